@@ -1,24 +1,97 @@
 import sys
 import cv2
+import functools
 import pickle
-import os
+import zipfile
+from collections import deque
 import numpy as np
-import matplotlib.pyplot as plt
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QAction,
     QLabel, QSlider, QLineEdit, QPushButton, QMessageBox, QFileDialog, QComboBox,
-    QColorDialog, QInputDialog, QStackedLayout, QCheckBox, QSplashScreen
+    QColorDialog, QInputDialog, QStackedLayout, QCheckBox, QSplashScreen, QButtonGroup
 )
-from PyQt5.QtCore import Qt, QRect, QSize, QPoint, QPointF, QTimer
+from PyQt5.QtCore import Qt, QRect, QRectF, QSize, QPoint, QPointF, QTimer, QObject, QRunnable, QThreadPool, pyqtSignal, QFile, QBuffer, QByteArray, QIODevice
 from PyQt5.QtGui import( QPainter, QPixmap, QColor, QImage, QIcon, QPen, QIntValidator, QPolygon, QFont, QFontDatabase,
-                        QImageWriter, QTransform, QMovie
+                        QImageWriter, QMovie, QPainterPath, QPixmapCache, QRegion
 )
 
 from PyQt5.QtGui import QFontMetrics, QPen
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
-from skimage import color
-from skimage.transform import resize
+
+import resources_rc  # Toolbar icons under :/icons, rebuild with: pyrcc5 resources.qrc -o resources_rc.py
+
+# Shared chrome for the flat icon buttons, parsed once for the whole window
+_TOOLBAR_BTN_QSS = "QPushButton#toolbarBtn { background: transparent; border: none; }"
+
+# Pen dropdown presets as (color, width, opacity, style); ShapeTool configures the shape pen instead
+_PEN_PRESETS = {
+    "Pencil": (Qt.black, 1, 1.0, Qt.SolidLine),
+    "Brush": (Qt.black, 5, 0.8, Qt.SolidLine),
+    "Highlighter": (Qt.yellow, 10, 0.5, Qt.SolidLine),
+    "Marker": (Qt.red, 8, 1.0, Qt.SolidLine),
+    "Calligraphy": (Qt.black, 6, 0.9, Qt.SolidLine),
+    "ShapeTool": (Qt.blue, 3, 0.8, Qt.DashLine),
+}
+
+@functools.lru_cache(maxsize=1)
+def _font_families():
+    """Installed font families, enumerated once per process."""
+    return QFontDatabase().families()
+
+def _icon(path, size=40):
+    """Rasterize an icon once per size through QPixmapCache and share it between widgets."""
+    key = f"icon:{path}:{size}"
+    pixmap = QPixmapCache.find(key)
+    if pixmap is None:
+        # Prefer the copy compiled into resources_rc, fall back to the file on disk
+        resource = f":/icons/{path}"
+        pixmap = QIcon(resource if QFile.exists(resource) else path).pixmap(size, size)
+        QPixmapCache.insert(key, pixmap)
+    return QIcon(pixmap)
+
+def _png_bytes(pixmap, quality=-1):
+    """Encode a pixmap as PNG in memory, quality as in QPixmap.save."""
+    data = QByteArray()
+    buffer = QBuffer(data)
+    buffer.open(QIODevice.WriteOnly)
+    pixmap.save(buffer, "PNG", quality)
+    buffer.close()
+    return data.data()
+
+def _image_pixels(image, channels, writable=False):
+    """View a QImage's buffer as an (h, w, channels) uint8 array without copying, valid while the image lives.
+
+    Row padding is sliced off. Read-only views go through constBits, bits() would detach a buffer
+    the image still shares with its pixmap.
+    """
+    ptr = image.bits() if writable else image.constBits()
+    ptr.setsize(image.byteCount())
+    height, width = image.height(), image.width()
+    rows = np.frombuffer(ptr, dtype=np.uint8).reshape((height, image.bytesPerLine()))
+    return rows[:, :width * channels].reshape((height, width, channels))
+
+def _bgrx_image(pixmap):
+    """The pixmap as a QImage holding B, G, R, X bytes per pixel, unpadded rows of 4 * width.
+
+    ARGB32 already lays its colour bytes out like RGB32, so only other formats are converted.
+    """
+    image = pixmap.toImage()
+    if image.format() not in (QImage.Format_RGB32, QImage.Format_ARGB32):
+        image = image.convertToFormat(QImage.Format_RGB32)
+    return image
+
+def _array_pixmap(pixels, image_format):
+    """Copy an (h, w) or (h, w, ch) uint8 array into a new QPixmap.
+
+    The QImage only wraps the array, with its row stride passed explicitly, so QPixmap.fromImage
+    makes the single copy and the array can be a reused buffer that the next filter overwrites.
+    """
+    # QImage reads packed pixels from one buffer; OpenCV results already are, so this only copies
+    # a strided view such as a channel slice
+    pixels = np.ascontiguousarray(pixels)
+    height, width = pixels.shape[:2]
+    return QPixmap.fromImage(QImage(pixels.data, width, height, pixels.strides[0], image_format))
 
 class SplashScreen(QWidget):
     def __init__(self, gif_path, width=800, height=500, duration=5000):
@@ -37,6 +110,7 @@ class SplashScreen(QWidget):
         # Load the GIF
         self.movie = QMovie(gif_path)
         self.movie.setScaledSize(self.size())  # Resize the GIF to match the splash screen size
+        self.movie.setCacheMode(QMovie.CacheAll)  # Keep the scaled frames so each is only scaled once
         self.label.setMovie(self.movie)
 
         layout.addWidget(self.label)
@@ -48,6 +122,66 @@ class SplashScreen(QWidget):
         # Automatically close the splash screen after 'duration' milliseconds
         QTimer.singleShot(duration, self.close)
 
+@functools.lru_cache(maxsize=64)
+def _gamma_lut(slider_value):
+    """256-entry gamma table for a gamma slider position (gamma = value / 10), built once per position."""
+    inv_gamma = 10.0 / slider_value
+    return ((np.arange(256) / 255.0) ** inv_gamma * 255).astype(np.uint8)
+
+@functools.lru_cache(maxsize=8)
+def _bit_plane_lut(bit):
+    """256-entry table mapping a level to 255 where the given bit is set and 0 elsewhere."""
+    return (((np.arange(256) >> bit) & 1) * 255).astype(np.uint8)
+
+@functools.lru_cache(maxsize=32)
+def _morph_kernel(kernel_size):
+    """Square structuring element for erosion and dilation, built once per size."""
+    return cv2.getStructuringElement(cv2.MORPH_RECT, (kernel_size, kernel_size))
+
+@functools.lru_cache(maxsize=64)
+def _piecewise_lut(piecewise_point):
+    """256-entry two-segment contrast table bending at piecewise_point (1..254), built once per point."""
+    levels = np.arange(256)
+    return np.clip(np.where(
+        levels <= piecewise_point,
+        (levels * 255) // piecewise_point,
+        128 + (levels - piecewise_point) * 127 // (255 - piecewise_point),
+    ), 0, 255).astype(np.uint8)
+
+def _equalize_lut(hist):
+    """256-entry equalization table for a channel histogram, the same mapping cv2.equalizeHist builds."""
+    hist = hist.ravel().astype(np.int64)  # calcHist counts in float32, exact only up to 2**24
+    total = hist.sum()
+    first = int(np.flatnonzero(hist)[0])
+    if hist[first] == total:  # A flat channel keeps its single level
+        return np.full(256, first, dtype=np.uint8)
+    cdf = np.cumsum(hist) - hist[first]
+    lut = np.rint(cdf.astype(np.float32) * np.float32(255.0 / (total - hist[first])))  # Its float32 rounding
+    lut[:first] = 0
+    return np.clip(lut, 0, 255).astype(np.uint8)
+
+# The Prewitt kernels are separable: a derivative along one axis and a box sum along the other
+_PREWITT_DERIVATIVE = np.array([1, 0, -1], dtype=np.float32)
+_PREWITT_SMOOTH = np.array([1, 1, 1], dtype=np.float32)
+
+@functools.lru_cache(maxsize=4)
+def _surface_grid(height, width):
+    """Read-only X, Y meshgrid for a height x width 3D surface, built once per shape."""
+    X, Y = np.meshgrid(np.linspace(0, width, width), np.linspace(0, height, height))
+    X.setflags(write=False)
+    Y.setflags(write=False)
+    return X, Y
+
+# Luma weights for B, G, R, X pixels, scaled so 8-bit levels map into [0, 1]
+_GRAY_WEIGHTS_BGRX = np.array([0.114, 0.587, 0.299, 0.0], dtype=np.float32) / 255.0
+
+# Patch size of the dark channel min filter
+_DEHAZE_PATCH_SIZE = 15
+
+# The dark channel's square min filter runs as a row pass then a column pass with these
+_DEHAZE_SE_ROW = cv2.getStructuringElement(cv2.MORPH_RECT, (_DEHAZE_PATCH_SIZE, 1))
+_DEHAZE_SE_COL = cv2.getStructuringElement(cv2.MORPH_RECT, (1, _DEHAZE_PATCH_SIZE))
+
 def dehaze(image, omega=0.95, t0=0.1):
     """
     Perform dehazing on an input image.
@@ -58,26 +192,26 @@ def dehaze(image, omega=0.95, t0=0.1):
     Returns:
         np.ndarray: Dehazed image (BGR format).
     """
-    def dark_channel(image, size=15):
+    def dark_channel(image):
         """Compute the dark channel of the image."""
-        min_channel = np.min(image, axis=2)
-        kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (size, size))
-        return cv2.erode(min_channel, kernel)
+        min_channel = cv2.min(cv2.min(image[..., 0], image[..., 1]), image[..., 2])
+        # A rectangular erosion is separable: a row pass then a column pass
+        min_channel = cv2.erode(min_channel, _DEHAZE_SE_ROW)
+        return cv2.erode(min_channel, _DEHAZE_SE_COL)
 
     def estimate_atmospheric_light(image, dark_channel):
         """Estimate atmospheric light based on the dark channel."""
         num_pixels = image.shape[0] * image.shape[1]
         num_brightest = max(num_pixels // 1000, 1)
         dark_vec = dark_channel.ravel()
-        indices = np.argpartition(dark_vec, -num_brightest)[-num_brightest:]
-        brightest = image.reshape(-1, 3)[indices]
-        return np.max(brightest, axis=0)
+        threshold = np.partition(dark_vec, -num_brightest)[-num_brightest]
+        mask = dark_vec >= threshold
+        flat = image.reshape(-1, 3)
+        return np.array([flat[mask, c].max() for c in range(3)])
 
-    # Convert BGR to RGB for consistency in processing
-    image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
-    
-    # Normalize the image to [0, 1] range
-    norm_image = image / 255.0
+    # Every step treats the channels alike, so the BGR order is kept throughout
+    # Normalize the image to [0, 1] range (float32 keeps every later pass half the size of float64)
+    norm_image = image.astype(np.float32) * np.float32(1.0 / 255.0)
 
     # Compute dark channel
     dark = dark_channel(norm_image)
@@ -85,27 +219,39 @@ def dehaze(image, omega=0.95, t0=0.1):
     # Estimate atmospheric light
     A = estimate_atmospheric_light(norm_image, dark)
 
-    # Estimate transmission map
-    transmission = 1 - omega * dark / np.max(A)
-
-    # Refine the transmission map using a guided filter
+    # Estimate transmission map, 1 - omega * dark / max(A), written over the dark channel
+    transmission = np.multiply(dark, np.float32(-omega / float(A.max())), out=dark)
+    np.add(transmission, 1, out=transmission)
+
+    # Refine the transmission map using a guided filter, run at quarter resolution
+    # (the map is smooth, so upsampling the result loses next to nothing)
+    height, width = transmission.shape
+    small_size = (max(width // 4, 1), max(height // 4, 1))
+    # Hand the resize/filter stage to OpenCL through UMat when a device is available
+    use_opencl = cv2.ocl.useOpenCL()
+    guide, src = (cv2.UMat(norm_image), cv2.UMat(transmission)) if use_opencl else (norm_image, transmission)
     transmission = cv2.ximgproc.guidedFilter(
-        guide=norm_image.astype(np.float32),
-        src=transmission.astype(np.float32),
-        radius=60,
+        guide=cv2.resize(guide, small_size, interpolation=cv2.INTER_AREA),
+        src=cv2.resize(src, small_size, interpolation=cv2.INTER_AREA),
+        radius=15,
         eps=0.0001
     )
+    transmission = cv2.resize(transmission, (width, height), interpolation=cv2.INTER_LINEAR)
+    if use_opencl:
+        transmission = transmission.get()
 
     # Ensure transmission is not too low
     transmission = np.clip(transmission, t0, 1)
 
-    # Recover the scene radiance
-    J = (norm_image - A) / transmission[:, :, np.newaxis] + A
-    J = np.clip(J, 0, 1)
+    # Recover the scene radiance in place, reusing the normalized buffer
+    J = norm_image
+    np.subtract(J, A, out=J)
+    np.divide(J, transmission[..., None], out=J)
+    np.add(J, A, out=J)
+    np.clip(J, 0, 1, out=J)
 
-    # Convert back to 8-bit image and return in BGR format
-    dehazed_image = (J * 255).astype(np.uint8)
-    return cv2.cvtColor(dehazed_image, cv2.COLOR_RGB2BGR)
+    # Convert back to 8-bit image, scale + saturate + cast in one pass
+    return cv2.convertScaleAbs(J, alpha=255.0)
 
 class MiniCanvasWindow(QWidget):
     def __init__(self, parent=None):
@@ -122,7 +268,12 @@ class MiniCanvasWindow(QWidget):
         layout = QVBoxLayout(self)
         layout.addWidget(self.canvas_label)
 
+    def canvas_size(self):
+        """The area the canvas preview is shown in."""
+        return self.canvas_label.size()
+
     def update_canvas(self, pixmap):
+        # A pixmap rendered at canvas_size() already fits, scaled() then hands it back as is
         self.canvas_label.setPixmap(pixmap.scaled(self.canvas_label.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation))
 
 class GridTool:
@@ -133,6 +284,42 @@ class GridTool:
         self.ruler_color = QColor(150, 150, 150)  # Default ruler color
         self.tick_color = QColor(100, 100, 100)   # Default tick color
         self.number_color = QColor(50, 50, 50)
+        self.grid_color = QColor(200, 200, 200)
+        self.grid_spacing = 20
+        self.ruler_thickness = 20
+        self.small_tick_size = 5
+        self.large_tick_size = 10
+        self.tick_interval = 10
+        self.number_interval = 50
+        self.build_grid_tile()
+        self.build_ruler_tiles()
+        self._ruler_strips = None  # Labelled rulers, rendered on first draw for the canvas size
+
+    def build_grid_tile(self):
+        """Pre-render one grid cell; call again if the grid spacing or color changes."""
+        self._grid_tile = QPixmap(self.grid_spacing, self.grid_spacing)
+        self._grid_tile.fill(Qt.transparent)
+        painter = QPainter(self._grid_tile)
+        painter.setPen(QPen(self.grid_color, 1, Qt.DashLine))
+        painter.drawLine(0, 0, self.grid_spacing - 1, 0)
+        painter.drawLine(0, 0, 0, self.grid_spacing - 1)
+        painter.end()
+
+    def build_ruler_tiles(self):
+        """Pre-render one numbered block of ruler ticks for each orientation."""
+        self._h_ruler_tile = QPixmap(self.number_interval, self.ruler_thickness)
+        self._v_ruler_tile = QPixmap(self.ruler_thickness, self.number_interval)
+        for tile, horizontal in ((self._h_ruler_tile, True), (self._v_ruler_tile, False)):
+            tile.fill(self.ruler_color)
+            painter = QPainter(tile)
+            painter.setPen(QPen(self.number_color))
+            for offset in range(0, self.number_interval, self.tick_interval):
+                size = self.large_tick_size if offset == 0 else self.small_tick_size
+                if horizontal:
+                    painter.drawLine(offset, 0, offset, size)
+                else:
+                    painter.drawLine(0, offset, size, offset)
+            painter.end()
 
     def toggle_grid(self):
         """Toggle the visibility of the grid."""
@@ -148,88 +335,126 @@ class GridTool:
         """Draw the grid if it's enabled."""
         if not self.show_grid:
             return
-        painter.setPen(QPen(QColor(200, 200, 200), 1, Qt.DashLine))
-        spacing = 20  # Grid spacing
-        for x in range(self.parent_canvas.canvas_x, 
-                       self.parent_canvas.canvas_x + self.parent_canvas.width, spacing):
-            painter.drawLine(x, self.parent_canvas.canvas_y, 
-                             x, self.parent_canvas.canvas_y + self.parent_canvas.height)
-        for y in range(self.parent_canvas.canvas_y, 
-                       self.parent_canvas.canvas_y + self.parent_canvas.height, spacing):
-            painter.drawLine(self.parent_canvas.canvas_x, y, 
-                             self.parent_canvas.canvas_x + self.parent_canvas.width, y)
+        painter.drawTiledPixmap(QRect(self.parent_canvas.canvas_x, self.parent_canvas.canvas_y,
+                                      self.parent_canvas.width, self.parent_canvas.height),
+                                self._grid_tile)
+
+    def build_ruler_strips(self, font):
+        """Render the top and left rulers with their labels; the canvas size never changes."""
+        width, height = self.parent_canvas.width, self.parent_canvas.height
+        font = QFont(font)
+        font.setPointSize(8)
+        # The left ruler's labels run past its edge, leave room for the longest one
+        label_width = QFontMetrics(font).horizontalAdvance(str(height - 1)) + 5
+        top = QPixmap(width, self.ruler_thickness)
+        left = QPixmap(max(self.ruler_thickness, label_width), height)
+        left.fill(Qt.transparent)
+
+        painter = QPainter(top)
+        painter.drawTiledPixmap(top.rect(), self._h_ruler_tile)
+        painter.setFont(font)
+        painter.setPen(QPen(self.number_color))
+        for x in range(0, width, self.number_interval):
+            painter.drawText(x + 2, 15, str(x))
+        painter.end()
+
+        painter = QPainter(left)
+        painter.drawTiledPixmap(QRect(0, 0, self.ruler_thickness, height), self._v_ruler_tile)
+        painter.setFont(font)
+        painter.setPen(QPen(self.number_color))
+        for y in range(0, height, self.number_interval):
+            painter.drawText(5, y + 5, str(y))
+        painter.end()
+        self._ruler_strips = (top, left)
 
     def draw_ruler(self, painter):
         """Draw the ruler with corrected positions."""
         if not self.show_ruler:
             return
+        if self._ruler_strips is None:
+            self.build_ruler_strips(painter.font())
 
-        ruler_thickness = 20
-        small_tick_size = 5
-        large_tick_size = 10
-        tick_interval = 10
-        number_interval = 50
-
-        font = painter.font()
-        font.setPointSize(8)
-        painter.setFont(font)
-        painter.setPen(QPen(self.number_color))
-
-        # Top ruler (horizontal)
-        painter.fillRect(self.parent_canvas.canvas_x, self.parent_canvas.canvas_y,
-                        self.parent_canvas.width, ruler_thickness, self.ruler_color)
-        for x in range(0, self.parent_canvas.width, tick_interval):
-            x_position = x + self.parent_canvas.canvas_x
-            if x % number_interval == 0:
-                painter.drawLine(x_position, self.parent_canvas.canvas_y,
-                                x_position, self.parent_canvas.canvas_y + large_tick_size)
-                painter.drawText(x_position + 2, self.parent_canvas.canvas_y + 15, str(x))
-            else:
-                painter.drawLine(x_position, self.parent_canvas.canvas_y,
-                                x_position, self.parent_canvas.canvas_y + small_tick_size)
-
-        # Left ruler (vertical)
-        painter.fillRect(self.parent_canvas.canvas_x, self.parent_canvas.canvas_y,
-                        ruler_thickness, self.parent_canvas.height, self.ruler_color)
-        for y in range(0, self.parent_canvas.height, tick_interval):
-            y_position = y + self.parent_canvas.canvas_y
-            if y % number_interval == 0:
-                painter.drawLine(self.parent_canvas.canvas_x, y_position,
-                                self.parent_canvas.canvas_x + large_tick_size, y_position)
-                painter.drawText(self.parent_canvas.canvas_x + 5, y_position + 5, str(y))
-            else:
-                painter.drawLine(self.parent_canvas.canvas_x, y_position,
-                                self.parent_canvas.canvas_x + small_tick_size, y_position)
+        # Top ruler (horizontal) first, the left ruler covers the corner
+        top, left = self._ruler_strips
+        painter.drawPixmap(self.parent_canvas.canvas_x, self.parent_canvas.canvas_y, top)
+        painter.drawPixmap(self.parent_canvas.canvas_x, self.parent_canvas.canvas_y, left)
 
 
 class TextTool:
     def __init__(self, canvas):
         self.canvas = canvas
         self.current_text = ""
+        self._version = 0  # Bumped whenever the finalized text changes
+        self._snapshot_version = None
         self.text_objects = []  # Stores all finalized text
         self.current_font = QFont("Arial", 12)
         self.pen_color = QColor(Qt.black)
         self.pen_opacity = 1.0  # New: Add opacity setting
         self.is_active = False
         self.text_rect = None  # Rectangle for the dashed box
+        self._rect_pen = QPen(self.pen_color, 1, Qt.DashLine)  # Rebuilt only when the color changes
+        self.update_font_metrics()
+
+    def update_font_metrics(self):
+        """Cache the metrics of the current font, they only change with the font."""
+        self._metrics_font = self.current_font
+        self._font_metrics = QFontMetrics(self.current_font)
+        self._text_box_width = self._font_metrics.averageCharWidth() * 10  # Estimate width (adjust as needed)
+
+    @property
+    def text_objects(self):
+        """Finalized text as a list of dicts, built from the parallel per-field lists."""
+        return [
+            {'position': position, 'text': text, 'font': font, 'color': color, 'opacity': opacity}
+            for position, text, font, color, opacity in zip(
+                self._positions, self._texts, self._fonts, self._colors, self._opacities)
+        ]
+
+    @text_objects.setter
+    def text_objects(self, text_objects):
+        # Each field lives in its own list so render_text reads plain lists instead of dicts
+        self._positions = [text_obj['position'] for text_obj in text_objects]
+        self._texts = [text_obj['text'] for text_obj in text_objects]
+        self._fonts = [text_obj['font'] for text_obj in text_objects]
+        self._colors = [text_obj['color'] for text_obj in text_objects]
+        self._opacities = [text_obj['opacity'] for text_obj in text_objects]
+        # Nothing mutates the list it was given, so it doubles as the undo snapshot
+        self._version += 1
+        self._snapshot = text_objects
+        self._snapshot_version = self._version
+
+    def is_empty(self):
+        """Whether there is no finalized text, without building the list of dicts."""
+        return not self._texts
+
+    def snapshot(self):
+        """Finalized text for an undo state, rebuilt only after the text has changed."""
+        if self._snapshot_version != self._version:
+            self._snapshot = self.text_objects
+            self._snapshot_version = self._version
+        return self._snapshot
+
+    def append_text_object(self, position, text, font, color, opacity):
+        """Store one finalized text."""
+        self._positions.append(position)
+        self._texts.append(text)
+        self._fonts.append(font)
+        self._colors.append(color)
+        self._opacities.append(opacity)
+        self._version += 1
 
     def add_text(self, position, text, font, color, opacity):
-        text_object = {
-            'position': position,
-            'text': text,
-            'font': self.current_font,
-            'color': color,
-            'opacity': opacity,
-        }
-        self.text_objects.append(text_object)
+        self.append_text_object(position, text, self.current_font, color, opacity)
         self.canvas.save_state()  # Save state after adding text
         self.canvas.update()
 
     def set_text_settings(self, color, font_name, size, opacity):
         """Update text settings."""
         self.pen_color = QColor(color)
+        self._rect_pen = QPen(self.pen_color, 1, Qt.DashLine)
         self.current_font = QFont(font_name, size)
         self.pen_opacity = opacity
+        self.update_font_metrics()
 
     def start_typing(self, event):
         """Start text input."""
@@ -241,26 +466,21 @@ class TextTool:
     def update_text_rect(self):
         """Calculate and update the dashed rectangle size."""
         if self.start_pos:
-            font_metrics = QFontMetrics(self.current_font)
-            text_height = font_metrics.height()
+            if self._metrics_font is not self.current_font:  # Font was replaced directly
+                self.update_font_metrics()
+            text_height = self._font_metrics.height()
             self.text_rect = QRect(
                 self.start_pos.x(),
                 self.start_pos.y() - text_height,  # Align rectangle top with font baseline
-                font_metrics.averageCharWidth() * 10,  # Estimate width (adjust as needed)
+                self._text_box_width,
                 text_height + 5,  # Add padding
             )
 
     def finalize_text(self):
         """Finalize the current text input and store it."""
         if self.current_text:
-            text_obj = {
-                "position": self.start_pos,
-                "text": self.current_text,
-                "font": self.current_font,
-                "color": self.pen_color,
-                "opacity": self.pen_opacity,
-            }
-            self.text_objects.append(text_obj)
+            self.append_text_object(self.start_pos, self.current_text, self.current_font,
+                                    self.pen_color, self.pen_opacity)
             self.current_text = ""
             self.start_pos = None
             self.text_rect = None  # Clear the rectangle
@@ -277,14 +497,25 @@ class TextTool:
             self.current_text += event.text()
             self.update_text_rect()  # Update rectangle when text changes
 
+    def draw_text_objects(self, painter):
+        """Draw the finalized text, only touching painter state when it actually changes."""
+        last_font = last_color = last_opacity = None
+        for position, text, font, color, opacity in zip(
+                self._positions, self._texts, self._fonts, self._colors, self._opacities):
+            if font != last_font:
+                last_font = font
+                painter.setFont(font)
+            if color != last_color:
+                last_color = color
+                painter.setPen(color)
+            if opacity != last_opacity:
+                last_opacity = opacity
+                painter.setOpacity(opacity)
+            painter.drawText(position, text)
+
     def render_text(self, painter):
         """Render finalized text and current text in progress."""
-        # Draw finalized text
-        for text_obj in self.text_objects:
-            painter.setFont(text_obj["font"])
-            painter.setPen(text_obj["color"])
-            painter.setOpacity(text_obj["opacity"])
-            painter.drawText(text_obj["position"], text_obj["text"])
+        self.draw_text_objects(painter)
 
         # Draw current text in progress
         if self.is_active and self.current_text:
@@ -295,13 +526,38 @@ class TextTool:
 
         # Draw dashed rectangle for typing
         if self.text_rect:
-            pen = QPen(Qt.DashLine)
-            pen.setColor(self.pen_color)
-            painter.setPen(pen)
+            painter.setPen(self._rect_pen)
             painter.setOpacity(1.0)  # Dashed rectangle should always be fully opaque
             painter.drawRect(self.text_rect)
 
-class ShapeTool:
+class CanvasMappingMixin:
+    """Widget-to-canvas mapping shared by the shape, drawing and erase tools."""
+    def cache_canvas_mapping(self):
+        """Snapshot the canvas offset and scale, they only change on resize or zoom."""
+        self._offset_x = self.canvas.canvas_x
+        self._offset_y = self.canvas.canvas_y
+        self._pixmap_width = self.canvas.pixmap.width()
+        self._pixmap_height = self.canvas.pixmap.height()
+        self._scale_x = self.canvas.width / self._pixmap_width
+        self._scale_y = self.canvas.height / self._pixmap_height
+
+    def map_to_canvas(self, widget_pos):
+        """Map widget position to canvas position, accounting for offsets and scaling."""
+        canvas_x = (widget_pos.x() - self._offset_x) / self._scale_x
+        canvas_y = (widget_pos.y() - self._offset_y) / self._scale_y
+        canvas_x = max(0, min(canvas_x, self._pixmap_width))
+        canvas_y = max(0, min(canvas_y, self._pixmap_height))
+        return QPoint(int(canvas_x), int(canvas_y))
+
+    def map_rect_to_widget(self, canvas_rect, margin=0):
+        """Map a canvas rectangle back to widget coordinates, grown by margin pixels."""
+        return QRectF(self._offset_x + canvas_rect.x() * self._scale_x,
+                      self._offset_y + canvas_rect.y() * self._scale_y,
+                      canvas_rect.width() * self._scale_x,
+                      canvas_rect.height() * self._scale_y).toAlignedRect().adjusted(
+            -margin, -margin, margin, margin)
+
+class ShapeTool(CanvasMappingMixin):
     def __init__(self, canvas):
         self.canvas = canvas
         self.start_pos = None
@@ -310,6 +566,8 @@ class ShapeTool:
         self.pen_width = 1
         self.pen_opacity = 1.0
         self.pen_style = Qt.SolidLine  # Default pen style
+        self._last_bbox = None  # Area covered by the previous preview
+        self.set_pen_settings(self.pen_color, self.pen_width, self.pen_opacity, self.pen_style)
 
     def set_pen_settings(self, color, width, opacity, style=Qt.SolidLine):
         """Update pen settings."""
@@ -317,37 +575,44 @@ class ShapeTool:
         self.pen_width = width
         self.pen_opacity = opacity
         self.pen_style = style
+        # Pens are rebuilt here only, not on every mouse move
+        self._pen = QPen(color, width, style)
+        self._dashed_pen = QPen(color, width, Qt.DashLine)
 
     def set_shape_type(self, shape_type):
         """Set the type of shape to draw."""
         self.shape_type = shape_type
 
-    def map_to_canvas(self, widget_pos):
-        """Map widget position to canvas position."""
-        offset_x = self.canvas.canvas_x
-        offset_y = self.canvas.canvas_y
-        scale_x = self.canvas.width / self.canvas.pixmap.width()
-        scale_y = self.canvas.height / self.canvas.pixmap.height()
-        canvas_x = (widget_pos.x() - offset_x) / scale_x
-        canvas_y = (widget_pos.y() - offset_y) / scale_y
-        canvas_x = max(0, min(canvas_x, self.canvas.pixmap.width()))
-        canvas_y = max(0, min(canvas_y, self.canvas.pixmap.height()))
-        return QPoint(int(canvas_x), int(canvas_y))
-
     def start_drawing(self, event):
         """Start drawing a shape."""
+        self.cache_canvas_mapping()
         self.start_pos = self.map_to_canvas(event.pos())
+        self.canvas.overlay_pixmap.fill(Qt.transparent)  # Clear overlay once per shape
+        self._last_bbox = None
+
+    def shape_bbox(self, start_pos, current_pos):
+        """Bounding rect of a previewed shape, padded for the pen width."""
+        rect = QRect(start_pos, current_pos)
+        size = min(rect.width(), rect.height())
+        bbox = rect.normalized().united(QRect(rect.topLeft(), QSize(size, size)).normalized())
+        pad = self.pen_width + 2
+        return bbox.adjusted(-pad, -pad, pad, pad)
 
     def continue_drawing(self, event):
         """Preview the shape while dragging the mouse."""
         if self.start_pos:
             current_pos = self.map_to_canvas(event.pos())
-            self.canvas.overlay_pixmap.fill(Qt.transparent)  # Clear overlay pixmap
 
             painter = QPainter(self.canvas.overlay_pixmap)
+            if self._last_bbox is not None:
+                # Only wipe the area the previous preview covered
+                painter.setCompositionMode(QPainter.CompositionMode_Clear)
+                painter.fillRect(self._last_bbox, Qt.transparent)
+                painter.setCompositionMode(QPainter.CompositionMode_SourceOver)
+            self._last_bbox = self.shape_bbox(self.start_pos, current_pos)
+
             painter.setOpacity(self.pen_opacity)
-            pen = QPen(self.pen_color, self.pen_width, self.pen_style)
-            painter.setPen(pen)
+            painter.setPen(self._pen)
 
             self.draw_shape(painter, self.start_pos, current_pos)
             painter.end()
@@ -360,8 +625,7 @@ class ShapeTool:
 
             painter = QPainter(self.canvas.pixmap)
             painter.setOpacity(self.pen_opacity)
-            pen = QPen(self.pen_color, self.pen_width, self.pen_style)
-            painter.setPen(pen)
+            painter.setPen(self._pen)
 
             self.draw_shape(painter, self.start_pos, current_pos)
             painter.end()
@@ -397,11 +661,10 @@ class ShapeTool:
             painter.drawLine(start_pos, current_pos)
         elif self.shape_type == "DashLine":
             # Use a dashed pen for drawing the line
-            dashed_pen = QPen(self.pen_color, self.pen_width, Qt.DashLine)
-            painter.setPen(dashed_pen)
+            painter.setPen(self._dashed_pen)
             painter.drawLine(start_pos, current_pos)
 
-class DrawingTool:
+class DrawingTool(CanvasMappingMixin):
     def __init__(self, canvas):
         self.canvas = canvas  # Reference to the main canvas
         #self.is_drawing = False  # Track whether drawing is active
@@ -410,53 +673,66 @@ class DrawingTool:
         self.pen_width = 1
         self.pen_opacity = 1.0
         self.pen_style = Qt.SolidLine
-
-    def map_to_canvas(self, widget_pos):
-        """Map widget position to canvas position, accounting for offsets and scaling."""
-        # Account for canvas offsets
-        offset_x = self.canvas.canvas_x
-        offset_y = self.canvas.canvas_y
-        
-        # Scaling factors
-        scale_x = self.canvas.width / self.canvas.pixmap.width()
-        scale_y = self.canvas.height / self.canvas.pixmap.height()
-        
-        # Adjust position to account for canvas position and scaling
-        canvas_x = (widget_pos.x() - offset_x) / scale_x
-        canvas_y = (widget_pos.y() - offset_y) / scale_y
-
-        # Clamp values to canvas bounds
-        canvas_x = max(0, min(canvas_x, self.canvas.pixmap.width()))
-        canvas_y = max(0, min(canvas_y, self.canvas.pixmap.height()))
-
-        return QPoint(int(canvas_x), int(canvas_y))
+        self._pending_path = QPainterPath()  # Segments not yet drawn on the overlay
+        self._pending_points = 0
+        self.max_pending_points = 8
+        self._flush_timer = QTimer()
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(16)  # About one frame
+        self._flush_timer.timeout.connect(self.flush_path)
+        self.set_pen_settings(self.pen_color, self.pen_width, self.pen_opacity, self.pen_style)
 
     def set_pen_settings(self, color, width, opacity, style=Qt.SolidLine):
         self.pen_color = color
         self.pen_width = width
         self.pen_opacity = opacity
         self.pen_style = style
+        # Round caps and joins keep freehand strokes smooth where segments meet
+        self._pen = QPen(color, width, style)
+        self._pen.setCapStyle(Qt.RoundCap)
+        self._pen.setJoinStyle(Qt.RoundJoin)
 
     def start_drawing(self, event):
         """Start the drawing process."""
+        self.cache_canvas_mapping()
         self.is_drawing = True
         self.last_pos = self.map_to_canvas(event.pos())
+        self._pending_path = QPainterPath(QPointF(self.last_pos))
+        self._pending_points = 0
 
     def continue_drawing(self, event):
         """Continue drawing as the mouse moves."""
         if self.is_drawing:
             current_pos = self.map_to_canvas(event.pos())
-            painter = QPainter(self.canvas.overlay_pixmap)
-            painter.setPen(QPen(self.pen_color, self.pen_width, self.pen_style))  # Customize pen as needed
-            painter.setOpacity(self.pen_opacity)
-            painter.drawLine(self.last_pos, current_pos)
-            painter.end()
+            self._pending_path.lineTo(QPointF(current_pos))
+            self._pending_points += 1
             self.last_pos = current_pos
-            self.canvas.update()
-            
+            # Draw the batched segments every few points, or once the move events pause
+            if self._pending_points >= self.max_pending_points:
+                self.flush_path()
+            elif not self._flush_timer.isActive():
+                self._flush_timer.start()
+
+    def flush_path(self):
+        """Draw the pending segments onto the overlay as one polyline."""
+        self._flush_timer.stop()
+        if not self._pending_points:
+            return
+        painter = QPainter(self.canvas.overlay_pixmap)
+        painter.setPen(self._pen)
+        painter.setOpacity(self.pen_opacity)
+        painter.drawPath(self._pending_path)
+        painter.end()
+        # Only repaint the area the new segments cover, padded for the pen width
+        stroke_rect = self.map_rect_to_widget(self._pending_path.boundingRect(), self.pen_width // 2 + 2)
+        self._pending_path = QPainterPath(QPointF(self.last_pos))
+        self._pending_points = 0
+        self.canvas.update(stroke_rect)
+
     def end_drawing(self):
         """Finalize the drawing process."""
         if self.is_drawing:
+            self.flush_path()
             # Commit the overlay drawing to the main pixmap
             painter = QPainter(self.canvas.pixmap)
             painter.drawPixmap(0, 0, self.canvas.overlay_pixmap)
@@ -468,44 +744,41 @@ class DrawingTool:
             self.last_pos = None
             self.canvas.update()
         
-class EraseTool:
+class EraseTool(CanvasMappingMixin):
     def __init__(self, canvas):
         self.canvas = canvas  # Reference to the main canvas
         self.last_pos = None  # Last mouse position
         self.pen_width = 10  # Default eraser size
         self.pen_style = Qt.SolidLine
-
-    def map_to_canvas(self, widget_pos):
-        """Map widget position to canvas position, accounting for offsets and scaling."""
-        offset_x = self.canvas.canvas_x
-        offset_y = self.canvas.canvas_y
-        scale_x = self.canvas.width / self.canvas.pixmap.width()
-        scale_y = self.canvas.height / self.canvas.pixmap.height()
-        canvas_x = (widget_pos.x() - offset_x) / scale_x
-        canvas_y = (widget_pos.y() - offset_y) / scale_y
-        canvas_x = max(0, min(canvas_x, self.canvas.pixmap.width()))
-        canvas_y = max(0, min(canvas_y, self.canvas.pixmap.height()))
-        return QPoint(int(canvas_x), int(canvas_y))
+        self.is_erasing = False
+        self.overlay_image = None  # Raw overlay buffer while a stroke is in progress
+        self._overlay_array = None
 
     def start_erasing(self, event):
         """Start the erasing process."""
+        self.cache_canvas_mapping()
         self.is_erasing = True
         self.last_pos = self.map_to_canvas(event.pos())
+        # Erase straight into an ARGB32 buffer, it becomes a pixmap again when the stroke ends
+        self.overlay_image = self.canvas.overlay_pixmap.toImage().convertToFormat(QImage.Format_ARGB32)
+        self._overlay_array = _image_pixels(self.overlay_image, 4, writable=True)
 
     def continue_erasing(self, event):
         """Erase continuously as the mouse moves."""
         if self.is_erasing:
             current_pos = self.map_to_canvas(event.pos())
-            painter = QPainter(self.canvas.overlay_pixmap)  # Use the overlay_pixmap
-            painter.setPen(QPen(Qt.white, self.pen_width, self.pen_style))  # Erase with white
-            painter.drawLine(self.last_pos, current_pos)
-            painter.end()
+            cv2.line(self._overlay_array, (self.last_pos.x(), self.last_pos.y()),
+                     (current_pos.x(), current_pos.y()), (255, 255, 255, 255), self.pen_width)  # Erase with white
             self.last_pos = current_pos
             self.canvas.update()  # Update the canvas display
 
     def end_erasing(self):
         """Finalize the erasing process."""
         if self.is_erasing:
+            self.canvas.overlay_pixmap = QPixmap.fromImage(self.overlay_image)
+            self.overlay_image = None
+            self._overlay_array = None
+
             # Commit the overlay erasing to the main pixmap
             painter = QPainter(self.canvas.pixmap)
             painter.drawPixmap(0, 0, self.canvas.overlay_pixmap)
@@ -517,12 +790,39 @@ class EraseTool:
             self.last_pos = None
             self.canvas.update()
 
+class FilterJobSignals(QObject):
+    finished = pyqtSignal(object)  # Filtered np.ndarray
+
+class FilterJob(QRunnable):
+    """Run one OpenCV filter off the GUI thread; the result arrives through signals.finished."""
+    def __init__(self, function, image):
+        super().__init__()
+        self.setAutoDelete(False)  # The canvas keeps the job alive until its result is delivered
+        self.function = function
+        self.image = image
+        self.signals = FilterJobSignals()
+
+    def run(self):
+        self.signals.finished.emit(self.function(self.image))
+
 class LeftPanel(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setFixedWidth(100)
         self.setStyleSheet("background-color: rgb(220, 220, 220);")
 
+class FontComboBox(QComboBox):
+    """Combo box that calls `populate` the first time its popup is opened."""
+    def __init__(self, parent=None, populate=None):
+        super().__init__(parent)
+        self._populate = populate
+
+    def showPopup(self):
+        if self._populate is not None:
+            populate, self._populate = self._populate, None
+            populate()
+        super().showPopup()
+
 class TopPanel(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -540,7 +840,7 @@ class CanvasApp(QWidget):
 
     def init_ui(self):
         self.setWindowTitle("Canvas Size Selector")
-        self.setWindowIcon(QIcon(r'fairy tail.png'))
+        self.setWindowIcon(_icon(r'fairy tail.png'))
         self.setGeometry(700, 300, 400, 300)
 
         # Layouts
@@ -550,16 +850,22 @@ class CanvasApp(QWidget):
 
         # Preview canvas
         self.preview_label = QLabel(self)
-        self.preview_pixmap = QPixmap(200, 150)  # Initial preview size
+        self.preview_pixmap = QPixmap(240, 160)  # Largest preview (slider maximum * 0.2), reused
         self.preview_pixmap.fill(Qt.white)
         self.preview_label.setPixmap(self.preview_pixmap)
 
+        # Coalesce slider ticks so fast drags repaint the preview at most once per frame
+        self.preview_timer = QTimer(self)
+        self.preview_timer.setSingleShot(True)
+        self.preview_timer.setInterval(16)
+        self.preview_timer.timeout.connect(self.update_preview)
+
         # Widgets for width
         self.width_label = QLabel("Width:")
         self.width_slider = QSlider(Qt.Horizontal)
         self.width_slider.setRange(100, 1200)
         self.width_slider.setValue(800)
-        self.width_slider.valueChanged.connect(self.update_preview)
+        self.width_slider.valueChanged.connect(self.schedule_preview)
 
         self.width_input = QLineEdit()
         self.width_input.setText("800")
@@ -570,7 +876,7 @@ class CanvasApp(QWidget):
         self.height_slider = QSlider(Qt.Horizontal)
         self.height_slider.setRange(100, 800)
         self.height_slider.setValue(600)
-        self.height_slider.valueChanged.connect(self.update_preview)
+        self.height_slider.valueChanged.connect(self.schedule_preview)
 
         self.height_input = QLineEdit()
         self.height_input.setText("600")
@@ -597,6 +903,10 @@ class CanvasApp(QWidget):
         self.setLayout(main_layout)
         self.update_preview()  # Initialize the preview
 
+    def schedule_preview(self):
+        if not self.preview_timer.isActive():
+            self.preview_timer.start()
+
     def update_preview(self):
         # Update width and height from sliders
         self.canvas_width = self.width_slider.value()
@@ -610,10 +920,11 @@ class CanvasApp(QWidget):
         preview_width = int(self.canvas_width * 0.2)
         preview_height = int(self.canvas_height * 0.2)
 
-        # Update preview canvas
-        self.preview_pixmap = QPixmap(preview_width, preview_height)
-        self.preview_pixmap.fill(Qt.white)
+        # Update preview canvas, releasing the label's copy first so painting doesn't detach
+        self.preview_label.clear()
+        self.preview_pixmap.fill(Qt.transparent)
         painter = QPainter(self.preview_pixmap)
+        painter.fillRect(0, 0, preview_width, preview_height, Qt.white)
         painter.setPen(QColor("black"))
         painter.drawRect(0, 0, preview_width - 1, preview_height - 1)  # Draw a border
         painter.end()
@@ -647,13 +958,29 @@ class CanvasApp(QWidget):
         self.close()  # Close the size selector window
 
 class CanvasWindow(QMainWindow):
+    SELECTION_PEN = QPen(QColor("blue"))  # Selected image border and anchors
+    ANCHOR_COLOR = QColor("blue")
+    BACKGROUND_COLOR = QColor("black")
+    SIDE_PANEL_COLOR = QColor(220, 220, 220)
+    TOP_PANEL_COLOR = QColor(200, 200, 200)
+    CROP_PEN = QPen(Qt.DashLine)
+    CROP_COLOR = QColor(255, 255, 255, 50)  # Semi-transparent
+    UNDO_LIMIT = 50  # States kept on each of the undo and redo stacks
+    HISTOGRAM_SAMPLES = 512 * 512  # Pixels counted for the histogram, larger images are sampled down to this
+    LIVE_UNDO_STATES = 5  # Newest undo states kept as pixmaps, older ones hold their pixels as PNG bytes
+    PNG_QUALITY = 85  # Qt turns this into zlib level 1, much faster to save for slightly larger files; -1 is Qt's default
+    SIZE_VALIDATOR = QIntValidator(1, 50)  # Shared by every window's size box
+    OPACITY_VALIDATOR = QIntValidator(0, 100)
+
     def __init__(self, width, height):
         super().__init__()
-        self.setWindowIcon(QIcon(r'fairy tail.png'))
+        self.setWindowIcon(_icon(r'fairy tail.png'))
         self.width = width
         self.height = height
         self.grid_tool = GridTool(self)
         self.current_scale_factor = 1.0
+        self._filter_sliders = []  # Filter sliders, the histogram waits while one is being dragged
+        self._slider_drag_state = None  # Undo state held from a filter slider press, False once saved
         self.init_ui()
         
         self.container()
@@ -661,15 +988,54 @@ class CanvasWindow(QMainWindow):
         self.pixmap.fill(Qt.white)
         self.overlay_pixmap = QPixmap(self.width, self.height)  # Separate overlay layer
         self.overlay_pixmap.fill(Qt.transparent)  # Transparent layer for drawing
+        self._empty_overlay_key = self.overlay_pixmap.cacheKey()  # Changes once anything is drawn on it
         
         # History stacks
-        self.undo_stack = []  # To store previous states
-        self.redo_stack = []  # To store undone states
+        self.undo_stack = deque(maxlen=self.UNDO_LIMIT)  # To store previous states, the oldest drop off
+        self._image_records = []  # Image entries of the last snapshot, reused while unchanged
+        self.redo_stack = deque(maxlen=self.UNDO_LIMIT)  # To store undone states
+
+        # Heavy filters run here; one thread keeps their results in request order
+        self.filter_pool = QThreadPool(self)
+        self.filter_pool.setMaxThreadCount(1)
+        self._filter_jobs = set()  # Jobs whose results are still pending
+        self._original_arrays = {}  # (pixmap cache key, rgb or "gray") -> read-only pixels of an original image
+        self._last_filter = None  # (slider values, original and result cache keys) of the last filter shown
+        self._zoom_cache = {}  # (original cache key, width, height) -> the original scaled to that zoom
+        self._filter_output = None  # Result buffer the slider filters write into, see filter_output
+        self._filter_scratch = {}  # name -> intermediate buffer of a slider filter, see filter_scratch
+        self._clahe = cv2.createCLAHE(tileGridSize=(8, 8))  # Only used on the single filter thread
+
+        # Histogram updates requested in the same event loop pass are drawn once
+        self._hist_timer = QTimer(self)
+        self._hist_timer.setSingleShot(True)
+        self._hist_timer.setInterval(0)
+        self._hist_timer.timeout.connect(self.draw_histogram)
+        self._histogram_key = None  # (pixmap cache key, checked channels) of the plotted histogram
+
+        # The mini canvas follows the main canvas at most every 33 ms, however often that repaints
+        self._mini_timer = QTimer(self)
+        self._mini_timer.setSingleShot(True)
+        self._mini_timer.setInterval(33)
+        self._mini_timer.timeout.connect(self.draw_mini_canvas)
+        self._rendering_mini_canvas = False
         self.image_rect = None  # Track the image position and size
         self.image_selected = False  # Whether the image is selected
         
         self.canvas_x = 100  # Initial x-offset for the canvas
         self.canvas_y = 100  # Initial y-offset for the canvas
+        self.canvas_rect = QRect(self.canvas_x, self.canvas_y, self.width, self.height)  # The canvas never moves or resizes
+        self._composite = None  # Canvas plus the images below the selection, see composite_layers
+        self._composite_key = None
+
+        # Anchor disc rendered once, the four anchors of the selection are blitted from it in one call
+        self.anchor_pixmap = QPixmap(11, 11)
+        self.anchor_pixmap.fill(Qt.transparent)
+        painter = QPainter(self.anchor_pixmap)
+        painter.setPen(self.SELECTION_PEN)
+        painter.setBrush(self.ANCHOR_COLOR)
+        painter.drawEllipse(QPoint(5, 5), 5, 5)
+        painter.end()
         self.drag_mode = False  # Track whether drag mode is active
         self.scale_mode = False  # Scale mode flag
         self.image_x = None  # X-position of the image relative to the canvas
@@ -733,71 +1099,34 @@ class CanvasWindow(QMainWindow):
 
         main_layout.addLayout(canvas_layout)
 
-        # Drag Mode Button
-        self.drag_button = QPushButton(self)
-        drag_icon = QIcon("move.png")
-        self.drag_button.setIcon(drag_icon)
-        self.drag_button.setGeometry(10, 100, 40, 40)
-        self.drag_button.setIconSize(self.drag_button.size())
-        self.drag_button.setStyleSheet("background: transparent; border: none;")
-        self.drag_button.setCheckable(True)
-        self.drag_button.clicked.connect(self.toggle_drag_mode)
-
-        # Undo and Redo buttons
-        self.undo_button = QPushButton(self)
-        undo_icon = QIcon("undo.png")
-        self.undo_button.setIcon(undo_icon)
-        self.undo_button.setGeometry(60, 30, 40, 40)
-        self.undo_button.setIconSize(self.undo_button.size())
-        self.undo_button.setStyleSheet("background: transparent; border: none;")
-        self.undo_button.clicked.connect(self.undo_action)
-
-        self.redo_button = QPushButton(self)
-        redo_icon = QIcon("redo.png")
-        self.redo_button.setIcon(redo_icon)
-        self.redo_button.setGeometry(110, 30, 40, 40)
-        self.redo_button.setIconSize(self.redo_button.size())
-        self.redo_button.setStyleSheet("background: transparent; border: none;")
-        self.redo_button.clicked.connect(self.redo_action)
-        
-        # Scale Mode Button
-        self.scale_button = QPushButton(self)
-        scale_icon = QIcon("scale.png")  # Replace with your scale icon file path
-        self.scale_button.setIcon(scale_icon)
-        self.scale_button.setGeometry(10, 150, 40, 40)  # Position below the drag button
-        self.scale_button.setIconSize(self.scale_button.size())
-        self.scale_button.setStyleSheet("background: transparent; border: none;")
-        self.scale_button.setCheckable(True)
-        self.scale_button.clicked.connect(self.toggle_scale_mode)
-        
-        self.draw_button = QPushButton(self)
-        draw_icon = QIcon("draw.png")  # Replace with your draw icon file path
-        self.draw_button.setIcon(draw_icon)
-        self.draw_button.setGeometry(10, 200, 40, 40)  # Position below the scale button
-        self.draw_button.setIconSize(self.draw_button.size())
-        self.draw_button.setStyleSheet("background: transparent; border: none;")
-        self.draw_button.setCheckable(True)
-        self.draw_button.clicked.connect(self.toggle_drawing_mode)
-        
-        # Eraser button
-        self.eraser_button = QPushButton(self)
-        eraser_icon = QIcon("eraser.png")  # Replace with your eraser icon file path
-        self.eraser_button.setIcon(eraser_icon)
-        self.eraser_button.setGeometry(10, 250, 40, 40)  # Position below the draw button
-        self.eraser_button.setIconSize(self.eraser_button.size())
-        self.eraser_button.setStyleSheet("background: transparent; border: none;")
-        self.eraser_button.setCheckable(True)
-        self.eraser_button.clicked.connect(self.toggle_eraser_mode)
-        
-        # Shape Tool Button
-        self.shape_button = QPushButton(self)
-        shape_icon = QIcon("shapes.png")  # Replace with your shape icon file path
-        self.shape_button.setIcon(shape_icon)
-        self.shape_button.setGeometry(10, 300, 40, 40)  # Position below the eraser button
-        self.shape_button.setIconSize(self.shape_button.size())
-        self.shape_button.setStyleSheet("background: transparent; border: none;")
-        self.shape_button.setCheckable(True)
-        self.shape_button.clicked.connect(self.toggle_shape_mode)
+        # Icon buttons: (attribute, icon, position, slot, checkable)
+        self._button_specs = [
+            ("drag_button", "move.png", (10, 100), self.toggle_drag_mode, True),
+            ("undo_button", "undo.png", (60, 30), self.undo_action, False),
+            ("redo_button", "redo.png", (110, 30), self.redo_action, False),
+            ("scale_button", "scale.png", (10, 150), self.toggle_scale_mode, True),
+            ("draw_button", "draw.png", (10, 200), self.toggle_drawing_mode, True),
+            ("eraser_button", "eraser.png", (10, 250), self.toggle_eraser_mode, True),
+            ("shape_button", "shapes.png", (10, 300), self.toggle_shape_mode, True),
+            ("text_button", "text.png", (10, 350), self.toggle_text_mode, True),
+            ("crop_button", "crop.png", (10, 400), self.toggle_crop_mode, True),
+            ("delete_button", "bin.png", (10, 450), self.delete_selected_image, False),
+            ("flip_horizontal_button", "horizontal.png", (10, 500), self.flip_horizontal, False),
+            ("flip_vertical_button", "vertical.png", (10, 550), self.flip_vertical, False),
+            ("zoom_in_button", "zoom-in.png", (10, 600), self.zoom_in, False),
+            ("zoom_out_button", "zoom-out.png", (10, 650), self.zoom_out, False),
+            ("reset_zoom_button", "reset.png", (10, 700), self.reset_zoom, False),
+        ]
+        self.setStyleSheet(_TOOLBAR_BTN_QSS)
+        for attr, icon_path, (x, y), slot, checkable in self._button_specs:
+            button = QPushButton(self)
+            button.setIcon(_icon(icon_path))
+            button.setGeometry(x, y, 40, 40)
+            button.setIconSize(button.size())
+            button.setObjectName("toolbarBtn")
+            button.setCheckable(checkable)
+            button.clicked.connect(slot)
+            setattr(self, attr, button)
 
         self.setup_shape_dropdown()
                 
@@ -812,7 +1141,7 @@ class CanvasWindow(QMainWindow):
         
         # Color picker button
         self.color_button = QPushButton(self)
-        color_icon = QIcon("color.png")
+        color_icon = _icon("color.png")
         self.color_button.setIcon(color_icon)
         self.color_button.setGeometry(400, 28, 40, 40)  # Adjust positioning as needed
         self.color_button.setIconSize(self.color_button.size())
@@ -834,11 +1163,11 @@ class CanvasWindow(QMainWindow):
         self.size_value_box = QLineEdit(self)
         self.size_value_box.setGeometry(620, 35, 50, 30)  # Position beside the slider
         self.size_value_box.setText("5")  # Default value
-        self.size_value_box.setValidator(QIntValidator(1, 50))  # Restrict input to valid range
+        self.size_value_box.setValidator(self.SIZE_VALIDATOR)  # Restrict input to valid range
 
         # Add connections
         self.size_slider.valueChanged.connect(self.update_value_box)
-        self.size_value_box.textChanged.connect(self.update_slider)
+        self.size_value_box.editingFinished.connect(self.update_slider)  # Only once typing is done, no slider/box loop
         
         # Opacity
         self.opacity_label = QLabel("Opacity:", self)
@@ -856,98 +1185,22 @@ class CanvasWindow(QMainWindow):
         self.opacity_value_box = QLineEdit(self)
         self.opacity_value_box.setGeometry(860, 35, 50, 30)  # Position beside the slider
         self.opacity_value_box.setText("100")  # Default value (100%)
-        self.opacity_value_box.setValidator(QIntValidator(0, 100))  # Restrict input to valid range
+        self.opacity_value_box.setValidator(self.OPACITY_VALIDATOR)  # Restrict input to valid range
 
         # Add connections
         self.opacity_slider.valueChanged.connect(self.update_opacity_value_box)
-        self.opacity_value_box.textChanged.connect(self.update_opacity_slider)
+        self.opacity_value_box.editingFinished.connect(self.update_opacity_slider)
 
-        self.text_button = QPushButton(self)
-        text_icon = QIcon("text.png")  # Replace with your text icon file path
-        self.text_button.setIcon(text_icon)
-        self.text_button.setGeometry(10, 350, 40, 40)  # Position below the shape button
-        self.text_button.setIconSize(self.text_button.size())
-        self.text_button.setStyleSheet("background: transparent; border: none;")
-        self.text_button.setCheckable(True)
-        self.text_button.clicked.connect(self.toggle_text_mode)
-        
         self.font_label = QLabel("Font :", self)
         self.font_label.setGeometry(1065, 35, 60, 30)  # Adjust positioning as needed
         
-        self.font_dropdown = QComboBox(self)
+        # Fonts are enumerated when the dropdown is first opened, until then it shows the current one
+        self.font_dropdown = FontComboBox(self, populate=self.populate_fonts)
         self.font_dropdown.setGeometry(1100, 35, 150, 30)  # Adjust position and size as needed
-        self.populate_fonts()  # Populate with available fonts
+        self.font_dropdown.addItem("Arial")  # TextTool's default font
         self.font_dropdown.currentIndexChanged.connect(self.set_font)  # Handle font changes
-        
-        self.color_button.clicked.connect(self.choose_text_color)
-        self.size_slider.valueChanged.connect(lambda value: self.change_text_size(value))
-        self.opacity_slider.valueChanged.connect(lambda value: self.change_text_opacity(value))
-        
-        # Crop Mode Button
-        self.crop_button = QPushButton(self)
-        crop_icon = QIcon("crop.png")  # Replace with your crop icon file path
-        self.crop_button.setIcon(crop_icon)
-        self.crop_button.setGeometry(10, 400, 40, 40)  # Position below other buttons
-        self.crop_button.setIconSize(self.crop_button.size())
-        self.crop_button.setStyleSheet("background: transparent; border: none;")
-        self.crop_button.setCheckable(True)
-        self.crop_button.clicked.connect(self.toggle_crop_mode)
-        
-        # Delete Image Button
-        self.delete_button = QPushButton(self)
-        delete_icon = QIcon("bin.png")  # Replace with your delete icon file path
-        self.delete_button.setIcon(delete_icon)
-        self.delete_button.setGeometry(10, 450, 40, 40)  # Adjust position as needed
-        self.delete_button.setIconSize(self.delete_button.size())
-        self.delete_button.setStyleSheet("background: transparent; border: none;")
-        self.delete_button.clicked.connect(self.delete_selected_image)
-        
-        # Flip Horizontal Button
-        self.flip_horizontal_button = QPushButton(self)
-        flip_horizontal_icon = QIcon("horizontal.png")  # Replace with your icon file path
-        self.flip_horizontal_button.setIcon(flip_horizontal_icon)
-        self.flip_horizontal_button.setGeometry(10, 500, 40, 40)  # Adjust position as needed
-        self.flip_horizontal_button.setIconSize(self.flip_horizontal_button.size())
-        self.flip_horizontal_button.setStyleSheet("background: transparent; border: none;")
-        self.flip_horizontal_button.clicked.connect(self.flip_horizontal)
-
-        # Flip Vertical Button
-        self.flip_vertical_button = QPushButton(self)
-        flip_vertical_icon = QIcon("vertical.png")  # Replace with your icon file path
-        self.flip_vertical_button.setIcon(flip_vertical_icon)
-        self.flip_vertical_button.setGeometry(10, 550, 40, 40)  # Adjust position as needed
-        self.flip_vertical_button.setIconSize(self.flip_vertical_button.size())
-        self.flip_vertical_button.setStyleSheet("background: transparent; border: none;")
-        self.flip_vertical_button.clicked.connect(self.flip_vertical)
-        
-        # Zoom In Button
-        self.zoom_in_button = QPushButton(self)
-        zoom_in_icon = QIcon("zoom-in.png")  # Replace with your icon file path
-        self.zoom_in_button.setIcon(zoom_in_icon)
-        self.zoom_in_button.setGeometry(10, 600, 40, 40)  # Adjust position
-        self.zoom_in_button.setIconSize(self.zoom_in_button.size())
-        self.zoom_in_button.setStyleSheet("background: transparent; border: none;")
-        self.zoom_in_button.clicked.connect(self.zoom_in)
-
-        # Zoom Out Button
-        self.zoom_out_button = QPushButton(self)
-        zoom_out_icon = QIcon("zoom-out.png")  # Replace with your icon file path
-        self.zoom_out_button.setIcon(zoom_out_icon)
-        self.zoom_out_button.setGeometry(10, 650, 40, 40)  # Adjust position
-        self.zoom_out_button.setIconSize(self.zoom_out_button.size())
-        self.zoom_out_button.setStyleSheet("background: transparent; border: none;")
-        self.zoom_out_button.clicked.connect(self.zoom_out)
-
-        # Reset Zoom Button
-        self.reset_zoom_button = QPushButton(self)
-        reset_zoom_icon = QIcon("reset.png")  # Replace with your icon file path
-        self.reset_zoom_button.setIcon(reset_zoom_icon)
-        self.reset_zoom_button.setGeometry(10, 700, 40, 40)  # Adjust position
-        self.reset_zoom_button.setIconSize(self.reset_zoom_button.size())
-        self.reset_zoom_button.setStyleSheet("background: transparent; border: none;")
-        self.reset_zoom_button.clicked.connect(self.reset_zoom)
-        
-        
+
+
     def setup_menu(self):
         menubar = self.menuBar()
         file_menu = menubar.addMenu("File")
@@ -1008,10 +1261,11 @@ class CanvasWindow(QMainWindow):
         # Create the stacked layout
         self.stacked_layout = QStackedLayout()
 
-        # Add pages to the stacked layout
+        # Add pages to the stacked layout; the filter and 3D pages are built on first visit
         self.page1 = self.create_page1()
-        self.page2 = self.create_page2()
-        self.page3 = self.create_page3()
+        self.page2 = QWidget()
+        self.page3 = QWidget()
+        self._page_builders = {1: self.create_page2, 2: self.create_page3}
         self.stacked_layout.addWidget(self.page1)
         self.stacked_layout.addWidget(self.page2)
         self.stacked_layout.addWidget(self.page3)
@@ -1022,9 +1276,9 @@ class CanvasWindow(QMainWindow):
         self.btn3 = QPushButton("3D Representation")
 
         # Connect buttons to change pages
-        self.btn1.clicked.connect(lambda: self.stacked_layout.setCurrentIndex(0))
-        self.btn2.clicked.connect(lambda: self.stacked_layout.setCurrentIndex(1))
-        self.btn3.clicked.connect(lambda: self.stacked_layout.setCurrentIndex(2))
+        self.btn1.clicked.connect(lambda: self._goto_page(0))
+        self.btn2.clicked.connect(lambda: self._goto_page(1))
+        self.btn3.clicked.connect(lambda: self._goto_page(2))
 
         # Add navigation buttons in a horizontal layout
         button_layout = QHBoxLayout()
@@ -1036,6 +1290,44 @@ class CanvasWindow(QMainWindow):
         self.container_layout.addLayout(button_layout)
         self.container_layout.addLayout(self.stacked_layout)
 
+    def _debounced(self, slider, handler, ms=50):
+        """Run handler(value) once a slider drag settles instead of on every step."""
+        timer = QTimer(self)
+        timer.setSingleShot(True)
+        timer.setInterval(ms)
+        timer.timeout.connect(lambda: handler(slider.value()))
+        slider.valueChanged.connect(lambda value: timer.start())
+
+        def flush():
+            # Apply the drag's last step right away, it still belongs to the drag's undo state
+            if timer.isActive():
+                timer.stop()
+                handler(slider.value())
+
+        slider.sliderReleased.connect(flush)
+        if slider not in self._filter_sliders:
+            self._filter_sliders.append(slider)
+            slider.sliderPressed.connect(self.begin_slider_drag)
+            slider.sliderReleased.connect(self.end_slider_drag)
+            slider.sliderReleased.connect(self.update_histogram)
+
+    def begin_slider_drag(self):
+        """Hold the state from before a filter slider drag, the drag's first edit saves it."""
+        self._slider_drag_state = self.capture_state()
+
+    def end_slider_drag(self):
+        """Let edits save states again once every handler of the released slider has run."""
+        QTimer.singleShot(0, lambda: setattr(self, '_slider_drag_state', None))
+
+    def _goto_page(self, index):
+        """Show a page of the side panel, building it the first time it is shown."""
+        builder = self._page_builders.pop(index, None)
+        if builder is not None:
+            layout = QVBoxLayout(self.stacked_layout.widget(index))
+            layout.setContentsMargins(0, 0, 0, 0)
+            layout.addWidget(builder())
+        self.stacked_layout.setCurrentIndex(index)
+
     def create_page1(self):
         """Create and return the first page with RGB histogram."""
         page = QWidget()
@@ -1051,7 +1343,7 @@ class CanvasWindow(QMainWindow):
         self.clahe_slider = QSlider(Qt.Horizontal)
         self.clahe_slider.setRange(1, 40)  # Clip limit range: 0.1 to 4.0 (scaled by 10)
         self.clahe_slider.setValue(20)  # Default clip limit = 2.0
-        self.clahe_slider.valueChanged.connect(lambda: self.apply_clahe(clahe_label))
+        self._debounced(self.clahe_slider, lambda value: self.apply_clahe(clahe_label))
 
         layout.addWidget(clahe_label)
         layout.addWidget(self.clahe_slider)
@@ -1061,7 +1353,7 @@ class CanvasWindow(QMainWindow):
         self.piecewise_slider = QSlider(Qt.Horizontal)
         self.piecewise_slider.setRange(0, 255)  # Point for piecewise linear transformation
         self.piecewise_slider.setValue(128)     # Default midpoint value
-        self.piecewise_slider.valueChanged.connect(lambda: self.update_piecewise_image(piecewise_label))
+        self._debounced(self.piecewise_slider, lambda value: self.update_piecewise_image(piecewise_label))
 
         layout.addWidget(piecewise_label)
         layout.addWidget(self.piecewise_slider)
@@ -1072,7 +1364,7 @@ class CanvasWindow(QMainWindow):
         self.erosion_slider = QSlider(Qt.Horizontal)
         self.erosion_slider.setRange(1, 20)  # Kernel size from 1x1 to 20x20
         self.erosion_slider.setValue(1)
-        self.erosion_slider.valueChanged.connect(lambda: self.update_erosion_image(erosion_label))
+        self._debounced(self.erosion_slider, lambda value: self.update_erosion_image(erosion_label))
 
         layout.addWidget(erosion_label)
         layout.addWidget(self.erosion_slider)
@@ -1082,7 +1374,7 @@ class CanvasWindow(QMainWindow):
         self.dilation_slider = QSlider(Qt.Horizontal)
         self.dilation_slider.setRange(1, 20)  # Kernel size from 1x1 to 20x20
         self.dilation_slider.setValue(1)
-        self.dilation_slider.valueChanged.connect(lambda: self.update_dilation_image(dilation_label))
+        self._debounced(self.dilation_slider, lambda value: self.update_dilation_image(dilation_label))
 
         layout.addWidget(dilation_label)
         layout.addWidget(self.dilation_slider)
@@ -1092,7 +1384,7 @@ class CanvasWindow(QMainWindow):
         self.threshold_slider = QSlider(Qt.Horizontal)
         self.threshold_slider.setRange(0, 255)  # Threshold values range from 0 to 255
         self.threshold_slider.setValue(127)  # Default threshold value
-        self.threshold_slider.valueChanged.connect(lambda: self.update_thresholding_image(threshold_label))
+        self._debounced(self.threshold_slider, lambda value: self.update_thresholding_image(threshold_label))
 
         layout.addWidget(threshold_label)  # Add threshold label to layout
         layout.addWidget(self.threshold_slider)  # Add threshold slider to layout
@@ -1102,7 +1394,7 @@ class CanvasWindow(QMainWindow):
         self.sharp_slider = QSlider(Qt.Horizontal)
         self.sharp_slider.setRange(0, 20)  # Represents 1.0 to 2.0 in steps of 0.1
         self.sharp_slider.setValue(0)  # Default value: 1.0
-        self.sharp_slider.valueChanged.connect(lambda: self.update_sharpening_image(sharp_label))
+        self._debounced(self.sharp_slider, lambda value: self.update_sharpening_image(sharp_label))
 
         layout.addWidget(sharp_label)  # Add sharpening label to layout
         layout.addWidget(self.sharp_slider)  # Add sharpening slider to layout
@@ -1113,10 +1405,13 @@ class CanvasWindow(QMainWindow):
         layout.addWidget(bit_plane_label)
 
         bit_plane_button_layout = QHBoxLayout()  # Horizontal layout for bit-plane buttons
+        self.bit_plane_group = QButtonGroup(self)  # One connection dispatches all eight buttons
+        self.bit_plane_group.setExclusive(False)
+        self.bit_plane_group.idClicked.connect(self.bit_plane_slicing)
 
         for i in range(8):  # Create 8 buttons for bit-plane slicing
             button = QPushButton(f"Bit {i}")
-            button.clicked.connect(lambda _, bit=i: self.bit_plane_slicing(bit))  # Connect button to slicing function
+            self.bit_plane_group.addButton(button, i)  # The button id is the bit to slice
             bit_plane_button_layout.addWidget(button)
 
         layout.addLayout(bit_plane_button_layout)
@@ -1126,7 +1421,7 @@ class CanvasWindow(QMainWindow):
         self.gamma_slider = QSlider(Qt.Horizontal)
         self.gamma_slider.setRange(1, 50)  # Gamma values scaled by 10 (0.1 to 5.0)
         self.gamma_slider.setValue(10)  # Default gamma = 1.0
-        self.gamma_slider.valueChanged.connect(self.update_powerlaw_image)
+        self._debounced(self.gamma_slider, lambda value: self.update_powerlaw_image())
 
         # Add the slider and label to the main layout
         layout.addWidget(self.gamma_label)  # Add label to layout
@@ -1148,9 +1443,10 @@ class CanvasWindow(QMainWindow):
         checkbox_layout.addWidget(self.check_blue)
         layout.addLayout(checkbox_layout)
 
-        # Add the Matplotlib canvas for the histogram
-        self.figure_histogram = Figure()
-        self.histogram_canvas = FigureCanvas(self.figure_histogram)
+        # The Matplotlib canvas for the histogram replaces this placeholder on the first update
+        self.figure_histogram = None
+        self.histogram_canvas = QWidget()
+        self.histogram_layout = layout
         layout.addWidget(self.histogram_canvas)
 
         # Connect checkboxes to update histogram
@@ -1185,7 +1481,7 @@ class CanvasWindow(QMainWindow):
         self.gaussian_slider.setValue(5)
         layout.addWidget(gaussian_label)
         layout.addWidget(self.gaussian_slider)
-        self.gaussian_slider.valueChanged.connect(lambda value: self.apply_gaussian_blur(value, gaussian_label))
+        self._debounced(self.gaussian_slider, lambda value: self.apply_gaussian_blur(value, gaussian_label))
 
         # --- Median Filter ---
         median_label = QLabel("Median Filter - Kernel Size: 5")
@@ -1196,7 +1492,7 @@ class CanvasWindow(QMainWindow):
         self.median_slider.setValue(5)
         layout.addWidget(median_label)
         layout.addWidget(self.median_slider)
-        self.median_slider.valueChanged.connect(lambda value: self.apply_median_filter(value, median_label))
+        self._debounced(self.median_slider, lambda value: self.apply_median_filter(value, median_label))
 
         # --- Bilateral Filter ---
         bilateral_label = QLabel("Bilateral Filter - Diameter: 9")
@@ -1206,7 +1502,7 @@ class CanvasWindow(QMainWindow):
         self.bilateral_slider.setValue(9)
         layout.addWidget(bilateral_label)
         layout.addWidget(self.bilateral_slider)
-        self.bilateral_slider.valueChanged.connect(lambda value: self.apply_bilateral_filter(value, bilateral_label))
+        self._debounced(self.bilateral_slider, lambda value: self.apply_bilateral_filter(value, bilateral_label))
 
         # --- Unsharp Masking (Sharpening) ---
         unsharp_label = QLabel("Unsharp Masking - Strength: 1.5")
@@ -1216,7 +1512,7 @@ class CanvasWindow(QMainWindow):
         self.unsharp_slider.setValue(15)
         layout.addWidget(unsharp_label)
         layout.addWidget(self.unsharp_slider)
-        self.unsharp_slider.valueChanged.connect(lambda value: self.apply_unsharp_mask(value / 10, unsharp_label))
+        self._debounced(self.unsharp_slider, lambda value: self.apply_unsharp_mask(value / 10, unsharp_label))
 
         # --- Laplacian Filter ---
         laplacian_label = QLabel("Laplacian Filter - Kernel Size: 3")
@@ -1227,7 +1523,7 @@ class CanvasWindow(QMainWindow):
         self.laplacian_slider.setValue(3)
         layout.addWidget(laplacian_label)
         layout.addWidget(self.laplacian_slider)
-        self.laplacian_slider.valueChanged.connect(lambda value: self.apply_laplacian_filter(value, laplacian_label))
+        self._debounced(self.laplacian_slider, lambda value: self.apply_laplacian_filter(value, laplacian_label))
 
         # --- Sobel Filter ---
         sobel_label = QLabel("Sobel Filter - Kernel Size: 3")
@@ -1238,7 +1534,7 @@ class CanvasWindow(QMainWindow):
         self.sobel_slider.setValue(3)
         layout.addWidget(sobel_label)
         layout.addWidget(self.sobel_slider)
-        self.sobel_slider.valueChanged.connect(lambda value: self.apply_sobel_filter(value, sobel_label))
+        self._debounced(self.sobel_slider, lambda value: self.apply_sobel_filter(value, sobel_label))
             
         # --- Contour Detection Sliders ---
         contour_label = QLabel("Contour Detection")
@@ -1254,7 +1550,7 @@ class CanvasWindow(QMainWindow):
         layout.addWidget(self.contour_threshold_slider)
 
         # Connect slider to the contour update method
-        self.contour_threshold_slider.valueChanged.connect(self.update_contours)
+        self._debounced(self.contour_threshold_slider, lambda value: self.update_contours())
 
         # --- Canny Edge Detection ---
         canny_label = QLabel("Canny Edge Detection")
@@ -1278,8 +1574,8 @@ class CanvasWindow(QMainWindow):
         layout.addWidget(self.canny_upper_slider)
 
         # Connect Canny sliders to the processing function
-        self.canny_lower_slider.valueChanged.connect(self.apply_canny_edge_detection)
-        self.canny_upper_slider.valueChanged.connect(self.apply_canny_edge_detection)
+        self._debounced(self.canny_lower_slider, lambda value: self.apply_canny_edge_detection())
+        self._debounced(self.canny_upper_slider, lambda value: self.apply_canny_edge_detection())
 
         # --- Prewitt Edge Detection ---
         prewitt_label = QLabel("Prewitt Edge Detection")
@@ -1304,7 +1600,7 @@ class CanvasWindow(QMainWindow):
         layout.addWidget(self.sobel_slider)
 
         # Connect Sobel slider to the processing function
-        self.sobel_slider.valueChanged.connect(self.apply_sobel_edge_detection)
+        self._debounced(self.sobel_slider, lambda value: self.apply_sobel_edge_detection())
 
         layout.addStretch()
         page.setLayout(layout)
@@ -1324,8 +1620,10 @@ class CanvasWindow(QMainWindow):
         self.show_3d_button.clicked.connect(self.show_3d_representation)
         layout.addWidget(self.show_3d_button)
 
-        self.figure_3d = plt.figure()
-        self.representation_canvas = FigureCanvas(self.figure_3d)
+        # The 3D canvas replaces this placeholder the first time it is shown
+        self.figure_3d = None
+        self.representation_canvas = QWidget()
+        self.representation_layout = layout
         layout.addWidget(self.representation_canvas)
 
         layout.addStretch()
@@ -1336,49 +1634,64 @@ class CanvasWindow(QMainWindow):
         painter = QPainter(self)
 
         # Draw the background panels
-        painter.fillRect(self.background, QColor("black"))
-        painter.fillRect(self.left_panel_rect, QColor(220, 220, 220))
-        painter.fillRect(self.right_panel_rect, QColor(220, 220, 220))
-        painter.fillRect(self.top_panel_rect, QColor(200, 200, 200))
+        painter.fillRect(self.background, self.BACKGROUND_COLOR)
+        painter.fillRect(self.left_panel_rect, self.SIDE_PANEL_COLOR)
+        painter.fillRect(self.right_panel_rect, self.SIDE_PANEL_COLOR)
+        painter.fillRect(self.top_panel_rect, self.TOP_PANEL_COLOR)
 
         # Set the clipping region to restrict drawing to the canvas
-        canvas_clip_rect = QRect(self.canvas_x, self.canvas_y, self.width, self.height)
+        canvas_clip_rect = self.canvas_rect
         painter.setClipRect(canvas_clip_rect)
 
-        # Draw the static canvas
-        painter.drawPixmap(self.canvas_x, self.canvas_y, self.pixmap)
-
-        # Draw all images
-        for index, img_data in enumerate(self.images):
-            painter.drawPixmap(img_data['x'], img_data['y'], img_data['pixmap'])
-            # Highlight if selected
-            if index == self.selected_image_index:
-                painter.setPen(QColor("blue"))
-                painter.drawRect(img_data['x'], img_data['y'], img_data['pixmap'].width(), img_data['pixmap'].height())
+        # Draw the static canvas and the images below the selected one from the cached composite
+        dirty_rect = event.rect()
+        selected = self.selected_image_index
+        first_live = selected if selected is not None and selected < len(self.images) else len(self.images)
+        canvas_visible = canvas_clip_rect.intersected(dirty_rect)
+        painter.drawPixmap(canvas_visible, self.composite_layers(first_live),
+                           canvas_visible.translated(-self.canvas_x, -self.canvas_y))
+
+        # Draw the selected image and those above it, skipping those outside the area being repainted
+        for i in range(first_live, len(self.images)):
+            img_data = self.images[i]
+            pixmap = img_data['pixmap']
+            if i == selected:
+                bounds = self.image_bounds(img_data)  # Room for the frame and anchors
+            else:
+                bounds = QRect(img_data['x'], img_data['y'], pixmap.width(), pixmap.height())
+            if not dirty_rect.intersects(bounds):
+                continue
 
-        for i, img_data in enumerate(self.images):
-            painter.drawPixmap(img_data['x'], img_data['y'], img_data['pixmap'])
+            # Only blit the part of the pixmap that is on the canvas and being repainted
+            visible = QRect(img_data['x'], img_data['y'], pixmap.width(), pixmap.height()).intersected(
+                canvas_visible)
+            if not visible.isEmpty():
+                painter.drawPixmap(visible, pixmap, visible.translated(-img_data['x'], -img_data['y']))
 
             # Highlight selected image
-            if i == self.selected_image_index:
-                painter.setPen(QColor("blue"))
+            if i == selected:
+                painter.setPen(self.SELECTION_PEN)
                 painter.drawRect(img_data['rect'])
-                
-            if i == self.selected_image_index:
-                # Draw anchor points
+
+                # Draw anchor points, fragments are centred so offset by half a pixel to land on the corners
                 rect = img_data['rect']
                 anchors = [rect.topLeft(), rect.topRight(), rect.bottomLeft(), rect.bottomRight()]
-                painter.setBrush(QColor("blue"))
-                for anchor in anchors:
-                    painter.drawEllipse(anchor, 5, 5)
+                painter.drawPixmapFragments(
+                    [QPainter.PixmapFragment.create(QPointF(anchor) + QPointF(0.5, 0.5), QRectF(0, 0, 11, 11))
+                     for anchor in anchors],
+                    self.anchor_pixmap)
                     
         if self.crop_mode and self.crop_rect:
-            painter.setPen(QPen(Qt.DashLine))
-            painter.setBrush(QColor(255, 255, 255, 50))  # Semi-transparent
+            painter.setPen(self.CROP_PEN)
+            painter.setBrush(self.CROP_COLOR)
             painter.drawRect(self.crop_rect)
                     
-        # Draw the overlay (drawings)
-        painter.drawPixmap(self.canvas_x, self.canvas_y, self.overlay_pixmap)
+        # Draw the overlay (drawings) for the repainted area only, an erase stroke in progress lives in a raw image
+        overlay_source = canvas_visible.translated(-self.canvas_x, -self.canvas_y)
+        if self.erase_tool.is_erasing:
+            painter.drawImage(canvas_visible, self.erase_tool.overlay_image, overlay_source)
+        else:
+            painter.drawPixmap(canvas_visible, self.overlay_pixmap, overlay_source)
 
         # Render text from the TextTool
         self.text_tool.render_text(painter)
@@ -1391,6 +1704,24 @@ class CanvasWindow(QMainWindow):
     
         painter.end()
         
+    def composite_layers(self, count):
+        """The canvas with the first `count` images drawn on it, in canvas coordinates.
+
+        Cached on the layers' pixmap cache keys and positions, so repaints and exports reuse
+        it until one of those layers actually changes.
+        """
+        key = (count, self.pixmap.cacheKey(),
+               tuple((img['pixmap'].cacheKey(), img['x'], img['y']) for img in self.images[:count]))
+        if key != self._composite_key:
+            composite = QPixmap(self.pixmap)
+            if count:
+                painter = QPainter(composite)
+                for img in self.images[:count]:
+                    painter.drawPixmap(img['x'] - self.canvas_x, img['y'] - self.canvas_y, img['pixmap'])
+                painter.end()
+            self._composite, self._composite_key = composite, key
+        return self._composite
+
     def export_as_png(self):
         """Export the current canvas as a PNG image."""
         file_path, _ = QFileDialog.getSaveFileName(self, "Export as PNG", "", "PNG Files (*.png);;All Files (*)")
@@ -1398,39 +1729,39 @@ class CanvasWindow(QMainWindow):
             if not file_path.endswith(".png"):
                 file_path += ".png"
 
-            # Create a temporary QPixmap to draw the combined state
-            export_pixmap = QPixmap(self.pixmap.size())
-            export_pixmap.fill(Qt.white)  # Ensure the background is white
+            # With nothing on top of an opaque canvas the export is the canvas itself
+            if (not self.images and self.text_tool.is_empty()
+                    and self.overlay_pixmap.cacheKey() == self._empty_overlay_key
+                    and not self.pixmap.hasAlphaChannel()):
+                export_image = self.pixmap
+            else:
+                export_image = self.compose_export()
 
-            painter = QPainter(export_pixmap)
-            painter.drawPixmap(0, 0, self.pixmap)  # Draw the main canvas
+            # Save the combined image to the specified file
+            if export_image.save(file_path, "PNG", self.PNG_QUALITY):
+                QMessageBox.information(self, "Export Successful", f"Image saved to {file_path}")
+            else:
+                QMessageBox.warning(self, "Export Failed", "Could not save the image.")
 
-            # Draw all imported images onto the export_pixmap
-            for img in self.images:
-                painter.drawPixmap(img['x'], img['y'], img['pixmap'])
+    def compose_export(self):
+        """Flatten the canvas, images, overlay and text into one image for export."""
+        # Compose into a QImage, the raster engine paints on it directly with no platform surface
+        # in between; RGB32 because the export is opaque and should stay a 24-bit PNG
+        export_image = QImage(self.pixmap.size(), QImage.Format_RGB32)
+        export_image.fill(Qt.white)  # Ensure the background is white
 
-            # Draw any additional overlay elements (shapes, lines)
-            painter.drawPixmap(0, 0, self.overlay_pixmap)
+        painter = QPainter(export_image)
+        painter.drawPixmap(0, 0, self.composite_layers(len(self.images)))  # The main canvas and all imported images
 
-            # Draw text objects
-            for text_obj in self.text_tool.text_objects:
-                font = QFont()
-                font.setFamily(text_obj['font']['family'])
-                font.setPointSize(text_obj['font']['size'])
-                font.setBold(text_obj['font']['bold'])
-                font.setItalic(text_obj['font']['italic'])
-                painter.setFont(font)
-                painter.setPen(QColor(text_obj['color']))
-                painter.setOpacity(text_obj['opacity'])
-                painter.drawText(text_obj['position'], text_obj['text'])
+        # Draw any additional overlay elements (shapes, lines)
+        painter.drawPixmap(0, 0, self.overlay_pixmap)
 
-            painter.end()
+        # Draw text objects, their positions are window coordinates like the images
+        painter.translate(-self.canvas_x, -self.canvas_y)
+        self.text_tool.draw_text_objects(painter)
 
-            # Save the combined pixmap to the specified file
-            if export_pixmap.save(file_path, "PNG"):
-                QMessageBox.information(self, "Export Successful", f"Image saved to {file_path}")
-            else:
-                QMessageBox.warning(self, "Export Failed", "Could not save the image.")
+        painter.end()
+        return export_image
 
                     
     def save_project(self):
@@ -1441,25 +1772,11 @@ class CanvasWindow(QMainWindow):
                 file_path += ".adli"
 
             try:
-                # Create a temporary folder to save images
-                project_folder = os.path.join(os.path.dirname(file_path), "project_resources")
-                os.makedirs(project_folder, exist_ok=True)
-
-                # Save the main canvas as an image
-                canvas_image_path = os.path.join(project_folder, "canvas.png")
-                self.pixmap.save(canvas_image_path, "PNG")
-
-                # Save the overlay pixmap
-                overlay_image_path = os.path.join(project_folder, "overlay.png")
-                self.overlay_pixmap.save(overlay_image_path, "PNG")
-
-                # Save individual images
+                # Encode the canvas, the overlay and each image to PNG in memory
                 image_data = []
-                for i, img in enumerate(self.images):
-                    image_path = os.path.join(project_folder, f"image_{i}.png")
-                    img['pixmap'].save(image_path, "PNG")
+                for img in self.images:
                     image_data.append({
-                        'path': image_path,
+                        'png': pickle.PickleBuffer(_png_bytes(img['pixmap'], self.PNG_QUALITY)),
                         'x': img['x'],
                         'y': img['y'],
                         'rect': img['rect'],
@@ -1484,14 +1801,20 @@ class CanvasWindow(QMainWindow):
 
                 # Save project metadata
                 project_data = {
-                    'canvas_image_path': canvas_image_path,
-                    'overlay_image_path': overlay_image_path,
+                    'canvas_png': pickle.PickleBuffer(_png_bytes(self.pixmap, self.PNG_QUALITY)),
+                    'overlay_png': pickle.PickleBuffer(_png_bytes(self.overlay_pixmap, self.PNG_QUALITY)),
                     'images': image_data,
                     'text_objects': serialized_text_objects,  # Save serialized text objects
                 }
 
-                with open(file_path, 'wb') as file:
-                    pickle.dump(project_data, file)
+                # The PNGs are pickled out of band and stored next to the metadata in one archive,
+                # already compressed so the archive does not compress them again
+                buffers = []
+                metadata = pickle.dumps(project_data, protocol=5, buffer_callback=buffers.append)
+                with zipfile.ZipFile(file_path, 'w', zipfile.ZIP_STORED) as archive:
+                    archive.writestr("project.pkl", metadata)
+                    for i, buffer in enumerate(buffers):
+                        archive.writestr(f"buffers/{i}.png", buffer.raw())
 
                 QMessageBox.information(self, "Save Successful", f"Project saved to {file_path}")
             except Exception as e:
@@ -1502,23 +1825,33 @@ class CanvasWindow(QMainWindow):
         file_path, _ = QFileDialog.getOpenFileName(self, "Open Project", "", "Adli Files (*.adli);;All Files (*)")
         if file_path:
             try:
-                with open(file_path, 'rb') as file:
-                    project_data = pickle.load(file)
-
-                # Restore the main canvas
-                canvas_image = QImage(project_data['canvas_image_path'])
-                self.pixmap = QPixmap.fromImage(canvas_image)
-
-                # Restore the overlay
-                overlay_image = QImage(project_data['overlay_image_path'])
-                self.overlay_pixmap = QPixmap.fromImage(overlay_image)
+                if zipfile.is_zipfile(file_path):
+                    with zipfile.ZipFile(file_path) as archive:
+                        count = sum(name.startswith("buffers/") for name in archive.namelist())
+                        buffers = [archive.read(f"buffers/{i}.png") for i in range(count)]
+                        project_data = pickle.loads(archive.read("project.pkl"), buffers=buffers)
+                else:  # Older projects are a bare pickle pointing at PNGs in project_resources/
+                    with open(file_path, 'rb') as file:
+                        project_data = pickle.load(file)
+
+                def load_pixmap(entry, png_key, path_key):
+                    if png_key not in entry:
+                        return QPixmap(entry[path_key])
+                    pixmap = QPixmap()
+                    pixmap.loadFromData(entry[png_key], "PNG")
+                    return pixmap
+
+                # Restore the main canvas and the overlay
+                self.pixmap = load_pixmap(project_data, 'canvas_png', 'canvas_image_path')
+                self.overlay_pixmap = load_pixmap(project_data, 'overlay_png', 'overlay_image_path')
 
                 # Restore imported images
                 self.images = []
                 for img_data in project_data['images']:
-                    pixmap = QPixmap(img_data['path'])
+                    pixmap = load_pixmap(img_data, 'png', 'path')
                     self.images.append({
                         'pixmap': pixmap,
+                        'original_pixmap': pixmap,  # Filters start from the image as it was saved
                         'x': img_data['x'],
                         'y': img_data['y'],
                         'rect': img_data['rect'],
@@ -1549,38 +1882,136 @@ class CanvasWindow(QMainWindow):
                 QMessageBox.critical(self, "Open Failed", f"An error occurred while opening: {e}")
 
 
-    def save_state(self):
-        """Save the current state to the undo stack."""
-        state = {
-            'images': [  # Save the images
-                {
-                    'pixmap': img['pixmap'].copy(),
-                    'original_pixmap': img['original_pixmap'].copy(),
-                    'x': img['x'],
-                    'y': img['y'],
-                    'rect': QRect(img['rect']),
-                }
-                for img in self.images
-            ],
+    def capture_state(self):
+        """Snapshot the editable state for the undo/redo stacks.
+
+        QPixmap is implicitly shared, so the snapshot holds the current buffers without copying
+        them; every later edit paints into or replaces a pixmap, which detaches it from the snapshot.
+        Entries for images and text that haven't changed since the last snapshot are shared with it.
+        """
+        return {
+            'images': self.capture_images(),  # Save the images
             'selected_image_index': self.selected_image_index,
-            'pixmap': self.pixmap.copy(),  # Save the current canvas pixmap
-            'overlay_pixmap': self.overlay_pixmap.copy(),  # Save the overlay layer
-            'text_objects': [  # Save text objects
-            {
-                'position': text_obj['position'],
-                'text': text_obj['text'],
-                'font': text_obj['font'],
-                'color': text_obj['color'],
-                'opacity': text_obj['opacity'],
-            }
-            for text_obj in self.text_tool.text_objects
-        ],
+            'pixmap': QPixmap(self.pixmap),  # Save the current canvas pixmap
+            'overlay_pixmap': QPixmap(self.overlay_pixmap),  # Save the overlay layer
+            'text_objects': self.text_tool.snapshot(),  # Save text objects
             # Save slider values
         'threshold_value': self.threshold_slider.value(),
         'sharp_value': self.sharp_slider.value(),
         'gamma_value': self.gamma_slider.value()
         }
+
+    def capture_images(self):
+        """Snapshot the image list, reusing the previous entry of every image that hasn't changed."""
+        previous = self._image_records
+        records = []
+        for i, img in enumerate(self.images):
+            record = previous[i] if i < len(previous) else None
+            # A pixmap's cache key changes whenever it is painted into
+            if (record is None or record['x'] != img['x'] or record['y'] != img['y']
+                    or record['rect'] != img['rect']
+                    or record['pixmap'].cacheKey() != img['pixmap'].cacheKey()
+                    or record['original_pixmap'].cacheKey() != img['original_pixmap'].cacheKey()):
+                record = {
+                    'pixmap': QPixmap(img['pixmap']),
+                    'original_pixmap': QPixmap(img['original_pixmap']),
+                    'x': img['x'],
+                    'y': img['y'],
+                    'rect': QRect(img['rect']),
+                }
+            records.append(record)
+        self._image_records = records
+        return records
+
+    def restore_images(self, records):
+        """Rebuild the live image list from snapshot entries, which other states may share."""
+        self.images = [
+            {
+                'pixmap': QPixmap(record['pixmap']),
+                'original_pixmap': QPixmap(record['original_pixmap']),
+                'x': record['x'],
+                'y': record['y'],
+                'rect': QRect(record['rect']),
+            }
+            for record in records
+        ]
+
+    @staticmethod
+    def state_pixmaps(state):
+        """Every pixmap slot of a state, either a QPixmap or a packed (cache key, PNG bytes) pair."""
+        yield state['pixmap']
+        yield state['overlay_pixmap']
+        for record in state['images']:
+            yield record['pixmap']
+            yield record['original_pixmap']
+
+    def push_undo_state(self, state):
+        """Push a state and pack the one that just dropped out of the live window."""
         self.undo_stack.append(state)
+        if len(self.undo_stack) > self.LIVE_UNDO_STATES:
+            self.compact_state(len(self.undo_stack) - self.LIVE_UNDO_STATES - 1)
+
+    def compact_state(self, index):
+        """Replace the pixmaps of an undo state with PNG bytes.
+
+        Pixmaps a newer live state still shares are left alone, packing them would free nothing,
+        and a buffer the next older state already packed reuses its bytes.
+        """
+        state = self.undo_stack[index]
+        live_keys = {pixmap.cacheKey()
+                     for i in range(index + 1, len(self.undo_stack))
+                     for pixmap in self.state_pixmaps(self.undo_stack[i])
+                     if isinstance(pixmap, QPixmap)}
+        packed = {}
+        if index:
+            packed = {entry[0]: entry for entry in self.state_pixmaps(self.undo_stack[index - 1])
+                      if isinstance(entry, tuple)}
+
+        def pack(pixmap):
+            if not isinstance(pixmap, QPixmap) or pixmap.cacheKey() in live_keys:
+                return pixmap
+            key = pixmap.cacheKey()
+            if key not in packed:
+                packed[key] = (key, _png_bytes(pixmap, self.PNG_QUALITY))
+            return packed[key]
+
+        state['pixmap'] = pack(state['pixmap'])
+        state['overlay_pixmap'] = pack(state['overlay_pixmap'])
+        # Image entries can be shared with other states, pack into new dicts
+        state['images'] = [dict(record, pixmap=pack(record['pixmap']),
+                                original_pixmap=pack(record['original_pixmap']))
+                           for record in state['images']]
+
+    @staticmethod
+    def materialize_state(state):
+        """Decode any packed pixmaps of a state coming off the undo stack."""
+        def unpack(entry):
+            if isinstance(entry, QPixmap):
+                return entry
+            pixmap = QPixmap()
+            pixmap.loadFromData(entry[1], "PNG")
+            return pixmap
+
+        state['pixmap'] = unpack(state['pixmap'])
+        state['overlay_pixmap'] = unpack(state['overlay_pixmap'])
+        state['images'] = [dict(record, pixmap=unpack(record['pixmap']),
+                                original_pixmap=unpack(record['original_pixmap']))
+                           for record in state['images']]
+        return state
+
+    def save_state(self):
+        """Save the current state to the undo stack.
+
+        A filter slider drag saves a single state, the one from before it was pressed.
+        """
+        state = self._slider_drag_state
+        if state is False:
+            return
+        if state is None:
+            state = self.capture_state()
+        else:
+            self._slider_drag_state = False
+        self.push_undo_state(state)
         self.redo_stack.clear()
         self.update_histogram()
 
@@ -1591,40 +2022,12 @@ class CanvasWindow(QMainWindow):
     def undo_action(self):
         if self.undo_stack:
             # Save the current state to the redo stack
-            current_state = {
-                'images': [  # Save the images
-                    {
-                        'pixmap': img['pixmap'].copy(),
-                        'original_pixmap': img['original_pixmap'].copy(),
-                        'x': img['x'],
-                        'y': img['y'],
-                        'rect': QRect(img['rect']),
-                    }
-                    for img in self.images
-                ],
-                'selected_image_index': self.selected_image_index,
-                'pixmap': self.pixmap.copy(),  # Save the current canvas pixmap
-                'overlay_pixmap': self.overlay_pixmap.copy(),  # Save the overlay layer
-                'text_objects': [
-                {
-                    'position': text_obj['position'],
-                    'text': text_obj['text'],
-                    'font': text_obj['font'],
-                    'color': text_obj['color'],
-                    'opacity': text_obj['opacity'],
-                }
-                for text_obj in self.text_tool.text_objects
-            ],
-                # Save slider values
-            'threshold_value': self.threshold_slider.value(),
-            'sharp_value': self.sharp_slider.value(),
-            'gamma_value': self.gamma_slider.value()
-            }
+            current_state = self.capture_state()
             self.redo_stack.append(current_state)
 
             # Restore the last state from the undo stack
-            last_state = self.undo_stack.pop()
-            self.images = last_state['images']
+            last_state = self.materialize_state(self.undo_stack.pop())
+            self.restore_images(last_state['images'])
             self.selected_image_index = last_state['selected_image_index']
             self.pixmap = last_state['pixmap']  # Restore the pixmap
             self.overlay_pixmap = last_state['overlay_pixmap']  # Restore the overlay layer
@@ -1641,40 +2044,12 @@ class CanvasWindow(QMainWindow):
     def redo_action(self):
         if self.redo_stack:
             # Save the current state to the undo stack
-            current_state = {
-                'images': [
-                    {
-                        'pixmap': img['pixmap'].copy(),
-                        'original_pixmap': img['original_pixmap'].copy(),
-                        'x': img['x'],
-                        'y': img['y'],
-                        'rect': QRect(img['rect']),
-                    }
-                    for img in self.images
-                ],
-                'selected_image_index': self.selected_image_index,
-                'pixmap': self.pixmap.copy(),
-                'overlay_pixmap': self.overlay_pixmap.copy(),
-                'text_objects': [
-                {
-                    'position': text_obj['position'],
-                    'text': text_obj['text'],
-                    'font': text_obj['font'],
-                    'color': text_obj['color'],
-                    'opacity': text_obj['opacity'],
-                }
-                for text_obj in self.text_tool.text_objects
-            ],
-                # Save slider values
-            'threshold_value': self.threshold_slider.value(),
-            'sharp_value': self.sharp_slider.value(),
-            'gamma_value': self.gamma_slider.value()
-            }
-            self.undo_stack.append(current_state)
+            current_state = self.capture_state()
+            self.push_undo_state(current_state)
 
             # Restore the next state from the redo stack
             next_state = self.redo_stack.pop()
-            self.images = next_state['images']
+            self.restore_images(next_state['images'])
             self.selected_image_index = next_state['selected_image_index']
             self.pixmap = next_state['pixmap']  # Restore the pixmap
             self.overlay_pixmap = next_state['overlay_pixmap']
@@ -1699,13 +2074,11 @@ class CanvasWindow(QMainWindow):
                 QMessageBox.warning(self, "Error", "Could not load the image.")
                 return
 
-            image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
-            h, w, ch = image.shape
-            bytes_per_line = ch * w
-            q_image = QImage(image.data, w, h, bytes_per_line, QImage.Format_RGB888)
-            pixmap = QPixmap.fromImage(q_image)
+            # Qt reads OpenCV's BGR order directly, fromImage copies so the array need not outlive it
+            pixmap = _array_pixmap(image, QImage.Format_BGR888)
 
             # Scale and center the image
+            h, w = image.shape[:2]
             if w > self.width or h > self.height:
                 pixmap = pixmap.scaled(self.width, self.height, Qt.KeepAspectRatio, Qt.SmoothTransformation)
 
@@ -1717,7 +2090,7 @@ class CanvasWindow(QMainWindow):
             # Add to the images list with both 'pixmap' and 'original_pixmap'
             self.images.append({
                 'pixmap': pixmap,
-                'original_pixmap': pixmap.copy(),  # Use .copy() to avoid references
+                'original_pixmap': QPixmap(pixmap),  # Shared until either one is modified, which detaches it
                 'x': x,
                 'y': y,
                 'rect': QRect(x, y, pixmap.width(), pixmap.height())
@@ -1788,19 +2161,31 @@ class CanvasWindow(QMainWindow):
         
     def get_clicked_anchor(self, pos, rect):
         """Detect if a specific anchor point is clicked."""
+        # Anchors sit on the corners, a click outside the padded rect cannot hit one
+        if not rect.adjusted(-5, -5, 5, 5).contains(pos):
+            return None
         anchors = {
             "top-left": rect.topLeft(),
             "top-right": rect.topRight(),
             "bottom-left": rect.bottomLeft(),
             "bottom-right": rect.bottomRight(),
         }
+        x, y = pos.x(), pos.y()
         for name, anchor in anchors.items():
-            if QRect(anchor.x() - 5, anchor.y() - 5, 10, 10).contains(pos):
+            # Same 10x10 hit box around the corner as QRect(anchor - 5, 10, 10).contains(pos)
+            if -5 <= x - anchor.x() < 5 and -5 <= y - anchor.y() < 5:
                 return name
         return None
 
+    def image_bounds(self, img_data):
+        """Screen area an image covers together with its selection frame and anchors."""
+        pixmap = img_data['pixmap']
+        return QRect(img_data['x'], img_data['y'], pixmap.width(), pixmap.height()).united(
+            img_data['rect'].adjusted(-6, -6, 6, 6))
+
     def scale_image(self, pos, img_data):
         """Scale the image dynamically based on anchor and mouse movement."""
+        before = self.image_bounds(img_data)
         rect = img_data['rect']
         anchor = self.anchor_clicked
 
@@ -1825,14 +2210,14 @@ class CanvasWindow(QMainWindow):
             if anchor in ["top-left", "top-right", "bottom-left", "bottom-right"]:
                 new_height = int(new_width / aspect_ratio)
 
-            # Scale the image
+            # Scale the image, a nearest-neighbour preview while dragging, mouseReleaseEvent smooths it
             img_data['pixmap'] = img_data['original_pixmap'].scaled(
-                new_width, new_height, Qt.KeepAspectRatio, Qt.SmoothTransformation
+                new_width, new_height, Qt.KeepAspectRatio, Qt.FastTransformation
             )
             # Update the rectangle
             img_data['rect'] = QRect(rect.topLeft(), QSize(new_width, new_height))
 
-        self.update()
+        self.update(before.united(self.image_bounds(img_data)))
         
     def toggle_scale_mode(self):
         self.scale_mode = not getattr(self, "scale_mode", False)  # Toggle scale_mode
@@ -1899,21 +2284,17 @@ class CanvasWindow(QMainWindow):
             
     def change_pen_type(self, pen_type):
         """Update the drawing tool based on selected pen type."""
-        if pen_type == "Pencil":
-            self.drawing_tool.set_pen_settings(color=Qt.black, width=1, opacity=1.0)
-        elif pen_type == "Brush":
-            self.drawing_tool.set_pen_settings(color=Qt.black, width=5, opacity=0.8)
-        elif pen_type == "Highlighter":
-            self.drawing_tool.set_pen_settings(color=Qt.yellow, width=10, opacity=0.5)
-        elif pen_type == "Marker":
-            self.drawing_tool.set_pen_settings(color=Qt.red, width=8, opacity=1.0)
-        elif pen_type == "Calligraphy":
-            self.drawing_tool.set_pen_settings(color=Qt.black, width=6, opacity=0.9, style=Qt.SolidLine)
-        elif pen_type == "ShapeTool":
-            self.shape_tool.set_pen_settings(color=Qt.blue, width=3, opacity=0.8, style=Qt.DashLine)
+        preset = _PEN_PRESETS.get(pen_type)
+        if preset is None:
+            return
+        tool = self.shape_tool if pen_type == "ShapeTool" else self.drawing_tool
+        tool.set_pen_settings(*preset)
             
     def choose_color(self):
-        """Open a color dialog to choose the pen color."""
+        """Open a color dialog to choose the pen color, or the text color in text mode."""
+        if self.text_mode:
+            self.choose_text_color()
+            return
         color = QColorDialog.getColor(initial=self.drawing_tool.pen_color, parent=self)
         if color.isValid():  # Check if the user selected a color
             self.drawing_tool.set_pen_settings(
@@ -1930,18 +2311,19 @@ class CanvasWindow(QMainWindow):
             )
             
     def update_value_box(self, value):
-        """Update the value box when the slider changes."""
+        """Update the value box when the slider changes, then the text size or the pen width."""
         self.size_value_box.setText(str(value))
-        self.drawing_tool.pen_width = value  # Update the pen width dynamically
-        self.shape_tool.pen_width = value 
+        if self.text_mode:
+            self.change_text_size(value)
+            return
+        for tool in (self.drawing_tool, self.shape_tool):  # Update the pen width dynamically
+            tool.set_pen_settings(tool.pen_color, value, tool.pen_opacity, tool.pen_style)
 
-    def update_slider(self, value):
-        """Update the slider when the value box changes."""
+    def update_slider(self):
+        """Update the slider when the value box is committed; the slider then updates the pens."""
+        value = self.size_value_box.text()
         if value.isdigit():  # Ensure valid input
-            pen_size = int(value)
-            self.size_slider.setValue(pen_size)
-            self.drawing_tool.pen_width = pen_size  # Update the pen width
-            self.shape_tool.pen_width = pen_size
+            self.size_slider.setValue(int(value))
 
     def set_pen_settings(self, color=Qt.black, width=1, opacity=1.0, style=Qt.SolidLine):
         """Update the pen settings."""
@@ -1951,18 +2333,19 @@ class CanvasWindow(QMainWindow):
         self.pen_style = style
         
     def update_opacity_value_box(self, value):
-        """Update the opacity value box when the slider changes."""
+        """Update the opacity value box when the slider changes, then the text or the pen opacity."""
         self.opacity_value_box.setText(str(value))
+        if self.text_mode:
+            self.change_text_opacity(value)
+            return
         self.drawing_tool.pen_opacity = value / 100.0  # Update opacity dynamically (0.0 to 1.0)
         self.shape_tool.pen_opacity = value / 100.0
 
-    def update_opacity_slider(self, value):
-        """Update the opacity slider when the value box changes."""
+    def update_opacity_slider(self):
+        """Update the opacity slider when the value box is committed; the slider then updates the pens."""
+        value = self.opacity_value_box.text()
         if value.isdigit():  # Ensure valid input
-            opacity = int(value)
-            self.opacity_slider.setValue(opacity)
-            self.drawing_tool.pen_opacity = opacity / 100.0  # Update opacity dynamically
-            self.shape_tool.pen_opacity = opacity / 100.0
+            self.opacity_slider.setValue(int(value))
 
     def toggle_eraser_mode(self):
         self.eraser_mode = not self.eraser_mode
@@ -2048,7 +2431,7 @@ class CanvasWindow(QMainWindow):
         ]
 
         for shape_name, icon_path in shapes:
-            icon = QIcon(icon_path)
+            icon = _icon(icon_path)
             self.shape_dropdown.addItem(icon, shape_name)
 
         # Connect dropdown selection to shape tool
@@ -2117,9 +2500,12 @@ class CanvasWindow(QMainWindow):
         
     def populate_fonts(self):
         """Populate the font dropdown with available system fonts."""
-        font_database = QFontDatabase()
-        fonts = font_database.families()
-        self.font_dropdown.addItems(fonts)
+        current = self.font_dropdown.currentText()
+        self.font_dropdown.blockSignals(True)  # Keep the selected font, this is not a user choice
+        self.font_dropdown.clear()
+        self.font_dropdown.addItems(_font_families())
+        self.font_dropdown.setCurrentIndex(max(self.font_dropdown.findText(current), 0))
+        self.font_dropdown.blockSignals(False)
         
     def set_font(self):
         """Set the selected font for the TextTool."""
@@ -2188,17 +2574,38 @@ class CanvasWindow(QMainWindow):
         self.update_mini_canvas()
 
     def update_mini_canvas(self):
+        """Schedule a mini canvas refresh; the repaint done by its own render() schedules nothing."""
+        if (hasattr(self, 'mini_canvas_window') and self.mini_canvas_window.isVisible()
+                and not self._rendering_mini_canvas and not self._mini_timer.isActive()):
+            self._mini_timer.start()
+
+    def draw_mini_canvas(self):
         if hasattr(self, 'mini_canvas_window') and self.mini_canvas_window.isVisible():
-            # Create a pixmap of the current canvas state
-            canvas_pixmap = QPixmap(self.width, self.height)
-            self.render(canvas_pixmap)
+            # Render the current canvas state straight at the preview's size instead of at full
+            # resolution, the painter's scale shrinks everything paintEvent draws
+            source = QSize(self.width, self.height)
+            target = source.scaled(self.mini_canvas_window.canvas_size(), Qt.KeepAspectRatio)
+            if target.isEmpty():
+                return
+            canvas_pixmap = QPixmap(target)
+            canvas_pixmap.fill(Qt.transparent)
+            painter = QPainter(canvas_pixmap)
+            painter.setRenderHint(QPainter.SmoothPixmapTransform)
+            painter.scale(target.width() / source.width(), target.height() / source.height())
+            self._rendering_mini_canvas = True
+            try:
+                self.render(painter, QPoint(), QRegion(0, 0, source.width(), source.height()))
+            finally:
+                self._rendering_mini_canvas = False
+                painter.end()
             self.mini_canvas_window.update_canvas(canvas_pixmap)
             
     def flip_horizontal(self):
         if self.selected_image_index is not None and 0 <= self.selected_image_index < len(self.images):
             self.save_state()  # Save state for undo functionality
             img_data = self.images[self.selected_image_index]
-            img_data['pixmap'] = img_data['pixmap'].transformed(QTransform().scale(-1, 1))  # Flip horizontally
+            # QImage.mirrored is a plain row/pixel copy, cheaper than a general transform
+            img_data['pixmap'] = QPixmap.fromImage(img_data['pixmap'].toImage().mirrored(True, False))  # Flip horizontally
             self.update()  # Refresh the canvas
         else:
             QMessageBox.warning(self, "Warning", "No image selected to flip horizontally.")
@@ -2207,7 +2614,7 @@ class CanvasWindow(QMainWindow):
         if self.selected_image_index is not None and 0 <= self.selected_image_index < len(self.images):
             self.save_state()  # Save state for undo functionality
             img_data = self.images[self.selected_image_index]
-            img_data['pixmap'] = img_data['pixmap'].transformed(QTransform().scale(1, -1))  # Flip vertically
+            img_data['pixmap'] = QPixmap.fromImage(img_data['pixmap'].toImage().mirrored(False, True))  # Flip vertically
             self.update()  # Refresh the canvas
         else:
             QMessageBox.warning(self, "Warning", "No image selected to flip vertically.")
@@ -2229,39 +2636,50 @@ class CanvasWindow(QMainWindow):
 
         # Scale images
         for img in self.images:
-            original_pixmap = img['original_pixmap']
-            scaled_pixmap = original_pixmap.scaled(
-                int(original_pixmap.width() * self.current_scale_factor),
-                int(original_pixmap.height() * self.current_scale_factor),
-                Qt.KeepAspectRatio,
-                Qt.SmoothTransformation
-            )
+            scaled_pixmap = self.zoomed_pixmap(img['original_pixmap'])
             img['pixmap'] = scaled_pixmap
             img['x'] = self.canvas_x + (self.width - scaled_pixmap.width()) // 2
             img['y'] = self.canvas_y + (self.height - scaled_pixmap.height()) // 2
             img['rect'] = QRect(img['x'], img['y'], scaled_pixmap.width(), scaled_pixmap.height())
 
-        # Scale the drawing canvas
-        self.pixmap = self.pixmap.scaled(
-            int(self.width * self.current_scale_factor),
-            int(self.height * self.current_scale_factor),
-            Qt.KeepAspectRatio,
-            Qt.SmoothTransformation
-        )
-
-        # Scale overlay pixmap (for drawings, shapes, etc.)
-        self.overlay_pixmap = self.overlay_pixmap.scaled(
-            int(self.width * self.current_scale_factor),
-            int(self.height * self.current_scale_factor),
-            Qt.KeepAspectRatio,
-            Qt.SmoothTransformation
-        )
+        # Scale the drawing canvas and the overlay pixmap (for drawings, shapes, etc.), a reset
+        # back to the size they already have leaves them as they are
+        canvas_size = QSize(int(self.width * self.current_scale_factor),
+                            int(self.height * self.current_scale_factor))
+        if self.pixmap.size() != canvas_size:
+            self.pixmap = self.pixmap.scaled(canvas_size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        if self.overlay_pixmap.size() != canvas_size:
+            self.overlay_pixmap = self.overlay_pixmap.scaled(canvas_size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
 
         # Update the canvas
         self.update()
         self.update_histogram()
             
+    def zoomed_pixmap(self, original_pixmap):
+        """An original image smoothly scaled to the current zoom, reused when a zoom level is revisited."""
+        size = QSize(int(original_pixmap.width() * self.current_scale_factor),
+                     int(original_pixmap.height() * self.current_scale_factor))
+        key = (original_pixmap.cacheKey(), size.width(), size.height())
+        scaled_pixmap = self._zoom_cache.get(key)
+        if scaled_pixmap is None:
+            scaled_pixmap = original_pixmap.scaled(size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+            # Keep the last few levels of each image, enough for zooming back and forth
+            if len(self._zoom_cache) >= 4 * max(1, len(self.images)):
+                del self._zoom_cache[next(iter(self._zoom_cache))]
+            self._zoom_cache[key] = scaled_pixmap
+        # A fresh handle, painting into the image detaches it from the cached pixels
+        return QPixmap(scaled_pixmap)
+
     def update_histogram(self):
+        """Schedule a histogram redraw, checkbox toggles and filters in a row collapse into one.
+
+        Nothing is drawn while a filter slider is held, releasing it asks again.
+        """
+        if any(slider.isSliderDown() for slider in self._filter_sliders):
+            return
+        self._hist_timer.start()
+
+    def draw_histogram(self):
         """Update the RGB histogram based on the selected channels."""
         if self.selected_image_index is None or not self.images:
             print("No image selected or no images loaded.")
@@ -2270,41 +2688,66 @@ class CanvasWindow(QMainWindow):
         # Get the selected image
         selected_image = self.images[self.selected_image_index]['pixmap']
 
-        # Convert QPixmap to QImage
-        q_image = selected_image.toImage()
-        q_image = q_image.convertToFormat(QImage.Format_RGB888)
+        # save_state asks for a histogram on every edit, most leave the selected image untouched
+        histogram_key = (selected_image.cacheKey(),
+                         self.check_red.isChecked(), self.check_green.isChecked(), self.check_blue.isChecked())
+        if histogram_key == self._histogram_key:
+            return
+        self._histogram_key = histogram_key
+
+        # Convert QPixmap to QImage, RGB32 is usually what the pixmap already holds so no conversion runs
+        q_image = _bgrx_image(selected_image)
 
-        # Get dimensions and stride
+        # View the QImage buffer without copying, RGB32 rows are 4 * width bytes in B, G, R, X order
         width, height = q_image.width(), q_image.height()
-        stride = q_image.bytesPerLine()
-        ptr = q_image.bits()
-        ptr.setsize(q_image.byteCount())
-
-        # Convert the QImage to a numpy array while handling the stride
-        img_array = np.array(ptr).reshape((height, stride))[:, :width * 3]
-        img_array = img_array.reshape((height, width, 3))
-
-        # Clear previous plot on the histogram figure
-        self.figure_histogram.clear()
-        ax = self.figure_histogram.add_subplot(111)
-
-        # Plot histograms for selected channels
-        if self.check_red.isChecked():
-            hist = cv2.calcHist([img_array], [0], None, [256], [0, 256])
-            ax.plot(hist, color='r', label='Red')
-        if self.check_green.isChecked():
-            hist = cv2.calcHist([img_array], [1], None, [256], [0, 256])
-            ax.plot(hist, color='g', label='Green')
-        if self.check_blue.isChecked():
-            hist = cv2.calcHist([img_array], [2], None, [256], [0, 256])
-            ax.plot(hist, color='b', label='Blue')
-
-        ax.set_xlim([0, 256])
-        ax.legend()
-        self.histogram_canvas.draw()
+        img_array = _image_pixels(q_image, 4)
+
+        # Count an evenly spread subset of a large image's pixels, nearest-neighbour resizing picks
+        # them in one fast pass; the counts are scaled back up so the axis reads as the full image
+        count_scale = 1.0
+        if width * height > self.HISTOGRAM_SAMPLES:
+            step = (width * height / self.HISTOGRAM_SAMPLES) ** 0.5
+            sample_size = (max(1, int(width / step)), max(1, int(height / step)))
+            img_array = cv2.resize(img_array, sample_size, interpolation=cv2.INTER_NEAREST)
+            count_scale = width * height / (sample_size[0] * sample_size[1])
+
+        # Create the histogram figure and one line per channel once, later redraws only swap their data
+        if self.figure_histogram is None:
+            self.figure_histogram = Figure()
+            self.histogram_axes = self.figure_histogram.add_subplot(111)
+            self.histogram_lines = [(check, channel, self.histogram_axes.plot(np.zeros(256), color=plot_color, label=label)[0])
+                                    for check, channel, plot_color, label in ((self.check_red, 2, 'r', 'Red'),
+                                                                              (self.check_green, 1, 'g', 'Green'),
+                                                                              (self.check_blue, 0, 'b', 'Blue'))]
+            self.histogram_axes.set_xlim([0, 256])
+            canvas = FigureCanvas(self.figure_histogram)
+            self.histogram_layout.replaceWidget(self.histogram_canvas, canvas)
+            self.histogram_canvas.deleteLater()
+            self.histogram_canvas = canvas
+        ax = self.histogram_axes
+
+        # Update the lines of the selected channels, calcHist counts one channel in a single strided pass
+        shown = []
+        for check, channel, line in self.histogram_lines:
+            line.set_visible(check.isChecked())
+            if check.isChecked():
+                hist = cv2.calcHist([img_array], [channel], None, [256], [0, 256])
+                line.set_ydata(hist.ravel() * count_scale)
+                shown.append(line)
+
+        # Fit the y axis to the visible lines and list only those in the legend
+        ax.relim(visible_only=True)
+        ax.autoscale_view(scalex=False)
+        if shown:
+            ax.legend(handles=shown)
+        elif ax.get_legend() is not None:
+            ax.get_legend().remove()
+        self.histogram_canvas.draw_idle()
 
     def resize_pixmap(self, source_pixmap, target_size):
         """Resize the source QPixmap to the target size."""
+        if source_pixmap.size() == target_size:  # Unscaled images skip the smooth resample
+            return source_pixmap
         return source_pixmap.scaled(target_size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
 
         
@@ -2312,6 +2755,10 @@ class CanvasWindow(QMainWindow):
         if self.selected_image_index is None or not self.images:
             return
 
+        filter_params = ('gamma', self.gamma_slider.value())
+        if self.filter_is_current(filter_params):
+            return
+
         self.save_state()
 
         # Get the original image and current size
@@ -2320,28 +2767,18 @@ class CanvasWindow(QMainWindow):
         current_size = selected_image['pixmap'].size()
 
         # Convert original_pixmap to OpenCV format
-        q_image = original_pixmap.toImage()
-        q_image = q_image.convertToFormat(QImage.Format_RGB32)
-        width, height = q_image.width(), q_image.height()
-        ptr = q_image.bits()
-        ptr.setsize(q_image.byteCount())
-        cv_image = np.array(ptr).reshape((height, width, 4))[:, :, :3]  # Extract RGB channels
+        cv_image = self.original_array(original_pixmap)  # Cached, BGR channel order
 
         # Get gamma value from the slider
         gamma_value = self.gamma_slider.value() / 10.0
         self.gamma_label.setText(f"Gamma: {gamma_value:.1f}")
 
         # Apply gamma correction
-        inv_gamma = 1.0 / gamma_value
-        table = np.array([(i / 255.0) ** inv_gamma * 255 for i in range(256)]).astype("uint8")
-        gamma_corrected_image = cv2.LUT(cv_image, table)
+        gamma_corrected_image = cv2.LUT(cv_image, _gamma_lut(self.gamma_slider.value()),
+                                        dst=self.filter_output(cv_image))
 
         # Convert back to QPixmap
-        gamma_corrected_image = cv2.cvtColor(gamma_corrected_image, cv2.COLOR_BGR2RGB)
-        h, w, ch = gamma_corrected_image.shape
-        bytes_per_line = ch * w
-        qt_image = QImage(gamma_corrected_image.data, w, h, bytes_per_line, QImage.Format_RGB888)
-        new_pixmap = QPixmap.fromImage(qt_image)
+        new_pixmap = _array_pixmap(gamma_corrected_image, QImage.Format_BGR888)
 
         # Resize to match the current cropped and scaled size
         resized_pixmap = self.resize_pixmap(new_pixmap, current_size)
@@ -2349,6 +2786,7 @@ class CanvasWindow(QMainWindow):
         # Update the displayed pixmap
         selected_image['pixmap'] = resized_pixmap
 
+        self.remember_filter(filter_params)
         self.update_histogram()
         self.update()
 
@@ -2367,34 +2805,13 @@ class CanvasWindow(QMainWindow):
         current_size = selected_image['pixmap'].size()
 
         # Convert original_pixmap to OpenCV format
-        q_image = original_pixmap.toImage()
-        q_image = q_image.convertToFormat(QImage.Format_RGB888)
-
-        width, height = q_image.width(), q_image.height()
-        stride = q_image.bytesPerLine()
-        ptr = q_image.bits()
-        ptr.setsize(q_image.byteCount())
-        img_array = np.array(ptr).reshape((height, stride))[:, :width * 3]
-        img_array = img_array.reshape((height, width, 3))
-
-        # Separate into RGB channels
-        red_channel = img_array[:, :, 0]
-        green_channel = img_array[:, :, 1]
-        blue_channel = img_array[:, :, 2]
-
-        # Apply bit-plane slicing
-        red_bit_plane = ((red_channel >> bit) & 1) * 255
-        green_bit_plane = ((green_channel >> bit) & 1) * 255
-        blue_bit_plane = ((blue_channel >> bit) & 1) * 255
+        img_array = self.original_array(original_pixmap, rgb=True)  # Cached, RGB channel order
 
-        # Combine channels back into an RGB image
-        sliced_image = np.stack([red_bit_plane, green_bit_plane, blue_bit_plane], axis=-1).astype(np.uint8)
+        # Apply bit-plane slicing to all channels at once through a 256-entry table
+        sliced_image = cv2.LUT(img_array, _bit_plane_lut(bit), dst=self.filter_output(img_array))
 
         # Convert back to QPixmap
-        h, w, ch = sliced_image.shape
-        bytes_per_line = ch * w
-        sliced_q_image = QImage(sliced_image.data, w, h, bytes_per_line, QImage.Format_RGB888)
-        new_pixmap = QPixmap.fromImage(sliced_q_image)
+        new_pixmap = _array_pixmap(sliced_image, QImage.Format_RGB888)
 
         # Resize to match the current cropped and scaled size
         resized_pixmap = self.resize_pixmap(new_pixmap, current_size)
@@ -2410,6 +2827,10 @@ class CanvasWindow(QMainWindow):
         if self.selected_image_index is None or not self.images:
             return  # No image selected or no images loaded
 
+        filter_params = ('sharp', self.sharp_slider.value())
+        if self.filter_is_current(filter_params):
+            return
+
         self.save_state()  # Save the state for undo before making changes
 
         # Get the selected image
@@ -2418,12 +2839,7 @@ class CanvasWindow(QMainWindow):
         current_size = selected_image['pixmap'].size()
 
         # Convert QImage to OpenCV format
-        q_image = original_pixmap.toImage()
-        q_image = q_image.convertToFormat(QImage.Format_RGB32)
-        width, height = q_image.width(), q_image.height()
-        ptr = q_image.bits()
-        ptr.setsize(q_image.byteCount())
-        cv_image = np.array(ptr).reshape((height, width, 4))[:, :, :3]  # Extract RGB channels
+        cv_image = self.original_array(original_pixmap)  # Cached, BGR channel order
 
         # Get sharpening level from slider (convert scaled integer back to float)
         sharp_value = self.sharp_slider.value() / 10.0
@@ -2441,14 +2857,10 @@ class CanvasWindow(QMainWindow):
             kernel[kernel_size // 2, kernel_size // 2] = center_value
 
             # Apply sharpening filter
-            sharp_image = cv2.filter2D(cv_image, -1, kernel)
+            sharp_image = cv2.filter2D(cv_image, -1, kernel, dst=self.filter_output(cv_image))
 
             # Convert back to QPixmap
-            sharp_image = cv2.cvtColor(sharp_image, cv2.COLOR_BGR2RGB)
-            h, w, ch = sharp_image.shape
-            bytes_per_line = ch * w
-            qt_image = QImage(sharp_image.data, w, h, bytes_per_line, QImage.Format_RGB888)
-            sharp_pixmap = QPixmap.fromImage(qt_image)
+            sharp_pixmap = _array_pixmap(sharp_image, QImage.Format_BGR888)
 
             # Resize the sharpened image to match the current dimensions
             resized_pixmap = self.resize_pixmap(sharp_pixmap, current_size)
@@ -2456,6 +2868,7 @@ class CanvasWindow(QMainWindow):
             # Update the selected image's displayed pixmap
             self.images[self.selected_image_index]['pixmap'] = resized_pixmap
 
+        self.remember_filter(filter_params)
         self.update()
         self.update_histogram()
 
@@ -2464,6 +2877,10 @@ class CanvasWindow(QMainWindow):
         if self.selected_image_index is None or not self.images:
             return  # No image selected or no images loaded
 
+        filter_params = ('threshold', self.threshold_slider.value())
+        if self.filter_is_current(filter_params):
+            return
+
         self.save_state()
 
         # Get the selected image
@@ -2472,31 +2889,17 @@ class CanvasWindow(QMainWindow):
         current_size = selected_image['pixmap'].size()
 
         # Convert QImage to OpenCV format
-        q_image = original_pixmap.toImage()
-        q_image = q_image.convertToFormat(QImage.Format_RGB32)
-        width, height = q_image.width(), q_image.height()
-        ptr = q_image.bits()
-        ptr.setsize(q_image.byteCount())
-        cv_image = np.array(ptr).reshape((height, width, 4))[:, :, :3]  # Extract RGB channels
+        cv_image = self.original_array(original_pixmap)  # Cached, BGR channel order
 
         # Get threshold value from slider
         threshold_value = self.threshold_slider.value()
         threshold_label.setText(f"Threshold Value: {threshold_value}")
 
-        # Apply thresholding to each channel (R, G, B)
-        channels = cv2.split(cv_image)  # Split the image into R, G, B channels
-        thresholded_channels = [
-            cv2.threshold(channel, threshold_value, 255, cv2.THRESH_BINARY)[1]
-            for channel in channels
-        ]
-        thresholded_image = cv2.merge(thresholded_channels)  # Merge the thresholded channels back
+        # Apply binary thresholding to each channel (R, G, B) in one pass, compare yields 255 or 0
+        thresholded_image = cv2.compare(cv_image, threshold_value, cv2.CMP_GT, dst=self.filter_output(cv_image))
 
         # Convert back to QPixmap
-        thresholded_image = cv2.cvtColor(thresholded_image, cv2.COLOR_BGR2RGB)
-        h, w, ch = thresholded_image.shape
-        bytes_per_line = ch * w
-        qt_image = QImage(thresholded_image.data, w, h, bytes_per_line, QImage.Format_RGB888)
-        threshold_pixmap = QPixmap.fromImage(qt_image)
+        threshold_pixmap = _array_pixmap(thresholded_image, QImage.Format_BGR888)
 
         # Resize the thresholded image to match the current dimensions
         resized_pixmap = self.resize_pixmap(threshold_pixmap, current_size)
@@ -2504,6 +2907,7 @@ class CanvasWindow(QMainWindow):
         # Update the selected image's displayed pixmap
         self.images[self.selected_image_index]['pixmap'] = resized_pixmap
 
+        self.remember_filter(filter_params)
         self.update()
         self.update_histogram()
         
@@ -2511,6 +2915,10 @@ class CanvasWindow(QMainWindow):
         if self.selected_image_index is None or not self.images:
             return  # No image selected or no images loaded
 
+        filter_params = ('erosion', self.erosion_slider.value())
+        if self.filter_is_current(filter_params):
+            return
+
         self.save_state()
 
         # Get the original image and current size
@@ -2519,27 +2927,18 @@ class CanvasWindow(QMainWindow):
         current_size = selected_image['pixmap'].size()
 
         # Convert QImage to OpenCV format
-        q_image = original_pixmap.toImage()
-        q_image = q_image.convertToFormat(QImage.Format_RGB32)
-        width, height = q_image.width(), q_image.height()
-        ptr = q_image.bits()
-        ptr.setsize(q_image.byteCount())
-        cv_image = np.array(ptr).reshape((height, width, 4))[:, :, :3]  # Extract RGB channels
+        cv_image = self.original_array(original_pixmap)  # Cached, BGR channel order
 
         # Get kernel size from slider
         kernel_size = self.erosion_slider.value()
         erosion_label.setText(f"Erosion Kernel Size: {kernel_size}")
 
         # Apply erosion
-        kernel = np.ones((kernel_size, kernel_size), np.uint8)
-        eroded_image = cv2.erode(cv_image, kernel)
+        kernel = _morph_kernel(kernel_size)
+        eroded_image = cv2.erode(cv_image, kernel, dst=self.filter_output(cv_image))
 
         # Convert back to QPixmap
-        eroded_image = cv2.cvtColor(eroded_image, cv2.COLOR_BGR2RGB)
-        h, w, ch = eroded_image.shape
-        bytes_per_line = ch * w
-        qt_image = QImage(eroded_image.data, w, h, bytes_per_line, QImage.Format_RGB888)
-        new_pixmap = QPixmap.fromImage(qt_image)
+        new_pixmap = _array_pixmap(eroded_image, QImage.Format_BGR888)
 
         # Resize to match the current cropped and scaled size
         resized_pixmap = self.resize_pixmap(new_pixmap, current_size)
@@ -2547,6 +2946,7 @@ class CanvasWindow(QMainWindow):
         # Update the displayed pixmap
         selected_image['pixmap'] = resized_pixmap
 
+        self.remember_filter(filter_params)
         self.update_histogram()
         self.update()
 
@@ -2555,6 +2955,10 @@ class CanvasWindow(QMainWindow):
         if self.selected_image_index is None or not self.images:
             return  # No image selected or no images loaded
 
+        filter_params = ('dilation', self.dilation_slider.value())
+        if self.filter_is_current(filter_params):
+            return
+
         self.save_state()
 
         # Get the original image and current size
@@ -2563,27 +2967,18 @@ class CanvasWindow(QMainWindow):
         current_size = selected_image['pixmap'].size()
 
         # Convert QImage to OpenCV format
-        q_image = original_pixmap.toImage()
-        q_image = q_image.convertToFormat(QImage.Format_RGB32)
-        width, height = q_image.width(), q_image.height()
-        ptr = q_image.bits()
-        ptr.setsize(q_image.byteCount())
-        cv_image = np.array(ptr).reshape((height, width, 4))[:, :, :3]  # Extract RGB channels
+        cv_image = self.original_array(original_pixmap)  # Cached, BGR channel order
 
         # Get kernel size from slider
         kernel_size = self.dilation_slider.value()
         dilation_label.setText(f"Dilation Kernel Size: {kernel_size}")
 
         # Apply dilation
-        kernel = np.ones((kernel_size, kernel_size), np.uint8)
-        dilated_image = cv2.dilate(cv_image, kernel)
+        kernel = _morph_kernel(kernel_size)
+        dilated_image = cv2.dilate(cv_image, kernel, dst=self.filter_output(cv_image))
 
         # Convert back to QPixmap
-        dilated_image = cv2.cvtColor(dilated_image, cv2.COLOR_BGR2RGB)
-        h, w, ch = dilated_image.shape
-        bytes_per_line = ch * w
-        qt_image = QImage(dilated_image.data, w, h, bytes_per_line, QImage.Format_RGB888)
-        new_pixmap = QPixmap.fromImage(qt_image)
+        new_pixmap = _array_pixmap(dilated_image, QImage.Format_BGR888)
 
         # Resize to match the current cropped and scaled size
         resized_pixmap = self.resize_pixmap(new_pixmap, current_size)
@@ -2591,6 +2986,7 @@ class CanvasWindow(QMainWindow):
         # Update the displayed pixmap
         selected_image['pixmap'] = resized_pixmap
 
+        self.remember_filter(filter_params)
         self.update_histogram()
         self.update()
         
@@ -2599,6 +2995,10 @@ class CanvasWindow(QMainWindow):
         if self.selected_image_index is None or not self.images:
             return
         
+        filter_params = ('canny', self.canny_lower_slider.value(), self.canny_upper_slider.value())
+        if self.filter_is_current(filter_params):
+            return
+
         self.save_state()
 
         lower_thresh = self.canny_lower_slider.value()
@@ -2609,20 +3009,13 @@ class CanvasWindow(QMainWindow):
 
         # Get the selected image
         selected_image = self.images[self.selected_image_index]['original_pixmap']
-        q_image = selected_image.toImage().convertToFormat(QImage.Format_RGB888)
-        width, height = q_image.width(), q_image.height()
-        ptr = q_image.bits()
-        ptr.setsize(q_image.byteCount())
-        stride = q_image.bytesPerLine()
-        img_array = np.frombuffer(ptr, dtype=np.uint8).reshape((height, stride))[:, :width * 3].reshape((height, width, 3))
+        gray_image = self.display_gray(selected_image, self.images[self.selected_image_index]['pixmap'].size())
 
-        # Convert to grayscale and apply Canny
-        gray_image = cv2.cvtColor(img_array, cv2.COLOR_RGB2GRAY)
+        # Apply Canny
         edges = cv2.Canny(gray_image, lower_thresh, upper_thresh)
 
         # Convert edges to QPixmap and resize
-        edges_qimage = QImage(edges.data, edges.shape[1], edges.shape[0], edges.strides[0], QImage.Format_Grayscale8)
-        new_pixmap = QPixmap.fromImage(edges_qimage)
+        new_pixmap = _array_pixmap(edges, QImage.Format_Grayscale8)
 
         # Resize the pixmap to the current display size
         current_display_size = self.images[self.selected_image_index]['pixmap'].size()
@@ -2630,6 +3023,7 @@ class CanvasWindow(QMainWindow):
 
         # Update the displayed pixmap
         self.images[self.selected_image_index]['pixmap'] = resized_pixmap
+        self.remember_filter(filter_params)
         self.update()
         self.update_histogram()
 
@@ -2640,25 +3034,16 @@ class CanvasWindow(QMainWindow):
 
         # Get the selected image
         selected_image = self.images[self.selected_image_index]['original_pixmap']
-        q_image = selected_image.toImage().convertToFormat(QImage.Format_RGB888)
-        width, height = q_image.width(), q_image.height()
-        ptr = q_image.bits()
-        ptr.setsize(q_image.byteCount())
-        stride = q_image.bytesPerLine()
-        img_array = np.frombuffer(ptr, dtype=np.uint8).reshape((height, stride))[:, :width * 3].reshape((height, width, 3))
-
-        # Convert to grayscale
-        gray_image = cv2.cvtColor(img_array, cv2.COLOR_RGB2GRAY)
+        gray_image = self.display_gray(selected_image, self.images[self.selected_image_index]['pixmap'].size())
 
-        # Apply Prewitt filters
-        prewitt_x = cv2.filter2D(gray_image, -1, np.array([[1, 0, -1], [1, 0, -1], [1, 0, -1]]))
-        prewitt_y = cv2.filter2D(gray_image, -1, np.array([[1, 1, 1], [0, 0, 0], [-1, -1, -1]]))
-        prewitt_combined = cv2.addWeighted(prewitt_x, 0.5, prewitt_y, 0.5, 0)
+        # Apply Prewitt filters into signed 16-bit so negative gradients aren't clipped to zero,
+        # then combine as |Gx| + |Gy| saturated to 8 bits
+        prewitt_x = cv2.sepFilter2D(gray_image, cv2.CV_16S, _PREWITT_DERIVATIVE, _PREWITT_SMOOTH)
+        prewitt_y = cv2.sepFilter2D(gray_image, cv2.CV_16S, _PREWITT_SMOOTH, _PREWITT_DERIVATIVE)
+        prewitt_combined = cv2.add(cv2.convertScaleAbs(prewitt_x), cv2.convertScaleAbs(prewitt_y))
 
         # Convert combined Prewitt edges to QPixmap
-        prewitt_qimage = QImage(prewitt_combined.data, prewitt_combined.shape[1], prewitt_combined.shape[0],
-                                prewitt_combined.strides[0], QImage.Format_Grayscale8)
-        new_pixmap = QPixmap.fromImage(prewitt_qimage)
+        new_pixmap = _array_pixmap(prewitt_combined, QImage.Format_Grayscale8)
 
         # Resize the pixmap to the current display size
         current_display_size = self.images[self.selected_image_index]['pixmap'].size()
@@ -2674,6 +3059,10 @@ class CanvasWindow(QMainWindow):
         if self.selected_image_index is None or not self.images:
             return
         
+        filter_params = ('sobel', self.sobel_slider.value())
+        if self.filter_is_current(filter_params):
+            return
+
         self.save_state()
 
         kernel_size = self.sobel_slider.value()
@@ -2684,26 +3073,21 @@ class CanvasWindow(QMainWindow):
 
         # Get the selected image
         selected_image = self.images[self.selected_image_index]['original_pixmap']
-        q_image = selected_image.toImage().convertToFormat(QImage.Format_RGB888)
-        width, height = q_image.width(), q_image.height()
-        ptr = q_image.bits()
-        ptr.setsize(q_image.byteCount())
-        stride = q_image.bytesPerLine()
-        img_array = np.frombuffer(ptr, dtype=np.uint8).reshape((height, stride))[:, :width * 3].reshape((height, width, 3))
+        gray_image = self.display_gray(selected_image, self.images[self.selected_image_index]['pixmap'].size())
 
-        # Convert to grayscale and apply Sobel
-        gray_image = cv2.cvtColor(img_array, cv2.COLOR_RGB2GRAY)
-        sobel_x = cv2.Sobel(gray_image, cv2.CV_64F, 1, 0, ksize=kernel_size)
-        sobel_y = cv2.Sobel(gray_image, cv2.CV_64F, 0, 1, ksize=kernel_size)
+        # Apply Sobel
+        # Signed 16-bit derivatives; anything saturating there is far past the 255 the result clips to
+        if kernel_size == 3:
+            sobel_x, sobel_y = cv2.spatialGradient(gray_image)
+        else:
+            sobel_x = cv2.Sobel(gray_image, cv2.CV_16S, 1, 0, ksize=kernel_size)
+            sobel_y = cv2.Sobel(gray_image, cv2.CV_16S, 0, 1, ksize=kernel_size)
 
-        # Calculate gradient magnitude
-        sobel_combined = cv2.magnitude(sobel_x, sobel_y)
-        sobel_combined = np.uint8(np.clip(sobel_combined, 0, 255))
+        # Calculate gradient magnitude as |Gx| + |Gy|, saturated to 8 bits
+        sobel_combined = cv2.add(cv2.convertScaleAbs(sobel_x), cv2.convertScaleAbs(sobel_y))
 
         # Convert to QPixmap and resize
-        sobel_qimage = QImage(sobel_combined.data, sobel_combined.shape[1], sobel_combined.shape[0],
-                            sobel_combined.strides[0], QImage.Format_Grayscale8)
-        new_pixmap = QPixmap.fromImage(sobel_qimage)
+        new_pixmap = _array_pixmap(sobel_combined, QImage.Format_Grayscale8)
 
         # Resize the pixmap to the current display size
         current_display_size = self.images[self.selected_image_index]['pixmap'].size()
@@ -2711,6 +3095,7 @@ class CanvasWindow(QMainWindow):
 
         # Update the displayed pixmap
         self.images[self.selected_image_index]['pixmap'] = resized_pixmap
+        self.remember_filter(filter_params)
         self.update()
         self.update_histogram()
 
@@ -2718,6 +3103,10 @@ class CanvasWindow(QMainWindow):
         if self.selected_image_index is None or not self.images:
             return
 
+        filter_params = ('piecewise', self.piecewise_slider.value())
+        if self.filter_is_current(filter_params):
+            return
+
         self.save_state()
 
         # Get the selected image and current size
@@ -2726,12 +3115,7 @@ class CanvasWindow(QMainWindow):
         current_size = selected_image['pixmap'].size()
 
         # Convert QPixmap to OpenCV format
-        q_image = original_pixmap.toImage()
-        q_image = q_image.convertToFormat(QImage.Format_RGB32)
-        width, height = q_image.width(), q_image.height()
-        ptr = q_image.bits()
-        ptr.setsize(q_image.byteCount())
-        cv_image = np.array(ptr).reshape((height, width, 4))[:, :, :3]  # Extract RGB channels
+        cv_image = self.original_array(original_pixmap)  # Cached, BGR channel order
 
         # Get the piecewise point value from the slider
         piecewise_point = self.piecewise_slider.value()
@@ -2744,21 +3128,10 @@ class CanvasWindow(QMainWindow):
             piecewise_point = 254
 
         # Perform piecewise linear transformation
-        lookup_table = np.array([
-            min(max((i * 255) // piecewise_point, 0), 255) if i <= piecewise_point
-            else min(max(128 + (i - piecewise_point) * 127 // (255 - piecewise_point), 0), 255)
-            for i in range(256)
-        ]).astype(np.uint8)
-
-        # Apply the lookup table to the image
-        transformed_image = cv2.LUT(cv_image, lookup_table)
+        transformed_image = cv2.LUT(cv_image, _piecewise_lut(piecewise_point), dst=self.filter_output(cv_image))
 
         # Convert back to QPixmap
-        transformed_image = cv2.cvtColor(transformed_image, cv2.COLOR_BGR2RGB)
-        h, w, ch = transformed_image.shape
-        bytes_per_line = ch * w
-        qt_image = QImage(transformed_image.data, w, h, bytes_per_line, QImage.Format_RGB888)
-        new_pixmap = QPixmap.fromImage(qt_image)
+        new_pixmap = _array_pixmap(transformed_image, QImage.Format_BGR888)
 
         # Resize to match the current cropped and scaled size
         resized_pixmap = self.resize_pixmap(new_pixmap, current_size)
@@ -2766,6 +3139,7 @@ class CanvasWindow(QMainWindow):
         # Update the displayed pixmap
         selected_image['pixmap'] = resized_pixmap
 
+        self.remember_filter(filter_params)
         self.update_histogram()
         self.update()
 
@@ -2782,31 +3156,25 @@ class CanvasWindow(QMainWindow):
         original_pixmap = selected_image['original_pixmap']
         current_size = selected_image['pixmap'].size()
 
-        q_image = original_pixmap.toImage()
-        q_image = q_image.convertToFormat(QImage.Format_RGB888)
-        width, height = q_image.width(), q_image.height()
-        stride = q_image.bytesPerLine()  # Correctly account for padding
-        ptr = q_image.bits()
-        ptr.setsize(q_image.byteCount())
-        color_image = np.array(ptr).reshape((height, stride))[:, :width * 3].reshape((height, width, 3))
+        color_image = self.original_array(original_pixmap, rgb=True)  # Cached, RGB channel order
 
-        # Apply histogram equalization to each channel
-        channels = cv2.split(color_image)
-        equalized_channels = [cv2.equalizeHist(channel) for channel in channels]
-        equalized_image = cv2.merge(equalized_channels)
+        # Equalize each channel through one 3-channel LUT on the filter thread, without splitting
+        # the interleaved image into planes and merging them back
+        def equalize(image):
+            luts = [_equalize_lut(cv2.calcHist([image], [channel], None, [256], [0, 256]))
+                    for channel in range(3)]
+            return cv2.LUT(image, np.stack(luts, axis=-1).reshape(256, 1, 3))
 
-        # Convert back to QPixmap
-        h, w, ch = equalized_image.shape
-        bytes_per_line = ch * w
-        qt_image = QImage(equalized_image.data, w, h, bytes_per_line, QImage.Format_RGB888)
-        new_pixmap = QPixmap.fromImage(qt_image)
+        def show(equalized_image):
+            # Convert back to QPixmap
+            new_pixmap = _array_pixmap(equalized_image, QImage.Format_RGB888)
 
-        # Resize and update the displayed image
-        resized_pixmap = self.resize_pixmap(new_pixmap, current_size)
-        selected_image['pixmap'] = resized_pixmap
+            # Resize and update the displayed image
+            selected_image['pixmap'] = self.resize_pixmap(new_pixmap, current_size)
+            self.update()
+            self.update_histogram()
 
-        self.update()
-        self.update_histogram()
+        self.run_filter_async(equalize, color_image, show)
 
     def apply_clahe(self, clahe_label):
         """Apply adaptive histogram equalization (CLAHE) with adjustable clip limit, preserving the original color."""
@@ -2814,6 +3182,15 @@ class CanvasWindow(QMainWindow):
             QMessageBox.warning(self, "No Image", "Please load and select an image first.")
             return
 
+        # Get clip limit from slider
+        clip_limit = self.clahe_slider.value() / 10.0
+        clahe_label.setText(f"CLAHE Clip Limit: {clip_limit:.1f}")
+
+        # The decoded original is cached, so a tick that lands on the shown clip limit does nothing
+        filter_params = ('clahe', self.clahe_slider.value())
+        if self.filter_is_current(filter_params):
+            return
+
         self.save_state()
 
         # Get the selected image and convert to OpenCV format
@@ -2821,35 +3198,30 @@ class CanvasWindow(QMainWindow):
         original_pixmap = selected_image['original_pixmap']
         current_size = selected_image['pixmap'].size()
 
-        q_image = original_pixmap.toImage()
-        q_image = q_image.convertToFormat(QImage.Format_RGB888)
-        width, height = q_image.width(), q_image.height()
-        stride = q_image.bytesPerLine()  # Correctly account for padding
-        ptr = q_image.bits()
-        ptr.setsize(q_image.byteCount())
-        color_image = np.array(ptr).reshape((height, stride))[:, :width * 3].reshape((height, width, 3))
+        color_image = self.original_array(original_pixmap, rgb=True)  # Cached, RGB channel order
 
-        # Get clip limit from slider
-        clip_limit = self.clahe_slider.value() / 10.0
-        clahe_label.setText(f"CLAHE Clip Limit: {clip_limit:.1f}")
+        # Apply CLAHE to each channel, on the filter thread; CLAHE only takes single-channel input,
+        # so each plane is gathered on its own and written straight back into one interleaved output
+        def equalize(image):
+            clahe = self._clahe  # Reused with its tile buffers, the jobs run one at a time
+            clahe.setClipLimit(clip_limit)
+            output = np.empty_like(image)
+            for channel in range(3):
+                output[:, :, channel] = clahe.apply(np.ascontiguousarray(image[:, :, channel]))
+            return output
 
-        # Apply CLAHE to each channel
-        clahe = cv2.createCLAHE(clipLimit=clip_limit, tileGridSize=(8, 8))
-        clahe_channels = [clahe.apply(channel) for channel in cv2.split(color_image)]
-        clahe_image = cv2.merge(clahe_channels)
-
-        # Convert back to QPixmap
-        h, w, ch = clahe_image.shape
-        bytes_per_line = ch * w
-        qt_image = QImage(clahe_image.data, w, h, bytes_per_line, QImage.Format_RGB888)
-        new_pixmap = QPixmap.fromImage(qt_image)
+        def show(clahe_image):
+            # Convert back to QPixmap
+            new_pixmap = _array_pixmap(clahe_image, QImage.Format_RGB888)
 
-        # Resize and update the displayed image
-        resized_pixmap = self.resize_pixmap(new_pixmap, current_size)
-        selected_image['pixmap'] = resized_pixmap
+            # Resize and update the displayed image
+            selected_image['pixmap'] = self.resize_pixmap(new_pixmap, current_size)
+            if self.selected_image_index is not None and self.images[self.selected_image_index] is selected_image:
+                self.remember_filter(filter_params)
+            self.update()
+            self.update_histogram()
 
-        self.update()
-        self.update_histogram()
+        self.run_filter_async(equalize, color_image, show)
         
     def update_contours(self):
         """Update contours dynamically as the slider is adjusted."""
@@ -2861,35 +3233,27 @@ class CanvasWindow(QMainWindow):
         original_pixmap = selected_image['original_pixmap']
         current_size = selected_image['pixmap'].size()
 
-        # Convert QPixmap to OpenCV format
-        q_image = original_pixmap.toImage()
-        q_image = q_image.convertToFormat(QImage.Format_RGB32)
-        width, height = q_image.width(), q_image.height()
-        ptr = q_image.bits()
-        ptr.setsize(q_image.byteCount())
-        cv_image = np.array(ptr).reshape((height, width, 4))[:, :, :3]  # Extract RGB channels
+        # Convert QPixmap to OpenCV format, at display size when that is much smaller than the
+        # original since the contours are shrunk to it anyway
+        cv_image = self.display_array(original_pixmap, current_size)  # Cached, BGR channel order
 
         # Get threshold value from slider
         threshold_value = self.contour_threshold_slider.value()
         self.contour_threshold_label.setText(f"Threshold Value: {threshold_value}")
 
-        # Convert to grayscale and apply thresholding
-        gray_image = cv2.cvtColor(cv_image, cv2.COLOR_BGR2GRAY)
+        # Apply thresholding to the cached grayscale of the same size
+        gray_image = self.display_gray(original_pixmap, current_size)
         _, binary_image = cv2.threshold(gray_image, threshold_value, 255, cv2.THRESH_BINARY)
 
-        # Find contours
-        contours, _ = cv2.findContours(binary_image, cv2.RETR_TREE, cv2.CHAIN_APPROX_SIMPLE)
+        # Find contours; all of them are drawn, so no nesting hierarchy needs building
+        contours, _ = cv2.findContours(binary_image, cv2.RETR_LIST, cv2.CHAIN_APPROX_SIMPLE)
 
         # Draw contours on the original color image
         contour_image = cv_image.copy()
         cv2.drawContours(contour_image, contours, -1, (0, 255, 0), 2)  # Green contours
 
         # Convert back to QPixmap
-        contour_image = cv2.cvtColor(contour_image, cv2.COLOR_BGR2RGB)
-        h, w, ch = contour_image.shape
-        bytes_per_line = ch * w
-        qt_image = QImage(contour_image.data, w, h, bytes_per_line, QImage.Format_RGB888)
-        new_pixmap = QPixmap.fromImage(qt_image)
+        new_pixmap = _array_pixmap(contour_image, QImage.Format_BGR888)
 
         # Resize and update the displayed image
         resized_pixmap = self.resize_pixmap(new_pixmap, current_size)
@@ -2906,34 +3270,34 @@ class CanvasWindow(QMainWindow):
 
         # Get the selected image
         selected_image = self.images[self.selected_image_index]['pixmap']
-        image = selected_image.toImage()
-        image = image.convertToFormat(QImage.Format.Format_RGB32)
+        image = _bgrx_image(selected_image)
 
         # Convert QImage to numpy array
-        width = image.width()
-        height = image.height()
-        ptr = image.bits()
-        ptr.setsize(height * width * 4)
-        img_array = np.frombuffer(ptr, np.uint8).reshape((height, width, 4))
-
-        # Convert to grayscale
-        img_gray = color.rgb2gray(img_array[:, :, :3])
-
-        # Resize for performance
-        img_resized = resize(img_gray, (200, 200), anti_aliasing=True)
-
-        # Create meshgrid for X, Y, Z
-        x = np.linspace(0, img_resized.shape[1], img_resized.shape[1])
-        y = np.linspace(0, img_resized.shape[0], img_resized.shape[0])
-        X, Y = np.meshgrid(x, y)
+        img_array = _image_pixels(image, 4)
+
+        # Shrink first, area averaging anti-aliases it, so the grayscale only runs on 200x200 pixels
+        small = cv2.resize(img_array, (200, 200), interpolation=cv2.INTER_AREA)
+
+        # Weighted grayscale in [0, 1] in one product, RGB32 holds the channels as B, G, R, X
+        img_resized = small @ _GRAY_WEIGHTS_BGRX
+
+        # X, Y grid for the surface, shared between calls
+        X, Y = _surface_grid(*img_resized.shape)
         Z = img_resized
 
-        # Clear previous plot on the 3D figure
+        # Create the 3D figure on first use, otherwise clear the previous plot and its colorbar
+        if self.figure_3d is None:
+            self.figure_3d = Figure()
+            canvas = FigureCanvas(self.figure_3d)
+            self.representation_layout.replaceWidget(self.representation_canvas, canvas)
+            self.representation_canvas.deleteLater()
+            self.representation_canvas = canvas
         self.figure_3d.clear()
         ax = self.figure_3d.add_subplot(111, projection='3d')
 
-        # Plot 3D surface
-        surface = ax.plot_surface(X, Y, Z, cmap='viridis', edgecolor='none')
+        # Plot 3D surface; matplotlib already caps the mesh at 50x50 polygons, and with no edges
+        # drawn their antialiasing only costs render time
+        surface = ax.plot_surface(X, Y, Z, cmap='viridis', edgecolor='none', antialiased=False)
         self.figure_3d.colorbar(surface, ax=ax, shrink=0.5, aspect=5)
         ax.set_title("3D Representation of Image Intensity")
         ax.set_xlabel("X-axis")
@@ -2951,9 +3315,6 @@ class CanvasWindow(QMainWindow):
             image = self.get_current_image()
             blurred = cv2.GaussianBlur(image, (kernel_size, kernel_size), 0)
             self.update_image_display(blurred)
-            
-        self.update()
-        self.update_histogram()
 
     def apply_median_filter(self, kernel_size, label):
         if kernel_size % 2 == 0:
@@ -2961,32 +3322,32 @@ class CanvasWindow(QMainWindow):
         label.setText(f"Median Filter - Kernel Size: {kernel_size}")
         if self.selected_image_index is not None:
             image = self.get_current_image()
-            filtered = cv2.medianBlur(image, kernel_size)
-            self.update_image_display(filtered)
-            
-        self.update()
-        self.update_histogram()
+            index = self.selected_image_index
+            self.run_filter_async(lambda img: cv2.medianBlur(img, kernel_size), image,
+                                  lambda filtered: self.update_image_display(filtered, index))
 
     def apply_bilateral_filter(self, diameter, label):
         label.setText(f"Bilateral Filter - Diameter: {diameter}")
         if self.selected_image_index is not None:
             image = self.get_current_image()
-            filtered = cv2.bilateralFilter(image, diameter, 75, 75)
-            self.update_image_display(filtered)
-            
-        self.update()
-        self.update_histogram()
+            index = self.selected_image_index
+            self.run_filter_async(lambda img: cv2.bilateralFilter(img, diameter, 75, 75), image,
+                                  lambda filtered: self.update_image_display(filtered, index))
 
     def apply_unsharp_mask(self, strength, label):
         label.setText(f"Unsharp Masking - Strength: {strength:.1f}")
         if self.selected_image_index is not None:
             image = self.get_current_image()
-            gaussian = cv2.GaussianBlur(image, (9, 9), 10)
-            sharpened = cv2.addWeighted(image, 1 + strength, gaussian, -strength, 0)
+            # The blur doesn't depend on the strength, so a drag only reruns the blend
+            original_pixmap = self.images[self.selected_image_index]['original_pixmap']
+            key = (original_pixmap.cacheKey(), "unsharp")
+            gaussian = self._original_arrays.get(key)
+            if gaussian is None:
+                gaussian = cv2.GaussianBlur(image, (9, 9), 10)
+                self.cache_original(key, gaussian)
+            sharpened = cv2.addWeighted(image, 1 + strength, gaussian, -strength, 0,
+                                        dst=self.filter_output(image))
             self.update_image_display(sharpened)
-            
-        self.update()
-        self.update_histogram()
 
     def apply_laplacian_filter(self, kernel_size, label):
         if kernel_size % 2 == 0:
@@ -2994,11 +3355,10 @@ class CanvasWindow(QMainWindow):
         label.setText(f"Laplacian Filter - Kernel Size: {kernel_size}")
         if self.selected_image_index is not None:
             image = self.get_current_image()
-            laplacian = cv2.Laplacian(image, cv2.CV_64F, ksize=kernel_size)
+            # 16-bit signed responses are enough, anything past 255 saturates in convertScaleAbs anyway
+            laplacian = cv2.Laplacian(image, cv2.CV_16S, ksize=kernel_size)
             result = cv2.convertScaleAbs(laplacian)
             self.update_image_display(result)
-        self.update()
-        self.update_histogram()
 
     def apply_sobel_filter(self, kernel_size, label):
         if kernel_size % 2 == 0:
@@ -3006,12 +3366,17 @@ class CanvasWindow(QMainWindow):
         label.setText(f"Sobel Filter - Kernel Size: {kernel_size}")
         if self.selected_image_index is not None:
             image = self.get_current_image()
-            sobel_x = cv2.Sobel(image, cv2.CV_64F, 1, 0, ksize=kernel_size)
-            sobel_y = cv2.Sobel(image, cv2.CV_64F, 0, 1, ksize=kernel_size)
-            sobel_combined = cv2.addWeighted(cv2.convertScaleAbs(sobel_x), 0.5, cv2.convertScaleAbs(sobel_y), 0.5, 0)
+            # One int16 buffer takes each derivative in turn, |Gx| waits in a second, |Gy| and the
+            # blend go straight into the output
+            derivative = self.filter_scratch('sobel', image.shape, np.int16)
+            abs_x = self.filter_scratch('sobel_abs', image.shape, np.uint8)
+            sobel_combined = self.filter_output(image)
+            cv2.Sobel(image, cv2.CV_16S, 1, 0, dst=derivative, ksize=kernel_size)
+            cv2.convertScaleAbs(derivative, dst=abs_x)
+            cv2.Sobel(image, cv2.CV_16S, 0, 1, dst=derivative, ksize=kernel_size)
+            cv2.convertScaleAbs(derivative, dst=sobel_combined)
+            cv2.addWeighted(abs_x, 0.5, sobel_combined, 0.5, 0, dst=sobel_combined)
             self.update_image_display(sobel_combined)
-        self.update()
-        self.update_histogram()
         
     def apply_glitch_effect(self):
         """Apply glitch art effects to the image."""
@@ -3027,35 +3392,53 @@ class CanvasWindow(QMainWindow):
         current_size = selected_image['pixmap'].size()
 
         # Convert QPixmap to OpenCV format
-        q_image = original_pixmap.toImage().convertToFormat(QImage.Format_RGB888)
-        width, height = q_image.width(), q_image.height()
-        ptr = q_image.bits()
-        ptr.setsize(q_image.byteCount())
-        stride = q_image.bytesPerLine()
-        img_array = np.frombuffer(ptr, dtype=np.uint8).reshape((height, stride))[:, :width * 3].reshape((height, width, 3))
-
-        # --- Glitch Effect 1: Random Distortions ---
-        for _ in range(10):  # Apply 10 random distortions
-            x_start = np.random.randint(0, img_array.shape[1] - 20)
-            x_end = x_start + np.random.randint(10, 50)
-            y = np.random.randint(0, img_array.shape[0])
-            img_array[y:y + 2, x_start:x_end] = np.roll(img_array[y:y + 2, x_start:x_end], shift=np.random.randint(-10, 10), axis=1)
+        original = self.original_array(original_pixmap, rgb=True)  # Cached, read only
 
         # --- Glitch Effect 2: Scanlines ---
-        for y in range(0, img_array.shape[0], 3):
-            img_array[y] = img_array[y] // 2
+        # Fused into the copy the glitches write on: every third row is halved on its way over and
+        # the others are copied as is. Halving whole rows commutes with the sideways distortions,
+        # so running it first gives the same image
+        img_array = np.empty_like(original)
+        np.right_shift(original[::3], 1, out=img_array[::3])
+        img_array[1::3] = original[1::3]
+        img_array[2::3] = original[2::3]
+
+        # --- Glitch Effect 1: Random Distortions ---
+        # 10 random runs of two rows, each rolled sideways; drawn at once and moved in one gather
+        height, width = img_array.shape[:2]
+        count = 10
+        ys = np.random.randint(0, height, size=count)
+        x_starts = np.random.randint(0, width - 20, size=count)
+        lengths = np.minimum(np.random.randint(10, 50, size=count), width - x_starts)  # Runs stop at the edge
+        shifts = np.random.randint(-10, 10, size=count)
+
+        # One entry per shifted pixel: its run, its offset in the run, and the column np.roll reads it from
+        run = np.repeat(np.arange(count), lengths)
+        offsets = np.arange(run.size) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+        dst_cols = x_starts[run] + offsets
+        src_cols = x_starts[run] + (offsets - shifts[run]) % lengths[run]
+
+        # Both rows of every run, dropping the second where the run starts on the last row
+        rows = np.concatenate((ys[run], ys[run] + 1))
+        inside = rows < height
+        rows = rows[inside]
+        dst_cols = np.tile(dst_cols, 2)[inside]
+        src_cols = np.tile(src_cols, 2)[inside]
+        img_array[rows, dst_cols] = img_array[rows, src_cols]
 
         # --- Glitch Effect 3: Chromatic Aberration ---
-        b, g, r = cv2.split(img_array)
-        b = np.roll(b, shift=5, axis=1)  # Shift blue channel
-        g = np.roll(g, shift=-5, axis=0)  # Shift green channel
-        img_array = cv2.merge((r, g, b))  # Convert back to RGB (fix color order)
+        # Copy each channel straight to its shifted place in one output, wrapping like np.roll;
+        # the first and last channels also trade places, as the effect always has
+        shifted = np.empty_like(img_array)
+        shifted[:, :, 0] = img_array[:, :, 2]
+        shifted[:-5, :, 1] = img_array[5:, :, 1]  # Green up 5 rows
+        shifted[-5:, :, 1] = img_array[:5, :, 1]
+        shifted[:, 5:, 2] = img_array[:, :-5, 0]  # First channel right 5 columns
+        shifted[:, :5, 2] = img_array[:, -5:, 0]
+        img_array = shifted
 
         # Convert back to QPixmap
-        h, w, ch = img_array.shape
-        bytes_per_line = ch * w
-        qt_image = QImage(img_array.data, w, h, bytes_per_line, QImage.Format_RGB888)
-        glitch_pixmap = QPixmap.fromImage(qt_image)
+        glitch_pixmap = _array_pixmap(img_array, QImage.Format_RGB888)
 
         # Resize to match the current cropped and scaled size
         resized_pixmap = self.resize_pixmap(glitch_pixmap, current_size)
@@ -3080,27 +3463,15 @@ class CanvasWindow(QMainWindow):
         current_size = selected_image['pixmap'].size()
 
         # Convert QPixmap to OpenCV format
-        q_image = original_pixmap.toImage()
-        q_image = q_image.convertToFormat(QImage.Format_RGB32)  # Ensure consistency with working examples
-        width, height = q_image.width(), q_image.height()
-        ptr = q_image.bits()
-        ptr.setsize(q_image.byteCount())
-        img_array = np.array(ptr).reshape((height, width, 4))[:, :, :3]  # Extract RGB channels only
+        img_array = self.original_array(original_pixmap)  # Cached, BGR channel order
 
         # Apply dehazing
         try:
-            # Assume `dehaze()` outputs a BGR image; adjust channel order
-            dehazed_image = dehaze(img_array)  # `dehaze()` processes RGB or BGR; check its documentation
+            # `dehaze()` keeps the channel order of its input, BGR here
+            dehazed_image = np.ascontiguousarray(dehaze(img_array))
 
-            # Convert to RGB for QImage/QPixmap compatibility
-            if dehazed_image.shape[2] == 3:  # Ensure it's a 3-channel image
-                dehazed_image = cv2.cvtColor(dehazed_image, cv2.COLOR_BGR2RGB)
-
-            # Convert back to QPixmap
-            h, w, ch = dehazed_image.shape
-            bytes_per_line = ch * w
-            qt_image = QImage(dehazed_image.data, w, h, bytes_per_line, QImage.Format_RGB888)
-            dehazed_pixmap = QPixmap.fromImage(qt_image)
+            # Convert back to QPixmap, QImage reads the BGR bytes directly
+            dehazed_pixmap = _array_pixmap(dehazed_image, QImage.Format_BGR888)
 
             # Resize to match the current size
             resized_pixmap = self.resize_pixmap(dehazed_pixmap, current_size)
@@ -3118,28 +3489,151 @@ class CanvasWindow(QMainWindow):
     def qimage_to_cv2(self, qimage):
         """Convert QImage to OpenCV format."""
         qimage = qimage.convertToFormat(QImage.Format_RGB888)
-        width, height = qimage.width(), qimage.height()
-        ptr = qimage.bits()
-        ptr.setsize(qimage.byteCount())
-        stride = qimage.bytesPerLine()
-        img_array = np.frombuffer(ptr, dtype=np.uint8).reshape((height, stride))[:, :width * 3]
-        return img_array.reshape((height, width, 3))
+        # One copy out of the strided view, the converted QImage's buffer is freed on return
+        return _image_pixels(qimage, 3).copy()
+
+    def original_array(self, pixmap, rgb=False):
+        """The pixels of an original image as a read-only (h, w, 3) array, decoded once per pixmap.
+
+        BGR channel order by default, as sliced from RGB32, or RGB when `rgb` is set. Filters must
+        copy it before writing in place.
+        """
+        key = (pixmap.cacheKey(), rgb)
+        pixels = self._original_arrays.get(key)
+        if pixels is None:
+            image = pixmap.toImage().convertToFormat(QImage.Format_RGB888) if rgb else _bgrx_image(pixmap)
+            # Copy out of the QImage's buffer, which goes away with the image; ascontiguousarray
+            # would hand back a view of it when RGB888 rows carry no padding
+            if rgb:
+                pixels = _image_pixels(image, 3).copy()
+            else:
+                pixels = _image_pixels(image, 4)[:, :, :3].copy()
+            self.cache_original(key, pixels)
+        return pixels
+
+    def cache_original(self, key, pixels):
+        """Store a read-only decode of an original, keeping only the most recent few."""
+        pixels.setflags(write=False)
+        # The last few originals are what the sliders keep filtering
+        if len(self._original_arrays) >= 8:
+            del self._original_arrays[next(iter(self._original_arrays))]
+        self._original_arrays[key] = pixels
+
+    def original_gray(self, pixmap):
+        """The grayscale of an original image as a read-only (h, w) array, converted once per pixmap.
+
+        Read in one pass straight from the pixmap's RGB32 buffer, so no colour copy is decoded
+        and cached on the way.
+        """
+        key = (pixmap.cacheKey(), "gray")
+        gray = self._original_arrays.get(key)
+        if gray is None:
+            image = _bgrx_image(pixmap)  # Held here, the view doesn't keep the image alive
+            pixels = _image_pixels(image, 4)
+            gray = cv2.cvtColor(pixels, cv2.COLOR_BGRA2GRAY)  # A new array, safe once the image goes
+            self.cache_original(key, gray)
+        return gray
+
+    def display_gray(self, pixmap, display_size):
+        """The grayscale of an original at the size it is displayed, when that is much smaller.
+
+        Edge maps are shrunk to the display size anyway, so detecting them on a 4K original shown
+        at 1K scans 16 times the pixels for nothing. Near full size the original is used as is.
+        """
+        size = self.reduced_size(pixmap, display_size)
+        if size is None:
+            return self.original_gray(pixmap)
+        key = (pixmap.cacheKey(), "gray", size.width(), size.height())
+        gray = self._original_arrays.get(key)
+        if gray is None:
+            gray = cv2.resize(self.original_gray(pixmap), (size.width(), size.height()),
+                              interpolation=cv2.INTER_AREA)
+            self.cache_original(key, gray)
+        return gray
+
+    def display_array(self, pixmap, display_size):
+        """The BGR pixels of an original at the size it is displayed, when that is much smaller.
+
+        The colour counterpart of display_gray, sized the same way so the two line up.
+        """
+        size = self.reduced_size(pixmap, display_size)
+        if size is None:
+            return self.original_array(pixmap)
+        key = (pixmap.cacheKey(), False, size.width(), size.height())
+        pixels = self._original_arrays.get(key)
+        if pixels is None:
+            pixels = cv2.resize(self.original_array(pixmap), (size.width(), size.height()),
+                                interpolation=cv2.INTER_AREA)
+            self.cache_original(key, pixels)
+        return pixels
+
+    @staticmethod
+    def reduced_size(pixmap, display_size):
+        """The size an original is shown at, or None when that is over half its pixels."""
+        size = pixmap.size().scaled(display_size, Qt.KeepAspectRatio)
+        if size.isEmpty() or size.width() * size.height() >= 0.5 * pixmap.width() * pixmap.height():
+            return None
+        return size
+
+    def filter_output(self, pixels):
+        """A reusable array shaped like `pixels` for a slider filter to write its result into.
+
+        Dragging a slider then reuses one buffer instead of allocating and faulting in a new
+        image-sized array per step. Only for filters on the GUI thread whose result is copied
+        into a pixmap straight away, the next call overwrites it.
+        """
+        output = self._filter_output
+        if output is None or output.shape != pixels.shape or output.dtype != pixels.dtype:
+            output = self._filter_output = np.empty_like(pixels)
+        return output
+
+    def filter_scratch(self, name, shape, dtype):
+        """A reusable intermediate array for a slider filter, like filter_output but one per name."""
+        scratch = self._filter_scratch.get(name)
+        if scratch is None or scratch.shape != shape or scratch.dtype != dtype:
+            scratch = self._filter_scratch[name] = np.empty(shape, dtype=dtype)
+        return scratch
+
+    def filter_is_current(self, params):
+        """Whether the selected image already shows this filter at these slider values.
+
+        A stray valueChanged, or a drag that ends where it started, then has nothing to redo.
+        """
+        img_data = self.images[self.selected_image_index]
+        return self._last_filter == (params, img_data['original_pixmap'].cacheKey(), img_data['pixmap'].cacheKey())
+
+    def remember_filter(self, params):
+        """Record the filter and slider values the selected image now shows."""
+        img_data = self.images[self.selected_image_index]
+        self._last_filter = (params, img_data['original_pixmap'].cacheKey(), img_data['pixmap'].cacheKey())
 
     def get_current_image(self):
-        """Retrieve the original image from the images list."""
+        """The selected image's original as a cached, read-only RGB array.
+
+        Decoded once per original by original_array, so slider filters reuse it on every step.
+        """
         original_pixmap = self.images[self.selected_image_index]['original_pixmap']
-        image = original_pixmap.toImage()
-        width, height = image.width(), image.height()
-        ptr = image.bits()
-        ptr.setsize(image.byteCount())
-        return cv2.cvtColor(np.array(ptr).reshape(height, width, 4), cv2.COLOR_RGBA2BGR)
+        return self.original_array(original_pixmap, rgb=True)
+
+    def run_filter_async(self, function, image, on_done):
+        """Run function(image) on the filter thread, then on_done(result) on the GUI thread."""
+        job = FilterJob(function, image)
+        self._filter_jobs.add(job)
+
+        def finished(result):
+            self._filter_jobs.discard(job)
+            on_done(result)
 
-    def update_image_display(self, image):
+        job.signals.finished.connect(finished)
+        self.filter_pool.start(job)
+
+    def update_image_display(self, image, index=None):
         """Update the QLabel or canvas with the processed image."""
-        height, width, channel = image.shape
-        bytes_per_line = 3 * width
-        q_image = QImage(image.data, width, height, bytes_per_line, QImage.Format_RGB888)
-        self.images[self.selected_image_index]['pixmap'] = QPixmap.fromImage(q_image)
+        if index is None:
+            index = self.selected_image_index
+        if index >= len(self.images):  # Image was removed while a filter job ran
+            return
+        self.images[index]['pixmap'] = _array_pixmap(image, QImage.Format_RGB888)
         self.update()
         self.update_histogram()
         
@@ -3157,6 +3651,7 @@ class CanvasWindow(QMainWindow):
 
 
     def mousePressEvent(self, event):
+        previous_selection = self.selected_image_index
         if self.drag_mode and event.button() == Qt.LeftButton:
             for i, img_data in enumerate(self.images):
                 if img_data['rect'].contains(event.pos()):
@@ -3214,6 +3709,11 @@ class CanvasWindow(QMainWindow):
                 self.selected_image_index = None
             self.update()
 
+        # Drags and scales only repaint around the selected image, so a new selection repaints
+        # everything once to clear the previous image's frame and anchors
+        if self.selected_image_index != previous_selection:
+            self.update()
+
     def mouseMoveEvent(self, event):
         if self.selected_image_index is not None:
             img_data = self.images[self.selected_image_index]
@@ -3232,25 +3732,15 @@ class CanvasWindow(QMainWindow):
                 self.shape_tool.continue_drawing(event)
 
             elif self.drag_mode and event.buttons() == Qt.LeftButton:
-                # Drag the image
+                # Drag the image, repainting only where it was and where it is now
                 img_data = self.images[self.selected_image_index]
+                before = self.image_bounds(img_data)
                 delta = event.pos() - self.last_mouse_position
                 self.last_mouse_position = event.pos()
                 img_data['x'] += delta.x()
                 img_data['y'] += delta.y()
                 img_data['rect'].moveTo(img_data['x'], img_data['y'])
-                self.update()
-            elif self.drag_mode and event.buttons() == Qt.LeftButton:
-                # Drag the image
-                delta = event.pos() - self.last_mouse_position
-                self.last_mouse_position = event.pos()
-                img_data['x'] += delta.x()
-                img_data['y'] += delta.y()
-                img_data['rect'].moveTo(img_data['x'], img_data['y'])
-            elif self.scale_mode and self.anchor_clicked:
-                # Perform scaling
-                self.scale_image(event.pos(), img_data)
-            self.update()
+                self.update(before.united(self.image_bounds(img_data)))
             
         elif self.drawing_mode and event.buttons() == Qt.LeftButton:
                 self.drawing_tool.continue_drawing(event)
@@ -3261,8 +3751,14 @@ class CanvasWindow(QMainWindow):
             self.shape_tool.continue_drawing(event)
 
     def mouseReleaseEvent(self, event):
+        if self.anchor_clicked and self.selected_image_index is not None:
+            # Finalize scaling with one smooth resample at the final size, with or without scale mode
+            img_data = self.images[self.selected_image_index]
+            img_data['pixmap'] = img_data['original_pixmap'].scaled(
+                img_data['pixmap'].size(), Qt.KeepAspectRatio, Qt.SmoothTransformation
+            )
         if self.selected_image_index is not None and self.scale_mode:
-            if self.anchor_clicked:  # Finalize scaling
+            if self.anchor_clicked:
                 self.save_state()
         elif self.drawing_mode:
             self.drawing_tool.end_drawing()
@@ -3298,6 +3794,7 @@ class CanvasWindow(QMainWindow):
 class MyApplication:
     def __init__(self):
         self.app = QApplication(sys.argv)
+        QPixmapCache.setCacheLimit(64 * 1024)  # KB, room for icons and previews
         self.canvas_app = None
 
         # Show the splash screen
@@ -0,0 +1,12217 @@
+# -*- coding: utf-8 -*-
+
+# Resource object code
+#
+# Created by: The Resource Compiler for PyQt5 (Qt v5.15.14)
+#
+# WARNING! All changes made in this file will be lost!
+
+from PyQt5 import QtCore
+
+qt_resource_data = b"\
+\x00\x00\x32\x48\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x02\x00\x00\x00\x02\x00\x08\x06\x00\x00\x00\xf4\x78\xd4\xfa\
+\x00\x00\x00\x04\x73\x42\x49\x54\x08\x08\x08\x08\x7c\x08\x64\x88\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0f\x67\x00\x00\x0f\x67\
+\x01\x28\x3c\xe3\xf2\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\
+\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\
+\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x20\x00\x49\x44\
+\x41\x54\x78\x9c\xed\xdd\x79\xb8\x5e\x55\x79\xf7\xf1\xef\x39\x09\
+\x84\x40\x80\x00\x32\x04\x08\xb3\x80\xcc\x93\x0c\x02\x2a\x82\xe2\
+\x04\x8a\x96\xda\x56\xa5\x28\xd5\x6a\x27\x2c\x6a\xd5\xb7\xed\x2b\
+\x7d\x6d\x95\x56\xdb\x8a\x75\x00\x8b\x16\xa1\xd6\x59\x2a\x20\x22\
+\x20\x32\x0f\xca\x28\x02\x02\x0a\x44\xa6\x08\x09\x63\xc8\x40\xa6\
+\xf7\x8f\x75\x0e\x09\xc9\x39\xcf\x79\xc6\x7d\xaf\xbd\xd7\xf7\x73\
+\x5d\xbf\x2b\x68\x85\xde\xec\x67\xaf\xfd\xdc\xcf\xda\x6b\xaf\x3d\
+\x84\x54\x86\x0d\x47\xb2\xd1\x4a\x7f\x3d\x56\xd6\x04\xd6\x00\xa6\
+\x8d\xfc\x7d\x6b\x01\x53\x47\xfe\x7a\x9d\x91\xff\xfb\xa8\x05\xc0\
+\xc2\x91\xbf\x9e\x07\x2c\x1e\xf9\xeb\xa7\x80\x65\x23\xff\xf7\xc7\
+\x57\xc9\xdc\x55\xfe\x7c\x1c\x78\xba\x6f\xff\x96\x92\xd4\xa6\xa1\
+\xe8\x02\xa4\x3e\x98\x02\x6c\x01\x6c\x0e\xcc\x00\xb6\x5b\x29\x9b\
+\x03\xdb\x00\x6b\x47\x15\xd7\x86\x45\xc0\x43\xc0\x23\xc0\xc3\xc0\
+\xbd\x2b\xe5\x11\xe0\x3e\x60\x7e\x58\x75\x92\x1a\xc9\x06\x40\x75\
+\xb2\x39\xb0\xeb\x2a\xd9\x1e\xd8\x24\xb2\xa8\x0a\x2c\x23\x35\x06\
+\x77\x03\xb7\xaf\x92\x27\x02\xeb\x92\x54\x63\x36\x00\xca\xd1\x74\
+\x60\x1f\x56\xff\xb2\xdf\x20\xb2\xa8\x4c\x3d\xcc\x8a\x66\xe0\x0e\
+\xe0\x36\xe0\x56\xd2\xed\x07\x49\x1a\x97\x0d\x80\xa2\x4d\x02\x76\
+\x06\xf6\x1d\xc9\xc1\xc0\xde\xc0\x70\x64\x51\x35\xb7\x84\x34\x5b\
+\x70\x23\x70\x15\x70\x35\xa9\x39\x58\x1e\x59\x94\xa4\xbc\xd8\x00\
+\xa8\x6a\x33\x80\x03\x47\x72\x00\xb0\x1f\x69\x71\x9d\x06\x6b\x0e\
+\x70\xfd\x4a\xb9\x0e\x17\x1f\x4a\x45\xb3\x01\xd0\xa0\xad\x0d\xbc\
+\x0c\x38\x62\x24\xfb\xe0\x79\x97\x83\xa5\xc0\x2d\xc0\x25\x23\xb9\
+\x92\xb4\x18\x51\x52\x21\xbc\x10\xab\xdf\x26\x01\x7b\xb1\xe2\x0b\
+\xff\x50\xd2\x2a\x7d\xe5\x6d\x3e\x70\x0d\x2b\x1a\x82\x9b\xf0\x96\
+\x81\xd4\x68\x36\x00\xea\x87\x8d\x81\x37\x01\xaf\x03\x5e\x45\x5a\
+\xc4\xa7\x7a\x7b\x90\xd4\x08\x9c\x0f\xfc\x08\x1f\x43\x94\x1a\xc7\
+\x06\x40\xdd\xda\x98\xf4\x85\x7f\x2c\x70\x24\x69\xf3\x1c\x35\xd3\
+\x42\x52\x33\xf0\x1d\xe0\x5c\xe0\xc9\xd8\x72\x24\xf5\x83\x0d\x80\
+\x3a\xb1\x0d\xe9\x97\xfe\xb1\xa4\xfb\xfa\x9e\x3f\xe5\x59\x4a\x5a\
+\x40\xf8\x1d\xe0\xdb\xa4\x8d\x8a\x24\xd5\x90\x17\x70\x4d\x64\x5b\
+\xe0\x9d\xc0\x5b\x81\x3d\x82\x6b\x51\x5e\x96\x92\x1e\x33\xfc\x2e\
+\xf0\x0d\xd2\xf6\xc6\x92\xa4\x1a\x5b\x8b\xf4\x2b\xff\x62\xd2\x2e\
+\x74\xcb\x8d\x99\x20\x8b\x80\xf3\x48\xe7\x8d\xb7\x83\x24\xa9\x66\
+\xf6\x05\x4e\x27\x3d\x1f\x1e\xfd\x85\x62\xea\x9b\x47\x80\x53\x49\
+\x4f\x83\x48\xca\x94\xb7\x00\xb4\x05\xf0\x0e\xe0\x04\xe0\xc5\xc1\
+\xb5\xa8\x79\x6e\x04\xce\x06\xbe\x4e\xda\x8c\x48\x92\x14\x68\x88\
+\xf4\x8c\xfe\xb9\xa4\xfb\xb8\xd1\xbf\x18\x4d\xf3\xb3\x00\x38\x03\
+\xd8\x13\x49\x52\xe5\xa6\x00\xc7\x01\xbf\x20\xfe\x0b\xc1\x94\x9b\
+\xab\x48\x6b\x05\x26\x23\x49\x1a\xa8\x19\xc0\xc9\xa4\x29\xd8\xe8\
+\x8b\xbf\x31\xa3\xb9\x17\xf8\x08\xb0\x21\x92\xa4\xbe\xda\x17\x38\
+\x0b\x58\x4c\xfc\xc5\xde\x98\xf1\xf2\x0c\x69\xf1\xe9\xae\x48\x92\
+\x7a\xf2\x7a\xd2\x66\x2d\xd1\x17\x76\x63\x3a\xc9\x32\xe0\xfb\xa4\
+\xd7\x41\x4b\x92\x3a\x70\x04\xe9\x55\xaf\xd1\x17\x72\x63\x7a\xcd\
+\xc5\xc0\xfe\x48\x92\xc6\x35\x04\x1c\x05\xfc\x8c\xf8\x8b\xb6\x31\
+\xfd\xce\xc5\xc0\x01\x48\x92\x9e\x37\xfa\xc5\x7f\x03\xf1\x17\x69\
+\x63\x06\x9d\xab\x80\xc3\x90\xa4\xc2\x1d\x03\xdc\x46\xfc\x45\xd9\
+\x98\xaa\x73\x11\xde\x1a\x90\x54\xa0\xfd\x80\xcb\x88\xbf\x08\x1b\
+\x13\x99\x65\xa4\x37\x11\x6e\x87\x24\x35\xdc\x4c\xd2\x63\x52\xee\
+\xda\x67\xcc\x8a\x2c\x22\xbd\x73\x60\x3a\x92\xd4\x30\xd3\x48\x1b\
+\xf8\x2c\x20\xfe\x62\x6b\x4c\xae\x99\x4b\xda\x50\x68\x0a\x92\x54\
+\x73\x6b\x00\xef\x05\x66\x13\x7f\x71\x35\xa6\x2e\xb9\x8b\xb4\xc5\
+\xb0\x2f\x39\x93\x54\x4b\xaf\x25\x5d\xc8\xa2\x2f\xa6\xc6\xd4\x35\
+\x97\x01\xbb\x23\x49\x35\xb1\x19\x69\xdb\xde\xe8\x8b\xa7\x31\x4d\
+\xc8\x62\xd2\xfa\x80\x69\x48\x52\xa6\x86\x48\x6f\xe8\xf3\x45\x3d\
+\xc6\xf4\x3f\xf7\x02\xaf\x43\xd2\x6a\xbc\x57\x16\x6b\x77\xd2\xea\
+\xfe\x83\xa2\x0b\x91\x1a\xee\x7c\xe0\xfd\xc0\x83\xd1\x85\x48\xb9\
+\x98\x14\x5d\x40\xa1\xa6\x02\x7f\x07\x9c\x0d\x6c\x13\x5b\x8a\x54\
+\x84\x1d\x81\x13\x48\x4f\xd4\x8c\xee\x9e\x29\x15\xcd\x19\x80\xea\
+\xbd\x16\xf8\x22\xb0\x6d\x74\x21\x52\xa1\xae\x05\xfe\x94\xb4\x9b\
+\xa6\x54\x2c\x67\x00\xaa\x33\x15\xf8\x57\xe0\x73\xc0\x06\xc1\xb5\
+\x48\x25\x9b\x09\xfc\x09\xe9\xfa\x77\x25\xce\x06\xa8\x50\xce\x00\
+\x54\xe3\x00\xd2\x0a\xff\x1d\xa3\x0b\x91\xf4\x02\xd7\x92\x16\xe1\
+\xfe\x3a\xba\x10\xa9\x6a\xc3\xd1\x05\x34\xdc\x64\xd2\x0e\x65\x57\
+\xe2\x97\xbf\x94\xa3\x83\x80\x9b\x48\x1b\x6f\x49\x45\x71\x06\x60\
+\x70\x76\x26\x2d\xf2\xdb\x2f\xba\x10\x49\x6d\xb9\x80\xb4\x50\x70\
+\x76\x74\x21\x52\x15\x9c\x01\xe8\xbf\x21\xd2\xaf\x89\x1b\xf0\xcb\
+\x5f\xaa\x93\xd7\x03\xb7\x02\x47\x47\x17\x22\x55\xc1\x19\x80\xfe\
+\x9a\x01\x9c\x09\xbc\x26\xb8\x0e\x49\xdd\x5b\x4e\xda\x9f\xe3\x24\
+\xd2\x63\x83\x52\x23\xd9\x00\xf4\xcf\xa1\xc0\xb7\x48\x4d\x80\xa4\
+\xfa\xbb\x15\xf8\x3d\x5c\x20\xa8\x86\xf2\x16\x40\xef\x86\x80\x13\
+\x81\x9f\xe0\x97\xbf\xd4\x24\x7b\x02\x37\x02\x6f\x8d\x2e\x44\x1a\
+\x04\xf7\x01\xe8\xcd\xba\xa4\x85\x7e\x1f\xc4\x63\x29\x35\xd1\x14\
+\xd2\x2b\x86\x37\x24\x35\xf9\xcb\x62\xcb\x91\xfa\xc7\x5b\x00\xdd\
+\xdb\x19\xf8\x1e\xb0\x4b\x74\x21\x92\x2a\x71\x05\xf0\x36\x7c\x4a\
+\x40\x0d\xe1\x2d\x80\xee\xbc\x9d\xb4\xca\xdf\x2f\x7f\xa9\x1c\x2f\
+\x27\x8d\xfb\x83\xa3\x0b\x91\xfa\xc1\x69\xeb\xce\x4c\x06\x3e\x09\
+\xfc\x1b\xb0\x66\x70\x2d\x92\xaa\xb7\x1e\x69\xe7\xc0\xe7\x80\xab\
+\x83\x6b\x91\x7a\x62\x03\xd0\xbe\x17\x01\x17\x02\x7f\x18\x5d\x88\
+\xa4\x50\xc3\xc0\x11\xa4\x17\x7a\x5d\x00\x2c\x8d\x2d\x47\xea\x8e\
+\x6b\x00\xda\xb3\x03\xe9\x7d\xe2\x3b\x45\x17\x22\x29\x2b\x57\x03\
+\x6f\x06\xe6\x44\x17\x22\x75\xca\x06\x60\x62\x07\x03\xe7\x00\x1b\
+\x47\x17\x22\x29\x4b\xbf\x06\xde\x00\xdc\x1d\x5d\x88\xd4\x09\x17\
+\x01\xb6\xf6\x36\xe0\x12\xfc\xf2\x97\x34\xbe\x1d\x80\x6b\x48\x8b\
+\x04\xa5\xda\xb0\x01\x18\xdb\x10\x70\x32\xf0\x0d\x60\xad\xd8\x52\
+\x24\xd5\xc0\x46\xc0\x45\xa4\x27\x84\xa4\x5a\x70\x11\xe0\xea\xa6\
+\x00\xff\x05\xfc\x15\xde\x22\x91\xd4\xbe\xc9\xc0\x31\xa4\xeb\xc6\
+\x65\xb1\xa5\x48\x13\xb3\x01\x78\xa1\x8d\x48\xab\x7a\xdf\x18\x5d\
+\x88\xa4\x5a\x1a\x02\x5e\x09\x6c\x4d\xba\x96\xb8\x73\xa0\xb2\xe5\
+\x2f\xdc\x15\x36\x23\x4d\xe1\xed\x1e\x5d\x88\xa4\x46\xb8\x80\xf4\
+\x32\x21\xdf\x28\xa8\x2c\xd9\x00\x24\x5b\x91\x16\xfb\xbd\x38\xba\
+\x10\x49\x8d\x72\x39\x70\x14\xf0\x4c\x74\x21\xd2\xaa\x6c\x00\xd2\
+\x66\x1e\x3f\x19\xf9\x53\x92\xfa\xed\xe7\xc0\xeb\x80\xb9\xd1\x85\
+\x48\x2b\x2b\xbd\x01\xd8\x05\xb8\x18\xd8\x3c\xba\x10\x49\x8d\x76\
+\x33\x70\x24\xf0\x58\x74\x21\xd2\xa8\x92\x1f\x03\xdc\x97\x34\x3d\
+\xe7\x97\xbf\xa4\x41\xdb\x9b\xf4\x36\xc1\x2d\xa3\x0b\x91\x46\x95\
+\xda\x00\x1c\x0a\x5c\x4a\xda\xdf\x5f\x92\xaa\xb0\x33\x70\x25\x69\
+\xe3\x20\x29\x5c\x89\x0d\xc0\x61\xa4\xd5\xb9\xeb\x45\x17\x22\xa9\
+\x38\xdb\x90\x9a\x80\xdd\x82\xeb\x90\x8a\x5b\x03\x70\x24\xf0\x03\
+\xd2\x66\x3f\x2a\xdb\x5c\xe0\x21\xe0\xd1\x91\xbf\x7e\x7c\x95\x3c\
+\x09\xcc\x1b\xf9\xdf\x2e\x64\xc5\xa3\x5c\xf3\x81\x45\xa4\x73\x68\
+\xed\x91\xff\x6e\x6d\x56\x9c\x53\xd3\x80\xe9\xc0\x86\x23\xd9\x68\
+\xa5\x3f\x37\x26\x4d\x01\x6f\x38\xa0\x7f\x27\xd5\xc7\xef\x80\x57\
+\x00\x77\x45\x17\xa2\x72\x95\xd4\x00\xbc\x1c\xf8\x11\x2b\x2e\xda\
+\x6a\xb6\xe7\x80\x3b\x47\x72\x1f\x30\x0b\xf8\xed\xc8\x9f\xb3\x80\
+\x67\xe3\x4a\x63\x1a\x69\xa3\x98\xd1\x6c\x45\x7a\x0a\x65\x17\xd2\
+\x1b\x27\xd7\x8c\x2b\x4d\x15\x7a\x90\xd4\x04\xdc\x1b\x5d\x88\xca\
+\x54\x4a\x03\xf0\x52\xd2\x73\xfe\x4e\xfb\x37\xcf\x72\xd2\x5b\xd8\
+\x7e\x01\xdc\x3e\x92\x5f\x92\xde\xd0\xb6\x24\xb0\xae\x6e\xad\x41\
+\xba\x47\xbc\x1b\xb0\xeb\x48\xf6\x20\xed\x51\x51\xca\x78\x2d\xc9\
+\x7d\xa4\x1f\x27\x0f\x46\x17\xa2\xf2\x94\x70\x41\xd9\x1d\xf8\x29\
+\x69\x0a\x56\xf5\xf7\x34\x70\x1b\x70\x15\xe9\x5d\xec\xd7\x52\xc6\
+\xbb\xd8\xd7\x23\x35\x02\x07\x03\x87\x00\x07\xe2\x22\xd6\xa6\xb8\
+\x87\x34\x13\xf0\x48\x74\x21\x2a\x4b\xd3\x1b\x80\x1d\x49\x8f\xde\
+\x6c\x1a\x5d\x88\xba\x36\x87\xb4\x51\xd3\xc5\xa4\x2f\xfd\xbb\x49\
+\xbf\xfa\x4b\x37\x44\x5a\x55\x7e\x28\x70\x04\x70\x38\xae\x2d\xa8\
+\xb3\x5f\x90\x16\x28\x3f\x1e\x5d\x88\xca\xd1\xe4\x06\x60\x26\xe9\
+\xcb\x7f\x9b\xe0\x3a\xd4\x99\x25\xc0\xf5\xc0\x79\xa4\xdb\x36\x37\
+\xe3\x0b\x55\xda\x31\x4c\x7a\xd6\xfc\x88\x91\x1c\x82\xaf\xb2\xae\
+\x9b\x5b\x80\x57\x01\x4f\x44\x17\x22\xd5\xd9\xe6\xa4\x7b\xc0\xcb\
+\x4d\x2d\x32\x17\x38\x93\xb4\x67\xfa\xd4\xd5\x3f\x4e\x75\x61\x6d\
+\xd2\xab\x69\xcf\x26\x7d\xa1\x44\x7f\xc6\xa6\xbd\x5c\x89\x0b\x95\
+\xa5\xae\xbd\x88\xb4\x10\x2c\x7a\x20\x9b\xd6\x99\x0d\x9c\x06\xbc\
+\x9a\xb4\xf0\x4d\x83\xb3\x26\x69\x2f\xfa\xff\x24\x3d\xf6\x18\xfd\
+\xd9\x9b\xd6\x39\x07\x5f\xd5\x2e\x75\x6c\x2d\xd2\x7d\xe2\xe8\x01\
+\x6c\xc6\xce\x53\xc0\x19\xa4\x55\xcf\x25\x6e\x42\x95\x83\x49\xa4\
+\x69\xe6\x33\x49\x6f\xa8\x8b\x3e\x27\xcc\xd8\xf9\xdc\x38\x9f\x9f\
+\xa4\x31\x0c\x91\xa6\x3b\xa3\x07\xae\x79\x61\x96\x92\x9a\xb2\xf7\
+\x92\x9e\x7f\x57\x3e\xa6\x02\xc7\x92\x16\x58\x2e\x23\xfe\x5c\x31\
+\x2f\xcc\x49\xe3\x7f\x74\x92\x56\xf6\x09\xe2\x07\xac\x59\x91\xfb\
+\x81\x8f\xe3\x22\xcc\xba\xd8\x1e\xf8\x7f\xc0\x03\xc4\x9f\x3b\x26\
+\x65\x29\xa9\x41\x93\xd4\xc2\xf1\xc4\x0f\x56\x93\x72\x03\x70\x1c\
+\x30\xb9\xd5\x07\xa6\x6c\x0d\x93\x16\x63\x5e\x4c\xfc\xb9\x64\xd2\
+\x16\xd4\x87\xb4\xfc\xc4\xa4\x82\xbd\x9c\xb4\x57\x7b\xf4\x40\x2d\
+\x39\x8b\x80\x6f\x93\x36\xa7\x51\x73\xec\x03\x9c\x4e\xfa\x12\x8a\
+\x3e\xc7\x4a\xce\x1c\xd2\x16\xd1\x92\x56\xb2\x33\x69\xe3\x8c\xe8\
+\x01\x5a\x6a\x1e\x03\xfe\x1e\xd8\x64\xa2\x0f\x4a\xb5\x36\x83\x74\
+\x8b\xcd\xb1\x16\x97\x5f\xe3\x6e\xa6\xd2\xf3\x36\x62\xc5\xae\x70\
+\xa6\xda\x3c\x06\x9c\x0c\xac\x3f\xd1\x87\xa4\x46\x99\x06\x9c\x48\
+\x7a\x84\x33\xfa\x1c\x2c\x31\x97\xe0\xad\x35\x89\x29\xa4\x7d\xe0\
+\xa3\x07\x64\x69\x79\x84\xb4\x32\xd9\x8d\x4a\xca\xb6\x2e\xf0\x31\
+\x52\x23\x18\x7d\x4e\x96\x96\xcf\xb4\xf1\xf9\x48\x8d\x76\x3a\xf1\
+\x03\xb1\xa4\x3c\x4c\xfa\xe5\xe7\x2e\x7d\x5a\xd9\x34\xe0\xc3\xd8\
+\x08\x54\x9d\x3f\x6a\xe7\xc3\x91\x9a\xe8\xed\xc4\x0f\xc0\x52\xf2\
+\x2c\x70\x0a\xbe\x46\x59\xad\x4d\x23\xdd\x12\x72\xb1\x60\x35\x59\
+\x00\xec\xd7\xce\x07\x23\x35\xc9\x1e\xa4\x2f\xa5\xe8\x01\xd8\xf4\
+\x2c\x25\xad\xea\xdf\xba\xbd\x8f\x45\x02\xd2\x0b\xb8\x4e\x27\x9d\
+\x3f\xd1\xe7\x70\xd3\x33\x0b\xd8\xb8\xbd\x8f\x45\xaa\xbf\xe9\xf8\
+\x82\x9f\x2a\x72\x09\xe9\xad\x72\x52\xb7\x5e\x0a\x5c\x4e\xfc\xb9\
+\xdc\xf4\x5c\x89\xef\xd1\x50\x01\x86\x80\xff\x25\x7e\xc0\x35\x39\
+\xf7\x93\x36\x80\x91\xfa\xe5\x6d\xa4\xf5\x23\xd1\xe7\x76\x93\xf3\
+\xe9\xb6\x3f\x0d\xa9\xa6\x3e\x46\xfc\x40\x6b\x6a\x16\x03\xa7\x92\
+\x56\x76\x4b\xfd\xb6\x3e\xe9\xfc\x5a\x42\xfc\xb9\xde\xc4\x2c\xc3\
+\xc6\x5d\x0d\x76\x18\xe9\x4b\x2a\x7a\xa0\x35\x31\x37\x91\xa6\x6b\
+\xa5\x41\xdb\x07\xf8\x39\xf1\xe7\x7c\x13\xf3\x28\xb0\x79\xfb\x1f\
+\x85\x54\x0f\x5b\x00\xbf\x23\x7e\x80\x35\x2d\x4f\x01\x7f\x81\xaf\
+\xe4\x55\xb5\xd6\x00\xfe\x06\x17\xf2\x0e\x22\x3f\xc1\xf1\xac\x06\
+\x19\x26\x9d\xd4\xd1\x03\xab\x69\xb9\x84\xb4\x5a\x5b\x8a\xb2\x3d\
+\x70\x0d\xf1\x63\xa1\x69\xf9\xdb\x4e\x3e\x04\x29\x67\x27\x11\x3f\
+\xa0\x9a\x94\x05\xc0\x47\xf0\x57\x82\xf2\x30\x89\x74\x3e\x2e\x22\
+\x7e\x6c\x34\x25\x8b\x81\x83\x3b\xf9\x10\xa4\x1c\xed\x02\xcc\x27\
+\x7e\x40\x35\x25\xb7\x01\x7b\x76\xf4\x09\x48\xd5\xd8\x1d\xb8\x95\
+\xf8\x31\xd2\x94\x3c\x80\x2f\x0d\x52\x8d\xad\x09\xdc\x4c\xfc\x40\
+\x6a\x42\x96\x00\x9f\x1c\x39\xa6\x52\xae\xa6\x02\xff\x41\x5a\xd1\
+\x1e\x3d\x66\x9a\x90\xef\x74\x76\xf8\xa5\x7c\x7c\x8a\xf8\x01\xd4\
+\x84\x3c\x0c\x1c\xda\xe1\xb1\x97\x22\xbd\x0e\x98\x43\xfc\xd8\x69\
+\x42\xfe\xa0\xc3\x63\x2f\x85\x3b\x18\x9f\x17\xee\x47\xae\x20\xbd\
+\xc3\x5d\xaa\x9b\x99\xc0\x75\xc4\x8f\xa1\xba\x67\x0e\xb0\x59\x87\
+\xc7\x5e\x0a\x33\x0d\xb8\x87\xf8\x81\x53\xe7\x2c\x23\x6d\xba\xe2\
+\xf6\xa0\xaa\xb3\x29\xa4\xf3\x38\x7a\x3c\xd5\x3d\xe7\x76\x7a\xe0\
+\xa5\x28\x5f\x25\x7e\xc0\xd4\x39\x4f\x03\xc7\x76\x7c\xd4\xa5\x7c\
+\xbd\x03\xf7\x0c\xe8\x35\x6f\xef\xf8\xa8\x4b\x15\x7b\x23\xf1\x03\
+\xa5\xce\xb9\x0d\xd8\xb1\xe3\xa3\x2e\xe5\x6f\x2f\xe0\x37\xc4\x8f\
+\xb1\xba\x66\x2e\xde\x0e\x54\xc6\xd6\x06\xee\x25\x7e\xa0\xd4\x35\
+\x17\x91\xf6\x5b\x97\x9a\x6a\x23\xd2\xba\x96\xe8\xb1\x56\xd7\x9c\
+\xd7\xf9\x21\x97\xaa\xf1\xaf\xc4\x0f\x90\xba\xe6\x74\x60\x72\xe7\
+\x87\x5c\xaa\x9d\xb5\x80\x6f\x11\x3f\xe6\xea\x9a\x77\x74\x7e\xc8\
+\xa5\xc1\xda\x03\x78\x8e\xf8\xc1\x51\xb7\x2c\x03\x4e\xee\xfc\x70\
+\x4b\xb5\x36\x44\x3a\xef\xa3\xc7\x5f\x1d\x33\x07\x37\x08\x52\x46\
+\x86\x81\x6b\x89\x1f\x18\x75\xcb\x02\x7c\xc6\x57\x65\x7b\x17\xfe\
+\x70\xe8\x26\x5f\xec\xe6\x60\x4b\x83\xf0\x97\xc4\x0f\x88\xba\xe5\
+\x31\x60\xff\x6e\x0e\xb6\xd4\x30\x47\x90\x9e\x7c\x89\x1e\x93\x75\
+\xca\x52\xbc\x7e\x28\x03\x33\x80\x27\x89\x1f\x10\x75\xca\x23\xa4\
+\x7d\xd3\x25\x25\xfb\xe1\xce\x81\x9d\xe6\x46\xd2\x8b\x98\xa4\x30\
+\xdf\x23\x7e\x20\xd4\x29\xf7\x03\x3b\x74\x73\xa0\xa5\x86\xdb\x95\
+\xb4\xed\x75\xf4\x18\xad\x53\xfe\xa2\xab\x23\x2d\xf5\xc1\xeb\x88\
+\x1f\x00\x75\xca\xaf\x48\xdb\xa3\x4a\x1a\xdb\x4e\xa4\xb7\xe0\x45\
+\x8f\xd5\xba\xe4\x29\x60\xf3\xae\x8e\xb4\xd4\x83\x35\x71\xbb\xdf\
+\x4e\x72\x3b\x0e\x54\xa9\x1d\x5b\xe3\xb5\xa5\x93\x9c\xdd\xdd\x61\
+\x96\xba\x77\x12\xf1\x27\x7e\x5d\xf2\x73\x60\xc3\xee\x0e\xb3\x54\
+\xa4\x2d\x48\x33\x66\xd1\x63\xb7\x0e\x59\x06\xbc\xac\xbb\xc3\x2c\
+\x75\x6e\x03\xd2\xb6\x94\xd1\x27\x7e\x1d\xf2\x0b\x7c\x66\x57\xea\
+\xc6\x16\xb8\x75\x70\xbb\xb9\x8e\xb4\xb7\x82\x34\x70\x9f\x25\xfe\
+\x84\xaf\x43\xee\xc6\xd7\x78\x4a\xbd\xd8\x0a\x98\x45\xfc\x58\xae\
+\x43\x7c\x81\x98\x06\x6e\x3b\x60\x21\xf1\x27\x7b\xee\x99\x45\xba\
+\x97\x29\xa9\x37\x3b\x02\xb3\x89\x1f\xd3\xb9\xe7\x5e\xd2\xeb\x97\
+\xa5\x81\xf1\xb1\xbf\x89\xf3\x20\xa9\x51\x92\xd4\x1f\x7b\xe0\x6d\
+\xc7\x76\xf2\x81\x6e\x0f\xb0\x34\x91\x83\x48\x0b\x4e\xa2\x4f\xf2\
+\x9c\xf3\x28\xb0\x4b\xb7\x07\x58\xd2\xb8\x0e\xc0\x1d\x03\x27\xca\
+\xe3\xb8\xe0\x58\x03\x30\x44\x5a\x68\x12\x7d\x82\xe7\x9c\x79\xc0\
+\xbe\xdd\x1e\x60\x49\x13\x3a\x12\x58\x4c\xfc\x58\xcf\x39\xff\xd2\
+\xf5\xd1\x95\xc6\xf1\x36\xe2\x4f\xec\x9c\xb3\x04\x38\xba\xeb\xa3\
+\x2b\xa9\x5d\x7f\x4a\xfc\x78\xcf\x39\x0b\x70\xfd\x91\xfa\x68\x12\
+\x3e\x93\x3b\x51\x4e\xec\xfa\xe8\x4a\xea\xd4\xa7\x89\x1f\xf3\x39\
+\xe7\xb4\xee\x0f\xad\xf4\x42\x7f\x44\xfc\x09\x9d\x73\x4e\xef\xfe\
+\xd0\x4a\xea\xc2\x30\x2e\x48\x6e\x95\xe7\x80\x6d\xbb\x3e\xba\xd2\
+\x88\x61\xe0\x36\xe2\x4f\xe8\x5c\x73\x01\x30\xb9\xeb\xa3\x2b\xa9\
+\x5b\x53\x81\x6b\x89\xbf\x06\xe4\x1a\x67\x01\xd4\x33\xef\xfd\x8f\
+\x9f\x9b\x81\x69\xdd\x1f\x5a\x49\x3d\xda\x8c\xf4\x86\xcd\xe8\x6b\
+\x41\x8e\x59\x84\x6b\x01\xd4\x83\x21\xd2\x56\xb6\xd1\x27\x72\x8e\
+\x79\x1c\x9f\xf5\x97\x72\xb0\x17\x30\x9f\xf8\x6b\x42\x8e\xf9\x52\
+\x0f\xc7\x55\x85\x3b\x96\xf8\x13\x38\xc7\x2c\x05\x5e\xdf\xc3\x71\
+\x95\xd4\x5f\x3e\x19\x30\x76\x9e\x03\xb6\xe9\xfe\xb0\xaa\x54\x43\
+\xc0\x2d\xc4\x9f\xc0\x39\xe6\x1f\x7a\x38\xae\x92\x06\xe3\xab\xc4\
+\x5f\x1b\x72\xcc\x17\x7b\x39\xa8\xaa\x87\x7e\xbf\x09\xea\x18\xe0\
+\xfb\x7d\xfe\x67\x36\xc1\x45\xc0\xeb\x48\x3b\x22\xaa\x1a\x27\x00\
+\xfb\x47\x17\xd1\xa5\xab\xf0\x7d\xed\x55\x59\x9b\xb4\x28\x70\x8f\
+\xe8\x42\x32\xf3\x1c\xe9\x76\xe5\x43\xd1\x85\xa8\x1e\x86\x80\x9b\
+\x88\xef\x5c\x73\xcb\x2c\xe0\x45\x3d\x1c\x57\x75\xe7\xeb\xc4\x7f\
+\xf6\xdd\xe6\xcb\x03\x38\x1e\x1a\xdf\x0e\xc0\x93\xc4\x7f\xee\xb9\
+\xe5\x53\xbd\x1c\x54\xe5\x6f\xb8\x8f\xff\xac\xc3\x81\xbd\xfb\xf8\
+\xcf\x6b\x82\xc5\xa4\x35\x11\x73\xa2\x0b\x91\x34\xae\x5f\x03\xef\
+\x8a\x2e\x22\x43\xef\x05\xd6\x89\x2e\x42\x83\xd3\xcf\x06\xc0\x37\
+\x4a\xad\xee\x1f\x80\x9f\x45\x17\x21\x69\x42\xe7\x00\x5f\x89\x2e\
+\x22\x33\x1b\x62\x63\xd4\x68\xfd\x6a\x00\x76\x20\xdd\xe3\xd6\x0a\
+\xd7\x02\xa7\x44\x17\x21\xa9\x6d\x27\x02\xf7\x44\x17\x91\x99\x93\
+\x48\xdb\xba\xab\x81\xfa\xd5\x00\xfc\x65\x1f\xff\x59\x4d\xf0\x2c\
+\xf0\xc7\xa4\x47\xff\x24\xd5\xc3\xb3\xc0\xf1\x38\x6e\x57\xb6\x2d\
+\x70\x54\x74\x11\x1a\x8c\x7e\x7c\x69\xaf\x4b\xfa\xb2\xd3\x0a\x7f\
+\x8d\xbf\x24\xa4\x3a\xba\x06\xf8\xe7\xe8\x22\x32\x73\x52\x74\x01\
+\x1a\x8c\x7e\x34\x00\xef\x06\xd6\xef\xc3\x3f\xa7\x29\x2e\x04\xce\
+\x88\x2e\x42\x52\xd7\x3e\x0e\xfc\x3c\xba\x88\x8c\x1c\x0a\x1c\x10\
+\x5d\x84\xfa\xaf\xd7\x06\x60\x18\xf8\x8b\x7e\x14\xd2\x10\x73\x49\
+\x53\x88\xcb\x83\xeb\x90\xd4\xbd\x25\xa4\x71\xbc\x28\xb8\x8e\x9c\
+\xfc\x79\x74\x01\xea\xbf\x5e\x1b\x80\x37\x90\x16\x00\x2a\xf9\x30\
+\xf0\xbb\xe8\x22\x24\xf5\xec\x0e\xe0\x5f\xa2\x8b\xc8\xc8\xef\x91\
+\x9e\x0a\x50\x83\xf4\xda\x00\xfc\x55\x5f\xaa\x68\x86\x2b\x80\x33\
+\xa3\x8b\x90\xd4\x37\xff\x04\xdc\x15\x5d\x44\x26\xa6\x02\xef\x88\
+\x2e\x42\xfd\xd5\x4b\x03\xb0\x03\x69\xf3\x1f\xa5\xa9\xc2\xd1\x17\
+\x8b\x48\x6a\x86\x45\x78\x8b\x73\x65\xef\x89\x2e\x40\xfd\xd5\x4b\
+\x03\x70\x3c\xfd\x7f\x97\x40\x5d\x9d\x02\xfc\x2a\xba\x08\x49\x7d\
+\x77\x09\x69\x5b\x69\xc1\x6e\xc0\x41\xd1\x45\xa8\x7f\xba\x6d\x00\
+\x86\x81\x77\xf6\xb3\x90\x1a\xbb\x07\x37\xfc\x91\x9a\xec\x03\xb8\
+\x9d\xf7\x28\x67\x01\x1a\xa4\xdb\x06\xe0\x70\x60\xab\x7e\x16\x52\
+\x63\xef\x03\x16\x46\x17\x21\x69\x60\xe6\x00\x7f\x1b\x5d\x44\x26\
+\xde\x86\x8f\x7d\x37\x46\xb7\x0d\x80\xfb\x43\x27\xe7\x00\x97\x46\
+\x17\x21\x69\xe0\xce\x00\x6e\x8e\x2e\x22\x03\x6b\xe3\x62\xc0\xc6\
+\xe8\xa6\x01\x98\x0e\xbc\xb9\xdf\x85\xd4\xd0\x62\xe0\xa3\xd1\x45\
+\x48\xaa\xc4\x32\x1c\xef\xa3\x8e\x8f\x2e\x40\xfd\xd1\x4d\x03\xf0\
+\x07\xa4\x47\x42\x4a\xf7\x25\xe0\xee\xe8\x22\x24\x55\xe6\x22\xd2\
+\x4e\x9f\xa5\xdb\x0f\xd8\x31\xba\x08\xf5\xae\x9b\x06\xe0\xf8\x7e\
+\x17\x51\x43\x4f\x02\x9f\x88\x2e\x42\x52\xe5\x4e\x22\xed\x14\x58\
+\xba\x3f\x88\x2e\x40\xbd\xeb\xb4\x01\xd8\x09\xf7\x84\x06\xf8\x47\
+\x5c\x15\x2c\x95\xe8\x4e\xe0\xbf\xa2\x8b\xc8\xc0\x1f\x46\x17\xa0\
+\xde\x75\xda\x00\x1c\x3f\x88\x22\x6a\xe6\x3e\xe0\xf3\xd1\x45\x48\
+\x0a\xf3\x7f\x81\x79\xd1\x45\x04\xdb\x19\xd8\x27\xba\x08\xf5\xa6\
+\xd3\x06\xe0\x2d\x03\xa9\xa2\x5e\x3e\x81\x2f\x09\x91\x4a\x36\x1b\
+\xf8\x42\x74\x11\x19\x70\x16\xa0\xe6\x3a\x69\x00\xf6\xc0\x85\x1f\
+\xb3\x70\x57\x30\x49\xf0\x69\x9c\x05\xf8\x23\xfa\xf3\x4a\x79\x05\
+\xe9\xe4\xc3\xf3\xd7\x7f\xba\xf7\xff\x5c\x74\x11\x92\xc2\xcd\x05\
+\x4e\x8b\x2e\x22\xd8\xe6\xc0\x21\xd1\x45\xa8\x7b\x9d\x34\x00\xc7\
+\x0c\xac\x8a\x7a\x98\x05\x9c\x15\x5d\x84\xa4\x6c\x7c\x06\x98\x1f\
+\x5d\x44\xb0\x63\xa3\x0b\x50\xf7\xda\x6d\x00\x76\x20\xdd\x02\x28\
+\xd9\xa7\xf0\xd7\xbf\xa4\x15\x7e\x07\x9c\x1e\x5d\x44\xb0\xa3\xf1\
+\xa5\x70\xb5\xd5\x6e\x03\xf0\xd6\x81\x56\x91\xbf\x07\x80\x33\xa3\
+\x8b\x90\x94\x9d\x7f\x01\x16\x44\x17\x11\x68\x2b\xfc\x71\x58\x5b\
+\xed\x36\x00\xa5\x4f\xff\xff\x2b\xae\xfc\x97\xb4\xba\xd9\xf8\xe3\
+\xe0\xa8\xe8\x02\xd4\x9d\x76\x1a\x80\x2d\x80\xfd\x07\x5d\x48\xc6\
+\x9e\xc1\x01\x2e\x69\x7c\x9f\x25\xbd\x2b\xa0\x54\x47\x47\x17\xa0\
+\xee\xb4\xd3\x00\xbc\x85\xb2\xef\xf1\x7c\x15\x78\x2a\xba\x08\x49\
+\xd9\xba\x9b\xf4\x9e\x80\x52\xed\x47\x7a\x22\x40\x35\xd3\x4e\x03\
+\xf0\x86\x81\x57\x91\xaf\x65\xc0\x17\xa3\x8b\x90\x94\xbd\x53\xa3\
+\x0b\x08\x34\x04\xbc\x31\xba\x08\x75\x6e\xa2\x06\x60\x4d\xca\x7e\
+\xce\xf3\x7c\x7c\xe3\x9f\xa4\x89\xfd\x98\xf4\x9e\x80\x52\xb9\x0e\
+\xa0\x86\x26\x6a\x00\x0e\x06\xd6\xa9\xa2\x90\x4c\xfd\x47\x74\x01\
+\x92\x6a\x61\x39\x65\x6f\x0f\x7c\x38\xb0\x56\x74\x11\xea\xcc\x44\
+\x0d\xc0\xab\x2b\xa9\x22\x4f\xb7\x03\x3f\x89\x2e\x42\x52\x6d\x7c\
+\x8d\x72\xd7\x0b\x4d\x05\x0e\x8a\x2e\x42\x9d\x99\xa8\x01\x78\x4d\
+\x25\x55\xe4\xe9\x0c\x52\x57\x2f\x49\xed\x98\x07\x7c\x33\xba\x88\
+\x40\x87\x45\x17\xa0\xce\xb4\x6a\x00\x36\x02\xf6\xae\xaa\x90\xcc\
+\x2c\xc6\x97\xfe\x48\xea\xdc\x99\xd1\x05\x04\x7a\x55\x74\x01\xea\
+\x4c\xab\x06\xe0\xf0\x09\xfe\xef\x4d\x76\x3e\xf0\x58\x74\x11\x92\
+\x6a\xe7\x3a\xca\x5d\x0c\x78\x00\xb0\x6e\x74\x11\x6a\x5f\xab\x2f\
+\xf8\x92\xef\xff\x9f\x19\x5d\x80\xa4\xda\x2a\xf5\xa5\x61\x93\x29\
+\xfb\xa9\xb1\xda\x99\x68\x06\xa0\x44\x8f\x02\x3f\x8a\x2e\x42\x52\
+\x6d\x9d\x05\x2c\x8d\x2e\x22\x88\xb7\x01\x6a\x64\xbc\x06\x60\x7b\
+\x60\xdb\x2a\x0b\xc9\xc8\xd9\xa4\x35\x00\x92\xd4\x8d\x87\x29\x77\
+\x67\xc0\x52\x7f\x38\xd6\xd2\x78\x0d\x40\xc9\x8f\x73\x9c\x1d\x5d\
+\x80\xa4\xda\x2b\xf5\x3a\xb2\x27\xb0\x41\x74\x11\x6a\x8f\x0d\xc0\
+\x0b\xdd\x03\xdc\x1a\x5d\x84\xa4\xda\x3b\x0f\x58\x18\x5d\x44\x80\
+\x61\xca\x7e\x79\x5c\xad\x8c\xd7\x00\x1c\x50\x69\x15\xf9\xf8\x5e\
+\x74\x01\x92\x1a\x61\x1e\x70\x49\x74\x11\x41\x4a\xfd\xfe\xa8\x9d\
+\xb1\x1a\x80\xa9\xc0\x1e\x55\x17\x92\x89\xef\x47\x17\x20\xa9\x31\
+\x4a\xbd\x9e\xd8\x00\xd4\xc4\x58\x0d\xc0\x7e\xc0\x1a\x55\x17\x92\
+\x81\x07\x81\x1b\xa2\x8b\x90\xd4\x18\xe7\x02\x4b\xa2\x8b\x08\x70\
+\x20\x65\xbf\x42\xbe\x36\xc6\x6a\x00\x4a\xed\xde\xbe\x8b\x5b\xff\
+\x4a\xea\x9f\xb9\xc0\x65\xd1\x45\x04\xd8\x90\xf4\x24\x99\x32\x67\
+\x03\xb0\x42\xa9\xd3\x75\x92\x06\xa7\xd4\xeb\xca\x81\xd1\x05\x68\
+\x62\x36\x00\xc9\x13\xc0\x35\xd1\x45\x48\x6a\x9c\xf3\xa3\x0b\x08\
+\x52\xe2\xf7\x48\xed\xac\xda\x00\x6c\x01\xcc\x8c\x28\x24\xd8\xa5\
+\x94\xbb\x73\x97\xa4\xc1\x79\x00\xb8\x2b\xba\x88\x00\x3e\x0a\x58\
+\x03\xab\x36\x00\xfb\x86\x54\x11\xaf\xd4\xc7\x75\x24\x0d\xde\xc5\
+\xd1\x05\x04\xd8\x8d\x72\x5f\x26\x57\x1b\xab\x7e\x40\xbb\x85\x54\
+\x11\xaf\xd4\x6d\x3b\x25\x0d\x5e\x89\x3f\x30\xd6\x06\xb6\x8b\x2e\
+\x42\xad\xad\xda\x00\xec\x1a\x52\x45\xac\xfb\x81\x7b\xa3\x8b\x90\
+\xd4\x58\x97\x52\xe6\xfb\x45\x76\x8f\x2e\x40\xad\xd9\x00\xc0\x8f\
+\xa3\x0b\x90\xd4\x68\xcf\x00\x3f\x8f\x2e\x22\x40\xa9\x33\xca\xb5\
+\xb1\x72\x03\x30\x09\xd8\x29\xaa\x90\x40\x25\x4e\xcf\x49\xaa\x56\
+\xa9\xeb\x00\x94\xb1\x95\x1b\x80\xed\x81\xb5\xa2\x0a\x09\x74\x55\
+\x74\x01\x92\x1a\xef\xea\xe8\x02\x02\xd8\x00\x64\x6e\xe5\x06\xa0\
+\xc4\x0f\xeb\x3e\x60\x76\x74\x11\x92\x1a\xef\x7a\xca\x7b\xd4\x78\
+\x47\x60\x4a\x74\x11\x1a\xdf\xca\x0d\xc0\x2e\x61\x55\xc4\xf9\x59\
+\x74\x01\x92\x8a\xf0\x34\xf0\xab\xe8\x22\x2a\x36\x19\xd8\x39\xba\
+\x08\x8d\xaf\xf4\x19\x80\x6b\xa3\x0b\x90\x54\x8c\x12\xaf\x37\x25\
+\xae\x2b\xab\x0d\x67\x00\x24\xa9\x1a\xd7\x47\x17\x10\xc0\xbd\x00\
+\x32\xb6\xea\x22\xc0\x92\x2c\x02\x6e\x8a\x2e\x42\x52\x31\xae\x8b\
+\x2e\x20\xc0\xb6\xd1\x05\x68\x7c\xa3\x0d\xc0\xc6\xa4\x9d\x9b\x4a\
+\x72\x2b\xa9\x09\x90\xa4\x2a\xdc\x41\xda\x13\xa0\x24\xce\x00\x64\
+\x6c\xb4\x01\xd8\x3a\xb4\x8a\x18\xb7\x46\x17\x20\xa9\x28\xcb\x80\
+\xdb\xa3\x8b\xa8\x98\x33\x00\x19\x9b\x3c\xf2\xe7\x56\xa1\x55\xc4\
+\xb8\x23\xba\x80\x8a\x1c\x07\x1c\x1c\x5d\x44\x80\x3a\xbf\x8d\xec\
+\x50\xe0\xf4\xe8\x22\x02\x9c\x03\x5c\x18\x5d\xc4\x80\xfd\x12\x38\
+\x30\xba\x88\x0a\x6d\x4d\xfa\x9e\x59\x12\x5d\x88\x56\x37\xda\x00\
+\x94\x38\x03\xf0\xcb\xe8\x02\x2a\xf2\x0a\xe0\xdd\xd1\x45\xa8\x23\
+\x3b\x53\xe6\xe3\x53\xf7\xd1\xfc\x06\xa0\x94\x1f\x1e\xa3\x26\x93\
+\x5e\x31\x7f\x5f\x74\x21\x5a\xdd\xe8\x2d\x80\x12\x67\x00\x4a\x9b\
+\x8a\x93\x14\xaf\xc4\xeb\x8e\xeb\x00\x32\x55\x6a\x03\xf0\x38\xf0\
+\x48\x74\x11\x92\x8a\x53\xca\xcc\xe3\xca\x4a\x9c\x61\xae\x85\xd1\
+\x06\x60\x9b\xc8\x22\x02\x94\xd8\x85\x4b\x8a\xf7\x30\xe9\x07\x48\
+\x49\x36\x8b\x2e\x40\x63\x1b\x6d\x00\x66\x86\x56\x51\xbd\xd2\xee\
+\xc3\x49\xca\x47\x69\x5b\x02\x6f\x1a\x5d\x80\xc6\x36\x4c\x7a\xfe\
+\x7f\xe3\xe8\x42\x2a\xe6\x82\x14\x49\x51\x4a\xbb\xfe\xd8\x00\x64\
+\x6a\x18\xd8\x24\xba\x88\x00\xb3\xa2\x0b\x90\x54\xac\xdf\x46\x17\
+\x50\x31\x1b\x80\x4c\x0d\x03\x1b\x46\x17\x11\xc0\x06\x40\x52\x94\
+\xd2\xae\x3f\x36\x00\x99\x2a\xb5\x01\x28\xad\x03\x97\x94\x8f\xd2\
+\xae\x3f\x36\x00\x99\x1a\x06\x36\x8a\x2e\xa2\x62\x8b\x81\xd9\xd1\
+\x45\x48\x2a\x56\x69\x33\x00\x1b\x00\x6b\x46\x17\xa1\xd5\x0d\x93\
+\x3e\x9c\x92\x3c\x00\x2c\x8d\x2e\x42\x52\xb1\x4a\x6b\x00\x86\x28\
+\x6f\xa1\x79\x2d\x94\x78\x0b\xe0\x81\xe8\x02\x24\x15\xed\x59\xca\
+\xdb\x0b\x60\xfd\xe8\x02\xb4\xba\x12\x6f\x01\x3c\x16\x5d\x80\xa4\
+\xe2\xcd\x89\x2e\xa0\x62\xd3\xa2\x0b\xd0\xea\x4a\x9c\x01\x28\xad\
+\xf3\x96\x94\x9f\xd2\xae\x43\xeb\x46\x17\xa0\xd5\xd9\x00\x48\x52\
+\xf5\x4a\xbb\x0e\x39\x03\x90\xa1\x12\x17\x01\x3e\x11\x5d\x80\xa4\
+\xe2\x95\xd6\x00\x38\x03\x90\xa1\x61\x60\xad\xe8\x22\x2a\x36\x37\
+\xba\x00\x49\xc5\x2b\xed\x3a\xe4\x0c\x40\x86\x86\x29\xef\xf9\xcc\
+\xd2\x3a\x6f\x49\xf9\x29\x6d\x26\xd2\x19\x80\x0c\x95\xd8\x00\x3c\
+\x19\x5d\x80\xa4\xe2\xd9\x00\x28\x5c\x89\x0d\xc0\xa2\xe8\x02\x24\
+\x15\x6f\x61\x74\x01\x15\x2b\xed\x56\x73\x2d\xd8\x00\x48\x52\xf5\
+\x16\x47\x17\x50\xb1\xe1\xe8\x02\xb4\xba\x61\x60\x4a\x74\x11\x15\
+\x7b\x2e\xba\x00\x49\xc5\x2b\xed\x87\x88\x0d\x40\x86\x4a\x9c\x01\
+\xb0\x01\x90\x14\xad\xb4\xeb\x90\x0d\x40\x86\x6c\x00\x24\xa9\x7a\
+\xa5\x5d\x87\x26\x45\x17\xa0\xd5\xd9\x00\x48\x52\xf5\xbc\x05\xa0\
+\x70\xc3\x94\xd7\x99\x2d\x89\x2e\x40\x52\xf1\x4a\x5b\x04\x58\xda\
+\xf7\x4c\x2d\x0c\x53\xde\x17\xe2\x1a\xd1\x05\x48\x2a\x5e\x69\x33\
+\xaf\x43\xd1\x05\x68\x75\xc3\x94\x37\x15\x55\xda\xc0\x93\x94\x9f\
+\xd2\xae\x43\xde\x02\xc8\xd0\x30\xe5\x4d\x45\x95\x36\xf0\x24\xe5\
+\xa7\xb4\xeb\x50\x69\x3f\x34\x6b\x61\x98\xf2\x16\xc5\x95\x36\xf0\
+\x24\xe5\xa7\xb4\xfd\x57\x4a\xdb\xf9\xb0\x16\x6c\x00\x24\xa9\x7a\
+\xa5\x5d\x87\x6c\x00\x32\x64\x03\x20\x49\xd5\x2b\xed\x3a\xe4\x2d\
+\x80\x0c\x95\xb8\x08\xd0\x97\x52\x48\x8a\x56\xda\x75\xc8\x19\x80\
+\x0c\x95\x38\x03\xb0\x41\x74\x01\x92\x8a\x57\xda\x75\xc8\x06\x20\
+\x43\x25\x36\x00\x1b\x46\x17\x20\xa9\x78\x1b\x45\x17\x50\x31\x1b\
+\x80\x0c\x0d\x03\x0b\xa2\x8b\xa8\x98\x0d\x80\xa4\x68\xce\x00\x28\
+\xdc\x30\xf0\x78\x74\x11\x15\xb3\x01\x90\x14\xad\xb4\x19\x80\xa7\
+\xa2\x0b\xd0\xea\x6c\x00\x24\xa9\x7a\xa5\x5d\x87\xe6\x46\x17\xa0\
+\xd5\x95\xd8\x00\x94\xd6\x79\x4b\xca\x4f\x69\xd7\xa1\xd2\xbe\x67\
+\x6a\xa1\xc4\x06\xe0\x45\xd1\x05\x48\x2a\x9e\x0d\x80\xc2\x95\xd8\
+\x00\xcc\x8c\x2e\x40\x52\xd1\xd6\x05\xa6\x47\x17\x51\xa1\xe5\x94\
+\xf7\x3d\x53\x0b\xc3\x94\x77\x6f\x66\x4b\x60\x72\x74\x11\x92\x8a\
+\xb5\x75\x74\x01\x15\x7b\x9a\xf2\x5e\x3a\x57\x0b\x25\xce\x00\x4c\
+\x06\x66\x44\x17\x21\xa9\x58\xa5\x35\x00\xa5\xfd\xc8\xac\x8d\x12\
+\x1b\x00\x28\x6f\x00\x4a\xca\x47\x69\xd7\x9f\x12\xbf\x63\x6a\xc1\
+\x06\x40\x92\xaa\xb5\x55\x74\x01\x15\x9b\x13\x5d\x80\xc6\x36\x0c\
+\x3c\x4a\x5a\xa4\x51\x12\x1b\x00\x49\x51\x4a\x6b\x00\x1e\x88\x2e\
+\x40\x63\x9b\x4c\x7a\x1b\xe0\x6c\xca\xba\x2f\xbe\x6d\x74\x01\x15\
+\xba\x1c\x58\x12\x5d\x44\x80\xa3\xa8\xef\x39\x7d\xe3\x48\x4a\x73\
+\x4b\x74\x01\x15\xd9\x2e\xba\x80\x8a\x3d\x18\x5d\x80\x5a\xbb\x9e\
+\x34\x0b\x50\x4a\xae\xee\xcf\x61\x53\xc6\x2e\x23\xfe\x3c\xeb\x36\
+\x27\xf7\xfd\x68\x28\x17\x43\xc0\x93\xc4\x9f\x63\x55\xe6\xf8\x7e\
+\x1c\x38\xf5\xdf\xf0\xc8\x9f\xb3\x42\xab\xa8\xde\xae\xa4\x81\x28\
+\x49\x55\x9a\x09\xac\x1f\x5d\x44\xc5\xbc\x05\x90\xa9\x52\x1b\x80\
+\xf5\x81\x2d\xa2\x8b\x90\x54\x9c\x5d\xa3\x0b\x08\x60\x03\x90\xa9\
+\xd1\x06\xe0\xb7\xa1\x55\xc4\x28\x71\x20\x4a\x8a\x55\xe2\x75\xc7\
+\x35\x00\x99\xb2\x01\x90\xa4\xea\x94\x76\xdd\x99\x0b\xcc\x8f\x2e\
+\x42\x63\x2b\xf5\x16\x00\xc0\x6e\xd1\x05\x48\x2a\xce\x2e\xd1\x05\
+\x54\xcc\xe9\xff\x8c\x95\xdc\x00\xec\x19\x5d\x80\xa4\xa2\x4c\xa6\
+\xbc\x19\x80\x7b\xa2\x0b\xd0\xf8\x46\x1b\x80\x27\x80\x67\x22\x0b\
+\x09\xb0\x3b\x30\x35\xba\x08\x49\xc5\xd8\x0d\x58\x27\xba\x88\x8a\
+\xdd\x15\x5d\x80\xc6\x37\xbc\xd2\x5f\x97\xd6\xa9\xad\x01\xec\x1b\
+\x5d\x84\xa4\x62\x1c\x14\x5d\x40\x80\x5f\x45\x17\xa0\xf1\xad\xdc\
+\x00\xdc\x1e\x56\x45\x9c\x03\xa3\x0b\x90\x54\x8c\x03\xa2\x0b\x08\
+\x60\x03\x90\xb1\xd2\x1b\x80\x12\x07\xa4\xa4\x18\xa5\xfd\xe0\x58\
+\x0e\xdc\x1d\x5d\x84\xc6\x57\x7a\x03\xf0\xb2\xe8\x02\x24\x15\x61\
+\x43\x60\xc7\xe8\x22\x2a\xf6\x10\xe5\xad\x2d\xab\x95\xd2\x1b\x80\
+\xcd\x81\x2d\xa3\x8b\x90\xd4\x78\x07\x50\xde\xf6\xe3\x4e\xff\x67\
+\x6e\xe5\x06\xe0\x7e\x60\x5e\x50\x1d\x91\x0e\x89\x2e\x40\x52\xe3\
+\x95\x78\x9d\xf1\x09\x80\xcc\xad\xdc\x00\x2c\x07\xee\x8c\x2a\x24\
+\xd0\xab\xa3\x0b\x90\xd4\x78\x25\x5e\x67\x6e\x8b\x2e\x40\xad\x0d\
+\xaf\xf2\x9f\x4b\xbc\x0d\xf0\x9a\xe8\x02\x24\x35\xda\x06\xc0\x3e\
+\xd1\x45\x04\xb8\x29\xba\x00\xb5\x66\x03\x90\xd6\x00\xec\x14\x5d\
+\x84\xa4\xc6\x3a\x1c\x98\x14\x5d\x44\xc5\x96\xe0\x0c\x40\xf6\x56\
+\x6d\x00\x7e\x19\x52\x45\xbc\x12\xa7\xe7\x24\x55\xe3\x88\xe8\x02\
+\x02\xdc\x01\x2c\x8c\x2e\x42\xad\xad\xda\x00\xfc\x9c\xb4\x16\xa0\
+\x34\x36\x00\x92\x06\xa5\xc4\xeb\xcb\x8d\xd1\x05\x68\x62\xab\x36\
+\x00\x73\x81\xdf\x44\x14\x12\xec\x95\xa4\xad\x81\x25\xa9\x9f\xb6\
+\x1b\x49\x69\x6e\x8e\x2e\x40\x13\x5b\xb5\x01\x00\xb8\xae\xf2\x2a\
+\xe2\xad\x07\xbc\x22\xba\x08\x49\x8d\x73\x74\x74\x01\x41\x9c\x01\
+\xa8\x81\xb1\x1a\x80\xeb\x2b\xaf\x22\x0f\x6f\x89\x2e\x40\x52\xe3\
+\x94\x78\x5d\x59\x06\xfc\x22\xba\x08\x4d\xcc\x19\x80\x15\xde\xcc\
+\xd8\xc7\x43\x92\xba\xb1\x09\x65\x6e\x37\x7e\x07\x65\x6e\x2a\x57\
+\x3b\x63\x7d\xe1\xdd\x0a\x2c\xa8\xba\x90\x0c\xcc\xa0\xcc\xd7\x75\
+\x4a\x1a\x8c\x63\x28\xef\xf1\x3f\x80\x2b\xa3\x0b\x50\x7b\xc6\x6a\
+\x00\x16\x53\xee\x06\x0e\x6f\x8d\x2e\x40\x52\x63\x94\x38\xfd\x0f\
+\x36\x00\xb5\x31\xde\x94\x77\xa9\xb7\x01\xde\x42\x79\x2f\xec\x90\
+\xd4\x7f\xd3\x49\x4f\x17\x95\xe8\xaa\xe8\x02\xd4\x9e\xf1\x1a\x80\
+\x52\x17\x02\x6e\x0d\xec\x17\x5d\x84\xa4\xda\x3b\x1a\x58\x33\xba\
+\x88\x00\xf7\x01\x0f\x44\x17\xa1\xf6\x8c\xd7\x00\x5c\x53\x69\x15\
+\x79\x79\x67\x74\x01\x92\x6a\xef\xb8\xe8\x02\x82\x5c\x11\x5d\x80\
+\xda\x37\x5e\x03\xf0\x10\xe5\xbe\xcb\xf9\xed\xc0\x94\xe8\x22\x24\
+\xd5\xd6\x96\x94\x3b\xfd\xef\xfd\xff\x1a\x69\xf5\xd8\xdb\x45\x95\
+\x55\x91\x97\x0d\x81\x37\x46\x17\x21\xa9\xb6\xde\x45\x99\xab\xff\
+\xc1\x19\x80\x5a\x69\xd5\x00\x5c\x5c\x59\x15\xf9\x79\x57\x74\x01\
+\x92\x6a\x69\x88\x72\xa7\xff\x1f\x01\xee\x89\x2e\x42\xed\x6b\xd5\
+\x00\x5c\x4e\x7a\x24\xb0\x44\x47\x92\xf6\x05\x90\xa4\x4e\x1c\x02\
+\xec\x10\x5d\x44\x90\x1f\x47\x17\xa0\xce\xb4\x6a\x00\x9e\xa1\xdc\
+\xc7\x01\x27\x03\xef\x88\x2e\x42\x52\xed\xfc\x71\x74\x01\x81\x2e\
+\x8c\x2e\x40\x9d\x99\x68\xeb\xdb\x92\x6f\x03\x9c\x80\x7b\x02\x48\
+\x6a\xdf\x7a\xc0\xef\x47\x17\x11\x64\x29\x65\x7f\x5f\xd4\x92\x0d\
+\xc0\xf8\x76\x02\x5e\x1b\x5d\x84\xa4\xda\x38\x01\x58\x37\xba\x88\
+\x20\xd7\x03\x8f\x47\x17\xa1\xce\x4c\xd4\x00\xfc\x1c\x78\xa2\x8a\
+\x42\x32\x75\x62\x74\x01\x92\x6a\x61\x18\xf8\xf3\xe8\x22\x02\x39\
+\xfd\x5f\x43\x13\x35\x00\x4b\x81\x9f\x56\x51\x48\xa6\x5e\x03\xec\
+\x1c\x5d\x84\xa4\xec\xbd\x11\xd8\x3e\xba\x88\x40\x36\x00\x35\xd4\
+\xce\xeb\x6f\xcf\x1f\x78\x15\xf9\x1a\x02\xfe\x2a\xba\x08\x49\xd9\
+\xfb\x40\x74\x01\x81\xe6\x00\x37\x46\x17\xa1\xce\xb5\xd3\x00\x9c\
+\x0b\x2c\x19\x74\x21\x19\x3b\x0e\xd8\x20\xba\x08\x49\xd9\xda\x1d\
+\x38\x2c\xba\x88\x40\x17\x02\xcb\xa2\x8b\x50\xe7\xda\x69\x00\xe6\
+\x92\xf6\x04\x28\xd5\x3a\xc0\x9f\x44\x17\x21\x29\x5b\xa5\xaf\x15\
+\x3a\x27\xba\x00\x75\xa7\x9d\x06\x00\xe0\xfb\x03\xad\x22\x7f\x27\
+\x01\x53\xa3\x8b\x90\x94\x9d\x99\x94\xbd\x67\xc8\x7c\xbc\xff\x5f\
+\x5b\x9d\x34\x00\x25\x4f\xf1\x6c\x86\xb3\x00\x92\x56\xf7\x11\xca\
+\x7e\x79\xd8\x79\xa4\x26\x40\x35\xd4\x6e\x03\x30\x9b\x72\x77\x05\
+\x1c\xf5\x31\x9c\x05\x90\xb4\xc2\x0c\xe0\xdd\xd1\x45\x04\xfb\x6e\
+\x74\x01\xea\x5e\xbb\x0d\x00\x78\x1b\x60\x06\xbe\x24\x48\xd2\x0a\
+\x1f\xa1\xec\x1f\x05\xf3\x81\x1f\x45\x17\xa1\xee\x75\xd2\x00\x7c\
+\x0f\x58\x3e\xa8\x42\x6a\xe2\xa3\xc0\x9a\xd1\x45\x48\x0a\xb7\x19\
+\xf0\x9e\xe8\x22\x82\x5d\x00\x3c\x1b\x5d\x84\xba\xd7\x49\x03\x70\
+\x3f\x70\xcb\x80\xea\xa8\x8b\x99\xc0\xf1\xd1\x45\x48\x0a\xf7\x61\
+\x60\xed\xe8\x22\x82\x7d\x2f\xba\x00\xf5\xa6\x93\x06\x00\xbc\xdf\
+\x03\xf0\x77\x94\x3d\xed\x27\x95\x6e\x4b\xe0\x7d\xd1\x45\x04\x5b\
+\x08\xfc\x30\xba\x08\xf5\xa6\xd3\x06\xe0\x2c\xd2\xf6\xc0\x25\x9b\
+\x09\xfc\x75\x74\x11\x92\xc2\xfc\x23\xfe\xfa\xff\x5f\xd2\x2b\xe3\
+\x55\x63\x9d\x36\x00\x0f\x02\x97\x0e\xa2\x90\x9a\xf9\x18\xe9\x1e\
+\xa0\xa4\xb2\xec\x09\xbc\x33\xba\x88\x0c\x7c\x2d\xba\x00\xf5\xae\
+\xd3\x06\x00\xe0\xcc\x7e\x17\x51\x43\xd3\x80\x8f\x47\x17\x21\xa9\
+\x72\x9f\xa1\xbb\xeb\x66\x93\x3c\x4c\xd9\xaf\x8a\x6f\x8c\x6e\x4e\
+\xe4\xef\x03\x4f\xf6\xbb\x90\x1a\x7a\x0f\xb0\x5b\x74\x11\x92\x2a\
+\xf3\x46\xe0\x88\xe8\x22\x32\xe0\xad\xe0\x86\xe8\xa6\x01\x58\x08\
+\x7c\xab\xdf\x85\xd4\xd0\x24\xe0\x94\xe8\x22\x24\x55\xc2\xf1\xbe\
+\xc2\x59\xd1\x05\xa8\x3f\xba\x9d\xca\x3a\xb3\x9f\x45\xd4\xd8\x1b\
+\x80\x23\xa3\x8b\x90\x34\x70\xef\x03\x76\x8d\x2e\x22\x03\xd7\x01\
+\x77\x46\x17\xa1\xfe\xe8\xb6\x01\xf0\x24\x58\xe1\x34\xd2\x1b\x03\
+\x25\x35\xd3\x66\xa4\x95\xff\x72\xf1\x5f\xa3\xf4\xb2\x98\xe5\xcc\
+\x7e\x15\x51\x73\xdb\x00\xff\x27\xba\x08\x49\x03\xf3\x59\x60\x7a\
+\x74\x11\x19\x58\x00\x7c\x33\xba\x08\xf5\x4f\x2f\x0d\xc0\x7f\x03\
+\x4b\xfa\x55\x48\xcd\x7d\x08\xa7\x07\xa5\x26\x7a\x2d\xf0\xb6\xe8\
+\x22\x32\xf1\x4d\x5c\x00\xde\x28\xbd\x34\x00\x0f\x93\x36\x83\x50\
+\x7a\x3f\xc0\x57\xf0\xf1\x20\xa9\x49\xa6\x02\x9f\x8f\x2e\x22\x23\
+\x5f\x88\x2e\x40\xfd\xd5\xeb\x17\xd6\xa9\x7d\xa9\xa2\x19\x0e\x00\
+\x4e\x88\x2e\x42\x52\xdf\xfc\x3d\xb0\x7d\x74\x11\x99\xb8\x1a\xb8\
+\x31\xba\x08\xf5\x57\xaf\x0d\xc0\x55\x78\x52\xac\xec\x9f\x49\xaf\
+\x0d\x96\x54\x6f\xbb\x03\x1f\x8c\x2e\x22\x23\xce\x84\x34\x50\x3f\
+\xa6\xac\x3f\xd7\x87\x7f\x46\x53\x6c\x40\x5a\x25\x3b\x14\x5d\x88\
+\xa4\xae\x4d\x01\xce\xc6\x57\x7f\x8f\x7a\x04\xdf\xfc\xd7\x48\xfd\
+\x68\x00\xbe\x09\xcc\xee\xc3\x3f\xa7\x29\x5e\x0d\xbc\x3f\xba\x08\
+\x49\x5d\xfb\x04\x69\xcf\x7f\x25\xa7\x01\x8b\xa3\x8b\x50\xff\xf5\
+\xeb\x97\xea\xc9\xb8\x37\xfe\xca\xe6\x03\x7b\x03\x77\x47\x17\x52\
+\xb0\x0f\x02\x3b\x46\x17\xd1\xa5\xf3\x81\xf3\xa2\x8b\x28\xd4\xcb\
+\x81\x9f\xe2\x82\xde\x51\xcf\x91\x1e\x75\x7e\x24\xb8\x0e\x65\x6c\
+\x33\xd2\x16\xc1\xcb\xcd\xf3\xb9\x1e\x98\xdc\xcb\x41\x95\x54\xa9\
+\xf5\x80\xfb\x88\xbf\x76\xe4\x94\xaf\xf7\x74\x44\x95\xb5\x49\x7d\
+\xfa\xe7\xcc\x23\xfd\xda\x72\xda\x6c\x85\x2d\x48\x03\xe8\xb2\xe0\
+\x3a\x24\xb5\xe7\xcb\xc0\x2b\xa2\x8b\xc8\xcc\xf1\xf8\xeb\x5f\x6d\
+\xd8\x97\xf8\x6e\x35\xb7\x2c\x06\x0e\xea\xe5\xa0\x4a\xaa\xc4\xb1\
+\xc4\x5f\x2f\x72\xcb\xf9\x3d\x1d\x51\x15\xe7\x12\xe2\x4f\xda\xdc\
+\xf2\x30\x3e\x1a\x28\xe5\xec\xc5\xa4\x1d\xee\xa2\xaf\x15\xb9\xe5\
+\x90\x5e\x0e\xaa\xca\xf3\x32\xe2\x4f\xda\x1c\x73\x29\xfd\xbb\xdd\
+\x22\xa9\x7f\xa6\x02\x37\x13\x7f\x8d\xc8\x2d\x97\xf7\x72\x50\x55\
+\xae\x9f\x12\x7f\xf2\xe6\x98\x7f\xea\xe5\xa0\x4a\x1a\x88\x33\x89\
+\xbf\x36\xe4\x98\xd7\xf6\x70\x4c\x55\xb0\xc3\x88\x3f\x79\x73\xcc\
+\x32\xe0\x98\x1e\x8e\xab\xa4\xfe\xfa\x33\xe2\xaf\x0b\x39\xe6\x16\
+\xdc\xcc\x4c\x3d\xb8\x9c\xf8\x93\x38\xc7\x3c\x81\x7b\x8b\x4b\x39\
+\xd8\x1f\x1f\x5d\x1e\x2f\xbf\xdf\xc3\x71\x95\x38\x9c\xf8\x93\x38\
+\xd7\xdc\x02\xac\xdb\xfd\xa1\x95\xd4\xa3\xcd\x80\x59\xc4\x5f\x0b\
+\x72\xcc\x9d\xb8\x5e\x49\x7d\x70\x05\xf1\x27\x73\xae\xb9\x00\x37\
+\x09\x92\x22\x4c\x05\xae\x25\xfe\x1a\x90\x6b\x7e\xaf\xfb\x43\x2b\
+\xad\x70\x24\xf1\x27\x73\xce\xf9\x72\xf7\x87\x56\x52\x17\x86\x49\
+\x2f\xb5\x89\x1e\xfb\xb9\xe6\x06\xbc\xf7\xaf\x3e\xba\x8a\xf8\x93\
+\x3a\xe7\x7c\xa0\xfb\x43\x2b\xa9\x43\x9f\x21\x7e\xcc\xe7\x9c\xd7\
+\x74\x7f\x68\xa5\xd5\xbd\x92\xf8\x93\x3a\xe7\x2c\x05\xde\xdc\xed\
+\xc1\x95\xd4\xb6\x13\x88\x1f\xef\x39\xe7\x8a\xee\x0f\xad\x34\xbe\
+\x73\x89\x3f\xb9\x73\xce\x3c\xd2\x36\xca\x92\x06\xe3\x48\xd2\xb6\
+\xdc\xd1\x63\x3d\xe7\xbc\xac\xeb\xa3\x2b\xb5\xb0\x13\xe9\x95\x92\
+\xd1\x27\x78\xce\x79\x14\xd8\xa5\xdb\x03\x2c\x69\x5c\x07\x00\x4f\
+\x13\x3f\xc6\x73\xce\xb9\x5d\x1f\x5d\xa9\x0d\x5f\x20\xfe\x24\xcf\
+\x3d\x0f\x02\xdb\x75\x7b\x80\x25\xad\x66\x0f\x60\x2e\xf1\x63\x3b\
+\xe7\x2c\x05\xf6\xea\xf6\x00\x4b\xed\xd8\x18\x5f\xb6\xd1\x4e\x66\
+\x01\x5b\x75\x79\x8c\x25\xad\xf0\x62\xd2\x6b\x6c\xa3\xc7\x74\xee\
+\x39\xa3\xdb\x03\x2c\x75\xe2\xa3\xc4\x9f\xec\x75\xc8\x5d\xc0\xa6\
+\x5d\x1e\x63\x49\x30\x13\xb8\x9f\xf8\xb1\x9c\x7b\x9e\xc6\x37\x95\
+\xaa\x22\x6b\xe1\xa0\x6c\x37\xb7\x02\x1b\x76\x75\x94\xa5\xb2\x6d\
+\x02\xfc\x8a\xf8\x31\x5c\x87\x7c\xb0\xcb\x63\x2c\x75\xe5\xed\xc4\
+\x9f\xf4\x46\x3d\x70\x57\x00\x00\x11\xb9\x49\x44\x41\x54\x75\xc9\
+\xb5\xc0\xf4\xee\x0e\xb3\x54\xa4\x19\xc0\xed\xc4\x8f\xdd\x3a\xe4\
+\x2e\x60\xcd\xee\x0e\xb3\xd4\x9d\x21\xe0\x67\xc4\x9f\xfc\x75\xc9\
+\x4d\xa4\xf5\x13\x92\x5a\xdb\x1a\xb8\x87\xf8\x31\x5b\x97\xbc\xa1\
+\xbb\xc3\x2c\xf5\x66\x3f\x60\x09\xf1\x03\xa0\x2e\xb9\x13\xd8\xb2\
+\xab\x23\x2d\x95\x61\x27\xe0\xb7\xc4\x8f\xd5\xba\xe4\xa2\xee\x0e\
+\xb3\xd4\x1f\x9f\x23\x7e\x10\xd4\x29\xf7\xe1\x6b\x84\xa5\xb1\xec\
+\x02\x3c\x44\xfc\x18\xad\x4b\x9e\x23\x35\x4c\x52\x98\xf5\x48\xcf\
+\xbd\x47\x0f\x86\x3a\xe5\x01\x1c\xb8\xd2\xca\xf6\xc7\xe7\xfc\x3b\
+\xcd\xe5\xf8\xc2\x1f\x65\xe0\xad\xc4\x0f\x86\xba\x65\x36\xb0\x4f\
+\x37\x07\x5b\x6a\x98\xc3\x71\x87\xbf\x6e\x73\x2a\x36\x01\xca\xc0\
+\x0f\x88\x1f\x0c\x75\xcb\x3c\xe0\x4d\xdd\x1c\x6c\xa9\x21\xde\x85\
+\xdb\x8b\xf7\x9a\xd3\xb0\x09\x50\xb0\xad\x80\x67\x88\x1f\x0c\x75\
+\xcb\x12\xe0\x23\x5d\x1c\x6f\xa9\xce\x86\x80\x93\x89\x1f\x7f\x4d\
+\xc9\xe9\xd8\x04\x28\xd8\x87\x88\x1f\x08\x75\xcd\xe9\xc0\xe4\xce\
+\x0f\xb9\x54\x3b\x53\x80\xaf\x13\x3f\xe6\x9a\x16\x9b\x00\x85\x9a\
+\x4c\x7a\xde\x3d\x7a\x20\xd4\x35\x17\x92\x16\x55\x4a\x4d\xb5\x11\
+\xe9\x7d\xf5\xd1\x63\xad\xa9\xb1\x09\x50\xa8\x97\xe2\xfb\xba\x7b\
+\xc9\xcd\xc0\xb6\x1d\x1f\x75\x29\x7f\x7b\x01\xbf\x21\x7e\x8c\x35\
+\x3d\x9f\xc3\x26\x40\x81\x4e\x26\x7e\x10\xd4\x39\x4f\x01\xc7\x74\
+\x7a\xd0\xa5\x8c\xbd\x13\x78\x96\xf8\xb1\x55\x4a\x9c\x09\x50\x98\
+\xc9\xc0\x75\xc4\x0f\x82\x3a\x67\x19\x70\x0a\x30\xa9\xc3\x63\x2f\
+\xe5\x64\x0a\xe9\x51\xb5\xe8\xf1\x54\x62\x6c\x02\x14\x66\x7b\x7c\
+\x2a\xa0\x1f\xf9\x29\xbe\x52\x58\xf5\x34\x13\x7f\x08\x44\xc7\x26\
+\x40\x61\xde\x4f\xfc\x00\x68\x42\x66\x91\x76\x4a\x93\xea\xe2\x0d\
+\xb8\xb3\x5f\x2e\xf9\x0f\x6c\x02\x14\x60\x08\x38\x9f\xf8\x01\xd0\
+\x84\x2c\x26\xdd\x12\x58\xa3\xa3\x4f\x40\xaa\xd6\x5a\xa4\xf3\x74\
+\x29\xf1\x63\xc6\xac\x88\x33\x01\x0a\xb1\x09\xf0\x3b\xe2\x07\x40\
+\x53\x72\x3d\xb0\x63\x47\x9f\x80\x54\x8d\xfd\x48\x6f\xbc\x8c\x1e\
+\x23\x66\xec\x7c\x19\x9b\x00\x05\x78\x33\xf1\x27\x7f\x93\x32\x1f\
+\x38\x11\x07\xb3\xf2\x30\x89\xb4\x9b\xe5\x22\xe2\xc7\x86\x69\x1d\
+\x9b\x00\x85\xf8\x2f\xe2\x4f\xfe\xa6\xe5\x5c\x5c\x20\xa8\x58\x3b\
+\x00\xd7\x10\x3f\x16\x4c\xfb\xf9\x3c\x36\x01\xaa\xd8\x3a\xc0\x2f\
+\x89\x3f\xf9\x9b\x96\x27\x48\xb3\x01\xc3\xed\x7f\x14\x52\xcf\x26\
+\x93\xce\x3b\x9f\xf4\xa9\x67\x9c\x09\x50\xe5\x76\x24\x6d\x72\x13\
+\x7d\xf2\x37\x31\x57\x02\xbb\xb6\xff\x51\x48\x5d\xdb\x17\xb8\x81\
+\xf8\x73\xde\xf4\x16\x9b\x00\x55\xee\x4d\xa4\x4d\x6e\xa2\x4f\xfe\
+\x26\xe6\x39\xd2\x0a\xec\xb5\xda\xfe\x34\xa4\xf6\x4d\x27\x6d\xea\
+\xe3\x0a\xff\xe6\xc4\x26\x40\x95\xfb\x37\xe2\x4f\xfc\x26\xe7\x6e\
+\xe0\x88\xb6\x3f\x0d\xa9\xb5\x21\xe0\x0f\x81\x47\x88\x3f\xb7\x4d\
+\xff\xf3\x05\x6c\x02\x54\xa1\xc9\xc0\xe5\xc4\x9f\xf8\x4d\xcf\xc5\
+\xc0\xee\x6d\x7e\x26\xd2\x58\x5e\x8a\x6f\xef\x2b\x21\xce\x04\xa8\
+\x52\x9b\x02\x0f\x11\x7f\xe2\x37\x3d\x8b\x49\x9b\x80\xf8\xb4\x80\
+\x3a\x31\x13\x38\x0b\x6f\xd7\x95\x94\x2f\xe3\x62\x62\x55\xe8\x65\
+\xa4\xfb\xd6\xd1\x27\x7e\x09\x79\x86\xf4\x96\xc6\xa9\xed\x7c\x30\
+\x2a\xd6\x06\xa4\x75\x24\x0b\x88\x3f\x67\x4d\xf5\xb1\x09\x50\xa5\
+\x3e\x4c\xfc\x49\x5f\x52\x66\x01\xef\x05\xd6\x6c\xe7\xc3\x51\x31\
+\xd6\x05\x3e\x0a\xcc\x21\xfe\x1c\x35\xb1\x71\x4d\x80\x2a\x33\x04\
+\x7c\x9d\xf8\x93\xbe\xb4\xcc\x22\xbd\xac\x69\xca\xc4\x1f\x91\x1a\
+\x6c\x3d\xe0\xef\xf0\x8b\xdf\xbc\x30\x5f\xc4\x26\x40\x15\x59\x13\
+\xb8\x94\xf8\x93\xbe\xc4\xcc\x26\x6d\xe3\xea\xad\x81\xb2\xac\x4b\
+\xfa\xdc\x7d\x63\x9f\x19\x2f\xde\x0e\x50\x65\x36\x22\x3d\xbe\x16\
+\x7d\xd2\x97\x9a\x87\x80\x0f\x91\x9e\xf5\x56\x73\x6d\x01\x7c\x12\
+\x78\x92\xf8\x73\xce\xe4\x1f\x67\x02\x54\x99\xed\x80\x47\x89\x3f\
+\xe9\x4b\xce\x02\xd2\xea\x6f\x77\x15\x6c\x96\x7d\x49\x9f\xab\x8b\
+\x6e\x4d\xa7\xf9\x4f\x9c\x09\x50\x45\x0e\x01\x16\x12\x7f\xd2\x97\
+\x9e\x65\xa4\x7d\x04\x8e\xc2\x5f\x00\x75\x35\x89\xf4\xf9\x5d\x4c\
+\xfc\xf9\x64\xea\x1d\x9b\x00\x55\xe6\xed\xf8\xfc\x71\x4e\xb9\x93\
+\x74\x7b\x60\xb3\x56\x1f\x9a\xb2\xb1\x03\xf0\x09\xe0\x41\xe2\xcf\
+\x1d\xd3\x9c\x7c\x09\x7f\x0c\xa8\x22\x1f\x27\xfe\x84\x37\x2f\xcc\
+\x52\xd2\xaf\xc9\xe3\x70\xd1\x60\x6e\xa6\x02\xc7\x92\x3e\x1f\x9b\
+\x67\x33\xa8\x38\x13\xa0\x4a\x0c\x01\x5f\x23\xfe\x84\x37\x63\x67\
+\x0e\xf0\x39\x60\x7f\xfc\x55\x10\x65\x32\xe9\x9d\x0f\x67\x01\xcf\
+\x12\x7f\x4e\x98\x32\xe2\x4c\x80\x2a\xb1\x06\x70\x1e\xf1\x27\xbc\
+\x69\x9d\xdf\x92\xb6\x1b\x3e\x8a\xf4\xa5\xa4\xc1\x99\x44\x5a\x27\
+\x73\x2a\xbe\x9c\xc7\xc4\xc5\x99\x00\x55\x62\x2a\xee\x11\x50\xa7\
+\x3c\x02\x9c\x06\xbc\x9a\xd4\xc0\xa9\x77\xeb\x00\x6f\x25\x6d\x98\
+\xf5\x14\xf1\x9f\xb1\x31\xcb\x49\xe3\xdc\x99\x80\x4c\x34\xf9\x83\
+\x58\x1b\xf8\x31\xe9\x97\x8f\xea\x63\x3e\x70\x0d\x70\xc9\x48\x6e\
+\x22\x5d\x38\xd4\xda\x30\xb0\x37\x69\x7a\xff\x08\xe0\x50\xdc\xb1\
+\x51\x79\x3a\x03\xf8\x53\xd2\xba\x13\x05\x6a\x72\x03\x00\xe9\x25\
+\x25\x97\x02\x7b\x45\x17\xa2\xae\x3d\xc4\x8a\x66\xe0\x4a\xd2\x76\
+\xc4\x4a\x63\x77\x67\xe0\xe5\xa4\x99\x93\xc3\x80\x0d\x43\x2b\x92\
+\xda\x77\x3a\x69\x5b\x71\x9b\xfb\x40\x4d\x6f\x00\x00\x36\x06\x2e\
+\x03\x76\x09\xae\x43\xfd\x31\x1b\xb8\x01\xb8\x71\x24\x57\x92\x76\
+\xa8\x6b\xba\xf5\x80\x3d\x80\x83\x49\xb3\x5a\x07\x91\x76\xc2\x94\
+\xea\xea\x2b\xa4\x97\x8c\x39\x13\x10\xa4\x84\x06\x00\xd2\x56\xa6\
+\x57\x02\xdb\x46\x17\xa2\xbe\x5b\x02\xfc\x12\xb8\x0d\xb8\x7d\xa5\
+\xdc\x4f\x3d\x7f\x5d\x4c\x26\x3d\x93\xbf\x1b\xa9\x69\xdd\x15\xd8\
+\x13\xd8\x91\x72\xc6\xab\xca\xe1\x4c\x40\xa0\x92\x2e\x28\xdb\x01\
+\x57\x90\x9a\x01\x35\xdf\xb3\xa4\xcd\x88\xee\x00\xee\x23\x3d\x75\
+\x30\x6b\xe4\xcf\xdf\x02\x8b\xe2\x4a\x63\x1d\x60\x6b\x60\x1b\x60\
+\xab\x91\x6c\x47\xfa\xc2\xdf\x09\x5f\xbb\xac\xb2\x7c\x19\x78\x1f\
+\x36\x01\x95\x2b\xa9\x01\x80\x74\xcf\xf4\x32\x60\xd3\xe0\x3a\x14\
+\xef\x11\xd2\xae\x77\x73\x80\xc7\xc7\xc9\x73\xa4\xe9\xc9\xa7\x46\
+\xfe\x9e\x45\xa4\x45\x8a\xa3\xa6\xb1\xe2\xa9\x85\x0d\x46\xfe\x9c\
+\x4a\xba\x17\x3f\x56\x36\x05\xb6\xc4\xa9\x7b\x69\x55\x36\x01\x01\
+\x4a\x6b\x00\x20\xfd\xc2\xba\x84\x74\x21\x96\x24\xe5\xc1\x35\x01\
+\x15\x2b\xb1\x01\x80\x34\xfd\xfa\x13\x60\xfb\xe8\x42\x24\x49\xcf\
+\xb3\x09\xa8\x50\xa9\xbb\x32\xcd\x22\x3d\x27\x7d\x7b\x74\x21\x92\
+\xa4\xe7\x9d\x40\xba\x1d\x50\xea\x77\x53\xa5\x4a\x9d\x01\x18\xb5\
+\x09\x70\x11\x69\x95\xb5\x24\x29\x0f\x5f\x05\xde\x83\x33\x01\x03\
+\x55\x7a\x97\xf5\x28\x69\x03\x95\xeb\xa3\x0b\x91\x24\x3d\xef\xdd\
+\xf8\xee\x80\x81\x9b\x14\x5d\x40\x06\x16\x02\xdf\x21\xdd\x12\xd8\
+\x2a\xb8\x16\x49\x52\xb2\x37\xb0\x39\xf0\x43\x7c\x3a\x60\x20\x6c\
+\x00\x92\x45\xc0\xff\x90\x36\x5b\xd9\x35\xb8\x16\x49\x52\xb2\x2f\
+\x30\x13\x38\x1f\x9b\x80\xbe\xb3\x01\x58\x61\x09\x70\x0e\xe9\x79\
+\xee\x03\x82\x6b\x91\x24\x25\x7b\x63\x13\x30\x10\x36\x00\x2f\xb4\
+\x1c\xf8\x11\x69\x6f\xf9\xd7\xe0\x22\x49\x49\xca\x81\x4d\xc0\x00\
+\xd8\x00\x8c\xed\x7a\xd2\xfe\xf2\x47\xe3\xfb\xe9\x25\x29\x07\x36\
+\x01\x7d\x66\x03\x30\xbe\x3b\x49\x9b\x05\xbd\x89\xb4\x77\xbb\x24\
+\x29\x96\x4d\x40\x1f\xd9\x00\xb4\xf6\x20\x70\x1e\xf0\x7a\x56\xec\
+\xf5\x2e\x49\x8a\xb3\x37\xe9\xa5\x6e\x3e\x1d\xd0\x23\x1b\x80\x89\
+\xcd\x01\xfe\x1b\xd8\x07\xb7\x0e\x96\xa4\x1c\xec\x83\x33\x01\x3d\
+\xb3\x01\x68\xcf\x02\xd2\x63\x82\x53\x80\x43\x82\x6b\x91\x24\x79\
+\x3b\xa0\x67\x36\x00\xed\x5b\x4e\x7a\x8b\xe0\x5d\xa4\x5b\x02\x2e\
+\x0e\x94\xa4\x58\x36\x01\x3d\xb0\x01\xe8\xdc\x2f\x81\x0b\x80\xd7\
+\x02\xd3\x83\x6b\x91\xa4\xd2\xd9\x04\x74\xc9\x06\xa0\x3b\xb3\x49\
+\xeb\x02\xf6\x05\xb6\x0b\xae\x45\x92\x4a\xb7\x37\x69\x2b\xf7\xf3\
+\xb0\x09\x68\x9b\x0d\x40\xf7\x46\xd7\x05\x4c\x03\x0e\xc4\x4d\x83\
+\x24\x29\xd2\xde\xc0\x96\x38\x13\xd0\x36\x1b\x80\xde\x2c\x23\xbd\
+\x4e\xf8\x6a\xd2\xce\x81\xd3\x62\xcb\x91\xa4\xa2\xed\x83\x33\x01\
+\x6d\xb3\x01\xe8\x8f\x7b\x49\xb7\x04\x76\x07\x76\x08\xae\x45\x92\
+\x4a\xe6\xed\x80\x36\xd9\x00\xf4\xcf\xb3\xc0\xd7\x81\x27\x80\xc3\
+\xf1\xd8\x4a\x52\x14\x9b\x80\x36\xf8\x25\xd5\x7f\xd7\x93\x6e\x0b\
+\x1c\x8e\xbb\x07\x4a\x52\x14\x9b\x80\x09\xd8\x00\x0c\xc6\x43\xa4\
+\x5b\x02\x3b\x00\x2f\x09\xae\x45\x92\x4a\xe5\x23\x82\x2d\xd8\x00\
+\x0c\xce\x02\xe0\xdb\xc0\x1d\xc0\x61\xc0\xda\xb1\xe5\x48\x52\x91\
+\x9c\x09\x18\x87\x0d\xc0\xe0\xdd\x01\x9c\x45\x7a\x8f\x80\xb3\x01\
+\x92\x54\x3d\x9b\x80\x31\xd8\x00\x54\xe3\x59\xe0\x5b\xa4\x66\xe0\
+\x55\x38\x1b\x20\x49\x55\xdb\x1b\xd8\x1a\x9b\x80\xe7\xd9\x00\x54\
+\xeb\x0e\xe0\x6b\xa4\xb5\x01\x3b\x07\xd7\x22\x49\xa5\xd9\x0b\x9b\
+\x80\xe7\xd9\x00\x54\x6f\x74\x36\xe0\x3e\xd2\x9b\x05\xd7\x89\x2d\
+\x47\x92\x8a\xb2\x17\xde\x0e\x00\x6c\x00\x22\xdd\x0a\xfc\x27\xe9\
+\x76\xc0\x7e\xc0\x70\x6c\x39\x92\x54\x0c\x6f\x07\x60\x03\x10\x6d\
+\x21\x70\x21\xf0\x63\xd2\x8b\x85\x66\xc4\x96\x23\x35\xca\x33\xc0\
+\x4f\x71\x77\x4e\x8d\xad\xf8\xdb\x01\x36\x00\x79\x78\x88\x34\x1b\
+\xf0\x30\xf0\x72\x60\xad\xd8\x72\xa4\x5a\x5b\x0e\x7c\x17\x78\x13\
+\xf0\x45\x60\x2a\xe9\x76\x9b\xb4\xaa\xbd\x80\x9d\x80\xff\xa5\xc0\
+\x26\xc0\x06\x20\x1f\xcb\x81\x1b\x49\x8b\x04\x37\x27\xbd\x57\x40\
+\x52\x67\xae\x07\xde\x0a\x7c\x16\x78\x7a\xe4\xbf\xfb\x09\x30\x9d\
+\xf4\xd6\x4e\x69\x55\xbb\xe1\x9a\x00\x65\xe6\x00\xe0\x0a\xd2\x09\
+\x69\x8c\x69\x9d\x87\x81\xf7\xd2\x7a\x2d\xcd\x29\x19\xd4\x69\xf2\
+\xcd\x37\x28\xec\x47\x71\x51\xff\xb2\x35\xf3\x10\x70\x26\xe9\xd1\
+\xc1\x7d\xf1\xbd\x02\xd2\x58\x16\x02\x9f\x01\x7e\x1f\xb8\x96\x74\
+\x21\x1f\x8f\x33\x01\x6a\x65\x37\xd2\x9a\x80\x73\x69\x7d\x1e\x49\
+\x95\x5a\x83\xf4\xeb\xe6\x51\xe2\xbb\x64\x63\x72\xc8\x52\xd2\x56\
+\xdb\xdb\xd1\x39\x67\x02\x4c\xab\x14\x33\x13\x50\xc4\xbf\x64\x03\
+\x2c\x23\xad\x0f\x38\x63\xe4\x3f\xef\x07\x4c\x8e\x2b\x47\x0a\xb3\
+\x1c\xf8\x21\x70\x2c\xf0\x05\xd2\xeb\xb7\x3b\x75\x09\x2e\x0c\xd4\
+\xf8\x76\x03\x76\xa4\xd0\x85\x81\xca\xdf\xd6\xc0\x97\x81\x45\xc4\
+\x77\xcb\xc6\x54\x95\x0b\x48\xcf\x6f\xf7\xc3\x10\x69\xa1\x60\xf4\
+\xbf\x93\xc9\x37\x67\xe2\xfe\x2c\xca\xd8\xd6\xc0\xe9\xd8\x08\x98\
+\x66\xe7\x4a\xe0\x50\xfa\xcf\x26\xc0\x4c\x94\x33\xb1\x09\x50\xe6\
+\xb6\x02\x4e\x25\xbd\x82\x38\x7a\xc0\x18\xd3\xaf\x5c\x05\x1c\xc5\
+\xe0\xb9\x26\xc0\xb4\xca\x37\xf0\x96\xab\x6a\x60\x6b\xe0\x34\x9c\
+\x11\x30\xf5\xcd\x52\xe0\x3b\xc0\x3e\x54\xc7\x99\x00\x33\x51\xbe\
+\x86\x6b\xe6\x54\x13\x9b\x02\x27\x03\x73\x88\x1f\x38\xc6\xb4\x93\
+\xe7\x80\xb3\x80\x97\x10\xc7\x99\x00\xd3\x2a\xce\x04\xa8\x56\xd6\
+\x01\xfe\x1c\xb8\x87\xf8\xc1\x63\xcc\x58\x79\x12\xf8\x37\x60\x26\
+\xf1\x9c\x09\x30\x13\xc5\x99\x00\xd5\xce\x30\xe9\x5e\xea\xc5\xc4\
+\x0f\x20\x63\x96\x03\x77\x01\x27\x02\xd3\xc8\x8f\x33\x01\xa6\x55\
+\xbe\x89\x33\x01\xaa\xa9\x97\x92\xba\xd8\xf9\xc4\x0f\x24\x53\x56\
+\x96\x00\xdf\x07\x5e\x45\xfa\xb5\x9d\x2b\x67\x02\xcc\x44\x39\x0b\
+\x67\x02\x54\x63\xd3\x81\xbf\x04\x7e\x41\xfc\x60\x32\xcd\xce\x63\
+\xc0\xa7\x48\x4f\xab\xd4\x85\x4d\x80\x99\x28\x36\x01\x6a\x84\x7d\
+\x49\xfb\x09\x3c\x43\xfc\xa0\x32\xcd\xc8\x12\xd2\x2d\xa7\x63\x81\
+\x35\xa9\x2f\x6f\x07\x98\x56\xf1\x76\x80\x1a\x63\x7d\xe0\xcf\x80\
+\xeb\x88\x1f\x58\xa6\x9e\xb9\x15\xf8\x6b\xd2\x93\x28\x4d\xe0\x4c\
+\x80\x99\x28\xce\x04\xa8\x71\xb6\x07\xfe\x0e\xb8\x9d\xf8\x01\x66\
+\xf2\xce\xa3\xa4\x8d\xa8\xfa\xb5\x4d\x6f\x6e\x6c\x02\xcc\x44\xb1\
+\x09\x50\x63\xed\x4a\xda\x57\xe0\xd7\xc4\x0f\x34\x93\x47\xe6\x90\
+\x2e\x7a\x47\x91\xde\x56\x59\x02\x6f\x07\x98\x56\xf1\x76\x80\x1a\
+\x6d\x88\xf4\x06\xb5\x7f\x07\x7e\x43\xfc\x80\x33\xd5\xe6\x61\xe0\
+\xf3\xc0\x2b\x29\xf3\xd7\x8e\x33\x01\x66\xa2\x9c\x4d\x99\x63\x43\
+\x05\xda\x0d\xf8\x18\x70\x2d\x69\x0b\xd7\xe8\xc1\x67\xfa\x9f\x5f\
+\x91\x36\xea\x39\x14\x5f\x8a\x02\x36\x01\x66\xe2\xd8\x04\xa8\x38\
+\x9b\x02\x27\x90\xde\xa1\x3d\x8f\xf8\x41\x68\xba\xcb\x3c\xe0\x07\
+\xc0\xfb\x81\x6d\xd1\x58\x6c\x02\xcc\x44\xa9\x45\x13\x90\xf3\x66\
+\x1c\xaa\xaf\x35\x80\x03\x48\x1b\xbe\xbc\x0a\x38\x10\x98\x12\x5a\
+\x91\xc6\xb3\x9c\xb4\xd0\xf3\xc2\x91\x5c\x45\x7a\x99\x94\x5a\x1b\
+\x22\xdd\x0a\x3b\x31\xba\x10\x65\xeb\xbf\x81\xe3\x49\xb3\xa3\x59\
+\xb2\x01\x50\x15\xa6\x02\x07\x93\xd6\x0f\x1c\x0c\xbc\x82\x72\x16\
+\x8e\xe5\x66\x29\x69\x1b\xde\xab\x80\x4b\x80\x9f\x92\x16\xf4\xa9\
+\x3b\xa7\x00\x1f\x89\x2e\x42\xd9\xfa\x36\xf0\x76\xd2\xbe\x18\xd9\
+\xb1\x01\x50\x84\x75\x81\xfd\x48\xb3\x04\x07\x02\xfb\x03\x33\x42\
+\x2b\x6a\xae\x79\xc0\x4d\xc0\x15\xc0\x95\xc0\x35\x23\xff\x9d\xfa\
+\xc3\x99\x00\x4d\xe4\xeb\xc0\x1f\x93\xe1\x4c\x80\x0d\x80\x72\xb1\
+\x15\xa9\x19\x38\x80\xd4\x10\xec\x4e\xda\x98\x48\xed\x7b\x0a\xb8\
+\x99\xf4\x85\x3f\x9a\xbb\x80\x65\x91\x45\x15\xc0\x26\x40\x13\xc9\
+\xb2\x09\xb0\x01\x50\xce\xb6\x22\x3d\x69\xb0\x72\x76\xc1\xf5\x04\
+\x8b\x80\xbb\x49\x5f\xee\x77\x91\x76\xdf\xbb\x09\xb8\x97\x74\x4f\
+\x5f\xd5\xb3\x09\xd0\x44\xb2\x6b\x02\x6c\x00\x54\x37\x93\x49\xbb\
+\x14\xee\x08\x6c\xb7\x52\xb6\x1d\xf9\x73\x6a\x5c\x69\x7d\xb5\x08\
+\x78\x10\x78\x80\x15\x5f\xf6\x77\x8e\xfc\x39\x8b\x8c\x2e\x22\x7a\
+\x9e\x4d\x80\x26\x92\x55\x13\x60\x03\xa0\xa6\x99\x41\x6a\x06\xb6\
+\x06\x36\x21\x3d\x9e\x38\x03\xd8\x78\xe4\xaf\x37\x1b\xf9\xef\xa3\
+\x5e\x50\x33\x1f\x98\x0b\x3c\x3e\xf2\xe7\x6c\xe0\x21\xd2\x97\xfd\
+\x6f\x47\xfe\x7c\x70\xe4\xbf\x57\xfd\xd8\x04\x68\x22\xff\x03\x1c\
+\x47\x06\x4d\x80\x0d\x80\x4a\xb5\x3e\xb0\x01\xb0\xce\x48\xd6\x1b\
+\xc9\xe8\x7f\x1e\x5d\x7f\x30\x8d\x89\x9f\x58\x98\x4f\xfa\xc5\xbe\
+\x10\x58\x00\x2c\x26\x2d\xb4\x5b\xca\x0b\xbf\xec\x1f\x1f\xf9\xdf\
+\xa8\xd9\x6c\x02\x34\x91\x6c\x9a\x00\x49\x52\xff\xf9\xee\x00\xd3\
+\x2a\xdf\x22\xf8\xdd\x01\xd9\xef\x54\x24\x49\x35\x75\x09\x69\x4d\
+\xca\x21\xd1\x85\x28\x4b\xbb\x02\x3b\x93\x76\x4f\x0d\x79\x52\xc7\
+\x06\x40\x92\x06\xc7\x26\x40\xad\x84\x36\x01\x36\x00\x92\x34\x58\
+\x36\x01\x6a\x25\xac\x09\xb0\x01\x90\xa4\xc1\xb3\x09\x50\x2b\xbb\
+\x02\x2f\x01\xce\xa1\xc2\x26\xc0\x06\x40\x92\xaa\x61\x13\xa0\x56\
+\x2a\x6f\x02\x6c\x00\x24\xa9\x3a\x36\x01\x6a\xa5\xd2\x26\xc0\x06\
+\x40\x92\xaa\x65\x13\xa0\x56\x2a\x6b\x02\x6c\x00\x24\xa9\x7a\x36\
+\x01\x6a\xa5\x92\x26\xc0\x06\x40\x92\x62\xd8\x04\xa8\x95\x81\x37\
+\x01\x36\x00\x92\x14\xc7\x26\x40\xad\x0c\xb4\x09\xb0\x01\x90\xa4\
+\x58\x36\x01\x6a\x65\x60\x4d\x80\x0d\x80\x24\xc5\xb3\x09\x50\x2b\
+\x03\x69\x02\x6c\x00\x24\x29\x0f\x36\x01\x6a\x65\x57\x60\x17\xfa\
+\xd8\x04\xd8\x00\x48\x52\x3e\x6c\x02\xd4\xca\x2e\xf4\xb1\x09\xb0\
+\x01\x90\xa4\xbc\xd8\x04\xa8\x95\xbe\x35\x01\x36\x00\x92\x94\x1f\
+\x9b\x00\xb5\xd2\x97\x26\xc0\x06\x40\x92\xf2\x64\x13\xa0\x56\x7a\
+\x6e\x02\x6c\x00\x24\x29\x5f\x3f\x01\xa6\x03\x07\x46\x17\xa2\x2c\
+\xed\x02\xec\x44\x6a\x02\x96\x77\xfa\x37\xdb\x00\x48\x52\xde\x2e\
+\xc4\x99\x00\x8d\x6f\x37\x60\x06\x70\x5e\xa7\x7f\xa3\x0d\x80\x24\
+\xe5\xcf\xdb\x01\x6a\x65\x5f\x60\x18\xb8\xac\x93\xbf\xc9\x06\x40\
+\x92\xea\xc1\x26\x40\xad\xbc\x02\x78\x02\xb8\xbe\xdd\xbf\xc1\x06\
+\x40\x92\xea\xc3\x35\x01\x6a\xe5\x35\xc0\x0d\xc0\x3d\xd1\x85\x48\
+\x92\x06\xe3\x14\xd2\xa2\x2f\x63\x56\xcd\x5c\x60\x2b\xda\xe0\x0c\
+\x80\x24\xd5\x8f\xb7\x03\x34\x9e\xa9\xa4\x35\x01\x67\x93\x1a\x82\
+\x71\xd9\x00\x48\x52\x3d\xd9\x04\x68\x3c\x5b\x03\x4b\x80\x2b\x5a\
+\xfd\x8f\x6c\x00\x24\xa9\xbe\x5c\x13\xa0\xf1\xbc\x1c\xb8\x00\x78\
+\x78\xbc\xff\x81\x0d\x80\x24\xd5\x9b\xfb\x04\x68\x2c\xc3\xc0\x3e\
+\xc0\x57\x18\xe7\x56\x80\x0d\x80\x24\xd5\x9f\xb7\x03\x34\x96\xcd\
+\x81\xfb\x81\x5b\x82\xeb\x90\x24\x0d\x98\x4f\x07\x98\x55\xf3\x3b\
+\xd2\x6d\xa2\xd5\x38\x03\x20\x49\xcd\xe1\x9a\x00\xad\x6a\x1d\xd2\
+\xed\x80\x4b\xa2\x0b\x91\x24\x0d\x9e\x33\x01\x66\xe5\x3c\xcd\x18\
+\xb3\x00\xce\x00\x48\x52\xf3\xb8\x26\x40\x2b\x9b\x42\x6a\x02\xae\
+\x8a\x2e\x44\x92\x54\x0d\x67\x02\xcc\x68\x66\x93\x9a\xc2\xe7\x39\
+\x03\x20\x49\xcd\xe5\x9a\x00\x8d\x9a\x46\x7a\x22\xe0\xa6\xd1\xff\
+\xc2\x06\x40\x92\x9a\xcd\x7d\x02\x34\x6a\x23\xe0\xab\xa3\xff\xc1\
+\x06\x40\x92\x9a\xcf\x35\x01\x02\x98\x09\x7c\x0d\x78\x12\x6c\x00\
+\x24\xa9\x14\x36\x01\x1a\x02\x1e\x01\xae\x06\x1b\x00\x49\x2a\x89\
+\x4d\x80\x36\x06\x4e\x8f\x2e\x42\x92\x54\xbd\x21\xe0\xb3\xc4\xaf\
+\x4a\x37\x71\x99\x09\xce\x00\x48\x52\x89\x5c\x18\x58\xb6\x1b\x81\
+\xdb\x6c\x00\x24\xa9\x4c\xde\x0e\x28\xd7\x1c\xe0\x7c\x1b\x00\x49\
+\x2a\x97\x4d\x40\x99\xa6\x01\x9f\x1f\x8a\xae\x42\x92\x14\x6a\x08\
+\xf8\x77\xe0\xc4\xe8\x42\x54\x99\xe5\xc0\x66\xce\x00\x48\x92\x5c\
+\x13\x50\x96\x21\xbc\x05\x20\x49\x1a\xe1\xed\x80\xb2\x5c\x6d\x03\
+\x20\x49\x1a\x65\x13\x50\x8e\x3b\x6d\x00\x24\x49\x2b\xb3\x09\x28\
+\xc3\xa3\x36\x00\x92\xa4\x55\xf9\x16\xc1\xe6\x9b\x67\x03\x20\x49\
+\x1a\x8b\x0b\x03\x9b\xed\x69\x1b\x00\x49\xd2\x78\xbc\x1d\xd0\x5c\
+\x0b\x6d\x00\x24\x49\xad\xd8\x04\x34\xd3\x72\x1b\x00\x49\xd2\x44\
+\x5c\x13\xd0\x3c\x93\x6d\x00\x24\x49\xed\x70\x4d\x40\xb3\x2c\xb2\
+\x01\x90\x24\xb5\xcb\xdb\x01\xcd\xf1\xa4\x0d\x80\x24\xa9\x13\x36\
+\x01\xcd\xf0\x3b\x1b\x00\x49\x52\xa7\x6c\x02\xea\xef\x01\x1b\x00\
+\x49\x52\x37\x5c\x18\x58\x6f\x77\xd9\x00\x48\x92\xba\xe5\xc2\xc0\
+\xfa\xba\xd4\x06\x40\x92\xd4\x0b\x6f\x07\xd4\xd3\x77\x6c\x00\x24\
+\x49\xbd\xb2\x09\xa8\x9f\xd3\x6c\x00\x24\x49\xfd\x60\x13\x50\x2f\
+\x9f\x8c\x2e\x40\x92\xd4\x2c\xa7\x00\xcb\x4d\xd6\x59\x00\xac\x35\
+\xde\x07\x28\x49\x52\xb7\x6c\x02\xf2\xce\xa5\x00\xde\x02\x90\x24\
+\xf5\x9b\xb7\x03\xf2\x76\x16\x70\x59\x74\x11\x92\xa4\xe6\x72\x26\
+\x20\xcf\xbc\xaa\xd5\x87\x26\x49\x52\xaf\x86\x80\xcf\x12\xff\x85\
+\x67\x56\x64\x3e\xb0\x76\xab\x0f\x4d\x92\xa4\x7e\x71\x26\x20\x9f\
+\x7c\x7b\x82\xcf\x4a\x92\xa4\xbe\xb2\x09\xc8\x23\xc7\x4c\xf4\x41\
+\x49\x92\xd4\x6f\x36\x01\xb1\x79\x8a\xb4\x38\x53\x92\xa4\x4a\xb9\
+\x26\x20\x36\x67\x4e\xf8\x09\x49\x92\x34\x40\xce\x04\xc4\xc4\x37\
+\x37\x4a\x92\xc2\xd9\x04\x54\x9b\x4b\x57\xfd\x00\xdc\x08\x48\x92\
+\x14\xc1\xcd\x82\xaa\xf5\x7e\xe0\x37\xd1\x45\x48\x92\x34\xca\x99\
+\x80\xc1\xe7\x56\xd2\xfa\x0b\x49\x92\xb2\xe1\xc2\xc0\xc1\xe7\xcd\
+\x6d\x7f\x1a\x92\x24\x55\xcc\x99\x80\xc1\xe4\xe2\xf1\x0e\xb8\x6b\
+\x00\x24\x49\x39\x70\x4d\x40\xff\x2d\x06\x8e\x06\xe6\x44\x17\x22\
+\x49\xd2\x44\x9c\x09\xe8\x5f\x3e\xdd\xe1\xb1\x97\x24\x29\x8c\x6b\
+\x02\xfa\x93\x7b\x81\xf5\x5a\x1d\x68\x6f\x01\x48\x92\x72\x73\x21\
+\xde\x0e\xe8\xc5\x12\xe0\x28\x7c\xec\x4f\x92\x54\x53\xde\x0e\xe8\
+\x2e\x7f\xd3\xcd\xc1\x96\x24\x29\x27\x36\x01\x9d\xe5\x42\x60\xb8\
+\xab\x23\x2d\x49\x52\x46\x5c\x13\xd0\x7e\xee\x01\x36\xee\xee\x30\
+\x4b\x92\x94\x27\x67\x02\x5a\xe7\x51\xe0\xc5\x5d\x1f\x5d\x49\x92\
+\x32\x66\x13\x30\x76\x9e\x06\xf6\xe9\xe1\xb8\x4a\x92\x94\x35\x6f\
+\x07\xac\x9e\x45\xc0\x11\xbd\x1c\x54\x49\x92\xea\xe2\x23\xc4\x7f\
+\xf1\xe6\x90\x67\x80\xd7\xf6\x78\x2c\x25\x49\xaa\x95\xe3\x49\x5b\
+\xdd\x46\x7f\x09\x47\x65\x36\x4e\xfb\x4b\x92\x0a\x75\x34\x30\x9f\
+\xf8\x2f\xe3\xaa\xf3\x1b\x5c\xf0\x27\x49\x2a\xdc\xfe\xa4\x6d\x6f\
+\xa3\xbf\x94\xab\xca\x0f\x81\x17\xf5\xe5\xc8\x49\x92\x54\x73\xeb\
+\x01\xff\x43\xfc\x97\xf3\x20\xb3\x18\x38\x19\x37\xf9\x91\x24\x69\
+\x35\xc7\x01\xf3\x88\xff\xb2\xee\x77\xee\x03\x0e\xea\xe3\x71\x92\
+\x24\xa9\x71\xb6\x07\xbe\x4d\xfc\x97\x76\x3f\xf2\x1c\x70\x2a\xb0\
+\x6e\x5f\x8f\x90\x24\x49\x0d\x76\x04\x70\x07\xf1\x5f\xe2\xdd\xe6\
+\x62\xe0\x25\x7d\x3f\x2a\x92\x24\x15\x60\x0a\xf0\x21\xe0\x61\xe2\
+\xbf\xd0\xdb\xcd\xf5\xc0\xeb\x07\x71\x30\x24\x49\x2a\xcd\x9a\xa4\
+\xf5\x01\x39\xcf\x08\x5c\x05\x1c\x35\xa8\x03\x20\x49\x52\xc9\x86\
+\x81\x63\x80\x1f\x90\xb6\xd0\x8d\xfe\xd2\x7f\x0c\xf8\x12\xb0\xe7\
+\x20\xff\xa5\x25\x49\xd2\x0a\x1b\x00\x27\x00\x97\x00\x4b\xa8\xee\
+\x4b\xff\x29\xe0\x2c\xe0\x75\xc0\x1a\x03\xff\xb7\x6c\x61\x28\xf2\
+\xff\xb9\x24\x49\x19\x98\x06\x1c\x08\x1c\x02\x1c\x0c\x1c\x4a\x5a\
+\x3f\xd0\x0f\xf3\x80\xeb\x80\xab\x49\xd3\xfc\x57\x92\x66\x1f\xc2\
+\xd9\x00\x48\x92\xf4\x42\x53\x81\x1d\x49\xdb\xed\xee\x30\xf2\xe7\
+\x4c\x60\x3a\xb0\xf6\x48\xa6\x93\x66\x0e\x9e\x21\xbd\x8e\xf7\x59\
+\xd2\xaf\xfb\x7b\x81\xbb\x81\x7b\x46\x72\x3f\xb0\xb4\xd2\xea\xdb\
+\xf4\xff\x01\x05\xd4\x5e\x40\xfd\xdf\x34\x75\x00\x00\x00\x00\x49\
+\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\xd1\x53\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x02\x00\x00\x00\x02\x00\x08\x06\x00\x00\x00\xf4\x78\xd4\xfa\
+\x00\x00\x00\x04\x73\x42\x49\x54\x08\x08\x08\x08\x7c\x08\x64\x88\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
+\x01\x95\x2b\x0e\x1b\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\
+\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\
+\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x20\x00\x49\x44\
+\x41\x54\x78\x9c\xec\xdd\x77\x78\x54\xd5\xd6\xc0\xe1\xdf\x99\x9e\
+\x49\xef\x8d\x24\xa4\x93\xd0\x09\x3d\x28\x88\x28\x2a\x62\x05\x04\
+\x11\x04\x01\xf5\x7a\x6d\x78\xbd\xf6\x6b\xc7\x86\xbd\x0b\x96\x0f\
+\xb1\x63\xbb\x22\x02\x2a\xa8\x08\x08\x48\x47\x7a\x0b\x01\x92\x90\
+\xde\xdb\x64\x66\xbe\x3f\x4e\xb8\x36\x4a\x32\xe7\x4c\xcd\x7e\x9f\
+\x27\x4f\x14\xc9\x3a\x0b\x4c\xe6\xac\xd9\x67\xef\xb5\x24\x04\x41\
+\xf0\x74\x7a\x20\xb2\xf5\x23\x16\x08\x01\x82\x5b\x3f\xff\xf1\x9f\
+\x03\x01\x13\x10\xd0\xfa\x35\x21\x80\xb6\xf5\xbf\x1f\xa7\x01\x82\
+\x00\xe9\x2f\xd7\xb0\x03\xd5\x80\xed\x0f\xbf\x56\x05\xb4\xb4\x7e\
+\xb6\x00\xb5\x40\x63\xeb\xef\xab\x6a\xfd\xa8\xfc\xcb\x47\x11\x50\
+\xd2\xfa\x61\x51\xf8\xe7\x16\x04\xc1\x89\xfe\xfa\x22\x20\x08\x82\
+\xeb\x48\xc8\x37\xf4\x04\x20\xae\xf5\x73\x27\x20\xbe\xf5\x9f\x23\
+\x81\x28\x20\xcc\x5d\x09\x2a\x54\x0e\x14\x23\x17\x03\xf9\xc0\xd1\
+\xd6\x8f\xc3\xad\x9f\x8f\x00\x05\x6e\xcb\x4e\x10\x3a\x38\x51\x00\
+\x08\x82\x73\x69\x81\x64\x20\x13\x48\x01\x52\x5b\x3f\x52\x5a\x3f\
+\x4c\xee\x4b\xcd\x23\x34\x02\x07\x80\xfd\xad\x1f\xc7\xff\x79\x0f\
+\x70\x10\xb0\xba\x2f\x35\x41\xf0\x6d\xa2\x00\x10\x04\x75\xe8\x80\
+\x2e\x40\x57\x20\xab\xf5\xa3\x0b\xf2\x8d\xdf\xe8\xc6\xbc\xbc\x59\
+\x13\xb0\x0b\xd8\x0d\xec\x00\x76\x02\xdb\x5b\xff\xbd\xc5\x8d\x79\
+\x09\x82\x4f\x10\x05\x80\x20\xb4\x5f\x10\xd0\x0b\xe8\xd9\xfa\xd1\
+\x0b\xe8\x86\xb8\xd1\xbb\x4a\x23\x72\x21\xb0\x19\xd8\xf2\x87\xcf\
+\xd5\xee\x4c\x4a\x10\xbc\x8d\x28\x00\x04\xe1\xd4\x74\xc8\xef\xe2\
+\x73\x80\x5c\x60\x08\xf2\x3b\x7b\x8d\x3b\x93\x12\x4e\xa8\x10\x58\
+\x09\xac\x02\x36\x00\xeb\x91\x8b\x05\x41\x10\x4e\x40\x14\x00\x82\
+\xf0\x67\x91\xc8\x37\xfa\x33\x81\xc1\x40\x6f\xc0\xe0\xd6\x8c\x04\
+\x47\x35\x01\x9b\x80\xd5\xc0\x0a\xe4\xc2\xa0\xd4\xad\x19\x09\x82\
+\x07\x11\x05\x80\xd0\xd1\xc5\x03\x67\x03\x67\x20\xdf\xf8\xb3\xdc\
+\x9b\x8e\xe0\x44\x76\xe4\x3d\x05\x2b\x81\x9f\x81\x65\x88\x53\x08\
+\x42\x07\x26\x0a\x00\xa1\xa3\x09\x00\x06\x02\x23\x5a\x3f\xfa\x20\
+\x7e\x0e\x3a\xb2\x03\xc0\xf7\xad\x1f\xcb\x90\x8f\x2e\x0a\x42\x87\
+\x20\x5e\xf8\x04\x5f\xa7\x01\xfa\x01\x17\x00\xe7\x23\xdf\xf0\xb5\
+\x6e\xcd\x48\xf0\x54\x56\xe4\xbd\x03\x8b\x81\x6f\x90\xf7\x10\xd8\
+\x4e\xf9\x15\x82\xe0\xc5\x44\x01\x20\xf8\xa2\x30\xe4\x65\xfd\x11\
+\xc0\x85\xc8\x4d\x76\x04\xa1\xbd\x4a\x81\x1f\x80\xaf\x81\x85\x40\
+\x85\x7b\xd3\x11\x04\x75\x89\x02\x40\xf0\x15\x09\xc8\xef\xf0\x47\
+\x03\x23\x91\x5b\xe1\x0a\x82\x5a\xac\xc0\x1a\x60\x01\xf0\x19\x72\
+\x17\x43\x41\xf0\x6a\xa2\x00\x10\xbc\x59\x16\x70\x69\xeb\x47\x0e\
+\xe2\xfb\x59\x70\x0d\x3b\xf2\xe3\x81\x2f\x5a\x3f\x76\xb9\x37\x1d\
+\x41\x70\x8c\x78\xc1\x14\xbc\x4d\x22\xf2\x0d\x7f\x2c\xf2\xae\x7d\
+\x41\x70\xb7\x1d\xc8\x2b\x03\xef\x03\x7b\xdd\x9c\x8b\x20\xb4\x99\
+\x28\x00\x04\x6f\x10\x0f\x8c\x03\xc6\x03\xfd\xdd\x9c\x8b\x20\x9c\
+\x8c\x1d\x58\x0b\x7c\x0c\x7c\x82\x38\x62\x28\x78\x38\x51\x00\x08\
+\x9e\xca\x0f\xb8\x0c\x98\x8c\xbc\xa1\xaf\x43\xef\xdc\xf7\x33\x6a\
+\x88\x0a\xd7\x13\x1b\x61\x20\x32\x54\x4f\x48\x90\x8e\x90\x40\x2d\
+\x21\x81\xba\xd6\x0f\x2d\x41\x01\xf2\x67\x83\x5e\x83\xbf\x9f\x06\
+\xb3\x49\xcb\xeb\x0b\x0a\x79\xf1\xfd\x42\x87\xae\x99\x3b\x26\x89\
+\x81\x17\x27\x60\x69\xb4\xd2\xdc\x68\xa5\xc5\x62\xa3\xb1\xb6\x85\
+\xc6\xba\x16\x1a\x6b\x2d\x34\xd4\xfe\xfe\xb9\xa1\xd6\x42\x5d\xa5\
+\x85\xea\xd2\x46\xea\x2a\x2d\x58\x9a\x3a\xfc\x0c\x1f\x2b\xf0\x1d\
+\xf0\x2e\xf0\x25\xd0\xe0\xde\x74\x04\xe1\xef\x74\xee\x4e\x40\x10\
+\xfe\x40\x42\x6e\xb5\x7b\x35\xf2\x12\x7f\x90\x7b\xd3\x71\x8d\xa8\
+\x30\x3d\x89\xb1\x46\x3a\x45\x1b\x49\x8c\x35\x90\x10\x6d\xa4\x53\
+\x8c\x91\x84\x68\x03\x91\x61\x7a\xe2\x22\x0d\x04\x98\x1d\xab\x7f\
+\x42\x83\x1c\xff\x11\xf7\x0b\xd4\x11\x95\xe4\xef\xd0\xd7\x36\xd5\
+\xb7\x50\x53\xd6\x44\x6d\xa5\x85\xaa\xe2\x06\xaa\x4a\x9a\xa8\x2c\
+\x6e\xa4\xa2\xa8\x81\xaa\x92\x46\xaa\x8a\x1b\xa9\xad\x68\x76\x38\
+\x37\x2f\xa0\x05\xce\x6b\xfd\xa8\x42\x7e\x44\x30\x0f\xb9\x1b\xa1\
+\xdd\x8d\x79\x09\xc2\xff\x88\x02\x40\xf0\x04\x91\xc0\x14\x60\x06\
+\x90\xee\xde\x54\x9c\x23\x32\x54\x4f\xd7\x34\x33\x69\x09\x26\x52\
+\x13\x4c\xa4\x25\xfa\x91\x96\x60\x22\x2d\xd1\xe4\xf0\xcd\xdd\x93\
+\x19\xcd\x3a\x8c\x66\x1d\x11\x09\x00\x21\x27\xfc\x3d\x4d\xf5\x2d\
+\x94\x1d\xad\xa7\xf4\x48\x3d\xe5\x05\x0d\x94\x1e\xa9\xa7\xec\x68\
+\x3d\xc7\xf2\x6a\xa9\xab\xf4\xa9\xe2\x20\x18\x98\xde\xfa\xb1\x07\
+\x98\x0b\xfc\x1f\xa2\x2d\xb1\xe0\x66\xa2\x00\x10\xdc\x45\x02\x86\
+\x01\xd7\x21\x6f\xea\xf3\x89\x7e\xfb\x21\x81\x3a\x7a\x67\xf9\x93\
+\x95\x6c\xa6\x5b\xba\x99\xac\x64\x3f\xba\xa5\x9b\x89\x08\x11\xa7\
+\x12\xff\xca\x68\xd6\x11\x97\x1e\x44\x5c\xfa\xdf\x17\x7a\xea\xaa\
+\x9a\x39\x76\xa0\x96\xe2\x43\x75\x14\x1d\xac\xe5\x58\x5e\x2d\x85\
+\x7b\xab\x69\xa8\xf5\xfa\x29\xc0\x19\xc0\x6c\xe0\x51\xe4\x13\x04\
+\x73\x80\x1f\x11\xab\x02\x82\x1b\x88\x02\x40\x70\xb5\x60\xe0\x1a\
+\xe0\x7a\xe4\x17\x43\xaf\x15\x1b\x69\xa0\x4f\x96\x3f\xbd\xbb\x04\
+\xd0\xbb\x8b\x3f\xbd\xb3\xfc\x49\x8e\x37\xb9\x3b\x2d\x9f\xe0\x1f\
+\x6c\x20\xa5\x77\x18\x29\xbd\xc3\xfe\xf4\xeb\xe5\x05\x0d\x1c\xdd\
+\x5b\x4d\xc1\xde\x6a\x0a\xf6\xd4\x70\x74\x4f\x35\x35\xe5\x4d\x6e\
+\xca\x52\x11\x23\xf2\xa6\xd6\xf1\xc8\xab\x02\xaf\x01\xef\x20\x3f\
+\x2e\x10\x04\x97\x10\x05\x80\xe0\x2a\xe9\xc0\x8d\xc8\x37\xff\x00\
+\x37\xe7\xd2\x6e\x7a\x9d\x44\x8f\x0c\x7f\x72\x7b\x07\x92\x93\x1d\
+\x40\x4e\x76\x00\x5d\x53\xcd\xee\x4e\xab\xc3\x09\x8b\xf3\x23\x2c\
+\xce\x8f\xee\x43\xa3\xff\xf7\x6b\xd5\xa5\x4d\x1c\xdd\x5d\xcd\x91\
+\x3d\x55\x1c\xda\x56\x49\xde\xb6\x4a\x6f\xdb\x84\x98\x01\x3c\x07\
+\x3c\x02\x7c\x00\xbc\x04\xfc\xe6\xd6\x8c\x84\x0e\x41\x14\x00\x82\
+\x33\x69\x80\x51\xc0\x4d\xc8\x6d\x79\xbd\xe6\xd4\x49\x68\x90\x8e\
+\x21\xbd\x83\x18\xda\x37\x88\x33\x72\x82\xe9\xdd\xc5\x1f\xbd\xce\
+\x6b\xd2\xef\x50\x82\x22\x8c\x04\x45\x44\x92\x95\x1b\x09\x80\xb5\
+\xc5\xce\xd1\x3d\xd5\xe4\x6d\xad\xe0\xc0\xe6\x72\xf2\xb6\x56\x78\
+\xcb\xa3\x83\x00\xe0\x5a\xe4\xbd\x30\xdf\x01\x2f\x22\xcf\x25\x10\
+\xf3\x08\x04\xa7\x10\x05\x80\xe0\x0c\x46\xe4\xe3\x7b\xff\x02\x32\
+\xdd\x9c\x4b\x9b\x04\x98\xb5\x8c\x18\x18\xc2\x59\xfd\x82\x19\xda\
+\x37\x88\xee\xe9\xfe\x68\x34\xee\xce\x4a\x70\x84\x56\x27\x91\x98\
+\x1d\x4c\x62\x76\x30\x67\x8e\xef\x8c\xdd\x66\xa7\x70\x7f\x2d\x07\
+\xb6\x94\xb3\x7f\x43\x39\xfb\x36\x96\xd1\xdc\xe0\xd1\x2b\x04\x12\
+\x70\x6e\xeb\xc7\x4e\xe0\x19\xe0\x3d\xc0\x2b\x9f\x75\x08\x9e\x4b\
+\x14\x00\x82\x9a\x82\x80\xa9\xc0\xbf\x91\x9b\xf7\x78\xb4\x94\x4e\
+\x26\x2e\x1c\x1a\xca\xe8\xa1\x61\x9c\xd1\x27\x08\xa3\x41\xdc\xf1\
+\x7d\x91\xa4\x91\x88\x4b\x0f\x24\x2e\x3d\x90\x21\x63\x92\xb0\x59\
+\xed\xe4\x6f\xaf\x64\xe7\x2f\x25\xec\x5d\x5f\x46\xc1\x9e\x6a\xec\
+\x9e\xbb\x05\x2f\x0b\x78\x13\x78\x0c\x79\x9f\xc0\x8b\x88\x91\xc5\
+\x82\x4a\x44\x01\x20\xa8\x21\x0e\xf9\xa6\x3f\x1d\x0f\x7e\xbe\x1f\
+\x14\xa0\xe5\xec\x01\x21\x9c\x3f\x24\x94\xf3\x72\x43\x48\x88\x31\
+\xba\x3b\x25\xc1\x0d\x34\x5a\x89\xce\x3d\x42\xe9\xdc\x23\x94\xf3\
+\xaf\x83\xca\x63\x8d\xec\x5e\x5b\xc2\xee\xb5\xa5\xec\xdb\x50\x4e\
+\x53\xbd\x47\x3e\x2e\x88\x02\x1e\x00\x6e\x43\x3e\x46\xf8\x34\xe0\
+\x58\x87\x27\x41\x68\x25\x0a\x00\x41\x89\x24\xe0\x0e\x60\x1a\xf2\
+\xb2\xbf\xc7\xe9\x9e\x6e\xe6\xfc\x21\xa1\x9c\x3f\x24\x94\xdc\xde\
+\x41\xe2\x39\xbe\xf0\x37\x21\xd1\x26\x06\x5c\x94\xc0\x80\x8b\x12\
+\xb0\x5a\x6c\xe4\xfd\x56\xc9\xee\x35\xa5\xec\x5a\x53\xc2\xb1\x83\
+\xb5\xee\x4e\xef\xaf\x02\x91\x8b\x80\x1b\x90\x57\x06\x9e\x02\x0e\
+\xbb\x35\x23\xc1\x6b\x89\x02\x40\x70\x44\x67\x60\x26\xf2\x86\x25\
+\x8f\x3b\xf7\x96\x9d\x6a\x66\xec\xb9\xe1\x5c\x31\x32\x92\xac\x14\
+\x3f\x77\xa7\x23\x78\x11\xad\x5e\x43\x6a\xef\x30\x52\x7b\x87\x71\
+\xc1\x3f\x32\x28\x2f\x6c\x60\xeb\xf2\x22\x36\x2e\x2d\xe0\x58\x9e\
+\x47\x15\x03\x26\xe4\x53\x35\xd7\x01\x1f\x21\x9f\x20\x10\x83\x88\
+\x84\x76\x11\x05\x80\xd0\x1e\x49\xc8\xcb\x90\x93\xf0\xb0\xef\x9d\
+\xcc\xce\x7e\x8c\x1b\x19\xc1\xb8\x91\x11\x74\x4b\x13\xc7\xf3\x04\
+\x75\x84\xc5\xfa\x31\x6c\x62\x32\xc3\x26\x26\x53\x74\xa0\x86\x2d\
+\xcb\x8b\xd8\xba\xbc\x88\xd2\x23\xf5\xee\x4e\xed\x38\x3d\xf2\xcf\
+\xe3\x04\xe4\xee\x82\x8f\x00\xf9\xee\x4c\x48\xf0\x1e\x1e\xf5\x22\
+\x2e\x78\xac\x48\xe4\x1d\xfd\xb7\xe0\x41\xef\xf8\x93\xe2\x8c\x5c\
+\x7c\x56\x18\x63\xcf\x8d\x60\x48\xef\x0e\x31\x36\x40\x70\xa3\x98\
+\x94\x40\x62\x52\x02\x19\x39\x3d\x9d\x63\x07\x6b\xd9\xfa\x63\x11\
+\x9b\xbf\x2b\xf4\x94\x62\x40\x87\xbc\x07\x67\x32\x72\x21\xf0\x20\
+\x62\x8f\x80\x70\x1a\xa2\x00\x10\x4e\x25\x0c\xb8\x13\x79\xa9\xd1\
+\x23\xde\x56\xc7\x46\x1a\x98\x38\x2a\x92\x2b\x46\x46\xd0\xb7\xab\
+\xc7\xee\x37\x14\x7c\x5c\x74\x72\x00\xe7\x24\xa7\x71\xce\xd4\x34\
+\x0e\xef\xac\x62\xcb\xf2\x22\x36\x7d\x5b\xe0\x09\x03\x8e\x0c\xc8\
+\x8f\xe6\x26\x22\x9f\x18\x98\x0d\x54\xb8\x35\x23\xc1\x63\x89\x02\
+\x40\x38\x11\x03\xf0\x0f\xe4\x77\x11\x27\x9e\xe4\xe2\x42\x1a\x0d\
+\x0c\xef\x1f\xc2\xb5\x63\xa2\xb9\x64\x78\xb8\xd8\xc8\x27\x78\x94\
+\x84\xac\x60\x12\xb2\x82\xb9\xe0\x1f\x19\xec\xdf\x58\xce\xba\x85\
+\x47\xf8\x6d\xc5\x31\x6c\x56\xb7\x9e\x2d\xf4\x07\xee\x46\x6e\xb9\
+\xfd\x24\xf0\x02\xd0\xe8\xce\x84\x04\xcf\x23\x0a\x00\xe1\x8f\x24\
+\x60\x0c\xf2\x0b\x46\xb2\x9b\x73\x21\x2e\xd2\xc0\xa4\xd1\x51\x5c\
+\x37\x36\x5a\xf4\xd8\x17\x3c\x9e\x46\x23\x91\xde\x37\x9c\xf4\xbe\
+\xe1\x54\x95\x34\xb2\xe9\xdb\x42\xd6\xfc\xf7\x30\x15\x45\x0d\xee\
+\x4c\x2b\x14\x78\x02\x79\x15\xef\x11\xe0\x2d\xc0\xa3\xbb\x20\x09\
+\xae\x23\x0a\x00\xe1\xb8\xb3\x91\x97\x0b\x7b\xbb\x33\x89\x3f\xbe\
+\xdb\xbf\xf4\xec\x70\x74\x5a\xf1\x6e\x5f\xf0\x3e\xc1\x91\x26\x86\
+\x4d\x4c\x66\xe8\x84\xce\xec\x6b\x5d\x15\xd8\xfe\xf3\x31\xac\x2d\
+\x6e\x5b\x15\xe8\x04\xbc\x81\xfc\x78\xe0\x0e\x60\xb9\xbb\x12\x11\
+\x3c\x87\x28\x00\x84\x6c\x60\x3e\xd0\xc7\x9d\x49\x24\xc7\x9b\x98\
+\x76\x59\x34\x53\x2f\x89\x22\x2e\xd2\x27\x26\x03\x0b\x02\xd2\x5f\
+\x56\x05\xd6\x2f\x3e\xca\xaf\x5f\x1f\x75\xe7\xaa\x40\x0e\xb0\x0c\
+\x58\x8f\x7c\x7a\x60\x97\xbb\x12\x11\xdc\x4f\x14\x00\x1d\x97\x19\
+\x78\x17\xb8\x0c\x37\x0e\xe9\xc9\xc9\x0e\xe0\xe6\x89\xb1\x4c\x1c\
+\x15\x89\x56\x23\xde\xed\x0b\xbe\x2b\x38\xd2\xc4\xd9\x93\x53\x19\
+\x7e\x55\x0a\xbb\x7e\x29\x65\xd5\x67\x87\xd8\xbb\xbe\xcc\x5d\xe9\
+\xf4\x45\x9e\x33\xb0\x04\x18\x07\xd4\xb8\x2b\x11\xc1\x7d\x44\x01\
+\xd0\xf1\x1c\x7f\xce\xff\x26\x72\xef\x7e\x97\xd3\x68\xe0\x82\x33\
+\xc2\xb8\xeb\x9a\x78\x72\xc5\xf1\x3d\xa1\x83\x91\x34\x12\x59\xb9\
+\xf2\xf4\xc2\xa3\xbb\xab\x59\xf9\xe9\x21\x36\x7f\x5f\xe8\xae\x4d\
+\x83\xe7\x01\x47\x91\xf7\x08\xcc\x07\x3c\x77\x2a\x82\xa0\x3a\x31\
+\xfd\xa4\x63\xe9\x06\xac\x00\x3e\xc1\x0d\x37\x7f\x7f\x3f\x2d\x37\
+\x4e\x88\x65\xcf\xc2\x1c\x16\xbe\x94\x25\x6e\xfe\x42\x87\x17\x9f\
+\x19\xc4\x15\xf7\x76\xe7\xf6\xf7\x86\x30\xe8\xd2\x44\xf4\x26\xad\
+\x3b\xd2\x08\x04\xe6\x01\x3f\x02\x5d\xdd\x91\x80\xe0\x1e\x62\x05\
+\xa0\x63\x30\x23\x6f\xfc\xb9\x1b\xf9\x88\x9f\x4b\x45\x85\xe9\xf9\
+\xc7\x15\x31\xdc\x34\x21\x8e\xf0\x10\xf1\x2d\x27\x08\x7f\x15\x1e\
+\x6f\xe6\x92\x99\x59\x9c\x77\x6d\x3a\xeb\x17\x1f\x65\xc5\x87\x79\
+\x54\x95\xb8\xfc\xd4\xde\x99\xc0\x66\xe0\x55\xe0\x5e\xc0\xa3\x7a\
+\x1f\x0b\xea\x13\xaf\xc6\xbe\xef\x22\xe4\x86\x20\x49\xae\xbe\x70\
+\x56\x8a\x1f\xff\x9a\x1c\xcf\x55\x17\x46\x8a\x51\xbb\x82\xd0\x06\
+\x26\x7f\x1d\x43\xc6\x24\x31\xf0\xa2\x04\x36\x2e\x2d\x60\xc5\xc7\
+\x79\x94\xe4\xd7\xb9\x32\x05\x1d\x70\x33\xf2\xeb\xc6\x4d\xc0\xd7\
+\xae\xbc\xb8\xe0\x5a\xa2\x00\xf0\x5d\xf1\xc0\xcb\xc0\x25\xae\xbe\
+\x70\x7a\xa2\x1f\x0f\xfc\x23\x81\x09\xe7\x47\xa2\x11\xf7\x7d\x41\
+\x68\x37\x9d\x41\x43\xff\xd1\x9d\xe8\x3b\x2a\x9e\x4d\xdf\x16\xf2\
+\xfd\xff\x1d\xa0\xbc\xc0\xa5\x85\x40\x67\x60\x21\xf0\x39\xf2\xfe\
+\x00\xd1\x56\xd8\x07\x89\x02\xc0\x37\x8d\x05\x5e\x47\x6e\xe5\xeb\
+\x32\x89\xb1\x46\xee\x9d\xd1\x89\x6b\x2e\x8d\x16\xe7\xf7\x05\x41\
+\x05\x1a\x8d\x44\xce\x79\x71\xf4\x1a\x11\xcb\xe6\xef\x0b\xf9\xf6\
+\xff\xf2\xa8\x2c\x70\xe9\x86\xfd\xcb\x90\x7b\x84\xdc\x01\xcc\x45\
+\x6c\x12\xf4\x29\xa2\x00\xf0\x2d\x9d\x81\x39\xc0\x39\xae\xbc\x68\
+\xa7\x68\x03\xb7\x4f\x89\xe7\xfa\xb1\x31\x62\xa9\x5f\x10\x9c\x40\
+\xab\xfb\xbd\x10\x58\xf7\x4d\x11\xdf\xfe\xdf\x01\xea\x4b\x5d\xf6\
+\x88\x3e\x18\xb9\x89\xd0\x44\xe4\x81\x43\x62\xec\xb0\x8f\x10\x05\
+\x80\x6f\xd0\x20\x3f\xaf\x9b\x85\xdc\x03\xdc\x25\x62\x22\x0c\xdc\
+\x35\x2d\x9e\xeb\xc6\xc4\x60\x32\x8a\x1b\xbf\x20\x38\x9b\x56\x27\
+\x31\xe8\xa2\x58\xfa\x8e\x8c\x62\xf9\xe7\x95\xac\xfa\x60\x17\x4d\
+\x55\x2e\x2b\x04\xce\x04\x36\x22\x6f\x10\x7c\x19\xb0\xb9\xea\xc2\
+\x82\x73\x88\x57\x6d\xef\x97\x84\xdc\xd9\xeb\x79\x5c\x74\xf3\xd7\
+\x48\x70\xd7\xb4\x78\xf6\x2c\xec\xc3\x2d\x13\xe3\xc4\xcd\x5f\x10\
+\x5c\x4c\x6f\xd4\x32\x72\x42\x38\x77\x7d\x72\x06\x39\xd7\x9c\x85\
+\x24\xb9\xec\x91\x5b\x00\xf2\x60\xa1\x9f\x81\x34\x57\x5d\x54\x70\
+\x0e\xf1\xca\xed\xdd\x66\x00\xdb\x80\x61\xae\xbc\xa8\xcd\x0e\xcd\
+\x16\x3b\x81\xfe\x6e\x39\xb3\x2c\x08\x42\x2b\xb3\x9f\x0d\x73\xdd\
+\x41\xec\x76\x97\x3f\x9a\x1f\x0c\x6c\x00\xa6\xb9\xfa\xc2\x82\x7a\
+\x44\x01\xe0\x9d\xa2\x81\xff\x22\x3f\xef\x0f\x74\x47\x02\x2f\x7d\
+\x50\xc8\xee\x3c\xb7\x4e\x39\x13\x84\x0e\xaf\xec\x68\x3d\xbf\x7c\
+\x9e\xef\xae\xcb\x07\x21\x77\x14\x5d\x0c\xc4\xb9\x2b\x09\xc1\x71\
+\xa2\x00\xf0\x3e\x97\x03\xdb\x91\xcf\xe9\xba\x8d\xa5\xc5\xce\xbf\
+\x9e\x3e\xe8\xce\x14\x04\xa1\xc3\xfb\xea\x85\x5d\xb4\x58\xdc\xfe\
+\x28\xfe\x3c\x60\x0b\x6e\x38\x72\x2c\x28\x23\x0a\x00\xef\xe1\x87\
+\xfc\xec\xed\x53\x20\xdc\xcd\xb9\x00\xb0\x68\x45\x05\x8b\x57\x56\
+\xb8\x3b\x0d\x41\xe8\x90\xf6\xae\x2f\x63\xd7\x9a\x12\x77\xa7\x71\
+\x5c\x04\xf0\x05\xf2\x80\x31\x97\x6d\x44\x16\x94\x11\x05\x80\x77\
+\xe8\x0a\xac\x45\xee\xd0\xe5\x51\x6e\x9b\x7d\x10\x8b\xfb\x66\x9c\
+\x0b\x42\x87\x64\xb3\xda\x59\xf8\x92\x47\x4e\xf2\x9d\x04\xfc\x0a\
+\xf4\x74\x77\x22\xc2\xe9\x89\x02\xc0\xb3\x49\xc8\x37\xfd\xf5\x40\
+\x77\x37\xe7\x72\x42\xbb\x0e\x36\xf0\xca\x47\xa2\x49\x98\x20\xb8\
+\xd2\xaa\xcf\xf2\x39\x76\xd0\x63\x5b\xf5\x67\x01\x6b\x80\x1b\x70\
+\xe3\xa8\x71\xe1\xf4\x44\x01\xe0\xb9\x42\x81\x2f\x91\x97\xfd\x4d\
+\x6e\xce\xe5\x94\x1e\x7a\xed\x30\x25\x15\x16\x77\xa7\x21\x08\x1d\
+\x42\x7d\xb5\x85\xe5\xef\xee\x77\x77\x1a\xa7\x63\x02\x5e\x41\x7e\
+\x64\x19\xec\xe6\x5c\x84\x93\x10\x05\x80\x67\xea\x83\xbc\x8c\xe6\
+\xd4\x8d\x7e\x92\x04\x93\xce\x8a\x67\x78\x0f\x65\x5b\x0a\x2a\x6b\
+\x5a\xb8\xff\x15\xb7\xed\x44\x16\x84\x0e\x65\xc9\x9c\xbd\xd4\x57\
+\x2b\x2b\xb8\xcd\xe9\xdd\x08\x19\x32\x52\x7e\x11\x70\xae\xcb\x90\
+\x37\x08\xf6\x77\xf6\x85\x84\xf6\x13\x05\x80\xe7\x99\x0c\xac\x04\
+\x52\x9d\x79\x91\x94\x18\x33\xdf\x3e\xdc\x9f\x77\x67\xf6\xe4\xe5\
+\xeb\xba\xa2\x57\xd8\xbb\x7f\xee\xa7\xc7\xd8\xb2\xdb\xa5\xc3\x4a\
+\x04\xa1\xc3\x39\x76\xb0\x96\x5f\x17\x1d\x51\x14\x43\xd2\x6a\x89\
+\xbe\xe2\x5a\x62\x26\xde\x40\xe2\xcc\x59\x18\xa2\x9c\x7e\x82\x2f\
+\x09\x58\x01\xdc\xe2\xec\x0b\x09\xed\x23\x0a\x00\xcf\x11\x00\x7c\
+\x08\xcc\x43\xde\xf1\xef\x14\x3a\xad\xc4\x1d\x97\xa5\xf0\xdb\xcb\
+\x67\x30\xa2\x67\x04\x00\x59\x09\x01\x5c\x7f\xbe\xb2\x69\xc1\x56\
+\x9b\x9d\x99\xb3\xc5\xb1\x40\x41\x70\xa6\x85\x2f\xed\xc2\x66\x55\
+\xb6\xe9\x36\xf1\x82\x33\x89\xef\x1a\x8c\x04\x98\xd3\xbb\xd2\xf9\
+\xde\xe7\x09\x1b\x71\x09\x4e\x1e\xdd\x69\x44\xee\x56\x2a\x4e\x09\
+\x78\x10\x51\x00\x78\x86\x34\xe0\x17\x60\xbc\x33\x2f\xd2\xa3\x73\
+\x20\xab\x9f\x1a\xcc\x93\x53\xba\xe0\x67\xf8\x73\x17\xbf\x87\xae\
+\x4c\x27\x22\xc8\xa0\x28\xfe\x0f\xeb\xaa\xf8\xec\xfb\x32\x45\x31\
+\x04\x41\x38\xb1\x6d\x3f\x1e\x63\xef\x7a\x65\x3f\x5f\xfa\x40\x7f\
+\xd2\xc7\x5f\x40\xa0\x7f\x1d\x31\x91\x25\x68\x35\x36\x34\x06\x23\
+\x51\x97\x4f\x25\xf9\xee\x67\x31\x25\x39\xbd\xbb\xef\x24\x60\x35\
+\x90\xe2\xec\x0b\x09\xa7\x27\x0a\x00\xf7\x3b\x0f\x58\x07\x74\x73\
+\xd6\x05\xfc\x0c\x5a\x1e\x98\x90\xce\xaf\xcf\xe6\xd2\x2f\xfd\xc4\
+\xfb\x71\x42\x03\xf4\x3c\x38\x21\x5d\xf1\xb5\x6e\x9b\x7d\x90\xfa\
+\x46\xb7\x37\x26\x11\x04\x9f\xd2\xd2\x6c\xe3\x9b\xd7\x76\x2b\x8e\
+\x93\x31\x71\x34\xfa\x40\xf9\x0d\xb8\xc9\xd0\x4c\x5c\x54\x31\x46\
+\x83\xbc\x9f\xc0\xd8\x29\x99\xa4\x3b\x9e\x22\x7a\xec\x74\x34\x46\
+\xa7\xee\x3b\xee\x81\xbc\xc7\xe9\x5c\x67\x5e\x44\x38\x3d\x51\x00\
+\xb8\x8f\x04\xdc\x05\x7c\x8d\xbc\xe3\xdf\x29\xfa\x67\x84\xb0\xe5\
+\xc5\x21\x3c\x38\x21\x1d\x83\xee\xd4\xff\xbb\xaf\x3f\x3f\x91\xee\
+\x49\xca\x3a\x0b\xe7\x17\x36\xf1\xdc\xfc\x02\x45\x31\x04\x41\xf8\
+\xb3\x9f\x3e\x3a\x48\x79\xa1\xb2\xd6\xdb\x01\x09\xb1\x24\x8c\x1c\
+\xf2\xa7\x5f\xd3\x69\xad\xc4\x46\x94\x62\x36\x35\x02\x20\x69\xb4\
+\x84\x0e\x1f\x4d\x67\xe7\xaf\x06\x84\x01\xdf\x00\xff\x46\x1c\x15\
+\x74\x1b\x51\x00\xb8\x87\x3f\xf0\x31\xf0\x38\xe0\x94\x89\x3a\x5a\
+\x8d\xc4\x3d\x63\x53\x59\xf9\xe4\x20\xd2\xe3\xda\xf6\xc8\x4d\xab\
+\x91\x78\x7e\x46\xb6\xe2\x6b\x3f\x36\xf7\x30\x87\x8b\x9a\x14\xc7\
+\x11\x04\x01\xaa\x4a\x1a\xf9\xf1\x7d\xe5\xfb\x6b\xb2\xa6\x8f\x41\
+\xd2\xfe\xfd\x25\x5f\x92\x6c\x44\x85\x97\x11\xe4\xff\x7b\x5f\x01\
+\x43\x74\x3c\x49\xff\x7e\x8a\xf0\x91\x97\x3b\xf3\xa4\x80\x16\x78\
+\x0a\xf8\x00\x30\x3b\xeb\x22\xc2\xc9\x89\x02\xc0\xf5\xe2\x80\x9f\
+\x80\xb1\xce\xba\x40\x62\xa4\x1f\xcb\x1e\x1d\xc0\xac\x49\x99\xed\
+\xde\xdd\x3f\xbc\x47\x38\x97\x0c\x8c\x56\x74\xfd\xfa\x46\x1b\xf7\
+\xbd\x24\x8e\x05\x0a\x82\x1a\x96\xcc\xd9\x4b\x73\x83\x55\x51\x8c\
+\xe8\x41\xbd\x88\xe8\x9d\x75\xd2\xff\x2e\x01\xe1\x21\x55\x84\x07\
+\x57\xfe\xef\xed\xb8\xa4\xd5\x12\x79\xc9\x64\x92\x6e\x7f\x02\x7d\
+\x44\x8c\xa2\xeb\x9f\xc6\x78\xe4\x7d\x01\x89\xce\xbc\x88\xf0\x77\
+\xa2\x00\x70\xad\x5e\xc8\x1d\xb2\x72\x9c\x75\x81\x31\xb9\x31\x6c\
+\x7a\x7e\x08\x43\xbb\x85\x39\x1c\xe3\x99\x6b\xb2\x30\x19\x94\x7d\
+\x6b\xcc\xff\xba\x98\x95\x9b\xaa\x15\xc5\x10\x84\x8e\x2e\x7f\x7b\
+\x25\x9b\xbe\x55\xf6\x48\x4d\xa3\xd3\x91\x79\x75\xdb\xe6\xf4\x04\
+\x05\xd4\x11\x15\x56\x8e\x24\xfd\x7e\xd2\xc0\x2f\xa5\x0b\xc9\xf7\
+\x3c\x47\x50\xff\xa1\x8a\xf2\x38\x8d\x9e\xc8\xaf\x8d\xfd\x9c\x79\
+\x11\xe1\xcf\x44\x01\xe0\x3a\x63\x80\x55\x40\x82\x33\x82\x07\x99\
+\x75\xbc\xf1\xcf\x6e\x2c\xb8\xb3\x0f\x61\x81\x7a\x45\xb1\x52\x62\
+\xcc\xdc\x32\x3a\x59\x51\x0c\xbb\x1d\x6e\x7d\xf2\x20\x36\xb1\x1f\
+\x50\x10\x1c\x62\xb7\xcb\xc7\xfe\xec\x0a\x47\x6d\x74\xbe\xe4\x6c\
+\xfc\xe3\xa2\xda\xfc\xfb\xcd\x7e\x0d\xc4\x46\x96\xa2\xd5\xfc\xfe\
+\xc3\xab\xf1\x33\x13\x37\xf5\x36\xe2\x67\xdc\x81\xd6\xcf\x69\xa7\
+\xf8\x62\x91\xfb\x05\x4c\x70\xd6\x05\x84\x3f\x13\x05\x80\xf3\x49\
+\xc0\x7d\xc0\x27\x38\xe9\x39\xd7\xe0\x2e\xa1\x6c\x7e\x61\x08\xd7\
+\x8e\x54\x6f\x05\xed\xde\x71\xa9\xc4\x86\x1a\x15\xc5\xd8\xb0\xa3\
+\x96\xf7\x16\x15\xab\x94\x91\x20\x74\x2c\x1b\x97\x16\x90\xbf\xa3\
+\x4a\x51\x0c\x63\x48\x10\xa9\x63\x46\xb6\xff\xeb\xf4\xcd\xc4\x45\
+\x95\xa0\xd7\xfe\xf9\xd1\x43\x60\x9f\x5c\x3a\xdf\xfd\x2c\x7e\xc9\
+\x99\x8a\xf2\x3a\x05\x13\xf0\x3e\x70\xb7\xb3\x2e\x20\xfc\x4e\x14\
+\x00\xce\xa5\x07\xde\x06\x1e\xc1\x09\x3b\x5d\x75\x5a\x89\x07\x27\
+\xa4\xf3\xd3\xe3\x03\x49\x8e\x56\xb7\xb6\x08\xf4\xd3\x31\x6b\x92\
+\xf2\x1f\xf2\x3b\x9e\xcd\xa3\xba\x56\xd9\xf3\x4b\x41\xe8\x68\x9a\
+\x1b\xac\x2c\x99\xb3\x47\x71\x9c\xcc\xab\x2f\x41\x67\x76\xec\x48\
+\x9f\x4e\xdb\x42\x6c\x54\x31\x06\xdd\x9f\xdb\x0e\xeb\x23\x63\x48\
+\xbc\xfd\x71\x22\x2e\xb8\xc2\x59\xcd\x83\x24\xe0\x31\xe0\x4d\x40\
+\xe7\x8c\x0b\x08\x32\x51\x00\x38\x4f\x00\xf2\x30\x9f\x29\xce\x08\
+\x1e\x11\x64\x60\xf1\x83\xfd\x78\x60\x42\x3a\x3a\x85\x6d\x7c\x4f\
+\xe6\xea\xb3\xe3\xe9\x9f\x11\xa2\x28\xc6\xb1\x32\x0b\x4f\xbd\xa3\
+\xac\x75\xa9\x20\x74\x34\x3f\xbc\x77\x80\xea\x52\x65\x27\x69\x82\
+\x52\x13\x88\x1b\x3e\x40\x51\x0c\xad\xc6\x46\x6c\x64\x09\x46\x43\
+\xf3\x9f\x7e\x5d\xd2\x68\x89\x18\x7d\x25\x89\xb7\x3e\x82\x2e\x48\
+\xd9\x6b\xc4\x29\x4c\x43\x3e\x2a\x18\xe4\xac\x0b\x74\x74\xa2\x00\
+\x70\x8e\x18\xe0\x47\xe0\x02\x67\x04\xcf\x49\x0b\x66\xfd\xb3\xb9\
+\xff\x6b\xe5\xeb\x2c\x1a\x49\xe2\xf9\xe9\x59\x8a\x4f\x01\x3d\x3d\
+\xaf\x80\x7d\xf9\x8d\xea\x24\x25\x08\x3e\xae\xbc\xb0\x81\x15\x1f\
+\xe7\x29\x0b\x22\x49\x64\xcf\x18\x87\xa4\xc2\x11\x3e\x8d\xc6\x4e\
+\x6c\x44\x29\x26\xe3\xdf\x0b\x12\x73\x7a\x37\x3a\xdf\xf5\x2c\x7e\
+\xc9\x19\x8a\xaf\x73\x12\xe7\x00\x3f\x03\xf1\xce\xba\x40\x47\x26\
+\x0a\x00\xf5\xa5\x21\x7f\xc3\x3a\x65\xa7\xff\xa4\xb3\xe2\xf9\xf9\
+\x89\x81\x24\x45\x39\x6d\x5c\xc0\x9f\x0c\xea\x12\xca\x84\x33\x95\
+\x0d\x0b\x69\x6a\xb6\x71\xd7\xf3\x79\xea\x24\x24\x08\x3e\x6e\xd1\
+\x2b\xbb\x69\x69\x56\xb6\x7b\x36\x6e\x68\x3f\x42\xb3\xd5\x9b\x27\
+\x26\x49\x76\x62\xc2\xcb\x30\x9b\xfe\xde\x8c\x48\x17\x1a\x4e\xe2\
+\x6d\x8f\x11\x32\xc4\x69\x8d\xfd\x7a\x20\xbf\xa6\x76\x71\xd6\x05\
+\x3a\x2a\x51\x00\xa8\xab\x3f\xf2\x51\x16\xd5\x5b\x68\x99\x0c\x1a\
+\xde\xba\xb9\x07\xef\xce\xec\xf9\xb7\x3e\xfe\xce\xf6\xd4\x94\x2e\
+\xf8\x9b\x94\x5d\xf3\xb3\xef\xcb\xf8\xee\x97\x4a\x95\x32\x12\x04\
+\xdf\xb4\x7f\x53\x39\xbf\xad\x38\xa6\x28\x86\xd6\xa0\x27\x63\x92\
+\xfa\x93\xc4\x25\xc9\x4e\x74\x58\x05\x01\xe6\xbf\x17\x01\x92\x4e\
+\x4f\xcc\xc4\x7f\x12\x33\xf1\x06\x24\x9d\xb2\x53\x48\x27\x91\x8c\
+\x5c\x04\xf4\x75\x46\xf0\x8e\x4a\x14\x00\xea\x19\x06\x7c\x07\x84\
+\xab\x1d\xb8\x53\x84\x89\x1f\x1f\x1b\xc8\x35\x23\x3a\xa9\x1d\xba\
+\x4d\xe2\xc3\x4d\xdc\x71\x99\xf2\xd9\x1d\x33\x9f\x3a\x48\x8b\xc2\
+\x49\x66\x82\xe0\xab\x6c\x36\x3b\x0b\x5f\xdc\xa5\x38\x4e\xca\xd8\
+\x91\xf8\x45\x3a\xde\x07\xe4\x94\x24\x3b\x11\xa1\xe5\x04\x98\xeb\
+\x4f\xf8\x9f\x43\x86\x8c\x24\xe9\xdf\x4f\xa2\x0f\x6f\xfb\xb1\xc3\
+\x76\x88\x40\x7e\xb4\x7a\x8e\x33\x82\x77\x44\xa2\x00\x50\xc7\x45\
+\xc0\x62\x9c\xb0\x59\x65\x68\xb7\x30\xd6\x3f\x9b\xcb\x00\x85\x9b\
+\xf1\x94\xfa\xf7\x65\x29\x74\x56\xf8\xd8\x61\xfb\xfe\x7a\xde\xfc\
+\x4c\xd9\xbb\x1b\x41\xf0\x55\xeb\xbe\x3a\x42\xe1\xfe\x1a\x45\x31\
+\x4c\x11\xa1\x24\x5f\x32\x42\xa5\x8c\x4e\x4c\x02\x22\x42\x2b\x4e\
+\x5a\x04\x98\x12\x53\xe9\x7c\xd7\x33\xf8\x67\xf5\x72\xc6\xe5\xfd\
+\x81\x85\xc0\xe5\xce\x08\xde\xd1\x88\x02\x40\xb9\x49\xc0\x67\xc8\
+\xe7\x57\x55\x23\x49\x70\xf3\xe8\xce\x7c\xff\xc8\x00\xa2\x43\x94\
+\x9d\xc7\x57\x83\x9f\x41\xcb\x93\x53\x94\x3f\x82\xbb\xf7\xa5\x43\
+\x94\x55\xb6\xa8\x90\x91\x20\xf8\x8e\x86\x1a\x0b\xdf\xbe\xb5\x4f\
+\x71\x9c\xac\x69\x97\xa3\x35\x2a\x1b\xeb\xdd\x16\xa7\x2b\x02\xb4\
+\x01\x41\x24\xdc\xf8\x00\xe1\xe7\x3a\x65\x96\x80\x11\x79\x96\xca\
+\x34\xb5\x03\x77\x34\xa2\x00\x50\x66\x26\x30\x0f\x95\xcf\xaa\x1a\
+\xf5\x1a\x3e\xb8\xbd\x17\x2f\xcc\xc8\x76\xda\x11\x3f\x47\x8c\x1b\
+\x12\xab\xa8\xc5\x30\x40\x79\x55\x0b\x8f\xce\x39\xac\x52\x46\x82\
+\xe0\x1b\xbe\x7f\x67\x3f\x75\x55\xcd\xa7\xff\x8d\xa7\x10\x9a\x95\
+\x4a\xcc\xe0\xde\x2a\x65\x74\x7a\xa7\x2b\x02\xd0\x68\x88\xbc\x74\
+\x32\x71\x53\x66\x3a\x63\x5f\x80\x16\x98\x0b\xdc\xac\x76\xe0\x8e\
+\x44\x14\x00\x8e\xfb\x37\xf0\x2c\x2a\x37\xf8\x09\x0b\xd4\xf3\xed\
+\xc3\xfd\x19\x7f\x86\xb2\x9d\xf7\xce\xf2\xfc\xf4\x6c\xb4\x1a\x65\
+\x7f\xe4\x97\x3f\x2c\xe4\xb7\x7d\x27\x79\xd1\x10\x84\x0e\xa6\xf8\
+\x50\x1d\xbf\x7c\xa9\x6c\x78\x96\x24\x49\x64\xcd\x18\xe3\xcc\xc9\
+\x7d\x27\xbe\x2e\xa7\x29\x02\x80\xa0\xfe\x43\x49\x9c\xf9\x28\xda\
+\x00\xd5\x9f\x90\x4a\xc0\x0b\xc8\x9d\x56\x05\x07\x88\x02\xc0\x31\
+\x77\x22\x8f\xb1\x54\x55\x4a\x8c\x99\x55\x4f\x0e\xe2\xcc\xae\x4e\
+\xda\xc0\xa3\x82\x5e\x29\x41\x8a\x37\x23\xb6\x58\xed\xcc\x7c\x4a\
+\xf9\x78\x53\x41\xf0\x05\x5f\xbf\xbc\x0b\x6b\x8b\xb2\xcd\xb1\x9d\
+\xce\xcd\x25\x38\x2d\x49\xa5\x8c\xda\xe7\x78\x11\xe0\xef\xf7\xf7\
+\xd3\x01\xc7\xf9\xa5\x74\x21\xe9\x8e\xa7\x30\x44\x39\xe5\x8d\xcd\
+\x23\xc0\x03\xce\x08\xec\xeb\x44\x01\xd0\x7e\x77\x02\x4f\xa8\x1d\
+\x74\x60\x66\x08\xbf\xcc\x1e\x4c\x97\x4e\x01\x6a\x87\x56\xdd\xa3\
+\x93\x32\x09\xf1\x57\xb6\xa4\xf7\xfd\x9a\x4a\x16\xad\xa8\x50\x29\
+\x23\x41\xf0\x4e\x3b\x57\x97\xb0\x7b\x6d\xa9\xa2\x18\x3a\xb3\x89\
+\xf4\x2b\x2f\x54\x29\x23\xc7\x48\x40\x54\x58\x39\x7e\xa6\x93\x77\
+\x2f\x34\x44\xc6\x92\x74\xc7\x53\xf8\xa5\x65\x3b\x23\x85\x07\x71\
+\xc2\xeb\xb2\xaf\x13\x05\x40\xfb\x3c\x8c\x13\xbe\xc9\x2e\x1f\x1c\
+\xc3\xf2\x59\x03\x88\x0a\x76\xfe\xe6\x1d\x35\x44\x05\x1b\xb8\xef\
+\x0a\xe5\xad\x0e\x6e\x7d\xea\x00\x4d\x0a\x1b\x9e\x08\x82\xb7\xb2\
+\x5a\x6c\x2c\x7a\x75\xb7\xe2\x38\x69\xe3\x47\x61\x0c\xf5\x8c\x6e\
+\xb9\x51\x61\x65\x18\x8d\x27\xdf\xcb\xa0\xf5\x0f\x24\xf1\x96\x87\
+\x09\xea\x7b\x86\x33\x2e\xef\x94\x95\x59\x5f\x26\x0a\x80\xb6\x7b\
+\x14\xf8\x8f\xda\x41\x6f\x1e\xdd\x99\x4f\xee\xec\xed\xf2\xe6\x3e\
+\x4a\xdd\x3c\xba\x33\x99\xf1\xca\xc6\x82\xee\xcb\x6f\xe4\xe5\x0f\
+\x0b\x55\xca\x48\x10\xbc\xcb\xaa\xcf\xf2\x29\xc9\xaf\x53\x14\xc3\
+\x1c\x1b\x49\xd2\xa8\xa1\x2a\x65\xa4\x9c\x46\xb2\x13\x13\x5e\x8a\
+\x41\x6f\x39\xe9\xef\x91\x74\x7a\xe2\xae\xf9\x17\x11\xa3\xc6\x3b\
+\x23\x85\x7f\x03\x4f\x3b\x23\xb0\x2f\x12\x05\x40\xdb\x3c\x0c\xdc\
+\xab\x66\x40\xad\x46\xe2\x95\xeb\xbb\xf2\xc2\x8c\x6c\x34\x2e\xde\
+\xb8\xa3\x06\xbd\x56\xe2\xe9\x6b\xb2\x14\xc7\x79\xe8\xf5\xc3\x14\
+\x95\x2a\xdb\xfd\x2c\x08\xde\xa6\xb6\xa2\x99\x65\xf3\xf6\x2b\x8e\
+\x93\x3d\x63\x2c\x1a\xbd\x67\x0d\xcc\xd3\xb4\xb6\x0d\xd6\xeb\x4e\
+\x71\xdc\x57\x92\x88\xb8\x70\x02\x31\x57\xdd\x88\xa4\x51\xfd\xcd\
+\xcf\xbf\x90\x1f\x09\x08\xa7\x21\x0a\x80\xd3\xbb\x0f\x95\xdf\xf9\
+\xfb\x9b\xb4\x2c\xfc\x4f\x5f\x6e\xb8\xc0\x3d\x9b\x76\xd4\x72\x61\
+\xbf\x28\xce\xcf\x89\x54\x14\xa3\xa6\xce\xca\xfd\xaf\x28\xdb\x01\
+\x2d\x08\xde\x66\xe9\xdc\xbd\x34\xd6\x29\xeb\x87\x11\xde\xb3\x0b\
+\x91\x7d\xbb\xa9\x94\x91\xba\xb4\x5a\x2b\xb1\x11\xa5\xe8\xb4\xa7\
+\x1e\x05\x1e\x92\x7b\x0e\xf1\xff\xb8\x07\x8d\x41\xf5\x5e\x27\x0f\
+\xa0\xf2\x9b\x36\x5f\x24\x0a\x80\x53\xbb\x0d\x79\x87\xa9\x6a\x82\
+\xcd\x3a\xbe\x7d\xb8\xbf\xe2\x1b\xa7\xa7\x78\x76\x5a\x16\x7a\x85\
+\xbd\x0a\xde\xfa\xe2\x18\xeb\xb7\xd7\xaa\x94\x91\x20\x78\xb6\x82\
+\xbd\x35\xac\xff\xe6\xa8\xa2\x18\x92\x56\x43\xf6\x8c\xb1\x2a\x65\
+\xe4\x1c\x5a\xad\x95\x98\xf0\x32\x34\x9a\x53\x9f\x70\x08\xe8\xd6\
+\x97\x84\x9b\x1e\x44\x63\x32\xab\x9d\xc2\xa3\xc0\xdd\x6a\x07\xf5\
+\x25\xa2\x00\x38\xb9\x99\xc0\x33\x6a\x06\x8c\x08\x32\xb0\x7c\xd6\
+\x00\x06\x77\x09\x55\x33\xac\x5b\x75\xe9\x14\xc0\x3f\x47\x29\x5b\
+\xc9\xb0\xd9\xe0\xd6\xa7\x0e\x62\x17\x63\x02\x84\x0e\x60\xe1\x4b\
+\xbb\xb0\xd9\x94\x7d\xb3\x27\x5d\x38\x8c\x80\xc4\x58\x95\x32\x72\
+\x1e\xbd\xde\x42\x4c\x58\x29\x92\x74\xea\x3f\xaf\x5f\x5a\x36\x89\
+\xb7\x3e\x8c\xd6\x5f\xf5\x53\x50\x8f\x21\x9a\x05\x9d\x94\x28\x00\
+\x4e\x6c\x32\x2a\xdf\xfc\xa3\x43\x8c\x2c\x9f\x35\x80\x3e\xa9\xc1\
+\x6a\x86\xf5\x08\x0f\x4c\x48\x27\x22\x48\xd9\x09\x86\x55\x9b\xaa\
+\x59\xf0\xad\xb2\xe3\x50\x82\xe0\xe9\xb6\x2c\x2f\xe2\xc0\xe6\x72\
+\x45\x31\xf4\x81\xfe\xa4\x8d\x3b\x5f\xa5\x8c\x9c\xcf\x68\x6c\x26\
+\x32\xf4\xf4\x47\x7e\x4d\x49\xe9\x24\xdd\xfe\x24\xba\x60\xd5\xfb\
+\xa0\x3c\x8f\x68\x1b\x7c\x42\xa2\x00\xf8\xbb\x8b\x81\xb7\x50\xb1\
+\xc3\x5f\x62\xa4\x1f\x3f\x3f\x31\x90\xee\x49\x81\x6a\x85\xf4\x28\
+\x21\xfe\x7a\x1e\x9e\x98\xa1\x38\xce\xed\xcf\xe4\x51\xdf\x28\x8e\
+\x05\x0a\xbe\xc9\xd2\x64\x65\xf1\xeb\x7b\x14\xc7\xc9\xb8\xea\x22\
+\xf4\x81\xca\x4e\xe0\xb8\x9a\xbf\x5f\x03\xa1\x81\xd5\xa7\xfd\x7d\
+\x86\x98\x4e\x24\xce\x9c\x85\x3e\x34\x42\xcd\xcb\x4b\xc0\x1b\xc0\
+\x18\x35\x83\xfa\x02\x51\x00\xfc\xd9\x70\xe0\x23\x54\xec\xed\x9f\
+\x1c\x6d\xe6\x87\x59\x03\x48\x8f\xf3\xae\x1f\xd8\xf6\xba\x76\x64\
+\x02\x3d\x93\x95\x9d\x45\x3e\x5c\xd4\xc4\x33\xf3\x94\x3d\x1b\x15\
+\x04\x4f\xf5\xd3\x87\x79\x54\x14\x9d\xbc\x5b\x5e\x5b\x04\x24\xc6\
+\x92\x70\x6e\xae\x3a\x09\xb9\x58\x48\x50\xcd\x29\x5b\x06\x1f\x67\
+\x88\x8e\x23\xf1\xf6\x27\x30\x44\xaa\xfa\x88\x43\x0b\xbc\x0f\x9c\
+\xab\x66\x50\x6f\x27\x0a\x80\xdf\xf5\x07\xbe\x44\xc5\xa9\x7e\x59\
+\x09\x01\xfc\xfc\xc4\x40\x52\x62\x54\xdf\xdc\xe2\x71\xb4\x1a\x89\
+\xe7\xa6\x2b\x3f\x16\xf8\xf8\x9b\x47\xc8\x2f\x3c\x79\x37\x31\x41\
+\xf0\x46\x55\x25\x8d\xfc\xf4\x81\xf2\xf6\xd7\x59\xd3\xc7\x20\x69\
+\xbd\xf7\x65\x3b\x32\xb4\x02\x93\xf1\xf4\x3f\xdf\xfa\xb0\x48\x12\
+\x6f\x7f\x1c\x63\xbc\xaa\x27\xa5\x0c\xc0\xe7\xc0\x60\x35\x83\x7a\
+\x33\xef\xfd\x4e\x52\x57\x17\xe0\x1b\x40\xb5\x35\xfa\x3e\xa9\xc1\
+\xac\x78\x7c\x20\xf1\xe1\xaa\x4e\x09\xf6\x68\x67\x75\x0f\xe7\xf2\
+\xc1\x31\x8a\x62\x34\x34\xd9\xb8\xe7\xc5\x43\x2a\x65\x24\x08\x9e\
+\xe1\x9b\xd7\xf6\xd0\xdc\x78\xea\x23\x71\xa7\x13\x93\xdb\x9b\x88\
+\x5e\xca\x8b\x6c\x77\x8b\x0e\x2b\xc7\xa0\x3b\x79\xa3\xa0\xe3\x74\
+\x41\xa1\x24\xde\xfa\x08\xa6\x84\x14\x35\x2f\xef\x0f\xfc\x17\x50\
+\xfe\xcc\xd2\x07\x88\x02\x00\x62\x90\x6f\xfe\xe1\x6a\x05\x1c\x98\
+\x19\xc2\xb2\x47\xfb\x2b\xde\x18\xe7\x8d\x66\x4f\xed\x82\xc9\xa0\
+\xec\xdb\xea\x83\x6f\x4a\xf8\x79\xe3\xe9\x9f\x17\x0a\x82\x37\x38\
+\xb4\xbd\x92\x2d\xcb\x94\x75\xbc\xd4\xe8\x75\x64\x4e\xbe\x44\xa5\
+\x8c\xdc\x4b\xa3\xb1\x11\x15\x71\xfa\xe3\x81\x00\xda\x80\x60\x12\
+\x66\x3e\x8a\x5f\xb2\xaa\xf7\xeb\x08\x60\x31\x10\xad\x66\x50\x6f\
+\xd4\xd1\x0b\x80\x40\x60\x11\x90\xac\x56\xc0\x9e\xc9\x41\x7c\xf3\
+\x40\x3f\xc5\xc3\x72\xbc\x55\x72\xb4\x99\xdb\x2e\x56\xf6\xd7\x69\
+\xb7\xc3\xad\x4f\x1e\xc4\x26\xf6\x03\x0a\x5e\xce\x6e\xb3\xb3\xf0\
+\xc5\x5d\x8a\x8f\xb8\x26\x5f\x3a\x02\x73\xac\x6f\xf4\x0e\x01\xd0\
+\x6b\xad\x44\x87\x95\xc1\x69\x8e\x07\x02\x68\xfd\xfc\x49\xb8\xe9\
+\x21\x4c\x89\xa9\x6a\xa6\x90\x82\xfc\xda\xef\xf9\xd3\xd7\x9c\xa8\
+\x23\x17\x00\x7a\x60\x01\xd0\x47\xad\x80\x99\xf1\xfe\x2c\x7d\xa8\
+\x1f\xa1\x01\x1d\xf3\xe6\x7f\xdc\xdd\x63\xd3\x88\x0b\x53\xf6\xe8\
+\x63\xe3\xce\x5a\xde\x5d\x58\xac\x52\x46\x82\xe0\x1e\x1b\x96\x14\
+\x70\x78\x67\x95\xa2\x18\xc6\xd0\x20\x52\x2e\xf3\xbd\xbd\x6b\x26\
+\x63\x13\x61\x6d\x38\x19\x00\xa0\xf1\x33\x93\x70\xd3\x83\x18\x63\
+\x13\xd4\x4c\x21\x07\xf8\x04\x15\x37\x7d\x7b\x9b\x8e\x5a\x00\x1c\
+\x3f\x16\x32\x52\xad\x80\x69\xb1\x66\x96\xcf\x1a\x40\x74\x88\xea\
+\x2d\x2d\xbd\x4e\x80\x49\xcb\xe3\x93\x33\x15\xc7\xb9\xeb\xf9\x3c\
+\xaa\x6b\x95\x3d\x37\x15\x04\x77\x69\xaa\x6f\x61\xc9\xdc\xbd\x8a\
+\xe3\x64\x4e\xb9\x14\x9d\xd9\x37\xf7\x12\x05\x07\xd6\x12\x60\x6e\
+\xdb\x40\x24\x6d\x40\x10\x09\xb7\x3c\x8c\x3e\x52\xd9\x3e\xa3\xbf\
+\x38\x1f\x78\x5d\xcd\x80\xde\xa4\xa3\x16\x00\xf7\x01\x53\xd5\x0a\
+\xd6\x29\xc2\xc4\x77\x8f\x0c\x50\xfc\xae\xd7\x97\x4c\x3a\x2b\x9e\
+\x01\x19\x21\x8a\x62\x1c\x2b\xb3\xf0\xf8\x5b\x47\x54\xca\x48\x10\
+\x5c\x6b\xf9\xfc\x03\xd4\x94\x29\x3b\xd1\x12\x9c\x96\x48\xdc\xb0\
+\xfe\x2a\x65\xe4\x99\x22\x42\xaa\x30\x9e\x62\x7a\xe0\x1f\xe9\x82\
+\xc3\xe4\x3e\x01\x61\x51\x6a\xa6\x30\x0d\xb8\x4b\xcd\x80\xde\xa2\
+\x23\x16\x00\x97\xa3\xe2\xa4\xa8\xa8\x60\x03\xdf\x3d\xdc\x9f\xce\
+\x51\x7e\x6a\x85\xf4\x09\x92\x04\xaf\x5c\xdf\x55\xf1\xa4\xc3\x67\
+\xdf\x3d\xca\xde\x7c\x65\x67\xa7\x05\xc1\xd5\xca\x0b\x1a\x58\xf9\
+\x89\xc2\xd3\x2c\x92\x44\xf6\xf5\xe3\x91\xbc\x70\x5a\x68\x7b\x48\
+\x92\x9d\xa8\xf0\x32\xb4\xa7\x19\x1c\x74\x9c\x3e\x34\x82\x84\x5b\
+\x1e\x42\x17\xac\x6a\x4b\xf5\xc7\x80\x2b\xd4\x0c\xe8\x0d\x3a\x5a\
+\x01\xd0\x07\x98\x87\x4a\x7f\x6e\xb9\xb7\xff\x40\xba\x74\xea\xd0\
+\xfb\x48\x4e\x2a\x27\x2d\x98\x89\xc3\xe2\x14\xc5\x68\xb6\xd8\xb9\
+\xe3\x59\x71\x2c\x50\xf0\x2e\x0b\x5f\xde\x45\x8b\x45\xd9\x2e\xd6\
+\xf8\xb3\xfa\x13\x92\xd1\x59\x9d\x84\x3c\x9c\x4e\x6b\x25\x32\xb4\
+\xa2\xcd\xed\x57\x0d\x51\x71\x24\xdc\xf4\x10\x5a\x7f\xd5\x4e\x6e\
+\x4b\xc0\x3b\xc8\xfd\x60\x3a\x8c\x8e\x54\x00\xc4\x21\x9f\xff\x54\
+\xa5\x25\x5f\x90\x59\xc7\xe2\x07\xfb\xd1\x35\x51\xdc\xfc\x4f\xe5\
+\xa9\x29\x5d\x08\x32\x2b\xdb\x63\xf3\xe5\xf2\x32\xbe\x5d\x5d\xa9\
+\x52\x46\x82\xe0\x5c\xfb\x37\x96\xb3\x63\xa5\xb2\x0d\xac\x5a\x93\
+\xd1\x67\x8e\xfd\xb5\x95\x9f\xb1\x89\xe0\x36\x6e\x0a\x04\x30\xc6\
+\x27\x91\x70\xeb\x23\x68\xfd\x54\xeb\xb2\xea\x87\xdc\x0c\xae\x93\
+\x5a\x01\x3d\x5d\x47\x29\x00\xfc\x81\xaf\x51\xe9\x7f\xac\xbf\x49\
+\xcb\xe2\x07\xfb\xd1\x37\xcd\xf7\x06\xfb\xa8\x2d\x26\xd4\xc8\x1d\
+\x97\x29\x6f\xe4\x31\x73\xf6\x41\x5a\xac\x62\x5c\xa0\xe0\xd9\x6c\
+\x36\x3b\x5f\xbd\xb8\x4b\x71\x9c\xd4\xb1\x23\x31\x86\x75\xbc\xd7\
+\x97\x90\xa0\x1a\xfc\x4c\x8d\x6d\xfe\xfd\xa6\x4e\xc9\xc4\xdf\x70\
+\x1f\x1a\x83\x6a\x9b\xaf\x63\x91\x8b\x00\xdf\x6f\xdf\x4a\xc7\x28\
+\x00\x8e\x2f\xed\xf4\x56\x23\x98\x4e\x2b\xb1\xe0\xce\x3e\x3e\x35\
+\xd2\xd7\xd9\x6e\xbf\x34\x85\xb4\x58\x65\x3f\x4f\x3b\xf6\xd7\xf3\
+\xc6\x82\x22\x95\x32\x12\x04\xe7\x58\xf3\xe5\x61\x8a\x0e\xd4\x28\
+\x8a\xe1\x17\x1d\x4e\xf2\xc5\x67\xab\x94\x91\x77\x91\x90\xdb\x05\
+\xb7\x75\x3f\x00\x80\x39\x2d\x9b\xb8\x69\xff\x06\x8d\x6a\xb7\xb3\
+\x1c\xe4\x81\x70\x3e\xaf\x23\x14\x00\x77\x03\x63\xd5\x0a\xf6\xfc\
+\xf4\x6c\xce\xcf\xf1\x9d\x86\x1c\xae\x60\xd4\x6b\x78\xe2\xea\x2e\
+\x8a\xe3\xfc\xe7\xe5\x7c\xca\x2a\x5b\x54\xc8\x48\x10\xd4\xd7\x50\
+\x63\xe1\xfb\x77\xf6\x2b\x8e\x93\x75\xcd\xe5\x68\x0c\x1d\xb7\x97\
+\x88\x56\x63\x23\xaa\x1d\xfb\x01\x00\x02\x7a\xf4\x23\x66\xc2\xf5\
+\x6a\xa6\x31\x1e\xb8\x5d\xcd\x80\x9e\xc8\xd7\x0b\x80\x73\x80\x87\
+\xd5\x0a\x76\xe7\xe5\xa9\xfc\x73\x94\xaa\xc3\x29\x3a\x8c\xcb\x07\
+\xc7\x70\x4e\x2f\x65\x23\x3e\x2b\xaa\x5b\x78\xe8\xf5\x7c\x95\x32\
+\x12\x04\x75\x7d\xfb\xd6\x3e\xea\xaa\x9a\x15\xc5\x08\xef\x9e\x41\
+\xf4\xa0\x5e\x2a\x65\xe4\xbd\x4c\xc6\x26\x42\x82\xda\xd7\x0e\x3c\
+\x64\xc8\x48\xc2\xce\xbe\x48\xcd\x34\x9e\x44\xee\x13\xe0\xb3\x7c\
+\xb9\x00\x48\x47\xee\xf2\xa4\x55\x23\xd8\xd8\xdc\x58\x1e\x9b\x2c\
+\xe6\x47\x28\xf1\xdc\xf4\x6c\x74\x5a\x65\x47\x9a\x5e\xfd\xa8\x88\
+\x6d\x7b\x4f\x3f\x52\x54\x10\x5c\xa9\xf8\x50\x1d\x6b\xbf\x3a\xac\
+\x28\x86\xa4\xd1\x90\x35\x5d\x8c\xac\x3f\x2e\x38\xb0\x7d\xfb\x01\
+\x00\xa2\x2e\xbf\x86\xc0\xde\x83\xd4\x4a\x41\x03\xbc\x07\xa8\xda\
+\x83\xd8\x93\xf8\x6a\x01\x10\x00\x7c\x01\x28\xeb\x44\xd3\x6a\x70\
+\x97\x50\xde\x9d\xd9\x53\xf1\x99\xf6\x8e\xae\x6b\x62\x00\xd3\xcf\
+\x55\xd6\xca\xd3\x6a\xb3\x33\xf3\xa9\x03\x2a\x65\x24\x08\xea\x58\
+\xf8\xd2\x2e\xac\x2d\xca\x36\xa9\x26\x8c\x1c\x42\x60\x72\x87\xd9\
+\x80\x7e\x5a\xff\xdb\x0f\xa0\x69\xc7\x71\x4a\x49\x22\x76\xca\x4c\
+\x35\x87\x07\x85\x01\x9f\xe1\xa3\x9b\x02\x7d\xb5\x00\x78\x15\xe8\
+\xaa\x46\xa0\x94\x18\x33\x5f\xdc\x9b\xa3\x78\xc2\x9d\x20\x9b\x75\
+\x55\x26\xe1\x81\xca\xa6\x24\x2e\x5b\x5b\xc5\x57\x3f\x96\xab\x94\
+\x91\x20\x28\xb3\x63\x65\x31\x7b\xd6\x95\x2a\x8a\xa1\x0f\x30\x93\
+\x3e\xf1\x42\x95\x32\xf2\x1d\x5a\x8d\x8d\x88\xb0\x8a\x76\x7d\x8d\
+\xc6\x60\xa4\xd3\x0d\xff\xc1\x10\x19\xab\x56\x1a\x3d\x81\x37\xd5\
+\x0a\xe6\x49\x7c\xf1\xae\x76\x03\x30\x49\x8d\x40\xe1\x81\x06\xbe\
+\x79\xa0\x1f\x51\xc1\x1d\x6f\xac\xaf\xb3\x84\x05\xea\xb9\xef\x0a\
+\xe5\x2b\x6a\xb7\xcd\x3e\x48\x53\xb3\x18\x17\x28\xb8\x97\xd5\x62\
+\x63\xd1\x6b\x7b\x14\xc7\x49\x9b\x30\x0a\x43\x90\xe8\x29\x72\x22\
+\x66\x63\x23\x81\xfe\x6d\x9b\x17\x70\x9c\x36\x20\x88\x4e\x37\xdc\
+\x87\xd6\x5f\xb5\xbf\xd3\x09\xc0\x74\xb5\x82\x79\x0a\x5f\x2b\x00\
+\x7a\x02\x4f\xab\x11\xc8\xa0\xd3\xb0\xe0\xae\xde\x64\xc6\xab\xd6\
+\x64\x42\x68\x75\xe3\xa8\xce\x8a\x1b\x28\xed\x3f\xdc\xc8\x0b\xef\
+\x2b\x9b\xb1\x2e\x08\x4a\xfd\xfc\xc9\x21\x4a\x0f\xb7\xef\xe6\xf4\
+\x57\xfe\x9d\x62\x48\xba\xe0\x4c\x95\x32\xf2\x4d\xe1\xc1\xd5\xe8\
+\x75\xed\x3b\x01\x64\x88\xe9\x44\xfc\xf5\xf7\x22\xe9\x54\x3b\x51\
+\xf1\x12\x2a\x4e\x8f\xf5\x04\xbe\x54\x00\x84\x22\x3f\xf7\x57\xdc\
+\x94\x5f\x92\x60\xde\xcc\x1e\x9c\xd5\x3d\x5c\x79\x56\xc2\xdf\xe8\
+\xb4\x12\xcf\xcf\xc8\x56\x1c\xe7\xd1\x39\x87\x29\x2c\x51\xb6\xeb\
+\x5a\x10\x1c\x55\x5b\xd1\xcc\x0f\xef\x29\xdf\x8f\x92\x35\xed\x72\
+\x24\xad\x2a\x7b\x95\x7d\x96\x24\xd9\xda\xd5\x2a\xf8\x38\x73\x5a\
+\x36\xb1\x93\x6e\x94\x5f\xd4\x95\x33\x01\x1f\x03\x3e\xd3\xa1\xc9\
+\x57\x0a\x00\x09\xf8\x3f\x20\x59\x8d\x60\x77\x5e\x9e\xca\xf8\x33\
+\x94\xf5\xb0\x17\x4e\x6d\x44\xcf\x08\x46\xf5\x55\x36\xd1\xab\xa6\
+\xce\xca\x7f\x5e\x11\xc7\x02\x05\xf7\x58\x32\x67\x0f\x8d\x75\xca\
+\xfa\x52\x44\xf5\xeb\x4e\x64\x8e\x2a\xdb\x95\x7c\x9e\xd1\xd0\x4c\
+\x70\x50\xfb\x9b\x2c\x05\xf5\x1f\x46\xd8\xd9\x17\xab\x95\x46\x1a\
+\xf0\x36\xb4\xbb\x16\xf1\x48\xbe\x52\x00\xdc\x0c\xa8\x72\x00\xf4\
+\xec\x9e\x8c\x1a\x28\x17\x00\x00\x20\x00\x49\x44\x41\x54\xe1\x3c\
+\x7a\x95\x38\xee\xe7\x0a\xcf\xcf\xc8\xc6\xa8\x57\xf6\x2d\xf8\xce\
+\x97\xc7\xf8\xf5\xb7\x5a\x95\x32\x12\x84\xb6\x29\xd8\x5b\xcd\xfa\
+\xc5\x05\x8a\x62\x68\x74\x3a\xba\x5c\x73\x99\x4a\x19\x75\x0c\xa1\
+\x01\x35\x18\x0d\x6d\x1b\x1d\xfc\x47\x51\x97\x5e\x8d\x7f\x96\x2a\
+\xcd\x60\x01\x2e\x03\xfe\xa1\x56\x30\x77\xf2\x85\x02\xa0\x1b\xf0\
+\xb8\x1a\x81\x12\x23\xfd\xf8\xf0\xf6\xde\x68\x35\x3e\x51\xdc\x79\
+\xbc\xb4\x58\xb3\xe2\xc6\x4a\x36\x1b\xdc\xf2\xe4\x01\xec\x62\x4c\
+\x80\xe0\x22\x76\x3b\x7c\xf5\xc2\x2e\xec\x36\x65\xdf\x74\x49\x17\
+\x0e\xc3\x3f\x3e\x5a\xa5\xac\x3a\x08\xc9\x4e\x44\x48\x39\x92\xd4\
+\xce\xbf\x7b\x8d\x86\xb8\x69\xff\x42\x1f\xae\x6c\xd5\xf1\x0f\x9e\
+\x41\xde\x73\xe6\xd5\xbc\xbd\x00\x30\x01\x1f\xa0\xc2\x73\x7f\x93\
+\x41\xc3\x67\x77\xf7\x21\x52\xec\xf8\x77\xa9\x07\xc6\xa7\x13\x13\
+\xaa\x6c\x90\xc7\x2f\x5b\x6a\xf8\x68\x49\x89\x4a\x19\x09\xc2\xa9\
+\x6d\x59\x56\xc8\xc1\xad\xed\x3b\x9a\xf6\x57\x86\xe0\x40\x52\xaf\
+\xf0\xe9\x26\x73\x4e\x63\xd0\xb7\x10\x12\xd8\xfe\x47\x01\x5a\xff\
+\x40\xe2\xa7\xdf\xa1\xd6\xa6\x40\xd5\xee\x3d\xee\xe4\xed\x05\xc0\
+\x8b\x40\x77\x35\x02\xbd\x7c\x5d\x57\x31\xdd\xcf\x0d\x82\xcc\x3a\
+\x1e\xba\x32\x5d\x71\x9c\x3b\x9e\xcd\xa3\xae\xa1\xed\x03\x44\x04\
+\xc1\x11\x96\x26\x2b\x4b\xe6\xec\x55\x1c\x27\xe3\xaa\x8b\xd0\xfb\
+\x7b\xf5\xbd\xc3\xad\x42\x02\x6a\x31\xe8\xdb\xbf\x01\xd8\xd4\x39\
+\x9d\xe8\x71\x33\xd4\x4a\x23\x1b\x95\x4e\x9d\xb9\x8b\x37\x6f\x3d\
+\xbd\x1c\xb9\x57\xb3\x62\xd7\x9d\x97\xc8\xfd\xe3\x95\xdf\x84\x04\
+\xc7\xf4\x4e\x0d\xe2\x9b\xf5\x25\x14\x94\x37\x39\x1c\xa3\xba\xce\
+\x8a\x5e\x2f\x31\xac\x5f\xc7\x2e\xe2\x5a\xac\x76\x4a\x2a\x5a\x38\
+\x54\xd8\xc4\xae\x83\x0d\x2c\xfe\xb9\x82\xed\xfb\x1d\x6b\x9d\x1c\
+\x10\x66\x24\x30\xcc\x48\x73\x83\x15\x6c\xa0\x33\x68\x90\x3a\xf8\
+\xe3\xb1\xe5\xf3\x0f\xb0\x63\x65\xb1\xa2\x18\x41\x29\x9d\xe8\x7a\
+\xc3\x04\x24\xd1\x59\xd4\x71\x12\x98\xf4\x16\x6a\xea\xdb\x7f\x4c\
+\xdb\x94\x94\x86\xa5\xbc\x84\xa6\x23\x07\xd5\xc8\xa4\x1f\xb0\x05\
+\x50\x3e\x03\xda\x0d\xbc\xf5\x3b\x30\x16\xd8\x06\x28\x3e\xa7\x37\
+\x20\x23\x84\x9f\x1e\x1f\xa8\x78\x33\x9a\xa0\xcc\xaa\x9d\x15\x9c\
+\x71\xd7\x2f\x8a\x9e\xe5\xfb\x19\x35\xec\xfc\x6f\x1f\x92\xe2\x54\
+\x9b\x0d\xee\x51\x6a\xea\xac\xe4\x15\x34\x71\xf0\x68\x23\x79\x47\
+\x5b\x3f\x17\x34\x51\x58\xd2\x4c\x59\x95\x85\x92\x72\x0b\x55\xb5\
+\xce\x5d\x05\x31\xf9\xeb\xf0\x0f\x31\xe0\x1f\x62\x20\x30\xcc\x40\
+\x68\x8c\x1f\x61\xb1\x7e\x84\xc5\x9a\x09\x8d\x35\x11\x16\x6b\xc6\
+\xe0\xe7\xcd\xef\x2b\x4e\xae\xaa\xa4\x91\xa7\x27\xae\xa4\xb9\x51\
+\xd9\xdf\xf1\x80\xc7\x66\x12\xd6\x4d\xbc\xe1\x50\x43\x79\x75\x30\
+\x55\x35\xed\xef\x29\x62\xb7\x34\x73\xe8\x99\x7b\x68\x3c\xa4\x7c\
+\x35\x07\x28\x45\x5e\x89\xf6\xba\x79\xe5\xde\x5a\x00\x7c\x0d\x8c\
+\x52\x1a\x24\x2a\xd8\xc0\x86\xe7\x86\xd0\x29\xc2\xa4\x42\x4a\x82\
+\x52\xe3\x9e\xdc\xc4\x82\x55\xca\x9a\xfb\x8c\x3f\x2f\x82\x0f\x9f\
+\xca\x54\x29\x23\xf7\x28\xab\x6c\x61\xcb\x9e\x3a\xb6\xed\xad\x63\
+\xdb\xde\x7a\xb6\xee\xa9\xe3\xc0\x91\x46\xaf\x19\x85\xec\x1f\x6c\
+\x20\x2c\xce\x8f\x98\x94\x40\x62\x53\x03\x88\x49\x0d\x24\x36\x35\
+\x10\x73\x90\x77\x8f\xb8\xfd\xe0\xc1\x2d\x6c\x59\xae\xec\x35\x3e\
+\x76\x48\x0e\xbd\xee\x98\xa6\x52\x46\x82\xcd\x2e\x71\xb4\x38\x8a\
+\x96\x16\x5d\xbb\xbf\xd6\x52\x5e\x42\xde\xe3\xff\xc2\x5a\x5b\xa5\
+\x46\x2a\x0b\x51\xe9\x24\x9a\x2b\x79\x63\x01\x30\x03\x98\xa3\x34\
+\x88\x4e\x2b\xf1\xdd\xc3\xfd\x19\x26\x9a\xfd\x78\x8c\xc3\xa5\x8d\
+\x74\xf9\xc7\x4f\xd4\x37\x29\x7b\x87\xf5\xd3\x3b\xdd\x39\x33\x27\
+\x48\xa5\xac\x9c\xeb\x58\x99\x85\x5f\xb6\x54\xf3\xcb\x96\x1a\xb6\
+\xec\x96\x6f\xf8\x05\x3e\xda\xdc\x28\x38\xd2\x44\x4c\x4a\x00\xb1\
+\x69\x81\x24\x66\x87\x90\xd4\x2d\x84\x80\x50\xef\xd8\x74\x7b\xe8\
+\xb7\x4a\x5e\xfb\xe7\x5a\x45\x2b\x54\x5a\x83\x9e\x33\x5e\xbd\x1f\
+\xbf\x28\xf1\x9a\xa3\xa6\xc6\x26\x23\x85\xa5\x8e\x8d\x1a\xaf\xdb\
+\xb9\x99\xc3\x2f\x3f\x24\x1f\x27\x52\x6e\x1a\x72\x8f\x00\xaf\xe1\
+\x6d\x05\x40\x32\xf2\xf3\x96\x40\xa5\x81\x1e\x9c\x90\xce\x03\x13\
+\xc4\x32\x9c\xa7\xb9\xff\xfd\x3d\x3c\xf2\xf1\x3e\x45\x31\x7a\x77\
+\xf1\x67\xfd\x47\xbd\xd0\x78\xe0\x53\x9d\x03\x47\x1a\x59\xb9\xa9\
+\x9a\x55\x9b\x6a\x58\xb9\xa9\x9a\x9d\x07\xea\x3b\xf4\x11\xc6\xc0\
+\x70\x23\xc9\x3d\x42\x49\xea\x1e\x42\x72\xf7\x50\xe2\xd2\x03\x3d\
+\x6e\x9f\x81\xdd\x66\xe7\xe5\xeb\xd7\x70\x64\x57\xfb\xe6\xd3\xff\
+\x55\xda\xf8\x0b\x48\xbf\x52\x0c\xfc\x71\x86\xd2\xca\x50\x6a\xea\
+\x1c\x1b\xd8\x57\xf2\xdf\xf7\x28\x5b\xb2\x40\x8d\x34\x6a\x81\x5e\
+\xc0\x7e\x35\x82\xb9\x82\x67\xfd\xa4\x9d\x9a\x06\x58\x0e\x0c\x55\
+\x1a\x28\x37\x2b\x94\x1f\x1f\x1b\xa8\x78\x36\xbd\xa0\xbe\x86\x66\
+\x2b\x5d\xfe\xb1\x82\xfc\x92\x06\x45\x71\xde\x7c\x30\x8d\x69\x97\
+\xb9\xff\x8c\x75\x41\x49\x33\x4b\x56\x56\xb0\x64\x55\x25\xcb\xd6\
+\x56\x52\x5e\xe5\x1d\xcb\xf8\xee\x62\x0e\xd2\x93\x96\x13\x4e\xe6\
+\x80\x08\x32\x07\x44\x10\x18\xee\xfe\xfd\x1c\xeb\xbe\x3e\xc2\x67\
+\x4f\x6d\x57\x14\xc3\x14\x1e\xc2\x99\xaf\x3d\x88\xd6\xe4\x1d\x2b\
+\x1e\xde\xc6\x66\x93\x38\x72\x2c\x06\xab\xad\xfd\x55\xbf\xdd\x66\
+\x25\xff\xe9\xbb\x69\x38\xb8\x5b\x8d\x54\x56\x22\xdf\xa3\xbc\x62\
+\x52\x99\x37\xdd\x01\x6f\x01\x9e\x57\x1a\x24\xc8\xac\x63\xf3\x0b\
+\x43\x48\x8e\xf6\xc9\xf1\xce\x3e\xe1\xfd\x1f\x0b\xb8\xea\xd9\xcd\
+\x8a\x62\x44\x85\xe9\xd9\xf3\x75\x0e\xc1\x01\xae\xdd\x90\x66\xb5\
+\xd9\xd9\xbc\xab\x8e\x85\x3f\x95\xf3\xf5\x4f\x15\x6c\xdc\x59\xdb\
+\xa1\xdf\xe1\x2b\x15\x16\xe7\x47\xd6\xe0\x28\xb2\x06\x47\x92\xd2\
+\x33\x14\xad\x8b\x37\xeb\x36\xd5\xb7\x30\x7b\xe2\x4a\x6a\xca\x1c\
+\x3f\xa1\x02\xd0\xf3\x5f\x53\x89\x1b\xda\x4f\xa5\xac\x84\x13\xa9\
+\xa9\xf3\xa7\xb4\x32\xc4\xa1\xaf\x6d\x2e\x29\x24\x6f\xd6\xad\xd8\
+\x9a\x1a\xd5\x48\xe5\x66\xe4\xc1\x41\x1e\xcf\x5b\xb6\xeb\x76\x06\
+\x3e\x05\x14\x97\xcf\x6f\xde\xd4\x9d\xa1\xdd\xc4\x33\x38\x4f\xd6\
+\x3d\x29\x90\x65\x5b\x4b\xc9\x2f\x71\xfc\x87\xb1\xae\xc1\x86\xd5\
+\x6a\xe7\x9c\x41\x8e\xbd\x20\xb4\x47\xb3\xc5\xce\xe2\x95\x15\x3c\
+\x32\xe7\x30\xd3\xee\xdf\xc7\x4b\x1f\x14\xf2\xd3\xfa\x6a\x31\xa8\
+\x48\x05\x0d\x35\x2d\x1c\xde\x51\xc5\xc6\xa5\x05\xac\xfe\x3c\x9f\
+\x63\x87\xea\xd0\xe9\x34\x84\xc6\xf8\xa1\x71\xc1\x0a\xde\xd2\xb9\
+\x7b\xd9\xfb\x6b\x99\xa2\x18\x21\x5d\x52\xc8\x9e\x3e\x46\xad\x81\
+\x34\xc2\x49\x18\x0c\x16\x1a\x1a\x4d\x58\x6d\xed\xbf\xad\x69\xfd\
+\x03\xd1\x05\x85\x52\xbb\x75\x9d\x1a\xa9\x0c\x05\x3e\x02\x94\x75\
+\x8b\x72\x01\x6f\xf8\x8e\x94\x80\xa5\xc0\x39\x4a\x03\x8d\xc9\x8d\
+\x61\xc1\x9d\x3e\x35\xcd\xd1\x67\x6d\xdc\x5f\x45\xbf\xdb\x56\x63\
+\x53\xf0\xf6\xd9\xa0\x97\xd8\xf6\x79\x6f\x32\x92\xd4\x6f\xb8\x62\
+\xb5\xd9\xf9\x65\x4b\x0d\x0b\xbe\x2d\xe5\xc3\x6f\x4a\x29\xa9\x68\
+\x7f\x7f\x72\xc1\x71\x7e\x01\x3a\xb2\x72\xa3\xe8\x31\x2c\x86\x8c\
+\x01\x11\x68\x75\xea\xbf\x94\x95\x1d\xad\xe7\xd9\xc9\xab\x68\xb1\
+\x38\xbe\x9a\x2b\x49\x12\x83\x66\xff\x9b\xe0\x8c\xce\xea\x25\x26\
+\x9c\x54\x53\xb3\x9e\xc2\x92\x28\x1c\x7d\xd5\x28\x78\x6b\x36\xd5\
+\xeb\x57\xaa\x91\xca\x72\x60\x04\x38\x9c\x8a\x4b\x78\xc3\x0a\xc0\
+\x0c\xe0\x56\xa5\x41\x3a\x45\x98\xf8\xe6\x81\x7e\xf8\x19\xbc\xe1\
+\x8f\x2c\xc4\x86\x99\xc8\x2b\x6e\x60\xf3\x41\xc7\x37\x5e\x59\x6d\
+\x70\xa8\xa0\x89\x09\x17\x44\xaa\x96\xd7\x9a\xad\x35\x3c\xf2\xc6\
+\x11\xae\xb9\x7f\x2f\xaf\x7c\x54\xc4\xda\x6d\xb5\xd4\x37\x7a\xc5\
+\xe3\x3e\x9f\xd2\xd2\x6c\xa3\x70\x7f\x0d\x9b\x97\x15\xb2\xe6\xcb\
+\xc3\x94\x15\x34\x10\x10\x6a\x20\x38\x52\xbd\x23\xbd\x9f\x3c\xb6\
+\x8d\xe2\x43\x75\x8a\x62\x74\x1a\x31\x88\xc4\x0b\x14\x6f\x5b\x12\
+\xda\x48\xa7\xb5\xd1\x62\xd3\xd1\x6c\x71\xec\xc8\xa9\x39\xab\x17\
+\x35\xbf\xae\xc0\xd6\xe0\x58\xf3\xac\x3f\x48\x06\x0e\x01\xca\x9e\
+\x65\x3a\x99\xa7\xaf\x00\xc4\x01\xbf\x01\xa1\x4a\x82\x68\x24\x89\
+\x65\x8f\x8a\x23\x7f\xde\xe6\x58\x65\x13\x19\xd7\xff\x44\x75\xbd\
+\xb2\x8d\x73\x8b\x5f\xcb\xe6\xbc\x5c\xc7\xbf\x85\xaa\x6a\xad\x7c\
+\xbc\xa4\x84\xd7\x3e\x29\x62\xf3\x2e\x65\x37\x04\xc1\xb9\xa2\x92\
+\xfc\xc9\x39\x2f\x9e\xfe\xa3\x3b\x29\xea\x3b\xb0\x6f\x43\x19\x73\
+\x67\xae\x57\x94\x8b\xce\xcf\xc4\x99\xaf\x3f\x80\x31\xb4\x63\x77\
+\xa7\x74\x35\x25\x1b\x02\x01\xea\xf7\x6e\x27\xff\xf9\xfb\xd4\x38\
+\x1a\x58\x05\x74\x05\x8e\x2a\x0d\xe4\x2c\x9e\xfe\x76\xf8\x5d\x40\
+\xf1\x0c\xc7\x7b\xc6\xa5\x71\xcd\x39\x09\x2a\xa4\x23\xb8\x52\x80\
+\x49\x87\x04\x2c\xdb\xa2\xec\x19\xec\xc6\x9d\xb5\x5c\x3b\x26\xa6\
+\xdd\x53\x1e\x37\xec\xa8\xe5\xa1\xd7\x0e\x33\xe5\xbe\xbd\x7c\xbe\
+\xac\x8c\xa2\x52\xb1\xcc\xef\xe9\xea\xaa\x2c\xec\xdb\x50\xc6\xaa\
+\x05\x87\x28\x3a\x50\x8b\x5f\xa0\x9e\xb0\x58\x73\xbb\x1e\xbf\xdb\
+\xac\x76\xde\xbd\x67\x13\xb5\x95\xca\xf6\x70\xa4\x4f\xbc\x90\xc8\
+\x3e\x5d\x15\xc5\x10\xda\x4f\x92\x40\xd2\xd8\x69\x68\x74\x6c\x35\
+\x48\x1f\x1e\x85\xbd\xb9\x89\x86\xfd\x3b\x95\xa6\x62\x02\x92\x80\
+\x4f\x94\x06\x72\x16\x4f\x2e\x00\xce\x07\x1e\x51\x1a\x24\x27\x2d\
+\x98\xf9\xb7\xf5\x12\x23\x7e\xbd\x54\xff\x8c\x10\x3e\xfe\xb9\x90\
+\xf2\x1a\xc7\x6f\xbe\xa5\x15\x2d\x44\x84\xe8\x19\xd0\xe3\xf4\xed\
+\x23\x9a\x9a\x6d\xcc\x5f\x58\xc2\xe4\x7b\xf6\xf0\xe8\x9c\x23\x6c\
+\xd8\x51\x8b\xa5\xc5\xa3\x1f\xe3\x09\x27\x60\xb3\xd9\x39\x96\x57\
+\xcb\xc6\xa5\x05\xfc\xb6\xa2\x18\xbd\x51\x43\x74\xe7\x80\x36\x6d\
+\x1c\x5c\xf5\x79\x3e\x1b\x97\x16\x28\xba\xbe\x39\x26\x82\x9e\xb7\
+\x4d\x41\xd2\x7a\x60\x33\x8a\x0e\xc0\x60\xb0\x50\xdf\xe8\xe7\xd0\
+\x86\x40\x00\x73\x46\x77\xea\x76\x6c\xa4\xa5\xb2\x5c\x69\x2a\xd9\
+\xc0\x46\x60\x8f\xd2\x40\xce\xe0\xa9\x05\x80\x3f\xf0\x0d\xa0\x68\
+\x0b\xb7\x9f\x41\xcb\xf7\x8f\xf4\x17\x23\x7e\xbd\x98\x56\x23\xd1\
+\x29\xdc\xc4\xc7\x2b\x95\xb5\x08\x5e\xbb\xad\x86\x69\x97\x45\x63\
+\x36\x9d\xf8\x5b\xbe\xba\xd6\xca\xeb\x0b\x8a\x18\x7f\xc7\x6e\xe6\
+\x7f\x5d\x42\x71\xb9\x78\xb7\xef\x2b\x6a\x2b\x9a\xd9\xb1\xb2\x98\
+\xb5\x0b\x8f\xd0\xdc\x68\x25\x36\x35\x10\xbd\xf1\xc4\xdf\x07\xf5\
+\xd5\x16\xde\xfb\xcf\x66\x2c\x4d\xca\x96\x7f\xbb\xdf\x3c\x89\xc0\
+\xa4\x38\x45\x31\x04\xc7\x49\x80\x5e\xd7\x42\x6d\xbd\x63\xc7\xbd\
+\x25\x8d\x06\x73\x5a\x36\x95\xab\xbf\x07\x9b\xe2\xf9\x1a\x03\x81\
+\xb9\x80\xc7\xbd\xa8\x78\x6a\x01\x30\x0b\xb8\x40\x71\x90\x49\x99\
+\x5c\xd4\xdf\xfd\xcd\x60\x04\x65\xb2\x12\x02\xf8\x65\x57\x05\xfb\
+\x8b\x1c\xdf\x98\xd3\xd8\x64\xa3\xae\xde\xc6\xa8\x33\xff\xbc\x17\
+\xe0\xe0\xd1\x46\x1e\x7c\x2d\x9f\xab\xee\xde\xcb\xc2\x1f\xcb\xa9\
+\xae\x13\x23\x85\x7d\x55\x73\xa3\x95\x03\x9b\x2b\xf8\xe5\x8b\x7c\
+\x2a\x8f\x35\x10\x99\xe0\x8f\xf9\x2f\x6f\x0e\xbe\x7e\x65\x37\x07\
+\xb7\x28\x3b\xbd\x15\xde\x23\x93\xcc\xc9\x17\x2b\x8a\x21\x28\xa7\
+\xd7\x59\x69\xb2\x18\x1d\x9a\x13\x00\xa0\x0d\x08\x42\x42\xa2\x7e\
+\xf7\x56\xa5\xa9\x84\x22\x37\xb2\x5b\xa6\x34\x90\xda\x3c\x71\x5d\
+\xbc\x2b\xb0\x09\x50\x34\x39\xa4\x67\x72\x10\xbf\x3e\x9b\x8b\x5e\
+\x74\xfb\xf3\x09\x3b\x0e\xd7\xd2\xf3\xe6\x9f\x69\xb1\x3a\xbe\x1c\
+\xaf\xd5\x48\x6c\xfc\xa4\x27\x3d\x32\xfc\xd9\x7f\xb8\x91\x87\x5f\
+\x3f\xcc\xfb\x8b\x4a\xb0\xda\x7c\x6b\x89\x3f\x20\x20\x80\x88\x88\
+\x08\x22\x23\x23\x09\x0f\x0f\x27\x30\x30\x10\xa3\xd1\x88\xd9\x2c\
+\xbf\x1b\xd2\xeb\xf5\x14\x14\x14\x50\x55\x25\x0f\x41\x09\x0e\x0e\
+\x26\x2e\x2e\x0e\x8b\x45\x7e\x83\x52\x5f\x5f\x4f\x53\x53\x13\x35\
+\x35\x35\x94\x96\x96\x52\x52\x52\x42\x59\x59\x19\xb5\xb5\xb5\x6e\
+\xfb\x33\x39\x83\x46\x2b\xd1\xfb\x9c\x58\x46\x4c\x4d\x23\x2c\xd6\
+\x8f\x63\x79\xb5\x3c\x3f\x75\x35\x36\x05\xdf\x63\x92\x46\x43\xee\
+\x0b\xf7\x88\x77\xff\x1e\xa2\xb9\x45\x4f\xc1\x31\xc7\x8f\x05\xda\
+\x6d\x56\x0e\x3d\x71\x3b\x8d\x87\x0f\x28\x4d\xa5\x05\xc8\x01\x14\
+\x57\x13\x6a\xf2\xb4\xbb\xa3\x04\xfc\x0c\xe4\x2a\x09\xa2\xd3\x4a\
+\xac\x7d\x7a\x30\x7d\x52\xc5\xee\x5b\x5f\x72\xe3\x1b\xdb\x79\x65\
+\xd1\x21\x45\x31\x06\xf7\x0a\x24\x3b\xc5\xcc\xbc\xaf\x8a\xbd\xf2\
+\xd9\x7e\x70\x70\x30\xc9\xc9\xc9\x74\xee\xdc\x99\xce\x9d\x3b\x93\
+\x9c\x9c\x4c\x72\x72\x32\x49\x49\x49\x44\x44\x44\x10\x1e\x1e\x8e\
+\xd1\xe8\x9c\xf6\xb9\x4d\x4d\x4d\x94\x95\x95\x51\x5a\x5a\xca\xa1\
+\x43\x87\x38\x78\xf0\x20\x07\x0f\x1e\x24\x2f\x2f\xef\x7f\x9f\x8f\
+\x17\x15\xde\x44\xab\x93\xe8\x7b\x41\x3c\xc5\x87\xea\x14\xbf\xfb\
+\x4f\x1a\x35\x8c\xec\xeb\xc6\xa9\x94\x99\xa0\x86\xd2\x8a\x50\x6a\
+\x1c\x7c\x14\x00\xd0\x78\x68\x2f\x79\x4f\xdd\xa1\xc6\xa9\x80\x15\
+\xc0\x30\x3c\xa8\x37\x80\xa7\x15\x00\x93\x90\x77\xfe\x2b\x72\xe7\
+\xe5\xa9\x3c\x71\xb5\x77\x8f\x84\x15\xfe\xae\xa2\xd6\x42\xfa\x75\
+\x3f\x51\x56\xe3\xfb\x1d\xf6\xf4\x7a\x3d\xe9\xe9\xe9\xe4\xe4\xe4\
+\xd0\xb5\x6b\x57\xb2\xb3\xb3\xe9\xdb\xb7\x2f\xb1\xb1\xb1\xee\x4e\
+\xed\x94\x2a\x2a\x2a\xd8\xbe\x7d\x3b\x1b\x36\x6c\x60\xc7\x8e\x1d\
+\x6c\xdf\xbe\x9d\x4d\x9b\x36\x51\x5f\xaf\xf8\x5c\xb5\xc7\xd3\x07\
+\x98\x39\xf3\xf5\x07\x31\x04\xb5\x7f\x3e\xbd\xe0\x3c\x56\xab\x96\
+\xc3\xc7\xa2\xb0\xdb\x1d\xdf\x90\x59\xfc\xe9\x5b\x94\x2f\xfb\x4a\
+\x8d\x74\xae\x04\x3e\x54\x23\x90\x1a\x3c\xa9\x00\x08\x00\x0a\x5b\
+\x3f\x3b\x2c\x39\xda\xcc\xb6\x97\xce\xc0\xff\x24\x9b\xbd\x04\xef\
+\xf6\xe2\xc2\x3c\x6e\x99\xbb\xc3\xdd\x69\xa8\x4a\x92\x24\x32\x33\
+\x33\x19\x3c\x78\x30\x43\x86\x0c\x61\xc0\x80\x01\x64\x64\x64\xa0\
+\xd3\x39\xf6\xec\xd2\xd3\xb4\xb4\xb4\xb0\x67\xcf\x1e\xd6\xae\x5d\
+\xcb\xca\x95\x2b\x59\xbd\x7a\x35\xbb\x76\xed\x72\x77\x5a\xaa\xcb\
+\xbe\x76\x1c\x49\x17\x0e\x73\x77\x1a\xc2\x09\x54\x54\x07\x51\x59\
+\xe3\xf8\x10\x59\x5b\x73\x13\x07\x1f\xbd\x19\x4b\x49\x91\xd2\x54\
+\x6a\x80\x58\xc0\x23\x1a\x8a\x78\x52\x01\xf0\x05\x70\x89\x92\x00\
+\x92\x04\xdf\x3e\xdc\x9f\x11\x3d\x1d\x9b\x0d\x2d\x78\xbe\x16\xab\
+\x9d\x3e\xb7\xae\x64\xdb\xa1\x1a\x77\xa7\xe2\x30\x8d\x46\x43\xdf\
+\xbe\x7d\x39\xeb\xac\xb3\xc8\xcd\xcd\x65\xd0\xa0\x41\x44\x44\x74\
+\xac\xef\xd9\xd2\xd2\x52\x56\xaf\x5e\xcd\xaa\x55\xab\xf8\xe1\x87\
+\x1f\xd8\xb0\x61\x03\x36\x75\x66\xb2\xbb\x45\x40\x42\x0c\x43\x5e\
+\xbc\x17\x49\x2b\xde\x78\x78\x22\x9b\x5d\xe2\x48\x91\xe3\xcd\x81\
+\x00\xea\x77\x6f\x25\xff\x85\xfb\x51\x61\xba\xd7\x97\xc0\xa5\x4a\
+\x83\xa8\xc1\x53\x0a\x80\x2c\x60\x3b\x0a\xf3\x99\x7e\x6e\x02\x73\
+\x6f\xec\xae\x4e\x46\x82\xc7\x5a\xb6\xa5\x8c\x11\xff\x59\xeb\xee\
+\x34\xda\x25\x3c\x3c\x9c\xe1\xc3\x87\x33\x62\xc4\x08\x2e\xbc\xf0\
+\x42\xe2\xe2\xc4\x26\xb1\x3f\x2a\x2d\x2d\xe5\x87\x1f\x7e\xe0\xfb\
+\xef\xbf\x67\xe1\xc2\x85\x14\x16\x2a\x3b\xf6\xe9\x6a\xfd\x1e\xbc\
+\x91\x88\x3e\xd9\xee\x4e\x43\x38\x85\xea\xda\x00\xca\xaa\x94\xed\
+\x0b\x2b\x9c\xf7\x3c\x55\x6b\x7e\x50\x9a\x8a\x1d\xe8\x81\xdc\xe5\
+\xd6\xad\x3c\xa5\x00\xd8\x00\x28\x9e\xd2\x33\xac\x7b\x38\x2f\x5f\
+\xd7\x95\xae\x89\xe2\x19\x9c\xaf\xbb\xf8\xd1\x0d\x7c\xb5\xee\x98\
+\xbb\xd3\x38\xa5\xcc\xcc\x4c\xc6\x8e\x1d\xcb\xe8\xd1\xa3\xe9\xdb\
+\xb7\x2f\x1a\x8d\x68\x0a\xd3\x16\x56\xab\x95\xf5\xeb\xd7\xb3\x70\
+\xe1\x42\x16\x2c\x58\xc0\x9e\x3d\x1e\xd9\x43\xe5\x7f\xa2\x07\xf4\
+\xa0\xcf\xbd\xd7\xbb\x3b\x0d\xe1\x34\xec\x76\x89\x23\xc7\xa2\x69\
+\xb1\x3a\xb6\x4a\xd3\x54\x98\xcf\xb1\x8f\xe6\x50\xbf\x67\x9b\x1a\
+\xe9\xac\x03\x06\xa8\x11\x48\x09\x4f\x28\x00\xce\x42\x9e\x9c\xa4\
+\x0a\x9d\x56\xe2\xfa\xf3\x12\x79\xe8\xca\x0c\xc2\x02\x15\x9d\x24\
+\x14\x3c\xd8\xfe\xa2\x7a\xba\xfe\x73\x05\x4d\x0a\x26\xb5\x39\x43\
+\x52\x52\x12\x17\x5f\x7c\x31\x63\xc7\x8e\x65\xc8\x90\x21\xee\x4e\
+\xc7\x27\x6c\xdf\xbe\x9d\x05\x0b\x16\xf0\xe1\x87\x1f\x7a\x5c\x31\
+\xa0\xd1\xe9\x18\xf2\xd2\x7d\xf8\xc7\x47\xb9\x3b\x15\xa1\x0d\xaa\
+\xeb\xfc\x29\xab\x6c\x5f\x7f\x39\x6b\x5d\x2d\xa5\x5f\x7f\x40\xe5\
+\x8a\x25\xd8\x95\x37\x05\xfa\xa3\x11\xb8\xb9\x37\x80\xbb\x0b\x00\
+\x0d\xb0\x1e\x15\xfa\xfd\xff\x55\x68\x80\x9e\x07\x26\xa4\xf3\xcf\
+\x0b\x92\xd0\x89\x5e\x00\x3e\xe9\x8e\xff\xdb\xc5\xec\xcf\x15\x9f\
+\xcf\x55\x2c\x2a\x2a\x8a\x49\x93\x26\x31\x7e\xfc\x78\xfa\xf6\xed\
+\xeb\xee\x74\x7c\xda\xaf\xbf\xfe\xca\x47\x1f\x7d\xc4\xfc\xf9\xf3\
+\x29\x29\x29\x71\x77\x3a\xa4\x5c\x76\x0e\x99\x53\x3c\xe2\x71\xae\
+\xd0\x06\x76\xe0\x48\x51\x4c\xdb\x56\x01\xec\x76\xaa\xd6\xfe\x48\
+\xf1\x67\xef\x60\xad\x75\xca\xf1\xd6\xf5\x40\x7f\xdc\x78\x2c\xd0\
+\xdd\x77\xc6\xc9\xc0\x3c\x67\x5e\xa0\x5b\x52\x20\xcf\x4d\xcf\x12\
+\x1b\x03\x7d\x8c\xc5\x6a\xe7\xf1\x05\xfb\x78\xf0\x83\xbd\x6e\xf9\
+\xe9\xd1\x68\x34\x0c\x1f\x3e\x9c\x49\x93\x26\x31\x76\xec\x58\xfc\
+\xfc\xfc\xdc\x90\x45\xc7\xd5\xdc\xdc\xcc\xd2\xa5\x4b\x99\x3f\x7f\
+\x3e\x9f\x7f\xfe\x39\x56\xab\x7b\x3a\x38\x76\xbe\x68\x38\x99\x57\
+\x5f\x82\x46\xef\x1b\x27\x36\x3a\x82\x9a\x3a\x33\xa5\x95\xa7\x9e\
+\x0e\x5a\xb7\x6b\x0b\xc5\x0b\xde\xa2\xa9\x40\x59\xdf\x91\x36\x70\
+\xeb\xb1\x40\x77\x16\x00\x26\x60\x37\x90\xe8\x8a\x8b\x5d\x32\x30\
+\x9a\xa7\xaf\xc9\x22\x35\xc6\xf1\x86\x10\x82\x67\x58\xb5\xb3\x82\
+\x69\x2f\x6e\x65\xf7\x51\xd7\x9f\xa4\x89\x8d\x8d\xe5\x9a\x6b\xae\
+\x61\xda\xb4\x69\x24\x27\x27\xbb\xfc\xfa\xc2\xdf\x1d\x38\x70\x80\
+\xb7\xde\x7a\x8b\x77\xde\x79\xc7\x2d\x9b\x07\x03\x12\x62\xe8\x76\
+\xd3\x55\x84\x76\x49\x71\xf9\xb5\x05\xc7\x1c\x39\x16\x8d\xe5\x04\
+\x2d\x82\x2d\x25\x45\x14\x7f\xf6\x0e\x35\x5b\xd6\xb8\x2a\x95\x3c\
+\xa0\x0b\xd0\xe4\xaa\x0b\xfe\x91\x3b\x0b\x80\xbb\x80\xc7\x5d\x79\
+\x41\xbd\x56\xe2\x1f\x17\x24\xf1\xc8\xc4\x0c\x82\xcc\xa2\x62\xf7\
+\x36\x2d\x56\x3b\x8f\x7e\xb2\x8f\x47\x3f\xde\xe7\xf2\xf6\xbd\x3d\
+\x7b\xf6\xe4\x86\x1b\x6e\x60\xf2\xe4\xc9\x98\x4c\x8e\x8d\x19\x15\
+\x9c\xcb\x62\xb1\xf0\xe5\x97\x5f\xf2\xf4\xd3\x4f\xb3\x6e\xdd\x3a\
+\x97\x5e\x5b\xd2\x68\x48\xbe\x74\x04\x19\x57\x8d\x16\x47\x01\xbd\
+\x40\x6d\xbd\x3f\x25\x15\xbf\xef\x05\xb0\x35\x35\x52\xfe\xdd\x17\
+\x94\x7d\xfb\x39\x76\x8b\xcb\x1b\x8d\xdd\x0e\x3c\xe3\xea\x8b\x82\
+\xfb\x0a\x80\x30\x60\x3f\x0a\xa7\xfd\x39\x2a\x22\xc8\xc0\x7d\x57\
+\xa4\x71\xe3\xa8\x24\x31\x26\xd8\x4b\xe4\x15\x37\x70\xd5\x33\x9b\
+\x59\xb5\x53\x59\xab\xd6\xf6\xca\xcd\xcd\xe5\xce\x3b\xef\xe4\xc2\
+\x0b\x2f\x44\x6a\xcf\x50\x79\xc1\xad\x56\xae\x5c\xc9\x93\x4f\x3c\
+\xc6\xa2\x6f\x96\x60\x57\x7e\x6e\xbb\xcd\x82\x33\x3a\xd3\xf3\xb6\
+\x29\xf8\xc7\x89\x4d\x81\x1e\xad\xf5\x44\x80\xa5\x45\x43\xd5\xda\
+\x1f\x29\xf9\x62\x1e\x2d\xd5\xae\x7d\x6d\xf9\x83\x0a\x20\xb5\xf5\
+\xb3\x4b\xb9\xeb\x15\xed\x49\xe0\x0e\x37\x5d\xfb\x7f\xfa\xa6\x05\
+\xf3\xc2\xb5\xd9\x0c\xee\x72\xea\xe7\x41\x82\x7b\xbd\xfd\xfd\x11\
+\x6e\x99\xb3\x9d\xda\x46\xd7\x3c\xe7\xd5\x6a\xb5\x5c\x75\xd5\x55\
+\xdc\x7e\xfb\xed\x74\xeb\xd6\xcd\x25\xd7\x14\x9c\x63\xdb\xd6\x2d\
+\xcc\x7e\xe2\x7e\x3e\xf8\xe4\x6b\xac\x56\xd7\x9c\x18\xd1\xf9\x99\
+\xc8\xbe\xee\x0a\xe2\x87\xbb\xfd\x94\x97\x70\x0a\x47\x37\x15\xb0\
+\xe7\xed\x8f\x68\x3c\xb4\xcf\xdd\xa9\x00\x3c\x06\xdc\xeb\xea\x8b\
+\xba\xa3\x00\x88\x05\xf6\x01\x1e\xf1\x30\x5e\x92\x60\xc2\x99\x71\
+\x3c\x79\x75\x17\x3a\x45\x88\xa5\x5d\x4f\x52\x5e\x63\xe1\xda\x57\
+\xb6\xf1\xd9\x6a\xc5\xed\x37\xdb\x44\xa3\xd1\x70\xc5\x15\x57\xf0\
+\xc0\x03\x0f\x90\x99\x29\x66\x49\xf8\x92\x5d\xdb\x56\xf0\xe0\x83\
+\x0f\xb2\xe0\xcb\x1f\xb1\xb9\xe8\xf1\x51\xec\x19\x39\x74\xbd\xe1\
+\x4a\xf4\xfe\x62\x83\xa8\x27\x69\x2c\xad\x64\xf7\xbc\x2f\x28\x58\
+\xb1\x5e\x8d\xae\x7e\x6a\xa9\x43\x5e\x05\x70\x69\x73\x13\x77\x3c\
+\xac\x7a\x02\x85\xd3\xfe\xd4\xb6\xed\x50\x0d\x6f\x2c\xc9\xc7\x66\
+\x87\xfe\x19\xc1\xe8\xb5\xa2\x61\x8b\xbb\x6d\x3e\x50\xcd\x88\xfb\
+\xd7\xb1\xda\x45\x4b\xfe\x23\x46\x8c\x60\xc1\x82\x05\xdc\x78\xe3\
+\x8d\x1d\xae\x2d\x6f\x47\x10\x11\x9d\xc4\x98\xcb\x47\x33\xe6\x82\
+\x6c\x4a\x4a\x2b\xd8\xb9\x3b\xdf\xe9\xd7\xac\xcd\x2f\xa4\x68\xf5\
+\x26\xc2\xbb\x67\x60\x0c\x09\x72\xfa\xf5\x84\x53\xb3\x36\x5b\x38\
+\xf0\xe9\x52\x36\xcf\x7e\x8b\xea\xfd\x87\xdd\x9d\xce\x5f\x19\x00\
+\x1d\xb0\xd4\x95\x17\x75\xf5\x0a\x40\x12\xf2\xce\x7f\xe7\xcc\x2b\
+\x55\x41\xa7\x08\x13\xb3\xae\xca\x64\xd2\x59\xf1\x88\x47\xbe\xee\
+\xf1\xee\xf2\xa3\x5c\xff\xea\x6f\x34\x34\x3b\x7f\xc9\x7f\xc4\x88\
+\x11\x3c\xf9\xe4\x93\xf4\xe9\xa3\xb8\x11\xa5\xe0\x0d\x6c\xf5\x50\
+\xb7\x8d\xf5\x1b\x36\x71\xe7\x03\x73\x58\xbe\x62\x93\xd3\x2f\xa9\
+\x35\x19\xe8\xf6\xcf\x89\xc4\x0d\xed\xe7\xf4\x6b\x09\x27\x56\xbc\
+\x6e\x1b\x3b\xe6\x7e\x42\xc3\xb1\x32\x77\xa7\x72\x2a\x8d\x40\x06\
+\xe0\xb2\xea\xc4\xd5\xb7\xb8\xb7\x81\xa9\x2e\xbe\xa6\x43\xfa\x67\
+\x84\xf0\xc2\x8c\x6c\x06\x66\xba\x65\x9f\x62\x87\xd4\x62\xb5\x73\
+\xdf\x7b\x7b\x78\xf2\xb3\xfd\x4e\xbf\x96\xbf\xbf\x3f\xaf\xbe\xfa\
+\x2a\x93\x27\x4f\x76\xfa\xb5\x04\x0f\x63\x6f\x81\xfa\xad\xd0\x52\
+\xc5\x57\xdf\xac\x62\xe2\x8c\xc7\xa8\xad\x6b\x70\xfa\x65\x13\x46\
+\x0e\x21\xfb\xba\x71\x68\x7c\x64\xca\xa3\x37\xa8\x3e\x70\x98\x9d\
+\x73\x17\x50\xbe\xdd\x23\x9e\xf3\xb7\xc5\x1c\xe0\x3a\x57\x5d\xcc\
+\x95\x05\x40\x2a\xb0\x0b\x79\x99\xc3\x21\x1a\x49\xc2\xe6\xc2\x67\
+\x36\x1a\x49\x62\xe2\xb0\x38\x66\x4f\xed\x42\x74\x88\xc7\x2e\x5a\
+\xf8\x84\x82\xf2\x46\xc6\x3e\xb1\x89\xd5\xbb\x9c\xbb\xe4\xaf\xd5\
+\x6a\xb9\xf4\xd2\x4b\x99\x3f\x7f\xbe\x38\xce\xd7\xa1\xd9\xa0\x7e\
+\x07\x58\x4a\x68\x6e\xb6\x70\xed\xad\xcf\xf0\xfe\xc7\xcb\x68\x71\
+\x72\x43\xa1\xd0\xec\x54\x7a\xdf\x39\x1d\x63\xa8\xb2\xa1\x34\xc2\
+\xa9\x59\x6a\xea\xd8\xfb\xd1\x37\xe4\x2f\xfa\x09\xbb\x2b\xa7\x4c\
+\x4a\x92\xd2\x7d\x05\x16\x20\x1d\x70\x7a\x07\x22\x70\xed\x1e\x80\
+\xd9\x80\xa2\x3e\xa9\x8f\x8c\xea\xc1\x19\x69\x91\xac\xc9\x2b\x75\
+\xc9\x39\x70\x3b\xb0\x35\xaf\x86\xd7\x17\xe7\xd3\xdc\x62\x67\x50\
+\x97\x50\xd1\x56\xd8\x09\xd6\xef\xab\xe2\xac\x7b\xd6\xb2\xf3\x48\
+\xad\xd3\xae\x21\x49\x12\x93\x27\x4f\x66\xe9\xd2\xa5\x4c\x9d\x3a\
+\x15\x9d\x78\x17\xd6\xc1\x49\xa0\x8f\x04\x7b\x33\x5a\xea\xb9\x64\
+\xd4\x10\xae\x9d\x72\x21\x45\xc7\xca\xf8\x6d\x67\x9e\xd3\xae\xda\
+\x58\x52\x41\xc1\x8a\xf5\x84\x77\xcf\xc4\x18\x26\x8a\x00\xb5\xd9\
+\xad\x56\x0e\x2d\xfa\x89\x8d\xb3\xde\xa0\x62\xfb\x5e\xd7\x6d\xf2\
+\xd3\xe8\xd0\xf6\x1d\x87\x36\x65\x20\xb6\xfc\x8d\x4a\x22\x69\x91\
+\x1f\x91\x2f\x52\x27\xb1\x53\x73\xd5\xdd\x2c\x01\x79\xe7\xbf\xc1\
+\xd1\x00\x31\x41\x26\xf6\xdf\x7f\x11\x66\x83\x96\xbd\x25\x35\xdc\
+\xfb\xf5\x56\x16\x6c\x72\xfe\x46\x9e\x3f\x4a\x8f\xf3\x67\xd6\xa4\
+\x0c\xc6\xe6\xc6\xba\xf4\xba\xbe\x6c\xc9\xc6\x12\xc6\x3d\xb9\x89\
+\x9a\x86\x16\xa7\x5d\x23\x35\x35\x95\x39\x73\xe6\x30\x7c\xf8\x70\
+\xa7\x5d\x43\xf0\x62\x8d\x07\xa0\xe9\xf7\x37\x5c\x2b\xd7\x6c\x63\
+\xc6\xcd\xcf\xb0\x6b\x8f\xf3\x5e\x5f\xb4\x26\x03\xbd\x6e\x9f\x46\
+\x54\x7f\x31\xbe\x5c\x2d\x65\x5b\x76\xb1\x63\xee\x02\x6a\xf3\x5d\
+\xdb\x0d\x52\x93\xdc\x1f\xdd\xb9\xb7\x23\x45\xa6\x80\xa5\x81\xe6\
+\x97\x2f\xc6\x5e\x57\xae\x24\x64\x13\xf2\x8a\xf9\x51\x75\x32\x3c\
+\x39\x57\xad\x00\x3c\x01\x0c\x54\x12\x60\xd6\x85\x3d\x19\x92\x1a\
+\x09\x40\xb8\xbf\x91\xb1\xbd\x13\x39\x23\x35\x8a\x8d\x87\xcb\x29\
+\xae\x75\x4d\x17\xc5\xf2\x1a\x0b\x0b\x56\x15\xb1\x72\x47\x39\x7d\
+\x52\x83\x89\x12\x8f\x05\x14\x99\xb3\x34\x9f\xab\x9e\xdd\x42\x63\
+\xb3\x73\x96\xe8\x74\x3a\x1d\x37\xde\x78\x23\x9f\x7e\xfa\xa9\x38\
+\xd6\x27\x9c\x9c\x2e\x14\x24\x2d\xb4\xc8\x8f\x9f\x12\x3b\x45\x33\
+\x7d\xd2\x05\xe8\x74\x5a\x7e\x59\xb7\xdd\x29\xfd\x03\xec\x2d\x56\
+\x8a\x56\x6e\x44\x1f\x68\x26\x24\xa3\xb3\xea\xf1\x3b\x92\xba\xa3\
+\xc5\x6c\x7d\x7e\x1e\x7b\xdf\x5f\x48\x73\x95\xf3\x56\x11\xff\x4a\
+\x0a\x4b\x44\x7f\xd1\x83\xe8\x86\xdd\x80\xe4\xdf\xda\x4b\x46\xab\
+\x07\x49\xc2\x76\x40\x51\x2b\x61\x1d\xf2\xbd\x79\x89\xf2\x2c\x4f\
+\xcd\x15\x2b\x00\xb1\xc8\x5d\xff\x1c\x3e\x0c\x1b\x17\xec\xc7\xbe\
+\xfb\x47\xe3\xa7\xff\x7b\xbd\xd2\x62\xb3\xf3\xf6\x9a\xfd\xdc\xbb\
+\x70\x2b\xa5\x75\xae\x6b\xa7\xac\xd3\x4a\x5c\x33\x22\x81\x59\x93\
+\x32\x88\x08\x72\x78\x61\xa3\x43\xb2\xdb\xe1\xa1\x8f\xf6\xf2\xd0\
+\x87\x7b\x9d\x76\x8d\x5e\xbd\x7a\xf1\xe6\x9b\x6f\x92\x93\x93\xe3\
+\xb4\x6b\x08\x3e\xa6\x29\x1f\x1a\xff\xbc\x01\x75\xeb\xf6\x03\xcc\
+\xb8\xf9\x69\xd6\x6d\xd8\xe5\xb4\xcb\x26\x8d\x3e\x8b\xac\xe9\x63\
+\x44\xa7\xc9\x76\xb2\xd4\x35\x70\xe0\xd3\xa5\xe4\xfd\x77\x39\xb6\
+\x16\xe7\xad\x20\xfe\x8d\x29\x10\xdd\xe0\x29\x68\x07\x5c\x29\xdf\
+\xf0\xff\xaa\xa5\x99\xe6\x57\x2e\xc1\x5e\x53\xac\xe4\x2a\x8d\x40\
+\x0a\xe0\xd4\xe5\x0c\x57\xac\x00\x3c\x02\x9c\xa1\x24\xc0\x53\x17\
+\xf7\x66\x50\xf2\x89\xcf\x66\x6b\x24\x89\x9c\x84\x30\xa6\x0f\x4e\
+\xa5\xd1\x62\x65\xc3\xe1\x72\x5c\xd1\xe7\xc3\x66\x87\x0d\xfb\xab\
+\x78\xeb\xbb\xc3\x98\x0c\x5a\xfa\xa6\x05\xa3\x11\x6d\x85\x4f\xab\
+\xbe\xc9\xca\x15\x4f\x6d\xe2\x8d\x25\xce\x59\x5e\xd5\xeb\xf5\x3c\
+\xfc\xf0\xc3\xbc\xfb\xee\xbb\xc4\xc7\xc7\x3b\xe5\x1a\x82\x8f\xd2\
+\x05\xff\x69\x25\x00\x20\x3a\x2a\x94\xa9\x13\xcf\x43\xaf\xd3\xf1\
+\xf3\x2f\xdb\x9c\xd2\x44\xa8\x6a\x4f\x1e\xb5\xf9\x85\x44\xf5\xef\
+\x81\x46\xcc\x11\x38\x2d\xbb\xdd\x4e\xc1\x0f\xeb\xd8\xf0\xe8\x6b\
+\x94\x6e\xda\xe9\xba\x4d\x7e\x92\x06\x6d\xf7\xf3\xd1\x5f\xf1\x1c\
+\x9a\xd4\x41\xa0\x39\xc9\xff\x2b\x8d\x16\xb4\x7a\x6c\xfb\x57\x29\
+\xb9\x9a\x0e\xb0\x01\xdf\x29\x09\x72\x3a\xce\xbe\x63\x85\x02\xf9\
+\x40\x80\xa3\x01\x92\xc2\xfc\xd9\xf3\x9f\x0b\x31\xb4\xb1\x39\xcf\
+\xae\x63\xd5\xcc\xfc\x7c\x23\x4b\x76\xba\xf6\x39\x50\x97\x4e\x01\
+\x3c\x37\x3d\x8b\xf3\xfa\x44\xba\xf4\xba\xde\xa4\xb6\xd1\xca\xc5\
+\x8f\xae\x67\xf9\x56\xe7\x9c\xc5\xed\xdc\xb9\x33\xef\xbd\xf7\x1e\
+\xb9\xb9\x1e\xd5\x67\x4a\xf0\x36\x4d\x79\xd0\x78\xf0\x6f\xbf\xfc\
+\xeb\xc6\xdd\x4c\x9c\x31\x8b\xbd\xfb\x8f\x38\xe5\xb2\x61\x5d\xd3\
+\xc8\xb9\xff\x06\x74\x7e\xe2\x74\xca\xc9\x94\x6f\xdb\xc3\x8e\x37\
+\x3f\xa5\xe6\xa0\x73\xfe\x1f\x9c\x8c\x26\x29\x07\xdd\xb9\xff\x42\
+\x8a\xce\x68\xdb\x17\x58\x2d\x34\xbf\x76\x39\xf6\xca\x02\x25\x97\
+\xad\x41\x9e\x96\x5b\xa9\x24\xc8\xa9\x38\xbb\xdc\xfc\x17\x70\x9e\
+\x92\x00\xcf\x5d\xda\x87\xbe\x89\x61\x6d\xfe\xfd\x11\x01\x46\xae\
+\xea\xd7\x99\x9c\x84\x30\xd6\xe6\x95\x51\xd1\xe0\x9a\xc9\x4e\xa5\
+\xd5\xcd\xbc\xff\x63\x01\x1b\xf6\x55\x31\x30\x33\x84\xd0\x80\x13\
+\x2c\x0d\x75\x60\x95\x75\x16\x46\x3e\xb0\x8e\x9f\x77\x38\xe7\x98\
+\xdf\xa4\x49\x93\x58\xb4\x68\x11\x69\x69\x69\x4e\x89\x2f\x74\x20\
+\xba\x10\xc0\x06\xd6\xaa\x3f\xfd\x72\x7c\x6c\x04\x53\x26\x8e\xa4\
+\xac\xbc\x9a\x0d\x9b\xf7\xa8\x7e\xd9\x86\x92\x72\xca\x36\xef\x22\
+\x66\x70\x6f\xb4\x46\xf1\x58\xf1\x8f\x1a\x4b\x2b\xd8\xf1\xc6\x27\
+\xec\x7c\xeb\x33\x9a\x2b\xab\x5d\x76\x5d\x29\x28\x1a\xdd\xc8\x3b\
+\xd0\x9d\x7b\x1b\x52\x40\x78\xdb\xbf\x50\xa3\x05\x9d\x11\xdb\xde\
+\x9f\x95\x5c\xde\x08\x94\x03\xab\x95\x04\x39\x15\x67\xae\x00\x18\
+\x81\x83\xc8\x7b\x00\x1c\x92\x16\x19\xc8\xce\x7b\x47\xa1\x73\x70\
+\x69\xbd\xd9\x6a\xe3\xb5\x9f\xf7\x72\xff\x37\xdb\xa8\x6e\xb4\x38\
+\x9a\x46\xbb\x19\x74\x1a\xae\x3f\x3f\x51\x8c\x1d\x6e\x55\x5c\xd5\
+\xcc\xb9\xf7\xaf\x63\xcb\x41\xf5\x7f\x70\xc3\xc2\xc2\x98\x3b\x77\
+\x2e\x97\x5d\x76\x99\xea\xb1\x85\x0e\xae\x61\x17\x34\x9f\x78\x25\
+\xf1\x93\x2f\x7e\xe4\xfa\x99\xcf\x51\x51\x59\xa3\xfa\x65\x83\x52\
+\x12\xe8\xf7\xd0\x4d\x18\x82\x1d\x5e\x38\xf5\x19\xd6\xa6\x66\x0e\
+\x7c\xfe\x1d\x07\x3e\xfb\x16\x5b\xb3\xeb\x5e\xc3\xd1\x9b\xd0\x0e\
+\x9a\x8c\x6e\xf0\x14\xd0\x39\x58\x8c\xd9\x5a\xe4\x55\x80\x0a\x45\
+\x9b\xf9\x8f\x22\xef\x05\x70\xca\x3b\x59\x67\xae\x00\x4c\x03\x26\
+\x28\x09\xf0\xe2\x98\x1c\x7a\xc5\x3b\x3e\xa9\x4f\xab\x91\x18\xd8\
+\x39\x82\x29\x03\x92\xa9\x69\x6c\x61\xd3\x91\x0a\x5c\x71\x2a\xd4\
+\x6a\xb3\xb3\x76\x4f\x25\xf3\x96\x1d\x21\xd0\xac\xa3\x77\x6a\x50\
+\x87\xdd\xe0\x53\x54\xd1\xc4\x88\xff\xac\x63\x5b\x9e\xfa\x2f\x94\
+\xbd\x7a\xf5\x62\xd9\xb2\x65\x0c\x1e\x3c\x58\xf5\xd8\x82\x80\x3e\
+\x1c\xac\x35\x60\xfb\x7b\x97\xc0\xae\x59\x9d\x99\x30\xe6\x6c\x56\
+\xfe\xb2\x8d\x82\x22\x75\x1f\x69\x35\x55\x54\x53\xfc\xeb\x36\xa2\
+\x07\xf4\x44\x67\xee\xa0\x8f\x03\xec\x76\x8a\x56\x6f\x62\xe3\xa3\
+\xaf\x53\xbc\x76\x2b\x76\x17\x4d\x72\x44\x92\xd0\xf6\x1d\x85\xfe\
+\xd2\xd9\x68\x33\x87\x9e\xfc\x39\x7f\x9b\x62\x69\xc0\x18\x80\x6d\
+\xcf\x4f\x4a\x32\x0a\x02\x0e\x00\x9b\x95\x04\x39\x19\x67\x15\x00\
+\x1a\x60\x3e\xe0\xf0\x54\x95\xac\xe8\x20\x5e\x1d\xd7\x0f\x8d\x0a\
+\x37\xce\x40\xa3\x9e\xd1\xdd\xe2\x19\xd5\x35\x8e\x1d\x45\xd5\x1c\
+\xae\xa8\x57\x1c\xb3\x2d\x6a\x1b\xad\x7c\xfd\x6b\x31\x8b\xd6\x97\
+\xd0\x35\x31\x90\xc4\xc8\x8e\x35\x15\x2c\xaf\xb8\x81\xa1\xf7\xac\
+\x61\xf7\xd1\x3a\xd5\x63\x4f\x9e\x3c\x99\x2f\xbe\xf8\x82\xc8\x48\
+\xb1\xe7\x42\x70\x96\xd6\x66\x41\x2d\x95\x60\xff\xfb\x09\xa3\xe0\
+\x20\x7f\xae\xba\xe2\x1c\xf2\x8f\x14\xb3\x75\xfb\x01\x55\xaf\x6c\
+\xa9\xae\xa5\x78\xed\x56\xa2\x07\xf4\xec\x70\xd3\x04\xab\xf6\x1d\
+\x62\xf3\x93\x6f\x72\xf0\xbf\xcb\x68\xa9\x77\x7e\x8b\xe6\xe3\x34\
+\xc9\x3d\x31\xfc\xf3\x75\x74\xe7\x5f\x0f\x76\x23\x58\x94\x77\x85\
+\xd4\x44\xa7\x63\xdb\xbe\x14\x1a\xaa\x4e\xff\x9b\x4f\x2e\x0d\x78\
+\x5d\x71\x32\x27\xe0\xac\x02\xe0\x42\xe0\x26\x25\x01\x9e\xb8\xa8\
+\x27\x39\xed\x78\xf6\xdf\x16\x71\xc1\x7e\x4c\x1d\x90\x42\xd7\xd8\
+\x60\xd6\x1e\x2a\xa3\xca\x45\x8f\x05\x0a\xcb\x9b\x78\x67\xd9\x11\
+\xb6\xe7\xd7\xd2\x3f\x23\x84\x10\x7f\xdf\xdf\x1f\x70\xb4\xac\x91\
+\xb3\xee\x5d\xcb\x81\x22\x75\x8b\x2d\x9d\x4e\xc7\x63\x8f\x3d\xc6\
+\xd3\x4f\x3f\x8d\x5e\xef\xfb\x7f\x8f\x82\x9b\x49\x12\xe8\x23\xc0\
+\x52\x22\xcf\x10\xf8\x0b\xbd\x5e\xc7\x65\xa3\xcf\x20\x2e\x26\x9c\
+\x6f\x97\xff\xaa\x6a\xcf\x00\x4b\x6d\x3d\xc5\xeb\xb6\x11\x9b\xdb\
+\xa7\x43\x6c\x0c\x6c\x2a\xaf\x62\xd7\xdb\x9f\xb3\xe3\xb5\x8f\x68\
+\x28\x75\xcd\x14\x50\x00\x29\x24\x1a\xfd\x84\xfb\x31\x5c\xfd\x38\
+\x52\x78\x27\xf9\x17\x35\x12\xd4\x36\xaa\x10\x5c\x92\x4f\x04\x28\
+\xdb\x0b\x10\x05\xac\x41\x6e\xa6\xa7\x2a\x67\x15\x00\xaf\x20\x3f\
+\xb7\x70\x48\x74\xa0\x89\xb7\xaf\x1c\x80\xce\x09\x63\x79\x25\x09\
+\xba\xc6\x06\x73\x5d\x6e\x3a\x7a\xad\xc4\xda\x43\x65\xb4\xb8\x68\
+\x3e\xf8\x8e\xc3\xb5\xcc\x59\x7a\x18\x8b\xd5\xce\xc0\x4c\xdf\x6d\
+\x2b\x5c\x5c\xd5\xcc\xf0\x7b\xd7\xb2\xb7\x40\xdd\x77\xfe\xb1\xb1\
+\xb1\x2c\x5e\xbc\x98\x09\x13\x14\x3d\x59\x12\x84\xf6\x91\xb4\xa0\
+\x0f\x03\xcb\x31\xe4\x93\x59\x7f\x97\xd3\x2b\x83\xb3\xce\xe8\xc5\
+\xe2\xef\xd6\xa9\x3a\x58\xc8\x52\x5b\x4f\xc9\x86\x1d\xc4\x0e\xc9\
+\x41\x6b\xf2\xcd\x8d\x81\xb6\x96\x16\x0e\x2d\xfa\x89\x4d\x8f\xcf\
+\xa1\x72\x97\xba\x2b\x29\xa7\xa4\xd3\xa3\x3b\x7b\x2a\xc6\x9b\xe7\
+\xa2\x49\xef\xc7\x1f\xc7\xbf\x4a\x7a\x2d\xf6\xaa\x7a\x55\x5a\x09\
+\x6b\xa2\x52\xb1\x6d\xfe\x12\x9a\x15\x7d\x5f\x84\x03\xef\x2b\x4e\
+\xe6\x2f\x9c\x51\x00\x64\x01\x4f\xa3\x60\x83\xe1\x3d\xe7\x66\x73\
+\x56\x46\xb4\x7a\x19\x9d\x80\x5e\xab\x61\x58\x7a\x34\x57\xf7\x4f\
+\xa6\xb4\xae\x89\x6d\x85\x4e\x3b\x69\xf1\x27\x16\xab\x9d\x9f\x7e\
+\x2b\x67\xde\xf2\x23\x44\x04\x1a\xe8\xd1\x39\xc8\xa7\xc6\x0e\x57\
+\xd6\x59\x38\xf7\xfe\x5f\xd9\x76\x48\xdd\x67\xfe\xdd\xba\x75\xe3\
+\x87\x1f\x7e\xa0\x5b\xb7\x6e\xaa\xc6\x15\x84\x36\x91\xf4\xa0\x0d\
+\x04\xcb\xc9\x9b\xbb\x24\x76\x8a\x66\xc2\x98\xe1\x2c\x5f\xb1\x89\
+\xa2\x62\x45\xad\x60\xff\xa4\xb9\xba\x96\xd2\x4d\xad\x45\x80\x8f\
+\x9d\x0e\x28\x5e\xb7\x8d\x0d\x8f\xbc\x46\xe1\x8a\xf5\x2e\x6d\xe6\
+\xa3\xed\x35\x02\xe3\x6d\xef\xa2\x1d\x74\x29\xe8\x4f\xd0\xd1\x55\
+\x92\xe4\x66\x2f\x6a\x9c\x22\xd3\x68\xa1\xb9\x01\xdb\xa1\x0d\x4a\
+\xa2\xa4\x01\x1f\x03\xa5\xca\x13\xfa\x9d\x33\x0a\x80\x87\x01\x87\
+\x07\x5f\x9b\x0d\x5a\xde\x9f\x3c\x18\xb3\xc1\x35\xbb\xe7\x83\xfd\
+\xf4\x5c\xda\x33\x81\xa1\x69\xd1\x6c\x3e\x5a\xc1\xb1\x1a\x15\x96\
+\x7d\xda\xa0\xba\xbe\x85\x2f\xd7\x1c\xe3\xc7\xdf\xca\xe8\x9d\x12\
+\x44\x4c\xa8\xf7\xb7\x15\xae\xae\x6f\xe1\xdc\x07\x7e\x65\xfd\x3e\
+\x45\xcf\xbb\xfe\x66\xc4\x88\x11\x2c\x59\xb2\x84\xe8\x68\xe7\x16\
+\x85\x82\x70\x4a\x1a\x3f\x79\x63\x57\xcb\xc9\x97\xa7\x83\x02\xcd\
+\x4c\x1c\x77\x36\x9b\xb7\xed\x63\xdf\x01\xf5\x5a\xb9\x37\x57\xd6\
+\x50\xfe\xdb\x5e\x62\xcf\xc8\x41\xa3\xf7\xfe\x93\x45\xb5\x87\x8b\
+\xd8\xf2\xdc\xff\xb1\xff\xe3\xc5\x58\x6a\x5d\xb3\x27\x0b\x40\x8a\
+\x4b\xc7\x70\xdd\x4b\xe8\x2f\x9e\x89\xe4\x7f\xea\x51\xef\x92\x5e\
+\x87\xbd\x4a\x9d\x55\x4c\x4d\x54\x3a\xd6\xf5\x9f\x80\xcd\xe1\x22\
+\x47\x42\x9e\x4f\xb7\x58\x95\x84\x5a\xa9\x5d\x00\x84\x00\xff\x87\
+\x82\xa1\x3f\xd7\xe7\xa6\x73\x79\xaf\x04\xd5\x12\x6a\xab\xce\xe1\
+\xfe\x5c\x9b\x9b\x46\x6a\x44\x00\xab\x0f\x96\x52\xd7\xec\x9a\x6a\
+\xf4\x50\x71\x03\x73\x96\x1e\x66\x7f\x51\x3d\x83\xb3\x42\x09\x30\
+\x79\xe7\x0f\x77\x7d\x93\x95\x51\x0f\xaf\x57\x7d\x9c\xef\xb4\x69\
+\xd3\xf8\xf0\xc3\x0f\x31\x9b\xcd\xaa\xc6\x15\x04\x87\xe8\x82\xe5\
+\x0d\x81\xd6\x93\xf7\x9c\x37\x1a\xf4\x8c\xbb\x74\x18\x47\x0a\x4a\
+\xd8\xbc\x4d\xbd\xc7\xb6\x8d\x65\x95\x54\xed\x3e\x48\xcc\x19\x39\
+\x5e\xdb\x31\xd0\x52\x53\xc7\xee\x77\xff\xcb\xb6\x17\xe6\x53\x5f\
+\xa0\xa8\x55\x6e\xbb\x48\xfe\x21\xe8\xc7\xdd\x8d\x61\xc6\x73\x68\
+\x62\xda\xf8\x74\x5a\xab\xc1\x5e\xdf\x0c\x2d\x2a\x8c\x88\xd6\x1b\
+\xa1\xa6\x18\x7b\xe1\x0e\x25\x51\xb2\x81\x57\x91\x87\x05\xa9\x42\
+\xed\xef\xa2\x1b\x80\xd1\x8e\x7e\xb1\x56\x23\xf1\xde\xe4\xc1\x84\
+\x99\xdd\xb3\xcc\x25\x49\x12\x3d\xe3\x43\x99\x31\x38\x15\x90\x58\
+\x9f\x5f\xe6\xd2\xb1\xc3\x6f\x7e\x7b\x04\x49\x82\x7e\xe9\x21\x5e\
+\xb5\x3f\xc0\x66\xb7\x73\xc5\x53\x9b\x58\xba\x49\xbd\xd5\x29\x49\
+\x92\x98\x35\x6b\x16\xb3\x67\xcf\x46\xeb\xa5\x2f\x76\x82\x8f\xd2\
+\x87\x41\x4b\x19\xd8\x4f\xbe\x3c\xac\xd5\x6a\xb8\x78\x54\x2e\x5a\
+\x8d\x86\x1f\x57\x6e\x51\xed\xd2\x0d\xc5\x65\xd4\x1d\x3d\x46\x4c\
+\x6e\x1f\xaf\x3a\x5a\x6c\xb7\x5a\x39\xf2\xdd\x6a\x36\x3e\x36\x87\
+\xf2\x6d\x7b\x5c\x37\xa6\x57\xab\x43\x37\xf4\x4a\x0c\xb7\xbc\x85\
+\x36\x3b\x57\x5e\xc1\x69\x07\x09\x09\x7b\x9d\x3a\xab\xc2\x52\x44\
+\xb2\xbc\x0a\xe0\xf8\x61\x74\x23\x50\x04\xac\x55\x25\x21\xd4\x2d\
+\x00\x24\xe4\x77\xff\xed\x68\x97\xf4\x67\x63\x7a\x25\x72\x5d\xae\
+\xfb\x3b\xb9\x99\xf4\x5a\x46\x64\xc6\x30\xae\x77\x12\x79\xe5\x75\
+\xec\x29\x56\xff\x0c\xfb\x89\x34\x5a\x6c\x7c\xbf\xa5\x8c\x4f\x56\
+\x15\x92\x1c\x6d\x26\x23\xde\xdf\x25\xd7\x55\x6a\xe6\x9b\x3b\x99\
+\xb7\x5c\xbd\xe5\x4e\x8d\x46\xc3\xdc\xb9\x73\xb9\xe5\x96\x5b\x54\
+\x8b\x29\x08\xea\x91\x40\x17\x06\x96\x22\x4e\xb6\x29\xf0\xb8\xa1\
+\xb9\x3d\x89\x8b\x8d\x60\xd1\xb7\x6b\x54\xbb\xe7\xd5\x1e\x2e\xc2\
+\xda\x6c\x21\xa2\x57\x96\x3a\x01\x9d\xac\x6c\xcb\x2e\x36\x3e\x36\
+\x87\x23\xdf\xad\xc6\xda\xe4\x9a\xce\xac\x00\x9a\xec\x21\x18\x6e\
+\x79\x0b\xdd\xd0\x09\x48\x46\x07\x8f\x52\xea\x75\x50\x55\xa7\xe0\
+\x9e\xfd\x3b\xc9\x2f\x08\xfb\xb1\x3d\xd8\xcb\xf2\x94\x84\x49\x46\
+\xde\x64\xaf\x0a\x35\x0b\x80\xe1\xc0\x6d\x4a\x02\xbc\x75\x65\x7f\
+\x3a\x85\x78\xce\x52\x6f\xb8\xbf\x91\x2b\x73\x92\x18\x92\x12\xc9\
+\xc6\x23\x15\x94\xb8\x68\xec\x70\x59\x8d\x85\x0f\x57\x14\xb0\x6a\
+\x47\x05\x39\x69\xc1\x44\x05\x7b\xee\xc6\x9f\x37\x96\xe4\xf3\x9f\
+\xf7\xd5\x6b\x8b\xaa\xd5\x6a\x79\xfb\xed\xb7\x99\x3a\x75\xaa\x6a\
+\x31\x05\x41\x75\x92\x5e\xde\x13\x60\x29\x39\xed\x6f\xcd\xe9\x95\
+\x41\x66\x5a\x02\x5f\x2d\x5e\x8d\x4d\xa5\xc1\x35\x95\x3b\x0f\x60\
+\x08\x0a\xf0\xe8\x51\xc2\x75\x05\xc5\x6c\x7f\xf5\x43\x76\xcf\xfb\
+\x92\xe6\x2a\xd7\xbc\x89\x02\x90\xa2\x93\x31\x4c\x79\x12\xfd\x15\
+\xf7\x22\x05\x39\xdc\x8a\xa6\x35\x98\x24\x3f\x02\x68\x52\xe7\xc8\
+\xb8\x14\x14\x8d\x6d\xcb\x57\x4a\x42\x44\x00\xcb\x81\x43\x6a\xe4\
+\xa3\x66\x01\xf0\x38\xe0\xf0\x16\xed\x21\x29\x91\xdc\x7f\x9e\x67\
+\xee\xf0\x4e\x89\x08\x60\xc6\xe0\x54\xc2\xfd\x8d\xfc\x92\x57\x4a\
+\x53\x8b\x6b\xba\x52\x1d\x38\x56\xcf\xdc\xa5\xf9\x94\xd6\x58\x18\
+\xd4\x25\x04\x93\xc1\xb3\x96\xc2\x17\xad\x2f\x66\xd2\xb3\x5b\x54\
+\x7b\x67\x63\x30\x18\xf8\xf8\xe3\x8f\xc5\x31\x3f\xc1\x3b\x68\xfd\
+\xe5\xc7\x00\xd6\xd3\xdf\xdc\xba\x65\x27\xd3\xbb\x47\x1a\x5f\x7c\
+\xbd\x92\x16\x35\x9e\x29\x03\xa5\x9b\x76\x12\x94\xd2\x09\xff\x78\
+\xcf\xda\x1c\x6b\x6d\x6c\x62\xff\x82\xa5\x6c\x79\xe6\x1d\x6a\xf2\
+\xd4\x5b\x19\x3c\x2d\x93\x3f\xba\x0b\x6f\xc2\x78\xc3\xab\x68\x12\
+\xd4\x5b\x1d\x91\x34\x1a\xec\xd5\xea\x1c\xed\x94\x82\x63\xb0\x1f\
+\x58\x83\xbd\xfa\x98\x92\x30\x06\xe0\x73\x35\xf2\x51\xeb\x8e\x12\
+\x01\xcc\x41\x1e\x61\xe8\x90\x17\x2e\xcf\xa1\x4b\x74\x90\x4a\xe9\
+\xa8\xef\x78\x5b\xe1\x19\x83\x53\x69\x6c\xb1\xb2\xfe\x70\xb9\x4b\
+\x1e\x63\xd9\xec\xb0\x76\x4f\x25\x73\xbf\x95\xc7\x0e\xf7\x4b\x0f\
+\x56\xa5\x3b\xa2\x52\x1b\xf6\x55\x31\xea\xe1\xf5\x34\x59\xd4\x29\
+\x86\xcc\x66\x33\x5f\x7e\xf9\x25\xa3\x47\x3b\xbc\x85\x44\xc8\x90\
+\x3a\xcb\x00\x00\x20\x00\x49\x44\x41\x54\x10\x5c\xaf\x0d\xfb\x01\
+\x8e\xcb\x48\x4b\x20\x77\x40\x37\x3e\xfb\x6a\x05\xcd\x16\x15\x36\
+\x19\xdb\xed\x14\xaf\xdb\x46\x64\x4e\x57\x8c\xa1\xc1\xca\xe3\x29\
+\x4e\xa7\x75\x4c\xef\x23\xaf\x51\xb2\xfe\x37\xd7\x8e\xe9\xcd\xbd\
+\x1c\xe3\xcc\x79\x68\x7b\x8d\x50\xd6\xbe\xf7\x44\x74\x5a\xec\x35\
+\x8d\xa0\xd2\x9f\x47\x32\x05\x62\xdb\xa1\x68\xca\x6f\x26\xf0\x06\
+\xa0\xf8\xf8\x84\x5a\x7f\x53\xff\x04\xce\x77\xf4\x8b\x93\xc3\x03\
+\x78\x65\x5c\x5f\xaf\xd8\xd4\x62\x36\xe8\x38\x3f\x3b\x8e\x8b\xba\
+\xc7\xb3\xb3\xa8\x9a\x43\x15\xea\xb7\xb9\x3d\x91\x86\x66\x1b\x4b\
+\x36\x96\xb0\x60\x55\x11\x69\xb1\x66\xd2\x62\xdd\xb7\x3f\xa0\xa0\
+\xbc\x91\xb3\xee\x59\x4b\x79\xad\x3a\xcb\x62\x66\xb3\x99\x45\x8b\
+\x16\x31\x62\xc4\x08\x55\xe2\x09\x82\xeb\x48\xa0\x0b\x6d\x1d\x1a\
+\x74\xfa\x77\x04\xc9\x49\x31\x0c\xea\xdf\x95\x4f\xbe\xf8\x51\x95\
+\x95\x00\x7b\x8b\x95\x92\x5f\x7f\x23\x6e\x58\x3f\x74\x26\xf7\x1d\
+\x25\x2e\xff\x6d\x2f\x9b\x1e\x7f\x83\xfc\xc5\x3f\x63\x6d\x74\xcd\
+\xa3\x52\x00\x4d\x6a\x6f\x0c\x37\xce\x45\x77\xce\x54\x24\x93\x93\
+\x5e\x13\x25\xc0\x6a\x53\xa7\x27\x00\x20\x85\x27\x61\xdb\xb6\x08\
+\x1a\x1d\x7e\x2c\xa2\x43\xde\x0c\xf8\x8b\xd2\x5c\xd4\x28\x00\x24\
+\xe0\x1d\x14\x6c\xfe\xbb\xfd\xec\x2e\x0c\x4d\x8b\x52\x21\x15\xd7\
+\x89\x09\xf2\x63\xea\xc0\x14\x72\x12\xc2\x58\x93\x57\x46\xa5\x0b\
+\xc7\x0e\xbf\xd7\x3a\x76\x78\x50\x17\xd7\x8f\x1d\xb6\x58\xed\x5c\
+\xf4\xe8\x06\xb6\xe7\x9f\xfc\x18\x54\x7b\x18\x0c\x06\x3e\xfd\xf4\
+\x53\xce\x3d\xf7\x5c\x55\xe2\x09\x82\xcb\x49\xfa\xd3\xf6\x07\xf8\
+\xa3\xe4\xa4\x18\xfa\xe7\x64\xf1\xc9\x97\x3f\xaa\xd2\x3a\xb8\xa5\
+\xa1\x91\xca\x9d\x07\x88\x3b\xab\x3f\x92\x46\xfd\xee\xa9\xa7\xd2\
+\x58\x5a\xc9\x8e\x37\x3e\x66\xe7\xdb\x9f\xd1\x54\xe1\xc2\x31\xbd\
+\x61\xb1\x18\x26\xcd\x42\x7f\xd5\x23\x48\x61\x0e\x0f\x9c\x6d\xfb\
+\xf5\x74\xad\x9d\x01\x55\x09\x26\x41\x53\x1d\xb6\x43\xeb\x95\x44\
+\x49\x42\x85\xcd\x80\x6a\x14\x00\x67\x00\xb7\x3b\xfa\xc5\x3a\x8d\
+\xc4\xbc\xab\x06\x11\x68\xf2\xce\xbe\xee\x99\x51\x41\x5c\x9b\x9b\
+\x46\xa0\x49\xc7\xda\xbc\x72\x9a\x5d\x34\xb5\x6a\x4f\x41\x1d\xaf\
+\x2d\xce\xa7\xb4\xba\x99\x21\xd9\xa1\x18\xf5\xae\xf9\xc1\xbf\x79\
+\xce\x0e\x3e\x5b\x5d\xa4\x4a\x2c\xad\x56\xcb\x07\x1f\x7c\xc0\x25\
+\x97\x5c\xa2\x4a\x3c\x41\x70\x1b\x5d\x10\x58\x2b\xc1\xd6\xb6\x23\
+\x63\xa9\xc9\x71\x74\xcb\x4e\xe6\xb3\xaf\x56\x60\x53\xe1\xa8\x71\
+\x63\x69\x05\xd6\x86\x26\x22\xfb\x64\x2b\x8e\xd5\x16\xd6\xa6\x66\
+\xf6\x2f\x58\xc2\x96\xd9\x6f\x51\xb5\x3f\xdf\x25\xd7\x04\xc0\xe0\
+\x87\xee\xbc\xeb\x30\xfe\xf3\x75\x34\x29\xbd\x70\x59\x1b\x55\xad\
+\x46\x9e\x0d\xa0\xd2\xeb\xbb\x14\xd6\x09\xeb\xba\x0f\x51\x70\xbc\
+\x20\x02\x58\x0a\x1c\x51\x92\x87\x1a\x05\xc0\xfd\x40\x1f\x47\xbf\
+\x78\x74\xb7\x4e\xad\xe7\xee\xbd\x97\x5e\xab\x61\x48\x4a\x24\x57\
+\x0f\x48\xa6\xb6\xc9\x0d\x63\x87\x97\x1f\x25\xd0\x4f\xeb\xf4\xb1\
+\xc3\xef\xff\x58\xc0\xdd\xef\xee\x56\x25\x96\x46\xa3\x61\xfe\xfc\
+\xf9\x8c\x1f\x3f\x5e\x95\x78\x82\xe0\x5e\x12\xe8\x42\xc0\xd2\xb6\
+\x47\x01\x00\x5d\x32\x12\x49\x49\x8a\xe5\xbf\xdf\xac\x52\x65\x3f\
+\x51\xe5\xee\x83\x98\xa3\x23\x08\x4a\xee\xa4\x3c\xd8\xc9\x1c\x1f\
+\xd3\x3b\xcb\x0d\x63\x7a\xfb\x5f\x88\xf1\x96\x77\xd0\xf6\x1b\x05\
+\x3a\x37\x9c\x8c\xb2\xdb\xa1\x5e\xa5\xc7\x00\x46\x7f\xec\x85\x3b\
+\xb0\x97\x2b\x2a\x9e\x5a\x80\x45\x4a\x02\x28\x2d\x00\xfc\x80\xb7\
+\x00\x87\x47\x55\x3d\x73\x69\x6f\x32\xa2\x02\x15\xa6\xe1\x19\x02\
+\x4d\xf2\xd8\xe1\x0b\xba\xc6\xb2\xbd\xb0\x8a\xc3\x95\xae\x69\x71\
+\x59\xd3\xd0\xc2\xd7\xbf\x16\xb3\x78\x43\x09\x5d\x93\x02\x49\x88\
+\x50\x7f\x7c\xe8\xa6\x03\xd5\x5c\x32\x6b\x03\x2d\x56\xe5\xaf\x54\
+\x92\x24\x31\x67\xce\x1c\xae\xbe\xfa\x6a\x15\x32\x13\x04\x0f\x21\
+\xe9\x41\xd2\xc9\x9b\x02\xdb\xa8\x47\xb7\x54\x62\xa3\xc3\x59\xb4\
+\x74\x8d\x2a\x29\x94\x6e\xde\x49\x54\xff\x1e\x18\x43\xd4\x7f\x4d\
+\xad\xda\x97\xcf\xe6\xd9\x6f\x71\xf0\xcb\x65\xb4\xa8\x38\xf0\xe8\
+\x74\x34\x9d\x7b\xfc\x6f\x4c\xaf\x64\x76\xdf\x46\x71\x79\x40\x90\
+\x7a\x7b\xbe\x24\x83\x59\x1e\x15\xec\xb8\x74\xe0\x05\xe4\x42\xc0\
+\x21\x4a\x0b\x80\x2b\x80\x2b\x1d\xfd\xe2\x4e\x21\x66\x5e\x1e\xdb\
+\xd7\x23\x76\xb5\xab\x29\x3e\xd8\xcc\x35\x03\x53\xe9\x1a\x1b\xcc\
+\x9a\x43\x65\x54\xbb\x68\xec\x70\x41\x79\x13\xef\x7c\x2f\x8f\x1d\
+\x1e\x90\x19\x42\xb0\x4a\x63\x87\xcb\x6b\x2c\x8c\xf8\xcf\x3a\x4a\
+\xaa\xd5\xa9\x7e\x67\xcd\x9a\x25\x9a\xfc\x08\xbe\x49\x1b\x24\xef\
+\x05\xb0\xb7\x7d\x23\x5c\x4e\xaf\x0c\x34\x1a\x0d\x3f\xfc\xbc\x59\
+\xf1\xe5\xed\x2d\x56\xca\xb6\xec\x22\x7e\xf8\x00\x34\x2a\x8d\xcb\
+\x6e\xaa\x38\x3e\xa6\xf7\x43\x1a\x4a\xd4\x1b\x72\x74\x3a\x52\x48\
+\xd4\xef\x63\x7a\x23\x5c\xdf\x1e\xfe\x6f\x34\x2a\xb6\x06\x06\xa4\
+\xd0\x4e\xd8\x36\x7f\x05\xcd\x0e\x17\x15\x26\x60\x2b\xb0\xdd\xd1\
+\x00\x4a\x0b\x80\x67\x00\x87\xd7\xef\x67\x9e\x95\xc9\x70\x27\x4f\
+\xfd\x73\x97\xe3\x63\x87\xaf\xcd\x4d\x43\xaf\xd5\xb8\x7c\xec\xf0\
+\xdc\x6f\x0f\xd3\xdc\xa2\xce\xd8\xe1\xa9\x2f\x6e\x65\xe5\x0e\x75\
+\x7a\xfc\x5f\x73\xcd\x35\x3c\xfd\xf4\xd3\xaa\xc4\x12\x1c\x53\x55\
+\x55\xc5\xa2\x45\x8b\x58\xba\x74\x29\x6b\xd6\xac\xa1\xb0\xb0\x90\
+\xb8\xb8\x38\x4c\x26\xdf\x9f\x39\xef\x12\xda\x20\x68\x2e\x68\xd7\
+\x97\x0c\xcd\xed\xc9\xa1\xfc\x63\xaa\xcc\x0e\xb0\xd4\xd4\x51\x5f\
+\x58\x42\xec\x90\x1c\x45\x71\xec\x56\xab\x7b\xc6\xf4\x6a\x75\xe8\
+\x46\x4c\xc5\x78\xf3\x9b\xad\x63\x7a\x5d\xbb\xb1\xf1\x94\xac\x76\
+\xa8\x57\xe9\x94\x83\xa4\xc1\xde\x58\x85\x3d\x7f\x93\x92\x28\xfe\
+\xc0\x07\x0e\xa7\xa0\xe0\xc2\xf1\xc8\xdd\x88\x1c\x2a\x22\xb4\x1a\
+\x89\x03\x0f\x5c\x44\x62\xa8\xe7\x74\xfe\x73\xa6\xc3\x15\xf5\xdc\
+\xfb\xf5\x16\xe6\xff\x9a\xe7\xd2\xeb\x26\x44\x98\x78\xf4\xaa\x4c\
+\x26\x0f\x8f\x77\xe8\xeb\xdf\xfa\xee\x30\xd3\x5f\xda\xa6\x4a\x2e\
+\xc3\x86\x0d\x63\xe9\xd2\xa5\x18\x0c\x9e\xdb\xd9\xd0\x97\x95\x95\
+\x95\x71\xcf\x3d\xf7\x30\x6f\xde\x3c\x9a\x9a\xfe\xfc\x22\x66\x34\
+\x1a\x99\x32\x65\x0a\xb3\x66\xcd\x22\x3c\xdc\xe1\x03\x3d\xc2\x71\
+\x8d\xfb\xa1\xa9\x7d\xcf\x77\x2d\x96\x16\x46\x8d\xbb\x9b\xef\x7e\
+\x50\x34\x36\xf6\x7f\x7a\xde\x36\x85\xb8\x61\xfd\xff\x9f\xbd\x33\
+\x0f\x8f\xaa\x3c\xfb\xff\xe7\x9c\x99\xc9\xbe\x27\x40\x12\x48\x58\
+\xc2\x0e\x41\x40\x14\x10\x45\x10\x51\x40\x10\x10\x04\x44\x05\xd7\
+\x8a\x3f\x5f\xf7\xd6\xd6\x2e\x5a\x6d\xdf\x6a\xab\xd6\xba\x54\x6d\
+\x55\x7c\x11\x45\x40\x41\x04\xa9\x08\x28\xca\xa2\x2c\x02\xb2\xef\
+\x10\x08\x90\x40\x12\x48\xc8\x3e\xdb\xf9\xfd\x11\xa1\xa8\x04\x26\
+\xcf\xf3\x9c\x99\xcc\xcc\xf9\x5c\x57\xaf\x5e\x85\x79\xee\x73\x97\
+\x4c\xce\xb9\xcf\xbd\x7d\x85\xce\x1e\x5f\xbb\x85\x1d\x6f\x7d\x44\
+\x55\xe1\x85\x37\x1d\xaa\xc4\xd6\xfd\x6a\x1c\x37\x3f\x8d\xd6\xb4\
+\xa5\x5f\xaf\xeb\x33\x6e\x0f\xde\xbc\xe3\x4a\x56\x03\x03\x18\xa5\
+\x47\x71\xfe\x73\x14\x18\xc2\xbd\x14\x6e\x20\x8b\xba\xb1\xc0\x06\
+\x23\x13\x00\x3c\x0a\x08\xbf\xca\x0d\xeb\x9c\xc9\xc2\x29\x57\x4a\
+\x5c\x3e\x38\x59\xb6\xe7\x18\x0f\xcd\xd9\xc0\xe6\xa3\xa5\x7e\xbd\
+\xee\xc0\xdc\x54\xfe\x71\x77\x67\xba\xb5\xf2\xbd\x36\xb8\xaf\xb0\
+\x8a\x1e\x0f\xae\xa4\xbc\x5a\x7e\x69\x49\xe7\xce\x9d\x59\xb5\x6a\
+\x15\x49\x49\xe7\x97\xe0\xb4\x30\x87\x5d\xbb\x76\x31\x78\xf0\x60\
+\xf2\xf3\xf3\xcf\xfb\xb9\x8c\x8c\x0c\x96\x2c\x59\x42\x97\x2e\x5d\
+\xfc\xe4\x59\x88\x62\x78\xa0\x62\xad\xcf\x53\x01\xa7\x39\x55\x5e\
+\xc5\x15\x43\x1e\x60\xf3\x36\xf9\x37\x6e\x5b\x54\x24\xfd\xfe\xf1\
+\x38\xb1\x99\xbe\x8f\x58\x57\x1e\x2e\x64\xc7\xdb\x73\x28\x5a\x2f\
+\x9c\x55\x16\x42\xcb\x68\x8b\x63\xe2\x93\xd8\xba\x5d\xe5\xd7\xeb\
+\x8a\x60\x1c\x2a\xc6\x50\xb4\x1a\x18\xc0\x35\xe3\x3e\xbc\xfb\xa5\
+\xf4\x7d\x1e\x00\x5e\x11\x39\x28\x13\x00\xac\x05\x2e\x11\x3d\xfc\
+\xf1\x5d\x57\x30\xaa\x9b\x89\xdd\xaa\x8d\x18\xaf\x61\xf0\xde\xba\
+\x3c\x7e\xf5\xc9\xf7\x1c\x2f\x57\xa3\x34\xe5\x0b\xba\xa6\x71\xf3\
+\x80\x4c\x9e\xbf\xa3\xd3\x05\xf5\x05\x5c\x1e\x83\xcb\x7f\xfd\x2d\
+\x6b\x77\xcb\x07\x2a\x19\x19\x19\xac\x59\xb3\x86\xac\xac\x46\x50\
+\xc7\x0b\x43\x0e\x1d\x3a\x44\x9f\x3e\x7d\x28\x28\x28\xf0\xe9\xf3\
+\x19\x19\x19\xac\x5e\xbd\x9a\xec\xec\x6c\x93\x3d\x0b\x71\xdc\x25\
+\x50\xb9\xb9\xc1\xc7\x0e\xe6\x1f\xa3\xcf\xd5\xf7\x51\x78\x4c\xbe\
+\xde\x9e\xdc\xb1\x0d\xbd\x9f\x79\x04\xcd\x76\xfe\x34\xba\xab\xbc\
+\x92\x3d\x33\xff\xc3\xa1\xff\x7c\xed\xbf\xce\x7e\x40\x8b\x4d\xc4\
+\x3e\xea\x11\xec\x83\x6e\x03\x5b\x70\x48\xa1\x1b\x25\x15\x18\x27\
+\xd4\x69\x1b\x78\x77\x2c\xc5\x35\xe7\x37\x32\x26\x56\x01\x97\x8b\
+\x1c\x14\xed\x01\x68\x03\x3c\x8b\x60\x00\x91\x9e\x10\xc5\xeb\xe3\
+\x2e\xc1\xa6\x87\x56\xf3\x9f\xaf\x9c\x96\x1d\xbe\xab\x6f\x9d\xec\
+\xf0\xba\x83\x25\x78\xfc\xb0\x57\xf8\xb4\xec\xf0\xdb\x4b\xea\xde\
+\x02\x2f\x6d\x9f\x54\xef\xcf\xe0\xc9\x19\x7b\x98\xb9\xbc\x61\x75\
+\xcc\x73\xe1\x70\x38\x58\xb0\x60\x01\xb9\xb9\xb9\xd2\xb6\x2c\x1a\
+\x4e\x79\x79\x39\xd7\x5c\x73\x0d\x7b\xf7\xfa\x5e\x5b\xae\xa8\xa8\
+\x60\xf1\xe2\xc5\xdc\x72\xcb\x2d\x56\x5f\x80\x0c\x7a\x4c\x9d\x4e\
+\x80\xb7\x61\x1d\xf3\x49\x89\x71\xf4\xeb\xdd\x95\xe9\xb3\x16\x4b\
+\x2f\x0a\xaa\x29\x3e\x89\xa6\x6b\xa4\xe4\xb6\x3f\xe7\xdf\x1b\x1e\
+\x2f\x87\x97\xac\x62\xc3\x33\xff\xe6\xc4\xe6\x40\xc9\xf4\x5e\x0e\
+\x7e\x5e\x60\x24\x85\x4d\x03\x55\x4b\x81\x00\x2d\x25\x0b\xef\xc6\
+\x8f\xc1\x25\x3c\x59\x91\x05\x4c\x03\x1a\xfc\xb6\x26\x1a\x00\xdc\
+\x0b\x0c\x12\x3c\xcb\x94\x7e\x6d\x19\xd2\x39\x53\xf4\x78\xc8\x10\
+\x7d\x5a\x76\xb8\x67\x36\xfb\x8b\x2b\xd9\x53\xe4\x27\xd9\x61\x67\
+\x9d\xec\xf0\x87\x2b\x0b\x68\x9d\x1e\x43\xfb\xcc\x1f\xaf\xd0\x5c\
+\xb5\xe3\x24\x77\xbd\xb2\x45\xc9\xbd\xe0\x95\x57\x5e\x61\xec\xd8\
+\xb1\xf2\x86\x2c\x1a\x8c\xc7\xe3\x61\xdc\xb8\x71\x2c\x5f\xbe\xbc\
+\xc1\x67\x8b\x8a\x8a\xf8\xfe\xfb\xef\x99\x30\x61\x02\x7a\x30\xdd\
+\x9c\x1b\x1b\xf6\xf8\x06\x37\x04\x02\x64\x35\x6f\x42\x62\x7c\x2c\
+\x8b\x96\xae\x95\x76\xe1\xe4\x8e\x7d\xa4\xf5\xe8\x44\x54\x5a\xf2\
+\x8f\xfe\xbc\x64\xd3\x2e\x36\xfc\xe5\x5f\x01\x90\xe9\xed\x47\xc4\
+\x83\x53\x7f\x90\xe9\x0d\xbe\x1e\x30\xcd\x6e\xc3\x50\xb8\x14\x08\
+\xdd\x86\x51\x5e\x84\x71\x44\xb8\xd7\x4a\x03\x8e\x00\xdf\x34\xf4\
+\xa0\x68\x00\xf0\x4f\x40\xb8\x7d\xff\xe5\xb1\x17\x93\x99\xa8\x7e\
+\x56\x3d\x58\x49\x8b\x8d\xe4\xe6\x5e\xad\xb8\xbc\x4d\x13\xd6\xe7\
+\xfb\x57\x76\x78\xc6\xd7\x75\xb2\xc3\xbd\xda\x25\xd2\x24\x31\x82\
+\x5a\x97\x97\xe1\x4f\x7f\xc7\xf1\x32\xf9\x1b\xc2\x2d\xb7\xdc\xc2\
+\x33\xcf\x3c\xa3\xc0\x53\x0b\x11\x1e\x7c\xf0\x41\xde\x7b\xef\x3d\
+\xe1\xf3\x7b\xf7\xee\xa5\xb0\xb0\xd0\x12\x68\x92\x41\x73\xf8\xac\
+\x18\xf8\x53\x7a\xf7\xea\xa4\x66\x32\xc0\x30\x38\xb9\x63\x3f\x59\
+\xd7\xf4\x43\xb3\xe9\x54\x15\x14\xb1\x35\x20\x32\xbd\xad\xd4\xc9\
+\xf4\x06\x1a\xb7\x17\x6a\x14\x06\x4d\x51\x71\x78\xbf\xff\x44\xc6\
+\x42\x2a\x75\x82\x7c\x0d\x42\x24\x07\xdf\x09\xd8\x2e\x70\x0e\x80\
+\x9c\xb4\x38\xf6\x3e\x61\xdd\x50\xea\xc3\xe5\xf1\xf2\xda\x8a\x3d\
+\x3c\xf9\xd9\x16\xca\xaa\xfd\xb3\x3f\x00\xc0\x61\xd3\xb8\x77\x58\
+\x4b\x22\xec\x3a\xcf\x7f\x2c\xdf\x80\x74\xd1\x45\x17\xf1\xcd\x37\
+\xdf\x10\x13\x13\x7c\x11\x7e\x28\xf0\xf2\xcb\x2f\x2b\xdb\xb5\xf0\
+\xf2\xcb\x2f\x73\xff\xfd\xf7\x2b\xb1\x15\x96\x18\x2e\x28\x5f\x0d\
+\x46\xc3\x9b\x69\xab\x6b\x6a\xb9\xfc\xda\x07\xd8\xb0\x69\x8f\xb4\
+\x1b\x39\x37\x0e\x41\xb3\xdb\xd8\xff\xd1\xe7\x78\x55\xa8\x11\xfa\
+\x4a\x64\x0c\xf6\xa1\x53\x70\x8c\xb8\x3f\x30\x1b\xfc\xcc\xa0\xc6\
+\x89\x37\xdf\xf7\x85\x4f\x17\xc6\xc0\xf9\xea\x48\x8c\x52\xa9\xb2\
+\x6b\x3b\xa0\x41\xd1\xa2\x48\x06\x60\x0a\x20\xdc\xaa\x79\xef\xe5\
+\xed\x18\x14\xa2\xb3\xff\x2a\x08\xb4\xec\xf0\x37\x3b\xe5\xe7\xfd\
+\x53\x52\x52\x58\xb6\x6c\x19\x4d\x9a\x34\x51\xe0\x99\x45\x43\x59\
+\xb4\x68\x11\xb7\xdd\x76\x1b\x5e\x45\xf2\xa5\x8b\x17\x2f\xa6\x7b\
+\xf7\xee\x74\xe8\xd0\x41\x89\xbd\xb0\x43\xfb\xe1\x36\xeb\xa3\x58\
+\xd0\xd9\x38\xec\x76\xae\x1e\x70\x31\xef\xce\x5c\x4c\x8d\x64\x9a\
+\xfe\xe4\xf6\xbd\x9c\xd8\xba\xc7\x8f\x32\xbd\x1a\xb6\x7e\x63\x89\
+\x7c\xf8\xff\xb0\x75\x1f\xac\x5e\xa6\x37\x90\xd8\x74\x28\xad\x52\
+\xd8\x33\xa1\xd5\x95\x01\x0e\x6f\x92\x31\x72\x98\x06\x96\x01\x44\
+\x8a\x7b\x52\xca\x2d\xe3\x7a\x58\x9d\xc5\xbe\x90\x1a\x1b\xc9\x4b\
+\x63\x2e\x66\xed\xa3\xd7\x72\x45\x4e\x70\x3d\x48\x5f\x7f\xfd\x75\
+\x5a\xb5\x6a\x15\x68\x37\xc2\x92\x6d\xdb\xb6\x31\x61\xc2\x04\xdc\
+\x6e\x75\x6f\x78\x1e\x8f\x87\x5b\x6e\xb9\x85\x4d\x9b\xa4\x6e\x4e\
+\xe1\x4d\x64\x16\xe8\x62\x0d\x95\x39\xad\x33\x79\xeb\x15\x61\xbd\
+\xb5\x80\xa0\xb7\xe9\x4e\xe4\x1f\xe6\x13\xf1\x8b\x97\xd0\x12\x83\
+\x4b\xe9\xd5\x27\x34\x0d\x62\xd5\x66\x33\x6c\x9d\x07\xcb\x9a\x18\
+\xdd\xd0\x03\x0d\x0d\x00\x5a\x20\x21\xfc\xd3\xa1\x69\x02\x17\x35\
+\xb7\xe6\xc0\x1b\x42\xcf\xac\x64\x96\x3f\x78\x35\xf3\x7f\xd1\x9f\
+\x56\x29\x26\xe9\x5d\x2b\xe4\xce\x3b\xef\x64\xdc\xb8\x71\x81\x76\
+\x23\x2c\x29\x2c\x2c\x64\xd8\xb0\x61\x94\x95\x95\x29\xb7\x5d\x5e\
+\x5e\xce\xb0\x61\xc3\x38\x7c\x58\x4a\x7c\x2c\x8c\xd1\x21\x52\x7c\
+\xb9\xcd\x98\xeb\xfb\x33\xf9\xa6\x6b\x15\xfa\x63\x0e\x5a\x72\x3a\
+\x11\xbf\x78\x89\xc8\x27\x3e\x45\xcf\x11\x7e\x54\x04\x05\x5a\x8c\
+\xda\x09\x19\x2d\xa3\x13\x5a\x8a\xd4\x0b\x72\x1f\xea\x9e\xd1\x3e\
+\xd3\xd0\x00\xe0\x06\x24\x76\x07\x8c\xef\x69\xbd\xfd\x8b\x32\xa2\
+\x6b\x73\xb6\xfd\xf6\x3a\x9e\x1c\xda\x95\x98\x88\xc6\x99\x4a\x6b\
+\xd7\xae\x1d\xff\xf8\xc7\x3f\x02\xed\x46\x58\x52\x5d\x5d\xcd\xa8\
+\x51\xa3\x38\x74\xc8\x3c\x69\xd6\xa3\x47\x8f\x32\x72\xe4\x48\x2a\
+\x2b\xd5\x09\xa2\x84\x15\x11\x19\xa0\x8b\x37\x3f\xbf\xf2\xdc\xfd\
+\xe4\xb4\x6e\xa4\xd3\x53\x11\xd1\xd8\x47\x3d\x42\xd4\xdf\x56\x62\
+\xeb\x37\xd6\x7f\x32\xbd\x81\x24\x36\x52\xb9\x49\xbd\xd3\xd5\x32\
+\xc7\x35\xa0\x41\x0d\x76\x0d\x0d\x00\xac\xf4\x7f\x00\x89\x89\xb0\
+\xf1\xc7\xa1\xb9\xec\xf8\xdd\x70\xc6\xf7\xcc\x6e\x54\xbf\x63\x76\
+\xbb\x9d\x77\xdf\x7d\x97\xb8\xb8\xb8\x40\xbb\x12\x76\x78\xbd\x5e\
+\x6e\xbe\xf9\x66\xd6\xac\x91\xda\x26\xe6\x13\x1b\x36\x6c\x60\xd2\
+\xa4\x49\xca\xfa\x0b\xc2\x0b\x4d\x2a\x0b\x10\x1f\x17\xc3\x07\x6f\
+\xff\x01\x87\xa3\x11\x2d\xcc\xd1\x34\x6c\xbd\xaf\x27\xea\xd9\xaf\
+\x71\x8c\x7e\x14\x22\xc2\x68\xba\xcb\xa6\xa3\x45\xaa\x11\x5c\x3a\
+\x63\xb2\xb3\x54\x00\x00\x0d\x2c\x03\x34\xe4\x55\x32\x85\xba\x75\
+\x83\x42\x43\xc1\x5d\x32\x12\xf9\xe3\x50\x6b\x19\x8c\x0a\x12\xa3\
+\x1d\x8c\xed\x9e\xcd\xa0\x0e\xe9\x6c\x3a\x72\x92\x82\x53\xfe\xdb\
+\x26\x58\x1f\x4f\x3f\xfd\x34\x13\x27\x0a\x0b\x43\x5a\x48\xf0\xeb\
+\x5f\xff\x9a\xb7\xdf\x7e\xdb\x6f\xd7\xdb\xb1\x63\x07\x35\x35\x35\
+\x0c\x1e\x2c\x5d\xb3\x0c\x3f\x6c\x71\xe0\x3a\x26\x34\x11\x00\xd0\
+\x3c\x23\x0d\xc3\x30\xf8\x6a\xa5\xbc\x72\xa0\x2c\x7a\xab\xdc\x3a\
+\x99\xde\x21\xf7\x04\x54\xa6\x37\xa0\xb8\x3d\x50\xad\x6e\x1c\x50\
+\x8b\x4b\xc5\xbb\x6d\x31\x54\x0b\x6f\x60\xcd\xa6\xee\x39\xed\xd3\
+\x43\xa1\x21\x01\xc0\x28\xe0\x46\x11\x8f\x00\xee\xef\xdf\x9e\x2b\
+\xdb\x86\x60\x33\x48\x00\xc9\x4e\x8e\xe5\xee\xcb\x72\xc8\x4e\x8e\
+\x61\xcd\xc1\x12\x2a\x9d\x7e\x1c\xed\x39\x8b\xee\xdd\xbb\x33\x6d\
+\xda\x34\x6b\x61\x4c\x00\x98\x3a\x75\x2a\xbf\xfe\xf5\xaf\xfd\x7e\
+\xdd\x55\xab\x56\x91\x9e\x9e\x4e\xaf\x5e\xbd\xfc\x7e\xed\xe0\x46\
+\xab\x9b\x0a\x70\x17\x0b\x5b\xe8\xd7\xa7\x2b\xff\x59\xbc\x86\x82\
+\x42\x95\x63\x68\xbe\xa3\x25\x36\x21\xe2\xe6\xa7\x71\x4c\x7e\x06\
+\x2d\x2d\x3c\xd7\xb9\x9f\x46\xd3\x34\x8c\x53\xc2\x1b\xfc\xce\x89\
+\x51\x75\x12\xe3\xd0\x06\xd1\xe3\x36\x60\x03\x3e\x8e\xea\x37\x24\
+\x00\x78\x0c\xb8\x48\xc4\x23\x80\x7f\x8e\xbb\x84\x26\x71\xea\x6b\
+\x26\xe1\x8e\xa6\x69\xf4\xcc\x4a\xe1\xde\x2b\xda\xe1\xb0\xe9\xac\
+\xce\x2b\xc6\xe3\x27\xd9\x61\xa8\x4b\xfd\x7f\xfa\xe9\xa7\x34\x6f\
+\x2e\xa6\x36\x68\x21\xce\xd7\x5f\x7f\xcd\x84\x09\x13\xf0\x78\xd4\
+\xe8\x93\x37\x94\xc5\x8b\x17\xd3\xb7\x6f\x5f\xda\xb4\x69\x13\x90\
+\xeb\x07\x2d\xb6\x38\x70\x15\x0a\x67\x01\x74\x5d\xa7\x77\xaf\x4e\
+\xbc\x3d\xfd\x33\xff\x96\x62\x7e\x90\xe9\x8d\x78\xe0\x2d\xf4\xb6\
+\x17\x87\x47\x9d\xff\x42\xd8\x75\x0c\xa5\xe3\x80\xa0\xc5\xa7\xe1\
+\xf9\x6e\xb6\x8c\x89\x0a\xc0\xa7\xad\x42\xbe\xbe\xb2\xe9\xc0\x10\
+\x51\x6f\x72\x33\x93\xe8\xd4\x2c\x4c\x53\x44\x7e\x22\x36\xc2\xce\
+\x1f\x87\xe6\xb2\xe5\xf1\x61\x8c\xe8\xea\xbf\x87\xf1\x63\x8f\x3d\
+\x46\x8f\x1e\x3d\xfc\x76\x3d\x8b\x3a\x76\xee\xdc\xc9\xe8\xd1\xa3\
+\x71\x3a\xfd\xb7\xc2\xf5\xa7\xb8\x5c\x2e\xc6\x8c\x19\xc3\xd6\xad\
+\x5b\x03\xe6\x43\x70\xa2\xd5\x8d\x05\x4a\x70\x51\xd7\x1c\x1e\xfe\
+\x7f\xfe\x5b\xb1\x6d\xeb\x31\x98\xa8\x67\xbe\xc2\x71\xcb\xd3\x68\
+\xd1\xbe\x2b\x8a\x86\x3c\x9a\x86\x16\xad\xb6\x0f\x40\x4b\x6d\x85\
+\x96\x26\x15\x54\x0f\xc5\xc7\x66\x7d\x5f\x03\x80\x4b\x01\xe1\x61\
+\xf4\x61\xd6\xde\x7f\xbf\xd1\xae\x49\x3c\xf3\x7f\xd1\x9f\xcf\xff\
+\xdf\x40\x3a\xa7\x27\x9a\x7a\xad\x0e\x1d\x3a\xf0\x87\x3f\xfc\xc1\
+\xd4\x6b\x58\xfc\x9c\x92\x92\x12\x46\x8c\x18\xc1\xc9\x93\xf2\x4b\
+\x9b\x64\x39\x75\xea\x14\xd7\x5f\x7f\x3d\xc7\x8f\x1f\x0f\xb4\x2b\
+\xc1\x85\x23\xa3\x6e\x4d\xb0\x04\x7f\x7c\x7c\x32\x6d\xdb\x98\x1b\
+\xec\x6b\xcd\xdb\x13\xf9\xab\x19\x44\x3c\xf4\x7f\x68\xcd\x5a\x9b\
+\x7a\xad\xa0\x25\xda\x84\x69\x80\xb6\x97\xc9\x1c\x4f\x07\x7c\x7a\
+\x2b\xf3\x35\x00\x18\x2a\xee\x0b\x0c\xed\x9c\x21\x73\xdc\x42\x80\
+\x6b\x3a\xa6\xb3\xe9\x37\x43\x79\x69\xcc\xc5\xa4\xc4\xa8\x5f\xbf\
+\xa9\x69\x1a\xaf\xbd\xf6\x9a\xa5\x16\xe7\x67\x9c\x4e\x27\x63\xc7\
+\x8e\x6d\x90\xba\x9f\xd9\x1c\x38\x70\x80\x1b\x6e\xb8\x81\x9a\x9a\
+\xc0\x37\xa3\x06\x0d\x9a\x0d\x22\xe4\x5e\x8c\xa2\xa3\x22\x79\xf3\
+\xe5\x47\xd1\x4c\x48\xc5\x6b\xb1\x49\x38\x6e\x79\x9a\xa8\x3f\x2d\
+\x41\xef\x7a\xa5\x72\xfb\x21\x45\xb4\xfa\xfb\xab\x9e\x23\x15\x00\
+\x00\x0c\xf3\xe9\x3a\x3e\x1a\x13\x0e\x00\x12\xa2\x1c\x5c\xd6\x3a\
+\xc8\x85\x1f\x82\x14\xbb\xae\xf1\xc0\x95\xed\xd9\xfb\xc4\x08\x1e\
+\xb8\xb2\x3d\x76\x85\xf2\xcb\xb7\xdc\x72\x0b\x57\x5d\x25\xbc\x11\
+\xda\x42\x00\xc3\x30\xb8\xfd\xf6\xdb\xf9\xea\xab\xaf\x94\xd8\x4b\
+\x8b\x88\x26\x4d\xd1\xd8\xd6\xaa\x55\xab\xb8\xf3\xce\x3b\x31\xfc\
+\x25\x27\x1b\x0a\x44\xb6\x40\x70\xa8\xea\x0c\x03\x2e\xef\xce\xf8\
+\xd1\x03\xd5\xf8\x03\xa0\xe9\x75\xeb\x7b\x9f\xfd\x1a\xfb\xe0\x3b\
+\xc1\xd6\x88\x46\x0e\x1b\x29\x5a\x94\x03\xcd\xa6\x36\x08\xd3\xb3\
+\xbb\x43\x84\x94\x8e\x8a\x4f\xcf\x6c\x5f\x9a\x00\x93\x80\x17\x11\
+\xfc\xa6\x5e\xd7\xa5\x39\x37\x5d\x2c\x3e\xfb\x6a\x21\x4f\xb4\xc3\
+\xc6\xd0\xce\x99\x8c\xee\xd6\x82\xcd\x47\xcb\xc8\x3f\x29\xa7\x65\
+\x6d\xb3\xd9\xf8\xec\xb3\xcf\xac\x99\x7f\x3f\xf3\xd4\x53\x4f\xf1\
+\xea\xab\xaf\x2a\xb1\x15\xa1\xdb\x98\xdf\x77\x2c\x37\x67\x75\xe1\
+\xfd\xfc\x6d\x78\x14\x3c\xb8\xb7\x6c\xa9\x93\x33\x1d\x30\x60\x80\
+\xb4\xad\xb0\x40\xb3\x81\x51\x0d\x9e\x0a\x29\x33\x57\xf4\xcd\xe5\
+\xc5\xd7\x3e\x92\x0e\xbe\xf4\xf6\x97\x12\xf1\xc8\x34\xec\x03\x6f\
+\x0d\x4a\x99\xde\x80\x52\xe3\x02\x95\x53\x58\xba\x0d\xe3\xf0\x16\
+\x8c\x13\x07\x45\x2d\x64\x00\x2f\x01\xe7\x95\x96\xf5\xe5\xa1\x7e\
+\x15\xe2\xb2\xc1\x0c\xe9\x64\xa5\xff\x1b\x0b\xaa\x9a\x31\x27\x4c\
+\x98\x40\x7a\x7a\xba\x02\x8f\x2c\x7c\x65\xd6\xac\x59\x3c\xfd\xf4\
+\xd3\x4a\x6c\x69\xc0\x5b\x3d\x86\x32\x20\x2d\x9b\x7e\xa9\x2d\x78\
+\xb7\xd7\x08\xf1\xf5\x9e\x3f\xe1\xe9\xa7\x9f\x66\xfa\xf4\xe9\x8a\
+\xac\x85\x01\x11\x72\xcd\x80\x00\xcd\x9a\x26\x33\x76\xa4\x7c\x9a\
+\x5e\x6f\xd1\x11\xbd\x45\x47\x69\x3b\x61\x89\x19\x65\x00\xb9\x3e\
+\x00\x3b\xd0\xff\x82\xd7\xf0\xc1\xd0\x20\x19\x2f\xae\xb5\x02\x80\
+\x46\xc3\xbe\xe2\x0a\xa6\xad\x3d\x20\x65\x23\x36\x36\x96\xb7\xde\
+\x7a\x4b\x91\x47\x16\xbe\xb0\x72\xe5\x4a\x26\x4f\x9e\xac\x2c\xbd\
+\xfe\x44\xc7\xcb\xb9\x35\xbb\xeb\x99\xff\x3d\xae\x79\x47\x9e\xe8\
+\x78\xb9\x12\xdb\x86\x61\x70\xd7\x5d\x77\x29\x2b\x53\x84\x3c\xb6\
+\x38\xb0\xc9\x07\xe5\xef\xbe\xf1\x38\x71\x71\x72\xe5\x1c\xf7\xd7\
+\x33\x30\x8a\xcc\x5b\x25\x1d\xd2\x98\xd1\x08\x28\xdf\x07\x70\xc1\
+\x67\xb7\xa9\x01\x40\xd7\x8c\x44\xb2\x93\xad\x54\x52\x63\xe1\xa9\
+\xcf\xb6\xe0\xf2\xc8\xcd\x0d\x4f\x9d\x3a\xd5\x6a\xfc\xf3\x23\x07\
+\x0e\x1c\x60\xcc\x98\x31\xd4\xd6\x9e\x37\x93\xe7\x33\xe3\x9a\x77\
+\xe4\xc9\x4e\x3f\x7f\xd8\x3f\xd9\xe9\x72\x6e\xc9\xea\xa2\xe4\x1a\
+\xa7\x1b\x15\xf7\xec\x91\xd7\xb0\x0f\x0b\x24\x9b\x01\x01\x22\x22\
+\xec\xfc\xeb\x1f\x8f\xc8\x19\xf1\xb8\x71\x2d\x78\x59\xda\x97\x70\
+\x44\x8b\xb4\x2b\xef\x03\xd0\x92\x32\xd1\x52\x5b\xc9\x98\xb8\xe0\
+\x5e\xe1\x0b\x05\x00\xcd\x01\x61\x11\xf0\xa1\xd6\xf8\x5f\xa3\x61\
+\x7f\x49\x05\x33\xd6\x0b\xd7\x93\x00\xb8\xfa\xea\xab\x2d\xa5\x3f\
+\x3f\x72\xea\xd4\x29\x46\x8c\x18\xa1\x6c\xc4\xae\x5f\x6a\x0b\xa6\
+\x5d\x3c\xfc\x9c\xe9\x7e\x0d\x78\xbb\xe7\x30\x06\xa4\xa9\xd1\xeb\
+\x68\x4c\xa3\x8a\x8d\x1e\x47\x33\xd0\xe4\x9b\xed\x26\x8e\x1d\xc4\
+\xc0\xfe\x72\x3b\x39\x3c\x2b\x3f\xc4\x28\xb6\x14\x1f\x45\x30\x22\
+\x1b\xdd\x34\x40\x17\xea\x46\x02\xeb\xb7\x7f\x01\x03\x52\x6d\xde\
+\x56\xfd\xbf\xf1\xf0\xe2\xb2\x5d\x52\x1b\x02\x35\x4d\xe3\x2f\x7f\
+\xf9\x8b\x42\x8f\x2c\xce\x87\xcb\xe5\xe2\x86\x1b\x6e\x60\xdb\xb6\
+\x6d\x4a\xec\xb5\x8e\x49\x62\x6e\xef\x1b\x88\x3a\x4f\x57\x77\x84\
+\x6e\xe3\xa3\xde\xa3\x69\x17\x97\xac\xe4\x9a\xbb\x76\xed\x62\xd4\
+\xa8\x51\x01\x5d\x56\x14\x14\x68\x3a\x38\xd4\xf4\xd4\x3c\xf7\xf4\
+\x3d\x72\x63\x81\x1e\x37\xee\x25\xfe\xd3\x95\x08\x25\xb4\x28\xb5\
+\x0b\x81\x40\xba\x0f\x40\x03\xce\x3b\x22\x72\xa1\x00\xe0\x82\x4d\
+\x04\xf5\x11\x17\x69\xa7\x5f\x1b\xe1\xdd\x41\x16\x0a\x39\x59\xe5\
+\xe4\xff\xd6\xec\x97\xb2\x31\x7a\xf4\x68\x2e\xb9\xe4\x12\x45\x1e\
+\x59\x5c\x88\xfb\xef\xbf\x9f\x2f\xbe\xf8\x42\x89\xad\x04\x7b\x24\
+\xf3\xfb\x8e\xa1\xa9\x0f\x9d\xdd\xa9\x11\xd1\xcc\xef\x33\x96\x64\
+\x87\x9a\x32\xcf\xf2\xe5\xcb\x99\x32\x65\x8a\x12\x5b\x21\x4d\xa4\
+\x9a\x85\x3e\x17\x77\x6f\xcf\x88\x21\x7d\xa5\x6c\xb8\xbf\x9a\x81\
+\x51\x75\x4a\x89\x3f\x61\x85\x19\x8d\x80\x2d\x7b\xca\x8e\x03\x5e\
+\x71\x5e\xfb\x17\x38\x2c\xdc\x19\x34\xa8\x7d\x3a\x91\x76\x4b\x1c\
+\xa6\x31\xf0\xda\xca\x3d\x54\xd4\x8a\x8f\xa8\xe8\xba\xce\x13\x4f\
+\x3c\xa1\xd0\x23\x8b\xf3\xf1\xec\xb3\xcf\xf2\xaf\x7f\xfd\x4b\x89\
+\x2d\x87\xae\x33\xa7\xf7\x68\xba\x26\xf8\x1e\x8c\x77\x8c\x4f\x65\
+\x5e\x9f\x31\x44\xe8\xc2\xc3\x3f\x3f\xe2\x9d\x77\xde\xe1\xaf\x7f\
+\xfd\xab\x12\x5b\x21\x8b\x1e\xa3\xa4\x19\x10\xe0\xcf\x7f\xb8\x03\
+\x5d\x66\xe7\x47\x4d\x05\x9e\x65\xd6\x24\x47\x83\x89\x52\x1f\x00\
+\x60\x8b\x40\xcf\xee\x29\x63\x41\x38\x00\x48\x43\xa2\xfe\x3f\xa8\
+\x43\x33\xd1\xa3\x16\x0a\xa9\x75\x7b\xf9\xe7\x72\xb9\x66\xac\xf1\
+\xe3\xc7\x73\xd1\x45\xc2\x3a\x50\x16\x0d\x60\xee\xdc\xb9\xfc\xee\
+\x77\xbf\x53\x66\xef\xe5\x6e\x83\xb9\xba\x69\xab\x06\x9f\xeb\x9f\
+\x96\xc5\x1b\xdd\xaf\x55\xe6\xc7\xe3\x8f\x3f\xce\xcc\x99\x33\x95\
+\xd9\x0b\x49\x22\xd4\xdc\x33\x73\x3b\xb7\x61\xcc\xf5\xc2\xc9\x5b\
+\x00\xdc\x8b\xdf\x06\xb7\x4b\x89\x3f\xe1\x82\xa6\x6b\x68\x11\x26\
+\x94\x01\x5a\x4b\x65\x5e\xbb\x00\x29\xf5\xda\x3e\xcf\xc1\x2b\xf0\
+\x51\x50\xe0\x5c\xf4\xcf\xb1\xa4\x7f\x1b\x03\xef\x7f\x97\x47\x81\
+\x84\x5c\xa5\xcd\x66\xb3\xde\xfe\xfd\xc4\xfa\xf5\xeb\x99\x34\x69\
+\x92\x32\x85\xb7\x5f\xb7\xef\xc3\x94\xd6\xe2\x4d\x61\xb7\xb7\xec\
+\xc6\x63\xed\xfa\x28\xf1\xc5\x30\x0c\xee\xb8\xe3\x0e\x56\xaf\x5e\
+\xad\xc4\x5e\x48\xe2\x68\x86\xc4\x2d\xf7\x47\xfc\xf9\xf7\x77\x62\
+\xb3\x89\x67\x60\x8d\xd2\x63\x78\x56\xcf\x53\xe2\x4b\x58\x61\x46\
+\x1f\x40\xb6\x54\x63\xa7\x06\xd4\xdb\x48\x70\xa1\x00\x40\x88\xe4\
+\x98\x08\x72\x33\xcd\x15\xa2\xb1\xf0\x8d\x17\x97\xed\x94\x3a\x7f\
+\xcb\x2d\xb7\xd0\xb1\xa3\xb5\x1c\xc4\x6c\x8e\x1c\x39\xc2\xc8\x91\
+\x23\xa9\xac\xac\x54\x62\xef\x86\xcc\x0e\xfc\xa5\xb3\xfc\x72\x98\
+\x67\xbb\x0e\x60\x42\x33\x35\xe3\x81\xd5\xd5\xd5\x8c\x1e\x3d\x9a\
+\x43\x87\xac\x59\xf3\x73\xa2\x39\xc0\x5e\xef\xcb\x5a\x83\x68\xdf\
+\xb6\x05\x13\xc6\xc8\xad\xea\x76\x2f\x52\x53\x86\x0a\x27\xcc\x68\
+\x04\xd4\xd2\x3b\x42\xa4\xd4\xd6\xd5\x7a\x9f\xe5\xe7\x0b\x00\xfa\
+\x89\x5e\xed\xf2\x36\x4d\xd0\x2d\xad\xe8\x80\xb3\x62\x5f\x11\x5b\
+\x0b\xca\x84\xcf\x6b\x9a\xc6\x23\x8f\x48\xce\x16\x5b\x5c\x90\xf2\
+\xf2\x72\xae\xbb\xee\x3a\x8e\x1c\x39\xa2\xc4\x5e\xcf\xa4\x74\xde\
+\xed\x35\x5c\xc9\xef\xa0\x06\x4c\xbd\x64\x28\xbd\x63\xe5\x37\xd6\
+\x01\x14\x16\x16\x32\x74\xe8\x50\xca\xca\xc4\xbf\x97\x21\x8d\xa2\
+\x32\x00\xc0\xaf\x1f\x9a\x20\x35\x11\xe0\xcd\xdf\x81\x77\xef\x7a\
+\x65\xfe\x84\x03\x86\x09\x01\x00\x9a\x8e\xde\xa2\x9b\x8c\x85\x7a\
+\x7b\xf9\xea\x0b\x00\x22\x01\xe1\xa2\xef\x95\x6d\xad\xf4\x7f\x63\
+\xe0\xcd\x6f\xe4\x14\xe3\x86\x0c\x19\x42\xb7\x6e\x52\x5f\x3c\x8b\
+\x0b\xe0\xf1\x78\xb8\xf9\xe6\x9b\xd9\xb4\x69\x93\x12\x7b\x99\x51\
+\x71\x7c\xd2\x67\x0c\xb1\x36\x75\x37\xa2\x68\x87\x9d\x79\xdd\xc6\
+\x93\x1d\x91\xa4\xc4\xde\xf6\xed\xdb\x99\x30\x61\x02\x6e\xb7\xc2\
+\xdd\xe9\xa1\x82\x3d\xad\x4e\x23\x40\x01\xb9\x9d\xdb\x70\xf5\x00\
+\xa9\x06\x32\xdc\x5f\xbd\xaf\xc4\x97\x70\x41\x8b\x70\xa8\xaa\xe2\
+\xfc\x08\xbd\xa5\xd4\xcf\xb1\x27\x70\xce\x0e\xc5\xfa\x02\x80\x8b\
+\xa8\x0b\x02\x84\xe8\xdf\xd6\x1a\xff\x0b\x34\xa5\xd5\x4e\xe6\x6c\
+\xca\x97\xb2\xf1\xe8\xa3\x8f\x2a\xf2\xc6\xa2\x3e\x1e\x7a\xe8\x21\
+\x16\x2c\x58\xa0\xc4\x56\xbc\x3d\x82\xcf\x2e\x1b\x47\x8b\xe8\x78\
+\x25\xf6\xce\x26\x3d\x2d\x82\x05\x39\x93\x89\xd7\xd5\xac\x3c\x5d\
+\xb4\x68\x11\x0f\x3f\xfc\xb0\x12\x5b\x21\x85\x66\xab\x0b\x02\x14\
+\xf1\xe8\xff\xc8\x2d\xee\xf2\xac\xf9\xc4\x1a\x09\x6c\x08\x1a\xa6\
+\x34\x02\x6a\x72\x93\x00\x51\x40\xee\xb9\xfe\xa2\xbe\x00\xa0\xb7\
+\xf0\x95\x1c\x36\xba\x37\x57\xb3\x48\xc4\x42\x9c\xe9\xeb\xf2\xa8\
+\x72\x7a\x84\xcf\x77\xeb\xd6\xcd\x92\xfb\x35\x99\xb9\x73\xe7\x2a\
+\x53\xf7\xb3\x69\x1a\xef\xf5\x1a\x41\xb7\x44\x93\xb2\x6f\x76\x2f\
+\xdd\x92\x53\x99\xdd\x7a\x22\x76\x4d\xcd\x78\xef\xab\xaf\xbe\xca\
+\x2b\xaf\xbc\xa2\xc4\x56\x48\xe1\x50\x17\x00\x5c\x3b\xe8\x12\xba\
+\xe7\xb6\x15\x37\xe0\xac\xc1\xb3\xfa\x13\x65\xfe\x84\x03\x66\x94\
+\x01\xf4\x8c\x8e\x60\x93\x1a\x33\xbc\xf4\x9c\x76\xeb\xf9\xb0\xf0\
+\xdc\x41\xaf\xac\x14\x1c\x12\xdd\xa7\x16\x6a\x98\xfa\xad\xdc\xe2\
+\x9f\x5f\xfd\xea\x57\x72\x1b\xc5\x2c\xce\x4b\x6d\x6d\x2d\xf7\xdd\
+\x77\x9f\x32\x7b\x2f\xe6\x5e\xcd\xf5\x19\xed\x94\xd9\x3b\x27\x09\
+\x2e\x86\x24\xb4\xe7\xef\xcd\xaf\x53\x66\xf2\xe1\x87\x1f\x66\xe1\
+\xc2\x85\xca\xec\x85\x04\xf6\x54\x04\xd5\xd7\xcf\xc9\x43\xff\x6f\
+\x8c\xd4\x79\xcf\xb2\x77\x15\x79\x12\x1e\x98\x91\x01\xc0\x16\x81\
+\x9e\x2e\x3c\x95\x0f\xf5\x3c\xd3\xeb\xfb\x96\x9d\x33\x5a\xf0\x85\
+\x3e\xad\x52\x45\x8f\x5a\x28\x62\x75\x5e\x31\xdf\x1f\x11\xdf\xc1\
+\x9e\x99\x99\xc9\xf8\xf1\xe3\x15\x7a\x64\xf1\x53\xe6\xcd\x9b\x47\
+\x61\x61\xa1\x12\x5b\xf7\xe7\x5c\xcc\xfd\x39\x17\x2b\xb1\x75\x5e\
+\xa2\xdd\xe0\xf0\x70\x7f\x93\xcb\xb8\xbf\x89\xb4\x52\x19\x50\xd7\
+\x03\x71\xd3\x4d\x37\x29\xeb\x81\x08\x09\x34\x1b\xd8\xd5\xf4\x5b\
+\x00\xdc\x34\x66\x10\x19\xe9\xe2\xf7\x65\xef\xa1\xed\x78\xf3\x36\
+\x2b\xf3\x27\xd4\xd1\x22\xe5\x75\x1d\xce\x69\xb7\xf9\x39\xb3\xf8\
+\xbe\xe2\x73\x06\x20\x01\x10\x7e\x95\xb8\xb4\xa5\x15\x00\x04\x9a\
+\x77\x56\xcb\x49\xfe\xde\x7e\xfb\xed\x38\x1c\x26\x44\xb1\x16\x67\
+\x58\xb1\x62\x85\x12\x3b\xc3\xd2\x73\x78\x31\xf7\x82\xa2\x5f\x8a\
+\x30\x20\xbe\x6e\x39\xcc\x8b\xcd\xaf\x63\x58\x82\xd4\x1b\xc9\x19\
+\xca\xcb\xcb\x19\x31\x62\x04\x05\x05\x05\x4a\xec\x85\x04\x0a\xcb\
+\x00\x11\x11\x76\x6e\x9b\x28\xb7\xd4\xc9\xb3\xdc\x5a\xe2\xe4\x33\
+\x51\x0e\x30\x21\x7b\xaa\x37\xef\x7a\xe1\x0f\xd5\x4f\x27\xe0\x67\
+\xcd\x41\xe7\x0a\x00\x7a\xd4\xf3\xe7\x3e\xd1\xa7\x95\xba\x2f\xae\
+\x45\xc3\x71\x79\xbc\x52\xcd\x7f\x9a\xa6\x71\xfb\xed\xb7\x2b\xf4\
+\xc8\xe2\x5c\x1c\x3d\x7a\x54\xda\x46\x97\x84\x34\x66\xf4\xba\x1e\
+\x9b\x3f\x4b\x35\x71\x4e\xd0\xc0\xa6\xe9\xcc\x6c\x75\x13\x17\x45\
+\xab\x11\xfc\xca\xcf\xcf\x67\xf8\xf0\xe1\xca\xf6\x20\x04\x3d\x0a\
+\x1b\x01\x01\xee\x9a\x74\x9d\xd4\x7a\x60\xcf\xda\x4f\xc1\x63\x4d\
+\x6d\xf8\x84\xa6\x81\x43\xcd\x24\xc7\x8f\xcc\xca\x05\x00\x3a\xf0\
+\xb3\x91\xae\x73\x3d\xe8\x85\xe7\xbe\x32\x12\xa2\xc9\x4a\x96\x12\
+\x2e\xb0\x90\x64\xe9\xae\x63\x94\x54\x8a\x6b\xc7\x0f\x1e\x3c\x98\
+\x9c\x9c\x1c\x85\x1e\x59\x9c\x8b\xa8\x28\x39\xb1\x9d\x8c\xa8\x38\
+\x3e\xbb\x6c\x1c\x89\x0e\x35\x5d\xf9\x3e\xa3\x1b\x10\x5f\xa7\xee\
+\x17\x6f\x8b\x64\x41\x9b\xc9\x64\x38\xd4\x4c\x1d\x6c\xd8\xb0\x81\
+\x5b\x6f\xbd\x55\xd9\x26\xc4\xa0\x46\x8f\x54\xa6\x0d\x00\xd0\xa6\
+\x55\x06\x03\x2e\xef\x2e\x7c\xde\x28\x2f\xc1\xbb\xcb\xda\xe2\xe8\
+\x2b\x5a\x84\xfa\x32\x80\x96\x94\x89\x16\x2b\xb5\x28\xea\x67\x5f\
+\x80\x73\x05\x00\xc2\xdf\x92\x8b\xb3\xd5\x6c\xb1\xb2\x10\x67\xd6\
+\x86\x83\x52\xe7\xef\xbe\xfb\x6e\x45\x9e\x58\x9c\x8f\x2e\x5d\xc4\
+\xb7\xeb\xc5\xd8\x1c\xcc\xef\x33\x96\xac\x68\x75\x0f\x88\x06\x11\
+\x5f\x0b\xd4\x49\x4b\x67\x45\x24\x32\xbf\xcd\x24\x62\x74\x35\x25\
+\xa3\x8f\x3f\xfe\x98\xdf\xfc\xe6\x37\x4a\x6c\x05\x3d\x8a\xb6\x02\
+\x9e\xe6\xee\xc9\x72\xcd\x9b\x9e\x35\xf3\x15\x79\x12\x06\x98\x10\
+\x00\xc0\x0f\x5b\x01\xc5\xf9\xd9\x6e\x1f\xa5\x01\x40\x8f\x16\xd6\
+\xf8\x5f\x20\x71\x7a\xbc\xcc\xdf\x2a\xbe\x4d\x2e\x2d\x2d\x8d\x11\
+\x23\x46\x28\xf4\xc8\xa2\x3e\xc6\x8e\x1d\x2b\x34\x65\xa1\x01\x6f\
+\xf7\x1c\x46\xaf\x64\x35\xfa\xf1\x42\x38\xbc\x75\x0d\x81\x3f\xd0\
+\x2b\xa6\x05\xd3\x5b\x8e\x47\x57\xb4\x01\xe5\xb9\xe7\x9e\xe3\x8d\
+\x37\xde\x50\x62\x2b\xa8\xb1\xab\xbd\x9f\xde\x30\xa2\x3f\x4d\xd2\
+\xc4\x9b\x0b\x3d\xeb\x3e\xb5\x04\x82\x7c\xc5\xb4\x00\x40\xaa\xef\
+\xe6\x82\x01\x80\x1d\xe8\x2c\x6a\xdd\x0a\x00\x02\xcb\xe2\x1d\x05\
+\x9c\xac\x72\x0a\x9f\x9f\x3c\x79\x32\x91\x91\x7e\x4e\x29\x87\x29\
+\x1d\x3a\x74\x60\xf4\xe8\xd1\x0d\x3e\xf7\x6c\xd7\x01\x4c\x68\xd1\
+\xc9\x04\x8f\x1a\x48\xc2\x8f\x1f\x04\x37\x24\x75\xe1\x99\xcc\x21\
+\xca\xcc\x3f\xf0\xc0\x03\x7c\xf1\xc5\x17\xca\xec\x05\x25\xf6\x04\
+\x65\x5b\x01\xa1\xae\x19\x70\xe2\xd8\x41\xc2\xe7\x8d\xca\x32\x3c\
+\x3b\x56\x2a\xf3\x27\xa4\x31\x29\x00\x90\x1c\x05\xcc\x05\x7e\xf4\
+\x85\xfa\x69\x00\xd0\x91\xba\xad\x41\x42\x74\x6f\xae\x6e\x74\xc5\
+\xa2\xe1\xcc\xdc\x20\x27\xb2\x32\x71\xe2\x44\x45\x9e\x58\xf8\xc2\
+\x2b\xaf\xbc\x42\x76\x76\xb6\xcf\x9f\xbf\xa7\x75\x77\x65\xea\x7c\
+\xd2\x44\xb9\xc0\xfe\xe3\x5a\xfd\x63\xcd\xfa\x73\x67\x6a\x2f\x25\
+\xe6\x5d\x2e\x17\x63\xc7\x8e\x65\xc7\x8e\x1d\x4a\xec\x05\x27\x3a\
+\xd8\xd4\xde\x53\x6f\x1a\x2b\xb7\xdc\xcb\x2a\x03\xf8\x86\x16\x61\
+\x37\x65\x12\x40\x6b\x26\x15\x00\x44\xf3\x93\x09\xbf\x9f\x06\x00\
+\xc2\x6d\x86\xc9\x31\x11\xb4\x4a\x91\x52\x2c\xb2\x90\xc0\xe5\xf1\
+\xf2\xe9\x36\xf1\xf4\x7f\x4e\x4e\x0e\x3d\x7b\xca\xed\x0d\xb7\x68\
+\x18\x99\x99\x99\x2c\x7d\x7f\x36\x9d\x13\xcf\xbf\x3a\x5b\x03\x1e\
+\x69\x7b\x29\xaf\x77\x57\xf7\x86\x2d\x8d\xc6\x99\x66\xc0\xb3\x79\
+\x3d\x6b\x14\x83\xe2\xd5\x34\x91\x96\x96\x96\x32\x7c\xf8\x70\x8a\
+\x8a\x8a\x94\xd8\x0b\x4a\x14\x97\x01\x2e\xbd\xb8\x23\xad\xb2\xc5\
+\xcb\x47\xde\x0d\x8b\xc1\x2b\xbe\x61\x34\x6c\xd0\x34\xb0\x99\x30\
+\x09\x90\xd2\x42\x56\x19\xf0\x47\xcd\x47\xe7\xca\x00\x08\x71\x51\
+\xf3\x24\x33\x02\x1e\x0b\x1f\xf9\xe6\x40\x31\x65\xd5\xe2\xf5\x39\
+\x6b\xf1\x4f\x00\x28\xaf\xa2\xdd\x07\x2b\x58\x7f\xe5\x64\x9e\xe9\
+\x32\x80\x96\x31\x3f\x96\xd0\xb6\x69\x1a\x43\x9b\xb5\x61\xd9\x15\
+\x13\x79\x21\xf7\x2a\x33\x34\x46\xe4\x88\xaf\x05\xcd\xf8\xd1\x1f\
+\x39\x34\x1b\x1f\xb6\xbe\x99\x8e\x51\x6a\xf4\x40\xf6\xef\xdf\xcf\
+\xe8\xd1\xa3\xa9\xa9\xa9\x51\x62\x2f\xe8\x50\x1c\x00\x68\x9a\xc6\
+\xb8\xd1\x03\x84\xcf\x1b\x95\xa5\x78\xf7\x6d\x54\xe7\x50\x08\xa3\
+\x45\xaa\x0f\x00\x40\x43\x6f\x2a\xb1\xda\xb9\x6e\x1f\xc0\x19\x7e\
+\x1a\x00\x08\xd7\xff\xbb\x66\x58\xe9\xff\x40\xb2\x68\x87\xdc\x12\
+\x15\x2b\x00\xf0\x33\x6e\x0f\x3c\xf7\x3e\x14\x94\x10\x65\xb3\xf3\
+\x9b\xf6\x7d\xc8\xbb\xf6\x5e\x0e\x5e\xfb\xff\xf8\x6e\xe0\x6d\xac\
+\x1b\x70\x1b\xa5\xc3\x1f\xe6\x3f\x97\x8d\xe3\xca\x34\xdf\xcb\x04\
+\x7e\x45\x07\x62\x7f\x1e\x74\x26\xdb\xa2\xf9\xb4\xcd\x64\x9a\xd8\
+\x63\x95\x5c\x66\xd5\xaa\x55\xdc\x79\xe7\x9d\x18\x86\x71\xe1\x0f\
+\x87\x1a\xb6\x38\xd0\xd4\x2e\xe5\x1a\x7f\xc3\x40\xa9\xf3\x9e\x2d\
+\xcb\x14\x79\x12\xe2\x98\xd5\x08\xd8\xa4\x8d\xcc\xf1\xf3\x06\x00\
+\xc2\xdd\x45\x9d\xd3\x03\x34\x92\x64\x01\xc0\x67\xdb\xc5\x17\xcb\
+\x74\xe8\xd0\xc1\x92\xfd\xf5\x27\x86\x01\xff\x9c\x03\x5b\x7f\xae\
+\xd7\x90\x1d\x93\xc0\xc5\x49\xe9\xf4\x4a\x4e\x27\xce\x2e\x25\xfe\
+\xe1\x1f\x12\x9c\x9c\x1e\x09\x3c\x9b\x9c\xc8\x54\x3e\x6e\x73\x2b\
+\x51\xba\x9a\x9b\xe0\x8c\x19\x33\x78\xea\xa9\xa7\x94\xd8\x0a\x3a\
+\xec\x89\x17\xfe\x4c\x03\xe8\x79\x51\x3b\xda\xe5\xb4\x10\x3e\xef\
+\xdd\x6c\x05\x00\x3e\xe1\x08\xae\x00\xc0\x06\x08\xe7\x16\xba\xa4\
+\xab\xfd\x92\x5a\xf8\xce\xd1\xb2\x6a\x36\x1f\x2d\x15\x3e\x3f\x6e\
+\x9c\x9c\x64\xa8\x45\x03\x99\xfd\x05\x7c\x1d\x22\x69\xd4\x08\x0f\
+\x44\x9d\xbb\x26\xdc\x2f\xb6\x25\xd3\xb2\x6f\x44\x53\x54\xbc\x78\
+\xfa\xe9\xa7\x99\x3e\x7d\xba\x12\x5b\x41\x85\xc2\x85\x40\xa7\xb9\
+\x71\xd4\x95\xc2\x67\xbd\x79\x5b\x30\xca\xc2\xb8\x2f\xc3\x47\x34\
+\x13\xb6\x01\x02\x68\x69\x52\x01\x40\x07\xce\x7a\xee\x9f\x1d\x00\
+\xb4\x41\x62\x02\xa0\x73\x86\x15\x00\x04\x8a\x45\x3b\x0a\x90\xc9\
+\x8e\x0e\x1f\x3e\x5c\x9d\x33\x16\xe7\x67\xd5\x66\x98\xfd\x65\xa0\
+\xbd\x50\x4b\x42\xfd\x9b\x27\xc7\x25\x77\xe3\x89\x74\x35\xb2\xd2\
+\x86\x61\x70\xd7\x5d\x77\xb1\x6c\x59\x98\xbd\x81\xda\xd4\xdf\x5b\
+\xaf\xbb\x46\x62\x9a\xc4\xf0\xe2\xdd\xfa\xb5\x3a\x67\x42\x95\xc6\
+\x99\x01\x88\x01\xce\xd4\x14\xcf\x0e\x00\xda\x8b\x5a\x6c\x1a\x1f\
+\x45\x5a\xac\x35\x3f\x1e\x28\x64\xd2\xff\x69\x69\x69\xf4\xea\xa5\
+\x66\x74\xcb\xe2\x02\xec\x3c\x08\x2f\x7f\x88\x54\xb4\xd6\x18\x89\
+\xf1\xfc\x6c\x24\xf0\x6c\x9e\xcc\x18\xc4\xad\x29\x3d\x94\x5c\xca\
+\xe9\x74\x72\xe3\x8d\x37\xb2\x67\xcf\x1e\x25\xf6\x82\x02\x5b\x3c\
+\x28\x6e\x01\xed\xdd\xab\x13\x29\xc9\xe2\x2b\x9c\x3d\x56\x19\xe0\
+\xc2\xd8\x6d\xe6\x8c\x02\xc6\xa5\x81\xdc\x16\xd0\x33\xb3\x84\x3f\
+\xcd\x00\x08\xd1\xa9\x99\x55\xff\x0f\x14\x86\x01\x5f\xee\x3e\x26\
+\x7c\xfe\xda\x6b\xaf\x45\xd7\xd5\x69\x8f\x5b\xd4\xc3\xb1\x93\xf0\
+\xd7\xf7\xc0\x15\x8a\x82\x2a\xff\x55\x09\x3c\x17\x1a\x1a\x6f\x65\
+\x8f\x61\x40\x9c\xd4\x9b\xcb\x19\x4a\x4a\x4a\x18\x31\x62\x04\x27\
+\x4f\x8a\x4b\x5e\x07\x15\x9a\xad\xae\x19\x50\x21\x36\x9b\xce\xe0\
+\x81\xe2\x81\xbf\x77\xdb\x8a\xd0\x0b\x64\x55\xa3\x01\x36\x73\xee\
+\xad\x7a\x5a\x6b\x99\xe3\x67\x7e\x11\xcf\xf6\x4e\x78\x78\xb7\x5d\
+\x13\x35\x62\x20\x16\x0d\x67\x7b\x61\x19\x27\x24\xb6\xff\x0d\x1d\
+\x3a\x54\xa1\x37\x16\xe7\xa4\xaa\x16\x9e\x99\x06\x65\x15\x81\xf6\
+\xc4\x3c\xe2\x9d\x3f\x1b\x09\x3c\x9b\x08\xcd\xc6\x47\xad\x6f\xa6\
+\x5d\xa4\x1a\x95\xbb\x5d\xbb\x76\x31\x6a\xd4\x28\x9c\x4e\xf1\xef\
+\x7e\x50\x61\x42\x1f\xc0\x90\xab\x2f\x11\x3e\x6b\x94\x97\x60\x1c\
+\x93\x93\x1d\x0f\x0b\x22\x4c\xea\x03\x48\xce\x92\x39\xae\x36\x00\
+\xc8\x49\xb3\x16\x00\x05\x8a\x55\x07\xc4\x9b\x71\x74\x5d\x67\xf0\
+\xe0\xc1\x0a\xbd\xb1\xf8\x19\x1e\x0f\xfc\x6d\x3a\x1c\x12\xcf\xd2\
+\x04\x05\xba\x17\x62\xcf\x9f\xdd\x48\xb5\xc7\x30\xbf\xcd\x24\x92\
+\x6d\xd1\x4a\x2e\xb9\x7c\xf9\x72\xa6\x4c\x99\xa2\xc4\x56\xa3\xc7\
+\xa6\xfe\x25\x6b\xc8\xa0\x4b\x85\xf4\x28\x4e\xe3\xdd\xbd\x56\xa1\
+\x37\xa1\x89\x66\x37\xa9\x0f\x20\x59\x7c\x8a\x83\xb3\x9e\xf5\x4a\
+\x02\x80\xb6\x56\x06\x20\x60\x7c\xb3\xbf\x58\xf8\x6c\xaf\x5e\xbd\
+\x68\xda\xb4\xa9\x42\x6f\xc2\x07\x8f\xc7\xc3\xbc\x79\xf3\xb8\xe9\
+\xa6\x9b\xc8\xcd\xcd\x25\x27\x27\x87\xde\xbd\x7b\xf3\xc8\x23\x8f\
+\xb0\x6d\xdb\xb6\xff\x7e\xf0\xcd\x05\xb0\x79\x5f\xe0\x1c\xf5\x27\
+\x09\x17\x5e\xd6\xd3\x31\xaa\x09\x1f\xb5\xbe\x19\x87\xa2\x1d\xf7\
+\xef\xbc\xf3\x0e\x7f\xfd\xeb\x5f\x95\xd8\x6a\xd4\x28\x2e\x01\x00\
+\xa4\x37\x4b\xa1\x7b\xae\xf8\x52\x19\xcf\x9e\x75\x0a\xbd\x09\x51\
+\xcc\xca\x00\xa4\xa8\xcd\x00\x68\x40\x2b\x51\x6b\x6d\x9b\x58\x19\
+\x80\x40\xb1\x72\xbf\x78\x06\xe0\xaa\xab\xd4\x74\x67\x87\x1b\xdb\
+\xb7\x6f\xa7\x77\xef\xde\x8c\x1e\x3d\x9a\x99\x33\x67\xb2\x75\xeb\
+\x56\xf6\xef\xdf\xcf\xda\xb5\x6b\x79\xf1\xc5\x17\xc9\xcd\xcd\xe5\
+\xde\x7b\xef\xa5\xea\x83\xcf\x61\xf1\x9a\x40\xbb\xeb\x3f\x22\xbc\
+\xf5\x8e\x04\x9e\xcd\x55\xf1\x39\xbc\x9e\x35\x4a\xd9\x65\x7f\xfb\
+\xdb\xdf\x32\x67\xce\x1c\x65\xf6\x1a\x25\xb6\x58\x54\x37\x02\x02\
+\x0c\xbc\x42\x58\xfc\x15\xaf\x15\x00\x5c\x86\x1e\xe0\xff\x00\x00\
+\x20\x00\x49\x44\x41\x54\x10\xcd\xde\x28\x4b\x00\x3f\xcb\x00\x64\
+\x50\x27\x14\x20\x66\xcd\x2a\x01\x04\x84\x63\xe5\x35\xec\x2b\x16\
+\xaf\x2b\xf7\xeb\xd7\x4f\xa1\x37\xe1\xc1\xc6\x8d\x1b\xe9\xdf\xbf\
+\x3f\xeb\xd7\xaf\xaf\xf7\x33\x86\x61\xf0\xc6\x1b\x6f\x30\xfc\xc1\
+\x7b\xa8\xf6\x84\x62\xd3\xdf\x79\x88\xaf\x7f\x24\xf0\x6c\xee\x4c\
+\xed\xc5\x63\xcd\xfa\x2b\xb9\xa4\xd7\xeb\x65\xd2\xa4\x49\xac\x5b\
+\x17\xca\x0f\x24\x1d\xf4\x18\xe5\x56\xfb\xf5\x11\x96\x7f\xc1\x28\
+\xdc\x8f\x71\x4a\x3c\x03\x19\x16\x98\xd4\x04\xa8\xa5\x48\x95\x00\
+\xe2\x80\x26\xf0\xdf\x00\x40\xd8\x5a\xd3\xf8\x28\xe2\x23\xd5\xae\
+\xaa\xb4\xf0\x8d\x55\x12\x6f\xff\x9a\xa6\xd1\xa7\x4f\x23\x51\x96\
+\x0b\x12\x4a\x4a\x4a\xb8\xe1\x86\x1b\x28\x29\x29\xf1\xe9\xf3\xcb\
+\x8a\x0e\xf2\x9b\x6d\x5f\x99\xeb\x54\x63\x23\xf6\xe7\x2a\x81\xf5\
+\xf1\x6c\xe6\x10\x26\x24\xff\x4c\xa2\x5c\x88\xaa\xaa\x2a\xc6\x8c\
+\x19\x13\xda\xc2\x41\x26\x94\x01\x2e\xef\x93\x2b\x7e\xd8\x30\xf0\
+\xee\xad\x3f\x10\xb6\xa0\x6e\x14\xd0\x0c\xa2\x12\x64\x47\x01\x5b\
+\xc0\x7f\x03\x00\xe1\x7c\x42\x76\xb2\xfa\xa8\xd4\xc2\x37\xd6\x1c\
+\xf4\xed\x41\x74\x2e\x3a\x74\xe8\x40\x5a\x9a\x9a\x8e\xec\x70\xc0\
+\xe3\xf1\x30\x7e\xfc\x78\xf2\xf2\xf2\x1a\x74\xee\xd5\xfd\xeb\xd9\
+\x53\x11\x26\xe3\x6a\xa7\x89\xf3\xad\x33\x5f\x43\xe3\xed\xec\x31\
+\x5c\x12\x23\xf5\x36\x73\x86\xfc\xfc\x7c\x26\x4e\x9c\x88\xc7\x13\
+\xa2\x6a\x75\x36\x35\xda\x0a\x67\xd3\xb4\x49\x92\xdc\x5a\xe0\x7d\
+\x1b\x14\x7a\x13\x7a\x18\x66\x05\x00\x80\x96\x20\xae\xea\xc8\x0f\
+\xcf\x7c\xe9\x0c\x40\x56\x92\x15\x00\x04\x8a\x4d\x47\xc4\xd7\xff\
+\x5e\x7e\xf9\xe5\x0a\x3d\x09\x7d\x7e\xff\xfb\xdf\xf3\xc5\x17\x5f\
+\x34\xf8\x9c\xd7\x30\x98\x9e\xbf\xd5\x04\x8f\x1a\x31\xf1\x4e\x9f\
+\xcb\xd5\x31\xba\x83\x4f\xda\x4c\x22\x3b\x42\x8d\x98\xd8\xd2\xa5\
+\x4b\x79\xe2\x89\x27\x94\xd8\x6a\x74\x98\x90\x01\x00\xe8\xd7\x5b\
+\xa2\x0c\x90\xbf\x5d\xa1\x27\xa1\x87\xa6\x6b\xa0\x9b\xa3\xe3\x29\
+\x19\x00\xfc\x28\x03\xd0\x5c\xd4\x4a\x76\x8a\xfa\xa8\xd4\xc2\x37\
+\x36\x4b\x04\x00\x56\xfd\xdf\x77\xe6\xcf\x9f\x2f\xd5\x69\xbe\xf6\
+\xa4\xf8\xa6\xc6\xa0\xc4\x66\x40\x8c\xef\xf3\xf9\x19\x8e\x78\x3e\
+\xcb\xb9\x9d\x44\x9b\xf0\x26\xf2\x1f\xf1\xcc\x33\xcf\x30\x77\xee\
+\x5c\x25\xb6\x1a\x15\x26\xf4\x00\x00\xf4\xeb\xd3\xe5\xc2\x1f\xaa\
+\x07\x6f\xfe\x0e\x85\x9e\x84\x28\x66\xf5\x01\x24\x36\x93\x39\xfe\
+\xa3\x00\xc0\xca\x00\x04\x19\xc5\x95\xb5\x14\x9c\xaa\x16\x3e\x7f\
+\xe9\xa5\x97\x2a\xf4\x26\x74\x39\x70\xe0\x00\x93\x26\x4d\x92\x92\
+\xa2\x2d\xaa\x15\xff\x39\x05\x2d\x89\x0d\x5b\xd0\xd3\x39\xaa\x29\
+\x33\x5a\x4d\xc0\xa6\xc9\xdf\x2c\x0d\xc3\xe0\xce\x3b\xef\xe4\xe0\
+\xc1\x83\xd2\xb6\x1a\x15\x7a\x14\x66\x4c\x02\xf4\xb9\x44\x58\x05\
+\x1e\xe3\x44\x01\x46\x65\x99\x42\x6f\x42\x10\xb3\x76\x01\x24\x48\
+\x05\x00\x3f\x2a\x01\x08\x67\x00\x9a\x27\xa9\x59\xea\x61\xd1\x30\
+\x64\xd2\xff\xd1\xd1\xd1\x74\xe8\xd0\xe1\xc2\x1f\x0c\x73\x0c\xc3\
+\xe0\x9e\x7b\xee\xa1\xac\x4c\xee\x06\x17\x1f\x0c\xb2\xbe\xaa\x89\
+\xf0\xd4\x8d\x05\x36\x80\x61\x09\x1d\xf8\x47\x73\x35\xc2\x54\xa5\
+\xa5\xa5\x21\xb8\x24\x48\xfb\x21\x08\x50\x4b\xc7\x76\xd9\x44\x4a\
+\x34\x72\x5b\x65\x80\xf3\xa3\xd9\x4d\xca\x00\x28\x2c\x01\x08\x87\
+\x12\x2d\xac\x0c\x40\x40\xd8\x22\x21\xff\xdb\xa5\x4b\x17\x6c\x36\
+\xf3\x9a\x53\x42\x85\x69\xd3\xa6\xb1\x64\xc9\x12\x69\x3b\x3d\x92\
+\xa4\x22\xf5\xe0\x25\xce\xb7\x91\xc0\xb3\xf9\x9f\x26\x7d\xb9\xbf\
+\xc9\x65\x4a\x2e\xbf\x68\xd1\xa2\xd0\x93\x0f\xd6\xd5\xbf\x70\xd9\
+\xed\x36\x3a\xb5\x6f\x29\x7c\xde\x2a\x03\x5c\x00\x93\x4a\x00\x24\
+\x48\x2d\x71\x6b\x0a\x0a\x02\x80\x8c\x04\x2b\x03\x10\x08\x64\x02\
+\x80\x6e\xdd\xba\x29\xf4\x24\x34\x29\x2e\x2e\xe6\x57\xbf\xfa\x95\
+\x12\x5b\x37\xb5\x10\x4f\xb1\x06\x35\xb1\x6e\xa1\x8c\xf5\x8b\xcd\
+\xaf\xe3\xfa\xc4\x4e\x4a\x5c\x78\xf8\xe1\x87\x39\x76\x2c\x84\xd6\
+\x30\x9b\xd4\x07\xd0\xad\x8b\xb8\x50\x93\x71\x78\xa7\x42\x4f\x42\
+\x10\xb3\x7a\x00\xe2\xa4\xa6\xb8\xce\x04\x00\x11\x80\xb0\xe0\x74\
+\xb3\x78\xf5\x29\x29\x8b\x0b\xb3\xb5\x40\x3c\x2d\xdd\xb5\xab\x78\
+\xd7\x6f\xb8\x70\xdf\x7d\xf7\x51\x5c\x2c\xbf\xe4\x64\x78\x7a\x5b\
+\x2e\x4d\xce\x50\xe0\x51\x10\x62\xf3\x36\xa8\x19\xf0\xcc\x31\x4d\
+\xe7\xbd\x96\xe3\xe9\x16\x2d\x95\xe2\x04\xea\x76\x37\x3c\xfc\xf0\
+\xc3\xd2\x76\x1a\x0d\x26\x94\x00\x00\x72\x25\x02\x00\xaf\x15\x00\
+\x9c\x1f\xb3\x02\x80\x98\x64\x99\xe3\x29\x80\x5d\xa7\x2e\x12\x10\
+\xea\x2c\x89\x76\xd8\x88\x8b\x34\xa7\xc1\xc1\xe2\xfc\xc8\x6c\x00\
+\xb4\x32\x00\xe7\xe7\xb3\xcf\x3e\x63\xf6\xec\xd9\xd2\x76\x9a\x45\
+\xc6\xf2\xef\x1e\x43\x14\x78\x14\xc4\xc4\xd6\x2f\x13\x7c\x3e\xe2\
+\x6d\x91\x7c\xda\xe6\x36\x9a\xda\xe5\x47\xdf\x3e\xf8\xe0\x03\x16\
+\x2d\x5a\x24\x6d\xa7\x51\x60\x6b\x84\x19\x80\xe3\x21\xd6\x6c\xa9\
+\x1a\xb3\xe4\xd6\xa3\xe2\x41\xbc\xbf\x48\x07\x52\x4f\x07\x00\x42\
+\xa4\x5b\xe9\xff\x80\x50\x5e\xeb\xa2\xa4\xb2\xe1\xf5\xd5\xd3\xe4\
+\xe6\x4a\x6c\xff\x0a\x71\xbc\x5e\x2f\x8f\x3f\xfe\xb8\xb4\x1d\x9b\
+\xa6\x31\xbd\xd7\x08\x32\xa2\xc2\x7c\x4d\x76\xb4\xfb\xbc\x32\xc1\
+\xe7\x23\x2b\x22\x91\x59\xad\x6f\xc2\xae\x60\x32\xe0\xb1\xc7\x1e\
+\xc3\xeb\x6d\x58\x53\x62\xa3\x44\x8b\x34\xc5\x6c\x6e\x67\x71\x7d\
+\x79\xa3\xbc\x04\x6a\xab\x14\x7a\x13\x5a\x68\x36\x73\xf6\x00\x80\
+\x74\x16\xa0\xa9\x0e\x08\x17\x12\x9a\xc6\x99\xf3\x65\xb4\x38\x3f\
+\x07\x4a\x2a\x85\xcf\x26\x26\x26\x5a\x0a\x80\xe7\x61\xc6\x8c\x19\
+\x6c\xda\xb4\x49\xda\xce\xb3\x5d\x06\x30\xb8\x69\x2b\x79\x87\x82\
+\x1d\x0d\x88\x11\xd7\x43\x18\x10\xd7\x86\xff\xcd\xb8\x56\xda\x8d\
+\x2d\x5b\xb6\x28\xc9\xea\x04\x1c\xdd\x9c\x89\x92\x8c\xf4\x54\xe2\
+\xe3\x04\xb3\x0b\x86\x81\x51\x7c\x58\xad\x43\x21\x84\x61\x56\x13\
+\x20\x40\x6c\xaa\xcc\xe9\x26\x3a\x75\xb5\x00\xb1\xd3\x56\xfd\x3f\
+\x20\xe4\x49\x04\x00\xad\x5b\x8b\x47\xfa\xa1\x8e\xcb\xe5\xe2\x8f\
+\x7f\xfc\xa3\xb4\x9d\x91\x19\xed\x78\xb4\x5d\x6f\x79\x87\x42\x85\
+\x18\xb1\x32\xc0\x69\x7e\xd5\xec\x0a\xc6\x26\xc9\xf7\xad\x3c\xf1\
+\xc4\x13\xb8\x5c\x72\xbe\x04\x1c\xcd\x81\x19\xbb\x00\x00\x5a\x66\
+\x89\x4f\xab\x78\x8b\xf3\x15\x7a\x12\x5a\x68\x26\x06\x00\x5a\xac\
+\x54\x06\x20\x55\x07\x84\x2d\xa4\xc6\x84\xe1\x7c\x73\x23\xe0\x40\
+\x89\x78\xfd\xdf\x0a\x00\xea\xe7\xad\xb7\xde\x62\xdf\xbe\x7d\x52\
+\x36\x5a\x44\xc7\xf3\x6e\xaf\xe1\x26\xdd\xa2\x83\x14\x89\x32\x00\
+\xd4\x69\x06\xbc\x99\x3d\x86\x4c\x87\x94\xf8\x09\x7b\xf6\xec\x61\
+\xea\xd4\xa9\x52\x36\x02\x8f\x66\x5a\x16\xa0\x75\x4b\xf1\xa6\x4b\
+\xa3\xe8\x90\x42\x4f\x42\x0c\xb3\x7a\x00\xa0\x4e\x14\x48\x9c\x44\
+\x1d\x89\x09\x80\x24\x2b\x00\x08\x08\x79\x27\xc4\x33\x00\xad\x5a\
+\xb5\x52\xe7\x48\x08\x51\x5d\x5d\xcd\x9f\xfe\xf4\x27\x69\x3b\xaf\
+\x77\xbf\x96\x04\xbb\x55\x1a\xfb\x11\xba\x51\xb7\x18\x48\x82\x24\
+\x5b\x14\xaf\x65\x8d\x94\x76\xe5\x4f\x7f\xfa\x13\x35\x35\x35\xd2\
+\x76\x02\x8a\x49\x7d\x00\xad\x5b\x89\x4f\xab\x18\x56\x06\xa0\x7e\
+\x74\xcd\xac\xa4\x0d\x5a\x54\xbc\xcc\xf1\x24\xb9\x00\x20\xda\x92\
+\x01\x0e\x04\x56\x00\xa0\x9e\x0f\x3e\xf8\x80\x82\x82\x02\x29\x1b\
+\x13\xb3\x3a\x33\x3c\xbd\xad\x22\x8f\x42\x8c\x68\x79\x85\xbe\x91\
+\x89\x9d\x19\x97\x2c\x37\xc1\x72\xe4\xc8\x91\xe0\xef\x05\x30\x2d\
+\x03\x20\x11\x00\x14\x59\x01\xc0\xf9\xd0\x34\x93\x22\x00\xb9\x26\
+\xe3\x44\x1d\x10\x96\xe1\x4a\x8c\xb2\x32\x00\x81\xe0\x68\x99\xf8\
+\x6e\x79\xab\x04\x70\x6e\x5e\x7f\xfd\x75\xa9\xf3\xa9\x11\xd1\xbc\
+\x98\x7b\xb5\x22\x6f\x42\x90\x68\xf1\x46\xc0\xb3\xf9\x67\x8b\xeb\
+\x69\x62\x97\x13\x20\x7b\xe9\xa5\x97\x94\xf8\x12\x30\x4c\xca\x00\
+\xb4\xca\x16\xef\x01\x30\x4a\x43\x68\xd9\x92\x09\x18\x26\x05\x00\
+\x56\x06\x20\x0c\x91\x19\x01\xcc\xce\xce\x56\xe8\x49\x68\xb0\x7a\
+\xf5\x6a\xbe\xfb\xee\x3b\x29\x1b\x4f\x77\xba\x82\xa6\x91\xd6\x5a\
+\xec\x7a\x89\xf0\xfc\x77\xef\xa8\x04\x69\xf6\x58\x7e\x9f\x7e\x95\
+\x94\x8d\x0d\x1b\x36\xb0\x6e\xdd\x3a\x79\x67\x02\x85\x66\xce\xee\
+\x15\x99\x26\x40\xa3\xfc\x84\x42\x4f\x42\x10\xb3\x1a\x01\x23\xe5\
+\x03\x00\x61\x0b\x89\x56\x00\x10\x10\x8a\x25\x02\x00\x6b\x04\xf0\
+\xe7\xfc\xf3\x9f\xff\x94\x3a\xdf\x2a\x26\x91\xbb\x5a\x5d\xa4\xc8\
+\x9b\x10\x45\x33\x20\x42\x4d\x16\x60\x4a\x5a\x6f\xda\x44\x0a\x0f\
+\x2f\x01\xf2\x3f\xf3\x80\x62\x52\x00\xd0\x24\x4d\x38\x19\x0c\x15\
+\x27\xd5\x39\x12\x82\x98\x55\x02\x90\xcc\x00\x24\xe8\x80\xf0\x6b\
+\x4b\x6c\x84\xb5\x05\xd0\xdf\xb8\x3c\x5e\x4e\xd5\x88\x8f\x32\xa5\
+\xa6\x4a\xcd\x8d\x86\x1c\x45\x45\x45\x7c\xf4\xd1\x47\x52\x36\xfe\
+\xd4\xb9\x3f\x11\xba\x25\xae\x74\x41\x22\xe5\xfb\x00\x00\x22\x34\
+\x1b\x7f\x90\xcc\x02\xcc\x9c\x39\x93\xe3\xc7\x8f\x2b\xf1\xc7\xef\
+\x98\x14\x00\xa4\xa5\x08\x27\x83\x31\xaa\xca\xc0\xa3\x26\xc0\x0b\
+\x45\x0c\xdd\xa4\x1e\x00\x87\xd4\x28\x7e\xb4\x0e\x08\xaf\xf3\x8b\
+\xb1\x02\x00\xbf\x53\x52\xe9\x44\x54\x9a\x3e\x21\x21\x81\x88\x08\
+\xab\x6f\xe3\x6c\xde\x7f\xff\x7d\xa9\xae\xf0\xae\x09\x4d\x98\x18\
+\xae\x62\x3f\x0d\x45\x51\x00\x00\x70\x6b\x72\x0f\x3a\x47\x89\x67\
+\xb3\x6a\x6b\x6b\x99\x39\x73\xa6\x32\x7f\xfc\x8a\x49\x01\x40\x54\
+\x54\x04\xb1\x31\x82\x0f\x14\xc3\xa8\x0b\x02\x2c\xce\x89\x69\x4d\
+\x80\x0a\x02\x00\xe1\x0c\x40\x4c\x84\xf5\xd6\xe3\x6f\x64\xea\xff\
+\xd6\xdb\xff\xcf\x99\x3b\x77\xae\xd4\xf9\xc7\xdb\xf7\x45\x37\xeb\
+\x97\x3b\xd4\x88\x54\xf7\x86\x68\xd3\x74\x7e\xd3\x6c\x80\x94\x0d\
+\xd9\x9f\x7d\xc0\x30\x29\x00\x00\x48\x4d\x91\x98\x2b\xb7\xca\x00\
+\xf5\x63\x52\x06\x40\x93\x0b\x00\x62\xac\x0c\x40\x90\x21\x53\xff\
+\x4f\x4b\x93\x92\x8f\x0c\x39\x8e\x1d\x3b\xc6\x37\xdf\x7c\x23\x7c\
+\xbe\x69\x64\x0c\x63\x9a\x77\x50\xe8\x51\x88\x63\x33\xea\x14\x02\
+\x15\x31\x3e\xb9\x1b\xcd\x24\xc4\x82\x56\xac\x58\x41\x61\x61\xa1\
+\x32\x7f\xfc\x86\x66\xde\x8b\x57\x5a\xaa\x44\x19\xc0\x6a\x04\xac\
+\x17\xc3\xac\x65\x40\x92\x19\x00\x3b\x12\x01\xc0\xb4\x35\x07\x48\
+\x8e\xb1\x1a\x01\xfd\xc9\xf6\xc2\x53\xc2\x67\x53\x52\xe4\x1a\xa7\
+\x42\x8d\x8f\x3f\xfe\x18\x8f\x47\x3c\x2d\x7d\x4f\xeb\x1e\x44\x5a\
+\xb5\xff\x86\x11\xe1\x85\x6a\x35\x37\xc3\x08\xcd\xc6\x9d\xa9\x97\
+\xf0\x97\x63\xcb\x84\xce\x7b\xbd\x5e\x3e\xfd\xf4\x53\xee\xba\xeb\
+\x2e\x25\xfe\xf8\x8d\x46\x9a\x01\x70\x7f\x3d\x03\x7d\x4f\x10\x4f\
+\x57\x98\x88\x51\x51\x03\x12\xbd\x5b\xf5\xda\xad\x96\x2a\xbb\xc8\
+\x05\x00\x7f\x5d\xba\x5d\xe6\xe2\x16\x7e\x26\x31\x51\x3c\xba\x0f\
+\x45\x3e\xfe\xf8\x63\xe1\xb3\x76\x4d\xe7\x17\xad\xba\x2b\xf4\x26\
+\x4c\x70\x78\x41\x7c\x8d\xc5\xcf\x98\x92\xd6\x9b\xbf\x1d\xff\x1a\
+\xb7\x21\x96\x59\xf8\xf8\xe3\x8f\x83\x2f\x00\x50\x31\x4f\x59\x0f\
+\x49\x89\xe2\x19\x15\xcf\xca\x0f\x51\xd7\xe5\x61\xe1\x07\x62\x74\
+\xc0\x7a\x85\x0f\x13\xa2\xa2\x2c\xf1\xa6\xd3\x94\x96\x96\xf2\xd5\
+\x57\x5f\x09\x9f\x1f\xda\xac\x0d\x2d\xa2\xa5\x46\x70\xc2\x13\x87\
+\xda\x47\x44\x56\x44\x22\x43\x12\xda\x0b\x9f\xff\xe2\x8b\x2f\x38\
+\x75\x4a\x3c\xab\x16\x18\xcc\x0b\x00\x22\x22\xac\xc7\x41\x18\x61\
+\xd7\x01\x2b\x87\x19\x26\x58\x13\x00\xff\x65\xc5\x8a\x15\x38\x9d\
+\x4e\xe1\xf3\x63\x9b\x77\x54\xe8\x4d\x18\xa1\x38\x00\x00\x18\x23\
+\xa1\x14\x58\x5b\x5b\xcb\xaa\x55\xab\x14\x7a\xe3\x07\x4c\x6c\x3a\
+\x8d\x70\x58\x7d\x5d\x61\x84\x4d\x07\xac\x9f\x78\x98\x60\x05\x00\
+\xff\xe5\xdb\x6f\xbf\x15\x3e\xeb\xd0\x75\x6b\xe7\xbf\x28\x0e\x75\
+\x4d\x80\xa7\x19\x91\xd0\x09\xbb\x26\xfe\x56\x2c\xf3\x5d\x08\x0c\
+\xe6\x05\x00\x91\x91\x56\x06\x20\x8c\x70\x58\x25\x00\x8b\xb0\x44\
+\xe6\xa6\x3f\x30\xad\x25\x29\x11\x56\x39\x45\x08\x1b\x52\xd2\xc0\
+\xe7\x22\xd5\x1e\xc3\x95\x71\xe2\x1a\x17\x32\x93\x20\x81\xc1\x44\
+\x79\x59\xb5\x3f\x1a\x8b\xc6\x4d\x84\x8e\xa9\xdf\x26\x8b\xc6\x84\
+\xac\xda\x5d\xa8\xe0\x76\xbb\xa5\x76\xc1\x8f\xca\x14\xaf\x39\x5b\
+\x18\x60\x57\x9f\x05\x18\x95\xd8\x45\xf8\xec\xda\xb5\x6b\xa5\xa6\
+\x41\xfc\x8e\x89\x25\x80\xa3\xc7\x4a\x4c\xb3\x6d\xd1\xe8\xb0\xe9\
+\x98\x99\x4f\xb2\x68\x54\x54\x54\x54\x04\xda\x85\x46\xc1\xa6\x4d\
+\x9b\xa8\xac\x14\x97\x54\x1e\x98\x66\x09\x2a\x49\x61\x53\xff\x9a\
+\x39\x20\xbe\x8d\xf0\xd9\xf2\xf2\x72\xb6\x6c\xd9\xa2\xd0\x1b\xb3\
+\x31\xef\x96\x5d\x55\x25\xbe\x15\xd3\x22\xe8\x90\x28\x9c\x59\x04\
+\x1d\xa6\xad\xa3\x0c\x32\xd6\xae\x5d\x2b\x7c\x36\x25\x22\x8a\x0e\
+\xf1\xd6\x46\x45\x29\x4c\xc8\x00\x74\x8e\x6a\x4a\x92\x4d\xbc\x2c\
+\xb3\x66\xcd\x1a\x85\xde\x04\x33\xd6\x3d\x22\x9c\xd0\xb1\xaa\x3e\
+\x61\x43\x6c\xac\x9c\x8e\x7a\xa8\xb0\x6b\xd7\x2e\xe1\xb3\x7d\x52\
+\x9a\x5b\xb7\x48\x59\x14\x6e\x03\x3c\x8d\x8e\x46\x9f\x58\xf1\xcc\
+\xcc\xee\xdd\xbb\x15\x7a\x63\x36\xe6\xdd\xb2\x85\xb5\x00\x2c\x82\
+\x11\x43\x07\xd4\xff\x36\x5a\x34\x4a\x32\x32\x32\x02\xed\x42\xa3\
+\x60\xdf\xbe\x7d\xc2\x67\xfb\xa6\x34\x57\xe8\x49\x98\x62\xd2\xe0\
+\x71\x5f\x89\x00\x40\xe6\x3b\xe1\x77\x44\xd5\xc0\x7c\x20\xa3\x99\
+\x95\xdd\x0a\x23\x3c\x3a\xa0\x7e\x3f\xa1\x85\x45\x23\xe6\xc0\x81\
+\x03\xc2\x67\x7b\x26\x36\x53\xe8\x49\x98\xa2\x9b\xf3\x00\xbb\x38\
+\x46\x3c\x38\xdb\xbf\x7f\xbf\x42\x4f\xcc\xc6\xc4\x77\x36\xc5\x13\
+\x1a\x16\x8d\x9a\x5a\x1d\xb0\x44\x9c\xc3\x04\x99\xc5\x37\xa1\x82\
+\x61\x18\x52\x01\x40\xdb\xb8\x64\x85\xde\x84\x29\x26\x94\x00\x00\
+\xda\x44\x88\x6b\x5d\xec\xdf\xbf\x1f\xc3\xc4\x37\x6b\xb5\x98\xe7\
+\x67\x6d\xad\xf5\x3e\x18\x46\xb8\x75\xb0\xd6\x37\x87\x0b\x56\x00\
+\x50\x37\x0a\x59\x55\x55\x25\x74\x56\xd7\x34\x5a\xc6\x58\x7a\x0a\
+\xd2\x98\xf4\x96\xd9\x3a\x22\x05\x5d\xb0\x43\xa3\xb2\xb2\x92\xe3\
+\xc7\x8f\x2b\xf6\xc8\x24\x4c\x0c\x54\x9c\x2e\xeb\x7d\x30\x8c\xb0\
+\x4a\x00\xe1\x44\x4d\x8d\x35\xe2\x93\x97\x97\x27\x7c\xb6\x45\x74\
+\xbc\xa5\xfe\xa7\x02\x93\xfe\x09\xa3\x74\x3b\x99\x0e\x71\x35\x3b\
+\x99\xcc\x90\x7f\x31\xaf\x04\x60\x65\x00\xc2\x0a\xb7\x1d\x09\x6d\
+\xae\x7b\x5b\xf7\x20\xc1\x11\xa9\xd0\x1f\x8b\x0b\xb1\xa7\xe2\x24\
+\x73\x8f\x8a\x75\xb1\x97\x95\x49\x49\x47\x86\x04\x32\xc2\x2f\x6d\
+\x62\x92\x14\x7a\x12\xc6\x98\x58\x67\x6e\x13\x99\xc2\x61\x97\xd8\
+\xf7\x3c\x68\x44\x81\x04\x95\x0f\x7d\xa1\xec\x94\xf8\xae\x10\xbd\
+\xd3\x55\x68\xc9\x59\x0a\xbd\x09\x21\x2a\x6b\x31\xcc\x08\xae\x5c\
+\x95\x78\xf7\x2d\x12\x3d\x5d\x25\x15\x00\xdc\x9f\xd3\x8b\x4e\xd6\
+\x4c\xb4\x5f\x59\x5e\x9c\x2f\x1c\x00\x94\x94\x58\x5b\xbe\x64\x16\
+\x00\xa5\x46\x08\x2b\x67\x5b\x9c\x8d\x89\x73\x94\xa9\xf6\x18\xe1\
+\xb3\x32\xdf\x0d\xff\x62\x5e\x9a\xbe\xb8\x44\x3c\x08\xb2\x5d\x7a\
+\x33\x7a\xd6\x45\x0a\xbd\x09\x1d\xbc\x05\x27\xa1\x5c\xa1\x0e\xf6\
+\x0f\x18\x65\x07\x65\x02\x80\x6a\x1d\x89\x00\xa0\xca\x63\xa5\x8b\
+\xfc\x4d\x5a\xa4\xf8\x43\xa8\xb8\xb8\x58\xa1\x27\xc1\x89\xcc\x36\
+\xc4\x38\xbb\x25\xa6\xd4\xd8\x89\xd3\xc5\x7f\x46\x41\xb3\x29\xd3\
+\x30\x33\x00\x10\xcf\x12\x6a\x56\x86\xac\x7e\xcc\xea\xdb\xf0\xd4\
+\xca\x9c\xae\xd6\x01\xb1\x8e\x28\xac\x00\x20\x10\xc8\xbc\x85\x5a\
+\x19\x00\xb9\xb7\xbc\x58\xbb\xa5\x9b\xa5\x04\xcd\xbc\x14\x76\xac\
+\x44\x00\x10\x34\x19\x00\x13\x03\x80\x92\x13\x12\x65\xc2\x68\xab\
+\x41\xb6\x3e\x34\xb3\x02\x00\xb7\x54\x00\x50\x25\x97\x01\x70\x5b\
+\x1d\xa3\xfe\x26\x35\x22\x5a\x38\x83\x5a\x5e\x5e\x4e\x6d\xad\xd4\
+\x17\x26\xe8\x91\x0a\x00\x6c\x56\x00\xa0\x04\x13\x4b\x00\x56\x06\
+\x40\x9c\xea\x9a\x5a\xaa\xaa\x05\xef\x0f\x9a\x8e\x16\x2d\xde\x80\
+\x19\xf2\x78\x43\x30\x03\x50\xe9\xb1\xc6\xca\xfc\x8d\x5d\xd3\x49\
+\x74\x88\xaf\xeb\x0c\xf7\x2c\x80\xcc\x24\x44\x94\xcd\xae\xd0\x13\
+\x0b\x33\x88\xd2\xc5\x83\xb4\xea\x6a\xf5\x35\x5a\x53\x30\xcc\x99\
+\xdc\x96\x4a\xff\x47\xc5\x5b\xd2\x32\xe7\xc1\x30\x29\x00\x30\x14\
+\x04\x00\xc2\x5d\x1f\xa5\xae\xf0\x7e\x9b\x0c\x14\x69\x12\x65\x80\
+\xa2\xa2\x22\x85\x9e\x04\x1f\x36\x9b\xf8\x0c\x9a\x55\xf2\x52\x85\
+\x89\x6a\x76\x5e\xf1\x97\x12\x87\x23\x48\x32\x3c\x26\x65\x00\x64\
+\x02\x00\x2b\xfd\x7f\x01\xcc\x2a\x01\x38\xa5\xb2\x56\x65\x3a\x50\
+\x2a\x7a\xba\xd4\x65\xcd\x95\x07\x02\x99\x3e\x80\x43\x87\x0e\x29\
+\xf4\x24\xf8\x88\x88\x10\x4f\x11\x97\xbb\xac\x8c\x97\x1a\xcc\x1b\
+\x03\x2c\x97\x78\x23\x8a\x8c\x0c\x92\x91\x66\x93\x02\x80\x83\xf9\
+\xc7\x84\xcf\x5a\x0d\x80\x17\xc0\xac\x00\xc0\x25\xd5\xb7\x52\xaa\
+\x03\xc2\x61\x5f\x99\x95\x01\x08\x08\x19\x51\x71\xc2\x67\x83\x67\
+\xd9\x89\x39\xc8\xdc\xe4\xcb\xdd\x56\x00\xa0\x04\xc3\xbc\x54\x71\
+\xb9\x44\x06\x40\x26\x38\xf4\x2b\x86\x39\xf7\xdd\xbc\x43\xe2\x01\
+\x00\x71\x69\xea\x1c\x09\x45\xbc\xe6\x34\xbe\x1a\xce\x00\x06\x00\
+\x27\xad\x0c\x40\x40\x68\x15\x2b\x9e\x6e\x93\xd9\x84\x17\x0a\x24\
+\x24\x88\x37\x2a\x55\x58\x01\x80\x1a\xcc\x6a\x88\x02\x4e\x79\xc4\
+\xef\x49\x89\x89\x41\x92\xc6\x96\x08\x72\xce\xc7\x81\x83\x05\xc2\
+\x67\xb5\xa4\x4c\x85\x9e\x84\x1a\x86\x79\x0b\xf7\xe5\x32\x00\x65\
+\x52\x01\x80\xd5\x03\x10\x18\x5a\x49\xec\xa3\x0f\xf7\x0c\x40\x6a\
+\xaa\xf8\xe2\xaa\x53\x56\x00\xa0\x08\xf3\x7a\x00\xca\xbd\xe2\xf7\
+\xa4\x94\x14\x71\x31\x21\xbf\x62\x52\x06\xe0\x40\x9e\x15\x00\x98\
+\x82\xd7\xc0\xb4\xb2\x97\x5c\x0f\x40\xa9\x54\x0f\xc0\x49\xa7\x95\
+\x01\x08\x04\xad\x25\x02\x80\x70\xcf\x00\xa4\xa5\x89\xa7\x2a\xf3\
+\xab\x83\x64\x55\x6c\x63\xc7\x30\x2f\x00\x38\xe4\x14\xbe\x9d\xd1\
+\xa4\x49\x13\x85\x9e\x98\x85\x61\x62\x06\xa0\x50\xf8\xac\x15\x00\
+\x9c\x07\xb7\x79\x19\x2f\x43\x41\x06\xe0\x84\xe8\xe9\xe3\xb5\x41\
+\xb2\x38\x23\xc4\x68\x1d\x2b\xde\x70\x13\xee\x19\x80\xa6\x4d\x9b\
+\x0a\x9f\x3d\x58\x55\x46\x8d\xc7\xda\x7d\x21\x8d\x49\xe9\xd0\x6a\
+\xaf\x8b\x7c\xa7\x78\x27\x7b\x50\x04\x00\x86\x0b\xb3\xde\x26\xa5\
+\x9a\x00\xad\x00\xa0\x7e\x4c\xaa\xff\x03\x50\x23\xa5\xef\x72\x42\
+\x07\x84\x35\x30\x8f\xd5\x0a\xaf\x10\xb0\x90\x40\xa6\x04\x50\x56\
+\x56\x16\x3c\xb2\xa7\x26\x90\x95\x95\x25\x3c\x0a\xe8\x31\x0c\xf6\
+\x56\x9e\x54\xec\x51\x18\xe2\x35\x27\x03\xb0\xbb\xb6\x18\xaf\xe0\
+\xc3\xd1\x6e\xb7\xd3\xa2\x45\x0b\xc5\x1e\x99\x80\x44\x89\xe3\x7c\
+\x14\x14\x96\x50\x5e\x21\x7a\x3f\xd7\xd0\x12\x33\x94\xfa\x13\x4a\
+\x18\xa6\x06\x00\xe2\x19\x2f\xe0\xb8\x64\x00\x60\x65\x00\x02\x41\
+\xbc\x3d\x42\x6a\x14\x70\xf3\xe6\xcd\x0a\xbd\x09\x2e\x1c\x0e\x07\
+\x99\x99\xe2\x6f\x2b\xbb\x2a\x84\x13\x66\x16\xa7\xf1\x9a\x33\x05\
+\xb0\xab\x46\x7c\xc7\x45\x56\x56\x16\x76\x7b\x10\x2c\x7a\x32\x29\
+\x00\xd8\xb4\x75\x9f\xf0\x59\x2d\x36\x19\x1c\x96\x50\x56\x7d\x68\
+\x1e\xb3\x4a\x00\x06\x46\xad\x54\x06\xe0\xb8\x0e\x14\x21\x98\x53\
+\xaa\xf1\xb8\x39\x25\xb7\x8b\xd8\x42\x90\x1c\x89\x32\x40\x38\x07\
+\x00\x00\xad\x5b\xb7\x16\x3e\xbb\xb3\x3c\xbc\x37\x29\x2a\xc1\x63\
+\x4e\x06\x60\x57\xad\xb8\xd8\x95\xcc\x77\xc2\xaf\x78\xcd\xd9\x56\
+\xb8\x75\x47\x9e\xf0\x59\x2d\x39\x08\x32\x27\x01\xc4\xf0\x9a\x54\
+\xf3\x72\x56\x82\x57\x78\x39\x99\x17\x28\xd1\x01\x17\x20\x9c\xd7\
+\x3c\x6e\x95\x01\x02\x42\x6e\x82\x78\x2d\x7b\xcb\x96\x2d\x0a\x3d\
+\x09\x3e\x3a\x77\xee\x2c\x7c\x76\x43\xa9\xc4\xac\xb4\x45\x1d\x26\
+\x95\x00\x36\x54\x1d\x11\x3e\x2b\xf3\x9d\xf0\x2b\x26\x05\x00\x9b\
+\xb7\x49\x64\x00\x9a\xb6\x55\xe8\x49\x08\xe2\x36\x69\x07\x40\xad\
+\x54\xfa\xbf\x04\xf0\x9c\xce\xc5\x09\x97\x01\x0a\x6b\xac\x32\x40\
+\x20\xc8\x4d\x14\x6f\x58\x0a\xf7\x0c\x40\x6e\x6e\xae\xf0\xd9\xaf\
+\x8a\x0f\xe2\x35\x6b\xab\x57\xb8\xe0\x51\x5f\x02\xf0\x18\x5e\xbe\
+\xae\x10\x6f\x70\x95\xf9\x4e\xf8\x15\xb3\x02\x80\xad\xfb\x85\xcf\
+\x5a\x01\xc0\x05\xf0\x98\xd4\x03\x20\xd7\x00\x58\x04\x20\x1d\x00\
+\x1c\xae\x2e\x97\x71\xc2\x42\x90\x6e\x09\xe2\x01\xc0\xb6\x6d\xdb\
+\x70\x87\xb1\x92\x63\xb7\x6e\xdd\x84\xcf\x9e\x70\xd6\xb0\xa9\x2c\
+\x7c\x9b\x28\x95\x60\x42\x09\x60\x43\xf5\x51\x4e\x7a\xc4\x1f\x8e\
+\x32\xdf\x09\xbf\x62\x42\x00\xe0\x76\x7b\xd8\xb9\x47\x7c\x45\xb8\
+\xd6\xb4\x9d\x42\x6f\x42\x0f\xc3\x63\x4e\x09\xc0\xa8\x16\x2f\x79\
+\x01\xc7\xe0\xbf\x01\xc0\x61\x51\x2b\xd6\x6c\x74\x60\xe8\x96\x28\
+\x5e\x02\xa8\xad\xad\x65\xf7\xee\xdd\x0a\xbd\x09\x2e\xba\x77\xef\
+\x2e\xd5\xf0\xf5\x65\xd1\x41\x85\xde\x84\x21\x2e\xf5\x01\xc0\xb2\
+\x72\xf1\x37\x58\x87\xc3\x11\x24\x19\x00\x03\xbc\xea\x77\xaf\xec\
+\xdc\x73\x88\xda\x5a\x71\xa1\x2b\xbd\x69\x8e\x42\x6f\x42\x0f\xcd\
+\xa4\x12\x00\x95\x52\xc2\x6e\x87\xc1\x0a\x00\x82\x96\xd4\x88\x68\
+\x9a\x47\xc7\x0b\x9f\x5f\xbd\x7a\xb5\x42\x6f\x82\x8b\xb8\xb8\x38\
+\xa9\x37\xbe\x65\xc5\x56\x00\x20\x8e\x06\x1e\x71\x45\xc6\xfa\xf8\
+\xb2\x42\xbc\x86\xdd\xa3\x47\x0f\x62\x63\x63\x15\x7a\x63\x12\xde\
+\x1a\xcc\xd8\x01\xf0\xed\xda\xed\xc2\x67\xb5\xc4\x74\x88\x12\x5f\
+\xaf\x1d\x0e\x18\x26\x95\x00\x8c\x2a\xa9\x00\x20\x1f\xfe\x1b\x00\
+\x08\x77\xcf\xe4\x57\x59\x25\x80\x40\x21\x53\x06\x58\xb5\x6a\x95\
+\x42\x4f\x82\x8f\x7e\xfd\xfa\x09\x9f\x5d\x56\x74\xc8\x12\x06\x12\
+\xc5\xad\x29\x7f\x86\x95\x79\x6a\x58\x2e\x51\xff\x97\xf9\x2e\xf8\
+\x15\xaf\x39\x0d\xd7\xab\x56\x6f\x15\x3e\x6b\xa5\xff\x7d\xc0\x6d\
+\x52\x09\x40\x2e\x00\xb0\x32\x00\xc1\x8e\x4c\x19\xe0\x9b\x6f\xbe\
+\x51\xe8\x49\xf0\xd1\xbf\x7f\x7f\xe1\xb3\x55\x1e\x17\x73\x8e\xee\
+\x52\xe8\x4d\x18\xe1\x56\xdf\x00\xf8\x51\xe9\x56\xaa\xc5\xc7\xa1\
+\xa4\xbe\x0b\x7e\xc5\x23\xb5\xf7\xbd\x5e\x56\xad\x91\x09\x00\xac\
+\x06\xc0\xf3\x62\x18\xe6\x89\x5f\xc9\xf5\x00\xfc\x28\x03\x90\x2f\
+\x6c\xc5\x0a\x00\x02\x46\x9f\x14\x89\x85\x36\xbb\x76\x51\x54\x24\
+\x15\x41\x06\x35\x83\x06\x0d\x92\xea\x03\x98\x7e\x48\xfc\xa6\x19\
+\xd6\xb8\xd5\xd7\xff\xdf\x3d\xb1\x41\xf8\xac\xc3\xe1\x60\xe0\xc0\
+\x81\x0a\xbd\x31\x11\x13\x02\x80\x63\xc7\x4f\xb2\x77\xbf\xf8\xf8\
+\xa4\xde\x22\x18\x7a\x27\x02\x88\xcb\x2c\x19\x40\x30\xaa\xa4\x02\
+\x80\x23\xa0\x20\x03\x70\xbc\xb6\xca\x4a\x87\x06\x88\xcb\x53\xb3\
+\x84\x75\xd5\x0c\xc3\xe0\xdb\x6f\xbf\x55\xea\x4f\x30\x91\x9c\x9c\
+\x4c\xef\xde\xbd\x85\xcf\x2f\x2b\x3a\x48\x5e\x95\xd4\x18\x4e\x78\
+\xe2\x54\x5b\xff\x3f\xe8\x2c\x65\x45\x45\x9e\xf0\xf9\x7e\xfd\xfa\
+\x05\x8f\x0c\xb0\x09\x01\xc0\xca\xd5\x32\x3b\x41\x34\xb4\xe6\x56\
+\x00\x70\x3e\x0c\x93\xd2\xff\x38\xcb\x65\x95\x00\x7f\x94\x01\x28\
+\x04\x84\xe7\x4b\xf6\x59\xfb\xd1\x03\x42\x5a\x44\x34\x6d\xe3\x92\
+\x85\xcf\x87\x7b\x1f\xc0\x75\xd7\x5d\x27\x7c\xd6\x00\x66\xe4\x8b\
+\x37\x4f\x85\x2d\x4e\xb5\xeb\x76\xa7\x9f\xd8\x80\x21\xd1\x54\x30\
+\x6c\xd8\x30\x85\xde\x98\x88\xe1\x35\x65\x04\x50\xaa\xfe\x9f\xd6\
+\x0a\x2d\x46\xfc\xfe\x13\x16\x98\x94\x01\x30\x2a\xc4\xa5\x9b\x81\
+\x72\xa0\x18\xfe\x1b\x00\x18\x80\x70\x17\xcd\xde\x0a\x2b\x00\x08\
+\x14\xfd\x52\xc4\xd7\x70\x2e\x5b\xb6\x4c\xa1\x27\xc1\xc7\xb8\x71\
+\xe3\xa4\xce\xbf\x7e\x60\x03\x4e\xb3\xd6\x7c\x86\x2a\x4e\x75\x3d\
+\x00\xb5\x86\x9b\x37\x8a\xd7\x48\xd9\xb8\xe1\x86\x1b\x14\x79\x63\
+\x32\xde\x4a\xcc\x98\x00\x58\xb6\xe2\x7b\xe1\xb3\x7a\x8b\x20\xd9\
+\x9d\x10\x48\xcc\x6a\x00\x94\x0b\x00\xce\xcc\xcc\xea\xe7\xfa\xc3\
+\x86\xb2\xb7\x52\x6a\x25\xa1\x85\x04\xfd\x52\xc5\x03\x80\xf5\xeb\
+\xd7\x87\xb5\x32\x60\x4e\x4e\x0e\x3d\x7b\xf6\x14\x3e\x7f\xb8\xba\
+\x9c\x77\xad\x5e\x00\xdf\x71\xeb\x4a\xd7\x00\xbf\x53\xb2\x9e\x23\
+\x2e\xf1\x1e\xa4\xde\xbd\x7b\x93\x93\x13\x24\x33\xec\x26\xa4\xff\
+\x0b\x8f\x9d\x90\x13\x01\xca\xea\xae\xd0\x9b\x10\xc5\xac\x1e\x00\
+\xb9\x00\xe0\xcc\x0f\x5d\x3f\xd7\x1f\x36\xd8\x9a\x55\x02\x08\x18\
+\x32\x01\x80\xd7\xeb\x65\xf1\xe2\xc5\x0a\xbd\x09\x3e\xc6\x8f\x1f\
+\x2f\x75\xfe\xd9\xdd\xdf\xe2\x36\x4c\x94\xfb\x0c\x25\x5c\xea\xde\
+\xfe\x5d\x86\x87\xbf\x1d\xfb\x5a\xca\x86\x6c\x06\xc8\xaf\x78\xd4\
+\x8f\x5b\x7f\xb6\x74\x2d\x86\xc4\x5a\x6b\x3d\xeb\x22\x85\xde\x84\
+\x28\xa6\x65\x00\x0a\x65\x8e\xab\x0d\x00\xf6\x58\x25\x80\x80\xd1\
+\x31\x3e\x55\x4a\x1a\xf8\xb3\xcf\x3e\x53\xe8\x4d\xf0\x31\x69\xd2\
+\x24\x1c\x0e\x87\xf0\xf9\x7d\x95\xa5\xcc\x3e\xbc\x53\xa1\x47\x21\
+\x4c\x8d\xba\xfa\xff\xfb\x27\xbf\xe7\x80\x53\xfc\xbe\xe3\x70\x38\
+\x98\x38\x71\xa2\x32\x7f\x4c\xc7\xa3\xbe\xe1\x74\xd1\xd2\xb5\xc2\
+\x67\xb5\xd8\x14\xb4\x94\x2c\x85\xde\x84\x26\x46\xe3\xec\x01\x38\
+\x53\xee\x57\x12\x00\x6c\x2f\x97\x1a\x47\xb0\x90\x40\x03\xae\x6a\
+\xd2\x52\xf8\xfc\xe2\xc5\x8b\xf1\x98\xb4\xab\x3a\x18\x48\x4f\x4f\
+\x67\xf8\xf0\xe1\x52\x36\xfe\xbc\x6b\x95\x95\x05\xf0\x05\x45\x01\
+\x80\xcb\xf0\xf0\x4c\xe1\x57\x52\x36\xae\xbf\xfe\x7a\xd2\xd3\xd3\
+\x95\xf8\x63\x3a\x86\x07\x3c\x6a\x45\xd7\x3c\x1e\x2f\x4b\xbf\x5a\
+\x2f\x7c\x5e\x6b\x7d\x29\x08\xcf\x20\x85\x11\x66\x65\x00\x4e\x09\
+\x0f\xee\x41\x3d\x19\x00\xe1\xe5\xf0\x45\xb5\x55\x14\x59\xb2\xc0\
+\x01\x63\x68\xb3\x36\xc2\x67\x8b\x8b\x8b\xf9\xee\xbb\xef\x14\x7a\
+\x13\x7c\xdc\x7d\xf7\xdd\x52\xe7\x77\x94\x97\xf0\xf2\xbe\xf0\xfe\
+\x37\xbc\x20\x86\xa6\x6c\x04\xf0\xef\xc7\x57\xb2\xbb\x56\xee\xa5\
+\x43\xf6\x67\xee\x57\x3c\xa7\x50\xdd\x00\xb8\x7a\xdd\x76\x4e\x9c\
+\x14\x2f\x2b\xe8\x39\x97\x29\xf4\x26\x44\x71\x7a\xea\x16\x01\xa9\
+\xa6\xe6\x64\xdd\x18\xa0\x38\x67\xb6\x98\x9d\x1d\x00\x1c\x00\x84\
+\x95\x26\xac\x2c\x40\xe0\x18\xd2\xac\x8d\x54\x2c\xfe\xe9\xa7\x9f\
+\x2a\xf3\x25\x18\x19\x32\x64\x08\x9d\x3a\x75\x92\xb2\xf1\xc7\x1d\
+\x2b\x39\x62\x29\x63\xd6\x4f\xad\xae\xe4\x19\x96\xef\x2c\xe3\xcf\
+\x85\x5f\x4a\xd9\xe8\xd8\xb1\x23\x83\x07\x0f\x96\x77\xc6\x5f\x78\
+\xd4\x2f\x5b\x5b\xb8\x58\x42\x0b\x44\xd3\xd1\xdb\xf4\x51\xe7\x4c\
+\x88\x62\xb8\xcc\x51\x5c\x35\xca\xc4\x95\x1b\x81\x2a\xce\x5a\xfc\
+\x77\x76\x00\xe0\x01\xf6\x88\x5a\xdd\x76\xca\x0a\x00\x02\x45\x46\
+\x54\x1c\x17\x25\x36\x13\x3e\x3f\x7b\xf6\x6c\x85\xde\x04\x1f\x9a\
+\xa6\xf1\xd0\x43\x0f\x49\xd9\x28\x77\x3b\x79\x74\xab\xdc\x83\x29\
+\xa4\x51\x94\xfe\x7f\xf0\xc8\x02\x2a\xbc\x72\x8b\xc7\x1e\x7b\xec\
+\x31\x74\x5d\xfd\x4a\x62\xd3\x70\xab\xaf\xff\x7f\x38\x4f\xbc\x81\
+\x52\xcb\xe8\x88\x16\x9b\xa2\xd0\x9b\x10\xc5\x69\x52\x00\x70\x4a\
+\x2a\x00\xd8\x09\x9c\xa9\x57\xfe\xf4\xb7\x60\x87\xa8\x55\x2b\x03\
+\x10\x58\x64\xca\x00\xbb\x77\xef\xe6\xfb\xef\xc5\xe7\x81\x43\x81\
+\x5b\x6f\xbd\x95\xa6\x4d\xc5\xb5\x15\x00\x66\x1d\xde\xc1\x92\xe3\
+\x79\x6a\x1c\x0a\x35\x6a\xc4\x1b\x2d\x4f\xf3\x9f\x53\xbb\xf8\xb8\
+\x74\x9b\x94\x8d\x8c\x8c\x8c\xe0\x6a\xfe\x03\xe5\x19\x80\xef\x36\
+\xee\x92\x5b\xff\x9b\x13\x24\xe2\x49\x81\xa6\x71\x66\x00\x7e\xf4\
+\x8c\xff\x69\x00\x20\xbc\xda\x6c\xab\x95\x01\x08\x28\x43\xd3\xc5\
+\x03\x00\x80\x59\xb3\x66\x29\xf2\x24\x38\x89\x8e\x8e\xe6\xb1\xc7\
+\x1e\x93\xb6\x73\xc7\x86\x85\x14\x3b\xd5\x6f\x6c\x0b\x6a\x3c\x3a\
+\xd4\xc8\xd5\xff\x8f\xbb\x2b\xb8\xfb\xd0\x5c\x69\x57\x1e\x7f\xfc\
+\x71\x22\x23\x23\xa5\xed\xf8\x0d\x4f\x05\x18\xe2\x42\x47\xe7\x62\
+\xd6\x5c\xb9\x05\x60\x7a\x5b\xab\xfe\xef\x13\x8d\x33\x03\x70\xde\
+\x00\x40\x78\x9e\x69\x53\xd9\x71\x13\xf6\x54\x59\xf8\x4a\xdf\x94\
+\xe6\x24\x39\xa2\x84\xcf\xcf\x9e\x3d\x5b\x6a\x26\x38\x14\xb8\xef\
+\xbe\xfb\x68\xde\xbc\xb9\x94\x8d\xc3\xd5\xe5\x4c\xfa\x6e\x01\xde\
+\x30\xff\xb7\xfc\x11\xd5\x72\x0f\x7f\x2f\x06\xb7\xe6\xcd\xe6\xa8\
+\xc4\xd2\x1f\x80\xcc\xcc\x4c\xee\xba\xeb\x2e\x29\x1b\x7e\xc7\xad\
+\x76\xc4\xda\x30\x0c\xb9\xf4\x7f\x74\x22\x7a\x66\x17\x85\x1e\x85\
+\x2e\xa6\xe8\x00\x18\x06\x46\x69\x9e\x8c\x85\xf3\x06\x00\xc2\x6b\
+\xcd\x4a\x5d\x35\x1c\xb0\x36\x02\x06\x0c\xbb\xa6\x73\x7d\x86\xb8\
+\x34\xe7\xfe\xfd\xfb\x59\xbf\x5e\x7c\x2c\x28\x14\x88\x8a\x8a\xe2\
+\xb7\xbf\xfd\xad\xb4\x9d\xcf\x8e\xed\xe7\x6f\x7b\xe4\x56\xd4\x86\
+\x14\xd5\x72\xe9\xff\xff\x2d\x5c\xc6\xe2\x72\xe1\xf6\xa4\x33\x3c\
+\xf9\xe4\x93\x44\x47\x8b\xef\xcc\x08\x08\x8a\x03\x80\xd5\xeb\x76\
+\x70\x30\xff\x98\xf0\x79\xbd\xc3\x00\xd0\x82\xa8\x7f\x22\x50\x18\
+\x86\x29\x25\x00\xa3\xb2\x00\xdc\x52\x19\xc6\x1f\xd5\xd0\x7e\xfa\
+\x93\xdc\x85\xc4\x24\xc0\xc6\x32\xf1\x2f\x96\x85\x3c\xe3\x9a\xcb\
+\x75\xb2\x7f\xf0\xc1\x07\x8a\x3c\x09\x5e\x7e\xf1\x8b\x5f\xd0\xb9\
+\x73\x67\x69\x3b\x7f\xd8\xbe\x9c\x95\x25\x52\xb3\xba\xa1\x81\xa1\
+\x49\x05\x00\x5f\x55\xec\xe7\xa9\xc2\x2f\xa4\xdd\xc8\xcd\xcd\xe5\
+\xce\x3b\xef\x94\xb6\xe3\x5f\xbc\xe0\x51\xfb\x52\x35\x73\xae\x5c\
+\xa3\xaa\xde\xe9\x6a\x45\x9e\x84\x38\x4e\xb7\x19\xd2\x0d\x18\x27\
+\xc5\x57\x37\x03\x95\xfc\xa4\xd1\xff\xa7\x01\x80\x1b\x89\x2c\xc0\
+\xc6\x52\x2b\x00\x08\x24\xd7\x34\x6d\x4d\x4a\x84\x78\x19\xe0\xdd\
+\x77\xdf\xa5\xb6\xb6\x56\xa1\x47\xc1\x87\xdd\x6e\xe7\xe5\x97\x5f\
+\x96\xb6\xe3\x36\xbc\x8c\x5e\x3d\x87\x9d\xe5\x25\x0a\xbc\x0a\x62\
+\x6a\xec\x67\xf5\x1c\x37\x8c\x3d\xb5\xc5\x8c\x3f\xf0\x01\x1e\x05\
+\x4b\x96\x5e\x78\xe1\x05\x6c\x36\xb5\x52\xc4\xa6\xe3\x3e\x55\xb7\
+\x04\x48\x11\x4e\xa7\x9b\x0f\x3e\x12\x0f\x00\xb4\x98\x24\xf4\xd6\
+\x97\x2a\xf3\x27\xa4\xa9\x35\xa9\xfe\x7f\x52\x58\xb3\x0f\x60\x0b\
+\x3f\xf9\x6d\x3c\x57\x2e\x67\x93\xa8\x75\x2b\x03\x10\x58\x1c\xba\
+\xce\xa8\x8c\xf6\xc2\xe7\x8b\x8b\x8b\x99\x3f\x7f\xbe\x42\x8f\x82\
+\x93\x41\x83\x06\x71\xfd\xf5\xd7\x4b\xdb\x29\x76\x56\x33\xf4\x9b\
+\xd9\x1c\xad\x51\x2f\xe4\x12\x34\x94\x47\x08\x1d\x3b\xec\x2a\xe3\
+\xea\xbd\x6f\x73\xdc\x2d\xff\x6f\x37\x66\xcc\x98\xe0\x9a\xfb\x3f\
+\x8d\xe2\xf4\xff\x9c\xf9\xcb\x29\x2a\x16\xcf\x28\xe8\x1d\xaf\x02\
+\x3d\xc8\x82\xa8\x00\x61\x98\xd5\x00\x58\x2a\xac\xd9\x07\xe7\x78\
+\xb6\x2b\x0d\x00\x36\x94\x4a\x09\x14\x58\x28\x40\xb6\x0c\xf0\xe6\
+\x9b\x6f\x2a\xf2\x24\xb8\x79\xfd\xf5\xd7\x49\x4a\x4a\x92\xb6\x93\
+\x57\x55\xc6\x35\xab\x66\x72\xc2\x29\x5c\x59\x0b\x5e\xbc\x9a\x50\
+\x03\x60\x99\xa7\x86\xe1\xfb\xa6\x71\xc8\x29\x9f\xfe\x4e\x48\x48\
+\xe0\xa5\x97\x5e\x92\xb6\x13\x10\xdc\x6a\xb3\x47\x6f\xbd\xbb\x50\
+\xea\xbc\xde\xf9\x1a\x45\x9e\x84\x3e\x86\x53\xed\xe4\xc6\x19\xbb\
+\x72\x25\x80\xcd\x3f\xfd\x83\x73\x05\x00\xc2\x03\xe1\x85\x35\x95\
+\x1c\xaa\x52\xbf\xb5\xca\xc2\x77\x06\x35\x6d\x49\xd3\xc8\x18\xe1\
+\xf3\x4b\x97\x2e\x65\xdf\x3e\xa9\x2f\x59\x48\x90\x99\x99\xc9\xff\
+\xfe\xef\xff\x2a\xb1\xb5\xed\x54\x31\x23\x57\x7f\x44\x85\x5b\x6e\
+\x81\x4d\xd0\x51\xe1\xa8\xeb\x01\x68\x00\xe5\x9e\x5a\xae\xdb\xf7\
+\x7f\x6c\xaa\x96\x12\x3b\x39\xc3\x73\xcf\x3d\x27\x3d\xd9\x11\x10\
+\xbc\xb5\x4a\x15\x00\xf7\xe7\x15\xf0\xd5\x4a\xf1\x5d\x1f\x5a\x5c\
+\x2a\x7a\x4b\x71\xe9\xec\xb0\xc3\x84\x00\xc0\xa8\x2c\x84\x5a\xa9\
+\xa5\x50\x3f\xfb\x02\xd4\x97\x01\x10\x2e\xba\xad\x3e\x79\x54\xf4\
+\xa8\x85\x02\xec\x9a\xce\xe8\x4c\xf1\x32\x80\x61\x18\x4c\x9d\x3a\
+\x55\xa1\x47\xc1\xcb\x94\x29\x53\x18\x38\x70\xa0\x12\x5b\x2b\x4b\
+\x0e\x33\x70\xe5\x8c\xf0\xd2\xcc\xa8\x68\xd8\xbc\xfd\x71\x77\x05\
+\x03\xf7\xbe\xc9\xaa\xca\x83\x4a\x2e\x7f\xf5\xd5\x57\x07\xd7\xce\
+\xff\xb3\x71\xab\xdd\xab\xf2\xd6\xbb\x0b\xf1\x7a\x25\xa4\x7f\x3b\
+\x0d\xb2\xba\xff\x7d\xc5\x30\xc0\xa9\x5e\x1c\xcc\x28\x11\x96\xeb\
+\x81\xba\x67\xfa\x96\x9f\xfe\xe1\xb9\x7e\xa2\xa7\x38\x4b\x2c\xa0\
+\xa1\xac\x39\x61\x05\x00\x81\xe6\x8e\x96\x72\x3a\xdd\xef\xbc\xf3\
+\x0e\x4e\x67\x98\xbd\xad\x9e\x03\x5d\xd7\x99\x3e\x7d\x3a\xa9\xa9\
+\xa9\x4a\xec\x7d\x77\xb2\x90\x3e\x5f\xbf\xcb\xde\xca\x30\x90\xcf\
+\xae\xb1\x81\xd3\xf7\x07\xc6\x01\xe7\x49\xae\xd8\xfd\x2f\xd6\x57\
+\x89\x6f\xa8\x3b\x9b\xe4\xe4\x64\xa6\x4e\x9d\x8a\xa6\x05\xa9\x62\
+\x9d\x4b\x5d\x00\xe0\x74\xba\x79\xe7\xfd\x45\x52\x36\x6c\x17\xc9\
+\xf7\xc4\x84\x0d\xb5\x6e\xcc\x18\x01\x30\x4a\x84\x1f\xcb\x50\xb7\
+\xe4\xef\x67\x29\xa5\xfa\x7e\x43\x85\x85\xa2\x57\x9f\x50\xf3\x0b\
+\x6c\x21\xce\xa5\xc9\x19\x74\x97\xd0\x06\x28\x28\x28\x60\xe6\xcc\
+\x99\x0a\x3d\x0a\x5e\x9a\x37\x6f\xce\x1b\x6f\xbc\xa1\xcc\xde\xfe\
+\xca\x52\xfa\x2f\x7f\x9f\xcd\x65\xc7\x95\xd9\x6c\x94\x94\xf9\xfe\
+\xf6\xff\x7d\x75\x01\x97\xed\x7e\x5d\x5a\xe1\xef\x6c\xa6\x4e\x9d\
+\x4a\x56\x56\x90\xea\xd5\x1b\x6e\x70\xab\x1b\xff\x9b\xf1\xd1\x52\
+\x0a\x8f\x9d\x10\x3e\xaf\x65\x74\x42\x4b\xef\xa8\xcc\x9f\x50\xc7\
+\xa8\x31\xa9\xfe\x2f\x17\x00\x9c\x73\x31\x49\x7d\x01\xc0\x3a\xd1\
+\xab\x6c\x28\x3b\x86\xd3\x1b\xbe\xfa\xf2\x8d\x85\x3b\x5b\x75\x93\
+\x3a\xff\xfc\xf3\xcf\x87\xfd\x66\xc0\xd3\x8c\x1d\x3b\x96\x07\x1e\
+\x78\x40\x99\xbd\x82\x9a\x0a\xfa\x2d\x7f\x8f\xf7\xf3\xe5\xf6\xda\
+\x37\x5a\x5c\xba\xcf\xbb\xff\xdf\x3b\xb1\x91\x2b\x76\xbf\x41\xa1\
+\x4b\x5d\xbd\xfb\xd1\x47\x1f\x65\xd4\xa8\x51\xca\xec\xf9\x1d\xf7\
+\x09\x24\xaa\xb0\x3f\xe3\x1f\xaf\xcd\x91\x3a\x6f\xeb\x31\x5a\x91\
+\x27\x61\x42\xad\x09\xd9\x53\xaf\x0b\xa3\x54\x6a\x04\xf0\x9c\xcf\
+\x74\xe5\x19\x80\x1a\x8f\x9b\xef\x43\xfd\xed\x26\x08\xb8\x35\xab\
+\x2b\x31\x36\xf1\x05\x2c\x5b\xb6\x6c\x61\xe9\xd2\xa5\x0a\x3d\x0a\
+\x6e\x5e\x78\xe1\x05\xfa\xf7\xef\xaf\xcc\x5e\x85\xdb\xc9\x2d\xdf\
+\x2d\x60\xd2\xfa\x4f\xa9\xf2\x98\xf3\xc6\x10\x30\xca\x22\x2f\x98\
+\x01\xad\xf1\xba\x79\xf0\xf0\x02\x6e\x3d\x38\x5b\x5a\xdd\xef\x6c\
+\x2e\xbb\xec\x32\x9e\x79\xe6\x19\x65\xf6\x02\x82\xab\x48\x99\xa9\
+\xcf\x96\xac\x65\xd3\x56\x89\xa6\x5e\x47\x34\xb6\x2e\xd7\x2a\xf3\
+\x27\x1c\x30\x23\x03\x60\x9c\xd8\x07\x5e\x29\xbb\x0d\x0a\x00\x36\
+\x01\xc2\x1b\x61\x96\x17\x4b\x89\x15\x58\x28\x20\xd1\x11\xc9\xd8\
+\xe6\x1d\xa4\x6c\xbc\xf0\xc2\x0b\x8a\xbc\x09\x7e\xec\x76\x3b\x33\
+\x67\xce\xa4\x45\x8b\x16\x4a\xed\x4e\x3f\xb4\x95\xbe\x5f\x4f\x0f\
+\x9d\x85\x41\x6e\x0d\x2a\xcf\x1f\x78\xee\xa8\x39\xce\x25\xbb\x5e\
+\xe5\xe5\xa2\x6f\x94\x5e\x3a\x3b\x3b\x9b\x39\x73\xe6\xe0\x70\xc8\
+\x2b\x0f\x06\x0c\xc3\xa3\x74\xfc\xef\x85\x57\xe5\xa4\xbe\x6d\x5d\
+\x06\x43\x64\xac\x22\x6f\xc2\x00\xc3\x30\x45\x04\xc8\x28\x12\xde\
+\xcf\x07\x75\xdb\x7d\x7f\xd6\x00\x08\xf5\x07\x00\x4e\x24\xc6\x01\
+\xbf\x2e\xce\x17\x3d\x6a\xa1\x90\xbb\x5b\x75\x97\x3a\xff\xf9\xe7\
+\x9f\xb3\x69\x93\xf0\x5a\x88\x90\x23\x23\x23\x83\x45\x8b\x16\x29\
+\xd9\x0f\x70\x36\x9b\xcb\x8e\xd3\x73\xd9\x3b\xfc\x71\xc7\x4a\x6a\
+\x83\xbd\x7c\x76\x22\xaa\xde\xd1\x3f\x97\xe1\xe1\xa5\xa2\x55\x5c\
+\xba\xeb\x9f\x6c\xad\x51\xbb\x34\x2c\x21\x21\x81\x05\x0b\x16\x90\
+\x9e\x9e\xae\xd4\xae\xdf\x71\x17\x2b\xdb\xfe\xb7\x79\xdb\x7e\xbe\
+\x5c\xbe\x51\xca\x86\x6e\xa5\xff\x1b\x86\xd3\x55\x17\x04\x28\xc6\
+\x2b\x17\x00\xac\x07\xce\x99\x3e\x38\x5f\x9b\xee\x4a\xd1\xab\xad\
+\x28\xc9\xc7\x63\xd5\x8f\x03\xce\xe5\xa9\x2d\xc8\x4d\x68\x22\x65\
+\xc3\xca\x02\xfc\x98\x2e\x5d\xba\x30\x73\xe6\x4c\xe5\x6f\x99\xd5\
+\x1e\x37\x4f\xed\x5c\x49\xf7\x2f\xa7\xf2\x45\x51\x9e\x52\xdb\x7e\
+\xa3\xd6\x0e\x55\xe7\xfe\x77\x59\x52\xbe\x87\xae\x3b\xfe\xc1\x43\
+\x87\x3f\x55\x9a\xf2\x07\x70\x38\x1c\xcc\x99\x33\x87\x6e\xdd\xe4\
+\xfa\x5e\x1a\x05\x4e\x75\xcb\xd4\x9e\x7d\x71\x86\x54\x1f\x8f\xd6\
+\xac\x3d\x7a\xf3\x5c\x65\xfe\x84\x03\x46\x8d\x09\x1b\x00\x0d\x0f\
+\x46\x89\xb0\x50\x2f\xc0\x8a\xfa\xfe\xc2\x94\x00\xa0\xcc\x55\xcb\
+\x96\x53\x56\x1f\x40\x63\xe0\x91\x76\x72\xbb\xbb\x67\xcc\x98\xc1\
+\x8e\x1d\x3b\x2e\xfc\xc1\x30\xe2\xda\x6b\xaf\x65\xda\xb4\x69\xa6\
+\xec\x96\xdf\x59\x5e\xc2\xd5\x2b\x67\x32\x71\xdd\x7c\xf2\xaa\xa4\
+\x96\x7e\xf8\x19\x0d\x4e\x44\xd6\xfd\xf7\x59\x1c\x70\x9e\x64\x7c\
+\xde\x07\x5c\xb3\x77\xaa\xd2\x2e\xff\xd3\xd8\x6c\x36\xa6\x4f\x9f\
+\xce\xd5\x57\x87\x80\x48\x8d\xe1\x52\xb6\xfe\x77\xdb\xce\x3c\x66\
+\xcd\x5d\x26\x65\xc3\xd6\xe7\x16\x25\xbe\x84\x15\xb5\x26\xd4\xff\
+\x4f\xee\x07\x97\xd4\xfe\x90\x7a\x9f\xe5\x17\x0a\x00\x84\xc3\x47\
+\xab\x0c\xd0\x38\xb8\xb9\x45\x17\x5a\x44\xc7\x0b\x9f\xf7\x78\x3c\
+\x3c\xf5\xd4\x53\x0a\x3d\x0a\x0d\x6e\xba\xe9\x26\xde\x7e\xfb\x6d\
+\x74\xdd\x9c\xe5\x28\x1f\x1c\xde\x4e\xce\xe2\x37\x18\xb7\x76\x5e\
+\x70\xf4\x07\x94\x47\xd4\x65\x00\x7e\x60\x7f\xed\x09\xee\xc9\xff\
+\x98\xf6\xdb\x9f\x67\xf6\xc9\x9f\x6d\x20\x55\x82\xa6\x69\xbc\xfe\
+\xfa\xeb\x8c\x1f\x3f\xde\x14\xfb\x7e\xc7\x75\x0c\x55\xf3\xe3\x4f\
+\xfe\xe5\xff\xa4\x16\xff\x68\xf1\x4d\xb1\x75\x0e\x42\xfd\x84\x00\
+\x63\x54\xab\x9f\x00\x90\xac\xff\x7b\x81\x6f\xeb\xfb\xcb\xf3\xdd\
+\xbd\x8a\x01\xe1\xbc\xc3\x97\x45\x6a\xb6\x79\x59\xc8\xe1\xd0\x75\
+\xfe\x5f\x1b\xb9\x15\x9e\xb3\x67\xcf\xb6\x7a\x01\xce\xc1\xe4\xc9\
+\x93\x79\xed\xb5\xd7\x4c\x0b\x02\xbc\x86\xc1\x87\x47\x76\xd2\xe5\
+\x8b\xb7\x98\xb0\xee\x13\x36\x35\xd6\xe9\x1a\xf7\xe9\xb7\xff\xba\
+\x99\xfe\xf1\x79\x1f\xd0\x6e\xfb\xf3\xfc\xbb\x78\x2d\x6e\x05\x4a\
+\x7e\xe7\x42\xd7\x75\x5e\x7f\xfd\xf5\xe0\xdd\xf4\x77\x2e\x9c\x6a\
+\xfa\x22\xb6\x6c\xdf\xcf\xc7\x9f\xd6\x9b\xf5\xf5\x09\x5b\xef\x9b\
+\x40\x62\x8a\x28\x2c\xf1\x1a\xa6\x64\x00\xbc\xc7\xcf\xd9\xbf\xe7\
+\x2b\xdb\x80\x7a\x97\x40\x5c\xe8\xce\x25\x5c\x06\xf8\xe2\x78\x5e\
+\xf0\x37\x34\x85\x08\x53\x5a\xf7\x20\xce\x2e\xa6\xca\x06\x75\xeb\
+\x81\xad\x2c\xc0\xb9\xb9\xe7\x9e\x7b\x78\xef\xbd\xf7\xb0\xdb\xed\
+\x17\xfe\xb0\x20\x5e\xc3\x60\xd6\xe1\x1d\x74\xff\x72\x2a\x5d\x96\
+\xbe\xc5\x5f\x77\xaf\xe6\x58\x6d\xa5\x69\xd7\x6b\x18\x1a\x27\x8e\
+\xc1\xbf\x8b\xd6\x71\xf9\xee\x37\xe8\xb1\xf3\x65\x66\x9f\xdc\x8c\
+\xd7\x0c\x31\xf4\x1f\xb0\x72\x45\xcb\x5d\x00\x00\x20\x00\x49\x44\
+\x41\x54\xd9\x6c\xbc\xfd\xf6\xdb\xdc\x73\xcf\x3d\xa6\x5d\xc3\xef\
+\x78\x2a\xc1\xa3\x46\x47\xe5\xb7\x4f\xbf\x2d\xf5\xf6\x4f\x44\x8c\
+\x35\xfb\x2f\x80\x19\x6f\xff\x78\x9c\x18\x72\x01\xc0\x79\x23\xc1\
+\x0b\x15\x31\x13\x81\x1b\x44\xae\xea\x32\xbc\x0c\x68\x92\x4d\x9b\
+\x58\xb5\x1d\xd3\x16\x0d\x27\xda\x66\xe7\x78\x6d\x25\x6b\x24\x74\
+\x1a\x76\xee\xdc\xc9\xb0\x61\xc3\x82\x53\x58\xc5\x64\x72\x73\x73\
+\xe9\xda\xb5\x2b\xf3\xe7\xcf\xc7\xed\x36\x47\x06\xf4\x34\x45\xce\
+\x2a\x96\x16\xe5\xf1\xd2\xbe\xef\x58\x77\xb2\x00\x03\x68\x1a\x15\
+\x23\x15\xe0\x89\x50\x58\x53\xc9\x27\x05\x7b\xf8\xed\xe6\xe5\x4c\
+\xd9\xbb\x80\xf9\x65\x3b\xc8\x77\x99\xdf\xb3\x10\x1d\x1d\xcd\xac\
+\x59\xb3\x98\x30\x61\x82\xe9\xd7\xf2\x2b\xb5\x79\x4a\xc4\x7f\xbe\
+\xdb\xb8\x8b\xc7\x9e\xf8\x97\x94\x0d\xdb\x25\x13\xd0\xdb\xab\xdb\
+\x79\x11\x36\x94\x57\x83\xe2\x20\xc0\x38\xbe\x09\x6f\xde\x17\x32\
+\x26\xfe\x0e\xd4\x5b\x43\xb8\xd0\xa2\xec\x4c\x40\x78\xb7\xef\x2f\
+\xdb\xf5\xe6\xb9\xae\x6a\xc4\x54\x2c\xe4\x38\x50\x55\x4a\xfb\xc5\
+\xff\x96\x4a\xc9\x5e\x75\xd5\x55\x7c\xf1\x85\xd4\x97\x31\xa4\xf9\
+\xf6\xdb\x6f\x19\x39\x72\x24\x45\x45\xea\x16\xb9\xf8\x82\x06\x74\
+\x4e\x48\x63\x50\x93\x56\x0c\x6c\x92\x4d\xff\xd4\x6c\x52\x22\xa2\
+\x94\x5e\xa3\xc4\x59\xcd\x8a\x92\x7c\xbe\x2c\x3a\xc8\x97\x45\x07\
+\xd9\x76\x4a\x7d\x43\xdf\x85\x68\xda\xb4\x29\x9f\x7c\xf2\x09\x7d\
+\xfa\xf4\xf1\xfb\xb5\x4d\xc5\xf0\x42\xf9\xaa\xba\x15\xc0\x92\x0c\
+\xb8\xee\x61\xbe\x5e\x25\x51\xae\xd3\xed\x44\xfc\xcf\x27\x68\x09\
+\xe2\xab\xc4\xc3\x15\xe3\x70\x09\x46\x95\xf0\xfa\x9c\x73\xe2\xd9\
+\xf8\x26\xde\x3d\x0b\x44\x8f\x1b\xd4\x3d\xc3\xeb\x1d\x2d\xf1\x45\
+\x29\x63\x07\x20\xb4\x08\xba\x4b\x42\x1a\x5b\x07\xdd\x25\x72\xd4\
+\xc2\x04\x6e\x5b\xbf\x90\x69\x87\xa4\xd2\x49\xbc\xff\xfe\xfb\x4c\
+\x9c\x38\x51\x91\x47\xa1\xc7\xbe\x7d\xfb\x18\x31\x62\x44\xc0\x27\
+\x27\x9a\x46\xc6\xd0\x29\x3e\x8d\xf6\x71\x29\x74\x88\x4b\xa1\x7d\
+\x7c\x0a\x29\x8e\x28\xe2\xec\x11\xc4\xdb\x23\x48\x72\x44\x11\x67\
+\xaf\xab\xf1\x56\xb8\x5d\x94\xba\x6a\x28\x77\x3b\xa9\x70\x3b\x39\
+\xe1\xaa\x61\x57\x79\x09\xbb\x2b\x4e\xb2\xab\xa2\x84\x9d\xe5\x25\
+\x1c\x0f\xb0\x8a\x61\x97\x2e\x5d\x98\x3f\x7f\x3e\x6d\xda\xb4\x09\
+\xa8\x1f\xa6\xe0\x2c\x80\x6a\xa9\x31\x2f\x00\xa6\xcf\x5c\xc2\xa4\
+\x29\x72\x5b\x10\x6d\x3d\x46\x63\xbf\xee\x77\xd2\xbe\x84\x23\xde\
+\xbd\x05\x75\x7d\x00\x0a\x71\x7f\x76\x2f\x46\xb9\xf0\x3b\xf8\x16\
+\xe0\xbc\xb3\xb1\xbe\x04\x00\xaf\x02\xf7\x89\x7a\x90\x77\xed\xbd\
+\xb4\x8c\x49\x14\x3d\x6e\xa1\x90\xbc\xaa\x32\x3a\x2c\xf9\xb7\x94\
+\x56\x43\x4c\x4c\x0c\x25\x25\x25\x44\x45\xa9\x7d\xc3\x0c\x25\x2a\
+\x2a\x2a\xb8\xe3\x8e\x3b\xf8\xf0\xc3\x0f\x03\xed\x4a\x48\x30\x72\
+\xe4\x48\xa6\x4d\x9b\x46\x62\x62\x88\xde\x47\x2a\xd6\x4b\xd7\xff\
+\xab\xab\x6b\x49\x6b\x33\x8a\xaa\x6a\x89\x37\x50\x9b\x83\x88\x7b\
+\xe7\xa0\x25\x65\x4a\xf9\x12\x96\xd4\xba\xf1\x1e\x54\xdb\xa4\x6b\
+\x54\x1e\xc3\xbd\x50\xaa\xc9\xf5\x45\xe0\x91\xf3\x7d\xc0\x97\xf6\
+\x65\xa9\x9c\xef\xe7\xc7\xa5\x04\x0c\x2c\x14\xd2\x2a\x26\x91\xdb\
+\xb2\xe5\x16\x7b\x54\x55\x55\x71\xfb\xed\xb7\x2b\xf2\x28\x34\x89\
+\x8b\x8b\x63\xd6\xac\x59\x3c\xf7\xdc\x73\xc1\xbd\x96\x36\xc0\x44\
+\x44\x44\xf0\xf7\xbf\xff\x9d\x79\xf3\xe6\x85\xee\xc3\xdf\x53\xa1\
+\xa4\xf9\x6f\xd2\x94\x67\xe5\x1e\xfe\xd4\xbd\xfd\x5b\x0f\x7f\x31\
+\x8c\xaa\x1a\xf5\x36\x0b\xd6\xcb\x9a\xb8\xe0\xb3\xdb\x97\x00\x60\
+\x19\x20\xfc\xca\xf8\x59\xe1\x7e\xd1\xa3\x16\x8a\xd9\x72\xaa\x88\
+\x6d\xe5\xf2\xb5\xdb\x0f\x3f\xfc\x90\x82\x82\x02\x05\x1e\x85\x2e\
+\x9a\xa6\xf1\xcb\x5f\xfe\x92\x6f\xbf\xfd\x96\x0e\x1d\xe4\x34\x19\
+\xc2\x91\x8e\x1d\x3b\xf2\xed\xb7\xdf\xf2\xf0\xc3\x0f\x07\xda\x15\
+\x73\xa9\x95\xdf\x97\x72\xa4\xa0\x98\xb9\x0b\xe4\xc6\xfe\x00\x8c\
+\x63\xbb\x31\x8e\xef\x95\xb6\x13\x8e\x18\x55\xea\x27\x00\xbc\x85\
+\x52\x01\x80\x9b\x0b\x4c\x00\x80\x6f\x01\x40\x29\x75\xbb\x84\x85\
+\xf8\xa2\x28\xcf\x92\x07\x0e\x30\x27\x9c\x35\x3c\xb8\x79\x29\x3d\
+\xbf\x7c\x87\x55\x25\x87\xa5\xed\x79\x3c\x1e\x1e\x7d\xf4\x51\x05\
+\x9e\x85\x3e\x17\x5f\x7c\x31\xeb\xd7\xaf\xe7\xde\x7b\xef\x35\x6d\
+\x5f\x40\x28\xa1\xeb\x3a\xf7\xdd\x77\x1f\xeb\xd7\xaf\xa7\x67\x4f\
+\xb9\xfd\x15\x8d\x1e\x6f\x2d\xb8\xe4\xd3\xc6\x0f\x3f\xfe\x1a\x5e\
+\xaf\xfc\xbe\x05\x6f\xfe\xf7\x38\xdf\x9c\x88\xfb\x93\x27\x30\x2a\
+\xeb\x1d\x1d\xb7\x38\x17\xaa\x47\x00\xbd\x2e\xd9\xf1\xbf\x35\xc0\
+\x05\x53\x4b\xbe\xde\x91\x3e\x13\xf5\xa2\xdc\xed\x54\xf2\xd0\xb1\
+\x68\x38\x6e\xc3\xcb\xcb\xfb\xbe\xa3\xdd\x92\x37\x78\x79\xdf\x77\
+\x4a\x97\xb2\xcc\x9c\x39\xd3\x9a\x08\xf0\x91\xd8\xd8\x58\x5e\x7b\
+\xed\x35\x96\x2f\x5f\x4e\xa7\x4e\x9d\x02\xed\x4e\xa3\xa5\x5d\xbb\
+\x76\x2c\x5d\xba\x94\x57\x5f\x7d\x95\x98\x98\x98\x40\xbb\x63\x3e\
+\xce\xc3\xd4\x2d\x6a\x13\x67\xd9\x8a\xef\xf9\xe8\x93\xaf\xd5\xf8\
+\x03\x60\x78\xf1\x6c\xf9\x0f\xce\x37\xc6\xe2\x59\x37\x13\xac\x97\
+\xb7\x0b\x53\xe3\x02\x05\x01\xd8\xd9\x18\x45\xdb\xc0\x2d\x55\x56\
+\xf0\xe9\x99\xed\x6b\x00\xf0\x1f\x09\x47\x58\x74\xcc\xea\x03\xf0\
+\x37\x8b\x8f\x1f\xe0\xa2\x2f\xa6\xf2\xe0\xe6\xa5\x9c\x70\x9a\x50\
+\x9f\x32\x0c\xee\xbd\xf7\x5e\xaa\xab\xab\x95\xdb\x0e\x55\xfa\xf5\
+\xeb\xc7\xc6\x8d\x1b\xf9\xf3\x9f\xff\x4c\x5c\x5c\x5c\xa0\xdd\x69\
+\x34\xc4\xc7\xc7\xf3\xcc\x33\xcf\xb0\x75\xeb\x56\x06\x0e\x0c\x93\
+\xb1\x61\xc3\x03\x4e\xf1\xbd\x1c\x00\x55\xd5\xb5\xdc\x75\xff\x73\
+\x52\x82\x3f\xf5\x52\x7d\x0a\xf7\xe7\xcf\xe3\xfc\xf7\x4d\x78\xf7\
+\xaf\x56\x6f\x3f\x84\x30\x24\x7b\x2f\xce\x85\xb7\x60\x83\xac\x09\
+\x9f\x9e\xd9\xbe\xaa\x99\x14\x00\xf7\x02\x42\xc2\xd0\xa5\xee\x1a\
+\xe9\x75\xb4\x16\xbe\xb1\xa7\xe2\x24\xb7\xaf\x5f\xc8\x1f\x76\xac\
+\xa0\xc8\x69\xee\xe8\xd6\x89\x13\x27\xf0\x78\x3c\xa1\x21\xc4\xe2\
+\x27\xec\x76\x3b\xfd\xfb\xf7\xe7\xb6\xdb\x6e\xa3\xb8\xb8\x98\x2d\
+\x5b\xb6\x98\x73\x03\x0f\x02\x74\x5d\x67\xf2\xe4\xc9\xcc\x9b\x37\
+\x8f\xa1\x43\x87\x9a\x22\xae\xd4\x68\x71\x1e\xa9\x93\xfe\x95\xe0\
+\xb7\x4f\xbf\xc5\xc2\xc5\x6b\x14\x39\x54\x0f\x55\x27\xf1\x6e\xf9\
+\x0f\x46\xc1\x4e\xf4\xcc\x4e\x68\xd1\x21\xda\x8c\x29\xc3\x89\x72\
+\x70\xa9\xcd\x94\x78\x37\xbe\x09\x4e\xe1\xe6\xd0\x02\xe0\x31\x5f\
+\x3e\xe8\x6b\x06\xc0\x0b\x2c\x12\xf5\x66\xdb\xa9\x62\xb6\x2b\x68\
+\x3e\xb3\xa8\x9f\x4a\x8f\x8b\x3f\xee\x58\x49\xee\x17\x6f\xb1\xa0\
+\xd0\x7f\x8d\x3c\xcf\x3f\xff\x3c\x1b\x36\x48\x47\xab\x61\x47\x66\
+\x66\x26\xd3\xa6\x4d\x63\xcb\x96\x2d\xdc\x78\xe3\x8d\x68\x9a\x2f\
+\x13\xb9\xa1\x81\xa6\x69\x0c\x1f\x3e\x9c\xf5\xeb\xd7\xf3\xce\x3b\
+\xef\x90\x91\x91\x11\x68\x97\xfc\x8c\xf1\x43\xfa\x5f\x9c\x4d\x5b\
+\xf7\xf1\xd2\x1b\x73\x15\xf9\x73\x61\xbc\x7b\x96\xe3\x7c\x63\x1c\
+\xee\xcf\x9f\x87\xda\x0a\xbf\x5d\xb7\xd1\x63\xa8\x5f\x01\x6c\x94\
+\x1d\xc4\x28\x97\xfa\x7e\x7c\x86\x8f\xaa\x52\x0d\xe9\x4a\x12\xee\
+\x03\x00\xf8\xf0\x88\xfc\xa2\x0b\x8b\x9f\xe3\x35\x0c\xde\x3e\xb8\
+\x89\x9c\xcf\xdf\xe0\xa9\x9d\x2b\xfd\xae\xbf\xe0\x76\xbb\xb9\xe3\
+\x8e\x3b\x70\xb9\xd4\x8b\x60\x84\x03\x9d\x3b\x77\x66\xf6\xec\xd9\
+\xac\x5f\xbf\x9e\x71\xe3\xc6\x85\xf4\x5b\xb0\xdd\x6e\x67\xfc\xf8\
+\xf1\x6c\xd8\xb0\x81\x05\x0b\x16\xd0\xbd\x7b\xf7\x40\xbb\x14\x18\
+\x9c\x85\xe0\x15\x2f\xcb\xb9\xdd\x1e\xee\xb8\xef\x6f\xb8\x5c\xe6\
+\xae\x9d\xfe\x19\x5e\x37\x9e\x75\x33\x71\xbe\x76\x03\x9e\xef\x3f\
+\xa9\xdb\x60\x18\xe6\x18\x35\x4e\xe5\xcb\x7f\xbc\xf9\xc2\x12\x3c\
+\xa7\xf1\xf9\x59\xdd\x90\xbb\xcd\x11\xe0\x51\x1a\x16\x34\x9c\xe1\
+\x58\x6d\x25\xf7\xb5\xb9\x58\xe4\xa8\x45\x3d\xac\x2c\x39\xcc\x0d\
+\x6b\x3e\xe6\x5f\x07\xbe\xa7\xd2\x13\xb8\x07\xf0\xb1\x63\xc7\x70\
+\x38\x1c\x5c\x79\xe5\x95\x01\xf3\x21\xd8\xc9\xc8\xc8\xe0\xc6\x1b\
+\x6f\xe4\xd6\x5b\x6f\xc5\x30\x0c\x76\xee\xdc\x49\x6d\xad\xfa\xda\
+\x62\x20\x48\x4a\x4a\xe2\x9e\x7b\xee\x61\xc6\x8c\x19\xdc\x75\xd7\
+\x5d\xa4\xa7\xa7\x07\xda\xa5\x00\x62\x40\xd5\x56\xa9\xb5\xbf\x4f\
+\xff\x6d\x3a\x33\xe7\x7c\xa9\xd0\xa7\x06\xe2\xaa\xc6\xbb\x7b\x39\
+\xde\x3d\x2b\xd0\x9a\xb4\x41\x4b\x0c\xe3\x9f\x67\x59\x95\xf2\x09\
+\x00\xef\xfa\xd7\xc1\x29\xac\x0b\xe1\x02\xa6\x00\x3e\xdd\x3c\x1a\
+\x9a\x77\x5c\x0a\x0c\x6a\xa8\x47\xa7\xd9\x3c\xe8\x4e\x72\x13\x9a\
+\x88\x1e\xb7\xf8\x81\x43\x55\xa7\x78\x6c\xdb\x32\x66\x1f\xde\x61\
+\xa2\xe6\x5a\xc3\xb0\xdb\xed\x2c\x5f\xbe\x9c\xbe\x7d\xfb\x06\xda\
+\x95\x90\xa0\xaa\xaa\x8a\x0f\x3f\xfc\x90\x37\xdf\x7c\x93\x6f\xbe\
+\xf9\x26\xe8\xfa\x04\x34\x4d\xa3\x5f\xbf\x7e\xdc\x7d\xf7\xdd\xdc\
+\x78\xe3\x8d\x44\x47\x47\x07\xda\xa5\xc6\x81\xf3\x28\x54\xef\x12\
+\x3e\xbe\x6e\xc3\x2e\xfa\x5d\x7b\xbf\xff\xdf\xfe\xeb\x45\x43\xef\
+\x3c\x18\xfb\xa0\x07\xc2\x32\x10\xf0\x1e\x2c\x52\x2a\x01\x6c\x9c\
+\xdc\x8f\x7b\xc9\x43\x32\x26\x3e\x07\x86\xf8\xfa\xe1\x86\x06\x00\
+\xff\x03\xbc\xd2\xc0\x33\x67\xf8\x5d\x87\xcb\xf8\x73\x67\x4b\x65\
+\x4a\x94\x2a\x8f\x8b\xbf\xed\x5e\xc3\x73\x7b\xd6\x50\x15\xc0\x37\
+\xfe\xfa\xc8\xc9\xc9\x61\xe3\xc6\x8d\xc4\xc7\xc7\x07\xda\x95\x90\
+\x22\x2f\x2f\x8f\xd9\xb3\x67\x33\x6b\xd6\xac\x46\xdf\x6f\xd1\xab\
+\x57\x2f\xc6\x8d\x1b\xc7\xb8\x71\xe3\x68\xd9\xb2\x65\xa0\xdd\x69\
+\x64\x18\x50\xbe\x5a\x38\xfd\x7f\xaa\xbc\x8a\xee\x97\xdf\xcd\x81\
+\x83\x8d\x70\x09\x97\x23\x0a\x5b\xdf\x49\xd8\xfb\x4e\x02\x47\x78\
+\xac\x09\x37\xdc\x5e\x8c\xfd\xf5\xea\xec\x08\xe1\xd9\x3c\x0d\xef\
+\xce\x39\x32\x26\xa6\x00\x3e\xcb\x41\x36\x34\x00\x68\x0e\xe4\x0b\
+\x9c\x03\x20\x27\x36\x89\xbd\xd7\x4c\x11\x39\x1a\xf6\x2c\x28\xdc\
+\xcb\x03\x9b\x96\x90\x57\x65\xbe\xe4\xaa\x0c\xb7\xdf\x7e\x3b\x53\
+\xa7\x4e\x0d\xb4\x1b\x21\x4b\x7e\x7e\x3e\x8b\x16\x2d\x62\xd1\xa2\
+\x45\x7c\xf9\xe5\x97\x94\x96\x96\x06\xd4\x9f\xa4\xa4\x24\x06\x0d\
+\x1a\xc4\x90\x21\x43\x18\x32\x64\x08\x2d\x5a\xb4\x08\xa8\x3f\x8d\
+\x1a\xc9\xb7\xff\x5b\xef\x79\x86\xf7\x66\x2d\x51\xe8\x90\x7a\xb4\
+\xf8\xa6\xd8\x06\xde\x87\xad\xdb\x30\x04\x1f\x13\x41\x83\x71\xaa\
+\x0a\xa3\x50\xed\xef\x9f\xfb\x3f\xbf\xc0\xa8\x10\x0e\x2a\xbc\x40\
+\x0b\xea\xa6\x00\x7c\x42\xe4\x27\xb4\x16\xb8\x44\xe0\x1c\x00\x1b\
+\x06\xde\x4e\x8f\x24\x4b\x6a\xd2\x57\x36\x94\x16\xf2\xd0\xe6\x2f\
+\x58\x51\x22\xbf\x32\xd4\x5f\x7c\xf0\xc1\x07\xa1\xa7\xd7\xde\x08\
+\xf1\x7a\xbd\x6c\xdb\xb6\x8d\x95\x2b\x57\xb2\x7a\xf5\x6a\x36\x6f\
+\xde\xcc\xf6\xed\xdb\x71\x3a\xd5\xaf\x25\x85\xba\xdd\xfc\x9d\x3b\
+\x77\xa6\x5b\xb7\x6e\xf4\xed\xdb\x97\xcb\x2f\xbf\x9c\xce\x9d\x3b\
+\x5b\x1b\x0e\x7d\xc1\xf0\x42\xc5\xea\xba\xed\x7f\x02\x7c\x38\xef\
+\x6b\xc6\xdd\xf6\x94\x62\xa7\xcc\x43\xcb\xec\x8c\xfd\x9a\x5f\xa2\
+\xb7\x38\xaf\x18\x5d\x50\xe3\x2d\x38\x09\xe5\xea\xf6\xa0\x18\x27\
+\x76\xe3\x5e\xfa\x4b\x19\x13\xab\x80\xcb\x1b\x72\x40\x24\x00\x78\
+\x1c\xf8\x8b\xc0\x39\x00\x7e\xdd\xbe\x0f\xcf\x76\x19\x20\x7a\x3c\
+\x6c\x28\x71\x56\xf3\xf4\xce\x55\xfc\x73\xff\x7a\x3c\x41\x56\xff\
+\x4d\x4e\x4e\x66\xdd\xba\x75\xe4\xe4\xe4\x04\xda\x95\xb0\xc3\xe5\
+\x72\xb1\x7b\xf7\x6e\xf6\xee\xdd\x4b\x5e\x5e\x1e\xfb\xf7\xef\xe7\
+\xf0\xe1\xc3\x94\x94\x94\x9c\xf9\x4f\x4d\x4d\x0d\x6e\xb7\x9b\xf2\
+\xf2\xba\x46\xa3\xf8\xf8\x78\xec\x76\x3b\x51\x51\x51\xa4\xa6\xa6\
+\x92\x9a\x9a\x4a\x5a\x5a\x1a\x2d\x5a\xb4\xa0\x75\xeb\xd6\xb4\x6e\
+\xdd\x9a\xb6\x6d\xdb\xd2\xbe\x7d\x7b\xec\x76\x7b\x80\xff\x1f\x06\
+\x29\xb5\x07\xa1\x46\x4c\x17\x65\xcf\xbe\xc3\x5c\x32\xf0\x5e\xca\
+\x4e\x55\x2a\x76\xca\x6c\x34\x6c\xb9\x43\xb1\x0d\x7a\x10\x2d\x2e\
+\x35\xd0\xce\x28\xc7\xd8\x57\x88\xe1\x51\x37\x09\xe1\xf9\x7e\x2a\
+\xde\xdd\xf3\x64\x4c\xfc\x12\x78\xa1\x21\x07\x44\x02\x80\x8e\x80\
+\xb0\xd8\x79\xeb\x98\x24\xf6\x5d\x3b\x25\xc4\x93\x43\xe2\xb8\xbc\
+\x5e\x5e\x3b\xb0\x81\x27\x77\xac\xa0\xcc\xe5\xbf\x2e\x70\x87\x66\
+\xe3\xde\xb4\xde\x44\xe9\x76\xfe\x76\x6c\xb9\xb4\xbd\x6e\xdd\xba\
+\xf1\xcd\x37\xdf\x10\x1b\x2b\xb4\x3b\xca\xc2\x22\x74\x30\x9c\x50\
+\xbe\x46\xa8\xf3\xbf\xb2\xaa\x86\x3e\x83\xee\x63\xeb\x0e\xf9\x6d\
+\xaa\xdd\x53\xfb\xa2\x69\x3a\x9b\x4b\x56\xe3\x31\xfc\x38\x2e\xec\
+\x88\xc6\xd6\xf7\x56\xec\x97\xdd\x06\xf6\x08\xff\x5d\xd7\x44\x8c\
+\x6a\x27\x46\xbe\xca\xdd\x36\x06\xee\x4f\xef\xc2\xa8\x2a\x92\x31\
+\x92\x03\x34\x28\xca\x14\x19\x3a\x2e\x06\x46\x03\x42\x2d\x9f\xa5\
+\xae\x1a\x86\xa5\xe7\xd0\x3c\xda\x6a\x14\xfb\x29\x4b\x8f\xe7\x31\
+\x6a\xf5\x1c\xa6\xe7\x6f\xf5\xeb\x3c\xff\xd5\xf1\x6d\xf9\xa4\xcd\
+\x24\x26\xa5\xf4\xa4\x7f\x5c\x6b\xe6\x96\x6e\xa3\xc8\x2d\xf7\xb6\
+\x71\xec\xd8\x31\x0e\x1c\x38\xc0\x98\x31\x63\x14\x79\x69\x61\x11\
+\xa4\xd4\xec\x05\x8f\x58\xef\xce\xdd\xf7\x3f\xcf\x92\xaf\xa4\x65\
+\x61\x49\x8e\x4c\x63\x40\xe6\x08\x32\x63\x5b\xd2\x26\xa1\x13\xd5\
+\xee\x4a\x4a\x9d\x25\xd2\x76\x7d\xc2\xeb\xc6\x38\xb8\x1e\xef\xf6\
+\xc5\x68\x71\x69\x68\x4d\xda\xf8\xe7\xba\x66\x72\xb2\x12\x6a\xd4\
+\x95\xda\x8c\xe2\x9d\x78\x77\x7f\x22\x63\x62\x2d\xf0\x5c\x43\x0f\
+\x89\x6e\x1d\x49\x02\x84\xf7\xbf\x26\xd8\x23\xb9\xb6\x59\x6b\xd1\
+\xe3\x21\xc7\xae\x8a\x13\x4c\x5e\xff\x29\x4f\xf8\x61\x7d\xef\xd9\
+\x74\x88\x6c\xc2\xbb\xad\xc6\xf1\xa7\x8c\xc1\x34\xb1\xd7\xbd\xa9\
+\xdb\x35\x9d\x1e\x31\x99\x4c\x3b\xb1\x01\x43\x72\xc8\x70\xeb\xd6\
+\xad\xa4\xa6\xa6\xd2\xbb\x77\x6f\x15\xee\x5a\x58\x04\x1f\xde\x2a\
+\xe1\xc6\xbf\x17\x5f\xfb\x88\xbf\xbd\x34\x53\xda\x05\x5d\xd3\xb9\
+\xba\xc5\x0d\xc4\x39\x12\x00\x88\xb4\x45\xd3\x3a\xa1\x23\xe9\x31\
+\x2d\x28\xa9\x39\x4e\x8d\xc7\x4f\xf7\x9c\xea\x53\x78\x77\x2c\xc5\
+\x38\xb4\x11\x3d\xbd\x23\x5a\x6c\x8a\x7f\xae\x6b\x02\x46\x51\x29\
+\x78\xd4\x95\x66\xbd\xbb\xe6\x61\x9c\xd8\x2d\x63\xe2\x45\xe0\xdb\
+\x86\x1e\x12\xcd\xc4\x67\x03\x79\xa2\xe7\x9b\x45\xc6\x92\x3f\xe4\
+\x3e\x1c\x61\xde\x3c\x74\xd2\x55\xc3\x5f\x77\xaf\xe6\xc5\xbd\xeb\
+\xfc\x2a\x99\x9c\x6c\x8b\xe6\xd7\xcd\xae\xe4\xe1\xa6\x97\x13\xa1\
+\x9d\x3b\x06\x7c\xb2\x60\x29\x4f\x17\xca\xab\xfd\x39\x1c\x0e\x96\
+\x2e\x5d\x4a\xff\xfe\xd6\xf8\xa7\x45\x18\x52\xb9\x09\xdc\x0d\x97\
+\xd6\xfd\x66\xcd\x36\x06\x0c\x7f\x58\xc9\xbc\x7f\xcf\x26\x57\xd0\
+\x3d\xf5\xdc\xfb\x39\xbc\x86\x97\x3d\x65\x5b\x58\x5f\xb4\xc2\x7f\
+\x81\x00\x80\x6e\xc3\xd6\x7d\x24\xb6\x01\xf7\xa2\xc5\x24\xfb\xef\
+\xba\x2a\xa8\x75\xd5\xcd\xff\xab\xc2\xeb\xc6\xb5\xe0\x76\xa8\x15\
+\x9e\xf0\x32\x80\x56\xc0\xa1\x86\x1e\x14\xcd\x00\x94\x51\xb7\x6c\
+\x40\x68\xe6\xa7\xd2\xe3\xa2\x7b\x52\x53\x3a\xc5\xa7\x09\x5e\x3e\
+\xb8\xf1\x1a\x06\xd3\xf3\xb7\x71\xfd\xea\x8f\x58\x7c\xfc\x80\xdf\
+\x9a\xfc\x74\x34\x6e\x49\xe9\xc1\xfc\x9c\x49\x5c\x9b\xd0\x1e\x9b\
+\x56\x7f\x00\x76\x45\x5c\x2b\x96\x94\xef\xe5\xb0\x4b\x6e\xec\xd0\
+\xeb\xf5\xb2\x68\xd1\x22\x6e\xbc\xf1\x46\x92\x92\x92\xa4\x6c\x59\
+\x58\x04\x15\xae\xa2\xba\xe6\xbf\x06\x92\x77\xa8\x90\xc1\xa3\x7f\
+\xc5\xa9\x72\xf9\x07\x72\xb3\xe8\x16\x5c\x91\x31\x14\xad\x9e\x77\
+\x35\x4d\xd3\x48\x8b\x4a\xa7\x7d\x52\x37\x3c\x86\x9b\x92\xda\x63\
+\xd2\x99\x3f\x9f\x30\x0c\x8c\x82\x1d\x78\x36\x7e\x82\x66\x8f\x40\
+\xcf\xe8\x0c\xe7\xb9\x1f\x35\x26\x0c\xc5\xdb\xff\xbc\x87\x57\x61\
+\xe4\x49\x6d\x76\x5c\x09\xfc\x43\xe4\xa0\xcc\xbf\xf8\x2c\x89\xb3\
+\xbc\x99\xb7\x49\xe6\x78\xd0\xb2\xac\xe8\x20\x3d\x96\xbd\xc3\xe4\
+\xf5\x9f\x52\x54\xeb\xbf\x88\x7b\x60\x5c\x1b\x36\x76\x7c\x80\x77\
+\x5b\x8e\xa3\xa9\xfd\xc2\x52\xb4\x76\x4d\xe7\xfd\x96\xe3\x49\xb0\
+\x45\x4a\x5f\xbb\xb0\xb0\x90\x61\xc3\x86\x05\x7c\x66\xdd\xc2\xc2\
+\x6f\x18\x9e\xba\xda\x7f\x03\x39\x55\x5e\xc5\xf5\x13\x7e\xcf\xb1\
+\xe3\x27\xa5\x5d\x88\xd0\x23\xb9\x32\xf3\xba\x7a\x1f\xfe\x67\x13\
+\x69\x8b\xa2\x4f\xb3\x41\x8c\x6e\x7d\x3b\x2d\x62\xfd\x58\xa3\xaf\
+\x39\x85\x7b\xf1\x0b\x38\xff\x35\x0e\xef\xde\x6f\xfc\x77\x5d\x09\
+\x8c\x0a\xb5\xf2\xea\xde\xfd\x8b\x65\x4d\x08\x3f\x8b\x65\x9a\xf1\
+\x33\xa9\x4b\x39\x08\x65\x11\x74\x4d\x63\xdf\x35\x53\x68\x15\x13\
+\x1e\xf2\x92\xf9\xd5\xa7\xf8\xdd\xf6\xe5\x4c\x3f\xb4\xd5\xaf\xd7\
+\xcd\x8a\x48\xe4\xcf\x19\xd7\x30\x29\x45\x4c\x8e\x79\xda\x89\x0d\
+\xdc\x76\xf0\x43\x25\xbe\x0c\x18\x30\x80\xcf\x3f\xff\x9c\x88\x88\
+\xd0\xe8\x04\xb6\xb0\xa8\x97\x9a\xbd\x50\xdb\xb0\xdd\x1d\x2e\x97\
+\x9b\x61\x37\x3e\xce\x52\x05\x4d\x7f\x00\x57\x66\x0e\x27\x27\xa1\
+\xb3\xd0\xd9\x43\x15\x7b\x59\x73\xec\x4b\xca\x5d\xfe\x0d\xda\xf5\
+\x76\x57\x60\xbf\xe6\x51\xb4\xe4\x46\xba\x50\xca\xe5\xc1\x7b\xe0\
+\x98\x32\x73\x46\x65\x21\xee\x85\xf7\xe0\xa3\x78\xdf\xb9\x70\x53\
+\x97\x89\x17\x72\x4a\x46\x7a\xac\x1c\xb8\x0c\x68\x2b\x72\xd8\x00\
+\x12\x1c\x91\x0c\x6c\x12\xda\xeb\x42\x2b\x3d\x2e\xfe\xb2\xeb\x5b\
+\x26\xac\xfb\x84\x0d\xa5\x6a\xd7\x46\x9e\x8f\x58\x3d\x82\xdf\x36\
+\x1b\xc0\xac\x56\x13\xb9\x38\xa6\xb9\xb0\x9d\xee\xd1\x19\xec\xae\
+\x2d\x66\x6b\x8d\xfc\x97\x3e\x2f\x2f\x8f\x23\x47\x8e\x30\x72\xe4\
+\x48\x69\x5b\x16\x16\x8d\x16\x4f\x25\x54\x37\x4c\xfd\xd4\x30\x0c\
+\xee\xfc\x9f\xe7\xf9\xf8\xd3\x15\x4a\x5c\x68\x9b\xd8\x85\x1e\x69\
+\xfd\x84\xcf\x27\x46\xa4\xd0\x29\xb9\x07\x91\xf6\x68\x8e\x57\x1f\
+\xc1\xeb\xa7\xb1\x41\xe3\xc4\x21\x3c\xeb\x3f\x82\xaa\x52\xf4\xac\
+\x8b\x1a\xdd\xd8\xa0\x71\xaa\x0a\xaa\xd4\x8d\x67\x7b\x77\xcd\xc5\
+\x28\xde\x2e\x63\xe2\x3f\xc0\x9b\xa2\x87\x65\xb5\x47\x3d\x80\xf0\
+\x9c\xd7\xbe\xca\x52\x1e\xcc\xb9\x04\x3d\x04\xb5\xd0\x0d\x60\xfa\
+\xa1\xad\x5c\xbf\xfa\x23\x16\x16\xee\xc3\xed\x27\xe9\x4c\x0d\x8d\
+\x1b\x93\x72\x99\xdf\x66\x32\x23\x93\x3a\x63\x57\x50\x57\x1b\x14\
+\xdf\x96\x39\xa5\x5b\x39\xe1\x91\xdf\x7a\xf5\xfd\xf7\xdf\x63\xb3\
+\xd9\x2c\xe5\x40\x8b\x10\xe5\xb4\xda\x5f\xc3\xd2\xc4\x4f\xfd\xf5\
+\x5d\x5e\x7a\x43\x6a\x07\xfc\x19\x12\x23\x52\xb8\xba\xc5\x0d\xd8\
+\xea\x69\xf0\xf5\x15\x4d\xd3\x68\x1a\x9d\x49\xbb\xc4\xae\xb8\xbc\
+\x4e\x4e\xd4\x1c\x57\xe2\xdf\x05\x31\xbc\x18\x47\xb7\xe2\xfd\x7e\
+\x1e\xd8\x1c\xe8\x99\x5d\xa0\x91\x3c\x23\x8c\xe3\x65\xa0\x6a\xf9\
+\x8f\xe1\xc1\xbb\xf6\x25\x70\x4b\xdd\x57\x7f\x07\x08\x47\x10\xb2\
+\x01\xc0\x5e\xea\x04\x82\x84\xd4\x1f\xca\xdd\x4e\x2e\x49\xce\xa0\
+\x7d\x5c\xf0\x8e\x83\x9c\x8b\x75\x27\x0b\xb8\x71\xed\x3c\x5e\xd9\
+\xbf\x9e\x0a\xb7\xff\x44\x7b\x2e\x89\x69\xc1\xec\xd6\x13\x79\xa4\
+\xe9\x15\x24\xda\xd4\x09\x72\x44\xe9\x76\x06\xc4\xb5\x61\xfa\x89\
+\x8d\xb8\x14\xbc\x09\x7c\xf5\xd5\x57\x64\x64\x64\x70\xf1\xc5\x96\
+\x3c\xb4\x45\x88\xe1\x3c\x52\xb7\xf3\xbf\x01\xbc\x31\x75\x01\x8f\
+\x3d\xe1\xb3\x7e\xcb\x79\x71\xe8\x11\x0c\xc9\x1a\x4f\xac\x43\xdd\
+\x9e\x15\x87\x1e\x41\x76\x5c\x5b\xb2\xe2\x72\x28\xad\x2d\xa1\xd2\
+\x7d\x4a\x99\xed\xf3\xe2\xaa\xc1\xbb\xef\xdb\xc6\x23\x3b\xec\x72\
+\x63\x14\x0b\xcb\xf4\xfe\x0c\xef\xd1\xb5\xb2\xf5\xff\x93\xc0\x2f\
+\xa8\x7b\x11\x17\x42\x36\x00\x70\x53\x57\x02\x10\x2b\x30\x53\x97\
+\x22\xbf\xa9\x85\x58\x9d\xaa\xb1\x71\xb4\xa6\x82\xfb\x36\x2d\xe6\
+\x81\x4d\x4b\xc8\xaf\x56\xf7\x45\xb9\x10\x99\x8e\x04\x9e\x6f\x3e\
+\x8c\xd7\xb2\x47\x91\x1d\x61\x4e\xa7\x7d\x33\x47\x1c\xad\x23\x53\
+\x98\x53\xaa\xa6\x87\x61\xe1\xc2\x85\x64\x65\x65\xd1\xa3\x47\x0f\
+\x25\xf6\x2c\x2c\x02\x8e\xb7\x1a\xaa\xb6\xd1\x90\x7a\xee\x7b\xb3\
+\x96\x70\xf7\x83\xcf\x2b\x93\x7b\xbe\x32\xf3\x3a\x32\x62\xb2\x95\
+\xd8\xfa\x29\x31\xf6\x38\xda\x27\xe5\x92\x14\x99\x46\x71\x4d\x01\
+\x4e\x41\x5d\x83\x06\x53\x51\x8c\x77\xd3\x7c\x8c\x82\x1d\xe8\x59\
+\x17\xa1\x45\x05\x66\x89\x9c\x51\x5a\x05\xd5\xea\xfe\x3f\x7b\x36\
+\x4d\x85\x8a\x86\x05\x8b\x3f\xe1\xff\x80\xf9\x32\x06\x64\x03\x00\
+\xa8\x8b\x42\xee\x10\x3d\xbc\xaf\xb2\x94\x3b\x5b\x76\x23\xc1\x21\
+\xdf\x6d\x1e\x28\xaa\x3d\x6e\xfe\xbe\x77\x2d\xe3\xd7\xce\x63\xdd\
+\x49\xff\x49\x75\x46\xeb\x0e\x1e\x6d\x7a\x05\xb3\x5b\x4d\xe4\xb2\
+\xb8\x96\x3e\x75\xfb\xca\x90\x1b\x9d\x4e\xa9\xa7\x86\x35\x55\x6a\
+\x84\x89\x16\x2e\x5c\x48\xc7\x8e\x1d\xe9\xd2\xa5\x8b\x12\x7b\x16\
+\x16\x81\xc3\x80\xaa\x2d\x75\x41\x80\x8f\xcc\x5b\xb8\x92\x9b\xef\
+\xfe\x0b\x1e\x45\x29\xe5\xdc\x94\x4b\xe9\x92\xd2\x4b\x89\xad\xf3\
+\x91\x1c\x99\x46\x87\xa4\x8b\x70\xe8\x91\x14\xd5\x14\xf8\xb7\x3f\
+\x60\xe3\xc7\xe0\xac\x44\x6f\x9e\x0b\x36\x87\x5f\xae\x7b\xe6\xfa\
+\x45\xea\xd2\xff\x46\x75\x31\xde\x0d\xff\x42\xa2\xf9\x0f\xe0\x7e\
+\xe0\x88\x8c\x01\x15\x01\x40\x3e\x70\x13\x20\xa4\xf6\xe0\xc5\x20\
+\x39\x22\x9a\xfe\x69\x59\x0a\x5c\xf1\x3f\x0b\x0a\xf7\x32\xe2\xdb\
+\x8f\xf8\xe8\xe8\x4e\xbf\x2e\xf3\x19\x9e\xd8\x91\x4f\x73\x6e\xe3\
+\xc6\xa4\x5c\x22\x75\xff\x09\xb4\x5c\x1d\xdf\x96\xe5\x15\x07\x38\
+\xe8\x94\xef\x0e\x36\x0c\x83\xf9\xf3\xe7\xd3\xb3\x67\x4f\xda\xb7\
+\x6f\xaf\xc0\x3b\x0b\x8b\x00\x51\x7b\x08\x9c\xbe\x37\xf9\x2e\x59\
+\xb6\x9e\x31\xb7\x3e\xa9\x64\xd1\x0f\x40\x46\x4c\x36\x57\x64\x0c\
+\x43\xf3\x53\xad\x5c\xd7\x6c\x34\x8b\x69\x41\xdb\xc4\x2e\xd4\x7a\
+\xaa\x39\x51\xab\x70\x31\xce\xf9\xf0\xba\x31\xf2\x37\xe1\xdd\xb2\
+\x10\xa2\x93\xd0\x9b\xb5\xc3\x2f\xb2\xc3\x4e\x37\x46\x89\xba\xac\
+\xae\xb1\x67\x3e\xc6\xf1\xcd\x32\x26\xb6\x03\xbf\x95\xf5\x43\xd5\
+\xbf\xdc\x2f\x11\xd8\x43\x7c\x9a\x56\x31\x89\xec\xbd\x66\x0a\xb6\
+\x46\xd2\xe8\xe1\x0b\x1b\x4b\x8f\xf1\xd0\x96\xa5\x2c\x2f\xf6\xaf\
+\x4c\x6f\xf7\xe8\x0c\x5e\x6a\x31\x82\xfe\x71\x81\x5b\xa5\x5c\xe8\
+\x2a\xe7\xe2\x5d\xaf\x72\xd4\xa5\xa6\x16\x18\x1d\x1d\xcd\xc2\x85\
+\x0b\x19\x38\x70\xa0\x12\x7b\x16\x16\x7e\xc5\x5b\x09\xe5\xdf\x51\
+\x27\xc7\x7e\x61\x96\xad\xf8\x9e\xeb\x6e\x7c\x9c\xea\x1a\x35\xe9\
+\xe4\x58\x47\x3c\x23\x5b\x4d\x26\xca\x16\xa3\xc4\x9e\x08\x45\xd5\
+\x05\xac\x3e\xbe\x94\xa2\x6a\xff\x65\x40\x01\xf4\xe6\x5d\xb1\x5d\
+\xf3\x4b\xf4\xe6\x5d\x4d\xbd\x8e\x51\x7c\x0a\xe3\x44\x85\x22\x63\
+\x5e\xdc\x0b\x7f\x81\x51\x25\xd5\x54\xf9\x30\x82\xcb\x7f\xce\x46\
+\x45\x06\x00\x60\x37\xf0\x20\x20\xf4\x2a\x5a\xea\xaa\xe5\xa2\xc4\
+\xe0\xd8\x0c\x58\xe2\xac\xe6\xf1\x6d\x5f\x73\xf7\xc6\xcf\xc8\xab\
+\x92\xdb\x92\xd7\x10\x52\xed\x31\x3c\x93\x79\x2d\x6f\x65\x8f\xa1\
+\x75\x64\x60\x9b\x26\xe3\x6c\x91\x0c\x8c\xcb\x61\xc6\xc9\xef\x71\
+\x2a\x48\xff\xb9\xdd\x6e\x66\xce\x9c\x49\xb7\x6e\xdd\xe8\xd0\xa1\
+\x83\x02\x0f\x2d\x2c\xfc\x84\xe1\x85\xaa\x4d\x75\x8a\x7f\x3e\xf0\
+\xd9\x92\xb5\x8c\xbc\xe9\xf7\xca\x1e\xfe\xa7\x9b\xfe\xe2\x4d\xea\
+\xfd\xf1\x95\x58\x47\x3c\xed\x93\xba\x91\xe0\x48\xe2\x78\xcd\x51\
+\xdc\x5e\xff\x34\x3f\x1b\xe5\xc7\xf1\x6e\x9a\x0f\x27\xf3\xd1\xb2\
+\x2e\x42\x8b\x88\x36\xe7\x3a\xc7\x4a\xc1\xab\xa6\x4f\xc3\x7b\x78\
+\x15\xde\x03\x52\xcd\x7f\xb5\xc0\x6d\x80\xf4\x26\x39\x55\x01\x40\
+\x15\xd0\x05\x10\x0e\xc3\xf2\xaa\xca\xb8\xbb\x55\x77\x45\xee\xa8\
+\xc7\xe5\xf5\xf2\xea\xfe\xf5\x8c\x5e\x33\x97\xe5\xc5\xf9\xfe\x58\
+\x96\x09\xd4\xc9\xf4\xfe\x4f\x93\xbe\xcc\x6b\x73\x2b\x57\xc6\xb5\
+\x69\x34\x23\x93\x19\x8e\x78\x7a\xc4\x64\x32\xab\x74\x33\x5e\x05\
+\xff\x1a\x1e\x8f\x87\xb9\x73\xe7\xd2\xa9\x53\x27\x3a\x77\x0e\x8d\
+\xa6\x50\x8b\x30\xa0\x66\x97\xcf\xbb\xfe\x17\x2c\xfa\x96\xb1\x93\
+\xff\x48\x8d\x22\x15\x39\x0d\x8d\x81\xcd\x47\x92\x1e\xd3\x38\xca\
+\xa7\x1a\x1a\x29\x51\x4d\xe9\x98\xd4\x1d\x9b\x66\xa3\xa8\xfa\xa8\
+\x7f\xd6\x0a\x63\x60\x1c\xdf\x83\x67\xc3\x1c\xf0\xb8\xd0\x5b\xe4\
+\x82\xae\xea\xd1\x06\x46\x55\x2d\x94\xca\xa9\xa3\x9e\x8d\xe7\xbb\
+\x57\xa0\x5a\x4a\x89\x71\x26\xf0\xbe\x0a\x5f\xd4\xfd\x2b\xc1\x09\
+\x60\xb2\xe8\xe1\x23\x35\x15\x5c\xd3\xac\x35\x59\xd1\x09\x0a\x5d\
+\x52\xc3\xd2\xe3\x79\x8c\x5e\x33\x87\xe9\x87\xfc\x2f\xd3\x3b\xaf\
+\xcd\xad\x4c\x4a\xe9\x49\x94\x1f\xeb\xfc\xbe\xd2\x2e\x32\x8d\x0c\
+\x47\x02\x0b\xca\x76\x28\xb1\x77\x3a\x08\xc8\xce\xce\xa6\x7b\xf7\
+\xc6\x1b\x0c\x5a\x58\x00\xe0\x3a\x0e\x35\xbe\xc9\xaf\xcf\xf8\xf0\
+\x0b\x6e\xba\xf3\x4f\x38\x9d\x6a\x6a\xfe\x00\x7d\x9b\x0d\xa6\x6d\
+\x62\xe3\x6b\xa0\xb5\x69\x36\x32\x62\xb2\xfd\x2f\x3b\xec\x71\xfd\
+\x20\x3b\xbc\x04\x2d\x2e\x55\x9d\xec\x70\x49\x05\xd4\xaa\xc9\x68\
+\x18\x45\xdb\xf0\x6e\x97\xda\xa2\x0f\x75\xcd\x7f\x0d\x17\x99\x38\
+\x07\x2a\x03\x80\x3c\x60\x3c\xd0\x44\xd4\x40\xa9\xab\x96\xf1\x2d\
+\x3a\x29\x73\x48\x96\xdd\x3f\xc8\xf4\xfe\x61\xc7\x0a\xbf\xee\xed\
+\x6f\x1f\xf9\xff\xdb\xbb\xef\xf0\x38\xaa\xab\xf1\xe3\xdf\xdd\x95\
+\x56\xbd\x4b\x96\xe4\x5e\x70\xc1\xb8\x01\x06\xc7\x0d\x6c\x70\xc1\
+\xa6\x19\xb0\x21\x84\x12\x08\x10\x42\x02\xc4\x21\x24\x21\x6f\x7e\
+\x49\x20\x6f\x42\x5e\x12\x48\x02\x21\x09\x10\x5a\x62\x8a\x83\xe9\
+\x18\x42\xb3\xc1\x0d\x6c\xe3\xde\x6d\x55\xab\x4b\x2b\x69\x55\xb6\
+\xef\xce\xcc\xef\x8f\x91\xc1\x36\xb6\x2c\xed\xdc\xad\xba\x9f\xe7\
+\xd9\x47\x8e\xcb\x99\xf3\x04\x69\xe7\xec\x9d\x7b\xcf\xc9\xe7\xf9\
+\x21\x4b\xf8\x6d\xff\x79\x3d\xea\xdb\x1f\x49\x67\xa7\x0e\xc0\xa1\
+\xfa\xf8\xdc\xd9\xeb\x41\x54\x27\x74\x64\x63\x60\x6e\x6e\xae\x1c\
+\x23\x2c\x45\x2f\xd5\xad\xef\xfa\xef\xc1\x73\xff\x27\x9f\x7b\x87\
+\x5b\xef\xfa\xa3\xb0\xdd\xfe\x00\x13\xf2\xbe\xc1\xc4\xbc\x6f\x08\
+\x8b\x17\x0a\x47\xc6\x0e\x17\xa6\x0c\xa4\xc5\xdb\x18\xc6\xb1\xc3\
+\xed\xfa\xd8\xe1\xea\x1d\x98\x8b\x0d\x8e\x1d\xd6\x34\x7d\xf9\x5f\
+\xd0\x42\x86\xba\xfd\x29\xb4\x4e\x43\x1b\xf7\x0f\x00\x3f\x13\x93\
+\x8d\xd8\x02\x00\x20\x11\x7d\x4a\x60\x50\x0e\x3a\x5a\xf9\xd6\xc0\
+\x33\xc8\x0b\xd1\x73\x9c\x9e\x6a\xf3\x7b\xb8\xff\xc0\x7a\x6e\xdc\
+\xba\x92\x03\x9d\x61\xaa\x5e\x81\x6c\x4b\x32\xf7\x17\xcf\xe1\x5f\
+\x43\x97\x30\x36\xb9\x5f\xd8\xae\x6b\xd4\xdc\xcc\xd3\x84\xb5\x0b\
+\x3e\xe2\xfd\xf7\xdf\x47\xd3\x34\xce\x3f\xff\xfc\xb0\xed\x6c\x96\
+\xa4\x9e\x51\xf5\x31\xbf\x6a\xf7\xdd\xfe\x34\x4d\xe3\x81\x87\xfe\
+\xcd\x4f\x7f\xf5\xa4\xb0\x73\xfe\x00\xc3\x32\x46\x33\xad\x68\x5e\
+\xc8\x8f\xfd\x8a\x92\x61\xcd\x66\x74\xf6\x44\xd2\x12\x33\xb0\xb9\
+\xeb\x08\x68\xe2\x56\x41\xba\xa3\xb5\xd5\xea\xc7\x06\x3b\x6d\x98\
+\x06\x8c\xc7\x94\xd8\xfb\xe6\x68\x5a\xa7\x07\x3a\x8d\x77\x40\xd5\
+\x63\xd5\xa2\xec\x08\xba\x6b\xef\x11\xbf\x01\x36\x09\x48\x07\x10\
+\x5f\x00\xec\x05\x7e\x00\x04\x75\xa8\x5f\x03\x14\x34\x2e\x2e\x1a\
+\x21\x34\xa9\x9e\x8a\xf4\x98\xde\x77\x46\x7c\x9b\xf9\x99\xa3\x84\
+\xb4\xef\x0d\x27\x13\x26\x16\x66\x8e\xe6\x33\xe7\x61\x2a\x7d\xc6\
+\xa7\x98\x1d\xb1\x66\xcd\x1a\x0e\x1f\x3e\xcc\xc5\x17\x5f\x8c\xc5\
+\x22\xfa\x5b\x55\x92\x82\xe4\x3e\xf5\x73\x7f\x9f\x2f\xc0\x2d\x77\
+\xfe\x91\xc7\x9e\x78\x5d\xe8\xa5\xfb\xa7\x0d\xe1\x82\x01\x8b\x30\
+\xc7\xda\x7b\xc4\x97\x63\x87\x27\xa2\x68\x01\x9a\x3d\x61\x9a\x8b\
+\x72\x64\xec\xf0\x8e\x37\x83\x1b\x3b\x6c\xeb\x00\xbf\x98\xc7\xbe\
+\xea\xee\x65\x68\xf6\xde\x4f\x88\x3c\x4a\x27\xfa\x63\x76\x61\xdd\
+\x88\x42\x51\x42\x3e\x8e\x5e\x04\x04\x25\xd5\x92\xc8\xe1\x8b\xbe\
+\x4f\x7e\x98\x57\x01\x3e\x6d\xae\x62\xe9\xae\x8f\xd9\xd9\x1e\xa6\
+\x7e\xd7\x5d\x66\xa5\x0f\xe7\x2f\x03\x2f\x61\x62\x4a\x71\x58\xaf\
+\x1b\x0a\x2e\xd5\xcf\x45\x65\xcf\xb2\xce\x51\x29\x34\xee\x05\x17\
+\x5c\xc0\x6b\xaf\xbd\x46\x76\x76\x64\x77\x3a\x4b\x12\xde\x2a\xf0\
+\x94\x75\xfb\x57\xec\x6d\x9d\x5c\x75\xc3\xaf\xf9\x64\xdd\x0e\xa1\
+\x97\xee\x97\xd2\x9f\xf9\x83\xae\x26\xd1\x1c\x5d\x03\x72\x82\xd1\
+\xe6\x6b\x61\x53\xe3\x6a\x6a\x9d\x15\x61\xbd\xae\x29\x6f\x28\x09\
+\xf3\xee\xc1\x3c\x62\xda\xa9\xff\xb2\x4f\x41\xad\x6c\x42\xc8\xfa\
+\xbf\xb7\x1d\xff\xca\x5b\x40\x31\xb4\x01\xf4\x51\x60\xa9\xf1\x64\
+\xbe\x12\x8a\x02\x60\x24\xfa\x73\x8a\xa0\x4b\xd4\xdf\x9c\x3e\x93\
+\x5f\x8e\x09\x7e\x92\x55\x6f\x44\x7a\x4c\xef\x0d\xb9\x67\xc6\xcc\
+\x52\x5e\x4f\xb4\x2b\x1e\x2e\x2c\x7d\x9a\xad\x2e\x43\xcf\xb9\xbe\
+\x66\xec\xd8\xb1\xbc\xf7\xde\x7b\x0c\x19\x12\xdf\xd3\x23\xa5\x28\
+\x16\x68\x05\xe7\x2e\xba\xbb\x21\x54\x56\x35\xb0\x70\xc9\xcf\xd9\
+\x7f\x50\xc8\x1e\xad\x2f\xe5\x26\xf7\x63\xc1\xa0\x6f\x92\x24\x70\
+\xc6\x47\x34\x88\xec\xd8\xe1\x7b\x31\xe5\x9c\x7c\x52\xaa\xc8\xb3\
+\xff\xca\x9e\x97\x50\xf7\x2d\x37\x12\x42\x03\xc6\xa0\x1f\xb9\x17\
+\x26\x54\x77\x9e\x0f\x80\x79\xc1\xfe\xe3\x7e\x49\xa9\x54\xce\xff\
+\x3e\x29\x96\xd0\xed\x7c\x77\x29\x7e\xfe\x70\x68\x13\x0f\x95\x6c\
+\xc4\xa3\x84\xe7\x99\x14\x40\xaa\x39\x91\x9f\xf4\x3b\x8f\xfb\x0a\
+\x67\x45\xe5\xce\x7e\x11\x6c\x01\x27\xb3\x4a\x9e\x62\x9f\xe0\xe9\
+\x61\x45\x45\x45\xac\x58\xb1\x82\x19\x33\x66\x08\x8d\x2b\x49\xa7\
+\xa4\xba\xc0\xb1\x15\xba\x79\x7e\xbd\xf6\xb3\x5d\x5c\x7d\xd3\x03\
+\x34\x36\x89\x7b\x0c\x06\x7a\xeb\xdd\x05\x83\xaf\x25\xd9\x12\xd9\
+\xbd\x51\xa1\xa2\x6a\x0a\xfb\xdb\x76\xb0\xcd\xb6\x0e\xbf\x2a\xe6\
+\x88\x64\x8f\x58\x12\xb1\x9c\x75\x15\x09\xb3\xee\x80\xa4\xb4\x63\
+\xff\x4c\xd3\xd0\xca\x1b\xd1\x44\x6c\xdc\x54\xbc\xfa\xa7\x7f\xaf\
+\xa1\xc6\x69\x2b\x81\x4b\x8d\x27\x73\xac\x50\x3d\x58\xb5\x03\xdf\
+\x0a\xf6\x1f\x3b\x15\x3f\x43\x52\x33\x39\x3b\x5b\xfc\xf4\x27\x0d\
+\x78\xb5\xf6\x00\x97\x6f\x7c\x8d\xb7\xeb\x4b\x22\x30\xa6\xf7\x46\
+\x61\x63\x7a\xa3\x55\x9a\xd9\xca\xe2\x9c\xf1\xbc\xd3\x7e\x80\x16\
+\x81\x3b\x7f\x1d\x0e\x07\xcb\x96\x2d\x23\x29\x29\x49\x16\x01\x52\
+\xf8\x68\x7e\x70\xee\xe8\xb6\xd9\xcf\x53\xcf\xaf\xe4\x9b\xdf\xf9\
+\x5f\x3a\x3a\xc5\xee\x74\xcf\xb4\xe6\xb0\x60\xf0\x37\x49\x49\x48\
+\x3b\xf5\x5f\x8e\x51\x26\x93\x39\xb2\x63\x87\x77\xad\x04\x6b\x2a\
+\xe6\xa2\xd1\x5f\x8d\x1d\x76\x78\xd0\x3a\xc4\x6c\xfe\x53\x2b\x3e\
+\x42\xab\xde\x60\x34\xcc\x5d\x40\xf7\xcf\x9e\x82\x10\xaa\x15\x00\
+\x13\xfa\x86\xc0\xa0\xcf\xf4\x8d\x4e\xcf\x65\xef\x9c\xdb\x84\xb6\
+\x07\xde\x62\x6f\x60\xe9\xee\x8f\xd9\xd0\x52\x23\x2c\x66\x4f\x4c\
+\x4e\x1d\xc8\x5f\x06\x5e\xc2\xf4\xb4\xbe\xb5\x7c\x7d\xd8\xd7\xc6\
+\x85\xa5\x4f\x53\xe6\x15\x7f\x92\xe2\xba\xeb\xae\xe3\xa9\xa7\x9e\
+\x22\x35\x35\x72\xed\x4f\xa5\x3e\x40\x53\xf4\x1d\xff\xca\x89\xbb\
+\x7e\x3a\x5d\x1e\x6e\xbd\xeb\x61\x96\xbf\xb6\x5a\xf8\xa5\x33\xad\
+\x39\x5c\x34\xe8\x1a\xd2\x13\xa3\xaf\x37\x4a\x28\x35\x7b\x1a\xd8\
+\xd4\xb8\x8a\x46\xb7\xd8\xc7\x88\xa7\x62\x2a\x1e\x4b\xc2\xbc\x1f\
+\x63\x1e\x34\x11\xad\xa6\x45\x6f\x00\x64\x94\xa6\x10\xf8\xef\xf7\
+\xd1\x1c\x86\x5a\x24\xef\x06\x26\x22\xec\x30\xe2\x57\x42\xb9\xb5\
+\xda\x03\x5c\x16\xec\x3f\x6e\xf1\xb9\x39\x2d\x2d\x87\x89\x59\xc6\
+\x8f\xc3\xd5\x79\x1c\xdc\xbb\x7b\x35\xdf\xdf\xf9\x01\x55\xae\x30\
+\xcd\xb2\x46\xef\x96\xf7\xc8\x80\x8b\xf9\xc7\xe0\x45\x0c\x89\x70\
+\xab\xce\x48\xc8\xb6\x24\x73\x75\xf6\x78\x3e\xec\x2c\xa1\x29\x20\
+\xa8\x8f\x76\x97\xdd\xbb\x77\xb3\x72\xe5\x4a\xe6\xcd\x9b\x47\x6e\
+\x6e\x64\x5b\x23\x4b\xf1\xaa\x6b\xc2\x9f\x72\xe2\xe7\xd3\xa5\xe5\
+\xb5\xcc\x5b\xf4\x53\x56\xaf\xdd\x26\xfc\xca\xd9\xd6\x3c\x16\x0c\
+\xfe\x26\x69\x89\x91\x19\x7d\x1b\x49\xfa\xd8\xe1\x09\x11\x18\x3b\
+\x6c\x43\xdd\xf9\x0e\x5a\x63\x19\xa4\x0c\xc5\x94\x68\xfc\xc3\x85\
+\x5a\xb9\x1a\xb5\x72\x95\xd1\x30\x3f\x01\x76\x1a\x4e\xe6\x04\x42\
+\xb9\xfb\x2c\x09\x28\x07\xfa\x07\x1b\x60\x68\x6a\x16\x07\xe7\x7e\
+\x17\x6b\x90\x6d\x1d\x7d\xaa\xc2\x3f\x2a\xb6\xf3\xab\x7d\xeb\xe8\
+\x08\x84\xe9\x9b\x08\xb0\x9a\x2c\x7c\x2f\x7f\x0a\xff\x5b\x3c\x8f\
+\x4c\x4b\xec\x8e\x39\x16\xc5\x16\x70\x32\xbf\xf4\x59\xb6\xbb\x0d\
+\xcd\xbe\x3e\xa1\xec\xec\x6c\x9e\x7c\xf2\x49\xae\xbe\xfa\x6a\xe1\
+\xb1\xa5\x3e\xce\xbd\xff\xa4\x13\xfe\x5e\x7e\x75\x35\x77\xdc\xf3\
+\x67\xda\x3b\xc4\xb5\x88\x3d\x22\x3f\xb9\x88\x79\x83\x96\xc4\xed\
+\x33\xff\xde\x08\xa8\x7e\x76\xb7\x6e\x66\x57\xcb\x26\x94\x30\xf5\
+\x0f\x00\xc0\x92\x84\x79\xcc\x95\x58\xc6\x5c\x05\x96\x20\x4f\x5d\
+\xa8\x0a\x81\xff\xde\x81\xe6\x34\x74\xe4\xb1\x06\x18\x01\x84\x64\
+\x73\x44\x28\x57\x00\x14\xc0\x0a\xcc\x09\x36\x40\x9b\xdf\xcb\x90\
+\xd4\x2c\xce\x0a\x62\x2f\xc0\x91\x31\xbd\x2f\xd7\xec\x0b\x6b\xfb\
+\xde\x4b\xb2\xc6\xb0\x72\xf8\x4d\x7c\x2b\x77\x52\x58\xc7\xf4\x46\
+\xb3\x34\xb3\x95\x6b\x72\x26\xb2\xce\x51\x49\xb5\x5f\xec\x00\x25\
+\x8f\xc7\xc3\xab\xaf\xbe\xca\xbe\x7d\xfb\x98\x3b\x77\x2e\xc9\xc9\
+\xf1\xb5\x4b\x5a\x8a\x10\x4f\x29\xf8\xbe\x5e\xb0\x76\x74\xba\xb8\
+\xfb\x67\x7f\xe5\x7f\x7e\xf3\x34\x5e\x41\xed\x61\x8f\x56\x98\x32\
+\x90\xf9\x83\x97\xc4\xdd\x6e\xff\x60\x99\xbb\xda\x0a\x8f\xcc\x1a\
+\x87\x57\x0d\xe3\xd8\x61\x4d\x41\xb3\xed\x41\xab\x5c\x0d\x49\x19\
+\x98\xb2\x87\xd2\xdb\xcf\xcb\x6a\xf9\x07\xa8\x87\x3f\x35\x9a\xc9\
+\x03\xc0\x7a\xa3\x41\x4e\x26\xd4\xe7\xcf\x32\x81\x2a\x20\x2b\xd8\
+\x00\x83\x53\x33\x39\x34\xf7\x76\x92\x7a\xb8\x0a\xb0\xbf\xb3\x85\
+\x1f\xed\xfe\x98\x0f\x1a\xc3\x7b\xbe\xf4\xf4\xe4\x7e\xfc\x69\xc0\
+\xc5\x5c\x94\x29\xe7\xda\x9f\x8c\x53\xf5\xb1\xa8\x7c\x19\x1f\x77\
+\x1a\x6a\x86\x71\x52\x43\x87\x0e\x65\xd9\xb2\x65\x72\x83\xa0\x64\
+\x8c\xa7\x02\xbc\x95\x5f\xfb\xed\x4d\x5b\xf6\x73\xfd\x77\x1f\xa4\
+\xb4\x3c\x34\xcf\xa6\x8b\x53\x07\x33\x67\xe0\x95\x71\x71\xce\x3f\
+\x54\xea\x5d\x55\x6c\x6a\x5c\x4d\xab\x37\xbc\xfd\x5a\x4c\xfd\xc6\
+\x63\x99\x74\x2b\xa6\xec\x1e\x8e\x61\x57\x7c\x04\xde\xfb\x1e\x9a\
+\xbb\xd9\xc8\x65\x3b\x80\xc1\x40\xc8\xc6\xce\x86\xba\xbd\x9a\x17\
+\x7d\x36\xc0\xd4\x60\x03\xb4\xfb\xbd\x14\x25\xa7\x73\x6e\x4e\xf7\
+\x8d\x72\x5a\x7d\x1e\xee\xdb\xfb\x29\x37\x6f\x7b\x97\x12\x87\xd8\
+\x63\x38\xdd\xc9\xb5\xa4\xf2\xfb\x01\xf3\x79\x7e\xf0\x62\x46\x25\
+\x47\xff\x38\xe3\x48\xb2\x9a\x2c\x2c\xc9\x1e\xcf\x41\xaf\x4d\xf8\
+\x11\x41\x80\xb6\xb6\x36\x96\x2d\x5b\x06\xc0\xf4\xe9\xd3\x31\x9b\
+\xe3\xf7\xa4\x85\x14\x22\x27\xb8\xf9\x07\x02\x0a\xbf\xf9\xc3\x32\
+\x6e\xfe\xfe\x43\x34\xb7\x84\xe6\xbd\x78\x78\xe6\xe9\x5c\x30\x60\
+\x11\x09\xe6\xc4\x90\xc4\x8f\x17\x19\x89\x59\x8c\xce\x99\x48\x66\
+\x62\x36\x8d\xee\x5a\x02\x5a\x78\xc6\x0e\xe3\x6c\x42\x2d\xff\x00\
+\x1c\x0d\x98\x0b\xc6\x42\x42\xf7\x2b\x34\x6a\xd9\x7b\xa8\xd5\x86\
+\x3f\xb8\xff\x05\x78\xd7\x68\x90\xee\x84\xa3\x03\x4d\x11\xfa\x5e\
+\x80\xa0\x1f\x68\x15\x27\xa7\x53\x3a\xef\x76\x52\x2d\x5f\xff\xe1\
+\x08\x68\x2a\xcf\x1e\xde\xc5\x2f\xf6\xae\xa1\xd9\x27\xe6\xd8\x46\
+\x4f\x24\x98\xcc\x7c\x27\x6f\x32\xbf\x2b\x9e\x47\x7e\x1c\x1f\xd1\
+\x09\x05\x0d\x8d\x07\xea\x57\xf1\x40\x83\xe1\xcd\x31\x27\x35\x61\
+\xc2\x04\x9e\x7e\xfa\x69\xce\x39\xe7\x9c\x90\x5d\x43\x8a\x33\x27\
+\xb8\xf9\xef\xdc\x53\xc6\xad\x77\x3d\xcc\x96\xed\x07\x43\x76\xd9\
+\xb1\x39\x67\x33\xa5\xf0\x82\xb8\x6a\x08\x16\x0e\x3e\xc5\xcb\xae\
+\xd6\x8d\xec\x69\xdd\x82\xaa\x85\xef\x31\x2f\x89\x69\x58\x4e\x5f\
+\x8c\x79\xd4\x65\x70\xa2\x82\x4d\xf1\x11\x78\xef\xbb\x68\xee\x9e\
+\x8d\x89\x3e\x09\x17\x30\x0c\x08\xe9\x52\x47\x38\x1a\xac\x3b\x80\
+\x62\xe0\xdc\xa0\x03\x04\x7c\xe4\x5b\x53\x99\x9a\x7b\x6c\xd7\x26\
+\x7d\x4c\xef\xeb\x3c\x7b\x78\x17\xae\x30\x36\xf3\xb9\x30\x63\x04\
+\x6f\x0e\xbf\x91\x5b\xf2\x26\x93\x2a\x97\xeb\x7a\xcd\x84\x89\x59\
+\x19\xc3\x19\x64\xcd\xe6\xbf\x1d\x87\x50\x43\x30\x33\xbc\xb1\xb1\
+\x91\xe7\x9e\x7b\x8e\x96\x96\x16\xce\x3b\xef\x3c\xac\x56\xf9\xdf\
+\x49\xea\xc6\x71\x37\x7f\xb7\xc7\xcb\xef\x1e\x7e\x91\x1b\x6f\xff\
+\x3d\x35\xb5\xa1\x79\xee\x6c\xc2\xc4\xb4\xa2\xb9\x4c\xca\x9f\x26\
+\x6f\xfe\x41\xb0\x98\x13\xe8\x9f\x36\x94\x61\x99\x63\x70\xf8\xdb\
+\xe9\x10\x38\x87\xa4\x5b\xaa\x1f\xad\x71\x27\x5a\xf5\x06\x4c\x69\
+\x85\x98\x32\x8e\xbd\x2f\xa9\x87\xde\x42\xad\xfd\xdc\xe8\x55\x1e\
+\x07\xc4\x0e\x92\x38\x81\x70\x7d\xd7\x0d\x02\x4a\xd1\x37\x05\x06\
+\x25\xdf\x9a\x42\xf9\xfc\x3b\xc8\x48\xb0\x52\xe2\xb0\xf3\x8b\x7d\
+\x6b\x58\x51\x7b\x40\x5c\x86\x3d\x30\x32\x29\x9f\xdf\xf5\x9f\xc7\
+\x92\xec\xf1\x61\xbd\x6e\x3c\xfb\xb0\xb3\x84\x25\x15\x2f\xd2\xa1\
+\x84\xee\x94\xc6\xf0\xe1\xc3\x79\xf2\xc9\x27\x99\x33\x27\xe8\xfd\
+\xa8\x52\x3c\xf3\x94\xe9\x3d\xfe\xbb\xac\xfd\x6c\x17\xb7\xdd\xfd\
+\x30\x87\x4a\x43\xd7\x2f\x24\xd1\x6c\x65\x56\xff\x4b\x19\x94\x1e\
+\x99\xc1\x67\xf1\xa8\xce\x79\x98\x4d\x4d\xab\xb0\x7b\x0d\x3d\x77\
+\xef\x35\x53\xe1\x44\x2c\x93\x6e\xc3\x94\x35\x18\x02\x1e\xfc\xef\
+\xde\x06\x5e\x43\x8f\x8a\xbc\xe8\x3b\xff\x43\xde\x08\x21\x9c\x65\
+\xe7\x53\xc0\x6d\x46\x02\xfc\xe6\xf4\x99\x28\x9a\xc6\xff\x1d\xfa\
+\x3c\xac\x3b\xfb\xd3\xcd\x56\x7e\xdc\x6f\x26\x3f\x2f\x9a\x45\x92\
+\x49\xee\xec\x17\x6d\xbb\xbb\x8e\x4b\xcb\xfe\x45\xad\x3f\x74\x3d\
+\x1a\x4c\x26\x13\xd7\x5c\x73\x0d\x7f\xfa\xd3\x9f\x28\x2e\x8e\xfd\
+\xc1\x4b\x92\x08\x9a\x3e\xd9\xcf\xa7\x37\x69\xa9\x6b\x68\x61\xe9\
+\x7d\x7f\xe3\xd5\xb7\xd6\x08\x1d\xdf\x7b\xbc\xb4\xc4\x0c\xe6\x0e\
+\x5c\x4c\x6e\x52\x41\xc8\xae\xd1\x57\xa9\x9a\xca\xfe\xb6\xed\x6c\
+\xb7\xad\x0f\x5f\xff\x00\x00\xb3\x05\xf3\x88\x85\x98\x12\x52\x50\
+\xf6\xbf\x62\x34\xda\xdf\x80\x3b\x05\x64\x75\x4a\xe1\x2c\x00\x86\
+\xa1\x0f\x32\x08\xfa\x0e\x6a\x36\x99\x50\xc3\x34\xa2\x17\xf4\x31\
+\xbd\xd7\xe5\x4e\xe2\x8f\x03\x16\x52\x98\x90\x1e\xb6\xeb\xf6\x45\
+\xb6\x80\x93\x6b\x2b\x5f\x66\x55\xa7\xf0\x6e\x97\xc7\x30\x9b\xcd\
+\x2c\x5a\xb4\x88\x17\x5e\x78\x81\x94\x14\x79\xce\xba\xcf\xd2\x14\
+\x70\xed\xa7\xd5\xe6\x3e\x00\x00\x20\x00\x49\x44\x41\x54\x85\x40\
+\x0b\x5e\xaf\x9f\xdb\xee\x7e\x98\x97\x56\xac\x42\x51\x43\xdb\x1a\
+\xbc\x28\x75\x10\xb3\xfb\x5f\x16\xd7\xad\x7d\xa3\x81\x57\x71\xb3\
+\xbd\xf9\x33\xf6\xdb\xb7\xa1\x85\xe0\x11\xe3\xc9\x99\x30\xd8\xb0\
+\xcf\x87\x3e\x50\xaf\xea\x54\x7f\x51\x84\x70\x0e\x59\x6f\x03\x86\
+\x00\x67\x05\x1b\x20\x9c\xff\x19\xa7\xa4\x0d\xe2\xd5\x61\xd7\x71\
+\x57\xc1\x34\xd2\xe5\x73\xfe\x90\x4b\x33\x5b\xf9\x56\xce\x24\x7c\
+\x9a\xc2\x06\xa7\xd8\x49\x6a\x47\xd3\x34\x8d\xfd\xfb\xf7\xf3\xa7\
+\x3f\xfd\x89\xfc\xfc\x7c\x26\x4f\x9e\x1c\xb2\x6b\x49\x51\x4a\x0b\
+\xe8\x53\xfd\x14\x3b\xff\x79\xfd\x13\xa6\xcd\xbb\x93\xad\x3b\x0e\
+\x85\xf4\x53\x3f\xc0\xe8\xec\x89\xcc\xee\x7f\x19\x56\xd9\x1c\x2c\
+\xe4\x12\xcc\x89\x0c\x4c\x1f\xce\xe0\xf4\xd3\x68\xf7\xb5\xe2\x08\
+\xe1\xea\xa2\x60\x4f\x01\x2f\x85\xeb\x62\xe1\xde\x79\x32\x18\x7d\
+\x15\x20\x6a\x7f\x02\x06\x26\x66\xf1\xbb\xfe\xf1\x37\xa6\x37\x96\
+\xbc\x6c\xdf\xc9\x6d\x55\xaf\xe3\x0c\xc3\x64\xb0\xd9\xb3\x67\xf3\
+\xd0\x43\x0f\xc9\xd3\x02\x7d\x85\xea\x02\xe7\x6e\x36\x7f\xb1\x8d\
+\x9f\xfe\xea\x49\xd6\x6c\x08\x49\x87\xd5\x63\x24\x9a\xad\xcc\x28\
+\x5e\xc0\xb0\x8c\xd1\x21\xbf\x96\x74\x62\xfa\xd8\xe1\x55\x74\x0a\
+\x6e\x44\x26\x98\x07\xfd\xd3\x7f\xd8\x86\xd5\x44\xe2\x0e\xf7\x28\
+\x70\x77\x04\xae\xdb\xad\x54\x73\x22\xf7\x15\xce\xe2\xde\x7e\x33\
+\x49\x91\x67\x71\x23\xee\x80\xc7\xc6\x95\x15\x2f\xb0\x3f\x4c\x93\
+\xc1\xe6\xcc\x99\xc3\x43\x0f\x3d\xc4\x59\x67\x05\xbd\x40\x25\x45\
+\xbb\x40\x2b\x7b\xb6\xac\xe4\x37\x0f\x3d\xcb\xab\x6f\xad\x0d\xf9\
+\x27\x7e\x80\x2c\x6b\x2e\x17\x0c\x58\x44\x4e\x92\xec\x11\x12\x69\
+\x8a\x16\x60\x77\xcb\x66\x76\xb5\x6e\x22\xa0\x86\xa9\x7f\x40\xef\
+\x3c\x02\xdc\x1b\xce\x0b\x46\xa2\x00\x28\x40\x1f\x6b\x18\x15\x53\
+\x2e\x4c\x98\xb8\x36\x67\x22\x0f\x0d\xb8\x88\x81\x89\x41\x37\x2c\
+\x94\x42\xa0\x5d\xf1\xf0\xbd\xea\x37\x59\x6e\x0f\xfd\xa7\x34\xd0\
+\x37\x0a\x2e\x5e\xbc\x98\xfb\xef\xbf\x9f\xb1\x63\xc7\x86\xe5\x9a\
+\x52\x78\xec\xdd\xb1\x9a\x5f\xff\xfa\x01\x5e\x7f\x67\x5d\x58\x6e\
+\xfc\x00\xa7\x65\x9d\xc1\xd4\xc2\xb9\xb2\xb3\x5f\x94\x71\x06\x3a\
+\xd9\xd2\xb4\x86\xb2\x8e\x7d\x91\x4e\xe5\x68\x0e\xf4\x9d\xff\x61\
+\x6d\x71\x18\xce\x3d\x00\x47\xb8\xd0\x5b\x04\x47\xbc\x5f\xeb\xe4\
+\xd4\x81\xac\x18\xf6\x2d\x96\xf6\x9b\x4e\xa6\xec\xbd\x1d\x75\x92\
+\xcd\x09\x2c\xce\x1e\xc7\x88\xa4\x3c\x56\x39\x4a\xf1\x86\xa1\xd9\
+\xc7\xbe\x7d\xfb\x78\xe2\x89\x27\x28\x29\x29\x61\xc4\x88\x11\x14\
+\x15\xf5\x7e\x0e\x85\x14\x3d\x76\x6c\xdf\xc6\x3d\x4b\x6f\xe5\xce\
+\xa5\xbf\x62\xdf\x81\xd0\xed\x2d\x39\x9a\xd5\x9c\xc4\xcc\xe2\x85\
+\x4c\xca\x9f\x86\xc5\x14\x89\xb7\x58\xa9\x3b\x56\x73\x12\x43\x33\
+\x46\x91\x94\x3a\x84\x16\x6f\x13\x81\x80\xf8\x81\x4e\x41\x78\x08\
+\x58\x19\xee\x8b\x46\xea\x21\x77\x0e\xfa\x2a\x40\x4e\x24\x2e\x5e\
+\x94\x98\xc1\x83\xc5\xf3\xf9\x76\xde\x59\x98\xe5\x73\xfe\x98\x70\
+\xd8\xd7\xc6\x0d\x87\xff\xc3\x3a\x47\x65\x58\xaf\x3b\x7d\xfa\x74\
+\x7e\xf6\xb3\x9f\x71\xc9\x25\x97\x60\x32\xc9\xef\x95\x58\xb1\x7e\
+\xfd\x7a\x1e\xfa\xbf\x07\x79\xf7\xbd\xf7\xc3\xf6\x89\x1f\xa0\x5f\
+\x4a\x7f\xce\xef\x7f\x09\x19\x89\x7d\x6f\xfc\x77\x2c\x51\x81\x9d\
+\x8a\x9f\x00\x2a\xf6\x8e\x7d\x34\x34\x7f\x46\x40\x89\x58\x21\xd0\
+\x8a\xfe\xe9\xff\xc4\x73\xa7\x43\x28\x92\xef\x68\x3f\x01\xfe\x10\
+\xce\x0b\x26\x9a\x2c\xdc\x21\xc7\xf4\xc6\x2c\x45\x53\x79\xb8\x69\
+\x1d\xbf\xac\xff\x08\x7f\x38\x5b\x7f\x02\xe3\xc7\x8f\xe7\xce\x3b\
+\xef\xe4\xc6\x1b\x6f\x94\x13\x07\xa3\x94\xcf\xe7\x63\xf9\xf2\xe5\
+\x3c\xfc\xf0\xc3\xec\xde\xbd\x3b\xac\xd7\x36\x9b\xcc\x4c\xcc\x9b\
+\x2a\xbb\xfa\xc5\x88\x06\x55\xa1\xfa\xa8\xf7\x10\x55\xf5\x63\xb3\
+\x6f\xc5\x66\xdf\x82\x16\xce\xb1\xc3\xba\x1f\xa1\xf7\xfd\x0f\xbb\
+\x48\x7e\xa7\x5a\x81\xfd\xc0\xf0\x70\x5c\x6c\x51\xd6\x58\x1e\x1e\
+\xb0\x90\x11\x49\x79\xe1\xb8\x9c\x14\x42\x1b\x9d\x55\xdc\x52\xf5\
+\x5a\x48\x06\x0a\x9d\x4a\x71\x71\x31\x37\xdd\x74\x13\xb7\xdc\x72\
+\x0b\x23\x46\xc8\x2e\x6e\xd1\xa0\xac\xac\x8c\x67\x9e\x79\x86\xe7\
+\x9f\x7f\x9e\xfa\xfa\xfa\xb0\x5f\x3f\x27\x29\x9f\x19\xc5\x0b\x28\
+\x48\x96\x0d\xa6\x62\x81\xaa\x69\xec\x54\xfd\x9c\xe8\x36\xef\xf3\
+\xb7\x53\xdf\xbc\x96\x0e\x47\x68\xfb\x91\x1c\xa5\x02\x38\x1d\xbd\
+\xfb\x5f\xd8\x45\xba\x54\xbd\x0e\x78\x21\x94\x17\x18\x97\x5c\xc8\
+\x9f\x07\x5e\xc2\x9c\x8c\xd3\x42\x79\x19\x29\xcc\xfc\x9a\xc2\xef\
+\x1b\x3f\xe5\xfe\xfa\x8f\xc3\xda\x1f\xe2\x68\x67\x9f\x7d\x36\xdf\
+\xfd\xee\x77\xb9\xfe\xfa\xeb\x49\x4d\x4d\x8d\x50\x16\x7d\x93\xd7\
+\xeb\xe5\xed\xb7\xdf\xe6\xa9\xa7\x9e\x62\xd5\xaa\x55\x61\x5d\xe6\
+\x3f\xda\x19\xb9\x93\x99\x5c\x70\xbe\x7c\xd6\x1f\x43\x1a\x34\x85\
+\xea\x53\x74\x92\x75\xb8\xaa\xa8\xb7\xad\xc1\xe3\x6b\x09\x75\x3a\
+\xd7\x00\x86\x5b\x07\x06\x2b\xd2\x05\x80\x19\xd8\x0c\x9c\x2d\x3a\
+\x70\x8e\x25\x85\x5f\x17\x5f\xc8\x0f\xf2\xa7\x92\x60\x92\x63\x61\
+\xe3\xd1\x4f\x6a\xdf\xe3\xe1\xa6\x75\x91\x4e\x83\xfc\xfc\x7c\xae\
+\xbb\xee\x3a\xbe\xf9\xcd\x6f\x32\x65\xca\x14\xb9\x57\x20\x44\x34\
+\x4d\x63\xe3\xc6\x8d\x2c\x5f\xbe\x9c\x17\x5f\x7c\x91\x96\x96\x90\
+\xbf\x39\x9f\xd2\xf8\xdc\x73\x39\xa7\xdf\xac\x48\xa7\x21\xf5\x90\
+\x0a\xec\x52\xfc\xf8\x7b\xf4\xb1\x41\xc3\xde\x71\x80\x86\xe6\xb5\
+\x04\x94\x90\x4c\x9a\xdd\x04\x4c\x25\xbc\x3d\xee\x8e\x11\x0d\xef\
+\x54\xe7\x03\x9f\x8a\x0a\x96\x60\x32\xf3\xbd\xfc\x29\x3c\x50\x3c\
+\x87\x5c\x8b\xfc\x54\x16\xaf\xca\xbc\x2d\x9c\xb1\xff\x2f\x78\xc3\
+\xff\xbc\xae\x5b\x83\x06\x0d\xe2\x8a\x2b\xae\x60\xc9\x92\x25\x4c\
+\x9f\x3e\x5d\x16\x03\x02\xec\xdd\xbb\x97\x15\x2b\x56\xf0\xe2\x8b\
+\x2f\x52\x5a\x5a\x1a\xe9\x74\x8e\x61\x36\x59\xb8\x62\xd8\xcd\x64\
+\x59\x73\x23\x9d\x8a\xd4\x03\x8d\x9a\x42\x55\x2f\xe7\xc8\x28\x8a\
+\x87\xc6\xd6\xcf\x69\x6d\xdf\x8d\xa6\x09\x6d\x15\x3d\x13\x58\x2f\
+\x32\x60\x6f\x45\xcb\xbb\xd3\x66\xc0\x70\x2b\xb6\x59\xe9\xc3\x79\
+\x7c\xd0\x65\x9c\x91\x5c\x28\x20\x25\x29\x9a\x5d\x56\xfe\x6f\xde\
+\x69\xdf\x1f\xe9\x34\xba\x75\xda\x69\xa7\x71\xf5\xd5\x57\x73\xf1\
+\xc5\x17\x33\x65\xca\x14\x2c\x16\xb9\x4c\xdc\x13\x8a\xa2\xb0\x71\
+\xe3\x46\xde\x7d\xf7\x5d\x5e\x79\xe5\x15\xca\xca\xc2\xf6\x3c\x36\
+\x28\x83\xd3\x4f\x63\xce\xc0\x2b\x23\x9d\x86\x74\x0a\xfa\xa7\x7f\
+\x1f\xc1\xb6\x00\xf2\xf8\x5a\xa8\x6b\xfa\x04\xa7\x5b\x48\xa3\xbe\
+\xcf\x81\x69\x22\x02\x19\x11\x2d\x05\xc0\x18\x60\x1f\x06\xf3\xb9\
+\x39\xef\x6c\x9e\x1d\xbc\x58\x4c\x46\x52\xd4\x5a\xd5\x59\xc6\x9c\
+\xd2\xa7\x23\x9d\x46\xaf\xa4\xa7\xa7\x33\x6b\xd6\x2c\x2e\xbd\xf4\
+\x52\x16\x2e\x5c\xc8\xc0\x81\x03\x23\x9d\x52\x54\xb1\xd9\x6c\x7c\
+\xfa\xe9\xa7\xbc\xf3\xce\x3b\xac\x5c\xb9\x12\xbb\x3d\x4c\xb3\xdd\
+\x05\x99\x37\x68\x09\x03\xd3\x86\x45\x3a\x0d\xa9\x1b\xf5\xaa\x42\
+\x8d\xc1\xd3\x43\xd5\x0d\xef\xd3\xd6\x69\x78\x0c\xbd\x06\x8c\x06\
+\x4a\x8c\x06\x32\x2a\x5a\x0a\x00\xd0\x37\x42\x2c\x31\x1a\xe4\x83\
+\xd3\xbe\xc3\xbc\x8c\x91\x02\xd2\x91\xa2\x51\x40\x53\x39\xf3\xc0\
+\x63\xec\xf1\x34\x46\x3a\x95\xa0\x99\x4c\x26\x26\x4d\x9a\xc4\xec\
+\xd9\xb3\x99\x31\x63\x06\xd3\xa6\x4d\xa3\xb0\xb0\x6f\xad\x5a\x35\
+\x36\x36\xb2\x61\xc3\x06\xd6\xaf\x5f\xcf\x27\x9f\x7c\xc2\xce\x9d\
+\x3b\x23\xb6\x91\x4f\x84\x6c\x6b\x1e\x8b\x86\xdd\x8c\x59\xee\x37\
+\x8a\x4a\x01\xf4\x4f\xff\x46\x6e\xff\x9d\xae\x4a\x2a\x6b\xdf\x14\
+\x91\xce\x2b\xe8\x9b\xff\x22\x2e\x9a\x0a\x80\x54\xa0\x0e\x30\xd4\
+\x8f\x77\xa8\x35\x87\xdd\xa7\x2f\x95\x13\xfc\xe2\xd4\xa3\xb6\x0d\
+\x2c\xad\x09\x7b\xc3\xac\x90\x1b\x39\x72\x24\xd3\xa7\x4f\x67\xc6\
+\x8c\x19\x4c\x99\x32\x85\x31\x63\xc6\x90\x90\x10\xf4\xe4\xec\xa8\
+\x12\x08\x04\x38\x70\xe0\x00\x1b\x37\x6e\x64\xfd\xfa\xf5\x7c\xf6\
+\xd9\x67\x94\x94\x44\xfc\xc3\x8f\x70\xdf\x28\xbc\x90\xb1\x39\xc2\
+\xf7\x33\x4b\x02\x54\xa9\x01\x1a\x0d\x3c\xbf\x57\xb5\x00\x25\x87\
+\x97\xe1\x33\x3e\x4c\xa8\x1d\x18\x00\x44\x45\xfb\xc1\x68\x2a\x00\
+\x00\xbe\x05\xbc\x68\x34\xc8\xbd\xfd\x66\xf2\xc7\x01\x0b\x05\xa4\
+\x23\x45\x93\x56\xc5\xc5\xa8\x7d\x8f\xd0\x12\x70\x45\x3a\x95\x90\
+\xb3\x5a\xad\x9c\x71\xc6\x19\x8c\x1f\x3f\x9e\xf1\xe3\xc7\x33\x61\
+\xc2\x04\xc6\x8f\x1f\x4f\x71\x71\x74\x9f\x35\xaf\xaf\xaf\x67\xf7\
+\xee\xdd\xec\xdc\xb9\x93\xdd\xbb\x77\xb3\x7b\xf7\x6e\xf6\xed\xdb\
+\x87\xcf\x17\xfa\xc9\x8e\x91\x96\x64\x49\xe6\xaa\xe1\xb7\x91\x6c\
+\x49\x89\x74\x2a\xd2\x51\xbc\x68\xec\x56\x7a\xb6\xef\xff\x64\xea\
+\x6d\x6b\x68\x6e\xdb\x2e\x22\x9d\xab\x81\x15\x22\x02\x89\x10\x6d\
+\x05\x80\x09\xfd\x44\xc0\x79\x46\x82\x58\x4c\x66\x36\x8e\xba\x83\
+\xc9\xa9\xf2\x39\x6b\x3c\xf9\x41\xf5\x5b\xfc\xbd\x79\xa3\xa1\x18\
+\x13\xd3\x06\x33\x32\xb9\x90\xb7\x5a\xb7\x85\xbd\x9b\xa0\x08\xe9\
+\xe9\xe9\x0c\x1b\x36\x8c\xa1\x43\x87\x32\x6c\xd8\xb0\x2f\x5f\x43\
+\x86\x0c\xa1\xa0\xa0\x80\xbc\xbc\xbc\x90\x75\x2a\x74\xbb\xdd\xb4\
+\xb4\xb4\x60\xb3\xd9\xa8\xaa\xaa\xa2\xa2\xa2\xe2\x98\x57\x65\x65\
+\x25\x0e\x87\x23\x24\xd7\x0e\xa5\x04\x93\x85\xe9\x39\x67\x52\xe7\
+\x6d\xa2\xc4\x59\x65\x28\xd6\xe9\x39\x67\x31\xb5\x70\x8e\xa0\xcc\
+\x24\x11\xca\xd4\x00\xad\x06\x3e\xfd\xbb\x3c\x0d\x94\x57\xff\x07\
+\xcd\xf8\x69\xbd\x4f\x80\x0b\x8c\x06\x11\x29\xda\x0a\x00\x80\x33\
+\x80\xed\x80\xa1\x99\xbc\x13\x52\x8a\xd8\x32\xfa\x4e\x12\x65\x83\
+\x8e\xb8\xb0\xcf\xd3\xc4\xc4\x03\x8f\x12\x30\xf0\x83\x6c\x36\x99\
+\x79\x71\xe4\xf7\x38\x2d\xb9\x90\x7a\x5f\x1b\x4f\x37\xad\xe1\x5d\
+\xfb\x0e\x14\xb1\x47\x7b\x22\x2e\x2d\x2d\x8d\xbc\xbc\x3c\xf2\xf2\
+\xf2\x28\x28\x28\x20\x2b\x2b\x0b\x8b\xc5\x42\x66\x66\x26\x00\x16\
+\x8b\x85\xfa\xfa\x7a\x3a\x3a\x3a\x00\xc8\xcc\xcc\xa4\xb8\xb8\x18\
+\x45\xd1\x0b\xa2\x8e\x8e\x0e\x14\x45\xa1\xbd\xbd\x1d\x9b\xcd\x46\
+\x4b\x4b\x0b\x2d\x2d\x2d\x38\x9d\x51\xb1\x6a\x29\x8c\xc5\x64\xe6\
+\x1b\xd9\x13\x59\x50\x30\x83\xdc\xc4\x2c\xea\xbd\xcd\xfc\xae\xec\
+\x29\x54\x03\xdf\x0f\x26\x4c\x5c\x3e\xec\x26\x72\x93\x0a\x04\x66\
+\x2a\x05\xcb\xa1\x69\xec\x37\x30\xfa\x57\xd3\x54\x4a\xab\x5f\xc6\
+\xe3\xb5\x19\x4d\xc5\x07\x4c\x42\xef\x7e\x1b\x35\xa2\xb1\x00\x00\
+\xf8\x3d\x70\x9f\xe1\x20\xfd\xe7\x73\x5f\xe1\x2c\xe3\xd9\x48\x11\
+\x37\xbf\xf4\x59\x3e\xec\x34\xf6\xdc\x78\x49\xde\xb9\xfc\x74\xc0\
+\xc5\xc7\xfc\x5e\xb3\xbf\x93\xd7\x5b\xb7\xb0\xbc\x79\x23\x9d\x8a\
+\xc7\x50\x7c\x29\x36\x24\x9b\xad\x4c\xcd\x99\xc8\x85\x79\xdf\x20\
+\xf7\xb8\x11\xe0\xcb\xeb\xdf\x67\x6d\xeb\x16\x43\xf1\x8b\x53\x87\
+\xb0\x60\x70\x54\xec\xf1\xea\xf3\x0e\x28\x7e\x3a\x0d\x7c\x72\x6f\
+\x6a\xdd\x44\x63\xcb\xe7\x22\x52\xf9\x2d\xf0\x4b\x11\x81\x44\x8a\
+\xd6\x02\x20\x15\xd8\x0b\x0c\x35\x12\x24\xd9\x9c\xc0\x8e\x31\x77\
+\x33\x5a\x56\xe3\x31\xed\xf5\xb6\xbd\x5c\x55\x61\xac\x63\x74\xa6\
+\x25\x85\xd7\x46\xdf\x4d\x76\xc2\x89\x9b\x43\xb9\x54\x2f\x6f\xb7\
+\x6e\xe7\x05\xdb\x67\x34\x1a\xdf\xe8\x23\x45\xa1\xcc\x84\x74\x66\
+\xe6\x9c\xc5\xec\xbc\x73\x49\x3d\xc9\xf8\x6f\xa7\xe2\xe6\xfe\x92\
+\xbf\xe3\x34\xd8\xf9\xed\xc2\x01\x57\x30\x44\x9e\x46\x8a\x28\xbb\
+\xa6\x52\xaa\x06\xdf\x28\xcc\xeb\x6b\xa5\xa4\xea\x45\x34\xe3\x8f\
+\x0a\xcb\x81\x71\x40\x48\xda\x09\x1a\x11\xad\xeb\xe3\x7e\xe0\x20\
+\x70\xbd\x91\x20\x01\x4d\xe5\x73\x67\x15\x37\xe5\x9d\x8d\x45\x1e\
+\xcf\x89\x49\x3e\x4d\xe1\xca\x8a\x17\x68\x55\x8c\x6d\xfc\xbb\xab\
+\x78\x1e\x93\xd3\x4f\x7e\x4e\x3b\xd1\x94\xc0\xb8\xd4\x81\x2c\xc9\
+\x3f\x97\x81\x49\xb9\xd4\xf9\xec\xb4\x46\xc7\x9c\x70\xc9\xa0\x81\
+\xc9\x85\x5c\x51\x78\x21\x37\x0c\xb8\x94\xd1\xe9\x43\x49\x34\x9f\
+\xfc\x74\x85\xd5\x9c\x48\xa2\x29\x91\x7d\x06\x87\xc1\x34\x7b\x1a\
+\x18\x93\x33\x51\x1e\x0b\x8c\x10\x0d\x28\xd1\x02\x41\x1f\xfb\xd3\
+\x34\x95\xca\xfa\xb7\xf0\x07\x3a\x45\xa4\x73\x03\x7a\x9f\x9b\xa8\
+\x13\xad\x05\x00\x40\x29\x30\x01\x7d\x52\x52\xd0\xea\xfd\x9d\x04\
+\x34\x55\x0e\x03\x8a\x51\x7f\x68\x5a\xcb\x8a\x36\x63\xa3\x5d\x87\
+\x25\x15\xf0\xcb\x41\x97\xf7\xe8\xcd\xd8\x62\x32\x33\x2a\xa5\x88\
+\xab\xf2\xce\x61\x66\xe6\x68\xc0\x44\x95\xb7\x39\x26\x37\x0c\xf6\
+\x65\x89\xa6\x04\x26\x65\x8e\x66\x49\xf1\x7c\x16\x15\x5e\xc8\xc0\
+\xe4\x42\xcc\x3d\x6c\xcb\x3c\x24\xa5\x98\x1d\x9d\x07\xe9\x34\x50\
+\x00\xfa\x54\x0f\x89\xe6\x44\x0a\xe5\x46\xe4\x88\x68\xd2\x54\x43\
+\x1b\xff\x1a\x5a\xd6\xd3\xe1\x10\x72\x54\x75\x05\xf0\xa0\x88\x40\
+\xa1\x10\xad\x8f\x00\x8e\x28\x42\xaf\x9c\x72\x8c\x04\x31\x63\xe2\
+\xa3\xd3\x6e\xe1\x82\x0c\x39\xbe\x35\x96\x34\x06\x1c\x8c\xda\xf7\
+\x30\x1d\x8a\xb1\x49\x99\x8f\x0d\xbb\x81\xa9\x06\x0a\x40\xa7\xe2\
+\xe5\xc3\xf6\xdd\xbc\xd1\xb2\x95\xfd\xee\x3a\x43\xb9\x48\xa1\x55\
+\x9c\x94\xcf\x94\xec\x09\x4c\xcf\x39\x93\x34\x03\xc7\xf1\x0e\x3a\
+\x2b\x78\xb4\xd2\xd8\x89\xe4\x44\xb3\x95\xab\x86\xdf\x4a\x6a\x42\
+\xba\xa1\x38\x52\xef\x04\xba\x8e\xfd\x05\xbb\xf8\xef\x74\xd7\x50\
+\x5e\xf3\x1a\x02\x66\xf4\xb4\x02\x63\x81\xa8\xed\x5a\x16\xcd\x2b\
+\x00\x00\x0e\xc0\x06\x5c\x6e\x24\x88\x06\xac\xee\x2c\xe3\xa6\xbc\
+\xb3\x48\x31\x1b\x3a\x5c\x20\x85\xd1\x9d\xd5\x6f\xb1\xd9\x65\xac\
+\xef\xf6\x79\x99\xa3\xb9\xa5\xf0\x7c\x43\x31\xac\xe6\x04\x4e\x4f\
+\xe9\xcf\x15\x79\x93\x99\x99\x39\x9a\x04\x93\x85\x06\x7f\x1b\x6e\
+\x03\xbb\x8b\x25\x71\x32\x13\xd2\x98\x9a\x3d\x89\x6b\xfb\x2f\xe4\
+\xd2\x7e\xb3\x18\x91\x3a\x08\xab\xc1\x9f\xf3\x7c\x6b\x0e\x55\x9e\
+\x7a\x9a\x7c\xad\x41\xc7\x50\x35\x05\xaf\xe2\x96\x7b\x01\xc2\xac\
+\x4a\x53\x71\x04\xd9\x55\x52\x51\xbd\x54\xd4\xbe\x81\xaa\x1a\xfb\
+\xd0\xd1\xe5\x7b\xc0\x67\x22\x02\x85\x4a\xb4\xaf\x00\x1c\xf1\x3e\
+\x30\xdf\x68\x90\xab\xb2\xc7\xf1\xea\xb0\xeb\x04\xa4\x23\x85\xda\
+\x56\x57\x2d\xe7\x1e\xfc\x1b\xaa\x81\x2a\x3c\xd1\x64\x61\xf9\xa8\
+\x1f\x30\x38\x29\x4f\x60\x66\x3a\x15\x8d\x5d\xce\x6a\x56\xb5\xef\
+\xe5\xc3\xb6\x3d\xb4\x06\x62\xef\xfc\x7b\x2c\x4b\xb5\x24\x33\x3e\
+\x63\x24\x67\x65\x8e\xe5\x8c\xf4\x11\x21\x79\xd6\x6e\xf3\xd9\xf9\
+\xdf\xd2\x27\x08\x18\x7c\xfc\x73\xe9\xd0\x1b\x28\x48\x8e\xee\x06\
+\x4e\xf1\xc2\x81\xca\x7e\x25\xf8\x8d\x7f\x55\xf5\xef\xd1\xee\x38\
+\x24\x22\x95\x55\xc0\x5c\x22\x38\xea\xb7\x27\xa2\x7d\x05\xe0\x88\
+\x75\xc0\x2d\x40\x92\x91\x20\xfb\x3d\x4d\x0c\x4b\xca\x65\x52\x8a\
+\xfc\x61\x8c\x66\x1a\x1a\xd7\x54\xbe\xcc\x61\x5f\x9b\xa1\x38\xd7\
+\x17\x4c\x67\x5e\xf6\x38\x41\x59\x1d\xcb\x84\x89\x22\x6b\x16\xd3\
+\x32\x46\x72\x6d\xfe\x37\x98\x98\x36\x18\x8b\xc9\x42\x83\xbf\x3d\
+\xea\x46\x14\xc7\x8b\x34\x4b\x0a\xe7\x64\x8f\xe3\xf2\xc2\xd9\x5c\
+\x5b\xbc\x90\x33\x33\x4f\xa7\x30\x29\x2f\x64\x23\x97\xd3\x2c\x29\
+\x78\x54\x1f\xe5\x06\x57\xa1\xda\xbc\xcd\x8c\xca\x9e\x20\x28\x2b\
+\xe9\x64\x34\xa0\x54\x09\x04\x3d\xed\xaf\xb5\x7d\x0f\x36\xfb\x17\
+\x22\x52\x71\x02\x0b\x81\xa8\x9f\x68\x15\x2b\x2b\x00\x00\x77\x01\
+\x8f\x19\x0d\x92\x61\x4e\x62\xfb\x98\xbb\x18\x11\x82\x4f\x85\x92\
+\x18\x2f\xb4\x6e\xe7\x86\xc3\xaf\x18\x8a\x91\x9b\x90\xc6\x6b\xa3\
+\xef\x26\xfd\x24\xc7\xbd\x42\x45\xd5\x54\x0e\x7a\x1a\xd8\xec\x28\
+\x67\x5d\xc7\x41\x76\x3b\xab\x0d\xad\x62\xf4\x75\xc5\x49\xf9\x8c\
+\xcf\x18\xc5\x98\xf4\x61\x8c\x4c\x1d\x12\xf6\xd3\x3c\x1e\xd5\xc7\
+\x03\x25\x7f\xa7\xdd\xe0\x0a\xcf\xf9\xfd\x2f\x61\x44\xe6\x58\x41\
+\x59\x49\x27\x62\x64\xda\x9f\xd7\x67\xa7\xb4\xfa\x25\x54\x31\x8f\
+\xf5\xee\x04\xfe\x26\x22\x50\xa8\xc5\x52\x01\x60\x06\x3e\x06\x66\
+\x1b\x0d\x34\x39\x75\x20\x9f\x8d\xfa\x9e\xec\x12\x18\x85\x5c\xaa\
+\x9f\xd3\xf7\xff\x89\x2a\x83\x9f\xfe\x7f\x39\xf0\x72\x2e\xcb\x3d\
+\x4b\x50\x56\xc1\x6b\x0d\x38\xf8\xbc\xb3\x94\xcf\x3a\x4b\xf9\xc2\
+\x51\x8e\x5d\x1e\x2d\xec\x56\x46\x42\x1a\x63\xd2\x86\x31\x36\x7d\
+\x04\x63\xd3\x87\x93\x91\x90\x16\xe9\x94\xf8\xcc\xbe\x83\x17\xea\
+\x8c\x0d\xa0\x4a\x4d\x48\x67\xf1\xf0\xdb\x48\x90\x7b\x90\x42\xc2\
+\xab\x69\xec\x55\x03\x28\x41\x14\xdb\x9a\xa6\x52\x5e\xf3\x0a\x2e\
+\x4f\x83\x88\x54\xd6\x01\xb3\x80\x98\x68\x2f\x1a\x4b\x05\x00\xe8\
+\x8d\x81\x76\x02\x99\x46\x03\xfd\xaa\xe8\x42\x1e\x28\x96\x3d\xbb\
+\xa3\xcd\x2f\xeb\x3f\xe2\xb7\x0d\xab\x0d\xc5\x18\x9d\x52\xcc\xbf\
+\x47\xde\x8e\x39\x0a\xbf\xbd\x6b\x7d\x76\x76\x38\x0f\x73\xc0\x5d\
+\xcf\x4e\x67\x15\x07\xdc\xf5\x22\x7a\x8c\xc7\xac\x7c\x6b\x0e\x23\
+\x52\x07\x32\x22\x75\x10\x23\x52\x07\x51\x94\x54\x10\x75\xff\xd5\
+\x34\x34\xfe\x50\xfe\x1c\x87\x0d\x9e\x00\x99\x94\x3f\x8d\xb3\xf2\
+\x67\x08\xca\x4a\x3a\x5a\x89\x1a\xa0\x2d\xc8\x63\x7f\x0d\xcd\xeb\
+\xb1\xd9\x8d\x75\x7f\xec\xd2\x0e\x4c\x04\x0e\x8b\x08\x16\x0e\xd1\
+\xf6\xb3\xd6\x13\xdf\x01\x9e\x31\x1a\xc4\x62\x32\xf3\xfe\x88\x9b\
+\x65\x7f\x80\x28\x52\xed\x6b\x67\xcc\xfe\x47\x70\x19\x5c\x86\x7b\
+\x6a\xc4\x77\x38\x33\x6d\x88\xa0\xac\x42\xcb\x1e\x70\xb2\xcb\x55\
+\xcd\x1e\x57\x0d\x25\xee\x06\x4a\x3d\x4d\x71\xdb\x89\x30\x27\x31\
+\x93\x01\x49\xfd\x18\x90\x5c\xc8\xb0\xd4\x01\x0c\x4f\x1d\x48\xba\
+\xe5\xc4\x9d\x19\xa3\x4d\xb9\xab\x86\x47\x2a\x9e\x37\x54\xaa\x59\
+\x4c\x09\x5c\x35\xfc\x16\xd2\x13\x0d\x4d\x3c\x97\x8e\xd3\xaa\xa9\
+\x94\x05\xd9\xf1\xaf\xd3\x55\x49\x65\xed\x5b\x08\xda\xab\x77\x13\
+\xf0\x2f\x11\x81\xc2\x25\x16\x0b\x00\x80\xd7\x80\x2b\x8d\x06\xc9\
+\xb5\xa4\xb2\x65\xcc\x9d\x0c\xb3\x1a\x6a\x33\x20\x09\xb2\xa4\xe2\
+\x45\x5e\x6d\xdb\x63\x28\xc6\xfc\xec\xf1\xfc\x76\xf0\x62\x41\x19\
+\x45\x46\x87\xe2\xa6\xd4\xd3\x48\xa9\xa7\x91\x12\x77\x23\x65\x9e\
+\x26\x6a\x7d\xad\x31\xd3\x99\x30\x33\x21\x8d\x7c\x6b\x0e\xfd\x93\
+\xfa\x31\x20\x59\x7f\xf5\x4f\xea\x77\xd2\xf6\xbb\xb1\xe2\xd9\x9a\
+\x37\xd8\xd2\xbe\xd7\x50\x8c\x61\x19\xa3\x99\x3d\xc0\xd0\xa9\x66\
+\xe9\x28\xaa\xa6\xb1\x5b\x0d\xe0\x0b\xe2\x06\xee\xf7\x77\x50\x5a\
+\xfd\x32\x01\x83\x6d\x9f\xbb\xbc\x05\x2c\x12\x11\x28\x9c\x62\xb5\
+\x00\x28\x00\xf6\x00\xfd\x8c\x06\x9a\x94\x52\xcc\x67\xa3\xee\x90\
+\xfd\x01\x22\x6c\x83\xf3\x30\x33\x0f\x3d\x69\x68\x39\x3c\xc9\x9c\
+\xc8\x8a\x51\x77\x52\x6c\xcd\x16\x98\x59\xf4\xf0\xa8\x7e\xea\x7c\
+\x76\x6a\x7d\x6d\xd4\xfb\xed\xd4\xf9\xda\xa8\xf3\xd9\x69\xf6\x3b\
+\x68\x57\x5c\xb4\x05\x5c\x74\x88\x79\x33\x3b\xa9\x34\x4b\x0a\x69\
+\x96\x14\xd2\x13\x52\xc9\x4c\x48\x27\x3f\x31\x9b\x5c\x6b\x16\xf9\
+\x89\x39\xe4\x59\xb3\xc8\x4b\xcc\x36\x7c\x06\x3f\x5a\xb5\xf9\x3b\
+\xb8\xbf\xf4\x1f\xf8\x0c\xae\x50\x2d\x1c\x7c\x2d\x45\xa9\x83\x04\
+\x65\xd5\xb7\x55\xab\x0a\x0d\x41\x6c\xfc\xd3\xb4\x00\x65\xd5\xaf\
+\xe0\xf6\x36\x89\x48\xc3\x06\x8c\x27\x8a\x1b\xfe\x9c\x4c\xac\x16\
+\x00\xa0\x57\x5b\x6f\x88\x08\x74\x4b\xde\x64\x9e\x1e\x7c\x95\x88\
+\x50\x52\x10\x54\x34\xce\x3d\xf8\x37\xb6\xba\x6a\x0d\xc5\xf9\x6e\
+\xe1\x6c\x6e\xeb\xe3\xd3\x1f\x55\x34\xda\x02\x2e\xda\x15\x17\xed\
+\x01\x37\x2b\x5a\x36\xf1\x61\x90\xab\x2a\x93\xb3\xce\xe0\xfc\xdc\
+\xc9\xfa\x0d\xdf\x92\x4a\x5a\x42\x0a\xa6\x98\x7e\xcb\x30\xee\xdd\
+\xa6\xb5\xbc\x6b\x5b\x6b\x28\x46\x6e\x72\x3f\x2e\x1f\xfa\xed\x3e\
+\xff\xff\xa5\x51\x2e\x4d\x63\x9f\xea\x0f\xea\x23\x43\x4d\xe3\x07\
+\xd8\x3b\x84\x4c\xe6\xd5\x80\xcb\x00\x63\xbb\x44\x23\x24\x96\x27\
+\x55\xbc\x09\x3c\x21\x22\xd0\x33\x2d\x5b\x78\xaa\x79\xb3\x88\x50\
+\x52\x10\xfe\xd9\xbc\xd9\xf0\xcd\xbf\x5f\x62\x26\xd7\x17\x4c\x13\
+\x94\x51\xec\x32\x63\x22\x37\x21\x8d\x61\x49\x05\x4c\x4a\x1b\xcc\
+\x90\xa4\xfc\xa0\x63\x15\x5a\xf3\xba\x36\xe6\xe5\x93\x9e\x90\x2a\
+\x6f\x58\xc0\xbc\xfc\x69\x5f\x1b\x21\xdc\x5b\xad\x9e\x26\x0e\xb5\
+\xed\x12\x94\x51\xdf\xa4\x02\x15\x6a\x20\xa8\x9b\x7f\x4b\xdb\x4e\
+\x51\x37\x7f\x80\xc7\x89\xd1\x9b\x3f\xc4\x76\x01\x00\xf0\x23\x40\
+\xc8\x4f\xd2\x9d\x35\x6f\xb3\xc1\x19\x33\x9b\x37\xe3\x46\x87\xe2\
+\xe5\xfe\x86\x55\x86\xe3\xfc\xb0\x78\x1e\x29\x66\xab\x80\x8c\x24\
+\xe9\xe4\x12\xcd\x09\x2c\x2a\xbc\xc0\x70\x9c\xad\xb6\x75\xf8\x0c\
+\xce\xb8\xe8\xcb\x6a\x35\x05\x57\x10\xb7\x7f\x97\xa7\x9e\xfa\x66\
+\x63\x2b\x38\x47\xd9\x03\xfc\x4c\x54\xb0\x48\x88\xf5\x02\xc0\x03\
+\x7c\x0b\x01\x73\x96\xfd\x9a\xc2\xb5\x95\x2f\xd3\x24\x5b\xba\x86\
+\xd5\xfd\x0d\x1f\xd3\xe0\x37\x36\x72\x73\x42\xea\x20\xe6\x86\xa8\
+\xe3\x9f\x24\x1d\x6f\x72\xd6\x19\x9c\x96\x3a\xd8\x50\x0c\x8f\xe2\
+\x62\x47\x4b\x54\xb7\x89\x8f\x5a\x0e\x4d\xa5\x41\xed\xfd\x73\xff\
+\x80\xe2\xa2\xaa\xfe\x5d\x34\x31\x93\x3d\x85\xdd\x7b\x22\x29\xd6\
+\x0b\x00\x80\xbd\xc0\x4f\x44\x04\xaa\xf6\xb5\xf3\xcd\x8a\x97\x09\
+\x18\x18\x23\x29\xf5\x5c\xa9\xb7\x85\xbf\xdb\x36\x1a\x8a\x61\xc6\
+\xc4\x8f\xfb\x2f\x90\xcb\xd3\x52\x58\x2d\x29\x9e\x67\xf8\x7b\x6e\
+\x9f\x7d\x2b\xed\x06\x86\x0d\xf5\x45\x2a\x50\x1e\xd4\xa6\x3f\x95\
+\xaa\xfa\xf7\xf0\x8b\xfb\x80\xf7\x43\xc0\xd8\x9c\xf2\x28\x10\x0f\
+\x05\x00\xc0\xdf\x11\xb4\x21\xf0\x13\x47\x39\x3f\xaf\x7b\x5f\x44\
+\x28\xe9\x14\x7e\x58\xf3\x8e\xe1\xbe\xf9\x97\xe5\x9e\xc5\xd8\xd4\
+\x01\x82\x32\x92\xa4\x9e\x19\x94\x5c\xc4\xd4\x9c\x89\x86\x62\xa8\
+\x9a\xca\xe6\xa6\x4f\x04\x65\xd4\x37\x54\xab\x01\xbc\x41\x4c\xfa\
+\x6b\x68\x5e\x87\xd3\x6d\x6c\xa6\xc3\x51\x5e\x01\x9e\x12\x15\x2c\
+\x92\xe2\xa5\x00\xd0\x80\x9b\x81\x32\x11\xc1\x1e\x69\x5a\xcf\x8b\
+\xf6\x1d\x22\x42\x49\x27\xf1\x51\x67\x09\xef\x75\x1c\x34\x14\x23\
+\xd5\x9c\xc4\xed\x85\x86\x3b\x43\x4b\x52\x50\x2e\xef\x37\x9b\x14\
+\x8b\xa1\xf9\x64\x54\x3b\xca\xa8\x71\x96\x0b\xca\x28\xbe\xb5\x6b\
+\x2a\x4d\x41\xac\xce\xda\x3b\xf6\xd1\xdc\xb6\x5d\x54\x1a\x87\x80\
+\x5b\x45\x05\x8b\xb4\x78\x29\x00\x40\x6f\xc3\x78\x25\x02\x9e\xc9\
+\x68\x68\xdc\x7c\xf8\x55\x56\x75\x0a\xa9\x27\xa4\xe3\x04\x34\x95\
+\x1f\xd5\xbc\x6b\x38\xce\xad\x85\xe7\x93\x9f\x98\x21\x20\x23\x49\
+\xea\xbd\x8c\x84\x34\x2e\x12\xd0\xda\x77\x53\xe3\x27\xa8\xf2\xb1\
+\x63\xb7\x14\x0d\x2a\x83\x58\x2d\x74\xba\x6b\xa8\x6d\x32\xbe\xc9\
+\xb8\x8b\x07\xf8\x26\x60\x6c\xd3\x52\x14\x89\xa7\x02\x00\xf4\x13\
+\x01\x4b\x45\x04\xf2\x6b\x0a\x57\x57\xbc\xc4\x41\xaf\x4d\x44\x38\
+\xe9\x28\x7f\xb5\x7d\xc6\x5e\x8f\xb1\x9e\x19\x03\xad\xb9\x5c\x93\
+\x3f\x45\x50\x46\x92\x14\x9c\xd9\x79\xe7\xd2\xcf\x9a\x6b\x28\x46\
+\xbb\xaf\x85\xfd\xf6\x6d\x82\x32\x8a\x4f\x87\xb5\x00\xbe\x5e\xae\
+\xfc\x7b\x7d\xad\x1c\xae\x7b\x47\xd4\xa6\x3f\x80\x3b\x00\x61\x4b\
+\x09\xd1\x20\xde\x0a\x00\xd0\x9f\xcd\x08\xe9\xc7\xdc\xaa\xb8\x58\
+\x50\xfa\x1c\x8d\xf2\x64\x80\x30\xad\x8a\x8b\xdf\x36\x18\x7f\xee\
+\x79\x4f\xff\x8b\xb0\x9a\x12\x04\x64\x24\x49\xc1\x4b\x30\x59\xb8\
+\xb2\xc8\xf8\x50\xb1\xed\x2d\x1b\xf0\x28\x2e\x01\x19\xc5\x1f\xbb\
+\xa6\xd2\xd2\xcb\x15\x92\x80\xe2\xa6\xb2\xee\x2d\x14\x55\xd8\x51\
+\xcb\xa7\x81\xe7\x45\x05\x8b\x16\xf1\x58\x00\x00\xfc\x00\x41\xfd\
+\x01\x2a\x7c\x76\x16\x95\x2f\xc3\x2d\x66\x4e\x74\x9f\xf7\x3f\x75\
+\x1f\xd2\x6a\xf0\x8d\xee\x9c\xf4\xe1\xcc\xcc\x1c\x2d\x28\x23\x49\
+\x32\x66\x42\xc6\x28\xc6\xa6\x8f\x30\x14\xc3\xa7\x78\xd9\x66\x5b\
+\x2f\x28\xa3\xf8\xe1\x47\xa3\xb2\x97\x83\x7e\x54\xd5\x4f\x65\xdd\
+\x9b\xf8\xc4\x0d\xd5\xda\x06\xdc\x2d\x2a\x58\x34\x89\xd7\x02\xc0\
+\x09\x5c\x0e\x34\x8b\x08\xb6\xd1\x59\xc5\xd5\x95\x2f\xa1\xc8\xe7\
+\x74\x86\xec\x74\xd7\xf3\x74\xcb\x17\x86\x62\x58\x4c\x66\x7e\xdc\
+\x7f\x81\xa0\x8c\x24\x49\x8c\xc5\x45\x73\xb1\x98\x8c\xbd\x9d\x1e\
+\x6c\xdb\x49\xb3\x98\x99\xf4\x71\x41\x03\xca\x54\x85\xde\xdd\xfe\
+\x35\xaa\x1b\x3f\xc0\x6d\xf0\x11\xe3\x51\x5a\x80\xc5\xc4\xf8\x79\
+\xff\x93\x89\xd7\x02\x00\xa0\x12\x7d\xc3\x86\xb1\x73\x66\x5d\x56\
+\xb6\x1f\xe0\x67\xf2\x78\xa0\x21\x4b\x6b\x56\x1a\x2e\xa2\x96\xe4\
+\x9d\xcb\x88\x64\xc3\x33\xa0\x24\x49\xa8\xa2\xa4\x7c\x66\xe6\x9c\
+\x6d\x28\x86\x86\xc6\xa6\xc6\xd5\x82\x32\x8a\x7d\xb5\x9a\x42\x67\
+\x2f\xdf\x2f\xea\x6c\x6b\xe8\x70\x94\x8a\x4a\x41\x41\x6f\xf6\x53\
+\x21\x2a\x60\xb4\x89\xe7\x02\x00\x60\x15\xf0\x3f\xa2\x82\x3d\xd2\
+\xb4\x8e\xc7\x6d\x9f\x8b\x0a\xd7\xa7\xbc\xda\xb6\x87\x4f\x1d\xc6\
+\x8e\x3b\x65\x5a\x52\xb8\xb5\xf0\x7c\x41\x19\x49\x92\x58\x97\xf4\
+\x3b\x9f\x74\x4b\xaa\xa1\x18\x8d\xee\x1a\x2a\x3b\x0f\x09\xca\x28\
+\x76\xb5\x69\x2a\xf5\xbd\xec\xf6\xd7\xdc\xb6\x9d\x96\x36\xa1\xc7\
+\xb7\xef\x05\x3e\x14\x19\x30\xda\xc4\x7b\x01\x00\xf0\x30\xb0\x5c\
+\x54\xb0\xa5\xb5\x2b\x79\xb7\xe3\x80\xa8\x70\x7d\x82\x47\x0d\xf0\
+\xd3\xda\xf7\x0c\xc7\xb9\xa3\xe8\x02\xb2\x0c\xbe\xc1\x4a\x52\xa8\
+\xa4\x5a\x92\xb9\xb8\xdf\x79\x86\xe3\x6c\x6e\x5a\x4d\xa0\x0f\xef\
+\x39\xf2\x69\x50\xd1\xcb\x9b\x7f\x87\xa3\x8c\x7a\x83\x53\x1a\x8f\
+\xf3\x22\xf0\x17\x91\x01\xa3\x51\x5f\x28\x00\x34\xe0\x16\x60\xab\
+\x88\x60\x8a\xa6\x72\x75\xc5\x4b\xac\x73\x54\x8a\x08\xd7\x27\x3c\
+\xdc\xb4\x96\x0a\x9f\xdd\x50\x8c\x61\xc9\x05\x5c\x91\x3b\x59\x50\
+\x46\x92\x14\x1a\x33\x73\xce\x66\x80\xc1\x47\x54\x0e\x7f\x07\x7b\
+\xed\x5b\x04\x65\x14\x5b\x34\xa0\x4c\x0b\xd0\x9b\x39\x7f\x4e\x77\
+\x0d\xd5\x0d\xff\xed\xfa\xd7\x42\x7c\x01\xdc\x26\x2a\x58\x34\xeb\
+\x0b\x05\x00\x80\x0b\xb8\x14\x10\xd2\x0b\xd2\xa5\xfa\xb9\xa4\xfc\
+\x79\xbe\x70\x09\x6b\x2d\x19\xb7\x6a\xfd\x1d\x3c\xd4\xb8\xc6\x70\
+\x9c\x7b\x8a\x17\x18\xde\x64\x25\x49\xa1\x66\x36\x99\x58\x5c\x34\
+\xcf\x70\x9c\x9d\x2d\x1b\x71\xf8\x3b\x04\x64\x14\x5b\xaa\xd5\x00\
+\x8e\x5e\x3c\xf7\x77\x79\x1a\xa8\xac\x7b\x1b\xd5\x60\x4b\xf1\xa3\
+\xd4\x21\xa8\xa1\x5c\x2c\xe8\x4b\xef\xa8\xf5\xc0\x65\xe8\x27\x04\
+\x0c\xeb\x50\xbc\xcc\x2b\x7d\x86\xed\xee\x3a\x11\xe1\xe2\xd6\x7d\
+\x75\xef\xe3\x50\x7d\x86\x62\xcc\xca\x3a\x9d\x6f\x64\x18\x3b\x66\
+\x25\x49\xe1\x32\x3a\x6d\x28\x13\x33\x8c\x1d\x53\x0d\xa8\x7e\xb6\
+\x35\xaf\x13\x94\x51\x6c\x68\xd5\x54\x1a\x7b\x71\xf3\xf7\x78\x9b\
+\xa9\xac\x7b\x13\xd5\xe0\xfb\xcb\x51\xdc\xc0\x22\x04\x7d\x50\x8c\
+\x05\x7d\xa9\x00\x00\xbd\x8b\xd3\x8d\xe8\x43\xa5\x0c\x6b\x53\x3c\
+\x5c\x54\xfa\x1c\xfb\x3d\x4d\x22\xc2\xc5\x9d\x8d\xce\x2a\x5e\x6c\
+\x35\xb6\x29\x27\xd1\x64\xe1\xee\xa2\xb9\x82\x32\x92\xa4\xf0\xb8\
+\xaa\x68\x0e\x89\x06\x1b\x55\x95\xb6\xef\xa5\x51\xdc\x00\x9b\xa8\
+\xe6\xd1\x7a\x77\xde\xdf\xeb\x6f\xa3\xa2\xf6\x0d\x14\xc5\x23\x2a\
+\x05\x15\x7d\xc7\xbf\xb1\x73\xca\x31\xa6\xaf\x15\x00\x00\xaf\x03\
+\xbf\x14\x15\xac\x29\xe0\x60\x5e\xe9\xb3\x86\x9f\x71\xc7\x1b\x0d\
+\x8d\xa5\xb5\x2b\xd1\x0c\x3e\x97\xbb\xae\x60\x1a\x83\x92\xf2\x04\
+\x65\x25\x49\xe1\x91\x6f\xcd\xe1\x82\xbc\x73\x0d\xc7\xd9\xd4\xb8\
+\xda\xf0\xcf\x50\xb4\x53\xd1\x9f\xfb\xf7\x74\xdb\x9f\x3f\xd0\x49\
+\x45\xcd\xeb\x04\x14\x21\x8b\xb9\x47\xdc\x07\xbc\x29\x32\x60\x2c\
+\xe8\x8b\x05\x00\xc0\x83\xe8\x23\x84\x85\xa8\xf1\xb7\x33\xb7\xf4\
+\x19\xea\xfa\xe0\x33\xbb\x93\xf9\x77\xeb\x76\x36\x39\xab\x0d\xc5\
+\xc8\x4d\x48\xe7\xa6\x82\x99\x82\x32\x92\xa4\xf0\xba\xa8\x60\x06\
+\x59\x09\xc6\x86\x55\x35\x7b\x1a\x28\x6b\xdf\x2b\x28\xa3\xe8\x54\
+\xa9\x2a\xb8\x7a\x38\xe2\xd7\x1f\x70\x50\x5e\xf3\x2a\xfe\x80\xd0\
+\xf7\xda\x7f\x02\x7f\x14\x19\x30\x56\xf4\xd5\x02\x00\xf4\xd6\x8e\
+\x6f\x89\x0a\x56\xe6\x6d\x61\x76\xc9\x3f\xe5\xdc\x00\xc0\xa1\xfa\
+\xf8\x9f\xba\x0f\x0c\xc7\xb9\xab\x78\x2e\x69\x06\xc7\xad\x4a\x52\
+\xa4\x24\x99\xad\x5c\x5e\x38\xcb\x70\x9c\x2f\x6c\x6b\xf0\x8b\x7b\
+\xce\x1d\x55\xea\x54\x85\x96\x1e\x0e\xeb\x09\x28\x6e\x2a\x6a\x5f\
+\x17\xd9\xe2\x17\xe0\x5d\xe0\xfb\x22\x03\xc6\x92\xbe\x5c\x00\x1c\
+\xe9\xf2\xb4\x51\x54\xc0\x43\xde\x66\xe6\x95\x3e\x63\xb8\xd7\x7d\
+\xac\x7b\xb0\xe1\x13\xc3\xab\x21\x63\x52\x8a\x59\x98\x33\x51\x50\
+\x46\x92\x14\x19\x53\xb2\x27\x30\x34\xa5\xbf\xa1\x18\xee\x80\x93\
+\x5d\x2d\xc2\xde\xa6\xa2\x86\x5d\x53\xa9\xeb\xe1\xcd\x5f\x51\xbd\
+\x54\xd6\xbe\x81\xd7\xd7\x2a\x32\x85\x2d\xc0\x35\x08\xea\x16\x1b\
+\x8b\xfa\x72\x01\x00\xfa\xf1\xc0\x45\x80\xb1\x16\x75\x47\xd9\xe5\
+\x6e\x60\x61\xd9\xf3\xd8\x95\x3e\x71\x8a\xe4\x6b\x2a\x7c\x76\xfe\
+\x6c\x70\xa8\x89\x09\x13\x3f\xee\xbf\x10\x33\x26\x41\x59\x49\x52\
+\x64\x98\xd0\x8f\x05\x1a\xfd\x4e\xde\xdd\xfa\x05\x1d\x71\xb4\xcf\
+\xc8\xa5\x69\x94\xab\x3d\x3b\xed\x7f\xe4\xe6\xef\xf6\x0a\xdd\x6c\
+\x5d\x0a\x2c\x44\xd0\xa9\xb0\x58\xd5\xd7\x0b\x00\x80\x46\x60\x01\
+\x82\x06\x07\x01\x6c\x72\x56\x73\x41\xc9\x3f\xb1\x05\xfa\xde\xf7\
+\xd6\xbd\xb5\xef\xe2\xe9\xe5\xf4\xae\xe3\x5d\x94\x33\x81\x49\x69\
+\x83\x05\x65\x24\x49\x91\x35\x3c\x75\x20\xe7\x64\x8d\x33\x14\x43\
+\xd5\x14\xb6\xd8\x8c\xf7\xd3\x88\x06\x3e\x34\x4a\xd4\x40\x8f\x8e\
+\x62\x05\x14\x17\xe5\x35\xaf\xe2\x12\x3b\x24\xc9\x86\xfe\x9e\x6f\
+\x13\x19\x34\x16\xc9\x02\x40\x77\x08\x98\x03\xb4\x89\x0a\xb8\xc3\
+\x5d\xcf\x79\x25\x4f\x52\x23\xf6\x79\x55\x54\xfb\xc4\x51\xce\xeb\
+\x6d\xc6\x36\x2c\x25\x9b\x13\xf9\x7e\xd1\x85\x82\x32\x92\xa4\xe8\
+\xb0\xa8\xf0\x42\xac\xe6\x44\x43\x31\x2a\x3b\x0f\x51\xeb\xac\x14\
+\x93\x50\x84\x68\x40\xa9\x12\xc0\xd7\x83\xcf\xfe\x81\x80\x93\x8a\
+\x9a\xd7\xf0\x78\x85\xde\xa7\x3b\xd0\x6f\xfe\xc2\x26\x06\xc5\x32\
+\x59\x00\x7c\x65\x27\x70\x05\x20\xec\x60\xe9\x01\x8f\x8d\x99\x87\
+\x9e\xa4\xcc\xdb\x22\x2a\x64\xd4\x52\x34\x95\xa5\x35\xef\x18\x8e\
+\x73\x53\xbf\x99\x14\x25\x66\x09\xc8\x48\x92\xa2\x47\x76\x62\x06\
+\xf3\xf2\xa7\x19\x8e\xb3\xb9\x69\x35\x6a\x0c\x8f\x25\x2f\x57\x03\
+\x38\x7b\x70\xf3\xf7\xf9\x3b\x28\xab\x79\x05\x8f\x4f\xe8\x7b\xa7\
+\x1b\xbd\x19\x9c\x90\xb6\xf0\xf1\x40\x16\x00\xc7\xfa\x14\xc1\x9b\
+\x42\x2a\x7d\x76\x66\x96\x3c\xc9\x5e\x71\xf3\xa9\xa3\xd2\x93\x2d\
+\x9b\xd9\xe5\x36\xb6\x4c\x57\x98\x98\xc5\x75\x02\xde\x24\x25\x29\
+\x1a\xcd\xcd\x9b\x4a\x5e\x62\xb6\xa1\x18\x76\x6f\x33\x87\xda\x77\
+\x0a\xca\x28\xbc\x6a\x54\x85\xd6\x1e\x14\x2f\x5e\x5f\x2b\xe5\x35\
+\xaf\x88\xde\xed\xaf\x00\xd7\x03\xf1\xf1\x1c\x45\x10\x59\x00\x7c\
+\xdd\xdb\xc0\xcd\x08\xea\x16\x08\x50\xef\xef\xe4\x82\x92\xa7\xd9\
+\xe9\xae\x17\x15\x32\xaa\xd8\x15\x37\xbf\xae\xff\xd8\x70\x9c\xa5\
+\xfd\xe7\x93\x6c\x70\x99\x54\x92\xa2\x55\xa2\x39\x81\x45\x85\x17\
+\x18\x8e\xb3\xd5\xb6\x0e\x6f\x8c\x6d\x32\x6e\xd5\x54\xea\x7b\xb0\
+\xe3\xdf\xe3\x6b\xa1\xbc\xf6\x35\xfc\x62\x8f\x53\x6b\xe8\xc3\x7d\
+\x5e\x17\x19\x34\x1e\xc8\x02\xe0\xc4\x5e\x00\x7e\x24\x32\x60\x53\
+\xc0\xc1\x05\x25\x4f\xc7\xe5\x00\xa1\x07\xea\x57\xd1\x6c\x70\xc3\
+\xe3\xc4\xb4\xc1\x5c\x98\x35\x56\x50\x46\x92\x14\x9d\xce\xce\x1a\
+\xcb\xc8\xb4\x21\x86\x62\x78\x15\x0f\x3b\x5a\x3e\x17\x94\x51\xe8\
+\x75\x68\x1a\x15\x3d\xd8\x18\xec\xf2\xd4\x53\x5e\xfd\x0a\x01\xb1\
+\x9b\xa7\x35\xe0\x2e\xe0\x39\x91\x41\xe3\x85\x2c\x00\x4e\xee\x31\
+\xe0\x1e\x91\x01\x5b\x15\x17\xb3\x4b\xfe\xc9\xea\xce\x32\x91\x61\
+\x23\x6a\xbf\xa7\x89\xbf\x37\x1b\x3b\xa3\x6c\xc6\xc4\x8f\xfb\x2f\
+\xc0\x24\x8f\xfd\x49\x7d\xc0\x92\xa2\x79\x98\x4d\xc6\xbe\xd7\xf7\
+\xdb\xb7\x61\xf7\x0a\x3b\xb8\x14\x32\x4e\x34\x4a\x7b\xb0\xe3\xdf\
+\xe9\xae\xd5\x7b\xfb\xab\x5e\xd1\x29\xfc\x1c\xf8\x9b\xe8\xa0\xf1\
+\x42\x16\x00\xdd\xfb\x33\xf0\xff\x44\x06\x74\xaa\x3e\x2e\x2d\xff\
+\x17\xef\xb4\xef\x17\x19\x36\x62\xee\xa9\x7d\x17\x7f\x0f\x9b\x79\
+\x9c\xcc\xe5\xb9\x67\x73\xba\xc1\x66\x29\x92\x14\x2b\x06\x26\x17\
+\x32\x35\x7b\x92\xa1\x18\xaa\xa6\xb2\xa9\x69\x95\xa0\x8c\x42\xc3\
+\xad\x69\x1c\x52\x02\x28\xa7\xd8\xf4\xd7\xe1\x28\xa3\xb2\xf6\x0d\
+\x91\x53\xfd\x8e\xf8\x1f\xe0\x21\xd1\x41\xe3\x89\x2c\x00\x4e\xed\
+\x77\xc0\x6f\x44\x06\x74\xa9\x7e\xae\xa8\x78\x81\xbf\xda\x3e\x13\
+\x19\x36\xec\xde\x69\xdf\xcf\xfb\x1d\x87\x0c\xc5\x48\xb3\x24\x71\
+\x7b\xd1\x6c\x41\x19\x49\x52\x6c\xb8\xac\xdf\x2c\x52\x2c\xc9\x86\
+\x62\xd4\x39\x0f\x53\xed\x88\xce\xd5\x44\xaf\xa6\x71\x48\xf3\x73\
+\xaa\x56\x3f\xcd\x6d\xdb\xa9\xaa\x5f\x89\xaa\x09\x6f\xc6\x77\x3f\
+\xf0\x7b\xd1\x41\xe3\x8d\x2c\x00\x7a\xe6\xd7\xe8\x85\x80\x30\x8a\
+\xa6\x72\x77\xcd\x3b\xfc\xb0\xe6\x1d\xd4\x18\x9c\xf6\xe5\xd3\x14\
+\xee\xad\x7d\xcf\x70\x9c\xdb\xfa\xcd\x22\x2f\x21\x5d\x40\x46\x92\
+\x14\x3b\x32\x12\xd2\x58\x50\x30\xc3\x70\x9c\x8d\x8d\xab\x50\x0c\
+\xae\xc0\x89\x16\x00\x0e\xa9\x01\x7c\xdd\xbc\xad\x69\x68\xd4\xd9\
+\x3e\xa5\xde\xb6\x26\x14\xd3\x0e\x1f\x01\x1e\x10\x1d\x34\x1e\xc9\
+\x02\xa0\xe7\xfe\x1f\x82\x57\x02\x00\x1e\xb3\x7d\xc6\x55\xe5\x2f\
+\xe0\x52\xfd\xa2\x43\x87\xd4\x63\xb6\xcf\x38\x64\xf0\x19\xe4\x20\
+\x6b\x2e\x4b\xf2\x8d\x8f\x4c\x95\xa4\x58\x34\x3b\xf7\x5c\x0a\x0d\
+\x8e\xba\xee\xf4\xb7\xb1\xdf\xbe\x4d\x50\x46\xc6\x29\xc0\x41\xd5\
+\x8f\xa7\x9b\x9b\xba\xaa\xfa\xa9\xaa\x5b\x49\x4b\xdb\x8e\x50\xa4\
+\xf0\x07\xe0\xde\x50\x04\x8e\x47\xb2\x00\xe8\x9d\x5f\xa3\xcf\x8d\
+\x16\xea\xcd\xf6\x7d\x31\x35\x49\xb0\x29\xe0\xe0\xb7\x0d\xab\x0d\
+\xc7\xf9\xf1\x80\x85\x58\x4d\x09\x02\x32\x92\xa4\xd8\x63\x31\x99\
+\xb9\xaa\x70\xae\xe1\x38\xdb\x9b\x37\xe0\x8e\x82\xb6\xe3\xaa\xa6\
+\x71\x48\xf5\x77\x3b\xda\x37\xa0\x38\x29\xaf\x7d\x95\x0e\x67\x48\
+\x1e\x5d\x3c\x04\xfc\x2c\x14\x81\xe3\x95\x2c\x00\x7a\x2f\x24\xdf\
+\x64\x9b\x5d\xd5\x4c\x3d\xf8\x77\xf6\x7b\x84\x0e\xbc\x08\x89\x5f\
+\xd4\x7d\x48\xbb\x62\xac\x61\xe2\xb9\xe9\xc3\x99\x9e\x31\x52\x50\
+\x46\x92\x14\x9b\xc6\x65\x9c\xc6\x19\xe9\x23\x0c\xc5\xf0\xab\x3e\
+\xb6\x35\x1b\x1b\xc0\x65\x94\x06\x94\xaa\x0a\x8e\x6e\x6e\xfe\x5e\
+\x5f\x2b\x65\xd5\xff\xc1\x1d\x9a\xa6\x68\x21\xf9\x70\x16\xef\x64\
+\x01\x10\x9c\x90\x2c\x33\x55\xf8\xec\x4c\x3f\xf4\x04\x9f\x3a\x84\
+\x0d\x27\x14\x6e\xbb\xbb\x8e\xe7\x5a\x8d\x75\xd2\xb4\x98\xcc\xfc\
+\xb8\xff\x02\x41\x19\x49\x52\x6c\xbb\xaa\x68\x1e\x16\x93\xb1\xb7\
+\xe2\x43\x6d\xbb\x68\x16\x3b\x30\xa7\x57\xca\xd5\x00\xed\xdd\x1c\
+\xf6\x73\xb8\xaa\x29\xab\xfe\x0f\x3e\x83\x63\xc2\x4f\xe2\x17\x84\
+\xe0\xf1\x6c\x5f\x20\x0b\x80\xe0\x3d\x02\xfc\x10\xc4\xee\x60\xb1\
+\x2b\x6e\x2e\x2a\x7d\x8e\x17\x5a\xb7\x8b\x0c\x2b\xcc\xd2\x9a\x95\
+\x28\x06\x7b\x91\x5f\x93\x37\x85\xe1\xc9\xfd\x04\x65\x24\x49\xb1\
+\xad\x28\x29\x8f\xf3\x73\x27\x1b\x8a\xa1\xa1\xb1\xb1\x31\x32\xc7\
+\x02\x2b\xb4\x40\xb7\x2d\x7e\xed\x1d\xfb\xa8\xac\x7b\x33\x14\x67\
+\xfc\x55\xe0\x4e\xe0\x41\xd1\x81\xfb\x0a\x59\x00\x18\xf3\x18\x70\
+\x03\x20\x74\x07\x9f\x57\x0b\x70\xc3\xe1\x57\xb8\xbd\xfa\x0d\xc3\
+\x67\xec\x45\xfa\x8f\x7d\x17\x6b\x1d\x15\x86\x62\x64\x5a\x52\xb8\
+\xa5\xf0\x7c\x41\x19\x49\x52\x7c\xb8\xb8\xe0\x3c\xd2\x13\x52\x0d\
+\xc5\x68\x72\xd7\x52\xd1\x79\x40\x50\x46\x3d\x53\xae\x2a\x34\xab\
+\x27\xbe\xf9\x6b\x9a\x4a\x43\xf3\x7a\x6a\x1a\x3f\x44\x13\xff\x3e\
+\xa6\x00\xb7\x22\x9b\xfc\x18\x22\x0b\x00\xe3\x5e\x04\xae\x42\x9f\
+\x34\x25\xd4\x53\xcd\x9b\x99\x53\xfa\x0c\x0d\xfe\x4e\xd1\xa1\x7b\
+\xcd\xad\xfa\xb9\xaf\xee\x7d\xc3\x71\x7e\x50\x34\x87\x4c\x4b\x8a\
+\x80\x8c\x24\x29\x7e\xa4\x58\x92\xb9\xb4\xc0\x78\x61\xbc\xb9\xe9\
+\x13\x02\x61\x3a\x51\x54\xae\x2a\xb4\x9c\xe4\xc6\x1e\x50\xdc\x54\
+\xd6\xbd\x81\xcd\xbe\x25\x14\x97\xf6\x02\x57\x23\xdb\xfb\x1a\x26\
+\x0b\x00\x31\xde\x41\x9f\x31\x2d\xfc\x01\xd7\x5a\x47\x05\x93\x0f\
+\x3e\xce\xe7\xce\x2a\xd1\xa1\x7b\xe5\x0f\x4d\x6b\xa9\xf4\xd9\x0d\
+\xc5\x18\x9e\xdc\x8f\xcb\x73\xcf\x12\x94\x91\x24\xc5\x97\xe9\x39\
+\x67\x31\x30\xb9\xd0\x50\x0c\xa7\xbf\x93\x3d\xad\x5f\x08\xca\xe8\
+\xc4\x34\xa0\x4c\x0d\x9c\xf4\xe6\xef\xf6\x34\x52\x5a\xf5\x12\x0e\
+\x57\x75\x28\x2e\xef\x00\x2e\x41\x0e\xf6\x11\x42\x16\x00\xe2\xac\
+\x01\x2e\x04\x84\x37\xe8\xae\xf5\x77\x30\xbb\xe4\x9f\x3c\xd9\xbc\
+\x49\x74\xe8\x1e\xa9\xf1\xb7\xf3\xc7\xc6\xb5\x86\xe3\xdc\xd3\xff\
+\x22\xc3\x9b\x9d\x24\x29\x5e\x99\x4d\x26\x16\x17\x19\x3f\x16\xb8\
+\xb3\x65\x23\x8e\xd0\x6c\xb6\xfb\xf2\xe6\x7f\xb2\x67\xfe\x2d\x6d\
+\x3b\x29\xab\x79\x05\x7f\x20\x24\xab\x96\x36\xe0\x7c\xc0\xf8\xe8\
+\x51\x09\x90\x05\x80\x68\x5b\x80\x29\x40\x89\xe8\xc0\x5e\x2d\xc0\
+\xf7\xaa\xdf\xe4\x86\xc3\xaf\x84\xbd\x69\xd0\x4f\x6b\xff\x8b\xd3\
+\x60\x9f\xee\x0b\xb3\xc6\x32\xc5\xe0\x71\x27\x49\x8a\x77\xa3\xd2\
+\x86\x72\x66\xe6\x18\x43\x31\x14\x2d\xc0\x56\x9b\xf1\x82\xfd\x78\
+\xaa\xa6\x51\xa2\xfa\xb1\x9f\xe0\xe6\xaf\x69\x01\x6a\x1a\x3f\xa2\
+\xce\xf6\x49\x28\x9e\xf7\x03\x94\x03\x33\x80\xe8\xe9\x7a\x14\x07\
+\x64\x01\x20\x5e\x39\x30\x15\x08\x49\xa3\xff\x17\x5a\xb7\x33\xe3\
+\xd0\x13\x54\x18\x5c\x8e\xef\xa9\xcf\x9d\x55\x2c\xb7\xef\x32\x14\
+\xc3\x6a\x4a\xe0\x07\xc5\xc6\x3f\xd9\x48\x52\x5f\x70\x65\xe1\x1c\
+\x12\x0d\x36\xc8\x2a\xeb\xd8\x47\xa3\xc0\xd1\xe3\x2a\x50\xa2\x29\
+\xb4\x9f\xe0\x9c\xbf\x3f\xd0\x49\x59\xcd\x0a\xec\x1d\x7b\x85\x5d\
+\xef\x38\x5f\xa0\xbf\xa7\x1a\x1b\x3c\x22\x7d\x8d\x2c\x00\x42\xa3\
+\x05\x98\x07\xac\x0c\x45\xf0\xed\xee\x3a\xce\x39\xf8\x38\x1f\x18\
+\x1c\xc4\x73\x2a\x2a\x1a\x4b\x6b\x56\x1a\xee\xd5\x7d\x43\xc1\x74\
+\x06\x59\x73\x05\x65\x25\x49\xf1\x2d\xcf\x9a\xcd\x85\xf9\xdf\x30\
+\x1c\x67\x63\xd3\x2a\x21\x7d\xf6\x03\xc0\x01\xc5\x4f\xc7\x09\x3e\
+\xf9\x77\x3a\x2b\x29\xa9\x7a\x31\x54\xcd\x7d\x00\x3e\x44\x7f\xb4\
+\x1a\xfd\x1d\xd2\x62\x90\x2c\x00\x42\xc7\x09\x5c\x01\x3c\x1d\x8a\
+\xe0\x2d\x01\x17\x17\x97\xff\x8b\x5f\xd4\x7d\x18\xb2\xa3\x34\x30\
+\x09\x07\x00\x00\x10\x88\x49\x44\x41\x54\x82\xcf\xb7\x6c\x65\xb3\
+\xc1\x8d\x3c\x05\x89\x99\xdc\xd8\xcf\xf8\xd0\x13\x49\xea\x4b\x2e\
+\xca\x9f\x4e\x4e\x62\xa6\xa1\x18\x2d\x9e\x46\x4a\xdb\xf7\x18\x8a\
+\xe1\x47\xe3\xa0\xe2\xc7\x79\x5c\x21\x71\xe4\x88\x5f\x65\xdd\x5b\
+\x28\x06\xbb\x82\x76\xe3\x49\x60\x21\x10\xf9\x63\x50\x71\x4a\x16\
+\x00\xa1\x15\x00\x6e\x03\x7e\x0e\xdd\xb4\xc9\x0a\x92\xa2\xa9\x3c\
+\xd8\xf8\x09\x33\x0e\x3d\x49\xa9\xb7\x45\x68\xec\x4e\xc5\xcb\xff\
+\xab\xff\xd0\x70\x9c\x3b\x8b\xe6\x90\x6a\xb6\x0a\xc8\x48\x92\xfa\
+\x0e\xab\x39\x91\xcb\xfa\xcd\x32\x1c\x67\x8b\x6d\x2d\xbe\x20\x1b\
+\xf0\xb8\x35\x8d\xfd\x6a\x00\xd7\x71\x37\x7f\xaf\xcf\x4e\x59\xcd\
+\x7f\xba\x8e\xf8\x85\x64\x92\xa9\x0a\xfc\x14\xf8\x1e\xfa\x79\x7f\
+\x29\x44\x64\x01\x10\x1e\xff\x07\x2c\x41\x5f\x15\x10\x6e\xb3\xab\
+\x9a\x09\x07\x1e\xe5\x51\xdb\x06\x61\x31\x7f\xdb\xb8\x9a\x7a\x83\
+\xfd\x07\xc6\xa7\x0e\x64\x41\xce\x04\x41\x19\x49\x52\xdf\x72\x6e\
+\xf6\x04\x46\xa4\x0e\x32\x14\xc3\x1d\x70\xb2\xab\x65\x63\xaf\xff\
+\x9d\x43\xd3\x38\xa0\xfa\xf1\x1e\xf7\xcc\xdf\xde\xb1\x9f\xd2\xea\
+\x97\x42\xb9\xe4\xef\x44\xef\xab\xf2\xc7\x50\x5d\x40\xfa\x8a\x2c\
+\x00\xc2\xe7\x75\x60\x3a\x10\x92\x03\xfd\x6e\xd5\xcf\xd2\x9a\x95\
+\x5c\x55\xf1\x02\x2d\x01\x97\xa1\x58\xe5\xde\x56\x1e\x6d\x32\xb6\
+\x87\xd1\x84\x89\x7b\xfa\x2f\xc0\x84\xc9\x50\x1c\x49\xea\xab\x4c\
+\xc0\x92\xa2\x79\x86\x7f\x86\xf6\xb4\x6e\xa1\xa3\x17\x9b\x86\xed\
+\x9a\xca\x01\xd5\x4f\xe0\xa8\xdf\x53\x54\x2f\xd5\x0d\xff\xa5\xa6\
+\xf1\x03\xd4\xd0\x9d\x42\xaa\x43\x3f\xe6\xf7\x66\xa8\x2e\x20\x1d\
+\x4b\x16\x00\xe1\xb5\x13\x7d\x37\x6b\xc8\x3a\x75\xbc\xde\xb6\x97\
+\x71\x07\xfe\xc2\xfb\x06\x36\x08\xde\x53\xfb\x2e\x5e\x2d\x70\xea\
+\xbf\xd8\x8d\x8b\x73\x26\x32\x2e\x75\xa0\xa1\x18\x92\xd4\xd7\x0d\
+\x4e\x29\xe6\xdc\xec\xf1\x86\x62\xa8\x9a\xc2\x17\xb6\x4f\x7b\xf4\
+\x77\x1b\x35\x85\x52\x35\x70\xcc\xc2\xbe\xc3\x55\x4d\xc9\xe1\x65\
+\xb4\x75\x1e\x34\x94\xc7\x29\xec\x00\xbe\x01\x18\x9b\x34\x26\xf5\
+\x8a\x2c\x00\xc2\xaf\x0e\x98\x05\x2c\x0f\xd5\x05\x1a\xfc\x9d\x5c\
+\x5c\xf6\x3c\x3f\xab\xfb\x2f\xbe\x5e\x6e\x10\x5c\xdd\x59\xc6\x5b\
+\xed\xfb\x0c\x5d\x3f\xd5\x6c\xe5\xfb\x45\x73\x0c\xc5\x90\x24\x49\
+\x77\x45\xe1\x85\x24\x9b\x93\x0c\xc5\x38\xdc\x59\x42\xad\xb3\xfb\
+\x39\x1e\x55\xaa\x42\x95\xfa\xd5\xfb\x85\xa6\x29\xd4\x37\xaf\xa3\
+\xa2\xf6\x75\xfc\x01\x87\xa1\xeb\x9f\xc2\x8b\xc0\x34\x20\x24\xad\
+\x03\xa5\x93\x93\x05\x40\x64\xb8\x80\x6b\x81\x9f\x10\xa2\x4d\x2e\
+\x2a\x1a\x7f\x68\x5c\xcb\xb4\x43\xff\xe0\x80\xc7\xd6\xa3\x7f\xa3\
+\x68\x2a\x4b\x6b\x8d\x9f\x5c\xbc\xa9\xdf\x4c\x0a\x12\x33\x0c\xc7\
+\x91\x24\x09\x32\x13\xd2\x98\x97\x3f\xd5\x70\x9c\x4d\x4d\xab\x51\
+\x4f\x70\x94\x4f\x41\xa3\x44\x0d\xd0\x78\xd4\x87\x05\xaf\xaf\x95\
+\xb2\xea\xff\xd0\x6c\xdf\x4a\x88\x36\xfa\x81\xbe\x49\xfa\x1e\xe0\
+\x7a\x42\x30\x4b\x45\x3a\x35\x59\x00\x44\xd6\xc3\x84\xf8\x8c\xeb\
+\x56\x57\x2d\x13\x0e\x3c\xca\x7d\x75\xef\x9f\x72\x35\xe0\x1f\xcd\
+\x9b\xd8\xed\x36\x36\x53\xbc\xbf\x35\x87\xeb\x0a\xa6\x19\x8a\x21\
+\x49\xd2\xb1\xe6\xe4\x4f\xa5\xc0\x60\x2f\x8d\x36\x6f\x0b\x07\xdb\
+\x76\x1c\xf3\x7b\x5e\x0d\x0e\x28\x01\xda\xba\x0a\x03\x4d\x53\xb1\
+\xd9\xb7\x50\x52\xf5\x12\x6e\x6f\x48\x8f\xde\xb7\xa0\xcf\x4f\xf9\
+\x73\x28\x2f\x22\x75\x4f\x16\x00\x91\xb7\x06\x98\x8c\xde\x46\x38\
+\x24\xfc\x9a\xc2\x43\x8d\x6b\x98\x7c\xf0\x71\x36\x39\x4f\xbc\xca\
+\x66\x57\xdc\x3c\xd0\x60\x7c\x9e\xf8\xd2\xe2\xf9\x58\x0d\x76\x31\
+\x93\x24\xe9\x58\x09\x26\x0b\x8b\x0a\x2f\x30\x1c\x67\x5b\xf3\x7a\
+\xbc\x8a\xfe\x61\xdb\x81\xca\x7e\xcd\xff\xe5\x31\x3f\xb7\xb7\x89\
+\xb2\xea\xe5\x34\x34\xaf\x47\x33\xb8\x07\xe8\x14\x76\x00\xe7\x20\
+\x7b\xfa\x47\x9c\x2c\x00\xa2\x43\x35\xfa\xee\xd7\x7f\x87\xf2\x22\
+\xbb\xdd\x0d\x4c\x2f\x79\x82\x7b\x6a\xdf\xfd\x5a\x6f\xff\x5f\xd5\
+\x7f\x44\x73\xc0\xd8\x29\xc5\xc9\xe9\xc3\x98\x9d\x75\xba\xa1\x18\
+\x92\x24\x9d\xd8\x99\x99\x63\x38\x3d\x7d\xb8\xa1\x18\x5e\xc5\xc3\
+\xf6\xe6\x0d\xd8\x34\x95\x03\x4a\x00\xbf\xa6\xa1\xaa\x7e\xea\x6d\
+\x6b\x28\xab\x7a\x39\xd4\x9f\xfa\x01\x9e\x45\x7f\xde\xdf\xfd\x86\
+\x04\x29\x2c\x64\x01\x10\x3d\x5c\xc0\xb7\xbb\x5e\xc6\xce\xf1\x75\
+\x43\xd1\x54\xfe\xdc\xb4\x9e\x71\xfb\xff\xf2\x65\x2b\xe1\x7d\x9e\
+\x26\x9e\x6c\xde\x6c\x28\xae\xd9\x64\xe6\x9e\xfe\x0b\x44\xa4\x28\
+\x49\xd2\x49\x2c\x2e\x9a\x8b\xd9\xe0\x44\xcd\xfd\xf6\xed\x1c\x70\
+\x37\xa0\x01\x9d\xae\x4a\x0e\x1d\x5e\x46\x73\xdb\x76\x21\x6d\x83\
+\xbb\xe1\x01\xbe\x0b\xdc\x82\x7c\xde\x1f\x35\xe4\x5a\x6d\xf4\xf9\
+\x37\xb0\x0b\x58\x01\x9c\x16\xaa\x8b\x54\xfa\xec\x5c\x54\xf6\x1c\
+\x4b\xb2\xc7\xd3\xac\xb8\x0c\xb7\x13\xbe\x32\xf7\x6c\x46\x1a\x9c\
+\x65\x2e\x49\x52\xf7\x8a\x93\x0a\x98\x9e\x73\x26\xeb\x5a\x83\x3f\
+\x2d\xa7\xa1\x51\x67\xfb\x84\x24\x6b\x2e\xad\xed\xbb\x05\x66\x77\
+\x52\x25\xc0\x62\xf4\xf7\x35\x29\x8a\xc8\x15\x80\xe8\xb4\x03\x7d\
+\x5f\xc0\xeb\xa1\xbe\xd0\x8a\xb6\xdd\x7c\xd2\x59\x66\x28\x46\xa6\
+\x25\x85\xdb\x05\x3c\x9f\x94\x24\xe9\xd4\x2e\xeb\x37\x8b\x34\x4b\
+\x8a\xa1\x18\x4e\x77\x6d\xb8\x6e\xfe\xaf\x00\x67\x23\x6f\xfe\x51\
+\x49\x16\x00\xd1\xab\x1d\xbd\x25\xe6\x0f\x88\xf2\x25\xb3\xdb\x0a\
+\x67\x91\x9d\x90\x1a\xe9\x34\x24\xa9\x4f\x48\xb3\xa4\xb0\xa0\x60\
+\x66\xa4\xd3\x38\x15\x17\x70\x3b\x70\x0d\x72\x98\x4f\xd4\x92\x05\
+\x40\xf4\xfb\x3b\x7a\x05\xbd\x33\xd2\x89\x9c\xc8\xb0\xa4\x02\x16\
+\xe7\x9d\x13\xe9\x34\x24\xa9\x4f\x99\x95\x3b\x99\xfe\x49\x05\x91\
+\x4e\xe3\x64\xf6\xa1\x77\xf5\x7b\x2a\xd2\x89\x48\xdd\x93\x05\x40\
+\x6c\xd8\x8f\xfe\x03\xf5\x18\x21\xec\xca\x11\x8c\x1f\xf5\xbf\x88\
+\x04\x93\x25\xd2\x69\x48\x52\x9f\x62\x36\x99\x59\x5c\x3c\x2f\xd2\
+\x69\x9c\xc8\x32\xf4\x23\x7e\x61\x79\xbe\x20\x19\x23\x0b\x80\xd8\
+\xe1\x01\x7e\x08\x5c\x09\xf4\xac\xb5\x5f\x88\xcd\xc8\x1c\xc5\xd4\
+\x8c\x90\xed\x53\x94\x24\xa9\x1b\x63\xd2\x86\x31\x2e\x7a\x7e\xfe\
+\x9a\x80\x4b\x81\x1b\x09\xe1\x29\x26\x49\x2c\x59\x00\xc4\x9e\x37\
+\x81\x71\x44\x78\x62\x56\xa2\xc9\xc2\xd2\xe2\xf9\x91\x4c\x41\x92\
+\xfa\xbc\x25\x45\xf3\xa2\x61\x05\xee\xbf\xc0\x24\xc0\x78\x1f\x71\
+\x29\xac\x64\x01\x10\x9b\x9a\x80\x2b\xd0\xcf\xd4\x76\x44\x22\x81\
+\xab\xf3\xa7\x30\x24\x29\x3f\x12\x97\x96\x24\xa9\x4b\x81\x35\x97\
+\xf3\x73\x27\x47\xea\xf2\xed\xc0\xcd\xc0\x42\xa0\x3e\x52\x49\x48\
+\xc1\x93\x05\x40\x6c\x7b\x16\x98\x00\x7c\x12\xce\x8b\x9a\x30\x91\
+\x60\x32\xe3\x54\xbc\xe1\xbc\xac\x24\x49\xc7\x71\x29\x7e\x5c\xa6\
+\x44\x4c\x98\xc2\x7d\xe9\x0d\xe8\x9b\x93\x9f\x0f\xf7\x85\x25\x71\
+\x22\xbe\x76\x24\x19\xd6\x8e\xbe\xf1\xa6\x05\x98\x09\x58\xc3\x71\
+\xd1\x9d\xce\x2a\xde\xb2\x6f\xc3\x84\x89\xd1\x29\x45\xd1\xb0\x0c\
+\x29\x9d\xc0\x56\x67\x25\xdb\x9c\x95\x41\xfd\xdb\x51\x69\x43\x18\
+\x95\x36\x44\x6c\x42\x92\x10\x3e\xd5\xcf\x7b\x2d\x9b\x78\xb6\xe6\
+\x35\x2a\x9d\xe5\xe1\xbc\x74\x27\x70\x2f\xf0\x7d\xa0\x35\x9c\x17\
+\x96\xc4\x93\xef\xda\xf1\x41\x03\x36\x03\x2f\x03\x63\x81\x11\xe1\
+\xb8\xa8\x47\xf5\xb3\xc9\x51\xc6\x1b\xad\x5b\x51\xd1\x18\x9b\xda\
+\x1f\x8b\xc1\x36\xa5\x92\x58\xb2\x00\x88\x2f\x01\x4d\x61\x7d\xdb\
+\x0e\x9e\xa8\x7e\x95\x7d\x9d\x07\x09\x84\x76\x68\xcf\xf1\x3e\x40\
+\x5f\xee\xff\x88\x28\x3b\x8d\x24\x05\x47\xb6\x02\x8e\x2f\x95\xc0\
+\x7c\x60\x09\xf0\x0f\x20\x2f\x1c\x17\xb5\x07\x9c\x3c\x5e\xff\x11\
+\x2b\x9a\x37\x73\x7d\xc1\x34\xae\xcc\x9b\x2c\x27\x02\x4a\x92\x40\
+\x8a\xa6\xb2\xa5\x7d\x0f\x6f\x37\xad\xc5\xee\x6f\x0b\xf7\xe5\xdb\
+\x80\x9f\x01\xff\x44\xde\xf8\xe3\x8a\x5c\x01\x88\x4f\xfb\xd0\x1f\
+\x0b\x0c\x45\x5f\x11\x08\x0b\xa7\xea\xe5\xf3\xce\x52\x3e\x68\xdb\
+\x4d\xba\x25\x99\xd3\x92\xfb\x61\x32\x85\xfd\xd9\xa4\x74\x14\xb9\
+\x02\x10\xdb\x54\x4d\xe5\xf3\xb6\x9d\xfc\xb3\xfa\x55\x36\xb6\xed\
+\xc2\xa3\x7a\xc2\x9d\xc2\x0a\xe0\x12\xf4\xb1\xe5\x52\x9c\x91\x1f\
+\xd3\xe2\x57\x3d\xfa\x00\x8e\x8b\x81\xbf\x02\xc3\xc2\x75\xe1\x5a\
+\x9f\x9d\x07\xaa\xdf\xe0\xb9\xa6\xb5\x5c\x5f\x30\x8d\x8b\x73\x26\
+\xc9\x15\x01\x49\xea\x05\xbf\x1a\x60\x63\xdb\x4e\x3e\x6e\xd9\x84\
+\xcd\x17\x91\x47\xed\xe5\xc0\x9d\xe8\x47\xfc\xa4\x38\x25\x57\x00\
+\xe2\x5f\x09\x7a\x4b\xce\x00\x30\x95\x30\x16\x7d\xed\x8a\x9b\x75\
+\x1d\x87\x78\xa3\x75\x2b\xed\x01\x17\xc3\x93\xfb\x91\x6a\x49\x0a\
+\xd7\xe5\x25\xe4\x0a\x40\xac\x71\x04\x5c\x7c\xda\xfa\x05\xcf\xd5\
+\xbc\xc1\x96\x8e\x7d\xb8\x94\xb0\x8f\x01\xf1\x03\x7f\x43\xff\xf0\
+\xb0\x2f\xdc\x17\x97\xc2\x4b\x7e\x2c\xeb\x1b\xdc\xc0\xfd\xe8\x93\
+\xb9\xfe\x01\x9c\x17\xce\x8b\xdb\x03\x4e\xfe\x65\x5b\xcf\xf2\x96\
+\x4d\x5c\x92\x33\x89\xeb\xf2\xa7\x32\x28\x29\x2c\xdb\x13\x24\x29\
+\x26\x34\xf9\x5a\x59\xd5\xbc\x91\x8d\xed\xbb\xf0\xab\x61\xdd\xd8\
+\x77\xb4\x4f\x81\x3b\x80\x03\x91\x4a\x40\x0a\x2f\x59\x00\xf4\x2d\
+\xfb\x80\xf3\xd1\x5b\x76\x2e\x03\xb2\xc2\x79\x71\xaf\xea\xe7\xb5\
+\x96\x2f\x78\xa3\x65\x0b\xd3\x32\x47\x72\x6d\xfe\x54\xce\x4d\x1f\
+\x1e\xce\x14\x24\x29\xaa\x54\xb9\xeb\xf9\xa4\x75\x33\x5f\xb4\xef\
+\x41\xd5\x22\xb6\xbf\xae\x13\x7d\xb9\x7f\x19\x72\x93\x5f\x9f\x22\
+\x0b\x80\xbe\xe9\x1d\xa0\x3f\xf0\x2f\xf4\x91\xc3\x61\xdd\xa9\xa7\
+\xa2\xb1\xbe\xe3\x10\xeb\x3b\x0e\x71\x7a\x4a\x7f\xae\xc9\x9f\xc2\
+\x45\xd9\x13\xe4\x11\x42\xa9\x4f\xd0\xd0\xd8\xd3\x59\xca\x07\xcd\
+\x1b\x28\x77\xd5\x44\x36\x15\x78\x1b\xb8\x1e\x70\x44\x32\x11\x29\
+\x32\x64\x01\xd0\x77\xb9\xd0\x8f\x0b\x0e\x05\x9e\x03\x66\x45\x22\
+\x89\xfd\xee\x3a\xee\xaf\x7e\x83\xbf\x35\xac\x62\x61\xf6\x04\xae\
+\xca\x3b\x87\x62\x6b\x76\x24\x52\x91\xa4\x90\x6a\x0f\x74\xb2\xa9\
+\x6d\x37\xeb\xec\xdb\x68\xf1\x85\xfd\x28\xdf\xf1\xb6\x00\xd7\x02\
+\xa5\x91\x4e\x44\x8a\x1c\x59\x00\x48\x95\xc0\x6c\xf4\x0d\x82\x7f\
+\x04\xa6\x47\x22\x09\x9b\xbf\x83\x7f\xd9\xd6\xb3\xcc\xb6\x81\xc9\
+\xe9\xc3\xb8\x22\x6f\x32\xb3\x32\xc7\xc8\x0e\x83\x52\x4c\x53\x35\
+\x8d\x43\xae\x4a\xd6\xb7\x6e\x63\x47\xe7\x41\x54\x4d\x8d\x74\x4a\
+\x5f\x00\x3f\x41\x1e\xeb\x93\x90\x05\x80\xf4\x95\xcf\xd1\x5b\x09\
+\x2f\x06\xfe\x0f\x88\xc8\xc3\x79\x15\x8d\xcd\x8e\x72\x36\x3b\xca\
+\xc9\x4f\xcc\xe0\xe2\xec\x89\x5c\x91\x37\x99\x01\xd6\x9c\x48\xa4\
+\x23\x49\x41\x69\xf3\x77\xb0\xb9\x7d\x0f\x6b\x5b\xb7\xd2\xea\x6f\
+\x8f\x74\x3a\x00\x55\xc0\x2f\x91\xcf\xf9\xa5\xa3\xc8\x02\x40\x3a\
+\x9a\x86\xde\xf8\xe3\x2d\xe0\x26\xe0\xb7\x40\x41\xa4\x92\x69\xf6\
+\x77\x1e\xb3\x2a\xb0\x30\x67\x22\x73\xb2\xce\x20\xc9\x9c\x18\xa9\
+\x94\x24\xe9\xa4\x02\x9a\xc2\xae\xce\x43\x6c\x6a\xdb\xc5\x5e\x47\
+\x69\x24\x37\xf5\x1d\xcd\x0e\x3c\x04\x3c\x0a\x84\xbd\x8b\x90\x14\
+\xdd\x64\x01\x20\x9d\x88\x0f\xbd\x77\xc0\x0a\xf4\xc1\x1f\x77\x03\
+\xe9\x91\x4a\xe6\xe8\x55\x81\xc7\xea\x3f\x64\x7e\xf6\x04\xe6\x66\
+\x8f\x63\x5c\xea\x80\x48\x4c\x41\x93\xa4\x2f\x69\x40\x85\xab\x86\
+\xad\x1d\x7b\xf9\xa2\x6d\x2f\x0e\xc5\x15\xe9\x94\x8e\x70\x00\x7f\
+\x01\x1e\x41\x6f\xe5\x2b\x49\x5f\x23\x0b\x00\xa9\x3b\x76\xe0\x17\
+\xc0\x9f\xf9\xaa\x10\x48\x89\x64\x42\xad\x01\x27\x2f\x37\x7f\xce\
+\xcb\xcd\x9f\x53\x98\x98\xc5\xec\xac\xd3\xb9\x30\xeb\x0c\x26\xa6\
+\x0d\x92\xc5\x80\x14\x36\xf5\x5e\x1b\xdb\xda\xf7\xb3\xb9\x7d\x37\
+\x36\x9f\x3d\xd2\xe9\x1c\xcd\x87\x3e\xa2\xf7\xd7\x40\x43\x64\x53\
+\x91\xa2\x9d\x2c\x00\xa4\x9e\x68\x06\xee\x03\x1e\x47\x7f\x8e\x78\
+\x33\x10\xf1\x75\xf8\x46\x7f\x3b\xcb\x9b\x37\xb2\xbc\x79\x23\x03\
+\xad\xb9\xcc\xcd\x1e\xc7\xdc\xec\x33\x18\x99\x5c\x14\xe9\xd4\xa4\
+\x38\x54\xe3\x69\x64\x6b\xfb\x5e\xb6\x76\xec\xa7\x39\xba\x6e\xfa\
+\xa0\xdf\xf8\x9f\x01\x7e\x07\xd4\x46\x38\x17\x29\x46\xc8\x02\x40\
+\xea\x8d\x1a\xe0\x76\xf4\x37\x99\x1f\x03\xb7\x11\xe1\x15\x81\x23\
+\x6a\x7c\xad\x3c\xd7\xb4\x96\xe7\x9a\xd6\xd2\xdf\x9a\xc3\x79\x99\
+\xa3\xb9\x38\x67\x12\x63\x52\x8a\x23\x9d\x9a\x14\xc3\x8e\x7c\xd2\
+\xdf\xda\xb1\x97\x06\x6f\x4b\xa4\xd3\x39\x11\x1f\xf0\x1f\xe0\x01\
+\xa0\x2c\xc2\xb9\x48\x31\x46\x16\x00\x52\x30\xaa\x80\x1f\x02\x7f\
+\x00\x7e\x4a\x14\x15\x02\x00\x75\x3e\xfb\x97\x2b\x03\xc3\x92\x0a\
+\x98\x9e\x39\x8a\x69\x19\xa7\x31\x31\x6d\xb0\x1c\x4a\x24\x75\x2b\
+\xa0\x29\x94\x38\x0f\xb3\xcf\x51\xc6\x5e\x47\x69\xb4\xde\xf4\x41\
+\xef\xe3\xf1\x14\xfa\xd1\xdd\xba\x08\xe7\x22\xc5\x28\xf9\x6e\x28\
+\x19\x51\x8b\x5e\x08\x3c\x88\xbe\x22\x70\x3b\x90\x19\xd1\x8c\x8e\
+\x53\xe1\xb5\x51\x61\xb3\xf1\x82\x6d\x03\xa9\x66\x2b\x93\xd3\x87\
+\x31\x2d\x63\x24\xd3\x32\x46\xca\x86\x43\x12\x00\x2d\xbe\x36\xf6\
+\x3a\x4a\xd9\xeb\x28\xe3\xa0\xb3\x12\x9f\xea\x8f\x74\x4a\xdd\x69\
+\x47\x9f\xe7\xf1\x67\xa0\x29\xc2\xb9\x48\x31\x4e\x16\x00\x92\x08\
+\x8d\xe8\x2b\x01\xff\x0b\x7c\x07\xbd\x18\x18\x14\xd1\x8c\x4e\xc0\
+\xa5\xfa\x58\xdb\x71\x90\xb5\x1d\x07\x01\x18\x60\xcd\xe1\xdc\xf4\
+\x11\xcc\xcc\x1c\xc5\x94\x8c\x11\x72\x75\xa0\x8f\xf0\x6b\x01\xca\
+\x5c\xd5\x1c\x70\x54\x70\xc0\x59\x41\x95\xbb\x3e\xd2\x29\xf5\x44\
+\x03\xf0\x24\xfa\xce\x7e\xb9\xab\x5f\x12\x42\xbe\xe3\x49\x22\x75\
+\xa2\x9f\x37\xfe\x07\xf0\x2d\xf4\x42\x60\x5c\x44\x33\xea\x46\xad\
+\xcf\xce\x1b\xad\x5b\x78\xa3\x75\x0b\xc9\xe6\x44\x26\xa7\x0f\xe3\
+\x9c\xf4\xe1\x9c\x99\x36\x84\xd1\xc9\x45\x98\xe5\x6c\x82\xb8\xa0\
+\x6a\x2a\xd5\x9e\x06\x4a\x5c\x55\x1c\x72\x54\x72\xc8\x75\x38\xda\
+\x3f\xe5\x1f\x6d\x37\xf0\x30\xf0\x32\xfa\xa8\x5e\x49\x12\x46\x16\
+\x00\x52\x28\x1c\x39\x8a\xf4\x2f\x60\x3e\xfa\xf1\xc1\xf9\x40\xd4\
+\xde\x51\x3d\xaa\xff\xcb\x01\x45\x00\x69\x96\x24\x26\xa5\x0e\xe6\
+\xcc\xf4\xa1\x9c\x99\x36\x84\x31\x29\xc5\x72\x85\x20\x46\x04\x34\
+\x85\xc3\xee\x3a\x4a\x5d\x55\x94\x3a\xab\x28\x73\x55\xe3\x51\x7d\
+\x91\x4e\xab\x37\x54\xe0\xbf\xc0\x63\xc0\x47\xc8\xce\x7d\x52\x88\
+\xc8\x77\x34\x29\x94\x34\xe0\xfd\xae\xd7\x08\xf4\xcd\x82\xdf\x05\
+\xa2\xbe\xaf\xaf\x53\xf1\xb2\xa1\xb3\x84\x0d\x9d\x25\x00\x58\x4c\
+\x66\x06\x27\xe5\x31\x29\x75\x08\x13\xd3\x06\x71\x7a\x4a\x7f\x86\
+\x25\x17\xc8\xde\x03\x51\xa0\x3d\xd0\x49\x95\xbb\x81\x32\x57\x35\
+\x65\xae\x6a\xaa\xdc\xf5\xf8\xb5\x40\xa4\xd3\x0a\x46\x27\xfa\x27\
+\xfd\x47\xd1\x47\x77\x4b\x52\x48\xc9\x02\x40\x0a\x97\x32\xf4\x5e\
+\x02\x0f\xa2\xb7\x19\xbe\x03\x18\x13\xc9\x84\x7a\x43\xd1\x54\x2a\
+\x3c\x36\x2a\x3c\x36\xde\x68\xdd\x02\x40\x6e\x42\x3a\xa3\x53\x8a\
+\x18\x9d\x52\xfc\xe5\x6b\xa0\x35\x47\x16\x05\x21\xa2\x01\x36\x5f\
+\x2b\x35\x9e\x46\xaa\xdd\xf5\x54\x7b\x1a\xa9\xf6\x34\xd0\x19\x70\
+\x46\x3a\x35\xa3\x0e\xa0\x3f\x36\x7b\x1e\xe8\x88\x6c\x2a\x52\x5f\
+\x22\x0b\x00\x29\xdc\x3a\xd0\x97\x36\xff\x0a\x9c\x87\xbe\x22\x70\
+\x15\x90\x14\xc9\xa4\x82\xd1\x1a\x70\xf0\x79\x67\x29\x9f\x77\x7e\
+\x35\x51\x35\xcd\x92\xc4\xc8\xe4\x42\x86\x27\xf7\x63\x78\x52\x3f\
+\x86\x27\x17\x30\x3c\xb9\x1f\x79\x09\x11\xeb\xa4\x1c\x93\xda\x03\
+\x0e\xea\xbd\x36\xea\x3d\xcd\xfa\x57\xaf\x8d\x5a\x4f\x63\xac\x2d\
+\xe5\x77\xc7\x03\xbc\x86\x7e\x94\x6f\x6d\x84\x73\x91\xfa\x28\x59\
+\x00\x48\x91\xa2\xa1\x8f\x24\x5d\x83\xbe\x47\xe0\xdb\xe8\x8f\x08\
+\x62\x66\x55\xe0\x44\x9c\x8a\x97\x1d\xce\x2a\x76\x38\xab\x8e\xf9\
+\xfd\x4c\x4b\x0a\xc3\x92\x0b\x18\x64\xcd\x65\x60\x52\xae\xfe\xb5\
+\xeb\xd7\x99\x96\xa8\x69\xa1\x10\x56\x4e\xc5\x4d\xb3\xcf\x8e\xed\
+\xcb\x57\x2b\x4d\xbe\x56\x1a\xbc\xcd\xb8\x94\xb8\x9d\x5b\xb3\x1f\
+\xfd\xa6\xff\x6f\xa0\x35\xc2\xb9\x48\x7d\x9c\x2c\x00\xa4\x68\xd0\
+\x02\xfc\xa9\xeb\x35\x15\xbd\x18\xb8\x06\x88\x9b\x83\xfa\x1d\x8a\
+\x9b\x9d\xce\x2a\x76\x1e\x57\x18\x80\x5e\x1c\x14\x26\x66\x51\x64\
+\xcd\xa2\x28\x31\x8b\x42\x6b\x16\x85\x89\x99\x14\x26\x66\x91\x93\
+\x90\x46\x5e\x42\x3a\x19\x96\xe4\x08\x64\x1d\x3c\xb7\xe2\xa1\x3d\
+\xe0\xc4\xa1\x38\x69\xf5\x77\x60\xff\xf2\xd5\x4e\xab\xbf\x1d\xbb\
+\xbf\x23\x9e\x6f\xf2\xc7\xb3\x03\xcb\xd1\x6f\xfa\x1b\x23\x9c\x8b\
+\x24\x7d\x49\x16\x00\x52\xb4\xf9\xbc\xeb\xb5\x14\xb8\x0c\xbd\x18\
+\x98\x0f\x58\x22\x99\x54\x28\x75\x28\x6e\x3a\x14\x37\x25\x9e\x93\
+\xcf\x6e\xb1\x9a\x12\xc8\x4e\x48\x25\x2f\x21\x9d\xdc\x84\x34\x32\
+\x2c\x29\xa4\x5b\x92\xc9\xb4\x24\x93\x61\x49\x26\xfd\xc8\xcb\x9c\
+\x8c\xc5\x64\x26\xdd\x92\x84\xd5\x94\x40\xa7\x81\x9b\xac\x4b\x71\
+\x53\xe7\xb5\x11\x50\x03\xb8\x55\x2f\x8a\xa6\xe0\x51\x7d\xb8\x15\
+\x0f\x6e\xc5\x8b\x4b\x75\xe3\x52\xbc\x5d\xff\xdb\x43\x87\xe2\xa4\
+\x23\xe0\xc4\x11\x70\x12\xd0\x94\xa0\xaf\x1b\x27\x02\xe8\x9b\x5f\
+\xff\x0d\xbc\x0d\x78\x23\x9b\x8e\x24\x7d\x9d\xdc\xad\x24\xc5\x82\
+\x22\x60\x09\xfa\xaa\xc0\x34\xe4\xf7\xad\x14\x9d\x54\xe0\x33\xf4\
+\xde\xfc\x2b\xd0\x1b\x64\x49\x52\xd4\x92\x6f\xa4\x52\xac\x19\x88\
+\xbe\x69\x70\x09\xb2\x18\x90\xa2\xc3\x3e\xf4\x1b\xfe\xbf\x81\xf2\
+\x08\xe7\x22\x49\x3d\x26\xdf\x3c\xa5\x58\x36\x02\xb8\x12\xb8\x02\
+\x98\x42\x14\x37\x1a\x92\xe2\x8a\x8a\xfe\x2c\xff\x0d\xe0\x75\xe4\
+\x4d\x5f\x8a\x51\xb2\x00\x90\xe2\x45\x3e\xb0\x10\x7d\x65\x60\x1e\
+\x60\x8d\x6c\x3a\x52\x9c\x51\xd0\x6f\xfa\x2b\xba\x5e\x72\x02\x9f\
+\x14\xf3\x64\x01\x20\xc5\xa3\x34\xe0\x02\xe0\x12\xf4\xa2\x60\x60\
+\x64\xd3\x91\x62\x94\x0d\xf8\x14\x58\x89\xbe\x91\x4f\x0e\xe1\x91\
+\xe2\x8a\x2c\x00\xa4\x78\x67\x02\xce\x02\x16\x74\xbd\xce\x45\x9e\
+\x7e\x91\x4e\x2c\x80\xfe\x29\xff\x7d\xf4\x5e\xfc\xdb\x91\x7d\xf8\
+\xa5\x38\x26\x0b\x00\xa9\xaf\x49\x43\xef\x35\x30\xa7\xeb\x75\x16\
+\xf2\xe7\xa0\x2f\x2b\x07\x3e\xee\x7a\x7d\x84\xfc\x94\x2f\xf5\x21\
+\xf2\x8d\x4f\xea\xeb\x8a\xd0\x1f\x17\xcc\x00\x66\x02\x63\x91\x9b\
+\x09\xe3\x95\x0a\xec\x05\xd6\x01\xeb\x81\xd5\xc8\xa3\x7a\x52\x1f\
+\x26\x0b\x00\x49\x3a\x56\x2e\x30\x1d\xbd\x20\x98\x81\xbe\x42\x10\
+\x5b\x6d\xf8\xa4\x23\xdc\xc0\x36\xf4\x9b\xfd\x7a\x60\x03\x7a\x57\
+\x3e\x49\x92\x90\x05\x80\x24\x9d\x4a\x02\x30\x1a\x38\xbb\xeb\x35\
+\x1d\x38\x13\xb9\x4a\x10\x8d\xca\xd1\x6f\xf2\x5b\xbb\x5e\x5f\x20\
+\x3b\xf0\x49\xd2\x49\xc9\x02\x40\x92\x7a\x2f\x03\x98\x00\x4c\x04\
+\x26\x75\x7d\x1d\x07\xa4\x46\x32\xa9\x3e\xc4\x05\xec\x01\x76\x00\
+\x3b\xbb\x5e\xbb\x80\xce\x48\x26\x25\x49\xb1\x46\x16\x00\x92\x24\
+\x86\x05\x18\x89\x5e\x08\x8c\x06\xce\x40\x9f\x6c\x38\x1a\x59\x18\
+\x04\xcb\x05\x1c\xe8\x7a\xed\xeb\xfa\xba\x07\x28\x45\x3f\x97\x2f\
+\x49\x92\x01\xb2\x00\x90\xa4\xd0\x32\x03\x43\x80\x51\xc0\x70\xf4\
+\xee\x85\x47\x7f\x4d\x8f\x5c\x6a\x51\xa1\x13\x7d\xe9\xbe\xac\xeb\
+\xeb\x91\x5f\x1f\x02\x0e\x23\x8f\xe1\x49\x52\xc8\xc8\x02\x40\x92\
+\x22\xab\x00\xbd\x51\xd1\x40\x60\x30\x30\xe0\xa8\x5f\x17\x74\xbd\
+\xf2\x89\xbd\x9f\x55\x0d\x68\x46\x6f\xa6\xd3\x04\x54\x03\x35\x40\
+\x2d\x50\xd5\xf5\xeb\x9a\xae\x3f\x97\x24\x29\x02\x62\xed\x4d\x45\
+\x92\xfa\x22\x0b\x5f\x15\x02\x47\xbe\x66\x03\x59\xc7\x7d\xcd\x40\
+\xef\x73\x90\x82\x7e\x72\x21\x1d\x48\xec\xfa\xf3\x23\x9b\x16\xcd\
+\x5d\xbf\x7f\xfc\x78\x65\x05\x70\xa0\x1f\x95\xa3\xeb\x6b\x3b\xe0\
+\xef\xfa\x7d\x0f\xfa\xae\x7a\x47\xd7\xab\xad\xeb\xcf\xdb\x8e\xfa\
+\xf5\x91\x1b\xfe\x91\xaf\x72\x99\x5e\x92\xa2\xd8\xff\x07\xf7\x02\
+\xef\x82\x25\xa1\xc8\x69\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\
+\x60\x82\
+\x00\x00\x23\x59\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x02\x00\x00\x00\x02\x00\x08\x06\x00\x00\x00\xf4\x78\xd4\xfa\
+\x00\x00\x00\x04\x73\x42\x49\x54\x08\x08\x08\x08\x7c\x08\x64\x88\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
+\x01\x95\x2b\x0e\x1b\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\
+\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\
+\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x20\x00\x49\x44\
+\x41\x54\x78\x9c\xed\xdd\x79\xb8\x5d\x55\x7d\xff\xf1\xf7\xbd\x21\
+\x09\x99\x00\x01\x35\x04\x23\x04\x8a\x28\xa3\xca\x20\x32\x19\x10\
+\x87\x52\x11\xfb\xab\x88\xa2\xd2\x56\x05\x87\x5f\xab\x55\xeb\x4f\
+\xab\x1d\x6c\xad\xad\xfa\xe8\x0f\xb1\x15\x07\x9e\xfa\x08\x56\x10\
+\x95\xe1\x87\x20\x0e\xa8\xa0\x20\x2a\x20\x09\xb3\x0c\x49\x50\x24\
+\x8c\x86\x21\x09\x99\xf3\xfb\x63\xdd\xdb\x5c\x92\x73\xef\x3d\xe7\
+\xdc\xbd\xf7\x77\xed\xbd\xdf\xaf\xe7\xf9\x3e\x19\xb0\xbd\x9f\x7b\
+\xf6\x3d\x59\xdf\xb3\xd6\xda\x6b\x83\x24\x49\x92\x24\x49\x92\x24\
+\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\
+\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\
+\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\
+\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\
+\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\
+\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\
+\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\
+\x92\x24\x49\x92\x24\x29\x2f\x03\xd1\x01\xa4\x51\x0c\x00\xcf\x02\
+\x76\x07\x76\x05\x56\x03\xeb\x86\x6a\x09\x70\x17\xf0\x44\x50\x36\
+\x49\x92\x54\xa0\xb9\xc0\x3b\x80\x4b\x81\x15\xc0\xc6\x31\x6a\x03\
+\x70\x13\x70\x3a\xf0\x12\x6c\x66\x25\x49\xaa\x9d\x83\x81\x8b\x48\
+\x83\xfa\x58\x83\xfe\x58\xb5\x08\x78\x1f\x30\xbd\xe2\xec\x92\x24\
+\xa9\x47\x07\x01\x3f\xa4\xff\x41\xbf\x53\xdd\x0f\xbc\x0d\x67\x04\
+\x24\x49\xca\xce\x1c\xe0\x2c\x60\x3d\xc5\x0e\xfe\x23\xeb\xa7\xc0\
+\x2e\x55\x7d\x43\x92\x24\x69\x74\xd3\x80\xbf\x07\x96\x53\xde\xc0\
+\x3f\xb2\x1e\x06\x5e\x5e\xc9\x77\x26\x49\x92\x3a\x3a\x8e\xb4\x4e\
+\x5f\xc5\xc0\x3f\xb2\xd6\x01\x27\x57\xf0\xfd\x49\x92\xa4\x11\x0e\
+\x02\xae\xa2\xfa\x81\x7f\xf3\x26\xe0\xa4\xb2\xbf\x51\x49\x92\x94\
+\xd6\xf9\xbf\x44\xb9\xeb\xfc\xbd\xd4\x1a\x60\x7e\x99\xdf\xb0\x24\
+\x49\x6d\x56\xf5\x3a\x7f\x2f\xf5\x00\xf0\x8c\xf2\xbe\x75\x49\x92\
+\xda\x29\x6a\x9d\xbf\x97\xba\xa8\xb4\xef\x5e\x92\xa4\x96\x39\x80\
+\x74\xdb\x5d\xf4\xe0\xde\x6d\x1d\x5b\xce\xcb\x20\x49\x52\x3b\xe4\
+\xb6\xce\xdf\x6d\xdd\x08\x0c\x96\xf0\x7a\x48\x92\xd4\x68\xd3\x80\
+\x0f\x02\x8f\x13\x3f\x98\xf7\x5b\x7f\x52\xf8\xab\x22\x49\x52\x83\
+\xd5\x61\x9d\xbf\x9b\xfa\x7f\x45\xbf\x30\x92\x24\x35\x51\x0e\xf7\
+\xf3\x17\x59\x6b\x81\xa7\x15\xfa\x0a\x49\x92\xd4\x20\x75\x5d\xe7\
+\xef\xa6\x5e\x5b\xe0\xeb\x24\x49\x52\x23\xe4\x7c\x3f\x7f\x51\x75\
+\x46\x61\xaf\x96\x24\x49\x0d\xd0\x94\x75\xfe\xf1\xea\x27\x45\xbd\
+\x60\x92\x24\xd5\x59\xd3\xd6\xf9\xc7\xab\xa5\xc5\xbc\x6c\x92\x24\
+\xd5\x53\x93\xd7\xf9\xc7\xaa\xd5\x45\xbc\x78\x92\x24\xd5\x4d\x13\
+\xee\xe7\x9f\x68\x6d\x35\xe1\x57\x51\x92\xa4\x9a\x18\x00\x4e\x04\
+\x96\x10\x3f\x00\x47\xd6\x06\x6c\x00\x24\x49\x2d\x51\xb7\x73\xfb\
+\xcb\xac\x65\x13\x7c\x2d\x25\x49\xca\xde\x1c\xe0\xab\xb4\x6f\x9d\
+\x7f\xac\xba\x73\x22\x2f\xa8\x24\x49\x39\x73\x9d\x7f\xf4\xba\x70\
+\x02\xaf\xab\x24\xd5\x9a\xeb\x9f\xcd\x76\x1c\x70\x3a\x30\x2f\x3a\
+\x48\xa6\x16\x46\x07\x90\x24\xa9\x48\x6d\xbb\x9f\xbf\xdf\xf2\x89\
+\x80\x92\xa4\x46\x68\xeb\xfd\xfc\xfd\xd4\x3a\x60\xbb\xfe\x5e\x66\
+\x49\x92\xf2\xe0\x3a\x7f\xef\xf5\xab\xbe\x5e\x69\x49\x6a\x08\xf7\
+\x00\xd4\x9f\xeb\xfc\xfd\xb9\x22\x3a\x80\x24\x49\xfd\xf0\x7e\xfe\
+\x89\x95\xeb\xff\x92\xa4\x5a\x19\x5e\xe7\x5f\x47\xfc\x20\x5a\xd7\
+\x72\xfd\x5f\x92\x54\x1b\xc3\xeb\xfc\x8f\x11\x3f\x80\xd6\xbd\x5c\
+\xff\x97\xd4\x7a\xee\x01\xa8\x07\xd7\xf9\x8b\x75\x45\x74\x00\x49\
+\x92\xc6\xe2\x3a\x7f\x39\xe5\xfa\xbf\x24\x29\x4b\xae\xf3\x97\x57\
+\xae\xff\x4b\x92\xb2\xe3\x3a\x7f\xf9\xe5\xfa\xbf\x24\xe1\x1e\x80\
+\x9c\xb8\xce\x5f\x8d\x2b\xa2\x03\x48\x92\x04\xae\xf3\x57\x5d\xae\
+\xff\x4b\x92\x42\xb9\xce\x5f\x7d\xb9\xfe\x2f\x49\x0a\xe3\x3a\x7f\
+\x5c\x5d\xdb\xc5\xf5\x91\xa4\x56\x70\x0f\x40\xb5\x5c\xe7\x8f\x75\
+\x45\x74\x00\x49\x52\xbb\xb8\xce\x9f\x47\xbd\x6a\xbc\x0b\x25\x49\
+\x52\x11\x5c\xe7\xcf\xa7\x5c\xff\x97\x24\x95\x6e\x0a\xf0\x1e\x5c\
+\xe7\xcf\xa9\x5c\xff\x97\xa4\x11\xdc\x03\x50\x3c\xd7\xf9\xf3\x74\
+\x45\x74\x00\x49\xca\xc9\x60\x74\x80\x06\x19\x5e\xe7\xbf\x18\x07\
+\xff\x1c\x5d\x19\x1d\x40\x92\xd4\x2c\xae\xf3\xe7\x5f\xae\xff\x4b\
+\x92\x0a\xe3\x3a\x7f\x7d\xca\xf5\x7f\x49\xda\x8c\x7b\x00\xfa\xe3\
+\x3a\x7f\xbd\x5c\x11\x1d\x40\x92\x72\xe3\x1e\x80\xde\xb8\xce\x5f\
+\x4f\xae\xff\x4b\x92\xfa\xe2\x3a\x7f\x7d\xcb\xf5\x7f\x49\x52\xcf\
+\x5c\xe7\xaf\x7f\x5d\xb7\xc5\x55\x95\x24\xb9\x07\x60\x14\x03\xc0\
+\xeb\x80\x4f\x02\xbb\x04\x67\xd1\xc4\xfc\x22\x3a\x80\x24\xe5\xc8\
+\x06\x60\x4b\x07\x00\xa7\x01\x47\x44\x07\x51\x21\xee\x8a\x0e\x20\
+\x49\x39\x72\x13\xe0\x26\x73\x80\xaf\x02\xbf\xc2\xc1\xbf\x49\x1e\
+\x8b\x0e\x20\x49\x39\x72\x06\x20\xad\xf3\xbf\x13\xf8\x17\x60\x9b\
+\xe0\x2c\x2a\xde\xec\xe8\x00\x92\x94\xa3\x36\x37\x00\xae\xf3\xb7\
+\xc3\x01\xd1\x01\x24\x49\xf9\x38\x10\xb8\x8a\xf8\x1d\xea\x56\xf9\
+\xb5\x02\x98\x89\x24\xe9\x29\x26\x45\x07\xa8\xd8\x1c\xe0\xd3\xc0\
+\x19\xf8\xa9\xbf\x2d\x26\x0f\xfd\xfa\xe3\xd0\x14\x92\xa4\x10\xd3\
+\x80\x8f\x00\x4f\x10\xff\x89\xd4\xaa\xbe\x56\x03\x07\x23\x49\x6a\
+\x8d\x01\xe0\x44\x60\x09\xf1\x83\x90\x15\x5b\x7f\x00\x0e\x42\x92\
+\xd4\x78\x07\x02\x3f\x23\x7e\xe0\xb1\xf2\xa9\x35\xc0\xc7\x80\x59\
+\x48\x52\xcb\x0d\x44\x07\x28\xc1\x1c\xe0\xdf\x80\x37\xe3\x39\x07\
+\xea\x6c\x25\xf0\x1d\x60\x01\xf0\x3b\x52\x63\x20\x8d\x67\x23\xf0\
+\xe8\xd0\xef\x57\x93\x7e\x8e\x20\x2d\x2d\xae\x03\x36\x00\x8f\x0c\
+\xfd\x59\xca\x5e\x93\x1a\x80\x69\xc0\xfb\x80\x0f\xe1\xae\x6f\x49\
+\x71\xd6\x90\x1a\x81\xe1\x7a\x18\x78\x68\xc4\xef\x1f\x00\x16\x0f\
+\xd5\x03\x41\x19\xa5\x46\x34\x00\xde\xcf\x2f\xa9\xae\x9e\x64\x53\
+\x33\xb0\x98\xb4\x5f\x69\x31\x70\x27\x70\x3b\xb0\x36\x2c\x99\x1a\
+\xaf\xee\x0d\xc0\x0b\x81\xcf\xe2\xd1\xbd\x92\x9a\x67\x1d\x70\x07\
+\x70\x0b\x70\x2b\x70\xfd\xd0\xef\x17\x45\x86\x52\x73\xd4\xb5\x01\
+\x98\x03\x7c\x1c\x38\x19\xd7\xf9\x25\xb5\xcb\x43\xc0\x42\x52\x43\
+\x70\x15\xf0\x73\xd2\x5d\x2e\x52\x4f\xea\xd6\x00\x78\x6e\xbf\x24\
+\x6d\x69\x11\x70\x35\xa9\x21\xb8\x9a\x34\x63\xb0\x31\x34\x91\xb2\
+\x57\x97\x06\xc0\x75\x7e\x49\xea\xde\xfd\xa4\x66\xe0\x72\xe0\x32\
+\xe0\xb7\xb1\x71\x94\xa3\x3a\x34\x00\xae\xf3\x4b\xd2\xc4\x2c\x22\
+\x35\x03\x97\x00\x3f\x20\xdd\xc6\xa8\x96\xcb\xb9\x01\x70\x9d\x5f\
+\x92\x8a\xb7\x9c\x4d\x33\x03\xdf\x05\xee\x8d\x8d\xa3\x28\x39\x36\
+\x00\xae\xf3\x4b\x52\x75\xae\x07\xbe\x06\x7c\x0b\xb8\x2f\x38\x8b\
+\x2a\x94\x5b\x03\x70\x1c\x70\x3a\x30\x2f\x3a\x88\x24\xb5\xcc\x06\
+\xe0\x1a\x52\x23\xf0\x0d\x3c\xa4\xa8\xf1\x72\x69\x00\x0e\x04\x4e\
+\x03\x0e\x8f\x0e\x22\x49\x62\x1d\xf0\x23\xe0\x3c\xe0\xdb\x78\xbc\
+\x71\x23\x45\x37\x00\x3b\x01\x1f\x05\xde\x0a\x4c\x8a\x8d\x22\x49\
+\xea\x60\x15\xe9\xd9\x19\x5f\x26\xed\x1d\x50\x43\x44\x35\x00\xae\
+\xf3\x4b\x52\xfd\xdc\x0a\x9c\x0d\x9c\x89\x87\x0f\xd5\x5e\x44\x03\
+\xe0\x3a\xbf\x24\xd5\xdb\xc8\x59\x81\x1f\xe1\xa1\x43\xb5\x54\x65\
+\x03\xe0\xfd\xfc\x92\xd4\x3c\x0b\x48\x7b\xb8\xce\xc5\x87\x17\xd5\
+\x4a\x15\x0d\x80\xeb\xfc\x92\xd4\x7c\x4b\x49\x33\x02\x9f\x05\x1e\
+\x0d\xce\xa2\x2e\x94\xd9\x00\xb8\xce\x2f\x49\xed\xf3\x38\xf0\x55\
+\xe0\xd3\xc0\xef\x62\xa3\x68\x2c\x65\x34\x00\x03\xc0\x09\xc0\xa7\
+\xf0\xdc\x7e\x49\x6a\xab\x35\xc0\x39\xa4\x67\xb8\xdc\x1e\x9c\x45\
+\x1d\x14\xdd\x00\xb8\xce\x2f\x49\x1a\x69\x03\x70\x3e\xf0\x11\xe0\
+\xce\xe0\x2c\x1a\xa1\xa8\x33\xf6\x77\x02\xbe\x04\xfc\x0a\x07\x7f\
+\x49\xd2\x26\x83\xa4\x59\xe1\x5b\x48\xb7\x10\xee\x16\x1b\x47\xc3\
+\x26\xba\x29\x6f\x0a\xf0\x57\xa4\xee\xee\x50\x7c\x68\x8f\x24\xa9\
+\xb3\x49\xc0\xfe\xa4\xbd\x61\x73\x81\x5f\xe3\x09\x83\xa1\xfa\x5d\
+\x02\x70\x9d\x5f\x92\x34\x11\x2b\x81\x33\x80\x7f\x03\x96\x05\x67\
+\x69\xa5\x7e\x1a\x00\xd7\xf9\x25\x49\x45\xf9\x03\xe9\x6e\xb1\xcf\
+\x93\x9e\x41\xa0\x8a\xf4\xd2\x00\xcc\x06\xfe\x1d\x38\x19\xa7\xfa\
+\x25\x49\xc5\xba\x09\xf8\x1b\xe0\xc7\xd1\x41\xda\xa2\xdb\x06\xe0\
+\x04\xe0\x0b\xc0\x0e\x25\x66\x91\x24\xe9\x12\x52\x23\x70\x77\x74\
+\x90\xa6\x1b\xaf\x01\x98\x05\xfc\x37\xf0\xea\x0a\xb2\x48\x92\x04\
+\xe9\x59\x03\xa7\x91\xf6\x07\x2c\x0f\xce\xd2\x58\x63\x35\x00\xb3\
+\x81\x4b\x49\x6b\xfe\x92\x24\x55\x6d\x29\xe9\x4e\xb3\x0b\xa2\x83\
+\x34\xd1\x68\xb7\x01\xee\x0c\xfc\x1c\x78\x5e\x85\x59\x24\x49\x1a\
+\x69\x16\x70\x22\x69\x2c\xfa\x19\xb0\x22\x36\x4e\xb3\x74\x6a\x00\
+\x66\x02\x97\x03\xcf\xad\x38\x8b\x24\x49\x9d\xec\x03\xbc\x8d\x74\
+\xbb\xe0\xaf\x83\xb3\x34\xc6\xe6\xbb\xf9\x07\x80\xaf\x03\xcf\x0f\
+\xc8\x22\x49\xd2\x68\xb6\x23\x9d\x38\xfb\x7d\x60\x5e\x70\x96\x46\
+\xd8\xbc\x01\xf8\x73\xdc\xf0\x27\x49\xca\xd7\xcb\x48\xb7\x0c\xbe\
+\x17\x6f\x49\x9f\x90\x91\x9b\x00\x77\x04\x6e\x1b\xfa\x55\x92\xa4\
+\xdc\x5d\x03\xbc\x11\x58\x1c\x1d\xa4\x8e\x46\x76\x4f\xff\x88\x83\
+\xbf\x24\xa9\x3e\x5e\x0c\xdc\x00\x9c\x14\x1d\xa4\x8e\x86\x67\x00\
+\x76\x00\xee\x01\x66\x04\x66\x91\x24\xa9\x5f\x5f\x03\xde\x85\xe7\
+\x06\x74\x6d\x78\x06\xe0\xaf\x71\xf0\x97\x24\xd5\xd7\x9b\x49\xb3\
+\x01\x07\x47\x07\xa9\x8b\xe1\xdb\x00\xcf\x00\x9e\x1e\x19\x44\x92\
+\xa4\x09\xda\x1e\xf8\x0b\x60\x3d\x70\x35\xb0\x31\x34\x4d\xe6\x06\
+\x80\x3d\x80\x3b\xa2\x83\x48\x92\x54\xa0\x9f\x00\xaf\x07\x1e\x8c\
+\x0e\x92\xab\x41\xe0\xd8\xe8\x10\x92\x24\x15\xec\x28\xe0\x17\x78\
+\xae\xcd\xa8\x06\x81\xfd\xa2\x43\x48\x92\x54\x82\x79\xa4\x5b\x05\
+\xdf\x12\x1d\x24\x47\x83\xc0\x5e\xd1\x21\x24\x49\x2a\xc9\xd6\xc0\
+\x7f\x91\x4e\x11\x9c\x12\x9c\x25\x2b\x03\xa4\xa7\x2d\xcd\x8e\x0e\
+\x22\x49\x52\xc9\xae\x06\x5e\x07\xdc\x17\x1d\x24\x07\x83\xa4\xee\
+\x48\x92\xa4\xa6\x3b\x0c\xb8\x0e\x38\x30\x3a\x48\x0e\x06\x81\xa9\
+\xd1\x21\x24\x49\xaa\xc8\x4e\xc0\x15\xc0\xf1\xc1\x39\xc2\x0d\x02\
+\x6b\xa3\x43\x48\x92\x54\xa1\x19\xc0\xf9\xa4\x43\xf0\x5a\x6b\x90\
+\xb4\x07\x40\x92\xa4\x36\x99\x04\x7c\x0e\x38\x9d\x96\x3e\x55\x70\
+\x10\xb8\x37\x3a\x84\x24\x49\x41\xde\x0d\x7c\x1b\x98\x1e\x1d\xa4\
+\x6a\x83\xc0\x8d\xd1\x21\x24\x49\x0a\xf4\xa7\xc0\x8f\x81\x67\x44\
+\x07\xa9\xd2\x20\xf0\xb3\xe8\x10\x92\x24\x05\x7b\x11\xe9\xe4\xc0\
+\x79\xd1\x41\xaa\x32\x00\xec\x48\xda\x07\xb0\x55\x70\x16\x49\x92\
+\xa2\xdd\x03\x1c\x03\xdc\x15\x1d\xa4\x6c\x83\xc0\xc3\xc0\x0f\xa2\
+\x83\x48\x92\x94\x81\x5d\x80\xab\x80\x7d\xa3\x83\x94\x6d\x78\xe7\
+\xe3\x59\xa1\x29\x24\x49\xca\xc7\x33\x81\x2b\x81\x83\xa3\x83\x94\
+\x69\x60\xe8\xd7\x29\xc0\x6d\xc0\x6e\x81\x59\x24\x49\xca\xc9\xa3\
+\xa4\x27\xe6\x5e\x13\x1d\xa4\x0c\x93\x86\x7e\x5d\x0f\x2c\x23\xed\
+\x84\x94\x24\x49\xe9\xa8\xfc\x13\x81\x5f\x02\x8b\x83\xb3\x14\x6e\
+\x60\xc4\xef\x07\x49\x3b\x20\x0f\x0a\xca\x22\x49\x52\x8e\x9e\x04\
+\xfe\x98\xb4\x2c\xd0\x18\x03\x9b\xfd\xf9\x8f\x80\x1b\x80\x99\x01\
+\x59\x24\x49\xca\xd5\x0a\xe0\x95\xa4\x0d\x82\x8d\xb0\xf9\xf1\x87\
+\x77\x01\xef\x8f\x08\x22\x49\x52\xc6\x66\x00\x17\x03\xfb\x47\x07\
+\x29\xca\xa4\x0e\x7f\x77\x3d\x30\x0d\x38\xbc\xe2\x2c\x92\x24\xe5\
+\x6c\x1a\xf0\x67\xc0\xa5\xc0\x43\xc1\x59\x26\x6c\xf3\x25\x80\x91\
+\x7f\xff\x25\xe0\x94\x0a\xb3\x48\x92\x54\x07\xbf\x07\x8e\xa0\xe6\
+\x1b\x03\x47\x7b\x02\xd2\x46\xe0\x54\xe0\x6f\x80\x0d\xd5\xc5\x91\
+\x24\x29\x7b\x3b\x03\x57\x90\x0e\x0d\xaa\xad\xd1\x66\x00\x46\xfa\
+\x53\xd2\x6c\xc0\xd3\x4b\xce\x22\x49\x52\x9d\xdc\x06\x1c\x46\xba\
+\x8d\xbe\x76\xba\x79\x06\xf2\x85\xc0\xde\xc0\xb9\x25\x67\x91\x24\
+\xa9\x4e\x9e\x47\x1a\x23\xa7\x46\x07\xe9\x47\xa7\x4d\x80\x9d\xac\
+\x04\xce\x27\xdd\x03\xf9\x7c\x60\x76\x69\x89\x24\x49\xaa\x8f\x5d\
+\x81\x3d\x48\x63\x64\xad\x74\xdb\x00\x0c\x5b\x02\x9c\x09\x2c\x02\
+\x5e\x8c\xe7\x05\x48\x92\xb4\x0f\x69\x46\xfd\x27\xd1\x41\x7a\xd1\
+\x6b\x03\x00\x69\x83\xe0\x42\xe0\x8b\xc0\x5a\xe0\x10\x7c\x94\xb0\
+\x24\xa9\xdd\x5e\x02\x3c\x00\x5c\x17\x1d\xa4\x5b\xfd\x34\x00\xc3\
+\xd6\x92\x76\x41\x9e\x0d\xec\x08\xec\x47\x77\x9b\x0a\x25\x49\x6a\
+\xa2\x57\x90\x8e\xd4\x5f\x14\x1d\xa4\x1b\x45\x0e\xd8\xf3\x81\xd3\
+\x48\x7b\x04\x24\x49\x6a\xa3\xc7\x48\x07\xe9\xdd\x1c\x1d\x64\x3c\
+\x45\x7f\x62\x1f\x04\xde\x04\x7c\x12\x37\x0a\x4a\x92\xda\xe9\x1e\
+\xe0\x00\xe0\x91\xe8\x20\x63\x99\xc8\x12\x40\x27\xee\x0f\x90\x24\
+\xb5\xdd\x76\xc0\x0b\x80\x73\x48\xe3\x62\x96\x8a\x6e\x00\x86\xb9\
+\x3f\x40\x92\xd4\x66\xbb\x0f\xfd\x7a\x45\x64\x88\xb1\x94\xd5\x00\
+\x0c\x7b\x9c\x74\x48\x82\xe7\x07\x48\x92\xda\xe6\x48\xe0\x46\xe0\
+\xf6\xe8\x20\x9d\x54\xf9\xa9\xdc\xfd\x01\x92\xa4\xb6\x79\x02\x38\
+\x98\x0c\x9b\x80\x88\x69\xf9\x19\xc0\x07\x80\x0f\x02\x5b\x07\x7c\
+\x7d\x49\x92\xaa\x74\x13\xe9\xf0\xbc\x15\xd1\x41\x46\x2a\x7b\x09\
+\xa0\x93\xe1\xfd\x01\xe7\x02\x73\x49\x67\x29\x4b\x92\xd4\x54\xcf\
+\x24\x1d\x19\x7c\x41\x70\x8e\xa7\x88\x68\x00\x86\x2d\x03\xbe\x89\
+\xfb\x03\x24\x49\xcd\xb7\x2f\xe9\xf6\xc0\x05\xd1\x41\x86\xe5\xb2\
+\x33\xdf\xfd\x01\x92\xa4\xa6\x5b\x01\xbc\x10\xb8\x23\x3a\x08\xe4\
+\xd3\x00\x0c\x73\x7f\x80\x24\xa9\xc9\xae\x03\x0e\x25\x2d\x87\x87\
+\x8a\x5c\x02\xe8\xc4\xf3\x03\x24\x49\x4d\x36\x87\x34\xae\x85\x3f\
+\x39\x30\xf7\xc1\x75\x3e\x3e\x5f\x40\x92\xd4\x2c\x1b\x80\x97\x12\
+\x7c\x48\x50\xee\x0d\x00\xb8\x3f\x40\x92\xd4\x3c\xf7\x02\xfb\x03\
+\x7f\x88\x0a\x90\xdb\x12\x40\x27\xc3\xcf\x17\x38\x93\x94\xf7\x40\
+\x7c\xbe\x80\x24\xa9\xde\xb6\x01\x9e\x0d\x9c\x1f\x15\xa0\x0e\x0d\
+\xc0\xb0\xd5\xc0\xe5\xc0\x59\xb8\x3f\x40\x92\x54\x7f\xfb\x92\x0e\
+\x09\xba\x2d\xe2\x8b\xd7\x79\x00\x9d\x8f\xfb\x03\x24\x49\xf5\x76\
+\x3f\xb0\x17\xe9\x6c\x9c\x4a\xd5\x69\x06\x60\x73\x4b\x48\xcb\x02\
+\x8b\x48\x47\x2c\xce\x0c\x4d\x23\x49\x52\xef\x66\x02\xdb\x03\xdf\
+\xa9\xfa\x0b\xd7\xb9\x01\x80\x4d\xfb\x03\xbe\x48\xba\x85\xf0\x10\
+\xdc\x1f\x20\x49\xaa\x97\x17\x02\x57\x93\x3e\xd0\x56\xa6\xce\x4b\
+\x00\x9d\xcc\x05\x3e\x4e\xba\x6b\xa0\x69\xdf\x9b\x24\xa9\xb9\xee\
+\x24\xdd\x15\xf0\x64\x55\x5f\xb0\xa9\x83\xe4\x7c\xdc\x1f\xa0\xce\
+\xd6\x93\xa6\xda\xce\x01\x7e\x4d\xba\x15\x67\x75\x68\x22\xd5\xc9\
+\x76\xa4\x7f\x37\xb7\x02\x66\x91\xa6\x6f\x77\x18\xaa\x1d\x87\x6a\
+\x2e\xe9\xc1\x2f\xbb\x0c\x95\xa7\x9a\xaa\x5b\x9f\x04\x3e\x54\xd5\
+\x17\x6b\x6a\x03\x00\x69\x79\xe3\x2d\xc0\xc7\x48\x4f\x62\x92\x6e\
+\x04\xde\x06\x5c\x1b\x1d\x44\xad\xf2\x2c\x60\x6f\xd2\x9d\x4b\xfb\
+\x02\xfb\x0c\xfd\x79\x4a\x64\x28\x65\x69\x1d\xf0\x22\xd2\x87\x93\
+\xd2\x35\xb9\x01\x18\xb6\x0d\xf0\x11\xe0\x3d\xc0\xd4\xe0\x2c\x8a\
+\xf3\x4b\xe0\xe5\xc0\xe3\xd1\x41\x24\xd2\xac\xc0\x01\xa4\x0d\xcc\
+\x87\x0d\xfd\xea\x07\x15\x41\xfa\x80\x72\x08\xe9\xb4\x40\x15\x64\
+\x77\xd2\x81\x0b\x1b\xad\xd6\xd5\x52\xd2\x2e\x5b\x29\x67\xfb\x02\
+\x7f\x0b\xfc\x10\x58\x45\xfc\xfb\xc6\x8a\xab\xbf\x44\xa5\x98\x0f\
+\xdc\x40\xfc\x05\xb6\xaa\xab\x37\x21\xd5\xcb\x0c\xe0\xd5\xa4\x07\
+\xa3\x3d\x4a\xfc\x7b\xc8\xaa\xb6\x96\x92\xf6\x98\xa8\x04\x93\x80\
+\x53\x48\x07\x30\x44\x5f\x68\xab\xdc\x7a\x10\x6f\x0d\x55\xbd\x4d\
+\x05\x8e\x23\x35\x03\x4f\x10\xff\x9e\xb2\xaa\xa9\x4f\xa0\x52\x6d\
+\x43\xda\x75\xe9\x74\x5b\x73\xeb\x2b\x48\xcd\x31\x8b\xf4\xe1\xe5\
+\x17\xc4\xbf\xb7\xac\x72\x6b\x15\x69\xe9\x5a\x25\x73\x7f\x40\x73\
+\xeb\xc3\x48\xcd\xb4\x2f\xf0\x79\x60\x39\xf1\xef\x33\xab\x9c\xba\
+\x10\x55\x66\x3e\xee\x0f\x68\x5a\xbd\x13\xa9\xd9\xb6\x07\xfe\x0e\
+\xb8\x8f\xf8\xf7\x9b\x55\x7c\x1d\x83\x2a\xe3\xfe\x80\x66\xd5\xc7\
+\x91\xda\x61\x0a\xf0\x17\xc0\x5d\xc4\xbf\xef\xac\xe2\xea\x26\x4a\
+\x3a\xb6\xbf\xee\xcf\x02\x28\xc3\x46\xd2\x21\x0c\x5f\x26\xbd\x3e\
+\x07\xe2\x26\xb2\x3a\x7b\x08\xf8\x66\x74\x08\xa9\x02\xeb\x81\x05\
+\xc0\x19\xc0\x6f\x49\x07\x0f\x6d\x17\x9a\x48\x45\x78\x06\xe9\x19\
+\x01\x0b\xa3\x83\xb4\x91\xfb\x03\xea\x5d\x0f\xd0\x8e\x03\xaf\xa4\
+\xcd\x4d\x01\xde\x81\xb3\x99\x4d\xa8\xbb\x81\xc9\x28\xcc\x7c\xdc\
+\x1f\x50\xd7\xda\x6b\xcb\xcb\x29\xb5\xc6\x0c\xe0\xa3\xa4\x87\xcc\
+\x44\xbf\x17\xad\xfe\xeb\x54\x14\xca\xfd\x01\xf5\xac\x77\x75\xba\
+\x98\x52\xcb\xec\x0e\x5c\x40\xfc\xfb\xd1\xea\xaf\x7e\x4b\xc1\xc7\
+\xd9\xbb\x07\xa0\x37\x1b\x49\xfb\x03\xbe\x00\xac\x25\x9d\xd7\xec\
+\xfe\x80\xfc\xad\x00\xbe\x1d\x1d\x42\x0a\xb6\x0c\x38\x0f\xb8\x0e\
+\x38\x1c\xd8\x36\x36\x8e\x7a\xb4\x2d\x69\x4f\xd3\x2f\xa3\x83\x28\
+\x99\x4b\x3a\x9d\x2b\xba\x33\xb4\xc6\x2e\xf7\x01\x48\x4f\x35\x83\
+\x74\xd2\xdc\x3a\xe2\xdf\x9f\x56\xf7\xb5\x14\x98\xde\xe1\x7a\x2a\
+\xd0\x51\xb8\x3f\x20\xf7\x72\x1f\x80\xb4\xa5\xc3\x49\x3b\xcc\xa3\
+\xdf\x9f\x56\xf7\xf5\x81\x8e\x57\x52\xa1\xdc\x1f\x90\x77\x79\x20\
+\x90\xd4\xd9\x36\xc0\x59\xc4\xbf\x47\xad\xee\xea\x21\x60\x66\xc7\
+\x2b\xd9\x23\xf7\x00\x14\x67\x23\x9e\x1f\x90\x33\xf7\x01\x48\x9d\
+\xad\x06\x2e\x02\x6e\x23\x9d\x3a\x37\x2d\x36\x8e\xc6\x31\x9d\xf4\
+\x90\x33\xf7\x02\x64\xcc\xfd\x01\x79\x95\xfb\x00\xa4\xf1\xcd\x25\
+\x0d\x2c\xd1\xef\x57\x6b\xec\x5a\x8c\x1f\x30\x6b\x61\x3e\xee\x0f\
+\xc8\xa5\x9e\x37\xf6\xa5\x92\x04\x6c\x0d\x9c\x49\xfc\xfb\xd5\x1a\
+\xbb\x5e\x3f\xda\x05\x54\x5e\xdc\x1f\x90\x47\xb9\x0f\x40\xea\xde\
+\x3b\x48\xcb\x03\xd1\xef\x5b\xab\x73\x5d\x3b\xfa\xa5\x53\x8e\x3c\
+\x91\x2b\xb6\xbe\x31\xee\x15\x92\x34\xd2\xd1\xa4\xf3\x03\xa2\xdf\
+\xbb\x56\xe7\x3a\x6a\xf4\x4b\xa7\x5c\xb9\x3f\x20\xa6\xdc\x07\x20\
+\xf5\x6e\x0f\xe0\x0e\xe2\xdf\xbf\xd6\x96\x75\xc9\x18\xd7\x4d\x99\
+\xf3\xfc\x80\xea\xeb\xb9\x5d\x5d\x19\x49\x23\xcd\x26\x4d\x39\x47\
+\xbf\x7f\xad\xa7\xd6\x06\x60\xef\x31\xae\xdb\x98\x06\xfb\xfd\x3f\
+\x54\x21\x7e\x42\xba\x5d\xf0\x54\xd2\xa7\x53\x95\x6f\x7e\x74\x00\
+\xa9\x86\xee\x27\x2d\x07\x5c\x19\x1d\x44\x4f\x31\x00\xbc\x37\x3a\
+\x84\x26\xce\xfd\x01\xd5\xd4\xb9\x5d\x5e\x0f\x49\x5b\x9a\x0e\x5c\
+\x46\xfc\xfb\xd8\xda\x54\x2b\x81\xa7\x8d\x75\xd1\x54\x1f\x3e\xb1\
+\xab\xdc\xba\xaf\xfb\x4b\x21\xa9\x83\xa9\xf8\x6f\x54\x6e\xe5\x13\
+\x4f\x1b\x66\x3e\xee\x0f\x28\xab\xf6\xec\xfe\x32\x48\xea\x60\x32\
+\x70\x31\xf1\xef\x65\x2b\xd5\xc2\xb1\x2f\x97\xea\x68\x10\x38\x99\
+\xf4\x04\xa8\xe8\x1f\xb0\x26\xd5\xdb\x7b\xb9\x08\x92\x3a\x9a\x02\
+\x7c\x97\xf8\xf7\xb3\x95\xea\xa0\xb1\x2f\xd7\x96\x7c\x16\x40\xde\
+\x36\x92\x3a\xbb\x2f\x02\x6b\x81\x43\xf0\xf8\xc7\x22\x3c\x01\x9c\
+\x1f\x1d\x42\xaa\xb9\xf5\xc0\x85\xc0\x11\xc0\x2e\xc1\x59\x94\x7c\
+\x27\x3a\x80\xca\xe3\xfe\x80\x62\xca\x7d\x00\x52\x71\xb6\x05\x6e\
+\x24\xfe\x7d\xdd\xf6\x7a\x02\x98\x35\xce\xb5\x52\x03\xcc\xc7\xfd\
+\x01\x13\xad\xe7\xf4\xfa\xa2\x4b\x1a\xd5\xce\xc0\xef\x88\x7f\x5f\
+\xb7\xbd\x4e\x19\xef\x42\xa9\x19\x7c\xbe\xc0\xc4\xea\xd4\xde\x5f\
+\x72\x49\x63\x78\x21\xe9\x53\x68\xf4\x7b\xbb\xcd\xe5\xf3\x01\x5a\
+\x66\x1b\xe0\x93\xc0\x2a\xe2\x7f\xf8\xea\x54\xe7\xf4\xf3\x62\x4b\
+\x1a\xd3\xab\x48\x7b\x03\xa2\xdf\xdf\x6d\xae\xae\x4f\x3b\x75\x13\
+\x60\xfd\xad\x06\x2e\x07\xce\x02\x76\x04\xf6\x8f\x8d\x53\x1b\x3b\
+\x02\x9f\x89\x0e\x21\x35\xcc\x1d\xa4\xe3\x69\x8f\x8e\x0e\xd2\x62\
+\x0f\xe3\x89\x8d\xad\x35\x1f\xf7\x07\x74\x5b\x7b\xf4\xf7\x12\x4b\
+\x1a\xc3\x00\xe9\x2e\x9b\xe8\xf7\x77\x5b\xeb\xb6\xf1\x2f\x91\x9a\
+\xcc\xfd\x01\xdd\xd5\x5b\xfa\x7d\x81\x25\x8d\x69\x3b\xe0\x4e\xe2\
+\xdf\xe3\x6d\xad\xfd\xc6\xbf\x44\x3e\x0c\xa8\xa9\xd6\x03\x67\x92\
+\x76\xba\x7f\x8a\xb4\x4c\xa0\x2d\x75\xf5\x26\x91\xd4\xb3\x47\x81\
+\xd7\xe2\xbf\x3d\x51\x5e\x17\x1d\x40\xf9\x78\x36\x70\x36\xf1\x5d\
+\x69\x6e\xf5\xc3\x89\xbc\xa8\x92\xc6\xf5\x3e\xe2\xdf\xe7\x6d\xac\
+\xbb\x49\x4b\x31\xd2\xff\x38\x0a\x58\x40\xfc\x0f\x67\x2e\xe5\x81\
+\x40\x52\xb9\x06\x80\x1f\x10\xff\x5e\x6f\x63\x1d\xd0\xc5\xf5\x51\
+\xcb\xf8\x7c\x81\x4d\xb5\x6a\x82\xaf\xa5\xa4\xf1\xcd\x21\xed\x4c\
+\x8f\x7e\xbf\xb7\xad\x3e\xd5\xcd\xc5\x51\x3b\x79\x7e\x40\xda\x2b\
+\x21\xa9\x7c\x6f\x20\xfe\xfd\xde\xb6\xba\xbb\xab\x2b\xa3\x56\x6b\
+\xfb\xfe\x00\x37\xc2\x4a\xd5\xf0\xf1\xc1\xd5\x97\x8f\x3e\x57\x57\
+\xda\xb8\x3f\x60\x05\x6e\x94\x91\xaa\xb2\x0b\x1e\x15\x5c\x75\xbd\
+\xb7\xab\x2b\x23\xd1\xbe\xfd\x01\x37\x16\xf3\xb2\x49\xea\xd2\x7b\
+\x88\x7f\xdf\xb7\xa9\xbe\xdf\xdd\x65\x91\x36\x99\x01\x7c\x14\x78\
+\x92\xf8\x1f\xe0\x32\xeb\xc2\x82\x5e\x2f\x49\xdd\x99\x04\x2c\x24\
+\xfe\xbd\xdf\x96\x5a\x05\xcc\x1c\xed\x62\xb8\xfe\xa9\x4e\x56\x90\
+\x1a\x80\x7d\x68\xf6\x20\xb9\x30\x3a\x80\xd4\x32\xeb\x71\x5a\xba\
+\x4a\x53\x49\xc7\xc3\x4b\x7d\x9b\x4f\x33\x9f\x2f\x70\x60\x81\xaf\
+\x91\xa4\xee\x5d\x48\xfc\xfb\xbf\x2d\xf5\xf9\x2e\xaf\x89\x34\xaa\
+\xa6\xed\x0f\x78\x00\x67\xc0\xa4\x28\xbb\xd1\xee\x5b\x90\xab\xac\
+\x45\x5d\x5e\x13\x69\x5c\xdb\x90\x0e\x98\xa8\xfb\x9b\xf7\xb4\xa2\
+\x5f\x18\x49\x3d\xf9\x0f\xe2\xff\x1d\x68\x4b\x79\x3b\xa0\x0a\x55\
+\xe7\xf3\x03\xd6\x90\x6e\x49\x92\x14\x67\x27\x60\x25\xf1\xff\x1e\
+\xb4\xa1\xde\xd1\xe9\x02\x38\x05\xaa\x7e\xfd\x96\xb4\x24\x70\x34\
+\xf5\xdb\x4c\x77\x2e\x70\x4f\x74\x08\xa9\xe5\x96\x02\x5f\x8a\x0e\
+\xd1\x12\x87\x45\x07\x50\x73\xd5\x69\x7f\xc0\x63\xc0\xdc\x72\x5e\
+\x06\x49\x3d\x9a\x4d\xba\xeb\x28\xfa\xdf\x85\xa6\xd7\xe2\x6e\x2f\
+\x88\xd4\xaf\x3a\xec\x0f\x78\x7b\x69\xdf\xbd\xa4\x7e\x9c\x4e\xfc\
+\xbf\x0b\x6d\xa8\x9d\xbb\xbd\x20\xd2\x44\xec\x0e\x5c\x40\xfc\x0f\
+\xfc\xe6\x75\x29\x1e\xfd\x2b\xe5\x66\x1e\xb0\x8e\xf8\x7f\x1f\x9a\
+\x5e\x27\x76\x7b\x41\xa4\x22\xcc\x27\x9f\xf3\x03\x6e\x02\xb6\x2d\
+\xf5\xbb\x95\xd4\xaf\x6f\x11\xff\x6f\x44\xd3\xeb\xf4\xae\xaf\x86\
+\x54\x90\x49\xc0\x29\xa4\xfb\xee\xa3\x7e\xf0\x17\x91\x9e\x49\x2e\
+\x29\x4f\x87\x10\x3f\x40\x36\xbd\xae\xef\xfa\x6a\x48\x05\x8b\xda\
+\x1f\x70\x2d\x69\xa3\x91\xa4\xbc\x5d\x43\xfc\x20\xd9\xe4\x5a\x07\
+\xcc\xea\xfa\x6a\x48\x25\xa8\x72\x7f\xc0\x05\xa4\x07\x1b\x49\xca\
+\xdf\x5b\x89\x1f\x24\x9b\x5e\xc7\x74\x7d\x35\xa4\x12\xcd\xa7\xbc\
+\xfd\x01\x7f\x00\x4e\xad\xec\x3b\x91\x54\x84\x99\xc0\xe3\xc4\x0f\
+\x92\x4d\xae\x0f\x74\x7d\x35\xa4\x92\x4d\x02\xde\x04\xdc\x4c\x31\
+\x3f\xdc\xcb\x49\x47\xfc\x3e\xa3\xca\x6f\x42\x52\x61\xce\x24\x7e\
+\x90\x6c\x72\x9d\xdd\xfd\xa5\x90\xaa\x31\x00\x1c\x0f\xfc\x00\x58\
+\x4d\xef\x3f\xd4\xb7\x93\x1e\x5f\xbc\x63\xc5\xb9\x25\x15\xcb\xcd\
+\x80\xe5\xd6\x82\x91\x2f\xb6\xf7\x44\x2b\x37\xdb\x00\x2f\x07\x5e\
+\x0a\xec\x41\xda\x33\x30\x97\x34\x5b\x00\xe9\x53\xfe\x1d\xc0\x6d\
+\xa4\x1f\xe6\x4b\x87\x7e\x2f\xa9\x19\xee\x26\x3d\x2d\x50\xc5\x5b\
+\x43\x5a\x6a\x59\x1b\x1d\x44\x92\xa4\xcd\x7d\x82\xf8\x4f\xca\x4d\
+\xae\x7d\x87\x5f\x68\x1f\x06\x24\x49\xca\xc9\xb7\xa2\x03\x34\xdc\
+\x7e\xc3\xbf\xb1\x01\x90\x24\xe5\xe4\x7a\xe0\xae\xe8\x10\x0d\xe6\
+\x0c\x80\x24\x29\x5b\x17\x45\x07\x68\xb0\xfd\x87\x7f\x63\x03\x20\
+\x49\xca\xcd\xf7\xa2\x03\x34\xd8\x3e\xc3\xbf\xf1\x2e\x00\x49\x52\
+\x6e\xa6\x00\x8f\x90\x76\xac\xab\x58\x1b\x81\xe9\xc0\x2a\x67\x00\
+\x24\x49\xb9\x59\x03\x5c\x19\x1d\xa2\xa1\x06\x80\x67\x83\x4b\x00\
+\x92\xa4\x3c\xb9\x0c\x50\x9e\xdd\xc0\x06\x40\x92\x94\xa7\x9f\x46\
+\x07\x68\xb0\x5d\xc1\x06\x40\x92\x94\xa7\x9b\x81\xc7\xa2\x43\x34\
+\xd4\xae\x60\x03\x20\x49\xca\xd3\x06\xe0\x17\xd1\x21\x1a\x6a\x1e\
+\xd8\x00\x48\x92\xf2\xf5\xf3\xe8\x00\x0d\x65\x03\x20\x49\xca\x9a\
+\x33\x00\xe5\x98\x07\x9e\x03\x20\x49\xca\xd7\x33\x81\xfb\xa3\x43\
+\x34\xd4\x2c\x67\x00\x24\x49\xb9\x7a\x00\x78\x28\x3a\x44\x43\x3d\
+\xdd\x06\x40\x92\x94\xb3\x9b\xa3\x03\x34\xd4\x0e\x36\x00\x92\xa4\
+\x9c\xdd\x14\x1d\xa0\xa1\x76\xb4\x01\x90\x24\xe5\xec\xd6\xe8\x00\
+\x0d\x65\x03\x20\x49\xca\xda\x92\xe8\x00\x0d\xe5\x12\x80\x24\x29\
+\x6b\x4b\xa2\x03\x34\x94\x0d\x80\x24\x29\x6b\xf7\x90\x1e\x61\xab\
+\x62\xb9\x04\x20\x49\xca\xda\x2a\x3c\x0b\xa0\x0c\xce\x00\x48\x92\
+\xb2\xf7\xfb\xe8\x00\x0d\xe4\x0c\x80\x24\x29\x7b\x8f\x44\x07\x68\
+\xa0\x69\x36\x00\x92\xa4\xdc\xd9\x00\x14\x6f\xaa\x0d\x80\x24\x29\
+\x77\x36\x00\xc5\x9b\x62\x03\x20\x49\xca\x9d\x0d\x40\xf1\x9c\x01\
+\x90\x24\x65\x6f\x79\x74\x80\x06\xb2\x01\x90\x24\x65\x6f\x75\x74\
+\x80\x06\x72\x09\x40\x92\x94\xbd\x35\xd1\x01\x1a\xc8\x19\x00\x49\
+\x52\xf6\x9c\x01\x28\x9e\x0d\x80\x24\x29\x7b\x36\x00\xc5\xb3\x01\
+\x90\x24\xa9\x8d\x6c\x00\x24\x49\xb9\x9b\x1a\x1d\xa0\x81\x56\xdb\
+\x00\x48\x92\x72\x67\x03\x50\x3c\x1b\x00\x49\x52\xf6\xa6\x44\x07\
+\x68\x20\x1b\x00\x49\x52\xf6\x9c\x01\x28\xde\x1a\x1b\x00\x49\x52\
+\xee\x66\x45\x07\x68\x20\x67\x00\x24\x49\xd9\xdb\x21\x3a\x40\x03\
+\xd9\x00\x48\x92\xb2\x67\x03\x50\x3c\x97\x00\x24\x49\xd9\xb3\x01\
+\x28\x9e\x33\x00\x92\xa4\xec\x6d\x1f\x1d\xa0\x81\x56\xda\x00\x48\
+\x92\x72\xb7\x73\x74\x80\x06\x7a\xd8\x06\x40\x92\x94\xb3\xad\x81\
+\xd9\xd1\x21\x1a\xe8\x11\x1b\x00\x49\x52\xce\x76\x01\x06\xa2\x43\
+\x34\x90\x33\x00\x92\xa4\xac\xcd\x8b\x0e\xd0\x50\xce\x00\x48\x92\
+\xb2\xb6\x6b\x74\x80\x86\xb2\x01\x90\x24\x65\xed\x79\xd1\x01\x1a\
+\xca\x25\x00\x49\x52\xd6\xf6\x8d\x0e\xd0\x50\x36\x00\x92\xa4\xac\
+\xed\x13\x1d\xa0\xa1\x1e\x71\x67\xa5\x24\x29\x57\xb3\x81\xa5\xd1\
+\x21\x1a\x6a\xa6\x33\x00\x92\xa4\x5c\xed\x17\x1d\xa0\xa1\x1e\x06\
+\x56\xd8\x00\x48\x92\x72\x75\x68\x74\x80\x86\x5a\x0c\x60\x03\x20\
+\x49\xca\x95\x0d\x40\x39\x6c\x00\x24\x49\xd9\x9a\x04\x1c\x1c\x1d\
+\xa2\xa1\x6c\x00\x24\x49\xd9\xda\x17\xd8\x36\x3a\x44\x43\xd9\x00\
+\x48\x92\xb2\x75\x64\x74\x80\x06\x5b\x02\x36\x00\x92\xa4\x3c\xbd\
+\x22\x3a\x40\x83\x2d\x02\x9f\xb0\x24\x49\xca\xcf\x54\xe0\x11\x60\
+\x46\x74\x90\x06\xda\x08\x4c\x07\x56\x39\x03\x20\x49\xca\xcd\x11\
+\x38\xf8\x97\xe5\x5e\x60\x15\xb8\x04\x20\x49\xca\xcf\x2b\xa3\x03\
+\x34\xd8\xcd\xc3\xbf\xb1\x01\x90\x24\xe5\xe6\x35\xd1\x01\x1a\x6c\
+\xc1\xf0\x6f\x6c\x00\x24\x49\x39\x39\x08\xd8\x3d\x3a\x44\x83\xdd\
+\x34\xfc\x1b\x1b\x00\x49\x52\x4e\x4e\x88\x0e\xd0\x70\x37\x0e\xff\
+\xc6\xbb\x00\x24\x49\x39\xb9\x1b\xd8\x2d\x3a\x44\x43\xad\x06\x66\
+\x01\x6b\xc1\x19\x00\x49\x52\x3e\x0e\xc5\xc1\xbf\x4c\xb7\x31\x34\
+\xf8\x83\x0d\x80\x24\x29\x1f\x6f\x8d\x0e\xd0\x70\x0b\x47\xfe\xc1\
+\x06\x40\x92\x94\x83\x99\xb8\xfe\x5f\xb6\x9b\x46\xfe\xc1\x06\x40\
+\x92\x94\x83\x13\x49\xeb\xd3\x2a\xcf\x82\x91\x7f\x70\x13\xa0\x24\
+\x29\x07\xbf\x00\x5e\x14\x1d\xa2\xc1\xd6\x01\xdb\x03\x4f\x0c\xff\
+\x85\x33\x00\x92\xa4\x68\x87\xe2\xe0\x5f\xb6\x05\x8c\x18\xfc\xc1\
+\x06\x40\x92\x14\xef\xfd\xd1\x01\x5a\xe0\xea\xcd\xff\xc2\x06\x40\
+\x92\x14\x69\x1e\x70\x7c\x74\x88\x16\xb0\x01\x90\x24\x65\xe5\xbd\
+\xc0\xa4\xe8\x10\x2d\xb0\x45\x03\xe0\x26\x40\x49\x52\x94\xd9\xa4\
+\x93\xff\xa6\x47\x07\x69\xb8\x45\x74\x78\xbe\x82\x33\x00\x92\xa4\
+\x28\x7f\x87\x83\x7f\x15\xae\xea\xf4\x97\x36\x00\x92\xa4\x08\x3b\
+\x01\xa7\x44\x87\x68\x89\x2d\xa6\xff\xc1\x06\x40\x92\x14\xe3\xef\
+\x81\x69\xd1\x21\x5a\xe2\x8a\x4e\x7f\xe9\x1e\x00\x49\x52\xd5\x76\
+\x07\x6e\x01\xa6\x46\x07\x69\x81\xc5\x8c\xf2\x80\x25\x67\x00\x24\
+\x49\x55\x3b\x0d\x07\xff\xaa\x5c\x3a\xda\x7f\xb0\x01\x90\x24\x55\
+\xe9\x68\xe0\xb8\xe8\x10\x2d\x72\xd9\x68\xff\xc1\x25\x00\x49\x52\
+\x55\x26\x01\x37\x00\xfb\x46\x07\x69\x89\x55\xc0\x0e\xc0\xca\x4e\
+\xff\xd1\x19\x00\x49\x52\x55\xde\x8d\x83\x7f\x95\xae\x64\x94\xc1\
+\x1f\x6c\x00\x24\x49\xd5\x78\x36\xf0\x2f\xd1\x21\x5a\x66\xd4\xe9\
+\x7f\xb0\x01\x90\x24\x55\xe3\x3f\x81\x99\xd1\x21\x5a\x66\xcc\x06\
+\x40\x92\xa4\xb2\x9d\x04\x6c\xb4\x2a\xad\xbb\xc6\xbb\x28\xce\x00\
+\x48\x92\xca\xb4\x33\xf0\xb9\xe8\x10\x2d\xf4\xed\xf1\xfe\x07\x36\
+\x00\x92\xa4\xb2\x0c\x02\x67\x91\x76\xa2\xab\x5a\xe7\x45\x07\x90\
+\x24\xb5\xd7\xdf\x12\x3f\x15\xde\xc6\x1a\x77\xfa\x1f\x9c\x01\x90\
+\x24\x95\xe3\x05\xc0\xbf\x46\x87\x68\xa9\x73\xa3\x03\x48\x92\xda\
+\xe9\x69\xa4\x4f\xa1\xd1\x9f\x84\xdb\x5a\x7b\x8f\x7f\x89\x24\x49\
+\x2a\xd6\x20\xe9\xfc\xf9\xe8\x41\xb0\xad\x75\xeb\xf8\x97\x28\x71\
+\x09\x40\x92\x54\xa4\x7f\x04\x8e\x8d\x0e\xd1\x62\xe7\x44\x07\x90\
+\x24\xb5\xcf\xf1\xc0\x7a\xe2\x3f\x05\xb7\xb9\xf6\x1c\xf7\x2a\x49\
+\x92\x54\xa0\x03\x81\xe5\xc4\x0f\x80\x6d\xae\x5f\x8e\x7b\x95\x46\
+\x70\x09\x40\x92\x34\x51\x3b\x03\x17\x01\x33\xa2\x83\xb4\xdc\x99\
+\xbd\xfc\x8f\x7d\x1c\xb0\x24\x69\x22\xb6\x03\xae\xc2\x9d\xe7\xd1\
+\x9e\x00\xe6\x90\x66\x61\xba\xe2\x0c\x80\x24\xa9\x5f\xd3\x81\x8b\
+\x71\xf0\xcf\xc1\xb9\xf4\x30\xf8\x4b\x92\xd4\xaf\x29\xa4\xa7\xcd\
+\x45\xaf\x7b\x5b\xa9\x0e\x1c\xfb\x72\x49\x92\x34\x71\x93\x49\x9f\
+\xfc\xa3\x07\x3d\x2b\xd5\xc2\xb1\x2f\x57\x67\x2e\x01\x48\x92\x7a\
+\x31\x15\xf8\x26\x70\x5c\x74\x10\xfd\x8f\x2f\x46\x07\x90\x24\x35\
+\xdb\x74\xe0\xfb\xc4\x7f\xe2\xb5\x36\xd5\x4a\xd2\x46\xcc\x9e\x6d\
+\xd5\xcf\xff\x91\x24\xa9\x75\xb6\x05\x2e\x01\x0e\x8f\x0e\xa2\xa7\
+\xf8\x3a\xf0\x68\x74\x08\x49\x52\x33\xed\x04\x5c\x4f\xfc\xa7\x5d\
+\xeb\xa9\xb5\x01\xd8\x6b\x8c\xeb\x26\x49\x52\xdf\xf6\x01\x96\x10\
+\x3f\xd8\x59\x5b\xd6\xc5\xa3\x5f\x36\x49\x92\xfa\x77\x0c\x69\x7a\
+\x39\x7a\xa0\xb3\x3a\xd7\x91\xa3\x5f\x3a\x49\x92\xfa\xf3\x57\xc0\
+\x1a\xe2\x07\x39\xab\x73\xfd\x6a\xf4\x4b\x27\x49\x52\xef\xb6\x06\
+\xbe\x42\xfc\x00\x67\x8d\x5d\x27\x8c\x76\x01\x25\x49\xea\xd5\x1f\
+\x91\x0e\x95\x89\x1e\xdc\xac\xb1\x6b\x11\x05\xdc\xc5\xe7\x41\x40\
+\x92\x24\x80\x93\x80\xeb\x80\xfd\xa2\x83\x68\x5c\xa7\x01\xeb\xa2\
+\x43\x48\x92\xea\x6d\x5b\xd2\xbd\xe4\xd1\x9f\x6a\xad\xee\xea\x41\
+\x7c\xec\xb2\x24\x69\x82\x8e\xc4\x5b\xfc\xea\x56\xef\xef\x74\x21\
+\x25\x49\xea\xc6\xb6\xc0\xe9\xc0\x7a\xe2\x07\x34\xab\xfb\xba\x8f\
+\x74\x1c\xb3\x24\x49\x3d\x3b\x0e\xf8\x2d\xf1\x83\x99\xd5\x7b\xfd\
+\xef\x0e\xd7\x53\x92\xa4\x31\xed\x81\x8f\xf0\xad\x73\xdd\x43\x7a\
+\x12\xa3\x24\x49\x5d\xd9\x0e\xf8\x04\xb0\x8a\xf8\x41\xcc\xea\xbf\
+\xde\xb6\xf9\x85\x95\x24\xa9\x93\xa9\xa4\xd3\xfc\x1e\x24\x7e\xf0\
+\xb2\x26\x56\x77\x01\x93\x91\x24\x69\x0c\x93\x81\x93\x81\xbb\x89\
+\x1f\xb8\xac\x62\xea\xcd\x48\x92\x34\x8a\xa9\xc0\xa9\xc0\x62\xe2\
+\x07\x2c\xab\xb8\x5a\x08\x4c\x42\x92\xa4\xcd\x6c\x0b\xbc\x07\xb8\
+\x97\xf8\xc1\xca\x2a\xbe\x5e\x86\x24\x49\x23\xec\x0f\x7c\x01\x58\
+\x41\xfc\x20\x65\x95\x53\xe7\x23\x49\x12\xb0\x0d\x69\x9a\xff\x2a\
+\xe2\x07\x27\xab\xdc\x5a\x45\x7a\x38\x53\x69\x26\xfc\x34\x21\x49\
+\x52\xa9\xb6\x06\xfe\x98\xf4\xf8\xd7\xe3\xf1\x24\xb8\xb6\xf8\x0c\
+\x69\xf7\x7f\x69\x06\xca\xfc\x7f\x2e\x49\xea\xcb\x4c\xd2\xda\xef\
+\x6b\x49\x27\xf7\xcd\x8a\x8d\xa3\x8a\xdd\x07\xec\x09\x2c\x2f\xf3\
+\x8b\x38\x03\x20\x49\x79\xd8\x8d\x34\xd8\xbf\x0a\x38\x02\x4f\x7d\
+\x6b\xb3\x0f\x51\xf2\xe0\x0f\xce\x00\x48\x52\x84\x69\xc0\x81\xc0\
+\x61\xc0\xa1\xc0\x8b\x81\x1d\x43\x13\x29\x17\xbf\x24\xfd\x3c\x6c\
+\x2c\xfb\x0b\xd9\x00\x48\x52\x79\x06\x81\xb9\xc0\x3e\x43\xb5\x1f\
+\xb0\x37\xb0\x17\x9e\xec\xa6\x2d\xad\x05\x0e\x22\xdd\xfb\x5f\x3a\
+\x97\x00\x24\xa9\x3b\x03\xa4\x73\xf5\x21\x6d\xcc\x9b\x46\xda\x95\
+\xbf\x03\xe9\xd3\xfb\x0e\x43\xb5\x0b\xb0\xeb\x50\xcd\x05\xa6\x54\
+\x9c\x53\xf5\xf5\x69\x2a\x1a\xfc\xc1\x19\x00\xe5\x61\x2a\xe9\xd3\
+\xd1\x73\x80\xe7\x92\x36\xbf\xec\x4a\x3a\xe0\x64\x06\x69\x43\xd4\
+\xd3\xa2\xc2\x49\x52\x05\xee\x20\x9d\xed\xb0\xaa\xaa\x2f\xe8\x0c\
+\x80\x22\x4c\x02\x0e\x06\x8e\x1a\xaa\x43\xf1\xd6\x26\x49\xed\xb5\
+\x11\x38\x85\x0a\x07\x7f\xb0\x01\x50\xb5\xf6\x02\x5e\x07\xfc\x39\
+\xe9\x13\xbe\x24\x09\xbe\x0c\xfc\xb4\xea\x2f\xea\x12\x80\xca\x36\
+\x19\x78\x23\xe9\xac\xf2\xe7\x07\x67\x91\xa4\xdc\xfc\x9e\xb4\x31\
+\xf4\xb1\xaa\xbf\xb0\x33\x00\x2a\xcb\x14\xe0\xf5\xc0\x3f\x50\xf2\
+\x71\x96\x92\x54\x63\x7f\x4d\xc0\xe0\x0f\x36\x00\x2a\xc7\x1b\x48\
+\xbb\x59\xe7\x44\x07\x91\xa4\x8c\x7d\x1d\xb8\x30\xea\x8b\xbb\x04\
+\xa0\x22\xed\x01\xfc\x07\xf0\x8a\xe8\x20\x92\x94\xb9\xdf\x91\x76\
+\xfd\x2f\x8b\x0a\x30\x18\xf5\x85\xd5\x28\x83\xc0\x87\x81\x9b\x71\
+\xf0\x97\xa4\xf1\xac\x27\xcd\x94\x86\x0d\xfe\xe0\x12\x80\x26\xee\
+\xe9\xc0\x59\xa4\xa7\x95\x49\x92\xc6\xf7\xaf\xc0\xd5\xd1\x21\x5c\
+\x02\xd0\x44\x1c\x09\x7c\x03\xd8\x29\x3a\x88\x24\xd5\xc4\x35\xa4\
+\x7f\x3b\xd7\x45\x07\xb1\x01\x50\xbf\x5e\x03\x9c\x4b\x3a\x12\x55\
+\x92\x34\xbe\xe5\xc0\x0b\x81\x3b\xa3\x83\x80\x7b\x00\xd4\x9f\x77\
+\x02\xe7\xe3\xe0\x2f\x49\xbd\x78\x27\x99\x0c\xfe\x60\x03\xa0\xde\
+\x7d\x18\x38\x03\x7f\x76\x24\xa9\x17\x67\x03\xff\x1d\x1d\x62\x24\
+\x97\x00\xd4\x8b\x77\x00\x5f\x88\x0e\x21\x49\x35\xb3\x90\xf4\xcc\
+\x93\x95\xd1\x41\x46\xb2\x01\x50\xb7\x5e\x03\x7c\x9b\xf4\x20\x1f\
+\x49\x52\x77\x96\x01\x07\x02\x8b\xa2\x83\x6c\xce\x69\x5c\x75\x63\
+\x78\xb7\xbf\x83\xbf\x24\x75\x6f\x03\xe9\x59\x28\xd9\x0d\xfe\x60\
+\x03\xa0\xf1\x3d\x9d\xb4\xdb\x7f\x6a\x74\x10\x49\xaa\x99\x7f\x02\
+\x2e\x8b\x0e\x31\x1a\x97\x00\x34\x96\x41\xe0\xbb\x78\xba\x9f\x24\
+\xf5\xea\x12\xe0\x78\xd2\x2c\x40\x96\x9c\x01\xd0\x58\x3e\x88\x83\
+\xbf\x24\xf5\xea\x2e\xe0\xcd\x64\x3c\xf8\x83\x33\x00\x1a\xdd\x9e\
+\xa4\x9d\xab\x4e\xfd\x4b\x52\xf7\x1e\x05\x0e\x03\x6e\x8d\x0e\x32\
+\x1e\x67\x00\x34\x9a\xcf\xe2\xe0\x2f\x49\xbd\x58\x0b\x9c\x40\x0d\
+\x06\x7f\xb0\x01\x50\x67\x6f\x00\x5e\x19\x1d\x42\x92\x6a\x64\x23\
+\x70\x0a\x70\x79\x74\x90\x6e\xb9\x04\xa0\xcd\x6d\x4d\x5a\xbf\xda\
+\x39\x3a\x88\x24\xd5\xc8\x3f\x03\x1f\x8d\x0e\xd1\x0b\x67\x00\xb4\
+\xb9\xbf\xc4\xc1\x5f\x92\x7a\x71\x2e\xa9\x01\xa8\x15\x67\x00\x34\
+\xd2\x64\xe0\x37\xc0\xbc\xe8\x20\x92\x54\x13\x57\x92\xee\x96\x5a\
+\x1d\x1d\xa4\x57\xce\x00\x68\xa4\x37\xe0\xe0\x2f\x49\xdd\xba\x85\
+\x74\x4c\x7a\xed\x06\x7f\x70\x06\x40\x4f\x75\x1d\x70\x40\x74\x08\
+\x49\xaa\x81\xbb\x49\xc7\xa4\xdf\x17\x1d\xa4\x5f\x36\x00\x1a\xb6\
+\x17\xa9\x9b\x95\x24\x8d\xed\x5e\xd2\xe0\xbf\x38\x3a\xc8\x44\xb8\
+\x04\xa0\x61\x27\x47\x07\x90\xa4\x1a\x78\x08\x78\x39\x35\x1f\xfc\
+\xc1\x19\x00\x25\x83\xc0\x12\x60\x6e\x70\x0e\x49\xca\xd9\xa3\xc0\
+\xd1\xc0\x0d\xd1\x41\x8a\xe0\x0c\x80\x20\x3d\xab\xda\xc1\x5f\x92\
+\x46\xf7\x38\xe9\x93\x7f\x23\x06\x7f\xb0\x01\x50\x72\x54\x74\x00\
+\x49\xca\xd8\x93\xc0\xab\x81\x6b\xa3\x83\x14\xc9\x06\x40\x60\x03\
+\x20\x49\xa3\x59\x41\x1a\xfc\xaf\x8c\x0e\x52\x34\xf7\x00\x68\x32\
+\xb0\x0c\x98\x11\x1d\x44\x92\x32\xf3\x28\x70\x2c\x70\x4d\x74\x90\
+\x32\x6c\x15\x1d\x40\xe1\xf6\xc6\xc1\x5f\x92\x36\xf7\x20\xe9\x84\
+\xbf\x05\xd1\x41\xca\x62\x03\xa0\x3d\xa3\x03\x48\x52\x66\xee\x07\
+\x5e\x06\xdc\x1c\x1d\xa4\x4c\x36\x00\xb2\x01\x90\xa4\x4d\xee\x01\
+\x8e\x21\x3d\x15\xb5\xd1\xdc\x04\x28\x1b\x00\x49\x4a\x7e\x03\x1c\
+\x4e\x0b\x06\x7f\xb0\x01\x10\xec\x1a\x1d\x40\x92\x32\x70\x0d\x70\
+\x04\xe9\x98\xdf\x56\xb0\x01\xd0\x36\xd1\x01\x24\x29\xd8\x05\xc0\
+\x4b\x49\xc7\xfc\xb6\x86\x0d\x80\x66\x45\x07\x90\xa4\x40\x9f\x03\
+\x4e\x20\x1d\xf6\xd3\x2a\x6e\x02\x94\x0d\x80\xa4\x36\x5a\x0f\xbc\
+\x07\xf8\x7c\x74\x90\x28\x36\x00\xf2\x0c\x00\x49\x6d\xb3\x1c\x78\
+\x3d\x70\x69\x74\x90\x48\x36\x00\x5a\x05\x4c\x8d\x0e\x21\x49\x15\
+\xf9\x3d\xe9\x68\xdf\x5f\x47\x07\x89\xe6\x1e\x00\x2d\x8f\x0e\x20\
+\x49\x15\xb9\x0a\x38\x08\x07\x7f\xc0\x06\x40\x36\x00\x92\xda\xe1\
+\xcb\xc0\xd1\xc0\xd2\xe8\x20\xb9\x70\x09\x40\x4f\x44\x07\x90\xa4\
+\x12\x3d\x09\xbc\x0b\xf8\x6a\x70\x8e\xec\xd8\x00\xc8\x6e\x58\x52\
+\x53\xdd\x05\xfc\x2f\xe0\xa6\xe8\x20\x39\x72\x09\x40\xbf\x89\x0e\
+\x20\x49\x25\xb8\x14\x38\x18\x07\xff\x51\xd9\x00\xe8\xf6\xe8\x00\
+\x92\x54\xa0\x35\xc0\xff\x01\x8e\x03\x96\x05\x67\xc9\x9a\x4b\x00\
+\xba\x23\x3a\x80\x24\x15\xe4\x76\xe0\x8d\xb8\xcb\xbf\x2b\xce\x00\
+\xe8\x66\x60\x43\x74\x08\x49\x9a\xa0\x2f\x03\x07\xe0\xe0\xdf\x35\
+\x1b\x00\x2d\x03\x16\x44\x87\x90\xa4\x3e\x3d\x4a\x3a\xd5\xef\xed\
+\xc0\xca\xe0\x2c\xb5\x62\x03\x20\x80\x9f\x44\x07\x90\xa4\x3e\xfc\
+\x08\xd8\x07\x38\x2f\x3a\x48\x1d\xd9\x00\x08\xe0\xc7\xd1\x01\x24\
+\xa9\x07\xcb\x81\x77\x03\x2f\x27\x1d\xed\xab\x3e\x0c\x44\x07\x50\
+\x16\x66\x02\x0f\x02\xd3\xa2\x83\x48\xd2\x38\x2e\x03\xde\x09\xdc\
+\x13\x1d\xa4\xee\x9c\x01\x10\xa4\x6e\xfa\xa2\xe8\x10\x92\x34\x86\
+\x65\xa4\x75\xfe\x63\x71\xf0\x2f\x84\x0d\x80\x86\x7d\x2d\x3a\x80\
+\x24\x8d\xe2\x5b\xc0\x9e\xa4\x9d\xfe\x2a\x88\x4b\x00\x1a\xb6\x15\
+\xf0\x3b\x60\x76\x74\x10\x49\x1a\x72\x0f\x69\xba\xff\xb2\xe8\x20\
+\x4d\x34\x29\x3a\x80\xb2\xb1\x01\xd8\x1e\x38\x22\x3a\x88\xa4\xd6\
+\x7b\x12\xf8\x77\xe0\x24\xe0\xb6\xe0\x2c\x8d\xe5\x0c\x80\x46\xda\
+\x01\x58\x42\xda\x14\x28\x49\x11\x2e\x21\xed\xf0\x5f\x1c\x1d\xa4\
+\xe9\xdc\x03\xa0\x91\x1e\x01\xfe\x2b\x3a\x84\xa4\x56\xba\x01\x78\
+\x09\xe9\x0c\x7f\x07\xff\x0a\x38\x03\xa0\xcd\x3d\x8b\xf4\x08\xcd\
+\xa9\xd1\x41\x24\xb5\xc2\x23\xc0\xc7\x80\xff\x04\xd6\x07\x67\x69\
+\x15\xf7\x00\x68\x73\x8f\x93\x96\x00\x0e\x8f\x0e\x22\xa9\xd1\x96\
+\x03\x9f\x01\x5e\x07\x5c\x09\x6c\x8c\x8d\xd3\x3e\xce\x00\xa8\x93\
+\xe9\xc0\x2d\xc0\xae\xc1\x39\x24\x35\xcf\x1a\xe0\xab\xc0\x3f\x01\
+\xf7\xc7\xcb\x5a\x50\x56\x00\x00\x02\xca\x49\x44\x41\x54\x46\x69\
+\x37\xf7\x00\xa8\x93\x95\xc0\xfb\xa3\x43\x48\x6a\x94\xb5\xa4\xfb\
+\xf8\x77\x23\x1d\xe8\xe3\xe0\x1f\xcc\x19\x00\x8d\xe5\x62\xd2\x86\
+\x1c\x49\xea\xd7\x3a\xe0\x2c\xd2\x3a\xbf\x27\xf8\x65\xc4\x06\x40\
+\x63\xd9\x91\xb4\x33\xf7\x59\xd1\x41\x24\xd5\xce\x6a\xe0\x6c\xe0\
+\x53\xa4\x8d\xc5\xca\x8c\x0d\x80\xc6\x73\x08\xf0\x53\x60\x72\x74\
+\x10\x49\xb5\xf0\x38\x69\x8d\xff\x53\xf8\xa4\xbe\xac\x79\x17\x80\
+\xc6\x73\x2f\x69\xed\xee\x98\xe8\x20\x92\xb2\xb6\x98\xb4\xb1\xef\
+\x4d\xa4\xe5\xc3\x27\x62\xe3\x68\x3c\xce\x00\xa8\x1b\x03\xa4\xcd\
+\x3b\x6f\x8b\x0e\x22\x29\x3b\x37\x00\x9f\x05\xce\x21\xad\xf7\xab\
+\x26\x6c\x00\xd4\xad\x49\xc0\x79\xc0\x9f\x45\x07\x91\x14\x6e\x15\
+\xf0\x1d\xd2\x07\x83\xcb\x83\xb3\xa8\x4f\x36\x00\xea\xc5\x34\xe0\
+\x7b\xc0\x91\xd1\x41\x24\x85\xb8\x1e\x38\x13\x38\x97\xb4\xd6\xaf\
+\x1a\xb3\x01\x50\xaf\xa6\x93\x9e\xcd\x7d\x6c\x74\x10\x49\x95\x78\
+\x1c\xf8\x06\xe9\xd3\xfe\xf5\xc1\x59\x54\x20\x1b\x00\xf5\x63\x32\
+\xf0\x15\xd2\x66\x1f\x49\xcd\xb3\x16\xf8\x01\x69\xd9\xef\x02\x60\
+\x45\x6c\x1c\x95\xc1\x06\x40\xfd\x1a\x00\x3e\x01\x7c\x00\x7f\x8e\
+\xa4\x26\x58\x0f\xfc\x98\x34\xe8\x5f\x08\xfc\x21\x36\x8e\xca\xe6\
+\x3f\xdc\x9a\xa8\xe3\x48\xf7\xfc\x6e\x1f\x9c\x43\x52\xef\x36\x00\
+\xd7\x90\x96\xf5\xce\xc3\xe3\x79\x5b\xc5\x06\x40\x45\xd8\x85\xb4\
+\x46\x78\x48\x74\x10\x49\xe3\x7a\x0c\xf8\x21\x69\x43\xef\x77\x81\
+\xa5\xb1\x71\x14\xc5\x06\x40\x45\x99\x0c\xbc\x1b\xf8\x28\xe9\x71\
+\xc2\x92\xf2\xb1\x10\xb8\x8c\x34\xe8\x5f\x8d\xf7\xeb\x0b\x1b\x00\
+\x15\xef\x59\xc0\xff\x05\x4e\x88\x0e\x22\xb5\xd8\xef\x81\x9f\x91\
+\xee\xd1\xff\x1e\x1e\xc9\xab\x0e\x6c\x00\x54\x96\x97\x00\xff\x00\
+\xbc\x34\x3a\x88\xd4\x70\x1b\x80\x5b\x49\x03\xfe\xcf\x87\x7e\xf5\
+\xa9\x7b\x1a\x97\x0d\x80\xca\x76\x08\xf0\x11\xe0\x4f\xf0\xe7\x4d\
+\x2a\xc2\xfd\xc0\x4d\xc0\xb5\xa4\x01\xff\x6a\xe0\xd1\xd0\x44\xaa\
+\x25\xff\x41\x56\x55\xe6\x02\x27\x01\x6f\x05\xf6\x08\xce\x22\xd5\
+\xc1\x5a\xe0\x4e\xe0\x16\xd2\x27\xfc\xeb\x81\xeb\x70\xd3\x9e\x0a\
+\x62\x03\xa0\xaa\x0d\x00\x2f\x06\x8e\x07\x8e\x06\x5e\x80\x4f\xa5\
+\x54\x7b\x2d\x07\x96\x90\x9e\xa4\x37\xb2\xee\x04\xee\xc0\xcd\x7a\
+\x2a\x91\x0d\x80\xa2\x6d\x47\xda\x2f\xf0\x22\xe0\x39\xc0\x9e\xa4\
+\x19\x82\xa9\x91\xa1\xa4\x09\x58\x05\x3c\x32\xa2\x1e\x02\x1e\x1e\
+\xf1\xe7\xa5\x6c\x1a\xf4\x1f\x8a\x89\x28\xd9\x00\x28\x4f\x93\x80\
+\x39\xc0\x36\xa4\x5b\x0a\x67\x91\x1a\x05\x7f\x5e\x15\x69\x03\xe9\
+\x1e\x7a\x80\x27\x49\x03\x3d\xc0\xb2\xa1\x5f\x57\x0f\xfd\xf7\xe5\
+\x15\xe7\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\
+\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\
+\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\
+\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\
+\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\
+\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\
+\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\
+\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\
+\x8d\xf0\xff\x01\x91\x35\x40\xee\x66\x6e\xbb\x64\x00\x00\x00\x00\
+\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x23\xb6\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x02\x00\x00\x00\x02\x00\x08\x06\x00\x00\x00\xf4\x78\xd4\xfa\
+\x00\x00\x00\x04\x73\x42\x49\x54\x08\x08\x08\x08\x7c\x08\x64\x88\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
+\x01\x95\x2b\x0e\x1b\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\
+\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\
+\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x20\x00\x49\x44\
+\x41\x54\x78\x9c\xed\xdd\x79\xb4\x5d\x65\x99\xe7\xf1\xef\xcd\x0d\
+\x81\x00\x21\x81\x14\x61\x9e\x11\x10\x01\x15\x97\x03\x8a\x20\x73\
+\x40\x05\xc5\x01\xd4\x12\x6b\x61\x6b\x59\x38\x0f\x25\xdd\x85\x55\
+\xd5\x55\x6a\x37\x76\x95\xa5\x56\x21\x6a\xd9\x50\x0d\x6a\x2b\xad\
+\x28\x38\x31\x04\x51\x04\x09\x0a\xca\x24\x32\x0b\x94\xc8\x14\x94\
+\x39\x0c\x21\x37\xfd\xc7\x4e\x24\x84\x9b\x7b\xa6\xbd\xf7\xf3\xbe\
+\xfb\xfd\x7e\xd6\x7a\xd6\x62\x89\x9c\xf3\xec\xe1\x9c\xe7\x77\xf7\
+\xde\x67\x6f\x90\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\
+\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\
+\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\
+\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\xa9\x08\x63\xd1\x0d\
+\x48\x0a\xb1\x1e\xb0\xe9\xf2\x7f\xbe\x03\x78\x30\xb0\x17\x49\x92\
+\xd4\x90\x17\x00\x1f\x03\x16\x02\x8b\x81\x65\xab\xd4\x62\xe0\x62\
+\xe0\x38\x60\xf7\xa0\x1e\x25\x49\x52\x0d\xc6\x80\x23\x80\x2b\x78\
+\xe6\xc0\xef\x55\x97\x03\x6f\xc4\xa3\x84\x92\x24\x65\x65\x1b\xe0\
+\x02\x06\x1f\xfc\xab\xd6\x4f\x80\xad\x5b\xed\x5c\x92\x24\x0d\xe5\
+\x10\xe0\x01\x46\x1f\xfe\x2b\xea\x7e\x60\x7e\xab\x4b\x20\x49\x92\
+\x06\x72\x14\xb0\x84\xfa\x86\xff\x8a\x5a\xb2\xfc\xb5\x25\x49\x52\
+\x62\xde\x09\x2c\xa5\xfe\xe1\xbf\xa2\x26\x80\xf7\xb6\xb6\x34\x92\
+\x24\xa9\xa7\x63\xa8\x06\x74\x53\xc3\x7f\xe5\x10\xf0\xc1\x96\x96\
+\x49\x92\x24\x4d\xe1\x58\x9a\x1f\xfc\xab\xd6\xdf\xb7\xb2\x64\x92\
+\x24\x69\x52\x11\xc3\x7f\x45\x1d\xdf\xc2\xf2\x49\x92\xa4\x95\x8c\
+\x01\xff\x4c\xdc\xf0\x5f\x51\x27\xe0\xbd\x02\x24\x49\x6a\xc5\x18\
+\xf0\x39\xe2\x87\xff\x8a\xfa\x22\x30\xad\xd1\x25\x96\x24\xa9\x70\
+\xe3\xc0\x49\xc4\x0f\xfd\x55\xeb\xab\xc0\xf4\x06\x97\x5b\x92\xa4\
+\x62\x8d\x03\xa7\x10\x3f\xec\x57\x57\xdf\x00\xd6\x68\x6c\xe9\x25\
+\x49\x2a\xd0\x0c\xe0\x74\xe2\x87\x7c\xaf\xfa\x1e\xb0\x56\x43\xeb\
+\x40\x92\xa4\xa2\xac\x09\x9c\x49\xfc\x70\xef\xb7\xce\x02\x66\x36\
+\xb2\x26\x24\x49\x2a\xc4\xda\xc0\x02\xe2\x87\xfa\xa0\x75\x01\x30\
+\xab\x81\xf5\x21\x49\x52\xe7\xad\x0b\x9c\x4f\xfc\x30\x1f\xb6\x2e\
+\x02\x66\xd7\xbe\x56\x24\x49\xea\xb0\x39\xc0\x25\xc4\x0f\xf1\x51\
+\xeb\x97\xc0\xdc\x9a\xd7\x8d\x24\x49\x9d\x34\x0f\xb8\x82\xf8\xe1\
+\x5d\x57\x5d\x03\x6c\x52\xeb\x1a\x92\x24\xa9\x63\x36\x06\xae\x26\
+\x7e\x68\xd7\x5d\xd7\x02\x9b\xd5\xb8\x9e\x24\x49\xea\x8c\x2d\x81\
+\x1b\x88\x1f\xd6\x4d\xd5\x2d\xc0\xb6\xb5\xad\x2d\x49\x92\x3a\x60\
+\x6b\xe0\x66\xe2\x87\x74\xd3\x75\x1b\xb0\x7d\x3d\xab\x4c\x92\xa4\
+\xbc\xed\x08\xdc\x4e\xfc\x70\x6e\xab\xee\x04\x76\xa9\x65\xcd\x49\
+\x92\x94\xa9\x9d\x81\x3b\x88\x1f\xca\x6d\xd7\xdd\xc0\x73\x6b\x58\
+\x7f\x92\x24\x65\x67\x77\x60\x11\xf1\xc3\x38\xaa\xee\x03\x5e\x3c\
+\xf2\x5a\x94\x24\x29\x23\x2f\x03\xee\x27\x7e\x08\x47\xd7\xfd\xcb\
+\xd7\x85\x24\x49\x9d\xb7\x17\xf0\x20\xf1\xc3\x37\x95\x7a\x04\xd8\
+\x7f\xa4\x35\x2a\x49\x52\xe2\xe6\x03\x8b\x89\x1f\xba\xa9\xd5\x63\
+\xc0\xa1\x23\xac\x57\x49\x92\x92\xf5\x2a\xe0\x51\xe2\x87\x6d\xaa\
+\xf5\x38\x70\xf8\xd0\x6b\x57\x92\xa4\x04\x1d\x01\x3c\x41\xfc\x90\
+\x4d\xbd\x9e\x04\xde\x3a\xe4\x3a\x96\x24\x29\x29\x6f\x01\x96\x10\
+\x3f\x5c\x73\xa9\x27\x81\xa3\x87\x5a\xd3\x92\x24\x25\xe2\x2f\x81\
+\xa5\xc4\x0f\xd5\xdc\x6a\x02\x78\xdf\x10\xeb\x5b\x92\xa4\x70\xef\
+\xa6\x1a\x64\xd1\xc3\x34\xd7\x9a\x00\x3e\x34\xf0\x5a\x97\x24\x29\
+\xd0\xb1\xc4\x0f\xd0\xae\xd4\xf1\x03\xae\x7b\x49\x92\x42\xfc\x77\
+\xe2\x87\x66\xd7\xca\x10\x20\x49\x4a\xd6\x18\xf0\x69\xe2\x87\x65\
+\x57\xeb\xf3\xcb\xd7\xb1\x24\x49\xc9\x18\x03\xfe\x95\xf8\x21\xd9\
+\xf5\xfa\x12\x30\xad\xcf\x6d\x22\x49\x52\xa3\xc6\x81\x93\x89\x1f\
+\x8e\xa5\xd4\xd7\x80\xe9\x7d\x6d\x19\x49\x92\x1a\x32\x0e\x9c\x4a\
+\xfc\x50\x2c\xad\x4e\x03\xd6\xe8\x63\xfb\x48\x92\x54\xbb\x19\xc0\
+\xe9\xc4\x0f\xc3\x52\xeb\xfb\xc0\x5a\x3d\xb7\x92\x24\x49\x35\x5a\
+\x13\x38\x93\xf8\x21\x58\x7a\x9d\x05\xcc\xec\xb1\xad\x24\x49\xaa\
+\xc5\x3a\xc0\x02\xe2\x87\x9f\x55\xd5\x05\xc0\xac\x29\xb7\x98\x24\
+\x49\x23\x9a\x0d\xfc\x8c\xf8\xa1\x67\x3d\xbd\x7e\x01\x6c\x30\xc5\
+\x76\x93\x24\x69\x68\xeb\x03\x97\x10\x3f\xec\xac\xc9\xeb\x97\xc0\
+\x9f\xad\x76\xeb\x49\x92\x34\x84\x79\xc0\x95\xc4\x0f\x39\x6b\xea\
+\xba\x06\xd8\x64\x35\xdb\x50\x92\xa4\x81\x6c\x0c\xfc\x9a\xf8\xe1\
+\x66\xf5\x57\xd7\x01\x9b\x4f\xba\x25\x25\x49\xea\xd3\x96\xc0\x8d\
+\xc4\x0f\x35\x6b\xb0\xba\x05\xd8\x76\x92\xed\x29\x49\x52\x4f\xdb\
+\x00\xbf\x25\x7e\x98\x59\xc3\xd5\x6d\xc0\xb3\x9e\xb1\x55\x25\x49\
+\x9a\xc2\x4e\xc0\xed\xc4\x0f\x31\x6b\xb4\xba\x0b\xd8\x15\x49\x92\
+\xfa\xf0\x3c\xe0\x1e\xe2\x87\x97\x55\x4f\xdd\xb3\x7c\x9b\x4a\x92\
+\xb4\x5a\x2f\x00\xee\x25\x7e\x68\x59\xf5\xd6\x7d\xc0\x4b\x90\x24\
+\x69\x12\x7b\x02\x0f\x10\x3f\xac\xac\x66\xea\x21\x60\x1f\x24\x49\
+\x5a\xc9\xde\xc0\x83\xc4\x0f\x29\xab\xd9\x7a\x04\x38\x00\x49\x92\
+\x80\x83\x81\xc5\xc4\x0f\x27\xab\x9d\x7a\x0c\x38\x0c\x49\x52\xd1\
+\x5e\x4d\x35\x10\xa2\x87\x92\xd5\x6e\x3d\x0e\xbc\x0e\x49\x52\x91\
+\x8e\x04\x9e\x20\x7e\x18\x59\x31\xf5\x24\x70\x14\x92\xa4\xa2\xfc\
+\x39\xb0\x84\xf8\x21\x64\xc5\x87\x80\xa3\x91\x24\x15\xe1\x5d\xc0\
+\x52\xe2\x87\x8f\x95\x46\x4d\x00\xef\x47\x2a\xcc\x78\x74\x03\x52\
+\xcb\x3e\x02\x7c\x16\x98\x16\xdd\x88\x92\x31\x06\xcc\xa7\x0a\x85\
+\x3f\x0d\xee\x45\x92\xd4\x80\x63\x89\xff\x6b\xd3\x4a\xbb\x8e\x47\
+\x92\xd4\x29\xff\x40\xfc\x70\xb1\xf2\xa8\x4f\x21\x49\xca\xde\x18\
+\xf0\x2f\xc4\x0f\x15\x2b\xaf\x3a\x91\x6a\xdf\x91\x24\x65\x68\x0c\
+\xf8\x37\xe2\x87\x89\x95\x67\xfd\x3b\x5e\x2b\x22\x49\xd9\x19\x07\
+\xfe\x83\xf8\x21\x62\xe5\x5d\x5f\x03\xa6\x23\x49\xca\xc2\x74\xe0\
+\x2b\xc4\x0f\x0f\xab\x1b\x75\x1a\xb0\x06\x92\xa4\xa4\xcd\x00\xbe\
+\x4d\xfc\xd0\xb0\xba\x55\xdf\x07\xd6\x42\x92\x94\xa4\xb5\x81\x73\
+\x88\x1f\x16\x56\x37\xeb\x7c\x60\x5d\x24\x49\x49\x59\x07\x38\x8f\
+\xf8\x21\x61\x75\xbb\x7e\x0a\xcc\x42\xea\x00\x7f\xe6\xa2\x2e\x98\
+\x0d\x9c\x05\xec\x11\xdd\x88\x8a\x70\x19\x70\x10\xf0\xc7\xe8\x46\
+\xa4\x51\x18\x00\x94\xbb\xf5\x81\xb3\x81\x17\x45\x37\xa2\xa2\x5c\
+\x0e\x1c\x08\xdc\x1b\xdd\x88\x34\x2c\x03\x80\x72\xb6\x11\x70\x2e\
+\xb0\x5b\x74\x23\x2a\xd2\xb5\xc0\xfe\xc0\x1d\xd1\x8d\x48\xc3\x30\
+\x00\x28\x57\x9b\x00\x0b\x80\xe7\x44\x37\xa2\xa2\x5d\x4f\x15\x02\
+\x6e\x8f\x6e\x44\x1a\x94\x01\x40\x39\x9a\x07\x5c\x0c\x6c\x17\xdd\
+\x88\x04\xdc\x04\xbc\x14\x58\x14\xdd\x88\x34\x08\x6f\x73\xa9\xdc\
+\xcc\x04\xce\xc0\xe1\xaf\x74\x6c\x0f\xfc\x80\xea\x67\xa8\x52\x36\
+\xc6\xa3\x1b\x90\x06\x74\x02\xf0\x9a\xe8\x26\xa4\x55\x6c\x06\xcc\
+\x01\x7e\x18\xdd\x88\xd4\x2f\x4f\x01\x28\x27\x2f\x01\x7e\x86\x47\
+\xae\x94\xa6\x09\x60\x2f\xaa\x7d\x54\x4a\x9e\x01\x40\x39\xf9\x39\
+\xfe\xdc\x4f\x69\x5b\x48\x75\x3d\x80\x94\x3c\xff\x92\x52\x2e\xf6\
+\xc2\xe1\xaf\xf4\xed\x81\x37\xa4\x52\x26\x0c\x00\xca\xc5\x3b\xa2\
+\x1b\x90\xfa\xf4\xce\xe8\x06\xa4\x7e\x78\x0a\x40\x39\x98\x06\xdc\
+\x49\xf5\xf3\x3f\x29\x75\x77\x01\x9b\x52\x3d\x3b\x40\x4a\x96\x47\
+\x00\x94\x83\x5d\x71\xf8\x2b\x1f\x1b\x03\xbb\x44\x37\x21\xf5\x62\
+\x00\x50\x0e\x76\x8c\x6e\x40\x1a\xd0\x0e\xd1\x0d\x48\xbd\x18\x00\
+\x94\x83\xad\xa3\x1b\x90\x06\xb4\x4d\x74\x03\x52\x2f\x06\x00\xe5\
+\xc0\x3b\xac\x29\x37\x33\xa3\x1b\x90\x7a\x31\x00\x28\x07\x4f\x46\
+\x37\x20\x0d\xc8\x7d\x56\xc9\x33\x00\x28\x07\xf7\x45\x37\x20\x0d\
+\xe8\xfe\xe8\x06\xa4\x5e\x0c\x00\xca\xc1\x75\xd1\x0d\x48\x03\xba\
+\x36\xba\x01\xa9\x17\xef\x03\xa0\x1c\xcc\xa3\xfa\x6d\xb5\xfb\xab\
+\x72\x30\x01\x6c\x04\xdc\x1b\xdd\x88\x34\x15\x8f\x00\x28\x07\xf7\
+\x50\x3d\x07\x40\xca\xc1\xcf\x71\xf8\x2b\x03\x06\x00\xe5\xe2\xdb\
+\xd1\x0d\x48\x7d\xfa\x4e\x74\x03\x52\x3f\x3c\xa4\xaa\x5c\xcc\x05\
+\x6e\x01\x66\x45\x37\x22\x4d\xe1\x11\xaa\x7b\x00\x2c\x8a\x6e\x44\
+\xea\xc5\x23\x00\xca\xc5\x1f\x80\x13\xa3\x9b\x90\x7a\xf8\x37\x1c\
+\xfe\xca\x84\x47\x00\x94\x93\xd9\xc0\x95\xc0\x56\xd1\x8d\x48\x93\
+\xb8\x1d\xd8\x0d\x7f\xb6\xaa\x4c\x78\x04\x40\x39\x79\x00\x38\x9a\
+\xea\x2a\x6b\x29\x25\x13\xc0\x51\x38\xfc\x95\x91\xf1\xe8\x06\xa4\
+\x01\xdd\x42\x75\x3a\xe0\x90\xe8\x46\xa4\x95\x7c\x04\xf8\x7a\x74\
+\x13\xd2\x20\x0c\x00\xca\xd1\xa5\xc0\x12\x60\x5f\x3c\x8d\xa5\x58\
+\xcb\x80\xe3\x80\x7f\x8a\x6e\x44\x92\x4a\x72\x04\xf0\x30\xd5\x97\
+\xb0\x65\xb5\x5d\x8f\x52\x1d\xf6\x97\x24\x05\xd8\x11\x38\x87\xf8\
+\x61\x60\x95\x55\xe7\x00\x3b\x21\x49\x0a\x77\x08\x70\x36\xb0\x94\
+\xf8\xe1\x60\x75\xb3\x96\x52\xed\x63\x5e\x7f\xa2\x4e\xf0\xfc\xa9\
+\xba\x66\x6b\xe0\x20\xe0\xe5\x54\x3f\xc9\x9a\x07\x6c\x88\xbf\x78\
+\xd1\x60\x26\xa8\x7e\xcf\x7f\x0f\x70\x35\x70\x21\xd5\x5f\xfd\xb7\
+\x44\x36\x25\xd5\xc9\x00\x20\x55\xf7\x17\x18\x36\x20\xcc\x04\xd6\
+\x9a\xe2\xdf\xdf\x3c\xe4\xeb\xaa\xb2\x1d\xf0\xdb\xe8\x26\xa4\x2e\
+\x9a\x1e\xdd\x80\x94\x80\x07\x46\xf8\x6f\xfd\xdd\x77\xb3\x96\x45\
+\x37\x20\x75\x95\x87\x45\x25\x49\x2a\x90\x01\x40\x52\xca\x3c\x02\
+\x20\x35\xc4\x00\x20\x49\x52\x81\x0c\x00\x92\x24\x15\xc8\x00\x20\
+\x29\x65\x9e\x02\x90\x1a\x62\x00\x90\x24\xa9\x40\x06\x00\x49\x92\
+\x0a\x64\x00\x90\x94\x32\x4f\x01\x48\x0d\x31\x00\x48\x92\x54\x20\
+\x03\x80\x24\x49\x05\x32\x00\x48\x4a\x99\xa7\x00\xa4\x86\x18\x00\
+\x24\x49\x2a\x90\x01\x40\x92\xa4\x02\x19\x00\x24\xa5\xcc\x53\x00\
+\x52\x43\x0c\x00\x92\x24\x15\xc8\x00\x20\x49\x52\x81\x0c\x00\x92\
+\x52\xe6\x29\x00\xa9\x21\x06\x00\x49\x92\x0a\x64\x00\x90\x24\xa9\
+\x40\x06\x00\x49\x29\xf3\x14\x80\xd4\x10\x03\x80\x24\x49\x05\x32\
+\x00\x48\x92\x54\x20\x03\x80\xa4\x94\x79\x0a\x40\x6a\x88\x01\x40\
+\x92\xa4\x02\x19\x00\x24\x49\x2a\x90\x01\x40\x52\xca\x3c\x05\x20\
+\x35\xc4\x00\x20\x49\x52\x81\x0c\x00\x92\x24\x15\xc8\x00\x20\x29\
+\x65\x9e\x02\x90\x1a\x62\x00\x90\x24\xa9\x40\x06\x00\x49\x92\x0a\
+\x64\x00\x90\x24\xa9\x40\x06\x00\x49\x29\xf3\x1a\x00\xa9\x21\x06\
+\x00\x49\x92\x0a\x64\x00\x90\x24\xa9\x40\x06\x00\x49\x29\xf3\x14\
+\x80\xd4\x10\x03\x80\x24\x49\x05\x32\x00\x48\x92\x54\x20\x03\x80\
+\xa4\x94\x79\x0a\x40\x6a\x88\x01\x40\x92\xa4\x02\x19\x00\x24\x49\
+\x2a\x90\x01\x40\x52\xca\x3c\x05\x20\x35\xc4\x00\x20\x49\x52\x81\
+\x0c\x00\x92\x24\x15\xc8\x00\x20\x29\x65\x9e\x02\x90\x1a\x62\x00\
+\x90\x24\xa9\x40\x06\x00\x49\x92\x0a\x34\x3d\xba\x01\x3d\xcd\x34\
+\x60\x57\x60\x07\x60\x5b\x60\x06\xf0\x04\xf0\x10\x70\x1d\xf0\x6b\
+\xe0\x9e\xb0\xee\x24\x69\x6a\xf3\xa8\xbe\xc3\x76\x02\xd6\xa5\xfa\
+\x0e\x7b\x1c\xb8\x05\xb8\x9e\xea\x3b\x6c\x22\xac\x3b\x29\x41\x7b\
+\x02\x5f\x01\xee\xa6\x3a\xe7\xb9\xba\x9a\x00\x16\x02\x7f\x0d\xcc\
+\x0d\xe9\x54\x83\x9a\x6a\x7b\x5a\xbd\x6b\x83\xc1\x57\xb9\x5a\x36\
+\x97\xea\x3b\xe9\x12\xaa\xef\xa8\xa9\xb6\xe7\xdd\xc0\x29\xc0\xcb\
+\x42\x3a\x95\x12\xb2\x27\xd5\x87\x66\x98\x2f\xc6\x87\x80\xe3\x81\
+\xd9\xad\x77\xad\x41\x44\x0f\xd0\xdc\x6b\xfd\xc1\x57\xb9\x5a\x32\
+\x07\xf8\x14\xd5\x77\xd1\x30\xdb\xf6\x12\x0c\x02\x2a\xd0\xda\xc0\
+\x17\x80\xa5\x8c\xfe\x05\x79\x1b\xb0\x6f\xbb\xed\x6b\x00\xd1\x03\
+\x34\xf7\x32\x00\xa4\x69\x3f\xe0\x3f\x19\x7d\xfb\x2e\x05\x4e\x04\
+\x66\xb6\xdb\xbe\x14\x63\x1e\xc3\xff\xd5\x3f\xd5\x87\xe8\xbd\x6d\
+\x2e\x84\xfa\x16\x3d\x40\x73\x2f\x03\x40\x7a\x3e\x40\xef\x43\xfd\
+\x83\xd6\x42\xaa\xef\x46\xa9\xb3\x36\x03\x6e\xa4\xb9\x2f\xcb\xbf\
+\x69\x6f\x51\xd4\xa7\xe8\x01\x9a\x7b\xcd\x19\x7c\x95\xab\x41\x7f\
+\x4b\x73\xdb\xfa\x46\x60\xf3\xf6\x16\x45\x6a\xcf\x86\xc0\x35\x34\
+\xfb\x65\x39\x01\x1c\xd9\xd6\x02\xa9\x2f\xd1\x03\x34\xf7\xf2\x1a\
+\x97\x74\xbc\x89\xe6\xb7\xf7\x0d\xc0\x26\x6d\x2d\x90\xd4\x86\xb9\
+\xc0\x55\xb4\xf3\x85\xf9\x30\xd5\x4f\x70\x94\x86\xe8\x01\x9a\x7b\
+\x79\x04\x20\x0d\xcf\x06\x1e\xa1\x9d\x6d\x7e\x15\xfe\xca\x49\x1d\
+\x31\x1b\xf8\x05\xed\x7e\x69\x9e\xd7\xca\x92\xa9\x1f\xd1\x03\x34\
+\xf7\xf2\x08\x40\x1a\xce\xa6\xdd\xed\x7e\x39\xfe\x04\x54\x99\x5b\
+\x17\xb8\x98\x98\x2f\xce\x43\x5a\x58\x3e\xf5\x16\x3d\x40\x73\x2f\
+\x03\x40\xbc\x43\x89\xd9\xf6\x17\x03\xb3\x5a\x58\x3e\xa9\x76\x33\
+\x81\xf3\x89\xfb\xe2\x3c\xab\xf9\x45\x54\x1f\xa2\x07\x68\xee\xb5\
+\xde\xe0\xab\x5c\x35\x3b\x8f\xb8\xed\x7f\x11\xb0\x4e\xf3\x8b\x28\
+\xd5\x67\x4d\xda\x3f\x64\xb6\x6a\x2d\x05\xb6\x6e\x78\x39\xd5\x5b\
+\xf4\x00\xcd\xbd\x0c\x00\xb1\xb6\xa3\xfe\x9f\xfc\x0d\x5a\xe7\x50\
+\x7d\xa7\xaa\x66\x3e\x0c\xa8\x7e\xe3\x54\xb7\xf5\x3d\x28\xb8\x8f\
+\x69\x09\xf4\x20\x8d\x6a\x59\x74\x03\x85\x9b\x0f\x8c\x05\xf7\x70\
+\x20\x70\x06\x86\x80\xda\x19\x00\xea\xb5\x62\xf8\xbf\x21\xba\x91\
+\xe5\x5e\x1e\xdd\x80\xa4\xac\xa5\xf2\x1d\x32\x1f\xf8\xbf\xf8\x00\
+\x3b\x25\x6a\x1a\xd5\x43\x2e\xa2\x0f\x99\xae\x5c\x57\x36\xba\xc4\
+\xea\x47\xf4\x3e\x90\x7b\x79\x11\x58\xac\xab\x89\xdf\x07\x56\xae\
+\x53\xf0\x0f\x57\x25\x66\x8c\xea\x7e\xd6\xd1\x1f\x8e\x55\xeb\xee\
+\x26\x17\x5a\x7d\x89\xde\x07\x72\x2f\x03\x40\xac\x45\xc4\xef\x03\
+\xab\xd6\xc9\xc4\x9f\x96\x90\xfe\xe4\x33\xc4\x7f\x28\x26\xab\x27\
+\x9b\x5c\x68\xf5\x25\x7a\x1f\xc8\xbd\x0c\x00\xb1\xea\x78\x60\x59\
+\x13\xf5\xd9\x26\x17\x5a\xea\xd7\x27\x89\xff\x30\x4c\x55\x8a\x15\
+\xbd\xfd\x73\xaf\x75\x07\x5f\xe5\xaa\xc9\x18\xf1\xdb\x7f\xaa\xfa\
+\x74\x73\x8b\x2e\xf5\xd6\xe4\x83\x31\xea\x2a\xc5\x8a\xde\xfe\xb9\
+\x97\x01\x20\xce\x34\xe2\xb7\x7f\xaf\xfa\xdb\xc6\x96\x5e\x9a\xc2\
+\xfb\x89\xdf\xf9\xfb\x29\xc5\x8a\xde\xfe\xb9\x97\x37\x81\x89\x33\
+\x4e\xfc\xf6\xef\xa7\x8e\x6d\x6a\x05\x48\x93\x79\x3b\xf1\x37\xc7\
+\xe8\xb7\x14\x2b\x7a\xfb\xe7\x5e\x06\x80\x38\x6b\x10\xbf\xfd\xfb\
+\xa9\x09\xe0\x98\x86\xd6\x81\xf4\x34\x6f\x23\xdd\x0b\x63\x26\x2b\
+\xc5\x8a\xde\xfe\xb9\x97\x01\x20\xce\x0c\xe2\xb7\x7f\xbf\x35\x01\
+\xbc\xb3\x99\xd5\x20\x55\x5e\x0f\x2c\x21\x7e\x67\x1f\xa4\x14\x2b\
+\x7a\xfb\xe7\x5e\x6b\x0f\xbe\xca\x55\x93\x35\x89\xdf\xfe\x83\xd4\
+\x52\xe0\x2d\x8d\xac\x89\x8e\xf2\x86\x0a\xfd\x7b\x0d\xde\x89\x4a\
+\x52\x39\x72\xfb\xad\xfd\x8a\x9b\xb1\x1d\x11\xdd\x48\x2e\x0c\x00\
+\xfd\x39\x10\xf8\x06\xd5\x39\x31\x49\x2a\x41\x6e\x01\x00\x9e\xba\
+\x1d\xfb\xab\xa2\x1b\xc9\x81\x01\xa0\xb7\x7d\xf1\x41\x14\x52\x14\
+\x4f\x63\xc5\xc9\x31\x00\x40\xf5\x87\xda\xe9\x54\xcf\x0f\xd0\x14\
+\x0c\x00\x53\xdb\x03\x38\x13\x98\x19\xdd\x88\x24\xb5\x2c\xd7\x00\
+\x00\xd5\x05\x8c\xa7\x03\x7b\x47\x37\x92\x32\x03\xc0\xea\x3d\x1f\
+\xf8\x01\xde\x88\x44\x52\x99\x72\x0e\x00\x50\x5d\x40\xfa\x5d\xe0\
+\x45\xd1\x8d\xa4\xca\x00\x30\xb9\xdd\x80\x05\xc0\xfa\xd1\x8d\x48\
+\x85\xf3\x14\x40\x9c\xdc\x03\x00\xc0\x7a\xc0\x39\xc0\x0b\xa2\x1b\
+\x49\x91\x01\xe0\x99\x76\xa0\xda\x61\xe6\x46\x37\x22\x49\x81\xba\
+\x32\x1f\xe6\x00\x67\x01\xcf\x89\x6e\x24\x35\x5d\xd9\xc0\x75\xd9\
+\x1e\xf8\x31\xb0\x71\x74\x23\x92\x14\xac\x0b\x47\x00\x56\xd8\x10\
+\xf8\x11\xb0\x53\x74\x23\x29\x31\x00\x3c\x65\x0b\xaa\xc3\xfe\x9b\
+\x46\x37\x22\xe9\x4f\x3c\x05\x10\xa7\x4b\x01\x00\x60\x23\xaa\xef\
+\xf8\x6d\xa2\x1b\x49\x85\x01\xa0\xb2\x62\xc7\xd8\x3a\xb8\x0f\x49\
+\x4a\x45\xd7\x02\x00\xc0\xe6\x54\x47\x79\xb7\x8a\x6e\x24\x05\x06\
+\x80\xea\xd0\xd0\xf9\xc0\x8e\xd1\x8d\x48\x52\x42\xba\x18\x00\xa0\
+\x1a\xfe\x0b\xf0\x54\x6f\xf1\x01\x60\x0e\x70\x36\xb0\x73\x74\x23\
+\x92\x26\xe5\x29\x80\x38\x5d\x0d\x00\x00\xcf\x02\xce\xa5\xf0\x8b\
+\xbd\x4b\x0e\x00\xeb\x51\xed\x00\xbb\x47\x37\x22\x49\x09\xea\x72\
+\x00\x00\xd8\x15\x38\x8f\x82\x7f\xee\x5d\x6a\x00\x58\x1b\xf8\x1e\
+\xf0\xc2\xe8\x46\x24\x29\x51\x5d\x0f\x00\x00\xcf\x03\x7e\x08\xcc\
+\x8a\x6e\x24\x42\x89\x01\x60\x26\xf0\x7d\x60\xaf\xe8\x46\x24\xf5\
+\xe4\x29\x80\x38\x25\x04\x00\x80\x97\x50\x85\x80\x75\xa2\x1b\x69\
+\x5b\x69\x01\x60\x06\xf0\x4d\x60\x9f\xe8\x46\x24\x29\x71\x25\xcd\
+\x87\x3d\x81\xef\x00\x6b\x45\x37\xd2\xa6\x92\x36\xf0\x38\xf0\x55\
+\xe0\x95\xd1\x8d\x48\x52\x06\x4a\x39\x02\xb0\xc2\x01\x14\xf6\xd8\
+\xf7\x52\x02\xc0\x38\x70\x2a\xf0\x86\xe8\x46\x24\x0d\xc4\x53\x00\
+\x71\x4a\x0b\x00\x00\x87\x01\x5f\x07\xa6\x47\x37\xd2\x86\x12\x02\
+\xc0\x18\xf0\x05\xe0\xcd\xd1\x8d\x48\x52\x46\x4a\x0c\x00\x00\xaf\
+\x03\x4e\xa2\x80\xf9\xd8\xf5\x05\x1c\x03\x4e\x00\xde\x11\xdd\x88\
+\x24\x65\xa6\xd4\x00\x00\x70\x14\xf0\x65\x3a\xbe\x0e\xba\x1e\x00\
+\x8e\x07\x8e\x89\x6e\x42\xd2\xd0\x3c\x05\x10\xa7\xd3\xc3\xaf\x0f\
+\x47\x03\x9f\x8d\x6e\xa2\x49\x5d\x0e\x00\x9f\x00\x3e\x1a\xdd\x84\
+\x24\x65\xaa\xf4\x00\x00\xf0\x3e\xe0\x9f\xa3\x9b\x68\x4a\x57\x03\
+\xc0\x87\x81\xe3\xa2\x9b\x90\xa4\x8c\x19\x00\x2a\x9d\x9d\x27\x5d\
+\xbc\xd2\xf1\x83\x74\x38\xb1\x0d\x61\xdb\x96\xde\xe7\xbe\x96\xde\
+\xa7\x2d\x13\xc0\x03\xd1\x4d\x48\x81\x0c\x00\x4f\xf9\x04\xf0\x28\
+\xf0\x2f\xd1\x8d\xd4\xa9\x6b\x1b\xf8\x68\xe0\x7f\xd3\xbd\xe5\x92\
+\x24\xc5\x5a\x06\xbc\x07\x38\x31\xba\x91\xba\x8c\x47\x37\x50\xa3\
+\xa3\x28\xe4\xa7\x1b\x92\xa4\xd6\x8d\x01\x87\x00\x77\x00\xbf\x0a\
+\xee\xa5\x16\x5d\x09\x00\xaf\x03\xbe\x42\x77\x96\x47\x92\x94\x9e\
+\x15\x21\xe0\x26\xe0\xea\xe0\x5e\x46\xd6\x85\x81\x79\x18\x70\x1a\
+\x05\xdd\xbe\x51\x92\x14\x66\x1a\xf0\x1a\xe0\x3a\xe0\x9a\xe0\x5e\
+\x46\x92\xfb\xb9\xf2\x03\x80\xef\x52\xd8\x03\x1c\x24\x49\xe1\x9e\
+\x00\x0e\x07\x7e\x10\xdd\xc8\xb0\x72\x0e\x00\x7b\x02\x67\x53\xe0\
+\x23\x1c\x25\x49\x49\x78\x94\xea\x01\x73\x3f\x8e\x6e\x64\x18\xb9\
+\x06\x80\x3d\x80\x73\x80\x59\xd1\x8d\x48\x92\x8a\xb6\x18\x38\x18\
+\xf8\x69\x74\x23\x83\xca\x31\x00\x3c\x0f\x38\x1f\x58\x3f\xba\x11\
+\x49\x92\x80\x07\x81\xfd\x81\x4b\xa3\x1b\x19\x44\x6e\x01\x60\x57\
+\xaa\x43\x2d\x73\xa3\x1b\x91\x24\x69\x25\xf7\x03\xfb\x91\xd1\x4f\
+\x04\x73\x0a\x00\x3b\x00\x17\x00\x1b\x47\x37\x22\x49\xd2\x24\x16\
+\x01\xaf\x00\x7e\x13\xdc\x47\x5f\x72\x09\x00\xdb\x51\x9d\x5f\xd9\
+\x34\xba\x11\x49\x92\xa6\x70\x37\xb0\x37\x70\x7d\x74\x23\xbd\xe4\
+\x10\x00\xb6\xa0\xfa\xcb\x7f\x9b\xe8\x46\x24\x49\xea\xc3\xef\x80\
+\xbd\x80\x5b\x83\xfb\x98\x52\xea\xb7\xcd\xdd\x08\x38\x17\x87\xbf\
+\x24\x29\x1f\x5b\x00\x0b\x48\xfc\xa8\x75\xca\x01\x60\x43\xe0\x47\
+\xc0\x4e\xd1\x8d\x48\x92\x34\xa0\xed\xa9\x2e\x5a\x4f\xf6\xba\xb5\
+\x54\x03\xc0\x1c\xaa\x9b\xfc\x3c\x27\xba\x11\x49\x92\x86\xb4\x03\
+\xd5\x3d\x6b\x92\xfc\xe5\x5a\x8a\x01\x60\x3d\xaa\x15\xb6\x7b\x74\
+\x23\x92\x24\x8d\x68\x37\xaa\xd3\x01\xc9\xdd\xbb\x26\xb5\x00\xb0\
+\x36\xf0\x3d\xe0\x45\xd1\x8d\x48\x92\x54\x93\xe7\x53\x3d\x33\x60\
+\xdd\xe8\x46\x56\x96\x52\x00\x58\x13\x38\x9d\xea\xca\x49\x49\x92\
+\xba\x64\x0f\xe0\x4c\x60\x66\x74\x23\x2b\xa4\x12\x00\x66\x00\xdf\
+\x02\xe6\x47\x37\x22\x49\x52\x43\xf6\x05\xce\xa0\xfa\x83\x37\x5c\
+\x0a\x01\x60\x1c\xf8\x0a\xf0\xaa\xe8\x46\x24\x49\x6a\xd8\x81\xc0\
+\x37\x80\x35\xa2\x1b\x19\x0f\x7e\xff\x69\x54\xc3\xff\xc8\xe0\x3e\
+\x24\x49\x6a\xcb\x4e\xc0\xb3\x81\xef\x00\x13\x51\x4d\x44\x06\x80\
+\x31\xe0\x8b\xc0\x5f\x04\xf6\x20\x49\x52\x84\x9d\x81\xad\x80\xef\
+\x02\xcb\x22\x1a\x88\x0a\x00\x63\xc0\x09\xc0\xbb\x82\xde\x5f\x92\
+\xa4\x68\xcf\x03\x36\xa7\xfa\xf5\x5b\xeb\xa2\x02\xc0\xf1\xc0\x07\
+\x83\xde\x5b\x92\xa4\x54\xec\xce\x53\x37\xbf\x6b\x55\x44\x00\xf8\
+\x38\xf0\x37\x01\xef\x2b\x49\x52\x8a\x5e\x42\x35\x8f\x7f\xdc\xe6\
+\x9b\xb6\x1d\x00\x3e\x04\x7c\xb2\xe5\xf7\x94\x24\x29\x75\x7b\x03\
+\x4b\x80\x0b\xdb\x7a\xc3\x36\x03\xc0\xfb\x80\xcf\xb4\xf8\x7e\x92\
+\x24\xe5\x64\x3f\x60\x31\x70\x71\x1b\x6f\xd6\x56\x00\x38\x1a\x38\
+\x91\xea\xe2\x3f\x49\x92\x34\xb9\xfd\x81\x7b\x80\xcb\x9a\x7e\xa3\
+\x36\x02\xc0\x51\xc0\x49\xa4\x71\xd3\x21\x49\x92\x52\x36\x06\x1c\
+\x0c\xdc\x0a\x5c\xd9\xf4\x1b\x35\xe9\x60\xaa\xdf\x38\x4e\x6f\xf8\
+\x7d\x24\x49\xea\x92\xa5\xc0\xe1\x54\x33\xb4\x11\x4d\x06\x80\x6d\
+\x80\x2b\xa8\x1e\xef\x2b\x49\x92\x06\xf3\x00\xd5\xbd\x02\x6e\x6d\
+\xe2\xc5\x9b\x3a\x2c\x3f\x06\xfc\x1f\x1c\xfe\x92\x24\x0d\x6b\x36\
+\x70\x72\x53\x2f\xde\x54\x00\x78\x23\x3e\xd6\x57\x92\xa4\x51\xed\
+\x03\xbc\xb6\x89\x17\x6e\xea\x14\xc0\xe5\x54\x87\x2d\x24\x49\xd2\
+\x68\xae\x04\x9e\x4f\xcd\xcf\x0c\x68\xe2\x08\xc0\x0b\x70\xf8\x4b\
+\x92\x54\x97\xe7\x2e\xaf\x5a\x35\x11\x00\x0e\x69\xe0\x35\x25\x49\
+\x2a\xd9\xc1\x75\xbf\xa0\x01\x40\x92\xa4\xf4\xd5\x3e\x5b\x9b\xb8\
+\x06\x60\x31\x30\xb3\x81\xd7\x95\x24\xa9\x54\x8f\x00\xeb\xd6\xf9\
+\x82\x75\x1f\x01\x98\x83\xc3\x5f\x92\xa4\xba\xad\x03\xcc\xaa\xf3\
+\x05\xeb\x0e\x00\x1b\xd7\xfc\x7a\x92\x24\xa9\x52\xeb\x8c\xad\x3b\
+\x00\xd4\xfa\x13\x05\x49\x92\xf4\x27\x49\xff\x0c\xf0\xae\x9a\x5f\
+\x4f\x92\x24\x55\x6a\x9d\xb1\x4d\x5c\x04\xf8\x08\xb0\x76\x03\xaf\
+\x2b\x49\x52\xa9\x1e\x26\xf1\x6b\x00\xa0\xe1\xc7\x17\x4a\x92\x54\
+\xa0\xcb\xeb\x7e\xc1\x26\x02\xc0\x59\x0d\xbc\xa6\x24\x49\x25\xab\
+\x7d\xb6\x36\x11\x00\x7e\xd0\xc0\x6b\x4a\x92\x54\xb2\x1f\xd6\xfd\
+\x82\x4d\x04\x80\x5f\xd1\xc0\xa1\x0a\x49\x92\x0a\x75\x19\x0d\x9c\
+\x5e\x6f\xea\x71\xc0\xff\xb3\xa1\xd7\x95\x24\xa9\x34\x9f\x6c\xe2\
+\x45\x9b\x7a\x1c\xf0\x18\xf0\x63\x60\xef\x86\x5e\x5f\x92\xa4\x12\
+\x9c\x0f\xec\xd7\xc4\x0b\x37\x15\x00\x00\xb6\xa0\x3a\x64\xb1\x7e\
+\x83\xef\x21\x49\x52\x57\xdd\x0f\x3c\x1f\xb8\xb5\x89\x17\x6f\xea\
+\x14\x00\xc0\xef\x80\x37\x03\x4f\x36\xf8\x1e\x92\x24\x75\xd1\x52\
+\xe0\xad\x34\x34\xfc\x01\xc6\x9b\x7a\xe1\xe5\x6e\x02\x6e\x03\x0e\
+\xa3\xd9\xa3\x0d\x92\x24\x75\xc5\x04\x70\x34\xf0\xcd\x26\xdf\xa4\
+\xe9\x00\x00\xd5\x69\x80\xdb\x81\x43\x31\x04\x48\x92\x34\x95\x65\
+\xc0\x7b\x80\x93\x9a\x7e\xa3\x36\x02\x00\x54\x3f\x0b\xbc\x0f\x38\
+\xb8\xa5\xf7\x93\x24\x29\x47\xc7\x02\x9f\x6b\xe3\x8d\xda\x0a\x00\
+\x00\x3f\x07\x1e\x02\x0e\x6a\xf1\x3d\x25\x49\xca\xc5\x71\xc0\xa7\
+\xda\x7a\xb3\x36\x03\x00\xc0\x42\x60\x3a\xb0\x57\xcb\xef\x2b\x49\
+\x52\xca\x3e\x0e\xfc\x63\x9b\x6f\xd8\x76\x00\x80\xea\xfe\x00\x33\
+\x81\x3d\x03\xde\x5b\x92\xa4\xd4\x7c\x8e\xea\xd0\x7f\xab\x22\x02\
+\x00\xc0\x8f\x80\x0d\x81\x17\x06\xbd\xbf\x24\x49\x29\x38\x09\x78\
+\x77\xc4\x1b\x47\x05\x00\xa8\x9e\x6c\xb4\x09\xf0\x82\xc0\x1e\x24\
+\x49\x8a\x72\x0a\xf0\x5f\xa8\xae\xfc\x6f\x5d\x64\x00\x80\xea\xe9\
+\x46\xcf\x02\x76\x0d\xee\x43\x92\xa4\x36\x7d\x0b\x78\x1b\xd5\x0d\
+\x7f\x42\x44\x07\x80\x65\xc0\x99\xc0\x4e\xc0\x73\x82\x7b\x91\x24\
+\xa9\x0d\x67\x00\x47\x12\x7c\xa7\xdc\x54\x6e\xcc\x33\x03\x38\x1d\
+\x78\x55\x74\x23\x92\x24\x35\xe8\x5c\xaa\x1b\xe3\x3d\x1e\xdd\x48\
+\x2a\x01\x00\x60\x4d\xaa\x54\x34\x3f\xba\x11\x49\x92\x1a\x70\x3e\
+\xd5\x1f\xba\x8f\x46\x37\x02\x69\x05\x00\x80\xb5\xa9\x2e\x0e\xf4\
+\x3e\x01\x92\xa4\x2e\x59\x08\x1c\x08\x3c\x1c\xdd\xc8\x0a\xa9\x05\
+\x00\x80\xf5\x80\x05\xc0\x8b\xa2\x1b\x91\x24\xa9\x06\x97\x03\xfb\
+\x51\xdd\x12\x3f\x19\x29\x06\x00\x80\x39\x54\xf7\x0a\xd8\x3d\xba\
+\x11\x49\x92\x46\x70\x15\xb0\x2f\xf0\x87\xe8\x46\x56\x95\x6a\x00\
+\x80\xea\x46\x41\x3f\x01\x76\x0e\xee\x43\x92\xa4\x61\xdc\x00\xec\
+\x0d\xdc\x15\xdd\xc8\x64\x52\x0e\x00\x00\x1b\x51\x85\x80\x9d\x82\
+\xfb\x90\x24\x69\x10\x37\x51\x0d\xff\x3b\xa2\x1b\x59\x9d\xd4\x03\
+\x00\xc0\x16\xc0\x05\xc0\x36\xd1\x8d\x48\x92\xd4\x87\xdf\x51\x5d\
+\xcc\x7e\x6b\x70\x1f\x53\xca\x21\x00\x00\x6c\x07\xfc\x14\xd8\x34\
+\xba\x11\x49\x92\xa6\x70\x37\xd5\x5f\xfe\xd7\x47\x37\xd2\xcb\xb4\
+\xe8\x06\xfa\x74\x33\xb0\x0f\x89\x9e\x47\x91\x24\x09\x58\x44\x75\
+\xc1\x5f\xf2\xc3\x1f\xf2\x09\x00\x50\x5d\x4c\x71\x20\x09\x5e\x49\
+\x29\x49\x2a\xde\xfd\x54\x37\xb2\xfb\x4d\x74\x23\xfd\xca\x29\x00\
+\x00\x5c\x0d\xec\x4f\x62\xbf\xa5\x94\x24\x15\xed\x41\xaa\x3f\x50\
+\x7f\x15\xdd\xc8\x20\x72\x0b\x00\x00\x57\x00\xaf\x04\x1e\x8a\x6e\
+\x44\x92\x54\xbc\xc5\xc0\xab\x81\x4b\xa3\x1b\x19\x54\x8e\x01\x00\
+\xaa\x5b\x2a\x1e\x02\x3c\x12\xdd\x88\x24\xa9\x58\x8f\x52\xdd\xdb\
+\xff\xa7\xd1\x8d\x0c\x23\xd7\x00\x00\x70\x11\xf0\x5a\x12\x78\xa2\
+\x92\x24\xa9\x38\x4f\x00\x6f\x00\x7e\x1c\xdd\xc8\xb0\x72\x0e\x00\
+\x50\x3d\x33\xe0\x48\x60\x49\x74\x23\x92\xa4\x62\x2c\x05\xfe\x1c\
+\xf8\x41\x74\x23\xa3\x18\x8f\x6e\xa0\x06\xd7\x51\x5d\x75\x79\x38\
+\xf9\x07\x1a\x49\x52\xda\x96\x02\x47\x01\xa7\x45\x37\x32\xaa\x2e\
+\x04\x00\x80\x6b\x81\xff\x04\x0e\x25\x9f\x9b\x1b\x49\x92\xf2\xb2\
+\x0c\x78\x17\x70\x4a\x74\x23\x75\xe8\x4a\x00\x00\xb8\x12\xb8\x1d\
+\x43\x80\x24\xa9\x7e\xcb\x80\xf7\x00\x5f\x8a\x6e\xa4\x2e\xd3\xa3\
+\x1b\xa8\xd9\xc9\x54\x8f\x12\xfe\x74\x74\x23\x09\xd9\x16\xb8\x25\
+\xba\x89\x42\x8d\x03\x4f\x46\x37\x91\xb9\x3a\xc2\xfc\x6c\xba\x77\
+\x7a\x70\xfd\x96\xde\xe7\xe6\x96\xde\x27\x07\x1f\x06\x4e\x8c\x6e\
+\x42\xbd\x7d\x8c\x2a\xad\x59\xb0\xd5\x88\xeb\x52\xc3\x9b\x4e\xfc\
+\xf6\xcf\xbd\x14\x2b\x7a\xfb\xa7\x52\xc7\x8d\xba\x22\xd5\xae\x4f\
+\x10\xbf\xd3\xa4\x50\x5b\x8e\xba\x22\x35\x34\x03\xc0\xe8\xa5\x58\
+\xd1\xdb\x3f\x85\xfa\xf8\xc8\x6b\x51\x21\x3e\x45\xfc\xce\x13\x5d\
+\x5b\x8c\xbc\x16\x35\x2c\x03\xc0\xe8\xa5\x58\xd1\xdb\x3f\xba\x3e\
+\x37\xfa\x2a\x4c\x57\xd7\xce\x8b\xad\xea\xbf\x02\x5f\x88\x6e\x22\
+\x98\x5f\xa2\x71\xbc\x18\x55\xca\xd7\xc9\xc0\x07\xa2\x9b\x68\x52\
+\xd7\x03\xc0\x32\xe0\xdd\xc0\x97\xa3\x1b\x09\x64\x00\x90\xa4\xc1\
+\x9c\x0a\xbc\x83\x8e\x7f\x7f\x76\x3d\x00\x40\xb5\x01\xff\x0a\xf8\
+\x7a\x74\x23\x41\x3a\xbd\x03\x4b\x52\xcd\x4e\x07\xde\x0e\x4c\x44\
+\x37\xd2\xb4\x12\x02\x00\x54\x77\x6e\x7a\x2b\xf0\xcd\xe8\x46\x02\
+\x18\x00\xe2\x78\x0a\x40\xca\xcb\x99\xc0\x9b\x28\xe4\xe7\xbb\xa5\
+\x04\x00\xe8\xc8\xbd\x9b\x87\x60\x00\x90\xa4\xde\x8a\x7b\xb6\x4c\
+\x49\x01\x00\x3a\xf0\xf4\xa6\x21\x74\xfe\x30\x96\x24\x8d\x68\xc5\
+\xd3\x65\x1f\x8b\x6e\xa4\x4d\xa5\x05\x00\xc8\xfc\xf9\xcd\x43\xf0\
+\x08\x40\x1c\x4f\x01\x48\xe9\x5b\x08\x1c\x02\x3c\x12\xdd\x48\xdb\
+\x4a\x0c\x00\x00\x8b\x81\x57\x03\x97\x46\x37\xd2\x02\x03\x80\x24\
+\x4d\xee\x0a\xe0\x95\xc0\x43\xd1\x8d\x44\x28\x35\x00\x00\x3c\x08\
+\x1c\x08\xfc\x2a\xba\x91\x86\x19\x00\x24\xe9\x99\xae\x06\xf6\x07\
+\xee\x8b\x6e\x24\x4a\xc9\x01\x00\xe0\x7e\x60\x3e\xf0\x9b\xe8\x46\
+\x1a\x64\x00\x88\xe3\x29\x00\x29\x4d\x37\x50\xfd\x01\xf8\x87\xe8\
+\x46\x22\x95\x1e\x00\x00\x16\x51\xed\x08\x5d\x7d\xea\x95\x01\x40\
+\x92\x9e\x72\x33\xb0\x0f\x70\x57\x74\x23\xd1\x0c\x00\x95\xdf\x53\
+\xed\x10\xb7\x06\xf7\xd1\x04\x03\x80\x24\x55\x7e\x07\x1c\x00\xdc\
+\x11\xdd\x48\x0a\x0c\x00\x4f\xe9\xea\x8e\x61\x00\x88\xe3\x29\x00\
+\x29\x1d\x77\x53\x1d\xed\xbd\x25\xba\x91\x54\x18\x00\x9e\xee\x26\
+\xba\x77\x68\xc8\x00\x20\xa9\x74\x8b\x80\xfd\x80\xeb\xa2\x1b\x49\
+\x89\x01\xe0\x99\x6e\x00\x0e\xa2\x3b\x17\x87\x78\x23\x20\x49\x25\
+\x5b\x71\xb1\xf7\x35\xd1\x8d\xa4\xc6\x00\x30\xb9\xab\xa8\x4e\x07\
+\x74\xe1\xe7\x21\x1e\x01\x88\xe3\x29\x00\x29\xd6\x83\x54\x7f\xd0\
+\x75\xfd\xe7\xde\x43\x31\x00\xac\xde\xe5\x54\x37\x88\x78\x38\xba\
+\x91\x11\x19\x00\x24\x95\x68\xc5\x0d\xdf\x7e\x11\xdd\x48\xaa\x0c\
+\x00\x53\x5b\x08\x1c\x46\xde\xf7\x87\x36\x00\x48\x2a\xcd\xe3\xc0\
+\xeb\x28\xe7\x96\xef\x43\x31\x00\xf4\x76\x3e\x55\x08\x78\x3c\xba\
+\x91\x21\x19\x00\xe2\x78\x0a\x40\x6a\xdf\x13\xc0\xeb\x81\xb3\xa3\
+\x1b\x49\x9d\x01\xa0\x3f\xe7\x52\x3d\x26\x32\xc7\x67\x44\x1b\x00\
+\x24\x95\x62\x29\xf0\x56\xe0\xfb\xd1\x8d\xe4\xc0\x00\xd0\xbf\x33\
+\x80\x37\x51\xed\x60\x39\x31\x00\x48\x2a\xc1\x04\x70\x14\xf0\xff\
+\xa2\x1b\x51\x77\xbd\x8d\x2a\x04\x2c\xcb\xa4\xd6\x68\x66\x35\xa8\
+\x0f\xeb\x12\xbf\xfd\x73\x2f\xc5\x8a\xde\xfe\xfd\xd6\x04\xf0\xce\
+\x86\xd6\x81\xf4\x34\x6f\xa7\xda\xe1\xa2\x77\xfa\x7e\x6a\x7a\x43\
+\xeb\x40\xbd\x19\x00\x46\x2f\xc5\x8a\xde\xfe\xfd\xd4\x04\x70\x4c\
+\x53\x2b\x40\x9a\xcc\x07\x88\xdf\xf1\xfb\x29\x4f\xf3\xc4\x31\x00\
+\x8c\x5e\x8a\x15\xbd\xfd\xfb\xa9\x63\x1b\x5b\x7a\x69\x0a\x7f\x47\
+\xfc\xce\xdf\xab\xbc\x12\x3d\xce\x2c\xe2\xb7\x7f\xee\xa5\x58\xd1\
+\xdb\xbf\x57\x7d\xac\xb9\x45\x97\x7a\xfb\x24\xf1\x1f\x02\xbf\x40\
+\xd3\x64\x00\x70\xff\xcd\x5d\xf4\xf6\x9f\xaa\x3e\xdd\xe0\x72\x4b\
+\x7d\xfb\x2c\xf1\x1f\x86\xc9\x2a\xc7\x9f\x2d\x76\x89\x01\x60\xf4\
+\x52\xac\x54\x2f\x78\xfe\x4c\x93\x0b\x2d\x0d\x62\x0c\xf8\x02\xf1\
+\x1f\x8a\x55\xeb\xce\x26\x17\x5a\x3d\xad\x47\xfc\x3e\x90\x7b\x29\
+\xd6\x3d\xc4\xef\x03\xab\xd6\x49\x78\x6a\xb3\x16\x5e\x20\x56\x8f\
+\x65\xc0\xbb\x81\x53\xa3\x1b\x59\xc5\x3d\xd1\x0d\x14\xce\x01\xa6\
+\xdc\xdd\x1d\xdd\xc0\x2a\x4e\x05\xde\x81\x9f\xad\x5a\x18\x00\xea\
+\x33\x01\x1c\x0d\x7c\x23\xba\x91\x95\x5c\x15\xdd\x40\xe1\xfc\x2b\
+\x45\xb9\xfb\x75\x74\x03\x2b\xf9\x36\x4f\xfd\x04\x5b\x35\x30\x00\
+\xd4\x6b\x29\xd5\x9d\xa8\xbe\x1b\xdd\xc8\x72\x17\x46\x37\x20\x29\
+\x6b\xa9\x7c\x87\x9c\x49\xbe\xb7\x63\x57\x61\xd6\x04\xce\x21\xf6\
+\x3c\xd9\x52\x60\xeb\x86\x97\x53\x53\xf3\x1a\x80\xd1\x4b\xb1\xb6\
+\x25\xfe\xa6\x67\x67\x53\x7d\xa7\x4a\xd9\x98\x49\xf5\x24\xc1\xa8\
+\x0f\xcd\x0f\x9b\x5f\x44\xf5\x30\x9b\xf8\x01\x9a\x7b\x29\xde\x02\
+\xe2\xb6\xff\x45\xc0\x3a\xcd\x2f\xa2\x54\xbf\x59\xc0\xc5\xc4\x7c\
+\x70\xe6\xb7\xb0\x7c\x9a\x9a\x01\x60\xf4\x52\xbc\x57\x13\xb3\xed\
+\x2f\xa6\xba\x9b\xa6\x94\xad\xd9\xc0\xa5\xb4\xfb\xc1\x59\xd0\xca\
+\x92\xa9\x97\x39\xc4\x0f\xd0\xdc\x4b\x69\x38\x9b\x76\xb7\xfb\xe5\
+\xc0\xfa\xad\x2c\x99\xd4\xb0\xb9\x54\x57\xe4\xb7\xf1\xc1\x79\x18\
+\xd8\xb1\x9d\xc5\x52\x0f\x06\x80\xd1\x4b\x69\x78\x36\xd5\x77\x4b\
+\x1b\xdb\xfc\x2a\xaa\xef\x4c\xa9\x33\xe6\x01\xbf\xa1\xd9\x0f\xce\
+\x04\x70\x44\x5b\x0b\xa4\x9e\x0c\x00\x06\x80\x2e\x39\x9c\xe6\x2f\
+\x08\xbc\x01\xd8\xa4\xad\x05\x92\xda\xb4\x39\x70\x23\xcd\x7d\x78\
+\x7c\x2a\x56\x5a\x0c\x00\x06\x80\xae\x39\x8e\xe6\xb6\xf5\x8d\xc0\
+\x66\xed\x2d\x8a\xd4\xbe\x79\xc0\x42\xea\xfd\xe0\x2c\xa5\xba\x13\
+\xa1\xd2\xb2\x3e\xf1\x03\x34\xf7\x52\x7a\xde\x47\xfd\xcf\x08\xf8\
+\x19\xb0\x61\x9b\x0b\x21\x45\x99\x09\x7c\x9e\x7a\x3e\x44\xb7\x02\
+\xaf\x68\xb3\x79\xf5\xcd\x00\x60\x00\xe8\xaa\x7d\x80\xdb\x18\x7d\
+\xfb\x2e\x05\xfe\x15\x58\xab\xdd\xf6\xa5\x78\x2f\x65\xf8\x9f\x09\
+\x3e\x08\xfc\x0f\xaa\x9b\xcd\x28\x4d\x06\x00\x03\x40\x97\xcd\x06\
+\x8e\x07\x1e\x62\xb8\x6d\xfb\x33\x60\x8f\xd6\xbb\x96\x12\xb3\x07\
+\xf0\x1f\xc0\x5d\xf4\x4e\xcb\x17\x03\x1f\xc1\xab\x64\x73\xb0\x01\
+\xf1\x03\x34\xf7\x52\xfa\xe6\x02\x7f\x4d\xf5\xdd\xd4\xeb\xa8\xe6\
+\x9d\x54\x4f\xf3\x7b\x71\x48\xa7\x7a\x1a\x1f\x56\x92\x96\x31\x60\
+\x17\x60\x07\x60\x2b\x60\x8d\xe5\xff\xfb\x83\xc0\xb5\xc0\xd5\xc0\
+\x1f\x62\x5a\xd3\x10\x36\xc0\xed\x35\x2a\xbf\xa3\xf2\x32\x17\xd8\
+\x0d\xd8\x89\xa7\x8e\x4e\x2e\xa1\x3a\x5d\x70\x03\xd5\xc3\x85\x0c\
+\x76\x89\xf0\xc3\x25\x35\x67\x2e\x70\x6f\x74\x13\x99\xf3\x3b\x4a\
+\x6a\x88\x4f\x03\x94\x24\xa9\x40\x06\x00\x49\x92\x0a\x64\x00\x90\
+\x9a\xe3\xe1\x6b\x49\xc9\x32\x00\x48\x92\x54\x20\x03\x80\x24\x49\
+\x05\x32\x00\x48\xcd\xf1\x14\x80\xa4\x64\x19\x00\x24\x49\x2a\x90\
+\x01\x40\x92\xa4\x02\x19\x00\xa4\xe6\x78\x0a\x40\x52\xb2\x0c\x00\
+\x92\x24\x15\xc8\x00\x20\x49\x52\x81\x0c\x00\x52\x73\x3c\x05\x20\
+\x29\x59\x06\x00\x49\x92\x0a\x64\x00\x90\x24\xa9\x40\x06\x00\xa9\
+\x39\x9e\x02\x90\x94\x2c\x03\x80\x24\x49\x05\x32\x00\x48\x92\x54\
+\x20\x03\x80\x24\x49\x05\x32\x00\x48\xcd\xf1\x1a\x00\x49\xc9\x32\
+\x00\x48\x92\x54\x20\x03\x80\x24\x49\x05\x32\x00\x48\xcd\xf1\x14\
+\x80\xa4\x64\x19\x00\x24\x49\x2a\x90\x01\x40\x92\xa4\x02\x19\x00\
+\xa4\xe6\x78\x0a\x40\x52\xb2\x0c\x00\x92\x24\x15\xc8\x00\x20\x49\
+\x52\x81\x0c\x00\x52\x73\x3c\x05\x20\x29\x59\x06\x00\x49\x92\x0a\
+\x64\x00\x90\x24\xa9\x40\x06\x00\xa9\x39\x9e\x02\x90\x94\x2c\x03\
+\x80\x24\x49\x05\x32\x00\x48\x92\x54\x20\x03\x80\xd4\x1c\x4f\x01\
+\x48\x4a\x96\x01\x40\x92\xa4\x02\x19\x00\x24\x49\x2a\x90\x01\x40\
+\x6a\x8e\xa7\x00\x24\x25\xcb\x00\x20\x49\x52\x81\x0c\x00\x92\x24\
+\x15\xc8\x00\x20\x35\xc7\x53\x00\x92\x92\x65\x00\x90\x24\xa9\x40\
+\x06\x00\x49\x92\x0a\x64\x00\x90\x9a\xe3\x29\x00\x49\xc9\x32\x00\
+\x48\x92\x54\x20\x03\x80\x24\x49\x05\x32\x00\x48\xcd\xf1\x14\x80\
+\xa4\x64\x19\x00\x24\x49\x2a\xd0\xf4\xe8\x06\x24\x69\x0a\xdb\x4e\
+\xf1\xef\x1e\x03\x1e\x1d\xf2\x75\x27\x80\x07\x86\xfc\x6f\xa5\x4e\
+\xf0\x10\xa5\xba\x66\x3b\x60\x3e\xb0\x27\xb0\x2b\xb0\xe1\xf2\x72\
+\x5f\xd7\x20\x96\x01\x8b\x96\xd7\xd5\xc0\x85\xc0\xd9\xc0\x6f\x23\
+\x9b\x92\x24\x3d\xd3\xa1\xc0\x79\x54\x7f\xd9\x2d\xb3\xac\x06\x6a\
+\x02\x58\x00\xbc\x1a\x49\x52\xb8\x67\x53\x0d\xfe\xe8\xe1\x60\x95\
+\x55\x0b\x80\x9d\x90\x24\x85\x38\x12\x78\x98\xf8\x61\x60\x95\x59\
+\x8f\x02\x6f\x43\xca\xd4\x78\x74\x03\xd2\x90\xfe\x0e\x38\x01\x98\
+\x11\xdd\x88\x8a\x35\x1d\x78\x0d\xf0\x24\xd5\x35\x02\x52\x56\x0c\
+\x00\xca\xd1\x7b\x80\xff\x15\xdd\x84\xb4\xdc\xbe\xc0\x43\xc0\xc2\
+\xe8\x46\xa4\x41\x78\x65\xb4\x72\xb3\x1f\xd5\xf9\x57\xf7\x5d\xa5\
+\x64\x02\x38\x00\x38\x3f\xba\x11\xa9\x5f\x7e\x89\x2a\x27\xb3\x81\
+\xab\x80\x2d\xa3\x1b\x91\x26\x71\x3b\xb0\x1b\x70\x5f\x74\x23\x52\
+\x3f\x3c\x05\xa0\x9c\xfc\x23\x70\x48\x74\x13\xd2\x6a\xac\x47\x75\
+\x71\xe0\x8f\xa2\x1b\x91\xfa\xe1\x11\x00\xe5\x62\x2e\x70\x0b\x30\
+\x2b\xba\x11\x69\x0a\x8f\x00\xdb\x50\xdd\x40\x48\x4a\x9a\xcf\x02\
+\x50\x2e\x8e\xc6\xe1\xaf\xf4\xad\x03\xfc\x45\x74\x13\x52\x3f\x0c\
+\x00\xca\xc5\xeb\xa3\x1b\x90\xfa\xf4\xda\xe8\x06\xa4\x7e\x78\x0a\
+\x40\x39\x98\x07\xdc\x85\xfb\xab\xf2\x30\x01\x6c\x04\xdc\x1b\xdd\
+\x88\x34\x15\x8f\x00\x28\x07\xbb\xe2\xf0\x57\x3e\xa6\x01\xbb\x44\
+\x37\x21\xf5\x62\x00\x50\x0e\xbc\xe7\xba\x72\xf3\xec\xe8\x06\xa4\
+\x5e\x0c\x00\xca\xc1\xfa\xd1\x0d\x48\x03\x9a\x13\xdd\x80\xd4\x8b\
+\x01\x40\x39\x98\x1e\xdd\x80\x34\x20\xf7\x59\x25\xcf\x00\xa0\x1c\
+\x2c\x8e\x6e\x40\x1a\xd0\xa3\xd1\x0d\x48\xbd\x18\x00\x94\x83\x5b\
+\xa2\x1b\x90\x06\xe4\x3e\xab\xe4\x19\x00\x94\x83\xeb\xa3\x1b\x90\
+\x06\x74\x43\x74\x03\x52\x2f\xfe\xb4\x4a\x39\x98\x06\xdc\x49\x75\
+\x3f\x00\x29\x75\x77\x01\x9b\x52\x3d\x17\x40\x4a\x96\x47\x00\x94\
+\x83\x09\xe0\xec\xe8\x26\xa4\x3e\x9d\x85\xc3\x5f\x19\x30\x00\x28\
+\x17\xff\x1e\xdd\x80\xd4\x27\xf7\x55\x65\xc1\x00\xa0\x5c\xfc\x0c\
+\xb8\x24\xba\x09\xa9\x87\x8b\x71\x3f\x55\x26\x0c\x00\xca\xc9\x07\
+\xa8\x4e\x07\x48\x29\x9a\x00\x3e\x1a\xdd\x84\xd4\xaf\xf1\xe8\x06\
+\xa4\x01\xfc\x9e\xea\x21\x2b\x2f\x8c\x6e\x44\x9a\xc4\xe7\x81\x2f\
+\x45\x37\x21\xf5\xcb\x5f\x01\x28\x37\x33\x81\xf3\x80\x97\x46\x37\
+\x22\xad\xe4\x52\xe0\x15\x78\xd3\x2a\x65\xc4\x00\xa0\x1c\x6d\x48\
+\x75\xae\x75\xfb\xe8\x46\x24\xe0\x26\xaa\x40\xba\x28\xba\x11\x69\
+\x10\x5e\x03\xa0\x1c\x2d\x02\x5e\x0e\x5c\x13\xdd\x88\x8a\x77\x3d\
+\xb0\x0f\x0e\x7f\x65\xc8\x00\xa0\x5c\xdd\x05\xec\x0b\x5c\x15\xdd\
+\x88\x8a\x75\x2d\xd5\x3e\x78\x7b\x74\x23\xd2\x30\x0c\x00\xca\xd9\
+\x3d\x54\xe7\x5d\x7f\x1e\xdc\x87\xca\x73\x39\xb0\x17\x70\x47\x74\
+\x23\xd2\xb0\x0c\x00\xca\xdd\x7d\xc0\x41\x54\xd7\x04\x48\x6d\xb8\
+\x0c\xd8\x1f\xb8\x37\xba\x11\x69\x14\x06\x00\x75\xc1\x03\xc0\x81\
+\x54\xbf\x0e\x90\x9a\x74\x21\xd5\x61\xff\x3f\x46\x37\x22\x49\x7a\
+\xca\x9a\xc0\x99\x54\xf7\x61\xb7\xac\xba\xeb\x7c\x60\x5d\x24\x49\
+\x49\x9a\x01\x9c\x4e\xfc\xb0\xb0\xba\x55\xdf\x07\xd6\x42\x92\x94\
+\xb4\x71\xe0\x54\xe2\x87\x86\xd5\x8d\x3a\x0d\x58\x03\x49\x52\x16\
+\xc6\x81\x93\x89\x1f\x1e\x56\xde\xf5\x35\x60\x3a\x52\x07\xf9\x2c\
+\x00\x75\xd5\x32\xe0\xbb\xc0\x06\xc0\x8b\x83\x7b\x51\x9e\xbe\x0c\
+\xbc\x1d\x58\x1a\xdd\x88\xd4\x04\x03\x80\xba\xee\x6c\x60\x3d\x60\
+\x8f\xe8\x46\x94\x95\x13\x81\x63\xa8\x82\xa4\xd4\x49\x06\x00\x95\
+\xe0\x1c\xaa\xe7\x5e\xbc\x22\xb8\x0f\xe5\xe1\x53\xc0\x87\xa2\x9b\
+\x90\x24\xd5\xe7\x58\xe2\xcf\x29\x5b\x69\xd7\xf1\x48\x92\x3a\xe9\
+\xdd\xc0\x04\xf1\x83\xc6\x4a\xab\x26\x80\x0f\x23\x49\xea\xb4\xbf\
+\xa4\xba\xb0\x2b\x7a\xe8\x58\x69\xd4\x04\xf0\x7e\x24\x49\x45\x78\
+\x0b\xb0\x84\xf8\xe1\x63\xc5\xd6\x93\xc0\xd1\x48\x92\x8a\x72\x04\
+\xf0\x04\xf1\x43\xc8\x8a\x1b\xfe\x47\x21\x49\x2a\xd2\xab\x80\x47\
+\x89\x1f\x46\x56\xbb\xf5\x38\xf0\x3a\x24\x49\x45\x9b\x0f\x2c\x26\
+\x7e\x28\x59\xed\xd4\x63\xc0\x61\x48\x92\x04\xec\x05\x3c\x48\xfc\
+\x70\xb2\x9a\xad\x47\x80\x03\x90\x24\x69\x25\x2f\x03\xee\x27\x7e\
+\x48\x59\xcd\xd4\x43\xc0\x3e\x48\x92\x34\x89\xdd\x81\x7b\x89\x1f\
+\x56\x56\xbd\x75\x1f\xf0\x12\x24\x49\x9a\xc2\xce\xc0\x1d\xc4\x0f\
+\x2d\xab\x9e\xba\x1b\x78\x2e\x92\x24\xf5\x61\x27\xe0\x76\xe2\x87\
+\x97\x35\x5a\xdd\x09\xec\x82\x24\x49\x03\xd8\x1a\xb8\x99\xf8\x21\
+\x66\x0d\x57\xb7\x01\xcf\x5a\x75\xa3\x4a\x92\xd4\x8f\x2d\x81\x1b\
+\x89\x1f\x66\xd6\x60\x75\x0b\xb0\xed\x24\xdb\x53\x92\xa4\xbe\x6d\
+\x0c\x5c\x4d\xfc\x50\xb3\xfa\xab\xeb\x80\xcd\x27\xdd\x92\x92\x24\
+\x0d\x68\x1e\x70\x05\xf1\xc3\xcd\x9a\xba\xae\x01\x36\x59\xcd\x36\
+\x94\x24\x69\x28\x73\x80\x4b\x88\x1f\x72\xd6\xe4\xf5\x4b\xe0\xcf\
+\x56\xbb\x3e\x0f\xc6\xb9\x00\x00\x03\x27\x49\x44\x41\x54\xf5\x24\
+\x49\x1a\xc1\x6c\xe0\x22\xe2\x87\x9d\xf5\xf4\xfa\x05\xb0\xc1\x14\
+\xdb\x4d\x92\xa4\x91\xad\x0d\x2c\x20\x7e\xe8\x59\x55\x5d\x00\xcc\
+\x9a\x72\x8b\x49\x92\x54\x93\x35\x81\x33\x89\x1f\x7e\xa5\xd7\x59\
+\xc0\xcc\x1e\xdb\x4a\x92\xa4\x5a\xcd\x00\x4e\x27\x7e\x08\x96\x5a\
+\xdf\x03\xd6\xea\xb9\x95\x24\x49\x6a\xc0\x38\x70\x2a\xf1\xc3\xb0\
+\xb4\x3a\x0d\x58\xa3\x8f\xed\x23\x49\x52\x63\xc6\x81\x93\x88\x1f\
+\x8a\xa5\xd4\xd7\x80\xe9\x7d\x6d\x19\x49\x92\x1a\x36\x06\x7c\x8e\
+\xf8\xe1\xd8\xf5\xfa\x12\x30\xad\xcf\x6d\x22\x49\x52\x2b\xc6\x80\
+\x4f\x13\x3f\x24\xbb\x5a\x27\x2c\x5f\xc7\x92\x24\x25\xe9\x58\xe2\
+\x87\x65\xd7\xea\xf8\x81\xb6\x80\x24\x49\x41\x0c\x01\xf5\xd5\xdf\
+\x0f\xb8\xee\x25\x49\x0a\x75\x0c\x30\x41\xfc\x00\xcd\xb5\x26\x80\
+\x0f\x0d\xbc\xd6\x25\x49\x4a\xc0\x3b\x81\xa5\xc4\x0f\xd3\xdc\x6a\
+\x02\x78\xdf\x10\xeb\x5b\x92\xa4\x64\xbc\x19\x58\x42\xfc\x50\xcd\
+\xa5\x9e\x04\x8e\x1e\x6a\x4d\x4b\x92\x94\x98\x37\x02\x4f\x10\x3f\
+\x5c\x53\xaf\x27\x81\xb7\x0e\xb9\x8e\x25\x49\x4a\xd2\x2b\x81\x47\
+\x89\x1f\xb2\xa9\xd6\xe3\xc0\xe1\x43\xaf\x5d\x49\x92\x12\x36\x1f\
+\x58\x4c\xfc\xb0\x4d\xad\x1e\x03\x0e\x1d\x61\xbd\x4a\x92\x94\xbc\
+\xbd\x80\x07\x89\x1f\xba\xa9\xd4\xc3\xc0\xfe\x23\xad\x51\x49\x92\
+\x32\xf1\x42\xe0\x0f\xc4\x0f\xdf\xe8\xba\x1f\x78\xe9\x88\xeb\x52\
+\x92\xa4\xac\xec\x0e\x2c\x22\x7e\x08\x47\xd5\x1f\x81\x17\x8f\xbc\
+\x16\x25\x49\xca\xd0\xce\xc0\x1d\xc4\x0f\xe3\xb6\xeb\x6e\xe0\xb9\
+\x35\xac\x3f\x49\x92\xb2\xb5\x23\xf0\x3b\xe2\x87\x72\x5b\x75\x27\
+\xb0\x4b\x2d\x6b\x4e\x92\xa4\xcc\x6d\x0d\xdc\x4c\xfc\x70\x6e\xba\
+\x6e\x03\xb6\xaf\x67\x95\x49\x92\xd4\x0d\x5b\x02\x37\x10\x3f\xa4\
+\x9b\xaa\xdf\x02\xdb\xd4\xb6\xb6\x24\x49\xea\x90\x8d\x80\xab\x88\
+\x1f\xd6\x75\xd7\xb5\xc0\x66\x35\xae\x27\x49\x92\x3a\x67\x43\xe0\
+\x72\xe2\x87\x76\x5d\x75\x0d\xb0\x49\xad\x6b\x48\x92\xa4\x8e\x9a\
+\x03\x2c\x24\x7e\x78\x8f\x5a\x97\x01\x73\x6b\x5e\x37\x92\x24\x75\
+\xda\xba\xc0\xf9\xc4\x0f\xf1\x61\xeb\x22\x60\xbd\xda\xd7\x8a\x24\
+\x49\x05\x58\x1b\x38\x97\xf8\x61\x3e\x68\xfd\x04\x98\x55\xff\xea\
+\x90\x24\xa9\x1c\x6b\x02\x67\x10\x3f\xd4\xfb\xad\x1f\x02\x33\x1b\
+\x59\x13\x92\x24\x15\x66\x06\xf0\x2d\xe2\x87\x7b\xaf\xfa\x1e\xb0\
+\x56\x43\xeb\x40\x92\xa4\x22\x8d\x03\xa7\x10\x3f\xe4\x57\x57\xdf\
+\x00\xd6\x68\x6c\xe9\x25\x49\x2a\xd8\x38\x70\x12\xf1\xc3\x7e\xd5\
+\xfa\x2a\x30\xbd\xc1\xe5\x96\x24\xa9\x78\x63\xc0\x67\x89\x1f\xfa\
+\x2b\xea\x8b\xc0\xb4\x46\x97\x58\x92\x24\xfd\xc9\xc7\x89\x1f\xfe\
+\xff\x44\x15\x48\x24\x49\x52\x8b\x8e\x25\x6e\xf8\x1f\xdf\xc2\xf2\
+\x49\x92\xa4\xd5\xf8\x28\xed\x0f\xff\xbf\x6b\x65\xc9\x24\x49\xd2\
+\x94\xfe\x0a\x98\xa0\xf9\xc1\x3f\x01\x7c\xb0\xa5\x65\x92\x24\x49\
+\x7d\x78\x07\xb0\x94\x66\x87\xff\x7b\x5b\x5b\x1a\x49\x92\xd4\xb7\
+\xa3\x80\x25\xd4\x3f\xfc\x97\x2c\x7f\x6d\x49\x92\x94\xa8\xf9\xc0\
+\xfd\xd4\x37\xfc\xef\x03\x0e\x6a\x75\x09\x24\x49\xd2\x50\xb6\xa6\
+\x9e\x27\x09\xfe\x08\xd8\xaa\xdd\xd6\x25\x49\xd2\xa8\x5e\x0b\xfc\
+\x92\xc1\x07\xff\x65\xc0\x6b\x02\xfa\x95\x24\x49\x35\x7a\x1e\xf0\
+\xdf\x80\x8b\x80\x47\x78\xe6\xc0\x7f\x18\xb8\x70\xf9\xff\xe7\xb9\
+\x41\x3d\x4a\x6a\x91\x77\xf0\x92\xca\xb4\x2e\xb0\xd9\xf2\x7f\xfe\
+\x3d\x55\x00\x90\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\
+\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\
+\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\
+\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\xba\xe6\xff\
+\x03\x39\x4d\x2e\x50\x6a\x9d\xf2\xa9\x00\x00\x00\x00\x49\x45\x4e\
+\x44\xae\x42\x60\x82\
+\x00\x00\x2a\x5b\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x02\x00\x00\x00\x02\x00\x08\x06\x00\x00\x00\xf4\x78\xd4\xfa\
+\x00\x00\x00\x04\x73\x42\x49\x54\x08\x08\x08\x08\x7c\x08\x64\x88\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
+\x01\x95\x2b\x0e\x1b\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\
+\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\
+\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x20\x00\x49\x44\
+\x41\x54\x78\x9c\xed\xdd\x79\xbc\x5e\x55\x7d\xef\xf1\xcf\x39\x09\
+\x43\x88\x88\x90\x30\x39\x60\x70\x02\xb9\x84\x8b\xa0\x82\x22\x48\
+\x71\x42\x11\x67\x44\xef\x75\xa8\xf6\x8a\x28\x58\x5b\xaf\x96\xf6\
+\x5a\x87\xab\xd6\xd2\x56\x5b\xa9\xa2\xd6\x29\xc7\x99\xe2\x40\x11\
+\x15\xaa\x38\xa0\x80\x16\x50\x31\x80\x80\x57\x66\x94\x29\xcc\xc8\
+\x98\xe4\xdc\x3f\xd6\x39\x72\x4c\xf2\x9c\x67\xda\x7b\xff\xd6\xda\
+\xfb\xf3\x7e\xbd\xd6\x2b\xc9\xc9\x49\xf2\xdb\xfb\x79\xb2\xf7\xef\
+\x59\xfb\xbb\xd7\x9e\x40\x52\xdb\x4d\x02\x4f\x04\x0e\x00\x76\x07\
+\x76\x05\x96\x00\x0f\x9c\xf9\xfd\x5b\x81\x1b\x81\xf3\x81\x73\x81\
+\xef\x01\x67\x03\xd3\x8d\x57\x2a\x49\x92\xc6\xf6\x30\xe0\x83\xc0\
+\x6f\x49\x27\xf3\x61\xc6\x55\xc0\x3f\x01\x0f\x6d\xbc\x6a\x49\x92\
+\x34\x92\x6d\x80\x4f\x03\xf7\x32\xfc\x89\x7f\xdd\x71\x0f\xf0\x49\
+\x60\xeb\x46\xb7\x40\x92\x24\x0d\xe5\x35\xa4\xe9\xfc\x71\x4f\xfc\
+\xeb\x8e\x55\xc0\xab\x1a\xdc\x0e\x49\x92\x34\x80\x85\xc0\x47\xa8\
+\xfe\xc4\xbf\xee\xf8\x04\xb0\x51\x43\xdb\x24\x49\x92\xe6\xb1\x19\
+\xf0\x03\xea\x3f\xf9\xcf\x8e\xef\x02\x8b\x1a\xd9\x32\x49\x92\xb4\
+\x41\x1b\x01\xdf\xa2\xb9\x93\xff\xec\x38\x89\x34\xeb\x20\x49\x92\
+\x02\x7c\x8a\xe6\x4f\xfe\xb3\xe3\xe3\x0d\x6c\x9f\x24\x49\x5a\xc7\
+\xf3\x89\x3b\xf9\xcf\x8e\x97\xd4\xbe\x95\x92\x24\xe9\x0f\xb6\x01\
+\xae\x27\xbe\x01\xb8\x7e\xa6\x16\x49\x92\xd4\x80\x29\xe2\x4f\xfe\
+\xb3\x63\x45\xbd\x9b\x2a\x49\x92\x00\x9e\x0c\xac\x25\xfe\xc4\x3f\
+\x3b\xd6\x02\xfb\xd5\xba\xc5\x92\x24\x75\xdc\x02\xe0\x17\xc4\x9f\
+\xf4\xd7\x1d\x2b\xf1\xae\x00\x49\x92\x6a\xf3\x26\xe2\x4f\xf6\xbd\
+\xc6\x91\x35\x6e\xb7\x24\x49\x9d\xb5\x0d\x70\x33\xf1\x27\xfa\x5e\
+\xe3\x56\x60\xfb\xda\xb6\x5e\x92\xa4\x8e\x9a\x22\xfe\x24\xdf\x6f\
+\xac\xa8\x6b\xe3\x25\x49\xea\xa2\xdc\x82\x7f\xbd\x86\x81\x40\x49\
+\x92\x2a\x92\x6b\xf0\xaf\xd7\x30\x10\x28\x49\x52\x05\x72\x0e\xfe\
+\xf5\x1a\x06\x02\x25\x49\x1a\x43\xee\xc1\xbf\x5e\xc3\x40\xa0\x24\
+\x49\x63\x98\x22\xfe\x64\x3e\xea\x58\x51\xfd\xee\x90\x24\xa9\xfd\
+\x4a\x09\xfe\xf5\x1a\x06\x02\x25\x49\x1a\x52\x69\xc1\xbf\x5e\xc3\
+\x40\xa0\x24\x49\x43\x28\x31\xf8\xd7\x6b\x18\x08\x94\x24\x69\x00\
+\xa5\x06\xff\x7a\x0d\x03\x81\x92\x24\x0d\x60\x8a\xf8\x93\x76\xd5\
+\x63\x45\x95\x3b\x48\x92\xa4\xb6\x29\x3d\xf8\xd7\x6b\x18\x08\x94\
+\x24\xa9\x87\xb6\x04\xff\x7a\x0d\x03\x81\x92\x24\x6d\x40\x9b\x82\
+\x7f\xbd\x86\x81\x40\x49\x92\xe6\x68\x5b\xf0\xaf\xd7\x30\x10\x28\
+\x49\xd2\x1c\x53\xc4\x9f\x9c\x9b\x1a\x2b\xaa\xd9\x65\x92\x24\x95\
+\xad\xad\xc1\xbf\x5e\xc3\x40\xa0\x24\xa9\xf3\xda\x1e\xfc\xeb\x35\
+\x0c\x04\x4a\x92\x3a\xad\x0b\xc1\xbf\x5e\xc3\x40\xa0\x24\xa9\x93\
+\xba\x12\xfc\xeb\x35\x0c\x04\x4a\x92\x3a\x69\x8a\xf8\x93\x70\xf4\
+\x58\x31\xee\x4e\x94\x24\xa9\x24\x5d\x0b\xfe\xf5\x1a\x06\x02\x25\
+\x49\x9d\xd1\xd5\xe0\x5f\xaf\x61\x20\x50\x92\xd4\x09\x5d\x0e\xfe\
+\xf5\x1a\x06\x02\x25\x49\xad\xd6\xf5\xe0\x5f\xaf\x61\x20\x50\x92\
+\xd4\x6a\x53\xc4\x9f\x6c\x73\x1d\x2b\x46\xdf\xad\x92\x24\xe5\xcb\
+\xe0\xdf\xfc\xc3\x40\xa0\x24\xa9\x75\x0c\xfe\x0d\x36\x0c\x04\x4a\
+\x92\x5a\xc5\xe0\xdf\xe0\xc3\x40\xa0\x24\xa9\x15\x0c\xfe\x0d\x37\
+\x0c\x04\x4a\x0d\x58\x10\x5d\x80\xd4\x01\xc7\x02\x7b\x47\x17\x51\
+\x90\x4d\x80\x25\xc0\x89\xd1\x85\x48\x92\x34\x2a\x83\x7f\xa3\x0d\
+\x03\x81\x92\xa4\x62\x19\xfc\x1b\x6f\x18\x08\x94\x24\x15\xc9\xe0\
+\xdf\xf8\xc3\x40\xa0\x54\x93\x89\xe8\x02\xa4\x96\xda\x06\xb8\x18\
+\x78\x50\x74\x21\x85\xbb\x0d\xd8\x19\xb8\x26\xba\x10\xa9\x6d\x0c\
+\x01\x4a\xf5\x30\xf8\x57\x0d\x03\x81\x92\xa4\x62\x18\xfc\xab\x76\
+\x18\x08\x94\x24\x65\xcf\xe0\x5f\x3d\xc3\x40\xa0\x24\x29\x6b\x06\
+\xff\xea\x1b\x06\x02\xa5\x0a\x19\x02\x94\xaa\x63\xf0\xaf\x5e\x06\
+\x02\xa5\x0a\x19\x02\x94\xaa\x63\xf0\xaf\x5e\x06\x02\x25\x49\xd9\
+\x31\xf8\xd7\xcc\x30\x10\x28\x49\xca\x86\xc1\xbf\x66\x87\x81\x40\
+\xa9\x02\x5e\x02\x90\xc6\x77\x24\xf0\x9a\xe8\x22\x46\x30\x3d\xf3\
+\x63\x69\x59\xa0\x6d\x81\x55\xc0\x59\xd1\x85\x48\x25\x2b\xed\x3f\
+\xbe\x94\x9b\x92\x83\x7f\x2b\x66\x7e\x2c\xb1\x79\x31\x10\x28\x49\
+\x0a\x35\x45\xfc\x94\xf8\x28\xe3\x56\x60\x7b\x52\x03\x73\x53\x06\
+\xf5\x8c\x32\x66\x1b\x18\x49\x92\x1a\x55\x72\xf0\xef\x88\x39\xdb\
+\x71\x64\x06\xf5\x8c\x32\x0c\x04\x4a\x92\x1a\x57\x72\xf0\x6f\xdd\
+\x10\xdd\x02\xe0\xe7\x19\xd4\x55\xc5\xb6\x48\x92\x54\xab\x52\x57\
+\xfc\xeb\xf5\xa9\xb9\xe4\xd9\x0c\x57\x08\x94\x24\x35\x62\x1b\xe0\
+\x66\xe2\x4f\x7c\xa3\x8c\xcf\xcc\xb3\x5d\x9f\xc9\xa0\xbe\x51\xc6\
+\x6c\x9e\x41\x92\xa4\x5a\x4d\x11\x7f\xd2\xab\xe3\x44\x69\x20\x50\
+\x92\xa4\x1e\x4a\x9e\x2a\x9f\x1b\xfc\xeb\xc5\x40\xa0\x24\x49\xeb\
+\x68\x53\xf0\x6f\xbe\x6d\x34\x10\x28\x49\xd2\x1c\x6d\x0b\xfe\xf5\
+\x52\xf2\x2c\x87\x81\x40\x49\x52\xa5\xda\x1a\xfc\xeb\xc5\x40\xa0\
+\x24\x49\xb4\x37\xf8\xd7\x8b\x81\x40\x49\x52\xe7\x95\x3c\x25\x3e\
+\x48\xf0\xaf\x17\x03\x81\x92\xa4\xce\xea\x42\xf0\x6f\xbe\x6d\x37\
+\x10\x28\x49\xea\xa4\xae\x04\xff\x7a\x29\x79\xf6\xc3\x40\xa0\x24\
+\x69\x24\x5d\x0b\xfe\xf5\x62\x20\x50\x92\xd4\x29\x53\xc4\x9f\xc4\
+\x72\x38\xf1\x19\x08\x94\x24\x75\x46\xc9\x53\xdf\xe3\x04\xff\x7a\
+\x31\x10\x28\x49\x6a\xbd\x2e\x07\xff\x7a\x31\x10\x28\x49\x6a\xbd\
+\xae\x07\xff\x7a\x29\x79\x56\xc4\x40\xa0\x24\x69\x5e\x06\xff\xe6\
+\x67\x20\x50\x92\xd4\x4a\x53\xc4\x9f\xac\x72\x3e\xc1\x19\x08\x94\
+\x24\xb5\x4e\xc9\x53\xdc\x75\x04\xff\x7a\x31\x10\x28\x49\x6a\x0d\
+\x83\x7f\x83\x33\x10\x28\x49\x6a\x0d\x83\x7f\xc3\x29\x79\xb6\xc4\
+\x40\xa0\x24\x09\x30\xf8\x37\x2a\x03\x81\x92\xa4\xa2\x4d\x11\x7f\
+\x52\x2a\xf1\x44\x66\x20\x50\x92\x54\xac\x92\xa7\xb2\x9b\x0c\xfe\
+\xf5\x62\x20\x50\x92\x54\x1c\x83\x7f\xe3\x33\x10\x28\x49\x2a\x8e\
+\xc1\xbf\x6a\x94\x3c\x8b\x62\x20\x50\x92\x3a\xc6\xe0\x5f\xb5\x0c\
+\x04\x4a\x92\x8a\x30\x45\xfc\xc9\xa7\x4d\x27\x2c\x03\x81\x92\xa4\
+\xec\x95\x3c\x65\x9d\x43\xf0\xaf\x17\x03\x81\x92\xa4\x6c\x19\xfc\
+\xab\x8f\x81\x40\x49\x52\xb6\x0c\xfe\xd5\xab\xe4\xd9\x15\x03\x81\
+\x92\xd4\x52\x06\xff\x9a\x61\x20\x50\x92\x94\x95\x29\xe2\x4f\x32\
+\x5d\x38\x31\x19\x08\x94\x24\x65\xa3\xe4\xa9\xe9\x9c\x83\x7f\xbd\
+\x18\x08\x94\x24\x85\x33\xf8\xd7\x3c\x03\x81\x92\xa4\x70\x06\xff\
+\x62\x94\x3c\xeb\x62\x20\x50\x92\x0a\x67\xf0\x2f\x96\x81\x40\x49\
+\x52\x88\x29\xe2\x4f\x26\x5d\x3e\x01\x19\x08\x94\x24\x35\xae\xe4\
+\x29\xe8\x12\x83\x7f\xbd\x18\x08\x94\x24\x35\xc6\xe0\x5f\x3e\x0c\
+\x04\x4a\x92\x1a\x63\xf0\x2f\x2f\x25\xcf\xc6\x18\x08\x94\xa4\x42\
+\x18\xfc\xcb\x93\x81\x40\x49\x52\xad\xa6\x88\x3f\x69\x78\xa2\x59\
+\x9f\x81\x40\x49\x52\x6d\x4a\x9e\x6a\x6e\x53\xf0\xaf\x17\x03\x81\
+\x92\xa4\xca\x19\xfc\xcb\x9f\x81\x40\x49\x52\xe5\x0c\xfe\x95\xa1\
+\xe4\x59\x1a\x03\x81\x92\x94\x19\x83\x7f\x65\x31\x10\x28\x49\xaa\
+\xc4\x14\xf1\x27\x07\x4f\x28\x83\x33\x10\x28\x49\x1a\x5b\xc9\x53\
+\xca\x5d\x08\xfe\xf5\x62\x20\x50\x92\x34\x32\x83\x7f\xe5\x32\x10\
+\x28\x49\x1a\x99\xc1\xbf\xb2\x95\x3c\x7b\x63\x20\x50\x92\x82\x18\
+\xfc\x6b\x07\x03\x81\x92\xa4\xa1\x4c\x11\x7f\x12\xf0\xc4\x31\x3e\
+\x03\x81\x92\xa4\x81\x95\x3c\x75\xdc\xe5\xe0\x5f\x2f\x06\x02\x25\
+\x49\x7d\x19\xfc\x6b\x1f\x03\x81\x92\xa4\xbe\x0c\xfe\xb5\x53\xc9\
+\xb3\x3a\x06\x02\x25\xa9\x66\x06\xff\xda\xcd\x40\xa0\x24\x69\x83\
+\xa6\x88\x3f\xd8\x7b\x82\xa8\x8f\x81\x40\x49\xd2\x7a\x4a\x9e\x22\
+\x36\xf8\x37\x38\x03\x81\x92\xa4\x3f\x30\xf8\xd7\x1d\x06\x02\x25\
+\x49\x7f\x60\xf0\xaf\x5b\x4a\x9e\xed\x31\x10\x28\x49\x15\x31\xf8\
+\xd7\x4d\x06\x02\x25\xa9\xe3\xa6\x88\x3f\xa8\x7b\x22\x68\x9e\x81\
+\x40\x49\xea\xb0\x92\xa7\x82\x0d\xfe\x8d\xcf\x40\xa0\x24\x75\x90\
+\xc1\x3f\x19\x08\x94\xa4\x0e\x32\xf8\x27\x28\x7b\x16\xc8\x40\xa0\
+\x24\x0d\xc9\xe0\x9f\xe6\x32\x10\x28\x49\x1d\x31\x45\xfc\xc1\xdb\
+\x03\x7e\x3e\x0c\x04\x4a\x52\x07\x94\x3c\xe5\x6b\xf0\xaf\x3e\x06\
+\x02\x25\xa9\xc5\x0c\xfe\xa9\x17\x03\x81\x92\xd4\x62\x06\xff\x34\
+\x9f\x92\x67\x87\x0c\x04\x4a\x52\x0f\x06\xff\x34\x08\x03\x81\x92\
+\xd4\x32\x53\xc4\x1f\xa4\x3d\xb0\xe7\xcf\x40\xa0\x24\xb5\x48\xc9\
+\x53\xbb\x06\xff\x9a\x67\x20\x50\x92\x5a\xc0\xe0\x9f\x86\x65\x20\
+\x50\x92\x5a\xc0\xe0\x9f\x46\x51\xf2\xac\x91\x81\x40\x49\x9d\x67\
+\xf0\x4f\xe3\x30\x10\x28\x49\x85\x9a\x22\xfe\x60\xec\x01\xbc\x5c\
+\x06\x02\x25\xa9\x40\x25\x4f\xe1\x1a\xfc\xcb\x87\x81\x40\x49\x2a\
+\x88\xc1\x3f\x55\xc5\x40\xa0\x24\x15\xc4\xe0\x9f\xaa\x54\xf2\x6c\
+\x92\x81\x40\x49\x9d\x61\xf0\x4f\x75\x30\x10\x28\x49\x99\x9b\x22\
+\xfe\xa0\xeb\x81\xba\x7d\x0c\x04\x4a\x52\xc6\x4a\x9e\xaa\x35\xf8\
+\x97\x3f\x03\x81\x92\x94\x21\x83\x7f\xaa\x9b\x81\x40\x49\xca\x90\
+\xc1\x3f\x35\xa1\xe4\x59\x26\x03\x81\x92\x5a\xc7\xe0\x9f\x9a\x64\
+\x20\x50\x92\x32\x31\x45\xfc\xc1\xd5\x03\x72\x77\x18\x08\x94\xa4\
+\x0c\x94\x3c\x25\x6b\xf0\xaf\x5c\x06\x02\x25\x29\x90\xc1\x3f\x45\
+\x31\x10\x28\x49\x81\x0c\xfe\x29\x52\xc9\xb3\x4f\x06\x02\x25\x15\
+\xcb\xe0\x9f\x72\x60\x20\x50\x92\x1a\x36\x45\xfc\x41\xd4\x03\xaf\
+\x0c\x04\x4a\x52\x83\x4a\x9e\x7a\x35\xf8\xd7\x3e\x06\x02\x25\xa9\
+\x01\x06\xff\x94\x1b\x03\x81\x92\xd4\x00\x83\x7f\xca\x51\xc9\xb3\
+\x52\x06\x02\x25\x65\xcf\xe0\x9f\x72\x66\x20\x50\x92\x6a\x32\x45\
+\xfc\xc1\xd2\x03\xac\x7a\x31\x10\x28\x49\x35\x28\x79\x8a\xd5\xe0\
+\x5f\x77\x18\x08\x94\xa4\x0a\x19\xfc\x53\x29\x0c\x04\x4a\x52\x85\
+\x0c\xfe\xa9\x24\x25\xcf\x56\x19\x08\x94\x94\x0d\x83\x7f\x2a\x91\
+\x81\x40\x49\x1a\xd3\x14\xf1\x07\x45\x0f\xa4\x1a\x96\x81\x40\x49\
+\x1a\x43\xc9\x53\xa9\x06\xff\x64\x20\x50\x92\x46\x60\xf0\x4f\xa5\
+\x33\x10\x28\x49\x23\x30\xf8\xa7\x36\x28\x79\x16\xcb\x40\xa0\xa4\
+\xc6\x19\xfc\x53\x9b\x18\x08\x94\xa4\x01\x4d\x11\x7f\xf0\xf3\x80\
+\xa9\xaa\x18\x08\x94\xa4\x01\x94\x3c\x65\x6a\xf0\x4f\xbd\x18\x08\
+\x94\xa4\x79\x18\xfc\x53\x5b\x19\x08\x94\xa4\x79\x18\xfc\x53\x9b\
+\x95\x3c\xbb\x65\x20\x50\x52\x6d\x0c\xfe\xa9\x0b\x0c\x04\x4a\xd2\
+\x3a\xa6\x88\x3f\xc8\x79\x60\x54\xdd\x0c\x04\x4a\xd2\x1c\x25\x4f\
+\x8d\x1a\xfc\xd3\xb0\x0c\x04\x4a\x12\x06\xff\xd4\x3d\x06\x02\x25\
+\x09\x83\x7f\xea\xa6\x92\x67\xbd\x0c\x04\x4a\x1a\x9b\xc1\x3f\x75\
+\x99\x81\x40\x49\x9d\x35\x45\xfc\xc1\xcc\x03\xa0\xa2\x18\x08\x94\
+\xd4\x49\x25\x4f\x81\x1a\xfc\x53\x55\x0c\x04\x4a\xea\x14\x83\x7f\
+\x52\x62\x20\x50\x52\xa7\x18\xfc\x93\xee\x57\xf2\x6c\x98\x81\x40\
+\x49\x03\x33\xf8\x27\xad\xcf\x40\xa0\xa4\xd6\x9b\x22\xfe\xa0\xe5\
+\x81\x4e\xb9\x31\x10\x28\xa9\xd5\x4a\x9e\xea\x34\xf8\xa7\xba\x19\
+\x08\x94\xd4\x4a\x06\xff\xa4\xf9\x19\x08\x94\xd4\x4a\x06\xff\xa4\
+\xfe\x4a\x9e\x25\x33\x10\x28\x69\x3d\x06\xff\xa4\xc1\x19\x08\x94\
+\xd4\x1a\x53\xc4\x1f\x9c\x3c\xa0\xa9\x14\x06\x02\x25\xb5\x42\xc9\
+\x53\x9a\x06\xff\x14\xc5\x40\xa0\xa4\xa2\x19\xfc\x93\x46\x63\x20\
+\x50\x52\xd1\x0c\xfe\x49\xa3\x2b\x79\xf6\xcc\x40\xa0\xd4\x61\x06\
+\xff\xa4\xf1\x19\x08\x94\x54\x9c\x29\xe2\x0f\x42\x1e\xb8\x54\x3a\
+\x03\x81\x2a\xd2\x44\x74\x01\x0a\xb3\x0f\xf0\x63\xca\x7c\x0f\x7c\
+\x1d\x38\x2e\xba\x08\x69\x8e\x97\x01\x2f\x8a\x2e\x62\x04\xd3\xc0\
+\xbe\xc0\x19\xd1\x85\xa8\x79\x25\x1e\xfc\x35\xbe\x05\xc0\x39\xc0\
+\xee\xd1\x85\x48\x0a\x77\x1e\xb0\x07\xb0\x3a\xba\x10\x35\x6b\x32\
+\xba\x00\x85\x78\x23\x9e\xfc\x25\x25\xcb\x81\xc3\xa3\x8b\x50\xf3\
+\x9c\x01\xe8\x9e\x6d\x80\x8b\x81\x07\x45\x17\x22\x29\x1b\xb7\x01\
+\x3b\x03\xd7\x44\x17\xa2\xe6\x2c\x88\x2e\x40\x8d\x3b\x16\xd8\x3b\
+\xba\x08\x49\x59\xd9\x04\x58\x02\x9c\x18\x5d\x88\x9a\xe3\x0c\x40\
+\xb7\x3c\x19\x38\x1d\x5f\x77\x49\xeb\x9b\x06\xf6\x07\x7e\x14\x5c\
+\x87\x1a\xe2\x89\xa0\x3b\x0c\xfe\x49\xea\xc7\x40\x60\x87\x18\x02\
+\xec\x0e\x83\x7f\x92\xfa\x31\x10\xd8\x21\xce\x00\x74\x83\xc1\x3f\
+\x49\x83\x32\x10\xd8\x11\x86\x00\xbb\xc1\xe0\x9f\xa4\x41\x19\x08\
+\xec\x08\x67\x00\xda\xef\x89\xc0\x4f\xf1\xb5\x96\x34\xb8\x69\xd2\
+\x87\x86\xb3\xa2\x0b\x51\x7d\xcc\x00\xb4\xdf\xfb\xf0\xe4\x2f\x69\
+\x38\x13\xc0\x7b\xa2\x8b\x50\xbd\x3c\x31\xb4\xdb\x7e\xc0\x69\xd1\
+\x45\x48\x2a\xd6\x53\xf0\x39\x01\xad\xe5\x0c\x40\xbb\xbd\x31\xba\
+\x00\x49\x45\x7b\x43\x74\x01\xaa\x8f\x33\x00\xed\xb5\x18\xb8\x6e\
+\xe6\x47\x49\x1a\xc5\xef\x81\x6d\x67\x7e\x54\xcb\x38\x03\xd0\x5e\
+\xcf\xc1\x93\xbf\xa4\xf1\x2c\x06\x9e\x19\x5d\x84\xea\x61\x03\xd0\
+\x5e\xde\xf6\x27\xa9\x0a\x1e\x4b\x5a\xca\x06\xa0\xbd\xf6\x8c\x2e\
+\x40\x52\x2b\x78\x2c\x69\x29\x1b\x80\xf6\x7a\x54\x74\x01\x92\x5a\
+\xc1\x63\x49\x4b\xd9\x00\xb4\xd7\x96\xd1\x05\x48\x6a\x05\x8f\x25\
+\x2d\xe5\x5d\x00\xed\xb4\x00\x9f\xe6\x25\xa9\x1a\xd3\xc0\x42\x60\
+\x6d\x74\x21\xaa\x96\x33\x00\xed\xb4\x06\xb8\x3b\xba\x08\x49\xad\
+\x70\x17\x9e\xfc\x5b\xc9\x06\xa0\xbd\x6e\x8a\x2e\x40\x52\x2b\xdc\
+\x18\x5d\x80\xea\x61\x03\xd0\x5e\xbf\x8b\x2e\x40\x52\x2b\x78\x2c\
+\x69\x29\x1b\x80\xf6\xfa\x59\x74\x01\x92\x5a\xe1\x9c\xe8\x02\x54\
+\x0f\x1b\x80\xf6\x3a\x3b\xba\x00\x49\xad\xe0\x87\x89\x96\xf2\x2e\
+\x80\xf6\xda\x0e\xb8\x9a\x74\x47\x80\x24\x8d\x62\x2d\xf0\x30\xbc\
+\x0c\xd0\x4a\xce\x00\xb4\xd7\xb5\xc0\xe9\xd1\x45\x48\x2a\xda\x0f\
+\xf0\xe4\xdf\x5a\x36\x00\xed\xf6\x99\xe8\x02\x24\x15\x6d\x45\x74\
+\x01\xaa\x8f\x97\x00\xda\x6d\x01\x70\x21\xf0\xe8\xe8\x42\x24\x15\
+\xe7\x52\x60\x27\x5c\x54\xac\xb5\x9c\x01\x68\xb7\x35\xc0\xfb\xa3\
+\x8b\x90\x54\xa4\xf7\xe0\xc9\xbf\xd5\x9c\x01\x68\xbf\x09\xe0\x3f\
+\x81\x67\x44\x17\x22\xa9\x18\xdf\x07\x9e\x4e\x5a\x06\x58\x2d\x65\
+\x03\xd0\x0d\x8f\x00\x7e\x01\x3c\x30\xba\x10\x49\xd9\xbb\x15\x78\
+\x1c\x70\x59\x74\x21\xaa\x97\x97\x00\xba\xe1\x52\xe0\xa5\x38\x9d\
+\x27\x69\x7e\x6b\x80\x57\xe0\xc9\xbf\x13\xbc\x47\xbc\x3b\x2e\x01\
+\x6e\x00\x0e\xc2\x99\x1f\x49\xeb\x9b\x06\x0e\x07\x8e\x8b\x2e\x44\
+\xcd\xb0\x01\xe8\x96\x73\x48\x8d\xc0\xc1\xf8\xda\x4b\xba\xdf\x6a\
+\xe0\x30\xe0\xd3\xd1\x85\xa8\x39\x7e\x12\xec\xa6\x67\x02\x9f\x03\
+\xb6\x8d\x2e\x44\x52\xb8\x6b\x81\x57\x02\xa7\x46\x17\xa2\x66\x99\
+\x01\xe8\xa6\xef\x00\xcb\x81\x13\xa2\x0b\x91\x14\xea\xeb\xa4\x63\
+\x81\x27\xff\x0e\xb2\x01\xe8\xae\x1b\x80\x17\x01\x4f\x26\x2d\xf7\
+\x29\xa9\x3b\xce\x04\x0e\x00\x5e\x0c\xac\x0a\xae\x45\x41\xbc\x04\
+\xa0\x59\x8f\x23\xa5\x7f\x5f\x0a\x3c\x34\xb8\x16\x49\xd5\xbb\x1a\
+\xf8\x77\xe0\x0b\xc0\xb9\xc1\xb5\x28\x03\x36\x00\xda\x90\x1d\x80\
+\x27\x00\xbb\x00\x5b\x02\x5b\x01\x9b\x85\x56\x24\x69\x18\x77\x02\
+\x37\xcd\x8c\x0b\x81\xb3\x80\xab\x42\x2b\x92\x24\x49\x92\x24\x49\
+\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\
+\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\
+\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\
+\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\
+\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\
+\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\
+\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x35\x9a\x18\xf3\
+\xcf\xef\x04\xec\x01\xec\x0c\x6c\x07\x3c\x10\x58\x30\x6e\x51\x52\
+\xcb\xdc\x05\xdc\x01\x5c\x06\x5c\x08\xfc\x04\xb8\x29\xb4\x22\x75\
+\xd9\x62\x60\x5b\x60\x29\xb0\x64\x9d\xb1\x31\xb0\x08\xd8\x74\xe6\
+\x7b\xb7\x00\x26\x67\x7e\x7e\x1b\xb0\x06\x58\x0b\xdc\x3a\xf3\xb5\
+\x1b\xe7\x8c\x55\x73\x7e\x7e\x43\xdd\x1b\xa1\xf1\x8d\xd2\x00\x3c\
+\x01\x78\x15\xf0\x42\xe0\x21\xd5\x96\x23\x75\xc2\x5a\xe0\xe7\xc0\
+\x97\x81\x2f\x01\xd7\xc6\x96\xa3\x16\x7a\x30\xb0\x2b\xf0\x28\x60\
+\x19\xb0\xe3\x9c\x1f\x97\x34\xf0\xef\xdf\x45\x6a\x78\x2f\x9f\x19\
+\x97\xcd\x8c\x0b\x80\xff\x47\x6a\x24\x14\x6c\x98\x06\xe0\x19\xc0\
+\x3b\x80\x7d\x6b\xaa\x45\xea\xa2\x7b\x80\x29\xe0\xfd\xc0\x95\xb1\
+\xa5\xa8\x40\x0b\x48\x27\xfa\x3d\x81\xe5\xc0\x6e\x33\x63\x69\x64\
+\x51\x7d\xdc\x4d\x6a\x04\x56\x02\xe7\x01\xe7\x02\x67\x93\x66\xc9\
+\xd4\xa0\x41\x1a\x80\x87\x00\x1f\x26\x7d\xe2\x97\x54\x8f\xdf\x03\
+\xef\x05\x3e\x80\x9f\x8e\xd4\xdb\x03\x80\xbd\x80\x7d\x66\xc6\xde\
+\xa4\x4b\xaf\xa5\x5b\x0d\xfc\x12\x38\x63\xce\xf8\x6d\x68\x45\x1d\
+\xd0\xaf\x01\x78\x0e\xf0\x59\xf2\xee\x26\xa5\x36\xf9\x11\xf0\x72\
+\xe0\x77\xd1\x85\x28\x0b\x13\xa4\x9c\xd5\x81\xc0\xb3\x49\x27\xff\
+\x85\xa1\x15\x35\xe7\x37\xc0\x29\xc0\xb7\x81\xd3\x80\x3b\x63\xcb\
+\x69\x9f\xf9\x1a\x80\xc3\x81\x63\xb9\x3f\x00\x22\xa9\x19\x57\x91\
+\x0e\xf8\xbf\x8a\x2e\x44\x21\x16\x03\x07\x91\x3e\x80\x1d\x48\x0a\
+\xec\x75\xdd\xdd\xa4\x26\xe0\x64\xe0\x04\xbc\x5c\x56\xab\x37\x03\
+\xd3\x0e\x87\x23\x6c\xac\x02\x76\x41\x5d\xb1\x08\x78\x09\x70\x3c\
+\xe9\x72\x50\xf4\xfb\x2f\xe7\xb1\x16\x38\x93\x74\x9e\x32\x88\x3e\
+\x86\x0d\xcd\x00\xbc\x0c\xf8\x22\x7e\xf2\x97\xa2\x5d\x45\xba\xc6\
+\xeb\xe5\x80\x76\x9a\x04\x9e\x05\xbc\x12\x38\x98\x74\x7d\x5f\xc3\
+\x59\x4b\xca\x0b\x7c\x69\x66\xdc\x16\x5b\x4e\x59\xd6\x6d\x00\x1e\
+\x0d\xfc\x0c\xd8\x3c\xa0\x16\x49\xeb\x3b\x0d\x78\x1a\x06\x03\xdb\
+\x64\x7b\xd2\xad\xd4\xaf\x27\xdd\x96\xa7\x6a\xdc\x0d\x9c\x04\x7c\
+\x02\xf8\x1e\x69\xb6\x40\x03\x5a\x40\xba\x15\x23\x7a\x7a\xc7\xe1\
+\x70\xfc\xf1\x78\x1b\x2a\xdd\x04\xe9\xba\xfe\x49\xa4\xc4\x7b\xf4\
+\x7b\xaa\xed\xe3\x3c\xe0\x4d\xf8\x61\x76\x60\x6f\x24\xfe\x45\x73\
+\x38\x1c\xeb\x8f\xdb\x81\x87\xa2\x12\x6d\x0a\xbc\x8e\x14\xe8\x8c\
+\x7e\x1f\x75\x71\xdc\x02\xfc\x03\x66\x05\xe6\xb5\x09\xe9\x9e\xcb\
+\xe8\x17\xcb\xe1\x70\x6c\x78\x1c\x8b\x4a\xb2\x05\x29\xa4\x76\x35\
+\xf1\xef\x1d\x07\xdc\x4b\x0a\x58\x3e\x71\xbe\x17\xad\xab\x0e\x23\
+\xfe\x05\x72\x38\x1c\xbd\xc7\x5d\x78\x3b\x58\x09\x96\x00\x47\x93\
+\x56\xb5\x8b\x7e\xcf\x38\xd6\x1f\x6b\x81\x13\x81\xff\xde\xeb\x05\
+\xec\x92\xd9\xa4\xff\x6b\x43\xab\x90\xd4\xcf\xa6\xa4\x05\x82\x94\
+\xa7\xcd\x81\xa3\x48\x8b\xd7\x1c\x45\xba\x97\x5f\xf9\x99\x00\x9e\
+\x07\xfc\x82\x94\xc7\xd8\x3d\xb6\x9c\x58\x13\xa4\x14\xea\xa5\xd1\
+\x85\x48\xea\xeb\x2c\xd2\x4a\x70\xca\xc7\x22\xe0\x2f\x81\xb7\x02\
+\x5b\x06\xd7\xa2\xe1\xad\x25\xdd\x3e\xf8\x4e\xd2\xc3\x8a\x3a\x65\
+\x12\x78\x7a\x74\x11\x92\x06\xb2\x27\x9e\x64\x72\x72\x30\x29\xdc\
+\xf7\x77\xf8\xba\x94\x6a\x12\x78\x05\x70\x11\x70\x0c\xed\x78\xae\
+\xc2\xc0\x26\x81\x27\x47\x17\x21\x69\x20\x0b\x48\x0b\x03\x29\xd6\
+\x9e\xc0\x8f\x81\x6f\x90\x1e\xb1\xab\xf2\x6d\x0c\xfc\x39\x70\x21\
+\xf0\x6a\x3a\xb2\x10\xde\x24\xf0\xd8\xe8\x22\x24\x0d\x6c\xe7\xe8\
+\x02\x3a\x6c\x2b\xe0\x53\xa4\x4b\x31\x4f\x09\xae\x45\xf5\x78\x30\
+\xe9\xf1\xdc\x3f\x25\x35\x7a\xad\x36\x89\x1d\xac\x54\x92\x65\xd1\
+\x05\x74\xd4\xa1\xa4\xe9\xfe\x3f\xa3\x23\x9f\x0e\x3b\xee\x09\xa4\
+\x26\xe0\x9f\x80\xcd\x82\x6b\xa9\xcd\x24\xae\x94\x24\x95\xa4\x53\
+\xd7\x28\x33\xb0\x3d\xf0\x35\xe0\x38\xbc\x0d\xb3\x6b\x16\x92\xc2\
+\x9d\xe7\x03\xcf\x08\xae\xa5\x16\x93\xa4\x14\xab\xa4\x32\x78\x7b\
+\x59\x73\x0e\x23\x85\xc3\x5e\x14\x5d\x88\x42\xed\x08\xfc\x27\xf0\
+\x69\x5a\xd6\x80\x4f\xb2\xe1\x27\x02\x4a\x52\x57\x6d\x4d\x5a\x2c\
+\xe6\xdf\x68\xd9\x01\x5f\x23\x9b\x20\xad\x97\xb3\x12\xd8\x37\xb8\
+\x96\xca\x78\x2d\x4b\x92\xee\xf7\x74\xe0\x5c\xd2\x62\x31\xd2\xba\
+\x1e\x0e\xfc\x80\xb4\xda\xe3\x46\xc1\xb5\x8c\xcd\x06\x40\x92\xd2\
+\x4a\x8b\x1f\x02\xbe\x43\x4a\x82\x4b\xbd\x2c\x20\xad\xf6\x78\x1a\
+\x85\x3f\xce\xd9\x06\x40\x52\xd7\x3d\x14\xf8\x21\xe9\xe1\x3d\x5e\
+\x12\xd5\xa0\x9e\x44\x9a\x2d\x7a\x41\x74\x21\xa3\xb2\x01\x90\xd4\
+\x65\x4f\x05\xce\xc1\x25\x96\x35\x9a\x07\x02\x5f\x27\x5d\x12\x28\
+\xee\x7c\x5a\x5c\xc1\x92\x54\x81\x09\xd2\x27\xfe\x53\xf1\xf6\x3e\
+\x8d\x67\x82\x74\x49\xe0\x24\x0a\x5b\x12\xda\x06\x40\x52\xd7\x2c\
+\x02\xfe\x9d\x74\xcd\x7f\x61\x70\x2d\x6a\x8f\xe7\x90\x56\x89\x2c\
+\x66\xb5\x4e\x1b\x00\x49\x5d\xb2\x84\x14\xf4\x3b\x24\xba\x10\xb5\
+\xd2\xa3\x80\x33\x81\xfd\x83\xeb\x18\x88\x0d\x80\xa4\xae\x98\x3d\
+\x38\xbb\x8e\xbf\xea\xb4\x25\x69\xe1\xa0\x57\x46\x17\xd2\x8f\x0d\
+\x80\xa4\x2e\x78\x32\xf0\x13\xe0\x31\xd1\x85\xa8\x13\x36\x06\x3e\
+\x0b\xbc\x9b\x8c\xef\x2c\xb1\x01\x90\xd4\x76\xcf\x07\xbe\x0f\x2c\
+\x8d\x2e\x44\x9d\x32\x01\xbc\x0b\xf8\x28\x99\x9e\x6b\xb3\x2c\x4a\
+\x92\x2a\x72\x28\xf0\x15\x60\x93\xe8\x42\xd4\x59\x87\x03\x5f\x20\
+\xc3\xc0\xa9\x0d\x80\xa4\xb6\x7a\x05\xe9\xc0\x5b\xfc\x92\xad\x2a\
+\xde\xcb\x49\xeb\x05\x6c\x1a\x5d\xc8\x5c\x36\x00\x92\xda\xe8\x0d\
+\xa4\x6b\xb0\xd9\x7d\xea\x52\x67\x1d\x4c\x6a\x02\xb2\x79\x02\xaf\
+\x0d\x80\xa4\xb6\x39\x92\x8c\xaf\xbb\xaa\xd3\x9e\x0d\x7c\x83\x4c\
+\x66\x02\xfc\x0f\x22\xa9\x4d\x5e\x0d\x1c\x13\x5d\x84\x34\x8f\xa7\
+\x03\xc7\x91\xc1\xa5\x29\x1b\x00\x49\x6d\xf1\x62\xe0\x53\x78\x5c\
+\x53\xfe\x9e\x0f\x7c\x89\xf4\x64\xc1\x30\xfe\x47\x91\xd4\x06\xcf\
+\x07\xbe\x8c\xd7\xfc\x55\x8e\x97\x90\x1a\xd6\xb0\x75\x02\x6c\x00\
+\x24\x95\x6e\x3f\xd2\xda\xfe\xe1\x53\xaa\xd2\x90\xfe\x14\xf8\xfb\
+\xa8\x7f\xbc\x84\x6e\xf9\xa5\xd1\x05\xa8\x53\xf6\x06\xde\x12\x5d\
+\x84\x06\xb6\x13\x70\x02\xde\xe7\x3f\x8a\x35\xc0\xd5\xc0\x15\xc0\
+\x75\xc0\xaa\x99\x71\x23\x70\xd7\xcc\xf7\xdc\x02\x4c\xcf\xfc\x7c\
+\x73\xd2\x39\x63\x21\xe9\x99\x0a\xb3\x63\x29\xb0\x03\xb0\x23\x19\
+\x25\xdc\x0b\x72\x14\x70\x29\xf0\x89\xa6\xff\xe1\x12\x1a\x80\xaf\
+\x44\x17\x20\x29\x4b\x5b\x03\xdf\x06\xb6\x8a\x2e\x24\x73\xf7\x01\
+\xe7\x03\xe7\x01\x2b\x67\xc6\x6f\x48\x27\xff\xfb\x2a\xfe\xb7\xb6\
+\x25\x35\x02\xcb\xe7\x8c\xdd\x81\x07\x55\xfc\xef\xb4\xcd\xb1\xc0\
+\x95\xc0\x29\x4d\xfe\xa3\x25\x34\x00\x92\xb4\xae\x45\xa4\xdb\xa9\
+\x1e\x11\x5d\x48\x86\x6e\x03\x4e\x23\x3d\xf8\xe8\x0c\xe0\x6c\xe0\
+\xee\x86\xfe\xed\xeb\x66\xc6\x4f\xe7\x7c\x6d\x02\x78\x2c\xe9\x79\
+\x0c\x4f\x01\x9e\x0a\x2c\x6b\xa8\x9e\x52\x2c\x04\x8e\x07\xf6\x05\
+\x7e\xd9\xe4\x3f\x3c\x9d\xf9\x90\x9a\x74\x08\xf1\xef\xf9\xf9\xc6\
+\xf1\xf5\x6d\x7a\x31\x26\x48\xfb\x21\xfa\xb5\xc8\x69\xac\x04\x8e\
+\x26\x3d\x86\xb6\x84\x2c\xc4\xce\xa4\x4b\x6d\xdf\x01\xee\x21\x7e\
+\xff\xe5\x32\xae\x06\xb6\x1f\x63\xbf\x0e\x2d\x7a\x83\xfb\x0d\xa9\
+\x49\x36\x00\xf9\x3b\x8a\xf8\xd7\x21\x87\x71\x01\xe9\x69\x73\x3b\
+\x8f\xb5\x37\xe3\x3d\x08\x78\x15\x70\x12\x70\x2f\xf1\xfb\x35\x7a\
+\x9c\x49\x7a\x9a\x60\x23\xa2\x37\xb6\xdf\x90\x9a\x64\x03\x90\xb7\
+\xa7\x01\xab\x89\x7f\x1d\xa2\xc6\xcd\xc0\x47\x48\xd7\xd5\xdb\x68\
+\x1b\xe0\xad\xc0\x45\xc4\xef\xeb\xc8\xd1\xd8\x62\x56\xd1\x1b\xda\
+\x6f\x48\x4d\xb2\x01\xc8\xd7\x0e\xc0\xf5\xc4\xbf\x06\x11\xe3\xe7\
+\xa4\x55\x0e\x37\x1b\x7b\x2f\x96\x61\x82\xfb\x6f\xef\xec\x6a\xc3\
+\xf7\x3f\xc7\xde\x8b\x03\x88\xde\xc8\x7e\x43\x6a\x92\x0d\x40\x9e\
+\x36\x01\xce\x22\x7e\xff\x37\x39\xd6\x02\xdf\x02\x0e\xa8\x60\xff\
+\x95\x6c\x47\xe0\x43\xc0\xed\xc4\xbf\x26\x4d\x8e\xdf\x03\xbb\x55\
+\xb0\xff\xe6\x15\xbd\x91\xfd\x86\xd4\x24\x1b\x80\x3c\x7d\x88\xf8\
+\x7d\xdf\xd4\x58\x0b\xfc\x07\x0d\x1c\xfc\x0b\xb3\x15\xf0\x7e\xba\
+\xd5\x08\x5c\x48\xcd\xb3\x3e\xd1\x1b\xd8\x6f\x48\x4d\xb2\x01\xc8\
+\xcf\xb3\x48\x27\xc5\xe8\x7d\xdf\xc4\x38\x19\x78\x7c\x35\xbb\xad\
+\xb5\xb6\x06\x3e\x48\x5a\xac\x28\xfa\xf5\x6a\x62\x7c\xbc\x9a\xdd\
+\xb6\x61\xd1\x1b\xd7\x6f\x48\x4d\xb2\x01\xc8\xcb\x52\xe0\x77\xc4\
+\xef\xf7\xba\xc7\x45\xc0\x41\x15\xed\xb3\xae\x78\x28\xf0\x39\xba\
+\xd1\x1c\x3e\xbf\xa2\x7d\xb6\x9e\xe8\x0d\xeb\x37\xa4\x26\xd9\x00\
+\xe4\xe5\x44\xe2\xf7\x79\x9d\xe3\x16\xe0\x4d\xb8\x28\xdb\x38\xf6\
+\x27\xad\x83\x10\xfd\x5a\xd6\x39\x6e\xa0\xa6\xf5\x01\xa2\x37\xac\
+\xdf\x90\x9a\x64\x03\x90\x8f\xc3\x88\xdf\xdf\x75\x8e\x13\x80\x07\
+\x57\xb6\xb7\xba\x6d\x23\xe0\xed\xb4\xfb\xb2\xc0\x29\xd4\xf0\xe4\
+\xc0\xe8\x8d\xea\x37\xa4\x26\xd9\x00\xe4\xe1\x21\xdc\xff\x20\x9a\
+\xb6\x8d\x6b\x49\x8f\x82\x55\xf5\x76\x02\x4e\x27\xfe\x35\xae\x6b\
+\xfc\x69\x65\x7b\x0a\x1f\x07\x2c\x29\x4f\x1f\x01\xb6\x88\x2e\xa2\
+\x06\xdf\x01\x1e\x07\x7c\x35\xba\x90\x96\xba\x98\xb4\x7e\xc0\x5f\
+\x90\x56\x15\x6c\x9b\x0f\x92\x1e\xb8\x54\x09\x1b\x00\x49\xb9\x39\
+\x14\x78\x41\x74\x11\x15\xbb\x0b\x38\x02\x38\x10\xb8\x26\xb8\x96\
+\xb6\x5b\x4b\x5a\x49\x6f\x3f\xd2\x53\x0f\xdb\x64\x2b\x2a\x5e\x25\
+\x30\x7a\x4a\xa3\xdf\x90\x9a\xe4\x25\x80\x58\x5b\x91\xa6\xc8\xa3\
+\xf7\x73\x95\xe3\x4a\xe0\x09\x55\xee\x24\x0d\x6c\x73\xd2\x6c\x4b\
+\xf4\x7b\xa0\xea\x51\xc9\x5d\x01\xce\x00\x48\xca\xc9\x3f\x52\xe1\
+\x14\x67\x06\x4e\x21\xad\xdb\x7f\x76\x74\x21\x1d\x75\x3b\xa9\xa9\
+\xff\x5b\x60\x4d\x70\x2d\x55\xfa\x30\xb0\x78\xdc\xbf\xc4\x06\x40\
+\x52\x2e\xf6\x00\x5e\x13\x5d\x44\x85\x3e\x40\xba\xb7\xff\xa6\xe8\
+\x42\x3a\x6e\x1a\xf8\x3b\xe0\x79\xa4\x86\xa0\x0d\x1e\x06\xfc\x55\
+\x15\x7f\x51\xf4\x54\x46\xbf\x21\x35\xc9\x4b\x00\x71\x4e\x23\x7e\
+\xff\x56\x31\x56\x93\xae\xf7\x2b\x3f\xcb\x81\x2b\x88\x7f\x8f\x54\
+\x31\xee\x04\x96\x8d\xb3\x33\x9c\x01\x90\x94\x83\x43\x49\xa1\xad\
+\xd2\xfd\x9e\xf4\x49\xf3\xd8\xe8\x42\xb4\x41\xe7\x01\xfb\x90\x16\
+\x0e\x2a\xdd\x22\xe0\xe8\x71\xfe\x02\x1b\x00\x49\xd1\x16\x01\xff\
+\x10\x5d\x44\x05\xee\x00\x0e\x06\xbe\x1d\x5d\x88\xe6\x75\x35\xf0\
+\x54\xe0\x27\xd1\x85\x54\x60\xac\xc6\xd9\x06\x40\x52\xb4\xbf\x00\
+\x1e\x1e\x5d\xc4\x98\x6e\x02\xfe\x04\xf8\x41\x74\x21\x1a\xc8\x2d\
+\xa4\x87\x4c\xfd\x28\xba\x90\x0a\x7c\x80\x11\x57\x08\xb4\x01\x90\
+\x14\x69\x0b\xe0\xad\xd1\x45\x8c\xe9\x46\xe0\x00\xe0\x9c\xe8\x42\
+\x34\x94\xdb\x81\x67\x53\x7e\xd3\xf6\x04\xd2\x65\xa7\xa1\xd9\x00\
+\x48\x8a\xf4\x16\xd2\xbd\xff\xa5\xba\x8d\x74\x12\xf9\x65\x74\x21\
+\x1a\xc9\x9d\xc0\x73\x81\x1f\x47\x17\x32\xa6\xf7\x32\xc2\xf9\xdc\
+\x06\x40\x52\x94\x07\x01\x7f\x1e\x5d\xc4\x18\xee\x24\x5d\xf3\xf7\
+\x1e\xff\xb2\xcd\xbe\x8e\x25\xcf\xe0\x2c\x07\x5e\x3c\xec\x1f\xb2\
+\x01\x90\x14\xe5\x28\x52\x13\x50\xa2\x35\xc0\xcb\x69\xc7\x35\x64\
+\xc1\xad\xa4\x99\x9c\x92\x97\x0e\x7e\x1f\xb0\x60\x98\x3f\x60\x03\
+\x20\x29\xc2\x12\xe0\x4d\xd1\x45\x8c\xe1\x4d\xc0\x37\xa2\x8b\x50\
+\xa5\x56\x91\x66\x02\x6e\x8e\x2e\x64\x44\x8f\x01\x5e\x3a\xcc\x1f\
+\xb0\x01\x90\x14\xe1\x0d\x54\xb0\x94\x69\x90\x0f\x00\x1f\x8b\x2e\
+\x42\xb5\xb8\x08\x78\x11\xe5\x3e\x49\x70\xa8\x40\xad\x0d\x80\xa4\
+\xa6\x6d\x42\xb9\x2b\xe5\x9d\x0a\xfc\x75\x74\x11\xaa\xd5\x0f\x49\
+\xb7\xa6\x96\x68\x0f\xd2\x1d\x29\x03\xb1\x01\x90\xd4\xb4\x57\x02\
+\xdb\x45\x17\x31\x82\x2b\x48\xd7\xfd\xdb\xf4\x50\x19\x6d\xd8\xc7\
+\x80\xcf\x44\x17\x31\xa2\x81\x67\x01\x6c\x00\x24\x35\x69\x02\xf8\
+\xcb\xe8\x22\x46\x70\x17\xf0\x02\xd2\x75\x62\x75\xc3\x91\xc0\x2f\
+\xa2\x8b\x18\xc1\x81\xc0\x7f\x1b\xe4\x1b\x6d\x00\x24\x35\xe9\xd9\
+\xc0\x2e\xd1\x45\x8c\xe0\x6d\xc0\xb9\xd1\x45\xa8\x51\x77\x01\x2f\
+\x23\x3d\xdf\xa1\x24\x13\xa4\xf5\x35\xfa\xb2\x01\x90\xd4\xa4\xc3\
+\xa3\x0b\x18\xc1\x29\xc0\x47\xa3\x8b\x50\x88\x5f\x53\xe6\x8c\xd5\
+\xcb\x81\x2d\xfb\x7d\x93\x0d\x80\xa4\xa6\x3c\x84\x34\x03\x50\x92\
+\xeb\x81\x57\x93\x1e\xbf\xaa\x6e\xfa\x24\xf0\xf5\xe8\x22\x86\xb4\
+\x88\xd4\x04\xcc\xcb\x06\x40\x52\x53\x5e\x0b\x2c\x8c\x2e\x62\x48\
+\x47\x90\x9a\x00\x75\xdb\xeb\x81\x1b\xa2\x8b\x18\xd2\xeb\xfb\x7d\
+\x83\x0d\x80\xa4\x26\x4c\x92\x1a\x80\x92\x7c\x13\xf8\x6a\x74\x11\
+\xca\xc2\x2a\x52\x0e\xa4\x24\xbb\x01\x8f\x9f\xef\x1b\x6c\x00\x24\
+\x35\xe1\x99\xc0\xb2\xe8\x22\x86\x70\x1b\x69\xb1\x22\x69\xd6\x67\
+\x81\xff\x8c\x2e\x62\x48\xaf\x9b\xef\x37\x6d\x00\x24\x35\xe1\x95\
+\xd1\x05\x0c\xe9\x1d\xc0\xd5\xd1\x45\x28\x3b\x47\x02\xf7\x44\x17\
+\x31\x84\x43\x49\x0b\x6f\x6d\x90\x0d\x80\xa4\xba\x6d\x4a\x7a\xe4\
+\x6a\x29\x2e\xc4\xa5\x7e\xb5\x61\xbf\x01\x8e\x89\x2e\x62\x08\x5b\
+\x00\xcf\xea\xf5\x9b\x36\x00\x92\xea\xf6\x5c\xe0\x81\xd1\x45\x0c\
+\xe1\x2d\xc0\x7d\xd1\x45\x28\x5b\xef\x03\xae\x89\x2e\x62\x08\x87\
+\xf6\xfa\x0d\x1b\x00\x49\x75\x3b\x24\xba\x80\x21\x9c\x32\x33\xa4\
+\x5e\x6e\x07\xde\x1d\x5d\xc4\x10\x0e\x26\xdd\x16\xb8\x1e\x1b\x00\
+\x49\x75\xda\x0c\x38\x28\xba\x88\x21\xbc\x2b\xba\x00\x15\x61\x05\
+\x70\x49\x74\x11\x03\xda\x9c\x1e\xeb\x6f\xd8\x00\x48\xaa\xd3\x41\
+\x94\xf3\xd8\xdf\x13\x81\xb3\xa2\x8b\x50\x11\xee\x03\xde\x13\x5d\
+\xc4\x10\x36\x38\x0b\x67\x03\x20\xa9\x4e\xcf\x89\x2e\x60\x40\xd3\
+\xf8\xe9\x5f\xc3\xf9\x22\x70\x71\x74\x11\x03\x7a\x16\x1b\x58\x84\
+\xcb\x06\x40\x52\x5d\x26\x98\x27\x81\x9c\x99\x93\x81\x5f\x46\x17\
+\xa1\xa2\xac\x01\x3e\x10\x5d\xc4\x80\xb6\x04\xf6\x5a\xf7\x8b\x36\
+\x00\x92\xea\xb2\x3b\xb0\x7d\x74\x11\x03\xfa\x60\x74\x01\x2a\xd2\
+\xe7\x29\xe7\x8e\x80\x03\xd7\xfd\x82\x0d\x80\xa4\xba\x94\xf2\xe0\
+\x9f\x95\xc0\x0f\xa2\x8b\x50\x91\xee\xa1\x9c\x27\x45\xae\xf7\xff\
+\xd1\x06\x40\x52\x5d\x4a\x69\x00\xfe\x05\x9f\xf6\xa7\xd1\x7d\x9c\
+\x32\x56\x07\xdc\x03\xd8\x6e\xee\x17\x6c\x00\x24\xd5\x61\x31\xb0\
+\x77\x74\x11\x03\xb8\x15\x38\x3e\xba\x08\x15\x6d\x15\x70\x42\x74\
+\x11\x03\x98\x00\x0e\x98\xfb\x05\x1b\x00\x49\x75\xd8\x8b\x32\x1e\
+\xfd\xfb\x05\xe0\xce\xe8\x22\x54\xbc\x4f\x45\x17\x30\xa0\x7d\xe6\
+\xfe\xc2\x06\x40\x52\x1d\xf6\xe9\xff\x2d\x59\x28\xe5\xc0\xad\xbc\
+\x7d\x9f\x32\x16\x06\xb2\x01\x90\x54\xbb\x12\x1a\x80\x8b\x80\x73\
+\xa3\x8b\x50\x2b\x4c\x03\x5f\x8e\x2e\x62\x00\xcb\x49\x0f\x08\x02\
+\x6c\x00\x24\x55\x6f\x92\x32\xae\xff\x7f\x29\xba\x00\xb5\xca\xbf\
+\x47\x17\x30\x80\x49\xe6\xac\x07\x60\x03\x20\xa9\x6a\xbb\x32\xe7\
+\x53\x46\xc6\xbe\x12\x5d\x80\x5a\xe5\x7c\xe0\x57\xd1\x45\x0c\xe0\
+\x0f\xb3\x73\x36\x00\x92\xaa\xb6\x47\x74\x01\x03\x38\x9f\x74\x09\
+\x40\xaa\xd2\x57\xa3\x0b\x18\xc0\x9e\xb3\x3f\xb1\x01\x90\x54\xb5\
+\xdd\xa2\x0b\x18\xc0\xb7\xa2\x0b\x50\x2b\x9d\x1c\x5d\xc0\x00\x96\
+\xcf\xfe\xc4\x06\x40\x52\xd5\x4a\x68\x00\x4e\x89\x2e\x40\xad\x74\
+\x16\x70\x43\x74\x11\x7d\xec\x40\x7a\x36\x80\x0d\x80\xa4\xca\x2d\
+\xef\xff\x2d\xa1\x6e\x07\xce\x8c\x2e\x42\xad\xb4\x16\x38\x35\xba\
+\x88\x01\xec\x0a\x36\x00\x92\xaa\xb5\x1d\xb0\x4d\x74\x11\x7d\xfc\
+\x08\xb8\x37\xba\x08\xb5\x56\x09\x0d\xc0\x6e\x60\x03\x20\xa9\x5a\
+\xb9\x7f\xfa\x07\x38\x23\xba\x00\xb5\x5a\x09\xef\xaf\xe5\x60\x03\
+\x20\xa9\x5a\x8f\x8a\x2e\x60\x00\xa7\x47\x17\xa0\x56\xfb\x35\x70\
+\x7d\x74\x11\x7d\x3c\x12\x6c\x00\x24\x55\x6b\x59\x74\x01\x7d\xdc\
+\x0b\x9c\x13\x5d\x84\x5a\x6d\x9a\xfc\x33\x26\x3b\x82\x0d\x80\xa4\
+\x6a\xed\x18\x5d\x40\x1f\xbf\x02\xee\x8a\x2e\x42\xad\xf7\xf3\xe8\
+\x02\xfa\xd8\x01\x58\x60\x03\x20\xa9\x4a\xcb\xa2\x0b\xe8\x63\x65\
+\x74\x01\xea\x84\xdc\xdf\x67\x1b\x01\x0f\xb6\x01\x90\x54\xa5\xdc\
+\x67\x00\xce\x8b\x2e\x40\x9d\x90\x7b\x03\x00\xb0\xa3\x0d\x80\xa4\
+\xaa\x2c\x06\x96\x46\x17\xd1\x87\x0d\x80\x9a\x70\x39\x69\xbd\x89\
+\x9c\x2d\xb3\x01\x90\x54\x95\xdc\xef\xff\x07\xf8\x4d\x74\x01\xea\
+\x84\x69\xe0\xd2\xe8\x22\xfa\xd8\xc6\x06\x40\x52\x55\x96\x44\x17\
+\xd0\xc7\x1a\xe0\xaa\xe8\x22\xd4\x19\x97\x45\x17\xd0\xc7\x12\x1b\
+\x00\x49\x55\xc9\x7d\xfa\xff\xb7\xb8\x02\xa0\x9a\x73\x79\x74\x01\
+\x7d\xd8\x00\x48\xaa\xcc\x56\xd1\x05\xf4\x71\x45\x74\x01\xea\x94\
+\xdc\x67\x00\x96\xda\x00\x48\xaa\xca\xd6\xd1\x05\xf4\x71\x5d\x74\
+\x01\xea\x94\xdc\x57\x03\x74\x06\x40\x52\x65\xb6\x8c\x2e\xa0\x8f\
+\x1b\xa3\x0b\x50\xa7\xe4\xfe\x7e\xb3\x01\x90\x54\x99\x45\xd1\x05\
+\xf4\x91\xfb\x73\xda\xd5\x2e\xab\xa2\x0b\xe8\x63\x53\x1b\x00\x49\
+\x55\xd9\x38\xba\x80\x3e\x6e\x8e\x2e\x40\x9d\x92\xfb\x0c\xc0\x26\
+\x36\x00\x92\xaa\x92\x7b\x03\xe0\x33\x00\xd4\xa4\xdc\xdf\x6f\x36\
+\x00\x92\x2a\xb3\x49\x74\x01\x7d\x78\x0b\xa0\x9a\x94\xfb\xfb\x6d\
+\x63\x1b\x00\x49\x55\xc9\x7d\x06\x20\xf7\x03\xb2\xda\xe5\x9e\xe8\
+\x02\xfa\x70\x06\x40\x52\x65\x6c\x00\xa4\xfb\xe5\xfe\x7e\x73\x06\
+\x40\x52\x65\x56\x47\x17\xd0\xc7\xc2\xe8\x02\xd4\x29\xb9\xbf\xdf\
+\x56\xdb\x00\x48\xaa\x4a\xf6\x9f\x78\xa2\x0b\x50\xa7\xe4\xfe\x7e\
+\xbb\xc7\x06\x40\x52\x55\x72\xbf\xe6\x99\xfb\x01\x59\xed\x92\x7d\
+\x28\xd6\x06\x40\x52\x55\x72\x9f\x01\xc8\xfd\x80\xac\x76\xc9\xfd\
+\xfd\xe6\x0c\x80\xa4\xca\xe4\xde\x00\xe4\xbe\x54\xb1\xda\x25\xf7\
+\x87\x63\xd9\x00\x48\xaa\x4c\xee\x97\x00\x96\x44\x17\xa0\x4e\xc9\
+\xfd\xfd\x66\x03\x20\xa9\x32\xb7\x44\x17\xd0\xc7\xd2\xe8\x02\xd4\
+\x29\xb9\xbf\xdf\x6e\xb6\x01\x90\x54\x95\xdc\x1f\x7e\x92\xfb\x01\
+\x59\xed\x92\xfb\x0c\xc0\x4d\x36\x00\x92\xaa\x92\xfb\xc3\x4f\x1e\
+\x16\x5d\x80\x3a\xe5\xe1\xd1\x05\xf4\x71\x83\x0d\x80\xa4\xaa\xe4\
+\x3e\x03\xb0\x0c\x98\x88\x2e\x42\x9d\xb1\x2c\xba\x80\x3e\x6e\xb4\
+\x01\x90\x54\x95\xdc\x67\x00\x36\x05\xb6\x8b\x2e\x42\x9d\xb1\x63\
+\x74\x01\x7d\xd8\x00\x48\xaa\x4c\xee\x33\x00\x00\x8f\x88\x2e\x40\
+\x9d\x61\x03\x20\xa9\x33\x6e\x02\xee\x88\x2e\xa2\x8f\x5d\xa3\x0b\
+\x50\x27\x2c\x25\xff\xd9\xa6\x2b\x6d\x00\x24\x55\xe9\x8a\xe8\x02\
+\xfa\x58\x1e\x5d\x80\x3a\x61\xb7\xe8\x02\x06\x70\x99\x0d\x80\xa4\
+\x2a\x5d\x1e\x5d\x40\x1f\x25\x1c\x98\x55\xbe\xdc\xdf\x67\xd3\xc0\
+\x15\x36\x00\x92\xaa\x74\x59\x74\x01\x7d\xec\x06\x78\xdc\x53\xdd\
+\x72\x6f\x00\xae\x05\xee\xf6\x3f\x82\xa4\x2a\x5d\x1e\x5d\x40\x1f\
+\x5b\x00\xbb\x44\x17\xa1\xd6\xdb\x27\xba\x80\x3e\x2e\x03\x3b\x61\
+\x49\xd5\xba\x34\xba\x80\x01\xe4\x7e\x70\x56\xd9\xb6\x06\x1e\x1d\
+\x5d\x44\x1f\x36\x00\x92\x2a\x77\x41\x74\x01\x03\xb0\x01\x50\x9d\
+\x9e\x42\xfe\x0b\x4e\x9d\x0f\x36\x00\x92\xaa\x75\x09\x70\x67\x74\
+\x11\x7d\x3c\x35\xba\x00\xb5\xda\x7e\xd1\x05\x0c\xe0\x3c\xb0\x01\
+\x90\x54\xad\x35\xe4\x3f\x0b\xb0\x03\xe6\x00\x54\x9f\xe7\x44\x17\
+\x30\x80\x95\x60\x03\x20\xa9\x7a\x2b\xa3\x0b\x18\xc0\xb3\xa3\x0b\
+\x50\x2b\xed\x08\x3c\x26\xba\x88\x3e\x6e\x01\xae\x06\x1b\x00\x49\
+\xd5\xb3\x01\x50\x57\x95\xf0\xbe\x3a\x8f\xb4\x0e\x80\x0d\x80\xa4\
+\xca\xfd\x32\xba\x80\x01\xec\x47\xfe\xcf\x6b\x57\x79\x5e\x18\x5d\
+\xc0\x00\xfe\xf0\xff\xd3\x06\x40\x52\xd5\xce\x02\xee\x8d\x2e\xa2\
+\x8f\x8d\x28\xe3\x60\xad\x72\x6c\x0d\xec\x1f\x5d\xc4\x00\xce\x98\
+\xfd\x89\x0d\x80\xa4\xaa\xdd\x45\x19\xb3\x00\x87\x46\x17\xa0\x56\
+\x39\x04\x58\x18\x5d\xc4\x00\x6c\x00\x24\xd5\xea\x8c\xfe\xdf\x12\
+\x6e\x7f\x60\xdb\xe8\x22\xd4\x1a\x25\x34\x94\x57\xcd\x0c\xc0\x06\
+\x40\x52\x3d\x4a\x68\x00\x16\x02\xaf\x8e\x2e\x42\xad\xf0\x48\x60\
+\xdf\xe8\x22\x06\x70\xfa\xdc\x5f\xd8\x00\x48\xaa\xc3\x8f\xa3\x0b\
+\x18\xd0\x61\xe4\xbf\x6a\x9b\xf2\xf7\x3a\xca\x78\x1f\xfd\x51\x63\
+\x6e\x03\x20\xa9\x0e\xd7\x01\x17\x47\x17\x31\x80\x47\xe2\xca\x80\
+\x1a\xcf\x46\x94\x33\x93\x74\xda\xdc\x5f\xd8\x00\x48\xaa\xcb\x29\
+\xd1\x05\x0c\xe8\x88\xe8\x02\x54\xb4\x17\x01\xdb\x45\x17\x31\x80\
+\xab\x98\x79\x06\xc0\x2c\x1b\x00\x49\x75\x29\xa5\x01\x78\x21\x69\
+\x26\x40\x1a\xc5\x5b\xa2\x0b\x18\xd0\x7a\xff\x1f\x6d\x00\x24\xd5\
+\xe5\x87\xe4\xff\x60\x20\x80\x05\xc0\x9b\xa3\x8b\x50\x91\xfe\x04\
+\x78\x62\x74\x11\x03\x3a\x79\xdd\x2f\xd8\x00\x48\xaa\xcb\xdd\xa4\
+\x26\xa0\x04\xaf\xc5\x95\x01\x35\xbc\xb7\x46\x17\x30\xa0\xfb\x80\
+\xef\xad\xfb\x45\x1b\x00\x49\x75\x2a\xe5\x32\xc0\x62\xe0\x6d\xd1\
+\x45\xa8\x28\x7b\x51\xc6\x93\xff\x20\xa5\xff\x6f\x5b\xf7\x8b\x36\
+\x00\x92\xea\x74\x02\xb0\x36\xba\x88\x01\x1d\x89\x0b\x03\x69\x70\
+\xef\x89\x2e\x60\x08\x5f\xdb\xd0\x17\x6d\x00\x24\xd5\xe9\x6a\xe0\
+\xcc\xe8\x22\x06\xb4\x18\x38\x2a\xba\x08\x15\xe1\x29\xc0\x33\xa3\
+\x8b\x18\xd0\x5a\x6c\x00\x24\x05\x39\x3e\xba\x80\x21\x1c\x01\x3c\
+\x3a\xba\x08\x65\x6d\x02\x38\x3a\xba\x88\x21\x9c\x06\x5c\xb3\xa1\
+\xdf\xb0\x01\x90\x54\xb7\xaf\x00\x6b\xa2\x8b\x18\xd0\xc6\x94\x75\
+\x70\x57\xf3\x5e\x01\xec\x13\x5d\xc4\x10\x7a\x36\xe0\x36\x00\x92\
+\xea\x76\x2d\xe5\x2c\x0d\x0c\x69\x61\x97\x67\x44\x17\xa1\x2c\x6d\
+\x06\xbc\x2f\xba\x88\x21\xac\x01\xbe\xde\xeb\x37\x6d\x00\x24\x35\
+\xe1\x4b\xd1\x05\x0c\xe9\x9f\x49\xb3\x01\xd2\x5c\xef\x04\x76\x88\
+\x2e\x62\x08\xdf\x05\xae\xef\xf5\x9b\x36\x00\x92\x9a\xf0\x65\xe0\
+\xf6\xe8\x22\x86\xb0\x2b\x06\x02\xf5\xc7\x76\xa3\x9c\x55\xff\x66\
+\x7d\x6a\xbe\xdf\xb4\x01\x90\xd4\x84\x3b\x28\x2b\x0c\x08\xf0\x76\
+\x60\x97\xe8\x22\x94\x85\x05\xc0\xa7\x49\x0f\xfe\x29\xc5\x75\xc0\
+\x37\xe6\xfb\x06\x1b\x00\x49\x4d\xf9\x64\x74\x01\x43\xda\x84\x54\
+\xf3\x82\xe8\x42\x14\xee\x7f\x03\x8f\x8f\x2e\x62\x48\x9f\x25\xad\
+\x00\xd8\x93\x0d\x80\xa4\xa6\xfc\x17\x70\x6e\x74\x11\x43\x7a\x32\
+\xf0\x7f\xa2\x8b\x50\xa8\x3d\x80\xf7\x46\x17\x31\x82\x15\xfd\xbe\
+\xc1\x06\x40\x52\x93\xe6\xbd\x26\x99\xa9\x77\x02\x7b\x47\x17\xa1\
+\x10\x8b\x49\x01\xd6\xd2\x02\xa1\x3f\x04\x2e\xea\xf7\x4d\x36\x00\
+\x92\x9a\xf4\x59\xe0\xe6\xe8\x22\x86\xb4\x10\xf8\x02\xb0\x45\x74\
+\x21\x6a\xdc\x31\xc0\x4e\xd1\x45\x8c\xe0\x5f\x06\xf9\x26\x1b\x00\
+\x49\x4d\xba\x03\xf8\x78\x74\x11\x23\x78\x24\xa9\x09\xf0\x98\xd9\
+\x1d\xaf\x04\xfe\x2c\xba\x88\x11\x5c\x0c\x7c\x73\x90\x6f\xf4\xcd\
+\x2c\xa9\x69\xc7\x90\x1e\x15\x5c\x9a\xe7\x92\xee\x0c\x50\xfb\xed\
+\x0e\xfc\xbe\xf4\xb2\x74\x00\x00\x09\xcc\x49\x44\x41\x54\x5b\x74\
+\x11\x23\xfa\x20\x03\x3e\x80\xcb\x06\x40\x52\xd3\xae\x03\x8e\x8b\
+\x2e\x62\x44\xef\x06\x0e\x8a\x2e\x42\xb5\xda\x16\xf8\x0f\x60\x51\
+\x74\x21\x23\xb8\x0e\xf8\xfc\xa0\xdf\x6c\x03\x20\x29\xc2\x3f\x03\
+\xd3\xd1\x45\x8c\x60\x92\xd4\xbc\x3c\x2e\xba\x10\xd5\x62\x33\xe0\
+\x44\xe0\xe1\xd1\x85\x8c\xe8\x58\x86\x98\x5d\xb3\x01\x90\x14\xe1\
+\x3c\xd2\x81\xb6\x44\x0f\x00\xbe\x45\x59\x4b\xc2\xaa\xbf\x49\xd2\
+\xa7\xe7\xbd\xa2\x0b\x19\xd1\xad\xc0\x47\x86\xf9\x03\x36\x00\x92\
+\xa2\xbc\x93\x01\xaf\x55\x66\x68\x7b\x52\xd0\x6a\xab\xe8\x42\x54\
+\x99\x63\x48\x0f\x82\x2a\xd5\x07\x19\xf2\x0e\x1b\x1b\x00\x49\x51\
+\xce\x23\x3d\x2a\xb8\x54\xcb\x81\xef\x01\x5b\x46\x17\xa2\xb1\xbd\
+\x1f\x38\x32\xba\x88\x31\xdc\x48\x6a\x60\x86\x62\x03\x20\x29\xd2\
+\x3b\x81\xd5\xd1\x45\x8c\x61\x77\xd2\xe5\x80\x07\x44\x17\xa2\x91\
+\xfd\x25\xf0\x37\xd1\x45\x8c\xe9\x1f\x81\xdb\x86\xfd\x43\x36\x00\
+\x92\x22\xfd\x9a\xf4\xa4\xc0\x92\x3d\x09\xf8\x36\xf0\xc0\xe8\x42\
+\x34\xb4\xa3\x48\x81\xd4\x92\xdd\x00\x7c\x74\x94\x3f\x68\x03\x20\
+\x29\xda\xdb\x81\x3b\xa3\x8b\x18\xd3\xbe\xa4\xcb\x01\x4b\xa2\x0b\
+\xd1\xc0\xde\x0d\x1c\x1d\x5d\x44\x05\xde\x41\x5a\x60\x6b\x68\x36\
+\x00\x92\xa2\x5d\x45\xf9\x9f\xc2\x20\x3d\x2d\xee\x54\xd2\x7d\xe4\
+\xca\xd7\x24\xf0\x61\xe0\x5d\xd1\x85\x54\x60\x25\x63\x3c\x5f\xc3\
+\x06\x40\x52\x0e\xfe\x1e\xb8\x32\xba\x88\x0a\xec\x0e\xfc\x14\xd8\
+\x25\xba\x10\x6d\xd0\xa6\xa4\x87\xfb\x94\x1c\xf8\x9b\xeb\xad\xc0\
+\x9a\x51\xff\xb0\x0d\x80\xa4\x1c\xdc\x49\x7b\x96\xd9\x5d\x46\x6a\
+\x02\x0e\x0c\xae\x43\x7f\x6c\x09\x69\x86\xe6\xd0\xe8\x42\x2a\xf2\
+\x35\xe0\xbb\xe3\xfc\x05\x36\x00\x92\x72\xf1\x45\xd2\x89\xb3\x0d\
+\x36\x27\x2d\x74\x74\x44\x74\x21\x02\xd2\xe5\x99\x9f\x01\xfb\x44\
+\x17\x52\x91\xbb\x81\xbf\x1a\xf7\x2f\xb1\x01\x90\x94\x8b\x69\xe0\
+\x70\xe0\xbe\xe8\x42\x2a\xb2\x31\x69\x65\xb6\x2f\x90\x96\x98\x55\
+\x8c\x57\x01\x3f\xa2\xdc\xe5\x7d\x37\xe4\xef\x81\x4b\xab\xf8\x8b\
+\xa6\x33\x1f\x52\x93\x0e\x21\xfe\x3d\x3f\xdf\x38\xbe\xbe\x4d\xcf\
+\xc6\xd1\xc4\xef\xe7\xaa\xc7\x2f\x28\xf3\xb9\xf2\x25\x5b\x4c\x0a\
+\xc8\x45\xbf\xf6\x55\x8f\xf3\x48\xcd\x65\x25\xa2\x37\xa6\xdf\x90\
+\x9a\x64\x03\x10\x6f\x13\xe0\x42\xe2\xf7\x75\xd5\xe3\x4e\xe0\xcd\
+\x15\xee\x27\xf5\xb6\x2b\xe9\x44\x19\xfd\x9a\x57\x3d\xd6\x50\xe1\
+\x65\x0c\x2f\x01\x48\xca\xcd\x3d\xc0\x1b\x49\x07\xbc\x36\x59\x04\
+\x7c\x08\x38\x01\x6f\x15\xac\xcb\x42\xd2\xe2\x3e\x3f\x23\x35\x01\
+\x6d\x73\x2c\x70\x46\x95\x7f\x61\x74\x47\xd3\x6f\x48\x4d\x72\x06\
+\x20\x1f\x9f\x20\x7e\x7f\xd7\x35\x6e\x04\xfe\x14\x98\xa8\x6a\x67\
+\x89\xdd\x81\x73\x88\x7f\x6d\xeb\x1a\x97\x93\xc2\xa5\x95\x8a\xde\
+\xa8\x7e\x43\x6a\x92\x0d\x40\x3e\x36\x07\x7e\x43\xfc\x3e\xaf\x73\
+\x7c\x07\x78\x74\x55\x3b\xac\xa3\x16\x93\x72\x23\xf7\x11\xff\x7a\
+\xd6\x35\xd6\x00\x4f\xad\x6a\x87\xcd\xf2\x12\x80\xa4\x5c\xdd\x0e\
+\xbc\x8c\xf6\xdc\x15\xb0\x21\xcf\x00\x2e\x20\x3d\xc9\x6d\x8b\xe0\
+\x5a\x4a\x33\x41\x6a\xd8\x2f\x20\x4d\xfb\x2f\x8c\x2d\xa7\x56\x47\
+\x03\xa7\xd5\xf1\x17\x47\x77\x36\xfd\x86\xd4\x24\x67\x00\xf2\xf3\
+\x0e\xe2\xf7\x7b\x13\xe3\x5a\xe0\xf5\xc0\x46\xd5\xec\xb6\x56\xdb\
+\x17\xf8\x09\xf1\xaf\x59\x13\xe3\x2c\x6a\x7c\x4f\x44\x6f\x5c\xbf\
+\x21\x35\xc9\x06\x20\x3f\x93\xc0\x0f\x89\xdf\xf7\x4d\x8d\xcb\x81\
+\xc3\x68\xf7\x27\xda\x51\xed\x05\x9c\x44\xfc\x6b\xd4\xd4\xb8\x83\
+\x9a\x6f\x1f\x8d\xde\xc0\x7e\x43\x6a\x92\x0d\x40\x9e\x96\x91\x82\
+\x73\xd1\xfb\xbf\xc9\x71\x31\xf0\x3a\xd2\xfa\xf5\x5d\xb7\x3f\xf0\
+\x2d\xe2\x5f\x93\xa6\xc7\xab\x2b\xd8\x77\xf3\x8a\xde\xc0\x7e\x43\
+\x6a\x92\x0d\x40\xbe\x0e\x24\x85\xa1\xa2\x5f\x83\xa6\xc7\xb5\xa4\
+\xcb\x20\x5b\x8f\xbf\x0b\x8b\xb2\x11\x69\xdd\xfe\xb3\x89\x7f\x0d\
+\x22\xc6\xc7\xc6\xdf\x85\xfd\x45\x6f\x64\xbf\x21\x35\xc9\x06\x20\
+\x6f\x7f\x4b\xfc\x6b\x10\x35\xee\x21\xbd\xfe\x07\x03\x0b\xc6\xdd\
+\x91\x19\x7b\x34\xf0\x6e\xd2\xd3\x21\xa3\xf7\x79\xd4\xf8\x29\x69\
+\x41\xac\xda\x45\x6f\x68\xbf\x21\x35\xc9\x06\x20\x6f\x13\xa4\x87\
+\xec\x44\xbf\x0e\xd1\xe3\x12\xe0\x7d\xc0\x6e\xe3\xed\xce\x6c\x6c\
+\x03\xbc\x81\x94\x74\x5f\x4b\xfc\xfe\x8d\x1c\xd7\x01\x0f\x1d\x6f\
+\x77\x0e\x2e\x7a\x63\xfb\x0d\xa9\x49\x36\x00\xf9\xdb\x02\xf8\x35\
+\xf1\xaf\x45\x2e\xe3\x57\xc0\x7b\x81\x27\x51\xd6\xcc\xc0\x23\x48\
+\x2b\x3e\x7e\x17\x58\x4d\xfc\x7e\xcc\x61\xdc\x47\xca\x3b\x34\x26\
+\x7a\x83\xfb\x0d\xa9\x49\x36\x00\x65\xd8\x89\xee\x85\x02\x07\x19\
+\xab\x80\x2f\x03\x7f\x06\xec\x4c\x5e\x2b\x0d\x6e\x03\xbc\x80\xb4\
+\x1c\xf2\x45\xc4\xef\xab\x1c\xc7\x61\x23\xef\xdd\x11\x78\x9b\x89\
+\xa4\x12\x5d\x4c\x3a\x99\x7c\x97\x86\xae\x95\x16\x62\x09\x69\xf1\
+\xa4\x97\xcd\xfc\x7a\x15\x70\x26\x69\x6d\xfc\xf3\x80\x95\xa4\xc7\
+\xc8\x4e\xd7\x5c\xc7\x52\xd2\xe5\x89\xe5\xa4\x25\x7a\x9f\x84\x4f\
+\x43\xec\xe7\x1f\x48\xcb\x5f\x37\xc6\x06\x40\x52\xa9\x7e\x0c\xbc\
+\x06\xf8\x22\x79\x7d\xd2\xcd\xc9\x52\xe0\x79\x33\x63\xd6\x1d\xa4\
+\x26\xe0\x32\xd2\x9a\x03\x97\x01\x37\x90\x66\x54\xae\x07\x6e\x05\
+\x6e\x9e\xf9\xde\xbb\x81\xbb\x48\xe7\x8a\xd9\x75\xe8\x17\x03\x0f\
+\x22\x35\x1b\x4b\x48\x9f\xec\x1f\x46\xba\x55\x73\x47\xd2\xd4\xbe\
+\x0f\x3b\x1a\xce\xf1\xc0\xdf\x34\xfd\x8f\x96\xd0\x00\xd4\xdd\xa9\
+\x4a\x2a\xd7\x97\x49\x27\x9c\xf7\x45\x17\x52\x90\x07\x90\x3e\x9d\
+\xb7\x25\x40\x58\xba\xb3\x48\x8d\x6c\xe3\xe7\x3a\x9f\x05\x20\xa9\
+\x74\x7f\x07\x7c\x34\xba\x08\x69\x04\x17\x00\xcf\x01\xee\x8c\xf8\
+\xc7\x6d\x00\x24\xb5\xc1\x91\xc0\xa7\xa2\x8b\x90\x86\x70\x09\xf0\
+\x4c\xd2\xa5\x97\x10\x36\x00\x92\xda\x60\x1a\x38\x1c\x38\x2e\xba\
+\x10\x69\x00\x57\x93\x9e\x04\xf9\xbb\xc8\x22\x6c\x00\x24\xb5\xc5\
+\x1a\xe0\x55\xc0\x37\xa3\x0b\x91\xe6\x71\x3d\xe9\xe4\x7f\x59\x74\
+\x21\x36\x00\x92\xda\xe4\x3e\xd2\x5a\x0e\x27\x47\x17\x22\x6d\xc0\
+\xb5\xc0\xd3\x48\xeb\x20\x84\xb3\x01\x90\xd4\x36\x77\x93\xd6\x08\
+\xf8\x6a\x74\x21\xd2\x1c\x57\x02\x4f\x05\xce\x8f\x2e\x64\x96\x0d\
+\x80\xa4\x36\xba\x97\xb4\x18\xce\x54\x70\x1d\x12\xa4\xe9\xfe\x3f\
+\x21\x2d\x61\x9d\x0d\x1b\x00\x49\x6d\xb5\x06\x78\x2d\xf0\xe1\xe8\
+\x42\xd4\x69\x17\x02\xfb\x92\x16\x5f\xca\x8a\x0d\x80\xa4\x36\x9b\
+\x06\xde\x0c\xbc\x3f\xba\x10\x75\xd2\x19\xa4\x93\xff\x6f\xa3\x0b\
+\xd9\x10\x1b\x00\x49\x6d\x37\x0d\xbc\x9d\x34\x1b\x70\x5f\x70\x2d\
+\xea\x8e\xaf\x91\xd2\xfe\x61\xf7\xf9\xf7\x63\x03\x20\xa9\x2b\x56\
+\x90\x56\x5d\xbb\x35\xba\x10\xb5\xde\xbf\x02\x2f\x25\x3d\x47\x21\
+\x5b\x36\x00\x92\xba\xe4\x54\x60\x3f\xe0\xaa\xe8\x42\xd4\x4a\xab\
+\x81\xd7\x93\x2e\x3b\xad\x0d\xae\xa5\x2f\x1b\x00\x49\x5d\xb3\x12\
+\xd8\x03\xf8\x5e\x74\x21\x6a\x95\x55\xc0\xb3\x69\xf8\x91\xbe\xe3\
+\xb0\x01\x90\xd4\x45\xab\x80\x03\x49\xcf\x60\x97\xc6\xf5\x33\xe0\
+\xf1\xa4\x19\xa6\x62\xd8\x00\x48\xea\xaa\xd5\xc0\x5f\x03\x2f\x07\
+\x7e\x1f\x5c\x8b\xca\xf5\x79\x52\xd2\xff\x8a\xe8\x42\x86\x65\x03\
+\x20\xa9\xeb\x8e\x03\x9e\x44\xba\x5f\x5b\x1a\xd4\x1d\xc0\x6b\x48\
+\xcf\x9f\xc8\x3a\xec\xd7\x8b\x0d\x80\x24\xc1\x79\xa4\x5c\xc0\xbf\
+\x92\x6e\x1b\x94\xe6\x73\x0e\xb0\x27\x85\xaf\x34\x69\x03\x20\x49\
+\xc9\xdd\xa4\xf4\xf6\x81\xc0\x35\xc1\xb5\x28\x4f\xd3\xa4\x26\x71\
+\x1f\x32\x5b\xd6\x77\x14\x36\x00\x92\xf4\xc7\xbe\x43\x9a\x0d\xf0\
+\x89\x82\x9a\xeb\x0a\xd2\x7a\xfe\x6f\x26\x3d\x6b\xa2\x78\x93\xb4\
+\x64\x43\xa4\x8e\xb8\x27\xba\x80\x8e\xb8\x96\xb4\x68\xd0\x4b\x81\
+\x1b\x82\x6b\x51\xac\x69\xd2\xad\x7d\xcb\x81\xd3\x82\x6b\xa9\xd4\
+\x24\x29\xc8\x20\xa9\x0c\xb7\x47\x17\xd0\x31\x5f\x01\x76\xa2\xa0\
+\x7b\xbb\x55\xa9\x0b\x48\xd3\xfd\xaf\xa7\x85\xff\xf7\x26\xf1\x5a\
+\x97\x54\x12\xff\xbf\x36\xef\x66\xd2\x09\xe0\x20\x0a\xbc\xd5\x4b\
+\x23\xb9\x07\x78\x17\xe9\x52\xd0\x4f\x82\x6b\xa9\xcd\x24\x70\x71\
+\x74\x11\x92\x06\xe6\xff\xd7\x38\xdf\x06\x1e\x4b\x5a\x3b\xa0\x75\
+\x9f\x06\xf5\x07\xdf\x04\x76\x01\xde\x43\xcb\x2f\x91\x4f\x92\x56\
+\x30\x92\x54\x86\xb3\xa3\x0b\xe8\xb8\xbb\x48\xab\x07\x3e\x96\xb4\
+\x00\x8c\xb7\x0c\xb6\xc7\x45\xa4\xa5\x7c\x0f\x06\x2e\x0d\xae\xa5\
+\x11\x93\xb8\x1e\xb6\x54\x8a\xcb\x81\xcb\xa2\x8b\x10\x90\x9e\xef\
+\xfe\x2a\xe0\x29\xc0\x7f\x05\xd7\xa2\xf1\x5c\x07\xbc\x01\xd8\x15\
+\x38\x25\xb8\x96\x46\x4d\x92\x3e\x51\xf8\x64\x2c\x29\x7f\x5f\x8f\
+\x2e\x40\xeb\x39\x13\xd8\x9b\xf4\xdc\x77\x67\x53\xcb\x72\x23\xf0\
+\x7f\x81\xc7\x00\x1f\x07\xd6\xc4\x96\xd3\xbc\x49\xd2\x23\x0b\xbf\
+\x10\x5d\x88\xa4\xbe\x3e\x1f\x5d\x80\x7a\x3a\x15\x78\x02\xf0\x12\
+\x52\x72\x5c\xf9\xba\x05\x78\x27\xb0\x23\xf0\x6e\xe0\xb6\xd0\x6a\
+\x02\x4d\xcc\xfc\xf8\x10\xe0\x12\x60\x93\xc0\x5a\x24\xf5\xf6\x7d\
+\xe0\x69\xd1\x45\x68\x20\x93\xc0\x21\xc0\xdb\x48\xcb\xc5\x2a\x0f\
+\xd7\x01\xc7\x02\x1f\x26\x35\x01\x9a\xe3\xa3\xa4\x40\x8b\xc3\xe1\
+\xc8\x6f\xec\x87\x4a\xb4\x3f\x29\x55\xbe\x96\xf8\xf7\x50\x57\xc7\
+\x45\xc0\x61\xc0\xa6\xf3\xbf\x54\xdd\xb6\x84\xb4\xe2\x55\xf4\x8b\
+\xe5\x70\x38\xfe\x78\x7c\x09\x95\x6e\x17\xe0\x93\xa4\x85\xd7\xa2\
+\xdf\x4f\x5d\x18\x6b\x81\x1f\x00\xcf\xc3\x25\xef\x7b\x9a\x58\xe7\
+\xd7\x87\x92\x1e\x8d\x29\x29\x0f\xd7\x02\xbb\x93\xa6\x2f\x55\xbe\
+\x2d\x80\xff\x01\xfc\x2f\xd2\x22\x33\xaa\xd6\x75\xc0\x67\x81\x4f\
+\xd3\x82\x87\xf5\x44\xf0\x52\x80\xc3\x91\xc7\xb8\x0f\x38\x00\xb5\
+\xd5\x9e\xc0\xc7\x48\x2b\x0d\x46\xbf\xd7\x4a\x1e\xab\x49\x0f\x6e\
+\x7a\x31\xb0\xd1\x50\xaf\x80\xd6\xb3\x80\x74\xbb\x51\xf4\x8b\xea\
+\x70\x74\x79\xac\x05\x5e\x8b\xba\x60\x01\xf0\x74\xe0\x73\xc0\xad\
+\xc4\xbf\xf7\x4a\x18\x6b\x80\xd3\x49\x4f\xe6\xdb\x6e\xf8\x5d\xae\
+\xf9\x2c\x02\x4e\x22\xfe\x45\x76\x38\xba\x38\x56\x93\x16\x26\x51\
+\xf7\x6c\x0a\xbc\x90\x94\xfb\xb8\x91\xf8\xf7\x62\x4e\xe3\x5e\xd2\
+\xdd\x30\x6f\x02\xb6\x1f\x75\x07\xeb\x7e\xeb\x66\x00\xe6\x5a\x08\
+\x1c\x03\xbc\xb1\xa1\x5a\x24\xa5\x4f\x80\xaf\x06\x4e\x8c\x2e\x44\
+\xe1\x16\x00\x7b\x91\x96\xa7\x3d\x90\x94\x19\xe8\x5a\xa0\xed\x2a\
+\xd2\xea\x7c\x27\x93\x56\xad\xed\xec\x3d\xfb\x75\x98\xaf\x01\x98\
+\x75\x08\xe9\xde\xc9\xad\x6b\xae\x45\xea\xba\x33\x49\xcb\xcb\x5e\
+\x12\x5d\x88\xb2\xb4\x0d\x29\x13\xb2\xcf\xcc\xd8\x8d\xd4\x24\xb4\
+\xc9\x55\xa4\xa9\xfd\x33\x81\x1f\x02\xe7\x87\x56\xd3\x72\x83\x34\
+\x00\x00\x5b\x91\x96\x4c\x7c\x1d\x2e\x16\x24\x55\xed\x2a\xd2\x8a\
+\x64\x2b\x48\x53\x9d\xd2\x20\x36\x27\x2d\x43\xbc\x0f\x69\x76\x60\
+\x39\xb0\x2c\xb2\xa0\x21\xdd\x02\xac\x04\x7e\x49\x7a\xe4\xee\xe9\
+\xb8\x2c\x7d\xa3\x06\x6d\x00\x66\x3d\x18\x38\x02\x78\x05\xb0\x43\
+\xf5\xe5\x48\x9d\x31\x0d\x9c\x01\x7c\x06\xf8\x22\x2d\x7f\xec\xa8\
+\x1a\xb3\x05\xa9\x11\x58\x4e\x9a\x21\x78\x24\xa9\x29\x78\x38\xb0\
+\x71\x40\x3d\xd3\xc0\x35\xa4\x87\x58\x5d\x46\x5a\x26\x79\x25\xe9\
+\x93\xfd\x95\x01\xf5\x68\x8e\x61\x1b\x80\x59\x93\xa4\x5b\x58\x0e\
+\x98\xf9\x71\x27\xd2\x72\xc2\x0f\xc0\x19\x02\x69\x5d\xb7\x93\x16\
+\x80\xb9\x94\xb4\x2a\xd9\xe9\xa4\xeb\x99\x7e\xda\x51\x53\x26\x49\
+\x1f\xe0\x76\x9c\x19\x4b\x49\x8b\xbf\x2d\x9d\x33\x96\x90\x02\xe0\
+\x00\x5b\xce\xfc\xb8\xe9\xcc\xd7\x56\x93\xde\xc7\x90\xde\xcb\xf7\
+\xcd\x7c\xed\xc6\x0d\x8c\xeb\x81\xab\x49\x4f\xaf\xbc\x1c\xb8\xbb\
+\xae\x8d\xd2\x78\xfe\x3f\x96\x2e\x62\x30\xde\xfb\xa8\x81\x00\x00\
+\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x10\xc9\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x02\x00\x00\x00\x02\x00\x08\x06\x00\x00\x00\xf4\x78\xd4\xfa\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x01\x57\x97\x00\x01\x57\x97\
+\x01\x2f\x91\xa4\x75\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\
+\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\
+\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x10\x56\x49\x44\
+\x41\x54\x78\x9c\xed\xdc\xbf\xeb\xae\x75\x1d\xc7\xf1\x97\x47\x25\
+\x08\x0c\xec\xd7\x12\x14\x94\x39\x04\x21\x16\x52\x4b\x44\x20\xb5\
+\x38\x09\xae\xfd\x58\x72\x68\x0e\x1b\x73\x08\xfa\x03\x5a\x84\xa6\
+\xa6\x68\xd5\x86\x8c\xa2\x31\x25\xc8\x8c\x32\xc7\x40\x12\x02\x97\
+\x42\x83\xe0\xf4\x6d\xf8\x7a\xe9\xf9\xf1\xfd\x71\xdf\xf7\x75\x7d\
+\xae\xcf\xaf\xc7\x03\xae\xf5\x78\xf9\x1d\xce\xf7\xc9\x7d\xbf\xce\
+\x3b\xe1\x22\x9f\x4f\xf2\x8b\x24\x9f\xac\xfd\x22\x00\xc0\x7e\x1e\
+\x49\x72\x96\xe4\xed\x24\x3f\x4e\xf2\x40\xdd\xd7\x01\x00\xf6\xb0\
+\x04\xc0\xf2\xbc\x91\xe4\xbb\x49\xee\xad\xf9\x52\x00\x40\x59\x77\
+\x06\xc0\xf2\xfc\x21\xc9\x57\x2b\xbe\x17\x00\x50\xd0\x65\x01\xb0\
+\x3c\xcf\x27\x79\xa8\xda\xdb\x01\x00\x45\x5c\x17\x00\x67\x49\xfe\
+\x9b\xe4\xb9\x24\x1f\xad\xf4\x8e\x00\xc0\xc6\x0e\x09\x80\xe5\x79\
+\x2b\xc9\x33\x49\x3e\x50\xe5\x4d\x01\x80\xcd\x1c\x13\x00\xcb\xf3\
+\x7a\x92\xa7\x6a\xbc\x2c\x00\xb0\x8d\x53\x02\x60\x79\x7e\x93\xe4\
+\xd1\xfd\x5f\x19\x00\x58\x6b\x4d\x00\x9c\x25\xb9\x19\x87\x84\x00\
+\xa0\x3b\x6b\x03\x60\x79\x1c\x12\x02\x80\x8e\x6c\x15\x00\x0e\x09\
+\x01\x40\x47\xb6\x0e\x00\x87\x84\x00\xa0\x03\xa5\x02\x60\x79\x1c\
+\x12\x02\x80\x06\x95\x0e\x80\xb3\x38\x24\x04\x00\xcd\xd9\x23\x00\
+\x96\xc7\x21\x21\x00\x68\xc4\x9e\x01\xb0\x3c\x0e\x09\x01\x40\x65\
+\x35\x02\x60\x79\x7e\x1b\x87\x84\x00\xa0\x8a\x9a\x01\x70\x16\x87\
+\x84\x00\xa0\x8a\xda\x01\xb0\x3c\x0e\x09\x01\xc0\x8e\x5a\x09\x80\
+\xe5\x71\x48\x08\x00\x76\xd0\x5a\x00\x2c\x8f\x43\x42\x00\x50\x50\
+\xab\x01\xb0\x3c\x0e\x09\x01\x40\x01\xad\x07\xc0\x59\x1c\x12\x02\
+\x80\xcd\xf5\x10\x00\xcb\xe3\x90\x10\x00\x6c\xa4\xa7\x00\x58\x1e\
+\x87\x84\x00\x60\xa5\x1e\x03\x60\x79\x1c\x12\x02\x80\x13\xf5\x1c\
+\x00\x67\x71\x48\x08\x00\x4e\xd2\x7b\x00\x2c\x8f\x43\x42\x00\x70\
+\x84\x51\x02\x60\x79\x1c\x12\x02\x80\x03\x8c\x16\x00\xcb\xe3\x90\
+\x10\x00\x5c\x61\xd4\x00\x58\x1e\x87\x84\x00\xe0\x02\xa3\x07\xc0\
+\x59\x1c\x12\x02\x80\xbb\xcc\x10\x00\xcb\xe3\x90\x10\x00\xbc\x6b\
+\xa6\x00\x58\x1e\x87\x84\x00\x98\xde\x8c\x01\xb0\x3c\x0e\x09\x01\
+\x30\xad\x99\x03\xe0\x2c\x0e\x09\x01\x30\xa9\xd9\x03\x60\x79\x1c\
+\x12\x02\x60\x2a\x02\xe0\xf6\xc7\x21\x21\x00\xa6\x20\x00\x2e\x7e\
+\x1c\x12\x02\x18\xc4\x8d\xda\x2f\x40\x57\xbe\x98\xe4\x77\x71\x48\
+\x08\xa0\x7b\x02\x80\x53\x3c\x91\xe4\xaf\x71\x48\x08\x80\xc1\xf8\
+\x0a\xe0\xf0\xc7\x21\x21\x00\x86\x21\x00\x8e\x7f\x1c\x12\x02\xe8\
+\x88\xaf\x00\xd8\xca\xc3\x39\xbf\x1d\xe0\x90\x10\x40\x07\x04\x00\
+\x5b\xfb\x5a\xce\xff\xb5\x80\x43\x42\x00\x0d\x13\x00\x94\x70\x23\
+\xe7\x5f\x07\xbc\x16\x87\x84\x00\xe8\x88\x0d\xc0\xb6\x8f\x43\x42\
+\x00\x74\x41\x00\x94\x79\x1c\x12\x02\x68\x84\xaf\x00\xd8\x93\x43\
+\x42\x00\x8d\x10\x00\xd4\x70\xeb\x21\xa1\x8f\x55\x7e\x17\x80\x29\
+\x09\x00\x6a\xb9\x3f\xe7\xbb\x80\xbf\xc5\x21\x21\x00\x1a\x61\x03\
+\xb0\xff\xe3\x90\x10\xc0\x8e\x7c\x02\x40\x2b\x1c\x12\x02\xd8\x91\
+\x00\xa0\x35\x0e\x09\x01\xec\x40\x00\xd0\x22\x87\x84\x00\x0a\x13\
+\x00\xb4\xec\x83\x39\x1f\x08\xbe\x16\x87\x84\x00\x36\x25\x00\xe8\
+\xc1\x27\x72\xfe\x4f\x06\x5f\x8a\x43\x42\x00\x9b\x10\x00\xf4\xc4\
+\x21\x21\x80\x8d\x08\x00\x7a\xe4\x90\x10\xc0\x4a\x02\x80\x5e\x39\
+\x24\x04\xb0\x82\x00\xa0\x77\x1f\xce\xf9\xbf\x14\x78\x35\x0e\x09\
+\x01\x1c\x4c\x00\x30\x0a\x87\x84\x00\x8e\x20\x00\x18\x8d\x43\x42\
+\x00\x07\x10\x00\x8c\xc8\x21\x21\x80\x6b\x08\x00\x46\xe6\x90\x10\
+\xc0\x25\x04\x00\x33\x70\x48\x08\xe0\x0e\x02\x80\x99\x38\x24\x04\
+\xf0\x2e\x01\xc0\x8c\x1c\x12\x02\xa6\x27\x00\x98\x95\x43\x42\xc0\
+\xd4\x04\x00\xb3\x73\x48\x08\x98\x92\x00\x80\x73\x0e\x09\x01\x53\
+\x11\x00\x70\x3b\x87\x84\x80\x29\x08\x00\xb8\x9b\x43\x42\xc0\xf0\
+\x04\x00\x5c\xce\x21\x21\x60\x58\x02\x00\xae\xe7\x90\x10\x30\x1c\
+\x01\x00\x87\x73\x48\x08\x18\x86\x00\x80\xe3\x39\x24\x04\x74\x4f\
+\x00\xc0\x69\x1c\x12\x02\xba\x26\x00\x60\x1d\x87\x84\x80\x2e\x09\
+\x00\xd8\x86\x43\x42\x40\x57\x04\x00\x6c\xcb\x21\x21\xa0\x0b\x02\
+\x00\xb6\xe7\x90\x10\xd0\x3c\x01\x00\xe5\x38\x24\x04\x34\x4b\x00\
+\x40\x79\x0e\x09\x01\xcd\x11\x00\xb0\x1f\x87\x84\x80\x66\x08\x00\
+\xd8\x9f\x43\x42\x40\x75\x02\x00\xea\x70\x48\x08\xa8\x4a\x00\x40\
+\x5d\x0e\x09\x01\x55\x08\x00\x68\x83\x43\x42\xc0\xae\x04\x00\xb4\
+\xc5\x21\x21\x60\x17\x02\x00\xda\xe3\x90\x10\x50\x9c\x00\x80\x76\
+\x39\x24\x04\x14\x23\x00\xa0\x7d\xcb\x21\xa1\x97\xe3\x90\x10\xb0\
+\x11\x01\x00\xfd\xf8\x42\x1c\x12\x02\x36\x22\x00\xa0\x3f\x0e\x09\
+\x01\xab\x09\x00\xe8\x93\x43\x42\xc0\x2a\x02\x00\xfa\xe6\x90\x10\
+\x70\x12\x01\x00\x63\x70\x48\x08\x38\x8a\x00\x80\xb1\x38\x24\x04\
+\x1c\x44\x00\xc0\x78\x1c\x12\x02\xae\x25\x00\x60\x5c\x0e\x09\x01\
+\x97\x12\x00\x30\x3e\x87\x84\x80\xbb\x08\x00\x98\x87\x43\x42\xc0\
+\x7b\x04\x00\xcc\xc7\x21\x21\x40\x00\xc0\xa4\x1c\x12\x82\xc9\x09\
+\x00\x98\x9b\x43\x42\x30\x29\x01\x00\x24\x0e\x09\xc1\x74\x04\x00\
+\x70\x2b\x87\x84\x60\x12\x02\x00\xb8\x93\x43\x42\x30\x01\x01\x00\
+\x5c\xc6\x21\x21\x18\x98\x00\x00\xae\xe3\x90\x10\x0c\x48\x00\x00\
+\x87\x72\x48\x08\x06\x22\x00\x80\x63\x39\x24\x04\x03\x10\x00\xc0\
+\x29\x1c\x12\x82\xce\x09\x00\x60\x0d\x87\x84\xa0\x53\x02\x00\xd8\
+\x82\x43\x42\xd0\x19\x01\x00\x6c\xc9\x21\x21\xe8\x84\x00\x00\xb6\
+\xe6\x90\x10\x74\x40\x00\x00\xa5\x38\x24\x04\x0d\x13\x00\x40\x69\
+\x0e\x09\x41\x83\x04\x00\xb0\x17\x87\x84\xa0\x21\x02\x00\xd8\x9b\
+\x43\x42\xd0\x00\x01\x00\xd4\xe0\x90\x10\x54\x26\x00\x80\x9a\x1c\
+\x12\x82\x4a\x04\x00\xd0\x02\x87\x84\x60\x67\x02\x00\x68\x89\x43\
+\x42\xb0\x13\x01\x00\xb4\xc6\x21\x21\xd8\x81\x00\x00\x5a\xe5\x90\
+\x10\x14\x24\x00\x80\xd6\x39\x24\x04\x05\x08\x00\xa0\x17\x0e\x09\
+\xc1\x86\x04\x00\xd0\x1b\x87\x84\x60\x03\x02\x00\xe8\x91\x43\x42\
+\xb0\x92\x00\x00\x7a\xe6\x90\x10\x9c\x48\x00\x00\x23\x70\x48\x08\
+\x8e\x24\x00\x80\x91\x38\x24\x04\x07\x12\x00\xc0\x68\x1c\x12\x82\
+\x03\x08\x00\x60\x54\x0e\x09\xc1\x15\x04\x00\x30\x3a\x87\x84\xe0\
+\x02\x02\x00\x98\x85\x43\x42\x70\x0b\x01\x00\xcc\xc6\x21\x21\x88\
+\x00\x00\xe6\xe4\x90\x10\xd3\x13\x00\xc0\xcc\x1c\x12\x62\x5a\x02\
+\x00\xc0\x21\x21\x26\x24\x00\x00\xde\xe7\x90\x10\xd3\x10\x00\x00\
+\xb7\x73\x48\x88\x29\x08\x00\x80\x8b\x39\x24\xc4\xd0\x04\x00\xc0\
+\xd5\x1c\x12\x62\x48\x02\x00\xe0\x30\x0e\x09\x31\x14\x01\x00\x70\
+\x1c\x87\x84\x18\x82\x00\x00\x38\x9e\x43\x42\x74\x4f\x00\x00\x9c\
+\xce\x21\x21\xba\x25\x00\x00\xd6\x73\x48\x88\xee\x08\x00\x80\xed\
+\x38\x24\x44\x37\x04\x00\xc0\xb6\x1c\x12\xa2\x0b\x02\x00\xa0\x0c\
+\x87\x84\x68\x9a\x00\x00\x28\xcb\x21\x21\x9a\x24\x00\x00\xf6\xe1\
+\x90\x10\x4d\x11\x00\x00\xfb\x72\x48\x88\x26\x08\x00\x80\xfd\x39\
+\x24\x44\x75\x02\x00\xa0\x1e\x87\x84\xa8\x46\x00\x00\xd4\xe7\x90\
+\x10\xbb\x13\x00\x00\xed\x70\x48\x88\xdd\x08\x00\x80\xb6\x38\x24\
+\xc4\x2e\x04\x00\x40\x9b\x1c\x12\xa2\x28\x01\x00\xd0\x36\x87\x84\
+\x28\x42\x00\x00\xf4\xc1\x21\x21\x36\x25\x00\x00\xfa\xe2\x90\x10\
+\x9b\x10\x00\x00\xfd\x71\x48\x88\xd5\x04\x00\x40\xbf\x96\x43\x42\
+\x7f\x8e\x43\x42\x1c\x49\x00\x00\xf4\xef\xb3\x71\x48\x88\x23\x09\
+\x00\x80\x71\x38\x24\xc4\xc1\x04\x00\xc0\x58\x1c\x12\xe2\x20\x02\
+\x00\x60\x4c\x0e\x09\x71\x25\x01\x00\x30\x36\x87\x84\xb8\x90\x00\
+\x00\x98\x83\x43\x42\xdc\x46\x00\x00\xcc\xc5\x21\x21\x92\x08\x00\
+\x80\x19\x39\x24\x84\x00\x00\x98\x98\x43\x42\x13\x13\x00\x00\x38\
+\x24\x34\x21\x01\x00\xc0\xc2\x21\xa1\x89\x08\x00\x00\x6e\xe5\x90\
+\xd0\x24\x04\x00\x00\x17\x71\x48\x68\x70\x02\x00\x80\xab\x38\x24\
+\x34\x28\x01\x00\xc0\x21\x1c\x12\x1a\x8c\x00\x00\xe0\x18\x0e\x09\
+\x0d\x42\x00\x00\x70\xac\xe5\x90\xd0\xeb\x71\x48\xa8\x5b\x02\x00\
+\x80\x53\x3d\x18\x87\x84\xba\x25\x00\x00\x58\xcb\x21\xa1\x0e\x09\
+\x00\x00\xb6\xe2\x90\x50\x47\x04\x00\x00\x5b\x72\x48\xa8\x13\x02\
+\x00\x80\x12\x1c\x12\x6a\x9c\x00\x00\xa0\x24\x87\x84\x1a\x25\x00\
+\x00\xd8\x83\x43\x42\x8d\x11\x00\x00\xec\xc9\x21\xa1\x46\x08\x00\
+\x00\xf6\xe6\x90\x50\x03\x04\x00\x00\xb5\x38\x24\x54\x91\x00\x00\
+\xa0\x36\x87\x84\x2a\x10\x00\x00\xb4\xc2\x21\xa1\x1d\x09\x00\x00\
+\x5a\xe2\x90\xd0\x4e\x04\x00\x00\x2d\x72\x48\xa8\x30\x01\x00\x40\
+\xcb\x1c\x12\x2a\x44\x00\x00\xd0\x83\xe5\x90\xd0\xaf\x93\x7c\xae\
+\xee\xab\x8c\x41\x00\x00\xd0\x93\xc7\x93\xbc\x12\x87\x84\x56\x13\
+\x00\x00\xf4\xc6\x21\xa1\x0d\x08\x00\x00\x7a\xe5\x90\xd0\x0a\x02\
+\x00\x80\xde\x39\x24\x74\x02\x01\x00\xc0\x28\x1c\x12\x3a\x82\x00\
+\x00\x60\x24\x0e\x09\x1d\xe8\x9e\xda\x2f\xd0\xa8\x8f\x27\xf9\x4e\
+\xed\x97\x00\x60\xb5\x37\x92\xfc\x3c\xc9\xcd\xda\x2f\x02\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x6c\xe5\x9e\xc2\x7f\xfe\xa3\
+\x49\x3e\x52\xf8\xbf\x01\x00\x23\x7a\x2b\xc9\x1f\x4b\xfd\xe1\xa5\
+\x03\xe0\x57\x49\xbe\x5e\xf8\xbf\x01\x00\x23\x7a\x31\xc9\x37\x4a\
+\xfd\xe1\x37\x4a\xfd\xc1\x00\x40\xbb\x04\x00\x00\x4c\x48\x00\x00\
+\xc0\x84\x04\x00\x00\x4c\x48\x00\x00\xc0\x84\x04\x00\x00\x4c\x48\
+\x00\x00\xc0\x84\x04\x00\x00\x4c\x48\x00\x00\xc0\x84\x04\x00\x00\
+\x4c\x48\x00\x00\xc0\x84\x04\x00\x00\x4c\x48\x00\x00\xc0\x84\x04\
+\x00\x00\x4c\x48\x00\x00\xc0\x84\x04\x00\x00\x4c\x48\x00\x00\xc0\
+\x84\x04\x00\x00\x4c\x48\x00\x00\xc0\x84\x04\x00\x00\x4c\x48\x00\
+\x00\xc0\x84\x04\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x2d\xbb\xa7\xf6\x0b\x34\xea\xd3\x49\x9e\xab\xfd\
+\x12\x00\xac\xf6\x42\x92\x9f\x24\xb9\x59\xfb\x45\x5a\x73\x5f\xed\
+\x17\x68\xd4\x03\x49\x1e\xaf\xfd\x12\x00\x9c\xec\xcd\x24\x3f\x48\
+\xf2\xb3\xda\x2f\xd2\x2a\x01\x00\xc0\x48\xfe\x97\xe4\xa7\x49\xbe\
+\x9f\xe4\x5f\x95\xdf\xa5\x69\x02\x00\x80\x51\xbc\x9a\xe4\xe9\x24\
+\xbf\xaf\xfd\x22\x3d\xb8\x51\xfb\x05\x00\x60\xa5\x77\x92\x3c\x9b\
+\xe4\xb1\xf8\xe5\x7f\x30\x9f\x00\x00\xd0\xb3\x5f\x26\xf9\x5e\x92\
+\xbf\xd7\x7e\x91\xde\xf8\x04\x00\x80\x1e\xbd\x99\xe4\x5b\x49\x9e\
+\x88\x5f\xfe\x27\xf1\x09\x00\x00\x3d\x31\xf2\xdb\x88\x00\x00\xa0\
+\x17\x46\x7e\x1b\xf2\x15\x00\x00\xad\x33\xf2\x2b\xc0\x27\x00\x00\
+\xb4\xcc\xc8\xaf\x10\x9f\x00\x00\xd0\x22\x23\xbf\xc2\x7c\x02\x00\
+\x40\x4b\x8c\xfc\x76\x22\x00\x00\x68\x85\x91\xdf\x8e\x7c\x05\x00\
+\x40\x6d\x46\x7e\x15\xf8\x04\x00\x80\x9a\x8c\xfc\x2a\xf1\x09\x00\
+\x00\x35\x18\xf9\x55\xe6\x13\x00\x00\xf6\x64\xe4\xd7\x08\x01\x00\
+\xc0\x5e\x8c\xfc\x1a\xe2\x2b\x00\x00\x4a\x33\xf2\x6b\x90\x4f\x00\
+\x00\x28\xc9\xc8\xaf\x51\x3e\x01\x00\xa0\x04\x23\xbf\xc6\xf9\x04\
+\x00\x80\x2d\x19\xf9\x75\x42\x00\xec\xef\xdf\x49\x7e\x54\xfb\x25\
+\x80\x2e\x3c\x9c\xe4\xdb\xe9\xe7\xd3\xda\x57\x72\x3e\xf2\x7b\xb9\
+\xf6\x8b\xc0\xa9\x1e\x49\x72\x56\xe8\xf9\xc7\x8e\xff\x1f\x40\x9f\
+\xee\x4f\xf2\x4c\x92\xff\xa4\xdc\xdf\x45\x5b\x3e\x6f\x27\xf9\xe1\
+\xbb\xef\x0d\x5d\x13\x00\x40\x2d\x5f\x49\xf2\x97\xd4\xff\xa5\x7e\
+\xe8\xf3\x42\x92\x4f\x15\xf9\x49\x40\x05\x02\x00\xd8\xdb\x83\x49\
+\x9e\xcb\xf9\x77\xe8\xb5\x7f\xa9\x1f\xfa\x77\xd9\x37\x8b\xfc\x24\
+\xa0\x22\x01\x00\xec\xe9\xa9\x24\xff\x4c\xfd\x5f\xea\x87\x3c\x37\
+\x73\x1e\x2a\x1f\x2a\xf2\x93\x80\xca\x04\x00\xb0\x87\x87\x92\xbc\
+\x98\xfa\xbf\xd4\x0f\x7d\x5e\x49\xf2\xe5\x22\x3f\x09\x68\x84\x00\
+\x00\x4a\x32\xf2\x83\x46\x09\x00\xa0\x14\x23\x3f\x68\x98\x00\x00\
+\xb6\x66\xe4\x07\x1d\x10\x00\xc0\x96\x8c\xfc\xa0\x13\x02\x00\xd8\
+\x82\x91\x1f\x74\x46\x00\x00\x6b\x18\xf9\x41\xa7\x04\x00\x70\x2a\
+\x23\x3f\xe8\x98\x00\x00\x8e\x65\xe4\x07\x03\x10\x00\xc0\x31\x8c\
+\xfc\x60\x10\x02\x00\x38\x84\x91\x1f\x0c\x46\x00\x00\x57\x31\xf2\
+\x83\x41\x09\x00\xe0\x32\x46\x7e\x30\x30\x01\x00\xdc\xc9\xc8\x0f\
+\x26\x20\x00\x80\x5b\x19\xf9\xc1\x24\x04\x00\x90\x18\xf9\xc1\x74\
+\x04\x00\xcc\xcd\xc8\x0f\x26\x25\x00\x60\x5e\x46\x7e\x30\x31\x01\
+\x00\xf3\x31\xf2\x03\x04\x00\x4c\xc6\xc8\x0f\x48\x22\x00\x60\x16\
+\x46\x7e\xc0\x6d\x04\x00\x8c\xcd\xc8\x0f\xb8\x90\x00\x80\x71\x19\
+\xf9\x01\x97\x12\x00\x30\x1e\x23\x3f\xe0\x5a\x02\x00\xc6\x62\xe4\
+\x07\x1c\x44\x00\xc0\x18\x3e\x13\x23\x3f\xe0\x08\x02\x00\xfa\x66\
+\xe4\x07\x9c\x44\x00\x40\xbf\x8c\xfc\x80\x93\x09\x00\xe8\x8f\x91\
+\x1f\xb0\x9a\x00\x80\xbe\x18\xf9\x01\x9b\x10\x00\xd0\x07\x23\x3f\
+\x60\x53\x02\x00\xda\x66\xe4\x07\x14\x21\x00\xa0\x5d\x46\x7e\x40\
+\x31\x02\x00\xda\x63\xe4\x07\x14\x27\x00\xa0\x2d\x46\x7e\xc0\x2e\
+\x04\x00\xb4\xc1\xc8\x0f\xd8\x95\x00\x80\xba\x8c\xfc\x80\x2a\x04\
+\x00\xd4\x63\xe4\x07\x54\x23\x00\x60\x7f\x46\x7e\x40\x75\x02\x00\
+\xf6\x65\xe4\x07\x34\x41\x00\xc0\x3e\x8c\xfc\x80\xa6\x08\x00\x28\
+\xcb\xc8\x0f\x68\x92\x00\x80\x72\x8c\xfc\x80\x66\x09\x00\xd8\x9e\
+\x91\x1f\xd0\x3c\x01\x00\xdb\x32\xf2\x03\xba\x20\x00\x60\x1b\x46\
+\x7e\x40\x57\x04\x00\xac\x63\xe4\x07\x74\x49\x00\xc0\xe9\x8c\xfc\
+\x80\x6e\x09\x00\x38\x9e\x91\x1f\xd0\x3d\x01\x00\xc7\x31\xf2\x03\
+\x86\x20\x00\xe0\x30\x46\x7e\xc0\x50\x04\x00\x5c\xcd\xc8\x0f\x18\
+\x92\x00\x80\xcb\x19\xf9\x01\xc3\x12\x00\x70\x37\x23\x3f\x60\x78\
+\x02\x00\x6e\x67\xe4\x07\x4c\x41\x00\xc0\x39\x23\x3f\x60\x2a\x02\
+\x80\xd9\x19\xf9\x01\x53\x12\x00\xcc\xcc\xc8\x0f\x98\x96\x00\x60\
+\x46\x46\x7e\xc0\xf4\x04\x00\xb3\x31\xf2\x03\x88\x00\x60\x1e\x46\
+\x7e\x00\xb7\x10\x00\x8c\xce\xc8\x0f\xe0\x02\x02\x80\x91\x19\xf9\
+\x01\x5c\x42\x00\x30\x22\x23\x3f\x80\x6b\x08\x00\x46\x63\xe4\x07\
+\x70\x00\x01\xc0\x28\x8c\xfc\x00\x8e\x20\x00\xe8\x9d\x91\x1f\xc0\
+\x09\x04\x00\x3d\x33\xf2\x03\x38\x91\x00\xa0\x47\x46\x7e\x00\x2b\
+\x09\x00\x7a\x63\xe4\x07\xb0\x01\x01\x40\x2f\x8c\xfc\x00\x36\x24\
+\x00\x68\x9d\x91\x1f\x40\x01\x02\x80\x96\x19\xf9\x01\x14\x22\x00\
+\x68\x91\x91\x1f\x40\x61\x02\x80\xd6\x18\xf9\x01\xec\x40\x00\xd0\
+\x0a\x23\x3f\x80\x1d\x09\x00\x6a\x33\xf2\x03\xa8\x40\x00\x50\x93\
+\x91\x1f\x40\x25\x02\x80\x1a\x8c\xfc\x00\x2a\x13\x00\xec\xcd\xc8\
+\x0f\xa0\x01\x02\x80\xbd\x18\xf9\x01\x34\x44\x00\x50\x9a\x91\x1f\
+\x40\x83\x04\x00\x25\x19\xf9\x01\x34\x4a\x00\x50\x82\x91\x1f\x40\
+\xe3\x04\x00\x5b\x33\xf2\x03\xe8\x80\x00\x60\x2b\x46\x7e\x00\x1d\
+\x11\x00\xac\x65\xe4\x07\xd0\x21\x01\xc0\x1a\x46\x7e\x00\x9d\x12\
+\x00\x9c\xc2\xc8\x0f\xa0\x73\x02\x80\x63\x19\xf9\x01\x0c\x40\x00\
+\x70\x28\x23\x3f\x80\x81\x08\x00\xae\x63\xe4\x07\x30\x20\x01\xc0\
+\x55\x8c\xfc\x00\x06\x25\x00\xb8\x88\x91\x1f\xc0\xe0\x04\x00\x77\
+\x32\xf2\x03\x98\x80\x00\x60\x61\xe4\x07\x30\x11\x01\x80\x91\x1f\
+\xc0\x84\x04\xc0\xdc\x8c\xfc\x00\x26\x25\x00\xe6\x64\xe4\x07\x30\
+\x39\x01\x30\x1f\x23\x3f\x00\x04\xc0\x44\x8c\xfc\x00\x78\x8f\x00\
+\x18\x9f\x91\x1f\x00\x77\x11\x00\x63\x33\xf2\x03\xe0\x42\x02\x60\
+\x4c\x46\x7e\x00\x5c\x49\x00\x8c\xc7\xc8\x0f\x80\x6b\x09\x80\x71\
+\x18\xf9\x01\x70\x30\x01\xd0\x3f\x23\x3f\x00\x8e\x26\x00\xfa\x66\
+\xe4\x07\xc0\x49\x04\x40\x9f\x8c\xfc\x00\x58\x45\x00\xf4\xc7\xc8\
+\x0f\x80\xd5\x04\x40\x3f\x7a\x1c\xf9\x7d\xa9\xc8\x4f\x02\x80\xd5\
+\x04\x40\xfb\x8c\xfc\x00\xd8\x9c\x00\x68\x9b\x91\x1f\x00\x45\x08\
+\x80\x36\x19\xf9\x01\x50\x94\x00\x68\x8f\x91\x1f\x00\xc5\x09\x80\
+\x76\x18\xf9\x01\xb0\x1b\x01\x50\x9f\x91\x1f\x00\xbb\x13\x00\x75\
+\x19\xf9\x01\x50\x85\x00\xa8\xc3\xc8\x0f\x80\xaa\x04\xc0\xfe\x8c\
+\xfc\x00\xa8\x4e\x00\xec\xc7\xc8\x0f\x80\x66\x08\x80\xf2\x8c\xfc\
+\x00\x68\x8e\x00\x28\xcb\xc8\x0f\x80\x26\x09\x80\x32\x8c\xfc\x00\
+\x68\x9a\x00\xd8\x9e\x91\x1f\x00\xcd\x13\x00\xdb\x31\xf2\x03\xa0\
+\x1b\x02\x60\x3d\x23\x3f\x00\xba\x23\x00\xd6\x31\xf2\x03\xa0\x4b\
+\x02\xe0\x34\x46\x7e\x00\x74\x4d\x00\x1c\xcf\xc8\x0f\x80\xee\x09\
+\x80\xc3\x19\xf9\x01\x30\x0c\x01\x70\x3d\x23\x3f\x00\x86\x23\x00\
+\xae\x66\xe4\x07\xc0\x90\x04\xc0\xc5\x8c\xfc\x00\x18\x9a\x00\xb8\
+\x9b\x91\x1f\x00\xc3\x13\x00\xef\x33\xf2\x03\x60\x1a\x02\xc0\xc8\
+\x0f\x80\x09\xcd\x1e\x00\x46\x7e\x00\x4c\x69\xd6\x00\x30\xf2\x03\
+\x60\x6a\x33\x06\x80\x91\x1f\x00\xd3\x9b\x29\x00\x8c\xfc\x00\xe0\
+\x5d\x33\x04\x80\x91\x1f\x00\xdc\x61\xf4\x00\x30\xf2\x03\x80\x0b\
+\x8c\x1a\x00\x46\x7e\x00\x70\x85\x11\x03\xc0\xc8\x0f\x00\xae\x31\
+\x52\x00\x18\xf9\x01\xc0\x81\x46\x08\x00\x23\x3f\x00\x38\x52\xef\
+\x01\xd0\xdb\xc8\xef\xf9\x18\xf9\x01\xd0\x80\x5e\x03\xc0\xc8\x0f\
+\x00\x56\xe8\x31\x00\x8c\xfc\x00\x60\xa5\x9e\x02\xc0\xc8\x0f\x00\
+\x36\xd2\x43\x00\x18\xf9\x01\xc0\xc6\x5a\x0f\x00\x23\x3f\x00\x28\
+\xa0\xd5\x00\x30\xf2\x03\x80\x82\x5a\x0c\x00\x23\x3f\x00\x28\xac\
+\xa5\x00\x30\xf2\x03\x80\x9d\xb4\x10\x00\x46\x7e\x00\xb0\xb3\xda\
+\x01\x60\xe4\x07\x00\x15\xd4\x0a\x00\x23\x3f\x00\xa8\xa8\x46\x00\
+\x18\xf9\x01\x40\x65\x7b\x06\x80\x91\x1f\x00\x34\x62\x8f\x00\x30\
+\xf2\x03\x80\xc6\x94\x0e\x00\x23\x3f\x00\x68\x50\xc9\x00\xb8\x99\
+\x7e\x46\x7e\x6f\x24\x79\x72\xe5\xcf\x12\x00\xba\x51\x32\x00\x7a\
+\x78\x8c\xfc\x00\x06\x77\x5f\xed\x17\xa0\x39\x7f\x4a\xf2\x74\x92\
+\x97\x6a\xbf\x08\x00\xe5\xdc\xa8\xfd\x02\x34\xe3\x9d\x24\xcf\x26\
+\x79\x2c\x7e\xf9\x03\x30\xa9\xd9\xbe\x02\x30\xf2\x03\x80\xcc\x13\
+\x00\x2e\xf9\x01\xc0\x2d\x46\x0f\x00\x23\x3f\x00\xb8\xc0\xc8\x01\
+\xe0\x92\x1f\x00\x5c\x62\xc4\x00\x70\xc9\x0f\x00\xae\x31\x5a\x00\
+\x18\xf9\x01\xc0\x01\x46\x09\x00\x23\x3f\x00\x38\x42\xef\x01\x60\
+\xe4\x07\x00\x27\xe8\x39\x00\x8c\xfc\x00\xe0\x44\x3d\x06\x80\x91\
+\x1f\x00\xac\xd4\x5b\x00\x18\xf9\x01\xc0\x06\x7a\x09\x00\x23\x3f\
+\x00\xd8\x50\xeb\x01\x60\xe4\x07\x00\x05\xb4\x1c\x00\x46\x7e\x00\
+\x50\x48\x8b\x01\x60\xe4\x07\x00\x85\xb5\x16\x00\x46\x7e\x00\xb0\
+\x83\x56\x02\xc0\xc8\x0f\x00\x76\x54\x3b\x00\x8c\xfc\x00\xa0\x82\
+\x9a\x01\x60\xe4\x07\x00\x95\xd4\x08\x00\x23\x3f\x00\xa8\x6c\xef\
+\x00\x30\xf2\x03\x80\x06\xec\x15\x00\x46\x7e\x00\xd0\x90\xd2\x01\
+\x60\xe4\x07\x00\x0d\x2a\x19\x00\x46\x7e\x00\xd0\xa8\x12\x01\x60\
+\xe4\x07\x00\x8d\xdb\x3a\x00\x8c\xfc\x00\xa0\x03\x5b\x05\x80\x91\
+\x1f\x00\x74\x64\x6d\x00\x18\xf9\x01\x40\x87\xd6\x04\x80\x91\x1f\
+\x00\x74\xea\x94\x00\x30\xf2\x03\x80\xce\x1d\x1b\x00\x46\x7e\x00\
+\x30\x80\x43\x03\xc0\xc8\x0f\x00\x06\x72\x5d\x00\x18\xf9\x01\xc0\
+\x80\xae\x0a\x00\x23\x3f\x00\x18\xd4\x45\x01\x60\xe4\x07\x00\x83\
+\xbb\x33\x00\x8c\xfc\x00\x60\x02\x4b\x00\x18\xf9\x01\x30\xa4\x7b\
+\x6b\xbf\x40\xa3\x3e\x96\xf3\xa1\xdf\x93\x49\x5e\xae\xfc\x2e\x00\
+\xb0\xb9\xff\x03\xf4\x79\x26\x6e\xd7\xda\x0a\xd9\x00\x00\x00\x00\
+\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x4a\x56\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x02\x00\x00\x00\x02\x00\x08\x06\x00\x00\x00\xf4\x78\xd4\xfa\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0e\xc3\x00\x00\x0e\xc3\
+\x01\xc7\x6f\xa8\x64\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\
+\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\
+\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x20\x00\x49\x44\
+\x41\x54\x78\x9c\xec\xdd\x79\x9c\x1c\x75\x9d\xff\xf1\xf7\xa7\xba\
+\x27\x07\x49\x98\x23\x09\x81\x64\xa6\xbb\xfa\x48\x06\x18\x09\x42\
+\x54\x14\x05\xa2\xe0\xe2\x81\xe2\x81\x0a\x88\x78\xdf\xab\xab\xa2\
+\xeb\xae\x7b\x28\xde\xd7\xee\x2a\xeb\xfa\x5b\x6f\x01\x5d\x89\xb8\
+\x8a\x80\x10\x14\x96\xc8\x21\x2a\x06\x10\x1d\x21\x49\xdf\x99\x24\
+\x26\x81\x4c\x4f\x48\x32\xc9\x4c\x77\x7d\x7e\x7f\x24\xd1\x24\x4c\
+\x92\x39\xba\xeb\x53\xd5\xf5\x7e\x3e\x1e\xfc\x01\xca\xf4\x0b\x98\
+\x99\xfe\xf4\xb7\xbe\xf5\x2d\x80\x88\x88\x88\x88\x88\x88\x88\x88\
+\x88\x88\x88\x88\x88\x88\x88\x5a\x81\x58\x07\x10\x35\x5b\x6f\x6f\
+\xef\x9c\xe1\xe1\xe1\xf8\xfe\x3f\x9f\x51\x9b\x11\xdb\x1d\xdf\x5d\
+\xdf\xff\xe7\xe9\x4a\xe5\x89\x55\x40\xcd\x24\x8e\x88\xc8\x08\x07\
+\x00\x0a\xbc\xa5\x0b\x16\xcc\xda\x35\x7d\x7a\x12\x8e\x33\x1f\x9e\
+\x1c\x07\xf1\x8e\xf3\x54\xe6\x89\xe8\x3c\xa8\xcc\x17\x07\x5d\xaa\
+\x98\x25\xc0\x2c\x05\xe6\x08\xd0\xa1\xc0\x2c\x00\xd3\x27\xf1\x72\
+\xc3\x00\x9e\x00\x74\x3b\xe0\x0c\x01\x3a\x04\xc5\x13\x10\xdd\x2e\
+\x2a\x8f\x7b\x0e\x36\x0b\xf0\x67\x55\xdd\xe2\x00\x9b\x62\x9e\xb7\
+\x79\xf6\x71\xc7\x6d\x5d\xbd\x7a\xf5\x68\x83\xff\xb1\x89\x88\x9a\
+\x8a\x03\x00\x99\xeb\xeb\xeb\x9b\xb6\x73\xe7\xce\x74\x1c\xe8\x55\
+\x95\xc5\x80\x97\x54\x91\xa4\xa3\x48\x00\xe8\x51\xa0\xcb\xba\xf1\
+\x28\xea\x50\x6c\x54\xa0\x28\x0e\x4a\x02\x14\x15\x28\x0a\x50\xaa\
+\x01\x6b\x4a\xa5\xd2\x9f\xad\x03\x89\x88\x0e\xc5\x01\x80\x7c\x93\
+\xcd\x66\xa7\x63\x74\xb4\x4f\x45\x4e\x51\x95\xa5\x02\x3d\x19\xc0\
+\x62\x00\x2e\x80\x98\x6d\x5d\x53\x0d\x02\x78\x54\x21\x7f\x12\xe0\
+\x51\xc0\xeb\x97\x5a\xdb\x1f\x72\x1b\x72\x03\xd6\x61\x44\x14\x5d\
+\x1c\x00\xa8\x29\xba\xbb\xbb\x67\x4e\x77\x9c\xd3\xc5\x71\x9e\x01\
+\xc5\xd3\x14\xba\x14\xc0\x89\x80\xc4\x8f\xfa\x37\x47\xc7\x16\x00\
+\xab\x01\x79\x00\xf0\x56\x7b\x8e\xf3\x40\xb1\x58\x2c\x5b\x47\x11\
+\x51\x34\x70\x00\xa0\x86\xe8\x4d\x26\x53\x35\x91\xb3\xe1\xe1\x99\
+\x10\x9c\x01\xe8\x29\x7c\xb3\x9f\x94\xcd\x00\xee\x15\xc1\x3d\x02\
+\xfc\xea\xd8\xb9\x73\x1f\xe0\xfe\x02\x22\x6a\x06\x0e\x00\x34\x29\
+\x99\xee\x4c\x56\x62\xb5\x73\x14\x38\x07\x2a\xcb\x21\xe8\xb1\x6e\
+\x6a\x51\xbb\x00\xfc\x56\x15\xab\x04\xde\xed\x3d\x95\xca\x6f\x56\
+\xf1\x8e\x05\x22\x6a\x00\x0e\x00\x34\x2e\xe9\x74\xba\x1d\xf5\xfa\
+\xb9\x22\x72\x3e\x14\x7f\x83\xbd\xd7\xed\xc9\x7f\x4f\x40\x70\x27\
+\x3c\xb9\xdd\x11\xef\xf6\x75\xe5\xf2\x23\xd6\x41\x44\x14\x4e\x1c\
+\x00\xe8\xb0\xb2\x89\x44\x1f\x44\x2e\x54\x38\x2f\x02\xbc\x33\xb8\
+\xa4\x1f\x48\x05\x08\x6e\x56\xcf\xb9\x69\xe6\x9c\x99\x77\xf5\xf7\
+\xf7\x8f\x58\x07\x11\x51\x38\x70\x00\xa0\x03\xc5\x52\x3d\xa9\x33\
+\x1d\x07\x17\x02\xde\x85\x80\x64\xad\x83\x68\x42\xb6\x43\x70\x9b\
+\xaa\xfe\xd4\x69\x6b\xbb\x29\x97\xcb\x6d\xb7\x0e\x22\xa2\xe0\xe2\
+\x00\x40\x7b\x3f\xe9\x3b\xce\xeb\x54\x71\x39\x80\x13\xac\x7b\xa8\
+\x21\xf6\x08\xf4\x17\xaa\xce\xf5\x32\x2d\x76\x03\x87\x01\x22\x3a\
+\x14\x07\x80\x88\xca\xf6\xf4\x64\x3c\x89\xbd\x56\x04\x97\x02\xe8\
+\xb5\xee\xa1\xa6\xda\x0d\x60\xa5\x42\xbf\xe7\xb4\xb5\xdd\x9c\xcb\
+\xe5\xf6\x58\x07\x11\x91\x3d\x0e\x00\x11\xd2\xdd\xdd\xdd\x35\xdd\
+\x69\xbb\x08\x82\xcb\x01\x3d\x13\xfc\xef\x1f\x45\x55\x40\x6f\x52\
+\x8d\x5d\x53\xa8\x14\xee\x00\xa0\xd6\x41\x44\x64\x83\x6f\x00\x2d\
+\x6e\x39\x10\xaf\x24\x93\x17\x0a\xe4\x4d\x80\xfe\x0d\x37\xf2\xd1\
+\x01\xd6\xaa\xe2\xdb\xd2\x16\xfb\x4e\x3e\x9f\xdf\x62\x1d\x43\x44\
+\xfe\xe2\x00\xd0\xa2\x52\xa9\xd4\x02\xa9\xeb\x1b\x44\xf0\x4e\x00\
+\x49\xeb\x1e\x0a\xb4\x11\x08\x7e\xaa\x9e\xf3\x75\xae\x0a\x10\x45\
+\x07\x07\x80\x16\x93\xea\x49\x9d\xe5\x38\xfa\x2e\x00\xaf\x00\x30\
+\xcd\xba\x87\x42\x67\x2d\x14\xff\x35\x63\x78\xd6\xb7\xfb\xb7\xf6\
+\xef\xb0\x8e\x21\xa2\xe6\xe1\x00\xd0\x02\x5c\xd7\x9d\x11\xf3\xe4\
+\xd5\x22\xfa\x01\x05\x4e\xb5\xee\xa1\x96\xb0\x1d\x82\xef\x22\x16\
+\xfb\x62\x3e\x9f\x5f\x6f\x1d\x43\x44\x8d\xc7\x01\x20\xc4\x7a\x7b\
+\x7a\x16\xd6\x9c\xf8\x07\x00\x7d\x0b\x80\x76\xeb\x1e\x6a\x49\x23\
+\x50\xfc\xc0\x8b\xc9\xbf\x17\x8b\xc5\x87\xad\x63\x88\xa8\x71\x38\
+\x00\x84\x50\x2a\x95\x4a\x3a\xaa\x1f\x80\xe2\xad\x00\x66\x5a\xf7\
+\x50\x54\xc8\xbd\xa2\xf8\x5c\xae\x52\xbc\x19\xdc\x27\x40\x14\x7a\
+\x1c\x00\x42\x64\x71\x32\x79\x92\x27\xf2\x0f\x50\xbd\x94\xbb\xf9\
+\xc9\x8c\xe0\x0f\x00\xfe\xad\xa7\x54\xfa\xfe\x2a\x3e\x98\x88\x28\
+\xb4\x38\x00\x84\x40\x2a\x95\x5a\xea\x78\xde\x07\x01\xb9\x14\x40\
+\xcc\xba\x87\x68\x9f\x12\x54\x3e\x93\xaf\x14\xbf\x05\xa0\x6e\x1d\
+\x43\x44\x13\xc3\x01\x20\xc0\xb2\xc9\xe4\xe9\x0a\xf9\x04\x80\x17\
+\x82\xff\xad\x28\xb8\xfa\x15\xfa\xd1\x42\xb9\xfc\x63\xf0\xd2\x00\
+\x51\x68\xf0\x4d\x25\x80\xf6\x5d\xe3\xff\x08\x14\x6f\x01\xe0\x58\
+\xf7\x10\x8d\x8f\xfe\x51\xd4\xf9\x78\xae\x52\xfc\x11\x38\x08\x10\
+\x05\x1e\x07\x80\x00\x59\xb2\x70\xc9\x3c\x6f\xda\xc8\x07\x55\xf1\
+\x3e\x00\xd3\xad\x7b\x88\x26\x43\x81\xdf\x38\x2a\x9f\xca\x55\x8a\
+\x37\x59\xb7\x10\xd1\xe1\x71\x00\x08\x80\xde\xde\xde\x39\xf5\x3d\
+\x7b\xae\x50\xd5\x2b\x00\x99\x6d\xdd\x43\xd4\x20\x77\x3a\x82\x0f\
+\xac\x2b\x95\x1e\xb2\x0e\x21\xa2\x27\xe3\x00\x60\x68\x39\x10\x5f\
+\x9f\x4c\xbd\x03\xd0\x7f\x01\x70\x9c\x75\x0f\x51\x13\xd4\xa1\xf8\
+\xa6\x4c\x8b\xff\x4b\x2e\x97\xdb\x6a\x1d\x43\x44\x7f\xc5\x01\xc0\
+\xc8\xe2\x54\xea\x6c\x4f\xf5\x2b\x50\x9c\x62\xdd\x42\xe4\x83\xaa\
+\x2a\x3e\xeb\x4c\x8b\x7f\x89\x8f\x23\x26\x0a\x06\x0e\x00\x3e\x4b\
+\x26\x93\x27\xc4\x81\xcf\x01\x72\x19\xf8\xef\x9f\xa2\x67\xad\xaa\
+\x73\x45\xa1\x52\xb8\xd9\x3a\x84\x28\xea\xf8\x06\xe4\x93\xe5\x40\
+\xbc\x92\x70\xdf\x2d\x82\x8f\x03\x38\xd6\xba\x87\xc8\x96\xde\x2e\
+\xaa\xef\xcb\x55\x2a\xfd\xd6\x25\x44\x51\xc5\x01\xc0\x07\x59\xd7\
+\x5d\xae\x8a\xaf\x00\xe8\xb3\x6e\x21\x0a\x90\x11\x11\x7c\x16\xf1\
+\xf8\xa7\x79\x59\x80\xc8\x7f\x1c\x00\x9a\x28\x91\x48\x74\xb6\x39\
+\xce\x97\xa0\xb8\xdc\xba\x85\x28\xc0\x1e\x81\x7a\x6f\xcd\x57\x2a\
+\xf7\x5a\x87\x10\x45\x09\x07\x80\x26\x49\x27\x93\x2f\x16\xc8\xd7\
+\x00\x2c\xb2\x6e\x21\x0a\x01\x85\xe0\x1b\x12\x8f\x7f\x28\x97\xcb\
+\x6d\xb7\x8e\x21\x8a\x02\x0e\x00\x0d\xb6\xef\x53\xff\x67\xa1\x78\
+\x9b\x75\x0b\x51\x08\x6d\x52\xe8\xdf\xee\x3b\x56\x98\x88\x9a\x88\
+\x03\x40\x03\x65\x5c\xf7\x62\x28\xae\x02\x30\xdf\xba\x85\x28\xd4\
+\x14\x2b\xd0\x16\x7b\x6f\x3e\x9f\xdf\x62\x9d\x42\xd4\xaa\x38\x00\
+\x34\x40\x26\x93\x39\x0e\xb5\xfa\xd7\x00\xbc\xcc\xba\x85\xa8\x85\
+\x6c\x15\x4f\xde\x92\x5b\x5f\xbc\xd1\x3a\x84\xa8\x15\x71\x00\x98\
+\xa2\x74\x22\x7d\x9e\x88\x77\x35\x80\x85\xd6\x2d\x44\xad\x49\xaf\
+\x9d\xb1\x6b\xf6\xbb\xfa\xb7\xf6\xef\xb0\x2e\x21\x6a\x25\x1c\x00\
+\x26\x29\x9b\xcd\x4e\x47\xad\x76\xa5\x2a\x3e\x04\x3e\xb1\x8f\xa8\
+\xa9\x14\x28\x42\x9d\xcb\x0b\x95\xc2\x3d\xd6\x2d\x44\xad\x22\x66\
+\x1d\x10\x46\x8b\x93\xc9\x93\xd4\xd3\x5b\x00\x5c\x04\x0e\x51\x44\
+\x4d\x27\x40\xa7\x88\x77\xf9\xdc\xce\xce\x59\xa9\x4c\xe6\x97\x9b\
+\x36\x6d\xf2\xac\x9b\x88\xc2\x8e\x6f\x5e\x13\x94\x76\xdd\x77\x8a\
+\xe2\xdf\x00\xcc\xb4\x6e\x21\x8a\xa8\x5f\xc7\xa1\x97\xae\x29\x97\
+\x8b\xd6\x21\x44\x61\xc6\x01\x60\x9c\xfa\xe6\xf7\xcd\xde\x3d\x73\
+\xe7\x37\x21\x78\x8d\x75\x0b\x11\x61\xbb\xa8\xbc\x39\x57\x29\xfe\
+\xc8\x3a\x84\x28\xac\x78\x09\x60\x1c\x5c\xd7\x3d\xd1\x6b\x1b\xfd\
+\x39\x04\xcf\xb5\x6e\x21\x22\x00\xc0\x74\x08\x5e\xd5\xd5\xd9\xd1\
+\x95\xce\x64\xee\xe0\x25\x01\xa2\x89\xe3\x0a\xc0\x51\xa4\x93\xc9\
+\x4b\x01\xf9\xba\x00\xb3\xac\x5b\x88\x68\x0c\x82\xbb\xe3\xf5\xfa\
+\xc5\x6b\xd6\xaf\xdf\x68\x9d\x42\x14\x26\x1c\x00\x0e\x23\x9b\xcd\
+\x4e\xd7\x5a\xed\xf3\x50\xbc\xd7\xba\x85\x88\x8e\x6a\xab\x38\x72\
+\x59\xae\x58\xfc\xb9\x75\x08\x51\x58\xf0\x12\xc0\x18\x5c\xd7\x3d\
+\x5e\xea\xde\x4a\x00\xaf\xb4\x6e\x21\xa2\x71\x99\x05\xc5\xa5\x5d\
+\xed\x1d\xbb\x07\x87\xaa\x7c\xa8\x10\xd1\x38\x70\x05\xe0\x10\xa9\
+\x54\xea\x54\xc7\xd3\x9f\x02\x48\x5a\xb7\x10\xd1\xa4\x5c\xb7\xa7\
+\x5e\x7b\xd3\xc0\xc0\xc0\xb0\x75\x08\x51\x90\x71\x00\x38\x40\x36\
+\x91\xba\xc8\x13\xfd\x2e\xaf\xf7\x13\x85\xde\x83\x1a\x73\x5e\x56\
+\x28\x14\x2a\xd6\x21\x44\x41\xc5\x13\xec\xf6\x92\x74\xc2\xfd\xb0\
+\x8a\xae\xe0\x9b\x3f\x51\x4b\x38\x4d\xea\xde\x7d\xa9\x54\xea\x19\
+\xd6\x21\x44\x41\x15\xf9\x15\x80\xbe\xbe\xbe\x69\x7b\x76\xec\xfa\
+\xb6\x42\x5f\x6b\xdd\x42\x44\x0d\xb7\x1b\x82\x37\xe6\x4b\xa5\xeb\
+\xac\x43\x88\x82\x26\xd2\x9b\x00\x7b\x7b\x7b\xe7\x8c\xec\x1c\xfe\
+\x09\x04\x2f\xb7\x6e\x21\xa2\xa6\x88\x03\x78\xe5\xdc\xce\x0e\xd9\
+\x56\xad\xae\xb2\x8e\x21\x0a\x92\xc8\x0e\x00\xbd\x3d\x3d\x0b\x47\
+\xeb\xde\xed\x22\x78\x8e\x75\x0b\x11\x35\x95\x00\x58\xde\xd9\xd1\
+\xd9\x73\xea\x50\xf5\x96\x12\xc0\x43\x83\x88\x10\xd1\x4b\x00\x99\
+\x9e\xcc\x53\xe0\xd4\x6e\x05\xa4\xdb\xba\x85\x88\x7c\x24\xb8\x71\
+\x78\x64\xe4\x92\x8d\x1b\x37\xee\xb2\x4e\x21\xb2\x16\xb9\x01\x60\
+\xb1\xeb\x9e\xa1\x8a\x5b\x14\xe8\xb2\x6e\x21\x22\xff\x29\xf0\x9b\
+\x69\xb5\xd1\x17\x3f\xba\x61\xc3\xe3\xd6\x2d\x44\x96\x22\x35\x00\
+\x64\x5d\xf7\x1c\x55\xdc\x08\xe0\x58\xeb\x16\x22\x32\xf5\x48\xac\
+\x5e\x7b\xfe\xda\x81\x81\x0d\xd6\x21\x44\x56\x22\x73\x1b\x60\xb6\
+\x27\xf5\x52\x55\xac\x04\xdf\xfc\x89\x08\x38\xa9\x1e\x8b\xdf\xd5\
+\x9b\x4c\xa6\xac\x43\x88\xac\x44\x62\x05\x20\x9d\x4c\xbe\x42\x20\
+\xd7\x01\x68\xb3\x6e\x21\xa2\x40\xd9\x28\xea\x3d\x3f\x57\xa9\xfc\
+\xc9\x3a\x84\xc8\x6f\x2d\x3f\x00\xa4\x93\xc9\x17\x0b\xe4\x7f\x01\
+\x4c\xb7\x6e\x21\xa2\x40\xda\xaa\x75\xe7\xdc\xc2\x40\xe1\x0f\xd6\
+\x21\x44\x7e\x6a\xe9\x01\x80\x6f\xfe\x44\x34\x4e\x5b\x3d\x47\xce\
+\x2b\x16\x8b\x0f\x5b\x87\x10\xf9\xa5\x65\xf7\x00\x64\x5c\xf7\x65\
+\x02\xf9\x09\xf8\xe6\x4f\x44\x47\x37\xdf\xf1\xf4\xf6\x54\x2a\xb5\
+\xd4\x3a\x84\xc8\x2f\x2d\xb9\x02\x90\x75\xdd\x0b\x55\xf1\x43\x00\
+\xd3\xac\x5b\x88\x28\x54\x36\x6b\xcc\x39\xbb\x50\x28\xac\xb5\x0e\
+\x21\x6a\xb6\x96\x1b\x00\xd2\x89\xc4\xb9\x22\xce\xcf\xc0\x4f\xfe\
+\x51\xf1\x38\xa0\x9b\x00\x59\x2f\xc0\x26\x85\x6e\x84\xca\x13\x80\
+\x54\xe1\xe8\x76\x55\x7d\x02\x1a\xdb\x03\x00\x22\xf5\x5d\x50\xdd\
+\xb3\xff\x6f\x74\x62\xb1\x59\xf5\xba\x4c\x03\x00\x07\x3a\xd3\x13\
+\xef\x58\x88\xcc\x81\x87\x76\x07\xe8\x50\xd1\x79\x2a\xb2\x40\x14\
+\xf3\x01\x9c\x00\xe0\x78\xf0\xfb\xaa\xf5\x29\xd6\x7b\x31\x39\xab\
+\x58\x2c\x96\xad\x53\x88\x9a\xa9\xa5\x06\x80\x74\x4f\xfa\xe9\xe2\
+\x78\x77\x00\x98\x63\xdd\x42\x0d\x33\x02\xe0\x51\x00\xfd\x22\xf8\
+\x83\xa7\x5a\x56\xcf\x59\x1f\x43\x6d\x63\x2d\x16\xdb\x50\x2a\x95\
+\x76\xfb\xd8\x22\xbd\x3d\x3d\x27\xd4\x44\x52\x82\x58\x4a\x05\xae\
+\x40\x4f\x52\xe0\x44\xec\xfd\xe3\x18\x1f\x5b\xa8\xa9\x34\x57\x17\
+\x39\xab\x54\x2a\xfd\xd9\xba\x84\xa8\x59\x5a\x66\x00\x58\x9c\x4c\
+\x9e\xe4\x01\x77\x01\x32\xcf\xba\x85\x26\xad\x04\xe0\x21\x40\xfa\
+\x45\xf1\x30\x50\xef\x6f\x9f\x3f\x7f\xed\xea\xd5\xab\x47\xad\xc3\
+\xc6\x41\x7a\x93\x49\xb7\x2e\xb2\x14\xc0\xe9\xaa\xb2\x0c\xd0\xd3\
+\xb1\x77\xe5\x80\xc2\xe9\xe1\x7d\x97\x03\x86\xac\x43\x88\x9a\xa1\
+\x25\x06\x80\xec\xa2\x6c\xb7\xc6\x6b\xf7\x00\x48\x5a\xb7\xd0\x84\
+\x14\x00\xbd\x17\xea\xdc\x13\x17\xef\x17\x6b\xca\xe5\xa2\x75\x50\
+\xa3\x25\x93\xc9\x13\xda\xd4\x79\x8e\x3a\x7a\x1e\x14\xcf\x01\x70\
+\xb2\x75\x13\x4d\xc8\x2f\xa5\x2d\x7e\x7e\x2e\x97\xdb\x73\xf4\xff\
+\x2b\x51\xb8\x84\x7e\x00\xc8\x66\xb3\xf3\x75\xb4\x76\x0f\x80\x25\
+\xd6\x2d\x74\x54\x0f\x2b\x70\x87\x08\xee\x8a\x8d\x4c\xbb\x67\xed\
+\xc6\xb5\x8f\x59\x07\xf9\x2d\x9d\x4e\x27\xa4\xa6\xcb\x45\x74\xb9\
+\x02\xe7\x00\x48\x5b\x37\xd1\x51\x28\x56\xe4\x2b\xa5\x4b\xc1\xa7\
+\x08\x52\x8b\x09\xf5\x00\xe0\xba\xee\x8c\x98\xe2\x0e\x00\x67\x5a\
+\xb7\xd0\x98\xea\x80\xfc\x5a\x55\x6f\xd2\x98\xdc\x50\x2c\x16\xd7\
+\x58\x07\x05\x8d\xeb\xba\xae\xe3\xe1\x42\x11\xbd\x00\xc0\x72\x40\
+\xe2\xd6\x4d\xf4\x64\x0a\xf9\x6a\xa1\x5c\x7c\xb7\x75\x07\x51\x23\
+\x85\x79\x00\x70\x32\xae\x7b\x1d\x14\xaf\xb2\x0e\xa1\x83\x54\x01\
+\xdc\x0a\xc1\x8d\x75\x60\x65\xa9\x54\xaa\x5a\x07\x85\x45\x32\x99\
+\x3c\x21\x2e\xf2\x52\xf5\xf0\x0a\x11\x3c\x17\x3c\xba\x3a\x50\x54\
+\xf1\xbe\x42\xa5\xf4\x65\xeb\x0e\xa2\x46\x09\xed\x00\x90\x75\xdd\
+\xcf\xaa\xe2\xc3\xd6\x1d\x04\x00\x18\x55\xc1\x4a\xc7\x93\x6b\x30\
+\x2d\x76\x13\xaf\x97\x4e\x9d\xeb\xba\x1d\x71\x4f\x2e\xf0\xa0\xaf\
+\x13\xc1\x79\x68\xe1\x43\xbb\x42\xa4\x0e\xc1\x05\xf9\x52\x69\xa5\
+\x75\x08\x51\x23\x84\x72\x00\xc8\x26\x93\x6f\x56\xc8\x37\xad\x3b\
+\x08\x7f\x52\xc5\x35\x1a\x93\xef\x16\x8b\xc5\xcd\xd6\x31\xad\x6a\
+\x49\x77\xf7\xa2\x9a\x13\xbf\x4c\x04\x6f\x03\xf7\x0c\x58\x7b\x02\
+\x5e\xec\xcc\xfc\xfa\xfc\x1f\xad\x43\x88\xa6\x2a\x74\x03\x40\x2a\
+\x91\x7a\xbe\x23\xfa\x33\x70\x79\xd4\xca\x90\x28\xbe\xe3\x79\xce\
+\xb7\xf9\xf0\x14\xdf\x39\xe9\x44\xfa\x79\x22\xde\x9b\x00\xbc\x1c\
+\xc0\x0c\xeb\xa0\x88\xca\xc7\x46\xa7\x3d\x33\x8a\x9b\x58\xa9\xb5\
+\x84\x6a\x00\xc8\xf6\xf4\x64\xd4\x89\xdd\x0f\xa0\xd3\xba\x25\x82\
+\xd6\x0a\xf4\xaa\xe9\xbb\x66\x5f\xdd\xbf\xb5\x7f\x87\x75\x4c\xd4\
+\x75\x77\x77\x77\x4d\x73\xe2\x6f\x15\xc1\x7b\x00\x2c\xb2\xee\x89\
+\xa0\x5f\xce\x98\x3d\xeb\x6f\xfa\xfb\xfb\x47\xac\x43\x88\x26\x2b\
+\x34\x03\xc0\xd2\x05\x0b\x66\xed\x9c\x39\xf3\x3e\x28\x4e\xb1\x6e\
+\x89\x10\x85\xe2\xe7\x10\xfd\x72\xbe\x5c\x5e\x09\x40\xad\x83\xe8\
+\x60\x7d\x7d\x7d\xd3\xf6\x3c\xb1\xeb\x35\x10\xbd\x42\x81\x53\xad\
+\x7b\xa2\x44\x80\xff\x97\x2b\x97\xde\x65\xdd\x41\x34\x59\x61\x19\
+\x00\x24\xe3\xba\x2b\xb8\xe3\xdf\x2f\x5a\x83\xca\xf7\xea\x0e\x3e\
+\x57\x2a\x95\x1e\xb5\xae\xa1\xf1\x49\x27\xd2\xe7\x89\x78\x57\x00\
+\x38\x1f\xe1\xf9\xd9\x0e\x37\x95\xd7\xe7\x2b\xc5\x6b\xac\x33\x88\
+\x26\x23\x14\xbf\x24\xd2\x09\xf7\xc3\x22\xf8\xac\x75\x47\x04\x8c\
+\x0a\x70\xad\xa3\xde\xa7\xd6\x56\x2a\x05\xeb\x18\x9a\x9c\x54\x2a\
+\xb5\xd4\xf1\xf4\x4a\x00\x17\x22\x24\x3f\xe3\x21\xb6\xcb\x73\xe4\
+\xcc\x62\xb1\xf8\x7b\xeb\x10\xa2\x89\x0a\xfc\x2f\x87\xac\xeb\x9e\
+\xaf\x8a\x9f\x01\x88\x59\xb7\xb4\xb0\x11\x40\xaf\xae\x8b\x7c\xba\
+\x54\x2a\x95\xac\x63\xa8\x31\xd2\x3d\xe9\xa7\x89\xe3\x7d\x1c\xc0\
+\x0b\xad\x5b\x5a\x5c\xbe\x2e\x78\x1a\xcf\xbc\xa0\xb0\x09\xf4\x00\
+\xb0\xa4\xbb\x7b\x51\x3d\x16\x7b\x88\x0f\xf8\x69\x1a\x0f\x8a\x6b\
+\xbd\x98\x7c\x94\x8f\x3e\x6d\x5d\x99\x44\xe2\xd9\x10\xe7\x93\x00\
+\x96\x5b\xb7\xb4\x2a\x15\xdc\x54\x28\x95\x2e\x04\xf7\xc9\x50\x88\
+\x04\xf6\x53\xf5\x72\x20\x5e\xed\xea\xba\x09\x90\x93\xac\x5b\x5a\
+\x93\xde\xee\x88\x5c\x94\x2b\x97\xfe\xbb\x5a\xad\xf2\x69\x67\x2d\
+\x6c\x70\x68\x68\xfd\xe0\x50\xf5\xea\x8e\xf6\xce\x5f\x89\xe0\x54\
+\x00\x0b\xac\x9b\x5a\x8d\x00\xbd\x73\x3b\xda\x47\xb6\x0d\x0d\xdd\
+\x6d\xdd\x42\x34\x5e\x81\x5d\x01\xc8\x24\x53\x9f\x02\xf4\x23\xd6\
+\x1d\xad\x46\x80\x47\xa1\xf2\xaf\xb9\x4a\xf1\x7a\xeb\x16\x32\xe1\
+\x64\x12\xa9\xcb\x20\xfa\x05\x00\xc7\x59\xc7\xb4\x16\xad\x01\x38\
+\x27\x5f\x2e\xff\xca\xba\x84\x68\x3c\x02\x39\x00\xec\x3b\xec\x67\
+\x25\x78\xfc\x69\xc3\x08\xb0\x4d\x05\x1f\xc9\x97\x4a\xdf\x04\x50\
+\xb7\xee\x21\x5b\x89\x44\xa2\xb3\x4d\xe4\x4a\x00\xef\xe4\x03\x88\
+\x1a\x47\x81\x22\x62\xce\x69\x85\x42\x81\xab\x6a\x14\x78\x81\xbb\
+\x04\x90\x4c\x26\x4f\x88\x09\x7e\x0e\x60\xb6\x75\x4b\x8b\x50\x28\
+\xae\x96\x69\xf1\x0b\xf3\x85\xc2\x5d\xe0\x35\x4a\x02\x30\x34\x34\
+\xb4\x7b\x70\x68\xe8\xd6\xb9\xed\xed\xff\x0b\x91\x93\x00\xa4\xac\
+\x9b\x5a\x81\x00\x9d\x8e\x6a\x62\xdb\x50\xf5\xc7\xd6\x2d\x44\x47\
+\x13\xb4\x15\x00\xc9\x24\xdd\x9b\x01\xbc\xc8\x3a\xa4\x45\xac\x55\
+\xf5\xde\x55\xa8\x54\xee\xb0\x0e\xa1\x60\xcb\x26\x52\xaf\x52\xf1\
+\xbe\xca\x0d\xb7\x0d\xc2\xf3\x01\x28\x04\x02\xb5\xc4\x9e\x4d\x26\
+\xdf\x09\xbe\xf9\x37\xc2\x6e\x15\xfc\x63\xc7\xbc\xb9\x4f\xe1\x9b\
+\x3f\x8d\x47\xae\x52\xbc\xde\x73\x9c\xa7\x40\xf0\x43\xeb\x96\x96\
+\x20\xfa\x95\x4c\x77\x26\x6b\x9d\x41\x74\x24\x81\x59\x01\x48\xa7\
+\xd3\x4b\x50\xf7\x1e\x10\x60\x96\x75\x4b\x98\x89\xe2\xb7\x80\xf7\
+\xc6\x5c\xa5\xf2\x27\xeb\x16\x0a\xa7\x6c\x22\xf5\x92\x7d\xab\x01\
+\xdd\xd6\x2d\x61\x26\x8a\xdf\x76\x57\x4a\xcf\x5e\x05\xd4\xac\x5b\
+\x88\xc6\x12\x88\x3d\x00\xcb\x81\xf8\xd0\xb1\xed\x37\x09\xaf\x43\
+\x4e\xc5\xa8\x08\xbe\xd8\x3e\x6f\xee\xeb\xfa\x1f\x7d\x94\x8f\xe6\
+\xa5\x49\xdb\x36\x54\x5d\x3b\x77\xfe\xfc\x6f\x41\xbd\xb9\x00\x96\
+\x59\xf7\x84\x96\x60\xd1\xf6\x8e\xf6\x91\x41\xde\x1a\x48\x01\x15\
+\x88\x15\x80\x4c\x32\xf5\x2f\x80\x7e\xdc\xba\x23\xac\x14\x78\xc8\
+\x51\xef\xb2\x5c\xa5\xd2\x6f\xdd\x42\xad\x25\xed\xba\x97\x88\xe2\
+\xab\x00\x3a\xac\x5b\x42\x6a\x0f\xbc\xd8\xd3\xf2\xeb\xf3\x7f\xb4\
+\x0e\x21\x3a\x94\xf9\x00\x90\xee\x4e\x9f\x22\x31\x6f\x35\x80\x36\
+\xeb\x96\x10\x52\x08\xbe\xb1\xa7\x56\x7b\xdf\xc0\xc0\xc0\xb0\x75\
+\x0c\xb5\xa6\x4c\x26\xd3\x83\x5a\xfd\x6a\x00\xcf\xb5\x6e\x09\xa9\
+\x07\x3b\xe6\xcd\x3d\x63\xf5\xea\xd5\xa3\xd6\x21\x44\x07\xb2\xbe\
+\x04\x10\xeb\xea\x6a\xbf\x11\x40\x8f\x71\x47\x08\xe9\x63\xaa\xb1\
+\x8b\x0b\xe5\xe2\xbf\x6f\xdf\xbe\x9d\xd7\x18\xa9\x69\x06\x07\x07\
+\xb7\x0f\x0e\x55\xaf\x9d\xdb\xd1\x3e\x02\xc8\x72\x04\x6c\xf3\x70\
+\x08\x9c\x30\x3c\x3c\xbc\x6b\xb0\x5a\xbd\xc7\x3a\x84\xe8\x40\xa6\
+\x2b\x00\x99\x64\xf2\x0a\x40\xbe\x68\xd9\x10\x46\xaa\xb8\xab\x4d\
+\xeb\x97\xac\x59\xbf\x7e\xa3\x75\x0b\x45\x4b\x26\x99\x7c\x2e\x20\
+\x3f\x00\x8f\x13\x9e\xa8\xdd\x0e\xf4\xf4\x75\xe5\xf2\x23\xd6\x21\
+\x44\xfb\x99\x4d\xf2\xae\xeb\xba\x00\x3e\x66\xf5\xfa\xa1\x25\xf8\
+\x7a\xe7\xfc\xb9\xe7\xf1\xcd\x9f\x2c\xe4\xcb\xe5\x3b\x11\x8f\x2d\
+\x05\xf4\x76\xeb\x96\x90\x99\x51\x87\x7c\x07\xf6\xab\xae\x44\x7f\
+\x61\xf5\xcd\x28\x73\xdb\x3b\x7f\x04\xe0\x44\xa3\xd7\x0f\xa3\x27\
+\x44\xe5\x75\xf9\x72\xe9\x73\x9b\x36\x6d\xf2\xac\x63\x28\xba\x06\
+\x07\x07\x77\x9e\x3a\x34\xf4\x83\xed\x1d\xed\xc7\x00\x72\xa6\x75\
+\x4f\x58\x08\xd0\x3d\xb7\xa3\x7d\x68\xdb\xd0\xd0\x7d\xd6\x2d\x44\
+\x80\xd1\x25\x80\x6c\x22\xf5\x3a\x15\xe5\x29\x59\xe3\x97\x17\xf5\
+\x5e\xca\x7b\xfb\x29\x68\x32\x89\xd4\xe5\x10\xfd\x1a\x80\x19\xd6\
+\x2d\x21\xf1\x44\xac\x5e\x3b\x69\xed\xc0\xc0\x06\xeb\x10\x22\xdf\
+\x2f\x01\xf4\xf6\xf6\xce\x51\xd1\xcf\xfa\xfd\xba\xe1\x25\xf7\x22\
+\x1e\x3b\x93\x6f\xfe\x14\x44\xf9\x4a\xf1\x1a\x11\x3c\x17\xc0\x26\
+\xeb\x96\x90\x98\x53\x77\xe2\xff\x66\x1d\x41\x04\x18\x0c\x00\xa3\
+\xbb\xf7\x5c\x09\x60\xa1\xdf\xaf\x1b\x46\x02\x7c\x7b\xc6\xec\x63\
+\x9e\x97\xcf\xe7\xb7\x58\xb7\x10\x1d\x4e\xae\x54\xfa\xb5\xd4\xe2\
+\xcf\x10\xe0\xf7\xd6\x2d\xa1\x20\x78\x4d\x3a\x91\x38\xd7\x3a\x83\
+\xc8\xd7\x4b\x00\xd9\x44\xa2\x4f\xc5\x79\x10\xbc\xe7\xff\xa8\x44\
+\xf0\xb9\x5c\xa9\xf4\x0f\xd6\x1d\x44\xe3\xd5\x37\xbf\x6f\xf6\xee\
+\x63\x76\xae\x00\x9f\xe7\x71\x74\x8a\x75\x32\x2d\x7e\x4a\x2e\x97\
+\xdb\x63\x9d\x42\xd1\xe5\xeb\x26\xc0\xce\x8e\xce\x15\x00\x32\x7e\
+\xbe\x66\x08\x29\xa0\x1f\xca\x97\xcb\x9f\xb0\x0e\x21\x9a\x88\xad\
+\xbb\xb6\x8e\x9c\x3a\x54\xfd\xe1\xf6\xce\x8e\xe3\xc1\x23\x84\x8f\
+\x4c\x30\x57\xeb\xde\x8e\xc1\xa1\xea\xbd\xd6\x29\x14\x5d\xbe\xad\
+\x00\x64\x13\xa9\x57\xab\xe8\x0a\xbf\x5e\x2f\xa4\x46\x20\x78\x7d\
+\xbe\x54\xba\xce\x3a\x84\x68\x0a\x24\x93\x4c\x7d\x01\xd0\x2b\xac\
+\x43\x82\x4c\x81\x9d\x12\x8f\x9d\x94\xcf\xe7\xd7\x5b\xb7\x50\x34\
+\xf9\xb2\x02\x90\xcd\x66\xa7\x7b\x9e\x77\x83\x00\x9d\x7e\xbc\x5e\
+\x18\x29\xb0\xd3\x71\xe4\x65\xf9\x52\xe9\xa7\xd6\x2d\x44\x53\x35\
+\x38\x54\xfd\x79\x57\x47\x7b\x0c\x90\x73\xac\x5b\x82\x4a\x80\x69\
+\xe2\x21\xb1\x6d\xa8\xca\x47\x30\x93\x09\x5f\x06\x80\xce\x39\xed\
+\x1f\x10\xe0\xd5\x7e\xbc\x56\x48\xed\x12\xe8\x4b\xf2\xa5\xd2\x1d\
+\xd6\x21\x44\x8d\x32\x38\x34\x74\x67\x57\x7b\xc7\x30\x04\xcf\xb7\
+\x6e\x09\xb0\x93\xbb\x3a\xda\xef\x1a\x1c\x1a\x2a\x59\x87\x50\xf4\
+\x34\x7d\x00\xe8\xee\xee\xee\x6a\x73\x9c\x1f\x02\x98\xd9\xec\xd7\
+\x0a\xa9\x5d\x80\x5e\x90\x2f\x97\xef\xb4\x0e\x21\x6a\xb4\xc1\xa1\
+\xea\xbd\x9d\x9d\x1d\x5b\x64\xef\xc6\x40\xf3\x87\x8f\x05\x91\xa8\
+\x9c\xb4\x6d\xa8\xfa\x2d\xeb\x0e\x8a\x9e\xa6\x0f\x00\xf3\xbb\xba\
+\x3e\x0b\x60\x79\xb3\x5f\x27\x8c\x14\xd8\xe9\x08\x2e\xc8\x97\xcb\
+\xab\xac\x5b\x88\x9a\x65\xb0\x5a\xfd\xdd\xdc\x8e\xf6\xad\x80\xbc\
+\xd8\xba\x25\x90\x04\x8b\x3a\x3b\xda\x1f\x1e\x1c\x1a\xe2\x73\x02\
+\xc8\x57\x4d\x1d\x00\xb2\x3d\x3d\x19\x88\xf3\xdd\x66\xbf\x4e\x48\
+\xed\x81\x7a\x2f\xe1\x27\x7f\x8a\x82\x6d\x43\x43\xf7\x77\x75\x74\
+\xd6\x01\x3c\xcf\xba\x25\x88\x04\x72\x5a\x3a\x9b\xf9\x1a\x8f\xf9\
+\x26\x3f\x35\xf5\x8d\xb9\xa3\xb3\xf3\x2a\x81\x9c\xd6\xcc\xd7\x08\
+\xa9\xba\xa8\xbc\x36\x5f\x29\xdf\x6c\x1d\x42\xe4\x97\xc1\xa1\xea\
+\x5d\x9d\x1d\x9d\xc7\x0a\xf0\x2c\xeb\x96\x00\x9a\x3b\x3c\x3c\xbc\
+\x69\xb0\x5a\xfd\x9d\x75\x08\x45\x47\xd3\xae\xc9\xa5\x52\xa9\x5e\
+\xc7\xd3\x7e\xf0\xd3\xff\xa1\x14\x2a\x6f\xcf\x57\x8a\xdf\xb0\x0e\
+\x21\x32\x20\xd9\xa4\xfb\x2d\x05\xde\x68\x1d\x12\x40\x5b\xe2\x33\
+\xa6\x67\xd7\xac\x59\xf3\x84\x75\x08\x45\x43\xd3\x8e\x02\x16\xcf\
+\xfb\x24\xf8\xe6\xff\x24\x2a\xf8\x08\xdf\xfc\x29\xc2\xb4\x7d\xde\
+\xdc\xb7\x03\xb8\xc5\x3a\x24\x80\x8e\x1b\x1d\xde\xf3\x01\xeb\x08\
+\x8a\x8e\xa6\xac\x00\x64\x93\xc9\xd3\x14\xb2\xba\x59\x5f\x3f\xb4\
+\x04\x5f\xcf\x97\x4a\x6f\xb7\xce\x20\xb2\xd6\x37\xbf\x6f\xf6\xf0\
+\x31\x3b\xef\x16\xe0\xa9\xd6\x2d\x01\xf3\x84\xe7\xc8\xe2\x62\xb1\
+\xb8\xd9\x3a\x84\x5a\x5f\x53\x56\x00\x3c\x91\x2b\xc1\x37\xff\x83\
+\x29\x6e\xeb\x29\x95\xde\x6d\x9d\x41\x14\x04\xfd\x5b\xfb\x77\x48\
+\x3c\xf6\x52\xf0\x29\x82\x87\x9a\xe3\x78\x1e\x4f\x50\x24\x5f\x34\
+\xfc\x4d\x3a\x95\x4a\x9d\xea\x78\xfa\x60\x33\xbe\x76\x68\x09\xfe\
+\x20\xf1\xf8\x73\x72\xb9\xdc\x76\xeb\x14\xa2\x20\x49\xf7\xa4\x9f\
+\x2e\x8e\xf7\x4b\xf0\x9c\x90\x03\xe8\x8e\xb6\x5a\xcd\x7d\x74\xc3\
+\x86\xc7\xad\x4b\xa8\xb5\x35\x7c\x05\xc0\xa9\xeb\x3f\x82\x6f\xfe\
+\x07\xd0\xc7\xea\xc0\x4b\xf9\xe6\x4f\xf4\x64\x85\xf5\x85\xfb\x45\
+\x85\x97\xc5\x0e\x22\xb3\x6b\x6d\x6d\xef\xb5\xae\xa0\xd6\xd7\xd0\
+\x37\xea\x4c\x77\x26\x8b\x58\xfd\x51\x70\xf3\xdf\x7e\x75\x11\xbc\
+\x38\x57\x2a\xdd\x66\x1d\x42\x14\x64\x99\x64\xf2\x2a\x40\xde\x63\
+\xdd\x11\x20\x43\x1a\x73\x92\x85\x42\x61\xc8\x3a\x84\x5a\x57\x63\
+\x57\x00\x9c\xfa\x3f\x81\x6f\xfe\x7f\x21\xd0\xbf\xe7\x9b\x3f\xd1\
+\xd1\x75\xcc\x9b\x77\x85\x2a\xee\xb2\xee\x08\x90\x76\x78\xde\x3b\
+\xad\x23\xa8\xb5\x35\x6c\x05\x20\x9d\x4e\x27\xa4\xee\xe5\x00\xb4\
+\x35\xea\x6b\x86\x9a\x62\x45\xbe\x52\xba\xd8\x3a\x83\x28\x2c\x92\
+\xc9\xe4\x09\x71\xc8\x83\x00\x16\x58\xb7\x04\xc4\x96\xe1\xd1\x91\
+\xd4\xc6\x8d\x1b\x77\x59\x87\x50\x6b\x6a\xd8\x0a\x80\xd4\xf5\xbd\
+\xe0\x9b\xff\x5e\x8a\xf5\xa3\xe0\xf4\x4e\x34\x11\xe5\x72\x79\x93\
+\x38\x72\x39\x00\x1e\x87\xbb\xd7\x71\x33\xe3\xd3\xde\x62\x1d\x41\
+\xad\xab\x21\xcb\xf5\xbd\xbd\xbd\x73\xbc\x5a\xed\x5a\x00\x33\x1a\
+\xf1\xf5\xc2\x4d\x6b\x10\x5c\x50\xaa\x54\xd6\x59\x97\x10\x85\xcd\
+\xb6\x6a\x35\xdf\xd5\xd1\x3e\x1b\x90\x67\x5b\xb7\x04\x82\xe8\x29\
+\x73\xe7\xcf\xff\xea\xb6\x6d\xdb\xea\xd6\x29\xd4\x7a\x1a\xb2\x02\
+\x50\x1b\xde\xf3\x46\x00\x1d\x8d\xf8\x5a\x61\xa7\x2a\x9f\xc8\x97\
+\xcb\xbf\xb2\xee\x20\x0a\xab\x8e\x79\xf3\xfe\x49\x14\xbf\xb5\xee\
+\x08\x06\xe9\xc6\xe8\xe8\x65\xd6\x15\xd4\x9a\x1a\x31\x00\xc4\x20\
+\xe0\x2d\x2b\x00\x00\xbd\xa7\x50\x29\x7d\xca\xba\x82\x28\xcc\x56\
+\xaf\x5e\x3d\xea\xc0\xbb\x04\x00\xcf\xc4\x07\xc0\xbb\x23\xa8\x59\
+\xa6\x3c\x00\x64\x5c\xf7\x25\x00\x32\x0d\x68\x09\xbb\xaa\xe7\x38\
+\x97\x01\xe0\x52\x1d\xd1\x14\xad\xad\x54\x0a\x50\xf9\xa0\x75\x47\
+\x10\x28\x70\x6a\xaa\x27\x75\x96\x75\x07\xb5\x9e\xa9\xaf\x00\xa8\
+\xf2\x78\x5b\x00\x2a\x78\x57\xb1\x58\x2c\x5b\x77\x10\xb5\x8a\x7d\
+\x0f\xcd\xba\xd5\xba\x23\x08\x1c\xe1\xef\x59\x6a\xbc\x29\x0d\x00\
+\xe9\xee\xf4\x62\x40\xce\x6d\x54\x4c\x68\x09\xae\x29\x94\x4a\x3f\
+\xb0\xce\x20\x6a\x31\x2a\xb5\xf8\xdb\x00\x54\xad\x43\xcc\x09\x5e\
+\x91\x4c\x26\x4f\xb0\xce\xa0\xd6\x32\xb5\x15\x80\x98\xf7\x4e\xf0\
+\xd8\xdf\xc7\x63\x23\xd3\xf8\xf0\x0e\xa2\x26\xc8\x6d\xc8\x0d\x40\
+\xf0\x7e\xeb\x8e\x00\x68\x6b\x13\x1e\x99\x4c\x8d\x35\xe9\x37\xef\
+\xee\xee\xee\x99\x33\x62\xf1\x01\x05\xba\x1a\x19\x14\x3a\x82\x37\
+\xe4\x4b\xa5\xab\xad\x33\x88\x5a\x59\x26\xe1\xae\x84\xe0\x7c\xeb\
+\x0e\x63\x9b\x3a\xe6\xcd\x4d\xae\x5e\xbd\x7a\xd4\x3a\x84\x5a\xc3\
+\xa4\x57\x00\xa6\xc7\xe3\xaf\x8e\xfc\x9b\x3f\xb0\x2a\x5f\x2a\x5d\
+\x63\x1d\x41\xd4\xea\x44\xeb\xef\x06\x30\x6c\xdd\x61\xec\x84\xea\
+\xe3\x8f\xbf\xc2\x3a\x82\x5a\xc7\xa4\x07\x00\xf5\xf0\xa6\x46\x86\
+\x84\xd0\x88\x03\x7d\x17\x00\xb5\x0e\x21\x6a\x75\xb9\xf5\xeb\xf3\
+\x80\x7c\xc6\xba\x23\x00\xb8\x19\x90\x1a\x66\x52\x03\x40\xb6\xa7\
+\x27\x23\x82\x88\xdf\x96\xa2\x9f\x5f\x57\x2e\x3f\x62\x5d\x41\x14\
+\x15\xd2\x16\xfb\x3c\x80\x35\xd6\x1d\xa6\x14\x67\xa5\x52\xa9\xa5\
+\xd6\x19\xd4\x1a\x26\x35\x00\xa8\xe3\xbc\x01\x91\xde\xfc\xa7\xb9\
+\xba\x08\x0f\xfc\x21\xf2\x51\x2e\x97\xdb\x23\x82\xb7\x23\xe2\xab\
+\x6e\x8e\x6a\xd4\x57\x5f\xa9\x41\x26\x33\x00\x38\x80\x5c\xde\xf0\
+\x92\x10\x11\x91\xbf\x2d\x95\x4a\xbb\xad\x3b\x88\xa2\x26\x57\x2a\
+\xfd\x12\xc0\x0a\xeb\x0e\x53\x8a\x4b\xfb\xfa\xfa\xa6\x59\x67\x50\
+\xf8\x4d\x78\x00\xc8\x24\x93\xcb\x01\x24\x1a\x9f\x12\x12\x8a\xdb\
+\x72\xa5\xd2\x6d\xd6\x19\x44\x51\x55\x17\xfc\x23\x80\x28\x0f\xe0\
+\xf3\x77\xef\xdc\xf9\x22\xeb\x08\x0a\xbf\x89\xaf\x00\x88\xbc\xa6\
+\x09\x1d\x61\xe1\x89\xe8\x47\xac\x23\x88\xa2\xac\x54\x2a\x95\x20\
+\xb8\xca\xba\xc3\x94\xe2\xf5\xd6\x09\x14\x7e\x13\x1a\x00\x96\x03\
+\x71\x28\x5e\xde\xa4\x96\xc0\x13\xe0\xba\x5c\xb9\xfc\x80\x75\x07\
+\x51\xd4\xa9\xe3\x7c\x1a\xd0\xc7\xac\x3b\x0c\xbd\x38\x9b\xcd\xce\
+\xb7\x8e\xa0\x70\x9b\xd0\x00\x50\x4e\xa4\x9e\x0b\x20\xaa\xdf\x74\
+\x23\xf0\xea\xff\x6a\x1d\x41\x44\x40\xa1\x50\x18\x12\xe0\x63\xd6\
+\x1d\x86\xda\xbc\x5a\xed\x22\xeb\x08\x0a\xb7\x09\x0d\x00\x8e\x78\
+\xaf\x6a\x56\x48\xf0\xe9\xd7\xf6\xde\x8b\x4c\x44\x41\xd0\x3e\x6f\
+\xde\xd7\x11\xe1\xdb\x02\x45\x11\xe5\xcb\xb1\xd4\x00\xe3\x1e\x00\
+\x96\x03\x71\x40\x5e\xd6\xc4\x96\x00\xd3\x1d\x9e\xe3\xf0\xb6\x3f\
+\xa2\x00\x59\xbd\x7a\xf5\xa8\x0a\xae\xb4\xee\x30\x74\xd6\x92\xee\
+\xee\x45\xd6\x11\x14\x5e\xe3\x1e\x00\xa2\xbc\xfc\x2f\x22\xff\x56\
+\x2c\x16\x37\x5b\x77\x10\xd1\xc1\x0a\xa5\xd2\x0f\x05\x78\xd4\xba\
+\xc3\x88\x53\x8b\xc7\x23\xbc\x2a\x4b\x53\x35\xee\x01\xc0\x11\xef\
+\xd5\xcd\x0c\x09\x2e\xdd\x31\xe2\x79\x5f\xb6\xae\x20\xa2\x31\xd5\
+\x3d\xe8\x27\xad\x23\xac\x88\x22\xa2\xbf\x97\xa9\x11\xc6\x35\x00\
+\x2c\xdf\xbb\xfc\x7f\x61\x93\x5b\x02\x49\xe1\x7c\xbd\x52\xa9\x0c\
+\x5a\x77\x10\xd1\xd8\x0a\xe5\xf2\x75\x88\xee\x5e\x80\x67\x66\x17\
+\x65\xbb\xad\x23\x28\x9c\xc6\x35\x00\x0c\xb8\xee\xb9\x88\xe6\xf2\
+\xff\x28\x62\xc2\x4f\xff\x44\xc1\x56\x17\x8d\xec\xd1\xdc\xe2\xb5\
+\xd5\x2e\xb0\x8e\xa0\x70\x1a\xd7\x00\xe0\xa9\xbc\xb4\xd9\x21\xc1\
+\xa4\xd7\x15\x0a\x85\x8a\x75\x05\x11\x1d\x59\xae\x52\xfc\x1f\x28\
+\xd6\x59\x77\x58\x10\x45\x24\x57\x67\x69\xea\xc6\x35\x00\x08\xf4\
+\xfc\x66\x87\x04\x90\x3a\x22\xff\x6e\x1d\x41\x44\xe3\x52\x57\x07\
+\xff\x61\x1d\x61\xe4\xb9\xd9\x6c\xf6\x58\xeb\x08\x0a\x9f\xa3\x0e\
+\x00\xe9\x74\x7a\x09\x80\x8c\x0f\x2d\x41\xb3\x72\x5d\xa9\xf4\x90\
+\x75\x04\x11\x8d\xcf\xec\xe1\xe1\x6b\x00\x44\x71\xbf\xce\x74\x8c\
+\xd4\x5f\x60\x1d\x41\xe1\x73\xd4\x01\x40\x6a\x5e\x44\xbf\xb1\xf4\
+\x0b\xd6\x05\x44\x34\x7e\x0f\x6f\xde\xbc\x13\xd0\x6f\x5a\x77\x58\
+\x50\x28\x1f\x0e\x44\x13\x76\xf4\x4b\x00\x82\x28\x0e\x00\x6b\xf2\
+\xe5\xf2\x2a\xeb\x08\x22\x9a\x18\x8d\xc5\xbe\x02\x68\xcd\xba\xc3\
+\x77\x82\xf3\x01\x88\x75\x06\x85\xcb\x11\x07\x00\xd7\x75\x67\x00\
+\x38\xc7\xa7\x96\xc0\x10\xe8\xd7\x01\xa8\x75\x07\x11\x4d\x4c\xa1\
+\x50\xa8\x28\x70\x83\x75\x87\x81\xe3\x53\xa9\xd4\x52\xeb\x08\x0a\
+\x97\x23\x0e\x00\x31\x60\x39\x80\x63\xfc\x49\x09\x8c\x11\xb4\xb5\
+\x5d\x6b\x1d\x41\x44\x93\xa4\xb1\x48\xde\xba\x2b\x75\x8d\xe2\x6a\
+\x2d\x4d\xc1\x11\x07\x00\xf1\x10\xbd\xdd\xff\x8a\x9f\xe4\x72\xb9\
+\xad\xd6\x19\x44\x34\x39\x85\x4a\xe1\x1e\x05\x22\xb7\x81\x57\x24\
+\x82\xbf\xaf\x69\x4a\x8e\xbc\x07\x20\x82\xd7\xff\x15\xde\x37\xac\
+\x1b\x88\x68\x8a\x04\x57\x5b\x27\x18\x78\xf6\xc2\x85\x0b\xa3\xb6\
+\x62\x4b\x53\x70\xd8\x01\x20\xbb\x28\xdb\xad\xc0\x89\x7e\xc6\x04\
+\x40\xbe\x50\xa9\xfc\x9f\x75\x04\x11\x4d\x8d\xc4\x62\xff\x03\x60\
+\xd4\xba\xc3\x67\xd3\x66\xb6\xb5\x9d\x61\x1d\x41\xe1\x71\xd8\x01\
+\x40\xdb\x6a\xcf\xf6\x33\x24\x18\xf4\x3b\xe0\xe6\x3f\xa2\xd0\xcb\
+\xe7\xf3\x5b\x20\xb8\xd5\xba\xc3\x6f\x22\x12\xb9\x4d\xdb\x34\x79\
+\x87\xbf\x04\xa0\xfa\x1c\x1f\x3b\x82\xa1\x1e\x5f\x61\x9d\x40\x44\
+\x8d\xa1\xaa\xd7\x58\x37\xf8\x4d\x35\x7a\x77\x6d\xd1\xe4\x1d\x7e\
+\x05\x00\x12\xb1\x01\x40\x56\xe7\x07\xf2\x39\xeb\x0a\x22\x6a\x8c\
+\x99\xb3\x67\xdf\x04\xe8\x63\xd6\x1d\x3e\x7b\xe6\xbe\xdb\xb7\x89\
+\x8e\x6a\xcc\x01\xa0\xb7\xb7\x77\x8e\x00\xa7\xf8\x1d\x63\x49\x55\
+\xaf\xb7\x6e\x20\xa2\xc6\xe9\xef\xef\x1f\x51\x38\x51\x5b\xd5\x9b\
+\x21\x75\x79\xba\x75\x04\x85\xc3\x98\x03\xc0\xc8\xf0\xc8\x33\x01\
+\xc4\x7c\x6e\x31\x15\x87\xc7\x01\x80\xa8\xc5\x08\xbc\xff\xb1\x6e\
+\xf0\x9b\xe3\x80\x1b\x01\x69\x5c\xc6\x1c\x00\x62\x4e\xc4\xae\xff\
+\x0b\xee\x5f\x5b\xa9\x14\xac\x33\x88\xa8\xb1\xf2\xe5\xf2\xaf\x01\
+\xfc\xd9\xba\xc3\x4f\x0a\x8f\x03\x00\x8d\xcb\x98\x03\x80\xaa\x44\
+\xeb\x0e\x00\x15\x7e\xfa\x27\x6a\x4d\x1e\xa0\x37\x5b\x47\xf8\x49\
+\x54\x38\x00\xd0\xb8\x3c\x69\x00\x58\x0e\xc4\x01\x7d\x86\x41\x8b\
+\x19\x8d\xc9\x4f\xad\x1b\x88\xa8\x39\x44\x9d\x1b\xad\x1b\x7c\x25\
+\xe8\xe9\xed\xe9\x59\x68\x9d\x41\xc1\xf7\xa4\x01\xa0\xd2\x9d\x3e\
+\x09\xc0\x1c\x83\x16\x13\x0a\x14\x0b\x85\xc2\x5a\xeb\x0e\x22\x6a\
+\x8e\xdd\xde\xe8\xed\x0a\xec\xb4\xee\xf0\x53\x2d\x16\x8b\xd4\x87\
+\x38\x9a\x9c\x27\x0d\x00\x8e\xa3\x4f\xb5\x08\xb1\x23\xb7\x58\x17\
+\x10\x51\xf3\x0c\x0c\x0c\x0c\x0b\xf0\x0b\xeb\x0e\x5f\xa9\x2e\xb3\
+\x4e\xa0\xe0\x7b\xd2\x00\xe0\x09\xa2\x35\x00\xa8\xac\xb4\x4e\x20\
+\xa2\xe6\x52\x41\xa4\x2e\x03\xa8\xc8\xa9\xd6\x0d\x14\x7c\x4f\x1a\
+\x00\x04\x88\xd2\x37\xce\x9e\xd9\x7b\x76\xde\x69\x1d\x41\x44\xcd\
+\xe5\xc4\xe3\x37\x03\xf0\xac\x3b\xfc\x22\x8a\xa5\xd6\x0d\x14\x7c\
+\x63\xdc\x05\xe0\x45\x68\x00\xd0\xbb\x1f\xde\xbc\x39\x52\xd7\x06\
+\x89\xa2\x28\x97\xcb\x6d\x85\xa0\xdf\xba\xc3\x47\x89\x44\x22\xd1\
+\x69\x1d\x41\xc1\x76\xd0\x00\x90\xc9\x64\x7a\x00\x99\x67\x15\xe3\
+\x3f\xe7\xe7\xd6\x05\x44\xe4\x0f\x55\xb9\xcb\xba\xc1\x47\x32\x3d\
+\x16\x8b\xd4\x69\xae\x34\x71\x07\x0d\x00\x32\xea\x45\xea\xfa\xbf\
+\x88\xde\x6d\xdd\x40\x44\xfe\x88\xda\xcf\xbb\xe7\xf1\x32\x00\x1d\
+\xd9\x41\x03\x80\x07\x3d\xdd\x2a\xc4\xc0\xf0\xf4\x59\xb3\x1e\xb0\
+\x8e\x20\x22\x7f\xd4\x54\xa3\xb4\x02\x00\x05\x4e\xb4\x6e\xa0\x60\
+\x3b\x78\x05\xc0\xc1\xc9\x56\x21\x06\x7e\xdb\xdf\xdf\x3f\x62\x1d\
+\x41\x44\xfe\x28\x97\xcb\x9b\x00\x8d\xcc\x13\x3f\x05\x5e\xaf\x75\
+\x03\x05\xdb\x41\x03\x80\x2a\x96\x58\x85\xf8\x4f\xee\xb1\x2e\x20\
+\x22\x7f\x09\x24\x42\x97\x01\x24\x42\xbf\xcf\x69\x32\x0e\x1c\x00\
+\x44\xa0\x59\xb3\x12\xdf\x79\xf7\x5a\x17\x10\x91\xbf\x3c\x41\x84\
+\x06\x00\xf4\x2c\x5d\xb0\x60\x96\x75\x04\x05\xd7\x5f\x06\x80\x25\
+\xdd\xdd\x0b\x01\x99\x6d\x19\xe3\x23\xad\x8b\xdc\x67\x1d\x41\x44\
+\x3e\x73\x9c\x28\x0d\xfe\x32\x3c\x73\xe6\x62\xeb\x08\x0a\xae\xbf\
+\x0c\x00\x5e\x3c\x1e\xa5\x6f\x94\x62\xa9\x54\xaa\x5a\x47\x10\x91\
+\xbf\x0a\x85\x42\x2e\x4a\xcf\x05\x50\x8f\x97\x01\xe8\xf0\xfe\x32\
+\x00\x28\x10\x99\x0d\x23\x0a\xe5\xee\x7f\xa2\x68\xf2\x44\xf0\x27\
+\xeb\x08\xbf\xa8\x20\x69\xdd\x40\xc1\xf5\xd7\x3d\x00\x2a\x91\x59\
+\x01\x10\xe0\x21\xeb\x06\x22\xb2\x21\x8a\x3f\x5a\x37\xf8\xc7\xeb\
+\xb1\x2e\xa0\xe0\xfa\xeb\x00\x20\x1a\x99\x01\x40\x35\xf6\x7b\xeb\
+\x06\x22\x32\x22\xf8\x83\x75\x82\x6f\x54\x12\xd6\x09\x14\x5c\x7f\
+\x19\x00\x44\xa3\xb3\x54\x14\xf7\x46\x1e\xb4\x6e\x20\x22\x1b\x75\
+\x4f\xa2\xb3\x02\x20\xe0\x00\x40\x87\x75\xc0\x1e\x00\x5d\x64\x19\
+\xe2\xa3\xc1\xb5\x03\x03\x1b\xac\x23\x88\xc8\x86\x3a\x1a\x9d\x15\
+\x00\x70\x00\xa0\xc3\x73\x00\xa0\xbb\xbb\x7b\x26\x20\x73\xad\x63\
+\xfc\x20\x8a\x75\xd6\x0d\x44\x64\xa7\x54\x2a\xfd\x19\xd0\xc7\xac\
+\x3b\x7c\x32\x77\xe1\xc2\x85\xc7\x58\x47\x50\x30\xc5\x01\x60\x1a\
+\xa6\x75\x03\x9e\x58\xc7\xf8\xc1\x13\x5d\x6b\xdd\x30\x55\x7d\xf3\
+\xfb\x66\xef\x39\x66\xc7\x12\x0f\x70\x45\x64\x0e\x3c\x99\x6e\xdd\
+\x44\x91\xa0\x02\x54\x55\xbc\xc7\xe2\x9e\xb7\x66\xcd\xfa\xf5\x1b\
+\xad\x83\x26\x4f\xfe\x08\x60\xb9\x75\x85\x1f\xe6\xb4\xb5\x2d\x00\
+\x50\xb4\xee\xa0\xe0\x89\x03\x80\xc4\xea\x3d\x40\x24\xde\xff\x01\
+\x95\x50\xae\x00\xa4\x52\xa9\x5e\xc7\xf3\x2e\x03\xf0\x82\xdd\xd8\
+\x79\x1a\x20\x31\x01\x00\x05\x20\x6a\x1b\x47\x91\xb1\xf7\x3b\x4d\
+\x50\x73\x62\xc8\x24\x93\x03\x50\xb9\x1d\x0e\x56\xe4\x4b\xa5\x5f\
+\x00\xa8\xdb\xd6\x8d\x9f\x00\x05\x8d\xc8\x00\x30\xe2\x38\xf3\xc1\
+\x01\x80\xc6\x10\x07\x00\x88\xf4\x20\x22\xef\x21\xe2\x20\x54\x2b\
+\x00\xa9\x9e\xd4\x59\xb1\x98\xfe\x8b\x7a\xfa\xfc\xc8\x0c\x69\x14\
+\x12\xd2\x0d\xc1\x1b\xa0\x78\x43\x26\xe9\x96\x05\xfa\xf9\xe9\xb3\
+\x67\x7f\x33\x0c\x0f\xd9\xf2\x14\x65\x89\xc8\x8f\x93\x78\xde\x7c\
+\xeb\x06\x0a\x26\x07\x00\x14\x38\xc1\x3a\xc4\x2f\x5a\x77\xf2\xd6\
+\x0d\xe3\x91\xc9\x64\x8e\xcb\x26\xdd\xef\x3b\x8e\xde\xa5\x8a\xe7\
+\x5b\xf7\x10\x1d\x45\x52\x21\xff\xb5\x7b\xc7\xce\x87\x52\x3d\xa9\
+\xb3\xac\x63\x8e\x46\x1c\x94\xad\x1b\x7c\x23\x72\x9c\x75\x02\x05\
+\xd3\xde\xbb\x00\x54\x22\x33\x21\x6a\x5c\x2b\xd6\x0d\x47\xb3\x38\
+\x95\x3a\x1b\xb5\xfa\x83\x0a\x5c\x6a\xdd\x42\x34\x41\x27\x39\x8e\
+\xde\x99\x4e\xb8\xff\x8a\x00\x2f\x59\x09\xa2\x33\x00\x88\x87\xc8\
+\xfc\x7e\xa7\x89\x71\x00\x40\x54\x23\x71\x07\x00\x80\x91\x62\xb1\
+\xb8\xd5\x3a\xe2\x48\xb2\x89\xd4\x45\x9e\xa7\x3f\x07\xb0\xd0\xba\
+\x85\x68\x92\x62\x22\xb8\x32\x93\x4c\x5e\xbd\x6c\xd9\xb2\x36\xeb\
+\x98\xb1\x78\x8e\x13\xe2\x0d\x8c\x13\x24\xca\x01\x80\xc6\xb4\x77\
+\x05\x40\x64\x9e\x71\x87\x2f\x14\xd8\x00\xc0\xb3\xee\x38\x9c\x6c\
+\x22\xf5\x12\x15\xef\x07\x00\xb8\xab\x9f\x5a\x80\xbc\xae\xfa\xd8\
+\xe3\x57\xe3\xe0\xc7\x8e\x07\xc5\x66\xeb\x00\x1f\xb5\x5b\x07\x50\
+\x30\xed\xfb\xc1\x8c\xc8\x0a\x80\x62\xbd\x75\xc2\xe1\x2c\x76\xdd\
+\xa7\xaa\xe8\x0a\x40\xe2\xd6\x2d\x44\x0d\x74\x49\x26\x99\xbc\xd2\
+\x3a\xe2\x50\x85\x42\x61\x08\xc0\x6e\xeb\x0e\x7f\xc8\x1c\xeb\x02\
+\x0a\xa6\x7d\x7b\x00\x10\x89\x01\x40\x1c\xfc\xd9\xba\x61\x2c\x4b\
+\x17\x2c\x98\xe5\x29\x56\x00\x98\x69\xdd\x42\xd4\x78\xf2\x91\x74\
+\x22\x71\xae\x75\xc5\x18\xb6\x58\x07\xf8\x83\x03\x00\x8d\x6d\xdf\
+\x25\x00\xed\x34\xee\xf0\x87\x87\x6d\xd6\x09\x63\xd9\x35\x73\xe6\
+\xbf\x00\xe0\x73\xbb\xa9\x55\x39\x22\xce\xd7\x5c\xd7\x9d\x61\x1d\
+\x72\x88\x48\x9c\x06\xa8\xaa\x1c\x00\x68\x4c\xfb\x2e\x01\xc8\x6c\
+\xdb\x0c\x9f\x88\x06\x6e\x03\x60\x26\x93\xe9\x51\xc5\xfb\xad\x3b\
+\x88\x9a\x2c\x13\x53\x79\x8f\x75\xc4\x21\x9e\xb0\x0e\xf0\x83\x08\
+\x38\x00\xd0\x98\x1c\x00\x31\x00\x41\x9b\xcc\x9b\x42\x55\x1e\xb7\
+\x6e\x78\x92\x7a\xfd\x0a\x00\xd3\xac\x33\x88\x9a\x4f\xaf\x08\xd2\
+\x2a\x80\x40\x23\x31\x00\x00\x5c\x01\xa0\xb1\x39\xd9\x6c\x76\x96\
+\x75\x84\x6f\x1c\x6c\xb7\x4e\x38\x50\x5f\x5f\xdf\x34\x28\x2e\xb3\
+\xee\x20\xf2\xc9\x82\xb8\x27\x2f\xb5\x8e\xf8\x2b\x09\xd4\xef\x83\
+\xe6\x11\xee\x2d\xa2\x31\x39\xa3\xa3\xa3\xd1\x19\x00\x02\xb6\xeb\
+\x77\xcf\xce\x9d\x2f\x04\xa2\xb1\x01\x93\x08\x00\x54\xf4\x12\xeb\
+\x86\xfd\x54\xa3\x71\x09\x00\x40\x20\xcf\x62\x20\x7b\x4e\x9b\xe7\
+\x45\xe6\x51\x91\xa2\x1a\xa8\x01\x40\x55\xcf\xb3\x6e\x20\xf2\xd9\
+\x73\x97\xef\x7f\x06\x89\x35\x07\x7b\xac\x13\xfc\x20\x41\xf9\xf7\
+\x4d\x81\xe3\xd4\x62\xb1\x28\x4d\x87\x81\x1a\x00\x20\x72\x86\x75\
+\x02\x91\xcf\xda\xcb\xa9\xd4\xc9\xd6\x11\x00\x00\x95\x51\xeb\x04\
+\x3f\x28\x07\x00\x3a\x0c\x27\x56\x8f\x45\xe9\x9b\x23\x58\x03\x80\
+\xf2\xd6\x3f\x8a\x9e\x58\x1d\xbd\xd6\x0d\x00\x20\xa2\x35\xeb\x06\
+\x9f\x44\xe9\x43\x1e\x4d\x80\xe3\xc4\xea\x91\x19\x00\x24\x40\x03\
+\xc0\xc2\x85\x0b\x8f\x01\x8f\xe8\xa4\x08\x52\x68\x20\x9e\x3e\xaa\
+\x2a\x51\x19\x00\x22\xf3\x3b\x9e\x26\xc6\x51\xd5\x20\x9e\xd3\xdd\
+\x14\x9e\x17\x0b\xcc\x92\xdf\xcc\x99\x33\xa3\x71\xf6\x02\xd1\xa1\
+\x24\x18\xb7\xa5\x89\x68\xdd\xba\xc1\x27\x1c\x00\x68\x4c\x4e\xdd\
+\x71\xa2\xf2\x43\x80\x58\xcc\x8b\x59\x37\xec\xb7\x67\xcf\x9e\xa8\
+\x7c\xfa\x20\x3a\x58\x40\xae\xbd\x6b\x44\xce\x3f\x01\x30\x62\x1d\
+\x40\xc1\x1d\xd9\x49\x35\x00\x00\x20\x00\x49\x44\x41\x54\xe4\xc4\
+\xea\xf5\xc8\xbc\x11\xd5\x3d\x27\x30\xd7\xc2\x16\x2c\x58\xf0\x04\
+\x00\xb5\xee\x20\xf2\x9d\x83\x21\xeb\x04\x00\x80\x6a\x54\xee\x8f\
+\xe7\x00\x40\x63\x72\xea\xb1\x58\x64\x06\x00\xc7\xf1\x02\xb3\x14\
+\xb6\x7a\xf5\xea\x51\x28\x06\xac\x3b\x88\xfc\xe6\x79\x52\xb0\x6e\
+\xd8\x87\x03\x00\x45\x9a\xd3\x56\xaf\x07\x62\x39\xce\x0f\x75\x4f\
+\x02\xb3\x02\x00\x00\x10\xf4\x5b\x27\x10\xf9\xad\xcd\x1b\xfd\x93\
+\x75\x03\xc0\x4b\x00\x44\x4e\x2d\x1e\x8f\xcc\x0a\x40\x4c\x83\x35\
+\xf1\x8b\xe0\x2e\xeb\x06\x22\x5f\x29\xd6\xad\x1d\x18\xd8\x60\x9d\
+\xb1\x0f\x07\x00\x8a\x34\xa7\x6d\x74\x34\x32\x03\x00\x04\xc7\x5a\
+\x27\x1c\xa8\x2e\xf2\x33\xeb\x06\x22\x5f\x39\xb8\xc5\x3a\x61\x3f\
+\x81\x44\xe5\x14\xd4\x48\x9c\x78\x48\x13\xe7\x0c\x8b\x0c\x5b\x47\
+\xf8\x46\xbc\x40\x0d\x00\xc5\x62\xf1\x61\x01\x7e\x6f\xdd\x41\xe4\
+\x17\xad\x3b\xdf\xb3\x6e\x38\x40\x54\x56\x00\x22\x73\x99\x97\x26\
+\xc6\x49\x57\x2a\x51\x79\x20\x06\x3c\x91\x40\x0d\x00\x00\xe0\x09\
+\xbe\x6c\xdd\x40\xe4\x93\xfb\x0a\xeb\x0b\xbf\xb3\x8e\x38\x40\xa0\
+\x2e\x09\x36\x11\x57\x00\x68\x4c\xce\x2a\xa0\x06\x20\x12\xab\x00\
+\x8e\x17\xbc\x93\xf7\x3a\xe7\xce\xfd\x1e\xa0\x39\xeb\x0e\xa2\xe6\
+\xd3\x7f\xb6\x2e\x38\x44\xe0\x7e\x1f\x34\x49\x60\x4e\x40\xa5\x60\
+\xd9\x7f\x0a\xe0\x0e\xd3\x0a\x9f\x78\x22\xf3\xad\x1b\x0e\xb5\x7a\
+\xf5\xea\x51\x88\xbc\xc7\xba\x83\xa8\x99\x14\xfa\xa3\x7c\xb9\xfc\
+\x7f\xd6\x1d\x87\x58\x64\x1d\xe0\x07\x81\x6e\xb3\x6e\xa0\x60\xda\
+\x3f\x00\x6c\x37\xad\xf0\x89\x03\x6f\x81\x75\xc3\x58\xf2\xa5\xd2\
+\x4a\x08\xbe\x6e\xdd\x41\xd4\x24\x9b\xbd\x80\x0d\xb9\x51\x7a\x16\
+\x87\x8a\x70\x00\xa0\x31\x39\x00\xa0\x40\x24\xf6\x01\x28\x70\xbc\
+\x75\xc3\xe1\xd4\x81\xbf\x53\xe0\x37\xd6\x1d\x44\x0d\xb6\x5b\xd5\
+\xb9\xa8\x54\x2a\xfd\xd9\x3a\xe4\x40\x33\x9d\x99\x0b\xad\x1b\xfc\
+\xa2\x8a\xc7\xad\x1b\x28\x98\x1c\x00\x10\x04\xe4\x68\xce\x66\x53\
+\x09\xe4\x0a\x00\x00\x94\x4a\xa5\xdd\xf1\xd1\x69\x17\x00\x3c\x1c\
+\x88\x5a\xc6\xa8\x42\x5f\x5b\xa8\x14\xee\xb1\x0e\x39\x94\x27\x5e\
+\x20\x9e\x48\xe8\x0b\x45\xd5\x3a\x81\x82\x69\xdf\x00\x20\x8f\x59\
+\x87\xf8\x42\x70\x3c\x80\xc0\x3c\x10\xe8\x50\x6b\x37\xae\x7d\x6c\
+\x4f\xbd\x76\x36\x80\x5f\x59\xb7\x10\x4d\x8d\xee\x00\xf4\xc2\x42\
+\xb9\xfc\x63\xeb\x92\xb1\x38\x31\x8d\xcc\x0a\x80\x23\xca\x15\x00\
+\x1a\x93\x03\x00\x1e\xb0\xd9\x3a\xc4\x27\x6d\xe9\x74\x3a\xd0\x1b\
+\x7f\x06\x06\x06\xb6\x49\x5b\xfc\x79\x10\x5c\x05\x3e\x2c\x88\xc2\
+\x48\xf0\x87\xba\xc8\xd3\xf3\xe5\xf2\xad\xd6\x29\x87\x23\xaa\x81\
+\xfe\x3d\xd0\x48\x1e\xf7\x00\xd0\x61\x38\x00\xe0\x88\x6e\xb5\x0e\
+\xf1\x8b\xe3\x79\x29\xeb\x86\xa3\xc9\xe5\x72\x7b\xf2\xa5\xd2\xdf\
+\x79\x9e\x9c\xc3\x83\x82\x28\x44\x9e\x10\xc1\x47\x66\xcc\x9a\xf5\
+\xb4\x52\xa9\xf4\xa8\x75\xcc\x91\x28\x10\x99\x4b\x00\x8e\x08\x57\
+\x00\x68\x4c\x7b\x9f\x8e\xa7\xba\x05\x10\xe3\x14\x7f\x28\x90\x02\
+\xf0\x4b\xeb\x8e\xf1\x28\xae\x2f\xde\x0d\xe0\xb4\x8c\xeb\x5e\x08\
+\xc5\x7b\x01\x9c\x83\xbf\xde\xb9\x41\x14\x14\x15\x55\x7c\x7b\xc4\
+\xab\xfd\xe7\xc0\xc0\x40\x48\x3e\x6d\x4a\xb7\x75\x81\x5f\xbc\x9a\
+\x0c\x5a\x37\x50\x30\xed\x1b\x00\x9c\x2d\x90\x88\xac\x36\xab\xa6\
+\xad\x13\x26\x48\xf3\xa5\xd2\x0d\x00\x6e\xc8\x2e\xca\x76\x7b\xf1\
+\xd1\xbf\x11\x95\xb3\xe1\xe0\x64\x28\x5c\x00\x73\x10\x9d\x23\x4d\
+\xc9\x96\x02\xa8\x02\xd8\xaa\x82\x35\xa2\x72\xbf\xc0\xbb\x3d\x57\
+\x2e\xff\x06\x80\x67\xdc\x36\x51\x27\x5b\x07\xf8\x45\xa6\x49\xa0\
+\xee\xc0\xa0\xe0\x88\x03\x80\xc4\xb0\x45\xc3\xf6\xe3\x3b\x59\x22\
+\x27\x5a\x27\x4c\x56\x6e\x43\x6e\x00\xc0\xb7\xf7\xfd\x41\x44\x93\
+\xb0\x1c\x88\xaf\x07\x7a\xad\x3b\xfc\xa1\xb5\x7c\x3e\xbf\xd1\xba\
+\x82\x82\x69\xef\x5d\x00\xf5\xfa\x80\x75\x88\x6f\x54\x4f\xb2\x4e\
+\x20\x22\x3b\xe5\x54\x2a\x03\x60\xba\x75\x87\x3f\x64\x03\x80\xba\
+\x75\x05\x05\x93\x03\x00\x6d\x73\xe6\x0c\x20\x7c\x4b\x78\x93\x24\
+\x4b\x96\xef\xbf\xf4\x41\x44\x91\x23\x9e\xd7\x67\xdd\xe0\x17\x55\
+\x94\xad\x1b\x28\xb8\x1c\x00\xe8\xef\xef\x1f\x01\xb0\xc9\xb8\xc5\
+\x2f\xd3\xf6\x7d\x02\x20\xa2\x08\x12\x38\x91\xb9\xfe\xef\x88\xac\
+\xb7\x6e\xa0\xe0\x3a\x70\x47\x79\xc5\xac\xc2\x67\x8e\xea\x53\xad\
+\x1b\x88\xc8\x8a\x46\x67\x05\x00\x5c\x01\xa0\xc3\x3b\x70\x00\x88\
+\xce\x37\x8a\xea\x32\xeb\x04\x22\x32\x22\x88\xce\x00\x20\xca\x15\
+\x00\x3a\xac\xbf\x0c\x00\xa2\x28\x19\x76\xf8\xcc\x39\xdd\xba\x80\
+\x88\xfc\x97\xcd\x66\xa7\x43\xb1\xc4\xba\xc3\x37\xaa\x91\x59\xd9\
+\xa5\x89\xfb\xeb\x0a\x80\x48\xde\xb0\xc3\x67\x7a\x3a\xa2\x72\xf2\
+\x11\x11\xfd\x85\x8e\x8c\x3c\x0d\x91\xb9\x03\x00\x70\x54\x4b\xd6\
+\x0d\x14\x5c\x7f\x5d\x01\x70\xb0\xd6\x32\xc4\x67\x9d\xd9\x44\x82\
+\xb7\x03\x12\x45\x8e\xf3\x6c\xeb\x02\x1f\x8d\x4e\x9f\x33\x27\x67\
+\x1d\x41\xc1\xf5\x97\x01\xc0\x73\x9c\x40\x9f\xdd\xdd\x70\x22\xcb\
+\xad\x13\x88\xc8\x67\x0e\xa2\x34\x00\xac\xdb\x77\x87\x17\xd1\x98\
+\xfe\x32\x00\xe4\xf3\xf9\x2d\x02\x84\xe4\x1c\xef\xa9\x53\x91\x73\
+\xac\x1b\x88\xc8\x57\x02\xc5\xb3\xac\x23\xfc\x22\x90\x47\xac\x1b\
+\x28\xd8\x0e\x7a\xb0\x8c\x22\x42\x97\x01\x14\xcb\xc1\x7d\x00\x44\
+\x91\x91\x4a\xa5\x96\x00\x98\x6f\xdd\xe1\x17\x85\xf7\x27\xeb\x06\
+\x0a\xb6\x83\x9f\x2c\xa7\x58\x63\xd4\x61\xe1\xb8\x6c\x22\x11\x99\
+\x03\x41\x88\xa2\x4e\x3c\x2f\x4a\xcb\xff\x50\xe1\x0a\x00\x1d\xd9\
+\xc1\x03\x80\xc8\x1f\x8d\x3a\x6c\x70\x1f\x00\x51\x84\x38\x67\x5a\
+\x17\xf8\x49\x45\xb8\x02\x40\x47\x74\xf0\x25\x00\x95\x87\xac\x42\
+\x2c\x70\x1f\x00\x51\x74\x08\xf4\x3c\xeb\x06\x1f\xd5\x47\x47\x47\
+\xa3\x73\x49\x97\x26\xe5\xa0\x01\x20\x5e\x8b\x47\x6a\x00\xe0\x3e\
+\x00\xa2\x68\x48\xa5\x52\x4b\x01\x24\xad\x3b\x7c\x94\x1f\x18\x18\
+\x18\xb6\x8e\xa0\x60\x3b\x68\x00\x58\xbb\x71\xed\x63\x80\x46\xe7\
+\xd1\xc0\xc0\xfc\x74\x4f\xfa\x69\xd6\x11\x44\xd4\x5c\x31\xcf\xbb\
+\xc0\xba\xc1\x4f\x02\xb9\xdf\xba\x81\x82\xcf\x39\xf4\x2f\xa8\xc8\
+\x83\x16\x21\x66\xc4\x7b\xb9\x75\x02\x11\x35\x97\x42\x5e\x6c\xdd\
+\xe0\x27\x4f\x95\x03\x00\x1d\xd5\x93\x06\x00\x51\x8d\xd4\x65\x00\
+\x47\xc0\x01\x80\xa8\x85\x2d\x59\xb8\x64\x1e\x80\x33\xac\x3b\xfc\
+\x24\xc2\x01\x80\x8e\x6e\x8c\x01\xc0\x89\xd4\x37\x8e\x02\x27\x2e\
+\x4e\x26\x79\x2c\x30\x51\x8b\xf2\xe2\xa3\x2f\x04\x10\xb3\xee\xf0\
+\xd1\xe8\x9e\x7a\x3d\x5a\x2b\xb9\x34\x29\x4f\x1a\x00\x9c\x5a\xdb\
+\x7d\x00\xd4\xa0\xc5\x8c\x07\xbc\xc2\xba\x81\x88\x9a\x43\xa1\x91\
+\x5a\xfe\x07\xf0\x07\x6e\x00\xa4\xf1\x78\xd2\x00\xb0\x6f\x23\x60\
+\x84\x9e\x0c\x08\x00\x0e\x2f\x03\x10\xb5\x20\xd7\x75\x67\x40\xf0\
+\x02\xeb\x0e\x5f\x29\x7e\x6b\x9d\x40\xe1\xf0\xa4\x01\x00\x00\x14\
+\xf8\xb5\xdf\x21\xb6\x74\x59\x6f\x32\x99\xb2\xae\x20\xa2\xc6\x8a\
+\x01\x17\x02\x68\xb7\xee\xf0\x93\xf2\xfa\x3f\x8d\xd3\x98\x03\x80\
+\x03\xdc\xe7\x77\x88\xb5\xba\xc8\xcb\xac\x1b\x88\xa8\xe1\x2e\xb5\
+\x0e\xf0\x9b\xa3\x1a\xb1\x0f\x70\x34\x59\x63\x0e\x00\x88\xe0\x00\
+\xa0\x8a\x37\x58\x37\x10\x51\xe3\x9c\xb8\x68\xd1\x5c\x68\xc4\x96\
+\xff\x81\xcd\xb9\x4a\x85\xcf\x00\xa0\x71\x19\x73\x00\xc8\x95\xcb\
+\x0f\x03\x18\xf4\xb9\xc5\xda\xd2\x4c\x22\xb1\xcc\x3a\x82\x88\x1a\
+\x63\xa4\xad\xed\xd5\x00\xa6\x59\x77\xf8\x4a\xb1\x0a\x11\xdb\xc4\
+\x4d\x93\x77\xb8\x15\x80\x3a\x14\x77\xf9\x5a\x12\x00\x22\xce\x9b\
+\xad\x1b\x88\xa8\x31\x44\xe5\xb5\xd6\x0d\xbe\x73\x70\xa7\x75\x02\
+\x85\xc7\xe1\x06\x00\x00\xf8\x3f\xdf\x2a\x02\x42\x81\x4b\xbb\xbb\
+\xbb\x67\x5a\x77\x10\xd1\xd4\xec\xdd\xd4\xab\x91\x7a\xfa\x1f\x00\
+\x78\x22\xab\xac\x1b\x28\x3c\x0e\x3b\x00\xa8\xe7\x44\x71\x92\x6c\
+\x9f\xe1\xb4\xbd\xd2\x3a\x82\x88\xa6\xa6\xae\xf2\x36\x44\xef\x41\
+\x5f\x1b\x8b\xc5\xe2\x1a\xeb\x08\x0a\x8f\xc3\x0e\x00\x85\x81\xc2\
+\x1f\x01\x6c\xf1\xb1\x25\x10\x54\x94\x97\x01\x88\x42\x2c\x9b\xcd\
+\x4e\x57\xc1\x9b\xac\x3b\xfc\xa6\xd0\xc8\xad\xda\xd2\xd4\x1c\xe9\
+\x12\x80\x22\x82\x97\x01\x00\x9c\x93\xe9\xce\x64\xad\x23\x88\x68\
+\x92\x46\xea\xaf\x02\x70\x9c\x75\x86\xdf\x1c\x60\x95\x75\x03\x85\
+\xcb\x91\x06\x00\x40\xb0\xd2\xa7\x8e\x20\x11\xc4\x6a\xef\xb5\x8e\
+\x20\xa2\xc9\xf1\x44\xff\xd6\xba\xc1\x80\xa2\xd6\x76\x9b\x75\x04\
+\x85\xcb\x11\x07\x00\x89\xc7\x6f\x01\xe0\xf9\xd4\x12\x20\xf2\xe6\
+\x13\x17\x2d\x9a\x6b\x5d\x41\x44\x13\x93\x4d\x26\x4f\x93\x88\x3d\
+\xf9\x6f\x2f\x79\x20\xb7\x21\x37\x60\x5d\x41\xe1\x72\xc4\x01\x20\
+\x97\xcb\x6d\x05\xf4\x01\xbf\x62\x02\xe4\x98\x5a\x3c\xfe\x76\xeb\
+\x08\x22\x9a\x28\x79\x8f\x75\x81\x05\x11\xbd\xd9\xba\x81\xc2\xe7\
+\xc8\x97\x00\x00\x88\xc8\x2d\x7e\x84\x04\x8d\x42\xfe\x36\x9b\xcd\
+\x4e\xb7\xee\x20\xa2\xf1\x49\xa5\x52\x0b\x14\xb8\xd8\xba\xc3\x82\
+\x57\x77\x38\x00\xd0\x84\x1d\x7d\x00\x00\x22\x39\x00\x00\x38\x41\
+\x6b\xb5\x4b\xac\x23\x88\x68\x7c\x62\xaa\xef\x07\x10\xc5\x73\x3c\
+\x36\x15\xd6\x17\x56\x5b\x47\x50\xf8\x1c\x75\x00\x58\x57\x2a\xfd\
+\x16\xd0\x68\x5e\x5b\x52\xbd\x02\xd1\xbb\x97\x98\x28\x74\xd2\xe9\
+\x74\xbb\x2a\xde\x61\xdd\x61\x43\x6f\x06\x8f\xff\xa5\x49\x38\xea\
+\x00\x00\x40\x15\xce\x4f\x9b\x5e\x12\x48\xf2\x94\x74\x32\xf9\x22\
+\xeb\x0a\x22\x3a\x32\xa9\xeb\x7b\x11\xb1\xc7\xfe\xee\x27\x22\x3f\
+\xb3\x6e\xa0\x70\x1a\xcf\x00\x00\x81\xf7\xe3\x66\x87\x04\x95\x40\
+\x3e\x0e\xae\x02\x10\x05\xd6\xd2\x05\x0b\x66\x01\x5e\x44\x6f\xdd\
+\xd5\x1d\xbb\x46\x46\x7e\x61\x5d\x41\xe1\x34\xae\x01\x20\x5f\x2e\
+\xff\x12\xc0\xd6\x26\xb7\x04\xd5\xe9\xe9\x64\xf2\xe5\xd6\x11\x44\
+\x34\xb6\x9d\x33\x66\xbc\x03\x90\x79\xd6\x1d\x16\x04\x72\xe3\xc6\
+\x8d\x1b\x77\x59\x77\x50\x38\x8d\x6b\x00\x00\x50\x17\xe0\xa6\xa6\
+\x96\x04\xd8\xbe\x55\x80\xf1\xfe\xbb\x22\x22\x9f\xec\xfd\xf4\x2f\
+\x1f\xb4\xee\x30\xe3\xc9\x0a\xeb\x04\x0a\xaf\xf1\xbf\xa9\x39\x91\
+\xfe\x46\xeb\x4b\x27\x93\x91\xbc\xbd\x88\x28\xc8\x76\x4c\x9f\x79\
+\x05\x80\xe3\xad\x3b\x8c\x54\x31\x3d\xc6\xd3\xff\x68\xd2\xc6\x3d\
+\x00\xe4\x8a\xc5\x3b\x00\xfc\xb9\x89\x2d\x81\x26\x2a\x1f\x5b\x0e\
+\xc4\xad\x3b\x88\x68\xaf\x6c\x36\x3b\x5f\x04\x57\x58\x77\x58\x11\
+\xe0\x27\xb9\x5c\x6e\x8f\x75\x07\x85\xd7\x44\x96\xb5\xeb\x10\x44\
+\x77\x15\x40\xb0\x78\x20\x99\x7a\x83\x75\x06\x11\xed\xa5\xb5\xda\
+\x3f\x03\x38\xd6\xba\xc3\x8a\x0a\x7e\x68\xdd\x40\xe1\x36\xa1\xeb\
+\xda\x9e\xc8\xff\x34\x2b\x24\x0c\x14\xfa\xa9\x74\x3a\x1d\xc9\x5b\
+\x8d\x88\x82\xa4\x37\x99\x4c\x41\x11\xe1\xe3\xba\xf5\xb1\x8e\xb9\
+\x73\xef\xb0\xae\xa0\x70\x9b\xd0\x00\x50\x2c\x16\x7f\x0b\xc5\xba\
+\x66\xc5\x84\xc0\x71\x52\xaf\xff\x93\x75\x04\x51\xd4\xd5\x20\x9f\
+\x06\x10\xd9\xa3\xba\x15\xce\x8a\xd5\xab\x57\x8f\x5a\x77\x50\xb8\
+\x4d\x7c\x67\xbb\xc8\xb5\x4d\xe8\x08\x11\xf9\xbb\x4c\x77\x26\x6b\
+\x5d\x41\x14\x55\x8b\x53\xa9\xb3\x01\xbc\xc6\xba\xc3\x92\x03\xef\
+\x5b\xd6\x0d\x14\x7e\x13\x1e\x00\xa4\x16\xfb\x0e\x80\x7a\x13\x5a\
+\xc2\x62\x1a\xe2\xf5\x7f\xb3\x8e\x20\x8a\xa8\x98\x7a\x7a\x15\xa2\
+\x7d\x38\xd7\x03\xb9\x72\xf9\x41\xeb\x08\x0a\xbf\x09\x0f\x00\xfb\
+\x9e\x39\x1d\xed\x93\xa7\x14\x2f\xcd\xb8\xee\x0b\xac\x33\x88\xa2\
+\x26\x9d\x70\xff\x56\x81\x53\xad\x3b\x2c\x09\x94\x9f\xfe\xa9\x21\
+\x26\x75\xb8\x8d\xa8\x44\xfe\x1b\x50\x14\xff\xc1\xc7\x05\x13\xf9\
+\x27\x95\x4a\x2d\x10\xc1\x95\xd6\x1d\xc6\x86\x6b\x11\xdf\x8c\x4d\
+\x8d\x33\xa9\x01\x60\xfa\x9c\x63\x6e\x44\x74\x8f\x06\x06\x00\x28\
+\x70\x22\x6a\xb5\x8f\x58\x77\x10\x45\x85\xa3\xfa\x79\x44\xf4\x81\
+\x3f\xfb\x09\xe4\xc7\xa5\x52\xa9\x6a\xdd\x41\xad\x61\x52\x03\x40\
+\x7f\x7f\xff\x88\x28\x22\xbf\x0a\xa0\x8a\x7f\xc8\x26\x12\x7d\xd6\
+\x1d\x44\xad\x2e\x95\x48\x3d\x1f\x8a\xd7\x59\x77\x58\x53\x6e\xfe\
+\xa3\x06\x9a\xf4\xf9\xf6\x8e\x57\xfb\x0a\x80\xa8\xdf\x86\x32\xcd\
+\x13\xe7\x5b\x00\x62\xd6\x21\x44\xad\x6a\xe9\x82\x05\xb3\x1c\xd1\
+\xff\x46\xb4\x37\xfe\x01\xc0\x9f\xf2\xe5\xf2\x2a\xeb\x08\x6a\x1d\
+\x93\x1e\x00\xd6\x0e\x0c\x6c\x80\xe0\x27\x8d\x8c\x09\x23\x01\xce\
+\xc8\x24\x53\xef\xb4\xee\x20\x6a\x55\x3b\x66\x1c\xf3\x79\x00\x69\
+\xeb\x0e\x73\x82\xab\x00\xa8\x75\x06\xb5\x8e\xa9\x3d\xe1\x4e\xf5\
+\xcb\x0d\xea\x08\x39\xfd\xb4\xeb\xba\xae\x75\x05\x51\xab\x59\x9c\
+\x4a\x9d\x2d\xd0\x77\x58\x77\x04\xc0\xe0\xac\xe1\xe1\xef\x59\x47\
+\x50\x6b\x99\xd2\x00\x90\x2f\x97\x7f\x05\xc1\xfd\x8d\x8a\x09\xb1\
+\x39\x31\xe0\x1a\xf0\x91\xc1\x44\x0d\xb3\x74\xc1\x82\x59\x9e\xe7\
+\x7d\x0b\xfc\xb9\x02\x20\xdf\x7e\x78\xf3\xe6\x9d\xd6\x15\xd4\x5a\
+\xa6\xfc\x83\xa5\x5c\x05\xd8\x4b\x71\x56\x3a\xe1\x7e\xc8\x3a\x83\
+\xa8\x55\xec\x9c\x31\xe3\x4b\x80\xf0\xd4\x4d\xc0\x8b\x69\xfd\xab\
+\xd6\x11\xd4\x7a\xa6\x3c\x00\x74\xce\x9b\xf7\x43\x00\x1b\x1a\xd0\
+\x12\x7a\x22\xf8\x44\xba\x27\xfd\x74\xeb\x0e\xa2\xb0\xcb\xb8\xee\
+\xcb\x00\x79\x8b\x75\x47\x40\xdc\xb8\xb6\x52\x29\x58\x47\x50\xeb\
+\x99\xf2\x00\xb0\xf7\x81\x14\xf2\xb5\x46\xc4\xb4\x80\x36\x71\xbc\
+\xef\xb8\xae\x3b\xc3\x3a\x84\x28\xac\x7a\x7b\x7a\x16\x42\xf1\x4d\
+\xeb\x8e\xa0\x10\xc1\x97\xac\x1b\xa8\x35\x35\xe6\xda\x5a\xdc\xf9\
+\x1a\x80\xdd\x0d\xf9\x5a\xe1\xd7\x17\x57\xfc\xbb\x75\x04\x51\x48\
+\x39\x35\xc7\xb9\x1a\xc0\x5c\xeb\x90\x80\xb8\x2f\x57\x2a\xfd\xd2\
+\x3a\x82\x5a\x53\x43\x06\x80\x7c\x3e\xbf\x45\x21\xdf\x6f\xc4\xd7\
+\x6a\x05\x0a\xbc\x33\xed\xba\x97\x58\x77\x10\x85\x4d\xd6\x75\xff\
+\x15\x90\xf3\xac\x3b\x82\x42\x54\x3e\x63\xdd\x40\xad\xab\x61\x07\
+\x6b\x64\x7b\x7a\x32\xea\x38\x8f\x02\x12\x6f\xd4\xd7\x0c\x37\xdd\
+\xe1\x00\xcf\x58\x57\x2e\x3f\x62\x5d\x42\x14\x06\xe9\x44\xe2\x5c\
+\x11\xe7\x36\xf0\x60\xad\xfd\x1e\xc9\x97\x4b\x4f\x01\xe0\x59\x87\
+\x50\x6b\x6a\xd8\xed\x35\xb9\xf5\xeb\xf3\x02\xb9\xb6\x51\x5f\x2f\
+\xfc\x64\xb6\x07\xfc\x70\xe1\xc2\x85\xc7\x58\x97\x10\x05\x5d\x26\
+\x93\xe9\x11\x91\xeb\xc0\x37\xff\xbf\x50\xe8\xa7\xc0\x37\x7f\x6a\
+\xa2\xc6\xde\x5f\xeb\xd5\x3f\x05\x68\xad\xa1\x5f\x33\xd4\xe4\x29\
+\x33\xda\xda\xb8\x41\x92\xe8\x08\x5c\xd7\x9d\xa1\xb5\xfa\xf5\x80\
+\xcc\xb3\x6e\x09\x0a\x05\x8a\x89\x72\x79\x85\x75\x07\xb5\xb6\x86\
+\x0e\x00\x5c\x05\x78\x32\x81\x5c\x96\x49\xa6\x3e\x68\xdd\x41\x14\
+\x54\x31\xe0\x6b\x02\x9c\x61\xdd\x11\x24\xa2\xf2\xd9\x55\x00\x3f\
+\x4c\x51\x53\x35\xfe\x84\x2d\xae\x02\x8c\x41\x3f\x97\x4e\x26\x5f\
+\x6c\x5d\x41\x14\x34\x99\x64\xea\x83\x50\x5c\x6e\xdd\x11\x30\xe5\
+\x19\x73\x8e\xf9\xae\x75\x04\xb5\xbe\x86\x0f\x00\xb9\xf5\xeb\xf3\
+\x50\xe1\x99\xd5\x07\x73\x04\xf2\xbd\x54\x2a\xd5\x6b\x1d\x42\x14\
+\x14\x99\x64\xf2\x85\x80\x7e\xd6\xba\x23\x70\x04\x1f\xeb\xef\xef\
+\x1f\xb1\xce\xa0\xd6\xd7\x94\x33\xb6\x45\xeb\x9f\xe4\x2a\xc0\x93\
+\x74\x38\x9e\xde\x92\xc9\x64\x8e\xb3\x0e\x21\xb2\x96\x49\x24\x96\
+\x01\xf8\x21\xb8\xe9\xef\x60\x8a\x75\x3d\xa5\x12\x3f\x40\x91\x2f\
+\x9a\x32\x00\x70\x15\xe0\xb0\xd2\xa8\xd7\x6f\xe6\x9d\x01\x14\x65\
+\xd9\x9e\x9e\x0c\xc4\xf9\x19\x20\xb3\xad\x5b\x82\x46\x1d\x7c\x74\
+\x15\xaf\xfd\x93\x4f\x9a\xf6\x94\xad\x18\xbc\x4f\x00\xe0\x32\xd6\
+\xa1\x14\x4f\x9f\xd9\x36\xed\x5a\xf0\x09\x67\x14\x41\xa9\x54\x6a\
+\x81\x3a\xb1\xdb\x00\x2c\xb0\x6e\x09\xa0\xfe\x42\xa9\xc4\x9d\xff\
+\xe4\x9b\xa6\x2d\xbf\x3d\x3e\x34\x34\xd8\xd9\xd1\xd9\x29\xc0\xb3\
+\x9a\xf5\x1a\x21\x76\x52\x57\x7b\xc7\x82\xc1\xa1\xea\x2d\xd6\x21\
+\x44\x7e\xe9\xed\xed\x9d\xa3\xa3\xf5\x9f\x03\xe8\xb3\x6e\x09\x22\
+\xf1\xe4\xad\xdb\xb6\x57\x1f\xb5\xee\xa0\xe8\x68\xea\xa7\x50\x4f\
+\xf4\x13\x80\x3e\xd6\xcc\xd7\x08\x2d\xc1\x3b\x32\xae\xfb\x1f\xd6\
+\x19\x44\x7e\x58\xb6\x6c\x59\x5b\x6d\x78\xcf\xf5\x80\x2e\xb3\x6e\
+\x09\xa8\x5f\xe6\xd6\x17\x6f\xb4\x8e\xa0\x68\x69\xea\x06\x9c\x6a\
+\xb5\xba\xbb\xab\xbd\x6b\x37\x04\x2f\x6c\xe6\xeb\x84\xd8\x33\x3b\
+\xdb\x3b\x30\x38\x54\xe5\xc3\x3e\xa8\x65\xf5\xf5\xf5\x4d\xdb\x51\
+\x1d\x5a\x01\xc1\x05\xd6\x2d\x01\xa5\xea\x39\xaf\x1a\xdc\x3e\xb8\
+\xd1\x3a\x84\xa2\xa5\xe9\x3b\x70\x4f\x1d\xaa\x3e\xb0\xbd\xa3\xe3\
+\x22\x00\xf3\x9b\xfd\x5a\x61\x24\x82\xe5\x5d\xed\x1d\xc3\x83\x43\
+\xd5\x7b\xad\x5b\x88\x1a\xad\xaf\xaf\x6f\xda\xee\x1d\x3b\x57\x00\
+\x78\xb9\x75\x4b\x70\xe9\xf7\x0a\x95\xd2\x7f\x59\x57\x50\xf4\x34\
+\x7d\x00\x28\x01\xde\xdc\x63\x3b\x07\x20\xe0\xd3\xf1\x0e\x47\x70\
+\xde\xdc\x8e\xf6\xad\xdb\x86\x86\xee\xb7\x4e\x21\x6a\x94\x6c\x36\
+\x3b\xbd\xb6\x7b\xe4\xc7\x00\x5e\x6a\xdd\x12\x60\xc3\x1a\x8b\xbd\
+\x62\x70\x70\x70\xc8\x3a\x84\xa2\xc7\x97\x7b\x70\xb7\x6d\xaf\xae\
+\xe9\xea\xe8\x38\x1b\x40\xca\x8f\xd7\x0b\x21\x01\xe4\x45\x9d\xed\
+\x1d\xbb\xb9\x12\x40\xad\xc0\x75\xdd\x19\x52\xf7\x6e\x00\xf0\x22\
+\xeb\x96\x60\x93\x2f\x14\x4a\xc5\x9f\x58\x57\x50\x34\xf9\x76\x2b\
+\x9a\xe7\xc8\x07\xc0\x27\x5b\x1d\x89\x88\xe0\xb3\x19\xd7\xfd\x32\
+\x1a\xf8\x98\x66\x22\xbf\x75\x77\x77\xcf\x8c\x03\x37\x02\x78\x81\
+\x75\x4b\xb0\xe9\xc0\x8c\x5d\xc7\x7c\xc6\xba\x82\xa2\xcb\xb7\x53\
+\xb8\xaa\xd5\xea\xe6\xce\x8e\xce\x84\x00\xa7\xfb\xf5\x9a\x21\x75\
+\x46\x57\x67\xc7\x09\x83\xd5\xea\xad\x00\xd4\x3a\x86\x68\x22\x5c\
+\xd7\xed\x68\x13\xe7\x66\x00\xcf\xb3\x6e\x09\x3a\x51\xe7\x2d\x6b\
+\x36\xad\x7d\xc8\xba\x83\xa2\xcb\xd7\x4f\x9a\xdd\xdd\xdd\x5d\xd3\
+\x63\xf1\x47\x00\xf0\x38\xdc\xa3\xbb\x41\xda\xe2\x17\xe7\x72\xb9\
+\x3d\xd6\x21\x44\xe3\x91\x4c\x26\x4f\x88\x41\x6e\x11\xe0\xa9\xd6\
+\x2d\xc1\x27\x77\xe4\xcb\xc5\xf3\xac\x2b\x28\xda\x7c\x3d\x8d\x6e\
+\x60\x60\x60\x1b\x04\x7f\xef\xe7\x6b\x86\xd8\xcb\x74\xb4\xf6\x93\
+\xa5\x0b\x16\xcc\xb2\x0e\x21\x3a\x9a\xc5\xc9\xe4\x49\x71\xc8\x7d\
+\x7c\xf3\x1f\x97\x51\x07\xde\x7b\xac\x23\x88\x7c\x3f\x8e\x36\x5f\
+\x2a\x5d\x03\xe0\x4e\xbf\x5f\x37\xa4\x5e\xb8\x73\xc6\xcc\xbb\x97\
+\x74\x77\x2f\xb2\x0e\x21\x3a\x9c\x4c\x32\xf9\x5c\x85\xdc\x03\x20\
+\x69\xdd\x12\x0e\xfa\xa5\x75\xe5\xf2\x23\xd6\x15\x44\x16\xe7\xd1\
+\xab\xd6\x9d\xb7\x03\xd8\x6d\xf0\xda\x61\x74\x5a\x3d\x16\xbf\x3f\
+\xdd\x93\x7e\x9a\x75\x08\xd1\xa1\xb2\xc9\xe4\x9b\x01\x59\xa9\x40\
+\x97\x75\x4b\x48\x94\x67\xec\x9a\xfd\x71\xeb\x08\x22\xc0\xe8\x51\
+\x9c\x83\xdb\x07\xb7\x75\xb6\x77\xc4\x45\xb0\xdc\xe2\xf5\x43\x68\
+\x0e\x44\x5f\xdb\xd9\xd1\xfe\xe8\xe0\xd0\x10\x3f\x39\x50\x10\xc4\
+\xd2\xc9\xd4\x17\x01\x7c\x06\x7c\xa4\xef\xf8\x09\x2e\x59\xb3\x71\
+\xdd\x9f\xac\x33\x88\x00\xc3\xdb\xcd\xb2\xd9\xec\x74\x1d\xad\xfd\
+\x1e\x40\xaf\x55\x43\x08\x29\x20\x9f\xc9\x97\x8b\xff\x0a\xa0\x6e\
+\x1d\x43\xd1\xb4\x6f\x33\xef\xf7\x00\x1e\xf1\x3d\x11\x02\xf9\x7e\
+\xae\x5c\xbc\xcc\xba\x83\x68\x3f\xd3\xfb\xcd\x17\xa7\x52\x67\x7b\
+\x9e\xae\xb2\xee\x08\xa1\x55\x88\xc7\x5e\x93\xcf\xe7\xb7\x58\x87\
+\x50\xb4\x64\x93\xc9\xd3\x14\xf2\x23\x00\x69\xeb\x96\x90\x79\x1c\
+\xf1\xd8\xc9\xfc\x99\xa5\x20\x31\x7d\x26\xfd\xba\x62\xf1\x2e\x28\
+\xbe\x6e\xd9\x10\x52\xcb\xb5\x56\xff\x75\x36\x99\xe4\x99\x0a\xe4\
+\x9b\x6c\x32\xf9\x66\x85\xfc\x0a\x7c\xf3\x9f\x30\x51\x79\x3f\xdf\
+\xfc\x29\x68\xcc\x3f\x79\xf7\xcd\xef\x9b\xbd\xfb\x98\x9d\x0f\x01\
+\xc8\x58\xb7\x84\xd0\x1e\x55\x7c\xb8\x50\x29\x5d\x05\x1e\x1a\x44\
+\x4d\xb2\x74\xc1\x82\x59\xbb\x66\xcc\xbc\x4a\x81\x37\x59\xb7\x84\
+\x91\x0a\x6e\x2a\x94\x4a\x7c\x1e\x02\x05\x8e\xf9\x00\x00\x00\x99\
+\x64\xf2\x4c\x40\xee\x02\x37\x13\x4d\x8a\x08\x7e\x51\x17\x79\x5d\
+\xb1\x58\xdc\x6c\xdd\x42\xad\x25\xd3\x93\x79\x0a\x9c\xda\x0f\x00\
+\x79\x8a\x75\x4b\x48\x3d\x5e\x17\x3c\xa5\x54\x2a\xfd\xd9\x3a\x84\
+\xe8\x50\x81\x78\xc3\x1d\x1c\x1a\x5a\xdf\xd5\xd1\x3e\x1b\x90\x67\
+\x5b\xb7\x84\x54\x46\x14\x97\xcc\xed\xec\x78\x60\x5b\xb5\x5a\xb2\
+\x8e\xa1\x96\xe0\x64\x92\xa9\x2b\x20\xde\x0a\x40\x4e\xb0\x8e\x09\
+\x2d\xc1\x9b\x8b\xa5\xd2\xaf\xad\x33\x88\xc6\x12\x88\x15\x00\x60\
+\xff\x5d\x01\xa3\xbf\xe3\x27\x8d\x29\xf1\x44\x71\xd5\x6e\xaf\xf6\
+\x91\x81\x81\x81\x61\xeb\x18\x0a\xa7\xde\x9e\x9e\x85\x35\xc7\xb9\
+\x1a\x10\x1e\x55\x3b\x05\x0a\xfd\x51\xa1\x5c\x7e\x95\x75\x07\xd1\
+\xe1\x98\x6e\x02\x3c\x50\x2e\x97\xdb\x23\xc0\xe5\x00\x46\xac\x5b\
+\x42\xcc\x51\xc1\xfb\xa6\xc7\xe2\x0f\xed\xbd\xac\x42\x34\x21\x92\
+\x4e\x26\xdf\x54\x73\x62\xfd\x7c\xf3\x9f\x3a\x47\x24\x6f\xdd\x40\
+\x74\x24\x81\xb8\x04\xb0\xdf\xb6\xa1\xa1\x3f\x77\x75\x74\x02\x7c\
+\x92\xd8\x54\xcd\x05\xe4\x0d\x5d\x1d\xed\x73\xda\x3b\x3b\xef\xae\
+\x56\xab\x35\xeb\x20\x0a\x36\xd7\x75\xdd\x79\x1d\x1d\x3f\x04\xe4\
+\xfd\x00\x66\x58\xf7\xb4\x88\xe7\xcc\xed\xec\x90\x6d\xd5\xea\x2a\
+\xeb\x10\xa2\xb1\x04\x6a\x00\x00\x80\xc1\xa1\xea\xbd\x5d\x1d\x1d\
+\x67\x03\x70\xad\x5b\x42\xce\x01\xe4\x4c\x07\x78\x75\x67\x7b\xd7\
+\xa3\x83\x43\x83\x05\xeb\x20\x0a\x24\x27\x93\x4c\xbd\xdb\x81\xfe\
+\x2f\x20\x27\x59\xc7\xb4\xa0\xe5\x1c\x02\x28\xa8\x02\xb3\x07\xe0\
+\x40\x7b\xaf\x41\xc6\x1e\x04\x1f\x1b\xdc\x48\xd7\xc5\xbd\xfa\x15\
+\x6b\xd6\xaf\xdf\x68\x1d\x42\xc1\x90\x4d\x26\x4f\x57\xc8\x57\x00\
+\x3c\xcb\xba\xa5\xd5\x89\xe0\xca\x5c\xa9\xf4\x31\xeb\x0e\xa2\x03\
+\x05\x6e\x05\x00\x00\x1e\xdf\xbe\xfd\x89\xae\x8e\xf6\x07\x00\xb9\
+\x0c\x01\xda\xa7\x10\x72\x4f\xa9\x8b\xf3\x8e\xb9\x9d\x1d\xd3\x4e\
+\x58\xb4\xe8\x57\x5b\xb7\x6e\xe5\x51\xc2\x11\x95\x48\x24\x3a\xe7\
+\x75\x76\x7e\x0e\x90\x6f\x00\x48\x58\xf7\x44\xc4\xf2\xb9\x9d\x1d\
+\x33\xb7\x55\xab\xb7\x5b\x87\x10\xed\x17\xc8\x01\x00\x00\x06\x87\
+\x86\x8a\x5d\x1d\x9d\xd3\x01\x9c\x65\xdd\xd2\x2a\x04\x98\x06\x60\
+\x79\x6d\x64\xf4\xc2\x8e\xf6\xce\x7c\x75\xa8\xca\xcb\x02\xd1\x12\
+\xcb\x26\x93\xef\x8c\x89\x73\x03\x80\xe5\xe0\x70\xed\x37\xee\x09\
+\xa0\x40\x09\xec\x00\x00\x00\xa7\x0e\x55\xef\x1a\x6a\xef\x58\x2e\
+\xc2\xe7\x8c\x37\xd8\x02\x11\xbc\xae\xab\xbd\xe3\x59\x1d\x5d\x9d\
+\x7f\xa8\x56\xab\x3c\x40\xa8\xc5\xa5\x12\xa9\xe7\x77\x75\x74\x5c\
+\x0f\xc8\x9b\x01\xcc\xb4\xee\x89\x30\xee\x09\xa0\xc0\x08\xe4\x1e\
+\x80\x03\x2d\xe9\xee\x5e\x54\x8f\xc5\x1f\x04\x30\xdf\xba\xa5\x45\
+\x79\x10\xfc\x6f\x5c\xf5\xc3\x6b\xca\xe5\xa2\x75\x0c\x35\xd6\x62\
+\xd7\x3d\xc3\x53\xf9\x14\xa0\xe7\x5a\xb7\xd0\x5f\x89\xe0\x73\xb9\
+\x52\xe9\x1f\xac\x3b\x28\xda\x02\xbd\x02\x00\xec\xdd\x0f\xd0\xd1\
+\xde\xf9\x90\x08\x2e\x05\x97\x2c\x9b\x41\x00\xf4\x79\x90\xb7\x75\
+\x75\xb4\x77\x74\x74\x75\x3d\x5c\xad\x56\x77\x5a\x47\xd1\xd4\xa4\
+\x52\xa9\xa5\x5d\x1d\x1d\xdf\x80\xe2\x0b\xe0\xc3\x7b\x82\x88\x97\
+\x03\xc8\x5c\xe0\x07\x00\x00\xa8\x0e\x55\x0b\x5d\x1d\xed\x3b\x01\
+\xf9\x1b\xeb\x96\x16\xd6\x06\xc8\x99\xa2\x78\x77\x57\x47\xfb\x82\
+\xb9\xb3\xe7\xff\x61\xdb\x13\xdb\xb6\x5b\x47\xd1\xc4\x64\x13\x89\
+\xbe\xae\x8e\xce\x2f\x89\xe2\x2b\x02\x9c\x68\xdd\x43\x47\xc4\xcb\
+\x01\x64\x2a\xf0\x97\x00\x0e\x94\x4d\xba\xdf\x56\xe0\x8d\xd6\x1d\
+\x11\x31\x0a\xe8\x75\x1a\x8b\x7d\xb2\x50\x28\xac\xb5\x8e\xa1\x23\
+\x4b\x27\xd2\xcf\x11\xc7\x7b\x2f\x14\xaf\x04\x57\xca\x42\x85\x97\
+\x03\xc8\x4a\xa8\x06\x80\xee\xee\xee\x99\xd3\x63\x6d\x77\x03\xba\
+\xcc\xba\x25\x3a\xb4\x26\x70\x56\x88\xe8\x7f\xae\x2b\x95\x7e\x63\
+\x5d\x43\x07\x71\x32\xc9\xe4\x85\x80\xfc\x3d\x80\x67\x5a\xc7\xd0\
+\xe4\xf1\x9c\x00\xb2\x10\xaa\x01\x00\x00\x32\x99\x4c\x0f\x6a\xf5\
+\xdf\x81\x87\x04\x19\xd0\xdf\x41\xe4\x2b\x75\x60\x45\xa9\x54\xda\
+\x6d\x5d\x13\x55\xe9\x74\xba\x1d\x9e\x77\xa9\x28\xde\x07\x60\x89\
+\x75\x0f\x35\x06\x87\x00\xf2\x5b\xe8\x06\x00\x00\x48\xf5\xa4\xce\
+\x72\x1c\xbd\x1d\x7b\xef\x6b\x27\xdf\xe9\x63\x22\xf2\xad\xba\xc8\
+\xff\x2b\x16\x8b\x65\xeb\x9a\xa8\xc8\x24\x93\x67\x42\xe5\xad\x10\
+\xbc\x1a\xc0\x31\xd6\x3d\xd4\x78\x1c\x02\xc8\x4f\xa1\x1c\x00\x00\
+\x20\x93\x48\x5d\x0e\xd1\xef\x22\xc4\xff\x0c\x2d\xa0\x0e\xc5\xed\
+\x02\xf9\x7e\x6c\xe6\xb4\x1b\xd6\xac\x59\xf3\x84\x75\x50\xab\xe9\
+\xee\xee\xee\x9a\xe6\xc4\x5f\x27\x82\xb7\x02\xe8\xb3\xee\xa1\xe6\
+\xe3\x10\x40\x7e\x09\xf5\x9b\x67\xd6\x75\x3f\xa6\x8a\x8f\x5a\x77\
+\x10\x00\x60\x17\x80\x9f\xaa\x3a\xff\xd3\x39\xbf\xf3\xb6\xd5\xab\
+\x57\x8f\x5a\x07\x85\x55\x6f\x6f\xef\x9c\xd1\x3d\x7b\x2e\x10\xc5\
+\x45\x00\x5e\x04\x3e\x9d\x2f\x72\x38\x04\x90\x1f\x42\x3d\x00\x00\
+\x90\x4c\x32\x79\x35\x20\xaf\xb3\x0e\xa1\x83\x3c\xae\x90\x15\xd0\
+\xfa\x8f\x67\xce\x99\x73\x77\x7f\x7f\xff\x88\x75\x50\xd0\xa5\xd3\
+\xe9\x76\xa7\xa6\x2f\x51\xe8\x45\x10\x9c\x0f\xbe\xe9\x47\x1e\x87\
+\x00\x6a\xb6\xb0\x0f\x00\xe8\xeb\xeb\x9b\xb6\x7b\xc7\xce\xdb\xb0\
+\xf7\x6c\x73\x0a\x9e\x27\x00\xdc\x0e\x95\x5b\x63\xde\xe8\x2d\x6b\
+\x07\x06\x36\x58\x07\x05\x85\xeb\xba\x6e\x5c\xe5\x3c\xc0\xbb\x50\
+\x21\xcf\x07\x30\xdd\xba\x89\x82\x85\x43\x00\x35\x53\xe8\x07\x00\
+\x60\xef\xd3\xcd\xda\xc4\xb9\x07\xc0\xc9\xd6\x2d\x74\x64\x02\xfc\
+\x1e\x8a\x5b\xe1\x60\xe5\xae\x91\x91\xfb\x37\x6e\xdc\xb8\xcb\xba\
+\xc9\x2f\x99\x4c\xe6\x38\xd4\xeb\xcf\x85\xea\xb9\x80\x9c\x0b\x9e\
+\xd0\x47\xe3\xa0\xc0\x7f\x38\x2a\xf7\x1d\xf4\x17\x1d\xdd\xae\xf5\
+\xd8\x86\x36\x6f\xf7\xa6\x47\x37\x6c\x78\xdc\x28\x8d\x42\xae\x25\
+\x06\x00\x00\xc8\x2e\xca\x76\x6b\xbc\x76\x0f\xc0\x07\x07\x85\x87\
+\xd6\x00\x3c\x04\xe0\xd7\x0a\xfc\x3a\xae\x7a\xdf\xda\x4a\xa5\x55\
+\x9e\x50\xe8\xa4\xd3\xe9\xac\x78\xde\x69\xe2\xe1\x99\x2a\x78\x1e\
+\x80\x53\xd0\x42\x3f\x73\x14\x18\xbb\x01\x6c\x04\xf0\xb0\x40\xef\
+\x87\xe3\xfc\x6e\xf7\xe8\xe8\xef\x06\x06\x06\xb6\x59\x87\x51\xb0\
+\xb5\xd4\x2f\xa3\x74\x3a\xbd\x44\xea\xde\xdd\xe0\x19\x01\x61\xb6\
+\x19\x8a\x5f\x43\xe4\x77\xa2\x78\xb4\x1e\xc3\xda\x58\x2c\xb6\x26\
+\x97\xcb\xed\xb1\x0e\x3b\x9c\xe5\x40\xbc\x9c\x4a\x9d\xec\xa8\x9e\
+\x06\xe0\x34\x00\xa7\x43\xf1\x54\x00\x73\x6c\xcb\x28\xe2\x1e\x16\
+\xc1\x0d\x50\xbd\x21\x57\x2e\x3f\x68\x1d\x43\xc1\xd3\x52\x03\x00\
+\x00\x64\x93\xc9\xd3\x15\x72\x27\x80\x63\xad\x5b\xa8\x61\x3c\x00\
+\x25\x00\x6b\x15\x78\x44\x04\x6b\xa0\xba\xae\x2e\xb2\xf1\xd8\xe1\
+\xe1\xf5\x0f\x6f\xde\xdc\xf4\x87\x17\xb9\xae\x7b\x7c\x1c\x70\x15\
+\x48\xaa\x07\xd7\x11\x24\x75\xef\x6a\x93\x0b\x20\x03\x5e\xbf\xa7\
+\x60\x2b\x01\x7a\x7d\x4c\xf5\xbf\x5b\x68\x95\x8d\xa6\xa8\xe5\x06\
+\x00\x00\xc8\xba\xee\x39\xaa\xb8\x15\x7c\xee\x79\x44\xe8\x0e\x40\
+\xd6\x03\x18\x04\x64\x10\xf0\xb6\x41\x64\x50\x80\x61\x00\x43\x9e\
+\x07\x0f\x0e\x86\xc4\x13\xef\x49\x7f\xab\xa3\xa2\x1e\x3a\x44\xa4\
+\x4d\x44\x67\xab\xea\x31\x02\xa7\x4b\xa1\x5d\x0a\x74\x09\x30\x0f\
+\xc0\x22\x70\x57\x3e\xb5\x06\x0f\xc0\x8d\x80\x5e\x95\x2f\x97\xef\
+\xb4\x8e\x21\x5b\x2d\x39\x00\x00\x40\xd6\x75\xcf\x57\xc5\x4f\xc1\
+\x4f\x66\x44\x44\x4f\xa2\xc0\x43\x8e\x23\x1f\xce\x15\x8b\x3f\xb7\
+\x6e\x21\x1b\x2d\x3b\x00\x00\x1c\x02\x88\x88\x8e\x4e\x6f\x87\x17\
+\x7f\x7f\x7e\x7d\xfe\x8f\xd6\x25\xe4\xaf\x96\x1e\x00\x00\x20\xdb\
+\x93\x7a\xa9\x3a\xfa\x23\x00\x6d\xd6\x2d\x44\x44\x01\x35\x0a\xc1\
+\x57\x87\x47\x46\x3e\x12\xa5\x5b\x73\xa3\xae\xe5\x07\x00\x00\xc8\
+\xb8\xee\xcb\xa0\xb8\x0e\x5c\x09\x20\x22\x3a\x2c\x01\x1e\x05\xf4\
+\x52\xde\x35\x10\x0d\x31\xeb\x00\x3f\x0c\x56\xab\x8f\x76\x75\xb4\
+\xdf\x0b\xe0\x95\x80\xf0\x09\x82\x44\x44\x63\x9b\x07\xc8\x9b\xe6\
+\x76\x76\xc4\xb6\x55\xab\x77\x01\x50\xeb\x20\x6a\x9e\x48\xac\x00\
+\xec\xb7\xef\xee\x80\x9b\xc0\xfb\xb3\x89\x88\x8e\x42\x7e\x36\x63\
+\xd7\x31\x17\xf7\x6f\xed\xdf\x61\x5d\x42\xcd\x11\xa9\x01\x00\x00\
+\x16\xbb\xee\x19\xaa\xb8\x45\x81\x2e\xeb\x16\x22\xa2\x40\x13\xdc\
+\x2f\xf1\xf8\x8b\x73\xb9\xdc\x56\xeb\x14\x6a\xbc\xc8\x0d\x00\x00\
+\xb0\x38\x99\x3c\xc9\x83\xac\x04\x90\xb0\x6e\x21\x22\x0a\xb8\x82\
+\xd6\x9d\x17\x14\x06\x0a\xeb\xac\x43\xa8\xb1\x22\x39\x00\x00\xc0\
+\x92\xee\xee\x45\xf5\x58\x6c\x25\x20\x4f\xb1\x6e\x21\x22\x0a\xb8\
+\x3f\x7b\x8e\x9c\x5f\x2c\x16\x1f\xb6\x0e\xa1\xc6\x71\xac\x03\xac\
+\xac\x1d\x18\xd8\x50\x17\x39\x4b\x15\x77\x59\xb7\x10\x11\x05\xdc\
+\xf1\x8e\xa7\xab\x32\x89\xc4\x32\xeb\x10\x6a\x9c\xc8\x0e\x00\x00\
+\x50\x2a\x95\xaa\x9e\x83\xf3\x21\xb8\xde\xba\x85\x88\x28\xe0\x3a\
+\x21\xb2\x32\x95\x4a\x2d\xb5\x0e\xa1\xc6\x88\xc4\x6d\x80\x47\x52\
+\xad\x56\x6b\x83\xd5\xea\x8f\xe6\x76\x76\x00\xc0\x39\x88\xf0\x65\
+\x11\x22\xa2\x23\x93\x63\x44\x71\x71\x57\xfb\xb1\xb7\x0f\x0e\x0d\
+\x6d\xb2\xae\xa1\xa9\xe1\x9b\xdd\x01\x32\xae\xfb\x1a\x28\xbe\x0b\
+\x3e\xf8\x85\x88\xe8\x48\x06\xa1\xde\xf3\xf3\x95\xca\x6a\xeb\x10\
+\x9a\x3c\x0e\x00\x87\xc8\x26\x93\xcf\x52\xc8\x0d\x00\x8e\xb3\x6e\
+\x21\x22\x0a\x30\x0e\x01\x21\x17\xe9\x3d\x00\x63\xc9\x95\xcb\xf7\
+\xc5\xd4\x7b\x16\xa0\x7c\x30\x06\x11\xd1\xe1\x71\x4f\x40\xc8\x71\
+\x00\x18\xc3\xda\x4a\xa5\xb0\xa7\x5e\x7f\x06\x14\x57\x5b\xb7\x10\
+\x11\x05\x97\xcc\xe3\xdd\x01\xe1\xc5\x4b\x00\x47\x91\x49\xa4\xde\
+\x06\xd1\xaf\x80\x4f\x13\x24\x22\x3a\x1c\x5e\x0e\x08\x21\x0e\x00\
+\xe3\x90\xea\x49\x9d\xe5\x38\xfa\x43\x00\xc7\x5b\xb7\x10\x11\x05\
+\x14\x87\x80\x90\xe1\x25\x80\x71\x28\xae\x2f\xde\x2d\xb5\xf8\xd3\
+\x15\xf8\x8d\x75\x0b\x11\x51\x40\x71\x4f\x40\xc8\x70\x00\x18\xa7\
+\xdc\x86\xdc\xc0\xcc\xd9\xb3\xce\x06\xf4\x8b\xe0\x23\x32\x89\x0c\
+\xe9\x0e\x40\x3f\xa9\xc0\x4e\xeb\x12\x3a\x94\xcc\x73\x3c\xef\x0e\
+\x0e\x01\xe1\xc0\x4b\x00\x93\x90\x4e\x24\xce\x15\x71\xae\x05\x70\
+\x82\x75\x0b\x51\xc4\xf4\xc3\x8b\x5d\x9c\x5f\x9f\xff\x63\x26\x91\
+\x78\x36\xc4\xb9\x15\x7c\xbc\x77\x10\xf1\x72\x40\x08\x70\x05\x60\
+\x12\x0a\x95\xca\x1d\x88\xc7\x9e\x0a\xe0\x56\xeb\x16\xa2\xe8\xd0\
+\x6b\x87\x47\x47\x9e\x91\x5f\x9f\xff\x23\x00\xe4\x2b\x95\x7b\xa1\
+\xde\x0b\x01\x3c\x61\x1c\x46\x4f\xd6\x09\x71\x7e\xc1\xbb\x03\x82\
+\x8d\x2b\x00\x53\xe3\xa4\x13\xee\x87\x44\xf0\x09\xf0\x2e\x01\xa2\
+\x26\xd1\xc7\x44\xe4\x2d\xb9\x52\xe9\xa7\x63\xfd\xaf\x8b\x53\xa9\
+\xb3\xeb\x9e\xde\x22\xc0\x2c\xbf\xcb\xe8\x68\xf4\x31\xcf\x71\xce\
+\xe5\x53\x04\x83\x89\x03\x40\x03\x2c\x76\xdd\x33\xbc\xbd\x67\x06\
+\xf4\x5a\xb7\x10\xb5\x98\x5b\x6a\xd0\xb7\x94\xcb\xe5\x23\x9e\x3b\
+\xcf\x21\x20\xc8\x38\x04\x04\x15\x07\x80\x06\x71\x5d\x77\x46\x1c\
+\xf8\x98\x2a\x3e\x08\x3e\x64\x89\x68\xaa\x86\x55\xf1\x8f\x85\x4a\
+\xe9\x2a\x8c\x73\xd3\x2d\xf7\x04\x04\x1a\xf7\x04\x04\x10\x07\x80\
+\x06\xdb\xf7\x2c\x81\xef\x80\xab\x01\x44\x93\xa2\xc0\x6f\x10\x73\
+\x2e\x2f\x14\x0a\x6b\x27\xfa\xf7\x72\x08\x08\x34\x0e\x01\x01\xc3\
+\x01\xa0\x09\xba\xbb\xbb\x67\xce\x88\xc7\x3f\xaa\x8a\x0f\x81\x1b\
+\x2d\x89\xc6\x6b\x58\x15\x57\x16\x2a\xa5\x2f\x02\xa8\x4f\xf6\x8b\
+\x70\x08\x08\x34\x0e\x01\x01\xc2\x01\xa0\x89\xb2\xae\xbb\x5c\x15\
+\xdf\x02\x90\xb6\x6e\x21\x0a\xb8\x3b\xc5\xab\xbf\x35\xb7\x7e\x7d\
+\xbe\x11\x5f\x2c\xeb\xba\xe7\x78\x8a\x9f\x71\x4f\x40\x10\x71\x4f\
+\x40\x50\x70\x00\x68\xb2\x7d\xab\x01\x1f\x56\xc5\x3f\x00\x98\x6e\
+\xdd\x43\x14\x30\x43\xaa\xf8\x68\xa1\x52\xfa\x4f\x00\x5e\x23\xbf\
+\x30\x57\x02\x02\x8d\x2b\x01\x01\xc0\x01\xc0\x27\xd9\x44\xe2\x64\
+\x15\xe7\xab\x00\xce\xb1\x6e\x21\x0a\x02\x81\xfc\x6f\xcc\xab\xbd\
+\x77\xcd\xfa\xf5\x1b\x9b\xf5\x1a\x5c\x09\x08\x32\xae\x04\x58\xe3\
+\x00\xe0\xb3\x6c\x22\xf5\x2a\x15\xfd\x4f\x00\x0b\xac\x5b\x88\x6c\
+\x68\x0e\xc0\x7b\xf3\xe5\xb2\x2f\x07\x69\xa5\x13\xe9\xe7\x88\x78\
+\xb7\x80\x2b\x01\x41\xc4\x95\x00\x43\xdc\xa0\xe6\xb3\x5c\xa5\x78\
+\x7d\x5d\x70\x22\x04\x57\x61\x0a\x1b\x9d\x88\x42\x68\x58\x04\x57\
+\xd6\x45\x4e\xf1\xeb\xcd\x1f\x00\x0a\x95\xc2\x3d\xaa\xce\x8b\xc0\
+\x13\x03\x83\x88\x27\x06\x1a\xe2\x0a\x80\xa1\xc5\xae\x7b\x46\x5d\
+\xf1\x65\x01\xce\xb0\x6e\x21\x6a\x2a\xc5\x4f\xe3\xa2\xef\x5f\x53\
+\x2e\x17\xad\x12\x78\x39\x20\xc8\x78\x39\xc0\x02\x07\x80\x00\xc8\
+\x26\x52\x2f\x51\xd1\xff\x00\x90\xb1\x6e\x21\x6a\xb0\x3f\x01\xfa\
+\x41\x3f\x3f\xf1\x1f\x09\x2f\x07\x04\x1a\x2f\x07\xf8\x8c\x03\x40\
+\x40\x2c\x5b\xb6\xac\xad\xba\x75\xdb\x1b\x21\xfa\x49\x00\xf3\xad\
+\x7b\x88\xa6\x68\x23\x54\xae\xcc\x57\x8a\xdf\x42\xc0\x2e\x75\x71\
+\x08\x08\x34\x0e\x01\x3e\xe2\x00\x10\x30\x89\x44\xa2\x73\x9a\xe3\
+\x7c\x58\x15\x7f\x07\x60\x86\x75\x0f\xd1\x04\xed\x12\xc1\x7f\xc6\
+\xa6\x4f\xff\xd4\x9a\x35\x6b\x02\x7b\xcd\x9d\x43\x40\xa0\x71\x08\
+\xf0\x09\x07\x80\x80\xea\x4d\x26\x53\x35\xc8\xa7\x01\xbc\x06\xfc\
+\xef\x44\xc1\xb7\x5b\x14\xff\xad\x6d\xb1\xcf\xe4\xf3\xf9\x2d\xd6\
+\x31\xe3\xc1\x3d\x01\x41\xc6\x3d\x01\x7e\xe0\x1b\x4b\xc0\xa5\x52\
+\xa9\xa5\x8e\xea\x3f\x43\xf1\x4a\xf0\xae\x0d\x0a\x9e\x11\x28\xbe\
+\x2d\xf5\xf8\xa7\x72\x1b\x72\x03\xd6\x31\x13\x95\x49\x26\xbf\x01\
+\xc8\x5b\xac\x3b\x68\x2c\x1c\x02\x9a\x8d\x6f\x28\x01\x57\x2c\x16\
+\x1f\xce\x97\x4a\xaf\x16\xf5\x4e\x01\xf4\x5a\x40\x6b\xd6\x4d\x44\
+\x00\x3c\x08\xae\x47\x3d\xd6\x97\xaf\x94\xde\x19\xc6\x37\x7f\x00\
+\x50\x38\xfc\x10\x14\x58\x32\xcf\xf1\x74\x15\x6f\x11\x6c\x1e\x0e\
+\x00\x21\x91\xab\x54\xfe\x94\x2f\x97\x2f\xd7\x58\xac\x0f\x8a\xab\
+\x39\x08\x90\x91\x3d\x80\x7e\x53\xeb\xce\x89\xf9\x52\xe9\xd5\xf9\
+\x81\x7c\xce\x3a\x68\x2a\x1c\x28\x7f\x07\x06\x5b\x27\x44\x56\xa6\
+\x52\xa9\xa5\xd6\x21\xad\x88\xdf\xfc\x21\x53\x28\x14\xd6\xe6\x2b\
+\xa5\x37\xd4\x45\x16\xef\x3b\x4c\x68\xb7\x75\x13\x45\x81\xee\x80\
+\xe0\x2a\xa9\xc5\xb3\xf9\x72\xf9\xad\x85\x81\xc2\x3a\xeb\xa2\x46\
+\x50\xe5\xef\xc0\xe0\xe3\x4a\x40\xb3\x70\xf9\x2b\xe4\xd2\xe9\x74\
+\x42\x3c\xef\xdd\x50\xbc\x19\xc0\x5c\xeb\x1e\x6a\x39\x5b\x01\xfd\
+\xf2\xa8\xea\x57\x2b\x95\xca\xa0\x75\x4c\xa3\x65\x12\xee\x77\x21\
+\x78\xbd\x75\x07\x8d\x07\xf7\x04\x34\x1a\x07\x80\x16\xd1\xdd\xdd\
+\x3d\x73\x46\xac\xed\xb5\x0a\x7d\x0f\x00\x2e\x97\xd1\x54\x3d\x0c\
+\x95\xaf\x0c\xd7\xf6\x7c\x7f\xe3\xc6\x8d\xbb\xac\x63\x9a\x25\x93\
+\x4c\x7d\x11\xd0\x2b\xac\x3b\x68\xbc\x38\x04\x34\x12\x07\x80\x16\
+\x94\x49\x24\x96\x41\xe4\xef\x00\x5c\x02\x48\xdc\xba\x87\x42\xc3\
+\x13\xe8\x2d\x9e\xc6\xbe\x5c\xa8\x14\xee\x00\xa0\xd6\x41\xcd\x96\
+\x49\x26\xaf\x00\xe4\x8b\xd6\x1d\x34\x21\x3c\x27\xa0\x41\x38\x00\
+\xb4\xb0\xde\x9e\x9e\x85\xf5\x58\xec\x6d\xaa\xfa\x6e\x40\xe6\x59\
+\xf7\x50\x60\x55\x21\xb8\xc6\x13\xf9\xf7\x62\xb1\x58\xb6\x8e\xf1\
+\x53\x3a\x99\xbc\x54\x20\xdf\xb7\xee\xa0\x09\xe3\x10\xd0\x00\x1c\
+\x00\x22\xa0\xbb\xbb\x7b\xe6\x0c\xa7\xed\x22\x15\x7d\x23\x80\xe5\
+\xe0\x7f\x77\x02\xea\x80\xac\x14\xc5\x77\x31\x2d\x76\x53\x2e\x97\
+\xdb\x63\x1d\x64\x21\xeb\xba\xcb\x55\x71\xa7\x75\x07\x4d\x06\x2f\
+\x07\x4c\x15\xdf\x08\x22\x66\x49\x22\x91\xf6\x1c\xe7\xf5\xaa\x78\
+\x03\x80\x84\x75\x0f\xf9\xee\x11\x40\xbe\x53\x83\xf7\xbd\x72\xb9\
+\xbc\xc9\x3a\xc6\x5a\x76\x51\xb6\x5b\xe3\xb5\xf5\xd6\x1d\x34\x59\
+\x1c\x02\xa6\x82\x03\x40\x74\x39\x59\xd7\x3d\x4b\x3d\x5c\x02\xc1\
+\x45\xe0\x1d\x04\xad\x6c\xab\x00\x3f\x12\xc1\xd5\xeb\x4a\xa5\xdf\
+\x58\xc7\x04\x4d\x26\xe9\x6e\x02\x70\xbc\x75\x07\x4d\x16\x87\x80\
+\xc9\xe2\x00\x40\x58\xb6\x6c\x59\xdb\xe0\xd6\xc1\xf3\x1d\xd1\x8b\
+\x15\xfa\x12\x00\xc7\x5a\x37\xd1\x94\x6d\x81\xe2\xc7\x0a\xef\x47\
+\x85\x4a\x65\x15\x02\xf6\x44\xbe\x20\xc9\x26\x93\x37\x29\xe4\x02\
+\xeb\x0e\x9a\x0a\x0e\x01\x93\xc1\x01\x80\x0e\x15\x4b\x27\xd2\xcf\
+\x12\xc7\x7b\x15\x14\xaf\x02\x70\x82\x75\x10\x8d\xdb\xe3\x80\xde\
+\x22\xea\x5c\xdf\x3e\xbf\x6b\xe5\xea\xd5\xab\x47\xad\x83\xc2\x20\
+\xeb\xba\x1f\x53\xc5\x47\xad\x3b\x68\xca\xb8\x31\x70\x82\x38\x00\
+\xd0\x91\xc4\x16\xa7\x52\xcf\xf6\x3c\xef\x02\x88\xbc\x00\x8a\x53\
+\xac\x83\xe8\x20\x1e\xa0\x0f\x00\x58\x09\xe0\xd6\x7c\xb9\xfc\x1b\
+\xf0\x93\xfe\x84\x65\x5c\xf7\x05\x50\xdc\x6a\xdd\x41\x8d\xc0\x95\
+\x80\x89\xe0\x00\x40\xe3\x96\xc9\x64\x7a\x30\xea\xbd\x10\xa2\x2f\
+\x00\x70\x2e\x78\xa9\xc0\x80\x3e\x26\x90\x9f\x43\x65\xa5\xb6\x39\
+\xb7\x85\xe5\xd1\xbb\x41\xe6\xba\xee\x8c\x98\x62\x0b\x80\x39\xd6\
+\x2d\xd4\x08\x1c\x02\xc6\x8b\x03\x00\x4d\x56\x2c\x95\x4a\x2d\x73\
+\xea\xba\x1c\x82\xe5\x80\x9e\x05\xc8\x6c\xeb\xa8\x56\x23\xc0\x36\
+\x4f\x70\xaf\xa8\xdc\xe5\x39\xb8\xab\x58\x2c\xfe\x0e\x80\x67\xdd\
+\xd5\x6a\x32\xae\xbb\x02\x8a\x57\x5b\x77\x50\xa3\x70\x08\x18\x0f\
+\x0e\x00\xd4\x10\xcb\x81\xf8\x80\xeb\x3e\x0d\xc0\xb3\x14\x78\x26\
+\x3c\x3c\x0b\x82\x1e\xeb\xae\xf0\xd1\x01\x81\xdc\xe5\x09\xee\x91\
+\x7a\xec\xee\xfc\xfa\x7c\x3f\x22\x70\x22\x9f\xb5\x8c\xeb\x5e\x0c\
+\xc5\x0f\xac\x3b\xa8\x91\x38\x04\x1c\x0d\x07\x00\x6a\x9a\xde\x9e\
+\x9e\x85\xa3\x8e\xf3\x4c\x47\xe4\x19\xea\xe1\xa9\x10\x9c\x0a\xde\
+\x6e\x75\xa0\x0a\x04\x0f\x09\xf0\xa0\x02\x0f\xa9\xe3\x3c\x50\x28\
+\x14\x2a\xd6\x51\x51\x94\xcd\x66\x8f\xd5\xd1\xda\x16\x00\xd3\xad\
+\x5b\xa8\x91\x38\x04\x1c\x09\x07\x00\xf2\x95\xeb\xba\xc7\xc7\x81\
+\x53\x3d\x0f\x4f\x15\x07\x27\x8b\x87\x13\x55\xb0\x04\x40\x87\x75\
+\x5b\x13\x0d\x42\x90\x53\xd5\x35\x02\xe7\xf7\xaa\xf5\x07\x47\x3c\
+\xef\xc1\x81\x81\x81\x6d\xd6\x61\xf4\x57\x19\xd7\xbd\x1a\x8a\xcb\
+\xad\x3b\xa8\xd1\x38\x04\x1c\x0e\x07\x00\x0a\x84\x54\x2a\xb5\x20\
+\xa6\x7a\x92\x7a\xb2\x44\xa1\xae\x23\x92\x50\x78\x49\xa8\x24\x21\
+\x58\x08\x20\x66\xdd\x78\x04\x1e\x80\x2d\xa2\xa8\x40\x90\x83\x60\
+\x9d\xa7\xba\x2e\x26\x92\x8b\x8d\x8e\xe6\x1e\xdd\xb0\xe1\x57\xf6\
+\xf9\xb9\x00\x00\x09\xcb\x49\x44\x41\x54\x71\xeb\x40\x3a\xba\x6c\
+\x32\x79\xba\x42\x78\x0b\x59\x4b\xe2\x10\x30\x16\x0e\x00\x14\x78\
+\xcb\x81\x78\x25\x9d\x5e\xe8\x78\xde\x42\xcf\x73\xe6\xc1\xf1\xe6\
+\x3b\xc0\xf1\x9e\x62\x3e\xa0\xf3\x1d\xa0\x43\x21\xb3\x01\x99\x03\
+\x68\x27\x80\xd9\xfb\xfe\x38\x66\x12\x2f\x37\x04\x60\x18\xc0\x2e\
+\x00\x55\x40\x86\x01\x6f\x18\x90\xc7\x20\xd8\x2c\xc0\x66\x05\x36\
+\xa9\xea\x96\x98\xc8\xc6\x11\xd5\xcd\xe5\x72\x79\x0b\x78\xfb\x5d\
+\x4b\xc8\xb8\xee\x5d\x50\x9c\x65\xdd\x41\xcd\xc0\x21\xe0\x50\x1c\
+\x00\xa8\xe5\xb9\xae\x3b\xc3\xf3\xbc\x99\xfb\xff\xbc\xad\xad\x6d\
+\x76\x6c\x74\xb4\x6d\xff\x9f\x3b\xf5\xfa\xd0\x76\xd5\xe1\x56\x7e\
+\xee\x3d\x8d\x4f\x3a\x99\x7c\xa5\x40\x7e\x64\xdd\x41\xcd\xc2\x21\
+\xe0\x40\x1c\x00\x88\x88\xfe\x2a\x96\x4d\xba\xab\x15\x38\xd5\x3a\
+\x84\x9a\x85\x43\xc0\x7e\x8e\x75\x00\x11\x51\x80\xd4\x15\xfa\x7e\
+\xeb\x08\x6a\x26\x99\xe7\x78\xba\x2a\x93\x48\x2c\xb3\x2e\xb1\xc6\
+\x01\x80\x88\xe8\x00\xf9\x72\xf9\x4e\x00\x37\x58\x77\x50\x53\x75\
+\x42\x9c\x5f\x44\x7d\x08\xe0\x00\x40\x44\x74\x88\x98\x7a\x57\x00\
+\xd8\x63\xdd\x41\x4d\x15\xf9\x21\x20\xc8\xb7\x56\x11\x11\x99\x78\
+\x7c\x68\x68\xb0\xab\xa3\x5d\x01\x79\x9e\x75\x0b\x35\xd5\x4c\x08\
+\x5e\xd1\xd1\xd5\x75\x5b\xb5\x5a\xdd\x6c\x1d\xe3\x37\x6e\x02\x24\
+\x22\x1a\x9b\x93\x49\xba\xbf\x00\xc0\x21\xa0\xf5\x45\xf2\x51\xc2\
+\xbc\x04\x40\x44\x34\x36\x4f\x6a\xf1\xd7\x03\xe0\x41\x4e\xad\x2f\
+\x92\x97\x03\x38\x00\x10\x11\x1d\x46\x6e\x43\x6e\x40\xa1\x6f\xb7\
+\xee\x20\x5f\x74\x42\x64\x65\x2a\x95\x5a\x6a\x1d\xe2\x17\xee\x01\
+\x20\x22\x3a\x82\xc1\xa1\xa1\x47\x3a\xdb\x3b\x20\x82\xe5\xd6\x2d\
+\xd4\x6c\x72\x8c\x28\x2e\xee\x6a\x3f\xf6\xf6\xc1\xa1\xa1\x4d\xd6\
+\x35\xcd\xc6\x01\x80\xe8\xff\xb7\x77\x3f\x21\x72\x9e\x75\x00\xc7\
+\x7f\xcf\xec\x6e\x93\x34\x56\x93\x94\x12\x1a\xdb\x24\x6b\x36\xa4\
+\xa2\xb5\x4a\x0f\x81\x52\x6b\xd5\x8b\x82\x52\x44\x0a\x1e\x5a\x2a\
+\xf6\x5c\xb0\x42\x0b\x82\x78\xec\xa9\xfe\x69\x11\xec\xc1\x93\x8a\
+\xb4\x5a\x45\x68\xad\x48\xad\x36\x15\x04\x6f\x52\x51\x1a\x92\xdd\
+\x99\xdd\x6c\x97\xae\x68\xbb\x31\xdd\x26\xd9\x3f\xf3\x78\xa8\x81\
+\xb8\xcd\x9f\xfd\x33\x33\xef\xfb\xce\xf3\xf9\x9c\x36\x33\xef\xbc\
+\xf3\x90\xcb\x7e\x79\x9e\xdf\xcc\xc2\x55\xbc\x75\x7a\xe1\xd8\x9e\
+\x5d\x1f\xb8\x3e\x22\x1d\xad\x7a\x2d\xf4\xdd\x8e\x48\xe9\xde\x12\
+\x22\xc0\x10\x20\xc0\xfa\x8c\x4c\x1c\x18\x7f\x26\x47\xfe\x72\xd5\
+\x0b\x61\x20\x86\x7e\x30\xd0\x0c\x00\xc0\xfa\xac\x9e\x5b\x5d\xbe\
+\x3f\x22\x8e\x55\xbd\x10\x06\x62\xe8\x67\x02\xec\x00\x00\x6c\xc0\
+\xbe\x7d\xfb\xae\xdd\x31\x76\xcd\xf3\x11\xf1\xe9\xaa\xd7\xc2\x40\
+\x0c\xed\x4e\x80\x00\x00\xd8\x20\x11\x50\x9c\xa1\x8c\x00\x01\x00\
+\xb0\x09\x22\xa0\x38\x43\x17\x01\x02\x00\x60\x93\x44\x40\x71\x86\
+\x2a\x02\x04\x00\xc0\x16\x88\x80\xe2\x0c\x4d\x04\x08\x00\x80\x2d\
+\x12\x01\xc5\x19\x8a\x08\x10\x00\x00\x3d\x20\x02\x8a\xd3\xf8\x08\
+\x10\x00\x00\x3d\x22\x02\x8a\xd3\xe8\x08\x10\x00\x00\x3d\x24\x02\
+\x8a\xd3\xd8\x08\x10\x00\x00\x3d\x26\x02\x8a\xd3\xc8\x08\x10\x00\
+\x00\x7d\x20\x02\x8a\xd3\xb8\x08\x10\x00\x00\x7d\x22\x02\x8a\xd3\
+\xa8\x08\x10\x00\x00\x7d\x24\x02\x8a\xd3\x98\x08\x10\x00\x00\x7d\
+\x26\x02\x8a\xd3\x88\x08\x10\x00\x00\x03\x20\x02\x8a\x53\xfb\x08\
+\x10\x00\x00\x03\x22\x02\x8a\x53\xeb\x08\x10\x00\x00\x03\x24\x02\
+\x8a\x53\xdb\x08\x10\x00\x00\x03\x26\x02\x8a\x53\xcb\x08\x10\x00\
+\x00\x15\x10\x01\xc5\xa9\x5d\x04\x08\x00\x80\x8a\x88\x80\xe2\xd4\
+\x2a\x02\x04\x00\x40\x85\x44\x40\x71\x6a\x13\x01\x02\x00\xa0\x62\
+\x22\xa0\x38\xb5\x88\x00\x01\x00\x50\x03\x22\xa0\x38\x95\x47\x80\
+\x00\x00\xa8\x09\x11\x50\x9c\x4a\x23\x40\x00\x00\xd4\x88\x08\x28\
+\x4e\x65\x11\x20\x00\x00\x6a\x46\x04\x14\xa7\x92\x08\x10\x00\x00\
+\x35\x24\x02\x8a\x33\xf0\x08\x10\x00\x00\x35\x25\x02\x8a\x33\xd0\
+\x08\x10\x00\x00\x35\x26\x02\x8a\x33\xb0\x08\x10\x00\x00\x35\x27\
+\x02\x8a\x33\x90\x08\x10\x00\x00\x0d\x20\x02\x8a\xd3\xf7\x08\x10\
+\x00\x00\x0d\x21\x02\x8a\xd3\xd7\x08\x10\x00\x00\x0d\x22\x02\x8a\
+\xd3\xb7\x08\x10\x00\x00\x0d\x23\x02\x8a\xd3\x97\x08\x10\x00\x00\
+\x0d\x24\x02\x8a\xd3\xf3\x08\x10\x00\x00\x0d\x25\x02\x8a\xd3\xd3\
+\x08\x10\x00\x00\x0d\x26\x02\x8a\xd3\xb3\x08\x10\x00\x00\x0d\x27\
+\x02\x8a\xd3\x93\x08\x10\x00\x00\x43\x40\x04\x14\x67\xcb\x11\x20\
+\x00\x00\x86\x84\x08\x28\xce\x96\x22\x40\x00\x00\x0c\x11\x11\x50\
+\x9c\x4d\x47\x40\xab\x1f\xab\x01\xa0\x1a\x73\x73\x73\xef\xec\x3c\
+\x77\xf6\x8b\x39\xc7\x2b\x55\xaf\x85\x81\xd8\x1d\xa9\xf5\xdb\xf1\
+\xf1\xf1\x23\x1b\x7d\xa1\x1d\x00\x80\x21\x64\x27\xa0\x34\x79\x36\
+\x46\x47\xef\x98\x9c\x9c\x3c\xb5\xde\x57\xd8\x01\x00\x18\x42\x73\
+\x73\x73\xef\x9c\x5d\x5e\xfa\x42\x44\xfc\xb1\xea\xb5\x30\x08\xe9\
+\xa6\x58\x59\x79\x61\xff\xfe\xfd\xbb\xd7\xfb\x0a\x01\x00\x30\xa4\
+\x1c\x07\x94\x26\x7d\x74\x2c\xb5\x7e\x75\x77\xc4\xe8\x7a\xae\x1e\
+\xe9\xf3\x6a\x00\xa8\xd0\xfc\xe2\xe2\xf2\x8e\x9d\xd7\xfe\x7c\x6c\
+\x64\xe4\x8e\x88\x18\xaf\x7a\x3d\xf4\xdd\xc1\xff\xec\xda\x3d\xf2\
+\xd6\xe9\x85\x3f\x5c\xed\x42\x33\x00\x00\x05\x30\x13\x50\x94\x6e\
+\x37\xa7\xcf\xb5\x67\xda\x2f\x5e\xe9\x22\x01\x00\x50\x08\x11\x50\
+\x94\xf9\xd5\x14\x1f\xef\x74\x3a\x6f\x5c\xee\x02\x33\x00\x00\x85\
+\x30\x13\x50\x94\xbd\x23\x11\x4f\x5c\xe9\x02\x3b\x00\x00\x85\xb1\
+\x13\x50\x92\xfc\x99\xc9\xe9\xe9\x4b\x7e\x12\xc4\x0e\x00\x40\x61\
+\x7c\x44\xb0\x24\xe9\x07\xb7\xdf\x7e\xfb\xd8\xa5\x9e\xf1\x29\x00\
+\x80\x02\x9d\x39\x73\x66\xf9\xe6\xed\xdb\x9e\x5d\x1a\x19\xbb\x33\
+\xa5\x38\x50\xf5\x7a\xe8\x9b\x1b\xce\x2d\x9e\xfd\xd7\x5b\xa7\x17\
+\xfe\xb2\xf6\x09\x47\x00\x00\x05\x73\x1c\x50\x84\xf9\xf3\xab\x2b\
+\xe3\xb3\xb3\xb3\x67\x2f\x7e\xd0\x11\x00\x40\xc1\x1c\x07\x14\x61\
+\xef\xb6\xd6\xd8\xfd\x6b\x1f\x14\x00\x00\x85\x13\x01\x05\x48\xf9\
+\xd1\x58\x73\xec\x2f\x00\x00\xf0\x11\xc1\xe1\x77\xe8\x43\x07\x0e\
+\xdc\x73\xf1\x03\x02\x00\x80\x88\x88\x78\x75\x7e\x7e\xf1\xdc\xca\
+\xd2\xe7\xc3\x4e\xc0\x70\x4a\xe9\xab\xff\xf7\xcf\x8a\x96\x01\x40\
+\x4d\x19\x0c\x1c\x5a\xcb\x63\x2b\xcb\x37\xbe\xf6\xfa\xeb\xff\x8e\
+\xb0\x03\x00\xc0\x1a\x66\x02\x86\xd6\xd8\xca\xe8\x35\x5f\xba\xf0\
+\x0f\x01\x00\xc0\x7b\x98\x09\x18\x4e\x39\xe2\x2b\x17\x7e\x76\x04\
+\x00\xc0\x65\x39\x0e\x18\x3a\xe7\xcf\xaf\xae\xec\x9e\x9d\x9d\x3d\
+\x6b\x07\x00\x80\xcb\x72\x1c\x30\x74\xb6\x6d\x1f\x1d\x3d\x1a\xe1\
+\x08\x00\x80\xab\x10\x01\xc3\xa5\xdb\x8d\x4f\x45\x08\x00\x00\xd6\
+\xc1\x4c\xc0\xf0\x48\x29\xee\x8a\x10\x00\x00\xac\x93\xef\x09\x18\
+\x1a\xb7\x46\x18\x02\x04\x60\x83\x0c\x06\x36\xdf\x72\xee\xee\xb1\
+\x03\x00\xc0\x86\x98\x09\x68\xbe\xd1\x3c\x7a\x48\x00\x00\xb0\x61\
+\x22\xa0\xe1\x46\xba\x87\x05\x00\x00\x9b\x22\x02\x9a\xab\x95\xf3\
+\x8d\x02\x00\x80\x4d\x13\x01\xcd\xd4\xcd\xe9\x3a\x01\x00\xc0\x96\
+\x88\x80\xe6\x49\x29\xbf\x4f\x00\x00\xb0\x65\x22\xa0\x61\xec\x00\
+\x00\xd0\x2b\xbe\x2c\xa8\x39\x52\x8a\x31\x01\x00\x40\xcf\xf8\xb2\
+\xa0\x66\xc8\x29\xde\x16\x00\x00\xf4\x94\xe3\x80\x06\xc8\x49\x00\
+\x00\xd0\x7b\x22\xa0\xde\x52\xca\x02\x00\x80\xfe\x30\x13\x50\x5f\
+\xdd\x88\x05\x01\x00\x40\xdf\x98\x09\xa8\xa7\x56\x4a\x93\xfe\x18\
+\x10\x00\x7d\xe7\x0f\x08\xd5\xcb\x48\xee\x1e\x12\x00\x00\x0c\x84\
+\x08\xa8\x8d\xa5\x9b\xa7\x3b\x3b\x1d\x01\x00\x30\x10\x66\x02\x6a\
+\x63\xf2\xe5\x88\x15\x01\x00\xc0\xc0\x98\x09\xa8\x5e\x8e\xf4\xe7\
+\x88\x08\x01\x00\xc0\x40\xf9\x88\x60\xb5\x52\xca\x7f\x8a\x10\x00\
+\x00\x54\x40\x04\x54\x67\x34\xe7\x57\x22\x04\x00\x00\x15\x31\x13\
+\x50\x89\x99\xe3\xd3\xd3\xed\x08\x01\x00\x40\x85\xcc\x04\x0c\x56\
+\x8e\xf8\xe5\x85\x9f\x05\x00\x00\x95\x72\x1c\x30\x38\xb9\x95\x9e\
+\xbe\xf0\xb3\xef\x01\x00\xa0\x16\x7c\x4f\x40\xdf\x4d\x4d\x4e\x77\
+\x26\x22\x22\x47\xd8\x01\x00\xa0\x26\xcc\x04\xf4\x5b\x7a\x3a\xfe\
+\xf7\xcb\x3f\x42\x00\x00\x50\x23\x66\x02\xfa\x66\x39\x46\x5b\x4f\
+\x5d\xfc\x80\x00\x00\xa0\x56\xcc\x04\xf4\x5e\x8a\xf8\xe9\xe4\xe4\
+\xe4\xa9\x8b\x1f\x13\x00\x00\xd4\x8e\x08\xe8\xa9\x1c\xb9\xfb\x9d\
+\xb5\x0f\x0a\x00\x00\x6a\xc9\x4c\x40\x8f\xa4\x78\xee\xe4\xcc\xcc\
+\xdf\xd7\x3e\x2c\x00\x00\xa8\x2d\x33\x01\x5b\xb6\xd4\x4d\xe9\xd1\
+\x4b\x3d\x21\x00\x00\xa8\x35\xc7\x01\x5b\x90\xe2\xfb\xed\x76\xfb\
+\xf8\xa5\x9e\x12\x00\x00\xd4\x9e\x08\xd8\x94\xf9\xdc\x6a\x3d\x76\
+\xb9\x27\x05\x00\x00\x8d\x60\x26\x60\x63\x52\x4e\x0f\x4d\x4d\x4d\
+\x9d\xbe\xdc\xf3\x02\x00\x80\xc6\x30\x13\xb0\x5e\xf9\x47\x27\x67\
+\xda\xbf\xb8\xd2\x15\x02\x00\x80\x46\x71\x1c\x70\x15\x39\x4e\x8c\
+\x6e\xdf\xfe\x8d\xab\x5d\xe6\x6f\x01\x00\xd0\x48\x1f\xdb\xbb\x77\
+\xe7\xdb\xdb\x76\xbc\x90\x52\xdc\x55\xf5\x5a\x6a\xe4\x5c\xb7\x95\
+\x8e\xb6\xdb\xed\x57\xaf\x76\xa1\x1d\x00\x00\x1a\xc9\x71\xc0\x7b\
+\x74\x53\x4e\xf7\xaf\xe7\x97\x7f\x84\x00\x00\xa0\xc1\x1c\x07\x5c\
+\x24\xc7\xc3\x27\x67\xda\xcf\xae\xf7\x72\x01\x00\x40\xa3\x89\x80\
+\x88\x88\xf4\xd8\xe4\x4c\xe7\xc9\x8d\xbc\x42\x00\x00\xd0\x78\x17\
+\x3e\x22\x18\x39\x7e\x57\xf5\x5a\x06\x2d\x47\xfa\xee\xe4\x74\xfb\
+\x5b\x1b\x7d\xdd\x48\x3f\x16\x03\x00\x83\x36\xbf\xb8\xb8\x7c\xdb\
+\xe9\x85\xa7\xcf\xec\xda\x75\x53\x44\x7c\xa2\xea\xf5\x0c\x40\xce\
+\x39\xbe\x39\x35\xd3\xf9\xf6\x66\x5e\x2c\x00\x00\x18\x1a\x9d\x88\
+\xee\x9b\xa7\x17\x9e\xbb\x7e\xf7\xae\xed\x11\x71\x67\xd5\xeb\xe9\
+\xa3\xa5\x1c\xf9\x81\xa9\x99\xe9\xa7\x36\x7b\x03\x01\x00\xc0\xd0\
+\x79\x73\x61\xe1\xf7\x7b\x76\xef\x7a\x23\x22\x3e\x1b\x11\x63\x55\
+\xaf\xa7\xa7\x72\x9c\xca\xd1\xba\x67\x6a\xa6\xf3\x9b\xad\xdc\xc6\
+\xf7\x00\x00\x30\xb4\x0e\x1f\x38\xf0\xe1\x6e\x4a\xcf\x44\x8e\x5b\
+\xab\x5e\x4b\x8f\xfc\xfa\xfc\xea\xca\x83\xb3\xb3\xb3\x6f\x6e\xf5\
+\x46\x02\x00\x80\xa1\xb6\x6f\xdf\xbe\x6b\x77\x8c\x8d\x3d\x11\x91\
+\x1e\x8c\x86\xfe\xde\xcb\x11\x8b\x91\xe2\x91\xa9\x4e\xe7\x87\xbd\
+\xba\x67\x23\xff\x23\x00\x60\xa3\x0e\x8f\x8f\xdf\x95\xbb\xf9\xc9\
+\x1c\x71\x5b\xd5\x6b\xd9\x88\x14\xf9\xf9\x95\x94\x1e\xea\x74\x3a\
+\x9d\xde\xde\x17\x00\xca\xd1\x3a\xb4\x7f\xfc\xbe\x48\xf9\xf1\x88\
+\xb8\xa1\xea\xc5\x5c\x49\x8a\x78\x2d\x52\x7c\xfd\x64\xa7\xd3\x97\
+\x8f\x36\x0a\x00\x00\x8a\x73\xe4\xc8\x91\xeb\x96\xcf\x9e\xff\x5a\
+\x4a\xf1\x48\x44\x7c\xb0\xea\xf5\x5c\x2c\x47\xfc\x35\xe5\xf4\xbd\
+\x9b\x67\xda\x3f\x7b\x39\x62\xa5\x5f\xef\x23\x00\x00\x28\xd6\xc4\
+\xc4\xc4\xb6\xbc\xb4\xfa\x40\x4a\xf9\xe1\x1c\x71\x4b\x85\x4b\x59\
+\x8d\x88\x17\x73\xee\x3e\x3e\x35\x33\xf3\xd2\x20\xde\x50\x00\x00\
+\x40\x44\x4c\xec\xdf\xff\x91\x68\xb5\xee\xcd\x39\xee\x8b\x88\x43\
+\x03\x7a\xdb\x7f\xe4\x1c\x3f\x1e\xcb\xab\x3f\x39\x7e\xea\xd4\xdc\
+\x80\xde\x33\x22\x04\x00\x00\xac\x95\x26\x0e\x1e\x3c\xda\x8d\xb8\
+\x3b\xe5\xf8\x64\xbc\xfb\x85\x42\xef\xef\xc9\x9d\x73\x9c\xca\x29\
+\x1f\x6b\x45\xeb\xd8\x48\x74\x5f\x3a\x3e\x3d\xdd\xee\xc9\x7d\x37\
+\x41\x00\x00\xc0\x95\x8d\x1c\x3e\x78\xf0\xd6\x6e\xc4\x2d\x91\xd3\
+\x44\xe4\x3c\x11\x29\x4d\x44\xe4\x3d\x11\xb1\x33\x22\xae\x8b\x77\
+\x03\x61\x25\x45\x2c\xe6\x88\x85\x88\x78\x3b\x22\xff\x33\x45\x3a\
+\x11\x91\x4f\x46\x6e\x9d\x58\x69\xe5\xbf\xf5\x7a\x92\x7f\x2b\xfe\
+\x0b\x57\x6a\xb4\xba\xdf\x84\x70\x51\x00\x00\x00\x00\x49\x45\x4e\
+\x44\xae\x42\x60\x82\
+\x00\x00\x1e\xce\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x02\x00\x00\x00\x02\x00\x08\x06\x00\x00\x00\xf4\x78\xd4\xfa\
+\x00\x00\x00\x04\x73\x42\x49\x54\x08\x08\x08\x08\x7c\x08\x64\x88\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
+\x01\x95\x2b\x0e\x1b\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\
+\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\
+\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x1e\x4b\x49\x44\
+\x41\x54\x78\x9c\xed\xdd\xdf\xcf\x6e\x69\x79\x17\xf0\x2f\x88\xcc\
+\x40\x81\x40\x6b\xeb\xb4\x14\x28\xd0\xa1\x51\x23\x6d\x0d\x6d\xfd\
+\x91\xd4\x42\x7f\xa4\x85\x73\xf5\xd0\x68\xe2\x41\x4d\x4c\xeb\x89\
+\x27\xc6\x04\x43\xc4\x54\xa2\x4d\x6c\x89\xd5\x36\x1a\x0f\x5a\xff\
+\x81\xa2\x51\x4b\x63\x13\x21\x50\x4d\x07\x9b\x1a\x95\x50\xe4\x47\
+\x5b\x84\x26\x40\x99\x01\x66\xda\x66\x3c\x78\xf6\xee\xec\xd9\xfb\
+\xd9\xef\xfb\xfc\x58\x6b\x5d\xf7\xbd\xae\xcf\x27\x79\x4f\x20\x79\
+\xd6\xba\xd9\xdc\xef\x73\xad\xeb\xbd\xd7\xf5\x4d\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\xfb\xbd\xa0\xfa\
+\x06\x80\x4d\xbc\x22\xc9\x3b\x92\xbc\x2d\xc9\xb7\x27\xf9\x96\x24\
+\xaf\xbc\xf3\xdf\x7d\x21\xc9\xff\x4d\xf2\x44\x92\xf7\x27\xf9\xc5\
+\x24\x5f\xda\xfc\x0e\x01\x80\xc5\xbc\x29\xc9\xcf\x25\x79\x2a\xc9\
+\xb3\x27\xfe\x3c\x95\xe4\x67\x93\x3c\x5e\x70\xbf\x00\xc0\x15\x5e\
+\x92\xe4\x3d\x49\x7e\x3f\xa7\x7f\xf1\xdf\xff\xf3\x4c\x92\x9f\x48\
+\xf2\xe8\xc6\xf7\x0e\x00\x5c\xe0\xf1\x24\xbf\x9e\xcb\xbf\xf8\xef\
+\xff\xf9\x60\x92\x6f\xdc\x74\x05\x00\xc0\x59\xbe\x33\xc9\x67\xb3\
+\xdc\x97\xff\xdd\x9f\x4f\x25\x79\xf3\x86\xeb\x00\x00\x4e\xf4\x78\
+\xd6\xf9\xf2\xbf\xb7\x08\x78\x6c\xb3\xd5\x00\x00\xb7\x7a\x34\x87\
+\x53\xfc\x6b\x7d\xf9\xdf\xfd\xf9\x6f\x39\x9c\x2f\x00\x00\x06\xf0\
+\x9e\xac\xff\xe5\x7f\xf7\xe7\x9d\x1b\xad\x09\x00\xb8\xc1\x9b\x72\
+\xdd\x69\xff\x73\x7f\xbe\x14\x7f\x0a\x00\x80\x72\x3f\x97\xed\xbe\
+\xfc\xef\xfe\xbc\x77\x93\x95\x01\x00\x47\xbd\x22\xe7\x0d\xf9\x59\
+\xea\xe7\xc9\x24\x2f\xdf\x60\x7d\xc0\x4a\x5e\x58\x7d\x03\xc0\x55\
+\xde\x91\xe4\xa5\x05\xd7\xfd\x9a\x24\x6f\x2f\xb8\x2e\xb0\x10\x05\
+\x00\xcc\xed\x6d\x4d\xaf\x0d\x5c\x49\x01\x00\x73\xfb\xf6\xc2\x6b\
+\x1b\x0c\x04\x13\x53\x00\xc0\xdc\x5e\x5f\x78\xed\x37\x14\x5e\x1b\
+\xb8\x92\x38\x60\x98\xdb\xd3\x49\x5e\x5c\x78\x6d\x41\x41\x30\x29\
+\x05\x00\xcc\xed\xd9\xe2\xeb\xfb\x1d\x02\x93\xf2\x27\x00\x00\x68\
+\x48\x01\x00\x00\x0d\x29\x00\x00\xa0\x21\x05\x00\x00\x34\xa4\x00\
+\x00\x80\x86\x14\x00\x00\xd0\x90\x02\x00\x00\x1a\x52\x00\x00\x40\
+\x43\x0a\x00\x00\x68\x48\x01\x00\x00\x0d\x29\x00\x00\xa0\x21\x05\
+\x00\x00\x34\xa4\x00\x00\x80\x86\x14\x00\x00\xd0\x90\x02\x00\x00\
+\x1a\x7a\x51\xf5\x0d\xc0\x46\x5e\x92\xe4\xfb\x93\x7c\x6f\x92\xbf\
+\x98\xe4\xd5\x49\xbe\xf6\xce\x7f\xfe\x99\x24\x9f\x4c\xf2\x3f\x93\
+\xbc\x2f\xc9\x7f\x4a\xf2\x54\xcd\x6d\xb2\x92\x97\x26\x79\x5b\x92\
+\x1f\x49\xf2\xe6\x24\xaf\x49\xf2\x4d\x49\x9e\x4e\xf2\xf9\x1c\xfe\
+\x3f\xf0\x81\x24\xbf\x92\xc3\xbf\xff\x97\x6a\x6e\x13\x80\xa5\xbc\
+\x3a\xc9\xbb\x93\xfc\x6e\x92\x67\x4f\xfc\xf9\x4a\x92\x7f\x91\xe4\
+\x75\x05\xf7\x7b\xae\x53\xd7\xb4\xd6\xcf\xe8\x5e\x93\xe4\xa7\x92\
+\x7c\x39\xa7\xaf\xe9\x8b\x49\x7e\x32\xc9\x1b\x0b\xee\x17\x80\x2b\
+\xfd\xb1\x24\x3f\x96\xe4\xc9\x5c\xfe\xe5\xf6\x74\x92\xf7\x24\x79\
+\x64\xe3\x7b\x3f\x87\x02\xe0\xb8\x17\x27\xf9\xc7\x49\xbe\x9a\xcb\
+\xd7\xf6\xd5\x24\xff\xe0\xce\x67\x01\x30\x81\x6f\x48\xf2\x5f\xb3\
+\xdc\x97\xdc\x7f\x4f\xf2\xad\x9b\xae\xe0\x74\x0a\x80\x07\x7d\x6b\
+\x92\x5f\xcd\x72\x6b\xfc\x48\x92\xd7\x6e\xba\x02\x00\xce\xf6\xda\
+\x24\xff\x2b\xcb\x7f\xd1\x7d\x36\xc9\x9f\xd9\x70\x1d\xa7\x52\x00\
+\x3c\xdf\x9b\x92\xfc\x4e\x96\x5f\xe7\x6f\xe7\x70\x76\x00\x80\x01\
+\xfd\x89\x24\x1f\xcf\x7a\x5f\x76\xbf\x9d\xf1\x3a\x01\x0a\x80\xe7\
+\xbc\x31\xc9\x6f\x65\xbd\xb5\x7e\x36\x3a\x01\x00\xc3\x79\x61\x0e\
+\x27\xf8\xd7\xfe\xc2\x7b\x22\x63\xfd\x4d\x58\x01\x70\xf0\xa2\x24\
+\x1f\xce\xfa\xeb\xfd\x50\xc6\x3e\x13\x02\xd0\xce\x8f\x67\xbb\x2f\
+\xbd\x77\x6d\xb4\xa6\x53\x28\x00\x0e\xde\x95\xed\xd6\xfc\xee\x8d\
+\xd6\x04\xc0\x2d\x5e\x91\xf3\x5e\xf3\xbb\xf6\xe7\xf7\x33\xce\x2b\
+\x82\x0a\x80\xe4\x5b\x72\xf8\x37\xd9\x6a\xcd\x5f\xce\x61\x86\x00\
+\x4c\xcd\x24\x40\xf6\xe0\xc7\x92\x7c\xdd\x86\xd7\x7b\x51\x92\xbf\
+\xbb\xe1\xf5\xb8\xd9\x8f\x67\xdb\xa1\x66\x2f\x49\xf2\xf7\x37\xbc\
+\x1e\x00\x47\x3c\x9a\xe4\x73\xd9\xfe\xc9\xf7\xc9\x24\x2f\xdf\x60\
+\x7d\xb7\xe9\xde\x01\x78\x79\xae\x9b\xf5\x70\xe9\xcf\x57\x72\x38\
+\x74\x0a\xd3\xd2\x01\x60\x76\x7f\x35\x35\xbf\x88\xbf\x26\xc9\xf7\
+\x15\x5c\x97\xe7\x7b\x6b\x0e\xff\x16\x5b\x7b\x34\xc9\xdf\x28\xb8\
+\x2e\x2c\x46\x01\xc0\xec\x7e\xb4\xf0\xda\xdf\x5f\x78\x6d\x0e\x7e\
+\xa0\xf0\xda\x3f\x9a\xc3\xc4\x49\x98\x92\x02\x80\x99\xbd\x25\xc9\
+\x77\x17\x5e\xbf\xf2\xda\x1c\x7c\x57\xe1\xb5\x5f\x97\xe4\x87\x0b\
+\xaf\x0f\x57\x51\x00\x30\xb3\xbf\x5d\x7c\xfd\xc7\x8a\xaf\x4f\xfd\
+\xbf\x41\x65\x07\x0a\xae\xf2\x82\xea\x1b\x80\x0b\xbd\x2a\xc9\xa7\
+\x73\x88\x79\xad\xf2\xe5\xd4\xfc\xfd\xf9\x5e\xd5\x07\xf1\xaa\x7f\
+\x87\x3c\x95\xda\xff\x0f\x3c\x9b\xe4\xdb\x92\x7c\xb4\xf0\x1e\xe0\
+\x22\x3a\x00\xcc\xea\x6f\xa6\xf6\x17\x7f\x06\xb8\x3e\xf5\xff\x06\
+\x2f\x48\xf2\xb7\x8a\xef\x01\x2e\x52\x5d\xbd\xc3\x25\x5e\x90\xe4\
+\x7f\x27\x79\xbc\xfa\x46\x52\xbf\x87\xba\x77\x00\xaa\xd7\x9f\x24\
+\x9f\x4f\xf2\xcd\x39\x74\x84\x60\x1a\x3a\x00\xcc\xe8\x47\x32\xc6\
+\x97\x3f\x24\x87\x3f\x47\xfd\x95\xea\x9b\x80\x73\x29\x00\x98\x91\
+\x83\x57\x8c\xe6\xef\x54\xdf\x00\x9c\xab\xba\x7d\x07\xe7\x7a\x5d\
+\x92\x8f\x65\x9c\xf7\xaf\xab\xf7\x50\x75\x0b\xbc\xfb\xfa\xef\xf5\
+\x3d\x39\x24\x12\xc2\x14\x74\x00\x98\x8d\xe1\x2b\x8c\x4a\x67\x8a\
+\xa9\x54\x57\xef\x70\x8e\x47\x92\x7c\x32\xc9\x37\x54\xdf\xc8\x3d\
+\xaa\xf7\x50\xf5\x13\x70\xf7\xf5\xdf\xeb\xe9\x24\xaf\x4d\xf2\xd9\
+\xea\x1b\x81\x53\xe8\x00\x30\x93\xbf\x96\xb1\xbe\xfc\xe1\x5e\x8f\
+\x24\xf9\xeb\xd5\x37\x01\xa7\xaa\xae\xde\xe1\x1c\x1f\xca\x78\xe3\
+\x77\xab\xf7\x50\xf5\x13\x70\xf7\xf5\xdf\xef\x13\x49\xde\x98\xe4\
+\x0f\xab\x6f\x04\x6e\xa3\x03\xc0\x2c\xbe\x33\xe3\x7d\xf9\xc3\xfd\
+\xe4\x03\x30\x0d\x05\x00\xb3\xf0\x9a\x15\xb3\x70\x18\x90\x29\x54\
+\xb7\xef\xe0\x14\x23\xcc\xfd\x7f\x98\xea\x3d\x54\xdd\x02\xef\xbe\
+\xfe\x63\xe4\x03\x30\x05\x1d\x00\x66\x30\xc2\xdc\x7f\x38\x95\x7c\
+\x00\xa6\x50\x5d\xbd\xc3\x6d\x46\x9a\xfb\x7f\x4c\xf5\x1e\xaa\x7e\
+\x02\xee\xbe\xfe\x87\x91\x0f\xc0\xf0\x74\x00\x18\x9d\xb9\xff\xcc\
+\x48\x3e\x00\xc3\x53\x00\x30\x3a\x07\xaa\x98\x95\x83\xab\x0c\xad\
+\xba\x7d\x07\x37\x19\x6d\xee\xff\x31\xd5\x7b\xa8\xba\x05\xde\x7d\
+\xfd\xb7\x91\x0f\xc0\xb0\x74\x00\x18\x99\xb9\xff\xcc\x4e\x07\x8b\
+\x61\x55\x57\xef\xf0\x30\x23\xce\xfd\x3f\xa6\x7a\x0f\x55\x3f\x01\
+\x77\x5f\xff\x6d\xe4\x03\x30\x2c\x1d\x00\x46\x65\xee\x3f\x7b\x20\
+\x1f\x80\x61\x55\x57\xef\xf0\x30\x23\xce\xfd\x3f\xa6\x7a\x0f\x55\
+\x3f\x01\x77\x5f\xff\x29\xe4\x03\x30\x24\x1d\x00\x46\x64\xee\x3f\
+\x7b\x22\x1f\x80\x21\x29\x00\x18\x91\xd7\xa7\xd8\x1b\x87\x01\x19\
+\x4e\x75\xfb\x0e\xee\x37\xf2\xdc\xff\x63\xaa\xf7\x50\x75\x0b\xbc\
+\xfb\xfa\x4f\x25\x1f\x80\xe1\xe8\x00\x30\x1a\x73\xff\xd9\x23\xf9\
+\x00\x0c\xa7\xba\x7a\x87\x7b\x8d\x3e\xf7\xff\x98\xea\x3d\x54\xfd\
+\x04\xdc\x7d\xfd\xe7\x90\x0f\xc0\x50\x74\x00\x18\x89\xb9\xff\xec\
+\x99\x7c\x00\x86\xa2\x00\x60\x24\x0e\x4a\xb1\x77\x0e\xb8\x32\x8c\
+\xea\xf6\x1d\xdc\x35\xc3\xdc\xff\x63\xaa\xf7\x50\x75\x0b\xbc\xfb\
+\xfa\x2f\x21\x1f\x80\x21\xe8\x00\x30\x0a\x73\xff\xe9\x42\xa7\x8b\
+\x21\x54\x57\xef\x90\xcc\x33\xf7\xff\x98\xea\x3d\x54\xfd\x04\xdc\
+\x7d\xfd\x97\x90\x0f\xc0\x10\x74\x00\x18\x81\xb9\xff\x74\x22\x1f\
+\x80\x21\x54\x57\xef\x90\xcc\x33\xf7\xff\x98\xea\x3d\x54\xfd\x04\
+\xdc\x7d\xfd\x97\x92\x0f\x40\x39\x1d\x00\xaa\x99\xfb\x4f\x47\xf2\
+\x01\x28\xa7\x00\xa0\x9a\xd7\xa2\xe8\xca\x61\x40\x4a\x55\xb7\xef\
+\xe8\x6d\xb6\xb9\xff\xc7\x54\xef\xa1\xea\x16\x78\xf7\xf5\x5f\x43\
+\x3e\x00\xa5\x74\x00\xa8\x64\xee\x3f\x9d\xc9\x07\xa0\x54\x75\xf5\
+\x4e\x5f\x33\xce\xfd\x3f\xa6\x7a\x0f\x55\x3f\x01\x77\x5f\xff\xb5\
+\xe4\x03\x50\x46\x07\x80\x2a\xe6\xfe\x83\x7c\x00\x0a\x29\x00\xa8\
+\xe2\x00\x14\x1c\x38\x08\x4b\x89\xea\xf6\x1d\x3d\xcd\x3a\xf7\xff\
+\x98\xea\x3d\x54\xdd\x02\xef\xbe\xfe\xa5\xc8\x07\x60\x73\x3a\x00\
+\x54\x30\xf7\x1f\x9e\x4f\x47\x8c\xcd\x55\x57\xef\xf4\x33\xf3\xdc\
+\xff\x63\xaa\xf7\x50\xf5\x13\x70\xf7\xf5\x2f\x45\x3e\x00\x9b\xd3\
+\x01\x60\x6b\xe6\xfe\xc3\x83\xe4\x03\xb0\xb9\xea\xea\x9d\x7e\x66\
+\x9e\xfb\x7f\x4c\xf5\x1e\xaa\x7e\x02\xee\xbe\xfe\x25\xc9\x07\x60\
+\x53\x3a\x00\x6c\xc9\xdc\x7f\x78\x38\xf9\x00\x6c\x4a\x01\xc0\x96\
+\xbc\xee\x04\x37\x73\x18\x90\xcd\x54\xb7\xef\xe8\x63\x0f\x73\xff\
+\x8f\xa9\xde\x43\xd5\x2d\xf0\xee\xeb\x5f\x9a\x7c\x00\x36\xa3\x03\
+\xc0\x56\xcc\xfd\x87\xdb\xc9\x07\x60\x33\xd5\xd5\x3b\x3d\xec\x65\
+\xee\xff\x31\xd5\x7b\xa8\xfa\x09\xb8\xfb\xfa\xd7\x20\x1f\x80\x4d\
+\xe8\x00\xb0\x05\x73\xff\xe1\x74\xf2\x01\xd8\x84\x02\x80\x2d\x38\
+\xd8\x04\xe7\x71\x60\x96\xd5\x55\xb7\xef\xd8\xbf\x3d\xcd\xfd\x3f\
+\xa6\x7a\x0f\x55\xb7\xc0\xbb\xaf\x7f\x4d\xf2\x01\x58\x95\x0e\x00\
+\x6b\x33\xf7\x1f\x2e\xa3\x73\xc6\xaa\xaa\xab\x77\xf6\x6d\x6f\x73\
+\xff\x8f\xa9\xde\x43\xd5\x4f\xc0\xdd\xd7\xbf\x26\xf9\x00\xac\x4a\
+\x07\x80\x35\x99\xfb\x0f\x97\x93\x0f\xc0\xaa\xaa\xab\x77\xf6\x6d\
+\x6f\x73\xff\x8f\xa9\xde\x43\xd5\x4f\xc0\xdd\xd7\xbf\x36\xf9\x00\
+\xac\x46\x07\x80\xb5\x98\xfb\x0f\xd7\x93\x0f\xc0\x6a\x14\x00\xac\
+\xc5\x6b\x4c\xb0\x0c\x87\x01\x59\x45\x75\xfb\x8e\x7d\xda\xeb\xdc\
+\xff\x63\xaa\xf7\x50\x75\x0b\xbc\xfb\xfa\xb7\x20\x1f\x80\x55\xe8\
+\x00\xb0\x06\x73\xff\x61\x39\xf2\x01\x58\x45\x75\xf5\xce\xfe\xec\
+\x79\xee\xff\x31\xd5\x7b\xa8\xfa\x09\xb8\xfb\xfa\xb7\x22\x1f\x80\
+\xc5\xe9\x00\xb0\x34\x73\xff\x61\x79\xf2\x01\x58\x9c\x02\x80\xa5\
+\x39\xb0\x04\xeb\x70\xb0\x96\x45\x55\xb7\xef\xd8\x97\xbd\xcf\xfd\
+\x3f\xa6\x7a\x0f\x55\xb7\xc0\xbb\xaf\x7f\x6b\xf2\x01\x58\x8c\x0e\
+\x00\x4b\x32\xf7\x1f\xd6\xa5\xc3\xc6\x62\xaa\xab\x77\xf6\xa3\xc3\
+\xdc\xff\x63\xaa\xf7\x50\xf5\x13\x70\xf7\xf5\x6f\x4d\x3e\x00\x8b\
+\xd1\x01\x60\x29\xe6\xfe\xc3\xfa\xe4\x03\xb0\x98\xea\xea\x9d\xfd\
+\xe8\x30\xf7\xff\x98\xea\x3d\x54\xfd\x04\xdc\x7d\xfd\x15\xe4\x03\
+\xb0\x08\x1d\x00\x96\x60\xee\x3f\x6c\x47\x3e\x00\x8b\x50\x00\xb0\
+\x04\xaf\x27\xc1\xb6\x1c\x06\xe4\x6a\xd5\xed\x3b\xe6\xd7\x69\xee\
+\xff\x31\xd5\x7b\xa8\xba\x05\xde\x7d\xfd\x55\xe4\x03\x70\x35\x1d\
+\x00\xae\x65\xee\x3f\x6c\x4f\x3e\x00\x57\xab\xae\xde\x99\x5b\xb7\
+\xb9\xff\xc7\x54\xef\xa1\xea\x27\xe0\xee\xeb\xaf\x24\x1f\x80\xab\
+\xe8\x00\x70\x0d\x73\xff\xa1\x8e\x7c\x00\xae\xa2\x00\xe0\x1a\x0e\
+\x22\x41\x2d\x07\x70\xb9\x58\x75\xfb\x8e\x79\x75\x9c\xfb\x7f\x4c\
+\xf5\x1e\xaa\x6e\x81\x77\x5f\xff\x08\xe4\x03\x70\x11\x1d\x00\x2e\
+\x65\xee\x3f\x8c\x41\x27\x8e\x8b\x54\x57\xef\xcc\xa9\xeb\xdc\xff\
+\x63\xaa\xf7\x50\xf5\x13\x70\xf7\xf5\x8f\x40\x3e\x00\x17\xd1\x01\
+\xe0\x12\xe6\xfe\xc3\x38\xe4\x03\x70\x11\x05\x00\x97\xd0\x72\x84\
+\x83\x5f\xad\xbe\x81\x3b\xfc\x49\x8e\xb3\x29\x00\x38\x97\xb9\xff\
+\xf0\x9c\xf7\x56\xdf\xc0\x1d\xf2\x01\x38\x9b\x02\x80\x73\x79\xed\
+\x08\x9e\xf3\x0b\x49\x3e\x57\x7d\x13\x77\xe8\xcc\x71\x16\x05\x00\
+\xe7\x30\x78\x04\x9e\xef\xe9\x24\xff\xa6\xfa\x26\xee\x30\x98\x8b\
+\xb3\x28\x00\x38\x87\xb9\xff\xf0\xa0\x9f\x4e\xf2\x87\xd5\x37\x11\
+\xf9\x00\x9c\xa9\xfa\x15\x1e\xe6\x61\xee\xff\x71\xd5\x7b\xa8\xfa\
+\x35\x38\xeb\x3f\xf8\xc5\x24\x6f\xaf\xbc\x91\x3b\xe4\x03\x70\x32\
+\x1d\x00\x4e\xa5\xbd\x08\x0f\xf7\xd3\xd5\x37\x70\x87\x3f\xd3\x71\
+\x32\x05\x00\xa7\x72\xc0\x08\x1e\xee\xdf\x27\xf9\x68\xf5\x4d\xdc\
+\xe1\xa0\x2e\x27\x51\x00\x70\x0a\xaf\x18\xc1\xcd\x9e\x4d\xf2\xaf\
+\xaa\x6f\xe2\x0e\xaf\xea\x72\x12\x05\x00\xa7\x30\x64\x04\x6e\xf7\
+\xb3\x19\xe7\x6f\xef\x3a\x76\xdc\xaa\xfa\x00\x0f\xe3\x33\xf7\xff\
+\x66\xd5\x7b\x68\x94\x43\x70\x55\x46\x5b\xff\xbf\xce\x18\x63\x79\
+\xe5\x03\x70\x2b\x1d\x00\x6e\x63\xee\x3f\x9c\xee\x9f\x57\xdf\xc0\
+\x1d\xf2\x01\xb8\x55\x75\xf5\xce\xf8\x3e\x14\x7f\x4f\xbc\x49\xf5\
+\x1e\x1a\xed\x09\x78\x6b\x23\xae\xff\xc3\x49\xbe\x6b\xeb\x1b\x39\
+\xe2\x13\x49\xde\x98\x31\x66\x14\x30\x20\x1d\x00\x6e\xe2\x30\x11\
+\x9c\x4f\x3e\x00\x53\x50\x00\x70\x13\xaf\x13\xc1\xf9\xe4\x03\x30\
+\x05\x05\x00\x0f\x63\xa0\x08\x5c\x46\x3e\x00\x53\x50\x00\xf0\x30\
+\xe6\xfe\xc3\xe5\xe4\x03\x30\xbc\xea\x03\x3c\x8c\xc9\xdc\xff\xd3\
+\x55\xef\xa1\x11\x0f\xc1\x6d\x69\xe4\xf5\xcb\x07\x60\x68\x3a\x00\
+\x1c\xa3\x6d\x08\xd7\x93\x0f\xc0\xd0\x14\x00\x1c\xe3\xe0\x10\x5c\
+\x4f\x3e\x00\x43\x53\x00\x70\x3f\xaf\x0e\xc1\x32\xe4\x03\x30\x34\
+\x05\x00\xf7\x33\xf7\x1f\x96\x23\x1f\x80\x61\x55\x1f\xe0\x61\x2c\
+\xe6\xfe\x9f\xaf\x7a\x0f\x8d\x7c\x08\x6e\x0b\x33\xac\x5f\x3e\x00\
+\x43\xd2\x01\xe0\x5e\xe6\xfe\xc3\xf2\xe4\x03\x30\xa4\xea\xea\x9d\
+\xb1\x98\xfb\x7f\xbe\xea\x3d\x34\xc3\x13\xf0\x9a\x66\x59\xbf\x7c\
+\x00\x86\xa3\x03\xc0\x5d\x0e\x09\xc1\x7a\xe4\x03\x30\x1c\x05\x00\
+\x77\x79\x4d\x08\xd6\x23\x1f\x80\xe1\x28\x00\x48\x0c\x0a\x81\xb5\
+\xc9\x07\x60\x38\x0a\x00\x12\x73\xff\x61\x0b\xf2\x01\x18\x4a\xf5\
+\x01\x1e\xea\x99\xfb\x7f\x9d\xea\x3d\x34\xcb\x21\xb8\xb5\xcc\xb6\
+\x7e\xf9\x00\x0c\x43\x07\x00\xed\x40\xd8\x8e\x7c\x00\x86\xa1\x00\
+\xc0\x81\x20\xd8\x8e\x7c\x00\x86\xa1\x00\xe8\xcd\x2b\x41\xb0\x2d\
+\xf9\x00\x0c\x43\x01\xd0\x9b\xb9\xff\xb0\x3d\xf9\x00\x0c\xa1\xfa\
+\x00\x0f\x75\xcc\xfd\x5f\x46\xf5\x1e\x9a\xed\x10\xdc\xd2\x66\x5d\
+\xbf\x7c\x00\xca\xe9\x00\xf4\x65\xee\x3f\xd4\x91\x0f\x40\xb9\xea\
+\xea\x9d\x3a\xe6\xfe\x2f\xa3\x7a\x0f\xcd\xfa\x04\xbc\x94\x99\xd7\
+\x2f\x1f\x80\x52\x3a\x00\x3d\x39\xfc\x03\xf5\xe4\x03\x50\x4a\x01\
+\xd0\x93\xd7\x7f\xa0\x9e\x7c\x00\x4a\x29\x00\xfa\x31\x00\x04\xc6\
+\x20\x1f\x80\x52\x0a\x80\x7e\xcc\xfd\x87\x71\xc8\x07\xa0\x4c\xf5\
+\x01\x1e\xb6\x65\xee\xff\xf2\xaa\xf7\xd0\xcc\x87\xe0\x96\xb0\x87\
+\xf5\xcb\x07\xa0\x84\x0e\x40\x2f\xda\x7c\x30\x1e\xf9\x00\x94\x50\
+\x00\xf4\xe2\xa0\x0f\x8c\x47\x3e\x00\x25\x14\x00\x7d\x78\xd5\x07\
+\xc6\x24\x1f\x80\x12\x0a\x80\x3e\xcc\xfd\x87\x71\xc9\x07\x60\x73\
+\xd5\x07\x78\xd8\x86\xb9\xff\xeb\xa9\xde\x43\x7b\x38\x04\x77\x8d\
+\x3d\xad\x5f\x3e\x00\x9b\xd2\x01\xe8\xc1\xdc\x7f\x18\x9f\x7c\x00\
+\x36\x55\x5d\xbd\xb3\x0d\x73\xff\xd7\x53\xbd\x87\xf6\xf4\x04\x7c\
+\x89\xbd\xad\x5f\x3e\x00\x9b\xd1\x01\xd8\x3f\x87\x7a\x60\x1e\xf2\
+\x01\xd8\x8c\x02\x60\xff\xbc\xd6\x03\xf3\x90\x0f\xc0\x66\x14\x00\
+\xfb\x66\xb0\x07\xcc\x45\x3e\x00\x9b\x51\x00\xec\x9b\xb9\xff\x30\
+\x1f\xf9\x00\x6c\xa2\xfa\x00\x0f\xeb\x31\xf7\x7f\x1b\xd5\x7b\x68\
+\x6f\x87\xe0\xce\xb5\xd7\xf5\xcb\x07\x60\x75\x3a\x00\xfb\xa5\x7d\
+\x07\xf3\x92\x0f\xc0\xea\x14\x00\xfb\xe5\x00\x0f\xcc\x4b\x3e\x00\
+\xab\x53\x00\xec\x93\x57\x78\x60\x6e\xf2\x01\x58\x9d\x02\x60\x9f\
+\xcc\xfd\x87\xf9\xc9\x07\x60\x55\xd5\x07\x78\x58\x9e\xb9\xff\xdb\
+\xaa\xde\x43\x7b\x3d\x04\x77\xaa\xbd\xaf\x5f\x3e\x00\xab\xd1\x01\
+\xd8\x1f\x73\xff\x61\x3f\xe4\x03\xb0\x9a\xea\xea\x9d\xe5\x99\xfb\
+\xbf\xad\xea\x3d\xb4\xf7\x27\xe0\xdb\x74\x58\xbf\x7c\x00\x56\xa1\
+\x03\xb0\x2f\x0e\xeb\xc0\xfe\xc8\x07\x60\x15\x0a\x80\x7d\xf1\xba\
+\x0e\xec\x8f\x7c\x00\x56\xa1\x00\xd8\x0f\x03\x3b\x60\x9f\xe4\x03\
+\xb0\x0a\x05\xc0\x7e\x98\xfb\x0f\xfb\x25\x1f\x80\xc5\x55\x1f\xe0\
+\x61\x19\xe6\xfe\xd7\xa9\xde\x43\x1d\x0e\xc1\xdd\xa4\xd3\xfa\xe5\
+\x03\xb0\x28\x1d\x80\x7d\xd0\x96\x83\xfd\x93\x0f\xc0\xa2\x14\x00\
+\xfb\xe0\x60\x0e\xec\x9f\x7c\x00\x16\xa5\x00\x98\x9f\x57\x73\xa0\
+\x07\xf9\x00\x2c\x4a\x01\x30\x3f\x73\xff\xa1\x0f\xf9\x00\x2c\xa6\
+\xfa\x00\x0f\xd7\x31\xf7\xbf\x5e\xf5\x1e\xea\x74\x08\xee\x98\x8e\
+\xeb\x97\x0f\xc0\x22\x74\x00\xe6\x66\xee\x3f\xf4\x23\x1f\x80\x45\
+\x54\x57\xef\x5c\xc7\xdc\xff\x7a\xd5\x7b\xa8\xe3\x13\xf0\xbd\xba\
+\xae\x5f\x3e\x00\x57\xd3\x01\x98\x97\x43\x38\xd0\x97\x7c\x00\xae\
+\xa6\x00\x98\x97\xd7\x70\xa0\x2f\xf9\x00\x5c\x4d\x01\x30\x27\x83\
+\x38\xa0\x37\xf9\x00\x5c\x4d\x01\x30\x27\x73\xff\x01\xf9\x00\x5c\
+\xa5\xfa\x00\x0f\xe7\x33\xf7\x7f\x2c\xd5\x7b\xa8\xeb\x21\xb8\xbb\
+\xba\xaf\x5f\x3e\x00\x17\xd3\x01\x98\x8f\x76\x1b\x70\x97\x7c\x00\
+\x2e\xa6\x00\x98\x8f\x03\x37\xc0\x5d\xf2\x01\xb8\x98\x02\x60\x2e\
+\x5e\xb9\x01\xee\x25\x1f\x80\x8b\x29\x00\xe6\x62\xee\x3f\x70\x3f\
+\xf9\x00\x5c\xa4\xfa\x00\x0b\xa7\x33\xf7\x7f\x4c\xd5\x7b\xa8\xfb\
+\x21\xb8\xee\xeb\xbf\x4b\x3e\x00\x67\xd3\x01\x98\x87\xb9\xff\xc0\
+\xc3\xc8\x07\xe0\x6c\xa3\x54\xaf\xdc\xce\xdc\xff\x31\x55\xef\xa1\
+\xee\x4f\xc0\xdd\xd7\x7f\x2f\xf9\x00\x9c\x45\x07\x60\x0e\x0e\xd7\
+\x00\xb7\x91\x0f\xc0\x59\x14\x00\x73\xf0\x7a\x0d\x70\x1b\xf9\x00\
+\x9c\x45\x01\x30\x3e\x03\x36\x80\x53\xc8\x07\xe0\x2c\x0a\x80\xf1\
+\x99\xfb\x0f\x9c\x4a\x3e\x00\x27\x1b\xe9\x00\x0b\x0f\x32\xf7\x7f\
+\x7c\xd5\x7b\xa8\xfb\x21\xb8\xee\xeb\x3f\x46\x3e\x00\x27\xd1\x01\
+\x18\x9b\x36\x1a\x70\x2e\xf9\x00\x9c\x44\x01\x30\x36\x07\x69\x80\
+\x73\xc9\x07\xe0\x24\x0a\x80\x71\x79\x95\x06\xb8\x84\x7c\x00\x4e\
+\xa2\x00\x18\x97\xb9\xff\xc0\xa5\xe4\x03\x70\xab\x11\x0f\xb0\x60\
+\xee\xff\x4c\xaa\xf7\x50\xf7\x43\x70\xdd\xd7\x7f\x13\xf9\x00\xdc\
+\x48\x07\x60\x4c\xe6\xfe\x03\xd7\x92\x0f\xc0\x8d\x46\xae\x5e\x3b\
+\x33\xf7\x7f\x1e\xd5\x7b\xa8\xfb\x13\x70\xf7\xf5\xdf\x46\x3e\x00\
+\x0f\xa5\x03\x30\x1e\x87\x66\x80\xa5\xc8\x07\xe0\xa1\x14\x00\xe3\
+\xf1\xda\x0c\xb0\x14\xf9\x00\x3c\x94\x02\x60\x2c\x06\x67\x00\x4b\
+\x92\x0f\xc0\x43\x29\x00\xc6\x62\xee\x3f\xb0\x34\xf9\x00\x1c\x35\
+\xfa\x01\x96\x4e\xcc\xfd\x9f\x53\xf5\x1e\xea\x7e\x08\xae\xfb\xfa\
+\x4f\x25\x1f\x80\x07\xe8\x00\x8c\x43\x7b\x0c\x58\x8b\x7c\x00\x1e\
+\xa0\x00\x18\x87\x03\x32\xc0\x5a\xe4\x03\xf0\x00\x05\xc0\x18\xbc\
+\x22\x03\xac\x49\x3e\x00\x0f\x50\x00\x8c\xc1\xdc\x7f\x60\x6d\xf2\
+\x01\x78\x9e\x59\x0e\xb0\xec\x99\xb9\xff\x73\xab\xde\x43\xdd\x0f\
+\xc1\x75\x5f\xff\xb9\xe4\x03\xf0\x47\x74\x00\xea\x99\xfb\x0f\x6c\
+\x45\x3e\x00\x7f\x64\xb6\xea\x75\x8f\xcc\xfd\x9f\x5b\xf5\x1e\xea\
+\xfe\x04\xdc\x7d\xfd\x97\x90\x0f\x40\x12\x1d\x80\x6a\x0e\xc3\x00\
+\x5b\x93\x0f\x40\x12\x05\x40\x35\xaf\xc3\x00\x5b\x93\x0f\x40\x12\
+\x05\x40\x25\x03\x31\x80\x0a\xf2\x01\x48\xa2\x00\xa8\x64\xee\x3f\
+\x50\x45\x3e\x00\x53\x1e\x60\xd9\x03\x73\xff\xf7\xa3\x7a\x0f\x75\
+\x3f\x04\xd7\x7d\xfd\xd7\x90\x0f\xd0\x9c\x0e\x40\x0d\x6d\x2f\xa0\
+\x9a\x7c\x80\xe6\x14\x00\x35\x1c\x7c\x01\xaa\xc9\x07\x68\x4e\x01\
+\xb0\x3d\xaf\xbe\x00\x23\x90\x0f\xd0\x9c\x02\x60\x7b\xe6\xfe\x03\
+\xa3\x90\x0f\xd0\xd8\xcc\x07\x58\x66\x64\xee\xff\xfe\x54\xef\xa1\
+\xee\x87\xe0\xba\xaf\x7f\x09\xf2\x01\x9a\xd2\x01\xd8\x96\xb9\xff\
+\xc0\x68\xe4\x03\x34\xb5\x87\xea\x75\x26\xe6\xfe\xef\x4f\xf5\x1e\
+\xea\xfe\x04\xdc\x7d\xfd\x4b\x91\x0f\xd0\x90\x0e\xc0\x76\x1c\x72\
+\x01\x46\x25\x1f\xa0\x21\x05\xc0\x76\xbc\xe6\x02\x8c\x4a\x3e\x40\
+\x43\x0a\x80\x6d\x18\x74\x01\x8c\x4c\x3e\x40\x43\x0a\x80\x6d\x98\
+\xfb\x0f\x8c\x4e\x3e\x40\x33\x7b\x39\xc0\x32\x32\x73\xff\xf7\xad\
+\x7a\x0f\x75\x3f\x04\xd7\x7d\xfd\x4b\x93\x0f\xd0\x88\x0e\xc0\xfa\
+\xb4\xb3\x80\x59\xc8\x07\x68\x44\x01\xb0\x3e\x07\x5a\x80\x59\xc8\
+\x07\x68\x44\x01\xb0\x2e\xaf\xb4\x00\x33\x91\x0f\xd0\x88\x02\x60\
+\x5d\xe6\xfe\x03\xb3\x91\x0f\xd0\xc4\xde\x0e\xb0\x8c\xc4\xdc\xff\
+\x1e\xaa\xf7\x50\xf7\x43\x70\xdd\xd7\xbf\x16\xf9\x00\x0d\xe8\x00\
+\xac\xc7\xdc\x7f\x60\x56\xf2\x01\x1a\xd8\x6b\xf5\x3a\x02\x73\xff\
+\x7b\xa8\xde\x43\xdd\x9f\x80\xbb\xaf\x7f\x4d\xf2\x01\x76\x4e\x07\
+\x60\x1d\x0e\xaf\x00\xb3\x93\x0f\xb0\x73\x0a\x80\x75\x78\x7d\x05\
+\x98\x9d\x7c\x80\x9d\x53\x00\x2c\xcf\x00\x0b\x60\x0f\xe4\x03\xec\
+\x9c\x02\x60\x79\xe6\xfe\x03\x7b\x21\x1f\x60\xc7\xf6\x7c\x80\xa5\
+\x82\xb9\xff\xfd\x54\xef\xa1\xee\x87\xe0\xba\xaf\x7f\x0b\xf2\x01\
+\x76\x4a\x07\x60\x59\xda\x54\xc0\xde\xc8\x07\xd8\x29\x05\xc0\xb2\
+\x1c\x54\x01\xf6\x46\x3e\xc0\x4e\x29\x00\x96\xe3\x55\x15\x60\x8f\
+\xe4\x03\xec\x94\x02\x60\x39\xe6\xfe\x03\x7b\x25\x1f\x60\x87\x3a\
+\x1c\x60\xd9\x82\xb9\xff\x7d\x55\xef\xa1\xee\x87\xe0\xba\xaf\x7f\
+\x4b\xf2\x01\x76\x46\x07\x60\x19\xe6\xfe\x03\x7b\x27\x1f\x60\x67\
+\x3a\x55\xaf\x6b\x32\xf7\xbf\xaf\xea\x3d\xd4\xfd\x09\xb8\xfb\xfa\
+\xb7\x26\x1f\x60\x47\x74\x00\xae\xe7\x50\x0a\xd0\x85\x7c\x80\x1d\
+\x51\x00\x5c\xcf\x6b\x29\x40\x17\xf2\x01\x76\x44\x01\x70\x1d\x83\
+\x29\x80\x4e\xe4\x03\xec\x88\x02\xe0\x3a\xe6\xfe\x03\xdd\xc8\x07\
+\xd8\x89\x6e\x07\x58\x96\x64\xee\x3f\x49\xfd\x1e\xea\x7e\x08\xae\
+\xfb\xfa\xab\xc8\x07\xd8\x01\x1d\x80\xcb\x69\x3f\x01\x5d\xc9\x07\
+\xd8\x01\x05\xc0\xe5\x1c\x40\x01\xba\x92\x0f\xb0\x03\x0a\x80\xcb\
+\x78\x05\x05\xe8\x4c\x3e\xc0\x0e\x28\x00\x2e\x63\xee\x3f\xd0\x9d\
+\x7c\x80\xc9\x75\x3d\xc0\x72\x0d\x73\xff\xb9\x57\xf5\x1e\xea\x7e\
+\x08\xae\xfb\xfa\xab\xc9\x07\x98\x98\x0e\xc0\xf9\xcc\xfd\x07\x38\
+\x90\x0f\x30\xb1\xee\xd5\xeb\x25\xcc\xfd\xe7\x5e\xd5\x7b\xa8\xfb\
+\x13\x70\xf7\xf5\x8f\x40\x3e\xc0\xa4\x74\x00\xce\xe3\xb0\x09\xc0\
+\xf3\xc9\x07\x98\x94\x02\xe0\x3c\x5e\x37\x01\x78\x3e\xf9\x00\x93\
+\x52\x00\x9c\xce\xc0\x09\x80\x07\xc9\x07\x98\x94\x02\xe0\x74\xe6\
+\xfe\x03\x1c\x27\x1f\x60\x42\x0e\xb0\x9c\xc6\xdc\x7f\x1e\xa6\x7a\
+\x0f\x75\x3f\x04\xd7\x7d\xfd\x23\x91\x0f\x30\x19\x1d\x80\xd3\x68\
+\x2b\x01\xdc\x4c\x3e\xc0\x64\x14\x00\xa7\x71\xb0\x04\xe0\x66\xf2\
+\x01\x26\xa3\x00\xb8\x9d\x57\x4b\x00\x6e\x27\x1f\x60\x32\x0a\x80\
+\xdb\x99\xfb\x0f\x70\x1a\xf9\x00\x13\x71\x80\xe5\x66\xe6\xfe\x73\
+\x9b\xea\x3d\xd4\xfd\x10\x5c\xf7\xf5\x8f\x48\x3e\xc0\x24\x74\x00\
+\x6e\x66\xee\x3f\xc0\x79\xe4\x03\x4c\x42\xf5\x7a\x33\x73\xff\xb9\
+\x4d\xf5\x1e\xea\xfe\x04\xdc\x7d\xfd\xa3\x92\x0f\x30\x01\x1d\x80\
+\x87\x73\x88\x04\xe0\x32\xf2\x01\x26\xa0\x00\x78\x38\xaf\x91\x00\
+\x5c\x46\x3e\xc0\x04\x14\x00\xc7\x19\x24\x01\x70\x39\xf9\x00\x13\
+\x50\x00\x1c\x67\xee\x3f\xc0\x75\xe4\x03\x0c\xce\x01\x96\x07\x99\
+\xfb\xcf\x39\xaa\xf7\x50\xf7\x43\x70\xdd\xd7\x3f\x3a\xf9\x00\x03\
+\xd3\x01\x78\x90\x76\x11\xc0\x32\xe4\x03\x0c\x4c\x01\xf0\x20\x07\
+\x46\x00\x96\x21\x1f\x60\x60\x0a\x80\xe7\xf3\xca\x08\xc0\x72\xe4\
+\x03\x0c\x4c\x01\xf0\x7c\xe6\xfe\x03\x2c\x4b\x3e\xc0\xa0\x1c\x60\
+\x79\x8e\xb9\xff\x5c\xa2\x7a\x0f\x75\x3f\x04\xd7\x7d\xfd\xb3\x90\
+\x0f\x30\x20\x1d\x80\xe7\x98\xfb\x0f\xb0\x0e\xf9\x00\x03\x52\xbd\
+\x3e\xc7\xdc\x7f\x2e\x51\xbd\x87\xba\x3f\x01\x77\x5f\xff\x4c\xe4\
+\x03\x0c\x46\x07\xe0\xc0\xe1\x10\x80\x75\xc9\x07\x18\x8c\x02\xe0\
+\xc0\xeb\x21\x00\xeb\x92\x0f\x30\x18\x05\x80\x01\x11\x00\x5b\x90\
+\x0f\x30\x18\x05\x80\xb9\xff\x00\x5b\x91\x0f\x30\x90\xee\x07\x58\
+\xcc\xfd\xe7\x5a\xd5\x7b\xa8\xfb\x21\xb8\xee\xeb\x9f\x91\x7c\x80\
+\x41\x74\xef\x00\x68\x03\x01\x6c\x4b\x3e\xc0\x20\xba\x17\x00\x0e\
+\x82\x00\x6c\x4b\x3e\xc0\x20\x3a\x17\x00\x5e\x05\x01\xd8\x9e\x7c\
+\x80\x41\x74\x2e\x00\xcc\xfd\x07\xa8\x21\x1f\x60\x00\x5d\x0f\xb0\
+\x98\xfb\xcf\x52\xaa\xf7\x50\xf7\x43\x70\xdd\xd7\x3f\x33\xf9\x00\
+\xc5\xba\x76\x00\xcc\xfd\x07\xa8\x25\x1f\xa0\x58\xd7\xea\xd5\xdc\
+\x7f\x96\x52\xbd\x87\xba\x3f\x01\x77\x5f\xff\xec\xe4\x03\x14\xea\
+\xd8\x01\x68\x7d\xe8\x03\x60\x20\xf2\x01\x0a\x75\x2c\x00\x5a\xbf\
+\xf6\x01\x30\x10\xf9\x00\x85\xba\x15\x00\xed\x07\x3f\x00\x0c\x44\
+\x3e\x40\xa1\x6e\x05\x80\xb9\xff\x00\x63\x91\x0f\x50\xa4\xd3\x01\
+\x16\x73\xff\x59\x43\xf5\x1e\xea\x7e\x08\xae\xfb\xfa\xf7\x42\x3e\
+\x40\x81\x4e\x1d\x80\x76\xed\x1d\x80\x49\xc8\x07\x28\xd0\xa9\x00\
+\x68\x77\xc0\x03\x60\x12\xf2\x01\x0a\x74\x29\x00\x5a\xbe\xe2\x01\
+\x30\x09\xf9\x00\x05\xba\x14\x00\xe6\xfe\x03\x8c\x4d\x3e\xc0\xc6\
+\x3a\x1c\x60\x31\xf7\x9f\x35\x55\xef\xa1\xee\x87\xe0\xba\xaf\x7f\
+\x6f\xe4\x03\x6c\xa8\x43\x07\xc0\xdc\x7f\x80\x39\xc8\x07\xd8\x50\
+\x87\xea\xd5\xdc\x7f\xd6\x54\xbd\x87\xba\x3f\x01\x77\x5f\xff\x1e\
+\xc9\x07\xd8\xc8\xde\x3b\x00\x6d\x0e\x73\x00\xec\x84\x7c\x80\x8d\
+\xec\xbd\x00\x68\xf3\x3a\x07\xc0\x4e\xc8\x07\xd8\xc8\x9e\x0b\x80\
+\x56\x03\x1d\x00\x76\x42\x3e\xc0\x46\xf6\x5c\x00\x98\xfb\x0f\x30\
+\x27\xf9\x00\x1b\xd8\xeb\x01\x16\x73\xff\xd9\x4a\xf5\x1e\xea\x7e\
+\x08\xae\xfb\xfa\xf7\x4c\x3e\xc0\xca\xf6\xda\x01\xd8\x75\xdb\x06\
+\xa0\x01\xf9\x00\x2b\xdb\x6b\x01\xb0\xeb\x83\x1b\x00\x0d\xc8\x07\
+\x58\xd9\x1e\x0b\x80\xdd\xbf\xba\x01\xd0\x80\x7c\x80\x95\xed\xb1\
+\x00\x30\xf7\x1f\x60\x1f\xe4\x03\xac\x68\x6f\x07\x58\xcc\xfd\x67\
+\x6b\xd5\x7b\xa8\xfb\x21\xb8\xee\xeb\xef\x40\x3e\xc0\x4a\xf6\xd6\
+\x01\x30\xf7\x1f\x60\x5f\xe4\x03\xac\x64\x6f\xd5\xab\xb9\xff\x6c\
+\xad\x7a\x0f\x75\x7f\x02\xee\xbe\xfe\x2e\xe4\x03\xac\x60\x4f\x1d\
+\x80\x5d\x1e\xd2\x00\x40\x3e\xc0\x1a\xf6\x54\x00\xec\xf2\x35\x0d\
+\x00\xe4\x03\xac\x61\x2f\x05\xc0\x6e\x07\x35\x00\x20\x1f\x60\x0d\
+\x7b\x29\x00\xcc\xfd\x07\xd8\x37\xf9\x00\x0b\xdb\xc3\x01\x16\x73\
+\xff\xa9\x54\xbd\x87\xba\x1f\x82\xeb\xbe\xfe\x6e\xe4\x03\x2c\x68\
+\x0f\x1d\x80\xdd\xb4\x63\x00\xb8\x91\x7c\x80\x05\xed\xa1\x00\xd8\
+\xcd\x81\x0c\x00\x6e\x24\x1f\x60\x41\xb3\x17\x00\xbb\x7a\x25\x03\
+\x80\x1b\xc9\x07\x58\xd0\xec\x05\x80\xb9\xff\x00\xbd\xc8\x07\x58\
+\xc8\xcc\x07\x58\xcc\xfd\x67\x04\xd5\x7b\xa8\xfb\x21\xb8\xee\xeb\
+\xef\x4a\x3e\xc0\x02\x66\xee\x00\x98\xfb\x0f\xd0\x93\x7c\x80\x05\
+\xcc\x5c\xbd\x9a\xfb\xcf\x08\xaa\xf7\x50\xf7\x27\xe0\xee\xeb\xef\
+\x4c\x3e\xc0\x95\x66\xed\x00\x4c\x7f\xf8\x02\x80\xab\xc8\x07\xb8\
+\xd2\xac\x05\xc0\xf4\xaf\x5f\x00\x70\x15\xf9\x00\x57\x9a\xb1\x00\
+\xd8\xc5\x00\x06\x00\xae\x22\x1f\xe0\x4a\x33\x16\x00\xe6\xfe\x03\
+\x90\xc8\x07\xb8\xca\x6c\x07\x58\xcc\xfd\x67\x34\xd5\x7b\xa8\xfb\
+\x21\xb8\xee\xeb\x47\x3e\xc0\xc5\x66\xeb\x00\x4c\xd9\x66\x01\x60\
+\x35\xf2\x01\x2e\x34\x5b\x01\x30\xe5\x41\x0b\x00\x56\x23\x1f\xe0\
+\x42\x33\x15\x00\xd3\xbe\x6a\x01\xc0\x6a\xe4\x03\x5c\x68\xa6\x02\
+\xc0\xdc\x7f\x00\x8e\x91\x0f\x70\x81\x59\x0e\xb0\x98\xfb\xcf\xa8\
+\xaa\xf7\x50\xf7\x43\x70\xdd\xd7\xcf\x73\xe4\x03\x9c\x69\x96\x0e\
+\x80\xb9\xff\x00\xdc\x44\x3e\xc0\x99\x66\xa9\x5e\xcd\xfd\x67\x54\
+\xd5\x7b\xa8\xfb\x13\x70\xf7\xf5\xf3\x7c\xf2\x01\xce\x30\x43\x07\
+\x60\xaa\x43\x15\x00\x94\x91\x0f\x70\x86\x19\x0a\x80\xa9\x5e\xab\
+\x00\xa0\x8c\x7c\x80\x33\x8c\x5e\x00\x4c\x37\x58\x01\x80\x32\xf2\
+\x01\xce\x30\x7a\x01\x60\xee\x3f\x00\xe7\x90\x0f\x70\xa2\x91\x0f\
+\xb0\x98\xfb\xcf\x0c\xaa\xf7\x50\xf7\x43\x70\xdd\xd7\xcf\x71\xf2\
+\x01\x4e\x30\x72\x07\x60\xf8\xf6\x09\x00\x43\x92\x0f\x70\x82\x91\
+\x0b\x80\xe1\x0f\x50\x00\x30\x24\xf9\x00\x27\x18\xb5\x00\x98\xe2\
+\x15\x0a\x00\x86\x24\x1f\xe0\x04\xa3\x16\x00\xe6\xfe\x03\x70\x0d\
+\xf9\x00\xb7\x18\xf1\x00\x8b\xb9\xff\xcc\xa4\x7a\x0f\x75\x3f\x04\
+\xd7\x7d\xfd\xdc\x4c\x3e\xc0\x0d\x46\xec\x00\x98\xfb\x0f\xc0\x12\
+\xe4\x03\xdc\x60\xc4\xea\xd5\xdc\x7f\x66\x52\xbd\x87\xba\x3f\x01\
+\x77\x5f\x3f\xb7\x93\x0f\xf0\x10\xa3\x75\x00\x86\x3d\x2c\x01\xc0\
+\x94\xe4\x03\x3c\xc4\x68\x05\xc0\xb0\xaf\x4b\x00\x30\x25\xf9\x00\
+\x0f\x31\x52\x01\x30\xf4\xc0\x04\x00\xa6\x24\x1f\xe0\x21\x46\x2a\
+\x00\xcc\xfd\x07\x60\x0d\xf2\x01\x8e\x18\xe5\x00\x8b\xb9\xff\xcc\
+\xaa\x7a\x0f\x75\x3f\x04\xd7\x7d\xfd\x9c\x4e\x3e\xc0\x7d\x46\xe9\
+\x00\x0c\xd5\x16\x01\x60\x77\xe4\x03\xdc\x67\x94\x02\x60\xa8\x83\
+\x11\x00\xec\x8e\x7c\x80\xfb\x8c\x50\x00\x0c\xf7\x6a\x04\x00\xbb\
+\x23\x1f\xe0\x3e\x23\x14\x00\xe6\xfe\x03\xb0\x05\xf9\x00\xf7\xa8\
+\x3e\xc0\x62\xee\x3f\xb3\xab\xde\x43\xdd\x0f\xc1\x75\x5f\x3f\xe7\
+\x93\x0f\x70\x47\x75\x07\xc0\xdc\x7f\x00\xb6\x24\x1f\xe0\x8e\xea\
+\xea\xd5\xdc\x7f\x66\x57\xbd\x87\xba\x3f\x01\x77\x5f\x3f\x97\x91\
+\x0f\x90\xda\x0e\xc0\x10\x87\x20\x00\x68\x47\x3e\x40\x6a\x0b\x80\
+\x21\x5e\x83\x00\xa0\x1d\xf9\x00\xa9\x2b\x00\x86\x19\x84\x00\x40\
+\x3b\xf2\x01\x52\x57\x00\x98\xfb\x0f\x40\xa5\xf6\xf9\x00\x15\x07\
+\x58\xcc\xfd\x67\x4f\xaa\x0f\x81\x75\x3f\x04\xd7\x7d\xfd\x5c\xa7\
+\x75\x3e\x40\x45\x07\xc0\xdc\x7f\x00\x46\xd0\x3a\x1f\xa0\xa2\x00\
+\x28\x9f\x7e\x04\x00\x69\x9e\x0f\xb0\x75\x01\x60\xee\x3f\x00\xa3\
+\x68\x9d\x0f\xb0\x75\x01\x60\xee\x3f\x00\x23\x69\x9b\x0f\xb0\xe5\
+\x01\x16\x73\xff\xd9\xa3\xea\x43\x60\xdd\x0f\xc1\x75\x5f\x3f\xcb\
+\x68\x99\x0f\xb0\x65\x07\xc0\xdc\x7f\x00\x46\xd4\x32\x1f\x60\xcb\
+\xea\xd5\xdc\x7f\xf6\xa8\xfa\x09\xb0\xfb\x13\x70\xf7\xf5\xb3\x9c\
+\x76\xf9\x00\x5b\x75\x00\xcc\xfd\x07\x60\x64\xed\xf2\x01\xb6\x2a\
+\x00\xcc\xfd\x07\x60\x64\xed\xf2\x01\xb6\x28\x00\xcc\xfd\x07\x60\
+\x74\xed\xf2\x01\xb6\x28\x00\xcc\xfd\x07\x60\x06\xad\xf2\x01\xd6\
+\x3e\xc0\x62\xee\x3f\x7b\x57\x7d\x08\xac\xfb\x21\xb8\xee\xeb\x67\
+\x79\x6d\xf2\x01\xd6\xee\x00\x98\xfb\x0f\xc0\x4c\xda\xe4\x03\xac\
+\x5d\x00\x98\xfb\x0f\xc0\x4c\xda\xe4\x03\xac\x59\x00\x98\xfb\x0f\
+\xc0\x6c\xda\xe4\x03\xac\x59\x00\x98\xfb\x0f\xc0\x8c\x5a\xe4\x03\
+\xac\x75\x80\xc5\xdc\x7f\xba\xa8\x3e\x04\xd6\xfd\x10\x5c\xf7\xf5\
+\xb3\x9e\xdd\xe7\x03\xac\xd5\x01\x30\xf7\x1f\x80\x99\xed\x3e\x1f\
+\x60\xad\xea\xd5\xdc\x7f\xba\xa8\x7e\x02\xec\xfe\x04\x5c\xbd\x7e\
+\xd8\xc2\x2a\xf9\x00\x6b\x74\x00\xcc\xfd\x07\x80\xe5\xac\x72\xa8\
+\x7e\x8d\x02\xc0\xdc\x7f\x00\x58\xd6\xe2\x87\x01\x97\x6e\xdf\xbd\
+\x2a\xc9\xa7\x63\xf4\x2f\x7d\x74\x6f\x81\x77\x5f\x3f\x6c\xe5\xd9\
+\x24\xdf\x96\x05\x67\x14\x2c\xdd\x01\x30\xf7\x1f\x00\x96\xb7\x78\
+\x3e\xc0\x92\xd5\xbb\xb9\xff\x74\xd4\xfd\x09\xb8\xfb\xfa\x61\x4b\
+\x8b\xe6\x03\x2c\xd9\x01\x30\xf7\x1f\x00\xd6\xb3\x68\x3e\xc0\x92\
+\x05\x80\xb9\xff\x00\xb0\xae\xc5\x0e\xda\x2f\xd5\xbe\x7b\x5d\x92\
+\x8f\xc5\xe8\x5f\xfa\xe9\xde\x02\xef\xbe\x7e\xa8\xf0\x3d\x49\x3e\
+\x7c\xed\x87\x2c\xd5\x01\x30\xf7\x1f\x00\xb6\xb1\x48\xc7\x7d\x89\
+\xea\xfd\x85\x49\x3e\x95\xe4\x9b\x16\xf8\x2c\x98\x4d\xf7\x27\xe0\
+\xee\xeb\x87\x0a\x5f\xce\x61\xdc\xfe\x53\xd7\x7c\xc8\x12\x1d\x80\
+\xef\x8d\x2f\x7f\x00\xd8\xca\x4b\x93\xbc\xfd\xda\x0f\x59\xa2\x00\
+\xf8\xbe\x05\x3e\x03\x00\x38\xdd\x5f\xbe\xf6\x03\x96\x28\x00\xde\
+\xb2\xc0\x67\x00\x00\xa7\xbb\xfa\xbb\x77\x89\x02\xe0\xb5\x0b\x7c\
+\x06\x00\x70\xba\xd7\x5c\xfb\x01\x4b\x14\x00\x5f\xbb\xc0\x67\x00\
+\x00\xa7\xfb\xba\x6b\x3f\x60\x89\x02\x60\xd1\x7c\x62\x98\xc8\xd3\
+\xd5\x37\x40\x9e\xa9\xbe\x01\x28\xf2\x07\xd7\x7e\xc0\x12\x05\xc0\
+\xef\x2d\xf0\x19\x30\xa3\x2f\x56\xdf\x00\x7e\xff\xd0\xd6\x55\xaf\
+\x00\x26\xcb\x14\x00\x1f\x5b\xe0\x33\x60\x46\xbf\x59\x7d\x03\xe4\
+\xe3\xd5\x37\x00\x45\xae\x8e\x05\x5e\xa2\x00\xf8\xf5\x05\x3e\x03\
+\x66\xf4\x91\xea\x1b\x20\x4f\x54\xdf\x00\x14\xb9\xfa\xbb\x77\x89\
+\x02\xe0\x3f\x2e\xf0\x19\x30\xa3\x5f\xaa\xbe\x01\xf2\xfe\xea\x1b\
+\x80\x22\x57\x7f\xf7\x2e\x31\xc6\xf3\x45\x39\x8c\x02\x7e\x6c\x81\
+\xcf\x82\x59\x3c\x95\xc3\xff\xe7\x9f\x2c\xbe\x8f\xea\x51\xb8\xd5\
+\xa3\x80\x5f\x9e\xe4\x33\x39\x4c\x46\x83\x2e\x9e\xcc\x61\x02\xef\
+\x97\xae\xf9\x90\x25\x3a\x00\x7f\x90\xe4\x5f\x2e\xf0\x39\x30\x93\
+\x9f\x4f\xfd\x97\x3f\x87\x5f\x80\xbf\x50\x7d\x13\xb0\xb1\x7f\x9b\
+\x2b\xbf\xfc\x93\xe5\xaa\xf7\xaf\x4f\xf2\x7f\x92\xbc\x72\xa1\xcf\
+\x83\x91\x3d\x93\xe4\x4f\x65\x8c\x43\x80\xdd\x3b\x00\x49\xf2\x78\
+\x92\xdf\x48\xf2\xc7\xab\x6f\x04\x36\xf0\x74\x92\x3f\x9d\x05\x7e\
+\xff\x2c\x15\x07\xfc\xb9\x24\xef\x5c\xe8\xb3\x60\x74\xff\x34\x63\
+\x7c\xf9\x73\xf0\xd1\x24\x3f\x59\x7d\x13\xb0\x91\x7f\x96\x85\x7e\
+\xff\x2c\x59\xbd\xbf\x30\xc9\x7f\x48\xf2\x83\x0b\x7e\x26\x8c\xe6\
+\x83\x49\xde\x9a\x71\x86\x00\xe9\x00\x1c\x3c\x9a\xe4\x97\x93\xfc\
+\xf9\xea\x1b\x81\x15\x7d\x24\xc9\x5f\x48\xf2\x95\x25\x3e\x6c\xe9\
+\xcd\xfb\x27\x93\x7c\x20\xc9\x1b\x16\xfe\x5c\x18\xc1\xa7\x92\x7c\
+\x77\x0e\x87\xce\x46\xa1\x00\x78\xce\x37\x26\xf9\x70\x92\x6f\xae\
+\xbe\x11\x58\xc1\x67\x92\xfc\xa5\x2c\xd8\x7d\x5c\xea\x4f\x00\x77\
+\xfd\xbf\x24\x6f\x4b\xf2\x89\x85\x3f\x17\xaa\x7d\x2a\xc9\x3b\x32\
+\xd6\x97\x3f\xcf\xf7\x3b\x39\xfc\x1b\x7d\xba\xfa\x46\x60\x61\x9f\
+\x4d\xf2\x03\x59\xf8\x4f\x8f\x4b\x17\x00\xc9\xe1\xcb\xff\x2d\xf1\
+\x7e\x2e\xfb\xf1\xc1\x1c\x9e\xfc\x0d\xbd\x1a\xdf\xff\x48\xf2\xe7\
+\x92\xfc\x4a\xf5\x8d\xc0\x42\x9e\xc8\xe1\x4f\x5b\xbf\xb1\xf4\x07\
+\xaf\x51\x00\x24\xc9\xef\x26\xf9\xe1\x24\x7f\x2f\xc9\x97\x57\xba\
+\x06\xac\xed\x99\x24\xef\xce\xe1\x6f\xfe\x9e\xfc\xe7\xf1\xb9\x24\
+\x3f\x94\xe4\x1f\x66\x81\x79\xe9\x50\xe4\x99\x24\xef\xca\xe1\x6f\
+\xfe\xd3\x8e\xbc\x7e\x75\x92\x7f\x92\xe4\x0b\x39\xfc\xbd\xd2\x8f\
+\x9f\xd1\x7f\x9e\x4c\xf2\x33\x99\xe3\x2c\x4b\xf5\xff\x56\xa3\x7b\
+\x2c\xc9\x7b\x73\xf8\x37\xad\xfe\xdf\xca\x8f\x9f\x53\x7e\x9e\x4c\
+\xf2\x53\xd9\xe0\xf7\xcf\x96\x07\x78\x1e\xc9\xe1\x0d\x81\x1f\xcc\
+\xa1\x45\xf7\x86\x24\xaf\x4a\xf2\x92\x0d\xef\x01\xee\xf7\x4c\x0e\
+\xc5\xe9\xc7\x93\xfc\x5a\x0e\x27\xc9\xdf\x97\x79\x86\xfc\x3c\x5b\
+\x7c\xfd\x91\x0e\x01\xde\xe4\x65\x39\x9c\x0f\x78\x6b\x92\xef\x48\
+\xf2\xfa\x1c\xe6\x96\xbc\xb8\xf2\xa6\x68\xef\xab\x49\x3e\x9f\xc3\
+\xef\x9f\x8f\x24\xf9\xcf\x39\xbc\x4d\xb7\x49\xe7\x7c\x96\xcd\x0b\
+\x1c\xa7\x00\x00\x2e\xb2\xd6\x19\x00\x00\x60\x60\x0a\x00\x00\x68\
+\x48\x01\x00\x00\x0d\x29\x00\x00\xa0\x21\x05\x00\x00\x34\xa4\x00\
+\x00\x80\x86\x14\x00\x00\xd0\x90\x02\x00\x00\x1a\x52\x00\x00\x40\
+\x43\x0a\x00\x00\x68\x48\x01\x00\x00\x0d\x29\x00\x00\xa0\x21\x05\
+\x00\x00\x34\xa4\x00\x00\x80\x86\x14\x00\x00\xd0\x90\x02\x00\xe6\
+\xf6\x4c\xe1\xb5\x9f\x2e\xbc\x36\x70\x25\x05\x00\xcc\xed\xf7\x0a\
+\xaf\xfd\xc5\xc2\x6b\x03\x57\x52\x00\xc0\xdc\x3e\x5e\x78\xed\xdf\
+\x2c\xbc\x36\x70\x25\x05\x00\xcc\xed\x89\xc2\x6b\x7f\xa4\xf0\xda\
+\xc0\x95\x14\x00\x30\xb7\xf7\x17\x5e\xfb\x97\x0a\xaf\x0d\x00\xad\
+\xbd\x2c\xc9\x93\x49\x9e\xdd\xf8\xe7\xc9\x3b\xd7\x06\x26\xa5\x03\
+\x00\x73\x7b\x32\xc9\xbf\x2b\xb8\xee\xcf\xdf\xb9\x36\x00\x50\xe4\
+\xf1\x1c\x5e\x07\xdc\xea\xe9\xff\xe9\x24\x6f\xd8\x64\x65\x00\xc0\
+\x8d\x7e\x22\xdb\x15\x00\xef\xde\x68\x4d\x00\xc0\x2d\x1e\x4d\xf2\
+\xc1\xac\xff\xe5\xff\x81\x24\x8f\x6c\xb4\x26\x00\xe0\x04\x8f\x25\
+\xf9\x64\xd6\xfb\xf2\xff\xad\x24\xaf\xde\x6c\x35\x00\xc0\xc9\xde\
+\x9c\xe4\x53\x59\xfe\xcb\xff\x93\x49\xfe\xec\x86\xeb\x00\x00\xce\
+\xf4\xf5\x49\xfe\x4b\x96\x6d\xfb\x3f\xb6\xe9\x0a\x00\x80\x8b\x3c\
+\x92\xe4\x9d\xb9\x6e\x46\xc0\xd3\x49\xfe\x51\xfc\xcd\x1f\x00\xa6\
+\xf3\x58\x92\xf7\xe6\xbc\x42\xe0\xc9\x24\x3f\x13\xaf\xfa\xc1\xae\
+\xbd\xa0\xfa\x06\x80\x4d\xbc\x2c\xc9\x3b\x92\xbc\x35\xc9\x77\x24\
+\x79\x7d\x92\x57\xde\xf9\xef\xbe\x90\x43\xa8\xd0\xaf\x25\xf9\xe5\
+\x24\xef\x8b\x21\x3f\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x34\xf4\xff\x01\xc0\x8f\xdc\x81\xe8\x3b\x27\
+\xb6\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x13\x7c\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x02\x00\x00\x00\x02\x00\x08\x06\x00\x00\x00\xf4\x78\xd4\xfa\
+\x00\x00\x00\x04\x73\x42\x49\x54\x08\x08\x08\x08\x7c\x08\x64\x88\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
+\x01\x95\x2b\x0e\x1b\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\
+\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\
+\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x12\xf9\x49\x44\
+\x41\x54\x78\x9c\xed\xdd\x7d\x8c\x65\x75\x7d\xc7\xf1\xcf\x0c\xcb\
+\xd3\x5a\x58\xd0\xa4\x81\x20\x22\x04\x48\x44\xb4\x94\xb4\x51\x6c\
+\x65\x21\xc5\x2a\x96\x68\x9a\x26\xd6\xb6\x89\x52\x28\x4d\x63\xff\
+\x90\x92\x52\x9a\x48\xd2\x9a\x94\x46\xd4\x56\xc4\x96\xa6\x0f\x96\
+\x9b\x9a\x60\x4b\x52\x68\xea\x03\x89\x6d\xda\xc5\x28\x16\x42\xc1\
+\x16\x8d\xca\xc3\x82\xa1\xc1\xd6\xaa\x2c\x64\x59\x60\xe3\xb2\xfd\
+\xe3\xee\x74\x76\x61\x66\x77\xee\x9d\xb9\xf7\x77\xce\xf9\xbe\x5e\
+\xc9\x04\x76\x67\x98\xf9\xde\x9b\x5d\xbe\xef\x7b\xce\x99\x33\x0b\
+\xe9\xa7\x63\x92\x5c\x9c\x64\x6b\x92\x1f\x4b\x72\x7a\x92\x63\x93\
+\x1c\xdd\x72\x28\x00\x98\x93\xe7\x93\x3c\x9d\xe4\xd1\x24\x5f\x4b\
+\xb2\x2d\xc9\xe7\x93\x7c\x7f\xad\x9f\x60\x61\x26\x63\xcd\xce\x59\
+\x49\xae\x4e\xf2\xae\x24\x9b\x1b\xcf\x02\x00\x5d\xb2\x3b\xc9\x67\
+\x92\x7c\x24\xc9\xdd\x87\xfa\xe0\xbe\x04\xc0\x2b\x92\x7c\x28\xc9\
+\x65\x49\x16\x1b\xcf\x02\x00\x5d\x77\x5b\x92\x2b\x93\x3c\xbe\xda\
+\x07\xf4\x21\x00\xce\x4f\x72\x4b\x92\x93\x5a\x0f\x02\x00\x3d\xb2\
+\x23\xe3\x17\xce\xb7\xaf\xf4\xce\xc3\xe6\x3b\xcb\xc4\x7e\x39\xe3\
+\x8a\x39\xae\xf5\x20\x00\xd0\x33\x47\x65\x7c\xca\x7c\x21\xe3\x6b\
+\x04\x0e\xd0\xe5\x00\xf8\xf9\x24\x9f\x4e\xb2\xa9\xf5\x20\x00\xd0\
+\x53\x0b\x49\x2e\x48\xb2\x2b\xc9\x5d\xfb\xbf\xa3\xab\x01\xf0\xc6\
+\x24\x9f\x4b\x72\x78\xeb\x41\x00\x60\x00\x2e\x4a\xf2\x40\x92\x6f\
+\x2c\xfd\x46\x17\xaf\x01\x38\x26\xe3\x21\x4f\x69\x3d\x08\x00\x0c\
+\xc8\x8e\x24\xaf\xcf\xbe\x0b\x03\xbb\x78\x45\xfd\x07\x63\xf9\x03\
+\xc0\x46\x3b\x2e\xc9\x0d\x4b\xbf\xe8\xda\x11\x80\x57\x26\x79\x24\
+\xc9\x11\xad\x07\x01\x80\x81\xfa\xa9\x24\x77\x75\xed\x08\xc0\x95\
+\xb1\xfc\x01\x60\x96\xae\x4a\xba\x75\x04\x60\x53\xc6\xe7\x25\x4e\
+\x68\x3d\x08\x00\x0c\xd8\xee\x24\x27\x75\xe9\x08\xc0\x79\xb1\xfc\
+\x01\x60\xd6\x8e\x48\xf2\xb6\x2e\x05\xc0\xd6\xd6\x03\x00\x40\x11\
+\x5b\xbb\x14\x00\x67\xb7\x1e\x00\x00\x8a\x38\xbb\x4b\x01\xf0\xea\
+\xd6\x03\x00\x40\x11\xa7\x76\x29\x00\xb6\xb4\x1e\x00\x00\x8a\xd8\
+\xd2\xa5\x00\xf0\xed\x7f\x00\x30\x1f\x47\x75\x29\x00\x00\x80\x39\
+\x11\x00\x00\x50\x90\x00\x00\x80\x82\x04\x00\x00\x14\x24\x00\x00\
+\xa0\x20\x01\x00\x00\x05\x09\x00\x00\x28\x48\x00\x00\x40\x41\x02\
+\x00\x00\x0a\x12\x00\x00\x50\x90\x00\x00\x80\x82\x04\x00\x00\x14\
+\x24\x00\x00\xa0\x20\x01\x00\x00\x05\x09\x00\x00\x28\x48\x00\x00\
+\x40\x41\x9b\x5a\x0f\xd0\x41\xef\x49\xf2\xe5\xd6\x43\x00\x30\x48\
+\x27\x27\xd9\xd6\x7a\x88\x44\x00\xac\xe4\x3b\x49\xb6\xb7\x1e\x02\
+\x00\x66\xc9\x29\x00\x00\x28\x48\x00\x00\x40\x41\x02\x00\x00\x0a\
+\x12\x00\x00\x50\x90\x00\x00\x80\x82\x04\x00\x00\x14\x24\x00\x00\
+\xa0\x20\x01\x00\x00\x05\x09\x00\x00\x28\x48\x00\x00\x40\x41\x02\
+\x00\x00\x0a\x12\x00\x00\x50\x90\x00\x00\x80\x82\x04\x00\x00\x14\
+\x24\x00\x00\xa0\x20\x01\x00\x00\x05\x09\x00\x00\x28\x48\x00\x00\
+\x40\x41\x02\x00\x00\x0a\x12\x00\x00\x50\x90\x00\x00\x80\x82\x04\
+\x00\x00\x14\x24\x00\x00\xa0\x20\x01\x00\x00\x05\x09\x00\x00\x28\
+\x48\x00\x00\x40\x41\x02\x00\x00\x0a\x12\x00\x00\x50\x90\x00\x00\
+\x80\x82\x04\x00\x00\x14\x24\x00\x00\xa0\x20\x01\x00\x00\x05\x6d\
+\x6a\x3d\x00\x40\x8f\x1d\x93\xe4\xfc\x24\xe7\x24\x39\x33\xc9\x96\
+\x24\x2f\x6b\x3a\x11\xab\xb9\x2f\xc9\x35\xad\x87\xe8\x12\x01\x00\
+\x30\x99\x85\x24\x97\x24\xb9\x22\xc9\xdb\x92\x1c\xde\x76\x1c\x98\
+\x8e\x00\x00\x58\xbb\x9f\x49\xf2\xb1\x24\xaf\x6b\x3d\x08\xac\x97\
+\x00\x00\x38\xb4\xcd\x49\x6e\x4c\x72\x79\xeb\x41\x60\xa3\x08\x00\
+\x80\x83\x3b\x21\xc9\x1d\x19\x9f\xe7\x87\xc1\x10\x00\x00\xab\x3b\
+\x21\xc9\x17\x93\x9c\xd1\x7a\x10\xd8\x68\xbe\x0d\x10\x60\x65\x9b\
+\x33\x7e\xe5\x6f\xf9\x33\x48\x02\x00\x60\x65\x37\xc6\x61\x7f\x06\
+\x4c\x00\x00\xbc\xd4\xd6\x24\x97\xb5\x1e\x02\x66\x49\x00\x00\x1c\
+\x68\x21\xc9\x27\xf6\xfd\x13\x06\x4b\x00\x00\x1c\xe8\x92\xf8\x3e\
+\x7f\x0a\x10\x00\x00\x07\xba\xa2\xf5\x00\x30\x0f\x02\x00\x60\xd9\
+\xb1\x19\xdf\xde\x17\x06\x4f\x00\x00\x2c\xfb\xe9\xb8\xb7\x3f\x45\
+\x08\x00\x80\x65\xe7\xb6\x1e\x00\xe6\x45\x00\x00\x2c\x3b\xbd\xf5\
+\x00\x30\x2f\x02\x00\x60\xd9\xf1\xad\x07\x80\x79\x11\x00\x00\xcb\
+\x8e\x6c\x3d\x00\xcc\x8b\x00\x00\x58\xf6\x4c\xeb\x01\x60\x5e\x04\
+\x00\xc0\xb2\xff\x6e\x3d\x00\xcc\x8b\x00\x00\x58\xf6\xcd\xd6\x03\
+\xc0\xbc\x08\x00\x80\x65\x5f\x69\x3d\x00\xcc\x8b\x00\x00\x58\x76\
+\x7f\x92\xef\xb6\x1e\x02\xe6\x41\x00\x00\x2c\xdb\x93\xe4\x6f\x5b\
+\x0f\x01\xf3\x20\x00\x00\x0e\xf4\x89\x8c\x43\x00\x06\x4d\x00\x00\
+\x1c\xe8\xe1\x24\x9f\x6e\x3d\x04\xcc\x9a\x00\x00\x78\xa9\x6b\x92\
+\x3c\xdd\x7a\x08\x98\x25\x01\x00\xf0\x52\x4f\x24\xb9\xa2\xf5\x10\
+\x30\x4b\x02\x00\x60\x65\xb7\x26\xf9\xa3\xd6\x43\xc0\xac\x08\x00\
+\x80\xd5\x5d\x9d\xe4\xaf\x5a\x0f\x01\xb3\x20\x00\x00\x56\xb7\x37\
+\xc9\xaf\x27\xf9\x60\x92\x17\x1a\xcf\x02\x1b\x4a\x00\x00\x1c\xdc\
+\xde\x24\xbf\x9f\xe4\xe2\x24\x8f\x35\x9d\x04\x36\x90\x00\x00\x58\
+\x9b\x2f\x24\x79\x6d\x92\x6b\x93\x7c\xaf\xf1\x2c\xb0\x6e\x02\x00\
+\x60\xed\x76\x25\xb9\x2e\xc9\xab\x92\xfc\x4a\x92\x7f\x48\xb2\xa3\
+\xe9\x44\x30\xa5\x4d\xad\x07\x00\xe8\xa1\x67\x93\xdc\xb2\xef\xed\
+\xb0\x24\xa7\x26\x39\x33\xc9\x96\x24\xc7\x34\x9c\x6b\x52\x8b\x49\
+\x3e\x90\xe4\x95\xad\x07\x61\xfe\x04\x00\xc0\xfa\xec\xc9\xf8\xee\
+\x81\x0f\xb7\x1e\x64\x42\x8b\x49\xfe\x3a\x96\x7f\x59\x4e\x01\x00\
+\xd4\xb3\xb4\xfc\xdf\xdb\x7a\x10\xda\x11\x00\x00\xb5\x58\xfe\x24\
+\x11\x00\x00\x95\x58\xfe\xfc\x3f\x01\x00\x50\x83\xe5\xcf\x01\x04\
+\x00\xc0\xf0\x59\xfe\xbc\x84\x00\x00\x18\x36\xcb\x9f\x15\x09\x00\
+\x80\xe1\xb2\xfc\x59\x95\x00\x00\x18\x26\xcb\x9f\x83\x12\x00\x00\
+\xc3\x63\xf9\x73\x48\x02\x00\x60\x58\x2c\x7f\xd6\x44\x00\x00\x0c\
+\x87\xe5\xcf\x9a\x09\x00\x80\x61\xb0\xfc\x99\x88\x00\x00\xe8\x3f\
+\xcb\x9f\x89\x09\x00\x80\x7e\xb3\xfc\x99\x8a\x00\x00\xe8\x2f\xcb\
+\x9f\xa9\x09\x00\x80\x7e\xb2\xfc\x59\x17\x01\x00\xd0\x3f\x96\x3f\
+\xeb\x26\x00\x00\xfa\xc5\xf2\x67\x43\x08\x00\x80\xfe\xb0\xfc\xd9\
+\x30\x02\x00\xa0\x1f\x2c\x7f\x36\x94\x00\x00\xe8\x3e\xcb\x9f\x0d\
+\x27\x00\x00\xba\xcd\xf2\x67\x26\x04\x00\x40\x77\x2d\x26\xf9\x64\
+\xfa\xbd\xfc\xff\xab\xf5\x00\xac\x4c\x00\x00\x74\xd3\xd2\x2b\xff\
+\x4b\x1b\xcf\xb1\x1e\xa3\x24\xd7\xb5\x1e\x82\x95\x09\x00\x80\xee\
+\x19\xc2\x61\xff\x51\x92\xcb\x93\xbc\xd0\x78\x0e\x56\x21\x00\x00\
+\xba\xc5\xf2\x67\x2e\x04\x00\x40\x77\x58\xfe\xcc\x8d\x00\x00\xe8\
+\x06\xcb\x9f\xb9\x12\x00\x00\xed\x59\xfe\xcc\x9d\x00\x00\x68\xcb\
+\xf2\xa7\x09\x01\x00\xd0\x8e\xe5\x4f\x33\x02\x00\xa0\x0d\xcb\x9f\
+\xa6\x04\x00\xc0\xfc\x59\xfe\x34\x27\x00\x00\xe6\xcb\xf2\xa7\x13\
+\x04\x00\xc0\xfc\x58\xfe\x74\x86\x00\x00\x98\x0f\xcb\x9f\x4e\x11\
+\x00\x00\xb3\x67\xf9\xd3\x39\x02\x00\x60\xb6\x2c\x7f\x3a\x49\x00\
+\x00\xcc\x8e\xe5\x4f\x67\x09\x00\x80\xd9\xb0\xfc\xe9\x34\x01\x00\
+\xb0\xf1\x2c\x7f\x3a\x4f\x00\x00\x6c\x2c\xcb\x9f\x5e\x10\x00\x00\
+\x1b\xc7\xf2\xa7\x37\x04\x00\xc0\xc6\xb0\xfc\xe9\x15\x01\x00\xb0\
+\x7e\x96\x3f\xbd\x23\x00\x00\xd6\xc7\xf2\xa7\x97\x04\x00\xc0\xf4\
+\x2c\x7f\x7a\x4b\x00\x00\x4c\xc7\xf2\xa7\xd7\x04\x00\xc0\xe4\x2c\
+\x7f\x7a\x4f\x00\x00\x4c\xc6\xf2\x67\x10\x04\x00\xc0\xda\x59\xfe\
+\x0c\x86\x00\x00\x58\x1b\xcb\x9f\x41\x11\x00\x00\x87\x66\xf9\x33\
+\x38\x02\x00\xe0\xe0\x2c\x7f\x06\x49\x00\x00\xac\xce\xf2\x67\xb0\
+\x04\x00\xc0\xca\x2c\x7f\x06\x4d\x00\x00\xbc\x94\xe5\xcf\xe0\x09\
+\x00\x80\x03\x59\xfe\x94\x20\x00\x00\x96\x59\xfe\x94\x21\x00\x00\
+\xc6\x2c\x7f\x4a\x11\x00\x00\x96\x3f\x05\x09\x00\xa0\x3a\xcb\x9f\
+\x92\x04\x00\x50\x99\xe5\x4f\x59\x02\x00\xa8\xca\xf2\xa7\x34\x01\
+\x00\x54\x64\xf9\x53\x9e\x00\x00\xaa\xb1\xfc\x21\x02\x00\xa8\x65\
+\x31\xc9\x27\x63\xf9\xcf\xd3\xde\xd6\x03\xb0\xb2\x4d\xad\x07\x00\
+\x98\x13\xaf\xfc\xdb\x78\xb6\xf5\x00\xfb\xec\x6c\x3d\x40\xd7\x38\
+\x02\x00\x54\xe0\x95\x7f\x3b\x3f\x68\x3d\xc0\x3e\x4f\xb6\x1e\xa0\
+\x6b\x1c\x01\x00\x86\xce\x2b\xff\xb6\x1e\x6a\x3d\xc0\x3e\x0f\xb6\
+\x1e\xa0\x6b\x1c\x01\x00\x86\xcc\x2b\xff\xf6\xb6\x27\x79\xaa\xf5\
+\x10\x49\xee\x6f\x3d\x40\xd7\x08\x00\x60\xa8\x96\x96\xff\xa5\x8d\
+\xe7\x58\x8f\x51\xfa\xbd\xfc\x93\x64\x4f\x92\x3b\x1b\xcf\xf0\x7c\
+\x92\x2f\x35\x9e\xa1\x73\x04\x00\x30\x44\x4b\x87\xfd\x2f\x6d\x3c\
+\xc7\x7a\x8c\xd2\xff\xe5\xbf\xe4\xd6\xc6\x5f\xff\xf3\x49\x9e\x69\
+\x3c\x03\x07\xf1\x48\xc6\xdf\x2e\xd2\xfa\xed\xa2\x59\x3f\x50\x60\
+\xa6\x16\x93\xdc\x9c\xf6\xff\x2f\x59\xcf\xdb\xcd\x19\xd6\x0b\xb4\
+\xcd\x49\xfe\x37\xed\x9e\xcf\xb7\xcf\xfe\x21\xae\xd9\x69\x69\xff\
+\xe7\x6b\x6f\x92\xbd\x43\xfa\x03\x06\xe0\xb0\x7f\x37\xed\x4a\x72\
+\x43\xa3\xaf\x7d\x5f\x92\x3b\x1a\x7d\x6d\xd6\xc8\x11\x00\x60\x3d\
+\x16\x33\x5e\x9e\xad\xff\x1f\xb2\x9e\xb7\x9b\x33\xac\x57\xfe\xfb\
+\x3b\x3a\xe3\x0b\x02\xe7\xf9\x7c\xbe\x90\xe4\x82\x39\x3c\xb6\x49\
+\x74\xe6\x08\xc0\xac\x1f\xe8\x24\x04\x00\x30\x2d\x87\xfd\xfb\xe1\
+\xa2\x8c\x2f\x0a\x9c\xd7\x73\x7a\xd3\x7c\x1e\xd6\x44\x04\xc0\x0a\
+\x04\x00\x30\x0d\xcb\xbf\x5f\x7e\x2f\xf3\x79\x4e\xef\x49\x72\xd4\
+\x9c\x1e\xd3\x24\x04\xc0\x0a\x04\x00\x30\x29\xcb\xbf\x7f\x16\x92\
+\xfc\x45\x66\xfb\x9c\x7e\x2b\xc9\x8f\xce\xeb\x01\x4d\x48\x00\xac\
+\x40\x00\x00\x93\xb0\xfc\xfb\x6b\x21\xc9\x47\x33\x9b\xe7\xf4\x9e\
+\x74\x77\xf9\x27\x02\x60\x45\x02\x00\x58\x2b\xcb\x7f\x18\x7e\x29\
+\xe3\xbb\x04\x6e\xc4\xf3\xf9\x42\xc6\xe7\xfc\xbb\x78\xd8\x7f\x7f\
+\x02\x60\x05\x02\x00\x58\x0b\xcb\x7f\x58\x4e\x4c\xf2\x37\x49\x7e\
+\x98\xe9\x9f\xcf\x7b\x93\xbc\x79\xde\x83\x4f\x49\x00\xac\x40\x00\
+\x00\x87\x62\xf9\x0f\xd7\x19\x19\xdf\x2b\xe0\x7f\xb2\xb6\xe7\xf1\
+\xb9\x24\xb7\x25\xb9\x38\xe3\x53\x0a\x7d\xd1\x99\x00\xf0\xd3\x00\
+\x81\xbe\x70\x93\x9f\x61\x7b\x28\xc9\x95\x49\xae\x4a\x72\x4e\x92\
+\xf3\x92\xbc\x26\xe3\xf3\xf9\xc7\x27\xd9\x99\x64\x47\xc6\x3f\xd5\
+\xef\xbe\x8c\xef\xed\xef\xf6\xbe\x03\xe1\x08\x00\xb0\x1a\x37\xf9\
+\x61\x28\x3a\x73\x04\xc0\x1f\x46\xa0\xeb\x96\x7e\xb0\xcf\x7b\x5b\
+\x0f\xb2\x0e\xa3\x78\xe5\x4f\xc7\x08\x00\xa0\xcb\x2c\x7f\x98\x11\
+\x01\x00\x74\x95\xe5\x0f\x33\x24\x00\x80\x2e\x5a\xba\xe0\xcf\xf2\
+\x87\x19\x11\x00\x40\x17\x7d\x34\xae\xf6\x87\x99\x12\x00\x40\xd7\
+\x5c\x91\xe4\xb7\x5a\x0f\xb1\x0e\xa3\x58\xfe\xf4\x80\x00\x00\xba\
+\xe4\xf4\x8c\x6f\x06\xd3\x57\xa3\x58\xfe\xf4\x84\x00\x00\xba\xe4\
+\x86\x24\x9b\x5b\x0f\x31\xa5\x51\x2c\x7f\x7a\x44\x00\x00\x5d\xf1\
+\x93\x49\x7e\xae\xf5\x10\x53\x1a\xc5\xf2\xa7\x67\x04\x00\xd0\x15\
+\x57\xb5\x1e\x60\x4a\xa3\x58\xfe\xf4\x90\x00\x00\xba\xe0\xd8\x24\
+\xef\x6c\x3d\xc4\x14\x46\xb1\xfc\xe9\x29\x01\x00\x74\xc1\x85\x49\
+\x8e\x6e\x3d\xc4\x84\x46\xb1\xfc\xe9\x31\x01\x00\x74\xc1\x9b\x5a\
+\x0f\x30\xa1\x51\x2c\x7f\x7a\x4e\x00\x00\x5d\x70\x56\xeb\x01\x26\
+\x30\x8a\xe5\xcf\x00\x08\x00\xa0\x0b\x4e\x6a\x3d\xc0\x1a\x8d\x62\
+\xf9\x33\x10\x02\x00\xe8\x82\x97\xb5\x1e\x60\x0d\x46\xb1\xfc\x19\
+\x10\x01\x00\x74\xc1\x9e\xd6\x03\x1c\xc2\x28\x96\x3f\x03\x23\x00\
+\x80\x2e\x78\xb2\xf5\x00\x07\x31\x8a\xe5\xcf\x00\x09\x00\xa0\x0b\
+\xb6\xb7\x1e\x60\x15\xa3\x58\xfe\x0c\x94\x00\x00\xba\xe0\xab\xad\
+\x07\x58\xc1\x28\x96\x3f\x03\x26\x00\x80\x2e\xb8\xb3\xf5\x00\x2f\
+\x32\x8a\xe5\xcf\xc0\x09\x00\xa0\x0b\xfe\x3d\xc9\xa3\xad\x87\xd8\
+\x67\x14\xcb\x9f\x02\x04\x00\xd0\x05\x7b\x93\xdc\xdc\x7a\x88\x58\
+\xfe\x14\x22\x00\x80\xae\xb8\x29\xc9\xce\x86\x5f\x7f\x14\xcb\x9f\
+\x42\x04\x00\xd0\x15\xdf\x4f\x72\x5d\xa3\xaf\x3d\x8a\xe5\x4f\x31\
+\x02\x00\xe8\x92\x3f\x4e\x72\xdf\x9c\xbf\xe6\x28\x96\x3f\x05\x09\
+\x00\xa0\x4b\x76\x27\x79\x77\xe6\x77\x63\xa0\x51\x2c\x7f\x8a\x12\
+\x00\x40\xd7\x3c\x94\xe4\x1d\x49\x9e\x9d\xf1\xd7\x19\xc5\xf2\xa7\
+\x30\x01\x00\x74\xd1\x97\x92\x5c\x98\xe4\x7b\x33\xfa\xfc\x37\xc6\
+\xf2\xa7\x38\x01\x00\x74\xd5\xdd\x49\x7e\x22\xc9\xbf\x6d\xe0\xe7\
+\x7c\x36\xc9\x95\x49\xde\x1f\xcb\x9f\xe2\x04\x00\xd0\x65\xdf\x4e\
+\x72\x7e\x92\xdf\x49\xf2\xf4\x3a\x3f\xd7\xed\x49\xce\x4a\xf2\xf1\
+\xf5\x0e\x05\x6c\xac\x47\x32\xbe\x19\x48\xeb\xb7\x8b\x66\xfd\x40\
+\x81\xa9\x1c\x9f\xe4\x03\x49\x1e\xce\xda\xff\x3e\xef\x4c\xf2\xa9\
+\x24\xe7\x36\x98\x17\x56\x72\x5a\xda\xef\xb9\xbd\x49\xf6\x6e\x9a\
+\xf5\x23\x05\xd8\x20\x4f\x66\x7c\x9f\x80\xeb\x92\xfc\x78\x92\x0b\
+\x92\x9c\x93\xe4\xf4\x24\x5b\x92\x1c\x91\xe4\xa9\x24\x8f\x27\xf9\
+\x66\xc6\xd7\x11\x6c\x4b\xb2\x6b\xfe\xa3\x42\xf7\x09\x00\xa0\x8f\
+\xee\xdf\xf7\x06\x4c\xc9\x35\x00\x00\x50\x90\x00\x00\x80\x82\x04\
+\x00\x00\x14\x24\x00\x00\xa0\x20\x01\x00\x00\x05\x09\x00\x00\x28\
+\x48\x00\x00\x40\x41\x02\x00\x00\x0a\x12\x00\x00\x50\x90\x00\x00\
+\x80\x82\x04\x00\x00\x14\x24\x00\x00\xa0\x20\x01\x00\x00\x05\x09\
+\x00\x00\x28\x48\x00\x00\x40\x41\x9b\x36\xe0\x73\x6c\x4e\x72\xe4\
+\x06\x7c\x9e\xae\xc4\xc8\x8f\x24\x39\xbe\xf5\x10\x30\x27\xbb\x93\
+\x3c\xd3\x7a\x08\x60\xfe\x16\x26\xfc\xf8\x53\x93\xbc\x23\xc9\x05\
+\x49\xce\x4e\xf2\xea\x6c\x4c\x44\x00\xed\xec\x49\xf2\xed\x24\x5f\
+\x4f\xb2\x2d\xc9\x67\x93\x3c\xd8\x72\x20\x18\xb0\xd3\x92\x3c\xd2\
+\x7a\x88\x64\x6d\x01\xb0\x90\xe4\xe2\x24\x57\x27\xd9\xba\xc6\xff\
+\x06\xe8\xb7\x2f\x27\xf9\x48\x92\x7f\x4c\xb2\xb7\xf1\x2c\x30\x24\
+\xbd\x09\x80\xb3\x92\xdc\x94\xf1\xe2\x07\xea\xf9\x4a\x92\xf7\x25\
+\xf9\x6a\xeb\x41\x60\x20\x3a\x13\x00\x07\x3b\xef\xfe\x6b\x49\xee\
+\x8d\xe5\x0f\x95\x9d\x97\xe4\xee\x24\xef\x6f\x3d\x08\xb0\xb1\x56\
+\x0a\x80\x85\x24\x1f\x4a\xf2\x97\x49\x8e\x9e\xef\x38\x40\x07\x1d\
+\x91\xe4\x86\x24\x7f\x9a\xee\x5c\xac\x0b\xac\xd3\x4a\x7f\x99\xff\
+\x30\xc9\x35\xf3\x1e\x04\xe8\xbc\xf7\x65\x1c\x01\xc0\x00\xbc\x38\
+\x00\x7e\x35\xc9\xef\xb6\x18\x04\xe8\x85\xdf\x88\xd3\x01\x30\x08\
+\xfb\x5f\x04\x78\x66\x92\xfb\x33\xfe\xbe\x7e\x80\xd5\xec\x4e\xf2\
+\x86\xb8\x30\x10\xa6\xd1\xc9\x8b\x00\xff\x24\x96\x3f\x70\x68\x47\
+\x24\xf9\xb3\xf8\x96\x60\xe8\xb5\xa5\x00\xb8\x30\xc9\x5b\x5a\x0e\
+\x02\xf4\xca\x1b\x33\xbe\x29\x18\xd0\x53\x4b\x01\xf0\xdb\x4d\xa7\
+\x00\xfa\xe8\xea\xd6\x03\x00\xd3\x5b\x4c\x72\x62\x92\xb7\xb6\x1e\
+\x04\xe8\x9d\x37\x25\x39\xa3\xf5\x10\xc0\x74\x16\x93\xbc\x3d\xc9\
+\x61\xad\x07\x01\x7a\x67\x21\xc9\x25\xad\x87\x00\xa6\xb3\x98\xe4\
+\xfc\xd6\x43\x00\xbd\xe5\x4e\xa1\xd0\x53\x8b\x19\xff\x54\x3f\x80\
+\x69\xbc\xb6\xf5\x00\xc0\x74\x16\x93\xbc\xaa\xf5\x10\x40\x6f\x9d\
+\xd2\x7a\x00\x60\x3a\x8b\x49\x8e\x6d\x3d\x04\xd0\x5b\x87\xc7\xfd\
+\x43\xa0\x97\x16\x33\xbe\xa9\x07\xc0\xb4\x8e\x6c\x3d\x00\x30\x39\
+\x3f\xd9\x0b\x00\x0a\x12\x00\x00\x50\x90\x00\x00\x80\x82\x04\x00\
+\x00\x14\x24\x00\x00\xa0\x20\x01\x00\x00\x05\x09\x00\x00\x28\x48\
+\x00\x00\x40\x41\x02\x00\x00\x0a\x12\x00\x00\x50\x90\x00\x00\x80\
+\x82\x04\x00\x00\x14\x24\x00\x00\xa0\x20\x01\x00\x00\x05\x09\x00\
+\x00\x28\x48\x00\x00\x40\x41\x9b\x5a\x0f\xb0\x9f\x73\x93\x3c\xd6\
+\x7a\x08\xe8\x89\xe3\x92\x6c\x6f\x3d\x04\xd0\x5f\x5d\x0a\x80\xa7\
+\x92\x3c\xd9\x7a\x08\x00\xa8\xc0\x29\x00\x00\x28\x48\x00\x00\x40\
+\x41\x02\x00\x00\x0a\x12\x00\x00\x50\x90\x00\x00\x80\x82\x04\x00\
+\x00\x14\x24\x00\x00\xa0\x20\x01\x00\x00\x05\x09\x00\x00\x28\x48\
+\x00\x00\x40\x41\x02\x00\x00\x0a\x12\x00\x00\x50\x90\x00\x00\x80\
+\x82\x04\x00\x00\x14\x24\x00\x00\xa0\x20\x01\x00\x00\x05\x09\x00\
+\x00\x28\x48\x00\x00\x40\x41\x02\x00\x00\x0a\x12\x00\x00\x50\x90\
+\x00\x00\x80\x82\x04\x00\x00\x14\x24\x00\x00\xa0\x20\x01\x00\x00\
+\x05\x09\x00\x00\x28\x48\x00\x00\x40\x41\x02\x00\x00\x0a\x12\x00\
+\x00\x50\x90\x00\x00\x80\x82\x04\x00\x00\x14\x24\x00\x00\xa0\x20\
+\x01\x00\x00\x05\x09\x00\x00\x28\x48\x00\x00\x40\x41\x02\x00\x00\
+\x0a\x12\x00\x00\x50\x90\x00\x00\x80\x82\x04\x00\x00\x14\x24\x00\
+\x00\xa0\x20\x01\x00\x00\x05\x09\x00\x00\x28\x48\x00\x00\x40\x41\
+\x02\x00\x00\x0a\x12\x00\x00\x50\x90\x00\x00\x80\x82\x04\x00\x00\
+\x14\x24\x00\x00\xa0\x20\x01\x00\x00\x05\x09\x00\x00\x28\x48\x00\
+\x00\x40\x41\x02\x00\x00\x0a\x12\x00\x00\x50\x90\x00\x00\x80\x82\
+\x04\x00\x00\x14\x24\x00\x00\xa0\x20\x01\x00\x00\x05\x09\x00\x00\
+\x28\x48\x00\x00\x40\x41\x02\x00\x00\x0a\x12\x00\x00\x50\x90\x00\
+\x00\x80\x82\x04\x00\x00\x14\x24\x00\x00\xa0\x20\x01\x00\x00\x05\
+\x09\x00\x00\x28\x48\x00\x00\x40\x41\x02\x00\x00\x0a\x12\x00\x00\
+\x50\x90\x00\x00\x80\x82\x04\x00\x00\x14\x24\x00\x00\xa0\x20\x01\
+\x00\x00\x05\x09\x00\x00\x28\x48\x00\x00\x40\x41\x02\x00\x00\x0a\
+\x12\x00\x00\x50\x90\x00\x00\x80\x82\x04\x00\x00\x14\x24\x00\x00\
+\xa0\x20\x01\x00\x00\x05\x09\x00\x00\x28\x48\x00\x00\x40\x41\x02\
+\x00\x00\x0a\x12\x00\x00\x50\x90\x00\x00\x80\x82\x04\x00\x00\x14\
+\x24\x00\x00\xa0\x20\x01\x00\x00\x05\x09\x00\x00\x28\x48\x00\x00\
+\x40\x41\x02\x00\x00\x0a\x12\x00\x00\x50\x90\x00\x00\x80\x82\x04\
+\x00\x00\x14\x24\x00\x00\xa0\x20\x01\x00\x00\x05\x09\x00\x00\x28\
+\x48\x00\x00\x40\x41\x02\x00\x00\x0a\x12\x00\x00\x50\x90\x00\x00\
+\x80\x82\x04\x00\x00\x14\x24\x00\x00\xa0\x20\x01\x00\x00\x05\x09\
+\x00\x00\x28\x48\x00\x00\x40\x41\x02\x00\x00\x0a\x12\x00\x00\x50\
+\x90\x00\x00\x80\x82\x04\x00\x00\x14\x24\x00\x00\xa0\x20\x01\x00\
+\x00\x05\x09\x00\x00\x28\x48\x00\x00\x40\x41\x02\x00\x00\x0a\x12\
+\x00\x00\x50\x90\x00\x00\x80\x82\x04\x00\x00\x14\x24\x00\x00\xa0\
+\x20\x01\x00\x00\x05\x09\x00\x00\x28\x48\x00\x00\x40\x41\x02\x00\
+\x00\x0a\x12\x00\x00\x50\x90\x00\x00\x80\x82\x04\x00\x00\x14\x24\
+\x00\x00\xa0\x20\x01\x00\x00\x05\x09\x00\x00\x28\x48\x00\x00\x40\
+\x41\x02\x00\x00\x0a\x12\x00\x00\x50\x90\x00\x00\x80\x82\x04\x00\
+\x00\x14\x24\x00\x00\xa0\x20\x01\x00\x00\x05\x09\x00\x00\x28\x48\
+\x00\x00\x40\x41\x02\x00\x00\x0a\x12\x00\x00\x50\x90\x00\x00\x80\
+\x82\x04\x00\x00\x14\x24\x00\x00\xa0\x20\x01\x00\x00\x05\x09\x00\
+\x00\x28\x48\x00\x00\x40\x41\x02\x00\x00\x0a\x12\x00\x00\x50\x90\
+\x00\x00\x80\x82\x04\x00\x00\x14\x24\x00\x00\xa0\x20\x01\x00\x00\
+\x05\x09\x00\x00\x28\x48\x00\x00\x40\x41\x02\x00\x00\x0a\x12\x00\
+\x00\x50\x90\x00\x00\x80\x82\x04\x00\x00\x14\x24\x00\x00\xa0\x20\
+\x01\x00\x00\x05\x09\x00\x00\x28\x48\x00\x00\x40\x41\x02\x00\x00\
+\x0a\x12\x00\x00\x50\x90\x00\x00\x80\x82\x04\x00\x00\x14\x24\x00\
+\x00\xa0\x20\x01\x00\x00\x05\x6d\x6a\x3d\x00\xd0\x7b\x5b\x93\xec\
+\x6c\x3d\x04\xf4\xc4\x89\xad\x07\x58\x22\x00\x80\xf5\xba\xbd\xf5\
+\x00\xc0\xe4\x9c\x02\x00\x80\x82\x04\x00\x00\x14\x24\x00\x00\xa0\
+\x20\x01\x00\x00\x05\x09\x00\x00\x28\x48\x00\x00\x40\x41\x02\x00\
+\x00\x0a\x12\x00\x00\x50\x90\x00\x00\x80\x82\x04\x00\x00\x14\x24\
+\x00\x00\xa0\x20\x01\x00\x00\x05\x09\x00\x00\x28\x48\x00\x00\x40\
+\x41\x02\x00\x00\x0a\x12\x00\x00\x50\x90\x00\x00\x80\x7a\x76\x09\
+\x00\x00\xa8\x67\x87\x00\x00\x80\x7a\x1e\x11\x00\x00\x50\xcf\x7f\
+\x08\x00\x00\xa8\xe7\x5f\x05\x00\x00\xd4\xf2\x4c\x92\x2f\x08\x00\
+\x00\xa8\xe5\xef\x92\xec\x14\x00\x00\x50\xc7\x9e\x24\x1f\x4e\xdc\
+\x07\x00\x00\x2a\xf9\xf3\x24\xdf\x4a\x04\x00\x00\x54\xf1\x78\x92\
+\x6b\x97\x7e\x21\x00\x00\x60\xf8\x9e\x4f\xf2\xee\x24\x4f\x2e\xfd\
+\x86\x00\x00\x80\x61\x7b\x21\xc9\x7b\x92\xdc\xb5\xff\x6f\x0a\x00\
+\x00\x18\xae\xe7\x92\xbc\x2b\xc9\xad\x2f\x7e\xc7\xa6\xf9\xcf\x02\
+\x00\xcc\xc1\xf6\x24\xbf\x98\xe4\xde\x95\xde\xe9\x08\x00\x00\x0c\
+\xcb\xf3\x49\xae\x4f\xf2\xfa\xac\xb2\xfc\x13\x47\x00\x00\x60\x28\
+\xbe\x93\xe4\x53\x49\x3e\x9e\xe4\x89\x43\x7d\x70\x97\x02\xe0\xe4\
+\xd6\x03\x40\x8f\x6c\x69\x3d\xc0\x7e\x1e\xcb\xf8\x22\x23\x60\x7e\
+\x9e\x4f\xf2\x54\x92\x47\x93\x3c\x90\x64\x5b\x92\x7b\x32\xbe\xd1\
+\xcf\x9a\x2c\x24\xd9\x3b\x8b\xc9\x80\x32\x5e\x9e\xfd\xbe\xb5\x08\
+\xe8\x07\xd7\x00\x00\x40\x41\x02\x00\x00\x0a\x12\x00\x00\x50\x90\
+\x00\x00\x80\x82\x04\x00\x00\x14\x24\x00\x00\xa0\x20\x01\x00\x00\
+\x05\x09\x00\x00\x28\x48\x00\x00\x40\x41\x02\x00\x00\x0a\x12\x00\
+\x00\x50\x90\x00\x00\x80\x82\x04\x00\x00\x14\x24\x00\x00\xa0\x20\
+\x01\x00\x00\x05\x09\x00\x00\x28\x68\x31\xc9\xee\xd6\x43\x00\xbd\
+\xf6\x5c\xeb\x01\x80\xc9\x2d\x26\x79\xaa\xf5\x10\x40\x6f\xed\x4e\
+\xf2\x6c\xeb\x21\x80\xc9\x2d\x26\x79\xac\xf5\x10\x40\x6f\x3d\xda\
+\x7a\x00\x60\x3a\x8b\x49\x1e\x68\x3d\x04\xd0\x5b\x5f\x6b\x3d\x00\
+\x30\x9d\xc5\x24\x77\xb6\x1e\x02\xe8\xad\x6d\xad\x07\x00\xa6\xb3\
+\x90\xe4\xe5\x49\x9e\x48\x72\x64\xe3\x59\x80\x7e\xd9\x9b\xe4\xb4\
+\x38\x8d\x08\xbd\xb4\x98\xe4\x07\x49\x3e\xdb\x7a\x10\xa0\x77\xfe\
+\x25\x96\x3f\xf4\xd6\xd2\x7d\x00\x3e\xdc\x74\x0a\xa0\x8f\xae\x6f\
+\x3d\x00\x30\xbd\xa5\x00\xb8\x27\xc9\x6d\x2d\x07\x01\x7a\xe5\x9f\
+\x93\xfc\x53\xeb\x21\x80\xe9\x2d\xec\xf7\xef\x27\x27\xf9\xcf\x24\
+\xc7\x35\x9a\x05\xe8\x87\x67\x92\x9c\x9b\xe4\xc1\xd6\x83\x00\xd3\
+\xdb\xff\x56\xc0\x8f\x27\xb9\x3c\xe3\x0b\x7b\x00\x56\xf3\x9b\xb1\
+\xfc\xa1\xf7\x0e\x7b\xd1\xaf\xbf\x91\x64\x57\x92\xb7\x34\x98\x05\
+\xe8\xbe\x3f\x48\xf2\xb1\xd6\x43\x00\xeb\xf7\xe2\x00\x48\x92\xbb\
+\x92\xec\x48\xf2\xb3\x39\xf0\x14\x01\x50\xdb\xf5\x49\xae\x6d\x3d\
+\x04\xb0\x31\x56\x0a\x80\x24\xb9\x3b\xe3\x3b\x7c\xbd\x35\xc9\x51\
+\xf3\x1b\x07\xe8\xa0\x9d\x49\x2e\x8b\x57\xfe\x30\x28\xab\x05\x40\
+\x32\x3e\x1d\x70\x4b\x92\x53\x92\xbc\x66\x3e\xe3\x00\x1d\xf3\xb9\
+\x24\xef\x4c\xf2\xc5\xd6\x83\x00\x1b\x6b\xf1\x10\xef\x7f\x3c\xc9\
+\x2f\x24\x79\x43\x92\xbf\x8f\x1f\x1d\x0c\x15\xfc\x30\xc9\x67\x92\
+\xbc\x39\xc9\x25\x49\xb6\xb7\x1d\x07\x98\x85\x49\xcf\xf1\xbf\x22\
+\xc9\xc5\x49\xb6\x26\x79\x5d\x92\x53\x93\x1c\x1b\xa7\x09\xa0\xaf\
+\x9e\x4f\xf2\x74\xc6\x77\xf4\xfb\x7a\xc6\xf7\xf6\xbf\x23\xc9\x77\
+\xdb\x8d\x04\xcc\xc3\xff\x01\x87\x71\xbd\x2d\x30\x31\x07\x47\x00\
+\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x1a\x0b\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x02\x00\x00\x00\x02\x00\x08\x03\x00\x00\x00\xc3\xa6\x24\xc8\
+\x00\x00\x00\x03\x73\x42\x49\x54\x08\x08\x08\xdb\xe1\x4f\xe0\x00\
+\x00\x00\x09\x70\x48\x59\x73\x00\x00\x19\x08\x00\x00\x19\x08\x01\
+\x2f\x5e\x5f\x23\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\x74\
+\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\x70\
+\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x03\x00\x50\x4c\x54\
+\x45\xff\xff\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x0b\x23\xb7\xe1\x00\x00\x00\xff\x74\x52\x4e\x53\x00\x01\x02\
+\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\x0f\x10\x11\x12\
+\x13\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\x1f\x20\x21\x22\
+\x23\x24\x25\x26\x27\x28\x29\x2a\x2b\x2c\x2d\x2e\x2f\x30\x31\x32\
+\x33\x34\x35\x36\x37\x38\x39\x3a\x3b\x3c\x3d\x3e\x3f\x40\x41\x42\
+\x43\x44\x45\x46\x47\x48\x49\x4a\x4b\x4c\x4d\x4e\x4f\x50\x51\x52\
+\x53\x54\x55\x56\x57\x58\x59\x5a\x5b\x5c\x5d\x5e\x5f\x60\x61\x62\
+\x63\x64\x65\x66\x67\x68\x69\x6a\x6b\x6c\x6d\x6e\x6f\x70\x71\x72\
+\x73\x74\x75\x76\x77\x78\x79\x7a\x7b\x7c\x7d\x7e\x7f\x80\x81\x82\
+\x83\x84\x85\x86\x87\x88\x89\x8a\x8b\x8c\x8d\x8e\x8f\x90\x91\x92\
+\x93\x94\x95\x96\x97\x98\x99\x9a\x9b\x9c\x9d\x9e\x9f\xa0\xa1\xa2\
+\xa3\xa4\xa5\xa6\xa7\xa8\xa9\xaa\xab\xac\xad\xae\xaf\xb0\xb1\xb2\
+\xb3\xb4\xb5\xb6\xb7\xb8\xb9\xba\xbb\xbc\xbd\xbe\xbf\xc0\xc1\xc2\
+\xc3\xc4\xc5\xc6\xc7\xc8\xc9\xca\xcb\xcc\xcd\xce\xcf\xd0\xd1\xd2\
+\xd3\xd4\xd5\xd6\xd7\xd8\xd9\xda\xdb\xdc\xdd\xde\xdf\xe0\xe1\xe2\
+\xe3\xe4\xe5\xe6\xe7\xe8\xe9\xea\xeb\xec\xed\xee\xef\xf0\xf1\xf2\
+\xf3\xf4\xf5\xf6\xf7\xf8\xf9\xfa\xfb\xfc\xfd\xfe\xeb\x08\xd9\x35\
+\x00\x00\x15\x72\x49\x44\x41\x54\x78\xda\xed\x9d\x67\x60\x15\x55\
+\xde\xc6\x4f\x6e\x42\xd1\xd0\x42\x0d\x11\x58\x9a\x01\x5c\x94\xb2\
+\x60\x59\x94\x22\x62\x04\x44\x36\x60\x48\x20\x84\x22\x02\xe2\xab\
+\xb0\x20\x6d\x41\x31\x26\x80\x25\x94\x04\x90\x22\x82\x20\xb2\xc0\
+\x2a\xd2\xa5\x88\x20\x65\x59\x44\xa5\xc9\x8b\x52\x97\x96\x10\x88\
+\x60\x20\x8d\x40\xc8\xd9\x0f\xef\xee\xbb\xbb\xc8\x9c\x29\x77\xce\
+\xcc\x99\xfb\x7f\x7e\x9f\x21\xe7\xdc\xff\xef\xb9\x77\x66\xce\x9c\
+\xc2\x18\x70\x8f\xf2\x3d\x3e\x3e\x90\x59\x98\xf1\xfd\xc2\xe8\x32\
+\x28\x06\x3d\xaa\x4c\xcd\xe7\xff\x22\x67\x62\x18\x0a\x42\x8c\x3e\
+\xb9\xfc\x3f\xc9\xee\x86\x92\x50\xc2\x97\xc2\xef\xa0\x78\x42\x10\
+\xca\x42\x86\xe0\x4f\xf8\xaf\x99\x8d\x04\x90\xf6\x8f\x04\x50\xf7\
+\x8f\x04\x50\xf7\x8f\x04\x50\xf7\x8f\x04\x50\xf7\x8f\x04\x50\xf7\
+\x8f\x04\x50\xf7\x8f\x04\x50\xf7\x8f\x04\x50\xf7\x8f\x04\x50\xf7\
+\x8f\x04\x50\xf7\x8f\x04\x50\xf7\x8f\x04\x50\xf7\x8f\x04\x50\xf7\
+\x8f\x04\x50\xf7\x8f\x04\x50\xf7\x8f\x04\x50\xf7\x8f\x04\x50\xf7\
+\x8f\x04\x50\xf7\x8f\x04\x50\xf7\x8f\x04\x50\xf7\x8f\x04\x50\xf7\
+\x8f\x04\x50\xf7\x8f\x04\x50\xf7\x8f\x04\x50\xf7\x8f\x04\x50\xf7\
+\x8f\x04\x50\xf7\x8f\x04\x50\xf7\x8f\x04\x50\xf7\x8f\x04\x50\xf7\
+\x8f\x04\x50\xf7\x8f\x04\x50\xf7\x8f\x04\x50\xf7\x8f\x04\x50\xf7\
+\x8f\x04\x50\xf7\x8f\x04\x50\xf7\x8f\x04\x50\xf7\x8f\x04\x50\xf7\
+\x8f\x04\x50\xf7\x8f\x04\x50\xf7\x8f\x04\x50\xf7\x8f\x04\x50\xf7\
+\x8f\x04\x50\xf7\x8f\x04\x50\xf7\x8f\x04\x50\xf7\x8f\x04\x50\xf7\
+\x8f\x04\x50\xf7\x8f\x04\x50\xf7\x8f\x04\x50\xf7\x8f\x04\x50\xf7\
+\x8f\x04\x50\xf7\x8f\x04\x50\xf7\x8f\x04\x50\xf7\x8f\x04\x50\xf7\
+\x8f\x04\x50\xf7\x8f\x04\x50\xf7\x8f\x04\x50\xf7\x8f\x04\x50\xf7\
+\x8f\x04\x50\xf7\x8f\x04\x50\xf7\x8f\x04\x50\xf7\x8f\x04\x50\xf7\
+\x8f\x04\x50\xf7\x8f\x04\x50\xf7\x8f\x04\x50\xf7\x8f\x04\x50\xf7\
+\x8f\x04\x50\xf7\x8f\x04\x50\xf7\x8f\x04\x50\xf7\x8f\x04\x50\xf7\
+\x8f\x04\x50\xf7\x8f\x04\x50\xf7\x8f\x04\x50\xf7\x8f\x04\x50\xf7\
+\x8f\x04\x50\xf7\x8f\x04\x50\xf7\x8f\x04\x50\xf7\x8f\x04\x50\xf7\
+\x8f\x04\x50\xf7\x8f\x04\x50\xf7\x8f\x04\x50\xf7\x8f\x04\x50\xf7\
+\x8f\x04\x50\xf7\x8f\x04\x50\xf7\x8f\x04\x50\xf7\x8f\x04\x50\xf7\
+\x8f\x04\x50\xf7\x8f\x04\x50\xf7\x8f\x04\x50\xf7\x8f\x04\x50\xf7\
+\x8f\x04\x50\xf7\x8f\x04\x50\xf7\x8f\x04\x50\xf7\x8f\x04\x50\xf7\
+\xcf\xf9\x4c\x38\x25\xed\x9f\xf3\x57\x60\x95\xb4\x7f\x7e\xab\x35\
+\xbc\x52\xf6\xcf\xf9\x0f\x3e\x98\xa5\xec\x9f\xf3\x3e\x50\x4b\xda\
+\x3f\xdf\x0f\xb7\xa4\xfd\x73\x7e\x1f\xec\x92\xf6\xcf\x5f\x80\x5e\
+\xd2\xfe\x79\x32\xfc\x92\xf6\xcf\xe7\x42\x30\x69\xff\x7c\x11\x0c\
+\x93\xf6\xcf\x53\xa0\x98\xb4\x7f\x3e\x12\x8e\x49\xfb\xe7\x8f\x41\
+\x32\x69\xff\x59\x18\x0b\x26\xed\x1f\x6f\x84\x89\xfb\xcf\x0b\x87\
+\x66\xca\xfe\x79\x22\x34\x93\xf6\xbf\x25\x18\x9e\x29\xfb\x3f\x16\
+\x06\xcf\x94\xfd\x9f\xa8\x01\xcf\xf0\x0f\xe0\x1f\xc0\x3f\x80\x7f\
+\x00\xff\x00\xfe\x01\xfc\xc3\x3f\xfc\xc3\x3f\xfc\xc3\x3f\xfc\xc3\
+\x3f\xfc\xc3\x3f\xfc\xc3\x3f\xfc\xc3\x3f\xfc\xc3\x3f\xfc\xc3\x3f\
+\xfc\xc3\x3f\xfc\xc3\x3f\xfc\xc3\x3f\xfc\xc3\x3f\xfc\xc3\x3f\xfc\
+\xc3\x3f\xfc\xc3\x3f\xfc\xc3\x3f\xfc\xc3\x3f\xfc\xc3\x3f\xfc\xc3\
+\x3f\xfc\xc3\x3f\xfc\xc3\x3f\xfc\xc3\x3f\xfc\xc3\x3f\xfc\xc3\x3f\
+\xfc\xc3\x3f\xfc\xc3\x3f\xfc\xc3\x3f\xfc\xc3\x3f\xfc\xc3\x3f\xfc\
+\xc3\x3f\xfc\xc3\x3f\xfc\xc3\x3f\xfc\xc3\x3f\xfc\xc3\x3f\xfc\xc3\
+\x3f\xfc\xc3\x3f\xfc\xc3\x3f\xfc\xc3\x3f\xfc\xc3\x3f\xfc\xc3\x3f\
+\xfc\xc3\x3f\xfc\xc3\x3f\xfc\xc3\x3f\xfc\xc3\x3f\xfc\xc3\x3f\xfc\
+\xc3\x3f\xfc\xc3\x3f\xfc\xc3\x3f\xfc\xc3\x3f\xfc\xc3\x3f\xfc\xc3\
+\x3f\xfc\xc3\x3f\xfc\xc3\x3f\xfc\xc3\x3f\xfc\xc3\x3f\xfc\xc3\x3f\
+\xfc\xc3\x3f\x80\x7f\x00\xff\x00\xfe\x01\xfc\x03\xf8\x07\xf0\x0f\
+\xff\xf0\x0f\xff\xf0\x0f\xff\xf0\x0f\xff\xf0\x0f\xff\xf0\x0f\xff\
+\xf0\x0f\xff\xf0\x0f\xff\xf0\x0f\xff\xf0\x0f\xff\xf0\x0f\xff\xf0\
+\x0f\xff\xf0\x0f\xff\xf0\x0f\xff\xf0\x0f\xff\xf0\x0f\xff\xf0\x0f\
+\xff\xf0\x0f\xff\xf0\x0f\xff\xf0\x0f\xff\xf0\x0f\xff\xf0\x0f\xff\
+\xf0\x0f\xff\xf0\x0f\xff\xf0\x0f\xff\xf0\x0f\xff\xf0\x0f\xff\xf0\
+\x0f\xff\xf0\x0f\xff\xf0\x0f\xff\xf0\x0f\xff\xf0\x0f\xff\xf0\x0f\
+\xff\xf0\x0f\xff\xf0\x0f\xff\xf0\x0f\xff\xf0\x0f\xff\xf0\x0f\xff\
+\xf0\x0f\xff\xf0\x0f\xff\xf0\x0f\xff\xf0\x0f\xff\xf0\x0f\xff\xf0\
+\x0f\xff\xf0\x0f\xff\xf0\x0f\xff\xf0\x0f\xff\xf0\x0f\xff\xf0\x0f\
+\xff\xf0\xef\x17\x73\xe0\x9f\x34\x71\xf0\x4f\x9a\xfa\xd7\xe1\x9f\
+\x34\x7f\x83\x7f\xd2\x3c\x04\xff\xb4\x79\x0f\xfe\x49\xe3\x3b\x0f\
+\xff\xa4\x69\x09\xff\xb4\x19\x02\xff\xb4\x99\x0f\xff\xb4\xd9\x0f\
+\xff\xa4\x29\x75\x13\xfe\x49\xd3\x02\xfe\x69\x33\x18\xfe\x69\x33\
+\x0f\xfe\x69\xf3\x1d\xfc\x93\xa6\x64\x21\xfc\x93\xa6\x39\xfc\xd3\
+\x66\x20\xfc\xd3\x66\x0e\xfc\xd3\x66\x1f\xfc\x93\xa6\xc4\x0d\xed\
+\x32\x1e\xc9\x83\xff\x80\xa7\xa9\xa0\x8e\x63\x9f\xcc\x83\xff\x40\
+\x67\x80\xa0\x90\x1d\x98\x27\x13\x00\xff\x66\x98\x2d\xa8\x64\x25\
+\xe6\xc5\x04\xc0\xbf\x29\xf6\x6a\x57\xf2\xef\x8c\x79\x30\x01\xf0\
+\x6f\x8a\x90\x02\xed\x52\xae\x64\x1e\x4c\x00\xfc\x9b\x43\x34\x23\
+\x7c\x1c\xf3\x5e\x02\xe0\xdf\x24\xfd\x05\xc5\x8c\x62\x9e\x4b\x00\
+\xfc\x9b\x65\x96\xa0\x9a\x95\x99\xd7\x12\x00\xff\xa6\xd9\xa3\x5d\
+\xcd\xb3\xff\xfe\x57\x1e\x49\x00\xfc\x9b\x26\x38\x5f\xbb\x9c\xab\
+\x98\xc7\x12\x00\xff\xe6\x69\x2c\xa8\xe7\xeb\xcc\x5b\x09\x80\x7f\
+\x0b\xf4\x15\x14\xb4\x23\xf3\x54\x02\xe0\xdf\x0a\x33\x04\x15\xad\
+\xca\xbc\x94\x00\xf8\xb7\xc4\x6e\xed\x8a\x9e\xbf\xf3\xdf\x2a\x9d\
+\x00\xf8\xb7\x84\x2f\x57\xbb\xa4\x6b\x98\x87\x12\x00\xff\xd6\x78\
+\x40\x50\xd3\x09\xcc\x3b\x09\x80\x7f\x8b\x24\x08\x8a\xda\x99\x79\
+\x26\x01\xf0\x6f\x95\x54\x41\x55\xc3\x99\x57\x12\x00\xff\x96\xd9\
+\xa9\x5d\xd5\xf4\xbb\xff\x0f\x05\x13\x00\xff\xd6\xef\x01\x73\xb4\
+\xcb\xba\x8e\x79\x24\x01\xf0\x6f\x9d\x86\x82\xba\x26\x32\x6f\x24\
+\x00\xfe\xfd\x20\x5e\x50\xd8\x2e\xcc\x13\x09\x80\x7f\x7f\x98\x26\
+\xa8\x6c\x04\xf3\x42\x02\xe0\xdf\x2f\xbe\xd6\xae\xec\x45\xd1\xff\
+\x53\x26\x01\xf0\xef\x17\x41\x82\x1d\x82\xd7\x33\x0f\x24\x00\xfe\
+\xfd\x23\x52\x50\xdb\x24\xa6\x7e\x02\xe0\xdf\x4f\x7a\x0a\x8a\xdb\
+\x95\x29\x9f\x00\xf8\xf7\x97\x29\x82\xea\xea\x16\xd7\xf5\x04\xc0\
+\xbf\xdf\x6c\xd3\xae\xee\x25\xfd\xff\xed\x72\x02\xe0\xdf\xff\x7b\
+\xc0\x6c\xed\xf2\x7e\xc1\x14\x4f\x00\xfc\xfb\x4f\x7d\x41\x7d\x27\
+\x32\xb5\x13\x00\xff\x36\x10\x2b\x28\x70\x34\x53\x3a\x01\xf0\x6f\
+\x07\xa2\x63\x22\x6a\x31\x95\x13\x00\xff\xb6\xf0\x95\x76\x85\xb3\
+\x8c\xfe\x0d\x57\x12\x00\xff\xf6\x70\x55\xbb\xc4\x9b\x98\xc2\x09\
+\x80\x7f\x7b\xa8\x2b\xa8\xf1\x64\xa6\x6e\x02\xe0\xdf\x26\x62\x04\
+\x45\xee\xce\x94\x4d\x00\xfc\xdb\xc5\x3b\x82\x2a\xd7\x66\xaa\x26\
+\x00\xfe\x6d\xe3\x4b\xed\x2a\x5f\x31\xf7\x97\x1c\x4c\x00\xfc\xdb\
+\xc7\x15\xed\x32\x6f\x61\x8a\x26\x00\xfe\xed\xa3\xb6\xa0\xce\x6f\
+\x33\x35\x13\x00\xff\x36\xd2\x5d\x50\xe8\x18\xa6\x64\x02\xe0\xdf\
+\x4e\x26\x0b\x2a\x5d\x97\xa9\x98\x00\xf8\xb7\x95\xcd\xda\x95\xbe\
+\x6a\xe5\xef\x49\x4f\x00\xfc\xdb\x4b\x96\x76\xa9\xb7\x32\x05\x13\
+\x00\xff\xf6\x52\x4b\x50\xeb\x77\x99\x7a\x09\x80\x7f\x9b\x89\x16\
+\x14\x3b\x96\x29\x97\x00\xf8\xb7\x9b\x89\x82\x6a\xd7\x67\xaa\x25\
+\x00\xfe\x6d\x67\xa3\x76\xb5\xb3\x83\x98\x62\x09\x80\x7f\xfb\xb9\
+\xa4\x5d\xee\x6d\x7e\xfc\x59\x29\x09\x80\x7f\xfb\xa9\x21\xa8\x77\
+\x0a\x53\x2b\x01\xf0\x2f\x81\xae\x82\x82\xf7\x64\x4a\x25\x00\xfe\
+\x65\x90\x24\xa8\x78\x24\x53\x29\x01\xf0\x2f\x85\x0d\xda\x15\xbf\
+\x16\xc4\x14\x4a\x00\xfc\xcb\xe1\xa2\x76\xc9\xbf\xf6\xfb\x8f\xdb\
+\x98\x00\xf8\x97\x43\x84\xa0\xe6\x53\x99\x3a\x09\x80\x7f\x49\x74\
+\x11\x14\x3d\x9e\x29\x93\x00\xf8\x97\x45\xa2\xa0\xea\x0d\x99\x2a\
+\x09\x80\x7f\x69\xac\xd3\xae\x7a\x8e\x8f\x29\x92\x00\xf8\x97\x47\
+\x86\x76\xd9\x77\xda\xd4\x84\xdf\x09\x80\x7f\x79\x84\x0b\xea\x3e\
+\x9d\xa9\x91\x00\xf8\x97\x48\x67\x41\xe1\xff\x5a\x46\x89\x04\xc0\
+\xbf\x4c\x26\x88\x4a\xbf\x4b\x85\x04\xc0\xbf\x54\xd6\x70\xc5\x13\
+\x00\xff\x72\xb9\xc0\xd5\x4e\x00\xfc\xcb\xa5\xaa\x9e\x00\x97\x13\
+\x00\xff\x92\xe9\xc8\x95\x4e\x00\xfc\xcb\xe6\x75\xae\x72\x02\xe0\
+\x5f\x3a\xab\xb8\xc2\x09\x80\x7f\xf9\x9c\xe3\xea\x26\x00\xfe\xe5\
+\x53\xc5\x98\x0a\x1b\x13\x90\x0f\xff\x2a\x11\xc5\x1d\x4c\x40\xd5\
+\x8e\xaf\xaf\x3a\x0b\xff\x4a\x31\x8e\x3b\x93\x80\xf0\xce\x13\xd6\
+\x9c\xc7\xf5\x5f\x3d\x56\x72\xe9\x09\x88\xe8\x92\xb8\x36\x1d\xcf\
+\x7f\x8a\x72\x86\xcb\x4c\x40\x8d\xae\x49\xeb\x2f\x62\xfc\x4f\x61\
+\x2a\x99\x91\x62\x2a\x01\xb5\xa2\x27\x7e\x71\x09\xef\x7f\x54\xa7\
+\x03\x97\x90\x80\xda\xdd\x27\x6d\xca\xc2\xfb\x7f\x4f\x30\x96\xdb\
+\x9b\x80\xba\x31\x6f\x6f\xb9\x82\xf9\x5f\xde\xe1\x53\x6e\x57\x02\
+\x82\xea\xc7\xbe\xbb\xf5\x2a\xe6\xff\x7a\x8c\xd3\xdc\x86\x04\x04\
+\x45\xf6\x4c\xd9\x96\x8d\xf5\x1f\x1e\x24\xcc\xbc\x9e\xff\x4e\x80\
+\xaf\x61\xaf\xa9\x5f\x5f\xc3\xfa\x3f\xaf\xd2\x9e\x5b\x4f\x80\xef\
+\x81\xde\xd3\x77\xe6\x60\xfd\xb7\xa7\x19\xcd\x2d\x25\x20\xb8\x71\
+\x9f\xb4\xdd\xb9\xd8\xff\xc3\xfb\xac\xb0\x24\x29\x1d\xfb\x3f\x05\
+\x0a\x27\xb9\x5a\xc0\xbf\xb3\x54\x28\x86\x7f\xd2\xb4\x83\x7f\xda\
+\x8c\x84\x7f\xda\x2c\x83\x7f\xda\x1c\x87\x7f\xd2\x94\x2b\x86\x7f\
+\xd2\xb4\x81\x7f\xda\x8c\x50\xc6\xff\xd6\x6a\xb0\xe1\x02\x4b\x15\
+\xd1\x5f\xf4\x86\x0f\x32\xdc\xe0\x27\x35\xf4\x6f\x7c\x02\x2a\x5c\
+\xa1\xec\x6d\xf7\xed\x17\xee\x19\x5a\x15\x26\x5c\xe2\x09\x77\xdd\
+\xdf\xd8\x37\x77\x60\xf3\x92\xd0\xe0\x1e\x7f\x74\xcd\x7d\xc1\xde\
+\xd9\x03\x9a\x96\x80\x01\x97\x59\xe2\x86\xfb\xfc\x3d\xb3\xfa\x3f\
+\x14\x82\xe2\xab\xc0\x51\x87\xdd\xe7\xee\x9e\xd1\xb7\x71\x30\xea\
+\xae\x0a\xa1\x0e\xde\x03\xe6\xec\x4a\x4d\x78\x00\xcf\x7a\x6a\xd1\
+\xca\x19\xf7\xd7\x77\x4c\x8b\x6f\x08\xf7\x0a\x32\x54\xba\xfb\xec\
+\xed\x53\x7a\x46\x06\xa1\xd2\x8a\xf2\x81\x4c\xf7\xbf\x7c\xf5\x5e\
+\x6c\x7d\xb8\x57\x9a\xcf\x25\xb9\xbf\xf2\xe5\x3b\x31\x75\x51\x5e\
+\xf5\xd9\x61\xbf\xfb\xac\xcd\x93\xbb\xd7\x46\x65\x3d\xc2\x21\x5b\
+\xdd\x5f\xda\x38\x31\xba\x16\x8a\xea\x25\xd6\xda\xe5\x3e\x73\x43\
+\x52\x57\xbc\xce\xf7\x1e\x93\x6d\x70\x9f\xb1\x2e\xb1\x4b\x04\x4a\
+\xe9\x4d\x7a\xfa\xe7\xfe\xc2\x9a\x09\x9d\xc3\x51\x45\x0f\x53\xc1\
+\xf2\xc2\xce\x73\xab\x5e\xef\x88\x97\xb8\xde\x27\xcd\x82\xfb\x33\
+\x2b\xc7\x45\x55\x41\xe9\x02\x83\x3a\x45\xa6\xdc\x9f\xfe\x74\x6c\
+\x87\x4a\xa8\x5a\x20\xf1\x27\x83\xea\x8b\x4f\xae\x18\xdd\x3e\x0c\
+\xf5\x0a\x38\x82\xd6\xe8\xbb\x3f\xbe\x6c\x64\xbb\x0a\x28\x55\xa0\
+\xde\x07\x8a\x06\x83\x8a\x7f\x5a\x3a\xa2\x4d\x39\x14\x29\xa0\x29\
+\x73\xf7\x17\x02\xb7\x8f\x2e\xf9\xe3\x13\x65\x51\x1e\x0a\x57\x81\
+\x21\x77\xec\xe4\x5a\x74\x64\xf1\xd0\x56\xa1\x28\x0c\x1d\x42\x47\
+\x7d\xf3\xcf\x25\x82\x45\x87\x3f\x7a\xe5\xf7\xf7\xa2\x22\xf4\xa8\
+\xd6\x79\xd0\x9b\x23\x62\x1f\xbe\x07\x95\x00\x00\x00\x00\x02\x86\
+\x90\xa8\xc4\xf5\x67\xd3\xcf\xed\x4f\xed\x82\x09\xf9\x04\x69\x3a\
+\xfd\xf2\xff\x3f\xdf\x1d\xef\x8d\x39\x9a\xc4\xee\xed\x47\xdc\x31\
+\xce\x37\x0f\x09\xa0\x43\xa9\x98\xf5\xb7\x7e\x35\xc0\xb7\x00\xeb\
+\x33\x88\xf0\xe8\x9c\xbb\x9f\xdc\xb0\x18\x09\x20\x40\xd5\x71\xc7\
+\x34\x5f\xf0\xbc\x8d\xf2\x04\xbc\xfe\x29\xa2\xad\xbc\x73\xf0\x66\
+\x37\xc0\x6f\xfc\xa6\xea\xec\xe4\x3e\x16\x35\x0a\x68\xfd\xba\x07\
+\x33\x5f\x2c\x85\x32\x05\x2a\xe1\xd3\x8c\x9c\xcb\x3d\xc0\x43\x9f\
+\xc8\x17\x56\xa7\x59\xbb\x6e\x2f\x8c\x18\xf7\x46\x62\xf2\xe4\x77\
+\xa7\xa6\xce\x9c\x9d\x36\x69\xdc\xd0\x01\xb1\xcf\xb6\x6d\xd1\x28\
+\x02\xbb\x8c\x58\xd1\xcf\xf9\x22\xe5\x3f\x49\x50\xf5\x87\xbb\x0f\
+\x9f\xf6\xe9\x37\x67\xb2\x85\x3b\xd9\xde\xce\xdc\xbf\x61\x7e\xd2\
+\x4b\x5d\x5b\xde\x87\x47\x1b\xc6\xc2\xa7\xe7\x1b\x9c\xe0\xf9\xa5\
+\xc2\x9f\x22\xe4\xc1\x3e\xa9\xdb\x4e\x17\x9a\xde\x6e\xec\x87\xcf\
+\x26\x26\xb4\xa4\x3c\x79\x2d\x34\x25\xdf\x70\xb5\x8e\xaa\xf9\x11\
+\xee\x79\xf8\xa5\x79\xfb\x0a\xfc\x5b\xa6\xb6\x7d\xce\xb0\x36\x65\
+\x28\xfa\x7f\xca\xcc\xe9\x8f\xd7\x94\xeb\x7e\xf9\x36\xc3\x3f\x3e\
+\x52\x64\xd3\x42\xd5\xdb\x3f\x2c\x18\xdc\x94\xd6\xed\x41\x85\x05\
+\xe6\x4a\xa4\xd2\x77\x24\xf4\x99\x71\x9f\x9e\xb2\x7f\xcf\xfa\xfc\
+\xdd\xd3\xe2\xea\x50\xf1\x1f\x9d\x61\xae\x38\xd7\x94\x79\x2d\x5c\
+\x7f\xe8\xe6\x1b\x12\x37\xa9\x49\x5f\xd4\x8b\xc0\xfa\xc5\x6a\x66\
+\x0f\x7f\xe6\x1b\x95\xe8\x77\xa9\x0e\xd3\x1d\x38\xad\xa4\xf8\xc0\
+\x7b\x4f\x95\x0e\x68\xff\x7d\xcd\x9f\xd4\xfe\x27\xf7\x7b\x5d\x63\
+\xd0\xea\x5c\xee\x14\xf9\x9b\x5f\x7b\x28\x50\xf5\xff\x66\x93\x85\
+\x82\xb4\x72\xb7\xcf\xc1\x8f\xbf\x7d\x88\x3b\x4d\xc6\xec\x76\x01\
+\x38\x1f\xca\xf7\xaa\x95\xf5\xfd\x79\x6e\x6e\xcf\x5d\xa6\xf7\xf2\
+\xab\x2e\x6d\x4f\x7d\x79\xee\x53\x01\xf6\x6c\x10\xb9\xdb\x52\x21\
+\xde\x71\xaf\xc7\xad\x16\xe4\x70\x37\xc9\x9a\x1f\x15\x40\x19\x78\
+\xee\x9a\xb5\xfd\x9c\xdc\x5a\xf0\x17\x3e\x5a\x85\xe3\x49\xae\x2c\
+\xec\x18\x18\x9b\xd4\x07\x25\x5a\x7b\x78\x2e\xec\xe0\xce\x10\x6f\
+\xd7\xb5\xb7\x54\x39\x9e\xea\xe7\xd4\x07\xbd\xef\xbf\x9c\xc5\x1d\
+\xde\x8a\xba\xb9\xd1\xdb\x46\xef\x65\x72\xa5\xd8\x37\xd8\xe3\xef\
+\x0d\x1a\x5a\xfc\x35\x3d\xdf\xce\xf9\xbe\x96\x1d\xb0\x87\xab\x47\
+\xde\xe2\xd6\x1e\xf6\xdf\xf1\xba\xa5\x0f\x7d\xf3\x23\xe7\xa7\x83\
+\x3d\xf6\x51\x2e\x57\x94\xe3\x63\xaa\x7b\xd4\x7f\xbc\xa5\xcb\xe9\
+\xa5\x64\xe7\xf7\x73\xec\xb4\x8b\xab\xcc\xad\x35\x9d\xbc\xb8\x50\
+\x62\xa8\x85\xdb\xbf\x9b\xab\xba\x3a\x7e\xf3\x1b\x1c\x77\x90\x2b\
+\xcf\xe1\x9e\x9e\x1b\x20\x4a\x32\xff\x29\x0f\x0c\xab\xec\xfc\x58\
+\xff\xe0\x93\xdc\x13\x9c\x1c\xe4\xa9\x49\x92\xbe\xd9\xa6\x7f\xfa\
+\xa7\x35\x71\xe1\xce\x6f\x54\x06\xf7\x0c\xe9\xaf\x79\x67\x12\x49\
+\xf0\x32\x93\x1f\xee\x60\x8c\x0b\xe3\x1e\x95\x93\x7f\xe1\x9e\xe2\
+\x4a\xa2\x57\xf6\xbf\x34\x79\xc8\xcb\x77\x5d\x5d\xb8\xc9\xa9\x95\
+\x96\xc7\x3d\x47\xee\xd4\xfb\xbc\xe0\x7f\x92\xa9\x0f\xb5\xb7\xb3\
+\x0b\x5d\xac\xb7\xe8\x26\xf7\x24\x85\x1f\xd4\x57\xde\xff\x30\x33\
+\x1f\x68\xf7\xd3\x2e\xf4\xb0\x52\x9a\x47\xf5\x73\xce\x79\xd1\x12\
+\xc5\x7f\x05\xe2\x4d\x3c\xff\xed\x78\xd2\x85\x0e\x96\x1e\x93\xcd\
+\x3d\x4d\xce\x28\x95\xdf\x14\x3d\x63\xfc\xcb\x75\xe1\x79\x37\xde\
+\x4f\x25\x9c\xe5\x9e\xe7\xe8\x93\xca\xfa\x6f\x68\xf8\x5d\x7a\xd1\
+\x34\x37\x1e\x6b\xda\xef\xe7\x01\xc1\x72\x45\xaf\x03\xf7\x1e\x31\
+\xfa\x09\xfe\xe6\xc2\x73\x3f\x6b\xfc\x85\xa4\xeb\x72\x4e\xd6\xb9\
+\xe3\x87\xbe\xd9\xb1\x69\xf5\xb2\x25\xab\xb7\xef\x3f\xf5\xf3\x2d\
+\xaa\xd7\x81\x8f\x8d\x3e\xd2\x0e\x72\xe1\xc9\x2f\x62\x81\xad\xc7\
+\x50\x5f\xde\xbb\x6c\xd2\x8b\xed\x1b\xd4\xac\x52\xf6\x2e\x13\x78\
+\x42\x23\x1a\x3d\x1a\xd5\x63\xe0\xc8\xe4\x19\x8b\xb7\x5d\x28\x96\
+\x73\x1d\x68\xaf\x9e\xff\x81\x06\xfb\xbe\xc8\x85\xd3\x5c\xca\x26\
+\xdb\xf4\xe0\x9f\x7b\x64\x6d\xda\xb0\xe7\x1e\x34\x71\x01\x0b\x6d\
+\x12\x33\x7e\xf1\x9e\x9f\x6d\x8f\xc0\x0a\xd5\xae\x03\xcd\x8c\x2d\
+\x9a\x3b\xe1\xc6\x4b\xee\x98\x74\x1b\x2a\x7e\x73\xef\xd4\x68\xeb\
+\x6f\x67\x2b\x3e\x9a\x90\xbc\xe2\x80\x9d\x2f\x9e\x73\x46\x2b\x75\
+\x1d\x28\x7f\xca\x50\xaf\x57\xba\x30\xcf\xa5\x8e\xff\x17\xff\xec\
+\x8d\xe3\xdb\xda\xb2\x4d\x75\x44\xdb\x41\x73\x0e\xdb\x75\x31\xfa\
+\xa1\x91\x42\x01\x30\xf4\x06\xe8\xd6\x08\xe7\x3b\x56\x62\x6c\xbe\
+\x7f\x65\x3e\xbb\xf4\xe5\x87\xec\x5d\xdd\x5f\xfe\x99\xe4\x6d\xb6\
+\xfc\x16\xe4\xf5\x55\xc6\x7f\x0b\x23\xa9\x4e\x77\x61\xc1\x47\xab\
+\x23\xfe\x54\xb8\x70\x43\xbf\x9a\x72\xfa\x15\xd2\x62\xd8\x5f\x6c\
+\xb8\x30\x2d\x52\xe4\xd8\x0c\xdf\xb7\x06\x3a\xbb\xd5\xf9\x75\x90\
+\x15\xe7\xfb\x71\x13\x5e\xb8\xbe\xaf\xe4\x09\x6a\xb5\xe3\x67\x1f\
+\xf2\xf3\x7a\x70\xb4\xb1\x12\x01\x78\x59\xbf\xa7\xc5\x13\x9d\xdf\
+\x25\x25\xe1\xb2\x75\xfb\xeb\xfa\x94\x77\xa4\x8f\xe5\xa2\x92\xbe\
+\xf2\xe7\x7a\x90\xff\x82\x02\xfe\xab\xea\xbf\x5c\xbf\xd2\xc9\xf1\
+\x5e\x35\xd8\xa6\xbc\xfd\x7f\x12\xdc\x22\xf1\xb0\xf5\x08\x2c\x71\
+\x7f\xb2\x88\xfe\x10\xd0\x19\xc7\xf7\x42\x08\x99\x60\x75\x61\xff\
+\x8e\x84\xf2\x2e\xd4\xf0\xfe\x31\xfb\xac\x26\xe0\x27\xb7\x97\x16\
+\x37\xd6\xbd\xd0\x9e\x75\xdc\xff\x6f\xbf\xb7\x56\xcc\x82\x85\x4d\
+\x5d\xab\x63\xcd\x61\x3b\xac\xdd\x11\x14\x0c\x72\x37\x00\x8b\xf5\
+\x3a\x78\xae\xae\xd3\x37\xa5\xa3\xad\x7d\xfd\xd3\xc7\xbb\x7c\xe8\
+\x74\xd5\x41\x9b\x2c\x4d\x57\x58\xe6\xe6\x01\x8a\x35\xf4\xba\x7c\
+\xbe\x9e\xd3\x3f\xa7\xd6\x56\xfa\xec\x89\x53\x61\x6c\xad\x42\xc2\
+\x5a\x0b\xbf\x03\x47\x22\xdc\xeb\xf1\x54\xbd\x57\xff\x0e\x4f\x64\
+\x0a\x7a\xd5\xca\xc0\x7f\xe1\x92\x96\xca\x8c\xaa\xd4\x4d\x33\xbf\
+\x48\xfd\xef\xae\x4d\x17\xab\xa0\xd3\xd9\xf4\xfb\x9d\xed\x4f\x6d\
+\x2b\x37\xff\xbf\xbc\x15\xae\xd2\xc0\x3a\x2b\x3f\xf2\x9c\xd9\x8f\
+\x90\xd9\xc4\xa5\xbe\xea\x9c\xef\x9e\xd1\xc0\xd9\xee\x0c\xb4\xb0\
+\x2a\x31\x77\x92\x7a\x3b\xd4\x87\xc4\x99\x7d\x2a\xf8\xc5\x9d\x9d\
+\x75\x82\x2f\x0a\x7b\x75\xb5\xa1\xa3\xbd\x89\xb0\xf0\xe2\xe7\x46\
+\x5a\x35\xa6\x24\x8f\x7f\x6e\xee\x66\x20\xaf\xa3\x1b\xbd\x7c\x52\
+\x3c\xfe\xd7\xc5\xd1\xce\x3c\x9b\x65\x7e\x42\xcf\x87\xb5\x98\xb2\
+\xd4\x9b\x61\xea\x66\xe0\x66\x9c\x0b\x7d\x9c\x25\xec\xd2\xbb\x4e\
+\x76\xa5\x54\xaa\x69\xfd\xc5\xcb\x23\x99\xd2\x54\x18\x6b\x66\x1a\
+\xf3\xed\x21\x8e\x77\x30\x48\xf8\x4a\x6b\xa7\x93\x3b\x1e\x35\x38\
+\x60\xda\xff\xba\x26\x4c\x79\xaa\x2e\x34\xf3\x42\x6b\xbc\xd3\xdd\
+\x7b\x54\xd4\x9b\xeb\x4e\x4e\x5b\xea\x6f\xfa\x95\xca\x37\xbf\x67\
+\x9e\xe0\x11\x33\xb7\x83\x53\x1d\x9e\x70\x99\x22\xea\xcc\x48\xe7\
+\xfa\x51\xce\xec\x9a\x54\x9e\x35\xc0\x33\x5b\x2f\x04\x0d\x30\xf1\
+\x5a\xf3\x23\x67\xb7\x13\x10\x2d\xb1\xff\xd1\xb9\x81\xb5\x47\x4e\
+\x9b\xd4\x7f\xfb\xfd\x30\xe6\x21\x2a\xcc\x30\xbe\x57\xfd\xc7\x4e\
+\x76\x2c\x52\xd4\x13\xc7\xf6\x7b\x0b\x1a\x63\x76\x2e\xfe\x9e\x66\
+\xcc\x63\x3c\xb8\xdd\xf0\x87\x7b\xcb\xc1\x6e\xc5\x08\xfa\xb1\xc5\
+\xa9\x4e\x84\x7f\x69\x52\xff\xa5\x7e\x5e\xdc\x78\x27\xf6\xbc\xd1\
+\xcf\xe7\xe0\x54\x41\xd1\x6e\x30\xcf\x3a\xd4\x87\x8e\x26\xe7\xfd\
+\x14\xcd\xf0\xe8\xc9\x94\xa1\x93\x0d\x5e\x07\x6e\x3a\xb7\x7c\x70\
+\x95\x76\x2f\x4e\x39\x33\x05\xac\xe4\x34\x93\xd3\xfe\xfe\xda\x84\
+\x79\x96\xb6\x17\x0d\x8e\x0a\x3f\xa0\xc0\x3d\xa0\x33\x53\xc0\xef\
+\x37\x39\xf1\xa3\x60\x84\xa7\x0f\x70\x0b\x37\x78\x27\x70\xc6\xa1\
+\xd1\xed\x50\xc1\x60\xb5\x23\x73\x80\xfb\x98\x7c\x6f\xba\xb7\x01\
+\xf3\x36\xc1\x93\x8d\xfd\xe0\x7d\x7b\xaf\x23\xdd\x69\xa9\xdd\x83\
+\x63\x0e\x34\x5f\xf6\x13\x93\xef\xfc\xc7\x06\xc0\x99\x0c\x9d\x8d\
+\x9d\xc0\xb2\xda\x91\x5f\xba\x04\xed\x0e\x2c\x74\x60\x14\xf2\x94\
+\x39\xff\xdf\x37\x66\x81\xc0\x6f\x8c\x0d\x0c\xa6\x3a\xd1\x97\x21\
+\xda\xed\x4b\x9f\xae\xee\x1b\x6f\xee\xe1\xff\xe6\x9b\x81\x72\x14\
+\x43\xc9\x59\x86\x3e\xf0\x50\x07\xba\x32\x5c\xbb\xf9\x87\x25\x37\
+\x5d\xf3\x6b\x73\x5f\xff\xc3\xcd\x58\xe0\x10\x67\xe4\xd6\xe7\xf6\
+\x73\xf2\x3b\x32\x4e\xbb\xf9\xdf\xca\x6d\xb9\xbb\xb9\x83\x7d\x8a\
+\x26\x95\x64\x81\x44\x03\x23\x4b\x1e\xf3\xe4\xaf\x1e\x16\x8c\x03\
+\x49\x5d\x09\x10\x66\xf2\x24\xd2\xa3\x2d\x59\x80\x11\xba\xd5\xc0\
+\xc7\xfe\x4e\xfa\x45\x4f\xf0\x2e\x50\xe6\x83\x68\xef\x4b\xe6\x5e\
+\xfc\xa4\x04\xe0\xc9\x8c\xa5\x8d\x9c\xc7\x97\x24\xbb\x17\x82\xbb\
+\x91\x9a\xd2\x1a\xbd\x7f\xab\xb9\xaf\xff\x89\x56\x2c\x10\x29\xb5\
+\xde\xc0\x95\x4f\xf6\x9d\xd8\x87\xda\x6d\xcb\x9a\xa0\x58\xfa\x4d\
+\x73\x8b\x7e\x8a\x67\xdc\xcb\x02\x93\x92\x6b\xf4\x3f\xfd\x31\xc9\
+\x1f\x7e\xba\x76\xd3\xa3\xa5\x34\x58\x62\xf0\x05\x93\xeb\x25\xda\
+\xb2\x80\xa5\xc4\x4a\xfd\xcf\x3f\x53\x6e\x17\x46\x6a\xb7\xfc\x89\
+\x8c\x47\xff\x04\x93\x43\x3f\x7c\x6e\x19\x16\xc0\x84\xac\xd0\xff\
+\x01\x94\x3b\x29\xa3\xa7\x76\xcb\xa7\xed\x7f\xe5\xde\xed\x7f\xcd\
+\xae\xf5\x7c\x9a\x05\x36\xc1\x4b\x75\x6b\x70\x5e\xea\xbb\xef\xd6\
+\x82\x96\xed\xde\xca\x30\xea\x5b\x93\xfa\xf9\xf2\x8a\x2c\xd0\xf1\
+\xe9\xae\xcc\xe6\x4b\x65\xb6\x5f\x4f\x54\x7e\x5b\x5b\x7a\x7c\xa7\
+\xe9\xe5\x7e\xbd\x18\x01\x7c\x1f\xea\x16\x22\x46\x62\xf3\xf7\x88\
+\x5e\xbd\xd9\x78\x0c\x54\xf3\x8d\xa6\xa7\xfc\x6f\xad\xc1\x48\x10\
+\x34\x57\x77\x77\x1e\x99\x87\x0f\x8a\x06\x64\x5f\xb3\xab\x91\x16\
+\x2b\x4d\xef\xf5\x55\x30\x2c\x88\x11\xc1\xa7\xbb\x1c\xf2\x0b\x89\
+\xad\x8b\xce\xdd\xfb\xc9\xa6\x6b\xbf\x85\xe5\xde\xdf\x37\x62\x74\
+\x08\xd3\x9d\x12\xff\xa2\xbc\xc6\x85\xbf\x3f\x5d\x6d\x78\xd0\x89\
+\xb7\x70\xb4\x63\xd1\xc4\x12\x8c\x12\x4d\xf5\xf6\x42\xcd\x94\xf7\
+\x30\x1c\x27\xdc\x1a\xc4\xdf\xdd\xb6\x42\x87\x9e\xb1\xb0\xd9\xc3\
+\xc9\xc7\x18\x31\xfa\xe8\x95\x64\x82\xb4\xa6\xab\x0b\xdb\x9d\xef\
+\xd7\xdf\xae\xfc\x96\xa5\x4d\xd6\xe7\x85\x32\x72\xbc\xaf\x53\x93\
+\xeb\xf2\xf6\xbe\x3a\x26\x6c\xd8\x8f\xb1\x80\x3a\xb3\x2c\x6d\xf2\
+\x9c\xd9\x99\x11\xa4\x84\xde\xae\x58\x33\xa4\x35\x3d\x4f\xd8\xee\
+\x69\xab\xdf\xc6\xd6\xcb\x8b\xac\xe8\xe7\x9f\x57\x66\x24\x89\xc8\
+\xd4\x99\x0f\x27\x6d\xa3\xbe\xee\xe2\x86\xd7\x5b\x79\x13\x5f\x63\
+\xfc\x09\x4b\xf6\xf9\xb5\x7e\x8c\x2a\xad\x75\x26\x48\xfe\x59\x56\
+\xc3\x25\x75\x36\x65\xd9\x6a\xf6\x37\xa0\x54\x8f\x4d\x56\x37\xd0\
+\xde\x51\x9b\xd1\x65\xb8\xce\x4b\x21\x69\x53\x22\xf5\x76\x09\xdc\
+\x6d\xea\x8c\x90\xe6\x33\xaf\x58\xb4\xcf\x0b\x46\xf9\x18\x65\x96\
+\x8b\xcb\xb3\x59\x56\xbb\x8d\x74\xd7\xa8\x18\x1e\x89\xac\x34\xec\
+\x20\xb7\xcc\x8e\x48\x46\x9b\x50\x9d\x79\xa2\xd2\xce\x19\xdb\xad\
+\xa7\xe6\xfa\x48\x23\xe3\x32\x95\xba\x7f\x56\x68\x5d\x7f\xf6\xa0\
+\x20\x46\x1d\x9d\x53\x5b\xbe\x93\x55\xa1\x7e\xfa\x7a\x7e\xd4\x79\
+\x2f\x5f\x31\x3a\xed\x90\x5f\xe7\xeb\xad\xac\xce\x00\x9b\x2f\x2e\
+\x52\xac\xa4\x66\x4b\x1b\x39\x8f\x77\x53\xbc\xd6\xad\x40\xc5\x3f\
+\xa4\x1e\xf2\xf3\x70\xc5\x8c\x68\xc8\x67\x8c\xb1\xca\xe2\xb5\x12\
+\x27\x64\x0d\x90\xf7\x32\x64\xe9\xc6\xba\x3e\x77\xce\xcf\x08\xaa\
+\xfe\x87\xd4\x83\x7e\x9f\xac\x59\x3c\xaf\x3c\xdc\xff\x1f\xaf\x88\
+\x2b\xf5\x3f\x92\x9a\x0d\x32\xbc\x8b\xd9\xe5\x3d\x4b\xde\xec\x1d\
+\xfd\x7c\x6c\xaf\xde\xfd\xc7\x7f\xb0\xe5\x58\x01\xb7\x81\x63\xad\
+\x21\xfe\x5f\x04\x1f\x12\x96\xea\xac\xac\xc7\xa4\x27\xb8\x6b\x5c\
+\x1b\x55\x0a\xde\x0d\x9b\x90\xb6\x69\xcf\x4a\x97\xf4\x17\xcd\xa9\
+\x02\xe9\xff\x85\x78\x92\xe8\x06\x59\xcd\xd6\xcb\x71\xc5\xff\xe6\
+\xc6\x30\x7e\x07\x11\x42\x13\xb7\xa5\x0d\x95\xc6\xbb\xa0\xff\xc7\
+\xce\xf0\xfd\x6b\x46\x0b\x6b\x36\x59\x5a\xbb\x1f\x38\xad\xff\xe7\
+\x57\x43\x60\xfb\x2e\x94\x14\xbe\x9f\xcf\x94\x36\x55\xaa\xf4\x41\
+\x47\xf5\x17\x4c\x0b\x83\xeb\xbb\x13\xe5\xca\x60\x10\x63\x91\xd7\
+\x9d\xd3\x9f\x3b\x05\x03\x7f\xda\xac\x16\x95\x6e\xbb\xbc\x76\xbb\
+\x17\x39\xa4\x3f\x3b\xb9\x12\x2c\x0b\x68\x28\x1c\x5a\x93\x78\x82\
+\x4f\x4f\x47\x12\x90\x35\x0e\xe3\x7e\x3a\x6c\x16\xd5\x4f\xe6\xde\
+\x61\x71\xf2\x13\x90\x31\x22\x14\x82\xf5\xe8\x22\x5c\x30\x77\x8f\
+\xc4\x96\x7b\xdc\x92\xab\xff\xcc\x10\x0c\xfb\x19\xc0\x27\x5c\x28\
+\xd2\x5f\x66\xd3\x31\x32\x13\x70\xac\x1f\x1e\xfc\x8c\x31\x52\x54\
+\xc6\x7d\x52\x9b\x6e\x9f\x29\x4b\xff\xb6\x18\x1f\xcc\x1a\x24\x4c\
+\x38\xa1\xbe\xb9\xd4\xb6\xc3\xbf\x92\x72\xe7\x97\x12\x09\xad\x26\
+\x10\xce\x0c\x79\x5f\xf2\x05\x68\x82\xed\xb7\x82\xdb\xe3\x4a\xc2\
+\xa9\x29\x9a\x08\x87\xd0\x65\xb7\xde\x36\xc3\xd6\x2f\xff\x14\x7c\
+\xf9\xcd\x23\xdc\x4d\x43\xfa\x1b\xd4\x4a\x69\x37\x6d\xfb\xf2\xf7\
+\xc4\x7d\xbf\xa5\xe7\x31\x51\x51\x3b\xc9\x6f\xbf\xee\xf2\x62\x3b\
+\x6e\xfb\xdf\x69\x00\x95\xd6\x08\x11\x6d\xa6\xd7\xc3\x89\x1e\xb4\
+\xdc\xee\x9f\xfc\xdb\x7b\xc6\x34\x84\x47\xeb\xbc\x21\xa8\x6d\xbc\
+\x33\x5d\xe8\xb4\xdd\xf2\xaf\x40\xc1\xba\x17\xab\xc1\xa1\x5f\x54\
+\x13\xac\xb1\x78\xce\xa9\x4e\xd4\x4d\x3a\x67\xe5\x45\xff\xe2\x6e\
+\x18\xee\xf5\x9f\x25\x2e\xde\x04\xfe\xc7\x33\xe1\xd3\xcb\x4d\x6d\
+\xec\x7b\xe1\xb3\x51\xad\x82\x21\xcf\x0e\x9a\xb9\xf7\x18\x78\xc7\
+\xa8\x54\xec\xcc\x03\x46\x56\xfb\xe6\xef\x4a\x79\xbe\x06\xbc\xd9\
+\x87\xe6\x96\xea\x2f\x3b\xdf\x97\x72\x51\xc9\xdb\xb5\x47\x27\x8b\
+\xce\xee\x5a\xf4\xf2\xef\x30\xce\x6f\x33\x6d\x34\x6e\xc1\xd2\x5d\
+\x3a\x3b\x21\xa4\xce\xe3\x3d\x86\xa7\xfc\x79\xc7\x89\x9c\xbc\x9c\
+\xec\xab\x59\x97\x32\xce\x9f\x3d\xbc\x7e\xf6\xd8\x5e\xad\x6a\xe2\
+\x37\x5f\x0e\x13\xef\xfe\x78\xd5\x01\x95\x21\x42\xf0\x96\xbb\x05\
+\x60\x34\x0a\x43\x86\xd2\x9f\xfd\x4a\xff\xad\x97\x50\x16\x42\xf8\
+\x92\xef\x18\x0d\xd8\xd6\x0a\x45\xa1\x45\xdd\x15\xff\xbe\xf9\x2e\
+\x5a\xd1\x02\x05\xa1\x47\x89\x47\x46\xac\xcc\x38\xbf\xf7\xf3\x99\
+\xa3\x6d\xd8\x28\xee\x1f\xec\xf1\x64\x4b\xe2\xfd\x33\x88\x00\x00\
+\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x2a\x42\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x02\x00\x00\x00\x02\x00\x08\x06\x00\x00\x00\xf4\x78\xd4\xfa\
+\x00\x00\x00\x04\x73\x42\x49\x54\x08\x08\x08\x08\x7c\x08\x64\x88\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0d\xd7\x00\x00\x0d\xd7\
+\x01\x42\x28\x9b\x78\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\
+\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\
+\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x20\x00\x49\x44\
+\x41\x54\x78\x9c\xed\xdd\x7b\xac\xa5\x67\x75\xdf\xf1\xdf\xf2\x6d\
+\x6c\x3c\x63\xd3\x62\xec\x78\x80\x24\x55\x31\x6d\x20\x09\x55\x21\
+\xc2\x6e\x93\xd8\xa1\xc2\x01\x62\x63\x2c\x42\x83\xa8\x1c\x28\x55\
+\x43\x50\x2d\x02\xd4\x5c\x9a\x52\x88\x49\x82\x72\x71\xc0\xa1\xae\
+\x54\x2e\x0d\x90\x91\x10\x2d\x20\x63\xec\x40\x82\xd5\x60\x5a\xb5\
+\x1e\x24\x28\x0d\xc4\x04\x0c\x2d\x94\xcb\x80\xed\x31\xd8\x33\x63\
+\x7b\xc6\x73\x59\xfd\x63\xbf\x87\x39\x3e\x73\x2e\x7b\xef\xf7\x79\
+\xde\xf5\x5c\xbe\x1f\xe9\x68\x90\x92\x73\x9e\xe5\x7d\xd6\x5e\xef\
+\xef\x3c\xfb\xbd\x98\xbb\x0b\x68\x9d\x99\x9d\x2a\xe9\xef\x48\x3a\
+\x5f\xd2\xce\xe1\xeb\xfc\x35\xff\xee\x94\xb4\x3d\xaa\x46\x4c\xe2\
+\x80\xa4\x3d\x92\xbe\x3b\xfc\xbb\xfa\x7f\xaf\xfc\xfb\x75\x77\x3f\
+\x1c\x56\x21\x30\x11\x23\x00\xa0\x55\x66\xb6\x43\xd2\xb3\x25\x3d\
+\x5f\xd2\x73\x25\x3d\x3a\xb6\x22\x54\xe2\x3e\x49\x1f\x97\xf4\x51\
+\x49\x7f\xee\xee\xfb\x83\xeb\x01\xb2\x20\x00\xa0\x29\x66\x76\xbe\
+\xa4\xcb\x35\x3b\xe8\x3f\x53\xd2\xb6\xd8\x8a\x50\xb9\x43\x92\xfe\
+\x52\xb3\x30\x70\xb3\xbb\x7f\x37\xb8\x1e\x20\x19\x02\x00\xaa\x67\
+\x66\x67\x48\x7a\xb9\xa4\x5f\x91\xf4\x0c\x49\x16\x5b\x11\x1a\xe5\
+\x92\x3e\x23\xe9\x3f\x4b\x7a\xa7\xbb\x3f\x14\x5c\x0f\x30\x0a\x01\
+\x00\xd5\x32\xb3\x93\x24\xbd\x54\xd2\xb5\x92\x1e\x1f\x5b\x0d\x3a\
+\xf3\x6d\x49\x6f\x96\xf4\x3e\x77\x3f\x16\x5d\x0c\xb0\x0c\x02\x00\
+\xaa\x64\x66\x97\x49\xfa\x3d\x49\x4f\x89\xae\x05\x5d\xbb\x43\xd2\
+\x1b\xdc\xfd\x96\xe8\x42\x80\x45\x11\x00\x50\x15\x33\x7b\x86\xa4\
+\xdf\x97\x74\x71\x74\x2d\xc0\x2a\x9f\x96\xf4\x7a\x77\xff\x4c\x74\
+\x21\xc0\xbc\x08\x00\xa8\x82\x99\x3d\x41\xd2\xdb\x24\xfd\x72\x74\
+\x2d\xc0\x26\x3e\x2c\xe9\x35\xee\xfe\xad\xe8\x42\x80\xad\x10\x00\
+\x50\x3c\x33\xfb\x47\x92\x6e\x94\x74\x6e\x74\x2d\xc0\x1c\xee\x96\
+\x74\xa5\xbb\xff\xcf\xe8\x42\x80\xcd\x9c\x14\x5d\x00\xb0\x19\x33\
+\x7b\xa9\xa4\x4f\x89\x83\x3f\xea\x71\xae\xa4\x4f\x0d\xbd\x0b\x14\
+\x8b\x00\x80\x22\x99\xd9\x49\x66\x76\x9d\xa4\xf7\x4a\x3a\x2d\xba\
+\x1e\x60\x41\xa7\x49\x7a\xaf\x99\x5d\x37\x5c\xad\x02\x14\x87\x8f\
+\x00\x50\x1c\x33\x3b\x4b\xd2\x07\x25\x3d\x27\xba\x16\x20\x81\x4f\
+\x48\x7a\x91\xbb\xef\x8b\x2e\x04\x58\x8d\x00\x80\xa2\x98\xd9\x13\
+\x25\x7d\x4c\xd2\x4f\x44\xd7\x02\x24\xf4\x37\x92\x9e\xe7\xee\x5f\
+\x8b\x2e\x04\x58\x41\x00\x40\x31\x86\x83\xff\x6e\x49\x8f\x89\xae\
+\x05\xc8\xe0\x5e\x49\x17\x12\x02\x50\x0a\x3e\x9b\x42\x11\x86\x6d\
+\xff\x8f\x89\x83\x3f\xda\xf5\x18\x49\x1f\x1b\x7a\x1d\x08\x47\x00\
+\x40\xb8\xe1\x24\xa9\x0f\x8a\x6d\x7f\xb4\xef\x27\x24\x7d\x90\x13\
+\x03\x51\x02\x9a\x10\x25\xf8\x03\x71\xc2\x1f\xfa\xf1\x1c\xcd\x7a\
+\x1e\x08\xc5\x39\x00\x08\x35\x5c\x2b\xfd\xde\xe8\x3a\x80\x00\xff\
+\xdc\xdd\xdf\x17\x5d\x04\xfa\x45\x00\x40\x98\xe1\x0e\x7f\x9f\x12\
+\xd7\xf9\xa3\x4f\x0f\x4b\xfa\x05\xee\x18\x88\x28\x04\x00\x84\x18\
+\xee\xed\xff\x59\x71\x87\x3f\xf4\xed\x6e\x49\x4f\xe7\xd9\x01\x88\
+\xc0\x39\x00\x88\xf2\x36\x71\xf0\x07\xce\xd5\xec\xbd\x00\x4c\x8e\
+\x1d\x00\x4c\x6e\x78\xa4\xef\xee\xe8\x3a\x80\x82\x5c\xc8\xa3\x84\
+\x31\x35\x76\x00\x10\xe1\xf7\xa3\x0b\x00\x0a\xc3\x7b\x02\x93\x23\
+\x00\x60\x52\x66\x76\x99\xa4\x8b\xa3\xeb\x00\x0a\x73\xf1\xf0\xde\
+\x00\x26\xc3\x47\x00\x98\xcc\x70\xf3\x93\x2f\x48\x7a\x4a\x74\x2d\
+\x40\x81\xee\x90\xf4\xd3\xee\x7e\x2c\xba\x10\xf4\x81\x1d\x00\x4c\
+\xe9\xa5\xe2\xe0\x0f\x6c\xe4\x29\x9a\xbd\x47\x80\x49\xb0\x03\x80\
+\x49\x98\xd9\x19\x92\xee\x94\xf4\xf8\xe8\x5a\x80\x82\x7d\x5b\xd2\
+\x93\xdc\xfd\xa1\xe8\x42\xd0\x3e\x76\x00\x30\x95\x97\x8b\x83\x3f\
+\xb0\x95\xc7\x6b\xf6\x5e\x01\xb2\x23\x00\x60\x2a\xbf\x12\x5d\x00\
+\x50\x09\xde\x2b\x98\x04\x1f\x01\x20\x3b\x33\x3b\x5f\xd2\x77\x24\
+\x59\x74\x2d\x40\x05\x5c\xd2\xe3\xdc\xfd\xbb\xd1\x85\xa0\x6d\xa7\
+\x44\x17\x80\x2e\x5c\xae\xf2\x0e\xfe\xc7\x24\xdd\x2e\xe9\x26\xcd\
+\x6e\x49\xbc\x47\xd2\x1e\x77\xdf\x1f\x5a\x15\xb2\x32\xb3\x1d\x92\
+\x76\x0e\x5f\x4f\x97\x74\x85\xa4\x8b\x54\xd6\x6e\xa8\x69\xf6\x9e\
+\x79\x57\x74\x21\x68\x1b\x3b\x00\xc8\xce\xcc\x3e\xae\x72\x1e\xf7\
+\x7b\x50\xd2\x0d\x92\xae\x73\xf7\xbb\xa2\x8b\x41\x3c\x33\x3b\x4f\
+\xd2\x35\x92\xae\x96\x74\x7a\x70\x39\x2b\x3e\xe1\xee\xcf\x8d\x2e\
+\x02\x6d\x23\x00\x20\xab\xe1\x2f\xae\x7b\x24\x6d\x8b\xae\x45\xd2\
+\x8d\x92\x5e\xe5\xee\xdf\x8c\x2e\x04\xe5\x31\xb3\x1f\x95\x74\xbd\
+\xa4\x2b\xa3\x6b\x91\x74\x48\xd2\x63\xd9\x91\x42\x4e\x25\x6d\x7b\
+\xa1\x4d\xcf\x56\xfc\xc1\xdf\x25\xfd\x96\xa4\x17\x70\xf0\xc7\x46\
+\x86\xde\x78\x81\x66\xbd\x12\xfd\x97\xd1\x36\xcd\xde\x3b\x40\x36\
+\x04\x00\xe4\xf6\xfc\xe0\xf5\x5d\xd2\x4b\xdc\xfd\x5a\x67\xbb\x0b\
+\x5b\xf0\x99\x6b\x25\xbd\x44\xf1\x21\x20\xfa\xbd\x83\xc6\x11\x00\
+\x90\x8d\x99\x9d\x2a\x29\xfa\x73\xcc\x6b\xdd\x7d\x57\x70\x0d\xa8\
+\xcc\xd0\x33\xd7\x06\x97\xf1\xdc\xe1\x3d\x04\x64\xc1\x39\x00\xc8\
+\xc6\xcc\x9e\x24\xe9\x2b\x81\x25\xdc\xa8\xd9\xb6\x3f\x4d\x8e\x85\
+\x99\x99\x49\xfa\x88\x62\xcf\x09\xf8\x7b\xee\x7e\x67\xe0\xfa\x68\
+\x18\x3b\x00\xc8\x69\x67\xe0\xda\x07\x35\x3b\xe1\x8f\x83\x3f\x96\
+\x32\xf4\xce\xab\x34\xeb\xa5\x28\x91\xef\x21\x34\x8e\x00\x80\x9c\
+\xce\x0f\x5c\xfb\x06\x4e\xf8\xc3\x58\x43\x0f\xdd\x10\x58\x42\xe4\
+\x7b\x08\x8d\x23\x00\x20\xa7\xa8\xbf\x5e\x8e\x49\xba\x2e\x68\x6d\
+\xb4\xe7\x3a\xcd\x7a\x2a\x02\x3b\x00\xc8\x86\x00\x80\x9c\xa2\xfe\
+\x7a\xb9\x9d\x9b\xfc\x20\x95\xa1\x97\x6e\x0f\x5a\x9e\x1d\x00\x64\
+\x43\x00\x40\x4e\x51\x7f\xbd\xdc\x14\xb4\x2e\xda\x15\xd5\x53\xec\
+\x00\x20\x1b\x02\x00\x72\x8a\x1a\x5e\x9f\x0d\x5a\x17\xed\x8a\xea\
+\x29\x02\x00\xb2\x21\x00\x20\xa7\xa8\xed\xcb\x3d\x41\xeb\xa2\x5d\
+\x51\x3d\xc5\x47\x00\xc8\x86\x00\x80\x9c\xa2\xfe\x7a\x21\x00\x20\
+\xb5\xa8\x9e\x62\x07\x00\xd9\x70\x23\x20\x64\x63\x66\x21\xcd\xe5\
+\xee\xa5\x3d\x7a\x18\x0d\xa0\x9f\xd1\x1a\x76\x00\x00\x00\xe8\x10\
+\x01\x00\x00\x80\x0e\x11\x00\x00\x00\xe8\x10\x01\x00\x00\x80\x0e\
+\x11\x00\x00\x00\xe8\x10\x01\x00\x00\x80\x0e\x11\x00\x00\x00\xe8\
+\x10\x01\x00\x00\x80\x0e\x11\x00\x00\x00\xe8\x10\x01\x00\x00\x80\
+\x0e\x11\x00\x00\x00\xe8\x10\x01\x00\x00\x80\x0e\x11\x00\x00\x00\
+\xe8\x10\x01\x00\x00\x80\x0e\x35\xf9\x38\x60\x33\x3b\x49\xd2\x45\
+\x92\x9e\xa6\xd9\xf3\xb4\x1f\xb7\xe6\xdf\x1d\x71\xd5\x01\x00\x0a\
+\xb4\x5f\xd2\x1e\x49\xdf\x59\xf3\xef\xe7\x24\xdd\xee\xee\xc7\x02\
+\x6b\xcb\xa2\x99\x00\x60\x66\xdb\x25\x5d\x2a\xe9\x72\x49\x97\x49\
+\x3a\x27\xb6\x22\x00\x40\x23\xf6\x4a\xba\x45\xd2\xcd\x92\x3e\xe9\
+\xee\x07\x82\xeb\x49\xa2\xfa\x00\x60\x66\xcf\x90\xf4\x46\x49\xcf\
+\x92\xb4\x2d\xb8\x1c\x00\x40\xdb\x0e\x49\xba\x55\xd2\xef\xb8\xfb\
+\x67\xa2\x8b\x19\xa3\xda\x00\x60\x66\x4f\x94\xf4\x56\x49\x2f\x8c\
+\xae\x05\x00\xd0\xa5\x0f\x49\xfa\x4d\x77\xff\x5a\x74\x21\xcb\xa8\
+\x2e\x00\x98\xd9\x63\x25\xbd\x49\xd2\xcb\x25\x9d\x1a\x5c\x0e\x00\
+\xa0\x6f\x87\x25\xbd\x53\xd2\x5b\xdc\xfd\x9e\xe8\x62\x16\x51\x55\
+\x00\x30\xb3\xe7\x4a\xfa\x80\xa4\xb3\xa3\x6b\x01\x00\x60\x95\xfb\
+\x25\xbd\xd8\xdd\x3f\x1e\x5d\xc8\xbc\xaa\xb9\x0c\xd0\xcc\x5e\xab\
+\xd9\x09\x18\x1c\xfc\x01\x00\xa5\x39\x5b\xd2\xcd\xc3\xb1\xaa\x0a\
+\xc5\xef\x00\x98\xd9\x36\x49\xef\x96\x74\x55\x74\x2d\x00\x00\xcc\
+\x61\x97\xa4\x7f\xe9\xee\x87\xa2\x0b\xd9\x4c\xd1\x01\xc0\xcc\xce\
+\x95\x74\x93\xa4\x0b\xa3\x6b\x01\x00\x60\x01\xbb\x25\x5d\xe1\xee\
+\x77\x47\x17\xb2\x91\x62\x03\xc0\xf0\x97\xff\x6d\xe2\xe0\x0f\x00\
+\xa8\xd3\x6e\x49\x97\x94\xba\x13\x50\xf2\x39\x00\xef\x16\x07\x7f\
+\x00\x40\xbd\x2e\xd4\xec\x58\x56\xa4\x22\x03\xc0\x70\x12\x05\x9f\
+\xf9\x03\x00\x6a\x77\x55\xa9\x27\x06\x16\xf7\x11\xc0\x70\xa9\xdf\
+\xcd\x2a\x34\x9c\x00\x00\xb0\xa0\x63\x92\x2e\x2f\xed\x12\xc1\xa2\
+\x02\xc0\x70\x93\x9f\xaf\x8a\x4b\xfd\x00\x00\x6d\xb9\x5f\xd2\x05\
+\x25\xdd\x2c\xa8\xb4\xbf\xb2\xdf\x24\x0e\xfe\x00\x80\xf6\x9c\xad\
+\xd9\x31\xae\x18\xc5\xec\x00\x0c\xf7\xf6\xff\x92\xb8\xbd\x2f\x00\
+\xa0\x4d\x87\x25\x3d\xb9\x94\x67\x07\x94\xb4\x03\xf0\x56\x71\xf0\
+\x07\x00\xb4\xeb\x54\xcd\x8e\x75\x45\x28\x62\x07\x60\x78\xa4\xef\
+\xee\xe8\x3a\x00\x00\x98\xc0\x85\x25\x3c\x4a\xb8\x94\x1d\x80\x37\
+\x46\x17\x00\x00\xc0\x44\x8a\x38\xe6\x85\xef\x00\x98\xd9\x76\x49\
+\x7b\x25\x6d\x0b\x2d\x04\x00\x80\x69\x1c\x92\x74\x8e\xbb\x1f\x88\
+\x2c\xa2\x84\x1d\x80\x4b\xc5\xc1\x1f\x00\xd0\x8f\x6d\x9a\x1d\xfb\
+\x42\x95\x10\x00\x2e\x8f\x2e\x00\x00\x80\x89\x85\x1f\xfb\x42\x3f\
+\x02\x30\xb3\x93\x24\xdd\x25\xe9\x9c\xb0\x22\x00\x00\x98\xde\x5e\
+\x49\xe7\xb9\xfb\xb1\xa8\x02\xa2\x77\x00\x2e\x12\x07\x7f\x00\x40\
+\x7f\xce\xd1\xec\x18\x18\x26\x3a\x00\x3c\x2d\x78\x7d\x00\x00\xa2\
+\x84\x1e\x03\xa3\x03\xc0\xce\xe0\xf5\x01\x00\x88\x12\x7a\x0c\x8c\
+\x0e\x00\x8f\x0b\x5e\x1f\x00\x80\x28\xa1\xc7\xc0\xe8\x00\xc0\x0e\
+\x00\x00\xa0\x57\xec\x00\x00\x00\xd0\x21\x76\x00\x00\x00\xe8\x50\
+\xd7\x3b\x00\x00\x00\x20\x40\x74\x00\xd8\x13\xbc\x3e\x00\x00\x51\
+\x42\x8f\x81\xd1\x01\xe0\x3b\xc1\xeb\x03\x00\x10\x25\xf4\x18\x18\
+\x1d\x00\xd8\x01\x00\x00\xf4\x8a\x1d\x00\x00\x00\x3a\xc4\x0e\x00\
+\x00\x00\x1d\xea\x7a\x07\xe0\x73\xc1\xeb\x03\x00\x10\x25\xf4\x18\
+\xc8\xe3\x80\x01\x00\x98\x5e\xdf\x8f\x03\x1e\xfe\xc3\x6f\x89\xac\
+\x01\x00\x80\x00\xb7\x44\x1e\xfc\xa5\xf8\x8f\x00\x24\xe9\xe6\xe8\
+\x02\x00\x00\x98\x58\xf8\xb1\x2f\xf4\x23\x00\x49\x32\xb3\xed\x9a\
+\x6d\x85\x6c\x0b\x2d\x04\x00\x80\x69\x1c\x92\x74\x8e\xbb\x1f\x88\
+\x2c\x22\x7c\x07\x60\x78\x01\x6e\x8d\xae\x03\x00\x80\x89\xdc\x1a\
+\x7d\xf0\x97\x0a\xd8\x01\x90\x24\x33\x7b\x86\xa4\xdd\xd1\x75\x00\
+\x00\x30\x81\x0b\xdd\xfd\x33\xd1\x45\x84\xef\x00\x48\xd2\xf0\x42\
+\x7c\x28\xba\x0e\x00\x00\x32\xfb\x50\x09\x07\x7f\xa9\x90\x1d\x00\
+\x49\x32\xb3\x27\x4a\xfa\x92\xa4\x53\xa3\x6b\x01\x00\x20\x83\xc3\
+\x92\x9e\xec\xee\x5f\x8b\x2e\x44\x2a\x64\x07\x40\x92\x86\x17\xe4\
+\x9d\xd1\x75\x00\x00\x90\xc9\x3b\x4b\x39\xf8\x4b\x05\xed\x00\x48\
+\x92\x99\x3d\x56\xd2\x57\x25\x9d\x1d\x5d\x0b\x00\x00\x09\xdd\x2f\
+\xe9\x02\x77\xbf\x27\xba\x90\x15\xc5\xec\x00\x48\xd2\xf0\xc2\xbc\
+\x58\x52\xe8\xcd\x11\x00\x00\x48\xe8\x98\xa4\x17\x97\x74\xf0\x97\
+\x0a\x0b\x00\x92\xe4\xee\x1f\x97\xf4\x86\xe8\x3a\x00\x00\x48\xe4\
+\x0d\xc3\xb1\xad\x28\x45\x7d\x04\xb0\x9a\x99\xfd\xa9\xa4\xab\xa2\
+\xeb\x00\x00\x60\x84\x5d\xee\xfe\xab\xd1\x45\xac\xa7\xe4\x00\xb0\
+\x4d\xd2\x6d\x92\x2e\x0c\x2e\x05\x00\x80\x65\xec\x96\x74\x89\xbb\
+\x1f\x8a\x2e\x64\x3d\xc5\x7d\x04\xb0\x62\x78\xc1\xae\x10\x37\x08\
+\x02\x00\xd4\x67\xb7\xa4\x2b\x4a\x3d\xf8\x4b\x05\x07\x00\x49\x72\
+\xf7\xbb\x25\x5d\x22\x69\x57\x70\x29\x00\x00\xcc\x6b\x97\x66\x7f\
+\xf9\xdf\x1d\x5d\xc8\x66\x8a\x0e\x00\xd2\x6c\x27\x60\xf8\xfc\xe4\
+\x75\xe2\xea\x00\x00\x40\xb9\x8e\x49\x7a\x9d\xbb\xff\x6a\xc9\x7f\
+\xf9\xaf\x28\xf6\x1c\x80\xf5\x98\xd9\x73\x25\x7d\x40\xdc\x27\x00\
+\x00\x50\x96\xfb\x35\xbb\xd4\xaf\xb8\xb3\xfd\x37\x52\xfc\x0e\xc0\
+\x6a\xc3\x0b\x7b\x81\xa4\x1b\x34\xbb\xa5\x22\x00\x00\x91\x0e\x6b\
+\x76\x4c\xba\xa0\xa6\x83\xbf\x54\xd9\x0e\xc0\x6a\xc3\xb3\x03\xde\
+\x2a\xe9\x85\xd1\xb5\x00\x00\xba\xf4\x21\x49\xbf\x59\xd2\xed\x7d\
+\x17\x51\x6d\x00\x58\x31\x3c\x4a\xf8\x8d\x92\x9e\x25\x69\x5b\x70\
+\x39\x00\x80\xb6\x1d\x92\x74\xab\xa4\xdf\x29\xe5\xa9\x7e\xcb\xaa\
+\x3e\x00\xac\x30\xb3\xed\x92\x2e\x95\x74\xb9\xa4\xcb\x24\x9d\x13\
+\x5b\x11\x00\xa0\x11\x7b\x25\xdd\x22\xe9\x66\x49\x9f\x74\xf7\x03\
+\xc1\xf5\x24\xd1\x4c\x00\x58\xcd\xcc\x4e\x92\x74\x91\xa4\xa7\x49\
+\xda\x29\xe9\x71\x6b\xfe\xdd\x11\x57\x1d\x00\xa0\x40\xfb\x25\xed\
+\x91\xf4\x9d\x35\xff\x7e\x4e\xd2\xed\xee\xde\xdc\x55\x68\x4d\x06\
+\x00\x00\x00\xb0\xb9\xaa\xae\x02\x00\x00\x00\x69\x10\x00\x00\x00\
+\xe8\x10\x01\x00\x00\x80\x0e\x11\x00\x00\x00\xe8\x10\x01\x00\x00\
+\x80\x0e\x11\x00\x00\x00\xe8\x10\x01\x00\x00\x80\x0e\x11\x00\x00\
+\x00\xe8\x10\x01\x00\x00\x80\x0e\x11\x00\x00\x00\xe8\x10\x01\x00\
+\x00\x80\x0e\x11\x00\x00\x00\xe8\x10\x01\x00\x00\x80\x0e\x11\x00\
+\x00\x00\xe8\x10\x01\x00\x00\x80\x0e\x11\x00\x00\x00\xe8\x10\x01\
+\x00\x00\x80\x0e\x11\x00\x00\x00\xe8\x10\x01\x00\x00\x80\x0e\x11\
+\x00\x00\x00\xe8\x10\x01\x00\x00\x80\x0e\x11\x00\x00\x00\xe8\x10\
+\x01\x00\x00\x80\x0e\x11\x00\x00\x00\xe8\x10\x01\x00\x00\x80\x0e\
+\x11\x00\x00\x00\xe8\x10\x01\x00\x00\x80\x0e\x11\x00\x00\x00\xe8\
+\x10\x01\x00\x00\x80\x0e\x9d\x12\x5d\x40\x14\x33\xfb\xaf\x92\x9e\
+\x19\x5d\x07\x00\x20\xd4\x5f\xba\xfb\x3f\x89\x2e\x22\x42\xcf\x3b\
+\x00\xf7\x44\x17\x00\x00\x08\xd7\xed\xb1\xa0\xe7\x00\x70\x77\x74\
+\x01\x00\x80\x70\xdd\x1e\x0b\x7a\x0e\x00\xdd\xa6\x3e\x00\xc0\x0f\
+\x75\x7b\x2c\x20\x00\x00\x00\x7a\xd6\xed\xb1\x80\x00\x00\x00\xe8\
+\x59\xb7\xc7\x02\x02\x00\x00\xa0\x67\xdd\x1e\x0b\x7a\x0e\x00\xdd\
+\x9e\xf8\x01\x00\xf8\xa1\x6e\x8f\x05\x3d\x07\x80\x6e\x53\x1f\x00\
+\xe0\x87\xba\x3d\x16\x98\xbb\x47\xd7\x10\xc2\xcc\x4c\xd2\x61\x49\
+\x27\x47\xd7\x02\x00\x08\x71\x54\xd2\xa9\xde\xe9\x81\xb0\xdb\x1d\
+\x80\xe1\x17\x7e\x6f\x74\x1d\x00\x80\x30\xf7\xf6\x7a\xf0\x97\x3a\
+\x0e\x00\x83\x6e\xb7\x7e\x00\x00\x7d\x1f\x03\x7a\x0f\x00\xdd\x9e\
+\xfc\x01\x00\xe8\xfb\x18\xd0\x7b\x00\xe8\x3a\xfd\x01\x40\xe7\xba\
+\x3e\x06\x10\x00\x00\x00\xbd\xea\xfa\x18\x40\x00\x00\x00\xf4\xaa\
+\xeb\x63\x00\x01\x00\x00\xd0\xab\xae\x8f\x01\xbd\x07\x80\xae\x4f\
+\x00\x01\x80\xce\x75\x7d\x0c\xe8\x3d\x00\x74\x9d\xfe\x00\xa0\x73\
+\x5d\x1f\x03\x08\x00\x00\x80\x5e\x75\x7d\x0c\x20\x00\x00\x00\x7a\
+\xd5\xf5\x31\xa0\xdb\x67\x01\x48\x92\x99\x9d\xa4\xd9\xf3\x00\x7a\
+\x0f\x42\x00\xd0\x9b\x63\x9a\x3d\x07\xe0\x58\x74\x21\x51\xba\x3e\
+\xf0\x0d\xbf\x78\x9e\x07\x00\x00\xfd\xb9\xb7\xe7\x83\xbf\xd4\x79\
+\x00\x18\x74\xbd\x05\x04\x00\x9d\xea\x7e\xf6\x13\x00\x68\x02\x00\
+\xe8\x51\xf7\xb3\x9f\x00\x40\x13\x00\x40\x8f\xba\x9f\xfd\x04\x00\
+\x9a\x00\x00\x7a\xd4\xfd\xec\x27\x00\x74\x7e\x27\x28\x00\xe8\x54\
+\xf7\xb3\x9f\x00\x40\x0a\x04\x80\x1e\x75\x3f\xfb\x09\x00\x34\x01\
+\x00\xf4\xa8\xfb\xd9\x7f\x4a\x74\x01\x05\xe8\xbe\x09\x82\xb9\xa4\
+\xdb\x24\x7d\x42\xd2\x1d\x92\xbe\xa4\xd9\xef\xe4\x74\x49\xdb\x24\
+\x9d\x2f\xe9\x67\x25\xfd\x9c\xa4\x67\x49\x3a\x2b\xa4\xca\xfa\x1d\
+\x93\x74\xbb\xa4\x9b\x24\x7d\x56\xd2\x9e\xe1\x4b\x92\x76\x0e\x5f\
+\x4f\x97\x74\x85\xa4\x8b\xc4\x1f\x07\x63\x7c\x49\xb3\x9e\xfe\x94\
+\xa4\x3b\x25\xdd\x27\xe9\x7e\x49\x8f\x96\xf4\x94\xe1\xeb\x39\x92\
+\x2e\x91\x64\x21\x15\x42\x62\xf6\xf7\x7d\x27\x40\x49\x32\xb3\x9f\
+\x94\xf4\xc5\xe8\x3a\x3a\x74\x40\xd2\xdb\x24\xfd\x89\xbb\xff\xbf\
+\x79\xbe\xc1\xcc\xce\x96\xf4\xeb\x92\x7e\x43\xb3\x60\x80\xad\x1d\
+\x94\x74\x83\xa4\xeb\xdc\xfd\xae\x79\xbe\xc1\xcc\xce\x93\x74\x8d\
+\xa4\xab\x35\x0b\x62\xd8\x9a\x4b\xba\x45\xd2\x5b\xdd\x7d\xf7\x3c\
+\xdf\x60\x66\x3f\x26\xe9\x65\x92\x5e\x23\x69\x7b\xc6\xda\xb0\xbe\
+\x9f\x72\xf7\xbf\x8e\x2e\x22\x12\x01\xc0\xec\x5c\x49\x73\x0d\x46\
+\x24\xf3\x51\x49\xaf\x74\xf7\x6f\x2d\xf3\xcd\x66\x76\x86\xa4\xeb\
+\x25\xfd\x5a\xd2\xaa\xda\x73\xa3\xa4\x57\xb9\xfb\x37\x97\xf9\x66\
+\x33\xfb\x51\xcd\x5e\xe7\x2b\x93\x56\xd5\x9e\xbf\x91\x74\x95\xbb\
+\x7f\x6e\x99\x6f\x36\xb3\x27\x48\x7a\x87\xa4\xe7\x27\xad\x0a\x5b\
+\x39\xcf\xdd\xbb\x3e\x11\x90\x6d\xbe\xd9\xad\x80\xfb\x4e\x41\xd3\
+\x71\x49\x57\xbb\xfb\x95\xcb\x1e\xfc\x25\xc9\xdd\x1f\x72\xf7\x97\
+\x4b\x7a\xa1\xa4\x07\x92\x55\xd7\x0e\x97\xf4\x5b\x92\x5e\xb0\xec\
+\xc1\x5f\x92\x86\xef\x7d\xc1\xf0\xb3\x78\x8f\xac\xef\x3f\x48\x7a\
+\xda\xb2\x07\x7f\x49\x72\xf7\x6f\xb9\xfb\x95\x9a\xed\xb8\xf0\x3a\
+\x4f\xc3\xc5\x6d\xe0\xd9\x01\x90\x24\x33\xdb\x2b\xe9\x31\xd1\x75\
+\x34\xee\x88\xa4\x97\xb9\xfb\xae\x94\x3f\xd4\xcc\x9e\xa5\xd9\xd6\
+\xeb\x69\x29\x7f\x6e\xc5\x5c\xd2\x4b\x32\xbc\xce\x57\x49\x7a\xbf\
+\xf8\xcc\x7a\xb5\x37\xb9\xfb\x6f\xa7\xfc\x81\xc3\xeb\xfc\x27\xe2\
+\xfc\xac\xdc\xee\x75\xf7\x73\xa2\x8b\x88\xc6\x0e\xc0\x4c\xf7\x27\
+\x83\x4c\xe0\x9a\xd4\x07\x25\x49\x72\xf7\x5b\x25\xfd\x33\xf1\x97\
+\xd3\x8a\x6b\x33\xbd\xce\xbb\x24\x5d\x9b\xfa\xe7\x56\xec\xad\xa9\
+\x0f\xfe\xd2\x0f\x5f\xe7\x6b\x52\xff\x5c\x9c\x80\x99\x2f\x02\xc0\
+\x0a\x9a\x21\xaf\x4f\xb8\xfb\x1f\xe7\xfa\xe1\xee\xfe\x61\x49\xef\
+\xcd\xf5\xf3\x2b\x72\xa3\xa4\xb7\x64\xfc\xf9\x6f\x19\xd6\xe8\xdd\
+\x6d\xee\xfe\x6f\x33\xfe\xfc\x77\x68\x76\x55\x0c\xf2\x61\xe6\x8b\
+\x00\xb0\xa2\xeb\x13\x41\x32\x3b\x20\xe9\xa5\x13\xac\xf3\x7a\x49\
+\xdf\x9f\x60\x9d\x52\x1d\xd4\xec\x84\xbf\x6c\x3b\x21\xc3\xcf\x7e\
+\xd5\xb0\x56\xaf\x0e\x69\x76\x25\x4a\x36\xc3\xeb\xfc\x52\xcd\xde\
+\x3b\xc8\x83\x99\x2f\x02\xc0\x0a\xd2\x60\x3e\xef\x9a\xe2\x4c\x5b\
+\x77\xdf\x2b\xe9\xf7\x72\xaf\x53\xb0\x1b\xc6\x9c\xf0\x37\xaf\x61\
+\x8d\x1b\x72\xaf\x53\xb0\x7f\xef\xee\x5f\xc9\xbd\xc8\xf0\x9e\x79\
+\x77\xee\x75\x3a\xc6\xcc\x17\x01\x60\x05\xcd\x90\xc7\x61\x49\x6f\
+\x9f\x70\xbd\x5d\x92\x8e\x4e\xb8\x5e\x29\x8e\x49\xba\x6e\xc2\xf5\
+\xae\x1b\xd6\xec\xd1\xbb\x26\x5c\xeb\x6d\x9a\xbd\x87\x90\x1e\x33\
+\x5f\x04\x80\x15\x34\x43\x1e\x9f\x76\xf7\x6f\x4f\xb5\x98\xbb\x7f\
+\x4f\xd2\x5f\x4c\xb5\x5e\x41\x6e\x9f\xf7\x26\x3f\x29\x0c\x6b\xdd\
+\x3e\xd5\x7a\x05\xf9\xb4\xbb\x7f\x75\xaa\xc5\x86\xf7\xce\xa7\xa7\
+\x5a\xaf\x33\xcc\x7c\x11\x00\x56\xd0\x0c\x79\xfc\xf7\x80\x35\x7b\
+\x0c\x00\x37\x75\xb2\x66\xb4\x3f\x0b\x58\x33\xe2\x3d\xd4\x03\x66\
+\xbe\x08\x00\x2b\x38\x21\x24\x8f\x88\xe1\xf5\xe5\x80\x35\xa3\x7d\
+\xb6\x93\x35\xa3\xdd\x11\xb0\x26\x01\x20\x0f\x66\xbe\x08\x00\x2b\
+\x48\x83\x79\x7c\x23\x60\xcd\x1e\x03\xc0\x9e\xad\xff\x5f\x9a\x58\
+\x33\x5a\x44\x00\xf8\x46\xc0\x9a\x3d\x60\xe6\x8b\x00\xb0\x82\x66\
+\xc8\xe3\xc1\x80\x35\xbf\xad\xfe\x6e\x0a\x44\x00\xc8\xcf\x25\x2d\
+\x7d\xfb\xea\x11\x22\xde\x43\x3d\x60\xe6\x8b\x00\xb0\x62\xaf\xfa\
+\x3b\x68\x4c\x61\xf2\xfb\xf4\xbb\xfb\x31\x49\xfb\xa7\x5e\x37\x92\
+\xbb\x4f\xfe\xdf\x1b\xb1\x66\xb0\xfd\x43\x6f\x4d\x8d\x67\x5d\xa4\
+\xe7\x9a\xcd\xfc\xee\x11\x00\x24\xb9\xfb\x11\xcd\x9e\xd9\x8d\xb4\
+\xa2\xee\x67\xce\xef\x12\xa9\x45\xf5\x14\xcf\x04\x48\xef\xbe\x61\
+\xe6\x77\x8f\x00\x70\x1c\x27\x85\xa4\xf7\xe8\xa0\x75\x09\x00\x48\
+\x2d\xaa\xa7\xa2\xde\x43\x2d\x63\xd6\x0f\x08\x00\xc7\xf1\x99\x50\
+\x7a\x04\x00\xb4\x82\x00\xd0\x0e\x66\xfd\x80\x00\x70\x1c\x4d\x91\
+\x1e\x01\x00\xad\x20\x00\xb4\x83\x59\x3f\x20\x00\x1c\x47\x53\xa4\
+\x47\x00\x40\x2b\x08\x00\xed\x60\xd6\x0f\x08\x00\xc7\xd1\x14\xe9\
+\x11\x00\xd0\x0a\x02\x40\x3b\x98\xf5\x03\x02\xc0\x71\x9c\x18\x92\
+\x5e\xd4\xf0\xba\x3f\x68\x5d\xb4\x2b\xaa\xa7\x08\x00\xe9\x31\xeb\
+\x07\x04\x80\xe3\x48\x85\xe9\xb1\x03\x80\x56\xb0\x03\xd0\x0e\x66\
+\xfd\x80\x00\x70\x1c\x4d\x91\xde\xd9\x41\xeb\x12\x00\x90\x5a\x54\
+\x4f\x45\xbd\x87\x5a\xc6\xac\x1f\x10\x00\x8e\xa3\x29\xd2\x63\x07\
+\x00\xad\x60\x07\xa0\x1d\xcc\xfa\x01\x01\xe0\x38\x9a\x22\x3d\x02\
+\x00\x5a\x41\x00\x68\x07\xb3\x7e\x40\x00\x38\x8e\xa6\x48\x8f\x00\
+\x80\x56\x10\x00\xda\xc1\xac\x1f\x10\x00\x06\xee\x7e\x58\x1c\x38\
+\x52\x23\x00\xa0\x15\x04\x80\x36\xdc\x37\xcc\x7a\x88\x00\xb0\x16\
+\xc9\x30\x2d\x2e\x03\x44\x2b\xb8\x0c\xb0\x0d\xcc\xf8\x55\x08\x00\
+\x8f\x44\x73\xa4\xc5\x0e\x00\x5a\xc1\x0e\x40\x1b\x98\xf1\xab\x10\
+\x00\x1e\x89\xe6\x48\xeb\x2c\x33\xb3\xa9\x17\x75\xf7\xa3\x92\x0e\
+\x4c\xbd\x2e\x9a\x75\x60\xe8\xa9\x49\x0d\xef\x9d\xb3\xa6\x5e\xb7\
+\x71\xcc\xf8\x55\x08\x00\x8f\xc4\x1d\xa2\xd2\x3a\x49\xd2\x8e\xa0\
+\xb5\xd9\x05\x40\x2a\x51\xbd\xb4\x43\xcc\xe8\xd4\x98\xf1\xab\xd0\
+\x5c\x8f\x44\x3a\x4c\x8f\x8f\x01\x50\x3b\xb6\xff\xdb\xc1\x8c\x5f\
+\x85\x00\xf0\x48\x34\x47\x7a\x04\x00\xd4\x8e\x00\xd0\x0e\x66\xfc\
+\x2a\x04\x80\x47\xa2\x39\xd2\x23\x00\xa0\x76\x04\x80\x76\x30\xe3\
+\x57\x21\x00\x3c\x12\xcd\x91\x1e\x01\x00\xb5\x23\x00\xb4\x83\x19\
+\xbf\x0a\x01\xe0\x91\x38\x41\x24\x3d\xee\x05\x80\xda\x71\x0f\x80\
+\x76\x30\xe3\x57\x21\x00\x3c\x12\xe9\x30\x3d\x76\x00\x50\x3b\x76\
+\x00\xda\xc1\x8c\x5f\x85\x00\xf0\x48\x34\x47\x7a\x3c\x12\x18\xb5\
+\xe3\x51\xc0\xed\x60\xc6\xaf\x42\x00\x58\xc5\xdd\x1f\x96\xb4\x2f\
+\xba\x8e\xc6\xb0\x03\x80\xda\xb1\x03\xd0\x86\x7d\xc3\x8c\xc7\x80\
+\x00\x70\x22\x12\x62\x5a\x04\x00\xd4\x8e\x00\xd0\x06\x66\xfb\x1a\
+\x04\x80\x13\x71\x92\x48\x5a\x04\x00\xd4\x8e\x00\xd0\x06\x66\xfb\
+\x1a\x04\x80\x13\x91\x12\xd3\x22\x00\xa0\x76\x04\x80\x36\x30\xdb\
+\xd7\x20\x00\x9c\x88\x26\x49\x8b\xcb\x00\x51\x3b\x2e\x03\x6c\x03\
+\xb3\x7d\x0d\x02\xc0\x89\x68\x92\xb4\xd8\x01\x40\xed\xd8\x01\x68\
+\x03\xb3\x7d\x0d\x02\xc0\x89\x68\x92\xb4\xb8\x0c\x10\xb5\xe3\x32\
+\xc0\x36\x30\xdb\xd7\x20\x00\x9c\x88\x13\x45\xd2\x0a\xf9\x2b\xc6\
+\xdd\x0f\x4b\x7a\x30\x62\x6d\x34\xe5\xc1\xa1\x97\x22\xb0\x03\x90\
+\x16\xb3\x7d\x0d\x02\xc0\x89\x48\x89\x69\x9d\x6c\x66\xdb\x83\xd6\
+\x66\x17\x00\x63\x85\xf4\xd0\xf0\x9e\x39\x39\x62\xed\x86\x31\xdb\
+\xd7\x20\x00\x9c\x88\x26\x49\x8f\xf3\x00\x50\x2b\x3e\xff\x6f\x07\
+\xb3\x7d\x0d\x02\xc0\x89\x68\x92\xf4\x08\x00\xa8\x15\x01\xa0\x1d\
+\xcc\xf6\x35\x08\x00\x27\xa2\x49\xd2\x23\x00\xa0\x56\x04\x80\x76\
+\x30\xdb\xd7\x20\x00\xac\xe1\xee\x07\x25\xed\x8f\xae\xa3\x31\xdc\
+\x0b\x00\xb5\xe2\x1e\x00\x6d\xd8\x3f\xcc\x76\xac\x42\x00\x58\x1f\
+\x49\x31\x2d\x76\x00\x50\x2b\x76\x00\xda\xc0\x4c\x5f\x07\x01\x60\
+\x7d\x34\x4b\x5a\xdc\x0b\x00\xb5\xe2\x1e\x00\x6d\x60\xa6\xaf\x83\
+\x00\xb0\x3e\x9a\x25\x2d\x76\x00\x50\x2b\x76\x00\xda\xc0\x4c\x5f\
+\x07\x01\x60\x7d\x34\x4b\x5a\x04\x00\xd4\x8a\x00\xd0\x06\x66\xfa\
+\x3a\x08\x00\xeb\xe3\x8e\x51\x69\x11\x00\x50\x2b\x02\x40\x1b\x98\
+\xe9\xeb\x20\x00\xac\x8f\xb4\x98\x16\x01\x00\xb5\x22\x00\xb4\x81\
+\x99\xbe\x0e\x02\xc0\xfa\x68\x96\xb4\xb8\x0c\x10\xb5\xe2\x32\xc0\
+\x36\x30\xd3\xd7\x41\x00\x58\x1f\xcd\x92\x16\x3b\x00\xa8\x15\x3b\
+\x00\x6d\x60\xa6\xaf\x83\x00\xb0\x3e\x9a\x25\x2d\x2e\x03\x44\xad\
+\xb8\x0c\xb0\x0d\xcc\xf4\x75\x10\x00\xd6\xc7\x09\x23\x69\xb1\x03\
+\x80\x5a\xb1\x03\xd0\x06\x66\xfa\x3a\x08\x00\xeb\x23\x2d\xa6\x15\
+\x32\xcc\xdc\xfd\x90\x24\x6e\xff\x89\x65\x1d\x1c\x7a\x28\x02\x01\
+\x20\x2d\x66\xfa\x3a\x08\x00\xeb\x70\xf7\x87\x24\x3d\x10\x5d\x47\
+\x43\x4e\x35\xb3\x47\x05\xad\xcd\x2e\x00\x96\x15\xd2\x3b\xc3\x7b\
+\xe5\xd4\x88\xb5\x1b\xf5\xc0\x30\xd3\xb1\x06\x01\x60\x63\x24\xc6\
+\xb4\xf8\x18\x00\xb5\x61\xfb\xbf\x0d\xcc\xf2\x0d\x10\x00\x36\x46\
+\xd3\xa4\x45\x00\x40\x6d\x08\x00\x6d\x60\x96\x6f\x80\x00\xb0\x31\
+\x4e\x1a\x49\x8b\x7b\x01\xa0\x36\xdc\x03\xa0\x0d\xcc\xf2\x0d\x10\
+\x00\x36\x46\x6a\x4c\x8b\x1d\x00\xd4\x86\x1d\x80\x36\x30\xcb\x37\
+\x40\x00\xd8\x18\x4d\x93\x16\xf7\x02\x40\x6d\xb8\x07\x40\x1b\x98\
+\xe5\x1b\x20\x00\x6c\x8c\xa6\x49\x8b\x1d\x00\xd4\x86\x1d\x80\x36\
+\x30\xcb\x37\x40\x00\xd8\x18\x4d\x93\x16\x01\x00\xb5\x21\x00\xb4\
+\x81\x59\xbe\x01\x02\xc0\xc6\x38\x71\x24\x2d\x02\x00\x6a\x43\x00\
+\x68\x03\xb3\x7c\x03\x04\x80\x8d\x91\x1a\xd3\x22\x00\xa0\x36\x04\
+\x80\x36\x30\xcb\x37\x40\x00\xd8\x18\x4d\x93\x16\x01\x00\xb5\x21\
+\x00\xb4\x81\x59\xbe\x01\x02\xc0\xc6\x68\x9a\xb4\xb8\x0f\x00\x6a\
+\xc3\x7d\x00\xda\xc0\x2c\xdf\x00\x01\x60\x03\xee\xfe\x80\x24\xee\
+\x1f\x9d\x0e\x97\x01\xa2\x36\x5c\x06\x58\xbf\x87\x86\x59\x8e\x75\
+\x10\x00\x36\xc7\xc9\x23\xe9\xf0\x11\x00\x6a\xc3\x47\x00\xf5\x63\
+\x86\x6f\x82\x00\xb0\x39\xb6\x8e\xd2\x21\x00\xa0\x36\x04\x80\xfa\
+\x31\xc3\x37\x41\x00\xd8\x1c\xcd\x93\x4e\xc8\x50\x1b\x1e\x03\xfa\
+\x70\xc4\xda\xa8\xda\xc3\x81\x8f\x90\x25\x00\xa4\xc3\x0c\xdf\x04\
+\x01\x60\x73\x34\x4f\x3a\xdb\xcc\xec\xf4\xa0\xb5\xd9\x05\xc0\xa2\
+\x42\x7a\x66\x78\x8f\x6c\x8b\x58\xbb\x51\xcc\xf0\x4d\x10\x00\x36\
+\x47\xf3\xa4\xc5\xc7\x00\xa8\x05\xdb\xff\x6d\x60\x86\x6f\x82\x00\
+\xb0\x39\x4e\x20\x49\x8b\x4b\x01\x51\x0b\x2e\x01\x6c\x03\x33\x7c\
+\x13\x04\x80\xcd\x91\x1e\xd3\x62\x07\x00\xb5\x60\x07\xa0\x0d\xcc\
+\xf0\x4d\x10\x00\x36\x47\xf3\xa4\xc5\xbd\x00\x50\x0b\xee\x01\xd0\
+\x06\x66\xf8\x26\x08\x00\x9b\xa3\x79\xd2\x62\x07\x00\xb5\x60\x07\
+\xa0\x0d\xcc\xf0\x4d\x10\x00\x36\x47\xf3\xa4\x45\x00\x40\x2d\x08\
+\x00\x6d\x60\x86\x6f\x82\x00\xb0\x39\x4e\x20\x49\x8b\x00\x80\x5a\
+\x10\x00\xda\xc0\x0c\xdf\x04\x01\x60\x13\xee\x7e\x40\xd2\xc1\xe8\
+\x3a\x1a\x42\x00\x40\x2d\x08\x00\xf5\x3b\x38\xcc\x70\x6c\x80\x00\
+\xb0\x35\xb6\x90\xd2\x21\x00\xa0\x16\x04\x80\xfa\x31\xbb\xb7\x40\
+\x00\xd8\x1a\x4d\x94\x0e\xf7\x01\x40\x2d\xb8\x0f\x40\xfd\x98\xdd\
+\x5b\x20\x00\x6c\x8d\x26\x4a\x87\x1d\x00\xd4\x82\x1d\x80\xfa\x31\
+\xbb\xb7\x40\x00\xd8\x1a\x27\x91\xa4\xc3\x7d\x00\x50\x0b\xee\x03\
+\x50\x3f\x66\xf7\x16\x08\x00\x5b\x23\x45\xa6\xc3\x0e\x00\x6a\xc1\
+\x0e\x40\xfd\x98\xdd\x5b\x20\x00\x6c\x8d\x26\x4a\x87\x00\x80\x5a\
+\x10\x00\xea\xc7\xec\xde\x02\x01\x60\x6b\x34\x51\x3a\x21\xc3\xcd\
+\xdd\x1f\x90\x74\x24\x62\x6d\x54\xe9\xc8\xd0\x33\x11\x08\x00\xe9\
+\x30\xbb\xb7\x40\x00\xd8\x1a\x4d\x94\xce\x19\x66\x76\x5a\xd0\xda\
+\xec\x02\x60\x5e\x21\xbd\x32\xbc\x37\xce\x88\x58\xbb\x51\xcc\xee\
+\x2d\x10\x00\xb6\xc6\x89\x24\x69\x71\x29\x20\x4a\xc7\x25\x80\x6d\
+\x60\x76\x6f\x81\x00\xb0\x35\x52\x64\x5a\x9c\x07\x80\xd2\xf1\xf9\
+\x7f\x1b\x98\xdd\x5b\x20\x00\x6c\x8d\x26\x4a\x8b\x4b\x01\x51\x3a\
+\x2e\x01\x6c\x03\xb3\x7b\x0b\x04\x80\x2d\xb8\xfb\x3e\x49\x87\xa2\
+\xeb\x68\x08\x3b\x00\x28\x1d\x3b\x00\xf5\x3b\x34\xcc\x6e\x6c\x82\
+\x00\x30\x9f\xbd\xd1\x05\x34\x84\x00\x80\xd2\x11\x00\xea\xc7\xcc\
+\x9e\x03\x01\x60\x3e\x9c\x4c\x92\x0e\x01\x00\xa5\x23\x00\xd4\x8f\
+\x99\x3d\x07\x02\xc0\x7c\xf8\x2c\x29\x1d\x02\x00\x4a\x47\x00\xa8\
+\x1f\x33\x7b\x0e\x04\x80\xf9\xd0\x4c\xe9\x10\x00\x50\x3a\x02\x40\
+\xfd\x98\xd9\x73\x20\x00\xcc\x87\x66\x4a\x87\xfb\x00\xa0\x74\xdc\
+\x07\xa0\x7e\xcc\xec\x39\x10\x00\xe6\x43\x33\xa5\xc3\x0e\x00\x4a\
+\xc7\x0e\x40\xfd\x98\xd9\x73\x20\x00\xcc\x87\x13\x4a\xd2\xe1\x3e\
+\x00\x28\x1d\xf7\x01\xa8\x1f\x33\x7b\x0e\x04\x80\xf9\x90\x26\xd3\
+\x61\x07\x00\xa5\x63\x07\xa0\x7e\xcc\xec\x39\x10\x00\xe6\x43\x33\
+\xa5\x43\x00\x40\xe9\x08\x00\xf5\x63\x66\xcf\x81\x00\x30\x1f\x9a\
+\x29\x1d\x02\x00\x4a\x47\x00\xa8\x1f\x33\x7b\x0e\x04\x80\xf9\xd0\
+\x4c\xe9\x44\x0d\xb9\x03\x92\x8e\x06\xad\x8d\x7a\x1c\xd5\xac\x57\
+\x22\x10\x00\xd2\x61\x66\xcf\x81\x00\x30\x07\x77\xbf\x4f\xd2\xe1\
+\xe8\x3a\x1a\x71\xa6\x99\x9d\x32\xf5\xa2\xee\xee\x92\xb8\x37\x38\
+\xb6\xb2\x6f\xe8\x95\x49\x0d\xef\x89\x33\xa7\x5e\xb7\x51\x87\x87\
+\x99\x8d\x2d\x10\x00\xe6\x47\xa2\x4c\x87\x8f\x01\x50\x2a\xb6\xff\
+\xeb\xc7\xac\x9e\x13\x01\x60\x7e\x34\x55\x3a\x5c\x0a\x88\x52\x71\
+\x09\x60\xfd\x98\xd5\x73\x22\x00\xcc\x8f\xa6\x4a\x87\x1d\x00\x94\
+\x8a\x1d\x80\xfa\x31\xab\xe7\x44\x00\x98\x1f\x4d\x95\x0e\x01\x00\
+\xa5\x22\x00\xd4\x8f\x59\x3d\x27\x02\xc0\xfc\xb8\xb3\x54\x3a\x04\
+\x00\x94\x8a\x00\x50\x3f\x66\xf5\x9c\x08\x00\xf3\x23\x55\xa6\x43\
+\x00\x40\xa9\x08\x00\xf5\x63\x56\xcf\x89\x00\x30\x3f\x9a\x2a\x1d\
+\x02\x00\x4a\x45\x00\xa8\x1f\xb3\x7a\x4e\x04\x80\xf9\xd1\x54\xe9\
+\xf0\x48\x60\x94\x8a\x47\x01\xd7\x8f\x59\x3d\x27\x02\xc0\xfc\x68\
+\xaa\x74\xd8\x01\x40\xa9\xd8\x01\xa8\x1f\xb3\x7a\x4e\x04\x80\xf9\
+\x71\x62\x49\x3a\xdc\x07\x00\xa5\xe2\x3e\x00\xf5\x63\x56\xcf\x89\
+\x00\x30\x3f\x52\x65\x3a\xec\x00\xa0\x54\xec\x00\xd4\x8f\x59\x3d\
+\x27\x02\xc0\xfc\xee\x93\x74\x24\xba\x88\x46\x10\x00\x50\x2a\x02\
+\x40\xdd\x8e\x88\xf7\xf9\xdc\x08\x00\x73\x1a\x1e\x10\xb2\x37\xba\
+\x8e\x46\x10\x00\x50\x2a\x02\x40\xdd\xf6\x46\x3c\xcc\xa9\x56\x04\
+\x80\xc5\xb0\xb5\x94\x06\x01\x00\xa5\x22\x00\xd4\x8d\x19\xbd\x00\
+\x02\xc0\x62\x38\xb9\x24\x8d\xa8\x61\xb7\x4f\x12\x7f\x1d\x60\x23\
+\x91\x8f\x8c\x26\x00\xa4\xc1\x8c\x5e\x00\x01\x60\x31\xa4\xcb\x34\
+\xb6\x9b\xd9\xc9\x53\x2f\x3a\x6c\x0d\x46\x0d\x78\x94\x6f\x5f\xc4\
+\xf6\xf1\xf0\x5e\xd8\x3e\xf5\xba\x8d\x62\x46\x2f\x80\x00\xb0\x18\
+\x9a\x2b\x0d\x93\x74\x56\xd0\xda\x7c\x0c\x80\x8d\x44\xf5\xc6\x59\
+\x9a\xbd\x27\x30\x1e\x33\x7a\x01\x04\x80\xc5\xd0\x5c\xe9\x70\x1e\
+\x00\x4a\xc3\xe7\xff\xf5\x63\x46\x2f\x80\x00\xb0\x18\x9a\x2b\x1d\
+\x02\x00\x4a\x43\x00\xa8\x1f\x33\x7a\x01\x04\x80\xc5\x70\x82\x49\
+\x3a\x04\x00\x94\x86\x00\x50\x3f\x66\xf4\x02\x08\x00\x8b\x21\x5d\
+\xa6\x43\x00\x40\x69\x08\x00\xf5\x63\x46\x2f\x80\x00\xb0\x18\x9a\
+\x2b\x1d\x02\x00\x4a\x43\x00\xa8\x1f\x33\x7a\x01\x04\x80\xc5\xd0\
+\x5c\xe9\xf0\x48\x60\x94\x86\x47\x01\xd7\x8f\x19\xbd\x00\x02\xc0\
+\x62\xbe\x2f\xe9\x68\x74\x11\x8d\x60\x07\x00\xa5\x61\x07\xa0\x6e\
+\x47\x35\x9b\xd1\x98\x13\x01\x60\x01\x3c\x0f\x20\x29\x1e\x09\x8c\
+\xd2\xf0\x28\xe0\xba\xf1\x1c\x80\x05\x11\x00\x16\xc7\x16\x53\x1a\
+\xec\x00\xa0\x34\xec\x00\xd4\x8d\xd9\xbc\x20\x02\xc0\xe2\x68\xb2\
+\x34\x08\x00\x28\x0d\x01\xa0\x6e\xcc\xe6\x05\x11\x00\x16\x47\x93\
+\xa5\x41\x00\x40\x69\x08\x00\x75\x63\x36\x2f\x88\x00\xb0\x38\x9a\
+\x2c\x0d\x02\x00\x4a\x43\x00\xa8\x1b\xb3\x79\x41\x04\x80\xc5\x71\
+\xa7\xa9\x34\x08\x00\x28\x0d\x01\xa0\x6e\xcc\xe6\x05\x11\x00\x16\
+\x47\xca\x4c\x23\x6a\xe8\xed\xd3\xec\xb9\xef\xc0\x6a\x91\x8f\x8a\
+\x26\x00\xa4\xc1\x6c\x5e\x10\x01\x60\x71\x34\x59\x1a\x67\x99\xd9\
+\xe4\x8f\x40\x75\xf7\xa3\x92\x0e\x4c\xbd\x2e\x8a\x77\x60\xe8\x8d\
+\x49\x0d\xef\x81\xa8\x47\x63\xb7\x86\xd9\xbc\x20\x02\xc0\xe2\x68\
+\xb2\x34\x22\x07\x1f\x1f\x03\x60\xad\xa8\x9e\x38\x4b\xb3\xf7\x02\
+\xc6\x63\x36\x2f\x88\x00\xb0\x38\x9a\x2c\x1d\xce\x03\x40\x29\xf8\
+\xfc\xbf\x7e\xcc\xe6\x05\x11\x00\x16\xc7\x89\x26\xe9\x10\x00\x50\
+\x0a\x02\x40\xfd\x98\xcd\x0b\x22\x00\x2c\xee\xfb\x92\x8e\x45\x17\
+\xd1\x08\x02\x00\x4a\x41\x00\xa8\xdb\x31\xf1\x1c\x80\x85\x11\x00\
+\x16\xe4\xee\xc7\x24\xdd\x1b\x5d\x47\x23\x08\x00\x28\x05\x01\xa0\
+\x6e\xf7\x0e\xb3\x19\x0b\x20\x00\x2c\x87\xcf\x9a\xd2\xe0\x91\xc0\
+\x28\x05\x8f\x02\xae\x1b\x33\x79\x09\x04\x80\xe5\xd0\x6c\x69\xb0\
+\x03\x80\x52\xb0\x03\x50\x37\x66\xf2\x12\x08\x00\xcb\xe1\x64\x93\
+\x34\x78\x24\x30\x4a\xc1\xa3\x80\xeb\xc6\x4c\x5e\x02\x01\x60\x39\
+\xa4\xcd\x34\xd8\x01\x40\x29\xd8\x01\xa8\x1b\x33\x79\x09\x04\x80\
+\xe5\xd0\x6c\x69\x10\x00\x50\x0a\x02\x40\xdd\x98\xc9\x4b\x20\x00\
+\x2c\x87\x66\x4b\x83\x00\x80\x52\x10\x00\xea\xc6\x4c\x5e\x02\x01\
+\x60\x39\x34\x5b\x1a\x04\x00\x94\x82\x00\x50\x37\x66\xf2\x12\x08\
+\x00\xcb\xe1\x84\x93\x34\x08\x00\x28\x05\x01\xa0\x6e\xcc\xe4\x25\
+\x10\x00\x96\x43\xda\x4c\x83\xfb\x00\xa0\x14\xdc\x07\xa0\x6e\xcc\
+\xe4\x25\x10\x00\x96\x43\xb3\xa5\xc1\x0e\x00\x4a\xc1\x0e\x40\xdd\
+\x98\xc9\x4b\x20\x00\x2c\xe7\x5e\xf1\x3c\x80\x14\xce\x1a\x9e\x87\
+\x3e\x29\x77\x3f\x22\xe9\x81\xa9\xd7\x45\xb1\x1e\x18\x7a\x62\x52\
+\x43\xef\x47\x3d\x12\xbb\x25\xdc\x9e\x7d\x49\x04\x80\x25\xb8\xfb\
+\x51\x49\x3f\x88\xae\xa3\x01\x27\x4b\xda\x1e\xb4\x36\xbb\x00\x58\
+\x11\xd5\x0b\xdb\x35\x7b\x0f\x60\x9c\x1f\x0c\x33\x19\x0b\x22\x00\
+\x2c\x8f\x93\x4e\xd2\xe0\x63\x00\x44\x63\xfb\xbf\x6e\xcc\xe2\x25\
+\x11\x00\x96\xc7\x67\x4e\x69\x10\x00\x10\x8d\x00\x50\x37\x66\xf1\
+\x92\x08\x00\xcb\xa3\xe9\xd2\x20\x00\x20\x1a\x01\xa0\x6e\xcc\xe2\
+\x25\x11\x00\x96\x47\xd3\xa5\xc1\xa5\x80\x88\xc6\x25\x80\x75\x63\
+\x16\x2f\x89\x00\xb0\x3c\x9a\x2e\x0d\x76\x00\x10\x8d\x1d\x80\xba\
+\x31\x8b\x97\x44\x00\x58\x1e\x27\x9e\xa4\xc1\x23\x81\x11\x8d\x47\
+\x01\xd7\x8d\x59\xbc\x24\x02\xc0\xf2\x48\x9d\x69\xb0\x03\x80\x68\
+\xec\x00\xd4\x8d\x59\xbc\x24\x02\xc0\xf2\x68\xba\x34\x08\x00\x88\
+\x46\x00\xa8\x1b\xb3\x78\x49\x04\x80\xe5\xd1\x74\x69\x10\x00\x10\
+\x8d\x00\x50\x37\x66\xf1\x92\x08\x00\xcb\xa3\xe9\xd2\x20\x00\x20\
+\x1a\x01\xa0\x6e\xcc\xe2\x25\x11\x00\x96\xb7\x57\x92\x47\x17\xd1\
+\x00\x02\x00\xa2\x11\x00\xea\xe5\x9a\xcd\x62\x2c\x81\x00\xb0\xa4\
+\xe1\xe1\x21\x3c\x0f\x60\x3c\xee\x03\x80\x68\xdc\x07\xa0\x5e\x3f\
+\x88\x78\x90\x53\x2b\x08\x00\xe3\xb0\xf5\x34\x1e\x3b\x00\x88\xc6\
+\x0e\x40\xbd\x98\xc1\x23\x10\x00\xc6\xa1\xf9\xc6\xe3\x3e\x00\x88\
+\xc6\x7d\x00\xea\xc5\x0c\x1e\x81\x00\x30\x0e\xcd\x37\x5e\xc8\x5f\
+\x41\xee\xfe\xb0\xa4\x87\x22\xd6\x46\x51\x1e\x1a\x7a\x21\x02\x3b\
+\x00\xe3\x31\x83\x47\x20\x00\x8c\xc3\x1d\xa8\xc6\x3b\xc5\xcc\xce\
+\x0c\x5a\x9b\x5d\x00\x84\xf4\xc0\xd0\xf3\xa7\x44\xac\xdd\x18\x66\
+\xf0\x08\x04\x80\x71\x48\x9f\x69\x70\x1e\x00\xa2\xf0\xf9\x7f\xdd\
+\x98\xc1\x23\x10\x00\xc6\xa1\xf9\xd2\x20\x00\x20\x0a\x01\xa0\x6e\
+\xcc\xe0\x11\x08\x00\xe3\xd0\x7c\x69\x70\x29\x20\xa2\x70\x09\x60\
+\xdd\x98\xc1\x23\x10\x00\xc6\xa1\xf9\xd2\x60\x07\x00\x51\xd8\x01\
+\xa8\x1b\x33\x78\x04\x02\xc0\x38\x9c\x80\x92\x06\x97\x02\x22\x0a\
+\x97\x00\xd6\x8d\x19\x3c\x02\x01\x60\x1c\xd2\x67\x1a\xec\x00\x20\
+\x0a\x3b\x00\x75\x63\x06\x8f\x40\x00\x18\x87\x7b\x50\xa7\x41\x00\
+\x40\x14\x02\x40\xdd\x98\xc1\x23\x10\x00\x46\x70\xf7\xc3\xe2\x20\
+\x92\x02\x01\x00\x51\x08\x00\xf5\xba\x6f\x98\xc1\x58\x12\x01\x60\
+\x3c\xb6\xa0\xc6\x23\x00\x20\x0a\x01\xa0\x5e\xcc\xde\x91\x08\x00\
+\xe3\x71\x12\xca\x78\x04\x00\x44\x21\x00\xd4\x8b\xd9\x3b\x12\x01\
+\x60\x3c\x52\xe8\x78\xdc\x07\x00\x51\xb8\x0f\x40\xbd\x98\xbd\x23\
+\x11\x00\xc6\xa3\x09\xc7\x63\x07\x00\x51\xd8\x01\xa8\x17\xb3\x77\
+\x24\x02\xc0\x78\x34\xe1\x78\xdc\x07\x00\x51\xb8\x0f\x40\xbd\x98\
+\xbd\x23\x11\x00\xc6\xa3\x09\xc7\x63\x07\x00\x51\xd8\x01\xa8\x17\
+\xb3\x77\x24\x02\xc0\x78\x9c\x88\x32\x5e\xc8\x30\x74\xf7\x83\x92\
+\x0e\x45\xac\x8d\x22\x1c\x1a\x7a\x20\x02\x01\x60\x3c\x66\xef\x48\
+\x04\x80\xf1\x48\xa1\xe3\x9d\x66\x66\x67\x04\xad\xcd\x2e\x40\xbf\
+\x42\x7e\xf7\x43\xaf\x9f\x16\xb1\x76\x63\x98\xbd\x23\x11\x00\xc6\
+\xa3\x09\xd3\xe0\x63\x00\x4c\x8d\xed\xff\xba\x31\x7b\x47\x22\x00\
+\x8c\x47\x13\xa6\x41\x00\xc0\xd4\x08\x00\x75\x63\xf6\x8e\x44\x00\
+\x18\x8f\x26\x4c\x83\x7b\x01\x60\x6a\xdc\x03\xa0\x6e\xcc\xde\x91\
+\x08\x00\x23\xb9\xfb\xc3\xe2\x20\x92\x02\x97\x02\x62\x6a\x5c\x02\
+\x58\xaf\xfb\x87\xd9\x8b\x11\x08\x00\x69\x90\x44\xc7\xe3\x23\x00\
+\x4c\x8d\x8f\x00\xea\xc5\xcc\x4d\x80\x00\x90\x06\xcd\x38\x1e\x01\
+\x00\x53\x23\x00\xd4\x8b\x99\x9b\x00\x01\x20\x0d\x9a\x71\x3c\x02\
+\x00\xa6\x46\x00\xa8\x17\x33\x37\x01\x02\x40\x1a\x34\xe3\x78\x04\
+\x00\x4c\x8d\x00\x50\x2f\x66\x6e\x02\x04\x80\x34\xb8\x23\xd5\x78\
+\x04\x00\x4c\x8d\x00\x50\x2f\x66\x6e\x02\x04\x80\x34\x48\xa3\xe3\
+\x71\x19\x20\xa6\xc6\x65\x80\xf5\x62\xe6\x26\x40\x00\x48\x83\x66\
+\x1c\x8f\x1d\x00\x4c\x8d\x1d\x80\x7a\x31\x73\x13\x20\x00\xa4\x41\
+\x33\x8e\xc7\x7d\x00\x30\x35\xee\x03\x50\x2f\x66\x6e\x02\x04\x80\
+\x34\x68\xc6\xf1\xd8\x01\xc0\xd4\xd8\x01\xa8\x17\x33\x37\x01\x02\
+\x40\x1a\x9c\x90\x32\x1e\x01\x00\x53\x23\x00\xd4\x8b\x99\x9b\x00\
+\x01\x20\x0d\xd2\xe8\x78\x21\x43\xd1\xdd\x1f\x94\x74\x38\x62\x6d\
+\x84\x3a\x3c\xfc\xee\x23\x10\x00\xc6\x63\xe6\x26\x40\x00\x48\xc0\
+\xdd\x0f\x49\xda\x1f\x5d\x47\xe5\x4e\x37\xb3\x6d\x41\x6b\xb3\x0b\
+\xd0\x9f\x90\xdf\xf9\xd0\xe3\xa7\x47\xac\xdd\x90\xfd\xc3\xcc\xc5\
+\x48\x04\x80\x74\x48\xa4\xe3\xf1\x31\x00\xa6\xc2\xf6\x7f\xbd\x98\
+\xb5\x89\x10\x00\xd2\xa1\x29\xc7\xe3\x5e\x00\x98\x0a\xf7\x00\xa8\
+\x17\xb3\x36\x11\x02\x40\x3a\x9c\x94\x32\x1e\x3b\x00\x98\x0a\x3b\
+\x00\xf5\x62\xd6\x26\x42\x00\x48\x87\x54\x3a\x1e\xf7\x02\xc0\x54\
+\xb8\x07\x40\xbd\x98\xb5\x89\x10\x00\xd2\xa1\x29\xc7\x63\x07\x00\
+\x53\x61\x07\xa0\x5e\xcc\xda\x44\x08\x00\xe9\xd0\x94\xe3\x11\x00\
+\x30\x15\x02\x40\xbd\x98\xb5\x89\x10\x00\xd2\xa1\x29\xc7\x23\x00\
+\x60\x2a\x04\x80\x7a\x31\x6b\x13\x21\x00\xa4\xc3\x89\x29\xe3\x11\
+\x00\x30\x15\x02\x40\xbd\x98\xb5\x89\x10\x00\xd2\x21\x95\x8e\xc7\
+\x65\x80\x98\x0a\x97\x01\xd6\x8b\x59\x9b\x08\x01\x20\x1d\x9a\x72\
+\x3c\x76\x00\x30\x15\x76\x00\xea\xc5\xac\x4d\x84\x00\x90\x0e\x4d\
+\x39\x1e\x97\x01\x62\x2a\x5c\x06\x58\x2f\x66\x6d\x22\x04\x80\x44\
+\xdc\xfd\x21\x49\x0f\x44\xd7\x51\x39\x76\x00\x30\x15\x76\x00\xea\
+\xf4\xc0\x30\x6b\x91\x00\x01\x20\x2d\x4e\x4e\x19\x87\x00\x80\xa9\
+\x10\x00\xea\xc4\x8c\x4d\x88\x00\x90\x16\x5b\x53\xe3\x10\x00\x30\
+\x15\x02\x40\x9d\x98\xb1\x09\x11\x00\xd2\xa2\x39\xc7\x09\x19\x8e\
+\xee\x7e\x40\xd2\xd1\x88\xb5\x11\xe2\xe8\xf0\x3b\x8f\x40\x00\x18\
+\x87\x19\x9b\x10\x01\x20\x2d\x9a\x73\x9c\x47\x99\xd9\xa9\x41\x6b\
+\xb3\x0b\xd0\x8f\x90\xdf\xf5\xd0\xdb\x8f\x8a\x58\xbb\x21\xcc\xd8\
+\x84\x08\x00\x69\xd1\x9c\xe3\x71\x2f\x00\xe4\xc6\x3d\x00\xea\xc5\
+\x8c\x4d\x88\x00\x90\x16\x27\xa8\x8c\xc7\x79\x00\xc8\x8d\xcf\xff\
+\xeb\xc5\x8c\x4d\x88\x00\x90\x16\xe9\x74\x3c\xee\x05\x80\xdc\xb8\
+\x07\x40\x38\x03\xd8\xf0\x00\x00\x09\xb3\x49\x44\x41\x54\xbd\x98\
+\xb1\x09\x11\x00\xd2\xa2\x39\xc7\x63\x07\x00\xb9\xb1\x03\x50\x2f\
+\x66\x6c\x42\x04\x80\xb4\x68\xce\xf1\x08\x00\xc8\x8d\x00\x50\x2f\
+\x66\x6c\x42\x04\x80\xb4\x68\xce\xf1\x08\x00\xc8\x8d\x00\x50\x2f\
+\x66\x6c\x42\x04\x80\xb4\x38\x41\x65\x3c\x02\x00\x72\x23\x00\xd4\
+\x8b\x19\x9b\x10\x01\x20\x21\x77\x7f\x50\xd2\x83\xd1\x75\x54\x8e\
+\xcb\x00\x91\x1b\x97\x01\xd6\xe9\xc1\x61\xc6\x22\x11\x02\x40\x7a\
+\x6c\x51\x8d\xc3\x0e\x00\x72\x63\x07\xa0\x4e\xcc\xd6\xc4\x08\x00\
+\xe9\xd1\xa4\xe3\x70\x19\x20\x72\xe3\x32\xc0\x3a\x31\x5b\x13\x23\
+\x00\xa4\x47\x93\x8e\xc3\x0e\x00\x72\x63\x07\xa0\x4e\xcc\xd6\xc4\
+\x08\x00\xe9\x71\x92\xca\x38\x04\x00\xe4\x46\x00\xa8\x13\xb3\x35\
+\x31\x02\x40\x7a\xa4\xd4\x71\x08\x00\xc8\x8d\x00\x50\x27\x66\x6b\
+\x62\x04\x80\xf4\x68\xd2\x71\x08\x00\xc8\x8d\x00\x50\x27\x66\x6b\
+\x62\x04\x80\xf4\x68\xd2\x71\xa2\x86\xe4\x7e\x49\xc7\x82\xd6\xc6\
+\x74\x8e\x69\xf6\xbb\x8e\x40\x00\x18\x87\xd9\x9a\x18\x01\x20\x3d\
+\x9a\x74\x9c\xed\x66\x76\xf2\xd4\x8b\xba\xbb\x4b\xda\x37\xf5\xba\
+\x98\xdc\xbe\xe1\x77\x3d\xa9\xa1\xa7\xb7\x4f\xbd\x6e\x63\x98\xad\
+\x89\x11\x00\xd2\xe3\x44\x95\xf1\xf8\x18\x00\xb9\xb0\xfd\x5f\x2f\
+\x66\x6b\x62\x04\x80\xf4\x48\xa9\xe3\x71\x2f\x00\xe4\xc2\x3d\x00\
+\xea\xc5\x6c\x4d\x8c\x00\x90\x1e\x4d\x3a\x1e\x3b\x00\xc8\x85\x1d\
+\x80\x7a\x31\x5b\x13\x23\x00\x24\xe6\xee\x07\x24\x1d\x8c\xae\xa3\
+\x72\x04\x00\xe4\x42\x00\xa8\xd3\xc1\x61\xb6\x22\x21\x02\x40\x1e\
+\x24\xd5\x71\x08\x00\xc8\x85\x00\x50\x27\x66\x6a\x06\x04\x80\x3c\
+\x38\x59\x65\x1c\x02\x00\x72\x21\x00\xd4\x89\x99\x9a\x01\x01\x20\
+\x0f\xd2\xea\x38\x04\x00\xe4\x42\x00\xa8\x13\x33\x35\x03\x02\x40\
+\x1e\x34\xeb\x38\x51\xc3\x32\xea\x39\xf1\x98\x4e\xd4\xef\x98\x00\
+\x30\x0e\x33\x35\x03\x02\x40\x1e\x34\xeb\x38\x5c\x06\x88\x5c\xb8\
+\x0c\xb0\x4e\xcc\xd4\x0c\x08\x00\x79\xd0\xac\xe3\xf0\x11\x00\x72\
+\xe1\x23\x80\x3a\x31\x53\x33\x20\x00\xe4\xc1\x09\x2b\xe3\x10\x00\
+\x90\x0b\x01\xa0\x4e\xcc\xd4\x0c\x08\x00\x79\x90\x56\xc7\x21\x00\
+\x20\x17\x02\x40\x9d\x98\xa9\x19\x10\x00\xf2\xa0\x59\xc7\x21\x00\
+\x20\x17\x02\x40\x9d\x98\xa9\x19\x10\x00\xf2\xa0\x59\xc7\x21\x00\
+\x20\x17\x02\x40\x9d\x98\xa9\x19\x10\x00\xf2\xa0\x59\xc7\x89\x1a\
+\x96\x47\x82\xd6\xc5\x74\xa2\x7e\xc7\x04\x80\x71\x98\xa9\x19\x10\
+\x00\x32\x70\xf7\x7d\x92\x0e\x45\xd7\x51\xb1\x1d\x66\x16\xd1\x9b\
+\x8f\x0a\x58\x73\x34\x33\xdb\xd1\xc3\x9a\x89\x9c\x39\xf5\x82\x43\
+\x2f\xd7\xfa\x7a\x95\xe0\xd0\x30\x53\x91\x18\x01\x20\x1f\x12\xeb\
+\xf2\x4c\xd2\x13\x02\xd6\xad\x32\x00\x48\xda\xd9\xc9\x9a\x29\x44\
+\xfc\x8e\x9f\xa0\x59\x4f\x63\x39\xcc\xd2\x4c\x08\x00\xf9\xd0\xb4\
+\xe3\x3c\x39\x60\xcd\xc7\x05\xac\x99\x02\x01\x60\x7e\x3f\x1e\xb0\
+\x66\x44\x2f\xb7\x84\x59\x9a\x09\x01\x20\x1f\x9a\x76\x9c\x88\xa1\
+\x79\x49\xc0\x9a\x29\x3c\xbd\x93\x35\x53\xf8\xb9\x80\x35\x09\x00\
+\xe3\x30\x4b\x33\x21\x00\xe4\x43\xd3\x8e\x73\x59\xc0\x9a\xcf\x0c\
+\x58\x33\x85\x2b\x3a\x59\x33\x85\x88\x00\x10\xd1\xcb\x2d\x61\x96\
+\x66\x42\x00\xc8\x87\x3b\x57\x8d\x73\xb1\x99\x4d\x76\x1e\x80\x99\
+\xed\x94\xf4\xb3\x53\xad\x97\xd8\x45\x66\x76\xde\x54\x8b\x0d\x6b\
+\x5d\x34\xd5\x7a\x89\x5d\x6c\x66\x8f\x9f\x6a\xb1\xa1\x87\x2f\x9e\
+\x6a\xbd\x46\x31\x4b\x33\x21\x00\xe4\x43\x6a\x1d\xc7\x24\xbd\x6c\
+\xc2\xf5\xae\x91\x74\xda\x84\xeb\xa5\x74\x92\x66\xf5\x4f\xe5\x1a\
+\xd5\x3b\x3b\x4e\x95\xf4\xea\x09\xd7\x7b\x99\x38\x01\x70\x2c\x66\
+\x69\x26\xb5\xbe\x89\x6b\x40\xd3\x8e\xf7\xda\x29\x76\x01\xcc\xec\
+\xb1\x92\x5e\x9e\x7b\x9d\xcc\xae\x36\xb3\x1f\xcd\xbd\xc8\xb0\xc6\
+\xd5\xb9\xd7\xc9\xec\xd7\xcc\xec\xdc\xdc\x8b\x0c\xbd\xfb\xda\xdc\
+\xeb\x74\x80\x59\x9a\x09\x01\x20\x1f\x9a\x76\xbc\x33\x25\xfd\x71\
+\xce\x05\xcc\xcc\x24\xbd\x47\xf5\x5e\x02\xb8\xe2\x74\x49\xd7\x0f\
+\xff\x3d\x59\x0c\x3f\xfb\xfa\x61\xad\x9a\x6d\x97\xf4\xbe\x9c\xaf\
+\xd5\xe0\xed\x0a\xb8\xef\x40\x83\x98\xa5\x99\x10\x00\xf2\xa1\x69\
+\xd3\xb8\xd2\xcc\x5e\x9f\xf1\xe7\x5f\x23\xe9\x79\x19\x7f\xfe\x94\
+\xae\x94\xf4\xa6\x8c\x3f\xff\x4d\xc3\x1a\x2d\x78\x8e\xa4\x57\xe6\
+\xfa\xe1\x66\xf6\x6a\x49\x2f\xc8\xf5\xf3\x3b\xc3\x2c\xcd\xc4\xdc\
+\x3d\xba\x86\x26\x99\xd9\x13\x25\x7d\x35\xba\x8e\x46\xb8\xa4\x97\
+\xb8\xfb\xae\x94\x3f\xd4\xcc\x5e\x24\x69\x97\xa4\x53\x52\xfe\xdc\
+\x60\xb9\x5e\xab\xab\x24\xbd\x5f\x6d\x7d\x9e\x7d\x44\xd2\xcb\x32\
+\xf5\xd5\x07\xd4\xd6\x6b\x15\xe9\x02\x77\xff\x5a\x74\x11\x2d\x62\
+\x07\x20\x1f\x52\x6b\x3a\xa6\xd9\x96\xed\xbf\x49\xb5\x6d\x3b\xec\
+\x2a\x7c\x40\x6d\x1d\xfc\xa5\xd9\x6b\xf5\x7e\x33\x7b\x73\x8a\xd7\
+\xca\x66\xde\xac\xf6\x0e\xfe\xd2\xec\x77\xff\x7e\x33\xfb\x57\x29\
+\x7e\xd8\xf0\x5a\xfd\x6b\x49\x7f\xaa\xf6\x5e\xab\x48\xcc\xd2\x4c\
+\xd8\x01\xc8\xc8\xcc\x0e\xa9\xde\x33\xcb\x4b\xf5\x51\x49\xaf\x70\
+\xf7\xef\x2d\xf3\xcd\xc3\x49\x6c\xd7\x49\x7a\x61\xd2\xaa\xca\x74\
+\xa3\xa4\x57\xb9\xfb\x37\x97\xf9\xe6\xe1\xb5\xba\x5e\xed\x6c\xfb\
+\x6f\xe6\xa3\x92\x5e\xe9\xee\xdf\x5a\xe6\x9b\x87\x4b\x23\xdf\x23\
+\xae\xf9\x4f\xed\x61\x77\xdf\x16\x5d\x44\xab\xd8\x01\xc8\x6b\x6f\
+\x74\x01\x0d\x7a\xbe\xa4\xff\x6b\x66\x7f\x64\x66\x3f\x32\xef\x37\
+\x99\xd9\xf9\x66\xf6\xdb\x92\xbe\xac\x3e\x0e\xfe\xd2\xec\xc0\xfd\
+\x15\x33\xfb\xc3\x45\xee\x13\x60\x66\xe7\x99\xd9\x1f\x4a\xfa\x8a\
+\xfa\x38\xf8\x4b\xb3\xbe\xfa\x92\x99\x5d\x6b\x66\x3f\x36\xef\x37\
+\x99\xd9\x4e\x33\xbb\x5e\xd2\xd7\xc5\xc1\x3f\x07\x66\x68\x46\xec\
+\x00\x64\x64\x66\xff\x5b\xd2\x53\xa3\xeb\x68\xd8\x31\x49\xb7\x4b\
+\xba\x59\xd2\x6e\x49\x7b\x24\x7d\x57\xb3\xed\xd7\xc7\x0f\x5f\x4f\
+\xd5\xec\x20\x76\x91\xfa\xde\x96\x5d\x79\xad\x6e\x92\xf4\x59\xcd\
+\x5e\xab\x3d\xc3\xff\x6d\xe7\xf0\xf5\x74\xcd\xee\xf0\x77\x91\xfa\
+\xfe\xe3\xc0\x25\xdd\x26\xe9\x13\x92\xee\x18\xbe\xbe\xaf\xd9\xd5\
+\x03\x3b\x34\x7b\xad\x2e\xd6\xec\xce\x91\x17\x8a\x5d\xbe\x9c\xfe\
+\xca\xdd\xff\x41\x74\x11\xad\x22\x00\x64\x64\x66\x9f\x94\xf4\xac\
+\xe8\x3a\x00\xa0\x52\xb7\xba\xfb\xa5\xd1\x45\xb4\xaa\xe7\x94\x3f\
+\x05\x4e\x5e\x01\x80\xe5\x31\x43\x33\x22\x00\xe4\x45\xf3\x02\xc0\
+\xf2\x98\xa1\x19\x11\x00\xf2\xa2\x79\x01\x60\x79\xcc\xd0\x8c\x08\
+\x00\x79\xd1\xbc\x00\xb0\x3c\x66\x68\x46\x04\x80\xbc\x78\x8c\x25\
+\x00\x2c\x8f\x19\x9a\x11\x01\x20\x2f\xd2\x2b\x00\x2c\x8f\x19\x9a\
+\x11\x01\x20\x2f\x9a\x17\x00\x96\xc7\x0c\xcd\x88\x00\x90\x17\xcd\
+\x0b\x00\xcb\x63\x86\x66\xc4\x8d\x80\x32\x1a\x1e\xc6\xf2\xb0\xda\
+\x7b\xe0\x0c\x00\xe4\x76\x44\xd2\x69\xce\x41\x2a\x1b\x76\x00\x32\
+\x1a\x1a\x97\x04\x0b\x00\x8b\xbb\x87\x83\x7f\x5e\x04\x80\xfc\x08\
+\x00\x00\xb0\x38\x66\x67\x66\x04\x80\xfc\x68\x62\x00\x58\x1c\xb3\
+\x33\x33\x02\x40\x7e\x34\x31\x00\x2c\x8e\xd9\x99\x19\x01\x20\x3f\
+\x9a\x18\x00\x16\xc7\xec\xcc\x8c\x00\x90\x1f\x77\xb2\x02\x80\xc5\
+\x31\x3b\x33\x23\x00\xe4\x47\x8a\x05\x80\xc5\x31\x3b\x33\x23\x00\
+\xe4\x47\x13\x03\xc0\xe2\x98\x9d\x99\x11\x00\xf2\x63\x1b\x0b\x00\
+\x16\xc7\xec\xcc\x8c\x00\x90\xdf\x57\xa2\x0b\x00\x80\x0a\x31\x3b\
+\x33\x23\x00\x64\xe6\xee\xf7\x48\xba\x2b\xba\x0e\x00\xa8\xc8\x5d\
+\xc3\xec\x44\x46\x04\x80\x69\x7c\x21\xba\x00\x00\xa8\x08\x33\x73\
+\x02\x04\x80\x69\xd0\xcc\x00\x30\x3f\x66\xe6\x04\x08\x00\xd3\xf8\
+\x62\x74\x01\x00\x50\x11\x66\xe6\x04\x08\x00\xd3\x20\xcd\x02\xc0\
+\xfc\x98\x99\x13\x30\x9e\xb6\x98\x9f\x99\x6d\x93\x74\x40\xd2\x29\
+\xd1\xb5\x00\x40\xe1\x8e\x48\xda\xee\xee\x87\xa2\x0b\x69\x1d\x3b\
+\x00\x13\x18\x1a\xf9\xce\xe8\x3a\x00\xa0\x02\x77\x72\xf0\x9f\x06\
+\x01\x60\x3a\xb7\x45\x17\x00\x00\x15\xb8\x2d\xba\x80\x5e\x10\x00\
+\xa6\xf3\x9e\xe8\x02\x00\xa0\x02\xcc\xca\x89\x10\x00\x26\xe2\xee\
+\x9f\x97\xf4\xf9\xe8\x3a\x00\xa0\x60\x9f\x1f\x66\x25\x26\x40\x00\
+\x98\x16\xc9\x16\x00\x36\xc6\x8c\x9c\x10\x57\x01\x4c\xc8\xcc\x1e\
+\x2d\x69\x8f\xa4\x33\xa2\x6b\x01\x80\xc2\x3c\x24\x69\xa7\xbb\xdf\
+\x17\x5d\x48\x2f\xd8\x01\x98\xd0\xd0\xd8\x1f\x89\xae\x03\x00\x0a\
+\xf4\x11\x0e\xfe\xd3\x22\x00\x4c\x8f\x2d\x2e\x00\x38\x11\xb3\x71\
+\x62\x7c\x04\x10\xc0\xcc\xee\x94\x74\x41\x74\x1d\x00\x50\x88\xaf\
+\xba\xfb\x93\xa2\x8b\xe8\x0d\x3b\x00\x31\xfe\x5d\x74\x01\x00\x50\
+\x10\x66\x62\x00\x76\x00\x82\x98\xd9\x9f\x4b\xfa\xc5\xe8\x3a\x00\
+\x20\xd8\x5f\xb8\xfb\xb3\xa3\x8b\xe8\x11\x01\x20\x88\x99\xfd\x5d\
+\x49\x7f\x2d\xe9\xf4\xe8\x5a\x00\x20\xc8\x41\x49\x3f\xe9\xee\xff\
+\x27\xba\x90\x1e\xf1\x11\x40\x90\xa1\xe1\x7f\x37\xba\x0e\x00\x08\
+\xf4\xbb\x1c\xfc\xe3\xb0\x03\x10\xc8\xcc\x4e\x93\xf4\x57\x92\xfe\
+\x7e\x74\x2d\x00\x30\xb1\x2f\x4b\x7a\xaa\xbb\x3f\x1c\x5d\x48\xaf\
+\xd8\x01\x08\x34\x34\xfe\x2b\xa2\xeb\x00\x80\x00\xaf\xe0\xe0\x1f\
+\x8b\x00\x10\xcc\xdd\x6f\x93\xb4\x2b\xba\x0e\x00\x98\xd0\xae\x61\
+\xf6\x21\x10\x1f\x01\x14\xc0\xcc\x76\x68\xf6\x08\xcc\x7f\x18\x5c\
+\x0a\x00\xe4\xf6\xbf\x24\x5d\xe2\xee\xfb\xa3\x0b\xe9\x1d\x01\xa0\
+\x10\x66\x76\xae\xa4\xff\x21\xe9\x89\xd1\xb5\x00\x40\x26\x5f\x93\
+\xf4\x8f\xdd\xfd\xee\xe8\x42\xc0\x47\x00\xc5\x18\xde\x10\x97\x4a\
+\xfa\x5e\x74\x2d\x00\x90\xc1\xf7\x24\x5d\xca\xc1\xbf\x1c\x04\x80\
+\x82\xb8\xfb\xd7\x35\xbb\x39\xd0\xfd\xd1\xb5\x00\x40\x42\xf7\x4b\
+\xfa\xc5\x61\xc6\xa1\x10\x04\x80\xc2\xb8\xfb\x17\x24\x3d\x4f\xb3\
+\x1b\x64\x00\x40\xed\x0e\x4a\x7a\xde\x30\xdb\x50\x10\x02\x40\x81\
+\xdc\xfd\xbf\x49\x7a\x91\xa4\xa3\xd1\xb5\x00\xc0\x08\x47\x25\xbd\
+\x68\x98\x69\x28\x0c\x01\xa0\x50\xee\x7e\x93\xa4\x5f\x92\xb4\x37\
+\xba\x16\x00\x58\xc2\x5e\x49\xbf\x34\xcc\x32\x14\x88\xab\x00\x0a\
+\x67\x66\x4f\x90\xf4\x5f\x24\x5d\x18\x5d\x0b\x00\xcc\x69\xb7\xa4\
+\x7f\xea\xee\xdf\x8a\x2e\x04\x1b\x63\x07\xa0\x70\xc3\x1b\xe8\xe7\
+\x25\xbd\x23\xba\x16\x00\x98\xc3\x3b\x24\xfd\x3c\x07\xff\xf2\xb1\
+\x03\x50\x11\x33\x7b\xa1\xa4\xff\x24\x69\x47\x74\x2d\x00\xb0\xc6\
+\x7e\x49\xff\xc2\xdd\x3f\x14\x5d\x08\xe6\x43\x00\xa8\x8c\x99\x3d\
+\x49\xd2\x87\x25\xfd\x54\x74\x2d\x00\x30\xf8\xa2\xa4\x5f\x76\xf7\
+\x3b\xa3\x0b\xc1\xfc\xf8\x08\xa0\x32\xc3\x1b\xec\x67\x24\xfd\x86\
+\xa4\xbb\x82\xcb\x01\xd0\xb7\xbb\x34\x9b\x45\x3f\xc3\xc1\xbf\x3e\
+\xec\x00\x54\xcc\xcc\x1e\x25\xe9\x6a\x49\xaf\x93\xf4\x98\xe0\x72\
+\x00\xf4\xe3\x5e\x49\x7f\x20\xe9\x06\x77\x7f\x30\xba\x18\x2c\x87\
+\x00\xd0\x80\xe1\x61\x42\xaf\x96\xf4\x1a\x49\x67\x07\x97\x03\xa0\
+\x5d\xf7\x4b\x7a\x9b\xa4\xb7\xf3\x30\x9f\xfa\x11\x00\x1a\x62\x66\
+\x7f\x4b\xd2\x35\x92\x7e\x5d\xd2\xdf\x0e\x2e\x07\x40\x3b\xbe\x2f\
+\xe9\x3f\x4a\xba\xce\xdd\x7f\x10\x5d\x0c\xd2\x20\x00\x34\xc8\xcc\
+\x4e\x96\x74\x91\xa4\xcb\x86\xaf\xa7\xc4\x56\x04\xa0\x42\x77\x48\
+\xba\x65\xf8\xba\xdd\xdd\xb9\x33\x69\x63\x08\x00\x1d\x30\xb3\x1f\
+\xd7\xec\xae\x82\x97\x49\xfa\x05\x49\xdb\x22\xeb\x01\x50\xa4\x43\
+\x92\x3e\xa5\xd9\x01\xff\xcf\xdc\xfd\x1b\xb1\xe5\x20\x37\x02\x40\
+\x67\xcc\xec\x4c\x49\x3f\x2d\xe9\x7c\x49\x3f\xb2\xc1\xbf\xe7\x4a\
+\x3a\x25\xaa\x46\x00\xc9\x1d\x91\x74\xb7\xa4\xef\x6a\xf6\x58\xde\
+\xf5\xfe\xfd\x82\xbb\x3f\x10\x56\x21\x26\xf7\xff\x01\x78\x2e\x4d\
+\x08\x0b\xd8\x6f\x15\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\
+\x82\
+\x00\x00\x14\xd9\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x02\x00\x00\x00\x02\x00\x08\x06\x00\x00\x00\xf4\x78\xd4\xfa\
+\x00\x00\x00\x04\x73\x42\x49\x54\x08\x08\x08\x08\x7c\x08\x64\x88\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
+\x01\x95\x2b\x0e\x1b\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\
+\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\
+\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x14\x56\x49\x44\
+\x41\x54\x78\x9c\xed\xdd\x5b\xac\x66\x67\x7d\xd8\xe1\xdf\xd8\x53\
+\x1f\x8a\x31\x29\xc6\x87\x62\x20\x55\x1d\xa0\xa8\x80\x94\xb6\x17\
+\xa9\x44\x08\x60\xc0\x2e\xf4\x98\x88\x8b\xaa\x54\x4d\xd2\x84\x04\
+\x45\x91\x2a\x8a\x5a\xb5\x15\x18\x1c\xa4\x4a\x4d\x81\x42\x45\xd2\
+\xc6\x21\x48\x40\xd4\x2b\x6e\x20\x72\x8c\x39\x18\x02\xad\xd4\x83\
+\xb8\x28\xc1\x01\x6c\xa7\xa4\x35\xc8\xd8\x98\xa4\xc6\xb4\x9e\x31\
+\xe3\xe9\xc5\xb7\xa7\xb4\x13\x66\xbc\x37\xde\xeb\x7b\xbf\xb5\xdf\
+\xe7\x91\xde\x0b\x8f\xed\xb5\xfe\x6b\xcf\xde\x6b\xfd\xf6\x77\x58\
+\x5f\x01\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc0\x11\x71\x6c\xf4\x00\
+\x6c\xcd\x05\xd5\x0b\xf6\xd6\x73\xab\xab\xaa\xcb\xf6\xfe\xdd\xc3\
+\xd5\xd7\xab\x2f\x55\x9f\xaf\x7e\xb7\x7a\x6c\xc0\x8c\x00\xc0\x21\
+\x38\x5e\xbd\xba\xfa\x77\xd5\x37\xaa\xd3\xfb\x5c\x0f\x54\xbf\x59\
+\xbd\x6a\x6f\x1b\x00\xc0\x0a\x5c\x5a\xfd\x62\xf5\x07\xed\xff\xa2\
+\x7f\xae\xf5\x95\xea\x17\xaa\x4b\xb6\x79\x00\x00\xc0\xc1\x5c\x5f\
+\x7d\xb1\x27\x7e\xe1\x3f\x7b\xdd\xd3\xe6\x11\x01\x00\x60\x87\x5c\
+\x52\xbd\xab\xc3\xbf\xf0\x9f\xbd\xde\x5f\xfd\xc9\x2d\x1d\x13\x00\
+\x70\x1e\xd7\x54\x9f\x6b\xf9\x8b\xff\x99\xf5\x5f\xaa\xab\xb7\x72\
+\x64\x00\xc0\xf7\xf4\x83\xd5\xdd\x6d\xef\xe2\x7f\x66\xdd\x5d\x3d\
+\x6b\x0b\xc7\x07\x00\x9c\xe5\x69\xd5\xef\xb5\xfd\x8b\xff\x99\x75\
+\x57\x9b\xb7\x13\x02\x00\x5b\x72\xbc\xfa\x9d\xc6\x5d\xfc\xcf\xac\
+\x3b\xaa\x0b\x17\x3e\x56\x00\x60\xcf\xdb\x1a\x7f\xf1\x3f\xb3\xde\
+\xba\xf0\xb1\x02\x00\xd5\xf3\xab\x93\x8d\xbf\xf0\x9f\x59\x8f\x56\
+\x2f\x5c\xf4\x88\x01\x80\x3e\xdd\xf8\x8b\xfe\xd9\xeb\x13\x8b\x1e\
+\x31\x00\x4c\xee\x25\x8d\xbf\xd8\x9f\x6b\xfd\xe8\x72\x87\x0d\x00\
+\x73\xfb\xad\xc6\x5f\xe8\xcf\xb5\x3e\xbc\xe0\x71\x03\xc0\xb4\xae\
+\x6e\xf3\x7c\xfb\xe8\x0b\xfd\xb9\xd6\xa3\xb9\x41\x10\xc0\x2a\x5c\
+\x30\x7a\x00\x0e\xe4\x35\xed\xf6\xa7\xf3\x1d\xaf\x7e\x7c\xf4\x10\
+\x00\x3c\x3e\x01\xb0\x2e\xd7\x8f\x1e\x60\x1f\x5e\x36\x7a\x00\x00\
+\x38\x6a\xee\x6f\xfc\xc3\xfc\x8f\xb7\xee\x5b\xec\xe8\x01\x38\x34\
+\xc7\x46\x0f\xc0\xbe\x3d\xad\x7a\x60\xf4\x10\xfb\x74\x45\xf5\xcd\
+\xd1\x43\x00\x70\x6e\x9e\x02\x58\x8f\xeb\x46\x0f\x70\x00\x6b\x9a\
+\x15\x60\x4a\x02\x60\x3d\x7e\x60\xf4\x00\x07\xb0\xa6\x59\x01\xa6\
+\x24\x00\xd6\xe3\x49\xa3\x07\x38\x80\x27\x8f\x1e\x00\x80\xf3\x13\
+\x00\xeb\xb1\xa6\x4f\xdc\x5b\xd3\xac\x00\x53\x12\x00\x00\x30\x21\
+\x01\x00\x00\x13\x12\x00\x00\x30\x21\x01\x00\x00\x13\x12\x00\x00\
+\x30\x21\x01\x00\x00\x13\x12\x00\x00\x30\x21\x01\x00\x00\x13\x12\
+\x00\x00\x30\x21\x01\x00\x00\x13\x12\x00\x00\x30\x21\x01\x00\x00\
+\x13\x12\x00\x00\x30\x21\x01\x00\x00\x13\x12\x00\x00\x30\x21\x01\
+\x00\x00\x13\x12\x00\x00\x30\x21\x01\x00\x00\x13\x12\x00\x00\x30\
+\x21\x01\x00\x00\x13\x12\x00\x00\x30\x21\x01\x00\x00\x13\x12\x00\
+\x00\x30\x21\x01\x00\x00\x13\x12\x00\x00\x30\x21\x01\x00\x00\x13\
+\x12\x00\x00\x30\x21\x01\x00\x00\x13\x12\x00\x00\x30\x21\x01\x00\
+\x00\x13\x12\x00\x00\x30\x21\x01\x00\x00\x13\x12\x00\x00\x30\x21\
+\x01\x00\x00\x13\x12\x00\x00\x30\x21\x01\x00\x00\x13\x12\x00\x00\
+\x30\x21\x01\x00\x00\x13\x12\x00\x00\x30\x21\x01\x00\x00\x13\x12\
+\x00\x00\x30\x21\x01\x00\x00\x13\x12\x00\x00\x30\x21\x01\x00\x00\
+\x13\x12\x00\x00\x30\x21\x01\x00\x00\x13\x12\x00\x00\x30\x21\x01\
+\x00\x00\x13\x12\x00\x00\x30\x21\x01\x00\x00\x13\x12\x00\x00\x30\
+\x21\x01\x00\x00\x13\x12\x00\x00\x30\x21\x01\x00\x00\x13\x12\x00\
+\x00\x30\x21\x01\x00\x00\x13\x12\x00\x00\x30\x21\x01\x00\x00\x13\
+\x12\x00\x00\x30\x21\x01\x00\x00\x13\x12\x00\x00\x30\x21\x01\x00\
+\x00\x13\x3a\x3e\x7a\x80\xc7\x71\x45\xf5\xec\xea\xb2\xea\x4f\x2d\
+\xb4\x8f\x93\xd5\xb7\xab\xfb\xaa\xbb\xab\x47\x16\xda\x0f\xbb\xe1\
+\x92\x36\xdf\x53\x57\x57\x4f\xaa\x2e\x1a\x3b\x0e\x0c\xe5\xfc\x37\
+\xb1\x5d\x0b\x80\x6b\xaa\x9f\xa8\xae\xaf\x5e\x54\x5d\xb9\xe5\xfd\
+\x3f\x56\xdd\x55\xdd\x51\x7d\xb4\xba\xb5\xcd\x0f\x08\xeb\x75\x71\
+\xf5\xaa\xea\x86\xea\x25\x6d\x2e\xfe\x1e\xf9\x82\x3f\xce\xf9\x8f\
+\x21\x5e\x52\xfd\x56\xf5\x9d\xea\xf4\x0e\xad\x07\xab\x77\x54\xcf\
+\x58\xec\xc8\xf7\xef\x35\x8d\xff\x7a\xec\x77\xbd\x66\xa1\xaf\xc1\
+\x41\x3c\xb3\x7a\x67\x9b\xbf\xc3\xd1\x5f\x0f\xcb\x5a\xe3\xda\xa5\
+\xf3\x1f\x47\xd0\x0b\xab\x4f\x37\xfe\x1b\xfd\xf1\xd6\x89\x36\x3f\
+\x08\x97\x2f\xf3\x65\xd8\x17\x01\xb0\x3f\x4f\xa9\xde\xd5\xe6\xef\
+\x6c\xf4\xd7\xc1\xb2\x8e\xc2\xda\x85\xf3\x1f\x47\xc8\xf1\xea\x6d\
+\xd5\xa3\x8d\xff\xe6\x3e\xc8\xfa\x6a\xf5\x8a\x05\xbe\x1e\xfb\x21\
+\x00\x1e\xdf\x0d\xd5\xd7\xf6\x39\xa3\x65\x59\x07\x5b\x23\xcf\x7f\
+\x2c\x60\xc4\x73\xa1\x57\x56\x9f\xac\xfe\x59\xbb\xf7\x1a\x84\xc7\
+\xf3\xf4\xea\xb6\xea\xa6\xea\xd8\xe0\x59\xf8\xae\x63\xd5\xcd\x6d\
+\x9e\xb3\xfc\xd3\x83\x67\x81\xa3\xca\xf9\xef\x88\xd9\x76\x00\xfc\
+\x60\xf5\x99\xea\x47\xb7\xbc\xdf\xc3\x74\x41\xf5\x96\xea\x96\xea\
+\xc2\xb1\xa3\xd0\xe6\xef\xe0\xbd\xd5\x9b\xf2\xe2\x3e\x58\x9a\xf3\
+\xdf\x11\xb2\xcd\x13\xe6\x95\xd5\xed\xd5\x73\xb7\xb8\xcf\x25\xfd\
+\xfd\xea\x7d\x29\xe1\x91\x8e\x55\xff\xb6\xfa\xa9\xd1\x83\xc0\x64\
+\x9c\xff\x8e\x80\x6d\x05\xc0\xa5\x6d\xde\x56\xf2\x9c\x2d\xed\x6f\
+\x5b\xfe\x6e\x9b\xdf\x3c\x19\xe3\xad\x6d\x4e\x44\xc0\xf6\x39\xff\
+\xad\xdc\xb6\x02\xe0\xdd\xd5\x0f\x6f\x69\x5f\xdb\x76\x53\xf5\xca\
+\xd1\x43\x4c\xe8\x65\xd5\x3f\x1d\x3d\x04\x4c\xce\xf9\x6f\xc5\xb6\
+\x11\x00\xaf\xae\x7e\x66\x0b\xfb\x19\xe5\x82\xea\x37\xaa\x27\x8f\
+\x1e\x64\x22\x97\x57\x1f\xcc\x73\x90\x30\x9a\xf3\xdf\x8a\x2d\x1d\
+\x00\x97\xb6\xf9\xed\xff\xa8\xbb\xb6\xcd\x0b\x63\xd8\x8e\x9b\xf3\
+\x6a\x7f\xd8\x15\xce\x7f\x2b\xb5\x74\x00\xfc\x4c\xf5\x67\x17\xde\
+\xc7\xae\xf8\x85\x36\x3f\x08\x2c\xeb\x19\xd5\xeb\x47\x0f\x01\xfc\
+\x7f\x9c\xff\x56\x68\xc9\x00\x38\x5e\xbd\x71\xc1\xed\xef\x9a\x8b\
+\xab\x37\x8c\x1e\x62\x02\x6f\xcc\x07\xf8\xc0\xae\x71\xfe\x5b\xa1\
+\x25\x03\xe0\xc6\xea\x59\x0b\x6e\x7f\x17\xfd\x64\x9b\x1f\x04\x96\
+\x71\x51\xf5\xda\xd1\x43\x00\xdf\xd3\x4f\xe6\xfc\xb7\x2a\x4b\x06\
+\xc0\xdf\x59\x70\xdb\xbb\xea\xa9\x6d\x6e\x47\xcb\x32\x5e\xdd\xe6\
+\x23\xa2\x81\xdd\xe3\xfc\xb7\x32\x4b\x05\xc0\x05\xd5\xcb\x17\xda\
+\xf6\xae\xf3\x03\xb0\x9c\x1b\x47\x0f\x00\x9c\x97\xf3\xdf\x8a\x2c\
+\x15\x00\x2f\xa8\x9e\xb6\xd0\xb6\x77\xdd\x4b\x47\x0f\x70\x84\xfd\
+\xd8\xe8\x01\x80\xf3\x72\xfe\x5b\x91\xa5\x02\xe0\x85\x0b\x6d\x77\
+\x0d\x9e\x53\x5d\x32\x7a\x88\x23\xe8\xd2\xea\xd9\xa3\x87\x00\xce\
+\xcb\xf9\x6f\x45\x96\x0a\x80\xa3\x76\xcb\xdf\x83\xb8\xb0\xba\x6e\
+\xf4\x10\x47\xd0\x0f\xe5\xc3\x7e\x60\xd7\x39\xff\xad\xc8\x52\x27\
+\xd4\x2b\x17\xda\xee\x5a\xcc\x7e\xfc\x4b\xb8\x6a\xf4\x00\xc0\xbe\
+\x38\xff\xad\xc4\x52\x01\x70\xd9\x42\xdb\x5d\x8b\xcb\x47\x0f\x70\
+\x04\xcd\xfe\x3d\x05\x6b\xe1\xfc\xb7\x12\x1e\x52\x05\xe0\x30\xb9\
+\x17\xc0\x4a\x2c\x15\x00\x0f\x2f\xb4\xdd\xb5\x78\x68\xf4\x00\x47\
+\xd0\xec\xdf\x53\x00\x87\x6a\xa9\x00\xb8\x7f\xa1\xed\xae\xc5\x03\
+\xa3\x07\x38\x82\x66\xff\x9e\x02\x38\x54\x4b\x05\xc0\x97\x17\xda\
+\xee\x1a\x9c\xaa\xee\x19\x3d\xc4\x11\x74\x57\x9b\xaf\x2d\x00\x87\
+\x60\xa9\x00\xf8\xaf\x0b\x6d\x77\x0d\xbe\x54\x3d\x32\x7a\x88\x23\
+\xe8\x91\xea\xee\xd1\x43\x00\x1c\x15\x4b\x05\xc0\xe7\xab\x6f\x2c\
+\xb4\xed\x5d\x77\xc7\xe8\x01\x8e\xb0\x4f\x8d\x1e\x00\xe0\xa8\x58\
+\x2a\x00\x4e\x57\xb7\x2f\xb4\xed\x5d\xf7\xd1\xd1\x03\x1c\x61\xb7\
+\x8d\x1e\x00\xe0\xa8\x58\xf2\x6d\x80\xbf\xb9\xe0\xb6\x77\xd5\x37\
+\x13\x00\x4b\xba\xb5\x7a\x70\xf4\x10\x00\x47\xc1\x92\x01\x70\x7b\
+\xf5\x07\x0b\x6e\x7f\x17\xbd\xaf\x3a\x39\x7a\x88\x23\xec\x64\xf5\
+\x81\xd1\x43\x00\x1c\x05\x4b\x06\xc0\x77\xaa\x5f\x5e\x70\xfb\xbb\
+\xe6\x44\xf5\xce\xd1\x43\x4c\xe0\xed\x6d\xbe\xd6\x00\x3c\x01\x4b\
+\xdf\x09\xf0\xbd\xcd\xf3\x96\xb8\x77\x57\x5f\x1d\x3d\xc4\x04\xee\
+\xad\x7e\x65\xf4\x10\x00\x6b\xb7\x74\x00\x3c\x52\xfd\xe2\xc2\xfb\
+\xd8\x05\xf7\x56\x37\x8f\x1e\x62\x22\x6f\xa9\xbe\x36\x7a\x08\x80\
+\x35\xdb\xc6\x67\x01\xfc\x76\xf5\x6b\x5b\xd8\xcf\x28\x8f\x55\x3f\
+\x9d\x5b\xd5\x6e\xd3\x43\xd5\x6b\x73\x63\x20\x80\xef\xdb\xb6\x3e\
+\x0c\xe8\x1f\x54\x9f\xdb\xd2\xbe\xb6\xed\xa6\xea\x63\xa3\x87\x98\
+\xd0\x1d\xd5\x2f\x8d\x1e\x02\x60\xad\xb6\x15\x00\xff\xbb\xba\xb1\
+\xcd\x5d\xf2\x8e\x92\x5b\xaa\xb7\x8d\x1e\x62\x62\x37\x57\xbf\x3e\
+\x7a\x08\x80\x35\xda\xe6\xc7\x01\x3f\x50\xbd\xb2\xfa\xe2\x16\xf7\
+\xb9\xa4\x5b\xaa\xd7\x8f\x1e\x62\x72\xa7\xab\x9f\x6f\xf3\x62\x53\
+\x00\x0e\x60\x9b\x01\x50\xf5\xdf\xab\x17\xb5\xee\x5b\xba\x9e\xaa\
+\xde\x54\xbd\x2e\xcf\x41\xef\x82\x53\xd5\xcf\xb6\x79\x2a\xe6\xb1\
+\xc1\xb3\x00\xac\xc6\xb6\x03\xa0\x36\x77\x72\x7b\x79\x9b\x87\x6f\
+\x1f\x1d\xb0\xff\x27\xe2\xde\x36\x8f\x62\x78\xd8\x7f\xb7\x9c\x6e\
+\xf3\xfd\x74\x43\xde\x8a\x09\xb0\x2f\x23\x02\xa0\x36\xbf\xb5\xdd\
+\x54\xfd\x70\xf5\xc9\x41\x33\x1c\xc4\x23\x6d\x6e\x6a\xf4\xbc\xd6\
+\x31\xef\xac\x3e\xde\xe6\xef\xc8\xcd\x82\x00\x1e\xc7\xa8\x00\x38\
+\xe3\x0b\xd5\xf5\xd5\x8b\xab\x8f\xb4\xb9\x7b\xe0\x2e\xf9\x46\x9b\
+\x8b\xc9\x75\xd5\x3f\xca\x5b\xfd\xd6\xe0\x5b\xd5\x1b\xdb\xfc\x9d\
+\xbd\x23\x9f\x1d\x00\xf0\x3d\x1d\x1f\x3d\xc0\x9e\xcf\xec\xad\xab\
+\xaa\x9f\x68\x13\x05\x2f\xaa\xae\xde\xf2\x1c\xa7\xaa\x2f\xb7\x79\
+\x8b\xd9\x6d\x6d\x3e\xd8\xc7\xbd\xfd\xd7\xe9\xab\xd5\x3f\xac\xfe\
+\x49\x9b\x77\xa0\xdc\x50\xbd\xb4\x7a\x4e\x75\xe1\xc0\xb9\x00\x76\
+\xc2\xae\x04\xc0\x19\xf7\x57\xbf\xba\xb7\xaa\x9e\xda\xe6\x37\xb9\
+\xa7\x54\x3f\x50\x1d\x5b\x60\x9f\x27\xda\xfc\x66\x7f\x5f\x9b\xdb\
+\x16\x7b\xe8\xf8\x68\x39\x59\x7d\x78\x6f\x55\x5d\xdc\xe6\x7b\xea\
+\x9a\xea\xb2\xbd\x7f\x86\x5d\xf7\x23\xd5\x1b\x46\x0f\xc1\xd1\xb2\
+\x6b\x01\x70\xb6\x6f\xee\x2d\x38\x2c\x27\xaa\x3b\xf7\x16\xc0\xb4\
+\x46\xbf\x06\x00\x00\x18\x40\x00\x00\xc0\x84\x04\x00\x00\x4c\x48\
+\x00\x00\xc0\x84\x04\x00\x00\x4c\x48\x00\x00\xc0\x84\x04\x00\x00\
+\x4c\x48\x00\x00\xc0\x84\x04\x00\x00\x4c\x48\x00\x00\xc0\x84\x04\
+\x00\x00\x4c\x48\x00\x00\xc0\x84\x04\x00\x00\x4c\x48\x00\x00\xc0\
+\x84\x04\x00\x00\x4c\x48\x00\x00\xc0\x84\x04\x00\x00\x4c\x48\x00\
+\x00\xc0\x84\x04\x00\x00\x4c\x48\x00\x00\xc0\x84\x04\x00\x00\x4c\
+\x48\x00\x00\xc0\x84\x04\x00\x00\x4c\x48\x00\x00\xc0\x84\x04\x00\
+\x00\x4c\x48\x00\x00\xc0\x84\x04\x00\x00\x4c\x48\x00\x00\xc0\x84\
+\x04\x00\x00\x4c\x48\x00\x00\xc0\x84\x04\x00\x00\x4c\x48\x00\x00\
+\xc0\x84\x04\x00\x00\x4c\x48\x00\x00\xc0\x84\x04\x00\x00\x4c\x48\
+\x00\x00\xc0\x84\x04\x00\x00\x4c\x48\x00\x00\xc0\x84\x04\x00\x00\
+\x4c\x48\x00\x00\xc0\x84\x04\x00\x00\x4c\x48\x00\x00\xc0\x84\x04\
+\x00\x00\x4c\x48\x00\x00\xc0\x84\x04\x00\x00\x4c\x48\x00\x00\xc0\
+\x84\x04\x00\x00\x4c\x48\x00\x00\xc0\x84\x04\x00\x00\x4c\x48\x00\
+\x00\xc0\x84\x04\x00\x00\x4c\x48\x00\x00\xc0\x84\x04\x00\x00\x4c\
+\x48\x00\x00\xc0\x84\x04\x00\x00\x4c\x48\x00\x00\xc0\x84\x04\x00\
+\x00\x4c\x48\x00\x00\xc0\x84\x04\x00\x00\x4c\x48\x00\x00\xc0\x84\
+\x04\x00\x00\x4c\x48\x00\x00\xc0\x84\x04\x00\x00\x4c\x48\x00\x00\
+\xc0\x84\x04\x00\x00\x4c\x48\x00\x00\xc0\x84\x04\x00\x00\x4c\x48\
+\x00\x00\xc0\x84\x04\x00\x00\x4c\x48\x00\x00\xc0\x84\x04\x00\x00\
+\x4c\x48\x00\x00\xc0\x84\x04\x00\x00\x4c\x48\x00\x00\xc0\x84\x04\
+\x00\x00\x4c\x48\x00\x00\xc0\x84\x04\x00\x00\x4c\x48\x00\x00\xc0\
+\x84\x04\x00\x00\x4c\x48\x00\x00\xc0\x84\x04\x00\x00\x4c\x48\x00\
+\x00\xc0\x84\x04\x00\x00\x4c\x48\x00\x00\xc0\x84\x04\x00\x00\x4c\
+\x48\x00\x00\xc0\x84\x04\x00\x00\x4c\x48\x00\x00\xc0\x84\x04\x00\
+\x00\x4c\x48\x00\x00\xc0\x84\x04\x00\x00\x4c\x48\x00\x00\xc0\x84\
+\x04\x00\x00\x4c\x48\x00\x00\xc0\x84\x04\x00\x00\x4c\x48\x00\x00\
+\xc0\x84\x04\x00\x00\x4c\x48\x00\x00\xc0\x84\x04\x00\x00\x4c\x48\
+\x00\x00\xc0\x84\x04\x00\x00\x4c\x48\x00\x00\xc0\x84\x04\x00\x00\
+\x4c\x48\x00\x00\xc0\x84\x04\x00\x00\x4c\x48\x00\x00\xc0\x84\x04\
+\x00\x00\x4c\x48\x00\x00\xc0\x84\x04\x00\x00\x4c\x48\x00\x00\xc0\
+\x84\x04\x00\x00\x4c\x48\x00\x00\xc0\x84\x04\x00\x00\x4c\x48\x00\
+\x00\xc0\x84\x04\x00\x00\x4c\x48\x00\x00\xc0\x84\x04\x00\x00\x4c\
+\x48\x00\x00\xc0\x84\x04\x00\x00\x4c\x48\x00\x00\xc0\x84\x04\x00\
+\x00\x4c\x48\x00\x00\xc0\x84\x04\x00\x00\x4c\x48\x00\x00\xc0\x84\
+\x04\x00\x00\x4c\x48\x00\x00\xc0\x84\x04\x00\x00\x4c\x48\x00\x00\
+\xc0\x84\x04\x00\x00\x4c\x48\x00\x00\xc0\x84\x04\x00\x00\x4c\x48\
+\x00\x00\xc0\x84\x04\x00\x00\x4c\x48\x00\x00\xc0\x84\x04\x00\x00\
+\x4c\x48\x00\x00\xc0\x84\x04\x00\x00\x4c\x48\x00\x00\xc0\x84\x04\
+\x00\x00\x4c\x48\x00\x00\xc0\x84\x04\x00\x00\x4c\x48\x00\x00\xc0\
+\x84\x04\x00\x00\x4c\x48\x00\x00\xc0\x84\x04\x00\x00\x4c\x48\x00\
+\x00\xc0\x84\x04\x00\x00\x4c\x48\x00\x00\xc0\x84\x04\x00\x00\x4c\
+\x48\x00\x00\xc0\x84\x04\x00\x00\x4c\x48\x00\x00\xc0\x84\x04\x00\
+\x00\x4c\x48\x00\x00\xc0\x84\x04\x00\x00\x4c\x48\x00\x00\xc0\x84\
+\x04\x00\x00\x4c\x48\x00\x00\xc0\x84\x04\x00\x00\x4c\x48\x00\x00\
+\xc0\x84\x04\x00\x00\x4c\x48\x00\x00\xc0\x84\x04\x00\x00\x4c\x48\
+\x00\x00\xc0\x84\x04\x00\x00\x4c\x48\x00\x00\xc0\x84\x04\x00\x00\
+\x4c\x48\x00\x00\xc0\x84\x04\x00\x00\x4c\x48\x00\x00\xec\xbe\x93\
+\xa3\x07\x38\x80\x13\xa3\x07\x60\x7f\x04\x00\xc0\xee\x7b\x78\xf4\
+\x00\x07\xf0\xd0\xe8\x01\xd8\x1f\x01\x00\xb0\xfb\xee\x1f\x3d\xc0\
+\x01\x3c\x30\x7a\x00\xf6\x47\x00\x00\xec\xbe\xbb\xaa\x53\xa3\x87\
+\xd8\x87\x53\xd5\x3d\xa3\x87\x60\x7f\x04\x00\xc0\xee\x7b\xa4\xba\
+\x7b\xf4\x10\xfb\xf0\xa5\x36\xb3\xb2\x02\x02\x00\x60\x1d\x3e\x35\
+\x7a\x80\x7d\xb8\x63\xf4\x00\xec\x9f\x00\x00\x58\x87\xdb\x46\x0f\
+\xb0\x0f\x1f\x1d\x3d\x00\xfb\x27\x00\x00\xd6\xe1\xd6\xea\xc1\xd1\
+\x43\x9c\xc7\x37\x13\x00\xab\x22\x00\x00\xd6\xe1\x64\xf5\x81\xd1\
+\x43\x9c\xc7\xfb\x5a\xd7\xfd\x0a\xa6\x27\x00\x00\xd6\xe3\xed\xed\
+\xe6\x8d\x76\x4e\x54\xef\x1c\x3d\x04\x07\x23\x00\x00\xd6\xe3\xde\
+\xea\x57\x46\x0f\xf1\x3d\xbc\xbb\xfa\xea\xe8\x21\x38\x18\x01\x00\
+\xb0\x2e\x6f\xa9\xbe\x36\x7a\x88\xff\xc7\xbd\xd5\xcd\xa3\x87\xe0\
+\xe0\x04\x00\xc0\xba\x3c\x54\xbd\xb6\xdd\xb8\x31\xd0\x63\xd5\x4f\
+\xb7\xae\x5b\x15\xb3\x47\x00\x00\xac\xcf\x1d\xd5\x2f\x8d\x1e\xa2\
+\xba\xa9\xfa\xd8\xe8\x21\xe0\xa8\x7b\x4d\x75\x7a\x25\xeb\x35\x0b\
+\x7d\x0d\x80\xef\x3a\x56\xdd\xd2\xb8\x9f\xf3\x5f\x5b\xfe\x10\x59\
+\x92\x47\x00\x00\xd6\xe9\x74\xf5\xf3\xd5\x7b\x07\xec\xfb\x96\xea\
+\xf5\x03\xf6\xcb\x21\x12\x00\x00\xeb\x75\xaa\xfa\xd9\x36\x0f\xc5\
+\x3f\xb6\xa5\xfd\xbd\xa9\x7a\x5d\xbb\xf1\x1a\x04\x98\x82\xa7\x00\
+\x80\xf3\x79\x79\x9b\x57\xe4\x2f\xf5\x73\xfd\x3f\xaa\x97\x6d\xed\
+\x68\x58\x9c\x47\x00\x00\x8e\x86\x8f\x57\xcf\xeb\xf0\x6f\x16\xf4\
+\x48\xf5\xcb\x7b\xdb\xfe\xe4\x21\x6e\x17\xd8\x27\x8f\x00\x00\xfb\
+\x75\x6d\x9b\x10\xf8\x46\xdf\xff\xcf\xf1\x03\xd5\xbf\xac\x9e\xbe\
+\xe5\xd9\x81\xb3\x08\x00\xe0\xa0\x2e\xaa\xfe\x7a\xf5\x9e\xea\xce\
+\xea\x3b\x9d\xfb\xe7\xf6\x3b\x7b\xff\xcd\x7b\xaa\xbf\xb6\xf7\xff\
+\x72\x84\x1d\x1f\x3d\x00\x00\x8b\x39\x59\x7d\x78\x6f\x55\x5d\x5c\
+\x5d\x57\x5d\x53\x5d\xb6\xf7\x67\x0f\x57\xf7\x55\xf7\xb4\x9b\x9f\
+\x33\xc0\x42\x04\x00\xc0\x3c\x4e\xb4\xf9\x2d\xff\xce\xd1\x83\x30\
+\x9e\x17\x01\x02\xc0\x84\x04\x00\x00\x4c\x48\x00\x00\xc0\x84\x04\
+\x00\x00\x4c\x48\x00\x00\xc0\x84\x04\x00\x00\x4c\x48\x00\x00\xc0\
+\x84\x04\x00\x00\x4c\x48\x00\x00\xc0\x84\x04\x00\x00\x4c\x48\x00\
+\x00\xc0\x84\x04\x00\x00\x4c\x48\x00\x00\xc0\x84\x04\x00\x00\x4c\
+\x48\x00\x00\xc0\x84\x04\x00\x00\x4c\x48\x00\x00\xc0\x84\x04\x00\
+\x00\x4c\x48\x00\x00\xc0\x84\x8e\x8f\x1e\x80\x23\xe9\x47\x46\x0f\
+\x00\x30\xd0\x1f\x56\x0f\x57\x77\x55\x0f\x0e\x9e\xe5\x9c\x04\x00\
+\x4b\x78\xc3\xe8\x01\x00\x76\xc4\x03\xd5\x67\xaa\x4f\x54\x1f\xaa\
+\xbe\x3e\x76\x9c\xef\xf2\x14\x00\x00\x2c\xe7\xca\xea\xc7\xab\xf7\
+\x54\xf7\x56\x1f\xa9\x5e\x3c\x74\xa2\x3d\x02\x00\x00\xb6\xe3\x78\
+\xf5\x57\xab\x4f\x57\x9f\xac\x9e\x3f\x72\x18\x01\x00\x00\xdb\xf7\
+\xd2\xea\x73\xd5\x5b\xab\x0b\x47\x0c\x20\x00\x00\x60\x8c\x3f\x51\
+\xbd\xb9\xfa\x78\x75\xc5\xb6\x77\x2e\x00\x00\x60\xac\x97\x54\x9f\
+\xad\x9e\xb5\xcd\x9d\x0a\x00\x00\x18\xef\xcf\xb5\x79\x5d\xc0\x35\
+\xdb\xda\xa1\x00\x00\x80\xdd\x70\x5d\x9b\x77\x09\x5c\xb2\x8d\x9d\
+\x09\x00\x00\xd8\x1d\x7f\xa9\x7a\xc7\x36\x76\x24\x00\x00\x60\xb7\
+\xbc\xbe\xba\x61\xe9\x9d\x08\x00\x00\xd8\x3d\xff\xba\xba\x78\xc9\
+\x1d\x08\x00\x00\xd8\x3d\xcf\xae\x7e\x6a\xc9\x1d\x08\x00\x00\xd8\
+\x4d\xff\xb8\x05\x3f\xb3\x47\x00\x00\xc0\x6e\xfa\x33\xd5\xcb\x97\
+\xda\xb8\x00\x00\x80\xdd\xf5\xda\xa5\x36\x2c\x00\x00\x60\x77\xbd\
+\xb2\x3a\xb6\xc4\x86\x05\x00\x00\xec\xae\x2b\x5b\xe8\x53\x03\x05\
+\x00\x00\xec\xb6\x17\x2c\xb1\x51\x01\x00\x00\xbb\xed\xb9\x4b\x6c\
+\x54\x00\x00\xc0\x6e\xbb\x72\x89\x8d\x0a\x00\x00\xd8\x6d\x4f\x5e\
+\x62\xa3\x02\x60\x3d\x4e\x8e\x1e\x00\x80\xa3\x43\x00\xac\xc7\xc3\
+\xa3\x07\x00\x60\x88\x6f\x2d\xb1\x51\x01\xb0\x1e\xf7\x8f\x1e\x00\
+\x80\x21\x16\x39\xff\x0b\x80\xf5\xb8\xab\x3a\x35\x7a\x08\x00\xb6\
+\xee\x4b\x4b\x6c\x54\x00\xac\xc7\x23\xd5\xdd\xa3\x87\x00\x60\xeb\
+\x3e\xbf\xc4\x46\x05\xc0\xba\x7c\x6a\xf4\x00\x00\x6c\xd5\xfd\xd5\
+\x17\x96\xd8\xb0\x00\x58\x97\xdb\x46\x0f\x00\xc0\x56\xdd\x5e\x9d\
+\x5e\x62\xc3\x02\x60\x5d\x6e\xad\x1e\x1c\x3d\x04\x00\x5b\xf3\xc1\
+\xa5\x36\x2c\x00\xd6\xe5\x64\xf5\x81\xd1\x43\x00\xb0\x15\x5f\xa9\
+\x3e\xbe\xd4\xc6\x05\xc0\xfa\xbc\xbd\x3a\x31\x7a\x08\x00\x16\xf7\
+\xcf\x5b\xf0\xdd\x5f\x17\x2e\xb5\x61\x16\xf3\x50\xf5\xd4\xea\x2f\
+\x8f\x1e\x04\x80\xc5\x7c\xb9\xfa\xb9\x16\x0c\x80\x63\x4b\x6d\x98\
+\x45\x5d\x5e\xfd\x5e\xf5\xf4\xd1\x83\x00\xb0\x88\x57\x56\x1f\x5b\
+\x72\x07\x9e\x02\x58\xa7\x87\xaa\xd7\xe6\xc6\x40\x00\x47\xd1\x7b\
+\x5a\xf8\xe2\x5f\x9e\x02\x58\xb3\xaf\xb4\x79\x04\xe7\x25\x63\xc7\
+\x00\xe0\x10\xfd\xa7\xea\x6f\xb7\x85\x5f\xf0\x04\xc0\xba\xfd\x4e\
+\x75\x6d\xf5\x17\x46\x0f\x02\xc0\x13\x76\x4f\xf5\x8a\xea\x7f\x6e\
+\x63\x67\x02\x60\xfd\x6e\x4d\x04\x00\xac\xdd\x9d\x6d\x2e\xfe\x5f\
+\xdb\xd6\x0e\x05\xc0\xfa\x9d\xae\x3e\x52\x3d\x56\xfd\x58\x5e\xd8\
+\x09\xb0\x36\x9f\xa8\x5e\x55\x7d\x7d\x9b\x3b\x15\x00\x47\xc7\xa7\
+\xab\xff\x50\x5d\xdf\xe6\x5d\x02\x00\xec\xb6\x47\xab\x9b\xab\xd7\
+\x55\xff\x6b\xdb\x3b\x17\x00\x47\xcb\xef\x57\xb7\x54\x17\x55\x7f\
+\xb1\x3a\x3e\x76\x1c\x00\xce\xe1\x63\xd5\xdf\xa8\x3e\xd4\x42\xf7\
+\xfa\x7f\x3c\x1e\x2e\x3e\xba\xae\xad\xde\x50\xfd\xbd\xea\x8a\xc1\
+\xb3\x00\xb0\xf9\x8d\xff\xb7\xab\x7f\x51\xfd\xfb\xc1\xb3\x08\x80\
+\x09\x5c\x54\xdd\x58\xdd\x50\xbd\xb4\x7a\x4e\x1e\xf9\x01\xd8\x96\
+\xfb\xaa\xcf\xb6\x79\x9e\xff\x43\xd5\x03\x63\xc7\xf9\x2e\x01\x30\
+\x9f\x8b\xab\xeb\xaa\x6b\xaa\xcb\xf6\xfe\x19\x80\xc3\x71\xba\xfa\
+\xa3\xbd\x75\x4f\xf5\x87\x63\xc7\x01\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\
+\xf9\x1c\x1b\x3d\x00\x00\x5b\x73\x49\xf5\xec\xea\xea\xea\x49\x7b\
+\x7f\xf6\xed\xea\xbe\xea\xee\xea\x91\x41\x73\x01\x00\x87\xe8\xe2\
+\xea\x6f\x55\xff\xa6\xfa\x62\x75\xaa\x3a\x7d\x8e\x75\x6a\xef\xbf\
+\xf9\xd5\xea\x6f\x56\x17\x0d\x98\x17\x00\x78\x02\x9e\x59\xbd\xb3\
+\x7a\xb0\x73\x5f\xf0\x1f\x6f\x3d\x58\xbd\xa3\x7a\xc6\x96\x67\x07\
+\x00\x0e\xe8\x29\xd5\xbb\xaa\x13\x7d\xff\x17\xfe\xb3\xd7\x89\x36\
+\x21\x70\xf9\x16\x8f\x03\x00\xd8\xa7\x1b\xaa\xaf\x75\x78\x17\xfe\
+\xb3\xd7\x57\xab\x57\x6c\xed\x68\x00\x80\xf3\x3a\x56\xdd\xdc\xf9\
+\x9f\xdf\x3f\xac\x75\xaa\xba\x29\x2f\x20\x07\x80\xa1\x2e\xac\x7e\
+\xa3\xe5\x2f\xfc\x67\xaf\x5f\xdf\xdb\x37\x00\xb0\x65\xc7\xda\x5c\
+\x88\xb7\x7d\xf1\x3f\xb3\xde\x9f\x47\x02\x00\x60\xeb\x6e\x6e\xdc\
+\xc5\xff\xcc\x7a\xf3\xe2\x47\x09\x00\xfc\x5f\x2f\xab\xbe\xd3\xf8\
+\x00\x38\x55\xbd\x72\xe1\x63\x05\x00\xda\xbc\x1d\x6f\xc9\x57\xfb\
+\x1f\x74\xdd\x5b\x3d\x79\xd1\x23\x06\x00\xfa\x57\x8d\xbf\xe8\x9f\
+\xbd\xde\xbe\xe8\x11\x03\xc0\xe4\x9e\xd1\xe1\xde\xe4\xe7\xb0\xd6\
+\x23\xd5\xb5\x0b\x1e\x37\x0b\xb8\x60\xf4\x00\x00\xec\xdb\x1b\xdb\
+\xcd\x7b\xf4\x5f\x5c\xbd\x61\xf4\x10\x00\x70\x14\x5d\x54\x7d\xa3\
+\xf1\xbf\xed\x9f\x6b\x3d\xd8\x26\x04\x58\x09\x8f\x00\x00\xac\xc3\
+\xab\xab\x2b\x46\x0f\x71\x1e\x4f\x6d\x73\x3b\x62\x56\x42\x00\x00\
+\xac\xc3\x8d\xa3\x07\xd8\x07\x01\x00\x00\x87\xec\x8b\x8d\x7f\x98\
+\xff\xf1\xd6\x9d\x8b\x1d\x3d\x87\xce\x6d\x1c\x01\x76\xdf\xa5\xd5\
+\xc3\xed\xfe\xa3\xb6\xa7\xaa\xcb\xda\xbc\x2b\x80\x1d\xb7\xeb\xdf\
+\x4c\x00\xd4\x0f\xb5\x8e\xf3\xf5\x85\xd5\x75\xa3\x87\x60\x7f\xd6\
+\xf0\x0d\x05\x30\xbb\xab\x46\x0f\x70\x00\x57\x8e\x1e\x80\xfd\x11\
+\x00\x00\xbb\xef\xb2\xd1\x03\x1c\xc0\xe5\xa3\x07\x60\x7f\x04\x00\
+\xc0\xee\xdb\xc5\x9b\xff\x9c\x8b\x7b\x01\xac\x84\x00\x00\x80\x09\
+\x09\x00\x00\x98\x90\x00\x00\x80\x09\x09\x00\x00\x98\x90\x00\x00\
+\x80\x09\x09\x00\x00\x98\x90\x00\x00\x80\x09\x09\x00\x00\x98\x90\
+\x00\x00\x80\x09\x09\x00\x00\x98\x90\x00\x00\x80\x09\x09\x00\x00\
+\x98\x90\x00\x00\x80\x09\x09\x00\x00\x98\x90\x00\x00\x80\x09\x09\
+\x00\x00\x98\x90\x00\x00\x80\x09\x09\x00\x00\x98\x90\x00\x00\x80\
+\x09\x09\x00\x00\x98\x90\x00\x00\xd8\x7d\xa7\x46\x0f\x70\x00\x6b\
+\x9a\x75\x6a\x02\x00\x60\xf7\x7d\x7b\xf4\x00\x07\xf0\xad\xd1\x03\
+\xb0\x3f\x02\x00\x60\xf7\xfd\xd1\xe8\x01\x0e\x60\x4d\xb3\x4e\x4d\
+\x00\x00\xec\xbe\xbb\x46\x0f\x70\x00\xf7\x8c\x1e\x80\xfd\x11\x00\
+\x00\xbb\xef\x9b\xd5\xfd\xa3\x87\xd8\x87\xfb\xda\xcc\xca\x0a\x08\
+\x00\x80\x75\xf8\xec\xe8\x01\xf6\xe1\x33\xa3\x07\x60\xff\x04\x00\
+\xc0\x3a\x7c\x62\xf4\x00\xfb\xb0\x86\x19\x01\x60\x55\xae\xaa\x1e\
+\xad\x4e\xef\xe8\x7a\xb4\xba\x7a\xb1\xa3\xe7\xd0\x79\x04\x00\x60\
+\x1d\xee\xaf\x6e\x1b\x3d\xc4\x79\xdc\x5a\x7d\x7d\xf4\x10\x00\x70\
+\x14\xbd\xb8\xf1\xbf\xe9\x9f\x6b\xbd\x68\xc1\xe3\x06\x80\xe9\x7d\
+\xb2\xf1\x17\xfb\xb3\xd7\xed\x8b\x1e\x31\x00\xd0\x9f\xaf\x4e\x36\
+\xfe\xa2\x7f\x66\x9d\xa8\x9e\xb7\xe8\x11\x03\x00\x55\xbd\xb5\xf1\
+\x17\xfe\x33\xeb\xcd\x0b\x1f\x2b\x00\xb0\xe7\xc2\xea\x8e\xc6\x5f\
+\xfc\x3f\xbe\x37\x0b\x00\xb0\x25\x57\x54\x77\x36\xee\xe2\xff\x85\
+\xea\xa9\x8b\x1f\x25\x00\xf0\xc7\x3c\xab\xcd\xe7\x04\x6c\xfb\xe2\
+\xff\xe5\xea\x99\x5b\x38\x3e\x00\xe0\x1c\xae\xaa\xfe\x73\xdb\xbb\
+\xf8\xff\xc7\xbd\x7d\x02\x00\x83\x5d\x5c\xbd\xab\xe5\x2f\xfe\xef\
+\xaf\x2e\xdd\xd2\x31\x01\x00\xfb\xf4\xd2\x96\x79\x5d\xc0\x5d\xd5\
+\x8d\x5b\x3c\x0e\x00\xe0\x80\x2e\xae\x5e\x5f\xfd\xb7\x9e\xf8\x85\
+\xff\xf7\xab\x9f\xab\x2e\xda\xea\x11\x00\x00\xdf\xb7\x0b\xab\xbf\
+\x52\x7d\xb0\xcd\xe7\x08\xec\xf7\xa2\xff\xf5\xea\x03\x6d\x7e\xe3\
+\xf7\x16\xbf\x23\xec\xd8\xe8\x01\x00\x58\xdc\xb1\xea\xf9\xd5\x0b\
+\xaa\xe7\x54\xd7\x54\x97\xed\xfd\xbb\x87\xab\xfb\xaa\x2f\x55\xbf\
+\xbb\xb7\x4e\x0f\x98\x11\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xe0\
+\xfb\xf3\x7f\x00\x93\x15\xf1\x32\xba\x93\x96\x59\x00\x00\x00\x00\
+\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x3d\xee\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x02\x00\x00\x00\x02\x00\x08\x06\x00\x00\x00\xf4\x78\xd4\xfa\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0e\xc3\x00\x00\x0e\xc3\
+\x01\xc7\x6f\xa8\x64\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\
+\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\
+\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x20\x00\x49\x44\
+\x41\x54\x78\x9c\xed\xdd\x77\x98\x1e\x65\xb9\xf8\xf1\x6f\x12\x42\
+\x08\x25\x21\x74\x08\x55\x40\x8a\xd2\x04\x01\x15\xf0\x88\xa0\x08\
+\x02\xca\x11\xf5\x58\xd0\x63\xef\xed\x70\x6c\xc7\xee\xf9\x29\xea\
+\xb1\x1f\xe5\x60\x17\xac\xd8\xc1\x2e\xd8\x51\x7a\x47\x7a\xef\x3d\
+\x84\x24\x90\x84\xec\xfe\xfe\xb8\x77\xcd\x12\x36\xbb\xfb\xee\x3b\
+\x33\xf7\x94\xef\xe7\xba\xee\x6b\x03\x84\x9d\x7b\x9e\xf7\x9d\x99\
+\x7b\x9e\x79\xe6\x79\xa6\x20\xa9\xee\x56\x05\x36\x00\xd6\x05\xd6\
+\x01\xe6\x8c\xf2\x73\xd6\xd0\xdf\x9b\x0d\xcc\x04\x56\x03\xd6\x06\
+\x66\x00\x6b\xac\xf0\xfb\x86\xff\xfb\xb0\x07\x80\x07\x87\xfe\xbc\
+\x08\x58\x3c\xf4\xe7\x85\xc0\x92\xa1\x3f\x2f\x00\x96\x0e\xfd\xbb\
+\x7b\x80\x7b\x87\x7e\x8e\xf6\xe7\xbb\x81\x79\x7d\xed\xb1\xa4\xd2\
+\x4d\xc9\x4e\x40\xea\xb8\x59\xc0\x96\xc0\x16\xc0\x56\xc0\x46\xc0\
+\x26\x23\x7e\x6e\x48\x5c\xfc\x9b\x66\x90\x28\x04\x6e\x03\xae\x07\
+\x6e\x1c\x11\xd7\x03\x37\x0d\xc5\x92\x95\xfd\x02\x49\xe5\xb2\x00\
+\x90\xca\xb7\x09\xb0\xdd\x50\x3c\x9a\xb8\xd0\x6f\x41\x5c\xf8\xe7\
+\xe4\xa5\x95\x6e\x90\x28\x10\x6e\x60\x79\x61\x70\x19\xf0\x0f\xe0\
+\x52\xa2\x37\x41\x52\x49\x2c\x00\xa4\xe2\x6c\x05\xec\x34\x14\x3b\
+\xb0\xfc\x82\x3f\x2b\x33\xa9\x06\xbb\x8d\xe5\xc5\xc0\x25\x44\x71\
+\x70\x09\x70\x47\x66\x52\x52\x5b\x58\x00\x48\xbd\x9b\x01\xec\x0a\
+\xec\x32\x14\x3b\x13\x17\xfd\xd9\x99\x49\x75\xc8\x3d\x44\x61\x70\
+\x01\x70\x16\x70\x26\x70\x39\x30\x90\x99\x94\xd4\x34\x16\x00\xd2\
+\xf8\x1e\x05\xec\x03\xec\x3e\x22\x56\x1b\xf3\xff\x50\xd5\x16\x10\
+\x05\xc1\x39\x23\xe2\x92\xd4\x8c\xa4\x9a\xb3\x00\x90\x1e\x6e\x0d\
+\x60\x2f\x60\xdf\xa1\x78\x3c\x76\xe1\x37\xd5\xad\x2c\xef\x21\x38\
+\x03\xf8\x1b\xf1\x96\x83\x24\x2c\x00\xa4\x75\x88\xbb\xfb\xfd\x80\
+\x27\x11\x77\xf7\xd3\x53\x33\x52\x59\x96\x00\xa7\x03\xbf\x1f\x8a\
+\x33\xf0\x2d\x04\x75\x98\x05\x80\xba\x66\x15\xe2\xb9\xfd\x01\x43\
+\xf1\x64\xbc\xe0\x77\xd5\x22\xa2\x57\xe0\x34\xe0\xaf\xc0\x9f\x88\
+\xb9\x0e\xa4\x4e\xb0\x00\x50\x17\x3c\x06\x38\x88\xb8\xe0\xef\x07\
+\xac\x9e\x9b\x8e\x6a\x6a\x1e\xf0\x67\xe0\x54\xe0\x97\xc0\x55\xb9\
+\xe9\x48\xe5\xb2\x00\x50\x1b\xad\x02\xec\x0d\x3c\x13\x38\x1c\xd8\
+\x3e\x37\x1d\x35\xd4\x35\xc0\xcf\x81\x1f\x10\x3d\x05\xbe\x65\xa0\
+\x56\xb1\x00\x50\x5b\xac\x07\x1c\x46\x5c\xf4\x0f\x04\xd6\xcc\x4d\
+\x47\x2d\x73\x1b\x70\x32\x70\x12\xd1\x43\xf0\x40\x6e\x3a\x52\xff\
+\x2c\x00\xd4\x64\xeb\x02\x87\x00\x47\x02\x4f\xc7\x67\xf9\xaa\xc6\
+\x03\x44\x11\x70\xf2\x50\xdc\x9a\x9b\x8e\x34\x39\x16\x00\x6a\x9a\
+\x8d\x80\x23\x80\xe7\x10\xcf\xf3\xa7\xe5\xa6\xa3\x8e\x5b\x06\xfc\
+\x01\xf8\x16\xf0\x63\xe0\xfe\xdc\x74\xa4\x89\xb3\x00\x50\x13\xcc\
+\x24\xba\xf6\x8f\xc2\x3b\x7d\xd5\xd7\x83\xc0\x29\xc0\xf1\xc0\xcf\
+\xf0\x15\x43\xd5\x9c\x05\x80\xea\x6a\x1a\xf0\x14\xe2\xa2\xff\x6c\
+\x7c\xa6\xaf\x66\xb9\x97\x18\x40\x78\x3c\xf1\xb8\x60\x30\x37\x1d\
+\xe9\x91\x2c\x00\x54\x37\x3b\x02\xaf\x00\x5e\x48\x33\x97\xc1\x95\
+\x56\x74\x35\xf0\xed\xa1\xb8\x22\x39\x17\x49\xaa\x95\xd5\x88\x81\
+\x7c\xbf\x23\x5e\xb5\x1a\x34\x8c\x96\xc6\xd9\xc0\xab\x88\xc7\x5a\
+\x52\x2a\x7b\x00\x94\x69\x0f\xe0\x95\xc0\xf3\x71\xbe\x7d\x75\xcb\
+\x1d\xc0\xd7\x80\xe3\x80\xeb\x72\x53\x51\x57\x59\x00\xa8\x6a\xab\
+\x12\x93\xf3\xbc\x8a\x98\x99\x4f\xea\xb2\x01\x62\x5d\x82\x2f\x01\
+\x3f\x01\x1e\xca\x4d\x47\x5d\x62\x01\xa0\xaa\x6c\x4c\x0c\xe8\x7b\
+\x23\x30\x37\x39\x17\xa9\x8e\x6e\x01\x4e\x00\xfe\x17\xb8\x29\x39\
+\x17\x49\xea\xdb\x93\x80\x1f\x12\x8b\xac\x64\x3f\x7f\x35\x8c\x26\
+\xc4\x62\xe0\xbb\xc4\xca\x94\x92\xd4\x28\x53\x81\x43\x89\x15\xd6\
+\xb2\x4f\xa6\x86\xd1\xe4\xf8\x2b\x71\x2c\xd9\x5b\x2b\xa9\xd6\x66\
+\x10\xdd\xfc\xff\x20\xff\xc4\x69\x18\x6d\x8a\xf3\x89\x63\x6b\x15\
+\xa4\x82\x58\x55\xaa\x08\xb3\x89\x67\xfb\x6f\xc4\x77\xf7\xa5\x32\
+\x5d\x0d\xfc\x0f\xf0\x0d\x62\xe6\x41\x69\xd2\x2c\x00\xd4\x8f\x75\
+\x89\x8b\xfe\x9b\x80\x39\xc9\xb9\x48\x5d\x72\x27\xf0\x45\xe0\x73\
+\xc0\x3d\xc9\xb9\xa8\xa1\x2c\x00\x34\x19\x1b\x00\xff\x01\xbc\x0e\
+\xa7\xe8\x95\x32\xdd\x4f\xbc\x35\xf0\x09\x62\xfa\x61\x69\xc2\x2c\
+\x00\xd4\x8b\x0d\x80\x77\x11\xef\xf0\xaf\x9e\x9c\x8b\xa4\xe5\xe6\
+\x11\x8f\x06\x3e\x0b\x2c\x48\xce\x45\x0d\x61\x01\xa0\x89\x58\x8b\
+\xb8\xdb\x7f\x37\xce\xd8\x27\xd5\xd9\x5d\x44\x21\xf0\x39\xe0\x81\
+\xe4\x5c\x54\x73\x16\x00\x1a\xcb\xea\xc4\x54\xbd\xef\xc6\xc1\x7d\
+\x52\x93\xdc\x44\x14\x02\xc7\xe2\xb2\xc4\x5a\x09\x0b\x00\x8d\x66\
+\x3a\xf0\x6a\xe0\xbf\x80\x8d\x92\x73\xd1\x72\xf7\x00\xb7\x11\xf3\
+\xc8\xdf\x43\x3c\xf3\x1d\xf9\xf3\x1e\x60\x11\x31\x91\xcc\xbd\xc4\
+\x89\x7f\x21\xf1\x9c\x78\xe4\x14\xb3\xc3\x7f\x67\xd8\x4c\x62\x41\
+\x26\x88\xa2\x6f\xc6\xd0\x9f\xd7\x20\xa6\x6e\x86\x18\xeb\x31\x1b\
+\x58\x87\x18\xf0\x39\xda\xcf\xe1\x3f\xaf\x5b\xc0\xbe\xaa\x18\x57\
+\x02\x1f\x00\xbe\x47\x4c\x3b\xdc\x05\x33\x89\x69\xc6\x9f\x00\x6c\
+\x49\x7c\x2f\x07\x89\xe3\xe3\x1a\x62\x6e\x85\x3f\x60\x61\x64\x01\
+\xa0\x47\x78\x16\xf0\x31\xe0\xd1\xd9\x89\x74\xcc\xdd\xc4\xa2\x30\
+\xd7\x8f\xf8\x79\x23\x70\x3b\x31\x45\xec\x6d\x34\xe7\xb5\xaf\x19\
+\xc0\xa6\xc0\x66\xc0\xe6\x43\x31\xfc\xcf\x5b\x0c\xfd\xf4\x51\x52\
+\xb5\x2e\x22\x7a\xf2\x7e\x9e\x9d\x48\x89\x9e\x48\x0c\x4e\x7e\x3a\
+\x51\xbc\x8e\x65\x3e\xf0\x4b\xe0\xe3\xc0\x79\x25\xe7\x55\x5b\x16\
+\x00\x1a\xb6\x07\xf0\x49\x60\xbf\xec\x44\x5a\x6c\x3e\x70\xf9\x50\
+\x5c\x46\xac\x0d\x7f\x39\x70\x2d\x71\x97\xde\x25\xb3\x81\xad\x80\
+\xed\x81\xc7\x0c\xfd\xdc\x11\xd8\x96\xe8\x81\x52\x39\x7e\x0b\xbc\
+\x05\xb8\x34\x3b\x91\x02\x3d\x1a\x38\x06\x78\xf6\x24\xfe\xdf\x01\
+\x62\xda\xe5\x77\x03\x37\x14\x99\x54\x13\x58\x00\x68\x73\xe0\x23\
+\xc0\x0b\xf0\xfb\x50\x94\xa5\xc4\x05\xfe\xc2\xa1\xb8\x80\xb8\x03\
+\xbb\x25\x33\xa9\x86\x98\x0e\x6c\x4d\x14\x03\x3b\x0c\xfd\xdc\x11\
+\x78\x2c\xce\x82\x57\x94\xa5\xc0\x17\x80\x0f\x12\x6f\x0f\x34\xd9\
+\xa1\xc0\xb7\x89\x81\xca\xfd\xb8\x1b\x38\x92\x78\x34\x20\xb5\xde\
+\x4c\xe0\xfd\xc4\xf3\xe0\xec\x69\x4e\x9b\x1c\x4b\x89\x69\x5a\xbf\
+\x04\xbc\x02\xd8\x95\xe5\xcf\xcd\x55\x9c\x99\x44\x17\xef\x9b\x81\
+\x6f\x11\x3d\x27\x03\xe4\x7f\xfe\x4d\x8e\x3b\x88\x41\xbe\x53\x7b\
+\xf8\x1c\xea\xe4\x6d\xc0\x32\x8a\x6b\x8f\x25\xc0\xcb\x2b\xdd\x03\
+\x29\xc1\x61\xc4\x60\x98\xec\x13\x50\x13\xe3\x36\xe0\x47\xc0\x5b\
+\x81\x7d\x70\x3e\x84\x4c\x6b\x03\x4f\x23\x06\xab\xfe\x94\xe8\x61\
+\xc9\xfe\x7e\x34\x31\xce\x25\xbe\xcb\x4d\xf2\x6f\x94\x53\x00\x3e\
+\x04\x3c\xa3\xc2\xfd\x90\x2a\xb3\x2d\xf0\x0b\xf2\x4f\x38\x4d\x8a\
+\xab\x89\x79\xd7\x5f\x0e\x6c\xd7\x73\x8b\xab\x6a\xdb\x01\xaf\x05\
+\x7e\x40\x4c\x97\x9b\xfd\xfd\x69\x4a\x0c\x00\xdf\x21\x06\x6b\xd6\
+\xdd\xe3\x29\xb7\xe7\x72\x1e\x31\x26\x45\x6a\x85\x99\xc0\x7f\x13\
+\xa3\xc8\xb3\x4f\x34\x75\x8f\x3b\x81\xef\x13\x5d\xa3\x5b\x4e\xa2\
+\xad\x55\x1f\x53\x81\x5d\x88\xde\x9a\x93\x81\xfb\xc8\xff\x7e\xd5\
+\x3d\x16\x10\x3d\x2a\x75\x1d\x88\x39\x95\x18\xb5\x5f\x76\x3b\xfc\
+\xa1\xaa\x1d\x92\xca\x74\x20\x70\x15\xf9\x27\x96\xba\xc6\x43\xc0\
+\x9f\x80\x77\x00\xbb\xd3\xdc\xe7\xa1\x1a\xdf\x2a\xc0\xde\xc4\x88\
+\xef\xbf\x53\xec\xf3\xe3\xb6\xc5\x85\xc0\x9e\x93\x6b\xe6\x52\xbd\
+\x88\xea\xda\xe0\xe0\x8a\xf6\x49\x2a\xdc\xfa\xc0\xf1\xe4\x9f\x48\
+\xea\x18\x77\x13\xdd\x9d\xff\x46\x4c\x12\xa2\x6e\xda\x88\xe8\xe9\
+\x39\x19\x07\xc3\x8e\x16\x0f\x01\x9f\x66\xfc\x77\xea\xab\x32\x85\
+\x98\xd8\xa8\xaa\xfd\x3f\xb3\x9a\xdd\x92\x8a\x33\x05\x78\x09\x3e\
+\xff\x5c\x31\x6e\x04\x3e\x03\x3c\x19\x98\x36\xe9\xd6\x55\x5b\xad\
+\x4e\xbc\x47\xfe\x35\x62\x74\x7c\xf6\xf7\xb5\x4e\x71\x0d\xd1\x93\
+\x98\x6d\x37\xaa\xdf\xf7\x2d\xab\xd8\x31\xa9\x08\x5b\x02\xa7\x90\
+\x7f\xc2\xa8\x4b\x5c\x4f\x4c\x6e\xf4\x04\x9c\xe3\x40\x13\x37\x8d\
+\x18\x15\xff\x49\xe0\x66\xf2\xbf\xc7\x75\x89\x6f\x90\xdb\x63\xf6\
+\x01\xaa\xdf\xe7\x37\x57\xb1\x63\x52\x3f\xa6\x10\x73\xf7\xcf\x27\
+\xff\x24\x91\x1d\xb7\x13\x4b\xa2\xee\x85\x17\x7d\xf5\x6f\x1a\x31\
+\xaf\xfc\xd7\x71\x10\xe1\x20\xf1\x1a\xec\x73\xfb\x6a\xd1\xc9\xfb\
+\xeb\x04\x73\x2c\x32\x4e\xaa\x64\xcf\xa4\x49\xda\x9c\x98\xde\x33\
+\xfb\xc4\x90\x19\x0b\x88\xc9\x61\x9e\x81\xb3\xc5\xa9\x3c\x33\x81\
+\xe7\x11\x17\x85\x25\xe4\x7f\xef\x33\xe3\x67\xc0\xdc\xfe\x9a\xb3\
+\x67\x19\x8f\x66\x2e\xaf\x64\xcf\xa4\x49\x78\x39\xdd\xbd\x2b\x19\
+\x20\x46\xef\xbf\x98\xfa\x0c\x52\x52\x77\xac\x07\xbc\x0e\x38\x8d\
+\xee\xce\x48\x78\x37\xf0\x9c\x7e\x1b\x72\x82\xa6\x90\xf3\xd6\xc6\
+\xdd\x55\xec\x9c\xd4\x8b\x0d\xe9\xee\x84\x3e\xb7\xe1\x6a\x85\xaa\
+\x97\xed\x89\x01\xa6\xf7\x92\x7f\x7c\x64\xc4\x57\x89\xe5\xa2\xcb\
+\xb4\x5a\xd2\xbe\x3d\x50\xf2\x7e\x49\x3d\x39\x84\x78\xce\x9d\x7d\
+\xd0\x57\x19\x03\xc0\xaf\x89\x51\xda\x75\x9d\xa0\x44\x5a\x9d\xe8\
+\x95\x3b\x8b\xfc\x63\xa6\xea\xb8\x92\x72\xe7\x0d\xb0\x00\x50\xa7\
+\xad\x46\x0c\x6e\xeb\x52\x77\xe3\x7d\xc0\x71\xc4\x72\xb1\x52\x93\
+\xec\x4e\x7c\x77\x17\x90\x7f\x1c\x55\x15\x4b\x89\x91\xfa\x65\xbc\
+\x66\x6b\x01\xa0\xce\xda\x05\xb8\x84\xfc\x03\xbc\xaa\xb8\x98\x98\
+\xcf\xbd\xec\x6e\x45\xa9\x6c\x6b\x03\x6f\x21\x96\x87\xce\x3e\xae\
+\xaa\x8a\x3f\x03\x5b\x14\xd1\x78\x23\x58\x00\xa8\x93\xde\x44\x77\
+\xe6\xf0\xff\x1d\xf0\x74\x7c\x7d\x4f\xed\x33\x15\x38\x9c\x18\x34\
+\x98\x7d\x9c\x55\x11\xf3\x88\x99\x36\x8b\x62\x01\xa0\x4e\x99\x0d\
+\xfc\x90\xfc\x03\xb9\xec\x58\x0a\x7c\x9b\x98\xe5\x4b\xea\x82\x7d\
+\x89\xe9\x87\xbb\xf0\x38\xef\x04\x8a\xe9\xc9\xb3\x00\x50\x67\xec\
+\x46\xfb\x17\xf0\x59\x48\x8c\x9c\xde\xa2\xa0\x36\x93\x9a\xe6\xb1\
+\xc0\x37\x69\xff\x9c\x02\x97\xd0\xff\x52\xda\x16\x00\xea\x84\xa3\
+\x88\x8b\x63\xf6\x41\x5b\x56\x2c\x20\x06\x33\x6e\x52\x54\x83\x49\
+\x0d\xb7\x11\x31\x78\x6e\x1e\xf9\xc7\x67\x59\x31\x1f\x38\xb2\x8f\
+\x36\xb2\x00\x50\xab\xad\x41\x74\x85\x67\x1f\xa8\x65\xc5\x3c\xe0\
+\xc3\xc0\xba\x45\x35\x98\xd4\x32\xeb\x00\x1f\xa5\xbd\x6f\x0e\x0c\
+\x00\xc7\x30\xb9\xb7\x04\x2c\x00\xd4\x5a\x5b\x13\xeb\x6f\x67\x1f\
+\xa0\x65\xc4\x7c\xe0\x43\xc4\x68\x68\x49\xe3\xdb\x90\xe8\x25\x6b\
+\xeb\xe0\xdf\x53\x89\xe5\xca\x7b\x61\x01\xa0\x56\x3a\x08\xb8\x87\
+\xfc\x83\xb2\xe8\x58\x4c\xbc\x07\xbd\x51\x71\x4d\x25\x75\xca\x66\
+\xc4\x31\xb4\x94\xfc\xe3\xb9\xe8\xb8\x89\x58\xa5\x73\xa2\x2c\x00\
+\xd4\x2a\x53\x80\x77\x00\x0f\x91\x7f\x30\x16\x19\x4b\x80\xe3\x81\
+\xad\x8a\x6b\x2a\xa9\xd3\xb6\x24\x0a\x81\xb6\x9d\x2b\x96\x12\xe7\
+\xc0\x89\xb0\x00\x50\x6b\xac\x49\x3b\x5f\xf1\xfb\x31\xce\xd1\x2f\
+\x95\x65\x67\x62\x25\xc2\xec\xe3\xbc\xe8\xf8\x06\x71\x81\x1f\x8b\
+\x05\x80\x5a\x61\x2e\x70\x0e\xf9\x07\x5d\x91\x71\x36\xf0\xe4\x22\
+\x1b\x49\xd2\x4a\x3d\x19\x38\x9f\xfc\xe3\xbe\xc8\x38\x9d\x18\xfb\
+\xb0\x32\x16\x00\x6a\xbc\xbd\x80\x5b\xc9\x3f\xd8\x8a\x8a\x1b\x81\
+\x57\x11\xb3\x9c\x49\xaa\xce\x54\xe2\x95\xe1\x3b\xc8\x3f\x0f\x14\
+\x15\xd7\x00\x3b\xac\x64\x7f\x2d\x00\xd4\x68\xcf\x03\x16\x91\x7f\
+\x90\x15\x11\x8b\x80\xf7\x03\x33\x0b\x6d\x21\x49\xbd\x5a\x07\xf8\
+\x3c\xed\x19\x28\x78\x0f\xf0\x94\x51\xf6\xd3\x02\x40\x8d\x34\x3c\
+\xd8\x6f\x19\xf9\x07\x57\x11\x71\x32\x0e\xf0\x93\xea\x66\x3b\xe0\
+\x57\xe4\x9f\x1f\x8a\x88\xa5\xc0\x6b\x56\xd8\x3f\x0b\x00\x35\xce\
+\xaa\xc0\xb7\xc8\x3f\xa0\x8a\x88\x2b\x80\x67\x14\xdb\x3c\x92\x0a\
+\x76\x04\xd1\x95\x9e\x7d\xbe\x28\x22\xfe\x9b\xe5\x0b\x83\x59\x00\
+\xa8\x51\x66\x11\x13\x5e\x64\x1f\x44\xfd\xc6\x83\xc0\xfb\x80\x19\
+\xc5\x36\x8f\xa4\x92\xcc\x24\x66\x14\x6c\xc3\x63\x81\xef\x12\x17\
+\x7f\x0b\x00\x35\xc6\xc6\xc0\xb9\xe4\x1f\x3c\xfd\xc6\x9f\x59\xf9\
+\xa0\x1c\x49\xf5\xb6\x33\x70\x26\xf9\xe7\x91\x7e\xe3\xef\xc0\xe6\
+\x49\xdb\xb6\x00\x50\x4f\xb6\x07\xae\x23\xff\xa0\xe9\x27\xee\x06\
+\x5e\xc6\xf2\xee\x37\x49\xcd\xb4\x0a\xf0\x9f\x34\x7f\x00\xf2\xb5\
+\x49\xdb\xb5\x00\xd0\x84\x3d\x11\xb8\x8b\xfc\x83\xa5\x9f\xf8\x1e\
+\x63\xbf\x8f\x2b\xa9\x79\xb6\xa1\x1d\x8f\x24\x2d\x00\x54\x4b\x87\
+\xd0\xec\x2a\xfb\x0e\xe0\x39\x85\xb7\x8a\xa4\xba\x98\x02\xbc\x1c\
+\xb8\x97\xfc\xf3\x4d\x53\xc2\x02\x40\xe3\x7a\x2e\x31\x07\x7e\xf6\
+\x97\x75\xb2\xf1\x43\x60\x83\xc2\x5b\x45\x52\x1d\x6d\x0c\xfc\x84\
+\xfc\xf3\x4e\x13\xc2\x02\x40\x63\x7a\x11\xcd\x1d\x6d\x7b\x2f\x31\
+\x93\x9f\xa4\xee\x39\x0a\xb8\x9f\xfc\xf3\x50\x9d\xc3\x02\x40\x2b\
+\xf5\x7a\x9a\x3b\xc1\xcf\x29\xc4\xba\x04\x92\xba\x6b\x2b\xe0\x34\
+\xf2\xcf\x47\x75\x0d\x0b\x00\x8d\xea\x1d\xe4\x7f\x39\x27\x13\x0f\
+\x0e\xe5\xee\xfc\xfd\x92\x20\xde\x14\xf8\x00\xed\x5b\x6e\xd8\x02\
+\x40\xa5\xf8\x28\xf9\x5f\xcc\xc9\xc4\x25\xc0\x2e\x25\xb4\x87\xa4\
+\xe6\xdb\x0f\xb8\x9e\xfc\xf3\x54\x9d\xc2\x02\x40\x0f\x73\x0c\xf9\
+\x5f\xca\xc9\xc4\x17\x71\xf1\x1e\x49\x63\x5b\x9b\x98\x7d\x2f\xfb\
+\x7c\x55\x97\xb0\x00\xd0\x3f\x7d\x8c\xfc\x2f\x64\xaf\x71\x1f\xf1\
+\x96\x82\x24\x4d\xd4\x8b\x71\x80\xa0\x05\x80\xfe\xe9\xff\x91\xff\
+\x65\xec\x35\x2e\x01\x76\x2c\xa3\x31\x24\xb5\xde\x76\xc4\x39\x24\
+\xfb\x3c\x66\x01\xa0\x54\x4d\xbc\xf8\x1f\x0f\xac\x5e\x46\x63\x48\
+\xea\x8c\xb5\x80\x13\xc9\x3f\x9f\x59\x00\x28\x45\xd3\x06\xfc\x2d\
+\x22\xde\xef\x95\xa4\x22\x4c\x21\xde\x1c\xea\xe2\x5b\x02\x16\x00\
+\x1d\xf6\x6e\xf2\xbf\x80\xbd\xc4\x8d\xc0\xe3\x4b\x69\x09\x49\x5d\
+\xb7\x1f\x70\x2b\xf9\xe7\x39\x0b\x00\x95\xee\xf5\xe4\x7f\xf9\x7a\
+\x89\x3f\xe1\x22\x3e\x92\xca\x35\x17\xf8\x1b\xf9\xe7\x3b\x0b\x00\
+\x95\xe6\xa5\xc0\x00\xf9\x5f\xbe\x89\xc6\x27\x89\xc9\x3c\x24\xa9\
+\x6c\xab\x12\xaf\x15\x67\x9f\xf7\x2c\x00\x54\xb8\x23\x69\xce\xb3\
+\xae\x07\x89\xb5\x08\x24\xa9\x6a\xaf\xa5\xb9\xeb\xa0\x58\x00\xe8\
+\x11\x9e\x0e\x2c\x26\xff\x4b\x37\x91\xb8\x03\x78\x52\x39\xcd\x20\
+\x49\x13\x72\x10\x30\x9f\xfc\xf3\xa1\x05\x80\xfa\xb2\x07\xcd\x99\
+\xf8\xe2\x0a\xe0\xd1\xe5\x34\x83\x24\xf5\xe4\xb1\xc0\x75\xe4\x9f\
+\x17\x2d\x00\x34\x29\x5b\x03\xb7\x91\xff\x65\x9b\x48\xfc\x96\x98\
+\xae\x53\x92\xea\x62\x63\xe0\x2c\xf2\xcf\x8f\x16\x00\xea\xc9\x86\
+\xc0\x55\xe4\x7f\xd1\x26\x12\xc7\xe1\x60\x3f\x49\xf5\xb4\x06\xf0\
+\x53\xf2\xcf\x93\x16\x00\x9a\x90\xb5\x80\x73\xc8\xff\x92\x4d\x24\
+\x8e\x29\xa9\x0d\x24\xa9\x28\x53\x88\xa5\x85\xb3\xcf\x97\x16\x00\
+\x13\xd0\xe5\xbb\xc9\xe9\xc0\x0f\x81\xc7\x65\x27\x32\x8e\x87\x80\
+\xd7\x00\x5f\xcd\x4e\x44\x52\x2b\x4c\x07\xb6\x02\x36\x25\xa6\x0b\
+\x2f\x7a\x95\xd0\x4b\x80\x53\x80\x03\x0a\xfe\xbd\x52\x61\xbe\x44\
+\x7e\x75\x39\x5e\x2c\x04\x9e\x59\x56\x03\x48\xea\x8c\x75\x80\x7f\
+\x27\xba\xe8\x17\x92\x7f\x6e\x6b\x4a\xb4\xba\x07\xa0\xab\xfe\x83\
+\xfc\x2f\xd6\x78\x71\x37\xb0\x77\x59\x0d\x20\xa9\x13\xd6\x00\xde\
+\x43\x2c\x0b\x9e\x7d\x4e\x6b\x62\x58\x00\xb4\xcc\x61\xc0\x32\xf2\
+\xbf\x58\x63\xc5\xad\xc0\x4e\x65\x35\x80\xa4\x4e\xd8\x0f\xb8\x99\
+\xfc\xf3\x59\x93\xc3\x02\xa0\x45\x76\xa5\xfe\xef\xfa\x5f\x8f\xef\
+\xf8\x4b\xea\xcf\x2b\x68\xce\xa4\x66\x75\x0e\x0b\x80\x96\xd8\x84\
+\x58\x2d\x2f\xfb\x0b\x35\x56\x5c\x0e\x6c\x5e\x56\x03\x48\xea\x84\
+\xa6\x2d\x64\x56\xe7\xb0\x00\x68\x81\xe9\xc0\xdf\xc9\xff\x32\x8d\
+\x15\x17\xe2\x6a\x7e\x92\xfa\x73\x00\xed\x9f\x9f\xdf\x02\x40\x3d\
+\xf9\x08\xf9\x5f\xa4\xb1\xe2\x7c\x60\xbd\xd2\xf6\x5e\x52\x17\xac\
+\x4f\x0c\x1e\xce\x3e\x9f\xb5\x29\x2c\x00\x1a\x6e\x5b\xea\xfd\x2c\
+\xcc\x8b\xbf\xa4\x22\x7c\x96\xfc\xf3\x59\xdb\xc2\x02\xa0\xe1\x3e\
+\x47\xfe\x97\x68\x65\x71\x1e\xb0\x6e\x79\xbb\x2e\xa9\x23\xb6\xa2\
+\xde\x37\x3a\x4d\x8d\x56\x17\x00\x53\xb3\x13\x28\xd9\xea\xc0\x8b\
+\xb2\x93\x58\x89\xf3\x89\xe7\x75\x77\x67\x27\x22\xa9\xf1\x5e\x0a\
+\xac\x9a\x9d\x84\x9a\xa5\xed\x05\xc0\xb3\x80\x39\xd9\x49\x8c\xe2\
+\x62\xbc\xf8\x4b\x2a\xce\xe1\xd9\x09\xa8\x79\xda\x5e\x00\xec\x99\
+\x9d\xc0\x28\xae\x02\x0e\xc4\x8b\xbf\xa4\x62\x6c\x0e\xec\x92\x9d\
+\x84\x9a\xa7\xed\x05\xc0\xee\xd9\x09\xac\xe0\x26\xe2\xe2\x7f\x5b\
+\x76\x22\x92\x5a\x63\xd7\xec\x04\xd4\x4c\x6d\x2f\x00\xb6\xce\x4e\
+\x60\x84\xdb\x81\xa7\x02\xd7\x25\xe7\x21\xa9\x5d\x36\xcb\x4e\x40\
+\xcd\xd4\xf6\x02\x60\x4a\x76\x02\x43\xee\x05\x9e\x06\x5c\x91\x9d\
+\x88\xa4\xd6\x59\x33\x3b\x81\x16\x1b\xcc\x4e\xa0\x4c\x6d\x2f\x00\
+\xea\xe0\x41\x62\x80\xce\x85\xd9\x89\x48\x6a\xa5\x25\xd9\x09\xb4\
+\xd8\x82\xec\x04\xca\xd4\xf6\x02\xe0\xae\xe4\xed\x2f\x03\x5e\x08\
+\xfc\x25\x39\x0f\x49\xed\x75\x67\x76\x02\x2d\xd6\xea\xb6\x6d\x7b\
+\x01\x70\x7e\xf2\xf6\xdf\x08\xfc\x38\x39\x07\x49\xed\x76\x79\x76\
+\x02\x2d\xf6\x8f\xec\x04\xca\xd4\xf6\x02\xe0\xdc\xc4\x6d\xff\x37\
+\x70\x6c\xe2\xf6\x25\x75\xc3\xb9\xe4\xf7\x76\xb6\xd5\x69\xd9\x09\
+\x68\xf2\xb6\x01\x06\xa8\x7e\xfa\xc8\xaf\x53\x9f\x01\x88\x92\xda\
+\xef\x1b\xe4\x4f\x9b\xdb\xc6\xd8\xb6\x87\xcf\x40\x35\xf4\x3b\xaa\
+\xfd\xc2\xfc\x11\xa7\xe4\x94\x54\xad\x83\xc9\xbf\x58\xb6\x2d\xfe\
+\xd4\xd3\x27\xa0\x5a\x7a\x16\xd5\x7d\x61\xae\xc0\xc5\x7d\x24\x55\
+\x6f\x0a\xf0\x37\xf2\x2f\x9a\x6d\x8a\x67\xf6\xf4\x09\xa8\xb6\x7e\
+\x41\xf9\x5f\x96\x7b\x80\xed\xaa\xda\x21\x49\x5a\xc1\xbe\xe4\x5f\
+\x34\xdb\x12\xa7\xf4\xd8\xf6\xaa\xb1\x4d\x81\xfb\x28\xef\xcb\xb2\
+\x04\xd8\xbf\xb2\xbd\x91\xa4\xd1\x7d\x9e\xfc\x8b\x67\xd3\xe3\x3e\
+\x60\xcb\x1e\xdb\x5d\x35\xf7\x6c\xe0\x21\x8a\xff\xb2\x0c\x00\x2f\
+\xa9\x70\x3f\x24\x69\x65\x56\xa1\xfa\x71\x4f\x6d\x8a\x87\x80\x43\
+\x7a\x6e\x75\x35\xc2\x4b\x80\xa5\x14\xf7\x65\x59\x06\xbc\xae\xd2\
+\x3d\x90\xa4\xb1\xcd\x21\x26\x1f\xcb\xbe\x98\x36\x2d\x96\x12\x13\
+\xb7\xa9\xc5\x9e\x0e\xdc\x41\xff\x5f\x96\x3b\x88\x01\x86\x92\x54\
+\x37\xab\x02\x5f\x21\xff\xa2\xda\x94\xb8\x99\x58\xa9\x55\x1d\xb0\
+\x31\xf0\x1d\x26\x3f\x47\xc0\x77\x81\xf5\x2b\xcf\x5a\x92\x7a\x73\
+\x24\xf1\x76\x52\xf6\x05\xb6\xae\xb1\x8c\x98\x43\x61\xce\x24\xdb\
+\x57\x0d\xb6\x3d\xf0\x19\x62\xb5\xbe\xf1\xbe\x28\xf7\x01\x5f\xc4\
+\xb5\xb7\x25\x35\xcb\x74\xe0\x35\xc0\x5f\x89\x0b\x5e\xf6\x45\xb7\
+\x0e\x71\x0f\x71\x3e\xdf\xa6\x8f\x76\x6d\x3c\x67\xab\x0b\xab\x11\
+\x17\xf6\xc7\x01\x3b\x12\x07\x0c\xc4\x80\x90\xcb\x88\xa9\x36\xcf\
+\x03\x16\xa5\x64\x27\x49\xc5\xd8\x10\x38\x08\x78\x0c\x30\x97\xe5\
+\xe7\xba\xb6\x5b\x4a\x2c\xec\x73\x23\x31\x3e\xe2\x1c\xa2\x18\x92\
+\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\
+\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\
+\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\
+\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\
+\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\
+\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\
+\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\
+\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\
+\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\
+\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\
+\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\
+\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\
+\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\
+\x49\x92\xa4\x36\x9b\xd2\xe3\xdf\x5f\x07\x78\x3c\xb0\x0d\xb0\x66\
+\xf1\xe9\x8c\xeb\x21\xe0\x7e\x60\x3e\xb0\x08\xb8\x01\xb8\x12\x58\
+\x98\x90\x4b\xd3\x64\x7f\x76\xfd\x7a\x08\xb8\x11\xb8\x08\xb8\x34\
+\x39\x97\xa6\x98\x0e\x6c\x06\x6c\x0a\x6c\x01\x6c\x0e\xcc\x02\xd6\
+\x06\x66\x00\xab\x0f\xfd\xbd\x25\xc4\x31\xf4\x20\xf0\x00\x70\x27\
+\x70\xdd\x88\xb8\xbb\xba\x94\x1b\x6d\x33\x60\x77\x60\x4b\xa2\x7d\
+\x9b\x66\x31\x70\x2d\x70\x36\x70\x73\x72\x2e\x93\xb5\x26\xb0\x17\
+\x71\x9e\x5b\x3b\x39\x97\x2a\x2d\x00\xae\x02\xce\x04\xee\x2d\xf2\
+\x17\xaf\x05\xbc\x11\x38\x05\x58\x0a\x0c\xd6\x30\x6e\x04\x7e\x0f\
+\x7c\x1a\x38\x9c\xb8\xd8\x69\xf9\x67\x77\x2a\xf5\xfd\xec\x26\x13\
+\x57\x01\x9f\x04\x76\x2e\xae\xa9\x1a\x6f\x15\x60\x6f\xe2\xf3\xfe\
+\x2a\x70\x0e\x71\x42\x2f\xa2\xbd\xef\x03\xfe\x4a\xb4\xf9\x91\xc4\
+\x85\x4e\x61\x33\xe0\xfd\xc0\xb9\xe4\x1f\x17\x45\xc5\x00\x70\x16\
+\xf0\x1e\x60\x6e\x71\x4d\x55\x9a\x19\xc0\xcb\x80\x9f\x13\x05\x6c\
+\x76\xfb\x65\xc6\x52\xe2\x5a\xfd\x06\xfa\xbc\xd1\x9b\x3e\xf4\x4b\
+\x6e\xaf\xc1\x4e\xf5\x1a\xcb\x80\xf3\x81\x8f\xd1\xcd\x8b\xc4\x74\
+\xe0\x55\xc0\x6d\xe4\x7f\x16\x65\xc6\x00\x70\x22\xf0\xa8\x62\x9a\
+\xad\x71\xb6\x05\xde\x04\xfc\x8c\xb8\x48\x57\xd9\xf6\x37\x03\x5f\
+\x07\x0e\x03\x66\x96\xbd\xa3\x35\x34\x07\x38\x86\xe8\x89\xcc\x3e\
+\x0e\xca\x8c\x85\x43\xfb\x59\xc7\xbb\xe9\x29\x44\x41\x7a\x35\xf9\
+\xed\x54\xc7\xb8\x0b\x78\x07\x93\xe8\x8d\xda\x8c\x76\x55\xb4\x17\
+\x01\xef\xa2\x19\xd5\x6c\xbf\x36\x07\xce\x23\xbf\xcd\xab\x8c\x45\
+\xc0\x0b\x8a\x68\xbc\x06\xd8\x1c\x78\x37\x51\xe0\x66\xb7\xfb\x70\
+\x2c\x00\x7e\x40\x7c\x06\x5d\x28\x06\x9e\x48\xfb\x8b\xeb\x15\xe3\
+\x26\xe2\x11\x62\x5d\xac\x43\xdc\xe9\x66\xb7\x4b\x13\xe2\x6c\xe2\
+\x31\xe0\x84\xec\x0d\xdc\x5a\x83\xa4\xcb\x88\xc5\xc4\x5d\xcb\x8e\
+\x13\x6d\x8c\x86\xe9\xe2\x89\x69\x38\x06\x80\x8f\xd0\xfb\xb8\x96\
+\xa6\x38\x10\xf8\x29\x31\x16\x22\xbb\xad\xc7\x8a\xbb\x81\xff\x01\
+\xb6\x2e\xa7\x19\xd2\x1d\x45\x8c\x95\xc8\x6e\xe7\x8c\x58\x04\xfc\
+\x5b\xff\x4d\xd8\xb7\xed\x89\xb1\x5f\xd9\xed\xd1\xa4\xb8\x85\x18\
+\x1b\x31\xa6\x1d\xa9\xbe\x2b\x31\x23\x96\x11\xdd\xa6\x6d\x7a\x3c\
+\xb0\x03\x30\x8f\xfc\xb6\xcd\x8e\x0f\xf6\xdb\x90\x35\x32\x05\x38\
+\x94\x18\xd8\x93\xdd\xae\x93\x39\xc6\x7e\x01\x1c\x54\x78\xab\xe4\
+\x39\x82\xd8\xaf\xec\xb6\xcd\xfe\x5c\x0f\xeb\xb7\x21\xfb\xb0\x11\
+\x31\xe6\x2b\xbb\x1d\x9a\x18\xf3\x81\xc7\xac\xac\x61\xd7\xa1\x7b\
+\x55\xd5\x32\xe0\x78\x60\xfd\x95\x35\x4a\x43\x74\xf1\xb3\x5b\x59\
+\x0c\x00\xcf\xef\xaf\x39\x6b\x61\x77\xe0\x34\xf2\xdb\xb3\x88\xf8\
+\x2b\xb0\x4f\xb1\xcd\x53\xb9\x5d\x89\x47\x1d\xd9\x6d\x59\x87\x98\
+\x0f\xec\xd4\x5f\x73\x4e\xca\x6a\xc0\xe9\x93\xc8\xd7\x58\x1e\xd7\
+\x00\xeb\x8d\xd6\xb8\xdf\xa9\x41\x72\x59\x71\x17\xf0\x4a\x9a\xdb\
+\x7d\xfc\x3d\xf2\xdb\xb0\x4e\x71\x3f\x71\xa7\xd0\x44\xb3\x81\xe3\
+\x68\xe7\x9d\xe6\xc9\xe4\x5c\x38\xfa\xb5\x0a\x70\x19\xf9\xed\x57\
+\xa7\xb8\x00\x98\xd6\x4f\xa3\x4e\xc2\x31\x05\xe5\xde\xf5\x38\x61\
+\xc5\x86\xdd\x95\x76\x9e\x70\x7a\x8d\xdf\xd0\xbc\x0b\xc7\x1e\xc4\
+\x5d\x6f\x76\xdb\xd5\x2d\xbe\xd8\x4f\xa3\x26\x39\x90\x98\xdb\x22\
+\xbb\xed\xca\x8c\x65\x44\x81\x33\xbb\xa0\x36\xab\xc2\x6b\xc9\x6f\
+\xb7\x3a\xc6\x4b\xfb\x68\xd3\x5e\xcd\x25\xde\x48\xc8\xde\xe7\x36\
+\xc4\x00\xd1\xc3\xf8\x4f\xbf\xa9\x41\x52\x75\x89\x9b\x81\xa7\xd2\
+\x1c\x7e\x76\xa3\xc7\x12\x9a\xf3\x7a\xe0\x34\xe0\x03\x74\xab\x08\
+\xbf\x05\x78\x56\x01\x6d\x57\xb6\xd5\x68\xef\xa0\xe8\x7e\xe3\x06\
+\xe2\x95\xe3\x2a\x7c\xa9\xa2\x7d\xea\x4a\xfc\x72\xb8\x61\x37\xa2\
+\x5b\x27\x9e\x89\xc4\x32\xe0\xad\xd4\xdf\x86\xf8\xd9\x8d\x15\xef\
+\x9e\x7c\xd3\x56\x66\x1d\xe0\xb7\xe4\xb7\x55\x56\x7c\x93\x7a\x4f\
+\xdc\x75\x28\xf9\x6d\x54\xe7\x38\x60\xf2\x4d\x3b\x61\xd3\x89\xd9\
+\xed\xb2\xf7\xb5\x4d\xb1\x0c\xd8\x68\x2a\x31\xa2\x73\xea\xc4\x3f\
+\x8b\x4e\x98\x0a\x7c\x0a\xf8\x2c\xf5\x6e\x9b\xc3\xa9\x77\x7e\xd9\
+\x0e\xcf\x4e\x60\x1c\x9b\x01\x7f\x26\xba\xfe\xbb\xea\x28\x62\x9e\
+\x8e\x27\x65\x27\xb2\x12\x75\xff\x0e\x65\xab\xa2\x7d\xf6\xa7\x9e\
+\x13\x11\x35\xd9\x54\xe0\x90\xa9\xc0\x33\xb2\x33\xa9\xb1\x37\x11\
+\x13\x9c\xd4\x75\x5e\x6f\x3f\xbb\xb1\x3d\x9e\xfa\xbe\xe1\xf1\x68\
+\x62\x94\xff\x4a\x5f\xcb\xe9\x90\x4d\x88\xa9\xbc\x5f\x93\x9d\xc8\
+\x28\x3c\xc6\xc6\x76\x70\x05\xdb\xf0\x33\x28\xc7\xc1\x53\xf1\x04\
+\x34\x9e\x23\x80\xef\x13\x23\x81\xeb\xc6\xcf\x6e\x6c\x53\xa8\xe7\
+\xa4\x4f\x9b\x13\x63\x37\x9c\x53\x7f\xb9\x55\x81\x63\x89\x11\xca\
+\x75\x99\x4d\x70\x0e\x51\x9c\x68\xe5\xb6\x62\xf9\xa2\x52\x65\xf1\
+\x3c\x57\x8e\xc7\x4c\x05\x36\xce\xce\xa2\x01\x0e\x07\xbe\x41\xfd\
+\xba\xdb\xfd\xec\xc6\x57\xb7\x36\xda\x10\xf8\x03\xb1\x62\x9c\x1e\
+\xe9\x45\x44\xfb\xcc\xc9\x4e\x84\xfa\x7d\x77\xea\x68\x0a\xe5\xbf\
+\x39\xe5\xe7\x50\x8e\x8d\xa7\x52\x7e\xf5\xd6\x16\x2f\x04\x3e\x9f\
+\x9d\xc4\x0a\xfc\xec\xc6\x57\xa7\x36\x5a\x0d\xf8\x09\xcd\x79\x3b\
+\x21\xcb\x5e\xc0\x57\xb2\x93\xa0\x5e\xdf\x9d\x3a\x2b\xbb\x9d\xea\
+\xd2\x23\xd4\x36\x6b\x4c\xa5\x7e\x77\xb5\x75\xf6\x3a\x62\x95\xbd\
+\xba\xf0\xb3\x1b\xdf\xa2\xec\x04\x46\x38\x0e\x78\x42\x76\x12\x0d\
+\x71\x04\xf0\xe2\xe4\x1c\x3c\xbe\x26\xa6\xec\x63\xec\x81\x92\x7f\
+\x7f\x57\x2d\xf4\x0b\xde\xbb\xcf\x51\xaf\x55\xb1\x34\xb6\x5b\xb2\
+\x13\x18\x72\xd4\x50\x68\xe2\x8e\xc1\xbb\xbf\xba\x1b\x24\x16\x20\
+\x2b\x53\xd9\xbf\xbf\xab\x6e\xb5\x00\xe8\xdd\x0c\xe2\xcd\x80\x75\
+\xb3\x13\xd1\xb8\x06\x81\x7f\x64\x27\x41\x74\xf9\xff\x6f\x76\x12\
+\x0d\xb4\x09\xf5\xea\x71\xd3\x23\x5d\x43\xf9\x3d\x00\x17\x97\xfc\
+\xfb\xbb\xea\x62\x0b\x80\xc9\xd9\x02\xf8\x4c\x76\x12\x1a\xd7\x19\
+\xc4\x3a\x0f\xd9\x3e\x0f\xac\x95\x9d\x44\x43\xd5\xf1\xd5\x40\x2d\
+\xf7\x8b\x0a\xb6\xf1\xcb\xf1\xff\x8a\x26\xe1\x97\x16\x00\x93\xf7\
+\x22\xe0\x90\xec\x24\x34\xa6\x9f\x65\x27\x00\x3c\x8f\x6a\xde\x95\
+\x6e\xab\xed\x81\x5d\xb2\x93\xd0\x4a\x55\x71\x8c\xfd\x81\x58\xea\
+\x5c\xc5\x19\x00\x7e\x61\x01\xd0\x9f\x2f\x00\x6b\x64\x27\xa1\x51\
+\x2d\x05\x4e\x4c\xce\x61\x55\xe0\x63\xc9\x39\xb4\xc1\xd3\xb3\x13\
+\xd0\xa8\x6e\x00\xfe\x52\xc1\x76\xea\x70\x2c\xb7\xcd\x6f\x80\xdb\
+\x2d\x00\xfa\xb3\x05\xf0\x8e\xec\x24\x34\xaa\xe3\x88\xe7\x93\x99\
+\x5e\x49\x7c\x47\xd4\x9f\xc7\x65\x27\xa0\x51\xbd\x97\xb8\x38\x57\
+\xe1\x83\xd4\xeb\x8d\x9e\x26\x1b\x00\xde\x33\xfc\x0f\xd9\x8b\x12\
+\x34\x3d\xee\x27\x6f\xba\xd9\xec\x7d\xaf\x6b\xcc\x07\x36\xe8\xa3\
+\x5d\x8b\x30\x1d\xb8\x89\xfc\xb6\x68\x43\x5c\xd8\x63\xdb\x17\x65\
+\xcf\x1e\x72\xec\x5a\x9c\x4f\xf5\xaf\x49\x7e\xb4\xa0\xdc\xbb\x1e\
+\xc7\x0f\x37\xa8\x3d\x00\xfd\x5b\x13\x78\x73\x76\x12\xfa\xa7\x41\
+\xe2\xce\xfb\x8e\xe4\x3c\x9e\x4b\xac\x61\xae\xfe\x39\x80\xb2\x5e\
+\xee\x27\xc6\x40\x0d\x54\xbc\xdd\x0f\x02\xa7\x57\xbc\xcd\xb6\xb9\
+\x16\x78\xdb\xf0\x3f\x58\x00\x14\xe3\xcd\xd4\x77\xd1\x99\xae\xf9\
+\x10\xb1\x76\x43\xb6\x37\x64\x27\xd0\x22\xce\x05\x50\x1f\x03\xc4\
+\xac\xa8\x19\xaf\xe6\x3d\x08\x3c\x9b\xe8\x59\x53\xef\xee\x27\x96\
+\xb7\xfe\xe7\x9b\x51\x16\x00\xc5\x58\x13\xf8\xf7\xec\x24\x3a\x6e\
+\x10\xf8\x7f\xc4\x5d\x42\xb6\xed\x80\xbd\xb3\x93\x68\x91\x3a\xbc\
+\xca\xa9\x98\x91\xef\x85\xc0\xc9\x89\x39\xdc\x46\x2c\x9f\x7d\x65\
+\x62\x0e\x4d\x74\x2b\xd1\x6e\x97\x8c\xfc\x97\x16\x00\xc5\x79\x39\
+\xb1\x30\x86\xaa\xb7\x08\x78\x01\x31\xb0\x65\x30\x39\x17\x88\xee\
+\x7f\x15\xe7\xe6\xec\x04\xc4\x4d\xc0\x7e\xc0\xf7\xb2\x13\x01\x2e\
+\x23\x0a\xec\x53\xb2\x13\x69\x88\xb3\x88\xd9\x6b\xcf\x58\xf1\x3f\
+\x58\x00\x14\xe7\xd1\xc4\x22\x26\xaa\xce\x00\x31\x2b\xe3\x63\xa9\
+\xc7\x89\x69\xd8\x11\xd9\x09\xb4\xcc\x39\xd9\x09\x74\xd8\x22\xe2\
+\x55\xd6\xc7\x02\x67\x27\xe7\x32\xd2\x3d\xc0\xd3\x88\x62\xfb\xea\
+\xe4\x5c\xea\xea\x2e\xe0\x9d\xc0\x3e\x8c\x51\x44\x67\x8f\x48\x6c\
+\x53\x1c\xb7\xb2\x46\x2e\x49\xf6\xfe\x66\xc5\x15\xc0\x27\x80\x9d\
+\xfa\x6f\xc2\xc2\x6d\x40\x14\x26\xd9\x6d\xd4\xa6\x78\x4a\x4f\x9f\
+\x40\x71\xba\xfa\x16\xc0\x00\x70\x26\xf0\x6e\x9a\xb1\x14\xef\xaa\
+\xc4\x23\xd8\x93\x88\x82\x25\xbb\xfd\x32\x63\x09\xf0\x5b\x62\xe1\
+\xba\x35\xc7\x6b\xb8\x29\x43\xff\x53\x86\xcf\xd1\xfb\x2a\x4f\x73\
+\x88\xb5\xa7\x77\x02\xb6\x2a\x3c\xa3\xfe\xdd\x46\xcc\x5f\x5e\x55\
+\x9b\x66\x7d\x76\x55\x4f\x6e\xb3\x88\x18\xc0\x72\x23\x70\x11\x70\
+\x79\xc5\xdb\xef\xc5\xf3\xa8\x57\x6f\xc4\xb0\x85\x44\xd7\xe9\xd5\
+\xc0\x9d\xc0\x82\xa1\x7f\x3f\x1b\xd8\x74\x28\xe6\x52\xbf\xc1\xac\
+\x37\x11\x6b\x29\x54\xf5\xbe\xf9\x48\x7b\x32\x4a\xb7\x69\x05\x6e\
+\x65\xc4\xab\x5a\x15\x99\x4f\x1c\x63\xd7\x02\xe7\x52\x9f\x45\xb4\
+\x7a\xb5\x06\xf1\xb9\x6d\x4d\xac\xd7\x32\x9b\xde\x7b\xba\x9f\x0a\
+\xec\x51\x70\x5e\x13\x71\x2a\x93\xeb\x65\xb9\x17\xb8\x8f\x38\xb6\
+\xcf\xa2\xc7\x59\x13\xb3\x2a\x95\x7e\x4f\x34\xdb\x01\xff\x49\x5c\
+\x14\xb2\xab\xae\x91\x51\xe5\x5d\x69\xd6\x3e\x6a\xe5\x3e\x43\xfe\
+\x77\x70\x38\x2e\x22\xba\x00\xf7\x00\xa6\x4d\x30\xff\xcd\x89\x57\
+\xbc\x8e\x23\x4e\x28\xd9\xfb\x70\xf4\x04\xf3\x2e\x43\x56\x0f\x40\
+\x46\xd1\xa1\xe5\x3e\x4d\xce\xe7\xfe\x96\x2a\x76\x6e\x45\x59\x07\
+\x76\x51\x77\x1a\x33\x88\xee\x8e\xfb\x12\xf7\x65\x64\xfc\xf3\x1d\
+\xcb\x0a\x64\xed\xa3\x56\xee\xf7\xe4\x7f\x07\xff\x0a\x3c\xa9\x80\
+\x7d\x99\x02\x3c\x81\x58\xc9\xf0\xce\x84\xfd\xb8\x9e\x09\x74\x63\
+\x96\xc8\x02\xa0\x9b\x3a\x53\x00\x64\x0e\x02\x2c\x6a\xc4\xfc\x62\
+\xe0\x8b\xc0\x6e\x44\xf7\x47\xb6\xa7\x66\x27\xa0\x54\x3b\x27\x6e\
+\x7b\x19\x71\xc7\xbf\x2f\x70\x5a\x01\xbf\x6f\x10\xf8\x3b\x31\xa7\
+\xc1\x66\xc0\xab\xa9\xee\xf1\xcb\x32\xe0\x65\x2c\x7f\x54\x21\xa9\
+\x60\x6d\x7a\x0b\xe0\x1a\x62\xb4\xe3\x6f\x93\xf3\xd8\x3d\x79\xfb\
+\xca\x33\x8b\x78\xee\x98\xe5\x0d\xc4\xf8\x8c\x32\x7a\x69\x1e\x04\
+\xbe\x04\xec\x48\x8c\x73\xb8\xaa\x84\x6d\x0c\x1b\x04\xde\x4a\x3c\
+\x13\x95\x54\x92\x36\xf4\x00\x8c\xb4\x04\x78\x0e\xb9\xaf\x0d\x6d\
+\x08\xac\x93\xb8\x7d\xe5\xd9\x34\x71\xdb\x3f\x00\xfe\xaf\x82\xed\
+\x0c\x10\x2b\xb3\x3d\x86\xb8\x48\xcf\x2f\xf8\xf7\x3f\x44\xdc\xf9\
+\x7f\xbe\xe0\xdf\x2b\x69\x05\x6d\xea\x01\x18\x76\x3f\x31\x5b\xd5\
+\xe2\xc4\x1c\xb6\x4b\xdc\xb6\xf2\x6c\x94\xb8\xed\xf7\x57\xbc\xbd\
+\x25\xc4\x80\xc7\xc7\x00\xbf\x28\xe8\x77\xde\x04\x1c\x06\x7c\xa3\
+\xa0\xdf\x27\x69\x0c\x99\x05\x40\x99\xdb\xbe\x9c\x18\xc8\x91\x65\
+\x87\xc4\x6d\x2b\xcf\xea\x49\xdb\xbd\x0a\xb8\x34\x69\xdb\x37\x11\
+\xf3\x8b\xbf\x81\xc9\x4f\xd9\xbb\x14\xf8\x1f\xe2\xb8\xf9\x55\x41\
+\x79\x49\x1a\x47\x1b\x7b\x00\x86\x7d\x9e\x18\x48\x94\xc1\x55\xe0\
+\xba\x29\x6b\xd1\x9a\x7f\x24\x6d\x77\xd8\x20\xf0\x05\x60\x0b\xe0\
+\x15\xc4\x14\xad\x13\xe9\x81\xbb\x90\x78\x8c\xb0\x29\xf1\x4a\xaf\
+\x03\xfe\xa4\x0a\xad\x92\xb8\xed\xb2\xe7\xcd\xbf\x05\xf8\x33\x39\
+\xb3\x88\xcd\x4a\xd8\xa6\xf2\x55\xbd\x3c\xea\xb0\xd5\x92\xb6\xbb\
+\xa2\x45\xc0\x57\x87\x62\x3a\x71\x47\xbf\x1b\x0f\x7f\x34\xb2\x80\
+\x58\x90\xe4\x42\x62\x3a\x57\x49\x49\x32\x0b\x80\x2a\xfc\x9d\x9c\
+\x02\xc0\xf5\xcb\xbb\xe9\xc1\xa4\xed\xee\x4e\xcc\x87\x91\x39\xee\
+\x65\x45\x4b\x89\x8b\xfc\x85\xd9\x89\x48\x1a\x5d\xdb\xde\x02\x58\
+\xd1\x0d\x15\x6c\x63\x34\x16\x00\xdd\x94\xd5\x85\xbd\x2e\xf0\xca\
+\xa4\x6d\x4b\x6a\xa8\xb6\x17\x00\xf7\x55\xb0\x8d\xd1\xd4\xa5\x4b\
+\x56\xd5\xca\x9c\x3f\xfd\x93\xc4\x14\xbe\x6d\xef\xd5\x93\x54\x90\
+\x36\x0f\x02\x84\x98\xbd\x2c\xc3\xa2\xa4\xed\x2a\x57\x66\x01\xb0\
+\x2a\x70\x02\x70\x1d\xf0\x1e\x62\x3e\x0a\x49\x5a\xa9\xb6\xf7\x00\
+\x6c\x5d\xc1\x36\x46\x63\x01\xd0\x4d\x0b\x89\xd7\xe2\x32\xcd\x05\
+\x3e\x4c\x3c\xfe\x3a\x11\x38\x20\x37\x1d\x49\x75\xd5\xe6\x02\x60\
+\x1a\x31\xa9\x48\x86\xfb\x93\xb6\xab\x7c\x17\x65\x27\x30\x64\x55\
+\xe0\x48\xe0\x77\xc4\xcc\x98\xaf\x22\x6f\x9e\x02\x49\x35\xd4\xe6\
+\x02\xe0\xa9\xc0\xc6\x25\x6f\x63\x65\xb2\xef\x02\x95\xe7\xdc\xec\
+\x04\x46\xf1\x38\x62\x79\xdf\xeb\x81\x63\x80\x2d\x53\xb3\x91\x54\
+\x0b\x6d\x1d\x03\x30\x0d\xf8\x68\xe2\xf6\xaf\x4f\xdc\xb6\x72\xfd\
+\x29\x3b\x81\x31\xac\x07\xbc\x83\x98\x39\xf0\xa7\xc0\x81\x54\xf3\
+\x28\x4e\x52\x0d\xb5\xb5\x07\xe0\xcd\xc4\x5d\x4f\x96\xeb\x12\xb7\
+\xad\x5c\xa7\x51\xaf\xf7\xf1\x47\x33\x0d\x38\x9c\x58\x39\xf3\x72\
+\xe0\xed\xc0\x06\xa9\x19\x49\xaa\x5c\x1b\x7b\x00\x0e\x25\xba\x39\
+\xb3\x2c\x05\x2e\x4b\xdc\xbe\x72\x2d\x22\xa6\xc2\x6d\x8a\x6d\x89\
+\x25\x84\x6f\x24\x06\x0d\x1e\x4a\x14\x08\x92\x5a\xae\x6d\x3d\x00\
+\xcf\x24\x4e\x62\xd3\x4b\xf8\xdd\x13\x75\x31\xf0\x40\xe2\xf6\x95\
+\xef\x47\xd9\x09\x4c\xc2\xf0\xa0\xc1\x93\x88\x5e\x81\x77\x92\xbb\
+\xba\xa1\xa4\x92\xb5\xa5\x00\x58\x95\x58\x4d\xec\x24\xf2\x27\xe1\
+\x39\x3b\x79\xfb\xca\xf7\x43\x9a\xfd\x26\xc8\xd6\xc4\x18\x9a\x9b\
+\x89\xb7\x08\x8e\x24\x8e\x31\x49\x2d\xd2\xf4\x47\x00\xd3\x81\xa3\
+\x88\xbb\xee\xff\xa0\x1e\x03\x9a\xfe\x90\x9d\x40\x05\x06\x2b\x88\
+\x65\xc4\xf2\xb2\xe7\x02\x5f\x21\xba\xa6\xb3\x56\xdb\xeb\xd5\xfd\
+\xc0\xf7\xb2\x93\x28\xc0\x54\x62\x1e\x81\x13\x81\xdb\x88\x37\x09\
+\x32\xc7\xd6\x74\xc5\x9e\x54\x73\x8c\x2d\x06\x6e\x07\xfe\x06\x7c\
+\x1c\xd8\x87\xe6\x5f\x13\xd4\xa3\x2a\xbe\x68\xa3\xc5\x36\x93\xc8\
+\x75\x0e\xb1\xc2\xd8\xf3\x80\xaf\x01\xb7\x26\xe6\x3f\x5a\x3c\x44\
+\xcc\xcb\x5e\x95\xec\xfd\xad\x3a\x16\x00\x9f\x03\xd6\x2f\xa2\xf1\
+\x4a\xb6\x13\xb1\x3a\x60\x76\x9b\x95\x11\xe7\x00\x6f\x24\x8e\xc7\
+\x36\xab\xea\x42\x5c\xa7\xb8\x0d\x38\x9a\xfc\x9e\xd4\x4c\x9f\x26\
+\xa7\xed\xdf\x52\xc5\xce\xad\x28\xeb\x8b\x36\x8f\x58\x0e\x74\xa2\
+\xf1\x40\x62\xae\x13\x8d\xd3\x7a\x6c\xfb\x7e\x65\xef\x6f\x56\xdc\
+\x47\x8c\x5c\xaf\x43\x8f\xcf\x58\x7e\x42\x7e\x5b\x95\x19\x0f\xd2\
+\xee\xd9\x06\xbb\x58\x00\x0c\xc7\xf5\xc0\xb3\xfa\x6f\xc2\x46\xb2\
+\x00\x30\x1a\xf1\x01\x66\xef\x6f\x76\xfc\x1c\x98\xd5\x77\x2b\x96\
+\x67\x17\xe2\x51\x46\x76\x3b\x55\x11\x67\x03\xaf\x20\x96\x25\x6e\
+\x8b\x2e\x17\x00\x83\x44\x0f\xd6\x31\x74\xef\xb1\x40\x67\x0a\x80\
+\xae\x7d\xb0\x65\x5a\x02\x7c\x3b\x3b\x89\x8e\x39\x04\xf8\x23\x30\
+\x3b\x39\x8f\x95\xb9\x00\xf8\x6a\x76\x12\x15\xd9\x1d\xf8\x32\x71\
+\xe7\xf8\x0e\xba\xdd\x85\xdc\x16\x53\x88\xcf\xf2\x9b\xd4\xbf\xb7\
+\x4d\x93\x60\x01\x50\x9c\x5f\x00\x77\x66\x27\xd1\x41\xbb\x01\xdf\
+\xa7\xbe\xef\xae\xff\x17\xf1\x08\xab\x2b\x36\x24\xee\x1a\xaf\x04\
+\x5e\x47\xbb\x7a\x04\xba\xea\x45\xc0\xfb\xb2\x93\x50\xf1\x2c\x00\
+\x8a\xf3\xb9\xec\x04\x3a\xec\xe9\xc4\x0a\x78\x75\x74\x27\xf0\xca\
+\xec\x24\x12\x6c\x0a\x7c\x01\xb8\x04\x38\x38\x39\x17\xf5\xef\xfd\
+\xe4\x2d\xae\xa6\x92\x58\x00\x14\xe3\x4c\xa2\x2b\x5a\x79\x8e\x26\
+\x66\xb5\xab\xa3\x1f\x03\xdf\xcd\x4e\x22\xc9\xd6\x44\xef\xd8\x8f\
+\x80\xcd\x92\x73\xd1\xe4\x4d\x01\x3e\x8b\x3d\x3a\xad\x62\x01\x50\
+\x8c\xcc\x85\x87\x14\xa6\x53\xdf\x5e\x00\x88\xe5\x78\x2f\xc9\x4e\
+\x22\xd1\x11\xc0\xa5\xc0\x1b\xf0\x79\x72\x53\x6d\x09\xbc\x36\x3b\
+\x09\x15\xc7\x02\xa0\x7f\xa7\x03\x3f\xcb\x4e\x42\x00\x3c\x97\xfa\
+\x2e\x75\xbb\x00\x78\x36\x70\x77\x76\x22\x89\xd6\x00\x3e\x4f\x1c\
+\x2f\xeb\x25\xe7\xa2\xc9\x39\x1a\x0b\xb8\xd6\xb0\x00\xe8\xcf\x20\
+\x71\x40\x0c\x66\x27\x22\x20\x4e\x4c\x87\x67\x27\x31\x86\x2b\x89\
+\x37\x17\x16\x64\x27\x92\xec\x50\xe2\x0d\x89\xfd\xb3\x13\x51\xcf\
+\xe6\x02\x8f\xcf\x4e\x42\xc5\xb0\x00\xe8\xcf\xb7\xa9\x7e\xf2\x1f\
+\x8d\xad\xce\x05\x00\xc0\x19\x44\x4f\xc0\xa2\xec\x44\x92\x6d\x02\
+\xfc\x06\x78\x4d\x76\x22\xea\x59\xdd\x8f\x31\x4d\x90\x05\xc0\xe4\
+\xdd\x49\xac\x3f\xa0\x7a\xd9\x9b\xfa\x7f\xaf\x4f\x01\x9e\x42\xb7\
+\x5e\x0f\x1c\xcd\x2a\xc0\xb1\xc4\xe0\xb2\xba\x7f\x66\x5a\xee\x89\
+\xd9\x09\xa8\x18\x1e\x74\x93\xf7\x5a\xe0\x8e\xec\x24\xf4\x08\x33\
+\x89\xbb\xcb\xba\x3b\x93\x28\x02\xae\x4b\xce\xa3\x0e\xde\x44\xbc\
+\x25\x91\xb9\x8c\xb7\x26\x6e\x32\xeb\xb8\xa8\x86\x2c\x00\x26\xe7\
+\x2b\x34\x73\xcd\xf7\xae\x58\x3b\x3b\x81\x09\xba\x90\x78\x9e\xfa\
+\x87\xec\x44\x6a\xe0\xb9\xc0\xb7\xa8\xef\x84\x4e\x5a\xae\x29\xc7\
+\x97\xc6\x61\x01\xd0\xbb\xf3\x88\x3b\x16\xa9\x08\x77\x01\x4f\x25\
+\xe6\x01\x5f\x92\x9c\x4b\xb6\xe7\x12\xab\x7c\x7a\x5e\x92\x2a\xe0\
+\x81\xd6\x9b\xdb\x89\x01\x30\x0f\x64\x27\xa2\x31\xdd\x9b\x9d\x40\
+\x8f\x06\x89\xe7\xe0\x7b\x02\xbf\x4b\xce\x25\xdb\x51\xc4\x62\x2c\
+\xaa\xaf\x79\xd9\x09\xa8\x18\x16\x00\x13\x37\x9f\x98\xd2\xf4\xc6\
+\xec\x44\x34\xa6\x07\x80\x5b\xb3\x93\x98\xa4\x0b\x80\xa7\x01\x07\
+\x12\x23\xe4\xbb\xfa\x7a\xe9\x9b\x80\x97\x66\x27\xa1\x95\xba\x2a\
+\x3b\x01\x15\xc3\x02\x60\x62\x16\x13\x6b\x63\x9f\x9b\x9d\x88\xc6\
+\xf5\x37\x62\x19\xd3\x26\x3b\x05\x38\x08\x78\x34\xf0\x31\xba\x79\
+\xc7\x75\x2c\xbe\x6f\x5e\x57\xbe\xfa\xdc\x12\x16\x00\xe3\x5b\x44\
+\x74\xfb\x3b\x50\xab\x19\xda\x34\x2b\xe3\x55\xc0\x3b\x89\xd9\x0d\
+\xff\x03\xb8\x26\x35\x9b\x6a\xad\x06\xfc\x00\x98\x95\x9d\x88\x1e\
+\xa1\x4d\xc7\x58\xa7\x59\x00\x8c\xed\x3e\x62\xa5\xb9\xdf\x64\x27\
+\xa2\x09\x19\x04\x4e\xca\x4e\xa2\x04\xf7\x01\x9f\x22\x16\x3b\x7a\
+\x16\x70\x2a\xdd\x78\x3c\xb0\x05\xf0\xf1\xec\x24\xf4\x30\x37\x03\
+\x67\x67\x27\xa1\x62\x58\x00\xac\xdc\x75\xc0\x7e\xc0\x5f\x93\xf3\
+\xd0\xc4\x7d\x0f\xb8\x3e\x3b\x89\x12\x0d\x10\x77\x5f\x07\x00\xdb\
+\x11\x8f\x07\xda\x3e\x99\xd0\xab\x88\x31\x11\xaa\x87\x8f\xd3\x8d\
+\xe2\xb3\x13\x2c\x00\x46\x77\x1a\x31\xa3\xdc\x85\xd9\x89\x68\xc2\
+\x96\x00\xef\xcd\x4e\xa2\x42\x57\x12\x8f\x07\x36\x27\x2e\x92\xe7\
+\xe5\xa6\x53\x9a\x29\xc0\x17\x70\x92\xa0\x3a\xb8\x16\x38\x2e\x3b\
+\x09\x15\xc7\x02\xe0\xe1\x96\x11\x4b\xfb\x3e\x85\x78\xe5\x4f\xcd\
+\xf1\x71\xe0\xea\xec\x24\x12\x2c\x04\xbe\x0c\x3c\x0e\xd8\x03\xf8\
+\x12\xed\x3d\xbd\xbd\x92\x00\x00\x1d\x6f\x49\x44\x41\x54\x5b\x67\
+\x60\x5b\xe0\xe5\xd9\x49\x74\xdc\x20\xf0\x66\x62\x40\xb4\x5a\x64\
+\xd0\x60\x90\xb8\x78\x3c\xa9\xcf\xb6\xac\x5a\x76\x9b\xd5\x25\x7e\
+\x8d\x33\xc8\x8d\xb4\x1e\x31\x68\xf0\x52\xf2\x3f\x9b\xa2\xe2\x66\
+\x62\x9a\xe7\x2a\xed\x59\x50\xee\x6d\x88\xf7\xf5\xd9\x96\x4d\xf2\
+\x69\x72\xda\xf8\x2d\x55\xec\xdc\x48\xf6\x00\xc0\x52\xe0\x73\xc0\
+\x2e\xf8\x7a\x4b\x13\x9d\x4b\xcc\x20\xb7\x2c\x3b\x91\x1a\xb9\x0b\
+\xf8\x24\xb0\x03\x31\x8e\xe5\x78\x9a\x3f\x79\xd5\x26\xc0\xab\xb3\
+\x93\xe8\xa8\x6f\x01\x1f\xce\x4e\x42\xc5\xeb\x72\x01\x30\x48\x8c\
+\x18\x7f\x0c\xd1\xb5\xd5\xf5\x35\xda\x9b\xe8\x87\xc4\x05\x6e\x7e\
+\x76\x22\x35\xf6\x17\xe0\x25\xc0\x46\xc4\x05\xb4\xc9\x73\x59\xbc\
+\x81\x6e\x9f\xb3\xaa\x36\x48\x0c\x34\x7d\xc9\xd0\x9f\xd5\x32\x5d\
+\x3d\x98\x4e\x01\xf6\x22\xde\xef\xbf\x32\x39\x17\xf5\xee\x3e\xe0\
+\x68\xe2\xce\x7f\x61\x72\x2e\x4d\x31\x9f\x18\x1f\xb0\x3b\x31\x56\
+\xe0\x73\x34\xef\x0d\x82\xad\x89\x75\x13\x54\xbe\xeb\x88\x57\x4e\
+\xdf\x49\xf3\x27\xd6\xd2\x18\xb2\x9f\x2d\x55\x15\xf3\x89\x11\xac\
+\x3b\x17\xd3\x6c\xb5\x90\xdd\xa6\x55\xc7\xfd\xc0\x67\x88\x67\xdc\
+\xea\xdf\x9a\xc4\x94\xbb\x7f\x24\x4e\xf2\xd9\x9f\xef\x44\xe2\xc4\
+\x12\xda\x61\x65\xba\x38\x06\xe0\x16\xe0\x6d\xc0\x8c\x02\xda\xaf\
+\xa9\x3a\x33\x06\x60\x95\xaa\x37\x98\x64\x80\x98\xd0\xe7\xef\xd9\
+\x89\x68\xc2\x96\x11\x8b\xfa\x5c\x0f\x9c\x43\x3c\xae\x39\x15\x78\
+\x30\x33\xa9\x96\x59\x00\x7c\x63\x28\x1e\x45\x2c\xc4\xf3\x12\x62\
+\xe6\xc1\xba\x3a\x98\x98\x25\xd0\xef\x41\xff\x16\x13\xd3\x4c\x5f\
+\x45\x8c\x7f\xfa\x29\x70\x06\xde\xf1\x77\x4a\x76\xc5\x59\x55\xdc\
+\x04\x6c\x56\x50\x9b\xd5\x45\x56\x5b\xaa\xbd\xa6\x12\x13\x0d\x9d\
+\x08\x3c\x44\xfe\x71\x3b\x5a\x1c\x52\xda\xde\x3f\x5c\x56\x0f\xc0\
+\x19\x55\xec\x9c\x56\xaa\x33\x3d\x00\x5d\x1a\x03\x30\x17\xf8\x25\
+\xb0\x76\x76\x22\x52\x8d\x0d\x10\x63\x64\x9e\x4b\xbc\x45\xf0\x75\
+\xa2\x10\xa8\x93\x43\xb3\x13\x90\xda\xa0\x4b\x05\x00\xc0\x63\x81\
+\x1f\x03\xab\x66\x27\x22\x35\xc0\x95\xc0\xcb\x88\xe3\xe6\x97\xc9\
+\xb9\x8c\xd4\xb4\xf9\x3a\xa4\x5a\xea\x5a\x01\x00\x31\xcb\xdf\xd7\
+\x89\x29\x46\x25\x8d\xef\x72\xa2\xdb\xfd\x05\xc4\x1c\x03\xd9\x76\
+\x20\x06\x30\x4a\xea\x43\x17\x0b\x00\x88\x13\xd9\x07\xb2\x93\x90\
+\x1a\xe6\xbb\xc4\x2b\x84\x17\x24\xe7\x31\x8d\x78\x9d\x51\x52\x1f\
+\xba\x5a\x00\x40\x4c\x6d\xf9\xda\xec\x24\xa4\x86\xb9\x1e\xd8\x07\
+\xf8\x43\x72\x1e\xdb\x26\x6f\x5f\x6a\xbc\xae\xbc\x06\xb8\x32\x9f\
+\x27\xe6\x18\x6f\xe3\x1a\xf2\xaa\x87\xf5\x80\x7d\x89\x8b\xe6\x66\
+\xc0\xea\xc4\x3b\xd6\x37\x11\xcf\xd8\x2f\x06\x7e\x47\xb3\xa6\xea\
+\x5d\x00\x3c\x07\x38\x9d\xbc\x0b\xf1\xe6\x49\xdb\x95\x5a\xa3\xeb\
+\x05\xc0\x34\xa2\x5b\x73\x7f\x7c\xf5\x46\xc5\x3a\x00\x78\xfb\xd0\
+\xcf\xf1\xc6\x9b\xcc\x07\x7e\x42\x2c\x7b\x7b\x56\xc9\x79\x15\xe5\
+\x1e\xa2\x08\x38\x97\x9c\x85\x98\x2c\x00\xa4\x3e\x75\xf9\x11\xc0\
+\xb0\xd5\x89\x93\xef\x96\xc9\x79\xa8\x1d\x76\x07\xce\x24\xee\xea\
+\x0f\x64\x62\x83\x4d\x67\x11\x13\xf0\x9c\x0e\x7c\x15\xd8\xa0\xb4\
+\xec\x8a\x75\x21\x71\xec\x64\x98\x93\xb4\x5d\xa9\x35\x2c\x00\xc2\
+\xc6\xc4\x6b\x4e\xeb\x64\x27\xa2\x46\x7b\x33\x71\x11\x7f\xfc\x24\
+\xff\xff\xa9\xc4\x6b\x77\x97\x11\x33\x57\x36\x41\xd6\xe3\xb3\xd5\
+\x92\xb6\x2b\xb5\x86\x05\xc0\x72\x3b\x10\x53\x61\x7a\x62\xd1\x64\
+\x7c\x92\x58\xa7\xa0\x88\xc7\x6a\x73\x80\x5f\x00\x2f\x2a\xe0\x77\
+\x95\xed\xe6\xa4\xed\xce\x4c\xda\xae\xd4\x1a\x16\x00\x0f\xb7\x2f\
+\xb1\x76\xba\xed\xa2\x5e\x7c\x80\x58\x40\xa5\x48\xd3\x88\x39\xfa\
+\x8f\x2a\xf8\xf7\x16\x6d\xdd\xa4\xed\x2e\x4d\xda\xae\xd4\x1a\x5e\
+\xe8\x1e\xe9\x48\x62\x0d\x6c\x69\x22\x9e\x4e\xbc\x52\x5a\x86\x69\
+\xc4\xa4\x55\x2f\x2b\xe9\xf7\x17\xe1\xa0\xa4\xed\xde\x9f\xb4\x5d\
+\xa9\x35\x32\x0b\x80\x3a\x5f\x64\x8f\x26\x9e\xe7\x4a\x63\x99\x41\
+\xbc\x4a\x5a\xe6\xac\x92\x53\x81\xaf\x00\x6f\x2d\x71\x1b\x93\xb5\
+\x36\xb1\x66\x7c\x06\x0b\x00\xa9\x4f\x99\x05\xc0\xbb\x88\xee\xf6\
+\xba\xfa\x14\x70\x44\x76\x12\xaa\xb5\xb7\x52\xcd\x7b\xf0\x53\x88\
+\xef\xe3\x77\xa9\xd7\x14\xb8\x1f\x24\x6f\xe0\xec\x2d\x49\xdb\x95\
+\x5a\x23\xb3\x00\x18\x04\x5e\x41\xac\x3c\x56\x47\x53\x81\x6f\xe1\
+\xc2\x23\x1a\xdd\x34\xaa\xef\x25\x7a\x3e\x31\x5f\x45\x1d\xa6\xc1\
+\x3d\x04\x78\x5d\xe2\xf6\xaf\x49\xdc\xb6\xd4\x0a\xd9\x63\x00\x96\
+\x02\xff\x4a\xbc\x4f\x5c\x47\x33\x81\x9f\x01\xdb\x65\x27\xa2\xda\
+\xd9\x1f\xd8\x28\x61\xbb\x3b\x12\x45\xc0\xe7\x81\xd9\x09\xdb\x07\
+\xd8\x0b\xf8\x3e\xb9\x13\x89\x59\x00\x48\x7d\xca\x2e\x00\x20\x66\
+\x41\x3b\x18\xb8\x31\x3b\x91\x95\x58\x17\xf8\x15\xb0\x61\x76\x22\
+\xaa\x95\xe7\x26\x6e\x7b\x1a\xf0\x06\x62\xbe\x80\x37\x13\x93\x59\
+\x55\xe5\xf9\xc0\xef\x81\x35\x2a\xdc\xe6\x8a\x06\x89\x19\x08\x25\
+\xf5\xa1\x0e\x05\x00\xc4\xbb\xc4\x07\x03\xf3\xb2\x13\x59\x89\xad\
+\x80\x9f\x93\x7b\xd2\x53\xbd\xec\x9a\x9d\x00\xd1\x03\xf1\x19\xe0\
+\x3a\xe0\xbf\x80\xf5\x4b\xdc\xd6\xba\xc0\xb1\xc0\x77\xa8\xb6\xe0\
+\x18\xcd\x65\xc0\xdd\xc9\x39\x48\x8d\x57\x97\x02\x00\x62\x51\x94\
+\x23\x80\x25\xd9\x89\xac\xc4\x1e\xe4\x77\x7b\xaa\x3e\xea\xb4\x1a\
+\xdd\xfa\xc0\x7f\x13\x85\xf4\xc9\xc4\x5d\x7a\x51\x17\xe9\x39\xc4\
+\x5b\x31\x57\x02\xaf\xa1\xdc\x37\x1e\x26\xea\xb4\xec\x04\xa4\x36\
+\xa8\x53\x01\x00\xb1\xc4\xe8\xbf\x13\x5d\x7c\x75\x74\x08\xf0\xc5\
+\xec\x24\x94\x6e\x6d\xf2\x9e\xbf\x8f\x65\x3a\xf0\x4c\xe2\x6d\x81\
+\x7b\x80\x3f\x11\x93\x14\xed\x4f\x6f\xbd\x03\x1b\x12\xaf\xf7\x7d\
+\x9b\x18\x6d\xff\x09\xea\x35\xf7\xfe\x9f\xb3\x13\x90\xda\xa0\x8e\
+\x77\xb3\xdf\x01\xb6\x21\x5e\x31\xaa\xa3\x57\x12\x03\x90\x8e\xc9\
+\x4e\x24\xd1\x3b\x12\xb6\xf9\x10\x31\x4e\xe4\x22\xe0\xd2\x84\xed\
+\x8f\x54\xd7\x5e\xaa\x91\x66\x00\xfb\x0d\xc5\xb0\x7b\x89\x3b\xf9\
+\x1b\x88\xc7\x6d\x0b\x81\x07\x89\xc2\x61\xdd\xa1\xd8\x9e\x38\xfe\
+\xea\x6a\x09\xd1\xcb\xd1\x66\x1b\x93\x73\x8c\x2d\x06\xae\x05\xce\
+\x26\x6f\x8a\x67\x55\x6c\x30\x29\xc6\xf3\x85\xc4\xdc\xc6\x8b\x01\
+\xea\x31\x45\x6b\x76\x3b\x64\xc5\x55\xc4\xdc\xfb\x3b\xf7\xdf\x84\
+\x93\x32\x05\x58\x36\x4e\x8e\x46\x39\x51\xe5\xe2\x43\x7b\x96\xb8\
+\x1f\x75\x8e\x01\x62\x59\xea\xf7\x00\x73\xfb\x6e\xc5\xe6\xf9\x34\
+\x39\xed\xfe\x96\x2a\x76\x6e\xa4\xba\x3d\x02\x18\xe9\x4d\xe4\xad\
+\x34\x36\x9e\x29\xc4\xec\x6c\x07\x64\x27\xd2\x51\x5b\x13\x73\xef\
+\x9f\x0f\x9c\x08\x3c\xaa\xe2\xed\x0f\x02\x77\x56\xbc\x4d\x85\x1f\
+\x64\x27\xd0\x01\x53\x88\x31\x4f\x1f\x06\xae\x20\x7a\x3b\xd7\x4e\
+\xcd\x48\xa5\xa8\x73\x01\xb0\x0c\xf8\x37\xe2\x9d\xe7\x3a\x9a\x0e\
+\xfc\x08\xd8\x25\x3b\x91\x0e\x9b\x42\xac\xdd\x70\x31\xf0\x82\x8a\
+\xb7\xed\x40\xb4\xea\xdd\x0b\xfc\x38\x3b\x89\x8e\x59\x9d\x78\x1c\
+\x71\x31\x93\x5f\xe6\x5a\x35\x55\xe7\x02\x00\x60\x11\x70\x28\xd1\
+\xe5\x5b\x47\xb3\x88\x65\x5b\x37\xcb\x4e\xa4\xe3\x66\x12\xb3\x36\
+\x7e\x84\xea\x46\xa9\xff\xa5\xa2\xed\x68\xb9\x63\x89\x71\x0b\xaa\
+\xde\x5c\x62\x50\xe9\xbf\x65\x27\xa2\xe2\xd4\xbd\x00\x80\xe8\x6a\
+\x3d\x8c\x18\xd5\x5c\x47\x73\x89\x41\x49\x75\x9a\xa3\xbd\x8b\xa6\
+\x10\xeb\x4b\x7c\xa0\xa2\xed\xfd\x8c\xe8\xa5\x52\x35\x96\x10\xe3\
+\x82\x94\x67\xb8\xd0\x3e\x2c\x3b\x11\x15\xa3\x09\x05\x00\xc4\xa8\
+\xef\x67\x11\x23\x96\xeb\x68\x17\xe0\x6b\xd9\x49\x08\x80\xf7\x12\
+\xef\xc1\x97\xed\x5a\x7c\x1e\x5d\xa5\x13\x70\x01\xa0\x3a\x18\x5e\
+\x23\x65\xa7\xec\x44\xd4\xbf\xa6\x14\x00\x10\x5d\xae\x47\x11\x23\
+\x54\xeb\xe8\x48\xaa\x7f\x0e\xad\x47\x9a\x02\x7c\x99\x6a\xe6\xe9\
+\xff\x38\x31\x20\x50\xe5\x5a\x08\xbc\x2f\x3b\x09\xfd\xd3\x5a\x44\
+\x11\x30\x2d\x3b\x11\xf5\xa7\x49\x05\x00\xc4\x1d\x57\xc6\xfb\xb1\
+\x13\xf5\x09\xa2\x9b\x4c\xb9\xd6\xa4\x9a\x0b\xc6\x79\xc0\x97\x2a\
+\xd8\x4e\xd7\x1d\x83\x77\xff\x75\xb3\x33\xf0\xe2\xec\x24\xd4\x9f\
+\xa6\x15\x00\x00\xff\x43\xac\x84\x56\x47\x9b\x00\x2f\xcb\x4e\x42\
+\x40\x2c\x35\x5d\xc5\xeb\x81\x47\x13\x93\x13\xa9\x1c\x37\x00\x9f\
+\xca\x4e\x42\xa3\xfa\x10\xf1\x36\x94\x1a\xaa\x89\x05\x00\xc4\x84\
+\x09\x3f\xc9\x4e\x62\x25\x5e\x91\x9d\x80\x80\x38\x31\x55\x31\x16\
+\x60\x01\x70\x38\xce\x9c\x56\x86\x01\x62\x6a\xf0\x45\xd9\x89\x68\
+\x54\x9b\x01\x4f\xce\x4e\x42\x93\xd7\xd4\x02\x60\x00\x78\x21\xf5\
+\x7c\x17\x7b\x57\x72\xd6\x89\xd7\x23\x1d\x5e\xd1\x76\xae\x05\x9e\
+\x02\xdc\x56\xd1\xf6\xba\xe2\x53\xc4\xd2\xc3\xaa\xaf\xaa\x8e\x31\
+\x95\xa0\xa9\x05\x00\xc0\x03\xc4\x97\xef\xf2\xec\x44\x46\xb1\x77\
+\x76\x02\x02\x62\xe2\x92\x32\x97\xc8\x1d\xe9\x4a\xe0\x20\x5c\xa6\
+\xb6\x28\x17\x10\x53\xd1\xaa\xde\x0e\xce\x4e\x40\x93\xd7\xe4\x02\
+\x00\xe2\x64\x7b\x08\x70\x47\x76\x22\x2b\xd8\x33\x3b\x01\x01\xf1\
+\x46\xc0\x8e\x15\x6e\xef\x02\x60\x5f\xe0\xa6\x0a\xb7\xd9\x46\x77\
+\x03\xff\x4a\x2c\x4e\xa3\x7a\xdb\x8a\xe2\x96\x9e\x56\xc5\x9a\x5e\
+\x00\x00\x5c\x4d\x14\x01\x75\x9a\x21\xcc\x79\xb3\xeb\x63\xe3\x8a\
+\xb7\x77\x29\xb1\x02\xdf\xd5\x15\x6f\xb7\x2d\x16\x13\x13\xcd\xd8\
+\x7e\xcd\x30\x05\x1f\x79\x36\xd6\x54\x72\xde\xab\x2f\x7a\x9b\x67\
+\x13\xef\xe0\xd7\x65\x66\xb6\xaa\x5e\x05\xac\xeb\x9c\x08\x75\x92\
+\x71\x77\x72\x2d\xf1\x18\xc8\xe9\x82\x7b\x33\x40\xbc\x45\xf3\xb7\
+\xec\x44\x86\x78\x7c\x4d\x4c\xdb\x7a\x00\xb2\xe6\xf6\xa8\xfc\xfb\
+\x36\x95\x9c\x11\xb6\x0b\x4a\xf8\x9d\x27\x01\x6f\x2c\xe1\xf7\x4e\
+\x46\x55\xf3\xd1\x3b\x3a\x7a\x7c\x59\x6d\x74\x17\xb1\x5a\xe4\xd7\
+\x93\xb6\xdf\x34\x03\xc0\xcb\x81\xef\x64\x27\x32\x82\xc7\xd7\xc4\
+\xb4\xad\x9d\xb2\x7a\x93\xcb\xb8\x2e\x8e\x69\x2a\x39\x23\x97\x6f\
+\x2d\xe9\xf7\x1e\x4b\x4c\x1a\x92\xad\xaa\xc5\x8b\x1c\x75\x3e\xbe\
+\xcc\x09\x64\x96\x10\x77\xb4\x2f\xa1\x7d\x27\xc9\x22\x2d\x23\xda\
+\xe9\x1b\xc9\x79\xac\xc8\xc9\x87\xc6\x37\x48\xfb\xce\x43\x59\xfb\
+\x53\xf9\xf7\x6d\x2a\x39\x93\x98\x5c\x5c\xe2\xef\x7e\x37\xf9\x77\
+\x11\x97\x56\xb4\x1d\x27\xa0\x19\xdb\x20\xf0\x8f\xec\x24\x80\xe3\
+\x81\x27\x52\xcf\x37\x56\xb2\x3d\x40\xac\x30\xf7\xcd\xec\x44\x46\
+\x31\x0f\xe7\x77\x18\xcf\x35\xb4\xaf\xb8\x2d\xf3\xfa\x34\x96\x4b\
+\xaa\xde\xe0\x54\xe0\x57\x55\x6f\xb4\xe4\x6d\x0e\x12\x77\x13\x7f\
+\x28\x71\x1b\xe3\x6d\xff\xac\x8a\xb6\x95\xf1\xd9\x35\xc9\x19\x44\
+\x57\x7c\x1d\x5c\x00\xec\x06\x7c\x8c\xfa\x8c\x55\xc9\x76\x2b\xf0\
+\x2f\xd4\x7b\x51\xa5\x5f\x66\x27\x50\x73\xbf\xc8\x4e\xa0\x04\x7f\
+\x03\xee\xad\x78\x9b\x17\x02\x37\x56\xbc\x4d\x00\x36\x20\x4e\x48\
+\x83\x15\xc5\x32\x60\xc3\x0a\xf6\x6b\x16\x71\xd2\xad\x6a\xbf\x86\
+\xe3\x8f\x15\xec\xdb\xb0\xaa\x3f\xbb\xa6\xc5\x3b\x27\xdf\xb4\xa5\
+\xda\x07\xb8\x8c\xfc\xf6\xc9\x8c\xb3\x80\x4d\xfb\x6d\xc8\x0a\x1c\
+\x42\x7e\x5b\xd5\x39\xf6\x9f\x7c\xd3\xd6\xda\xb7\xa9\xb6\x1d\x3f\
+\x54\xcd\x6e\x8d\xee\xd7\x2b\x49\xaa\x8c\xa8\xb2\xa2\xde\x8c\xe8\
+\xc2\xab\xf2\x83\x7c\x79\x25\x7b\xb6\x5c\x95\x9f\x5d\x93\x62\x09\
+\xd5\xac\x05\x30\x59\xd3\x81\x37\x03\xf3\xc9\x6f\xab\x2a\x63\x19\
+\xf0\x59\x60\xd5\xfe\x9b\xb0\x12\xab\x11\xcf\x66\xb3\xdb\xad\x8e\
+\x71\x3d\xed\x5d\x0b\xe0\x20\xaa\x6b\xc7\x87\x80\x1d\xaa\xd9\xad\
+\xd1\xed\x42\x35\x77\x92\xcb\x80\xc7\x55\xb4\x4f\xc3\x1e\x4b\x74\
+\xe7\x54\xf1\x41\xde\x0c\xac\x51\xcd\x6e\xfd\x53\x55\x9f\x5d\xd3\
+\xa2\xae\x0b\x46\xad\x68\x2e\xf0\x35\xe2\x24\x90\xdd\x66\x65\xc7\
+\x55\xc4\x58\x88\xa6\x79\x35\xf9\x6d\x57\xc7\x38\xaa\x9f\x46\x6d\
+\x80\x53\xa9\xa6\x1d\xbf\x5a\xd5\x0e\x8d\xa5\x8a\x2e\x8f\x13\x2a\
+\xdb\x9b\x87\x3b\x90\xb8\x23\x2c\x7b\xff\x5e\x58\xd5\x0e\xad\xa0\
+\xea\xee\xaa\xba\xc7\x7c\xe2\xf1\x48\x93\x6c\x0f\x9c\x48\x3b\x8b\
+\xb9\x05\xc4\xb4\xbe\x4d\x5d\x2a\x7b\x15\x62\x60\x6f\x76\x3b\xd6\
+\x29\xce\xa7\x1d\x13\xc9\x8d\x65\x4f\xe2\xf5\xd4\x32\xdb\x71\x11\
+\x35\x79\x14\xb6\x0e\x31\x9f\x79\x59\x3b\x7a\x05\x30\xa7\xb2\xbd\
+\x79\xa4\x97\x50\xee\x87\x79\x62\x75\xbb\xf2\x08\x65\x7f\x76\x4d\
+\x8a\x01\xe0\x79\xfd\x35\x67\xaa\xed\x81\x2f\x03\x0f\x92\xdf\x96\
+\xfd\xc6\x32\xa2\x38\xad\xc5\x09\xae\x4f\xbb\x10\x85\x4c\x76\x9b\
+\xd6\x21\xe6\x13\x3d\xab\x5d\xf0\x3e\xca\x6d\xcb\x5a\x2d\x1f\xbf\
+\x03\xf1\xea\x4b\xd1\x3b\x39\x8f\xe4\x67\x1c\x43\xde\x45\x39\x1f\
+\xe2\xd9\x54\xdf\xf5\xbf\xa2\xed\x29\xe7\xb3\x6b\x5a\x7c\xa0\xcf\
+\x76\xac\x8b\x8d\x89\xbb\xe6\x6b\xc9\x6f\xd3\x5e\x63\x09\xf1\x5a\
+\x5f\x1d\x8e\xf9\x22\x3d\x9b\x76\xf6\xd0\xf4\x12\xcb\x80\x43\xfb\
+\x6d\xc8\x06\x99\x02\x7c\x97\x72\xda\xf2\x63\x15\xee\xc7\x84\xed\
+\x4d\xbc\x9e\x53\xd4\x4e\xde\x42\xbd\x56\xc7\x7b\x0f\xc5\xf6\x04\
+\x9c\x4e\xdc\x81\xd7\xc1\x13\x28\xf6\xb3\x6b\x52\x0c\x00\xff\x4d\
+\x75\xb3\x30\x56\x65\x2a\x31\x20\xe9\x5b\xd4\x7f\xc0\xe0\x1d\xc4\
+\x12\xbe\x5b\x94\xd2\x12\xf5\x70\x14\xed\xe8\x9d\x99\x4c\x2c\x02\
+\x9e\xdf\x7f\x13\x36\xce\x4c\x8a\x2f\x02\x3e\x09\x4c\xab\x72\x27\
+\x7a\xb1\x19\x70\x0e\xfd\xef\x64\x5d\x5f\xf5\x79\x1e\xfd\xdf\x2d\
+\x0f\x10\x27\xbb\x19\x15\xe7\x3e\x9e\xa2\x3e\xbb\x26\xc5\x42\xba\
+\x71\x62\x9a\x09\x3c\x87\x28\x06\xee\x20\xbf\xdd\x07\x89\xbb\xfd\
+\x93\x81\x23\x68\xce\xc8\xfe\x7e\x75\xb1\xd0\xbe\x11\xd8\xa3\x88\
+\xc6\x6b\xa8\x29\xc0\x7f\xd1\x7f\x0f\xd0\x03\xc0\x4b\xab\x4d\x7d\
+\x72\xa6\x03\xaf\x23\xa6\x45\xec\x75\x27\x6f\x03\x5e\x4b\xbd\x5f\
+\x11\x99\x4b\x54\x75\x93\xf9\x40\xcf\x22\x06\x16\xd6\xd5\x74\xe0\
+\x55\xb4\xff\x24\xb5\x8c\x18\x7b\xb1\x55\x31\xcd\xd6\x28\x53\x81\
+\xc7\x13\x8f\xb5\x7e\x0e\xdc\x43\x75\xed\x7e\x33\xf0\x15\x62\xc9\
+\xde\x59\x65\xef\x68\x4d\xad\x49\x3c\x6e\x5a\x44\xfe\x71\x50\x66\
+\x2c\x24\xa6\x57\x9f\x5d\x48\xab\x35\xdf\x8e\xc4\x39\xa7\xd7\x76\
+\x1c\x18\xfa\xff\xb6\xae\x3e\xe5\xfe\xac\x09\xbc\x1e\xf8\x1d\x63\
+\x8f\xa4\x5f\x32\xf4\x77\x5e\x3f\xf4\xff\x34\xc5\x0e\xc0\xa7\x89\
+\x0a\x77\xac\x0f\xf0\x1e\xe0\x87\xc0\xd3\x73\xd2\x9c\x94\x89\x7e\
+\x76\x4d\x8b\x2b\x80\x4f\x00\x3b\x15\xd7\x54\x8d\x37\x85\xf8\x2e\
+\x3f\x0f\xf8\x08\xf0\x33\x62\x6a\xd1\x7e\x2f\x50\xb7\x10\xb3\x6a\
+\x7e\x62\xe8\x77\x37\xee\x04\x56\xb2\x4d\x81\xf7\x12\xe3\x80\xca\
+\x1e\x31\x5e\x55\x0c\x00\x67\x12\xd3\xaa\x57\xbd\x9c\x76\x53\xec\
+\x07\xfc\x1f\xe3\xcf\x11\x71\x35\xd1\x53\xbc\x5b\x4e\x9a\x63\xeb\
+\xf5\x79\xe9\xda\xc4\x5d\xc7\xd6\x2c\xaf\x08\xef\x23\x76\xf2\x2c\
+\xa2\x5b\xbd\xc9\xb6\x01\x76\x06\x36\x27\xba\xf6\x17\x11\x5d\xad\
+\x57\x03\xe7\xd1\xec\x29\x5c\x57\xfc\xec\x32\xdf\xc8\xe8\xd5\x22\
+\xe0\x7e\xa2\x48\xbb\x08\xe7\xd4\xef\xd5\x86\xc4\x89\x7c\xbd\xa1\
+\x98\x45\x14\x87\x23\x7b\xe8\x16\x01\x8b\x89\x63\xf8\x1e\xe0\x06\
+\x62\xa2\x97\xc5\x95\x66\xda\x6c\x73\x81\xdd\x81\x2d\x81\xb5\x86\
+\xa2\x29\xe6\x13\xc7\xd8\xb5\xc0\xb9\xb8\x10\xd2\x44\x4d\x25\xae\
+\x19\x3b\x02\x9b\x10\xcf\xf5\x97\x02\x37\x11\xe7\xaa\xaa\xd6\x85\
+\x91\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\
+\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\
+\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\
+\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\
+\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\
+\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\
+\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\
+\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\
+\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\
+\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\
+\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\
+\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\
+\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\
+\x24\x49\x92\xa4\xd1\x4c\xc9\x4e\x20\xd9\x26\xc0\xfe\xc0\x4e\xc0\
+\xe6\xc0\xb4\xdc\x74\x2a\xb5\x18\xb8\x16\x38\x1b\x38\x05\x58\x94\
+\x9b\x8e\x24\xf5\x65\x23\x60\x0f\x60\x37\x60\x07\x60\x95\xa1\x7f\
+\x7f\x2b\x70\xee\x50\x5c\x02\x0c\xa4\x64\xa7\xda\x78\x06\xf0\x7b\
+\xe2\x8b\x30\x68\xb0\x08\xf8\x29\xf0\xb4\x7e\x1a\x55\x92\x2a\xb6\
+\x0a\x70\x38\xf0\x2b\x60\x19\xe3\x9f\xeb\x6e\x02\x3e\x42\x14\x0b\
+\xea\x98\x5d\x89\xbb\xdd\xec\x0b\x6e\x9d\xe3\x77\x44\x05\x2d\x49\
+\x75\xb6\x07\x70\x21\x93\xbf\xe9\x79\x2f\xb0\x6a\xe5\x59\x2b\xc5\
+\x4b\x81\x07\xc9\xbf\xc0\x36\x21\x16\x03\xaf\x98\x54\x2b\x4b\x52\
+\xb9\xa6\x01\x1f\x05\x96\xd2\xff\xb9\xee\x2c\x60\xcb\x4a\xb3\x57\
+\xe5\x8e\x21\xff\xa2\xda\xc4\xf8\x0c\x8e\x13\x91\x54\x1f\xd3\x81\
+\x1f\x53\xec\x79\xee\x16\xe0\xb1\x55\xee\x84\xaa\xf3\x76\xf2\x2f\
+\xa4\x4d\x8e\xff\xea\xbd\xc9\x25\xa9\x70\x53\x80\x13\x28\xe7\x3c\
+\x77\x0b\xf6\x04\xb4\xce\xa1\x4c\x6c\x60\x88\xb1\xf2\x58\x06\x3c\
+\xab\xd7\x86\x97\xa4\x82\x7d\x88\x72\xcf\x75\x67\xe1\x98\x80\xd6\
+\x98\x0d\xdc\x41\xfe\x05\xb4\x0d\x71\x3b\xb0\x56\x6f\xcd\x2f\x49\
+\x85\x79\x11\xd5\xbc\xb5\xf5\xde\xaa\x76\x48\xe5\xfa\x08\xf9\x17\
+\xce\x36\xc5\x87\x7a\x6b\x7e\x49\x2a\xc4\x3e\x54\x37\x80\x7b\x21\
+\xb0\x5e\x35\xbb\xa5\xb2\x6c\x48\xbc\xe6\x91\x7d\xd1\x6c\x53\x2c\
+\x00\xd6\xee\xe5\x43\x90\xa4\x3e\x6d\x0d\xdc\x49\xb5\xe7\xba\xa3\
+\x2b\xd9\xb3\x1a\x98\x9a\x9d\x40\x49\x5e\x04\xcc\xcc\x4e\xa2\x65\
+\xd6\x00\x0e\xce\x4e\x42\x52\x67\xac\x03\xfc\x9c\xea\xef\xc8\x5f\
+\x45\x47\xde\x7e\x6a\x6b\x01\x70\x58\x76\x02\x2d\x75\x78\x76\x02\
+\x92\x3a\x61\x26\x70\x12\xb0\x7d\xc2\xb6\xb7\x25\xa6\x12\x56\x03\
+\xad\x82\x13\xfe\x94\x15\x77\xf7\xf0\x39\x48\xd2\x64\x4c\x23\xa6\
+\x26\xcf\x3c\xd7\xbd\xa8\xf4\xbd\xac\x81\x36\xf6\x00\x6c\x09\xcc\
+\xc8\x4e\xa2\xa5\xd6\x01\x36\xc8\x4e\x42\x52\xab\x7d\x81\xfc\xde\
+\xc6\x4e\x4c\x87\xde\xc6\x02\x60\x9d\xec\x04\x5a\xce\x11\xb2\x92\
+\xca\xf2\x01\xe0\xd5\xd9\x49\x00\x73\xb2\x13\xa8\x42\x1b\x0b\x00\
+\x27\x72\x28\xd7\x6a\xd9\x09\x48\x6a\xa5\xd7\x02\xef\xcf\x4e\x62\
+\x88\x83\x00\x1b\xaa\x13\x1f\x5c\xa2\xfb\xb3\x13\x90\xd4\x3a\x2f\
+\x06\xfe\x37\x3b\x89\x11\x06\xb2\x13\xa8\x42\x1b\x0b\x00\x95\x67\
+\x80\x58\x4f\x5b\x92\x8a\xf2\x2c\xe0\x6b\xd4\xeb\x7a\x74\x65\x76\
+\x02\x55\xa8\x53\x83\xab\xfe\x2e\x03\x1e\xc8\x4e\x42\x52\x6b\x3c\
+\x1d\xf8\x3e\xf1\xf6\x56\x9d\x9c\x9f\x9d\x40\x15\x2c\x00\xd4\x8b\
+\x93\xb3\x13\x90\xd4\x1a\xfb\x11\x4b\xfb\xd6\x6d\xdc\xd6\x00\x70\
+\x4e\x76\x12\x55\xb0\x00\x50\x2f\x7e\x9a\x9d\x80\xa4\x56\x78\x12\
+\x31\xcb\xdf\xea\xd9\x89\x8c\xe2\x4f\xc4\xf4\xc3\xad\x67\x01\xa0\
+\x89\xba\x10\x38\x33\x3b\x09\x49\x8d\xb7\x2f\xf0\x6b\xea\xbb\xc2\
+\xe8\xb1\xd9\x09\x68\xf2\xf6\x25\x7f\xc6\xbc\x36\xc6\x41\xbd\x7c\
+\x08\x92\x34\x8a\x7d\x88\x37\x89\xb2\xcf\x67\x2b\x8b\x8b\x88\x99\
+\x08\xd5\x50\x16\x00\xc5\xc7\xaf\x7b\xfa\x04\x24\xe9\x91\xea\x7e\
+\xf1\x5f\x46\x8c\x4b\x50\x83\x59\x00\x14\x1b\xd7\xe1\xf4\xbf\x92\
+\xfa\xb3\x3f\xf5\xbe\xf8\x0f\x02\x1f\x29\x6d\xef\x55\x19\x0b\x80\
+\xe2\x62\x01\xb0\x6b\x6f\xcd\x2f\x49\x0f\x73\x28\xf1\xfa\x70\xf6\
+\xf9\x6c\xac\x38\x19\xbb\xfe\x5b\xc1\x02\xa0\x98\xb8\x09\x78\x7c\
+\x8f\x6d\x2f\x49\x23\x3d\x1f\x58\x42\xfe\xf9\x6c\xac\xb8\x18\x98\
+\x5d\x56\x03\xa8\x5a\x16\x00\xfd\xc7\x1f\x81\x8d\x7a\x6c\x77\x49\
+\x1a\xe9\x95\xc4\x73\xf5\xec\xf3\xd9\x58\x71\x33\xb0\x59\x59\x0d\
+\xa0\xea\x59\x00\x4c\x3e\x2e\x07\x8e\xc0\xf5\x14\x24\xf5\xe7\xed\
+\xc4\x84\x3a\xd9\xe7\xb4\xb1\x62\x01\xb0\x7b\x59\x0d\xa0\x1c\x16\
+\x00\xbd\xc5\x2d\xc0\xff\x01\xcf\x00\xa6\x4f\xa2\xbd\x25\x69\xd8\
+\x54\xe0\x33\xe4\x9f\xd7\xc6\x8b\x65\xc0\xb3\x4b\x6a\x83\xc6\xa8\
+\xdb\xfc\xcb\x7a\xb8\x4f\x01\xa7\x97\xf0\x7b\xef\x1f\x8a\x6b\x89\
+\x02\x40\x92\xfa\x35\x03\xf8\x26\xf0\xbc\xec\x44\x26\xe0\x68\xe0\
+\x27\xd9\x49\xa8\x78\x6d\xea\x01\x78\x10\x78\x41\xb1\xcd\x23\x49\
+\x85\x5b\x13\xf8\x0d\xf9\xe7\xcc\x89\xc4\x27\x4a\x6a\x03\xd5\x40\
+\x9b\x0a\x80\x41\xe2\x39\xda\x3b\x0b\x6d\x21\x49\x2a\xce\x5c\x62\
+\xf5\xbc\xec\x73\xe5\x44\xe2\xdb\x38\xc6\xa9\xd5\xda\x56\x00\x0c\
+\xc7\xd7\xf0\x19\xbd\xa4\x7a\xd9\x05\xb8\x81\xfc\xf3\xe3\x44\xe2\
+\xf7\xc4\x63\x0a\xb5\x58\x5b\x0b\x80\x41\xe0\x14\x60\xed\xe2\x9a\
+\x4a\x92\x26\xed\x60\x60\x3e\xf9\xe7\xc5\x89\xc4\x85\x78\xee\xec\
+\x84\x36\x17\x00\x83\xc0\x25\xc0\x56\x85\xb5\x96\x24\xf5\xee\xed\
+\xd4\xff\x1d\xff\xe1\xb8\x0a\xe7\x35\xe9\x8c\xb6\x17\x00\x83\xc0\
+\xed\xc0\xde\x45\x35\x98\x24\x4d\xd0\x0c\xe0\xab\xe4\x9f\x03\x27\
+\x1a\x37\xe2\x0d\x53\xa7\x74\xa1\x00\x18\x24\xe6\xd6\x7e\x69\x31\
+\x4d\x26\x49\xe3\xda\x04\xf8\x1b\xf9\xe7\xbe\x89\xc6\xed\xc0\xf6\
+\xa5\xb4\x84\x6a\xab\x2b\x05\xc0\x70\x1c\x0f\xcc\x2c\xa4\xe5\x24\
+\x69\x74\xbb\x03\xd7\x93\x7f\xbe\x9b\x68\xcc\x03\x1e\x57\x4a\x4b\
+\xa8\xd6\xba\x56\x00\x0c\x02\xe7\x60\x37\x97\xa4\x72\xbc\x18\x58\
+\x44\xfe\x79\x6e\xa2\xb1\x10\xd8\xa7\x94\x96\x50\xed\x75\xb1\x00\
+\x18\x04\xee\x04\x0e\x28\xa0\xfd\x24\x09\x60\x35\x62\x9a\xf0\xec\
+\x73\x5b\x2f\xb1\x08\xd8\xbf\x8c\xc6\x50\x33\x74\xb5\x00\x18\x24\
+\x26\x0d\x3a\x86\x98\x8f\x5b\x92\x26\x6b\x0b\x62\x1a\xf2\xec\x73\
+\x5a\xaf\x17\x7f\x6f\x82\x3a\xae\xcb\x05\xc0\x70\x9c\x0c\xcc\xe9\
+\xb7\x21\x25\x75\xd2\xe1\xc0\x3d\xe4\x9f\xc7\x7a\x89\x07\x81\x43\
+\xca\x68\x0c\x35\x8b\x05\x40\xc4\x15\xc0\x6e\x7d\xb6\xa5\xa4\xee\
+\x58\x15\xf8\x2c\xf9\xe7\xae\x5e\x63\x11\x70\x60\x09\xed\xa1\x06\
+\xb2\x00\x58\x1e\x4b\x80\x0f\xe0\x23\x01\x49\x63\xdb\x8a\x66\xbd\
+\xe2\x37\x1c\xde\xf9\xeb\x61\x2c\x00\x1e\x19\xa7\x02\x9b\xf6\xd3\
+\xa8\x92\x5a\xeb\x65\xc4\xf2\xe0\xd9\xe7\xa9\x5e\x63\x21\xde\xf9\
+\x6b\x05\x16\x00\xa3\xc7\x3c\xe0\x85\x7d\xb4\xab\xa4\x76\x99\x4d\
+\xac\x8e\x97\x7d\x6e\x9a\x4c\xdc\x0f\x3c\xb5\xf8\x26\x51\xd3\x59\
+\x00\x8c\x1d\xdf\x00\x66\x4d\xb6\x71\x25\xb5\xc2\xbf\xd0\xac\x89\
+\x7d\x46\xc6\x5d\xc0\x1e\x85\xb7\x88\x5a\xc1\x02\x60\xfc\xb8\x6e\
+\xa8\x9d\x24\x75\xcb\x4c\xe2\x55\xe1\xa6\x2c\xe4\xb3\x62\xdc\x0a\
+\xec\x5c\x78\xab\xa8\x35\x2c\x00\x26\x16\x4b\x81\x0f\x11\x23\x7f\
+\x25\xb5\xdf\x13\x80\xcb\xc9\x3f\xf7\x4c\x36\xae\x05\xb6\x29\xbc\
+\x55\xd4\x2a\x16\x00\xbd\xc5\xc5\xc4\x89\x41\x52\x3b\xad\x06\x7c\
+\x0c\x78\x88\xfc\xf3\xcd\x64\xe3\x12\x1c\xc8\xac\x09\xb0\x00\xe8\
+\x3d\x06\x80\xe3\x80\xb5\x26\xd1\xde\x92\xea\xeb\x89\xc4\xc5\x33\
+\xfb\x1c\xd3\x4f\x9c\x0e\xac\x57\x74\xc3\xa8\x9d\xb2\x0a\x80\xdb\
+\x89\xd7\x52\xb2\x0f\x96\x7e\xe2\x7a\x7c\xa7\x56\x6a\x83\xd9\xc0\
+\x17\x69\xee\xb3\xfe\xe1\xf8\x09\xae\x76\xaa\x1e\x64\x15\x00\x7f\
+\x06\xf6\x24\x06\xa9\x64\x1f\x34\xfd\xc6\x89\xc0\x06\xbd\x36\xbc\
+\xa4\x5a\x78\x26\x70\x03\xf9\xe7\x91\x7e\xe3\x6b\xc0\x2a\x05\xb7\
+\x8d\x5a\x2e\xb3\x00\x80\x58\x44\xe3\xe2\xa4\x1c\x8a\x8c\xbb\x80\
+\xa3\x7a\x69\x78\x49\xa9\x36\x07\x7e\x44\xfe\xb9\xa3\x88\x78\x5f\
+\xc1\x6d\xa3\x8e\xc8\x2e\x00\x20\xba\xdf\x7e\x9b\x94\x47\xd1\x71\
+\x2a\xf0\xd8\x09\xb6\xbd\xa4\xea\xcd\x00\xde\x05\x2c\x20\xff\x7c\
+\xd1\x6f\x2c\x06\x5e\x5a\x68\xeb\xa8\x53\xea\x50\x00\x40\x74\x5d\
+\x7d\x21\x29\x97\xa2\x63\x19\x70\x3c\x3e\x16\x90\xea\x66\x7f\x9a\
+\x3f\xc8\x6f\x38\xee\x06\x9e\x52\x6c\xf3\xa8\x6b\xea\x52\x00\x0c\
+\x7b\x3b\xcd\x1f\x88\x33\x1c\xf7\x00\x6f\x02\xa6\xaf\xbc\xf9\x25\
+\x55\xe0\x51\xb4\xa7\xbb\x7f\x90\x98\x9f\x60\xdb\x42\x5b\x48\x9d\
+\x54\xb7\x02\x00\xe0\x08\x9a\xff\x86\xc0\x8a\x07\xab\x6f\x0b\x48\
+\xd5\x5b\x93\x58\xe1\xf3\x01\xf2\xcf\x03\x45\xc5\x5f\x81\xf5\x0b\
+\x6c\x23\x75\x58\x1d\x0b\x00\x80\xbd\x80\xdb\x92\x72\x2b\x2b\x4e\
+\x06\x1e\x3d\xce\x7e\x4b\xea\xdf\x2a\xc0\x6b\x81\x3b\xc8\x3f\xee\
+\x8b\x8c\xaf\x60\x8f\xa2\x0a\x54\xd7\x02\x00\x60\x4b\xe0\xdc\xa4\
+\xfc\xca\x8a\xc5\xc0\xa7\xb1\x82\x97\xca\x72\x28\xed\x79\xce\x3f\
+\x1c\x4b\x80\xd7\x17\xd9\x48\x12\xd4\xbb\x00\x80\x98\x96\xf3\xcb\
+\x49\x39\x96\x19\x0b\x88\x45\x46\xe6\x4c\xb0\x1d\x24\x8d\xed\x09\
+\xc0\x1f\xc9\x3f\xb6\x8b\x8e\x3b\x89\xc1\x8b\x52\xe1\xea\x5e\x00\
+\x0c\x3b\x0a\x58\x94\x94\x6b\x99\x31\x9f\x28\x04\x66\xf7\xd8\x1e\
+\x92\xc2\x63\x88\xc9\xb8\xb2\x8f\xe5\x32\xe2\x3c\xa2\x27\x54\x2a\
+\x45\x53\x0a\x00\x88\x99\x03\x9b\xba\x26\xf7\x78\x71\x07\xf0\x1f\
+\x38\x8d\xa7\x34\x51\x8f\x01\xbe\x4f\x7b\xde\x1a\x5a\x31\x4e\xc0\
+\xf3\x81\x4a\xd6\xa4\x02\x00\x62\x91\x8b\xdf\x25\xe5\x5c\x45\xdc\
+\x4c\x3c\xeb\x73\xd9\x61\x69\x74\x3b\x11\x77\xfc\x6d\xbd\xf0\x3f\
+\x88\xcf\xfb\x55\x91\xa6\x15\x00\x00\xd3\x80\x8f\x10\xab\xf2\x65\
+\x1f\xac\x65\xc5\x75\xc4\x1c\x02\x6b\xf4\xd1\x4e\x52\x9b\xec\x02\
+\xfc\x90\x76\x1f\xf7\xd7\x00\x7b\x14\xd5\x60\xd2\x78\x9a\x58\x00\
+\x0c\x7b\x26\x31\xd9\x4e\xf6\x41\x5b\x66\xdc\x07\x7c\x16\xd8\xa4\
+\x80\xf6\x92\x9a\x68\x1f\xe2\x15\xda\x36\x5f\xf8\x07\x81\x93\x70\
+\x50\xb0\x2a\xd6\xe4\x02\x00\x62\x36\xac\xf3\x92\xf6\xa1\xca\x58\
+\x04\x1c\x0b\x6c\x53\x4c\xb3\x49\xb5\x36\x15\x78\x0e\x70\x06\xf9\
+\xc7\x5e\xd9\xb1\x04\x78\x1b\x30\xa5\x90\x96\x93\x7a\xd0\xf4\x02\
+\x00\x62\x71\x8f\xff\xa1\xbd\xcf\x04\x47\xc6\x32\xa2\x1b\x74\xcf\
+\x42\x5a\x4e\xaa\x97\x35\x81\xd7\x01\x57\x92\x7f\xac\x55\x11\xd7\
+\x00\x7b\x17\xd2\x72\xd2\x24\xb4\xa1\x00\x18\xf6\x54\xe0\xa6\xa4\
+\xfd\xc9\x88\x3f\x02\xcf\xc6\x35\xc0\xd5\x7c\x5b\x03\x9f\x04\xee\
+\x25\xff\xb8\xaa\x2a\x4e\x00\x66\x15\xd1\x78\xd2\x64\xb5\xa9\x00\
+\x00\x58\x87\xb8\x43\xce\x3e\xb8\xab\x8c\x9b\x81\x0f\x02\x9b\x15\
+\xd0\x7e\x52\x55\xa6\x00\x07\x12\xcf\xbe\xbb\xd0\x7b\x37\x1c\xf7\
+\x01\x2f\x2c\xa0\xfd\xa4\xbe\xb5\xad\x00\x18\x76\x14\x31\xc9\x4e\
+\xf6\xc1\x5e\x65\x2c\x23\x5e\x91\x3c\x12\x7b\x05\x54\x5f\x73\x80\
+\x57\x01\x17\x91\x7f\xcc\x54\x1d\x67\xe0\x38\x1e\xd5\xc8\x3e\xe4\
+\x1c\x08\x65\x17\x00\x10\x07\xda\xe9\x49\xfb\x97\x1d\xd7\x01\xef\
+\x01\x36\xee\xb7\x11\xa5\x02\x4c\x25\xee\xf6\x7f\x40\xac\x87\x91\
+\x7d\x7c\x54\x1d\x4b\x80\xf7\x61\x61\xae\x9a\xd9\x9d\x9c\x03\xe2\
+\xd7\x55\xec\x1c\x71\xc0\x7d\x08\x78\xa8\x82\x7d\xaa\x63\x2c\x21\
+\xd6\x41\x3f\x9c\x18\x2c\x29\x55\x69\x1b\x62\x39\xde\x6b\xc8\x3f\
+\x16\xb2\xe2\x42\x60\xb7\x3e\xdb\x51\x2a\xc5\x96\xe4\x1c\x14\x27\
+\x54\xb0\x6f\x23\x3d\x11\xb8\xb4\xa0\xdc\x9b\x1a\xf7\x10\xcb\x89\
+\x3e\x85\xb8\x23\x93\xca\x30\x07\x78\x35\xb1\x6e\x7d\xdb\xdf\xdd\
+\x1f\x2b\x96\x12\x13\x96\x39\xab\xa7\x6a\x6b\x2a\x39\x8b\xec\xbc\
+\xa7\x8a\x9d\x5b\xc1\x6a\xc0\x87\x89\xbb\xe2\xec\x93\x43\x76\xdc\
+\x0c\x7c\x0a\x67\x1d\x53\x31\xd6\x00\x9e\x4b\x0c\xc0\x7d\x80\xfc\
+\xef\x77\x76\x5c\x0a\xec\xd5\x57\x8b\x4a\x15\xf9\x39\xd5\x1f\x20\
+\x4f\xa8\x64\xcf\x46\xb7\x13\xdd\x98\x60\x64\xa2\x71\x39\xd1\x4d\
+\xbb\x7d\x1f\x6d\xaa\xee\x59\x9d\xb8\xe8\xff\x00\x58\x48\xfe\xf7\
+\xb8\x0e\xb1\x94\x58\xdd\xd3\x45\x7c\xd4\x18\xaf\xa4\xda\x83\xe4\
+\x56\xf2\xbb\xa0\xa7\x01\x6f\x01\x16\x90\x7f\xd2\xa8\x53\x5c\x06\
+\x7c\x02\x78\xf2\x50\x1b\x49\x23\xad\x47\xbc\x61\xf3\x43\xbc\xe8\
+\xaf\x18\x67\x01\xbb\x4e\xbe\x69\xa5\x1c\x1b\x12\x2b\x50\x55\x75\
+\xa0\xfc\x6f\x35\xbb\x35\x21\x5b\x12\x03\x12\xb3\x4f\x1e\x75\x8c\
+\xbb\x81\x6f\x01\xcf\x03\xd6\x9e\x64\xfb\xaa\xf9\xb6\x05\x8e\x06\
+\xfe\x44\x77\x07\xd3\x8e\x15\x0b\x80\xb7\x62\xc1\xac\x06\xfb\x34\
+\xd5\x1c\x2c\x8b\x80\x4d\x2b\xda\xa7\x5e\xbc\x18\xb8\x93\xfc\x93\
+\x49\x5d\x63\x09\x70\x2a\xd1\x6b\xb2\xed\x24\xdb\x58\xcd\xb0\x26\
+\x70\x18\x51\xa8\x5f\x41\xfe\x77\xaf\xce\xf1\x2b\xe2\x26\x42\x6a\
+\xb4\xf5\x80\x79\x94\x7f\xc0\x1c\x53\xd5\x0e\x4d\xc2\xfa\xc4\x1d\
+\x6f\x97\x47\x2e\x4f\x34\x6e\x00\x8e\x07\x5e\x06\x3c\x6a\x32\x8d\
+\xad\xda\x58\x85\x18\xb0\xf6\x2e\x62\x7a\x69\x07\xc9\x4e\xec\xfb\
+\xff\x9c\x49\xb4\xb5\x54\x5b\x2f\xa6\xdc\x83\xe6\x62\x60\xad\xca\
+\xf6\x66\xf2\xf6\x05\xce\x21\xff\x24\xd3\xa4\xb8\x1e\xf8\x26\xf0\
+\x52\x60\xab\x9e\x5b\x5c\x55\x9a\x4e\xbc\x16\xfb\x4e\xe2\x0e\xf6\
+\x7e\xf2\xbf\x3f\x4d\x89\xc5\xc0\x47\x89\xb7\x1e\xa4\xd6\xf9\x38\
+\xe5\x1c\x38\x77\x11\x0b\x7e\x34\xc5\x54\xe0\x15\xc0\xed\xe4\x9f\
+\x74\x9a\x18\xd7\x01\xdf\x20\x56\x76\xdb\x8b\x78\x05\x53\x39\x36\
+\x06\x9e\x45\x5c\xb8\xfe\x80\x03\x5f\x27\x1b\xbf\x01\xb6\xeb\xb1\
+\xed\xa5\x46\x99\x06\x7c\x9d\x62\x0f\x9c\xbb\x80\x27\x55\xb9\x13\
+\x05\x9a\x4d\x2c\x35\xdc\xc5\xe9\x4b\x8b\x8c\x25\xc0\xb9\xc0\x97\
+\x89\x49\x62\xf6\xc0\x09\x52\xca\xb0\x3e\x31\xe5\xee\xdb\x81\xef\
+\x13\x3d\x33\xd9\x9f\x7d\xd3\xe3\x1a\xe0\x5f\x7b\xf9\x10\xa4\xa6\
+\x3b\x9a\x62\x46\xfc\x5e\x44\x3b\x9e\x11\x3f\x1a\x38\x99\xfc\x93\
+\x51\x9b\x62\x31\xf1\xea\xd4\xff\x01\xaf\x07\x0e\x00\x36\x9f\xe8\
+\x07\xd2\x71\x33\x80\x9d\x89\xf7\xf0\x3f\x4c\x7c\x37\xbb\xb4\x14\
+\x76\x15\x31\x0f\xf8\x4f\x9c\x42\x5b\x43\xa6\x64\x27\x50\xb1\x27\
+\x11\x77\xbf\x7b\x4f\xe2\xff\x5d\x04\x7c\x86\xe8\x76\x5c\x50\x64\
+\x52\xc9\x0e\x22\x66\xd0\xdb\x21\x3b\x91\x16\x5b\x48\x4c\x4e\x74\
+\x05\x31\x2f\xc1\x65\x43\x7f\xbe\x9c\xf8\x5e\x75\xc5\x54\x60\x2e\
+\x51\x40\x3f\x8a\x28\x42\x77\x00\x76\x1c\xfa\x67\x5f\x3b\x2b\xc7\
+\x43\x44\x4f\xd5\xfb\x89\x37\x83\x24\xa0\x7b\x05\x00\xc4\x3e\x1f\
+\x01\xbc\x86\x98\x1c\x66\xfa\x38\x7f\xff\x26\x62\xf1\x99\x4f\x10\
+\xd3\xcd\xb6\xd1\x74\xe2\xd9\xf6\x7b\x88\xb7\x27\x54\x8d\x41\xe0\
+\x16\xe0\xc6\xa1\x9f\x37\x11\xdf\xb1\x5b\x88\x51\xd9\xc3\xff\xee\
+\xc1\xac\x04\x7b\x34\x9b\xb8\xc0\xcf\x05\x36\x01\x36\x23\x9e\xd7\
+\x6f\x49\x5c\xe0\xb7\xc2\xbb\xcf\xaa\xfd\x8a\xe8\xfd\xfc\x47\x76\
+\x22\xaa\x9f\x2e\x16\x00\x23\xcd\x01\x9e\x41\xac\x6c\xb5\xf9\xd0\
+\x3f\x3f\x48\x4c\x18\x73\x39\x70\x0a\xcb\x47\xcf\x77\xc1\x5a\xc4\
+\x04\x20\x6f\x23\x4e\xe6\xaa\x87\xbb\x89\x62\xe0\x2e\xa2\x1b\xf7\
+\xbe\x95\xc4\xbc\x11\xff\x7d\xd9\x88\xff\xff\x01\x1e\x59\x44\x2c\
+\x22\x1e\x59\x4c\x65\xf9\x67\xbd\x2a\xcb\x47\x83\xaf\x39\x14\x6b\
+\x10\x93\x26\xad\x35\xf4\xcf\xb3\x88\x22\x71\xdd\xa1\x9f\xeb\x0f\
+\xc5\x7a\xc4\x54\xba\xaa\x87\xbf\x03\xef\x26\x5e\x83\x94\x46\xd5\
+\xf5\x02\x40\xa3\x5b\x07\x78\x13\x51\x0c\xcc\x4a\xce\x45\xd2\xc4\
+\xfd\x83\x58\x07\xe3\x87\x74\xe7\xc6\x45\x93\x64\x01\xa0\xb1\xac\
+\x47\x74\x1f\xbe\x09\x17\x03\x91\xea\xec\x7a\x62\xa9\xde\xaf\xf2\
+\xf0\xde\x1f\x49\xea\xcb\x66\xc0\x71\x38\xa3\x9a\x61\xd4\x2d\xae\
+\x21\xe6\xf7\x18\x6f\x2c\x93\xf4\x08\xf6\x00\xa8\x17\x5b\x10\xcf\
+\x15\x5f\x8e\x23\xb6\xa5\x4c\xd7\x11\x6f\x25\xfd\x1f\x31\x96\x43\
+\x92\x2a\xf1\x68\xe0\x4b\x54\xbb\xe2\xa2\x61\x18\xf1\xfa\xe8\x4b\
+\x88\xf5\x0e\xa4\xbe\xd8\x03\xa0\x7e\x6c\x44\x8c\x0f\x78\x2d\x2e\
+\xaf\x2b\x95\xe9\x3c\xe2\x55\xe4\x13\xf1\x19\xbf\xa4\x1a\x59\x13\
+\x78\x33\x4e\xd3\x6a\x18\x45\xc7\x5f\x81\x43\xf1\x66\x4d\x52\xcd\
+\x4d\x07\x8e\x24\xa6\xc3\xcd\x3e\x71\x1a\x46\x53\x63\x19\x31\x15\
+\xf2\xe3\x91\x4a\x64\x55\xa9\x32\x4c\x21\x26\x58\xfa\x4f\xe0\x5f\
+\x72\x53\x91\x1a\xe3\x2e\x62\xca\xde\x63\x89\xd9\x21\xa5\x52\x59\
+\x00\xa8\x6c\x3b\x10\x83\x96\x5e\x45\xcc\xb4\x28\xe9\xe1\xce\x27\
+\x2e\xfa\xdf\xa2\x5b\x6b\x43\x48\xea\x88\x35\x89\x22\xe0\x5c\xf2\
+\xbb\x58\x0d\x23\x3b\x96\x10\x03\xfa\xf6\x45\x4a\x62\x0f\x80\x32\
+\xec\x4e\x14\x03\x2f\x64\xf9\xdc\xf3\x52\x17\x5c\x05\x7c\x9b\x98\
+\xb1\xcf\x6e\x7e\x49\x9d\x35\x8b\x28\x04\x2e\x20\xff\x8e\xcc\x30\
+\xca\x8a\x07\x89\xbb\xfd\x03\xf0\xa6\x4b\x35\xe2\x97\x51\x75\xb1\
+\x2f\xf0\x52\x62\xa9\x66\xe7\x14\x50\x1b\x9c\x0d\x9c\x40\xdc\xf1\
+\xdf\x9d\x9c\x8b\xf4\x08\x16\x00\xaa\x9b\x19\xc0\xd3\x88\xd7\x09\
+\x8f\xc0\x47\x04\x6a\x96\x9b\x81\x1f\x01\x5f\x27\x06\xf7\x49\xb5\
+\x65\x01\xa0\x3a\x9b\x0d\x3c\x1b\x78\x01\xb0\x3f\xae\x3f\xa0\x7a\
+\x9a\x07\xfc\x84\xb8\xdb\xff\x13\x30\x90\x9b\x8e\x34\x31\x16\x00\
+\x6a\x8a\x75\x81\x7f\x05\x8e\x02\x9e\x88\xdf\x5d\xe5\x9a\x47\x4c\
+\xd6\xf3\x03\xe0\x37\xc4\xa8\x7e\xa9\x51\x3c\x89\xaa\x89\xb6\x21\
+\x8a\x81\xc3\x80\xbd\xb0\x67\x40\xd5\x98\x07\x9c\x44\x5c\xf4\x7f\
+\x8b\x17\x7d\x35\x9c\x05\x80\x9a\x6e\x5d\xe2\xf1\xc0\xa1\x44\x41\
+\x30\x3b\x37\x1d\xb5\xcc\xf5\xc4\x1d\xfe\xcf\xf1\x4e\x5f\x2d\x63\
+\x01\xa0\x36\x99\x41\x4c\x3d\x7c\x18\xf0\x4c\x60\xf3\xd4\x6c\xd4\
+\x44\x03\xc4\x5a\x16\x27\x11\x5d\xfc\x17\xe5\xa6\x23\x95\xc7\x02\
+\x40\x6d\xb6\x2b\x51\x08\x1c\x4c\x2c\xac\xe2\x1a\xea\x1a\xcd\x4d\
+\x44\x97\xfe\x6f\x81\x53\x89\x39\xf9\xa5\xd6\xb3\x00\x50\x57\xac\
+\x09\xec\x43\xf4\x10\xfc\x0b\x31\x1b\xa1\x05\x41\x37\xdd\x0f\xfc\
+\x05\xf8\x1d\x71\xd1\xff\x47\x6e\x3a\x52\x0e\x0b\x00\x75\xd5\x1a\
+\xc0\x13\x88\xa2\xe0\x49\xc0\x7e\xc0\xaa\xa9\x19\xa9\x2c\x0b\x80\
+\xd3\x81\x53\x80\xd3\x80\x33\xf1\x59\xbe\x64\x01\x20\x0d\x99\x45\
+\x14\x01\x4f\x06\xf6\x06\x76\xc3\x49\x88\x9a\xea\x5a\xe2\x82\x7f\
+\x06\x71\xa7\x7f\x01\xb0\x2c\x35\x23\xa9\x86\x2c\x00\xa4\xd1\x4d\
+\x03\xb6\x07\xf6\x18\x11\xbb\x02\xab\x65\x26\xa5\x47\x98\x47\x4c\
+\xb9\x7b\x3a\x71\x67\x7f\x06\x70\x47\x6a\x46\x52\x43\x58\x00\x48\
+\x13\xb7\x0a\xb0\x1d\x31\x7e\x60\x64\x58\x14\x54\xe3\x56\xe0\x1c\
+\xe0\x12\xe2\xb9\xfd\x39\x43\x3f\x07\x33\x93\x92\x9a\xca\x02\x40\
+\xea\xcf\x74\x60\x2b\x60\x07\xa2\x38\xd8\x8e\xe8\x39\xd8\x1e\x58\
+\x27\x31\xaf\x26\xbb\x01\xb8\x9c\xb8\xb8\x5f\x0a\x5c\x46\xbc\x8e\
+\x77\x4f\x66\x52\x52\xdb\x58\x00\x48\xe5\x59\x8f\x47\x16\x06\x8f\
+\x02\x36\x03\xd6\x4a\xcc\x2b\xdb\x00\xb1\x68\xce\x35\x2b\xc4\x95\
+\xc4\xc5\xfe\xfe\xbc\xd4\xa4\xee\xb0\x00\x90\x72\xcc\x02\x36\x1d\
+\x8a\x4d\x88\x49\x8b\x36\x01\xe6\x12\x05\xc2\x26\xc0\xfa\x69\xd9\
+\x4d\xde\x62\xe2\x3d\xfa\x1b\x81\xdb\x86\x7e\xde\x4a\x5c\xf0\x6f\
+\x26\xde\xb9\xbf\x6e\xe8\xef\x49\x4a\x64\x01\x20\xd5\xd7\x6a\x44\
+\x11\xb0\x36\x31\xc5\xf1\x8a\x3f\x87\xff\x3c\x67\xc4\x9f\xa7\x11\
+\x6f\x2f\x8c\x7c\xa5\x71\xca\xd0\x7f\x5b\xf1\x77\xcf\x24\x9e\x9f\
+\xcf\x1b\xfa\x77\xcb\x80\xf9\x43\x7f\x5e\x4a\xbc\x3e\x77\x3f\xb0\
+\x70\x28\xe6\x0d\xfd\xbb\x05\x43\x7f\xbe\x9b\xb8\xd8\xdf\x05\xdc\
+\x39\xf4\xd3\xbb\x77\xa9\x21\xfe\x3f\x74\x4c\xdb\xb7\xde\xc1\x5e\
+\x74\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x20\xd7\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x02\x00\x00\x00\x02\x00\x08\x06\x00\x00\x00\xf4\x78\xd4\xfa\
+\x00\x00\x00\x04\x73\x42\x49\x54\x08\x08\x08\x08\x7c\x08\x64\x88\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
+\x01\x95\x2b\x0e\x1b\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\
+\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\
+\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x20\x00\x49\x44\
+\x41\x54\x78\x9c\xed\xdd\x6b\xac\x66\x57\x7d\x1e\xf0\x67\xc6\xc6\
+\x33\x36\x06\x7c\xeb\xd8\x18\x08\xd7\x70\xc7\x21\x76\xb9\xba\x38\
+\x60\x30\x01\xca\xad\xdc\x1a\x45\x09\x6d\x43\x44\x3e\x41\x14\x29\
+\x69\x3e\x26\x4a\xd4\xb4\x89\x54\xa9\x34\x52\xa3\xaa\x4d\xd2\x44\
+\x6a\x0b\x81\x90\xb8\x01\xc2\xcd\x21\x50\x6c\x03\x95\x89\xb9\x16\
+\x53\x6c\xc0\x18\x30\x06\x8c\xaf\x18\x8f\x3d\x33\xfd\xb0\xcf\xcb\
+\x9c\x99\x39\x97\xf7\xb2\xdf\xbd\xd6\xda\xfb\xf7\x93\x96\xe4\x99\
+\x39\x73\xe6\x3f\xe7\xf8\x9c\xe7\x99\xb5\xf6\xde\x6f\x02\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xbb\xdb\x53\
+\x7a\x00\x80\x11\x3b\x27\xc9\xb9\x49\xce\xda\x58\x67\x27\x39\x39\
+\xc9\xbe\x24\xa7\x6d\xbc\xcd\x7d\x49\xee\xda\xf8\xef\x5b\x37\xad\
+\xef\x26\xf9\x76\x92\xc3\x03\xce\xcb\x84\x28\x00\x00\xab\x79\x50\
+\x92\xa7\x6e\xac\x27\x27\x79\x52\x92\x9f\x48\xf2\xa8\x24\xa7\xae\
+\xf8\xbe\xef\x4b\xf2\xcd\x24\x37\x26\xb9\x2e\xc9\x17\x93\x7c\x7e\
+\x63\xdd\xbc\xe2\xfb\x66\xe2\x14\x00\x80\xc5\x3c\x3a\xc9\x0b\x92\
+\x3c\x27\xc9\xb3\xd2\x85\xfe\x49\x05\xe6\xb8\x31\xc9\x27\x36\xd6\
+\xc7\x92\xfc\x43\xec\x16\x00\x40\x6f\x4e\x4d\xf2\xca\x24\x7f\x94\
+\xe4\x2b\x49\x8e\x54\xba\xbe\x97\xe4\x1d\x49\xde\x94\xe4\x1f\xad\
+\xe5\x23\x01\x00\x23\x77\x6a\x92\x7f\x9e\xe4\x2f\x92\xdc\x99\xf2\
+\xe1\xbe\xe8\xba\x3f\xc9\x47\x92\xbc\x25\xc9\x79\x3d\x7f\x6c\x00\
+\x60\x74\x2e\x4a\xf2\xb6\x74\xff\x9a\x2e\x1d\xe2\x7d\x96\x81\x0f\
+\x25\x79\x63\x56\xbf\x26\x01\x00\x46\x63\x5f\xba\x70\xbc\x36\xe5\
+\xc3\x7a\xdd\xeb\x3b\x49\xfe\x5d\x92\x87\xf7\xf2\x91\x03\x80\x06\
+\x9d\x9d\xe4\x77\xd3\xdd\x6e\x57\x3a\x98\x87\x5e\xf7\x26\xf9\xf3\
+\x74\x17\x30\x02\xc0\x24\x9c\x93\xe4\xb7\x93\xdc\x96\xf2\x41\x5c\
+\x7a\x1d\x4a\xf2\x37\x49\x2e\x5c\xe5\x03\x0a\x00\x35\x7b\x60\x92\
+\xdf\x4a\xf7\xd0\x9d\xd2\xc1\x5b\xdb\x3a\x9c\xe4\xbf\x27\x79\xe4\
+\xd2\x1f\x5d\x00\xa8\xcc\xde\x24\xbf\x94\xee\x81\x3a\xa5\x83\xb6\
+\xf6\x75\x4f\xba\x6b\x04\x1e\xbc\xd4\x47\x1a\x00\x2a\x71\x41\x92\
+\xab\x53\x3e\x58\x5b\x5b\xdf\x4e\x77\x61\x24\x00\x34\xe5\xb4\x24\
+\x7f\x90\xee\x51\xba\xa5\xc3\xb4\xe5\xf5\xde\x74\x8f\x34\x06\x80\
+\xea\x3d\x23\xc9\x97\x52\x3e\x3c\xc7\xb2\xee\x48\xf2\xe6\x85\x3e\
+\x03\x00\x30\xa0\x93\x93\xfc\x66\xba\x5b\xdc\x4a\x87\xe6\x18\xd7\
+\xfb\x92\x3c\x74\xee\xcf\x06\x00\x0c\xe0\x40\x92\x2b\x52\x3e\x24\
+\xc7\xbe\xbe\x93\xe4\xd2\x39\x3f\x27\x00\xb0\x56\xcf\x4b\xf2\xad\
+\x94\x0f\xc7\xa9\xac\xfb\xd2\xed\xb4\x78\x35\x59\x00\x8a\x79\x6b\
+\x5c\xe8\x57\x6a\xbd\x3d\x5e\x5b\x00\x80\x81\x9d\x94\xee\x45\x7b\
+\x4a\x87\xe0\xd4\xd7\x27\x92\x9c\xbb\xcb\xe7\x0a\x00\x7a\x71\x7a\
+\xba\xc7\xd7\x96\x0e\x3f\xab\x5b\xd7\x27\x79\xe2\x8e\x9f\x31\x00\
+\x58\xd1\x43\x92\x5c\x99\xf2\xa1\x67\x1d\xbb\x6e\x4d\xf2\xac\x1d\
+\x3e\x6f\x00\xb0\xb4\x33\x93\x7c\x32\xe5\xc3\xce\xda\x7a\xdd\x96\
+\xe4\xe2\x6d\x3f\x7b\x00\xb0\x84\x73\x93\x7c\x3e\xe5\x43\xce\xda\
+\x79\xdd\x15\xb7\x09\x02\xd0\x93\x03\x49\x3e\x97\xf2\xe1\x66\xcd\
+\xb7\x7e\x98\xe4\x45\x5b\x7e\x26\x01\x60\x4e\xc2\xbf\xcd\xa5\x04\
+\x00\xb0\x34\xe1\xdf\xf6\x52\x02\x00\x58\x98\xf0\x1f\xc7\x52\x02\
+\x00\x98\x9b\xf0\x1f\xd7\x52\x02\x00\xd8\x95\xf0\x1f\xe7\x52\x02\
+\x00\xd8\x96\xf0\x1f\xf7\x52\x02\x00\x38\x81\xf0\x9f\xc6\x52\x02\
+\x00\xf8\x31\xe1\x3f\xad\xa5\x04\x00\x20\xfc\x27\xba\x94\x00\x80\
+\x09\x13\xfe\xd3\x5e\x4a\x00\xc0\x04\x09\x7f\x4b\x09\x00\x98\x18\
+\xe1\x6f\x6d\x5e\x4a\x00\xc0\x04\x08\x7f\x6b\xab\xa5\x04\x00\x8c\
+\x98\xf0\xb7\x76\x5a\x4a\x00\xc0\x08\x09\x7f\x6b\x9e\xa5\x04\x00\
+\x8c\x88\xf0\xb7\x16\x59\x4a\x00\xc0\x08\x08\x7f\x6b\x99\xa5\x04\
+\x00\x34\x4c\xf8\x5b\xab\x2c\x25\x60\xcd\xf6\x94\x1e\x00\x18\xa5\
+\x03\x49\xae\x48\xf2\xd4\xd2\x83\xd0\xb4\x7b\x92\xbc\x32\xc9\x87\
+\x4b\x0f\x32\x46\x0a\x00\xd0\x37\xe1\x4f\x9f\x94\x80\x35\x51\x00\
+\x80\x3e\x09\x7f\xd6\x41\x09\x58\x03\x05\x00\xe8\x8b\xf0\x67\x9d\
+\x94\x80\x9e\x29\x00\x40\x1f\x84\x3f\x43\x50\x02\x7a\xa4\x00\x00\
+\xab\x12\xfe\x0c\x49\x09\xe8\x89\x02\x00\xac\x42\xf8\x53\x82\x12\
+\xd0\x03\x05\x00\x58\x96\xf0\xa7\x24\x25\x60\x45\x0a\x00\xb0\x0c\
+\xe1\x4f\x0d\x94\x80\x15\x28\x00\xc0\xa2\x84\x3f\x35\x51\x02\x96\
+\xa4\x00\x00\x8b\x10\xfe\xd4\x48\x09\x58\x82\x02\x00\xcc\x4b\xf8\
+\x53\x33\x25\x60\x41\x0a\x00\x30\x0f\xe1\x4f\x0b\x94\x80\x05\x28\
+\x00\xc0\x6e\x84\x3f\x2d\x51\x02\xe6\xa4\x00\x00\x3b\x11\xfe\xb4\
+\x48\x09\x98\x83\x02\x00\x6c\x47\xf8\xd3\x32\x25\x60\x17\x0a\x00\
+\xb0\x15\xe1\xcf\x18\x28\x01\x3b\x50\x00\x80\xe3\x09\x7f\xc6\x44\
+\x09\xd8\x86\x02\x00\x6c\x26\xfc\x19\x23\x25\x60\x0b\x0a\x00\x30\
+\x23\xfc\x19\x33\x25\xe0\x38\x0a\x00\x90\x08\x7f\xa6\x41\x09\xd8\
+\x44\x01\x00\x84\x3f\x53\xa2\x04\x6c\x50\x00\x60\xda\x84\x3f\x53\
+\xa4\x04\x44\x01\x80\x29\x13\xfe\x4c\xd9\xe4\x4b\x80\x02\x00\xd3\
+\x24\xfc\x61\xe2\x25\x40\x01\x80\xe9\x11\xfe\x70\xd4\x64\x4b\x80\
+\x02\x00\xd3\x22\xfc\xe1\x44\x93\x2c\x01\x0a\x00\x4c\x87\xf0\x87\
+\xed\x4d\xae\x04\x28\x00\x30\x0d\xc2\x1f\x76\x37\xa9\x12\xa0\x00\
+\xc0\xf8\x1d\x48\xf2\x77\x49\x9e\x52\x7a\x10\x68\xc0\x64\x4a\x80\
+\x02\x00\xe3\x26\xfc\x61\x71\x93\x28\x01\x0a\x00\x8c\x97\xf0\x87\
+\xe5\x8d\xbe\x04\x28\x00\x30\x4e\xc2\x1f\x56\x37\xea\x12\xa0\x00\
+\xc0\xf8\x08\x7f\xe8\xcf\x68\x4b\x80\x02\x00\xe3\x22\xfc\xa1\x7f\
+\xa3\x2c\x01\x0a\x00\x8c\x87\xf0\x87\xf5\x19\x5d\x09\x50\x00\x60\
+\x1c\x84\x3f\xac\xdf\xa8\x4a\x80\x02\x00\xed\x13\xfe\x30\x9c\xd1\
+\x94\x00\x05\x00\xda\x26\xfc\x61\x78\xa3\x28\x01\x0a\x00\xb4\x4b\
+\xf8\x43\x39\xcd\x97\x00\x05\x00\xda\x24\xfc\xa1\xbc\xa6\x4b\x80\
+\x02\x00\xed\x11\xfe\x50\x8f\x66\x4b\x80\x02\x00\x6d\x11\xfe\x50\
+\x9f\x26\x4b\x80\x02\x00\xed\x10\xfe\x50\xaf\xe6\x4a\x80\x02\x00\
+\x6d\x10\xfe\x50\xbf\xa6\x4a\x80\x02\x00\xf5\x13\xfe\xd0\x8e\x66\
+\x4a\x80\x02\x00\x75\x13\xfe\xd0\x9e\x26\x4a\x80\x02\x00\xf5\x12\
+\xfe\xd0\xae\xea\x4b\x80\x02\x00\x75\x12\xfe\xd0\xbe\xaa\x4b\x80\
+\x02\x00\xf5\x11\xfe\x30\x1e\xd5\x96\x00\x05\x00\xea\x22\xfc\x61\
+\x7c\xaa\x2c\x01\x0a\x00\xd4\x43\xf8\xc3\x78\x55\x57\x02\x14\x00\
+\xa8\x83\xf0\x87\xf1\xab\xaa\x04\x28\x00\x50\x9e\xf0\x87\xe9\xa8\
+\xa6\x04\x28\x00\x50\x96\xf0\x87\xe9\xa9\xa2\x04\x28\x00\x50\x8e\
+\xf0\x87\xe9\x2a\x5e\x02\x14\x00\x28\x43\xf8\x03\x45\x4b\x80\x02\
+\x00\xc3\x13\xfe\xc0\x4c\xb1\x12\xa0\x00\xc0\xb0\x84\x3f\x70\xbc\
+\x22\x25\x40\x01\x80\xe1\x08\x7f\x60\x3b\x83\x97\x00\x05\x00\x86\
+\x21\xfc\x81\xdd\x0c\x5a\x02\x14\x00\x58\x3f\xe1\x0f\xcc\x6b\xb0\
+\x12\xa0\x00\xc0\x7a\x09\x7f\x60\x51\x83\x94\x00\x05\x00\xd6\x47\
+\xf8\x03\xcb\x5a\x7b\x09\x50\x00\x60\x3d\x84\x3f\xb0\xaa\xb5\x96\
+\x00\x05\x00\xfa\x77\x6e\x92\x8f\x24\x79\x52\xe9\x41\x80\xe6\xfd\
+\x30\xc9\xcb\x92\x7c\xb4\xef\x77\xac\x00\x40\xbf\xfc\xcb\x1f\xe8\
+\xdb\xdd\x49\x5e\x92\xe4\xe3\x7d\xbe\x53\x05\x00\xfa\x23\xfc\x81\
+\x75\xb9\x3d\xc9\xa5\x49\x3e\xdd\xd7\x3b\x54\x00\xa0\x1f\xb6\xfd\
+\x81\x75\xbb\x39\xc9\xb3\x93\x7c\xbd\x8f\x77\xb6\xb7\x8f\x77\x02\
+\x13\x77\x20\xc9\x15\x11\xfe\xc0\x7a\x9d\x97\xe4\x7d\x49\xce\xe8\
+\xe3\x9d\x29\x00\xb0\x1a\xdb\xfe\xc0\x90\x9e\x9c\xe4\xed\x49\x4e\
+\x5e\xf5\x1d\x9d\xb4\xfa\x2c\x30\x59\xc2\x1f\x28\xe1\x71\x49\x4e\
+\x4f\xf2\xc1\x55\xde\x89\x02\x00\xcb\x11\xfe\x40\x49\xcf\x49\xf2\
+\xc5\x8d\xb5\x14\x17\x01\xc2\xe2\x84\x3f\x50\x83\xbb\x92\x3c\x2b\
+\x4b\x96\x00\x05\x00\x16\x23\xfc\x81\x9a\x7c\x21\xc9\x3f\x4e\xf2\
+\xa3\x45\x7f\xa3\x23\x00\x98\xdf\x81\x24\x7f\x9f\xee\x22\x1c\x80\
+\x1a\x1c\x48\xf2\x80\x2c\xf1\xb8\x60\x77\x01\xc0\xfc\x6e\x4f\x72\
+\x7d\xe9\x21\x00\x8e\xf3\x1b\x49\x9e\xbf\xe8\x6f\x72\x04\x00\x8b\
+\xd9\x9f\xe4\xf2\x24\x2f\x2e\x3d\x08\xc0\x26\x5f\x49\x72\x41\xba\
+\x17\x10\x9a\x8b\x23\x00\x58\xcc\xfd\x49\xde\x99\xe4\xe9\x49\x1e\
+\x5f\x78\x16\x80\x99\xb3\x92\x1c\x49\xf7\x44\xd2\xb9\xd8\x01\x80\
+\xe5\xec\x4b\xf2\xae\x24\x2f\x2f\x3d\x08\xc0\x86\x83\x49\x7e\x3a\
+\x73\xde\x15\xe0\x1a\x00\x58\xce\xbd\x49\x5e\x9f\x15\x1f\xc4\x01\
+\xd0\xa3\x53\x92\xfc\xe1\xbc\x6f\xec\x08\x00\x96\xe7\x38\x00\xa8\
+\xcd\xa3\xd3\xbd\x62\xe0\x97\x77\x7b\x43\x47\x00\xb0\x3a\xc7\x01\
+\x40\x4d\xae\x4b\xf2\xb4\x24\xf7\xed\xf4\x46\x76\x00\x60\x75\x87\
+\x92\xfc\x55\x92\x67\x26\x79\x6c\xe1\x59\x00\xce\x49\xf2\xcd\x24\
+\xd7\xec\xf4\x46\x76\x00\xa0\x3f\x76\x02\x80\x5a\x7c\x23\xdd\x8b\
+\x06\x1d\xdc\xee\x0d\xec\x00\x40\x7f\x0e\x25\x79\x77\x5c\x13\x00\
+\x94\xf7\x90\x24\x37\x65\x87\x5d\x00\x3b\x00\xd0\x3f\x0f\x0b\x02\
+\x6a\xf0\xb5\x74\xff\x18\xd9\xf2\x5a\x00\xb7\x01\x42\xff\x7e\x94\
+\xe4\x95\x49\xde\x53\x7a\x10\x60\xd2\x1e\x95\xe4\x35\xdb\xfd\xa2\
+\x02\x00\xeb\x71\x6f\x92\xd7\x45\x09\x00\xca\xfa\xd5\xed\x7e\xc1\
+\x11\x00\xac\x97\x0b\x03\x81\xd2\x9e\x9d\xe4\x93\xc7\xff\xa4\x8b\
+\x00\x61\xbd\xdc\x22\x08\x94\x76\x52\xba\xeb\x92\x8e\x61\x07\x00\
+\x86\x61\x27\x00\x28\xe5\xee\x24\xe7\x25\xb9\x6b\xf3\x4f\xba\x06\
+\x00\x86\xe1\x9a\x00\xa0\x94\x07\x26\x79\xed\xf1\x3f\xa9\x00\xc0\
+\x70\xbc\x80\x10\x50\xca\x1b\x8f\xff\x09\x47\x00\x30\x3c\xc7\x01\
+\xc0\xd0\x0e\x25\x39\x3f\xc9\x2d\xb3\x9f\xb0\x03\x00\xc3\x73\x1c\
+\x00\x0c\xed\xa4\x74\xcf\x27\xf9\x31\x05\x00\xca\x70\x1c\x00\x0c\
+\xed\x98\x87\x02\x29\x00\x8c\xd1\xb9\x49\xfe\x24\xc9\x83\x4a\x0f\
+\xb2\x0b\x4f\x0c\x04\x86\xf4\x82\x24\xa7\xcd\x7e\xa0\x00\x30\x36\
+\x07\x92\x7c\x38\xc9\xbf\x4a\xf2\xfe\xd4\x5f\x02\x1c\x07\x00\x43\
+\xd9\x9f\xe4\x9f\xcc\x7e\xa0\x00\x30\x26\x07\x92\x5c\x91\xe4\xa9\
+\x1b\x3f\x7e\x6e\x94\x00\x80\xcd\x2e\x9b\xfd\x87\x02\xc0\x58\x1c\
+\x1f\xfe\x33\x2d\x95\x00\xd7\x04\x00\xeb\xf6\xc2\xd9\x7f\xb8\x0d\
+\x90\x31\xd8\x2e\xfc\x37\xbb\x2a\xc9\x4b\x92\xdc\x39\xc8\x44\xcb\
+\x73\x8b\x20\xb0\x4e\x87\x92\x9c\x91\xe4\x2e\x3b\x00\xb4\x6e\x9e\
+\xf0\x4f\xda\xda\x09\x70\x1c\x00\xac\xcb\x49\x49\x9e\x91\x38\x02\
+\xa0\x6d\xf3\x86\xff\x8c\x12\x00\xd0\xbd\x3a\xa0\x02\x40\xb3\x16\
+\x0d\xff\x19\x25\x00\x98\xba\xa7\x27\x0a\x00\x6d\x5a\x36\xfc\x67\
+\x94\x00\x60\xca\x9e\x92\xb8\x08\x90\xf6\xac\x1a\xfe\x9b\xb9\x30\
+\x10\x98\xa2\xfb\x92\x9c\xae\x00\xd0\x92\x3e\xc3\x7f\xa6\x95\x12\
+\xb0\x3f\xc9\xe5\x49\x5e\x5c\x7a\x10\x60\x14\x9e\xe2\x08\x80\x56\
+\xac\x23\xfc\x93\x76\x8e\x03\x3c\x36\x18\xe8\xd3\x23\x15\x00\x5a\
+\xb0\xae\xf0\x9f\x69\xa5\x04\xb8\x26\x00\xe8\x8b\x02\x40\xf5\xd6\
+\x1d\xfe\x33\x4a\x00\x30\x25\x3f\xa1\x00\x50\xb3\xa1\xc2\x7f\xa6\
+\xa5\x12\xe0\xb1\xc1\xc0\x2a\x1e\xa6\x00\x50\xab\xa1\xc3\x7f\xa6\
+\x95\x12\xe0\x9a\x00\x60\x15\x67\x29\x00\xd4\xa8\x54\xf8\xcf\xb4\
+\x52\x02\x1c\x07\x00\xcb\x3a\x5b\x01\xa0\x36\xa5\xc3\x7f\xa6\xa5\
+\x12\xe0\x38\x00\x58\xd4\x99\x0a\x00\x35\xa9\x25\xfc\x67\x5a\x29\
+\x01\x8e\x03\x80\x45\x9d\xa6\x00\x50\x8b\xda\xc2\x7f\xa6\x95\x12\
+\xe0\x38\x00\x58\xc4\x29\x0a\x00\x35\xa8\x35\xfc\x67\x94\x00\x60\
+\x6c\x14\x00\x8a\xab\x3d\xfc\x67\x5a\x2a\x01\xae\x09\x00\x76\x73\
+\xb2\x02\x40\x49\xad\x84\xff\x4c\x2b\x25\xc0\x35\x01\xc0\x6e\x0e\
+\x2a\x00\x94\xd2\x5a\xf8\xcf\xb4\x52\x02\x1c\x07\x00\x3b\x51\x00\
+\x28\xa2\xd5\xf0\x9f\x69\xa9\x04\x38\x0e\x00\xb6\xa2\x00\x30\xb8\
+\xd6\xc3\x7f\xa6\x95\x12\xe0\x38\x00\xd8\xca\x1d\x0a\x00\x43\x1a\
+\x4b\xf8\xcf\xb4\x52\x02\x1c\x07\x00\xc7\xfb\xbe\x02\xc0\x50\xc6\
+\x16\xfe\x33\x4a\x00\xd0\xa2\x5b\x15\x00\x86\x30\xd6\xf0\x9f\x69\
+\xa9\x04\xb8\x26\x00\x48\xec\x00\x30\x80\xb1\x87\xff\x4c\x2b\x25\
+\xc0\x35\x01\x40\x92\x7c\x43\x01\x60\x9d\xa6\x12\xfe\x33\xad\x94\
+\x00\xc7\x01\xc0\xd7\x15\x00\xd6\x65\x6a\xe1\x3f\xa3\x04\x00\x2d\
+\xb8\x71\x4f\xe9\x09\x18\xa5\xa9\x86\xff\x66\x57\x25\x79\x49\x92\
+\x3b\x4b\x0f\xb2\x8b\xfd\x49\x2e\x4f\xf2\xe2\xd2\x83\x00\x83\x7a\
+\x84\x02\x40\xdf\x84\xff\x51\xad\x94\x80\x7d\x49\xde\x95\xe4\xe5\
+\xa5\x07\x01\x06\x71\x47\x92\x33\x1c\x01\xd0\x27\xe1\x7f\x2c\xc7\
+\x01\x40\x8d\xbe\x90\xe4\x88\x02\x40\x5f\x84\xff\xd6\x5a\x2a\x01\
+\x6e\x11\x84\x69\xf8\x42\x92\x28\x00\xf4\x41\xf8\xef\xac\x95\x12\
+\xe0\x16\x41\x98\x86\x4f\x25\x0a\x00\xab\x13\xfe\xf3\x69\xa5\x04\
+\x38\x0e\x80\xf1\xbb\x3a\x49\x5c\x04\xc8\x2a\x84\xff\xe2\x5c\x18\
+\x08\x94\x74\x67\x92\x33\x93\x1c\xb2\x03\xc0\xb2\x84\xff\x72\x5a\
+\xda\x09\x70\x4d\x00\x8c\xcf\x55\x49\x0e\x25\x8e\x00\x58\x8e\xf0\
+\x5f\x4d\x2b\x25\xc0\x35\x01\x30\x3e\x1f\x9a\xfd\x87\x02\xc0\xa2\
+\x84\x7f\x3f\x5a\x29\x01\xae\x09\x80\x71\xf9\x71\x01\x70\x0d\x00\
+\x8b\x10\xfe\xfd\x6b\xe5\x9a\x00\x4f\x0c\x84\xf6\x7d\x27\xc9\x43\
+\x93\x1c\x49\xec\x00\x30\x3f\xe1\xbf\x1e\xad\xec\x04\x38\x0e\x80\
+\xf6\x5d\x9e\x8d\xf0\x4f\x14\x00\xe6\x23\xfc\xd7\xab\x95\x12\xe0\
+\x38\x00\xda\xf6\xee\xcd\x3f\x70\x04\xc0\x6e\x84\xff\x70\x5a\x39\
+\x0e\x70\x8b\x20\xb4\xe7\xb6\x24\xe7\x26\x39\x38\xfb\x09\x3b\x00\
+\xec\x44\xf8\x0f\xab\xa5\x9d\x00\xb7\x08\x42\x5b\xfe\x2a\x9b\xc2\
+\x3f\x51\x00\xd8\x9e\xf0\x2f\xa3\x95\x12\xe0\x9a\x00\x68\xcb\x7f\
+\x3b\xfe\x27\x1c\x01\xb0\x95\x03\x49\xfe\x2e\xc9\x53\x4a\x0f\x32\
+\x61\x8e\x03\x80\xbe\x7c\x35\xc9\x63\xb3\xe9\x02\xc0\xc4\x0e\x00\
+\x27\x12\xfe\x75\x68\x65\x27\xc0\x71\x00\xd4\xef\x4f\x73\x5c\xf8\
+\x27\x76\x00\x38\x96\xf0\xaf\x8f\x9d\x00\x60\x15\xf7\x26\x79\x54\
+\x92\x9b\x8f\xff\x05\x3b\x00\xcc\x08\xff\x3a\xb5\xb4\x13\xe0\x16\
+\x41\xa8\xcf\xff\xcc\x16\xe1\x9f\xd8\x01\xa0\x23\xfc\xeb\xd7\xca\
+\x4e\x80\x27\x06\x42\x5d\x2e\x4c\xf2\x0f\x5b\xfd\x82\x1d\x00\x84\
+\x7f\x1b\x5a\xd9\x09\x70\x77\x00\xd4\xe3\x03\xd9\x26\xfc\x13\x3b\
+\x00\x53\x27\xfc\xdb\xd3\xca\x4e\x80\x6b\x02\xa0\xbc\x4b\x92\xfc\
+\xef\xed\x7e\xd1\x0e\xc0\x74\x09\xff\x36\xb5\xb2\x13\xe0\x9a\x00\
+\x28\xeb\xc3\xd9\x21\xfc\x13\x3b\x00\x53\x25\xfc\xdb\xd7\xca\x4e\
+\x80\x6b\x02\x60\x78\x47\x92\x5c\x9c\xe4\xea\x9d\xde\xc8\x0e\xc0\
+\xf4\x08\xff\x71\x68\x65\x27\xc0\x35\x01\x30\xbc\x77\x66\x97\xf0\
+\x4f\xec\x00\x4c\x8d\xf0\x1f\x9f\x56\x76\x02\x5c\x13\x00\xc3\x38\
+\x98\xee\x7b\xfc\x57\x76\x7b\x43\x3b\x00\xd3\x21\xfc\xc7\xa9\x95\
+\x9d\x00\x4f\x0c\x84\x61\xbc\x2d\x73\x84\x7f\x62\x07\x60\x2a\x84\
+\xff\xf8\xd9\x09\x00\x6e\x4c\xf7\x7d\xfe\xae\x79\xde\xd8\x0e\xc0\
+\xf8\x09\xff\x69\x68\x69\x27\xc0\xdd\x01\xb0\x1e\x6f\xc9\x9c\xe1\
+\x9f\xd8\x01\x18\x3b\xe1\x3f\x3d\xad\xec\x04\xb8\x3b\x00\xfa\xf5\
+\xee\x24\xaf\x5d\xe4\x37\x28\x00\xe3\x25\xfc\xa7\xab\x95\x12\xe0\
+\x38\x00\xfa\xf1\xdd\x24\x4f\x4b\xf2\x9d\x45\x7e\x93\x23\x80\x71\
+\x12\xfe\xd3\xe6\x38\x00\xa6\xe5\x97\xb2\x60\xf8\x27\x0a\xc0\x18\
+\x09\x7f\x92\xb6\x4a\x80\xbb\x03\x60\x79\xff\x39\x4b\x96\x68\x47\
+\x00\xe3\x22\xfc\x39\x9e\xe3\x00\x18\xaf\xcf\x24\x79\x4e\x92\x7b\
+\x96\xf9\xcd\x0a\xc0\x78\x08\x7f\xb6\xa3\x04\xc0\xf8\xdc\x96\xe4\
+\xa2\x24\x37\x2c\xfb\x0e\x1c\x01\x8c\x83\xf0\x67\x27\x8e\x03\x60\
+\x5c\x0e\x27\xf9\xc5\xac\x10\xfe\x89\x02\x30\x06\xc2\x9f\x79\xb4\
+\x52\x02\xbc\x76\x00\xec\xee\x5f\xa7\x87\xaf\x11\x47\x00\x6d\x13\
+\xfe\x2c\xca\x71\x00\xb4\xed\x8f\x93\xfc\x72\x1f\xef\x48\x01\x68\
+\x97\xf0\x67\x59\xad\x94\x00\x0f\x0b\x82\x63\xfd\x6d\xba\x1d\xb2\
+\xfb\xfb\x78\x67\x0a\x40\x9b\x84\x3f\xab\x6a\xa5\x04\xd8\x09\x80\
+\xce\x55\xe9\xca\xf0\xdd\x7d\xbd\x43\x05\xa0\x3d\xc2\x9f\xbe\x28\
+\x01\xd0\x86\x6b\x93\xbc\x20\xdd\x95\xff\xbd\x51\x00\xda\x22\xfc\
+\xe9\x5b\x2b\x25\xc0\x71\x00\x53\xf5\xd9\x24\x97\x26\xf9\x7e\xdf\
+\xef\xd8\x5d\x00\xed\x10\xfe\xac\x83\xbb\x03\xa0\x5e\x9f\x4d\xf2\
+\xc2\xac\x21\xfc\x13\x3b\x00\xad\x10\xfe\xac\x5b\x2b\x3b\x01\x8e\
+\x03\x98\x8a\x59\xf8\x7f\x6f\x5d\x7f\x80\x02\x50\x3f\xe1\xcf\x50\
+\x94\x00\xa8\xc3\xda\xc3\x3f\x51\x00\x6a\x27\xfc\x19\x9a\x12\x00\
+\x65\x0d\x12\xfe\x89\x02\x50\x33\xe1\x4f\x29\x4a\x00\x94\x31\x58\
+\xf8\x27\x0a\x40\xad\x84\x3f\xa5\x29\x01\x30\xac\x41\xc3\x3f\x51\
+\x00\x6a\x24\xfc\xa9\x85\x12\x00\xc3\x18\x3c\xfc\x13\x05\xa0\x36\
+\xc2\x9f\xda\x28\x01\xb0\x5e\x45\xc2\x3f\x51\x00\x6a\x22\xfc\xa9\
+\x95\x12\x00\xeb\x51\x2c\xfc\x13\x05\xa0\x16\xc2\x9f\xda\x29\x01\
+\xd0\xaf\xa2\xe1\x9f\x28\x00\x35\x10\xfe\xb4\x42\x09\x80\x7e\x14\
+\x0f\xff\x44\x01\x28\x4d\xf8\xd3\x1a\x25\x00\x56\x53\x45\xf8\x27\
+\x0a\x40\x49\xc2\x9f\x56\x29\x01\xb0\x9c\x6a\xc2\x3f\x51\x00\x4a\
+\x11\xfe\xb4\x4e\x09\x80\xc5\x54\x15\xfe\x89\x02\x50\x82\xf0\x67\
+\x2c\x94\x00\x98\x4f\x75\xe1\x9f\x28\x00\x43\x13\xfe\x8c\x8d\x12\
+\x00\x3b\xab\x32\xfc\x13\x05\x60\x48\xc2\x9f\xb1\x52\x02\x60\x6b\
+\xd5\x86\x7f\xa2\x00\x0c\x45\xf8\x33\x76\x4a\x00\x1c\xab\xea\xf0\
+\x4f\x14\x80\x21\x08\x7f\xa6\x42\x09\x80\x4e\xf5\xe1\x9f\x28\x00\
+\xeb\x26\xfc\x99\x1a\x25\x80\xa9\x6b\x22\xfc\x13\x05\x60\x9d\x0e\
+\x24\xf9\xfb\x24\x4f\x2a\x3c\x07\x0c\xed\xca\x24\x2f\x8d\x12\xc0\
+\xf4\x34\x13\xfe\x49\xb2\xb7\xf4\x00\x23\x75\x46\x92\xbf\x8d\xf0\
+\x67\x9a\x2e\x4e\xf2\xfe\x24\x0f\x2e\x3d\xc8\x2e\xee\x4d\xf2\xba\
+\x24\xef\x29\x3d\x08\xa3\xd0\x54\xf8\x27\x0a\xc0\x3a\x3c\x38\xc9\
+\x07\x92\x5c\x58\x7a\x10\x28\xe8\xb9\xe9\x4a\xb0\x12\xc0\x14\x34\
+\x17\xfe\x89\x02\xd0\xb7\x7d\x49\x2e\x4f\xf2\xcc\xd2\x83\x40\x05\
+\x9e\x9b\xe4\x7d\x49\x1e\x54\x7a\x90\x5d\x28\x01\xac\xa2\xc9\xf0\
+\x4f\x14\x80\x3e\xed\x49\xf2\x5f\x92\x3c\xbf\xf0\x1c\x50\x13\xc7\
+\x01\x8c\x59\xb3\xe1\x9f\x28\x00\x7d\xfa\xad\x24\xbf\x58\x7a\x08\
+\xa8\x90\xe3\x00\xc6\xa8\xe9\xf0\x4f\xdc\x05\xd0\x97\x37\x24\x79\
+\x7b\x7c\x3c\x61\x27\xee\x0e\x60\x2c\x9a\x0f\xff\x44\x60\xf5\xe1\
+\x09\x49\x3e\x95\xfa\xff\x75\x03\x35\xb8\x2a\x5d\x09\xb8\xa3\xf4\
+\x20\xbb\x50\x02\xd8\xce\x28\xc2\x3f\x71\x04\xb0\xaa\xd3\x93\xbc\
+\x3b\xc2\x1f\xe6\xe5\x38\x80\x96\x8d\x26\xfc\x13\x05\x60\x55\x7f\
+\x94\xe4\xc9\xa5\x87\x80\xc6\xb8\x3b\x80\x16\x8d\x2a\xfc\x13\x47\
+\x00\xab\x78\x4d\x92\xbf\x2c\x3d\x04\x34\xcc\x71\x00\xad\x18\x5d\
+\xf8\x27\x0a\xc0\xb2\xce\x4f\xf2\xb9\x24\x67\x95\x1e\x04\x1a\xa7\
+\x04\x50\xbb\x51\x86\x7f\xe2\x08\x60\x59\xff\x35\xc2\x1f\xfa\xe0\
+\x38\x80\x9a\x8d\x36\xfc\x13\x05\x60\x19\x3f\x97\xee\x5f\x2c\x40\
+\x3f\x3c\x2c\x88\x1a\x8d\x3a\xfc\x13\x47\x00\x8b\x7a\x48\x92\x2f\
+\xa6\x3b\x02\x00\xfa\xe5\x38\x80\x5a\x8c\x3e\xfc\x13\x3b\x00\x8b\
+\xfa\xbd\x08\x7f\x58\x17\xc7\x01\xd4\x60\x12\xe1\x9f\xd8\x01\x58\
+\xc4\x13\xd3\x5d\xf8\x77\x72\xe9\x41\x60\xe4\xec\x04\x50\xca\x64\
+\xc2\x3f\xb1\x03\xb0\x88\x7f\x1f\xe1\x0f\x43\xf0\xb0\x20\x4a\x98\
+\x54\xf8\x27\x76\x00\xe6\x75\x69\x92\x2b\x4a\x0f\x01\x13\xe3\xb5\
+\x03\x18\xca\xe4\xc2\x3f\x51\x00\xe6\xf5\xb1\x24\xcf\x2b\x3d\x04\
+\x4c\x90\xe3\x00\xd6\x6d\x92\xe1\x9f\x38\x02\x98\xc7\x8b\x22\xfc\
+\xa1\x14\xc7\x01\xac\xd3\x64\xc3\x3f\xb1\x03\x30\x8f\x8f\x26\xb9\
+\xa4\xf4\x10\x30\x71\x76\x02\xe8\xdb\xa4\xc3\x3f\x51\x00\x76\xf3\
+\x9c\x74\xdf\x78\x80\xf2\x94\x00\xfa\x32\xf9\xf0\x4f\x1c\x01\xec\
+\xe6\xad\xa5\x07\x00\x7e\xcc\x71\x00\x7d\x10\xfe\x1b\xec\x00\x6c\
+\xef\xfc\x24\x5f\x4b\xf2\x80\xc2\x73\x00\xc7\xb2\x13\xc0\xb2\x84\
+\xff\x26\x76\x00\xb6\xf7\x2b\x11\xfe\x50\x23\x4f\x0c\x64\x19\xc2\
+\xff\x38\x76\x00\xb6\xb6\x37\xc9\x0d\x49\x1e\x59\x7a\x10\x60\x5b\
+\x76\x02\x98\x97\xf0\xdf\x82\x1d\x80\xad\x5d\x1a\xe1\x0f\xb5\x73\
+\x4d\x00\xf3\x10\xfe\xdb\x50\x00\xb6\xf6\x2f\x4b\x0f\x00\xcc\xc5\
+\x71\x00\x3b\x11\xfe\x3b\x70\x04\x70\xa2\x7d\x49\xbe\x9b\xfa\xbf\
+\xa1\x00\x47\x39\x0e\xe0\x78\xc2\x7f\x17\x76\x00\x4e\xf4\xb3\x11\
+\xfe\xd0\x1a\xc7\x01\x6c\x26\xfc\xe7\xa0\x00\x9c\xe8\x35\xa5\x07\
+\x00\x96\xa2\x04\x90\x08\xff\xb9\x39\x02\x38\xd6\xde\x24\xb7\x24\
+\x39\xbb\xf4\x20\xc0\xd2\xbc\x8a\xe0\x74\x09\xff\x05\xd8\x01\x38\
+\xd6\x85\x11\xfe\xd0\xba\x8b\x93\xbc\x3f\x76\x02\xa6\x46\xf8\x2f\
+\x48\x01\x38\xd6\x65\xa5\x07\x00\x7a\xe1\x38\x60\x5a\x84\xff\x12\
+\x14\x80\x63\xbd\xa8\xf4\x00\x40\x6f\xdc\x22\x38\x0d\xc2\x7f\x49\
+\xae\x01\x38\xea\xa4\x24\xb7\x27\x79\x60\xe9\x41\x80\x5e\xb9\x45\
+\x70\xbc\x84\xff\x0a\xec\x00\x1c\x75\x41\x84\x3f\x8c\x91\xe3\x80\
+\x71\x12\xfe\x2b\x52\x00\x8e\x7a\x76\xe9\x01\x80\xb5\x51\x02\xc6\
+\x45\xf8\xf7\x40\x01\x38\xea\xa2\xd2\x03\x00\x6b\xe5\x9a\x80\x71\
+\x10\xfe\x3d\x51\x00\x8e\x7a\x6a\xe9\x01\x80\xb5\x73\x8b\x60\xdb\
+\x84\x7f\x8f\x5c\x04\xd8\xd9\x93\xe4\xb6\xd4\xff\x4d\x01\xe8\x87\
+\x0b\x03\xdb\x23\xfc\x7b\x66\x07\xa0\xf3\x88\x08\x7f\x98\x12\xc7\
+\x01\x6d\x11\xfe\x6b\xa0\x00\x74\x1e\x57\x7a\x00\x60\x70\x8e\x03\
+\xda\x20\xfc\xd7\x44\x01\xe8\xfc\x44\xe9\x01\x80\x22\xdc\x1d\x50\
+\x37\xe1\xbf\x46\x0a\x40\x47\x01\x80\xe9\x52\x02\xea\x24\xfc\xd7\
+\x4c\x01\xe8\x3c\xac\xf4\x00\x40\x51\xae\x09\xa8\x8b\xf0\x1f\x80\
+\x02\xd0\x39\xa7\xf4\x00\x40\x71\xae\x09\xa8\x83\xf0\x1f\x88\x02\
+\xd0\x39\xab\xf4\x00\x40\x15\x1c\x07\x94\x25\xfc\x07\xa4\x00\x74\
+\xce\x2e\x3d\x00\x50\x0d\x25\xa0\x0c\xe1\x3f\x30\x05\xa0\xe3\x45\
+\x80\x80\xcd\x94\x80\x61\x09\xff\x02\x14\x80\xce\x29\xa5\x07\x00\
+\xaa\xa3\x04\x0c\x43\xf8\x17\xa2\x00\x74\x14\x00\x60\x2b\x4a\xc0\
+\x7a\x09\xff\x82\x14\x80\xce\x03\x4a\x0f\x00\x54\xcb\x2d\x82\xeb\
+\x21\xfc\x0b\x53\x00\x3a\xf7\x97\x1e\x00\xa8\x9a\x5b\x04\xfb\x25\
+\xfc\x2b\xa0\x00\x74\xee\x2b\x3d\x00\x50\x3d\xc7\x01\xfd\x10\xfe\
+\x95\x50\x00\x3a\x07\x4b\x0f\x00\x34\x41\x09\x58\x8d\xf0\xaf\x88\
+\x02\xd0\xf9\x61\xe9\x01\x80\x66\xb8\x26\x60\x39\xc2\xbf\x32\x0a\
+\x40\xe7\xfb\xa5\x07\x00\x9a\xe2\x9a\x80\xc5\x08\xff\x0a\x29\x00\
+\x9d\x5b\x4b\x0f\x00\x34\xc7\x71\xc0\x7c\x84\x7f\xa5\x14\x80\x8e\
+\x02\x00\x2c\xc3\x71\xc0\xce\x84\x7f\xc5\x14\x80\xce\x37\x4b\x0f\
+\x00\x34\xcb\x71\xc0\xd6\x84\x7f\xe5\x14\x80\xce\x37\x4a\x0f\x00\
+\x34\xcd\x71\xc0\xb1\x84\x7f\x03\x14\x80\xce\x8d\xa5\x07\x00\x9a\
+\xa7\x04\x74\x84\x7f\x23\x14\x80\xce\x57\x4b\x0f\x00\x8c\xc2\xd4\
+\xaf\x09\x10\xfe\x0d\xd9\x53\x7a\x80\x4a\x9c\x9c\xe4\xae\x24\xfb\
+\x4a\x0f\x02\x8c\xc2\x55\x49\x5e\x9a\xe4\x8e\xd2\x83\xec\x62\x5f\
+\x92\x77\x25\x79\x79\x0f\xef\x4b\xf8\x37\xc6\x0e\x40\xe7\xfe\x24\
+\xd7\x95\x1e\x02\x18\x8d\xa9\x1d\x07\x08\xff\x06\x29\x00\x47\x7d\
+\xa1\xf4\x00\xc0\xa8\x4c\xe5\x38\x40\xf8\x37\x4a\x01\x38\xea\xd3\
+\xa5\x07\x00\x46\x67\xec\xb7\x08\x0a\xff\x86\x29\x00\x47\x7d\xa2\
+\xf4\x00\xc0\x28\x8d\xf5\x38\x40\xf8\x37\xce\x45\x80\x47\x9d\x9a\
+\xe4\xb6\x24\xa7\x94\x1e\x04\x18\xa5\x31\x5d\x18\x28\xfc\x47\xc0\
+\x0e\xc0\x51\xf7\x24\xf9\x4c\xe9\x21\x80\xd1\x1a\xcb\x35\x01\xc2\
+\x7f\x24\x14\x80\x63\x5d\x51\x7a\x00\x60\xd4\x5a\xbf\x26\x40\xf8\
+\x8f\x88\x02\x70\xac\x0f\x97\x1e\x00\x18\xbd\x56\xaf\x09\x10\xfe\
+\x23\xe3\x1a\x80\x63\xed\x4f\xf2\xfd\x24\xa7\x95\x1e\x04\x18\xbd\
+\x56\xae\x09\xd8\x9f\xe4\x0f\x92\xfc\x4e\x84\xff\xa8\x28\x00\x27\
+\xba\x3c\xc9\x2b\x4b\x0f\x01\x4c\x42\x2b\x25\x80\x11\x72\x04\x70\
+\xa2\x77\x97\x1e\x00\x98\x8c\x56\x8e\x03\x18\x21\x3b\x00\x27\x3a\
+\x23\xc9\x77\xe2\x76\x40\x60\x38\x76\x02\x18\x9c\x1d\x80\x13\xdd\
+\x96\xe4\x23\xa5\x87\x00\x26\xa5\x95\x5b\x04\x19\x11\x05\x60\x6b\
+\x7f\x56\x7a\x00\x60\x72\x5a\xb9\x45\x90\x91\x70\x04\xb0\xb5\xfd\
+\x49\xbe\x9d\xee\x38\x00\x60\x48\x8e\x03\x18\x84\x1d\x80\xad\xfd\
+\x28\xc9\xdb\x4b\x0f\x01\x4c\x92\xe3\x00\x06\xb1\x8e\x1d\x80\xd3\
+\x93\x9c\x95\xe4\x96\x74\x41\xda\xaa\xa7\xa6\x7b\xf0\x85\x5d\x12\
+\xa0\x04\x3b\x01\xac\xd5\xaa\xe1\x76\x4a\x92\x4b\x92\xfc\xd3\x24\
+\x2f\x4e\xf2\xa8\x1c\xfb\x10\x9d\xdb\x93\x7c\x29\xdd\x6d\x2e\xef\
+\x49\xf7\x92\xbb\x47\x56\xfc\x33\x87\xf4\x91\x24\xcf\x2f\x3d\x04\
+\x30\x59\x4a\x00\xd5\xd9\x9b\xe4\xf5\x49\xae\x4f\x17\xe8\xf3\xae\
+\x4f\x25\x79\x45\x81\x79\x97\xf5\xea\x2c\xf6\xf7\xb3\x2c\xcb\xea\
+\x7b\x5d\x19\x17\x06\x52\x89\x67\x27\xf9\xbf\x59\xed\x7f\xe8\x0f\
+\x26\x79\xf8\xd0\x83\x2f\xe1\xa4\x24\xd7\xa5\xfc\x37\x00\xcb\xb2\
+\xa6\xbd\x3e\x1e\xd7\x04\xd0\xb3\x45\x2f\x02\xfc\xe5\x24\x1f\x4b\
+\xf2\xc4\x15\xff\xdc\xcb\x92\x5c\x9b\xee\xb6\x97\x9a\x1d\x4a\xf2\
+\x7b\xa5\x87\x00\x26\xcf\x2d\x82\xf4\x6e\x91\x6b\x00\xde\x92\xe4\
+\x6d\x0b\xfe\x9e\xdd\xdc\x93\x6e\x9b\xfd\x83\x3d\xbe\xcf\xbe\x9d\
+\x94\xe4\x8b\x49\x1e\x5f\x7a\x10\x60\xf2\x5c\x13\x40\x6f\xe6\xdd\
+\x01\xf8\x67\x49\xfe\x43\xfa\xbf\x22\xfe\xd4\x74\x2f\xbe\xf3\xe2\
+\x9e\xdf\x6f\x9f\xec\x02\x00\xb5\x70\x8b\x20\xbd\x99\x27\xd0\x1f\
+\x96\xe4\x73\x49\xce\x5c\xe3\x1c\x3f\x4a\xf2\xaa\xd4\xbb\x13\xb0\
+\x37\xc9\xff\x49\x72\x61\xe9\x41\x00\x62\x27\x80\x1e\xcc\xb3\x03\
+\xf0\xdb\x59\x6f\xf8\x27\xdd\x93\xf7\xfe\x57\x92\x97\xaf\xf9\xcf\
+\x59\xd6\xe1\x24\xbf\x5e\x7a\x08\x80\x0d\x5e\x45\x90\x95\xed\xb6\
+\x03\xf0\x93\xe9\xce\xbf\x4f\x1e\x60\x96\x24\xb9\x37\xc9\xeb\xd2\
+\x3d\x33\xa0\x46\xef\x4d\xf2\xb2\xd2\x43\x00\x6c\xb8\x32\xdd\x4e\
+\xc0\x9d\xa5\x07\xa1\x3d\xbb\xed\x00\xfc\x5a\x86\x0b\xff\x24\xd9\
+\x97\xe4\x9d\xa9\xf7\x9a\x80\x5f\x4d\x77\xe1\x22\x40\x0d\xdc\x1d\
+\xc0\xd2\x76\x2a\x00\x7b\x52\xe6\xa1\x3d\x35\x1f\x07\x7c\x25\xc9\
+\xbf\x29\x3d\x04\xc0\x26\x8e\x03\x58\xca\x4e\x47\x00\x17\x26\xb9\
+\x66\xa8\x41\xb6\x50\xeb\x71\xc0\x29\xe9\x1e\x69\xfc\x94\xd2\x83\
+\x00\x6c\xe2\x38\x80\x85\xec\xb4\x03\xf0\xd3\x83\x4d\xb1\xb5\x7d\
+\x49\xde\x95\xfa\x76\x02\x0e\x26\x79\x63\x92\xfb\x4a\x0f\x02\xb0\
+\x89\xe3\x00\x16\xb2\x53\x01\x38\x6f\xb0\x29\xb6\x57\x6b\x09\xf8\
+\x74\x92\xdf\x2d\x3d\x04\xc0\x71\x4e\x4f\xb7\x4b\x09\xbb\xda\xa9\
+\x00\x1c\x18\x6c\x8a\x9d\xd5\x7a\x61\xe0\xbf\x4d\x72\x75\xe9\x21\
+\x00\x36\x7c\x36\xc9\x0b\x93\x7c\xaf\xf4\x20\xb4\x61\xa7\x02\x70\
+\x70\xb0\x29\x76\x57\xe3\x85\x81\xf7\x27\xf9\xb9\xf8\x62\x03\xca\
+\x13\xfe\x2c\x6c\xa7\x02\x70\xf3\x60\x53\xcc\xa7\xc6\xe3\x80\x1b\
+\x93\xfc\x7c\xba\xc7\x05\x03\x94\x20\xfc\x59\xca\x4e\x05\xe0\x5b\
+\x83\x4d\x31\xbf\x1a\x8f\x03\x3e\x14\xaf\x15\x00\x94\x21\xfc\x59\
+\xda\x4e\xb7\x01\x9e\x9f\xe4\xa6\x5d\xde\xa6\x94\xda\x6e\x11\xdc\
+\x9b\xae\x98\xbc\xa6\xf4\x20\xc0\x64\x08\x7f\x56\xb2\xdb\x0e\xc0\
+\xb5\x43\x0d\xb2\xa0\xda\x8e\x03\x0e\x27\xf9\x85\x24\x9f\x28\x3d\
+\x08\x30\x09\xc2\x9f\x95\xed\xf6\x28\xe0\xbf\x1c\x64\x8a\xe5\xd4\
+\x76\x1c\x70\x4f\xba\x97\x4d\xfe\x7a\xe9\x41\x80\x51\x13\xfe\xf4\
+\x62\xb7\xed\xfd\x87\x24\xb9\x3e\xc9\xd9\x03\xcc\xb2\xac\xda\x8e\
+\x03\x1e\x97\xe4\x63\x49\x1e\x5a\x7a\x10\x60\x74\x84\x3f\xbd\xd9\
+\x6d\x07\xe0\xf6\x24\xbf\x3f\xc4\x20\x2b\xa8\xed\x38\xe0\x2b\x49\
+\x7e\x36\xc9\xf7\x4b\x0f\x02\x8c\x8a\xf0\xa7\x57\xf3\x5c\xe0\xb7\
+\x3f\xc9\x27\x93\x5c\xb0\xe6\x59\x56\xf5\xa3\x24\xaf\x4a\xf2\xc1\
+\xd2\x83\x6c\x78\x66\xba\x3b\x04\x3c\x96\x13\x58\x95\xf0\xa7\x77\
+\xbb\xed\x00\x24\x5d\xb0\xbe\x21\xf5\xff\x8b\x76\x7f\x92\xcb\x53\
+\xcf\x35\x01\x9f\x4a\x72\x69\x92\x1f\x94\x1e\x04\x68\x9a\xf0\x67\
+\x2d\xe6\x29\x00\x49\x72\x5d\xba\x2d\xf6\xda\x5f\x65\x6a\x56\x02\
+\x5e\x58\x7a\x90\x0d\xd7\x24\xb9\x2c\x4a\x00\xb0\x1c\xe1\xcf\xda\
+\x2c\x7a\x8f\xff\xc5\xe9\x5e\x77\xfa\x41\x6b\x98\xa5\x4f\x77\x26\
+\x79\x5e\x92\xcf\x94\x1e\x64\xc3\x45\xe9\x8e\x03\xce\x2c\x3d\x08\
+\xd0\x0c\xe1\xcf\x5a\x2d\xf3\x90\x9f\x56\x4a\xc0\x75\xe9\x82\xf7\
+\xee\xd2\x83\x6c\x50\x02\x80\x79\x09\x7f\xd6\x6e\xde\x23\x80\xcd\
+\xae\x4c\xf2\x92\x24\x77\xf4\x3c\x4b\xdf\x9e\x90\xe4\xd7\x4a\x0f\
+\xb1\x89\xe3\x00\x60\x1e\xc2\x9f\x41\xac\xf2\x98\xdf\xe7\xa6\xdb\
+\x09\xa8\xf9\x2a\xf7\xdb\x93\x3c\x36\x75\x5d\xc0\x68\x27\x00\xd8\
+\x8e\xf0\x67\x30\xcb\xec\x00\xcc\x5c\x95\xe4\x65\xa9\xfb\xc2\xc0\
+\x87\x24\x79\x6b\xe9\x21\x8e\x63\x27\x00\xd8\x8a\xf0\x67\x50\xab\
+\x14\x80\xa4\x8d\xe3\x80\x57\x97\x1e\x60\x0b\x4a\x00\xb0\x99\xf0\
+\x67\x70\x7d\xbd\xd2\x5f\xed\xc7\x01\x8f\x4e\xf2\xb5\xd2\x43\x6c\
+\xc1\x71\x00\x20\xfc\x29\x62\xd5\x1d\x80\x99\xda\x8f\x03\x9e\x5b\
+\x7a\x80\x6d\xd8\x09\x80\x69\x13\xfe\x14\xd3\x57\x01\x48\xea\x3e\
+\x0e\x38\xbf\xf4\x00\x3b\x50\x02\x60\x9a\x84\x3f\x45\xf5\x59\x00\
+\x92\x6e\x27\xe0\xa5\xa9\xaf\x04\x9c\x57\x7a\x80\x5d\x28\x01\x30\
+\x2d\xc2\x9f\xe2\xfa\x2e\x00\x49\x9d\xc7\x01\x27\x97\x1e\x60\x0e\
+\x4a\x00\x4c\x83\xf0\xa7\x0a\xeb\x28\x00\x49\x7d\xc7\x01\xdf\x2a\
+\x3d\xc0\x9c\x94\x00\x18\x37\xe1\x4f\x35\xd6\x55\x00\x92\xba\x76\
+\x02\x6e\x2e\x3d\xc0\x02\x94\x00\x18\x27\xe1\x4f\x55\xd6\x59\x00\
+\x92\x7a\x76\x02\x3e\x55\xf8\xcf\x5f\x94\x12\x00\xe3\x22\xfc\xa9\
+\x4e\x5f\xcf\x01\xd8\x4d\xc9\xe7\x04\xdc\x90\xee\x71\xc0\x2d\xf2\
+\x9c\x00\x68\x9f\xf0\xa7\x4a\xeb\xde\x01\x98\x29\x79\x1c\x70\x79\
+\x81\x3f\xb3\x2f\x76\x02\xa0\x6d\xc2\x9f\x6a\x0d\xb5\x03\x30\x33\
+\xf4\x4e\xc0\xc1\x24\x4f\x4c\xf2\xd5\x81\xfe\xbc\x75\xb1\x13\x00\
+\xed\x11\xfe\x54\x6d\xa8\x1d\x80\x99\xa1\x9f\x13\xf0\x9f\xd2\x7e\
+\xf8\x27\x76\x02\xa0\x35\xc2\x9f\xea\x0d\xbd\x03\x30\x73\x71\xba\
+\x9d\x80\x07\xad\xf1\xcf\xb8\x39\xc9\xd3\x32\xae\x2f\x40\x3b\x01\
+\x50\x3f\xe1\x4f\x13\x86\xde\x01\x98\xb9\x32\xdd\x4e\xc0\xba\xae\
+\x09\xb8\x2f\xc9\x2f\x64\x7c\x5f\x80\x76\x02\xa0\x6e\xc2\x1f\xe6\
+\x74\x71\x92\xdb\x93\x1c\xe9\x71\x1d\x4a\xf2\x2f\x86\xfc\x4b\x14\
+\x70\x51\x92\x5b\xd3\xef\xc7\xcd\xb2\xac\xd5\xd6\x67\x92\x9c\x13\
+\x60\x6e\x4f\x4f\x72\x53\xfa\xf9\x02\xbc\x3b\xc9\x6b\x87\x1d\xbf\
+\x18\x25\xc0\xb2\xea\x59\xc2\x1f\x96\x74\x4e\x92\x77\x24\x39\x9c\
+\xe5\xbf\x00\xaf\x4e\xf2\xa4\xa1\x07\x2f\x4c\x09\xb0\xac\xf2\x4b\
+\xf8\x43\x0f\x9e\x96\xe4\x2f\xb2\xd8\x17\xdf\x17\x93\xbc\x3e\xe5\
+\x2e\x68\x2c\x4d\x09\xb0\xac\x72\x4b\xf8\xd3\xac\x5a\x43\xf3\x31\
+\x49\x5e\x9e\xee\x42\xc1\x27\xa6\x7b\x39\xdf\xfd\xe9\x2e\xee\xbb\
+\x25\xdd\xd3\xfd\x3e\x98\xe4\xbd\x49\xae\x4d\xf7\x85\x38\x65\xee\
+\x0e\x80\xe1\xb9\xe0\x8f\xa6\xd5\x5a\x00\xb6\xf2\xe0\x94\x7f\x4d\
+\x81\x9a\x29\x01\x30\x1c\xe1\x4f\xf3\x5a\x2a\x00\xec\x4e\x09\x80\
+\xf5\x13\xfe\x8c\x82\x02\x30\x3e\x4a\x00\xac\x8f\xf0\x67\x34\x14\
+\x80\x71\x52\x02\xa0\x7f\xc2\x9f\x51\x51\x00\xc6\x4b\x09\x80\xfe\
+\x08\x7f\x46\x47\x01\x18\x37\x25\x00\x56\x27\xfc\x19\x25\x05\x60\
+\xfc\x94\x00\x58\x9e\xf0\x67\xb4\x14\x80\x69\x50\x02\x60\x71\xc2\
+\x9f\x51\x53\x00\xa6\x43\x09\x80\xf9\x09\x7f\x46\x4f\x01\x98\x16\
+\x25\x00\x76\x27\xfc\x99\x04\x05\x60\x7a\x94\x00\xd8\x9e\xf0\x67\
+\x32\x14\x80\x69\x52\x02\xe0\x44\xc2\x9f\x49\x51\x00\xa6\x4b\x09\
+\x80\xa3\x84\x3f\x93\xa3\x00\x4c\x9b\x12\x00\xc2\x9f\x89\x52\x00\
+\x50\x02\x98\x32\xe1\xcf\x64\x29\x00\x24\x4a\x00\xd3\x24\xfc\x99\
+\x34\x05\x80\x19\x25\x80\x29\x11\xfe\x4c\x9e\x02\xc0\x66\x4a\x00\
+\x53\x20\xfc\x21\x0a\x00\x27\x52\x02\x18\x33\xe1\x0f\x1b\x16\x2d\
+\x00\xe7\x26\x79\x4e\x92\xc7\x24\x39\x23\xc9\x29\xbd\x4f\xb4\x98\
+\x83\x49\x6e\x4b\x72\x43\x92\xab\x92\xdc\x52\x76\x9c\xd1\x50\x02\
+\x18\x23\xe1\x0f\x0b\x3a\x33\xc9\x6f\x24\xb9\x32\xc9\xa1\x24\x47\
+\x2a\x5d\x87\x92\x7c\x3c\xc9\xaf\x47\x70\xf5\xe1\xa2\x24\xb7\xa6\
+\xfc\xe7\xd5\xb2\xfa\x58\x9f\x49\x72\x4e\x80\xb9\x9c\x92\xe4\xcd\
+\xe9\xfe\x55\x5d\xfa\x8b\x77\xd1\x75\x6b\x92\xdf\x4c\x72\x6a\xef\
+\x1f\x95\x69\x51\x02\xac\x31\x2c\xe1\x0f\x0b\x78\x4c\x92\xcf\xa7\
+\xfc\x17\xee\xaa\xeb\x4b\x49\x1e\xdf\xf3\xc7\x66\x6a\x94\x00\xab\
+\xe5\x25\xfc\x61\x01\x3f\x93\xee\x8c\xac\xf4\x17\x6e\x5f\xeb\xbb\
+\x49\x2e\xe9\xf5\x23\x34\x3d\x4a\x80\xd5\xe2\x12\xfe\xb0\x80\x9f\
+\x4a\x72\x67\xca\x7f\xe1\xf6\xbd\xee\x4c\x72\x41\x8f\x1f\xa7\x29\
+\x52\x02\xac\x96\x96\xf0\x87\x05\x9c\x93\xe4\xfa\x94\xff\xc2\x5d\
+\xd7\xfa\x5a\x92\x03\x7d\x7d\xb0\x26\x4a\x09\xb0\x5a\x58\xc2\x1f\
+\x16\xf4\xae\x94\xff\xc2\x5d\xf7\x7a\x47\x6f\x1f\xad\xe9\x52\x02\
+\xac\x9a\x97\xf0\x87\x05\x3d\x33\xc9\xe1\x94\xff\xe2\x5d\xf7\x3a\
+\x9c\xee\x39\x06\xac\x46\x09\xb0\x6a\x5c\xc2\x1f\x96\x70\x45\xca\
+\x7f\xf1\x0e\xb5\x3e\xd4\xd3\xc7\x6c\xea\x94\x00\xab\xa6\x25\xfc\
+\x61\x41\x7b\x92\x9c\x9f\xe4\xa6\x4c\xe7\xb1\xc0\x87\x93\x3c\x3c\
+\xc9\xb7\x4b\x0f\x32\x02\x9e\x18\x48\x0d\x3c\xe1\x0f\x96\xb0\x37\
+\xc9\xab\x32\x9d\xf0\x4f\xba\xbf\xf3\x2b\x4a\x0f\x31\x12\xd7\x24\
+\xb9\x2c\xc9\x0f\x4a\x0f\xc2\x64\x09\x7f\x58\xd2\xde\x24\x2f\x29\
+\x3d\x44\x01\x2f\x2d\x3d\xc0\x88\x28\x01\x94\x22\xfc\x61\x05\x7b\
+\x93\x3c\xb9\xf4\x10\x05\x4c\xf1\xef\xbc\x4e\x4a\x00\x43\x13\xfe\
+\xb0\xa2\xbd\x49\x1e\x5a\x7a\x88\x02\xce\x2b\x3d\xc0\x08\x29\x01\
+\x0c\x45\xf8\x43\x0f\xf6\x24\xb9\x3f\xc9\x49\xa5\x07\x19\xd8\xa1\
+\x24\x27\x97\x1e\x62\xa4\x5c\x18\xc8\x3a\x09\x7f\xe8\xc9\xde\x24\
+\xf7\x94\x1e\xa2\x80\xbb\x4b\x0f\x30\x62\x76\x02\x58\x17\xe1\x0f\
+\x3d\xda\x9b\xe4\x5b\xa5\x87\x28\x60\x8a\x7f\xe7\x21\x29\x01\xf4\
+\x4d\xf8\x43\xcf\xf6\xa6\x7b\xd9\xdf\xa9\x99\xe2\xdf\x79\x68\x4a\
+\x00\x7d\x11\xfe\xb0\x06\x7b\x93\xbc\xb7\xf4\x10\x05\xbc\xa7\xf4\
+\x00\x13\xa1\x04\xb0\x2a\xe1\x0f\x6b\xb2\x27\xdd\xe3\x33\x6f\xce\
+\x74\x2e\x04\x3c\x94\xee\x2e\x00\xdf\x50\x86\xe3\xc2\x40\x96\x21\
+\xfc\x61\x8d\xf6\xa6\xfb\xe2\x7a\x7f\xe9\x41\x06\xf4\xbe\xf8\x86\
+\x32\x34\x3b\x01\x2c\x4a\xf8\xc3\x40\x2e\x48\xf7\x2f\xe3\xd2\x2f\
+\xe8\xb1\xee\x75\x28\xc9\xd3\x7b\xfa\x98\xb1\x38\x2f\x20\x64\xcd\
+\xb3\xbc\xb0\x0f\x0c\xec\xcf\x52\xfe\x0b\x7f\xdd\xeb\x4f\x7b\xfb\
+\x68\xb1\x2c\x25\xc0\xda\x69\x09\x7f\x28\xe0\xc1\x49\xbe\x90\xf2\
+\xdf\x00\xd6\xb5\xbe\x94\xe4\x8c\xde\x3e\x5a\xac\x42\x09\xb0\xb6\
+\x5a\xc2\x1f\x0a\x7a\x7c\xc6\xf9\x8d\xf9\xd6\x24\x3f\xd9\xe3\xc7\
+\x89\xd5\x29\x01\xd6\xe6\x25\xfc\xa1\x02\x17\x25\xb9\x29\xe5\xbf\
+\x21\xf4\xb5\xbe\x91\xe4\xc2\x5e\x3f\x42\xf4\x45\x09\xb0\x8e\x44\
+\xf8\x43\x55\x1e\x9a\xe4\xea\x94\xff\xc6\xb0\xea\xba\x32\x5e\xf8\
+\xa7\x76\x4a\xc0\xb4\x97\xf0\x87\x0a\xed\x4d\xf2\xfa\x24\x5f\x4d\
+\xf9\x6f\x12\x8b\xae\x9b\x92\xbc\x39\xd3\x79\xb6\x41\xeb\x94\x80\
+\x69\x2e\xe1\x0f\x95\x3b\x35\xc9\x9b\x92\xfc\x4d\xba\x17\x0e\x2a\
+\xfd\x4d\x63\xbb\xf5\xc3\x8d\x19\xdf\xb4\x31\x33\x6d\x51\x02\xa6\
+\xb5\x84\x3f\x14\xb6\x67\xc1\xb7\x7f\x60\xba\x6f\xd4\x8f\x49\xf7\
+\x54\xb7\x53\x7a\x9f\x68\x31\x07\xd3\x3d\x5c\xe6\xfa\x24\x9f\x8e\
+\x57\xf9\x6b\xdd\xb3\x93\x7c\x20\xdd\x1d\x29\x8c\xd7\x91\x24\x7f\
+\x12\x0f\xf9\x81\x3e\x1c\x4c\x72\x5b\x92\x1b\x92\x5c\x95\xe4\x96\
+\x79\x7f\xe3\xa2\x05\x00\xd6\x4d\x09\x00\x58\xce\xe1\x74\xd7\xef\
+\xfd\x75\x92\x3f\xce\x2e\x4f\x5f\x55\x00\xa8\x91\xd7\x0e\x00\x58\
+\xcd\x0f\x92\xfc\x7e\x92\xff\x98\xee\xf8\xfe\x04\x0a\x00\xb5\x52\
+\x02\x00\x56\x77\x5d\x92\x57\x26\xf9\xf2\xf1\xbf\xb0\x77\xf8\x59\
+\x60\x2e\xd7\x24\x79\x59\x92\x3b\x4a\x0f\x02\xd0\xb0\x27\xa4\xbb\
+\x25\xfe\x92\xe3\x7f\xc1\x0e\x00\xb5\xb3\x13\x00\xb0\xba\xbb\x92\
+\x5c\x9c\xee\x95\x36\x93\x28\x00\xb4\x41\x09\x00\x58\xdd\xd7\x93\
+\x3c\x33\x1b\x77\x0a\x38\x02\xa0\x05\x8e\x03\x00\x56\xf7\xc8\x24\
+\x7f\x38\xfb\x81\x1d\x00\x5a\x62\x27\x00\x60\x35\x47\xd2\x1d\x05\
+\x5c\x6d\x07\x80\x96\xd8\x09\x00\x58\xcd\x9e\x24\xbf\x33\xfb\x0f\
+\x68\x8d\x9d\x00\x80\xe5\x1d\x4e\xf2\x70\x3b\x00\xb4\xe8\x9a\x24\
+\x97\x65\x97\xa7\x5c\x01\xb0\xa5\xbd\x49\x5e\xe1\xd5\xf2\x68\xd5\
+\xb7\x93\x7c\x34\xc9\x1b\x92\xec\x2b\x3c\x0b\x40\x6b\x0e\x39\x02\
+\xa0\x75\x5e\x3b\x00\x60\x71\x5f\x56\x00\x18\x03\xd7\x04\x00\x2c\
+\xe6\x0e\x05\x80\xb1\xb0\x13\x00\x30\xbf\x43\x2e\x02\x64\x2c\x3e\
+\x91\xe4\xd2\xb8\x30\x10\x60\x1e\x77\x2b\x00\x8c\x89\xbb\x03\x00\
+\xe6\xf3\x2d\x05\x80\xb1\xf1\xb0\x20\x80\xdd\x7d\x5e\x01\x60\x8c\
+\x1c\x07\x00\xec\xec\x3d\x2e\x02\x64\xcc\xdc\x1d\x00\x70\xa2\x43\
+\x49\xce\xb3\x03\xc0\x98\x39\x0e\x00\x38\xd1\xfb\x92\x7c\xcf\x0e\
+\x00\x53\x60\x27\x00\xa0\x73\x38\xdd\xf7\xc4\x6b\xed\x00\x30\x05\
+\x76\x02\x00\x3a\x7f\x9e\xe4\xda\xc4\xab\x01\x32\x2d\x76\x02\x80\
+\x29\xbb\x2e\xdd\x43\xd3\x6e\x4b\x14\x00\xa6\x47\x09\x00\xa6\xe8\
+\x07\x49\x9e\x95\xe4\xff\xcd\x7e\xc2\x11\x00\x53\x73\x4d\xba\x5b\
+\x04\x6f\x2c\x3d\x08\xc0\x40\x6e\x4a\xf2\xa2\x6c\x0a\xff\x44\x01\
+\x60\x9a\xae\x4d\xf2\x8c\x24\x1f\x2f\x3d\x08\xc0\x9a\x5d\x95\xee\
+\xfb\xdd\xa7\x8f\xff\x05\x05\x80\xa9\xba\x25\xc9\xcf\x24\x79\x43\
+\x92\x1b\x0a\xcf\x02\xd0\xb7\x6f\x26\xf9\x95\x24\x97\x24\xb9\x79\
+\xab\x37\x70\x0d\x00\x24\xfb\x93\xfc\x7c\x92\x57\x27\x79\x61\x92\
+\xd3\xca\x8e\x03\xb0\x94\x7b\x92\x5c\x91\xe4\xaf\x93\xfc\x8f\x8d\
+\x1f\x6f\x4b\x01\x80\x63\x9d\x9a\xe4\xa7\x92\x9c\x9b\xe4\x11\x49\
+\x1e\x58\x76\x1c\x80\x1d\x1d\x4c\x77\x81\xdf\xf5\xe9\xb6\xf9\xef\
+\x2e\x3b\x1a\x24\x6b\x75\x00\x00\x00\x48\x49\x44\x41\x54\x0e\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x63\xf3\
+\xff\x01\x0a\x65\x34\xb0\xc3\xad\xbb\x11\x00\x00\x00\x00\x49\x45\
+\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x23\xa0\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x02\x00\x00\x00\x02\x00\x08\x06\x00\x00\x00\xf4\x78\xd4\xfa\
+\x00\x00\x00\x04\x73\x42\x49\x54\x08\x08\x08\x08\x7c\x08\x64\x88\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
+\x01\x95\x2b\x0e\x1b\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\
+\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\
+\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x20\x00\x49\x44\
+\x41\x54\x78\x9c\xed\xdd\x79\x9c\x5d\x75\x7d\xff\xf1\x57\x26\x1b\
+\x21\x1b\x10\xd6\xc8\x16\xf6\x10\x40\x05\x8c\xc8\x52\x83\xa2\xb2\
+\xa9\xad\x82\x50\x45\xea\x43\x2a\x6e\x68\xb1\x5a\xd4\xfe\xac\xcb\
+\x8f\xd2\x9f\x58\x6b\xeb\xa3\x56\xd4\x1f\xb5\x0a\xad\x22\xc8\x22\
+\xa2\xa0\xa0\xa0\x80\x28\x22\x84\x4d\x64\x35\x84\xcd\x00\x61\x49\
+\x08\x64\xcf\xef\x8f\xef\xcc\x2f\xc3\x64\xee\x9d\x3b\x33\xf7\x9c\
+\xcf\xf7\x9c\xf3\x7a\x3e\x1e\x9f\x47\x22\x91\x99\x37\x39\xf7\xce\
+\xf9\xdc\xef\x76\x40\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\
+\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\
+\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\
+\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\
+\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\
+\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\
+\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\
+\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\
+\x92\x94\x97\x31\xd1\x01\x24\xa9\xe2\xa6\x01\x3b\x03\x3b\x02\xe3\
+\x7a\x6b\x22\xb0\x00\xb8\x1f\x78\x18\x58\x17\x94\x4d\x92\x24\x75\
+\x49\x0f\x30\x0f\xf8\x32\x70\x3b\xb0\x96\x74\x83\x6f\x55\xcb\x80\
+\xcb\x80\xf7\x02\xdb\x96\x1f\x57\x92\x24\x8d\xc6\x64\xe0\x63\xa4\
+\x4f\xf6\xed\x6e\xf8\xed\x6a\x0d\x70\x31\x30\xb7\xdc\xe8\x92\x24\
+\x69\xb8\xc6\x00\x27\x03\x8b\x18\xf9\x8d\x7f\xb0\xba\x12\x78\x45\
+\x89\xff\x1d\x92\x24\xa9\x43\xb3\x80\xeb\xe8\xee\x8d\x7f\xe0\x88\
+\xc0\xb7\x81\x99\x65\xfd\x07\x49\x92\xa4\xf6\x0e\x07\x16\x53\xdc\
+\xcd\xbf\x7f\x3d\x07\x7c\x0a\x98\x54\xca\x7f\x99\x24\x49\x1a\xd4\
+\xf1\xc0\x2a\xca\xb9\xf9\xf7\xaf\x87\x80\x13\x71\x87\x96\x24\x49\
+\xa5\x7b\x27\x69\x68\xbe\xec\x9b\x7f\xff\xba\x0e\xd7\x07\x48\x92\
+\x54\x9a\x83\x81\xe5\xc4\xde\xfc\xfb\x6a\x2d\x70\x3e\xb0\x43\xa1\
+\xff\xc5\x92\x24\x35\xdc\x56\x74\x7f\xa5\x7f\x37\xca\xf5\x01\x92\
+\x24\x15\xe8\xfb\xc4\xdf\xec\xdb\x95\xeb\x03\x24\x49\xea\xb2\x37\
+\x11\x7f\x83\xef\xb4\x6e\x04\x0e\x2c\xe6\xaf\x41\x92\xa4\xe6\xe8\
+\x01\xe6\x13\x7f\x63\x1f\x4e\xb9\x3e\x40\x92\xa4\x51\x7a\x33\xf1\
+\x37\xf4\x91\xd6\x32\xe0\xf3\xc0\x94\xae\xff\xad\x48\x92\x54\x73\
+\x3f\x26\xfe\x46\x3e\xda\x72\x7d\x80\x24\x49\xc3\x30\x03\x58\x4d\
+\xfc\x0d\xbc\x5b\xe5\xf9\x01\x92\x24\x75\xe0\x78\xe2\x6f\xda\xdd\
+\x2e\xd7\x07\x48\x92\x34\x84\xaf\x11\x7f\xc3\x2e\xaa\x3c\x3f\x40\
+\x92\xa4\x16\xae\x25\xfe\x46\x5d\x74\xb9\x3e\x40\x92\xa4\x01\x1e\
+\x27\xfe\x06\x5d\x56\xb9\x3e\x40\x92\xa4\x5e\x75\x5a\x00\xd8\x49\
+\xb9\x3e\x40\x92\xd4\x78\x1b\x11\x7f\x43\x8e\x2a\xcf\x0f\x90\x24\
+\x35\xd6\x44\xe2\x6f\xc4\xd1\xb5\x00\x38\x0e\xd7\x07\x48\x92\x1a\
+\x66\x29\xf1\x37\xe1\x1c\xca\xe7\x0b\x48\x92\x1a\xe5\x01\xe2\x6f\
+\xbe\xb9\xd4\x1a\xe0\x5b\xc0\xcc\xd1\xfc\x85\x4a\x92\x54\x05\x97\
+\x12\x7f\xe3\xcd\xad\x5c\x1f\xd0\x10\x3d\xd1\x01\x24\x29\xd0\x2d\
+\xd1\x01\x32\xb4\x31\xf0\x71\xe0\x2e\x3c\x3f\x40\x92\x54\x53\x47\
+\x11\xff\x89\x3b\xf7\xf2\xfc\x00\x49\x52\xed\x4c\xa7\x79\x67\x01\
+\x8c\xa4\x3c\x3f\x40\x92\x54\x3b\xbf\x25\xfe\x06\x5b\x95\x72\x7d\
+\x80\x24\xa9\x36\xfe\x99\xf8\x1b\x6b\xd5\xca\xe7\x0b\x48\x92\x2a\
+\xef\x68\xe2\x6f\xa8\x55\xad\xdf\xe0\xf9\x01\x92\xa4\x8a\x72\x1d\
+\xc0\xe8\xaa\x6f\x7d\xc0\xf6\xc3\xfd\x8b\x97\x24\x29\x9a\xeb\x00\
+\x46\x5f\xae\x0f\xa8\x98\xb1\xd1\x01\x24\x29\x03\xbb\xe1\x50\xf6\
+\x68\x8d\x07\x0e\x26\xad\x0d\x58\x0c\xdc\x16\x1b\x47\x92\xa4\xa1\
+\xb9\x0e\xa0\xfb\xe5\xfa\x00\x49\x52\xf6\x5c\x07\x50\x4c\xb9\x3e\
+\x40\x92\x94\x3d\xd7\x01\x14\x57\xae\x0f\xc8\x90\x6b\x00\x24\x29\
+\x71\x1d\x40\x71\x5c\x1f\x20\x49\xca\x96\xeb\x00\xca\x2b\xd7\x07\
+\x48\x92\xb2\xe1\x3a\x80\x72\xcb\xf5\x01\x92\xa4\x6c\xdc\x44\xfc\
+\x8d\xb1\x69\xe5\xfa\x80\x20\xae\x01\x90\xa4\xf5\x5c\x07\x50\x3e\
+\xd7\x07\x48\x92\xc2\xbd\x91\xf8\x4f\xc4\x4d\x2f\xd7\x07\x48\x92\
+\x4a\xe7\x3a\x80\x3c\xca\xf5\x01\x92\xa4\xd2\xb9\x0e\x20\x9f\x5a\
+\x06\x7c\x16\x98\xd4\xee\x82\x69\x64\x5c\x03\x20\x49\x2f\xe6\x3a\
+\x80\x7c\x8c\x07\xe6\x01\x7f\x85\xeb\x03\x24\x49\x05\x73\x1d\x40\
+\xbe\xe5\xfa\x00\x49\x52\x61\x5c\x07\x90\x77\xb9\x3e\x40\x92\x54\
+\x18\xd7\x01\xe4\x5f\xae\x0f\x18\x25\xd7\x00\x48\xd2\x86\x5c\x07\
+\x90\x3f\xd7\x07\x48\x92\xba\xce\x75\x00\xd5\x2b\xd7\x07\x48\x92\
+\x46\xcd\x75\x00\xd5\x2c\xd7\x07\x48\x92\x46\xed\x77\xc4\xdf\xd0\
+\xac\x91\x95\xeb\x03\x3a\xd0\x13\x1d\x40\x92\x32\x75\x43\x74\x00\
+\x8d\xd8\xc6\xc0\x67\x80\xbb\x80\xe3\x80\x31\xb1\x71\xf2\x64\x03\
+\x20\x49\x83\x7b\x20\x3a\x80\x46\x6d\x07\xe0\x3c\xe0\xd7\xb8\x3e\
+\x60\x03\x36\x00\x92\x34\xb8\x67\xa3\x03\xa8\x6b\xe6\x02\xd7\x02\
+\xdf\x02\x66\xc6\x46\xc9\x87\x0d\x80\x24\x0d\x6e\x9b\xe8\x00\xea\
+\xaa\x1e\xd2\x96\xc1\x7b\x71\x7d\x00\x60\x03\x20\x49\xad\xec\x1b\
+\x1d\x40\x85\x70\x7d\x80\x24\xa9\xa5\x69\xc0\xf3\xc4\xaf\x66\xb7\
+\x8a\xaf\xeb\x80\xfd\x69\x20\x47\x00\x24\x69\x43\x9f\xc4\x21\xe2\
+\xa6\x38\x08\xb8\x11\xcf\x0f\x90\xa4\xc6\x9b\x0b\xac\x20\xfe\x93\
+\xa9\x55\x7e\x2d\x05\xfe\x17\x36\x7f\x92\xd4\x38\x73\x81\xa7\x89\
+\xbf\x11\x59\xb1\xb5\x00\xd7\x07\x48\x52\x23\x4c\x05\x4e\x07\x56\
+\x12\x7f\xf3\xb1\xf2\xa9\x6b\xa9\xf1\xfa\x00\xbb\x1b\x55\xc9\x34\
+\x60\x33\xd2\xda\x95\x71\xa4\x1f\xda\x90\x56\xf5\x4e\xec\xfd\xfd\
+\x26\xf8\xba\x56\x67\x26\x02\xdb\x02\x2f\x23\x3d\xfc\x67\xe3\xd8\
+\x38\xca\xd4\x5a\xe0\x5c\xe0\xef\x81\x47\x83\xb3\x74\x95\x3f\x28\
+\x15\x6d\x6b\x60\x47\x60\x56\xef\xef\x67\x00\x9b\x03\x5b\xf4\xfe\
+\xbe\x7f\x4d\x88\x89\x28\x49\x3c\x07\x7c\x1e\xf8\x12\xf0\x42\x70\
+\x96\xae\xb0\x01\x50\xd1\xc6\x03\xb3\x81\x5d\x59\x7f\xa3\xef\xfb\
+\x75\x16\x2e\xb6\x91\x54\x2d\x0f\x02\x1f\x27\xed\x1a\x58\x17\x9c\
+\x65\x54\x6c\x00\xd4\x4d\x9b\x02\x73\x80\xfd\x80\x3d\xfb\xfd\x7e\
+\xa3\xc8\x50\x92\x54\x80\x1b\x81\x53\xa9\xf0\x43\xa3\x6c\x00\x34\
+\x52\x33\x48\x0f\xd7\x38\x88\xb4\x48\x66\x1f\xd2\xb0\xbd\x24\x35\
+\xc5\x5a\xe0\x1c\xd2\xd6\xc1\xca\xad\x0f\xb0\x01\x50\xa7\x66\x92\
+\x6e\xf6\x07\xf7\xfe\xfa\x72\x3c\x48\x4a\x92\x20\x9d\x1a\xf9\xcf\
+\xc0\x99\x54\x68\x7d\x80\x0d\x80\x5a\xd9\x11\x38\x1c\x78\x1d\xe9\
+\x86\xbf\x55\x68\x1a\x49\xca\x5f\xa5\xd6\x07\xd8\x00\xa8\xcf\x38\
+\xe0\x00\xe0\x68\xe0\x30\xd2\x83\x50\x7c\x7d\x48\xd2\xf0\x55\x62\
+\x7d\x80\x3f\xe0\x9b\x6d\x3b\xe0\x48\xe0\x08\xe0\xb5\xc0\x94\xd8\
+\x38\x92\x54\x1b\xd9\xaf\x0f\xb0\x01\x68\x9e\xcd\x81\xb7\x00\x27\
+\x92\x16\xf1\xf9\x1a\x90\xa4\xe2\x64\xbb\x3e\xc0\x1f\xfe\xcd\xb0\
+\x19\x69\x68\xff\x58\xd2\xbc\xfe\xb8\xd8\x38\x92\xd4\x38\x0f\x93\
+\x46\x03\xce\x25\x93\xf5\x01\x36\x00\xf5\x35\x0d\x38\x06\x38\x1e\
+\x78\x0d\x30\x36\x36\x8e\x24\x09\xb8\x0e\xf8\x08\x70\x53\x74\x10\
+\x1b\x80\xfa\xd9\x0f\x38\x19\x78\x3b\xce\xe9\x4b\x52\x8e\xd6\x01\
+\xdf\x07\x3e\x06\x2c\x8c\x0a\x61\x03\x50\x0f\xd3\x48\x9f\xf4\xdf\
+\x47\xda\x9f\x2f\x49\xca\x5f\xe8\xfa\x00\x1b\x80\x6a\xeb\xfb\xb4\
+\xff\x0e\x60\x72\x70\x16\x49\xd2\xc8\x84\xac\x0f\xb0\x01\xa8\x9e\
+\x1e\xe0\x28\xd2\x8b\xe5\x95\xc1\x59\x24\x49\xdd\x53\xea\xf9\x01\
+\x36\x00\xd5\x31\x05\x38\x89\xb4\x78\x64\x87\xe0\x2c\x92\xa4\x62\
+\x94\xb6\x3e\xc0\x06\x20\x7f\x5b\x93\xe6\xf6\x3f\x44\xda\xce\x27\
+\x49\xaa\xbf\xc2\xd7\x07\xd8\x00\xe4\x6b\x4f\xd2\x99\xd2\xc7\x03\
+\x13\x82\xb3\x48\x92\x62\x3c\x08\x9c\x06\x5c\x40\x97\xd7\x07\xd8\
+\x00\xe4\x67\x47\xe0\x93\xa4\xe1\x7e\xf7\xee\x4b\x92\xa0\x80\xf5\
+\x01\x36\x00\xf9\xd8\x0e\xf8\x14\xf0\x6e\x3c\xa9\x4f\x92\xb4\xa1\
+\xae\xae\x0f\xf0\x13\x66\xbc\x2d\x81\x7f\x00\xfe\x87\xb4\xaa\xbf\
+\x27\x36\x8e\x24\x29\x53\x63\x80\x39\xc0\x7b\x49\x53\xc3\xbf\x01\
+\x56\x8f\xe6\x8b\x29\xc6\x66\xa4\xad\x7c\xef\x07\x26\x05\x67\x91\
+\x24\x55\xcf\xa8\xd6\x07\xd8\x00\x94\x6f\x1c\x69\x98\xff\x1f\x81\
+\x2d\x82\xb3\x48\x92\xaa\x6f\x44\xeb\x03\x6c\x00\xca\x75\x18\xf0\
+\x6f\xa4\x21\x1c\x49\x92\xba\x65\x2d\x70\x0e\x69\x11\xf9\x9f\x3a\
+\xf9\x17\x9c\x6f\x2e\xc7\x2e\xc0\xf9\xc0\x95\x78\xf3\x97\x24\x75\
+\x5f\x0f\xf0\x2e\xe0\x2e\xd2\x11\xf1\x43\x72\x04\xa0\x58\xd3\x48\
+\xf3\xfc\x7f\x03\x4c\x0c\xce\x22\x49\x6a\x8e\x4b\x80\x77\x02\xcf\
+\xb5\xfa\x3f\xd8\x00\x14\xe7\x68\xe0\xab\xa4\xed\x7d\x92\x24\x95\
+\xed\x76\xe0\x08\xe0\x91\xc1\xfe\xd0\x06\xa0\xfb\xb6\x06\xfe\x1d\
+\x38\x26\x3a\x88\x24\xa9\xf1\x1e\x00\x0e\x01\x1e\x1d\xf8\x07\x36\
+\x00\xdd\x75\x2c\x70\x16\x30\x23\x3a\x88\x24\x49\xbd\x6e\x06\xfe\
+\x0c\x58\xd6\xff\x1f\xba\x08\xb0\x3b\x76\x06\xae\x22\x2d\xf4\xf3\
+\xe6\x2f\x49\xca\xc9\xbe\xa4\x1d\x02\x2f\xe2\x49\x80\xa3\x33\x16\
+\xf8\x5b\xd2\x8d\x7f\xf7\xe0\x2c\x92\x24\xb5\x32\x9b\x34\x1d\x70\
+\x5b\xdf\x3f\x70\x0a\x60\xe4\xb6\x03\xce\x05\x5e\x1d\x1d\x44\x92\
+\xa4\x0e\x2c\x26\x6d\x45\x5f\x04\x8e\x00\x8c\xd4\x31\xc0\x8f\x48\
+\x1d\x95\x24\x49\x55\xb0\x31\x30\x1e\xb8\x02\x1c\x01\x18\xae\xa9\
+\xc0\x17\xe9\xf0\x90\x05\x49\x92\x32\xf3\x3c\xe9\xb1\xf3\x4f\x38\
+\x02\xd0\xb9\x03\x48\x27\xf9\x1d\x16\x1d\x44\x92\xa4\x11\x1a\x0f\
+\x2c\x05\x7e\xe9\x2e\x80\xa1\x8d\x05\x3e\x0d\x5c\x0b\xec\x14\x9c\
+\x45\x92\xa4\xd1\x3a\x0e\x9c\x02\x18\xca\x0c\xe0\x3b\xc0\xeb\xa3\
+\x83\x48\x92\xd4\x45\xbb\x3b\x05\xd0\xda\x7e\xc0\xcf\x7a\x7f\x95\
+\x24\xa9\x4e\xee\xb1\x01\x18\xdc\x09\xc0\x45\xc0\x16\xd1\x41\x24\
+\x49\x2a\xc0\xc3\x36\x00\x2f\x36\x0e\xf8\x27\xe0\x5f\x48\x0b\x25\
+\x24\x49\xaa\xa3\x17\x6c\x00\xd6\x7b\x09\x69\x6f\xe4\xf1\xd1\x41\
+\x24\x49\x2a\xd8\x58\x1b\x80\x64\x2e\x70\x0d\xb0\x47\x70\x0e\x49\
+\x92\xca\xb0\xda\x6d\x80\xf0\xe7\xc0\xd5\xc0\x56\xd1\x41\x24\x49\
+\x2a\xc9\xc4\xa6\x37\x00\xa7\x02\x17\x92\x8e\x47\x94\x24\xa9\x29\
+\xd6\x8c\x8b\x4e\x10\x64\x2c\xf0\x25\xe0\xc3\xd1\x41\x24\x49\x0a\
+\xf0\x70\x13\x1b\x80\xc9\xc0\xff\x00\x6f\x8e\x0e\x22\x49\x52\x90\
+\x47\x9b\xd6\x00\x6c\x0d\x5c\x0a\xbc\x22\x3a\x88\x24\x49\x81\x6e\
+\x6d\x52\x03\xb0\x3d\x70\x15\xb0\x6b\x74\x10\x49\x92\x82\xfd\xb2\
+\x29\xcf\x02\xd8\x95\x74\xf3\xdf\x3e\x3a\x88\x24\x49\xc1\x56\x03\
+\x5b\x37\x61\x17\xc0\x6c\xd2\x1e\x7f\x6f\xfe\x92\x24\xc1\xe5\xc0\
+\xe2\xba\x37\x00\xfb\x02\xbf\x04\x66\x46\x07\x91\x24\x29\x13\xdf\
+\x82\x7a\x3f\x0e\xf8\x40\xe0\xc7\xc0\xf4\xe8\x20\x92\x24\x65\xe2\
+\x3e\x60\x4f\x60\x55\x5d\x47\x00\x5e\x0b\xfc\x14\x6f\xfe\x92\x24\
+\xf5\xf7\x19\x60\x15\xd4\x73\x04\x60\x1e\xe9\x93\xff\xa4\xe0\x1c\
+\x92\x24\xe5\xe4\x46\xe0\x55\xc0\x5a\xa8\x5f\x03\xf0\x4a\xe0\x4a\
+\x60\x6a\x74\x10\x49\x92\x32\xf2\x3c\x69\x5d\xdc\xdd\x7d\xff\xa0\
+\x4e\x53\x00\x2f\x23\xad\x6c\xf4\xe6\x2f\x49\xd2\x8b\x7d\x98\x7e\
+\x37\x7f\xa8\x4f\x03\xb0\x1b\xe9\xe6\xbf\x69\x74\x10\x49\x92\x32\
+\x73\x06\xf0\x9f\x03\xff\x61\x1d\xa6\x00\x76\xc6\xad\x7e\x92\x24\
+\x0d\xe6\xeb\xc0\xfb\x81\x75\x03\xff\xa0\xea\x23\x00\xdb\x92\xe6\
+\xfc\xbd\xf9\x4b\x92\xb4\xde\x3a\xe0\x73\xc0\xfb\x18\xe4\xe6\x0f\
+\xd5\x1e\x01\x98\x01\x5c\x0f\xec\x1e\x1d\x44\x92\xa4\x8c\x3c\x0e\
+\xbc\x17\xb8\xa4\xdd\xff\xa9\xaa\x23\x00\x13\x81\x8b\xf1\xe6\x2f\
+\x49\x52\x7f\xdf\x05\xe6\x30\xc4\xcd\x1f\xaa\xd9\x00\x8c\x01\xce\
+\x06\x0e\x89\x0e\x22\x49\x52\x26\x7e\x0f\x1c\x0e\xbc\x1d\x78\xb2\
+\x93\x7f\xa1\x8a\x0d\xc0\x19\xc0\x09\xd1\x21\x24\x49\xca\xc0\x62\
+\xe0\x54\x60\x1f\xe0\x27\xc3\xf9\x17\xab\xb6\x06\xe0\x24\xd2\xa7\
+\x7f\x49\x92\x9a\x6c\x15\x70\x16\xf0\x69\xe0\xd9\x91\x7c\x81\x2a\
+\x35\x00\x6f\x00\x2e\x03\xc6\x45\x07\x91\x24\x29\xd0\x65\xa4\x4f\
+\xfd\xf7\x8f\xe6\x8b\x54\xa5\x01\xd8\x07\xb8\x16\x98\x16\x1d\x44\
+\x92\xa4\x20\xf3\x81\x8f\x00\xd7\x74\xe3\x8b\x55\xa1\x01\xd8\x0c\
+\xf8\x2d\xb0\x53\x74\x10\x49\x92\x02\x2c\x06\x4e\x07\xbe\x02\xac\
+\xe9\xd6\x17\xcd\x7d\x38\xbd\x07\xf8\x6f\xbc\xf9\x4b\x92\x9a\x67\
+\xd4\xf3\xfc\xed\xe4\xde\x00\x9c\x0e\x1c\x11\x1d\x42\x92\xa4\x92\
+\x75\x65\x9e\xbf\x9d\x9c\xa7\x00\xde\x44\x3a\xc8\x20\xe7\x8c\x92\
+\x24\x75\xd3\xef\x81\xbf\x65\x98\x5b\xfa\x46\x22\xd7\x9b\xeb\x6e\
+\xc0\x8d\xc0\xf4\xe8\x20\x92\x24\x95\xa0\x90\x79\xfe\x76\x72\x9c\
+\x02\x98\x02\x5c\x84\x37\x7f\x49\x52\xfd\x15\x3a\xcf\xdf\x4e\x8e\
+\x0d\xc0\x37\x49\xe7\x18\x4b\x92\x54\x67\x17\x01\x7f\x07\x3c\x10\
+\xf1\xcd\x73\x6b\x00\x4e\x06\x8e\x8d\x0e\x21\x49\x52\x81\x4a\x9b\
+\xe7\x6f\x27\xa7\x35\x00\xbb\x00\x37\x03\x53\xa3\x83\x48\x92\x54\
+\x80\xd2\xe7\xf9\xdb\xc9\x65\x04\x60\x3c\x69\xbf\xbf\x37\x7f\x49\
+\x52\xdd\x84\xcd\xf3\xb7\x93\x4b\x03\x70\x3a\xf0\xca\xe8\x10\x92\
+\x24\x75\x59\xe1\xfb\xf9\x47\x2a\x87\x29\x80\x43\x80\xab\x81\xb1\
+\xd1\x41\x24\x49\xea\x92\x2c\xe6\xf9\xdb\x89\x6e\x00\x36\x01\x6e\
+\x05\xb6\x0f\xce\x21\x49\x52\x37\x64\x35\xcf\xdf\x4e\xf4\x14\xc0\
+\x37\xf0\xe6\x2f\x49\xaa\xbe\x15\xc0\x97\x81\x33\x80\x25\xc1\x59\
+\x3a\x12\xd9\x00\x1c\x8b\x5b\xfe\x24\x49\xd5\x97\xed\x3c\x7f\x3b\
+\x51\x53\x00\xd3\x49\xf3\x23\x33\x83\xbe\xbf\x24\x49\xa3\x95\xfd\
+\x3c\x7f\x3b\x3d\x41\xdf\xf7\xdf\xf0\xe6\x2f\x49\xaa\xa6\xc5\xa4\
+\x4f\xfc\xfb\x50\xd1\x9b\x3f\xc4\x8c\x00\x1c\x0a\xfc\x2c\xe8\x7b\
+\x4b\x92\x34\x52\x59\xee\xe7\x1f\xa9\xb2\x6f\xc2\x1b\x03\xb7\x01\
+\x3b\x97\xfc\x7d\x25\x49\x1a\x8d\x4a\xce\xf3\xb7\x53\xf6\x22\xc0\
+\xff\x8d\x37\x7f\x75\x6e\x39\xf0\x20\xb0\xa0\xf7\xd7\x87\x80\x27\
+\x7b\x6b\x71\x6f\x3d\x07\x2c\x05\x56\x03\xeb\x80\x67\x22\x82\xaa\
+\x92\x26\x02\xdb\x02\xfb\x02\xef\x00\x8e\xc6\xf3\x48\xb4\xa1\xf9\
+\xc0\x47\x80\x6b\x82\x73\x74\x5d\x99\x23\x00\xaf\x00\x6e\xc0\x37\
+\x98\x36\xb4\x12\xb8\xa3\xb7\x6e\x27\x8d\x12\xfd\x1e\x78\x38\x32\
+\x94\x1a\x67\x2e\x70\x36\xb0\x77\x74\x10\x65\x61\x11\xf0\x0f\xa4\
+\x27\xd4\x66\xbd\x9f\x7f\xa4\xca\x6a\x00\x7a\x80\x9b\x80\x97\x97\
+\xf4\xfd\x94\xb7\x3f\x91\x9a\xc1\xeb\x7b\x7f\xfd\x1d\x69\x0f\xad\
+\x14\x6d\x3a\x69\x51\x97\x47\x93\x37\x57\xe5\xf6\xf3\xe7\xee\x3d\
+\xa4\xe1\x59\xab\x99\xf5\x02\xf0\x53\xe0\xa3\xc0\x1c\xa4\xbc\x6d\
+\x46\x6a\x52\xa3\xdf\x37\x56\xf9\x75\x21\x4e\x53\x77\xd5\x74\xd2\
+\x50\x4a\xf4\x85\xb5\xca\xad\xa7\x81\x6f\x91\xe6\x55\x37\x46\xaa\
+\x96\x77\x12\xff\x1e\xb2\xca\xab\x5b\x80\x79\xa8\xeb\xbe\x48\xfc\
+\xc5\xb5\xca\xa9\x25\xa4\x9b\xfe\x51\xc0\x04\xa4\xea\x1a\x07\x3c\
+\x41\xfc\x7b\xca\x2a\xb6\xfe\x44\x1a\xa1\x76\x6d\x5a\x01\x76\x23\
+\xcd\xa7\x44\x5f\x64\xab\xd8\xba\x01\x38\x09\x98\x82\x54\x1f\xff\
+\x45\xfc\x7b\xcb\x2a\xa6\x96\x03\x67\x02\xd3\x68\xb0\xa2\xb7\x01\
+\xfe\x0b\x7e\x12\xac\xab\x65\xa4\x4f\xfb\x5f\x23\xad\xde\x97\xea\
+\xe6\xbe\xe8\x00\x2a\xc4\x45\xc0\x69\xd4\x68\x3f\xff\x48\x15\xd9\
+\x00\xbc\x81\x34\xff\xab\x7a\x79\x84\xf4\x98\xcb\xaf\x93\xe6\xf9\
+\xa5\xba\xf2\x4c\x89\x7a\xa9\xed\x7e\xfe\x91\x2a\xaa\x01\x18\x07\
+\xfc\x6b\x41\x5f\x5b\x31\xee\x05\xfe\x11\x38\x8f\xb4\x6f\x5f\xaa\
+\xbb\x97\x44\x07\x50\x57\xd4\x7e\x3f\x7f\x6e\x4e\x22\x7e\x8e\xc7\
+\xea\x4e\xdd\x0f\xbc\x8b\xd8\x47\x47\x4b\x11\x2e\x24\xfe\xfd\x67\
+\x8d\xbc\x9c\xe7\x0f\x30\x81\x74\x74\x6b\xf4\xc5\xb7\x46\x57\x8f\
+\x01\x27\x03\xe3\x91\x9a\x67\x0c\x6e\x5f\xae\x72\xb9\x9f\x3f\xc8\
+\x07\x89\xbf\xf8\xd6\xc8\xab\xef\x14\x2c\xbb\x66\x35\xd9\x1c\xe2\
+\xdf\x8b\xd6\xf0\xeb\xf7\xc0\xe1\x83\x5c\x4f\x95\x60\x12\x69\x91\
+\x58\xf4\x8b\xc0\x1a\x59\x7d\x1f\x98\xb5\xc1\x55\x95\x9a\xe7\x03\
+\xc4\xbf\x1f\xad\xce\xcb\xfd\xfc\x19\xf8\x28\xf1\x2f\x04\x6b\xf8\
+\xf5\x08\xf0\x96\x41\xae\xa7\xd4\x54\xe7\x13\xff\xbe\xb4\x86\xae\
+\x95\xa4\x11\xcb\xe9\x83\x5f\x46\x95\x65\x32\xce\x99\x55\xad\xd6\
+\x92\xb6\xf3\x39\xdc\x2f\xad\x37\x06\x9f\x05\x50\x85\xfa\x21\xce\
+\xf3\x67\xe3\x93\xc4\xbf\x20\xac\xce\xeb\x3e\xe0\xc0\x41\xaf\xa4\
+\xd4\x6c\x7b\x12\xff\xfe\xb4\x5a\xd7\x2d\xc0\xa1\x2d\xaf\x9e\x4a\
+\x37\x0d\x58\x4c\xfc\x0b\xc3\xea\xac\xbe\x09\x4c\x1d\xf4\x4a\x4a\
+\x7a\x3f\xf1\xef\x51\x6b\xc3\x72\x9e\xbf\xcb\xba\xb5\xb7\xfb\xaf\
+\x49\x8f\xd0\x54\xde\x9e\x22\x6d\xed\xbb\x30\x3a\x88\x94\xb1\x79\
+\xd1\x01\xf4\x22\x7d\x3b\x93\xce\x20\x3d\x70\x4c\x19\x19\x0f\x3c\
+\x48\x7c\x77\x68\xb5\xaf\x9b\x71\x85\xbf\x34\x14\xe7\xff\xf3\x2a\
+\xe7\xf9\x33\x77\x02\xf1\x2f\x12\xab\x7d\x9d\x43\xda\xa2\x29\xa9\
+\x3d\xe7\xff\xf3\x28\xf7\xf3\x57\xc4\xcd\xc4\xbf\x58\xac\xc1\x6b\
+\x05\x69\xce\x4c\x52\x67\x9c\xff\x8f\x2d\xe7\xf9\x2b\xe4\x30\xe2\
+\x5f\x30\xd6\xe0\xf5\x14\xce\x65\x4a\xc3\xf5\x3d\xe2\xdf\xbb\x4d\
+\x2c\xf7\xf3\x57\xd0\xe5\xc4\xbf\x70\xac\x0d\xeb\x01\x60\x76\x9b\
+\xeb\x26\x69\x43\x63\x48\xcf\xc0\x88\x7e\xff\x36\xad\x9c\xe7\xaf\
+\xa0\xbd\x48\x07\xc9\x44\xbf\x78\xac\x17\xd7\xaf\x81\x2d\xdb\x5c\
+\x37\x49\x83\xdb\x83\xf8\xf7\x6f\x93\xca\xfd\xfc\xc1\x7a\x46\xf1\
+\xef\x7e\x84\xd4\x31\x2b\x1f\x57\x93\xa6\x65\x1e\x8f\x0e\x22\x55\
+\xd0\xbc\xe8\x00\x0d\xb1\x88\xb4\x1d\x79\x7f\xd2\xcf\x2c\x55\xcc\
+\x74\x60\x19\xf1\x1d\xa4\xb5\xbe\x7e\x8c\x2b\xfd\xa5\xd1\x38\x8f\
+\xf8\xf7\x71\x9d\xcb\x79\xfe\x9a\x38\x85\xf8\x17\x93\xb5\xbe\x2e\
+\x04\x26\xb4\xbd\x62\x92\x86\xf2\x28\xf1\xef\xe5\xba\xd6\x45\x38\
+\xcf\x5f\x1b\xb7\x10\xff\x82\xb2\x52\xfd\x80\x74\x18\x93\xa4\x91\
+\x73\xfe\xbf\x98\x72\x3f\x7f\xcd\x1c\x40\xfc\x8b\xca\x4a\x75\x25\
+\xb0\x51\xfb\xcb\x25\xa9\x03\xef\x23\xfe\xfd\x5c\xa7\x7a\x12\xf8\
+\x1b\xdc\xcf\x9f\xb5\x91\x3c\x0b\xc0\x83\x65\xf2\xf0\x2b\xe0\x2f\
+\x80\xe5\xd1\x41\xa4\x1a\x78\x75\x74\x80\x9a\x58\x05\x9c\x05\x7c\
+\x1a\x78\x36\x38\x8b\xba\x6c\x1a\xf0\x1c\xf1\xdd\x65\xd3\x6b\x7e\
+\xef\xb5\x90\xd4\x1d\xce\xff\x8f\xbe\x9c\xe7\xaf\x39\x8f\xc9\x8c\
+\xaf\x47\x80\xed\x86\xba\x50\x92\x3a\xb6\x3b\xf1\xef\xeb\x2a\x97\
+\xf3\xfc\x0d\xe1\xb9\xff\xb1\xb5\x04\x78\xd9\x90\x57\x49\xd2\x70\
+\x9c\x4c\xfc\x7b\xbb\x8a\xe5\xb9\xfd\x0d\x32\x87\xf8\x17\x5c\x93\
+\x6b\x35\x70\xc4\x90\x57\x49\xd2\x70\x7d\x87\xf8\xf7\x77\x95\x6a\
+\x39\x70\x26\x4e\x43\x36\xca\xe9\xc4\xbf\xf0\x9a\x5c\x1f\x1f\xfa\
+\x12\x49\x1a\x81\x47\x88\x7f\x7f\x57\xa5\x3c\xb7\xbf\xa1\xee\x22\
+\xfe\xc5\xd7\xd4\xfa\x01\x1e\xbb\x2c\x15\x61\x37\xe2\xdf\xdf\x55\
+\x28\xe7\xf9\x1b\xec\xe5\xc4\xbf\x00\x9b\x5a\x7f\xc0\xa1\x36\xa9\
+\x28\x27\x11\xff\x1e\xcf\xb9\x9c\xe7\xaf\xb1\x4e\xcf\x01\x78\x5b\
+\xa1\x29\xd4\xca\x0b\xc0\x31\xa4\xc5\x7f\x92\xba\x6f\x9f\xe8\x00\
+\x99\x5a\x41\x3a\xb7\xff\x0c\xfc\xf9\xd3\x78\xf7\x11\xdf\x89\x36\
+\xb1\x4e\xe9\xe4\xe2\x48\x1a\xb1\x9f\x13\xff\x3e\xcf\xad\x9c\xe7\
+\xd7\xff\x37\x97\xf8\x17\x64\x13\xeb\x72\x9c\xf7\x97\x8a\xb6\x88\
+\xf8\xf7\x7a\x2e\x35\x1f\x38\x74\x74\x7f\x9d\xaa\x9b\x2f\x11\xff\
+\xc2\x6c\x5a\x3d\x01\x6c\xd3\xc9\xc5\x91\x34\x2a\xab\x89\x7f\xbf\
+\x47\x97\xe7\xf6\xab\xa5\x05\xc4\xbf\x40\x9b\x56\xae\xb9\x90\x8a\
+\x37\x86\xf8\xf7\x7a\x64\xb9\x9f\x5f\x6d\x79\xf8\x4f\xf9\xf5\xa3\
+\x8e\xae\x8c\xa4\xd1\x1a\x4f\xfc\xfb\x3d\xaa\x9c\xe7\x17\x3d\x43\
+\xfc\xb9\x27\xcf\x95\x6b\x09\xf0\xde\xe8\x10\x52\x43\xac\xa1\x79\
+\x4f\xd3\xbc\x15\x78\x0d\xf0\x46\xe0\xfe\xe0\x2c\xca\xdc\xcf\x88\
+\xef\x54\x9b\x54\x1f\xec\xec\xb2\x48\xea\x92\xa6\x1c\x70\xe6\x3c\
+\xbf\x86\x65\x0a\xa9\x3b\x8e\x7e\xe1\x36\xa5\x6e\x61\xe8\x11\x19\
+\x49\xdd\x75\x19\xf1\xef\xfd\x22\x6b\x25\x69\x3f\xff\xf4\x6e\xfd\
+\x85\xa9\x3e\xda\xdd\x70\x0e\x03\x26\x96\x15\x44\x9c\x0a\xac\x8d\
+\x0e\x21\x35\xcc\xfc\xe8\x00\x05\xba\x18\x98\x4d\xfa\xe4\xff\x6c\
+\x70\x16\x55\xcc\xd7\x89\xef\x5e\x9b\x52\xe7\x77\x78\x4d\x24\x75\
+\xd7\xab\x88\x7f\xff\x77\xbb\x3c\xb7\x5f\xa3\xb6\x80\xf8\x17\x72\
+\x13\x6a\x05\xb0\x4b\x67\x97\x44\x52\x97\xf5\x90\xce\xbb\x8f\xfe\
+\x39\xd0\x8d\x72\x9e\x5f\x5d\xe1\xf6\xbf\xf2\xea\x5f\x3b\xbc\x26\
+\x92\x8a\xf1\x65\xe2\x7f\x0e\x8c\xa6\x96\x03\x5f\xc0\xfd\xfc\xea\
+\x92\x0f\x11\xff\xa2\x6e\x42\x3d\x0f\xcc\xec\xf0\x9a\x48\x2a\xc6\
+\x76\xa4\xc5\x72\xd1\x3f\x0f\x46\x52\xee\xe7\xd7\x88\xb5\x5a\x04\
+\x78\x60\xa9\x29\x9a\xeb\x2b\xc0\xa3\xd1\x21\xa4\x86\x7b\x08\xf8\
+\x5e\x74\x88\x61\x72\x3f\xbf\x0a\xb3\x90\xf8\xce\xb6\xee\xf5\x1c\
+\xb0\x65\xa7\x17\x44\x52\xa1\x5e\x02\x3c\x43\xfc\xcf\x85\xa1\xca\
+\x79\x7e\x15\x6a\x7b\xe2\x5f\xe4\x4d\xa8\x2f\x76\x7a\x41\x24\x95\
+\xe2\x03\xc4\xff\x5c\x68\x55\xce\xf3\xab\x14\x7f\x49\xfc\x8b\xbd\
+\xee\xb5\x8a\xd4\x68\x49\xca\x47\x0f\x70\x05\xf1\x3f\x1f\x06\xd6\
+\x45\x38\xcf\xaf\x92\xfc\x07\xf1\x2f\xf8\xba\xd7\x77\x3a\xbe\x1a\
+\x92\xca\x34\x95\x74\x38\x50\xf4\xcf\x88\x75\xb8\x9f\x5f\x01\x72\
+\x79\xf1\xd7\xb9\xe6\x76\x7c\x35\x24\x95\x6d\x5b\x62\xcf\x41\x59\
+\x04\xbc\x07\xe7\xf9\x55\xb2\xe9\xc0\x6a\xe2\x6f\x90\x75\xae\xeb\
+\x3b\xbe\x1a\x92\xa2\xcc\x04\x6e\xa6\xdc\x9f\x0d\xce\xf3\x2b\xd4\
+\xeb\x89\xbf\x41\xd6\xbd\xde\xd5\xe9\xc5\x90\x14\x6a\x0a\xe9\x3c\
+\xfd\x32\x7e\x2e\x38\xcf\xaf\x70\x9f\x20\xfe\x06\x59\xe7\x7a\x06\
+\x98\xdc\xf1\xd5\x90\x94\x83\x63\x81\x27\x28\xe6\x67\x82\xf3\xfc\
+\xca\xc6\x7f\x13\x7f\x93\xac\x73\x9d\xd5\xf9\xa5\x90\x94\x91\xad\
+\x48\x47\x06\x2f\xa3\x3b\x3f\x0b\x6e\x07\x4e\xc0\x79\x7e\x65\xe4\
+\x36\xe2\x6f\x92\x75\xae\xfd\x3a\xbf\x14\x92\x32\xb4\x05\xf0\x39\
+\xe0\x1e\x86\xff\xfe\x5f\x01\xfc\x04\x78\x13\x30\xa6\xec\xe0\xd2\
+\x40\xfd\x5f\x84\x13\x48\xa7\xd3\x8d\x0f\xca\x52\x77\xf7\x00\xbb\
+\x47\x87\x90\xd4\x35\x73\x80\x23\x81\x97\x02\xb3\x81\xdd\x48\xeb\
+\x06\x00\xd6\x90\x8e\x18\xbe\x1f\xb8\x17\xf8\x19\xe9\xe6\xbf\xb4\
+\xfc\x98\xd2\xe0\xc6\xf5\xfb\xfd\x9e\x78\xf3\x2f\xd2\xf9\xd1\x01\
+\x24\x75\xd5\x9d\xbd\x25\x55\x52\xff\x87\x01\xbd\x34\x2c\x45\x33\
+\x5c\x10\x1d\x40\x92\xa4\x3e\xfd\x1b\x80\xbd\xc3\x52\xd4\xdf\x3d\
+\xa4\xf5\x15\x92\x24\x65\xc1\x06\xa0\x1c\x17\x45\x07\x90\x24\xa9\
+\x3f\x1b\x80\x72\xfc\x24\x3a\x80\x24\x49\xfd\xf5\xed\x02\x98\x44\
+\xda\xdf\xea\xd6\x94\xee\x5b\x0a\xcc\x20\x3d\x01\x50\x92\xa4\x2c\
+\xf4\x8d\x00\xcc\xc2\x9b\x7f\x51\x7e\x86\x37\x7f\x49\x52\x66\xfa\
+\x1a\x80\x1d\x23\x43\xd4\x9c\xc3\xff\x92\xa4\xec\xf4\x1f\x01\x50\
+\x31\x7e\x11\x1d\x40\x92\xa4\x81\x6c\x00\x8a\xf5\x34\x70\x77\x74\
+\x08\x49\x92\x06\xb2\x01\x28\xd6\xaf\x80\xb5\xd1\x21\x24\x49\x1a\
+\xc8\x35\x00\xc5\xba\x21\x3a\x80\x24\x49\x83\xb1\x01\x28\xd6\xaf\
+\xa3\x03\x48\x92\x34\x98\x31\xc0\x54\x60\x49\x74\x90\x9a\xda\x12\
+\x78\x22\x3a\x84\x24\x49\x03\xf5\x00\x5b\x45\x87\xa8\xa9\xc7\xf0\
+\xe6\x2f\x49\xca\x54\x0f\xe9\x94\x3a\x75\xdf\xed\xd1\x01\x24\x49\
+\x6a\xa5\x07\xd8\x3c\x3a\x44\x4d\xf9\xf4\x3f\x49\x52\xb6\x1c\x01\
+\x28\xce\x1f\xa2\x03\x48\x92\xd4\x8a\x23\x00\xc5\x59\x10\x1d\x40\
+\x92\xa4\x56\x1c\x01\x28\xce\x82\xe8\x00\x92\x24\xb5\xe2\x08\x40\
+\x31\xd6\x02\x0f\x45\x87\x90\x24\xa9\x15\x47\x00\x8a\xf1\x08\xb0\
+\x32\x3a\x84\x24\x49\xad\xd8\x00\x14\xe3\xb1\xe8\x00\x92\x24\xb5\
+\xd3\x03\x6c\x1c\x1d\xa2\x86\x9e\x8c\x0e\x20\x49\x52\x3b\x3d\xc0\
+\x84\xe8\x10\x35\xb4\x38\x3a\x80\x24\x49\xed\xf4\x00\x13\xa3\x43\
+\xd4\x90\x0d\x80\x24\x29\x6b\x8e\x00\x14\xc3\x06\x40\x92\x94\x35\
+\x47\x00\x8a\xf1\x5c\x74\x00\x49\x92\xda\x71\x04\xa0\x18\x6e\x01\
+\x94\x24\x65\xcd\x11\x80\x62\xd8\x00\x48\x92\xb2\xe6\x08\x40\x31\
+\x6c\x00\x24\x49\x59\xb3\x01\x28\x86\x0d\x80\x24\x29\x6b\x3d\xd1\
+\x01\x24\x49\x52\xf9\x7a\xf0\xd3\x6a\x11\x1c\x55\x91\x24\x65\xcd\
+\x06\xa0\x18\x36\x00\x92\xa4\xac\xf5\x00\x2b\xa2\x43\xd4\x90\x0d\
+\x80\x24\x29\x6b\x8e\x00\x14\xc3\x06\x40\x92\x94\x35\x47\x00\x8a\
+\x31\x35\x3a\x80\x24\x49\xed\x38\x02\x50\x8c\x19\xd1\x01\x24\x49\
+\x6a\xc7\x11\x80\x62\xd8\x00\x48\x92\xb2\xe6\x08\x40\x31\x6c\x00\
+\x24\x49\x59\xeb\x01\x96\x45\x87\xa8\x21\x1b\x00\x49\x52\xd6\x7a\
+\xf0\xd9\xf5\x45\x98\x19\x1d\x40\x92\xa4\x76\x6c\x00\x8a\x31\x13\
+\x9f\xb2\x28\x49\xca\x58\x0f\xf0\x64\x74\x88\x1a\xea\x01\xb6\x8d\
+\x0e\x21\x49\x52\x2b\x8e\x00\x14\x67\xc7\xe8\x00\x92\x24\xb5\xe2\
+\x08\x40\x71\x66\x45\x07\x90\x24\xa9\x15\x47\x00\x8a\x33\x3b\x3a\
+\x80\x24\x49\xad\x38\x02\x50\x9c\xbd\xa3\x03\x48\x92\xd4\x8a\x23\
+\x00\xc5\xd9\x27\x3a\x80\x24\x49\xad\xf4\x00\x8f\x47\x87\xa8\xa9\
+\xad\x80\x2d\xa2\x43\x48\x92\x34\x98\x1e\x60\x29\xf0\x54\x74\x90\
+\x9a\x7a\x69\x74\x00\x49\x92\x06\xd3\xd3\xfb\xeb\x82\xc8\x10\x35\
+\xf6\xaa\xe8\x00\x92\x24\x0d\xa6\xaf\x01\xf8\x63\x68\x8a\xfa\xb2\
+\x01\x90\x24\x65\xc9\x06\xa0\x58\xaf\x62\xfd\xdf\xb1\x24\x49\xd9\
+\x70\x0a\xa0\x58\x9b\xe0\x79\x00\x92\xa4\x0c\x39\x02\x50\xbc\x57\
+\x47\x07\x90\x24\x69\x20\x1b\x80\xe2\xbd\x3e\x3a\x80\x24\x49\x03\
+\x8d\xe9\xfd\x75\x12\xb0\xac\xdf\xff\x56\xf7\x2c\x03\x66\x00\x2b\
+\xa2\x83\x48\x92\xd4\xa7\x6f\x04\xe0\x05\xe0\xb1\xc8\x20\x35\x36\
+\x19\x38\x30\x3a\x84\x24\x49\xfd\xf5\x5f\xa1\x7e\x47\x58\x8a\xfa\
+\x3b\x3c\x3a\x80\x24\x49\xfd\xf5\x6f\x00\x6e\x0d\x4b\x51\x7f\x6f\
+\x8d\x0e\x20\x49\x52\x7f\xfd\x1b\x80\xdb\xc3\x52\xd4\xdf\xce\xc0\
+\xcb\xa2\x43\x48\x92\xd4\xa7\x7f\x03\x70\x5b\x58\x8a\x66\x38\x36\
+\x3a\x80\x24\x49\x7d\xfa\xaf\xfa\x9f\x40\x7a\x30\xd0\x84\xa0\x2c\
+\x75\x77\x3f\xb0\x4b\x74\x08\x49\x92\xe0\xc5\x23\x00\x2b\x81\xbb\
+\xa3\x82\x34\xc0\xce\xc0\x2b\xa2\x43\x48\x92\x04\x1b\x9e\x53\xef\
+\x34\x40\xb1\xde\x1d\x1d\x40\x92\x24\xb0\x01\x28\xdb\x3b\x80\x29\
+\xd1\x21\x24\x49\x1a\xd8\x00\xcc\x0f\x49\xd1\x1c\x53\x71\x31\xa0\
+\x24\x29\x03\x03\x8f\xfe\x9d\x06\x3c\x05\x8c\x0d\xc8\xd2\x14\x37\
+\xe0\xc9\x80\x92\xa4\x60\x03\x47\x00\x96\xe0\x79\x00\x45\x7b\x15\
+\x70\x40\x74\x08\x49\x52\xb3\x0d\x6c\x00\x00\xae\x2f\x3d\x45\xf3\
+\x9c\x1a\x1d\x40\x92\xd4\x6c\x36\x00\x31\x8e\x01\x76\x8a\x0e\x21\
+\x49\x6a\xae\xc1\x1a\x80\xeb\x4a\x4f\xd1\x3c\x63\x81\x53\xa2\x43\
+\x48\x92\x9a\x6b\xe0\x22\xc0\x3e\x0f\x02\xdb\x97\x19\xa4\x81\x96\
+\x91\x46\x01\x1e\x8f\x0e\x22\x49\x6a\x9e\x56\xab\xfd\xe7\x02\x7b\
+\x97\x19\xa4\x81\x26\x90\x1a\xb0\x2b\xa3\x83\x48\x92\x9a\x67\xb0\
+\x29\x00\x70\x1d\x40\x59\x4e\x01\x66\x46\x87\x90\x24\x35\x4f\xab\
+\x06\xe0\xea\x52\x53\x34\xd7\x46\xc0\x69\xd1\x21\x24\x49\xcd\xd3\
+\x6a\x0d\x00\xc0\x02\x60\x87\x92\x72\x34\xd9\x4a\x60\x2f\xe0\xde\
+\xe8\x20\x92\xa4\xe6\x68\x35\x02\x00\x70\x45\x69\x29\x9a\x6d\x02\
+\xf0\xf9\xe8\x10\x92\xa4\x66\x69\xd7\x00\x5c\x5e\x5a\x0a\xbd\x05\
+\x38\x2c\x3a\x84\x24\xa9\x39\xda\x4d\x01\x4c\x06\x16\x03\x13\x4b\
+\xca\xd2\x74\xb7\x02\xfb\x01\x6b\xa2\x83\x48\x92\xea\xaf\xdd\x43\
+\x7f\x56\x01\xf3\xf0\xc4\xba\xb2\x6c\x0d\x3c\x01\xdc\x18\x1d\x44\
+\x92\x54\x7f\xed\xa6\x00\xc0\x69\x80\xb2\x7d\x1e\x98\x15\x1d\x42\
+\x92\x54\x7f\x36\x00\x79\x99\x0c\xfc\x47\x74\x08\x49\x92\x00\xfe\
+\x08\xac\xb3\x4a\xad\xe3\x3a\xba\x32\x92\x24\x8d\xd0\x50\x23\x00\
+\x00\x17\x16\x9e\x42\x03\x7d\x05\xd8\x26\x3a\x84\x24\xa9\xbe\x3a\
+\x69\x00\xbe\x57\x78\x0a\x0d\xb4\x39\xf0\x6d\xda\xef\xd2\x90\x24\
+\xa9\x70\xf7\x12\x3f\x2c\xde\xc4\xfa\x70\x27\x17\x47\x92\xa4\xe1\
+\xea\x64\x04\x00\xe0\x82\x42\x53\xa8\x95\x33\xf1\xa9\x8c\x92\xa4\
+\x02\x74\xda\x00\x38\x0d\x10\x63\x23\xd2\x1a\x8c\x4d\xa2\x83\x48\
+\x92\x9a\xeb\x4e\xe2\x87\xc4\x9b\x5a\x97\xe2\x7a\x00\x49\x52\x17\
+\xb5\x3b\x09\x70\xa0\x2d\x49\x27\x03\xaa\x7c\xbb\x93\x9e\x1a\x78\
+\x6d\x74\x10\x49\x52\xf3\xcc\x26\xfe\x93\x70\x93\x6b\x35\x70\xd4\
+\x90\x57\x49\x92\xa4\x02\xdc\x44\xfc\x8d\xb0\xc9\xb5\x14\x78\xf9\
+\x90\x57\x49\x92\xa4\x21\x74\xba\x08\xb0\xcf\xd9\x85\xa4\x50\xa7\
+\xa6\x00\x3f\x02\xb6\x8f\x0e\x22\x49\xaa\xb6\xe1\x2e\x2c\x9b\x06\
+\x3c\x42\xba\x11\x29\xce\xed\xc0\x21\xc0\xb3\xd1\x41\x24\x49\xd5\
+\x34\xdc\x11\x80\x25\xb8\x25\x30\x07\x7b\x93\x1e\xd4\x64\x23\x26\
+\x49\x2a\xcd\x2b\x89\x9f\x0b\xb7\x52\x5d\x45\x3a\x2b\x40\x92\xa4\
+\x52\xdc\x42\xfc\xcd\xcf\x4a\x75\x39\x30\xa1\xfd\xe5\x92\x24\xe9\
+\xc5\x86\x73\x0e\x40\x7f\xe3\x80\x23\xbb\x19\x44\x23\xb6\x0b\xb0\
+\x17\x70\x09\xb0\x26\x38\x8b\x24\xa9\xe6\xa6\x03\xcb\x88\xff\xf4\
+\x6b\xad\xaf\x9f\xe3\x9a\x00\x49\x52\x87\x86\xbb\x08\xb0\xcf\xb3\
+\xc0\x79\xdd\x0c\xa2\x51\x3b\x94\xb4\x45\x70\x6a\x74\x10\x49\x52\
+\xbd\xcd\x01\xd6\x12\xff\xc9\xd7\x7a\x71\xfd\x16\xd8\xba\xcd\x75\
+\x93\x24\x69\xd4\x7e\x44\xfc\x0d\xcf\xda\xb0\x1e\x06\x5e\xd6\xe6\
+\xba\x49\x92\x34\x2a\xaf\x21\xfe\x66\x67\x0d\x5e\x4b\x80\x23\x5a\
+\x5f\x3a\x49\x92\x46\xc7\xe7\x03\xe4\x5b\x2b\x80\xf7\xb7\xbe\x74\
+\x92\xa4\xa6\x1a\xe9\x36\xc0\xfe\x96\x02\x6f\xed\xc2\xd7\x51\xf7\
+\x8d\x25\x3d\x41\x70\x57\xe0\x0a\x60\x55\x6c\x1c\x49\x52\x9d\x8c\
+\x05\xee\x27\xfe\xd3\xae\xd5\xbe\xe6\x03\x3b\xb7\xb8\x86\x92\xa4\
+\x86\xe9\xc6\x08\xc0\xba\xde\xaf\xf3\x86\x2e\x7c\x2d\x15\x67\x6b\
+\xe0\x44\xe0\x41\xe0\x8e\xe0\x2c\x92\xa4\x9a\x98\x0a\x3c\x49\xfc\
+\xa7\x5c\xab\xb3\x3a\x87\xf4\x64\x47\x49\x52\x43\x75\x63\x04\x00\
+\x60\x25\xe9\xd1\xc2\x87\x75\xe9\xeb\xa9\x58\x2f\x05\x8e\x07\x6e\
+\x06\x16\x06\x67\x91\x24\x55\xdc\x64\xe0\x4f\xc4\x7f\xba\xb5\x3a\
+\xaf\xb5\xa4\xd1\x80\xcd\x06\xb9\x9e\x92\xa4\x1a\xeb\xd6\x08\x00\
+\xa4\x15\xe6\xab\x81\xc3\xbb\xf8\x35\x55\xac\x31\xa4\xd1\x80\xbe\
+\xb5\x01\xbf\x8f\x8d\x23\x49\xaa\xaa\x8d\x48\xa7\xd0\x45\x7f\xb2\
+\xb5\x46\x56\x97\x90\x9e\x2e\x28\x49\xaa\xb9\x6e\x8e\x00\x40\x1a\
+\x01\x78\x81\xb4\xf7\x5c\xd5\xb3\x07\xe9\xe0\xa0\xcd\x81\x1b\x48\
+\x07\x09\x49\x92\xd4\x91\x09\xc0\x1f\x89\xff\x34\x6b\x8d\xae\x16\
+\x01\x1f\xe8\xbd\x9e\x92\xa4\x9a\xe9\xf6\x08\x00\xc0\x1a\xd2\xe9\
+\x80\x6f\x2e\xe0\x6b\xab\x3c\x93\x49\x23\x39\xef\x22\x2d\x16\x9c\
+\x4f\xba\xb6\x92\x24\xb5\x34\x8e\x74\xd8\x4c\xf4\xa7\x58\xab\x7b\
+\xf5\x00\x70\x12\x30\x11\x49\x92\xda\xf0\x49\x81\xf5\xac\x45\xc0\
+\x67\x49\xeb\x04\x24\x49\x1a\xd4\x0f\x88\xbf\x61\x59\xc5\xd4\x32\
+\xe0\xab\xa4\x6d\x84\x92\xa4\x8a\x19\x53\xf0\xd7\xdf\x19\xb8\x13\
+\x87\x8d\xeb\xee\x77\xc0\xb9\xbd\xf5\x54\x70\x16\x49\x52\x07\x8a\
+\x58\x04\xd8\xdf\xd3\xa4\xe7\x04\x1c\x54\xf0\xf7\x51\xac\x99\xa4\
+\x03\xa0\x3e\x04\xcc\x21\x2d\x16\x7c\x90\xb4\x2d\x54\x92\x94\xa1\
+\xa2\x47\x00\x20\x3d\x74\xe6\x6e\xd2\xd3\xe8\xd4\x1c\x4b\x80\x4b\
+\x81\x0b\x81\xab\x80\xe7\x62\xe3\x48\x92\xfa\x2b\xa3\x01\x00\x78\
+\x37\xf0\x9f\x25\x7d\x2f\xe5\x67\x35\x70\x2b\x70\x19\xf0\x43\xd2\
+\x43\x88\xd6\x85\x26\x92\xa4\x86\x2b\xab\x01\xe8\x01\x7e\x03\xec\
+\x5f\xd2\xf7\x53\xde\x9e\x20\x9d\x34\xf8\x2b\xe0\x7a\xe0\x26\x60\
+\x79\x68\x22\x49\x6a\x98\xb2\x1a\x00\x80\x7d\x49\x4d\xc0\xb8\x12\
+\xbf\xa7\xaa\x61\x15\xe9\x41\x44\x77\x00\xb7\xf7\xd6\x9d\xc0\x43\
+\xa4\x43\x88\x24\x49\x5d\x56\x66\x03\x00\x70\x26\x70\x5a\xc9\xdf\
+\x53\xd5\xb5\x12\x58\x08\x2c\xe8\xad\x85\xc0\xe2\xde\x7a\xb2\xf7\
+\xd7\x25\xa4\xe7\x4f\xf4\x8d\x20\x3c\x83\xd3\x0b\x92\x34\xa4\xb2\
+\x1b\x80\x49\xc0\x6d\xf8\xc4\x39\x49\xf5\xf6\x34\x69\xe1\xeb\x32\
+\xe0\x59\x52\x03\x7b\x37\xf0\x07\xe0\x1e\xd2\x28\xd7\xca\xa8\x70\
+\x12\x94\xdf\x00\x40\x3a\x21\xf0\xaa\xa0\xef\x2d\x49\x39\x78\x9e\
+\xb4\xfe\xe5\xea\xde\xfa\x2d\x3e\x6b\x43\x25\x8b\xba\x09\x9f\x4d\
+\x3a\x57\x5e\x92\x04\x8f\x02\xdf\x07\xbe\x4d\xda\x25\x23\x15\x2e\
+\xaa\x01\xd8\x94\xb4\xc8\x6b\x9b\xa0\xef\x2f\x49\xb9\xba\x05\xf8\
+\x32\xf0\x1d\xd2\x02\x59\xa9\x10\x45\x9f\x04\xd8\xca\x72\xd2\x9c\
+\xd8\xdb\x82\xbe\xbf\x24\xe5\x6a\x1b\xe0\xcf\x81\x13\x49\x0b\x5a\
+\x6f\xc3\x53\x35\x55\x80\xa8\x06\x00\xe0\x2e\x60\x0f\x60\xaf\xc0\
+\x0c\x92\x94\xab\x4d\x48\x47\x6c\xff\x15\x69\x8a\xe0\xce\xd8\x38\
+\xaa\x9b\xe8\x85\x78\x9b\x00\xf3\x81\x1d\x82\x73\x48\x52\xee\xae\
+\x01\x3e\x48\x3a\x33\x43\x1a\xb5\x9e\xe0\xef\xff\x0c\x69\x98\xcb\
+\xd5\xaf\x92\xd4\xde\x3c\xd2\x02\xc1\x4f\x10\xff\xe1\x4d\x35\x10\
+\x39\x05\xd0\xe7\x41\xd2\xe3\x82\x0f\x89\x0e\x22\x49\x99\x1b\x07\
+\x1c\x06\x1c\x0c\xfc\x14\x1f\xb2\xa5\x51\xc8\xa5\x8b\x1c\x0f\x5c\
+\x07\xcc\x8d\x0e\x22\x49\x15\xf1\x08\x70\x3c\xe9\x67\xa7\x34\x6c\
+\xb9\x34\x00\x00\x3b\x93\xb6\xbf\x4c\x8d\x0e\x22\x49\x15\xb1\x82\
+\x34\x8d\x7a\x7e\x74\x10\x55\x4f\x0e\x53\x00\x7d\x9e\x06\x16\x01\
+\x6f\x8e\x0e\x22\x49\x15\x31\x0e\x78\x0b\xf0\x38\xe9\xa9\x9a\x52\
+\xc7\x72\x6a\x00\x20\x8d\x00\xec\x06\xec\x1d\x1d\x44\x92\x2a\xa2\
+\x07\x38\x9a\x34\x1a\xe0\x74\x80\x3a\x96\x5b\x03\x00\x70\x39\x70\
+\x24\x9e\x12\x28\x49\xc3\x71\x18\xf0\x14\x70\x63\x74\x10\x55\x43\
+\x4e\x6b\x00\xfa\xdb\x91\x34\x9c\x35\x23\x38\x87\x24\x55\xc9\x5a\
+\xd2\xc2\xc0\x0b\xa2\x83\x28\x7f\xd1\xe7\x00\xb4\xb2\x00\x78\x17\
+\xe9\xc5\x2c\x49\xea\x4c\x0f\x70\x0e\x70\x50\x74\x10\xe5\x2f\xc7\
+\x29\x80\x3e\xf7\x90\xf2\xbd\x3a\x3a\x88\x24\x55\xc8\x38\xe0\xf5\
+\xc0\xb9\xa4\xc7\x0e\x4b\x83\xca\xb9\x01\x00\xf8\x25\xb0\x3f\x69\
+\x61\xa0\x24\xa9\x33\xd3\x48\x8b\xa9\xbf\x4b\x7a\xa0\x90\xb4\x81\
+\xdc\x1b\x80\x75\xa4\x45\x81\xc7\x92\x1e\x21\x2c\x49\xea\xcc\xae\
+\xc0\x32\xe0\x57\xd1\x41\x94\xa7\x5c\x17\x01\x0e\xb4\x17\x69\x7b\
+\xcb\xf4\xe8\x20\x92\x54\x21\xcb\x81\x7d\x80\x7b\xa3\x83\x28\x3f\
+\xb9\x2e\x02\x1c\xe8\x0e\xd2\xf3\xb1\x57\x46\x07\x91\xa4\x0a\xd9\
+\x08\xf8\x4a\x74\x08\xe5\x29\xf7\x29\x80\xfe\x16\x90\xce\xbe\xf6\
+\xa4\x40\x49\xea\xdc\xce\xc0\x9d\xf8\x18\x61\x0d\x50\xa5\x06\x00\
+\x60\x3e\x69\x85\xeb\x9f\x45\x07\x91\xa4\x0a\x39\x00\xf8\x2a\x3e\
+\x7a\x5d\xfd\x54\xad\x01\x00\xb8\x06\x98\x05\xbc\x34\x38\x87\x24\
+\x55\xc5\x74\xe0\x21\xe0\xe6\xe8\x20\xca\x47\x55\x16\x01\x0e\x34\
+\x9e\xb4\x3b\xe0\xb5\xd1\x41\x24\xa9\x22\x1e\x00\x76\x07\x56\x47\
+\x07\x51\x1e\xaa\xb2\x08\x70\xa0\x55\xa4\xad\x81\x77\x45\x07\x91\
+\xa4\x8a\xd8\x89\x74\x4c\xb0\x04\x54\x77\x04\xa0\xcf\x4b\x48\x87\
+\x05\xed\x14\x1d\x44\x92\x2a\xe0\xb7\xc0\xdc\xe8\x10\xca\x43\xd5\
+\x1b\x00\x80\xed\x49\x4d\xc0\x0e\xd1\x41\x24\xa9\x02\x66\x03\x7f\
+\x88\x0e\xa1\x78\x55\x9d\x02\xe8\x6f\x21\xf0\x3a\xe0\x4f\xd1\x41\
+\x24\xa9\x02\x4e\x88\x0e\xa0\x3c\xd4\x61\x04\xa0\xcf\xde\xc0\xd5\
+\xf8\x08\x61\x49\x6a\x67\x21\x69\x27\x95\x4f\x5b\x6d\xb8\x3a\x8c\
+\x00\xf4\xb9\x1d\x38\x12\x58\x1a\x1d\x44\x92\x32\xb6\x3d\x6e\xa3\
+\x16\xf5\x6a\x00\x00\x6e\x04\x0e\x27\x3d\x00\x43\x92\x34\xb8\xd7\
+\x44\x07\x50\xbc\xba\x35\x00\x90\x9e\x7c\xe5\x48\x80\x24\xb5\x76\
+\x68\x74\x00\xc5\xab\xd3\x1a\x80\x81\xf6\x07\xae\xc0\x35\x01\x92\
+\x34\xd0\x52\xd2\xcf\xc6\x55\xd1\x41\x14\xa7\x8e\x23\x00\x7d\x6e\
+\x22\xed\x0e\x78\x22\x3a\x88\x24\x65\x66\x2a\x69\x3b\xa0\x1a\xac\
+\xce\x0d\x00\xc0\x2d\xa4\x07\x07\x3d\x1c\x1d\x44\x92\x32\xb3\x5b\
+\x74\x00\xc5\xaa\x7b\x03\x00\xe9\xc0\x8b\x43\x80\xfb\xa3\x83\x48\
+\x52\x46\x76\x8f\x0e\xa0\x58\x4d\x68\x00\x00\x16\x90\x9a\x80\x3b\
+\x83\x73\x48\x52\x2e\x6c\x00\x1a\xae\x29\x0d\x00\xc0\x63\xa4\xad\
+\x2f\xbf\x8e\x0e\x22\x49\x19\x98\x15\x1d\x40\xb1\x9a\xd4\x00\x00\
+\x3c\x0e\xcc\x03\xce\x0b\xce\x21\x49\xd1\xa6\x45\x07\x50\xac\xa6\
+\x35\x00\x00\x2b\x80\xb7\x03\x9f\x8b\x0e\x22\x49\x81\xa6\x46\x07\
+\x50\xac\x26\x36\x00\x00\xeb\x80\xcf\x02\xef\x01\x56\xc7\x46\x91\
+\xa4\x10\x36\x00\x0d\x57\xe7\x83\x80\x3a\xf5\x46\xe0\xbb\xc0\xe4\
+\xe8\x20\x92\x54\xa2\xe5\xc0\xa4\xe8\x10\x8a\xd3\xd4\x11\x80\xfe\
+\x7e\x08\xbc\x9a\xb4\x48\x50\x92\x9a\x62\x45\x74\x00\xc5\xb2\x01\
+\x48\x7e\x47\x7a\x3a\xd6\xcf\xa3\x83\x48\x52\x49\x96\x44\x07\x50\
+\x2c\x1b\x80\xf5\x9e\x00\xde\x00\x9c\x19\x1d\x44\x92\x4a\xe0\x03\
+\xd3\x1a\xce\x06\xe0\xc5\x56\x03\x9f\x20\xed\x12\xf0\x91\xc2\x92\
+\xea\xcc\x06\xa0\xe1\x6c\x00\x06\xf7\x5d\xe0\x40\x3c\x3e\x58\x52\
+\x7d\xb9\xee\xa9\xe1\x6c\x00\x5a\xbb\x0d\xd8\x17\xb8\x24\x3a\x88\
+\x24\x15\xe0\xee\xe8\x00\x8a\x65\x03\xd0\xde\x12\xe0\xad\xc0\x27\
+\xf1\xb9\xd9\x92\xea\xc5\x06\xa0\xe1\x6c\x00\x86\xb6\x16\xf8\x3c\
+\x69\x4a\xe0\x9e\xe0\x2c\x92\xd4\x2d\x36\x00\x0d\x67\x03\xd0\xb9\
+\x9b\x48\x53\x02\x67\x47\x07\x91\xa4\x51\x5a\x83\x4f\x47\x6d\x3c\
+\x1b\x80\xe1\x59\x46\x3a\x3e\xf8\x2d\xc0\xe2\xe0\x2c\x92\x34\x52\
+\x37\x03\xcf\x46\x87\x50\x2c\x1b\x80\x91\xb9\x18\x98\x03\x5c\x11\
+\x1d\x44\x92\x46\xc0\x43\xcf\x64\x03\x30\x0a\x8b\x80\xa3\x80\x53\
+\xf1\xcc\x00\x49\xd5\x72\x75\x74\x00\xc5\xf3\x61\x40\xdd\xb1\x23\
+\xf0\x35\xd2\x49\x82\x92\x94\xb3\x65\xc0\x96\xc0\xf3\xd1\x41\x14\
+\xcb\x11\x80\xee\x58\x00\x1c\x0e\xbc\x8d\x74\xa4\xb0\x24\xe5\xea\
+\x22\xbc\xf9\x0b\x1b\x80\x6e\xbb\x00\xd8\x03\xf8\x46\x74\x10\x49\
+\x6a\xe1\xdc\xe8\x00\xca\x83\x53\x00\xc5\x39\x1a\xf8\x2a\xb0\x5d\
+\x74\x10\x49\xea\xf5\x28\xb0\x3d\x69\x1b\xa0\x1a\xce\x11\x80\xe2\
+\x5c\x06\xcc\x06\xce\x00\x96\x07\x67\x91\x24\x80\x6f\xe2\xcd\x5f\
+\xbd\x1c\x01\x28\xc7\xb6\xc0\x3f\x01\x27\xe0\xdf\xb9\xa4\x18\xcb\
+\x80\x59\xb8\x4e\x49\xbd\x1c\x01\x28\xc7\xc3\xc0\x89\xc0\xa1\xc0\
+\xfc\xe0\x2c\x92\x9a\xe9\x2c\xbc\xf9\xab\x1f\x3f\x8d\x96\xaf\x87\
+\x34\x12\xa4\x10\x54\xb8\x00\x00\x03\x11\x49\x44\x41\x54\xf0\x05\
+\x60\xab\xe0\x2c\x92\x9a\x61\x05\xb0\x13\x69\x0d\x80\x04\xc0\xd8\
+\xe8\x00\x0d\xb4\x0e\xb8\x95\xf4\x4c\x81\x31\xc0\xcb\x81\x09\xa1\
+\x89\x24\xd5\xdd\x17\x80\x1f\x44\x87\x50\x5e\x1c\x01\x88\xb7\x39\
+\xf0\x31\xe0\xc3\xc0\xa4\xe0\x2c\x92\xea\x67\x21\xb0\x27\x9e\x58\
+\xaa\x01\x1c\x01\x88\xf7\x3c\x70\x15\xf0\x7f\x49\x8f\x1e\xde\x1f\
+\x18\x17\x9a\x48\x52\x9d\x9c\x08\xdc\x11\x1d\x42\xf9\x71\x04\x20\
+\x3f\x3b\x02\x9f\x06\xde\x89\x8d\x80\xa4\xd1\xb9\x98\xf4\xf4\x52\
+\x69\x03\x36\x00\xf9\xda\x0d\x38\x8d\xb4\x60\x70\x62\x70\x16\x49\
+\xd5\xb3\x90\xb4\xc6\xe8\xa9\xe8\x20\xca\x93\x0d\x40\xfe\xb6\x04\
+\x3e\x00\x9c\x02\xcc\x08\xce\x22\xa9\x1a\x56\x03\xf3\x80\xeb\x83\
+\x73\x28\x63\xae\x01\xc8\xdf\x32\xe0\x1a\xd2\xb1\xc2\x8b\x48\xcf\
+\x1a\xd8\x34\x32\x90\xa4\xec\x7d\x1c\xf8\x5e\x74\x08\xe5\xcd\x11\
+\x80\xea\xe9\x01\x8e\x02\xfe\x1e\x38\x20\x38\x8b\xa4\xfc\x7c\x03\
+\x78\x6f\x74\x08\xe5\xcf\x06\xa0\xda\xf6\x03\x4e\x06\xde\x0e\x4c\
+\x09\xce\x22\x29\xde\xa5\xc0\x5b\x49\x53\x00\x52\x5b\x36\x00\xf5\
+\x30\x8d\xd4\x04\xbc\x07\xd8\x37\x38\x8b\xa4\x18\xbf\x00\x0e\xc7\
+\x87\x8f\xa9\x43\x36\x00\xf5\x33\x87\xb4\x85\xf0\x3d\xc0\x66\xc1\
+\x59\x24\x95\xe3\x2a\xd2\x76\xbf\xa5\xd1\x41\x54\x1d\x36\x00\xf5\
+\x35\x85\x34\x14\x78\x1c\x70\x18\x30\x3e\x36\x8e\xa4\x82\x7c\x1b\
+\xf8\x6b\x1c\xf6\xd7\x30\xd9\x00\x34\xc3\x0c\xe0\x2f\x80\xe3\x49\
+\x5b\x83\xdc\xfd\x21\x55\xdf\x3a\xe0\xff\x00\x9f\xea\xfd\xbd\x34\
+\x2c\x36\x00\xcd\x33\x83\xb4\x8b\xe0\x58\xd2\x7c\xa1\xa7\x0d\x4a\
+\xd5\xf3\x2c\x70\x12\x70\x61\x74\x10\x55\x97\x0d\x40\xb3\xcd\x04\
+\x8e\x24\x35\x02\xaf\x23\x2d\x26\x94\x94\xb7\x5f\x01\x7f\x49\x3a\
+\xe9\x4f\x1a\x31\x1b\x00\xf5\x19\x0f\x1c\x44\x6a\x06\x8e\x00\xf6\
+\x89\x8d\x23\x69\x80\xa5\xc0\x67\x80\x7f\xc7\xf9\x7e\x75\x81\x0d\
+\x80\x5a\xd9\x96\xd4\x08\xbc\x16\x38\x84\x34\x5a\x20\x29\xc6\x79\
+\xc0\x47\x81\x47\xa3\x83\xa8\x3e\x6c\x00\xd4\xa9\x1d\x81\x83\x49\
+\xa3\x04\x07\x93\x9e\x2f\xde\x13\x19\x48\x6a\x80\x2b\x81\xd3\x81\
+\x6b\xa3\x83\xa8\x7e\x6c\x00\x34\x52\x9b\x02\x07\x92\x1a\x82\xfd\
+\x49\x53\x06\x5b\x85\x26\x92\xea\x61\x1d\x70\x19\x70\x06\xf0\x9b\
+\xe0\x2c\xaa\x31\x1b\x00\x75\xd3\xa6\xa4\x83\x88\xf6\x23\x8d\x10\
+\xcc\x21\x9d\x4c\x38\x29\x32\x94\x54\x11\x0b\x81\xef\x02\x67\x03\
+\xf7\x05\x67\x51\x03\xd8\x00\xa8\x68\xe3\x80\xdd\x81\x5d\x49\xd3\
+\x08\xb3\x06\xd4\xe4\xb0\x64\x52\xac\x35\xc0\xcd\xc0\xd5\xc0\x25\
+\xc0\x0d\xb1\x71\xd4\x34\x36\x00\x8a\xb6\x05\xeb\x9b\x81\xad\x49\
+\xe7\x14\xcc\x00\x36\xef\xfd\xb3\xbe\xdf\xcf\x00\x26\x06\x65\x94\
+\x46\x6b\x05\x70\x2f\x70\x37\x70\x0f\x69\x68\xff\x17\xc0\x33\x91\
+\xa1\xd4\x6c\x36\x00\xaa\x92\x29\xc0\x74\xd6\x37\x02\x9b\xf6\xfe\
+\xba\x11\xeb\xa7\x19\xa6\xe3\xe2\x44\xc5\x5a\x47\xba\xb1\x2f\x05\
+\x9e\x03\x96\x90\x56\xef\xaf\x89\x0c\x25\x49\x92\x24\x49\x92\x24\
+\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\
+\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\
+\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\
+\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\
+\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\
+\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\
+\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\x92\x24\x49\
+\x92\x24\x49\x92\x24\x49\x92\x72\xf7\xff\x00\x6a\x03\x21\xe7\x07\
+\x90\xa3\x5c\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x11\x38\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x02\x00\x00\x00\x02\x00\x08\x06\x00\x00\x00\xf4\x78\xd4\xfa\
+\x00\x00\x00\x04\x73\x42\x49\x54\x08\x08\x08\x08\x7c\x08\x64\x88\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0e\xc4\x00\x00\x0e\xc4\
+\x01\x95\x2b\x0e\x1b\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\
+\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\
+\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x10\xb5\x49\x44\
+\x41\x54\x78\x9c\xed\xdd\x6b\xac\xed\x79\x5d\xdf\xf1\xf7\x99\x39\
+\xc3\x55\x06\x06\xa8\x30\x40\x2b\xda\x76\x62\x8d\x5a\x23\x6a\x0d\
+\xd5\xa4\xa6\x14\xb1\x46\x10\x28\xd6\x18\x1b\x6d\xa3\x35\x01\xb5\
+\xf2\xa0\xf5\x92\x6a\x9a\x28\xda\x84\x26\x5a\xc5\x0b\x12\xa3\x05\
+\x8c\xd0\x52\x50\x4a\xc5\x54\xa4\x46\x63\x04\xd4\x16\x15\xab\x18\
+\x14\xcd\xe8\xc0\x80\x0d\x20\x30\x33\x4c\x99\x73\xfa\x60\x9d\x56\
+\x9c\x9c\xb3\x6f\x67\xed\xfd\x5b\x7b\x7d\x5f\xaf\xe4\xff\x68\xdf\
+\x3e\x67\xaf\xcb\x7e\xcf\x5a\xff\xb5\xa6\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\xf6\xca\x85\x2d\x7c\xfd\x67\x55\x4f\
+\xab\x3e\xa1\x7a\x6c\xf5\x98\x2d\x7c\x5f\x80\x7d\xf5\xe1\xea\xf6\
+\xea\xce\xea\x4d\xd5\xcf\x55\x1f\x5c\xba\x88\x91\x4e\xfa\x87\xfa\
+\x11\xd5\xbf\xac\xbe\xaa\x7a\xfc\xf6\xe6\x00\x8c\xf3\x91\xea\xe7\
+\xab\xef\xac\xde\xb2\x78\x0b\x83\x1c\x37\x00\x2e\x54\xdf\x50\x7d\
+\x47\xf5\xa8\xed\xcf\x01\x18\xeb\x72\xf5\xaa\xea\xf9\xd5\x9f\x2e\
+\xde\xc2\x00\xc7\x09\x80\x07\x55\x2f\xa9\xbe\xf2\x94\xb6\x00\x50\
+\xef\xaa\x9e\x59\xbd\x79\xf5\x10\xf6\xdb\x51\x03\xe0\x61\xd5\x1b\
+\xdb\x3c\xdf\x0f\xc0\xe9\xba\xa7\x7a\x76\xf5\xb3\xab\x87\xb0\xbf\
+\x8e\x12\x00\x37\x54\xaf\xa9\x9e\x7e\xca\x5b\x00\xf8\x0b\x1f\xac\
+\x9e\x5c\xbd\x6d\xf5\x10\xf6\xd3\x0d\x47\xf8\x9c\xef\xc8\x1f\x7f\
+\x80\xb3\xf6\xb0\xea\xa7\xab\x87\xae\x1e\xc2\x7e\xba\xf1\x90\x8f\
+\x3f\xbe\x7a\x65\x75\xd3\x19\x6c\x01\xe0\x2f\x7b\x64\x75\x77\xf5\
+\x4b\xab\x87\xb0\x7f\x0e\x7b\x0a\xe0\xc7\xab\xaf\x3e\x83\x1d\x00\
+\x5c\xdd\x9f\x57\x7f\xa3\x7a\xef\xea\x21\xec\x97\x83\x1e\x01\x78\
+\x44\xf5\xd2\x43\x3e\x07\x80\xd3\xf5\xc0\x36\x6f\x1a\xf4\xab\xab\
+\x87\xb0\x5f\x0e\x3a\x07\xe0\x8b\xab\x07\x9c\xd5\x10\x00\xae\xe9\
+\x19\xab\x07\xb0\x7f\x0e\x0b\x00\x00\xd6\x7b\x72\x9b\xf3\x01\x60\
+\x6b\x0e\x0a\x80\xdb\xce\x6c\x05\x00\x07\xb9\xb1\xfa\xa4\xd5\x23\
+\xd8\x2f\x07\x05\xc0\xad\x67\xb6\x02\x80\xc3\x3c\x6e\xf5\x00\xf6\
+\xcb\x41\x01\xf0\xf1\x67\xb6\x02\x80\xc3\x3c\x66\xf5\x00\xf6\xcb\
+\x41\x01\x70\xf1\xcc\x56\x00\x70\x18\xf7\xc9\x6c\xd5\x51\xde\x09\
+\x10\x00\xd8\x33\x02\x00\x00\x06\x12\x00\x00\x30\x90\x00\x00\x80\
+\x81\x04\x00\x00\x0c\x24\x00\x00\x60\x20\x01\x00\x00\x03\x09\x00\
+\x00\x18\x48\x00\x00\xc0\x40\x02\x00\x00\x06\x12\x00\x00\x30\x90\
+\x00\x00\x80\x81\x04\x00\x00\x0c\x24\x00\x00\x60\x20\x01\x00\x00\
+\x03\x09\x00\x00\x18\x48\x00\x00\xc0\x40\x02\x00\x00\x06\x12\x00\
+\x00\x30\x90\x00\x00\x80\x81\x04\x00\x00\x0c\x24\x00\x00\x60\x20\
+\x01\x00\x00\x03\x09\x00\x00\x18\x48\x00\x00\xc0\x40\x02\x00\x00\
+\x06\x12\x00\x00\x30\x90\x00\x00\x80\x81\x04\x00\x00\x0c\x24\x00\
+\x00\x60\x20\x01\x00\x00\x03\x09\x00\x00\x18\x48\x00\x00\xc0\x40\
+\x02\x00\x00\x06\x12\x00\x00\x30\x90\x00\x00\x80\x81\x04\x00\x00\
+\x0c\x24\x00\x00\x60\x20\x01\x00\x00\x03\x09\x00\x00\x18\x48\x00\
+\x00\xc0\x40\x02\x00\x00\x06\x12\x00\x00\x30\x90\x00\x00\x80\x81\
+\x04\x00\x00\x0c\x24\x00\x00\x60\x20\x01\x00\x00\x03\x09\x00\x00\
+\x18\x48\x00\x00\xc0\x40\x02\x00\x00\x06\x12\x00\x00\x30\x90\x00\
+\x00\x80\x81\x04\x00\x00\x0c\x24\x00\x00\x60\x20\x01\x00\x00\x03\
+\x5d\x5c\x3d\x60\xb1\x0f\x57\xf7\xae\x1e\xb1\x67\x6e\xac\x6e\x5e\
+\x3d\x62\x87\x7d\xa4\xba\x6b\xf5\x88\x3d\xf4\x88\xea\xc2\xea\x11\
+\x70\x9e\x4c\x0f\x80\xe7\x56\x2f\x5d\x3d\x62\xcf\xdc\x56\xbd\x7d\
+\xf5\x88\x1d\xf6\xc3\xd5\xf3\x57\x8f\xd8\x43\x1f\xaa\x1e\xba\x7a\
+\x04\x9c\x27\x9e\x02\x00\x80\x81\x04\x00\x00\x0c\x24\x00\x00\x60\
+\x20\x01\x00\x00\x03\x09\x00\x00\x18\x48\x00\x00\xc0\x40\x02\x00\
+\x00\x06\x12\x00\x00\x30\x90\x00\x00\x80\x81\x04\x00\x00\x0c\x24\
+\x00\x00\x60\x20\x01\x00\x00\x03\x09\x00\x00\x18\x48\x00\x00\xc0\
+\x40\x02\x00\x00\x06\x12\x00\x00\x30\x90\x00\x00\x80\x81\x04\x00\
+\x00\x0c\x24\x00\x00\x60\x20\x01\x00\x00\x03\x09\x00\x00\x18\x48\
+\x00\x00\xc0\x40\x02\x00\x00\x06\x12\x00\x00\x30\x90\x00\x00\x80\
+\x81\x04\x00\x00\x0c\x24\x00\x00\x60\xa0\x83\x02\xe0\xd2\x99\xad\
+\x58\x67\xc2\xbf\x11\x26\x98\x70\x5b\x9e\xf0\x6f\xe4\x0c\x1d\x14\
+\x00\xef\x3d\xb3\x15\xeb\xbc\x67\xf5\x00\x60\x2b\xdc\x5f\xc1\x31\
+\x1d\x14\x00\xef\x3a\xb3\x15\xeb\xdc\xb1\x7a\x00\xb0\x15\xee\xaf\
+\xe0\x98\x0e\x0a\x80\x77\x9e\xd9\x8a\x35\xee\xab\x6e\x5f\x3d\x02\
+\xd8\x8a\x7d\xbf\xbf\xba\x5c\xfd\xd1\xea\x11\xec\x97\x83\x02\xe0\
+\xf5\x67\xb6\x62\x8d\x5f\xa9\x3e\xb0\x7a\x04\xb0\x15\xfb\x7e\x7f\
+\xf5\x3f\xaa\x3b\x57\x8f\x60\xbf\x1c\x14\x00\xaf\x6d\xbf\x4f\x3a\
+\xf9\x99\xd5\x03\x80\xad\xf9\xaf\xd5\xbd\xab\x47\x9c\x22\xf7\x57\
+\x6c\xdd\x41\x01\x70\x67\x9b\x1b\xd5\x3e\xba\xab\x7a\xc5\xea\x11\
+\xc0\xd6\x7c\xa0\x7a\xf5\xea\x11\xa7\xe4\xde\xea\xe5\xab\x47\xb0\
+\x7f\x0e\x7b\x1f\x80\x6f\xae\x3e\x7a\x16\x43\xce\xd8\xf7\xe6\x84\
+\x1a\xd8\x37\xdf\xd6\x7e\x3e\x0a\xf0\x43\xed\xff\x39\x0e\x2c\x70\
+\x58\x00\xfc\x6e\xf5\x63\x67\x31\xe4\x0c\xdd\x51\xbd\x70\xf5\x08\
+\x60\xeb\xde\x59\xbd\x68\xf5\x88\x2d\xfb\xb3\xea\x05\xab\x47\xb0\
+\x9f\x8e\xf2\x4e\x80\xdf\x54\xbd\xf9\xb4\x87\x9c\x91\x7b\xaa\x67\
+\xe7\xe4\x3f\xd8\x57\xdf\x52\xfd\xe2\xea\x11\x5b\xf2\x7f\xaa\x2f\
+\x6b\x13\x01\xb0\x75\x47\x09\x80\x7b\xaa\x67\x75\xfe\x5f\x32\x77\
+\xa9\xfa\xda\xea\x4d\xab\x87\x00\xa7\xe6\xff\xfd\xd1\xfc\x83\xd5\
+\x43\xae\xd3\xe5\xea\x79\xd5\x7f\x5f\x3d\x84\xfd\x75\xd4\xff\x17\
+\xc0\x1d\xd5\xdf\xe9\xfc\x3e\x12\xf0\xa1\x36\x11\xe3\x44\x1a\xd8\
+\x7f\xef\x6d\x73\x7f\x75\x5e\xff\x78\xde\x53\xfd\x93\xea\x25\xab\
+\x87\xc0\xc7\x7a\x50\xf5\x03\x6d\x4e\xb4\xb9\x7c\x4e\x8e\x37\x55\
+\x9f\x72\x1a\xbf\x0c\xae\xea\xb6\xd6\x5f\xe6\xbb\x7c\x7c\xef\xc9\
+\x7f\xb5\x1c\xd3\x03\xaa\x7f\x57\x7d\xa4\xf5\x97\xfb\x51\x8f\xdf\
+\xa8\x3e\xe3\x34\x7e\x19\xb0\x2d\xb7\x55\xff\xa9\xdd\x0e\x81\xb7\
+\x55\xff\xa8\xba\x70\x4a\xbf\x03\xae\x4e\x00\x1c\x7c\x08\x80\xb3\
+\xf7\x49\xd5\x4f\xb6\xdb\x21\xf0\x7b\xd5\x57\xe4\xfe\x8a\x33\x74\
+\xbd\x57\xb6\x5b\xaa\x7f\x58\x7d\x61\xf5\xc4\xea\xd6\xea\x51\xd7\
+\xf9\x3d\x4f\xe2\xee\x36\x4f\x53\xdc\x51\xfd\x6a\x9b\x37\xcd\xf8\
+\xdd\x05\x3b\xd8\x04\xc0\xdb\x57\x8f\xd8\x61\xdf\x57\x3d\x7f\xf5\
+\x88\xa1\x1e\x5e\x3d\xad\xfa\xa2\xea\x13\xab\xc7\x56\x7f\x65\xc1\
+\x8e\x7b\xfa\x8b\xfb\xab\x37\xb7\xb9\xbf\x7a\xdb\x82\x1d\x00\x5b\
+\xe5\x11\x00\x8f\x00\x00\xe7\xc0\x51\x4f\x02\x04\x00\xf6\x88\x00\
+\x00\x80\x81\x04\x00\x00\x0c\x24\x00\x00\x60\x20\x01\x00\x00\x03\
+\x09\x00\x00\x18\x48\x00\x00\xc0\x40\x02\x00\x00\x06\x12\x00\x00\
+\x30\x90\x00\x00\x80\x81\x04\x00\x00\x0c\x24\x00\x00\x60\x20\x01\
+\x00\x00\x03\x09\x00\x00\x18\x48\x00\x00\xc0\x40\x02\x00\x00\x06\
+\x12\x00\x00\x30\x90\x00\x00\x80\x81\x04\x00\x00\x0c\x24\x00\x00\
+\x60\x20\x01\x00\x00\x03\x09\x00\x00\x18\x48\x00\x00\xc0\x40\x02\
+\x00\x00\x06\x12\x00\x00\x30\xd0\xc5\xd5\x03\x80\x11\x1e\x50\x3d\
+\xa6\xba\x69\xf5\x10\xd8\x33\x1f\xae\xee\x3c\xc9\x17\x0a\x00\xe0\
+\xb4\xdc\x52\x3d\xb7\x7a\x56\xf5\x99\x8b\xb7\xc0\x3e\xbb\xbb\xfa\
+\x6f\xd5\xcb\xaa\x57\x57\x97\x8f\xf2\x45\x9e\x02\x00\x4e\xc3\x57\
+\x57\xef\xa8\xbe\x2b\x7f\xfc\xe1\xb4\x3d\xb8\x7a\x46\xf5\xaa\xea\
+\x4d\xd5\x6d\x47\xf9\x22\x01\x00\x6c\xdb\xbf\xad\x7e\xbc\x7a\xe4\
+\xea\x21\x30\xd0\xe7\xb4\x89\x80\xcf\x3b\xec\x13\x05\x00\xb0\x4d\
+\xcf\xab\xbe\x79\xf5\x08\x18\xee\x96\xea\x35\xd5\x27\x1e\xf4\x49\
+\x02\x00\xd8\x96\x27\x54\x2f\x5c\x3d\x02\xa8\xea\xd1\xd5\x0f\x1d\
+\xf4\x09\x02\x00\xd8\x96\x6f\x6f\xf3\x5c\x24\xb0\x1b\x9e\xd6\x01\
+\x4f\x05\x08\x00\x60\x1b\x6e\x6c\x73\xb6\x3f\xb0\x5b\xbe\xec\x5a\
+\x1f\x10\x00\xc0\x36\x7c\x7a\x9b\x87\x1c\x81\xdd\xf2\x05\xd7\xfa\
+\x80\x00\x00\xb6\xe1\x09\xab\x07\x00\x57\x75\xcd\xdb\xa6\x00\x00\
+\xb6\xe1\xe6\xd5\x03\x80\xab\x7a\xc4\xb5\x3e\x20\x00\x80\x6d\xb8\
+\xb0\x7a\x00\x70\x3c\x02\x00\x00\x06\x12\x00\x00\x30\x90\x00\x00\
+\x80\x81\x04\x00\x00\x0c\x24\x00\x00\x60\x20\x01\x00\x00\x03\x09\
+\x00\x00\x18\x48\x00\x00\xc0\x40\x02\x00\x00\x06\x12\x00\x00\x30\
+\x90\x00\x00\x80\x81\x04\x00\x00\x0c\x24\x00\x00\x60\x20\x01\x00\
+\x00\x03\x09\x00\x00\x18\x48\x00\x00\xc0\x40\x02\x00\x00\x06\x12\
+\x00\x00\x30\x90\x00\x00\x80\x81\x04\x00\x00\x0c\x24\x00\x00\x60\
+\x20\x01\x00\x00\x03\x09\x00\x00\x18\x48\x00\x00\xc0\x40\x02\x00\
+\x00\x06\x12\x00\x00\x30\x90\x00\x00\x80\x81\x04\x00\x00\x0c\x24\
+\x00\x00\x60\x20\x01\x00\x00\x03\x09\x00\x00\x18\x48\x00\x00\xc0\
+\x40\x02\x00\x00\x06\x12\x00\x00\x30\x90\x00\x00\x80\x81\x2e\xae\
+\x1e\x00\x70\x4a\xfe\x57\xf5\x2f\x56\x8f\x38\x45\x3f\x55\x3d\x7a\
+\xf5\x88\x13\x78\x45\xf5\x63\xab\x47\x9c\x92\xc7\x55\xff\x61\xf5\
+\x88\xa3\x12\x00\xc0\xbe\xfa\x40\xf5\x86\xd5\x23\x4e\xd1\x3d\xab\
+\x07\x9c\xd0\x1f\xb5\xbf\x97\xcb\x5f\x5f\x3d\xe0\x38\x3c\x05\x00\
+\x00\x03\x09\x00\x00\x18\x48\x00\x00\xc0\x40\x02\x00\x00\x06\x12\
+\x00\x00\x30\x90\x00\x00\x80\x81\x04\x00\x00\x0c\x24\x00\x00\x60\
+\x20\x01\x00\x00\x03\x09\x00\x00\x18\x48\x00\x00\xc0\x40\x02\x00\
+\x00\x06\x12\x00\x00\x30\x90\x00\x00\x80\x81\x04\x00\x00\x0c\x24\
+\x00\x00\x60\x20\x01\x00\x6c\xc3\xe5\xd5\x03\x80\xe3\x11\x00\xc0\
+\x36\xbc\x7f\xf5\x80\xab\xf8\xdf\xab\x07\x30\xce\xfb\x56\x0f\xb8\
+\x8a\x6b\xde\x0e\x04\x00\xb0\x0d\x7f\xb2\x7a\xc0\x55\xfc\xe9\xea\
+\x01\x8c\xf3\xbe\xea\xae\xd5\x23\xee\xe7\x9a\xb7\x03\x01\x00\x6c\
+\xc3\x6f\x57\xef\x5e\x3d\xe2\x7e\x7e\x61\xf5\x00\xc6\xb9\x5c\xbd\
+\x71\xf5\x88\xfb\x79\xc3\xb5\x3e\x20\x00\x80\x6d\xb8\x54\xbd\x6a\
+\xf5\x88\x8f\xf1\xfe\xea\xe7\x56\x8f\x60\xa4\x9f\x5a\x3d\xe0\x7e\
+\x5e\x79\xad\x0f\x08\x00\x60\x5b\xbe\xb3\xfa\xe0\xea\x11\x57\x7c\
+\x77\xbb\xb3\x85\x59\x5e\x51\xbd\x75\xf5\x88\x2b\x5e\x53\xbd\xe5\
+\x5a\x1f\x14\x00\xc0\xb6\xbc\xa7\xfa\xfa\xd5\x23\xaa\x5f\xa9\xfe\
+\xfd\xea\x11\x8c\x75\xa9\xfa\xa7\xd5\x87\x17\xef\x78\x77\xf5\x8d\
+\x07\x7d\x82\x00\x00\xb6\xe9\xa5\xd5\xbf\x6e\xdd\xcb\x02\xff\x67\
+\xf5\xac\xea\xde\x45\x3f\x1f\x6a\xf3\x08\xc0\x97\xb7\x2e\x02\xee\
+\xac\xbe\xa4\x43\x4e\xce\x15\x00\xc0\xb6\xbd\xa0\x7a\x4e\x75\xc7\
+\x19\xfe\xcc\xfb\xaa\x1f\xad\x3e\xaf\xcd\x23\x11\xb0\xda\xeb\xda\
+\x5c\x1f\xcf\xfa\xe9\x80\x5f\xa8\x3e\xbb\xfa\xf5\xc3\x3e\x51\x00\
+\x00\xa7\xe1\x3f\x57\x7f\xb3\xcd\x43\x90\xbf\x58\xdd\x7d\x0a\x3f\
+\xe3\x52\xf5\x8e\x36\x0f\xf7\x7f\x46\xf5\x75\xed\xde\x4b\xb0\x98\
+\xed\xad\xd5\x93\xaa\x7f\x5c\xbd\xba\xd3\x7b\xbf\x8c\x77\x57\x2f\
+\xab\x9e\x5a\x3d\xa5\xba\xfd\x28\x5f\x74\xf1\x94\xc6\x00\xdc\x55\
+\xfd\xc0\x95\xa3\xea\x96\x2b\xc7\x36\x7c\xa4\xcd\xc3\x9c\x1f\xdd\
+\xd2\xf7\x83\xd3\x72\xa9\xfa\x8f\x57\x8e\xaa\x87\x54\x8f\xa9\x2e\
+\x6c\xe1\x7b\xdf\xd7\xe6\x76\x70\xcf\x49\xbe\x58\x00\x00\x67\xe5\
+\x7d\xed\xe6\x3b\xa5\xc1\x59\xba\xab\x7a\xe7\xea\x11\xe5\x29\x00\
+\x00\x18\x49\x00\x00\xc0\x40\x02\x00\x00\x06\x12\x00\x00\x30\x90\
+\x00\x00\x80\x81\x04\x00\x00\x0c\x24\x00\x00\x60\x20\x01\x00\x00\
+\x03\x09\x00\x00\x18\x48\x00\x00\xc0\x40\x02\x00\x00\x06\x12\x00\
+\x00\x30\x90\x00\x00\x80\x81\x04\x00\x00\x0c\x24\x00\x00\x60\x20\
+\x01\x00\x00\x03\x09\x00\x00\x18\x48\x00\x00\xc0\x40\x02\x00\x00\
+\x06\x12\x00\x00\x30\x90\x00\x00\x80\x81\x04\x00\x00\x0c\x24\x00\
+\x00\x60\x20\x01\x00\x00\x03\x09\x00\x00\x18\x48\x00\x00\xc0\x40\
+\x02\x00\x00\x06\x12\x00\x00\x30\x90\x00\x00\x80\x81\x04\x00\x00\
+\x0c\x24\x00\x00\x60\x20\x01\x00\x00\x03\x09\x00\x00\x18\x48\x00\
+\x00\xc0\x40\x02\x00\x00\x06\x12\x00\x00\x30\x90\x00\x00\x80\x81\
+\x04\x00\x00\x0c\x24\x00\x00\x60\x20\x01\x00\x00\x03\x09\x00\x00\
+\x18\x48\x00\x00\xc0\x40\x02\x00\x00\x06\x12\x00\x00\x30\x90\x00\
+\x00\x80\x81\x04\x00\x00\x0c\x24\x00\x00\x60\x20\x01\x00\x00\x03\
+\x09\x00\x00\x18\x48\x00\x00\xc0\x40\x02\x00\x00\x06\x12\x00\x00\
+\x30\x90\x00\x00\x80\x81\x04\x00\x00\x0c\x24\x00\x00\x60\x20\x01\
+\x00\x00\x03\x09\x00\x00\x18\x48\x00\x00\xc0\x40\x02\x00\x00\x06\
+\x12\x00\x00\x30\x90\x00\x00\x80\x81\x04\x00\x00\x0c\x24\x00\x00\
+\x60\x20\x01\x00\x00\x03\x09\x00\x00\x18\x48\x00\x00\xc0\x40\x02\
+\x00\x00\x06\x12\x00\x00\x30\x90\x00\x00\x80\x81\x04\x00\x00\x0c\
+\x24\x00\x00\x60\x20\x01\x00\x00\x03\x09\x00\x00\x18\x48\x00\x00\
+\xc0\x40\x02\x00\x00\x06\x12\x00\x00\x30\x90\x00\x00\x80\x81\x04\
+\x00\x00\x0c\x24\x00\x00\x60\x20\x01\x00\x00\x03\x09\x00\x00\x18\
+\x48\x00\x00\xc0\x40\x02\x00\x00\x06\x12\x00\x00\x30\x90\x00\x00\
+\x80\x81\x04\x00\x00\x0c\x24\x00\x00\x60\x20\x01\x00\x00\x03\x09\
+\x00\x00\x18\x48\x00\x00\xc0\x40\x02\x00\x00\x06\x12\x00\x00\x30\
+\x90\x00\x00\x80\x81\x04\x00\x00\x0c\x24\x00\x00\x60\x20\x01\x00\
+\x00\x03\x09\x00\x00\x18\x48\x00\x00\xc0\x40\x02\x00\x00\x06\x12\
+\x00\x00\x30\x90\x00\x00\x80\x81\x04\x00\x00\x0c\x24\x00\x00\x60\
+\x20\x01\x00\x00\x03\x09\x00\x00\x18\x48\x00\x00\xc0\x40\x02\x00\
+\x00\x06\x12\x00\x00\x30\x90\x00\x00\x80\x81\x04\x00\x00\x0c\x24\
+\x00\x00\x60\x20\x01\x00\x00\x03\x09\x00\x00\x18\x48\x00\x00\xc0\
+\x40\x02\x00\x00\x06\x12\x00\x00\x30\x90\x00\x00\x80\x81\x04\x00\
+\x00\x0c\x24\x00\x00\x60\x20\x01\x00\x00\x03\x09\x00\x00\x18\x48\
+\x00\x00\xc0\x40\x02\x00\x00\x06\x12\x00\x00\x30\x90\x00\x00\x80\
+\x81\x04\x00\x00\x0c\x74\x71\xf5\x00\x4e\xe4\xf1\xd5\xe7\x56\x8f\
+\xab\x1e\x5b\x3d\x7a\xed\x9c\xbf\xe4\xe1\xab\x07\xec\xb8\xbf\x5f\
+\xbd\x78\xf5\x88\x8f\x71\x77\xf5\xae\x2b\xc7\xef\x57\x6f\xa9\x2e\
+\x2d\x5d\x04\x9c\x09\x01\x70\x7e\x7c\x5c\xf5\xdc\xea\x39\xd5\x93\
+\xaa\x0b\x6b\xe7\x70\x42\x9f\x76\xe5\xd8\x55\x77\x56\xff\xa5\xfa\
+\xc1\xea\xad\x8b\xb7\x00\x8c\x76\xb1\x7a\x5e\x9b\x3b\xe6\xcb\x0e\
+\xc7\x19\x1d\xf7\x55\x2f\xab\xfe\x5a\xec\xaa\xdb\x5b\x7f\x3d\x39\
+\xc9\xf1\x3d\xa7\xf1\xcb\xe0\xf8\x9c\x03\xb0\xdb\x6e\xae\x7e\xba\
+\x7a\x51\xf5\xf1\x8b\xb7\x30\xcb\x0d\xd5\x57\xb6\x79\x14\xe0\x29\
+\x8b\xb7\x00\xa7\x40\x00\xec\xae\x27\x56\xbf\x56\x7d\xf1\xe2\x1d\
+\xcc\x76\x4b\xf5\xfa\xea\x9f\xaf\x1e\x02\x6c\x97\x00\xd8\x4d\x1f\
+\x57\xbd\xb6\xba\x6d\xf5\x10\x68\xf3\x34\xd4\x0f\x57\x5f\xb2\x7a\
+\x08\xb0\x3d\x02\x60\x37\xbd\xbc\xdd\x3e\x51\x8c\x79\x6e\x68\x73\
+\xbd\xfc\xe4\xd5\x43\x80\xed\x10\x00\xbb\xe7\x99\xd5\x33\x56\x8f\
+\x80\xab\xb8\xb9\xfa\xbe\xd5\x23\x80\xed\x10\x00\xbb\xe5\xc6\xea\
+\xbb\x56\x8f\x80\x03\x7c\x61\x4e\x0a\x84\xbd\x20\x00\x76\xcb\xd3\
+\xab\x4f\x59\x3d\x02\x0e\xf1\xaf\x56\x0f\x00\xae\x9f\x00\xd8\x2d\
+\xcf\x5c\x3d\x00\x8e\xe0\xef\xb5\x79\x75\x00\x70\x8e\x09\x80\xdd\
+\x71\x31\x2f\xf9\xe3\x7c\xb8\xa9\xfa\xa2\xd5\x23\x80\xeb\x23\x00\
+\x76\xc7\x13\xaa\x47\xae\x1e\x01\x47\xe4\x55\x2a\x70\xce\x09\x80\
+\xdd\x71\xeb\xea\x01\x70\x0c\x8f\x5b\x3d\x00\xb8\x3e\x02\x60\x77\
+\x3c\x76\xf5\x00\x38\x06\x01\x00\xe7\x9c\x00\xd8\x1d\x0f\x5a\x3d\
+\x00\x8e\xe1\x81\xab\x07\x00\xd7\x47\x00\x00\xc0\x40\x02\x00\x00\
+\x06\x12\x00\x00\x30\x90\x00\x00\x80\x81\x2e\xae\x1e\x00\xb0\x67\
+\x1e\x5c\x7d\x6a\x9b\x57\xf6\x9c\xe6\xc9\xbd\x0f\x3e\xc5\xef\x7d\
+\x9a\x3e\xb9\x7a\xce\x29\x7e\xff\xf7\x57\xb7\x57\xbf\x77\x8a\x3f\
+\x63\x2f\x08\x00\x80\xed\x78\x52\xf5\xad\x6d\xde\x25\xf1\x21\x8b\
+\xb7\xec\xb2\x2f\xbd\x72\x9c\xb6\x3f\xae\x7e\xb2\x7a\x61\x9b\x28\
+\xe0\x7e\x3c\x05\x00\x70\x7d\x6e\xaa\x5e\x54\xfd\x5a\xf5\xec\xfc\
+\xf1\xdf\x15\x9f\x50\x7d\x5b\xf5\x8e\xbc\xcd\xfa\x55\x09\x00\x80\
+\x93\xbb\xa9\x7a\x5d\xf5\xbc\xea\xc2\xe2\x2d\x5c\xdd\xa3\xaa\xd7\
+\x56\xff\x6c\xf5\x90\x5d\x23\x00\x00\x4e\xee\xfb\xab\xa7\xae\x1e\
+\xc1\xa1\x6e\xa8\x7e\xa4\xfa\xfc\xd5\x43\x76\x89\x00\x00\x38\x99\
+\xcf\xa9\xbe\x6e\xf5\x08\x8e\xec\xa6\xea\xc5\x39\xf7\xed\xff\x13\
+\x00\x00\x27\xf3\xed\x79\xd8\xff\xbc\xf9\x5b\xd5\x33\x57\x8f\xd8\
+\x15\x02\x00\xe0\xf8\x1e\x56\xfd\x83\xd5\x23\x38\x91\x67\xad\x1e\
+\xb0\x2b\x04\x00\xc0\xf1\x7d\x66\xfe\x87\x48\xe7\xd5\xe7\xae\x1e\
+\xb0\x2b\x04\x00\xc0\xf1\xdd\xba\x7a\x00\x27\x76\x6b\x9e\xba\xa9\
+\x04\x00\xc0\x49\x3c\x74\xf5\x00\x4e\xec\x81\x6d\x4e\x08\x1c\x4f\
+\x00\x00\xc0\x40\x02\x00\x00\x06\x12\x00\x00\x30\x90\x00\x00\x80\
+\x81\x04\x00\x00\x0c\x24\x00\x00\x60\x20\x01\x00\x00\x03\x09\x00\
+\x00\x18\x48\x00\x00\xc0\x40\x02\x00\x00\x06\x12\x00\x00\x30\x90\
+\x00\x00\x80\x81\x04\xc0\xee\xf8\xe8\xea\x01\x70\x0c\xae\xaf\x70\
+\xce\x09\x80\xdd\x71\xe7\xea\x01\x70\x0c\xef\x5e\x3d\x00\xb8\x3e\
+\x02\x60\x77\xdc\xb1\x7a\x00\x1c\x83\xeb\x2b\x9c\x73\x02\x60\x77\
+\xfc\x49\x75\xf7\xea\x11\x70\x44\xef\x58\x3d\x00\xb8\x3e\x02\x60\
+\x77\xdc\x53\xbd\x61\xf5\x08\x38\x82\xcb\xd5\xeb\x56\x8f\x00\xae\
+\x8f\x00\xd8\x2d\x3f\xb3\x7a\x00\x1c\xc1\xaf\xb7\x79\xc4\x6a\xb2\
+\xfb\x56\x0f\xe0\xc4\x2e\x57\x97\x56\x8f\xd8\x05\x02\x60\xb7\xbc\
+\x32\x27\x03\xb2\xfb\x7e\x70\xf5\x80\x1d\xf0\x9e\xd5\x03\x38\xb1\
+\x3f\xcb\xab\x58\x2a\x01\xb0\x6b\x3e\x54\xbd\x60\xf5\x08\x38\xc0\
+\x6f\x57\x2f\x5f\x3d\x62\x07\x38\x07\xe2\xfc\x72\xd9\x5d\x21\x00\
+\x76\xcf\x8b\xab\xdf\x5a\x3d\x02\xae\xe2\xbe\xea\x9b\xf2\xf0\x77\
+\xd5\xef\x57\x6f\x5f\x3d\x82\x13\x71\xfe\xca\x15\x02\x60\xf7\xdc\
+\x5b\x3d\x3d\x0f\x31\xb2\x7b\xbe\xa5\x7a\xe3\xea\x11\x3b\xe4\x25\
+\xab\x07\x70\x6c\x77\x57\x2f\x5b\x3d\x02\x0e\xf3\xf9\xd5\x9f\xb7\
+\x39\x61\xc5\xe1\x58\x7d\xbc\x38\xee\xef\x41\xd5\x1f\xb4\xfe\xb2\
+\x71\x1c\xfd\xf0\x14\x2b\xe7\xc6\xa7\x56\x7f\xd8\xfa\x1b\x8d\x63\
+\xee\x71\xa9\xfa\x37\x71\x2d\x7f\xbb\xfa\x60\xeb\x2f\x27\xc7\xe1\
+\xc7\x2f\x57\x0f\xb8\xfa\xc5\x08\xbb\xe9\xd1\xd5\x4f\xb4\x79\xde\
+\x75\xf5\x0d\xc8\x31\xeb\xf8\x9d\xea\x29\x71\x98\xbf\xdb\xe6\xd5\
+\x3b\xab\x2f\x2f\xc7\xb5\x8f\x9f\xad\x1e\x7e\xad\x0b\x10\x76\xdd\
+\xa7\x57\xaf\xaa\xee\x6a\xfd\x8d\xc9\xb1\xdf\xc7\x6f\x56\x5f\x53\
+\xdd\x18\x47\xf5\xf8\xea\xa5\x09\xf5\x5d\x3b\xde\x5b\x7d\x43\xae\
+\xcb\x57\x75\x61\xf5\x00\x8e\xed\x21\xd5\x53\xab\x27\x57\xb7\xb6\
+\xb9\xe3\xb9\x79\xe9\x22\xce\xb3\x7b\xdb\x9c\x70\x7a\x7b\x9b\x97\
+\x47\xbd\xb6\x7a\xe7\xd2\x45\xe7\xdb\x13\xab\x2f\xad\x3e\xab\xfa\
+\xab\xd5\x43\x97\xae\x99\xe9\xce\x36\xd7\xe7\x9f\xaf\x5e\xdf\xe6\
+\x3f\x9a\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xd8\
+\x7f\xff\x17\x84\xf5\xb1\x51\x4a\x2d\x5a\xcd\x00\x00\x00\x00\x49\
+\x45\x4e\x44\xae\x42\x60\x82\
+"
+
+qt_resource_name = b"\
+\x00\x05\
+\x00\x6f\xa6\x53\
+\x00\x69\
+\x00\x63\x00\x6f\x00\x6e\x00\x73\
+\x00\x0b\
+\x03\x03\x9b\x47\
+\x00\x7a\
+\x00\x6f\x00\x6f\x00\x6d\x00\x2d\x00\x69\x00\x6e\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x09\
+\x03\x65\x83\x87\
+\x00\x63\
+\x00\x6f\x00\x6c\x00\x6f\x00\x72\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x08\
+\x04\xb2\x58\xc7\
+\x00\x75\
+\x00\x6e\x00\x64\x00\x6f\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x08\
+\x06\xc8\x59\xc7\
+\x00\x6d\
+\x00\x6f\x00\x76\x00\x65\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x0a\
+\x06\xcd\x6a\x47\
+\x00\x73\
+\x00\x68\x00\x61\x00\x70\x00\x65\x00\x73\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x0c\
+\x06\xe6\x62\xa7\
+\x00\x76\
+\x00\x65\x00\x72\x00\x74\x00\x69\x00\x63\x00\x61\x00\x6c\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x0c\
+\x06\xeb\x97\xe7\
+\x00\x7a\
+\x00\x6f\x00\x6f\x00\x6d\x00\x2d\x00\x6f\x00\x75\x00\x74\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x0e\
+\x07\x5d\x60\x27\
+\x00\x68\
+\x00\x6f\x00\x72\x00\x69\x00\x7a\x00\x6f\x00\x6e\x00\x74\x00\x61\x00\x6c\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x09\
+\x08\x28\xa4\x67\
+\x00\x73\
+\x00\x63\x00\x61\x00\x6c\x00\x65\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x08\
+\x08\x8a\x5a\x27\
+\x00\x64\
+\x00\x72\x00\x61\x00\x77\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x07\
+\x09\x01\x57\x87\
+\x00\x62\
+\x00\x69\x00\x6e\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x08\
+\x09\x63\x5a\x07\
+\x00\x63\
+\x00\x72\x00\x6f\x00\x70\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x09\
+\x09\xc7\xa6\xc7\
+\x00\x72\
+\x00\x65\x00\x73\x00\x65\x00\x74\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x0a\
+\x09\xc8\xc6\x47\
+\x00\x65\
+\x00\x72\x00\x61\x00\x73\x00\x65\x00\x72\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x08\
+\x0b\xb2\x58\x47\
+\x00\x72\
+\x00\x65\x00\x64\x00\x6f\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x08\
+\x0c\xf7\x58\x07\
+\x00\x74\
+\x00\x65\x00\x78\x00\x74\x00\x2e\x00\x70\x00\x6e\x00\x67\
+"
+
+qt_resource_struct_v1 = b"\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x10\x00\x00\x00\x02\
+\x00\x00\x00\x10\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x00\x2c\x00\x00\x00\x00\x00\x01\x00\x00\x32\x4c\
+\x00\x00\x00\x44\x00\x00\x00\x00\x00\x01\x00\x01\x03\xa3\
+\x00\x00\x00\x5a\x00\x00\x00\x00\x00\x01\x00\x01\x27\x00\
+\x00\x00\x00\x70\x00\x00\x00\x00\x00\x01\x00\x01\x4a\xba\
+\x00\x00\x00\x8a\x00\x00\x00\x00\x00\x01\x00\x01\x75\x19\
+\x00\x00\x00\xa8\x00\x00\x00\x00\x00\x01\x00\x01\x85\xe6\
+\x00\x00\x00\xc6\x00\x00\x00\x00\x00\x01\x00\x01\xd0\x40\
+\x00\x00\x00\xe8\x00\x00\x00\x00\x00\x01\x00\x01\xef\x12\
+\x00\x00\x01\x00\x00\x00\x00\x00\x00\x01\x00\x02\x02\x92\
+\x00\x00\x01\x16\x00\x00\x00\x00\x00\x01\x00\x02\x1c\xa1\
+\x00\x00\x01\x2a\x00\x00\x00\x00\x00\x01\x00\x02\x46\xe7\
+\x00\x00\x01\x40\x00\x00\x00\x00\x00\x01\x00\x02\x5b\xc4\
+\x00\x00\x01\x58\x00\x00\x00\x00\x00\x01\x00\x02\x99\xb6\
+\x00\x00\x01\x72\x00\x00\x00\x00\x00\x01\x00\x02\xba\x91\
+\x00\x00\x01\x88\x00\x00\x00\x00\x00\x01\x00\x02\xde\x35\
+"
+
+qt_resource_struct_v2 = b"\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x10\x00\x00\x00\x02\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x10\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x01\x9b\x20\x93\x9e\xc0\
+\x00\x00\x00\x2c\x00\x00\x00\x00\x00\x01\x00\x00\x32\x4c\
+\x00\x00\x01\x9b\x20\x93\x9e\xc0\
+\x00\x00\x00\x44\x00\x00\x00\x00\x00\x01\x00\x01\x03\xa3\
+\x00\x00\x01\x9b\x20\x93\x9e\xc0\
+\x00\x00\x00\x5a\x00\x00\x00\x00\x00\x01\x00\x01\x27\x00\
+\x00\x00\x01\x9b\x20\x93\x9e\xc0\
+\x00\x00\x00\x70\x00\x00\x00\x00\x00\x01\x00\x01\x4a\xba\
+\x00\x00\x01\x9b\x20\x93\x9e\xc0\
+\x00\x00\x00\x8a\x00\x00\x00\x00\x00\x01\x00\x01\x75\x19\
+\x00\x00\x01\x9b\x20\x93\x9e\xc0\
+\x00\x00\x00\xa8\x00\x00\x00\x00\x00\x01\x00\x01\x85\xe6\
+\x00\x00\x01\x9b\x20\x93\x9e\xc0\
+\x00\x00\x00\xc6\x00\x00\x00\x00\x00\x01\x00\x01\xd0\x40\
+\x00\x00\x01\x9b\x20\x93\x9e\xc0\
+\x00\x00\x00\xe8\x00\x00\x00\x00\x00\x01\x00\x01\xef\x12\
+\x00\x00\x01\x9b\x20\x93\x9e\xc0\
+\x00\x00\x01\x00\x00\x00\x00\x00\x00\x01\x00\x02\x02\x92\
+\x00\x00\x01\x9b\x20\x93\x9e\xc0\
+\x00\x00\x01\x16\x00\x00\x00\x00\x00\x01\x00\x02\x1c\xa1\
+\x00\x00\x01\x9b\x20\x93\x9e\xc0\
+\x00\x00\x01\x2a\x00\x00\x00\x00\x00\x01\x00\x02\x46\xe7\
+\x00\x00\x01\x9b\x20\x93\x9e\xc0\
+\x00\x00\x01\x40\x00\x00\x00\x00\x00\x01\x00\x02\x5b\xc4\
+\x00\x00\x01\x9b\x20\x93\x9e\xc0\
+\x00\x00\x01\x58\x00\x00\x00\x00\x00\x01\x00\x02\x99\xb6\
+\x00\x00\x01\x9b\x20\x93\x9e\xc0\
+\x00\x00\x01\x72\x00\x00\x00\x00\x00\x01\x00\x02\xba\x91\
+\x00\x00\x01\x9b\x20\x93\x9e\xc0\
+\x00\x00\x01\x88\x00\x00\x00\x00\x00\x01\x00\x02\xde\x35\
+\x00\x00\x01\x9b\x20\x93\x9e\xc0\
+"
+
+qt_version = [int(v) for v in QtCore.qVersion().split('.')]
+if qt_version < [5, 8, 0]:
+    rcc_version = 1
+    qt_resource_struct = qt_resource_struct_v1
+else:
+    rcc_version = 2
+    qt_resource_struct = qt_resource_struct_v2
+
+def qInitResources():
+    QtCore.qRegisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+def qCleanupResources():
+    QtCore.qUnregisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+qInitResources()